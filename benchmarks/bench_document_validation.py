@@ -0,0 +1,113 @@
+# benchmarks/bench_document_validation.py
+"""
+Сравнение способов получить dict документа из тела ответа EDMS.
+
+- legacy:        json.loads -> DocumentDto(**data) -> model_dump (прежний путь инструмента)
+- validate_json: DocumentDto из байтов (TypeAdapter) -> model_dump
+- trusted:       только json.loads, без проверки схемы
+- projected:     срез DocumentDto по профилю вопроса (status/author) из байтов -> model_dump
+
+Запуск: python benchmarks/bench_document_validation.py [--tasks 50] [--repeat 200]
+"""
+import argparse
+import json
+import sys
+import timeit
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.edms_assistant.core.tools.document_tool import DOCUMENT_PROFILES  # noqa: E402
+from src.edms_assistant.infrastructure.api_clients.model_adapters import to_payload, validate_json  # noqa: E402
+from src.edms_assistant.infrastructure.resources_openapi import DocumentDto  # noqa: E402
+
+
+def _user(index: int) -> dict:
+    return {
+        "firstName": f"Имя{index}",
+        "lastName": f"Фамилия{index}",
+        "middleName": f"Отчество{index}",
+        "authorPost": "Ведущий специалист",
+        "authorDepartmentName": "Отдел документационного обеспечения",
+        "authorDepartmentId": str(uuid.uuid4()),
+        "employeeId": str(uuid.uuid4()),
+        "employee": {
+            "id": str(uuid.uuid4()),
+            "firstName": f"Имя{index}",
+            "lastName": f"Фамилия{index}",
+            "middleName": f"Отчество{index}",
+            "fired": False,
+            "active": True,
+            "fullPostName": "Ведущий специалист отдела документационного обеспечения",
+        },
+    }
+
+
+def make_document(tasks: int) -> bytes:
+    """Синтетический DocumentDto с вложенными пользователями и поручениями."""
+    document = {
+        "id": str(uuid.uuid4()),
+        "organizationId": "1",
+        "docCategoryConstant": "INCOMING",
+        "createDate": "2025-10-01T09:30:00Z",
+        "regDate": "2025-10-02T10:00:00Z",
+        "regNumber": "01-15/1234",
+        "status": "NEW",
+        "prevStatus": "DRAFT",
+        "pages": 12,
+        "shortSummary": "О согласовании договора поставки",
+        "summary": "Текст документа. " * 200,
+        "documentVersionId": str(uuid.uuid4()),
+        "author": _user(0),
+        "responsibleExecutor": _user(1),
+        "taskList": [
+            {
+                "id": str(uuid.uuid4()),
+                "type": "GENERAL",
+                "taskNumber": str(i),
+                "createDate": "2025-10-03T08:00:00Z",
+                "taskStatus": "ON_EXECUTION",
+                "author": _user(i + 2),
+                "taskText": f"Подготовить заключение по пункту {i}",
+                "documentId": str(uuid.uuid4()),
+            }
+            for i in range(tasks)
+        ],
+    }
+    return json.dumps(document, ensure_ascii=False).encode("utf-8")
+
+
+def legacy(content: bytes) -> dict:
+    return DocumentDto(**json.loads(content)).model_dump(mode="json", exclude_unset=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=50, help="Поручений в документе")
+    parser.add_argument("--repeat", type=int, default=200, help="Повторов на вариант")
+    args = parser.parse_args()
+
+    content = make_document(args.tasks)
+    # Прогрев: сборка схемы и TypeAdapter не должна попадать в замер
+    validate_json(DocumentDto, content)
+    for profile in ("status", "author"):
+        to_payload(content, DocumentDto, include=DOCUMENT_PROFILES[profile])
+
+    variants = {
+        "legacy": lambda: legacy(content),
+        "validate_json": lambda: to_payload(content, DocumentDto),
+        "trusted": lambda: to_payload(content, DocumentDto, trusted=True),
+        "projected:status": lambda: to_payload(content, DocumentDto, include=DOCUMENT_PROFILES["status"]),
+        "projected:author": lambda: to_payload(content, DocumentDto, include=DOCUMENT_PROFILES["author"]),
+    }
+    print(f"payload: {len(content) / 1024:.1f} KiB, {args.tasks} tasks, {args.repeat} runs")
+    baseline = None
+    for name, run in variants.items():
+        per_doc = min(timeit.repeat(run, number=args.repeat, repeat=3)) / args.repeat
+        baseline = baseline or per_doc
+        print(f"{name:>16}: {per_doc * 1e6:9.1f} µs/doc  ({baseline / per_doc:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# benchmarks/bench_models_import.py
+"""
+Время импорта моделей resources_openapi: отложенная сборка против сборки при импорте.
+
+- deferred: пакет как есть — model_config = ConfigDict(defer_build=True), валидаторы
+            строятся при первом использовании модели
+- eager:    копия пакета без defer_build — pydantic строит каждую модель при импорте
+
+Сценарии (каждый замер — в отдельном процессе, pydantic уже импортирован):
+- startup:          обращение к DocumentDto и EmployeeFilter (то, что нужно API)
+- first_validation: startup + первая валидация DocumentDto из байтов
+- all_models:       обращение ко всем моделям пакета
+
+Запуск: python benchmarks/bench_models_import.py [--repeat 5]
+"""
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PACKAGE = Path(__file__).resolve().parents[1] / "src" / "edms_assistant" / "infrastructure" / "resources_openapi"
+DEFER_BUILD_LINE = "    model_config = ConfigDict(defer_build=True)\n"
+
+SCENARIOS = {
+    "startup": "m.DocumentDto; m.EmployeeFilter",
+    "first_validation": (
+        "m.DocumentDto; m.EmployeeFilter; "
+        "m.DocumentDto.model_validate_json(b'{\"id\": \"7d5f2b8e-3b0a-4a7e-9b0e-1c2d3e4f5a6b\", \"taskList\": []}')"
+    ),
+    "all_models": "[getattr(m, name) for name in m._MODULES]",
+}
+
+TIMED = """
+import time
+import pydantic
+started = time.perf_counter()
+import resources_openapi as m
+{code}
+print(time.perf_counter() - started)
+"""
+
+
+def make_variant(root: Path, defer_build: bool) -> Path:
+    """Копия пакета в root/resources_openapi; для eager строки defer_build удаляются."""
+    target = root / "resources_openapi"
+    shutil.copytree(PACKAGE, target, ignore=shutil.ignore_patterns("__pycache__"))
+    if not defer_build:
+        for module in target.glob("*.py"):
+            text = module.read_text(encoding="utf-8").replace(DEFER_BUILD_LINE, "")
+            # Класс, в котором кроме model_config ничего не было
+            module.write_text(text.replace("):\n\n\n", "):\n    pass\n\n\n"), encoding="utf-8")
+    # Байткод компилируется заранее: замер не должен включать компиляцию исходников
+    subprocess.run([sys.executable, "-m", "compileall", "-q", str(target)], check=True)
+    return root
+
+
+def measure(root: Path, code: str, repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMED.format(code=code)],
+            cwd=root,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        runs.append(float(output.strip().splitlines()[-1]))
+    return min(runs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Запусков на сценарий (берётся лучший)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        variants = {
+            "eager": make_variant(Path(tmp) / "eager", defer_build=False),
+            "deferred": make_variant(Path(tmp) / "deferred", defer_build=True),
+        }
+        print(f"{'scenario':>18} {'eager':>10} {'deferred':>10}")
+        for scenario, code in SCENARIOS.items():
+            eager, deferred = (measure(root, code, args.repeat) for root in variants.values())
+            print(f"{scenario:>18} {eager * 1e3:8.0f}ms {deferred * 1e3:8.0f}ms  ({eager / deferred:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,14 @@
 # download_openapi.py
+import ast
 import httpx
 import json
+import keyword
 import subprocess
 import sys
 import logging
+import os
 import re
+import tempfile
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -107,6 +111,41 @@ def run_datamodel_codegen(input_file: str, output_file: str) -> bool:
         return False
 
 
+DEFER_BUILD_CONFIG = "model_config = ConfigDict(defer_build=True)"
+
+
+def _defer_model_building(content: str) -> str:
+    """
+    Adds `model_config = ConfigDict(defer_build=True)` to every root model class
+    (direct subclass of BaseModel/RootModel; subclasses inherit the config).
+
+    Validators and schemas are then built on first use of a model instead of at
+    import time, so a process pays only for the models it actually touches.
+    """
+    tree = ast.parse(content)
+    lines = content.splitlines()
+    # Правки идут с конца файла, чтобы номера строк выше оставались верными
+    for node in sorted(
+        (n for n in tree.body if isinstance(n, ast.ClassDef)), key=lambda n: n.lineno, reverse=True
+    ):
+        if not any(ast.unparse(base).split("[")[0] in ("BaseModel", "RootModel") for base in node.bases):
+            continue
+        if any(
+            isinstance(stmt, ast.Assign) and any(getattr(t, "id", None) == "model_config" for t in stmt.targets)
+            for stmt in node.body
+        ):
+            continue
+        first = node.body[0]
+        indent = " " * first.col_offset
+        if len(node.body) == 1 and isinstance(first, ast.Pass):
+            lines[first.lineno - 1] = indent + DEFER_BUILD_CONFIG
+        elif isinstance(first, ast.Expr) and isinstance(first.value, ast.Constant) and isinstance(first.value.value, str):
+            lines.insert(first.end_lineno, indent + DEFER_BUILD_CONFIG)
+        else:
+            lines[first.lineno - 1: first.lineno - 1] = [indent + DEFER_BUILD_CONFIG, ""]
+    return "\n".join(lines)
+
+
 def fix_generated_file(file_path: str):
     """
     Applies necessary fixes to the generated Pydantic models file.
@@ -159,6 +198,9 @@ def fix_generated_file(file_path: str):
     ):
         needed_pydantic_items.add("RootModel")
 
+    # model_config = ConfigDict(defer_build=True) добавляется в корневые модели ниже
+    needed_pydantic_items.add("ConfigDict")
+
     # Формируем новый импорт pydantic
     pydantic_import_line = ""
     if needed_pydantic_items:
@@ -204,18 +246,522 @@ def fix_generated_file(file_path: str):
         content,
     )
 
+    # v1-вызовы X.update_forward_refs() строят модели при импорте; ссылки вперёд
+    # pydantic v2 разрешает сам при первой сборке модели
+    content = re.sub(r"^\w+\.update_forward_refs\(\)\n", "", content, flags=re.MULTILINE)
+    content = _defer_model_building(content).rstrip() + "\n"
+
     # --- Сохраняем исправленный файл ---
     with open(file_path, "w", encoding="utf-8") as f:
         f.write(content)
     logger.info(f"All fixes applied to {file_path}.")
 
 
+# --- Генерация типизированного клиента ---
+TRANSLIT = {
+    "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ё": "e", "ж": "zh",
+    "з": "z", "и": "i", "й": "i", "к": "k", "л": "l", "м": "m", "н": "n", "о": "o",
+    "п": "p", "р": "r", "с": "s", "т": "t", "у": "u", "ф": "f", "х": "kh", "ц": "ts",
+    "ч": "ch", "ш": "sh", "щ": "shch", "ъ": "", "ы": "y", "ь": "", "э": "e", "ю": "iu",
+    "я": "ia",
+}
+
+RESERVED_ARGUMENTS = set(keyword.kwlist) | {"self", "service_token", "body", "files", "max_bytes"}
+
+BINARY_CONTENT_TYPES = ("application/octet-stream", "application/vnd.", "application/pdf")
+
+
+def tag_slug(tag: str) -> str:
+    """Python identifier for an OpenAPI tag (transliterated, snake_case)."""
+    latin = "".join(TRANSLIT.get(ch, ch) for ch in tag.lower())
+    slug = re.sub(r"[^a-z0-9]+", "_", latin).strip("_") or "other"
+    return f"tag_{slug}" if slug[0].isdigit() else slug
+
+
+def _tag_slugs(tags, reserved=()) -> dict:
+    """Unique slug per tag; colliding slugs get a trailing underscore."""
+    slugs: dict = {}
+    for tag in sorted(tags):
+        slug = tag_slug(tag)
+        while slug in slugs.values() or slug in reserved:
+            slug += "_"
+        slugs[tag] = slug
+    return slugs
+
+
+def _group_operations(spec: dict) -> dict:
+    """Operations of the spec grouped by their first tag (untagged ones go to "other")."""
+    groups: dict = {}
+    for path, path_item in spec.get("paths", {}).items():
+        for method, operation in path_item.items():
+            if method not in ("get", "post", "put", "patch", "delete", "head"):
+                continue
+            tag = (operation.get("tags") or ["other"])[0]
+            groups.setdefault(tag, []).append((path, method, operation))
+    return groups
+
+
+def tag_class_name(slug: str) -> str:
+    return "".join(part.capitalize() for part in slug.split("_")) + "Api"
+
+
+def snake_case(name: str) -> str:
+    """operationId / parameter name -> snake_case identifier."""
+    name = re.sub(r"[^0-9a-zA-Z_]+", "_", name)
+    name = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name)
+    name = re.sub(r"_+", "_", name).strip("_").lower() or "param"
+    return f"p_{name}" if name[0].isdigit() else name
+
+
+def _clean_text(text: str) -> str:
+    """Strips HTML markup and characters that would break a generated docstring."""
+    text = re.sub(r"<br\s*/?>", "\n", text or "")
+    text = re.sub(r"<[^>]+>", "", text)
+    text = text.replace("\\", "/").replace('"', "'")
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
+
+
+def schema_annotation(schema: dict, models_alias: str = "m") -> str:
+    """Python type expression for an OpenAPI schema (models referenced as `m.Name`)."""
+    if not schema:
+        return "Any"
+    if "$ref" in schema:
+        return f"{models_alias}.{schema['$ref'].rsplit('/', 1)[-1]}"
+    schema_type = schema.get("type")
+    if isinstance(schema_type, list):
+        schema_type = next((t for t in schema_type if t != "null"), None)
+    if schema_type == "array":
+        return f"list[{schema_annotation(schema.get('items', {}), models_alias)}]"
+    if schema_type == "string":
+        return {
+            "uuid": "UUID",
+            "date-time": "datetime",
+            "date": "date",
+            "binary": "bytes",
+        }.get(schema.get("format"), "str")
+    if schema_type == "integer":
+        return "int"
+    if schema_type == "number":
+        return "float"
+    if schema_type == "boolean":
+        return "bool"
+    if schema_type == "object":
+        extra = schema.get("additionalProperties")
+        value = schema_annotation(extra, models_alias) if isinstance(extra, dict) and extra else "Any"
+        return f"dict[str, {value}]"
+    return "Any"
+
+
+def _success_content(operation: dict):
+    """(content_type, schema) of the first 2xx response, or None for empty responses."""
+    for code in sorted(operation.get("responses", {})):
+        if not code.startswith("2"):
+            continue
+        content = operation["responses"][code].get("content") or {}
+        for content_type, media in content.items():
+            return content_type, media.get("schema") or {}
+    return None
+
+
+def _is_binary(content_type: str, schema: dict) -> bool:
+    return schema.get("format") == "binary" or content_type.startswith(BINARY_CONTENT_TYPES)
+
+
+def _method_names(operations: list) -> dict:
+    """
+    Method names for the operations of one tag.
+
+    springdoc makes operationId unique across the whole spec by appending `_N`
+    (create_12); inside a tag the suffix is dropped when the base name is unique.
+    """
+    bases = {}
+    for _, _, operation in operations:
+        operation_id = operation["operationId"]
+        bases[operation_id] = snake_case(re.sub(r"_\d+$", "", operation_id))
+    counts: dict = {}
+    for base in bases.values():
+        counts[base] = counts.get(base, 0) + 1
+    return {
+        operation_id: base if counts[base] == 1 else snake_case(operation_id)
+        for operation_id, base in bases.items()
+    }
+
+
+def _lazy_type(annotation: str) -> str:
+    """Model types are wrapped in a lambda: the model module is imported on the first call."""
+    return f"lambda: {annotation}" if "m." in annotation else annotation
+
+
+def _render_operation(path: str, method: str, operation: dict, name: str) -> str:
+    http_method = method.upper()
+    endpoint = path.lstrip("/")
+
+    # --- Параметры: путь позиционно, остальное только по имени ---
+    used_names = set()
+    path_args, query_args = [], []
+    for param in operation.get("parameters", []):
+        if param.get("in") not in ("path", "query"):
+            continue
+        arg = snake_case(param["name"])
+        while arg in RESERVED_ARGUMENTS or arg in used_names:
+            arg += "_"
+        used_names.add(arg)
+        entry = (arg, param["name"], schema_annotation(param.get("schema", {})), param.get("required", False))
+        (path_args if param["in"] == "path" else query_args).append(entry)
+
+    body_type, multipart, body_required = None, False, False
+    request_body = operation.get("requestBody")
+    if request_body:
+        content = request_body.get("content", {})
+        body_required = request_body.get("required", False)
+        if "multipart/form-data" in content:
+            multipart = True
+        elif content:
+            body_type = schema_annotation(next(iter(content.values())).get("schema", {}))
+
+    success = _success_content(operation)
+    binary = success is not None and _is_binary(*success)
+    streaming = binary and http_method == "GET"
+    if success is None:
+        return_type = "None"
+    elif binary:
+        return_type = "AsyncIterator[bytes]" if streaming else "bytes"
+    else:
+        return_type = schema_annotation(success[1])
+
+    op_fields = [repr(http_method), repr(endpoint)]
+    if success is not None and not binary:
+        op_fields.append(f"response={_lazy_type(return_type)}")
+    if body_type:
+        op_fields.append(f"body={_lazy_type(body_type)}")
+    if multipart:
+        op_fields.append("multipart=True")
+    if binary:
+        op_fields.append("binary=True")
+
+    signature = ["self"]
+    signature += [f"{arg}: {annotation}" for arg, _, annotation, _ in path_args]
+    signature.append("*")
+    keyword_args = []
+    if multipart:
+        keyword_args.append(("files: Any", body_required))
+    elif body_type:
+        keyword_args.append((f"body: {body_type}", body_required))
+    for arg, _, annotation, required in query_args:
+        keyword_args.append((f"{arg}: {annotation}", required))
+    # Обязательные параметры идут раньше необязательных
+    signature += [text for text, required in keyword_args if required]
+    signature += [f"{text} | None = None" for text, required in keyword_args if not required]
+    signature.append("service_token: Optional[str] = None")
+    if streaming:
+        signature.append("max_bytes: Optional[int] = None")
+
+    call_args = [f"self._op_{name}"]
+    if path_args:
+        call_args.append("path={" + ", ".join(f"{original!r}: {arg}" for arg, original, _, _ in path_args) + "}")
+    if query_args:
+        call_args.append("query={" + ", ".join(f"{original!r}: {arg}" for arg, original, _, _ in query_args) + "}")
+    if multipart:
+        call_args.append("body=files")
+    elif body_type:
+        call_args.append("body=body")
+    call_args.append("service_token=service_token")
+    if streaming:
+        call_args.append("max_bytes=max_bytes")
+
+    doc_lines = _clean_text(operation.get("summary", "")).splitlines()
+    description = _clean_text(operation.get("description", ""))
+    if description:
+        doc_lines += ([""] if doc_lines else []) + description.splitlines()
+    doc_lines += ["", f"{http_method} {path}"]
+
+    lines = [f"    _op_{name} = Operation({', '.join(op_fields)})", ""]
+    lines.append(f"    {'def' if streaming else 'async def'} {name}(")
+    lines += [f"        {item}," for item in signature]
+    lines.append(f"    ) -> {return_type}:")
+    lines.append('        """')
+    lines += [f"        {line}" if line else "" for line in doc_lines]
+    lines.append('        """')
+    lines.append("        return self._stream(" if streaming else "        return await self._call(")
+    lines += [f"            {arg}," for arg in call_args]
+    lines += ["        )", ""]
+    return "\n".join(lines)
+
+
+def generate_client(
+    input_file: str,
+    output_file: str,
+    models_module: str = "src.edms_assistant.infrastructure.resources_openapi",
+) -> bool:
+    """
+    Generates a typed async EDMS client from the OpenAPI spec.
+
+    One method per operation (named after operationId), grouped into one class per
+    tag. Requests and responses go through Operation/ApiGroup (api_operations.py),
+    i.e. the shared DocumentClient transport and TypeAdapter validation; binary GET
+    operations are generated as streaming methods.
+
+    Args:
+        input_file: Path to the OpenAPI JSON spec file.
+        output_file: Path where the generated client module will be saved.
+        models_module: Module with the generated Pydantic models.
+
+    Returns:
+        True if successful, False otherwise.
+    """
+    logger.info(f"Generating typed EDMS client from {input_file}...")
+    try:
+        with open(input_file, "r", encoding="utf-8") as f:
+            spec = json.load(f)
+
+        descriptions = {tag["name"]: tag.get("description", "") for tag in spec.get("tags", [])}
+        groups = _group_operations(spec)
+        slugs = _tag_slugs(groups)
+        ordered_tags = sorted(slugs.items(), key=lambda item: item[1])
+
+        out = [
+            f"# {output_file}",
+            "# generated by download_openapi.py from openapi_spec.json — не редактировать вручную",
+            '"""',
+            "Типизированный асинхронный клиент EDMS, сгенерированный из OpenAPI.",
+            "",
+            "Операции сгруппированы по тегам: edms_api.<тег>.<operationId в snake_case>(...).",
+            "Запросы идут через общий транспорт DocumentClient, ответы валидируются из байтов.",
+            '"""',
+            "from __future__ import annotations",
+            "",
+            "from datetime import date, datetime",
+            "from typing import Any, AsyncIterator, Optional",
+            "from uuid import UUID",
+            "",
+            f"import {models_module} as m",
+            "from src.edms_assistant.infrastructure.api_clients.api_operations import ApiGroup, Operation",
+            "from src.edms_assistant.infrastructure.api_clients.document_client import DocumentClient, document_client",
+            "",
+        ]
+        operations = 0
+        for tag, slug in ordered_tags:
+            doc_lines = [_clean_text(tag)] + _clean_text(descriptions.get(tag, "")).splitlines()
+            out += ["", f"class {tag_class_name(slug)}(ApiGroup):", '    """']
+            out += [f"    {line}" for line in doc_lines]
+            out += ['    """', ""]
+            names = _method_names(groups[tag])
+            for path, method, operation in sorted(groups[tag], key=lambda item: names[item[2]["operationId"]]):
+                out.append(_render_operation(path, method, operation, names[operation["operationId"]]))
+                operations += 1
+
+        out += [
+            "",
+            "class EDMSApi:",
+            '    """Все операции EDMS, сгруппированные по тегам OpenAPI."""',
+            "",
+            "    def __init__(self, transport: DocumentClient):",
+        ]
+        out += [f"        self.{slug} = {tag_class_name(slug)}(transport)" for _, slug in ordered_tags]
+        out += ["", "", "# Глобальный экземпляр", "edms_api = EDMSApi(document_client)", ""]
+
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.write("\n".join(out))
+        logger.info(f"Generated {operations} operations in {len(slugs)} groups into {output_file}")
+        return True
+    except Exception as e:
+        logger.error(f"An error occurred while generating the client: {e}")
+        return False
+
+
+# --- Разбиение моделей по тегам ---
+MODELS_COMMON = "common"
+MODELS_OTHER = "other"
+
+
+def _schema_refs(node, refs: set) -> set:
+    """Names of all component schemas referenced ($ref) anywhere inside node."""
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str):
+            refs.add(ref.rsplit("/", 1)[-1])
+        for value in node.values():
+            _schema_refs(value, refs)
+    elif isinstance(node, list):
+        for value in node:
+            _schema_refs(value, refs)
+    return refs
+
+
+def _class_dependencies(classes: dict) -> dict:
+    """Other generated classes each class refers to (field types, bases, defaults)."""
+    return {
+        name: {
+            ref.id
+            for ref in ast.walk(node)
+            if isinstance(ref, ast.Name) and ref.id in classes and ref.id != name
+        }
+        for name, node in classes.items()
+    }
+
+
+def _closure(roots: set, dependencies: dict) -> set:
+    seen, stack = set(), [name for name in roots if name in dependencies]
+    while stack:
+        name = stack.pop()
+        if name not in seen:
+            seen.add(name)
+            stack.extend(dependencies[name] - seen)
+    return seen
+
+
+def _segment(lines: list, node: ast.AST) -> str:
+    """Source of a top-level statement (ast.get_source_segment re-splits the whole file)."""
+    return "\n".join(lines[node.lineno - 1: node.end_lineno])
+
+
+def _import_lines(module: str, names: list) -> list:
+    if len(names) == 1:
+        return [f"from .{module} import {names[0]}"]
+    return [f"from .{module} import ("] + [f"    {name}," for name in names] + [")"]
+
+
+def split_models(models_file: str, spec_file: str, package_dir: str) -> bool:
+    """
+    Splits the generated models module into a package with one module per tag.
+
+    A class used (directly or transitively) by the operations of exactly one tag
+    goes to that tag's module, a class shared by several tags goes to `common`,
+    and classes no operation refers to go to `other`. The package `__init__`
+    imports a module only when one of its classes is first accessed, so a process
+    builds just the models it actually uses.
+
+    Args:
+        models_file: Models module produced by datamodel-codegen (after fix_generated_file).
+        spec_file: Path to the OpenAPI JSON spec file.
+        package_dir: Directory of the models package to (re)create.
+
+    Returns:
+        True if successful, False otherwise.
+    """
+    logger.info(f"Splitting {models_file} into per-tag modules in {package_dir}...")
+    try:
+        with open(models_file, "r", encoding="utf-8") as f:
+            source = f.read()
+        with open(spec_file, "r", encoding="utf-8") as f:
+            spec = json.load(f)
+
+        tree = ast.parse(source)
+        lines = source.splitlines()
+        classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+        first_class = min(node.lineno for node in classes.values())
+        header = "\n".join(lines[: first_class - 1]).strip()
+        # Хвост модуля: X.update_forward_refs() и т.п. — переносится вместе с классом X
+        trailers: dict = {}
+        for node in tree.body:
+            if isinstance(node, ast.Expr) and node.lineno > first_class:
+                owner = next((n.id for n in ast.walk(node) if isinstance(n, ast.Name) and n.id in classes), None)
+                if owner:
+                    trailers.setdefault(owner, []).append(_segment(lines, node))
+
+        dependencies = _class_dependencies(classes)
+        slugs = _tag_slugs(_group_operations(spec), reserved={MODELS_COMMON, MODELS_OTHER})
+        used_by: dict = {}
+        for tag, operations in _group_operations(spec).items():
+            roots: set = set()
+            for _, _, operation in operations:
+                _schema_refs(operation, roots)
+            for name in _closure(roots, dependencies):
+                used_by.setdefault(name, set()).add(slugs[tag])
+
+        modules: dict = {}
+        for name in classes:
+            tags = used_by.get(name, set())
+            modules[name] = next(iter(tags)) if len(tags) == 1 else MODELS_COMMON if tags else MODELS_OTHER
+
+        if os.path.isdir(package_dir):
+            for stale in os.listdir(package_dir):
+                if stale.endswith(".py"):
+                    os.remove(os.path.join(package_dir, stale))
+        os.makedirs(package_dir, exist_ok=True)
+
+        for module in sorted(set(modules.values())):
+            names = [name for name in classes if modules[name] == module]
+            imports: dict = {}
+            for name in names:
+                for dependency in dependencies[name]:
+                    if modules[dependency] != module:
+                        imports.setdefault(modules[dependency], set()).add(dependency)
+
+            out = [f"# {os.path.join(package_dir, module)}.py", header]
+            if imports:
+                out.append("")
+            for source_module in sorted(imports):
+                out += _import_lines(source_module, sorted(imports[source_module]))
+            body = [_segment(lines, classes[name]) for name in names]
+            out += ["", "", "\n\n\n".join(body), ""]
+            tail = [line for name in names for line in trailers.get(name, [])]
+            if tail:
+                out += ["", *tail]
+            with open(os.path.join(package_dir, f"{module}.py"), "w", encoding="utf-8") as f:
+                f.write("\n".join(out) + "\n")
+
+        init = [
+            f"# {os.path.join(package_dir, '__init__.py')}",
+            "# generated by download_openapi.py from openapi_spec.json — не редактировать вручную",
+            '"""',
+            "Pydantic-модели EDMS, сгенерированные из OpenAPI и разбитые по тегам.",
+            "",
+            "Модели, которые используют операции только одного тега, лежат в модуле этого",
+            f"тега, общие для нескольких тегов — в {MODELS_COMMON}, не используемые ни одной",
+            f"операцией — в {MODELS_OTHER}. Модуль импортируется при первом обращении к его",
+            "модели (`from ...resources_openapi import DocumentDto`), поэтому процесс строит",
+            "только те модели, которые ему действительно нужны.",
+            '"""',
+            "import importlib",
+            "from typing import Any, List",
+            "",
+            "# Модель -> модуль пакета, в котором она определена",
+            "_MODULES = {",
+            *[f"    {name!r}: {modules[name]!r}," for name in sorted(classes)],
+            "}",
+            "",
+            "__all__ = list(_MODULES)",
+            "",
+            "",
+            "def __getattr__(name: str) -> Any:",
+            "    module = _MODULES.get(name)",
+            "    if module is None:",
+            '        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")',
+            '    value = getattr(importlib.import_module(f".{module}", __name__), name)',
+            "    # Следующие обращения к модели идут мимо __getattr__",
+            "    globals()[name] = value",
+            "    return value",
+            "",
+            "",
+            "def __dir__() -> List[str]:",
+            "    return sorted(set(globals()) | set(_MODULES))",
+            "",
+        ]
+        with open(os.path.join(package_dir, "__init__.py"), "w", encoding="utf-8") as f:
+            f.write("\n".join(init))
+
+        counts: dict = {}
+        for module in modules.values():
+            counts[module] = counts.get(module, 0) + 1
+        logger.info(
+            f"Split {len(classes)} models into {len(counts)} modules "
+            f"({counts.get(MODELS_COMMON, 0)} in {MODELS_COMMON}, {counts.get(MODELS_OTHER, 0)} in {MODELS_OTHER})"
+        )
+        return True
+    except Exception as e:
+        logger.error(f"An error occurred while splitting the models: {e}")
+        return False
+
+
 async def main():
     """
     Main function orchestrating the DTO generation process:
     1. Download OpenAPI spec.
     2. Generate Pydantic models.
     3. Apply post-generation fixes.
+    4. Split the models into per-tag modules.
+    5. Generate the typed async client.
     """
 
     def check_datamodel_codegen():
@@ -234,22 +780,34 @@ async def main():
 
     OPENAPI_URL = "http://127.0.0.1:8098/public-resources/openapi"
     SPEC_FILE = "openapi_spec.json"
-    DTO_FILE = "src/edms_assistant/infrastructure/resources_openapi.py"
+    MODELS_PACKAGE = "src/edms_assistant/infrastructure/resources_openapi"
+    CLIENT_FILE = "src/edms_assistant/infrastructure/api_clients/edms_api.py"
 
     download_success = await download_openapi_spec(OPENAPI_URL, SPEC_FILE)
     if not download_success:
         logger.error("Download failed. Stopping process.")
         return
 
-    generation_success = run_datamodel_codegen(SPEC_FILE, DTO_FILE)
-    if not generation_success:
-        logger.error("Model generation failed.")
-        sys.exit(1)
+    # Единый модуль от datamodel-codegen — промежуточный, в пакет попадают модули тегов
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        dto_file = os.path.join(tmp_dir, "resources_openapi.py")
+        generation_success = run_datamodel_codegen(SPEC_FILE, dto_file)
+        if not generation_success:
+            logger.error("Model generation failed.")
+            sys.exit(1)
+
+        fix_generated_file(dto_file)
 
-    fix_generated_file(DTO_FILE)
+        if not split_models(dto_file, SPEC_FILE, MODELS_PACKAGE):
+            logger.error("Model split failed.")
+            sys.exit(1)
+
+    if not generate_client(SPEC_FILE, CLIENT_FILE):
+        logger.error("Client generation failed.")
+        sys.exit(1)
 
     logger.info(
-        "OpenAPI spec downloaded, Pydantic models generated, and fixes applied successfully!"
+        "OpenAPI spec downloaded, Pydantic models and client generated, and fixes applied successfully!"
     )
 
 
@@ -49,7 +49,24 @@ export const sendMessage = async (
   return res.data;
 };
 
-// Для потоковой передачи
+// Один кадр Server-Sent Events из /chat/stream: "event: <тип>\ndata: <json>"
+const parseSseFrame = (frame: string): { event: string; data: Record<string, unknown> } | null => {
+  let event = 'message';
+  const dataLines: string[] = [];
+  for (const line of frame.split('\n')) {
+    if (line.startsWith('event:')) event = line.slice(6).trim();
+    else if (line.startsWith('data:')) dataLines.push(line.slice(5).trimStart());
+  }
+  // Кадры без data (например, комментарии keep-alive) пропускаем
+  if (dataLines.length === 0) return null;
+  return { event, data: JSON.parse(dataLines.join('\n')) };
+};
+
+// Для потоковой передачи.
+// onChunk получает текст очередных токенов ответа, onComplete — итоговый ответ в том же
+// виде, что и /chat: либо done ({ response, thread_id }), либо уточнение
+// ({ requires_clarification, candidates, thread_id }) — тогда выбор отправляется
+// повторным вызовом с тем же threadId и selectedCandidateId.
 export const streamMessage = async (
   userId: string,
   serviceToken: string,
@@ -58,8 +75,9 @@ export const streamMessage = async (
   file: File | undefined,
   threadId: string | undefined,
   onChunk: (chunk: string) => void,
-  onComplete: () => void,
-  onError: (err: string) => void
+  onComplete: (result: ChatResponse) => void,
+  onError: (err: string) => void,
+  selectedCandidateId?: string
 ) => {
   const formData = new FormData();
   formData.append('user_id', userId);
@@ -68,6 +86,7 @@ export const streamMessage = async (
   if (documentId) formData.append('document_id', documentId);
   if (file) formData.append('file', file);
   if (threadId) formData.append('thread_id', threadId);
+  if (selectedCandidateId) formData.append('selected_candidate_id', selectedCandidateId);
 
   try {
     const response = await fetch(`${API_BASE}/chat/stream`, {
@@ -85,16 +104,38 @@ export const streamMessage = async (
 
     const reader = response.body.getReader();
     const decoder = new TextDecoder();
+    let buffer = '';
 
     while (true) {
       const { done, value } = await reader.read();
       if (done) break;
-      const chunk = decoder.decode(value, { stream: true });
-      onChunk(chunk);
+      // Кадр может прийти частями: разбираем только завершённые (до пустой строки)
+      buffer = (buffer + decoder.decode(value, { stream: true })).replace(/\r\n/g, '\n');
+      let boundary = buffer.indexOf('\n\n');
+      while (boundary !== -1) {
+        const frame = parseSseFrame(buffer.slice(0, boundary));
+        buffer = buffer.slice(boundary + 2);
+        boundary = buffer.indexOf('\n\n');
+        if (!frame) continue;
+
+        switch (frame.event) {
+          case 'token':
+            onChunk(String(frame.data.content ?? ''));
+            break;
+          case 'clarification':
+          case 'done':
+            onComplete(frame.data as unknown as ChatResponse);
+            return;
+          case 'error':
+            onError(String(frame.data.detail ?? 'Agent error'));
+            return;
+          // node — служебные события о ходе выполнения графа
+        }
+      }
     }
 
-    onComplete();
+    throw new Error('Stream ended without a result');
   } catch (err) {
     onError(String(err));
   }
-};
\ No newline at end of file
+};
@@ -1,4 +1,5 @@
 # run.py
+import argparse
 import logging
 import os
 import sys
@@ -9,6 +10,7 @@ from pathlib import Path
 from dotenv import load_dotenv
 from edms_assistant.presentation.api import app
 from src.edms_assistant.config.settings import settings
+from src.edms_assistant.infrastructure.storage.checkpointer import is_shared_checkpointer
 
 load_dotenv()
 
@@ -35,13 +37,48 @@ def cleanup_temp_dir():
 
 atexit.register(cleanup_temp_dir)
 
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="EDMS Assistant API server")
+    parser.add_argument(
+        "--prod",
+        action="store_true",
+        help="Продакшн-режим: без автоперезагрузки, несколько воркеров",
+    )
+    parser.add_argument("--workers", type=int, default=settings.server.workers)
+    parser.add_argument("--host", default=settings.server.host)
+    parser.add_argument("--port", type=int, default=settings.server.port)
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
     import uvicorn
 
+    args = parse_args()
+
+    if not args.prod:
+        uvicorn.run(
+            "edms_assistant.presentation.api:app",
+            host=args.host,
+            port=args.port,
+            reload=True,
+            log_level=settings.logging_level.lower(),
+        )
+        sys.exit(0)
+
+    if args.workers > 1 and not is_shared_checkpointer():
+        # MemorySaver живёт в памяти воркера: продолжение потока попадёт в чужой процесс
+        logging.error(
+            f"--workers={args.workers} requires a shared checkpointer "
+            f"(CHECKPOINTER_TYPE=sqlite or postgres), got '{settings.checkpointer_type}'"
+        )
+        sys.exit(1)
+
     uvicorn.run(
         "edms_assistant.presentation.api:app",
-        host="127.0.0.1",
-        port=8000,
-        reload=True,
+        host=args.host,
+        port=args.port,
+        reload=False,
+        workers=args.workers,
         log_level=settings.logging_level.lower(),
     )
@@ -1,7 +1,7 @@
 # src/edms_assistant/config/settings.py
 from pydantic import BaseModel, Field, HttpUrl, PostgresDsn, field_validator
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, Optional
 import uuid
 
 
@@ -18,6 +18,96 @@ class EDMSConfig(BaseModel):
     timeout: int = Field(30, ge=1, le=300)
     service_token: str = Field(..., min_length=10, description="JWT-токен для EDMS")
     user_id: uuid.UUID = Field(..., description="UUID пользователя в EDMS")
+    max_connections: int = Field(100, ge=1, le=1000, description="Максимум соединений в пуле к EDMS")
+    max_keepalive_connections: int = Field(20, ge=0, le=1000, description="Сколько простаивающих соединений держать открытыми")
+    keepalive_expiry: float = Field(30.0, ge=0, description="Время жизни простаивающего соединения, сек")
+    http2: bool = Field(False, description="Использовать HTTP/2 (нужен пакет h2)")
+    single_flight: bool = Field(True, description="Объединять одновременные одинаковые GET-запросы")
+    max_attachment_mb: int = Field(100, ge=1, le=4096, description="Максимальный размер скачиваемого вложения, МБ")
+    trusted_documents: bool = Field(False, description="Не валидировать схему DocumentDto в инструментах (доверенный EDMS)")
+    bulk_concurrency: int = Field(8, ge=1, le=128, description="Сколько документов загружает одновременно get_documents")
+
+
+class RetryConfig(BaseModel):
+    max_attempts: int = Field(3, ge=1, le=10, description="Максимум попыток запроса к EDMS при временных сбоях")
+    base_delay: float = Field(0.2, gt=0, description="Минимальная пауза перед повтором, сек")
+    max_delay: float = Field(5.0, gt=0, description="Максимальная пауза перед повтором (и допустимый Retry-After), сек")
+    breaker_failure_threshold: int = Field(5, ge=1, description="Сбоев подряд, после которых хост EDMS считается недоступным")
+    breaker_reset_timeout: float = Field(30.0, gt=0, description="Через сколько секунд пробовать недоступный хост снова")
+
+
+class HedgingConfig(BaseModel):
+    enabled: bool = Field(False, description="Дублировать медленные GET-запросы к EDMS")
+    percentile: float = Field(95.0, ge=50, le=99.9, description="Перцентиль задержек маршрута, после которого отправляется хедж")
+    min_delay: float = Field(0.05, ge=0, description="Минимальная задержка перед хеджем, сек")
+    max_delay: float = Field(2.0, gt=0, description="Максимальная задержка перед хеджем, сек")
+    budget_ratio: float = Field(0.05, ge=0, le=0.5, description="Доля запросов, которые можно дублировать")
+
+
+class UploadConfig(BaseModel):
+    max_size_mb: int = Field(50, ge=1, le=1024, description="Максимальный размер загружаемого файла, МБ")
+    chunk_size: int = Field(1024 * 1024, ge=4096, description="Размер блока при потоковой записи, байт")
+    store_max_entries: int = Field(256, ge=1, description="Максимум файлов в хранилище загрузок")
+    store_max_size_mb: int = Field(2048, ge=1, description="Максимальный суммарный размер хранилища загрузок, МБ")
+
+    @property
+    def max_size_bytes(self) -> int:
+        return self.max_size_mb * 1024 * 1024
+
+
+class BatchConfig(BaseModel):
+    max_items: int = Field(500, ge=1, le=10000, description="Максимум вопросов в одном /chat/batch")
+    max_concurrency: int = Field(8, ge=1, le=128, description="Сколько вопросов пакета выполняется одновременно (не больше admission.max_per_user)")
+
+
+class AdmissionConfig(BaseModel):
+    max_concurrent: int = Field(16, ge=1, le=1024, description="Одновременных запусков графа на процесс (каждый воркер uvicorn считает отдельно)")
+    max_per_user: int = Field(4, ge=1, le=1024, description="Одновременных запусков графа на пользователя в пределах процесса (воркера uvicorn)")
+    max_queue: int = Field(64, ge=0, le=10000, description="Длина очереди ожидания допуска (на процесс)")
+    queue_timeout: float = Field(30.0, gt=0, le=600, description="Максимальное ожидание в очереди, сек")
+
+
+class JobsConfig(BaseModel):
+    workers: int = Field(4, ge=1, le=64, description="Воркеров фоновых заданий на процесс")
+    max_pending: int = Field(256, ge=1, description="Максимум заданий в очереди")
+    result_ttl: float = Field(3600.0, gt=0, description="Сколько хранить завершённые задания, сек")
+    state_dir: Optional[str] = Field(None, description="Каталог состояния заданий (по умолчанию во временной директории)")
+
+
+class AnswerCacheConfig(BaseModel):
+    enabled: bool = True
+    ttl: float = Field(
+        3600.0,
+        ge=0,
+        description="Максимальный возраст ответа, сек (актуальность проверяется по штампу документа)",
+    )
+    max_entries: int = Field(4096, ge=1, description="Максимум ответов в кэше")
+
+
+class ResponseCacheConfig(BaseModel):
+    enabled: bool = True
+    max_entries: int = Field(2048, ge=1, description="Максимум ответов EDMS в кэше")
+    max_size_mb: int = Field(64, ge=1, description="Максимальный объём кэша ответов EDMS, МБ")
+    # Шаблон пути ('*' — один сегмент) -> TTL, сек; побеждает первое совпадение, 0 — не кэшировать
+    ttls: Dict[str, float] = Field(
+        default_factory=lambda: {
+            "api/document/status": 600.0,
+            "api/document/status-group": 600.0,
+            "api/document/recipient": 300.0,
+            "api/document/*/properties": 300.0,
+            "api/document/*/version": 60.0,
+            "api/document/*/contract-version-info": 60.0,
+            "api/document/*/responsible": 60.0,
+            "api/document/*": 30.0,
+            "api/employee/*": 300.0,
+        }
+    )
+
+
+class ServerConfig(BaseModel):
+    host: str = "127.0.0.1"
+    port: int = Field(8000, ge=1, le=65535)
+    workers: int = Field(1, ge=1, le=64, description="Число процессов uvicorn в production-режиме; лимиты допуска и хранилище загрузок действуют в каждом процессе отдельно")
 
 
 class TelemetryConfig(BaseModel):
@@ -62,9 +152,40 @@ class Settings(BaseSettings):
     vllm_timeout: int = Field(120, ge=1, le=600)
     llm_temperature: float = Field(0.0, ge=0.0, le=1.0)
 
+    # EDMS retries & circuit breaker
+    retry: RetryConfig = RetryConfig()
+
+    # EDMS request hedging
+    hedging: HedgingConfig = HedgingConfig()
+
+    # Uploads
+    upload: UploadConfig = UploadConfig()
+
+    # Batch
+    batch: BatchConfig = BatchConfig()
+
+    # Admission control
+    admission: AdmissionConfig = AdmissionConfig()
+
+    # EDMS response cache
+    response_cache: ResponseCacheConfig = ResponseCacheConfig()
+
+    # Answer cache
+    answer_cache: AnswerCacheConfig = AnswerCacheConfig()
+
+    # Server
+    server: ServerConfig = ServerConfig()
+
+    # Background jobs
+    jobs: JobsConfig = JobsConfig()
+
     # Storage & Checkpointing
     store_type: str = "memory"
     checkpointer_type: str = "memory"
+    checkpointer_sqlite_path: str = Field(
+        "edms_checkpoints.sqlite",
+        description="Файл SQLite для checkpointer_type=sqlite (общий для воркеров на одной машине)"
+    )
     checkpointer_postgres_url: Optional[PostgresDsn] = Field(
         None,
         description="PostgreSQL DSN для LangGraph Checkpointer (опционально)"
@@ -1,13 +1,21 @@
 # src/edms_assistant/core/agents/attachment_agent.py
 
+import asyncio
 import logging
+from typing import Optional
 from langgraph.graph import StateGraph, END
+from src.edms_assistant.core.state.credentials import get_service_token
 from src.edms_assistant.core.state.global_state import GlobalState
 from src.edms_assistant.core.tools.attachment_tool import summarize_attachment_tool
 from src.edms_assistant.infrastructure.llm.llm import get_llm
-from src.edms_assistant.infrastructure.api_clients.document_client import DocumentClient
-from src.edms_assistant.utils.file_utils import extract_text_from_bytes
+from src.edms_assistant.infrastructure.api_clients.document_client import (
+    AttachmentTooLargeError,
+    document_client,
+)
+from src.edms_assistant.infrastructure.storage.upload_store import upload_store
+from src.edms_assistant.utils.file_utils import extract_text_from_file
 from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.runnables import RunnableConfig
 from uuid import UUID
 import os
 
@@ -16,7 +24,7 @@ logger = logging.getLogger(__name__)
 llm = get_llm()
 
 
-async def analyze_and_summarize_node(state: GlobalState) -> dict:
+async def analyze_and_summarize_node(state: GlobalState, config: RunnableConfig) -> dict:
     """
     Определяет, что суммаризировать:
     1. Если загружен файл → суммаризировать его
@@ -33,74 +41,130 @@ async def analyze_and_summarize_node(state: GlobalState) -> dict:
 
     # === Приоритет 1: Загруженный файл ===
     if uploaded_file_path and os.path.exists(uploaded_file_path):
-        file_name = os.path.basename(uploaded_file_path)
-        clean_filename = file_name.split("_", 1)[-1] if "_" in file_name else file_name
-
-        try:
-            with open(uploaded_file_path, "rb") as f:
-                file_bytes = f.read()
-
-            text = extract_text_from_bytes(file_bytes, clean_filename)
-            if text and len(text.strip()) >= 20:
-                summary = await _generate_summary(text, clean_filename)
-                final_summary = f"Содержание вашего файла '{clean_filename}':\n{summary}"
-            else:
-                final_summary = f"Файл '{clean_filename}' не содержит текста или не поддерживается."
-
-        except Exception as e:
-            final_summary = f"Не удалось обработать ваш файл: {e}"
-
+        file_name = agent_input.get("uploaded_file_name") or os.path.basename(uploaded_file_path)
+        clean_filename = os.path.basename(file_name)
+        final_summary = await summarize_uploaded_file(
+            uploaded_file_path, clean_filename, agent_input.get("uploaded_file_sha256")
+        )
         return {"messages": [AIMessage(content=final_summary)]}
 
     # === Приоритет 2: Вложение из EDMS ===
     attachment_keywords = ["вложение", "файл", "приложение", "содержание файла", "приложен"]
     if doc_id_str and any(kw in user_msg for kw in attachment_keywords):
-        try:
-            # ✅ Загружаем документ, чтобы получить список вложений
-            from src.edms_assistant.core.tools.document_tool import get_document_tool
-            service_token = state["service_token"]
-            doc_data = await get_document_tool.ainvoke({"document_id": doc_id_str, "service_token": service_token})
+        final_summary = await summarize_document_attachment(
+            doc_id_str, get_service_token(config), user_msg=user_msg, config=config
+        )
+        return {"messages": [AIMessage(content=final_summary)]}
 
-            if not doc_data or "error" in doc_data:
-                return {"messages": [AIMessage(content="Документ не найден.")]}
+    return {"messages": [AIMessage(content="Нет файлов для суммаризации.")]}
 
-            attachments = doc_data.get("attachmentDocument", [])
-            if not attachments:
-                return {"messages": [AIMessage(content="В документе нет вложений.")]}
 
-            target_att = attachments[0]
+async def summarize_document_attachment(
+        document_id: str,
+        service_token: str,
+        user_msg: str = "",
+        attachment_id: Optional[str] = None,
+        config: Optional[RunnableConfig] = None,
+) -> str:
+    """
+    Суммаризирует вложение документа EDMS.
+
+    Вложение выбирается по attachment_id, иначе по имени, упомянутому в user_msg,
+    иначе берётся первое вложение документа.
+    """
+    user_msg = user_msg.lower()
+    try:
+        # ✅ Загружаем документ, чтобы получить список вложений
+        from src.edms_assistant.core.loaders.document_loader import load_document
+        doc_data = await load_document(document_id, service_token, config, profile="attachments")
+
+        if not doc_data or "error" in doc_data:
+            return "Документ не найден."
+
+        attachments = doc_data.get("attachmentDocument", [])
+        if not attachments:
+            return "В документе нет вложений."
+
+        target_att = attachments[0]
+        if attachment_id:
+            target_att = next((att for att in attachments if att.get("id") == attachment_id), None)
+            if target_att is None:
+                return f"Вложение {attachment_id} не найдено в документе."
+        else:
             for att in attachments:
                 if att.get("name") and att["name"].lower() in user_msg:
                     target_att = att
                     break
 
-            doc_uuid = UUID(doc_id_str)
-            att_id_str = target_att.get("id")
-            if not att_id_str:
-                return {"messages": [AIMessage(content="ID вложения не найден.")]}
+        doc_uuid = UUID(document_id)
+        att_id_str = target_att.get("id")
+        if not att_id_str:
+            return "ID вложения не найден."
 
-            att_uuid = UUID(att_id_str)
+        att_uuid = UUID(att_id_str)
+        att_name = target_att.get("name") or "вложение"
 
-            async with DocumentClient(service_token=service_token) as client:
-                file_bytes = await client.download_attachment(doc_uuid, att_uuid)
+        # Вложение скачивается потоком прямо в хранилище загрузок: в памяти нет всего
+        # файла, а текст и резюме кэшируются по SHA-256 содержимого
+        try:
+            saved = await document_client.download_attachment_to_file(
+                doc_uuid, att_uuid, upload_store.staging_path(), service_token=service_token
+            )
+        except AttachmentTooLargeError as e:
+            return f"Вложение '{att_name}' слишком большое для обработки (больше {e.max_bytes // (1024 * 1024)} МБ)."
+        except Exception as e:
+            logger.error(f"summarize_document_attachment: download failed: {e}")
+            return f"Не удалось загрузить файл '{att_name}'."
 
-            if not file_bytes:
-                return {"messages": [
-                    AIMessage(content=f"Не удалось загрузить файл '{target_att.get('name', 'без имени')}'.")]}
+        entry = await upload_store.add(saved, att_name)
+        try:
+            summary = await _summarize_file(entry.path, att_name, entry.sha256)
+        finally:
+            upload_store.release(entry.sha256)
 
-            text = extract_text_from_bytes(file_bytes, target_att.get("name", "вложение"))
-            if text and len(text.strip()) >= 20:
-                summary = await _generate_summary(text, target_att.get("name", "вложение"))
-                final_summary = f"Содержание вложения '{target_att.get('name', 'без имени')}':\n{summary}"
-            else:
-                final_summary = f"Вложение '{target_att.get('name', 'без имени')}' не содержит текста."
+        if summary is None:
+            return f"Вложение '{att_name}' не содержит текста."
+        return f"Содержание вложения '{att_name}':\n{summary}"
 
-        except Exception as e:
-            final_summary = f"Не удалось обработать вложение: {e}"
+    except Exception as e:
+        return f"Не удалось обработать вложение: {e}"
 
-        return {"messages": [AIMessage(content=final_summary)]}
 
-    return {"messages": [AIMessage(content="Нет файлов для суммаризации.")]}
+async def _summarize_file(file_path, filename: str, sha256: Optional[str]) -> Optional[str]:
+    """
+    Резюме файла на диске или None, если текста нет.
+
+    Текст и резюме кэшируются в upload_store по SHA-256 содержимого, поэтому
+    повторная обработка тех же байтов не требует ни извлечения текста, ни вызова LLM.
+    """
+    summary = upload_store.get_summary(sha256) if sha256 else None
+    if summary is not None:
+        logger.info(f"_summarize_file: summary for {sha256[:12]} served from upload store")
+        return summary
+
+    text = upload_store.get_text(sha256) if sha256 else None
+    if text is None:
+        text = await asyncio.to_thread(extract_text_from_file, file_path, filename)
+        if sha256:
+            upload_store.set_text(sha256, text or "")
+    if not text or len(text.strip()) < 20:
+        return None
+    summary = await _generate_summary(text, filename)
+    if sha256:
+        upload_store.set_summary(sha256, summary)
+    return summary
+
+
+async def summarize_uploaded_file(file_path: str, filename: str, sha256: Optional[str]) -> str:
+    """Суммаризирует загруженный файл (с кэшированием по SHA-256, см. _summarize_file)."""
+    try:
+        summary = await _summarize_file(file_path, filename, sha256)
+        if summary is None:
+            return f"Файл '{filename}' не содержит текста или не поддерживается."
+        return f"Содержание вашего файла '{filename}':\n{summary}"
+
+    except Exception as e:
+        return f"Не удалось обработать ваш файл: {e}"
 
 
 async def _generate_summary(text: str, filename: str) -> str:
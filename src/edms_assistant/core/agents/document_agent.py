@@ -2,16 +2,19 @@
 import datetime
 import logging
 from langgraph.graph import StateGraph, END
+from src.edms_assistant.core.state.credentials import get_service_token
 from src.edms_assistant.core.state.global_state import GlobalState
-from src.edms_assistant.core.tools.document_tool import get_document_tool
+from src.edms_assistant.core.loaders.document_loader import load_document, load_document_content
 from src.edms_assistant.infrastructure.llm.llm import get_llm
+from src.edms_assistant.infrastructure.storage.answer_cache import answer_cache, document_stamp
 from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.runnables import RunnableConfig
 
 llm = get_llm()
 
 logger = logging.getLogger(__name__)
 
-async def load_document_node(state: GlobalState) -> dict:
+async def load_document_node(state: GlobalState, config: RunnableConfig) -> dict:
     logger.info("load_document_node: started")
     agent_input = state.get("agent_input", {})
     doc_id = agent_input.get("document_id")
@@ -22,37 +25,48 @@ async def load_document_node(state: GlobalState) -> dict:
         logger.warning("load_document_node: document_id not provided in agent_input")
         return {"current_document": None, "error": "document_id not provided in agent_input"}
 
-    service_token = state["service_token"]
-    logger.info(f"load_document_node: calling get_document_tool with doc_id={doc_id}")
+    service_token = get_service_token(config)
+    # В состояние (и чекпоинт) попадают только поля, нужные для ответа на вопрос
+    profile = detect_document_intent(state.get("user_message", ""))
+    logger.info(f"load_document_node: loading document doc_id={doc_id}, profile={profile}")
 
     try:
-        doc_data = await get_document_tool.ainvoke({"document_id": doc_id, "service_token": service_token})
+        doc_data = await load_document(doc_id, service_token, config, profile=profile)
         logger.info(f"load_document_node: got doc_data = {type(doc_data)}, keys = {list(doc_data.keys()) if isinstance(doc_data, dict) else 'not dict'}")
         return {"current_document": doc_data}
     except Exception as e:
         logger.error(f"load_document_node: error calling tool: {e}", exc_info=True)
         return {"current_document": None, "error": str(e)}
 
-async def format_and_respond_node(state: GlobalState) -> dict:
-    logger.info("format_and_respond_node: started")
-    doc_data = state.get("current_document")
-    user_msg = state.get("user_message", "").lower()
-    logger.info(f"format_and_respond_node: doc_data = {doc_data}, user_msg = {user_msg}")
-
-    if not doc_data or "error" in doc_data:
-        logger.warning("format_and_respond_node: doc_data is None or has error")
-        return {"messages": [AIMessage(content="Документ не найден.")]}
-
-    # ✅ Проверяем, есть ли вопрос в user_msg, и отвечаем на него
+def detect_document_intent(user_msg: str) -> str:
+    """
+    Нормализует вопрос о документе до intent: одинаковые по смыслу вопросы дают одинаковый ключ кэша.
+    Intent также выбирает профиль проекции документа (DOCUMENT_PROFILES в document_tool).
+    """
+    user_msg = user_msg.lower()
     if "автор" in user_msg:
+        return "author"
+    if "статус" in user_msg:
+        return "status"
+    if "дата создания" in user_msg or "создан" in user_msg:
+        return "create_date"
+    if "номер" in user_msg and ("рег" in user_msg or "регистрации" in user_msg):
+        return "reg_number"
+    if "сумма" in user_msg or "договор" in user_msg and "сумм" in user_msg:
+        return "contract_sum"
+    return "full"
+
+
+def render_document_answer(doc_data: dict, intent: str) -> str:
+    """Формирует ответ на вопрос с указанным intent по данным документа."""
+    if intent == "author":
         author = doc_data.get("author", {})
         author_name = f"{author.get('lastName', '')} {author.get('firstName', '')} {author.get('middleName', '')}".strip()
         if author_name:
-            response = f"Автор документа: {author_name}"
-        else:
-            response = "Автор документа не указан."
+            return f"Автор документа: {author_name}"
+        return "Автор документа не указан."
 
-    elif "статус" in user_msg:
+    if intent == "status":
         status = doc_data.get("status")
         status_map = {
             "DRAFT": "Черновик",
@@ -63,35 +77,89 @@ async def format_and_respond_node(state: GlobalState) -> dict:
             "EXECUTED": "Исполнен",
         }
         status_str = status_map.get(status, status)
-        response = f"Статус документа: {status_str}"
+        return f"Статус документа: {status_str}"
 
-    elif "дата создания" in user_msg or "создан" in user_msg:
+    if intent == "create_date":
         create_date = doc_data.get("createDate")
         if create_date:
             try:
                 dt = datetime.datetime.fromisoformat(str(create_date).replace("Z", "+00:00"))
-                response = f"Дата создания документа: {dt.strftime('%d.%m.%Y')}"
+                return f"Дата создания документа: {dt.strftime('%d.%m.%Y')}"
             except:
-                response = f"Дата создания документа: {create_date}"
-        else:
-            response = "Дата создания документа не указана."
+                return f"Дата создания документа: {create_date}"
+        return "Дата создания документа не указана."
 
-    elif "номер" in user_msg and ("рег" in user_msg or "регистрации" in user_msg):
+    if intent == "reg_number":
         reg_number = doc_data.get("regNumber")
-        response = f"Рег. номер: {reg_number}" if reg_number else "Рег. номер не указан."
+        return f"Рег. номер: {reg_number}" if reg_number else "Рег. номер не указан."
 
-    elif "сумма" in user_msg or "договор" in user_msg and "сумм" in user_msg:
+    if intent == "contract_sum":
         contract_sum = doc_data.get("contractSum")
         currency_obj = doc_data.get("currency", {})
         currency_name = currency_obj.get("name", "руб.")
         if contract_sum is not None:
-            response = f"Сумма договора: {contract_sum} {currency_name}"
-        else:
-            response = "Сумма договора не указана."
+            return f"Сумма договора: {contract_sum} {currency_name}"
+        return "Сумма договора не указана."
+
+    # Если вопрос не распознан, возвращаем всё содержимое
+    return format_full_document(doc_data)
+
+
+async def cached_answer_node(state: GlobalState, config: RunnableConfig) -> dict:
+    """
+    Отдаёт ответ из кэша, если документ не изменился с момента, когда ответ был построен.
+
+    Документ запрашивается через загрузчик запроса и кэш ответов EDMS (обычно это
+    свежая запись или 304), поэтому при промахе load_document получает то же тело
+    без повторного запроса. Штамп сохраняется в состоянии для format_and_respond.
+    """
+    doc_id = (state.get("agent_input") or {}).get("document_id")
+    service_token = get_service_token(config)
+    if not doc_id or not service_token:
+        return {"answer_cache_hit": False, "document_stamp": None}
+
+    try:
+        content = await load_document_content(doc_id, service_token, config)
+    except Exception as e:
+        # Ошибку загрузки вернёт load_document_node
+        logger.warning(f"cached_answer_node: document {doc_id} not loaded: {e}")
+        return {"answer_cache_hit": False, "document_stamp": None}
+    if not content:
+        return {"answer_cache_hit": False, "document_stamp": None}
+
+    stamp = document_stamp(content)
+    intent = detect_document_intent(state.get("user_message", ""))
+    answer = answer_cache.get(service_token, doc_id, intent, stamp)
+    if answer is None:
+        return {"answer_cache_hit": False, "document_stamp": stamp}
+
+    logger.info(f"cached_answer_node: serving cached '{intent}' answer for document {doc_id}")
+    return {"answer_cache_hit": True, "messages": [AIMessage(content=answer)]}
+
+
+def route_after_cache(state: GlobalState) -> str:
+    return "answered" if state.get("answer_cache_hit") else "load"
+
+
+async def format_and_respond_node(state: GlobalState, config: RunnableConfig) -> dict:
+    logger.info("format_and_respond_node: started")
+    doc_data = state.get("current_document")
+    user_msg = state.get("user_message", "").lower()
+    logger.info(f"format_and_respond_node: doc_data = {doc_data}, user_msg = {user_msg}")
+
+    if not doc_data or "error" in doc_data:
+        logger.warning("format_and_respond_node: doc_data is None or has error")
+        return {"messages": [AIMessage(content="Документ не найден.")]}
+
+    # ✅ Проверяем, есть ли вопрос в user_msg, и отвечаем на него
+    intent = detect_document_intent(user_msg)
+    response = render_document_answer(doc_data, intent)
 
-    else:
-        # Если вопрос не распознан, возвращаем всё содержимое
-        response = format_full_document(doc_data)
+    doc_id = (state.get("agent_input") or {}).get("document_id")
+    service_token = get_service_token(config)
+    stamp = state.get("document_stamp")
+    if doc_id and service_token and stamp:
+        answer_cache.put(service_token, doc_id, intent, response, stamp)
 
     logger.info(f"format_and_respond_node: response = {response[:100]}...")
     return {"messages": [AIMessage(content=response)]}
@@ -222,10 +290,16 @@ def format_full_document(doc: dict) -> str:
 
 def create_document_agent_graph():
     workflow = StateGraph(GlobalState)
+    workflow.add_node("cached_answer", cached_answer_node)
     workflow.add_node("load_document", load_document_node)
     workflow.add_node("format_and_respond", format_and_respond_node)
 
-    workflow.set_entry_point("load_document")
+    workflow.set_entry_point("cached_answer")
+    workflow.add_conditional_edges(
+        "cached_answer",
+        route_after_cache,
+        {"answered": END, "load": "load_document"},
+    )
     workflow.add_edge("load_document", "format_and_respond")
     workflow.add_edge("format_and_respond", END)
 
@@ -3,52 +3,27 @@
 import re
 import json
 import logging
+from typing import Any, List, Optional
 from langgraph.graph import StateGraph, END
 from langgraph.types import interrupt
+from src.edms_assistant.core.state.credentials import get_service_token
 from src.edms_assistant.core.state.global_state import GlobalState
 from src.edms_assistant.core.tools.employee_tool import find_responsible_tool
 from src.edms_assistant.infrastructure.llm.llm import get_llm
 from src.edms_assistant.core.tools.get_employee_by_id_tool import get_employee_by_id_tool  # ✅ Новый инструмент
-from langchain_core.messages import HumanMessage, ToolMessage, AIMessage
+from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.runnables import RunnableConfig
 
 logger = logging.getLogger(__name__)
 
 llm = get_llm()
 
 
-async def find_responsible_node(state: GlobalState) -> dict:
+async def find_responsible_node(state: GlobalState, config: RunnableConfig) -> dict:
     """
     Извлекает фамилию из agent_input или из сообщения пользователя и ищет ответственных.
-    Если найдено несколько — вызывает прерывание для уточнения.
-    Если пришло уточнение (ID) — получает сотрудника по ID и возвращает полный JSON.
+    Если найдено несколько — сохраняет кандидатов в состоянии для уточнения (select_candidate).
     """
-    # ✅ Проверяем, пришло ли уточнение (ToolMessage)
-    messages = state.get("messages", [])
-    if messages:
-        last_message = messages[-1]
-        if isinstance(last_message, ToolMessage):
-            try:
-                selected_data = json.loads(last_message.content)
-                selected_id = selected_data.get("id")
-                if selected_id:
-                    logger.info(f"find_responsible_node: user selected ID {selected_id}")
-                    # ✅ Вызываем НОВЫЙ инструмент
-                    service_token = state["service_token"]
-                    employee_json = await get_employee_by_id_tool.ainvoke({
-                        "employee_id": selected_id,
-                        "service_token": service_token
-                    })
-                    employee_data = json.loads(employee_json)
-                    if "error" in employee_data:
-                        return {"messages": [AIMessage(content=f"Ошибка: {employee_data['message']}")]}
-
-                    # ✅ Возвращаем полный JSON как строку в content
-                    return {"messages": [AIMessage(content=json.dumps(employee_data, ensure_ascii=False, indent=2))]}
-
-            except (json.JSONDecodeError, KeyError, TypeError) as e:
-                logger.warning(f"find_responsible_node: failed to parse ToolMessage: {e}")
-                return {"messages": [AIMessage(content="Не удалось обработать выбор.")]}
-
     # ✅ Обычная логика поиска по фамилии
     agent_input = state.get("agent_input", {})
     last_name = agent_input.get("last_name")
@@ -62,7 +37,7 @@ async def find_responsible_node(state: GlobalState) -> dict:
     if not last_name:
         return {"messages": [AIMessage(content="Фамилия не найдена в сообщении.")]}
 
-    service_token = state["service_token"]
+    service_token = get_service_token(config)
 
     args = {
         "last_name": last_name,
@@ -71,7 +46,8 @@ async def find_responsible_node(state: GlobalState) -> dict:
         "department_id": None
     }
 
-    output = await find_responsible_tool.ainvoke(args)
+    # config передаёт инструменту загрузчик запроса: одинаковый поиск выполняется один раз за ход
+    output = await find_responsible_tool.ainvoke(args, config=config)
 
     try:
         parsed_output = json.loads(output)
@@ -85,13 +61,9 @@ async def find_responsible_node(state: GlobalState) -> dict:
         candidates = []
 
     if isinstance(candidates, list) and len(candidates) > 1:
-        # 🔴 ПРЕРЫВАНИЕ: нужно уточнение
-        logger.info(f"find_responsible_node: found {len(candidates)} candidates, interrupting for clarification.")
-        return interrupt({
-            "type": "clarification",
-            "candidates": candidates,
-            "document_id": state.get("document_id"),
-        })
+        # Нужно уточнение: кандидаты сохраняются в чекпоинте потока
+        logger.info(f"find_responsible_node: found {len(candidates)} candidates, clarification required.")
+        return {"employee_candidates": candidates}
 
     # Если кандидат один — сразу возвращаем результат (полный JSON)
     if candidates:
@@ -105,12 +77,76 @@ async def find_responsible_node(state: GlobalState) -> dict:
     return {"messages": [AIMessage(content=response_text)]}
 
 
+def _match_candidate(candidates: List[dict], selection: Any) -> Optional[dict]:
+    """Находит выбранного кандидата по ID или по номеру в списке (с 1)."""
+    selection = str(selection).strip()
+    for candidate in candidates:
+        if str(candidate.get("id")) == selection:
+            return candidate
+    if selection.isdigit() and 1 <= int(selection) <= len(candidates):
+        return candidates[int(selection) - 1]
+    return None
+
+
+async def select_candidate_node(state: GlobalState, config: RunnableConfig) -> dict:
+    """
+    Прерывает выполнение для уточнения и при возобновлении (Command(resume=...))
+    выбирает сотрудника из уже найденных кандидатов, без повторного поиска.
+
+    Сотрудник не из списка запрашивается с токеном того, кто прислал выбор (из config),
+    а не с токеном из чекпоинта, с которым поток был начат.
+    """
+    candidates = state.get("employee_candidates") or []
+    selection = interrupt({
+        "type": "clarification",
+        "candidates": candidates,
+        "document_id": state.get("document_id"),
+    })
+    logger.info(f"select_candidate_node: user selected {selection}")
+
+    employee_data = _match_candidate(candidates, selection)
+    if employee_data is None:
+        # Выбран ID не из списка — запрашиваем сотрудника напрямую
+        service_token = get_service_token(config)
+        if not service_token:
+            return {"employee_candidates": None, "messages": [AIMessage(content="Не удалось обработать выбор.")]}
+        employee_json = await get_employee_by_id_tool.ainvoke({
+            "employee_id": str(selection),
+            "service_token": service_token
+        }, config=config)
+        try:
+            employee_data = json.loads(employee_json)
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.warning(f"select_candidate_node: failed to parse employee: {e}")
+            return {"employee_candidates": None, "messages": [AIMessage(content="Не удалось обработать выбор.")]}
+        if "error" in employee_data:
+            return {
+                "employee_candidates": None,
+                "messages": [AIMessage(content=f"Ошибка: {employee_data['message']}")],
+            }
+
+    return {
+        "employee_candidates": None,
+        "messages": [AIMessage(content=json.dumps(employee_data, ensure_ascii=False, indent=2))],
+    }
+
+
+def route_after_search(state: GlobalState) -> str:
+    return "clarify" if state.get("employee_candidates") else "done"
+
+
 def create_employee_agent_graph():
     workflow = StateGraph(GlobalState)
 
     workflow.add_node("find_responsible", find_responsible_node)
+    workflow.add_node("select_candidate", select_candidate_node)
 
     workflow.set_entry_point("find_responsible")
-    workflow.add_edge("find_responsible", END)
+    workflow.add_conditional_edges(
+        "find_responsible",
+        route_after_search,
+        {"clarify": "select_candidate", "done": END},
+    )
+    workflow.add_edge("select_candidate", END)
 
     return workflow.compile()
\ No newline at end of file
@@ -0,0 +1,82 @@
+# src/edms_assistant/core/loaders/document_loader.py
+"""
+Загрузка документа запроса через загрузчик запроса (RequestLoader).
+
+/chat начинает загрузку документа запроса (prefetch) сразу при получении запроса,
+поэтому запрос к EDMS идёт параллельно с работой планировщика, а выбранный агент
+получает уже готовый или ещё выполняющийся результат. Все запуски, получившие один
+и тот же загрузчик (например, элементы одного пакета /chat/batch), разделяют
+единственный запрос к EDMS на каждый document_id.
+"""
+import logging
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from langchain_core.runnables import RunnableConfig
+
+from src.edms_assistant.core.loaders.request_loader import RequestLoader, load_once
+from src.edms_assistant.core.tools.document_tool import document_key, get_document_tool, project_document
+from src.edms_assistant.infrastructure.api_clients.document_client import document_client
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_document_id(document_id: str) -> Optional[UUID]:
+    try:
+        return UUID(str(document_id))
+    except ValueError:
+        return None
+
+
+def prefetch_document(loader: RequestLoader, document_id: str, service_token: str) -> None:
+    """Начинает загрузку документа, не дожидаясь её; get_document_tool затем получит тот же результат."""
+    doc_uuid = _parse_document_id(document_id)
+    if doc_uuid is None:
+        return
+    loader.prefetch(
+        document_key(doc_uuid, service_token),
+        lambda: document_client.get_document_content(doc_uuid, service_token=service_token),
+    )
+
+
+async def load_document_content(
+        document_id: str, service_token: str, config: Optional[RunnableConfig] = None
+) -> Optional[bytes]:
+    """Тело ответа EDMS с документом через загрузчик запроса (тот же запрос, что у get_document_tool)."""
+    doc_uuid = _parse_document_id(document_id)
+    if doc_uuid is None:
+        return None
+    return await load_once(
+        config,
+        document_key(doc_uuid, service_token),
+        lambda: document_client.get_document_content(doc_uuid, service_token=service_token),
+    )
+
+
+def peek_document(
+        loader: RequestLoader, document_id: str, service_token: str, profile: str = "full"
+) -> Optional[Dict[str, Any]]:
+    """Документ по профилю проекции, если он уже загружен (без ожидания), иначе None."""
+    doc_uuid = _parse_document_id(document_id)
+    if doc_uuid is None:
+        return None
+    content = loader.peek(document_key(doc_uuid, service_token))
+    if content is None:
+        return None
+    return project_document(doc_uuid, content, profile)
+
+
+async def load_document(
+        document_id: str,
+        service_token: str,
+        config: Optional[RunnableConfig] = None,
+        profile: str = "full",
+) -> Dict[str, Any]:
+    """
+    Загружает документ через загрузчик запроса из config, а при его отсутствии — напрямую.
+
+    profile — профиль проекции (DOCUMENT_PROFILES): возвращаются только нужные поля.
+    """
+    return await get_document_tool.ainvoke(
+        {"document_id": document_id, "service_token": service_token, "profile": profile}, config=config
+    )
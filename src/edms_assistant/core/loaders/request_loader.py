@@ -0,0 +1,110 @@
+# src/edms_assistant/core/loaders/request_loader.py
+"""
+Загрузчик данных EDMS в пределах одного запроса (хода диалога).
+
+Передаётся через config["configurable"]["request_loader"] и доходит до всех узлов
+графа (в том числе узлов подграфов агентов) и до инструментов, вызванных с этим
+config. Инструменты выполняют чтения EDMS через load_once(): каждая сущность
+(документ, сотрудник, результат поиска сотрудников) запрашивается не более одного
+раза за ход, а параллельные запросы одной сущности разделяют один запрос в полёте.
+
+Загрузчик живёт только в пределах запроса: между ходами данные не переиспользуются
+(для этого есть кэш ответов DocumentClient), поэтому изменения в EDMS видны уже
+на следующем ходу.
+"""
+import asyncio
+import logging
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from langchain_core.runnables import RunnableConfig
+
+logger = logging.getLogger(__name__)
+
+CONFIG_KEY = "request_loader"
+
+# Ключ сущности: (вид, идентификатор..., service_token), например ("document", id, token)
+LoaderKey = Tuple[Hashable, ...]
+
+
+class RequestLoader:
+    """
+    Мемоизирует чтения EDMS по ключу сущности, включая запросы в полёте.
+
+    - `load()` — результат загрузки; фабрика вызывается только при первом обращении
+    - `prefetch()` — начать загрузку заранее, не дожидаясь её
+    - `peek()` — готовый результат без ожидания (или None)
+    - `close()` — отменить незавершённые загрузки в конце запроса
+    """
+
+    def __init__(self):
+        self._tasks: Dict[LoaderKey, asyncio.Task] = {}
+        self._hits: Counter = Counter()
+        self._misses: Counter = Counter()
+        self._prefetched = 0
+
+    def _start(self, key: LoaderKey, factory: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = asyncio.ensure_future(factory())
+        # Результат предзагрузки может так и не понадобиться — ошибку забираем, чтобы не было warning
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._tasks[key] = task
+        return task
+
+    def prefetch(self, key: LoaderKey, factory: Callable[[], Awaitable[Any]]) -> None:
+        """Начинает загрузку, не дожидаясь её; load() с тем же ключом получит тот же результат."""
+        if key not in self._tasks:
+            self._prefetched += 1
+            self._start(key, factory)
+
+    def peek(self, key: LoaderKey) -> Any:
+        """Результат загрузки, если он уже готов (без ожидания), иначе None."""
+        task = self._tasks.get(key)
+        if task is None or not task.done() or task.cancelled() or task.exception() is not None:
+            return None
+        return task.result()
+
+    async def load(self, key: LoaderKey, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Возвращает результат factory(), выполняя её не более одного раза на ключ."""
+        kind = key[0]
+        task = self._tasks.get(key)
+        if task is None or task.cancelled():
+            self._misses[kind] += 1
+            task = self._start(key, factory)
+        else:
+            self._hits[kind] += 1
+            logger.debug(f"RequestLoader: shared {kind} fetch")
+        # shield: отмена одного потребителя не должна отменять загрузку для остальных
+        return await asyncio.shield(task)
+
+    def close(self) -> None:
+        """Отменяет незавершённые загрузки (например, предзагрузку, которая не понадобилась)."""
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entities": dict(Counter(key[0] for key in self._tasks)),
+            "hits": sum(self._hits.values()),
+            "misses": sum(self._misses.values()),
+            "prefetched": self._prefetched,
+        }
+
+
+def get_request_loader(config: Optional[RunnableConfig]) -> Optional[RequestLoader]:
+    """Достаёт загрузчик из конфигурации запуска графа, если он был передан."""
+    if not config:
+        return None
+    return config.get("configurable", {}).get(CONFIG_KEY)
+
+
+async def load_once(
+        config: Optional[RunnableConfig],
+        key: LoaderKey,
+        factory: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Чтение EDMS через загрузчик запроса, а при его отсутствии — напрямую."""
+    loader = get_request_loader(config)
+    if loader is None:
+        return await factory()
+    return await loader.load(key, factory)
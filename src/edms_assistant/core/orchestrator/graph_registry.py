@@ -0,0 +1,146 @@
+# src/edms_assistant/core/orchestrator/graph_registry.py
+"""
+Реестр скомпилированных графов.
+
+Оркестратор и под-графы агентов компилируются один раз на процесс (в lifespan
+FastAPI) и переиспользуются всеми запросами вместе с общим чекпоинтером,
+поэтому память потоков (thread_id) сохраняется между запросами.
+"""
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph.state import CompiledStateGraph
+
+from src.edms_assistant.core.agents.attachment_agent import create_attachment_agent_graph
+from src.edms_assistant.core.agents.document_agent import create_document_agent_graph
+from src.edms_assistant.core.agents.employee_agent import create_employee_agent_graph
+from src.edms_assistant.core.orchestrator.orchestrator import create_orchestrator_graph
+
+logger = logging.getLogger(__name__)
+
+
+class GraphRegistry:
+    """
+    Хранит скомпилированный граф оркестратора и его под-графы.
+
+    - `startup()` компилирует и прогревает графы (вызывается из lifespan)
+    - `get_graph()` отдаёт общий граф; при отсутствии startup компилирует его лениво
+    - `stats()` возвращает время компиляции и счётчики переиспользования
+    """
+
+    def __init__(self, checkpointer: Optional[BaseCheckpointSaver] = None):
+        self._checkpointer = checkpointer
+        self._graph: Optional[CompiledStateGraph] = None
+        self._subgraphs: Dict[str, CompiledStateGraph] = {}
+        self._compile_seconds: Dict[str, float] = {}
+        self._warmup_seconds: Optional[float] = None
+        self._reuse_counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def checkpointer(self) -> BaseCheckpointSaver:
+        """Общий чекпоинтер всех запросов."""
+        if self._checkpointer is None:
+            self._checkpointer = MemorySaver()
+        return self._checkpointer
+
+    @property
+    def is_ready(self) -> bool:
+        return self._graph is not None
+
+    def _compile(self) -> None:
+        """Компилирует под-графы и оркестратор, замеряя время каждого шага."""
+        factories = {
+            "document": create_document_agent_graph,
+            "attachment": create_attachment_agent_graph,
+            "employee": create_employee_agent_graph,
+        }
+        subgraphs: Dict[str, CompiledStateGraph] = {}
+        for name, factory in factories.items():
+            started = time.perf_counter()
+            subgraphs[name] = factory()
+            self._compile_seconds[name] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        graph = create_orchestrator_graph(
+            checkpointer=self.checkpointer,
+            document_agent_graph=subgraphs["document"],
+            attachment_agent_graph=subgraphs["attachment"],
+            employee_agent_graph=subgraphs["employee"],
+        )
+        self._compile_seconds["orchestrator"] = time.perf_counter() - started
+
+        self._subgraphs = subgraphs
+        self._graph = graph
+        logger.info(
+            "GraphRegistry: graphs compiled in "
+            + ", ".join(f"{k}={v * 1000:.1f}ms" for k, v in self._compile_seconds.items())
+        )
+
+    def _warm_up(self) -> None:
+        """Строит описания графов заранее, чтобы первый запрос не платил за ленивую инициализацию."""
+        started = time.perf_counter()
+        self._graph.get_graph(xray=True)
+        for subgraph in self._subgraphs.values():
+            subgraph.get_graph()
+        self._warmup_seconds = time.perf_counter() - started
+        logger.info(f"GraphRegistry: warm-up finished in {self._warmup_seconds * 1000:.1f}ms")
+
+    def _ensure_compiled(self) -> None:
+        if self._graph is not None:
+            return
+        with self._lock:
+            if self._graph is None:
+                self._compile()
+                self._warm_up()
+
+    async def startup(self, checkpointer: Optional[BaseCheckpointSaver] = None) -> None:
+        """
+        Компилирует и прогревает графы при старте приложения.
+
+        Args:
+            checkpointer: Общий чекпоинтер (см. open_checkpointer); по умолчанию MemorySaver.
+        """
+        if checkpointer is not None and checkpointer is not self._checkpointer:
+            self._checkpointer = checkpointer
+            self._graph = None
+        self._ensure_compiled()
+
+    async def shutdown(self) -> None:
+        """Освобождает графы при остановке приложения."""
+        logger.info(f"GraphRegistry: shutting down, reuse counts = {self._reuse_counts}")
+        self._graph = None
+        self._subgraphs = {}
+        self._checkpointer = None
+
+    def get_graph(self) -> CompiledStateGraph:
+        """Возвращает общий скомпилированный граф оркестратора."""
+        self._ensure_compiled()
+        self._reuse_counts["orchestrator"] = self._reuse_counts.get("orchestrator", 0) + 1
+        return self._graph
+
+    def get_subgraph(self, name: str) -> CompiledStateGraph:
+        """Возвращает скомпилированный под-граф агента ("document", "attachment", "employee")."""
+        self._ensure_compiled()
+        if name not in self._subgraphs:
+            raise KeyError(f"Unknown subgraph: {name}")
+        self._reuse_counts[name] = self._reuse_counts.get(name, 0) + 1
+        return self._subgraphs[name]
+
+    def stats(self) -> Dict[str, Any]:
+        """Метрики реестра: время компиляции/прогрева и количество выдач графов."""
+        return {
+            "ready": self.is_ready,
+            "checkpointer": type(self._checkpointer).__name__ if self._checkpointer else None,
+            "compile_ms": {k: round(v * 1000, 2) for k, v in self._compile_seconds.items()},
+            "warmup_ms": round(self._warmup_seconds * 1000, 2) if self._warmup_seconds is not None else None,
+            "reuse_counts": dict(self._reuse_counts),
+        }
+
+
+# Глобальный экземпляр
+graph_registry = GraphRegistry()
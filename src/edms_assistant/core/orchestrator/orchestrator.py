@@ -2,6 +2,10 @@
 import logging
 from langgraph.graph import StateGraph, END
 from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableConfig
+from src.edms_assistant.core.loaders.document_loader import peek_document
+from src.edms_assistant.core.loaders.request_loader import get_request_loader
+from src.edms_assistant.core.state.credentials import get_service_token
 from src.edms_assistant.core.state.global_state import GlobalState
 from src.edms_assistant.infrastructure.llm.llm import get_llm
 from src.edms_assistant.core.agents.document_agent import create_document_agent_graph
@@ -16,12 +20,28 @@ logger = logging.getLogger(__name__)
 llm = get_llm()
 
 
-async def orchestrator_planner(state: GlobalState) -> dict:
+def _document_brief(document: dict) -> str:
+    """Краткие реквизиты документа для промпта планировщика."""
+    fields = ("docCategoryConstant", "regNumber", "status", "shortSummary")
+    return ", ".join(f"{field}: {document[field]}" for field in fields if document.get(field)) or "Нет данных о документе."
+
+
+async def orchestrator_planner(state: GlobalState, config: RunnableConfig) -> dict:
     logger.info(f"orchestrator_planner: full state keys = {list(state.keys())}")
     user_msg = state["user_message"]
     document_id = state.get("document_id")
     uploaded_file_path = state.get("uploaded_file_path")
-    current_document = state.get("current_document", "Нет данных о документе.")
+    uploaded_file_name = state.get("uploaded_file_name")
+    uploaded_file_sha256 = state.get("uploaded_file_sha256")
+    current_document = state.get("current_document") or "Нет данных о документе."
+
+    # Предзагруженный документ используем, только если он уже пришёл: ждать EDMS планировщику незачем
+    loader = get_request_loader(config)
+    service_token = get_service_token(config)
+    if document_id and loader is not None and service_token:
+        prefetched = peek_document(loader, document_id, service_token, profile="brief")
+        if isinstance(prefetched, dict) and "error" not in prefetched:
+            current_document = _document_brief(prefetched)
 
     logger.info(
         f"orchestrator_planner: user_msg={user_msg}, document_id={document_id}, uploaded_file_path={uploaded_file_path}")
@@ -32,7 +52,11 @@ async def orchestrator_planner(state: GlobalState) -> dict:
         logger.info(f"orchestrator_planner: directing to attachment_agent (file uploaded)")
         return {
             "next_agent": "attachment",
-            "agent_input": {"uploaded_file_path": uploaded_file_path},
+            "agent_input": {
+                "uploaded_file_path": uploaded_file_path,
+                "uploaded_file_name": uploaded_file_name,
+                "uploaded_file_sha256": uploaded_file_sha256,
+            },
             "requires_clarification": False
         }
 
@@ -159,12 +183,23 @@ async def route_to_agent(state: GlobalState) -> str:
     return "default"
 
 
-def create_orchestrator_graph():
+def create_orchestrator_graph(
+        checkpointer=None,
+        document_agent_graph=None,
+        attachment_agent_graph=None,
+        employee_agent_graph=None,
+):
+    """
+    Собирает граф оркестратора.
+
+    Уже скомпилированные под-графы и общий чекпоинтер можно передать снаружи
+    (см. GraphRegistry), иначе они создаются заново.
+    """
     workflow = StateGraph(GlobalState)
 
-    document_agent_graph = create_document_agent_graph()
-    attachment_agent_graph = create_attachment_agent_graph()
-    employee_agent_graph = create_employee_agent_graph()
+    document_agent_graph = document_agent_graph or create_document_agent_graph()
+    attachment_agent_graph = attachment_agent_graph or create_attachment_agent_graph()
+    employee_agent_graph = employee_agent_graph or create_employee_agent_graph()
 
     workflow.add_node("planner", orchestrator_planner)
     workflow.add_node("document_agent", document_agent_graph)
@@ -186,5 +221,6 @@ def create_orchestrator_graph():
     workflow.add_edge("attachment_agent", END)
     workflow.add_edge("employee_agent", END)
 
-    checkpointer = MemorySaver()
+    if checkpointer is None:
+        checkpointer = MemorySaver()
     return workflow.compile(checkpointer=checkpointer)
@@ -0,0 +1,24 @@
+# src/edms_assistant/core/state/credentials.py
+"""
+Токен вызывающего для одного запуска графа.
+
+Передаётся через config["configurable"] рядом с загрузчиком запроса и доходит до всех
+узлов (в том числе подграфов агентов). В состоянии графа токена нет: состояние
+сохраняется чекпоинтером в общей БД, а токен не должен храниться там открытым
+текстом. Узлы, обращающиеся к EDMS от имени пользователя, берут токен отсюда; при
+возобновлении уточнения это токен того, кто прислал выбор.
+
+Ключ начинается с "__": такие значения LangGraph не копирует в метаданные чекпоинта.
+"""
+from typing import Optional
+
+from langchain_core.runnables import RunnableConfig
+
+CONFIG_KEY = "__service_token"
+
+
+def get_service_token(config: Optional[RunnableConfig]) -> Optional[str]:
+    """Токен вызывающего из конфигурации запуска графа, если он был передан."""
+    if not config:
+        return None
+    return config.get("configurable", {}).get(CONFIG_KEY)
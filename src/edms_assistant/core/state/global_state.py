@@ -11,7 +11,8 @@ from uuid import UUID
 
 class GlobalState(TypedDict):
     user_id: UUID
-    service_token: str
+    # service_token в состоянии нет: оно сохраняется чекпоинтером в общей БД, а токен
+    # передаётся на каждый запуск через config (см. core.state.credentials)
     user_message: str
     messages: Annotated[Sequence[dict], add_messages]
     # plan: Optional[Plan]
@@ -23,7 +24,11 @@ class GlobalState(TypedDict):
     error: Optional[str]
     uploaded_file_path: Optional[str]
     uploaded_file_name: Optional[str]
+    uploaded_file_sha256: Optional[str]
     attachment_id: Optional[str]
     attachment_name: Optional[str]
     document_id: Optional[str]
-    current_document: Optional[dict]
\ No newline at end of file
+    current_document: Optional[dict]
+    answer_cache_hit: Optional[bool]
+    document_stamp: Optional[str]
+    employee_candidates: Optional[list]
\ No newline at end of file
@@ -1,11 +1,17 @@
 # src/edms_assistant/tools/attachment_tool.py
+import asyncio
 import json
+import tempfile
+from pathlib import Path
 from typing import Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 from pydantic import BaseModel, Field
 from langchain_core.tools import tool
-from src.edms_assistant.infrastructure.api_clients.document_client import DocumentClient
-from src.edms_assistant.utils.file_utils import extract_text_from_bytes
+from src.edms_assistant.infrastructure.api_clients.document_client import (
+    AttachmentTooLargeError,
+    document_client,
+)
+from src.edms_assistant.utils.file_utils import extract_text_from_file
 from src.edms_assistant.infrastructure.llm.llm import get_llm
 import logging
 
@@ -34,14 +40,22 @@ async def summarize_attachment_tool(
         return f"Ошибка: неверный UUID. {e}"
 
     try:
-        async with DocumentClient(service_token=service_token) as client:
-            file_bytes = await client.download_attachment(doc_uuid, att_uuid)
-        if not file_bytes:
-            return "Ошибка: файл не найден."
-
         filename = attachment_name
+        spool_path = Path(tempfile.gettempdir()) / f"edms_attachment_{uuid4().hex}.part"
+        try:
+            await document_client.download_attachment_to_file(
+                doc_uuid, att_uuid, spool_path, service_token=service_token
+            )
+        except AttachmentTooLargeError:
+            return f"Ошибка: файл '{filename}' слишком большой для обработки."
+        except Exception as e:
+            logger.error(f"Ошибка загрузки вложения {attachment_id}: {e}")
+            return "Ошибка: файл не найден."
 
-        text = extract_text_from_bytes(file_bytes, filename)
+        try:
+            text = await asyncio.to_thread(extract_text_from_file, spool_path, filename)
+        finally:
+            spool_path.unlink(missing_ok=True)
         if not text or len(text) < 20:
             return f"Файл '{filename}' содержит мало текста или не поддерживается."
 
@@ -4,22 +4,60 @@
 Все инструменты возвращают сырые данные от EDMS API (в формате JSON-строки).
 """
 import json
-from typing import Optional, Any, Coroutine
+from typing import Optional, Any, Coroutine, Dict
+from uuid import UUID
 from pydantic import BaseModel, Field
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool
-from src.edms_assistant.infrastructure.api_clients.document_client import DocumentClient
-from src.edms_assistant.infrastructure.resources_openapi import DocumentDto
+from src.edms_assistant.core.loaders.request_loader import load_once
+from src.edms_assistant.infrastructure.api_clients.document_client import document_client
 from src.edms_assistant.utils.api_utils import validate_document_id
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Поля, которые есть в любой проекции: идентификатор документа и его версии
+_IDENTITY = {"id": True, "documentVersionId": True}
+
+# Профили проекции DocumentDto по intent вопроса (detect_document_intent) в формате
+# include из pydantic; в состояние графа и чекпоинт попадают только эти поля.
+# None — документ целиком.
+DOCUMENT_PROFILES: Dict[str, Optional[Dict[str, Any]]] = {
+    "author": {
+        **_IDENTITY,
+        "author": {"lastName", "firstName", "middleName", "authorPost", "authorDepartmentName"},
+    },
+    "status": {**_IDENTITY, "status": True},
+    "create_date": {**_IDENTITY, "createDate": True},
+    "reg_number": {**_IDENTITY, "regNumber": True},
+    "contract_sum": {**_IDENTITY, "contractSum": True, "currency": {"name"}},
+    "attachments": {**_IDENTITY, "attachmentDocument": {"__all__": {"id", "name"}}},
+    # Реквизиты для промпта планировщика
+    "brief": {**_IDENTITY, "docCategoryConstant": True, "regNumber": True, "status": True, "shortSummary": True},
+    "full": None,
+}
+
+
 class GetDocumentInput(BaseModel):
     """Схема входных данных для получения документа по ID."""
 
     document_id: str = Field(..., description="UUID документа в EDMS.")
     service_token: str = Field(..., description="JWT-токен для авторизации в EDMS.")
+    profile: str = Field(
+        "full",
+        description=f"Какие поля документа вернуть: {', '.join(DOCUMENT_PROFILES)} (full — весь документ).",
+    )
+
+
+def document_key(doc_uuid: UUID, service_token: str) -> tuple:
+    """Ключ тела документа в загрузчике запроса (RequestLoader)."""
+    return ("document", str(doc_uuid), service_token)
+
+
+def project_document(doc_uuid: UUID, content: bytes, profile: str = "full") -> Optional[Dict[str, Any]]:
+    """dict документа по профилю проекции; неизвестный профиль — документ целиком."""
+    return document_client.document_payload(doc_uuid, content, include=DOCUMENT_PROFILES.get(profile))
 
 
 @tool(
@@ -27,13 +65,18 @@ class GetDocumentInput(BaseModel):
     name_or_callable="get_document_tool",
     description="Получить документ по ID из EDMS. Возвращает сырой JSON-ответ от Java API в виде строки.",
 )
-async def get_document_tool(document_id: str, service_token: str) -> dict:
+async def get_document_tool(
+    document_id: str, service_token: str, config: RunnableConfig, profile: str = "full"
+) -> dict:
     """
     Получает документ по ID из EDMS и возвращает **сырой JSON-ответ** от Java API в виде строки.
 
     Args:
         document_id: UUID документа в EDMS (строка в формате UUID)
         service_token: JWT-токен для авторизации в EDMS
+        config: конфигурация запуска; если в ней есть загрузчик запроса, документ
+            запрашивается из EDMS не более одного раза за ход
+        profile: профиль проекции из DOCUMENT_PROFILES — вернуть только нужные поля
 
     Returns:
         str: Сырой JSON-ответ от EDMS (в виде строки), или JSON с ошибкой при неудаче.
@@ -47,17 +90,22 @@ async def get_document_tool(document_id: str, service_token: str) -> dict:
             "details": "Не удалось преобразовать строку в UUID.",
         }
     try:
-        async with DocumentClient(service_token=service_token) as client:
-            doc_model: Optional[DocumentDto] = await client.get_document(doc_uuid)
+        # Документ разбирается из байтов ответа сразу в dict, без промежуточной модели
+        # Загрузчик хранит тело ответа: вызовы с разными профилями разделяют один запрос
+        content = await load_once(
+            config,
+            document_key(doc_uuid, service_token),
+            lambda: document_client.get_document_content(doc_uuid, service_token=service_token),
+        )
+        document = project_document(doc_uuid, content, profile)
 
-        if doc_model is None:
+        if document is None:
             return {
                 "error": "document_not_found",
                 "message": f"Документ с ID {document_id} не найден или недоступен.",
             }
 
-        # Преобразуем модель в dict (с вложенными объектами)
-        return doc_model.model_dump(mode="json", exclude_unset=True)
+        return document
 
     except Exception as e:
         logger.error(
@@ -3,9 +3,11 @@ import json
 from typing import List, Dict, Any, Optional
 from uuid import UUID
 from pydantic import BaseModel, Field
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool
-from src.edms_assistant.infrastructure.api_clients.document_client import DocumentClient
-from src.edms_assistant.infrastructure.resources_openapi import EmployeeFilter
+from src.edms_assistant.core.loaders.request_loader import load_once
+from src.edms_assistant.infrastructure.api_clients.document_client import document_client
+from src.edms_assistant.infrastructure import resources_openapi as models
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,22 +30,27 @@ async def find_responsible_tool(
         service_token: str,
         first_name: Optional[str] = None,
         department_id: Optional[UUID] = None,
+        config: RunnableConfig = None,
 ) -> str:
     """
     Выполняет поиск сотрудников через EDMS API /employee/search.
+    Через загрузчик запроса из config одинаковый поиск выполняется не более одного раза за ход.
     """
     try:
         # Формируем фильтр
-        filter_data = EmployeeFilter(
+        filter_data = models.EmployeeFilter(
             lastName=last_name,
             firstName=first_name,
             departmentId=[department_id] if department_id else None,
             active=True,
         )
 
-        async with DocumentClient(service_token=service_token) as client:
-            # ✅ Вызываем метод клиента
-            response = await client.search_employees(filter_data.model_dump(exclude_none=True, mode="json"))
+        filter_json = filter_data.model_dump(exclude_none=True, mode="json")
+        response = await load_once(
+            config,
+            ("employee_search", json.dumps(filter_json, sort_keys=True), service_token),
+            lambda: document_client.search_employees(filter_json, service_token=service_token),
+        )
 
         if not response or "content" not in response:
             return json.dumps({"error": "Пустой ответ от EDMS"})
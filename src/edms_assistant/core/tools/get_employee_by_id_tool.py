@@ -4,8 +4,10 @@ import json
 from typing import Optional, Dict, Any
 from uuid import UUID
 from pydantic import BaseModel, Field
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool
-from src.edms_assistant.infrastructure.api_clients.document_client import DocumentClient
+from src.edms_assistant.core.loaders.request_loader import load_once
+from src.edms_assistant.infrastructure.api_clients.document_client import document_client
 from src.edms_assistant.utils.api_utils import validate_document_id as validate_uuid
 import logging
 
@@ -23,18 +25,22 @@ class GetEmployeeByIdInput(BaseModel):
 async def get_employee_by_id_tool(
     employee_id: str,
     service_token: str,
+    config: RunnableConfig,
 ) -> str:
     """
     Выполняет поиск сотрудника по UUID через EDMS API /api/employee/{id}.
+    Через загрузчик запроса из config сотрудник запрашивается не более одного раза за ход.
     """
     try:
         emp_uuid = validate_uuid(employee_id)
         if emp_uuid is None:
             return json.dumps({"error": "invalid_employee_id", "message": f"Неверный формат ID: '{employee_id}'."})
 
-        async with DocumentClient(service_token=service_token) as client:
-            # ✅ Вызываем метод клиента
-            response = await client.get_employee_by_id(emp_uuid)
+        response = await load_once(
+            config,
+            ("employee", str(emp_uuid), service_token),
+            lambda: document_client.get_employee_by_id(emp_uuid, service_token=service_token),
+        )
 
         if not response:
             return json.dumps({"error": "employee_not_found", "message": f"Сотрудник с ID {employee_id} не найден."})
@@ -0,0 +1,201 @@
+# src/edms_assistant/infrastructure/admission/admission_controller.py
+"""
+Контроль допуска запросов к выполнению графа.
+
+Ограничивает число одновременных запусков (глобально и на пользователя) и держит
+ограниченную очередь ожидания с дедлайном. Если очередь переполнена или дедлайн
+истёк, запрос отклоняется с рекомендацией, через сколько секунд повторить.
+"""
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Tuple
+
+from src.edms_assistant.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejected(Exception):
+    """Запрос не допущен к выполнению: очередь переполнена или истёк срок ожидания."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(f"Admission rejected: {reason}")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Допускает к выполнению не более `max_concurrent` запросов (и `max_per_user` на
+    пользователя). Остальные ждут в FIFO-очереди длиной до `max_queue` не дольше
+    `queue_timeout` секунд.
+
+    Ожидающие, упёршиеся только в лимит своего пользователя, не мешают другим: запрос
+    с запасом по обоим лимитам допускается сразу, а в его лимит очереди засчитываются
+    лишь свои ожидающие и ожидающие общего слота.
+    """
+
+    def __init__(self, max_concurrent: int, max_per_user: int, max_queue: int, queue_timeout: float):
+        self.max_concurrent = max_concurrent
+        self.max_per_user = max_per_user
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+
+        self._active = 0
+        self._active_by_user: Dict[str, int] = {}
+        self._waiters: Deque[Tuple[str, asyncio.Future]] = deque()
+
+        self._admitted = 0
+        self._rejected_queue_full = 0
+        self._rejected_timeout = 0
+        self._max_queue_depth = 0
+        self._wait_times: Deque[float] = deque(maxlen=1000)
+        self._hold_times: Deque[float] = deque(maxlen=1000)
+
+    def _has_capacity(self, user_key: str) -> bool:
+        return (
+            self._active < self.max_concurrent
+            and self._active_by_user.get(user_key, 0) < self.max_per_user
+        )
+
+    def _queued_ahead(self, user_key: str) -> int:
+        """Ожидающие, которые конкурируют с user_key за очередь: свои и ждущие общего слота."""
+        return sum(
+            1 for waiting_key, _ in self._waiters
+            if waiting_key == user_key or self._active_by_user.get(waiting_key, 0) < self.max_per_user
+        )
+
+    def _grant(self, user_key: str) -> None:
+        self._active += 1
+        self._active_by_user[user_key] = self._active_by_user.get(user_key, 0) + 1
+        self._admitted += 1
+
+    def _retry_after(self) -> int:
+        """Оценка в секундах: сколько займёт разбор текущей очереди при среднем времени выполнения."""
+        if not self._hold_times:
+            return 1
+        mean_hold = sum(self._hold_times) / len(self._hold_times)
+        estimate = mean_hold * (len(self._waiters) + 1) / self.max_concurrent
+        return min(max(math.ceil(estimate), 1), 60)
+
+    async def acquire(self, user_key: str) -> float:
+        """
+        Ждёт допуска к выполнению.
+
+        Returns:
+            Момент допуска (time.monotonic()), который нужно передать в release().
+
+        Raises:
+            AdmissionRejected: очередь переполнена или истёк queue_timeout.
+        """
+        started = time.monotonic()
+        # Есть общий слот — значит, все ожидающие упёрлись в лимиты своих пользователей
+        if self._has_capacity(user_key):
+            self._grant(user_key)
+            self._wait_times.append(0.0)
+            return started
+
+        queued = self._queued_ahead(user_key)
+        if queued >= self.max_queue:
+            self._rejected_queue_full += 1
+            logger.warning(f"AdmissionController: queue full ({queued}), rejecting {user_key}")
+            raise AdmissionRejected("queue_full", self._retry_after())
+
+        future = asyncio.get_running_loop().create_future()
+        waiter = (user_key, future)
+        self._waiters.append(waiter)
+        self._max_queue_depth = max(self._max_queue_depth, len(self._waiters))
+        try:
+            await asyncio.wait({future}, timeout=self.queue_timeout)
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+        if not future.done():
+            self._abandon(waiter)
+            self._rejected_timeout += 1
+            logger.warning(f"AdmissionController: wait deadline exceeded for {user_key}")
+            raise AdmissionRejected("queue_timeout", self._retry_after())
+
+        admitted_at = time.monotonic()
+        self._wait_times.append(admitted_at - started)
+        return admitted_at
+
+    def _abandon(self, waiter: Tuple[str, asyncio.Future]) -> None:
+        """Снимает ожидающего с очереди; если допуск уже выдан — возвращает его."""
+        user_key, future = waiter
+        if future.done() and not future.cancelled():
+            self.release(user_key, time.monotonic())
+            return
+        future.cancel()
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def release(self, user_key: str, admitted_at: float) -> None:
+        """Освобождает слот и допускает следующих ожидающих, для которых есть место."""
+        self._hold_times.append(time.monotonic() - admitted_at)
+        self._active -= 1
+        remaining = self._active_by_user.get(user_key, 0) - 1
+        if remaining > 0:
+            self._active_by_user[user_key] = remaining
+        else:
+            self._active_by_user.pop(user_key, None)
+        self._wake()
+
+    def _wake(self) -> None:
+        # Ожидающий, упёршийся в лимит своего пользователя, не блокирует остальных
+        for waiter in list(self._waiters):
+            if self._active >= self.max_concurrent:
+                break
+            user_key, future = waiter
+            if future.done():
+                self._waiters.remove(waiter)
+                continue
+            if self._has_capacity(user_key):
+                self._waiters.remove(waiter)
+                self._grant(user_key)
+                future.set_result(None)
+
+    @asynccontextmanager
+    async def admit(self, user_key: str) -> AsyncIterator[None]:
+        """Контекстный менеджер: acquire() при входе и release() при выходе."""
+        admitted_at = await self.acquire(user_key)
+        try:
+            yield
+        finally:
+            self.release(user_key, admitted_at)
+
+    def stats(self) -> Dict[str, Any]:
+        waits = sorted(self._wait_times)
+        return {
+            "active": self._active,
+            "queue_depth": len(self._waiters),
+            "max_queue_depth": self._max_queue_depth,
+            "admitted": self._admitted,
+            "rejected_queue_full": self._rejected_queue_full,
+            "rejected_timeout": self._rejected_timeout,
+            "wait_ms_avg": round(sum(waits) / len(waits) * 1000, 2) if waits else 0.0,
+            "wait_ms_p95": round(waits[min(int(len(waits) * 0.95), len(waits) - 1)] * 1000, 2) if waits else 0.0,
+            "wait_ms_max": round(waits[-1] * 1000, 2) if waits else 0.0,
+            "limits": {
+                "max_concurrent": self.max_concurrent,
+                "max_per_user": self.max_per_user,
+                "max_queue": self.max_queue,
+                "queue_timeout": self.queue_timeout,
+            },
+        }
+
+
+# Глобальный экземпляр
+admission_controller = AdmissionController(
+    max_concurrent=settings.admission.max_concurrent,
+    max_per_user=settings.admission.max_per_user,
+    max_queue=settings.admission.max_queue,
+    queue_timeout=settings.admission.queue_timeout,
+)
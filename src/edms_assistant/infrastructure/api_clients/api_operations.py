@@ -0,0 +1,154 @@
+# src/edms_assistant/infrastructure/api_clients/api_operations.py
+"""
+Основа сгенерированного клиента EDMS (edms_api.py).
+
+Каждая операция OpenAPI описывается объектом Operation (метод, шаблон пути, типы
+тела запроса и ответа), а вызов выполняется через транспорт DocumentClient: общий
+пул соединений, повторы и circuit breaker, хеджирование, single-flight и кэш ответов.
+Тело запроса сериализуется, а ответ валидируется прямо из байтов через TypeAdapter,
+который создаётся один раз на тип (при первом вызове операции).
+
+Типы моделей в сгенерированном клиенте заданы через lambda: модуль тега из
+resources_openapi импортируется только при первом вызове операции, а не при
+импорте клиента.
+"""
+from dataclasses import dataclass
+from functools import cached_property
+from types import FunctionType
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Mapping, Optional
+from urllib.parse import quote
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from src.edms_assistant.infrastructure.api_clients.model_adapters import type_adapter, validate_json
+
+if TYPE_CHECKING:
+    from src.edms_assistant.infrastructure.api_clients.document_client import DocumentClient
+
+
+def _resolve(tp: Any) -> Any:
+    """Тип, заданный лениво (lambda: m.Model), или сам тип."""
+    return tp() if isinstance(tp, FunctionType) else tp
+
+
+@dataclass(frozen=True)
+class Operation:
+    """Описание операции OpenAPI."""
+
+    method: str
+    path: str
+    response: Any = None
+    body: Any = None
+    multipart: bool = False
+    binary: bool = False
+
+    @cached_property
+    def response_type(self) -> Any:
+        return _resolve(self.response)
+
+    @cached_property
+    def body_type(self) -> Any:
+        return _resolve(self.body)
+
+    def endpoint(self, path_params: Mapping[str, Any]) -> str:
+        """Путь с подставленными параметрами; каждый кодируется целиком ('/', '?', '#' не меняют адрес)."""
+        return self.path.format(**{
+            name: quote(str(to_jsonable_python(value)), safe="") for name, value in path_params.items()
+        })
+
+
+def _flatten_query(name: str, value: Any, params: Dict[str, Any]) -> None:
+    """
+    Параметры запроса в виде, который понимает Spring: объекты-фильтры (Pageable,
+    *Filter) раскрываются в отдельные параметры, вложенные поля — через точку.
+    """
+    if value is None:
+        return
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode="json", exclude_none=True)
+        for key, item in value.items():
+            _flatten_query(key, item, params)
+        return
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _flatten_query(f"{name}.{key}", item, params)
+        return
+    params[name] = to_jsonable_python(value)
+
+
+class ApiGroup:
+    """Операции одного тега OpenAPI поверх общего транспорта."""
+
+    def __init__(self, transport: "DocumentClient"):
+        self._transport = transport
+
+    def _request_kwargs(
+        self,
+        operation: Operation,
+        query: Optional[Mapping[str, Any]],
+        body: Any,
+        service_token: Optional[str],
+    ) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {}
+        if query:
+            params: Dict[str, Any] = {}
+            for name, value in query.items():
+                _flatten_query(name, value, params)
+            if params:
+                kwargs["params"] = params
+        if body is None:
+            return kwargs
+        if operation.multipart:
+            kwargs["files"] = body
+            return kwargs
+        adapter = type_adapter(operation.body_type or Any)
+        if operation.body_type is not None and not isinstance(body, BaseModel):
+            # dict от вызывающего проверяется схемой до отправки
+            body = adapter.validate_python(body)
+        kwargs["content"] = adapter.dump_json(body, exclude_unset=True, by_alias=True)
+        kwargs["headers"] = {
+            **self._transport._get_headers(service_token),
+            "Content-Type": "application/json",
+        }
+        return kwargs
+
+    async def _call(
+        self,
+        operation: Operation,
+        path: Optional[Mapping[str, Any]] = None,
+        query: Optional[Mapping[str, Any]] = None,
+        body: Any = None,
+        service_token: Optional[str] = None,
+    ) -> Any:
+        """Выполняет операцию и возвращает ответ, провалидированный типом операции."""
+        response = await self._transport._fetch(
+            operation.method,
+            operation.endpoint(path or {}),
+            service_token=service_token,
+            **self._request_kwargs(operation, query, body, service_token),
+        )
+        if operation.binary:
+            return response.content
+        if not response.content or operation.response_type is None:
+            return None
+        if operation.response_type is str and "json" not in response.headers.get("content-type", ""):
+            return response.text
+        return validate_json(operation.response_type, response.content)
+
+    def _stream(
+        self,
+        operation: Operation,
+        path: Optional[Mapping[str, Any]] = None,
+        query: Optional[Mapping[str, Any]] = None,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """Выполняет бинарную операцию, отдавая тело ответа потоком блоков."""
+        return self._transport._stream(
+            operation.method,
+            operation.endpoint(path or {}),
+            service_token=service_token,
+            max_bytes=max_bytes,
+            **self._request_kwargs(operation, query, None, service_token),
+        )
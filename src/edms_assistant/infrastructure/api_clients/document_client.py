@@ -3,23 +3,59 @@
 EDMS Document Client — асинхронный клиент для взаимодействия с EDMS API.
 
 Все методы, кроме помеченных как бинарные, возвращают JSON-ответы (Dict[str, Any] или List[Dict]).
-Бинарные методы возвращают bytes или AsyncIterator[bytes].
+Бинарные методы возвращают bytes, AsyncIterator[bytes] или пишут поток прямо в файл.
 """
+import asyncio
 import httpx
-from typing import Optional, Dict, Any, List, AsyncIterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Dict, Any, Iterable, List, AsyncIterator, Awaitable, Mapping, Union
 from uuid import UUID
 from src.edms_assistant.config.settings import settings
-from src.edms_assistant.utils.retry_utils import async_retry
-from src.edms_assistant.infrastructure.resources_openapi import DocumentDto
+from src.edms_assistant.infrastructure.api_clients.hedging import edms_hedger
+from src.edms_assistant.infrastructure.api_clients.http_pool import edms_http_pool
+from src.edms_assistant.infrastructure.api_clients.model_adapters import to_payload, validate_json
+from src.edms_assistant.infrastructure.api_clients.response_cache import DOCUMENT_ID_PATTERN, edms_response_cache
+from src.edms_assistant.infrastructure.api_clients.retry_policy import edms_retry_policy
+from src.edms_assistant.infrastructure.api_clients.single_flight import edms_single_flight
+# Пакет моделей ленивый: модуль с DocumentDto импортируется при первом обращении к models.DocumentDto
+from src.edms_assistant.infrastructure import resources_openapi as models
+from src.edms_assistant.infrastructure.storage.answer_cache import answer_cache
 from src.edms_assistant.utils.api_utils import (
     handle_api_error,
     prepare_auth_headers,
 )
+from src.edms_assistant.utils.file_utils import SavedUpload, save_byte_stream
 import logging
 
+if TYPE_CHECKING:
+    from src.edms_assistant.infrastructure.resources_openapi import DocumentDto
+
 logger = logging.getLogger(__name__)
 
 
+class AttachmentTooLargeError(ValueError):
+    """Вложение превышает допустимый для скачивания размер."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Вложение превышает допустимый размер {max_bytes} байт")
+        self.max_bytes = max_bytes
+
+
+@dataclass
+class DocumentResult:
+    """Результат загрузки одного документа в пакетном запросе."""
+
+    document_id: str
+    document: Optional["DocumentDto"] = None
+    error: Optional[str] = None
+    status_code: Optional[int] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.document is not None
+
+
 class DocumentClient:
     """
     Асинхронный клиент для работы с EDMS Document API.
@@ -30,10 +66,14 @@ class DocumentClient:
     - Выполнение операций (согласование, подписание и т.д.)
     - Загрузку файлов (бинарные методы)
 
+    Соединения берутся из общего пула процесса (edms_http_pool), поэтому клиент
+    дёшево создавать, а один экземпляр (document_client) можно использовать для
+    разных пользователей, передавая service_token в каждый вызов.
+
     Безопасность:
     - service_token передаётся только в заголовках
     - Не сохраняется в логах или состоянии
-    - Автоматические retry при временных ошибках
+    - Повторы только при временных ошибках (5xx, сбои соединения) и circuit breaker по хосту
     """
 
     def __init__(
@@ -45,8 +85,13 @@ class DocumentClient:
         resolved_base_url = base_url or str(settings.edms.base_url)
         self.base_url = resolved_base_url.rstrip("/")
         self.timeout = timeout or settings.edms.timeout
+        # Токен по умолчанию; у каждого метода можно передать свой service_token
         self.service_token = service_token
-        self.client = httpx.AsyncClient(timeout=self.timeout)
+        self.pool = edms_http_pool
+        self.single_flight = edms_single_flight
+        self.response_cache = edms_response_cache
+        self.retry_policy = edms_retry_policy
+        self.hedger = edms_hedger
 
     async def __aenter__(self):
         return self
@@ -55,23 +100,98 @@ class DocumentClient:
         await self.close()
 
     async def close(self):
-        """Закрывает HTTP-клиент."""
-        await self.client.aclose()
+        """Общий пул соединений закрывается в lifespan приложения, а не клиентом."""
 
-    def _get_headers(self) -> Dict[str, str]:
+    def _get_headers(self, service_token: Optional[str] = None) -> Dict[str, str]:
         """Возвращает заголовки с авторизацией."""
-        return prepare_auth_headers(self.service_token)
-
-    @async_retry(
-        max_attempts=3,
-        delay=1.0,
-        backoff=2.0,
-        exceptions=(httpx.RequestError, httpx.HTTPStatusError),
-    )
+        return prepare_auth_headers(service_token or self.service_token)
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Запрос через общий пул с повторами временных сбоев и circuit breaker.
+        Каждая попытка GET может быть хеджирована (см. edms_hedger).
+        """
+        if method.upper() == "GET":
+            def attempt() -> Awaitable[httpx.Response]:
+                return self.hedger.run(url, lambda: self.pool.request(method, url, **kwargs))
+        else:
+            def attempt() -> Awaitable[httpx.Response]:
+                return self.pool.request(method, url, **kwargs)
+        return await self.retry_policy.execute(method, url, attempt)
+
+    async def _send(
+        self, method: str, url: str, service_token: Optional[str], **kwargs
+    ) -> httpx.Response:
+        """
+        Отправляет запрос через общий пул.
+
+        GET без тела проходят через кэш ответов (для эндпоинтов с TTL) и объединяются
+        (single-flight) в пределах одного токена: в сеть уходит один запрос, ответ
+        получают все.
+        """
+        if method.upper() != "GET" or "json" in kwargs or "content" in kwargs:
+            return await self._request(method, url, **kwargs)
+        key = self.single_flight.key(
+            service_token or self.service_token, method, url, kwargs.get("params")
+        )
+
+        async def send(extra_headers: Dict[str, str]) -> httpx.Response:
+            request_kwargs = kwargs
+            if extra_headers:
+                request_kwargs = {**kwargs, "headers": {**kwargs.get("headers", {}), **extra_headers}}
+            return await self.single_flight.do(
+                key, lambda: self._request(method, url, **request_kwargs)
+            )
+
+        ttl = self.response_cache.ttl_for(url)
+        if ttl is None:
+            return await send({})
+        return await self.response_cache.fetch(key, url, ttl, send)
+
+    def _invalidate_document(self, document_id: Union[UUID, str]) -> None:
+        """Сбрасывает кэшированные ответы и готовые ответы ассистента о документе."""
+        self.response_cache.invalidate_document(document_id)
+        answer_cache.invalidate_document(document_id)
+
+    async def _fetch(
+        self,
+        method: str,
+        endpoint: str,
+        service_token: Optional[str] = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Выполняет HTTP-запрос и возвращает успешный ответ (тело не разбирается).
+
+        Любой запрос, кроме GET, к api/document/{id}... сбрасывает кэши документа —
+        и для ручных методов, и для сгенерированного клиента. Сброс выполняется и при
+        ошибке: изменение могло примениться на стороне EDMS.
+
+        Raises:
+            httpx.HTTPStatusError: EDMS вернул ошибку.
+            httpx.RequestError: сбой сети или недоступность EDMS.
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        headers = kwargs.pop("headers", {}) or self._get_headers(service_token)
+        kwargs.setdefault("timeout", self.timeout)
+        mutated = DOCUMENT_ID_PATTERN.search(url) if method.upper() != "GET" else None
+
+        try:
+            response = await self._send(method, url, service_token, headers=headers, **kwargs)
+        except httpx.RequestError as e:
+            logger.error(f"Request error for {method} {url}: {e}")
+            raise
+        finally:
+            if mutated:
+                self._invalidate_document(mutated.group(1).lower())
+        await handle_api_error(response, f"{method} {url}")
+        return response
+
     async def _make_request(
         self,
         method: str,
         endpoint: str,
+        service_token: Optional[str] = None,
         **kwargs,
     ) -> Optional[Dict[str, Any]]:
         """
@@ -80,106 +200,258 @@ class DocumentClient:
         Args:
             method: HTTP-метод (GET, POST, PUT и т.д.)
             endpoint: Путь эндпоинта (например, "api/document/123")
+            service_token: Токен вызывающего (по умолчанию — токен клиента)
             **kwargs: Дополнительные параметры для httpx (json, params и т.д.)
 
         Returns:
             Dict[str, Any] — JSON-ответ от сервера, или {} если ответ пустой (например, 204 No Content)
             None — при необрабатываемой ошибке (не рекомендуется, лучше исключение)
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        headers = kwargs.pop("headers", {}) or self._get_headers()
-
+        response = await self._fetch(method, endpoint, service_token=service_token, **kwargs)
         try:
-            response = await self.client.request(method, url, headers=headers, **kwargs)
-            await handle_api_error(response, f"{method} {url}")
             return response.json() if response.content else {}
-        except httpx.HTTPStatusError:
-            raise
-        except httpx.RequestError as e:
-            logger.error(f"Request error for {method} {url}: {e}")
-            raise
         except Exception as e:
-            logger.error(f"Unexpected error for {method} {url}: {e}")
+            logger.error(f"Unexpected error for {method} {endpoint}: {e}")
             return None
 
     # === Документы (все методы возвращают JSON) ===
-    async def get_document(self, document_id: UUID) -> Optional[DocumentDto]:
-        """Получить документ по ID. Возвращает типизированную модель."""
-        data = await self._make_request("GET", f"api/document/{document_id}")
-        if data is None:
+    async def get_document(
+        self, document_id: UUID, service_token: Optional[str] = None
+    ) -> Optional["DocumentDto"]:
+        """Получить документ по ID. Возвращает типизированную модель (валидация прямо из байтов)."""
+        response = await self._fetch(
+            "GET", f"api/document/{document_id}", service_token=service_token
+        )
+        try:
+            return validate_json(models.DocumentDto, response.content)
+        except Exception as e:
+            logger.error(f"Ошибка валидации документа {document_id}: {e}")
             return None
+
+    async def get_document_payload(
+        self,
+        document_id: UUID,
+        service_token: Optional[str] = None,
+        trusted: Optional[bool] = None,
+        include: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Получить документ по ID в виде JSON-совместимого dict (для инструментов).
+
+        Args:
+            trusted: Не валидировать схему DocumentDto, только разобрать JSON
+                (по умолчанию — settings.edms.trusted_documents).
+            include: Проекция — только эти поля документа (см. document_payload).
+        """
+        content = await self.get_document_content(document_id, service_token=service_token)
+        return self.document_payload(document_id, content, trusted=trusted, include=include)
+
+    async def get_document_content(
+        self, document_id: UUID, service_token: Optional[str] = None
+    ) -> bytes:
+        """Тело ответа GET api/document/{id} без разбора (бинарный метод)."""
+        response = await self._fetch(
+            "GET", f"api/document/{document_id}", service_token=service_token
+        )
+        return response.content
+
+    @staticmethod
+    def document_payload(
+        document_id: UUID,
+        content: bytes,
+        trusted: Optional[bool] = None,
+        include: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        dict документа из тела ответа; None, если тело не соответствует DocumentDto.
+
+        include — проекция в формате pydantic: валидируются и попадают в результат
+        только указанные поля (None — документ целиком).
+        """
+        if trusted is None:
+            trusted = settings.edms.trusted_documents
         try:
-            return DocumentDto(**data)
+            return to_payload(content, models.DocumentDto, trusted=trusted, include=include)
         except Exception as e:
             logger.error(f"Ошибка валидации документа {document_id}: {e}")
             return None
 
-    async def create_document(self, profile_id: UUID) -> Optional[Dict[str, Any]]:
+    async def _load_document_result(
+        self, document_id: str, service_token: Optional[str]
+    ) -> DocumentResult:
+        """Загружает документ, превращая любую ошибку в результат с описанием."""
+        try:
+            response = await self._fetch(
+                "GET", f"api/document/{document_id}", service_token=service_token
+            )
+            return DocumentResult(document_id, document=validate_json(models.DocumentDto, response.content))
+        except httpx.HTTPStatusError as e:
+            return DocumentResult(document_id, error="http_error", status_code=e.response.status_code)
+        except httpx.RequestError as e:
+            return DocumentResult(document_id, error=f"request_error: {e}")
+        except Exception as e:
+            logger.error(f"Ошибка валидации документа {document_id}: {e}")
+            return DocumentResult(document_id, error=f"validation_error: {e}")
+
+    async def iter_documents(
+        self,
+        document_ids: Iterable[Union[UUID, str]],
+        service_token: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[DocumentResult]:
+        """
+        Загружает несколько документов параллельно и отдаёт результаты по мере готовности.
+
+        Повторяющиеся ID загружаются один раз, ошибка одного документа не прерывает
+        остальные (она возвращается в DocumentResult.error). Если вызывающий прекращает
+        перебор, незавершённые загрузки отменяются.
+
+        Args:
+            document_ids: ID документов (UUID или строки).
+            service_token: Токен вызывающего.
+            max_concurrency: Сколько документов загружать одновременно
+                (по умолчанию — settings.edms.bulk_concurrency).
+        """
+        unique_ids: List[str] = []
+        seen = set()
+        for raw_id in document_ids:
+            try:
+                document_id = str(UUID(str(raw_id)))
+            except ValueError:
+                yield DocumentResult(str(raw_id), error="invalid_document_id")
+                continue
+            if document_id not in seen:
+                seen.add(document_id)
+                unique_ids.append(document_id)
+        if not unique_ids:
+            return
+
+        semaphore = asyncio.Semaphore(max_concurrency or settings.edms.bulk_concurrency)
+
+        async def load(document_id: str) -> DocumentResult:
+            async with semaphore:
+                return await self._load_document_result(document_id, service_token)
+
+        tasks = [asyncio.create_task(load(document_id)) for document_id in unique_ids]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def get_documents(
+        self,
+        document_ids: Iterable[Union[UUID, str]],
+        service_token: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> Dict[str, DocumentResult]:
+        """
+        Загружает несколько документов параллельно (см. iter_documents).
+
+        Returns:
+            Результаты по ID документа в порядке первого появления ID во входном списке.
+        """
+        document_ids = list(document_ids)
+        results = {
+            result.document_id: result
+            async for result in self.iter_documents(document_ids, service_token, max_concurrency)
+        }
+        ordered: Dict[str, DocumentResult] = {}
+        for raw_id in document_ids:
+            try:
+                key = str(UUID(str(raw_id)))
+            except ValueError:
+                key = str(raw_id)
+            if key in results and key not in ordered:
+                ordered[key] = results[key]
+        return ordered
+
+    async def create_document(
+        self, profile_id: UUID, service_token: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """Создать новый документ. Возвращает JSON."""
         data = {"id": str(profile_id)}
-        return await self._make_request("POST", "api/document", json=data)
+        return await self._make_request(
+            "POST", "api/document", json=data, service_token=service_token
+        )
 
     async def search_documents(
-        self, filters: Optional[Dict[str, Any]] = None
+        self, filters: Optional[Dict[str, Any]] = None, service_token: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """Поиск документов с фильтрацией. Возвращает JSON."""
         params = filters or {}
-        return await self._make_request("GET", "api/document", params=params)
+        return await self._make_request(
+            "GET", "api/document", params=params, service_token=service_token
+        )
 
     # === Версии (все методы возвращают JSON) ===
     async def create_document_version(
-        self, document_id: UUID, body: Dict[str, Any]
+        self, document_id: UUID, body: Dict[str, Any], service_token: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """Создать новую версию документа. Возвращает JSON."""
         return await self._make_request(
-            "POST", f"api/document/{document_id}/version", json=body
+            "POST", f"api/document/{document_id}/version", json=body, service_token=service_token
         )
 
     async def get_all_versions(
-        self, document_id: UUID
+        self, document_id: UUID, service_token: Optional[str] = None
     ) -> Optional[List[Dict[str, Any]]]:
         """Получить все версии документа. Возвращает JSON (список)."""
-        return await self._make_request("GET", f"api/document/{document_id}/version")
+        return await self._make_request(
+            "GET", f"api/document/{document_id}/version", service_token=service_token
+        )
 
     # === История (возвращает JSON) ===
-    async def get_document_history(self, document_id: UUID) -> Optional[Dict[str, Any]]:
+    async def get_document_history(
+        self, document_id: UUID, service_token: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """Получить историю документа. Возвращает JSON."""
-        return await self._make_request("GET", f"api/document/{document_id}/history/v2")
+        return await self._make_request(
+            "GET", f"api/document/{document_id}/history/v2", service_token=service_token
+        )
 
     # === Адресаты (возвращают JSON) ===
     async def get_document_recipients(
-        self, document_id: UUID
+        self, document_id: UUID, service_token: Optional[str] = None
     ) -> Optional[List[Dict[str, Any]]]:
         """Получить список адресатов документа. Возвращает JSON (список)."""
-        return await self._make_request("GET", f"api/document/{document_id}/recipient")
+        return await self._make_request(
+            "GET", f"api/document/{document_id}/recipient", service_token=service_token
+        )
 
     async def get_correspondents(
-        self, filters: Optional[Dict[str, Any]] = None
+        self, filters: Optional[Dict[str, Any]] = None, service_token: Optional[str] = None
     ) -> Optional[List[Dict[str, Any]]]:
         """Получить список контрагентов. Возвращает JSON (список)."""
         params = filters or {}
-        return await self._make_request("GET", "api/document/recipient", params=params)
+        return await self._make_request(
+            "GET", "api/document/recipient", params=params, service_token=service_token
+        )
 
     # === Статусы (возвращают JSON) ===
     async def get_document_statuses(
-        self, filters: Optional[Dict[str, Any]] = None
+        self, filters: Optional[Dict[str, Any]] = None, service_token: Optional[str] = None
     ) -> Optional[List[Dict[str, Any]]]:
         """Получить статусы документов. Возвращает JSON (список)."""
         params = filters or {}
-        return await self._make_request("GET", "api/document/status", params=params)
+        return await self._make_request(
+            "GET", "api/document/status", params=params, service_token=service_token
+        )
 
     async def get_status_groups(
-        self, filters: Optional[Dict[str, Any]] = None
+        self, filters: Optional[Dict[str, Any]] = None, service_token: Optional[str] = None
     ) -> Optional[List[Dict[str, Any]]]:
         """Получить группировку по статусам. Возвращает JSON (список)."""
         params = filters or {}
         return await self._make_request(
-            "GET", "api/document/status-group", params=params
+            "GET", "api/document/status-group", params=params, service_token=service_token
         )
 
     # === Операции (возвращает JSON-совместимый результат) ===
     async def execute_document_operations(
-        self, document_id: UUID, operations: List[Dict[str, Any]]
+        self, document_id: UUID, operations: List[Dict[str, Any]], service_token: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Выполнить операции над документом (согласование, подписание и т.д.).
@@ -188,7 +460,7 @@ class DocumentClient:
         """
         try:
             result = await self._make_request(
-                "POST", f"api/document/{document_id}/execute", json=operations
+                "POST", f"api/document/{document_id}/execute", json=operations, service_token=service_token
             )
             # Если в будущем EDMS начнёт возвращать тело — используем его
             if result is not None:
@@ -201,62 +473,157 @@ class DocumentClient:
 
     # === Автор (возвращает JSON) ===
     async def change_document_author(
-        self, document_id: UUID, new_author_id: UUID
+        self, document_id: UUID, new_author_id: UUID, service_token: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """Изменить автора документа. Возвращает JSON."""
         data = {"id": str(new_author_id)}
         return await self._make_request(
-            "PUT", f"api/document/{document_id}/change-document-author", json=data
+            "PUT", f"api/document/{document_id}/change-document-author", json=data, service_token=service_token
         )
 
     # === Свойства (возвращает JSON) ===
     async def get_document_properties(
-        self, document_id: UUID
+        self, document_id: UUID, service_token: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """Получить свойства документа. Возвращает JSON."""
-        return await self._make_request("GET", f"api/document/{document_id}/properties")
+        return await self._make_request(
+            "GET", f"api/document/{document_id}/properties", service_token=service_token
+        )
 
     # === Ответственные (договоры) (возвращают JSON) ===
     async def get_contract_responsibles(
-        self, document_id: UUID
+        self, document_id: UUID, service_token: Optional[str] = None
     ) -> Optional[List[Dict[str, Any]]]:
         """Получить ответственных по договору. Возвращает JSON (список)."""
         return await self._make_request(
-            "GET", f"api/document/{document_id}/responsible"
+            "GET", f"api/document/{document_id}/responsible", service_token=service_token
         )
 
     async def get_contract_version_info(
-        self, document_id: UUID
+        self, document_id: UUID, service_token: Optional[str] = None
     ) -> Optional[List[Dict[str, Any]]]:
         """Получить информацию о версиях договора. Возвращает JSON (список)."""
         return await self._make_request(
-            "GET", f"api/document/{document_id}/contract-version-info"
+            "GET", f"api/document/{document_id}/contract-version-info", service_token=service_token
         )
 
         # === Поиск сотрудников (возвращают JSON) ===
-    async def search_employees(self, filter_data: dict) -> Optional[Dict[str, Any]]:
+    async def search_employees(
+        self, filter_data: dict, service_token: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """Выполняет поиск сотрудников через POST /api/employee/search."""
-        return await self._make_request("POST", "api/employee/search", json=filter_data)
+        return await self._make_request(
+            "POST", "api/employee/search", json=filter_data, service_token=service_token
+        )
 
-    async def get_employee_by_id(self, employee_id: UUID) -> Optional[Dict[str, Any]]:
+    async def get_employee_by_id(
+        self, employee_id: UUID, service_token: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """Получить сотрудника по ID. Возвращает JSON."""
-        return await self._make_request("GET", f"api/employee/{employee_id}")
+        return await self._make_request(
+            "GET", f"api/employee/{employee_id}", service_token=service_token
+        )
 
     # === ФАЙЛОВЫЕ МЕТОДЫ (возвращают БАЙТЫ, НЕ JSON) ===
+    async def _stream(
+        self,
+        method: str,
+        endpoint: str,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        chunk_size: int = 64 * 1024,
+        **kwargs,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выполняет запрос и отдаёт тело ответа потоком блоков, не держа его в памяти целиком.
+
+        Raises:
+            AttachmentTooLargeError: тело больше max_bytes (по Content-Length или по факту).
+            httpx.HTTPStatusError / httpx.RequestError: ошибка EDMS или сети.
+        """
+        max_bytes = max_bytes or settings.edms.max_attachment_mb * 1024 * 1024
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        kwargs.setdefault("timeout", self.timeout)
+        logger.debug(f"{method} (stream) {url}")
+
+        async with self.pool.stream(
+            method, url, headers=self._get_headers(service_token), **kwargs
+        ) as response:
+            if response.is_error:
+                await response.aread()
+                await handle_api_error(response, f"{method} (stream) {url}")
+
+            declared_size = response.headers.get("content-length")
+            if declared_size and declared_size.isdigit() and int(declared_size) > max_bytes:
+                raise AttachmentTooLargeError(max_bytes)
+
+            received = 0
+            async for chunk in response.aiter_bytes(chunk_size):
+                received += len(chunk)
+                if received > max_bytes:
+                    raise AttachmentTooLargeError(max_bytes)
+                yield chunk
+
+    def iter_attachment(
+        self,
+        document_id: UUID,
+        attachment_id: UUID,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> AsyncIterator[bytes]:
+        """
+        Скачивает вложение документа потоком блоков, не держа файл в памяти целиком.
+
+        Raises:
+            AttachmentTooLargeError: вложение больше max_bytes (по Content-Length или по факту).
+            httpx.HTTPStatusError / httpx.RequestError: ошибка EDMS или сети.
+        """
+        return self._stream(
+            "GET",
+            f"api/document/{document_id}/attachment/{attachment_id}",
+            service_token=service_token,
+            max_bytes=max_bytes,
+            chunk_size=chunk_size,
+        )
+
+    async def download_attachment_to_file(
+        self,
+        document_id: UUID,
+        attachment_id: UUID,
+        destination: Path,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> SavedUpload:
+        """
+        Скачивает вложение сразу в файл (размер и SHA-256 считаются по пути).
+        При ошибке частично записанный файл удаляется, исключение пробрасывается.
+        """
+        return await save_byte_stream(
+            self.iter_attachment(
+                document_id, attachment_id, service_token=service_token, max_bytes=max_bytes
+            ),
+            destination,
+        )
+
     async def download_attachment(
-        self, document_id: UUID, attachment_id: UUID
+        self, document_id: UUID, attachment_id: UUID, service_token: Optional[str] = None
     ) -> Optional[bytes]:
         """
         Скачивает вложение документа как байты.
+
+        Весь файл оказывается в памяти — для больших вложений используйте
+        iter_attachment() или download_attachment_to_file().
         """
-        endpoint = f"api/document/{document_id}/attachment/{attachment_id}"
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        headers = self._get_headers()
-        logger.debug(f"GET (binary) {url}")
         try:
-            response = await self.client.get(url, headers=headers)
-            await handle_api_error(response, f"GET (binary) {url}")
-            return response.content
+            return b"".join([
+                chunk async for chunk in self.iter_attachment(
+                    document_id, attachment_id, service_token=service_token
+                )
+            ])
         except Exception as e:
             logger.error(f"Ошибка загрузки вложения {attachment_id}: {e}")
             return None
+
+# Глобальный экземпляр: токен передаётся в каждый вызов
+document_client = DocumentClient()
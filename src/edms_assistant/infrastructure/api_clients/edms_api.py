@@ -0,0 +1,25041 @@
+# src/edms_assistant/infrastructure/api_clients/edms_api.py
+# generated by download_openapi.py from openapi_spec.json — не редактировать вручную
+"""
+Типизированный асинхронный клиент EDMS, сгенерированный из OpenAPI.
+
+Операции сгруппированы по тегам: edms_api.<тег>.<operationId в snake_case>(...).
+Запросы идут через общий транспорт DocumentClient, ответы валидируются из байтов.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Optional
+from uuid import UUID
+
+import src.edms_assistant.infrastructure.resources_openapi as m
+from src.edms_assistant.infrastructure.api_clients.api_operations import ApiGroup, Operation
+from src.edms_assistant.infrastructure.api_clients.document_client import DocumentClient, document_client
+
+
+class AdConfigControllerApi(ApiGroup):
+    """
+    ad-config-controller
+    Константы для получения истории: AD_CONFIG
+    """
+
+    _op_create = Operation('POST', 'api/ad-config', response=lambda: m.AdConfigDto, body=lambda: m.AdConfigDto)
+
+    async def create(
+        self,
+        *,
+        body: m.AdConfigDto,
+        service_token: Optional[str] = None,
+    ) -> m.AdConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_AD_CONFIG
+
+        POST /api/ad-config
+        """
+        return await self._call(
+            self._op_create,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/ad-config', response=str)
+
+    async def delete(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_AD_CONFIG
+
+        DELETE /api/ad-config
+        """
+        return await self._call(
+            self._op_delete,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/ad-config', response=lambda: m.AdConfigDto)
+
+    async def get(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AdConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_AD_CONFIG
+
+        GET /api/ad-config
+        """
+        return await self._call(
+            self._op_get,
+            service_token=service_token,
+        )
+
+    _op_sync = Operation('POST', 'api/ad-config/sync', response=str)
+
+    async def sync(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: SYNC_AD_CONFIG
+
+        POST /api/ad-config/sync
+        """
+        return await self._call(
+            self._op_sync,
+            service_token=service_token,
+        )
+
+    _op_test_6 = Operation('POST', 'api/ad-config/test', response=lambda: list[m.LdapUser], body=lambda: m.AdConfigDto)
+
+    async def test_6(
+        self,
+        *,
+        body: m.AdConfigDto,
+        service_token: Optional[str] = None,
+    ) -> list[m.LdapUser]:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_AD_CONFIG
+
+        POST /api/ad-config/test
+        """
+        return await self._call(
+            self._op_test_6,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_test_7 = Operation('POST', 'api/ad-config/test-with-auth', response=lambda: list[m.LdapUser], body=lambda: m.TestWithAuth)
+
+    async def test_7(
+        self,
+        *,
+        body: m.TestWithAuth,
+        service_token: Optional[str] = None,
+    ) -> list[m.LdapUser]:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_AD_CONFIG
+
+        POST /api/ad-config/test-with-auth
+        """
+        return await self._call(
+            self._op_test_7,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_test_8 = Operation('POST', 'api/ad-config/test-auth', response=str, body=lambda: m.TestAdAuth)
+
+    async def test_8(
+        self,
+        *,
+        body: m.TestAdAuth,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_AD_CONFIG
+
+        POST /api/ad-config/test-auth
+        """
+        return await self._call(
+            self._op_test_8,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update = Operation('PUT', 'api/ad-config', response=lambda: m.AdConfigDto, body=lambda: m.AdConfigDto)
+
+    async def update(
+        self,
+        *,
+        body: m.AdConfigDto,
+        service_token: Optional[str] = None,
+    ) -> m.AdConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_AD_CONFIG
+
+        PUT /api/ad-config
+        """
+        return await self._call(
+            self._op_update,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class AdresatyKorrespondentyApi(ApiGroup):
+    """
+    Адресаты/корреспонденты
+    API для работы с адресатами и корреспондентами
+    Константы для получения истории: CORRESPONDENT
+    """
+
+    _op_delete = Operation('DELETE', 'api/correspondent/{id}')
+
+    async def delete(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить адресата/корреспондента
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_CORRESPONDENT
+
+        DELETE /api/correspondent/{id}
+        """
+        return await self._call(
+            self._op_delete,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_list = Operation('DELETE', 'api/correspondent', body=lambda: m.IdsUUID)
+
+    async def delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список адресатов/корреспондентов
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_CORRESPONDENT
+
+        DELETE /api/correspondent
+        """
+        return await self._call(
+            self._op_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_download_template_correspondent = Operation('GET', 'api/correspondent/template', binary=True)
+
+    def download_template_correspondent(
+        self,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Скачать шаблон для импорта адресатов/корреспондентов
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_CORRESPONDENT
+
+        GET /api/correspondent/template
+        """
+        return self._stream(
+            self._op_download_template_correspondent,
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_export_correspondent = Operation('GET', 'api/correspondent/export', binary=True)
+
+    def export_correspondent(
+        self,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Экспорт адресатов/корреспондентов
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CORRESPONDENT
+
+        GET /api/correspondent/export
+        """
+        return self._stream(
+            self._op_export_correspondent,
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_get = Operation('GET', 'api/correspondent/{id}', response=lambda: m.CorrespondentDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.CorrespondentDto:
+        """
+        Получить адресата/корреспондента по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CORRESPONDENT
+
+        GET /api/correspondent/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/correspondent', response=lambda: m.CorrespondentDto)
+
+    async def get_collection(
+        self,
+        *,
+        filter: m.CorrespondentFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.CorrespondentDto:
+        """
+        Получить список адресатов/корреспондентов
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CORRESPONDENT
+
+        GET /api/correspondent
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_import_correspondent = Operation('POST', 'api/correspondent/import')
+
+    async def import_correspondent(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Импорт адресатов/корреспондентов
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_CORRESPONDENT
+
+        POST /api/correspondent/import
+        """
+        return await self._call(
+            self._op_import_correspondent,
+            service_token=service_token,
+        )
+
+    _op_post_v2 = Operation('POST', 'api/correspondent/v2', response=lambda: m.CorrespondentDto, body=lambda: m.CorrespondentAddRequest)
+
+    async def post_v2(
+        self,
+        *,
+        body: m.CorrespondentAddRequest,
+        service_token: Optional[str] = None,
+    ) -> m.CorrespondentDto:
+        """
+        Создать новый адресат/корреспондент
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_CORRESPONDENT
+
+        POST /api/correspondent/v2
+        """
+        return await self._call(
+            self._op_post_v2,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put_v2 = Operation('PUT', 'api/correspondent/v2', response=lambda: m.CorrespondentDto, body=lambda: m.CorrespondentUpdateRequest)
+
+    async def put_v2(
+        self,
+        *,
+        body: m.CorrespondentUpdateRequest,
+        service_token: Optional[str] = None,
+    ) -> m.CorrespondentDto:
+        """
+        Изменить адресата/корреспондента
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_CORRESPONDENT
+
+        PUT /api/correspondent/v2
+        """
+        return await self._call(
+            self._op_put_v2,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_search_fts_top_by_name = Operation('GET', 'api/correspondent/fts-name', response=lambda: m.CorrespondentDto)
+
+    async def search_fts_top_by_name(
+        self,
+        *,
+        fts: str,
+        service_token: Optional[str] = None,
+    ) -> m.CorrespondentDto:
+        """
+        Полнотекстовый поиск корреспондента по названию
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CORRESPONDENT
+
+        GET /api/correspondent/fts-name
+        """
+        return await self._call(
+            self._op_search_fts_top_by_name,
+            query={'fts': fts},
+            service_token=service_token,
+        )
+
+
+class AismvCertInfoControllerApi(ApiGroup):
+    """
+    aismv-cert-info-controller
+    """
+
+    _op_delete_all = Operation('DELETE', 'api/aismv-cert-info', response=str)
+
+    async def delete_all(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_AISMV_CERT_CONFIG
+
+        DELETE /api/aismv-cert-info
+        """
+        return await self._call(
+            self._op_delete_all,
+            service_token=service_token,
+        )
+
+    _op_delete_ca = Operation('DELETE', 'api/aismv-cert-info/ca/{id}', response=str, body=lambda: m.IdString)
+
+    async def delete_ca(
+        self,
+        *,
+        body: m.IdString,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_AISMV_CERT_CONFIG
+
+        DELETE /api/aismv-cert-info/ca/{id}
+        """
+        return await self._call(
+            self._op_delete_ca,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_crl = Operation('DELETE', 'api/aismv-cert-info/crl/{id}', response=str, body=lambda: m.IdString)
+
+    async def delete_crl(
+        self,
+        *,
+        body: m.IdString,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_AISMV_CERT_CONFIG
+
+        DELETE /api/aismv-cert-info/crl/{id}
+        """
+        return await self._call(
+            self._op_delete_crl,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_root = Operation('DELETE', 'api/aismv-cert-info/root/{id}', response=str, body=lambda: m.IdString)
+
+    async def delete_root(
+        self,
+        *,
+        body: m.IdString,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_AISMV_CERT_CONFIG
+
+        DELETE /api/aismv-cert-info/root/{id}
+        """
+        return await self._call(
+            self._op_delete_root,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_disable = Operation('POST', 'api/aismv-cert-info/disable', response=str)
+
+    async def disable(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_AISMV_CERT_CONFIG
+
+        POST /api/aismv-cert-info/disable
+        """
+        return await self._call(
+            self._op_disable,
+            service_token=service_token,
+        )
+
+    _op_enable = Operation('POST', 'api/aismv-cert-info/enable', response=str)
+
+    async def enable(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_AISMV_CERT_CONFIG
+
+        POST /api/aismv-cert-info/enable
+        """
+        return await self._call(
+            self._op_enable,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/aismv-cert-info', response=lambda: m.AismvCertInfoDto)
+
+    async def get(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AismvCertInfoDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_AISMV_CERT_CONFIG
+
+        GET /api/aismv-cert-info
+        """
+        return await self._call(
+            self._op_get,
+            service_token=service_token,
+        )
+
+    _op_import_ca = Operation('POST', 'api/aismv-cert-info/import-ca', response=str)
+
+    async def import_ca(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_AISMV_CERT_CONFIG
+
+        POST /api/aismv-cert-info/import-ca
+        """
+        return await self._call(
+            self._op_import_ca,
+            service_token=service_token,
+        )
+
+    _op_import_crl = Operation('POST', 'api/aismv-cert-info/import-crl', response=str)
+
+    async def import_crl(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_AISMV_CERT_CONFIG
+
+        POST /api/aismv-cert-info/import-crl
+        """
+        return await self._call(
+            self._op_import_crl,
+            service_token=service_token,
+        )
+
+    _op_import_p7b = Operation('POST', 'api/aismv-cert-info/import-p7b', response=str)
+
+    async def import_p7b(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_AISMV_CERT_CONFIG
+
+        POST /api/aismv-cert-info/import-p7b
+        """
+        return await self._call(
+            self._op_import_p7b,
+            service_token=service_token,
+        )
+
+    _op_import_root = Operation('POST', 'api/aismv-cert-info/import-root', response=str)
+
+    async def import_root(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_AISMV_CERT_CONFIG
+
+        POST /api/aismv-cert-info/import-root
+        """
+        return await self._call(
+            self._op_import_root,
+            service_token=service_token,
+        )
+
+
+class AismvOrgPackageControllerApi(ApiGroup):
+    """
+    aismv-org-package-controller
+    """
+
+    _op_delete = Operation('DELETE', 'api/aismv-org-package/{id}', response=str, body=lambda: m.IdUUID)
+
+    async def delete(
+        self,
+        id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_AISMV_ORG_PACKAGE
+
+        DELETE /api/aismv-org-package/{id}
+        """
+        return await self._call(
+            self._op_delete,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_download_attachment = Operation('GET', 'api/aismv-org-package/{id}/attachment/{attachmentId}', binary=True)
+
+    def download_attachment(
+        self,
+        id: UUID,
+        attachment_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_AISMV_ORG_PACKAGE
+
+        GET /api/aismv-org-package/{id}/attachment/{attachmentId}
+        """
+        return self._stream(
+            self._op_download_attachment,
+            path={'id': id, 'attachmentId': attachment_id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_get_84 = Operation('GET', 'api/aismv-org-package', response=lambda: m.SliceDtoAismvOrgPackageDto)
+
+    async def get_84(
+        self,
+        *,
+        p: m.Pageable,
+        f: m.AismvOrgPackageFilter,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoAismvOrgPackageDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_AISMV_ORG_PACKAGE
+
+        GET /api/aismv-org-package
+        """
+        return await self._call(
+            self._op_get_84,
+            query={'p': p, 'f': f},
+            service_token=service_token,
+        )
+
+    _op_get_85 = Operation('GET', 'api/aismv-org-package/{id}', response=lambda: m.AismvOrgPackageDto)
+
+    async def get_85(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AismvOrgPackageDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_AISMV_ORG_PACKAGE
+
+        GET /api/aismv-org-package/{id}
+        """
+        return await self._call(
+            self._op_get_85,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_retry = Operation('POST', 'api/aismv-org-package/{id}/retry', response=str)
+
+    async def retry(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_AISMV_ORG_PACKAGE
+
+        POST /api/aismv-org-package/{id}/retry
+        """
+        return await self._call(
+            self._op_retry,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+
+class AismvRecycleSettingsControllerApi(ApiGroup):
+    """
+    aismv-recycle-settings-controller
+    Константы для получения истории: AISMV_ORG_PACKAGE_RECYCLE_SETTINGS
+    """
+
+    _op_create = Operation('POST', 'api/aismv-recycle-settings', response=lambda: m.AismvOrgPackageRecycleSettingsDto, body=lambda: m.AismvOrgPackageRecycleSettingsDto)
+
+    async def create(
+        self,
+        *,
+        body: m.AismvOrgPackageRecycleSettingsDto,
+        service_token: Optional[str] = None,
+    ) -> m.AismvOrgPackageRecycleSettingsDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_AISMV_RECYCLE_SETTING
+
+        POST /api/aismv-recycle-settings
+        """
+        return await self._call(
+            self._op_create,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/aismv-recycle-settings', response=lambda: m.AismvOrgPackageRecycleSettingsDto)
+
+    async def get(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AismvOrgPackageRecycleSettingsDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_AISMV_RECYCLE_SETTING
+
+        GET /api/aismv-recycle-settings
+        """
+        return await self._call(
+            self._op_get,
+            service_token=service_token,
+        )
+
+    _op_update = Operation('PUT', 'api/aismv-recycle-settings', response=lambda: m.AismvOrgPackageRecycleSettingsDto, body=lambda: m.AismvOrgPackageRecycleSettingsDto)
+
+    async def update(
+        self,
+        *,
+        body: m.AismvOrgPackageRecycleSettingsDto,
+        service_token: Optional[str] = None,
+    ) -> m.AismvOrgPackageRecycleSettingsDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_AISMV_RECYCLE_SETTING
+
+        PUT /api/aismv-recycle-settings
+        """
+        return await self._call(
+            self._op_update,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class AktObUnichtozheniiDelApi(ApiGroup):
+    """
+    Акт об уничтожении дел
+    API для работы с актами об уничтожении дел
+    """
+
+    _op_agreement = Operation('PUT', 'api/destruction-act/{id}/process/{itemId}/agreement', response=dict[str, Any], body=lambda: m.DestructionActProcessAction)
+
+    async def agreement(
+        self,
+        id: UUID,
+        item_id: UUID,
+        *,
+        body: m.DestructionActProcessAction,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Выполнить действие подписания акта уничтожения дел
+
+        Для доступа к этому API необходимо: DESTRUCTION_ACT_AGREEMENT
+
+        PUT /api/destruction-act/{id}/process/{itemId}/agreement
+        """
+        return await self._call(
+            self._op_agreement,
+            path={'id': id, 'itemId': item_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_cancel = Operation('PUT', 'api/destruction-act/{id}/cancel', response=dict[str, Any], body=lambda: m.DestructionActCancelRequest)
+
+    async def cancel(
+        self,
+        id: UUID,
+        *,
+        body: m.DestructionActCancelRequest,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Анулировать уничтожения дел
+
+        Для доступа к этому API необходимо: DESTRUCTION_ACT_CANCEL
+
+        PUT /api/destruction-act/{id}/cancel
+        """
+        return await self._call(
+            self._op_cancel,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_cancel_affairs = Operation('PUT', 'api/destruction-act/cancel-affairs', response=dict[str, Any], body=lambda: m.IdsUUID)
+
+    async def cancel_affairs(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Анулировать уничтожения дел
+
+        PUT /api/destruction-act/cancel-affairs
+        """
+        return await self._call(
+            self._op_cancel_affairs,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_cancel_cancel_affairs = Operation('PUT', 'api/destruction-act/restore-affairs', response=dict[str, Any], body=lambda: m.IdsUUID)
+
+    async def cancel_cancel_affairs(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Отменить отмена уничтожения дел
+
+        PUT /api/destruction-act/restore-affairs
+        """
+        return await self._call(
+            self._op_cancel_cancel_affairs,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create = Operation('POST', 'api/destruction-act', response=lambda: m.DestructionActDto, body=lambda: m.DestructionActCreateRequest)
+
+    async def create(
+        self,
+        *,
+        body: m.DestructionActCreateRequest,
+        service_token: Optional[str] = None,
+    ) -> m.DestructionActDto:
+        """
+        Создать акт об уничтожении дел
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_DESTRUCTION_ACT
+
+        POST /api/destruction-act
+        """
+        return await self._call(
+            self._op_create,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/destruction-act', response=str, body=lambda: m.IdsUUID)
+
+    async def delete(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+
+        DELETE /api/destruction-act
+        """
+        return await self._call(
+            self._op_delete,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_attachment = Operation('DELETE', 'api/destruction-act/{id}/attachment', response=dict[str, Any])
+
+    async def delete_attachment(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Удалить вложение акта уничтожения дел
+
+        Для доступа к этому API необходимо: DESTRUCTION_ACT_PRINT
+
+        DELETE /api/destruction-act/{id}/attachment
+        """
+        return await self._call(
+            self._op_delete_attachment,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_destroy = Operation('POST', 'api/destruction-act/{id}/destroy', response=dict[str, Any], body=lambda: m.DestroyAckRequestBody)
+
+    async def destroy(
+        self,
+        id: UUID,
+        *,
+        body: m.DestroyAckRequestBody,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Запустить процесс согласования акта уничтожения дел
+
+        Для доступа к этому API необходимо: DESTRUCTION_ACT_DESTROY
+
+        POST /api/destruction-act/{id}/destroy
+        """
+        return await self._call(
+            self._op_destroy,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_destroy_edit = Operation('PUT', 'api/destruction-act/{id}/destroy', response=dict[str, Any], body=lambda: m.DestroyAckRequestBody)
+
+    async def destroy_edit(
+        self,
+        id: UUID,
+        *,
+        body: m.DestroyAckRequestBody,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Запустить процесс согласования акта уничтожения дел
+
+        Для доступа к этому API необходимо: DESTRUCTION_ACT_DESTROY_CHANGE_DATE
+
+        PUT /api/destruction-act/{id}/destroy
+        """
+        return await self._call(
+            self._op_destroy_edit,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_download_attachment = Operation('GET', 'api/destruction-act/{id}/attachment', binary=True)
+
+    def download_attachment(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Скачать вложение акта уничтожения дел
+
+        Для доступа к этому API необходимо: DESTRUCTION_ACT_READ
+
+        GET /api/destruction-act/{id}/attachment
+        """
+        return self._stream(
+            self._op_download_attachment,
+            path={'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_execute = Operation('POST', 'api/destruction-act/{id}/execute', body=lambda: list[m.DestructionActOperation])
+
+    async def execute(
+        self,
+        id: UUID,
+        *,
+        body: list[m.DestructionActOperation],
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Выполнить операции над актом уничтожения дел
+
+        Выполнить операции над актом уничтожения дел
+
+        POST /api/destruction-act/{id}/execute
+        """
+        return await self._call(
+            self._op_execute,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/destruction-act', response=lambda: m.SliceDtoDestructionActDto)
+
+    async def get_all(
+        self,
+        *,
+        f: m.DestructionActFilter,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoDestructionActDto:
+        """
+        Получить список актов об уничтожении дел
+
+        GET /api/destruction-act
+        """
+        return await self._call(
+            self._op_get_all,
+            query={'f': f, 'p': p},
+            service_token=service_token,
+        )
+
+    _op_get_all_links = Operation('GET', 'api/destruction-act/links', response=lambda: m.SliceDtoDestructionActNomenclatureAffairLinkDto)
+
+    async def get_all_links(
+        self,
+        *,
+        filter: m.DestructionActNomenclatureAffairFilter,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoDestructionActNomenclatureAffairLinkDto:
+        """
+        Получить список элементов процесса акта уничтожения дел
+
+        GET /api/destruction-act/links
+        """
+        return await self._call(
+            self._op_get_all_links,
+            query={'filter': filter, 'p': p},
+            service_token=service_token,
+        )
+
+    _op_get_by_id = Operation('GET', 'api/destruction-act/{id}', response=lambda: m.DestructionActDto)
+
+    async def get_by_id(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DestructionActDto:
+        """
+        Получить акт об уничтожении дел по id
+
+        Для доступа к этому API необходимо: DESTRUCTION_ACT_READ
+
+        GET /api/destruction-act/{id}
+        """
+        return await self._call(
+            self._op_get_by_id,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_history = Operation('GET', 'api/destruction-act/{id}/history', response=lambda: m.SliceDtoDestructionActHistoryDto)
+
+    async def get_history(
+        self,
+        id: UUID,
+        *,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoDestructionActHistoryDto:
+        """
+        Получить историю
+
+        Для доступа к этому API необходимо: DESTRUCTION_ACT_READ
+
+        GET /api/destruction-act/{id}/history
+        """
+        return await self._call(
+            self._op_get_history,
+            path={'id': id},
+            query={'p': p},
+            service_token=service_token,
+        )
+
+    _op_get_links = Operation('GET', 'api/destruction-act/{id}/links', response=lambda: m.SliceDtoDestructionActNomenclatureAffairLinkDto)
+
+    async def get_links(
+        self,
+        id: UUID,
+        *,
+        p: m.Pageable,
+        name: str | None = None,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoDestructionActNomenclatureAffairLinkDto:
+        """
+        Получить список элементов процесса акта уничтожения дел
+
+        Для доступа к этому API необходимо: DESTRUCTION_ACT_READ
+
+        GET /api/destruction-act/{id}/links
+        """
+        return await self._call(
+            self._op_get_links,
+            path={'id': id},
+            query={'name': name, 'p': p},
+            service_token=service_token,
+        )
+
+    _op_get_permission = Operation('GET', 'api/destruction-act/{id}/permission', response=lambda: list[m.DestructionActPermission])
+
+    async def get_permission(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.DestructionActPermission]:
+        """
+        Получить пермишены акта уничтожения дел по id
+
+        GET /api/destruction-act/{id}/permission
+        """
+        return await self._call(
+            self._op_get_permission,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_process_executors = Operation('GET', 'api/destruction-act/{id}/process/items/{itemId}/executors', response=lambda: list[m.DestructionActProcessExecutorDto])
+
+    async def get_process_executors(
+        self,
+        id: UUID,
+        item_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.DestructionActProcessExecutorDto]:
+        """
+        Получить список исполнителей элемента процесса акта уничтожения дел
+
+        Для доступа к этому API необходимо: DESTRUCTION_ACT_READ
+
+        GET /api/destruction-act/{id}/process/items/{itemId}/executors
+        """
+        return await self._call(
+            self._op_get_process_executors,
+            path={'id': id, 'itemId': item_id},
+            service_token=service_token,
+        )
+
+    _op_get_process_items = Operation('GET', 'api/destruction-act/{id}/process/items', response=lambda: list[m.DestructionActProcessItemDto])
+
+    async def get_process_items(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.DestructionActProcessItemDto]:
+        """
+        Получить список элементов процесса акта уничтожения дел
+
+        Для доступа к этому API необходимо: DESTRUCTION_ACT_READ
+
+        GET /api/destruction-act/{id}/process/items
+        """
+        return await self._call(
+            self._op_get_process_items,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_with_permission = Operation('GET', 'api/destruction-act/{id}/all', response=lambda: m.DestructionActWithPermission)
+
+    async def get_with_permission(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DestructionActWithPermission:
+        """
+        Получить акт об уничтожении дел по id и пермишены
+
+        GET /api/destruction-act/{id}/all
+        """
+        return await self._call(
+            self._op_get_with_permission,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_years = Operation('GET', 'api/destruction-act/years', response=list[int])
+
+    async def get_years(
+        self,
+        *,
+        statuses: list[str] | None = None,
+        service_token: Optional[str] = None,
+    ) -> list[int]:
+        """
+
+        GET /api/destruction-act/years
+        """
+        return await self._call(
+            self._op_get_years,
+            query={'statuses': statuses},
+            service_token=service_token,
+        )
+
+    _op_print_by_template = Operation('PUT', 'api/destruction-act/{id}/print', response=lambda: m.AttachmentDto, body=lambda: m.DestructionActRequest)
+
+    async def print_by_template(
+        self,
+        id: UUID,
+        *,
+        body: m.DestructionActRequest,
+        service_token: Optional[str] = None,
+    ) -> m.AttachmentDto:
+        """
+        Печать акта уничтожения дел по шаблону
+
+        Для доступа к этому API необходимо: DESTRUCTION_ACT_PRINT
+
+        PUT /api/destruction-act/{id}/print
+        """
+        return await self._call(
+            self._op_print_by_template,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_signing = Operation('PUT', 'api/destruction-act/{id}/process/{itemId}/signing', response=dict[str, Any], body=lambda: m.DestructionActProcessAction)
+
+    async def signing(
+        self,
+        id: UUID,
+        item_id: UUID,
+        *,
+        body: m.DestructionActProcessAction,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Выполнить действие подписания акта уничтожения дел
+
+        Для доступа к этому API необходимо: DESTRUCTION_ACT_SIGNING
+
+        PUT /api/destruction-act/{id}/process/{itemId}/signing
+        """
+        return await self._call(
+            self._op_signing,
+            path={'id': id, 'itemId': item_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_start = Operation('PUT', 'api/destruction-act/{id}/start', response=dict[str, Any])
+
+    async def start(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Запустить процесс согласования акта уничтожения дел
+
+        Для доступа к этому API необходимо: DESTRUCTION_ACT_START
+
+        PUT /api/destruction-act/{id}/start
+        """
+        return await self._call(
+            self._op_start,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_statement = Operation('PUT', 'api/destruction-act/{id}/process/{itemId}/statement', response=dict[str, Any], body=lambda: m.DestructionActProcessAction)
+
+    async def statement(
+        self,
+        id: UUID,
+        item_id: UUID,
+        *,
+        body: m.DestructionActProcessAction,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Выполнить действие утверждения акта уничтожения дел
+
+        Для доступа к этому API необходимо: DESTRUCTION_ACT_STATEMENT
+
+        PUT /api/destruction-act/{id}/process/{itemId}/statement
+        """
+        return await self._call(
+            self._op_statement,
+            path={'id': id, 'itemId': item_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update = Operation('PUT', 'api/destruction-act/{id}', response=lambda: m.DestructionActDto, body=lambda: m.DestructionActDto)
+
+    async def update(
+        self,
+        id: UUID,
+        *,
+        body: m.DestructionActDto,
+        service_token: Optional[str] = None,
+    ) -> m.DestructionActDto:
+        """
+        Создать акт об уничтожении дел
+
+        Для доступа к этому API необходимо: DESTRUCTION_ACT_UPDATE
+
+        PUT /api/destruction-act/{id}
+        """
+        return await self._call(
+            self._op_update,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_upload_attachment = Operation('POST', 'api/destruction-act/{id}/attachment', response=Any, multipart=True)
+
+    async def upload_attachment(
+        self,
+        id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> Any:
+        """
+        Загрузить вложение акта уничтожения дел
+
+        Для доступа к этому API необходимо: DESTRUCTION_ACT_PRINT
+
+        POST /api/destruction-act/{id}/attachment
+        """
+        return await self._call(
+            self._op_upload_attachment,
+            path={'id': id},
+            body=files,
+            service_token=service_token,
+        )
+
+
+class ArchiveRegistrationControllerApi(ApiGroup):
+    """
+    archive-registration-controller
+    """
+
+    _op_get = Operation('GET', 'api/nces/registration', response=lambda: m.ArchiveRegistrationDto)
+
+    async def get(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ArchiveRegistrationDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ARCHIVE_REGISTRATION
+
+        GET /api/nces/registration
+        """
+        return await self._call(
+            self._op_get,
+            service_token=service_token,
+        )
+
+    _op_registration_dispatch = Operation('POST', 'api/nces/registration/dispatch', response=lambda: m.ArchiveRegistrationDto, body=lambda: m.ArchiveRegistrationRequest)
+
+    async def registration_dispatch(
+        self,
+        *,
+        body: m.ArchiveRegistrationRequest,
+        service_token: Optional[str] = None,
+    ) -> m.ArchiveRegistrationDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_ARCHIVE_REGISTRATION
+
+        POST /api/nces/registration/dispatch
+        """
+        return await self._call(
+            self._op_registration_dispatch,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_save_or_edit = Operation('POST', 'api/nces/registration', response=lambda: m.ArchiveRegistrationDto, body=lambda: m.ArchiveRegistrationRequest)
+
+    async def save_or_edit(
+        self,
+        *,
+        body: m.ArchiveRegistrationRequest,
+        service_token: Optional[str] = None,
+    ) -> m.ArchiveRegistrationDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_ARCHIVE_REGISTRATION
+
+        POST /api/nces/registration
+        """
+        return await self._call(
+            self._op_save_or_edit,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_status = Operation('GET', 'api/nces/status/inv-index/{invIndex}', response=lambda: m.GetInventoryStatusResponse2)
+
+    async def status(
+        self,
+        inv_index: str,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.GetInventoryStatusResponse2:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ARCHIVE_REGISTRATION
+
+        GET /api/nces/status/inv-index/{invIndex}
+        """
+        return await self._call(
+            self._op_status,
+            path={'invIndex': inv_index},
+            service_token=service_token,
+        )
+
+    _op_test_connect = Operation('GET', 'api/nces/registration/test', response=lambda: m.GetInventoryStatusResponse2)
+
+    async def test_connect(
+        self,
+        *,
+        request: m.ArchiveRegistrationRequest,
+        service_token: Optional[str] = None,
+    ) -> m.GetInventoryStatusResponse2:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ARCHIVE_REGISTRATION
+
+        GET /api/nces/registration/test
+        """
+        return await self._call(
+            self._op_test_connect,
+            query={'request': request},
+            service_token=service_token,
+        )
+
+
+class ArkhivnyeFondyApi(ApiGroup):
+    """
+    Архивные фонды
+    API для работы со справочником «Архивные фонды»
+    Константы для получения истории: ARCHIVE_FUND
+    """
+
+    _op_get = Operation('GET', 'api/archive-fund/{id}', response=lambda: m.ArchiveFundDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ArchiveFundDto:
+        """
+        Получить архивный фонд по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ARCHIVE_FUND
+
+        GET /api/archive-fund/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/archive-fund', response=lambda: m.SliceDtoArchiveFundDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoArchiveFundDto:
+        """
+        Получить список архивных фондов
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ARCHIVE_FUND
+
+        GET /api/archive-fund
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_mark_delete_list = Operation('DELETE', 'api/archive-fund', response=dict[str, Any], body=lambda: m.IdsUUID)
+
+    async def mark_delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Проставить отметку об удалении для списка архивных фондов по ids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_ARCHIVE_FUND
+
+        DELETE /api/archive-fund
+        """
+        return await self._call(
+            self._op_mark_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/archive-fund', response=lambda: m.ArchiveFundDto, body=lambda: m.ArchiveFundRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.ArchiveFundRequest,
+        service_token: Optional[str] = None,
+    ) -> m.ArchiveFundDto:
+        """
+        Создать новый архивный фонд
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_ARCHIVE_FUND
+
+        POST /api/archive-fund
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/archive-fund', response=lambda: m.ArchiveFundDto, body=lambda: m.ArchiveFundRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.ArchiveFundRequest,
+        service_token: Optional[str] = None,
+    ) -> m.ArchiveFundDto:
+        """
+        Изменить архивный фонд
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_ARCHIVE_FUND
+
+        PUT /api/archive-fund
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class AtributnyeSertifikatySotrudnikaApi(ApiGroup):
+    """
+    Атрибутные сертификаты сотрудника
+    API для работы с атрибутными сертификатами сотрудника
+    """
+
+    _op_delete_all = Operation('DELETE', 'api/employee/{employeeId}/attribute-certificate/all')
+
+    async def delete_all(
+        self,
+        employee_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить все атрибутные сертификаты сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_EMPLOYEE ИЛИ Доступ по условию: employeeId должен совпадать с user.id И user.subordinates не должен быть null
+
+        DELETE /api/employee/{employeeId}/attribute-certificate/all
+        """
+        return await self._call(
+            self._op_delete_all,
+            path={'employeeId': employee_id},
+            service_token=service_token,
+        )
+
+    _op_delete_certificate = Operation('DELETE', 'api/employee/{employeeId}/attribute-certificate', body=lambda: m.IdsUUID)
+
+    async def delete_certificate(
+        self,
+        employee_id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить атрибутный сертификат сотрудника по идентификатору
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_EMPLOYEE ИЛИ Доступ по условию: employeeId должен совпадать с user.id И user.subordinates не должен быть null
+
+        DELETE /api/employee/{employeeId}/attribute-certificate
+        """
+        return await self._call(
+            self._op_delete_certificate,
+            path={'employeeId': employee_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/employee/{employeeId}/attribute-certificate', response=lambda: m.EmployeeAttrCertInfoDto)
+
+    async def get_all(
+        self,
+        employee_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeAttrCertInfoDto:
+        """
+        Получить список атрибутных сертификатов сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_EMPLOYEE ИЛИ Доступ по условию: employeeId должен совпадать с user.id И user.subordinates не должен быть null
+
+        GET /api/employee/{employeeId}/attribute-certificate
+        """
+        return await self._call(
+            self._op_get_all,
+            path={'employeeId': employee_id},
+            service_token=service_token,
+        )
+
+    _op_import_certificate = Operation('POST', 'api/employee/{employeeId}/attribute-certificate', multipart=True)
+
+    async def import_certificate(
+        self,
+        employee_id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить атрибутный сертификат сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_EMPLOYEE ИЛИ Доступ по условию: employeeId должен совпадать с user.id И user.subordinates не должен быть null
+
+        POST /api/employee/{employeeId}/attribute-certificate
+        """
+        return await self._call(
+            self._op_import_certificate,
+            path={'employeeId': employee_id},
+            body=files,
+            service_token=service_token,
+        )
+
+
+class AttachiDokumentaApi(ApiGroup):
+    """
+    Аттачи документа
+    API для работы с аттачами документа
+    """
+
+    _op_add_sign_3 = Operation('PUT', 'api/document/{documentId}/attachment/{id}/sign2', body=lambda: m.SimpleCmsDTO)
+
+    async def add_sign_3(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.SimpleCmsDTO,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Прикрепить подпись ЭЦП
+
+        Для доступа к этому API необходимо: [DOCUMENT_ATTACHMENT_EDS_UPLOAD]
+
+        PUT /api/document/{documentId}/attachment/{id}/sign2
+        """
+        return await self._call(
+            self._op_add_sign_3,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_add_sign_4 = Operation('PUT', 'api/document/{documentId}/attachment/{id}/sign-kta', body=lambda: m.KtaSign)
+
+    async def add_sign_4(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.KtaSign,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Прикрепить подпись ЭЦП
+
+        Для доступа к этому API необходимо: [DOCUMENT_ATTACHMENT_EDS_UPLOAD]
+
+        PUT /api/document/{documentId}/attachment/{id}/sign-kta
+        """
+        return await self._call(
+            self._op_add_sign_4,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_add_sign_6 = Operation('POST', 'api/document/{documentId}/attachment/{id}/sign', response=lambda: m.AttachmentSignature, body=lambda: m.Signature)
+
+    async def add_sign_6(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.Signature,
+        service_token: Optional[str] = None,
+    ) -> m.AttachmentSignature:
+        """
+        Прикрепить подпись ЭЦП
+
+        Для доступа к этому API необходимо: [DOCUMENT_ATTACHMENT_EDS_UPLOAD]
+
+        POST /api/document/{documentId}/attachment/{id}/sign
+        """
+        return await self._call(
+            self._op_add_sign_6,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_change_attachment_type = Operation('PUT', 'api/document/{documentId}/attachment/{id}/document-type', body=lambda: m.ChangeAttachmentDocumentTypeRequest, binary=True)
+
+    async def change_attachment_type(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.ChangeAttachmentDocumentTypeRequest,
+        service_token: Optional[str] = None,
+    ) -> bytes:
+        """
+        Изменить тип вложения
+
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ATTACHMENT]
+
+        PUT /api/document/{documentId}/attachment/{id}/document-type
+        """
+        return await self._call(
+            self._op_change_attachment_type,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_check_sign = Operation('POST', 'api/document/{documentId}/attachment/{id}/verify-sign', response=str, body=lambda: m.CheckAttachmentSignRequest)
+
+    async def check_sign(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.CheckAttachmentSignRequest,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Проверить ЭЦП
+
+        POST /api/document/{documentId}/attachment/{id}/verify-sign
+        """
+        return await self._call(
+            self._op_check_sign,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_convert_to_pdf = Operation('POST', 'api/document/{documentId}/attachment/{id}/convert-pdf', binary=True)
+
+    async def convert_to_pdf(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> bytes:
+        """
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ATTACHMENT, DOCUMENT_ADD_DOCUMENTS]
+
+        POST /api/document/{documentId}/attachment/{id}/convert-pdf
+        """
+        return await self._call(
+            self._op_convert_to_pdf,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_convert_to_pdf_all = Operation('POST', 'api/document/{documentId}/attachment/convert-pdf', body=lambda: m.IdsUUID, binary=True)
+
+    async def convert_to_pdf_all(
+        self,
+        document_id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> bytes:
+        """
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ATTACHMENT, DOCUMENT_ADD_DOCUMENTS]
+
+        POST /api/document/{documentId}/attachment/convert-pdf
+        """
+        return await self._call(
+            self._op_convert_to_pdf_all,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create_empty = Operation('POST', 'api/document/{documentId}/create-empty', multipart=True)
+
+    async def create_empty(
+        self,
+        document_id: UUID,
+        *,
+        files: Any,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Создать файл в документе по шаблону
+
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ATTACHMENT, DOCUMENT_ADD_DOCUMENTS]
+
+        POST /api/document/{documentId}/create-empty
+        """
+        return await self._call(
+            self._op_create_empty,
+            path={'documentId': document_id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_delete_additional_attachment = Operation('DELETE', 'api/document/{documentId}/additional-attachment/{id}')
+
+    async def delete_additional_attachment(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить файл из документа по uuid документа и uuid аттача
+
+        Для доступа к этому API необходимо: [DOCUMENT_DELETE_ADDITIONAL_ATTACHMENT]
+
+        DELETE /api/document/{documentId}/additional-attachment/{id}
+        """
+        return await self._call(
+            self._op_delete_additional_attachment,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_attachment = Operation('DELETE', 'api/document/{documentId}/attachment/{id}')
+
+    async def delete_attachment(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить файл из документа по uuid документа и uuid аттача
+
+        Для доступа к этому API необходимо: [DOCUMENT_DELETE_ATTACHMENT]
+
+        DELETE /api/document/{documentId}/attachment/{id}
+        """
+        return await self._call(
+            self._op_delete_attachment,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_download_additional_attachment = Operation('GET', 'api/document/{documentId}/additional-attachment/{id}', binary=True)
+
+    def download_additional_attachment(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл из документа по uuid документа и uuid аттача
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ_ADDITIONAL_ATTACHMENT]
+
+        GET /api/document/{documentId}/additional-attachment/{id}
+        """
+        return self._stream(
+            self._op_download_additional_attachment,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_download_attachment = Operation('GET', 'api/document/{documentId}/attachment/{id}', binary=True)
+
+    def download_attachment(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл из документа по uuid документа и uuid аттача
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ_ATTACHMENT]
+
+        GET /api/document/{documentId}/attachment/{id}
+        """
+        return self._stream(
+            self._op_download_attachment,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_download_attachment_zip_eds = Operation('GET', 'api/document/{documentId}/attachment/{id}/zip-eds', binary=True)
+
+    def download_attachment_zip_eds(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Получить файл с его ЭЦП
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ_ATTACHMENT]
+
+        GET /api/document/{documentId}/attachment/{id}/zip-eds
+        """
+        return self._stream(
+            self._op_download_attachment_zip_eds,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_download_base64 = Operation('GET', 'api/document/{documentId}/attachment/{id}/base64', binary=True)
+
+    def download_base64(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл base64 из MinIO по uuid
+
+        GET /api/document/{documentId}/attachment/{id}/base64
+        """
+        return self._stream(
+            self._op_download_base64,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_download_source_attachment = Operation('GET', 'api/document/{documentId}/attachment/{id}/source', binary=True)
+
+    def download_source_attachment(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить исходник файла из документа по uuid документа и uuid аттача
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ_ATTACHMENT]
+
+        GET /api/document/{documentId}/attachment/{id}/source
+        """
+        return self._stream(
+            self._op_download_source_attachment,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_get_all_by_doc = Operation('GET', 'api/document/{documentId}/attachment', response=lambda: list[m.AttachmentDocumentDto])
+
+    async def get_all_by_doc(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.AttachmentDocumentDto]:
+        """
+        Получить все вложения документа
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/attachment
+        """
+        return await self._call(
+            self._op_get_all_by_doc,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_attachment_meta_info = Operation('GET', 'api/document/{documentId}/attachment/{id}/metadata', binary=True)
+
+    def get_attachment_meta_info(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Для доступа к этому API необходимо: [DOCUMENT_READ_ATTACHMENT]
+
+        GET /api/document/{documentId}/attachment/{id}/metadata
+        """
+        return self._stream(
+            self._op_get_attachment_meta_info,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_remove_sign = Operation('DELETE', 'api/document/{documentId}/attachment/{id}/sign', response=lambda: m.AttachmentSignature, body=lambda: m.IdUUID)
+
+    async def remove_sign(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.AttachmentSignature:
+        """
+        Удалить подпись ЭЦП
+
+        Для доступа к этому API необходимо: [DOCUMENT_ATTACHMENT_EDS_REMOVE]
+
+        DELETE /api/document/{documentId}/attachment/{id}/sign
+        """
+        return await self._call(
+            self._op_remove_sign,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_remove_sign_4 = Operation('DELETE', 'api/document/{documentId}/attachment/{id}/sign/{signId}', response=lambda: m.AttachmentSignature)
+
+    async def remove_sign_4(
+        self,
+        document_id: UUID,
+        id: UUID,
+        sign_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AttachmentSignature:
+        """
+        Удалить подпись ЭЦП
+
+        Для доступа к этому API необходимо: [DOCUMENT_ATTACHMENT_EDS_REMOVE]
+
+        DELETE /api/document/{documentId}/attachment/{id}/sign/{signId}
+        """
+        return await self._call(
+            self._op_remove_sign_4,
+            path={'documentId': document_id, 'id': id, 'signId': sign_id},
+            service_token=service_token,
+        )
+
+    _op_rename_file = Operation('PUT', 'api/document/{documentId}/attachment/{id}/rename', body=lambda: m.RenameFileRequest, binary=True)
+
+    async def rename_file(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.RenameFileRequest,
+        service_token: Optional[str] = None,
+    ) -> bytes:
+        """
+        Сменить имя вложения
+
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ATTACHMENT]
+
+        PUT /api/document/{documentId}/attachment/{id}/rename
+        """
+        return await self._call(
+            self._op_rename_file,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_upload_additional_attachment = Operation('POST', 'api/document/{documentId}/additional-attachment', multipart=True)
+
+    async def upload_additional_attachment(
+        self,
+        document_id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить файл в документ
+
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ADDITIONAL_ATTACHMENT, DOCUMENT_ADD_DOCUMENTS]
+
+        POST /api/document/{documentId}/additional-attachment
+        """
+        return await self._call(
+            self._op_upload_additional_attachment,
+            path={'documentId': document_id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_attachment = Operation('POST', 'api/document/{documentId}/attachment', multipart=True)
+
+    async def upload_file_attachment(
+        self,
+        document_id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить файл в документ
+
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ATTACHMENT, DOCUMENT_ADD_DOCUMENTS]
+
+        POST /api/document/{documentId}/attachment
+        """
+        return await self._call(
+            self._op_upload_file_attachment,
+            path={'documentId': document_id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_decision = Operation('POST', 'api/document/{documentId}/decision', multipart=True)
+
+    async def upload_file_decision(
+        self,
+        document_id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить файл в документ
+
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ATTACHMENT, DOCUMENT_ADD_DOCUMENTS]
+
+        POST /api/document/{documentId}/decision
+        """
+        return await self._call(
+            self._op_upload_file_decision,
+            path={'documentId': document_id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_documents_question = Operation('POST', 'api/document/{documentId}/documents-question', multipart=True)
+
+    async def upload_file_documents_question(
+        self,
+        document_id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить файл в документ
+
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ATTACHMENT, DOCUMENT_ADD_DOCUMENTS]
+
+        POST /api/document/{documentId}/documents-question
+        """
+        return await self._call(
+            self._op_upload_file_documents_question,
+            path={'documentId': document_id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_print_document = Operation('POST', 'api/document/{documentId}/print-document', multipart=True)
+
+    async def upload_file_print_document(
+        self,
+        document_id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить файл в документ
+
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ATTACHMENT, DOCUMENT_ADD_DOCUMENTS]
+
+        POST /api/document/{documentId}/print-document
+        """
+        return await self._call(
+            self._op_upload_file_print_document,
+            path={'documentId': document_id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_project_solution = Operation('POST', 'api/document/{documentId}/project-solution', multipart=True)
+
+    async def upload_file_project_solution(
+        self,
+        document_id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить файл в документ
+
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ATTACHMENT, DOCUMENT_ADD_DOCUMENTS]
+
+        POST /api/document/{documentId}/project-solution
+        """
+        return await self._call(
+            self._op_upload_file_project_solution,
+            path={'documentId': document_id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_rationale = Operation('POST', 'api/document/{documentId}/rationale', multipart=True)
+
+    async def upload_file_rationale(
+        self,
+        document_id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить файл в документ
+
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ATTACHMENT, DOCUMENT_ADD_DOCUMENTS]
+
+        POST /api/document/{documentId}/rationale
+        """
+        return await self._call(
+            self._op_upload_file_rationale,
+            path={'documentId': document_id},
+            body=files,
+            service_token=service_token,
+        )
+
+
+class AvtorizatsiiaApi(ApiGroup):
+    """
+    Авторизация
+    """
+
+    _op_get_principal = Operation('GET', 'auth/spnego', response=lambda: m.SpnegoAuthDebug)
+
+    async def get_principal(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.SpnegoAuthDebug:
+        """
+
+        GET /auth/spnego
+        """
+        return await self._call(
+            self._op_get_principal,
+            service_token=service_token,
+        )
+
+    _op_spnego_auth = Operation('POST', 'auth/spnego', response=lambda: m.TokenResponse)
+
+    async def spnego_auth(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TokenResponse:
+        """
+
+        POST /auth/spnego
+        """
+        return await self._call(
+            self._op_spnego_auth,
+            service_token=service_token,
+        )
+
+    _op_spnego_auth_1 = Operation('POST', 'auth/refresh-token', response=lambda: m.TokenResponse, body=lambda: m.RefreshToken)
+
+    async def spnego_auth_1(
+        self,
+        *,
+        body: m.RefreshToken,
+        service_token: Optional[str] = None,
+    ) -> m.TokenResponse:
+        """
+        Обновление токена
+
+        POST /auth/refresh-token
+        """
+        return await self._call(
+            self._op_spnego_auth_1,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_spnego_auth_2 = Operation('POST', 'auth/basic', response=lambda: m.TokenResponse, body=lambda: m.BasicAuthRequest)
+
+    async def spnego_auth_2(
+        self,
+        *,
+        body: m.BasicAuthRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TokenResponse:
+        """
+        Авторизация по логину и паролю
+
+        POST /auth/basic
+        """
+        return await self._call(
+            self._op_spnego_auth_2,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class BasicUserAccountControllerApi(ApiGroup):
+    """
+    basic-user-account-controller
+    """
+
+    _op_change = Operation('PUT', 'api/user-basic-account/{id}/change', response=str, body=lambda: m.BasicUserAccountChange)
+
+    async def change(
+        self,
+        id: UUID,
+        *,
+        body: m.BasicUserAccountChange,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_USER_BASIC_AUTH
+
+        PUT /api/user-basic-account/{id}/change
+        """
+        return await self._call(
+            self._op_change,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create = Operation('POST', 'api/user-basic-account/{id}', response=str, body=lambda: m.BasicUserAccountCreate)
+
+    async def create(
+        self,
+        id: UUID,
+        *,
+        body: m.BasicUserAccountCreate,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: ADD_USER_BASIC_AUTH
+
+        POST /api/user-basic-account/{id}
+        """
+        return await self._call(
+            self._op_create,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/user-basic-account/{id}', response=lambda: m.NoPasswordUserAccount)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NoPasswordUserAccount:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_USER_BASIC_AUTH ИЛИ Доступ по условию: id должен совпадать с user.id
+
+        GET /api/user-basic-account/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_update = Operation('PUT', 'api/user-basic-account/{id}', response=str, body=lambda: m.BasicUserAccountUpdate)
+
+    async def update(
+        self,
+        id: UUID,
+        *,
+        body: m.BasicUserAccountUpdate,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_USER_BASIC_AUTH ИЛИ Доступ по условию: id должен совпадать с user.id
+
+        PUT /api/user-basic-account/{id}
+        """
+        return await self._call(
+            self._op_update,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update_1 = Operation('DELETE', 'api/user-basic-account/{id}', response=str)
+
+    async def update_1(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_USER_BASIC_AUTH
+
+        DELETE /api/user-basic-account/{id}
+        """
+        return await self._call(
+            self._op_update_1,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+
+class BpmnProcessDirectoryControllerApi(ApiGroup):
+    """
+    bpmn-process-directory-controller
+    """
+
+    _op_definition = Operation('GET', 'api/bpmn/definition', response=str)
+
+    async def definition(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+
+        GET /api/bpmn/definition
+        """
+        return await self._call(
+            self._op_definition,
+            service_token=service_token,
+        )
+
+    _op_download = Operation('GET', 'api/bpmn/{id}/xml', response=dict[str, Any])
+
+    async def download(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+
+        GET /api/bpmn/{id}/xml
+        """
+        return await self._call(
+            self._op_download,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_edit = Operation('PUT', 'api/bpmn', response=lambda: m.BpmnProcessDirectoryDto, body=lambda: m.BpmnProcessDirectoryRequest)
+
+    async def edit(
+        self,
+        *,
+        body: m.BpmnProcessDirectoryRequest,
+        service_token: Optional[str] = None,
+    ) -> m.BpmnProcessDirectoryDto:
+        """
+
+        PUT /api/bpmn
+        """
+        return await self._call(
+            self._op_edit,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_find_by_id = Operation('GET', 'api/bpmn/{id}', response=lambda: m.BpmnProcessDirectoryDto)
+
+    async def find_by_id(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.BpmnProcessDirectoryDto:
+        """
+
+        GET /api/bpmn/{id}
+        """
+        return await self._call(
+            self._op_find_by_id,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/bpmn', response=lambda: m.SliceDtoBpmnProcessDirectoryDto)
+
+    async def get_all(
+        self,
+        *,
+        request: m.BpmnSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoBpmnProcessDirectoryDto:
+        """
+        Разрешенные поля для сортировки: name
+
+        GET /api/bpmn
+        """
+        return await self._call(
+            self._op_get_all,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_mark_delete = Operation('DELETE', 'api/bpmn/{id}')
+
+    async def mark_delete(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+
+        DELETE /api/bpmn/{id}
+        """
+        return await self._call(
+            self._op_mark_delete,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_mark_delete_list = Operation('DELETE', 'api/bpmn', body=lambda: m.IdsUUID)
+
+    async def mark_delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+
+        DELETE /api/bpmn
+        """
+        return await self._call(
+            self._op_mark_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_upload = Operation('POST', 'api/bpmn', response=lambda: m.BpmnProcessDirectoryDto, body=lambda: m.BpmnProcessDirectoryRequest)
+
+    async def upload(
+        self,
+        *,
+        body: m.BpmnProcessDirectoryRequest,
+        service_token: Optional[str] = None,
+    ) -> m.BpmnProcessDirectoryDto:
+        """
+
+        POST /api/bpmn
+        """
+        return await self._call(
+            self._op_upload,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class DepartamentyApi(ApiGroup):
+    """
+    Департаменты
+    API для работы с департаментами/подразделениями
+    Константы для получения истории: EMPLOYEE, DEPARTMENT
+    """
+
+    _op_delete = Operation('DELETE', 'api/department/{id}')
+
+    async def delete(
+        self,
+        id: UUID,
+        *,
+        ignore_errors: bool | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить департамент по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_DEPARTMENT
+
+        DELETE /api/department/{id}
+        """
+        return await self._call(
+            self._op_delete,
+            path={'id': id},
+            query={'ignoreErrors': ignore_errors},
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/department/{id}', response=lambda: m.DepartmentDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        filter: m.DepartmentFilter,
+        service_token: Optional[str] = None,
+    ) -> m.DepartmentDto:
+        """
+        Получить департамент по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DEPARTMENT ИЛИ Доступ по условию: id должен совпадать с user.departmentId
+
+        GET /api/department/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_all_employees = Operation('GET', 'api/department/{id}/employees', response=lambda: m.EmployeeDto)
+
+    async def get_all_employees(
+        self,
+        id: UUID,
+        *,
+        request: m.BasicSearchEmployeeRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeDto:
+        """
+        Получить список пользователей департамента по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DEPARTMENT ИЛИ Доступ по условию: id должен совпадать с user.departmentId
+
+        GET /api/department/{id}/employees
+        """
+        return await self._call(
+            self._op_get_all_employees,
+            path={'id': id},
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_all_employees_1 = Operation('GET', 'api/department/{id}/employees/all', response=lambda: m.EmployeeDto)
+
+    async def get_all_employees_1(
+        self,
+        id: UUID,
+        *,
+        filter: m.EmployeeFilter,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeDto:
+        """
+        Получить список всех сотрудников департамента по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DEPARTMENT ИЛИ Доступ по условию: id должен совпадать с user.departmentId
+
+        GET /api/department/{id}/employees/all
+        """
+        return await self._call(
+            self._op_get_all_employees_1,
+            path={'id': id},
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_all_without_child = Operation('GET', 'api/department/getAllWithoutChild/{id}', response=lambda: m.DepartmentDto)
+
+    async def get_all_without_child(
+        self,
+        id: UUID,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.DepartmentDto:
+        """
+        Получить все департаменты без дочерних
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DEPARTMENT
+
+        GET /api/department/getAllWithoutChild/{id}
+        """
+        return await self._call(
+            self._op_get_all_without_child,
+            path={'id': id},
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_child_departments = Operation('GET', 'api/department/child-departments/{id}', response=lambda: m.DepartmentDto)
+
+    async def get_child_departments(
+        self,
+        id: UUID,
+        *,
+        filter: m.DepartmentFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.DepartmentDto:
+        """
+        Получить список дочерних департаментов по id родителя
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DEPARTMENT ИЛИ Доступ по условию: id должен совпадать с user.departmentId
+
+        GET /api/department/child-departments/{id}
+        """
+        return await self._call(
+            self._op_get_child_departments,
+            path={'id': id},
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_collection_23 = Operation('GET', 'api/department', response=lambda: m.DepartmentDto)
+
+    async def get_collection_23(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.DepartmentDto:
+        """
+        Получить список департаментов (стандартный фильтр)
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DEPARTMENT
+
+        GET /api/department
+        """
+        return await self._call(
+            self._op_get_collection_23,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_collection_53 = Operation('GET', 'api/department/extended', response=lambda: m.DepartmentDto)
+
+    async def get_collection_53(
+        self,
+        *,
+        filter: m.DepartmentFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.DepartmentDto:
+        """
+        Получить список департаментов
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DEPARTMENT
+
+        GET /api/department/extended
+        """
+        return await self._call(
+            self._op_get_collection_53,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_deputy_leader = Operation('GET', 'api/department/{id}/deputy-leader', response=lambda: m.DepartmentDto)
+
+    async def get_deputy_leader(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DepartmentDto:
+        """
+        Получить заместителей подразделения
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DEPARTMENT ИЛИ Доступ по условию: id должен совпадать с user.departmentId
+
+        GET /api/department/{id}/deputy-leader
+        """
+        return await self._call(
+            self._op_get_deputy_leader,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_path = Operation('GET', 'api/department/getPath/{id}', response=lambda: m.DepartmentDto)
+
+    async def get_path(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DepartmentDto:
+        """
+        Получить путь
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DEPARTMENT ИЛИ Доступ по условию: id должен совпадать с user.departmentId
+
+        GET /api/department/getPath/{id}
+        """
+        return await self._call(
+            self._op_get_path,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_roots = Operation('GET', 'api/department/roots', response=lambda: m.DepartmentDto)
+
+    async def get_roots(
+        self,
+        *,
+        filter: m.DepartmentFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.DepartmentDto:
+        """
+        Получить список департаментов родителей
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DEPARTMENT
+
+        GET /api/department/roots
+        """
+        return await self._call(
+            self._op_get_roots,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/department', response=lambda: m.DepartmentDto, body=lambda: m.DepartmentDto)
+
+    async def post(
+        self,
+        *,
+        body: m.DepartmentDto,
+        service_token: Optional[str] = None,
+    ) -> m.DepartmentDto:
+        """
+        Создать новый департамент
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_DEPARTMENT И user.subordinatesDepartments не должен быть null
+
+        POST /api/department
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/department', response=lambda: m.DepartmentDto, body=lambda: m.DepartmentDto)
+
+    async def put(
+        self,
+        *,
+        body: m.DepartmentDto,
+        service_token: Optional[str] = None,
+    ) -> m.DepartmentDto:
+        """
+        Изменить департамент
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_DEPARTMENT И user.subordinatesDepartments не должен быть null
+
+        PUT /api/department
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_search_fts_top_by_name = Operation('GET', 'api/department/fts-name', response=lambda: m.DepartmentDto)
+
+    async def search_fts_top_by_name(
+        self,
+        *,
+        fts: str,
+        service_token: Optional[str] = None,
+    ) -> m.DepartmentDto:
+        """
+        Полнотекстовый поиск департамента по названию
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DEPARTMENT
+
+        GET /api/department/fts-name
+        """
+        return await self._call(
+            self._op_search_fts_top_by_name,
+            query={'fts': fts},
+            service_token=service_token,
+        )
+
+
+class DokumentApi(ApiGroup):
+    """
+    Документ
+    API для работы со списком вопросов по документу
+    Константы для получения истории: CONTRACT_VERSION_INFO, NOMENCLATURE_AFFAIR
+    """
+
+    _op_affairs = Operation('GET', 'api/document/{id}/nomenclature-affair', response=lambda: m.NomenclatureAffairDto)
+
+    async def affairs(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+        Получить список дел в которые добавлен документ
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{id}/nomenclature-affair
+        """
+        return await self._call(
+            self._op_affairs,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_answer = Operation('POST', 'api/document/{docId}/smdo-answer', response=lambda: m.DocumentDto, body=lambda: m.IdUUID)
+
+    async def answer(
+        self,
+        doc_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Создать документ ответ смдо
+
+        POST /api/document/{docId}/smdo-answer
+        """
+        return await self._call(
+            self._op_answer,
+            path={'docId': doc_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_cancel = Operation('POST', 'api/document/cancel', body=lambda: m.DocumentCancelAction)
+
+    async def cancel(
+        self,
+        *,
+        body: m.DocumentCancelAction,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Аннулировать документ
+
+        POST /api/document/cancel
+        """
+        return await self._call(
+            self._op_cancel,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_change_control = Operation('PUT', 'api/document/{docId}/control', response=lambda: m.ControlDto, body=lambda: m.ControlRequest)
+
+    async def change_control(
+        self,
+        doc_id: UUID,
+        *,
+        body: m.ControlRequest,
+        service_token: Optional[str] = None,
+    ) -> m.ControlDto:
+        """
+        Отредактировать контроль документа
+
+        PUT /api/document/{docId}/control
+        """
+        return await self._call(
+            self._op_change_control,
+            path={'docId': doc_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_change_document_author = Operation('PUT', 'api/document/{documentId}/change-document-author', response=lambda: m.DocumentDto, body=lambda: m.IdUUID)
+
+    async def change_document_author(
+        self,
+        document_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Изменить автора документа
+
+        Для доступа к этому API необходимо: [DOCUMENT_CHANGE_AUTHOR]
+
+        PUT /api/document/{documentId}/change-document-author
+        """
+        return await self._call(
+            self._op_change_document_author,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create_answer = Operation('POST', 'api/document/{docId}/answer', response=lambda: m.DocumentDto, body=lambda: m.IdUUID)
+
+    async def create_answer(
+        self,
+        doc_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Создать документ ответ
+
+        Для доступа к этому API необходимо: [DOCUMENT_CREATE_ANSWER]
+
+        POST /api/document/{docId}/answer
+        """
+        return await self._call(
+            self._op_create_answer,
+            path={'docId': doc_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create_color = Operation('POST', 'api/document/{id}/color', response=lambda: m.DocumentDto, body=lambda: m.DocumentUserColorDto)
+
+    async def create_color(
+        self,
+        id: UUID,
+        *,
+        body: m.DocumentUserColorDto,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Получить документ по id
+
+        POST /api/document/{id}/color
+        """
+        return await self._call(
+            self._op_create_color,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create_or_update = Operation('POST', 'api/document/color/batch', response=lambda: m.DocumentDto, body=lambda: list[m.DocumentUserColorDto])
+
+    async def create_or_update(
+        self,
+        *,
+        body: list[m.DocumentUserColorDto],
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Получить документ по id
+
+        POST /api/document/color/batch
+        """
+        return await self._call(
+            self._op_create_or_update,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create_questions = Operation('POST', 'api/document/{documentId}/questions', response=lambda: m.ControlDto)
+
+    async def create_questions(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ControlDto:
+        """
+        Создать список вопросов
+
+        Для доступа к этому API необходимо: [DOCUMENT_LIST_QUESTIONS_UPDATE]
+
+        POST /api/document/{documentId}/questions
+        """
+        return await self._call(
+            self._op_create_questions,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_creating_based_existing = Operation('POST', 'api/document/{documentId}/creating-based-existing', body=lambda: m.DocumentBasedExistingBody)
+
+    async def creating_based_existing(
+        self,
+        document_id: UUID,
+        *,
+        body: m.DocumentBasedExistingBody,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Создание документа на основе имеющегося
+
+        POST /api/document/{documentId}/creating-based-existing
+        """
+        return await self._call(
+            self._op_creating_based_existing,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_control = Operation('DELETE', 'api/document/{docId}/control')
+
+    async def delete_control(
+        self,
+        doc_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить контроль документа
+
+        DELETE /api/document/{docId}/control
+        """
+        return await self._call(
+            self._op_delete_control,
+            path={'docId': doc_id},
+            service_token=service_token,
+        )
+
+    _op_delete_document = Operation('DELETE', 'api/document', response=lambda: m.CountResult, body=lambda: m.IdsUUID)
+
+    async def delete_document(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.CountResult:
+        """
+        Удалить документ
+
+        DELETE /api/document
+        """
+        return await self._call(
+            self._op_delete_document,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_document_1 = Operation('DELETE', 'api/document/{id}', response=lambda: m.DocumentDto)
+
+    async def delete_document_1(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Удалить документ
+
+        DELETE /api/document/{id}
+        """
+        return await self._call(
+            self._op_delete_document_1,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_document_extract_archive = Operation('DELETE', 'api/document/archive', response=lambda: m.CountResult, body=lambda: m.IdsUUID)
+
+    async def document_extract_archive(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.CountResult:
+        """
+        Достать документы из архива
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_DOCUMENT_IN_ARCHIVE_VIEW
+
+        DELETE /api/document/archive
+        """
+        return await self._call(
+            self._op_document_extract_archive,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_document_list_in_archive = Operation('PUT', 'api/document/archive', response=lambda: m.CountResult, body=lambda: m.IdsUUID)
+
+    async def document_list_in_archive(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.CountResult:
+        """
+        Отправить документы в архив
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_DOCUMENT_IN_ARCHIVE_VIEW
+
+        PUT /api/document/archive
+        """
+        return await self._call(
+            self._op_document_list_in_archive,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_document_recipient_aismv_delivery_cancel = Operation('POST', 'api/document/{id}/recipient/{recipientId}/aismv-delivery-history/{deliveryId}/cancel', response=lambda: m.DocumentRecipientDto)
+
+    async def document_recipient_aismv_delivery_cancel(
+        self,
+        id: UUID,
+        recipient_id: UUID,
+        delivery_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentRecipientDto:
+        """
+        Для доступа к этому API необходимо: [DOCUMENT_SMDO_CANCEL_DELIVERY]
+
+        POST /api/document/{id}/recipient/{recipientId}/aismv-delivery-history/{deliveryId}/cancel
+        """
+        return await self._call(
+            self._op_document_recipient_aismv_delivery_cancel,
+            path={'id': id, 'recipientId': recipient_id, 'deliveryId': delivery_id},
+            service_token=service_token,
+        )
+
+    _op_document_recipient_aismv_delivery_confirm = Operation('POST', 'api/document/{id}/recipient/{recipientId}/aismv-delivery-history/{deliveryId}/confirm', response=lambda: m.DocumentRecipientDto)
+
+    async def document_recipient_aismv_delivery_confirm(
+        self,
+        id: UUID,
+        recipient_id: UUID,
+        delivery_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentRecipientDto:
+        """
+        Для доступа к этому API необходимо: [DOCUMENT_SMDO_CONFIRM_DELIVERY]
+
+        POST /api/document/{id}/recipient/{recipientId}/aismv-delivery-history/{deliveryId}/confirm
+        """
+        return await self._call(
+            self._op_document_recipient_aismv_delivery_confirm,
+            path={'id': id, 'recipientId': recipient_id, 'deliveryId': delivery_id},
+            service_token=service_token,
+        )
+
+    _op_document_recipient_aismv_delivery_retry = Operation('POST', 'api/document/{id}/recipient/{recipientId}/aismv-delivery-history/{deliveryId}/retry', response=lambda: m.DocumentRecipientDto)
+
+    async def document_recipient_aismv_delivery_retry(
+        self,
+        id: UUID,
+        recipient_id: UUID,
+        delivery_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentRecipientDto:
+        """
+        Для доступа к этому API необходимо: [DOCUMENT_SMDO_RETRY_DOCUMENT_DELIVERY]
+
+        POST /api/document/{id}/recipient/{recipientId}/aismv-delivery-history/{deliveryId}/retry
+        """
+        return await self._call(
+            self._op_document_recipient_aismv_delivery_retry,
+            path={'id': id, 'recipientId': recipient_id, 'deliveryId': delivery_id},
+            service_token=service_token,
+        )
+
+    _op_download = Operation('GET', 'api/document/{documentId}/contract-version-info/{id}/attachment/{attachId}/download', binary=True)
+
+    def download(
+        self,
+        document_id: UUID,
+        id: UUID,
+        attach_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл версии договора
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/contract-version-info/{id}/attachment/{attachId}/download
+        """
+        return self._stream(
+            self._op_download,
+            path={'documentId': document_id, 'id': id, 'attachId': attach_id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_download_zip_as_stream = Operation('GET', 'api/document/{documentId}/contract-version-info/{id}/attachment/zip/download-stream', binary=True)
+
+    def download_zip_as_stream(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файлы в zip формате (потоковая передача)
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/contract-version-info/{id}/attachment/zip/download-stream
+        """
+        return self._stream(
+            self._op_download_zip_as_stream,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_execute_document_operations = Operation('POST', 'api/document/{id}/execute', body=lambda: list[m.DocOperation])
+
+    async def execute_document_operations(
+        self,
+        id: UUID,
+        *,
+        body: list[m.DocOperation],
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Выполнить действие над документом
+
+        POST /api/document/{id}/execute
+        """
+        return await self._call(
+            self._op_execute_document_operations,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_extract_nomenclature_v2 = Operation('PUT', 'api/document/{documentId}/extract-nomenclature', body=lambda: m.IdsUUID)
+
+    async def extract_nomenclature_v2(
+        self,
+        document_id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Извлечение документа из номенклатур дел
+
+        Для доступа к этому API необходимо: [DOCUMENT_EXTRACT_NOMENCLATURE_AFFAIR_UPDATE]
+
+        PUT /api/document/{documentId}/extract-nomenclature
+        """
+        return await self._call(
+            self._op_extract_nomenclature_v2,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/document/{id}', response=lambda: m.DocumentDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Получить документ по id
+
+        GET /api/document/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_affairs_with_links = Operation('GET', 'api/document/{id}/nomenclature-affair-document-link', response=lambda: m.NomenclatureAffairDto)
+
+    async def get_affairs_with_links(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+        Получить список дел в которые добавлен документ и связи документов
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{id}/nomenclature-affair-document-link
+        """
+        return await self._call(
+            self._op_get_affairs_with_links,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_all_8 = Operation('GET', 'api/document', response=lambda: m.DocumentDto)
+
+    async def get_all_8(
+        self,
+        *,
+        f: m.DocumentFilter,
+        p: m.Pageable,
+        list_attribute: bool,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Получить все документы
+
+        Разрешенные поля для сортировки: regNumber, regDate, status, createDate, documentType.typeName, receiptDate, author.firstName, author.lastName, author.middleName, dateQuestion, dateMeetingQuestion, dateMeeting, startMeeting, shortSummary
+
+        GET /api/document
+        """
+        return await self._call(
+            self._op_get_all_8,
+            query={'f': f, 'p': p, 'listAttribute': list_attribute},
+            service_token=service_token,
+        )
+
+    _op_get_all_9 = Operation('GET', 'api/document/{documentId}/questions', response=lambda: m.ControlDto)
+
+    async def get_all_9(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ControlDto:
+        """
+        Получить документы повестки вопросов по id документа
+
+        GET /api/document/{documentId}/questions
+        """
+        return await self._call(
+            self._op_get_all_9,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_all_count_by_status = Operation('GET', 'api/document/status-group', response=lambda: m.DocumentDto)
+
+    async def get_all_count_by_status(
+        self,
+        *,
+        f: m.DocumentFilter,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Получить документы в работе в количестве по статусам
+
+        GET /api/document/status-group
+        """
+        return await self._call(
+            self._op_get_all_count_by_status,
+            query={'f': f},
+            service_token=service_token,
+        )
+
+    _op_get_all_versions = Operation('GET', 'api/document/{id}/version', response=lambda: m.DocumentVersionDto)
+
+    async def get_all_versions(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentVersionDto:
+        """
+        Получить все версии документа
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{id}/version
+        """
+        return await self._call(
+            self._op_get_all_versions,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_all_with_permissions = Operation('GET', 'api/document/{documentId}/all', response=lambda: m.DocumentDto)
+
+    async def get_all_with_permissions(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Получить документ по id
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/all
+        """
+        return await self._call(
+            self._op_get_all_with_permissions,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_by_user_author = Operation('GET', 'api/document/stat/user-author', response=lambda: m.ExecutionDocumentStatCount)
+
+    async def get_by_user_author(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ExecutionDocumentStatCount:
+        """
+
+        GET /api/document/stat/user-author
+        """
+        return await self._call(
+            self._op_get_by_user_author,
+            service_token=service_token,
+        )
+
+    _op_get_by_user_control = Operation('GET', 'api/document/stat/user-control', response=lambda: m.ExecutionDocumentStatCount)
+
+    async def get_by_user_control(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ExecutionDocumentStatCount:
+        """
+
+        GET /api/document/stat/user-control
+        """
+        return await self._call(
+            self._op_get_by_user_control,
+            service_token=service_token,
+        )
+
+    _op_get_by_user_executor = Operation('GET', 'api/document/stat/user-executor', response=lambda: m.ExecutionDocumentStatCount)
+
+    async def get_by_user_executor(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ExecutionDocumentStatCount:
+        """
+
+        GET /api/document/stat/user-executor
+        """
+        return await self._call(
+            self._op_get_by_user_executor,
+            service_token=service_token,
+        )
+
+    _op_get_contract_responsible = Operation('GET', 'api/document/{documentId}/responsible', response=lambda: m.DocumentDto)
+
+    async def get_contract_responsible(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Получить ответственных по договору
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/responsible
+        """
+        return await self._call(
+            self._op_get_contract_responsible,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_control = Operation('GET', 'api/document/{documentId}/control', response=lambda: m.ControlDto)
+
+    async def get_control(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ControlDto:
+        """
+        Получить контроль документа
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/control
+        """
+        return await self._call(
+            self._op_get_control,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_correspondent = Operation('GET', 'api/document/recipient', response=lambda: m.DocumentDto)
+
+    async def get_correspondent(
+        self,
+        *,
+        filter: m.DocumentFilter,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Получить контрагентов
+
+        GET /api/document/recipient
+        """
+        return await self._call(
+            self._op_get_correspondent,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_document_aismv_ack_delivery = Operation('GET', 'api/document/{id}/aismv-ack-delivery', response=lambda: m.DocumentRecipientDto)
+
+    async def get_document_aismv_ack_delivery(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentRecipientDto:
+        """
+        Получить историю отправки квитанций аисмв
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{id}/aismv-ack-delivery
+        """
+        return await self._call(
+            self._op_get_document_aismv_ack_delivery,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_document_history = Operation('GET', 'api/document/{id}/history', response=lambda: m.DocumentHistoryDto)
+
+    async def get_document_history(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentHistoryDto:
+        """
+        Получить протокол работы с документом
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{id}/history
+        """
+        return await self._call(
+            self._op_get_document_history,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_document_history_v2 = Operation('GET', 'api/document/{id}/history/v2', response=lambda: m.DocumentHistoryDto)
+
+    async def get_document_history_v2(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentHistoryDto:
+        """
+        Получить протокол работы с документом
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{id}/history/v2
+        """
+        return await self._call(
+            self._op_get_document_history_v2,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_document_not_sent_recipient_list = Operation('GET', 'api/document/{id}/not-sent-recipient', response=lambda: m.DocumentRecipientDto)
+
+    async def get_document_not_sent_recipient_list(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentRecipientDto:
+        """
+        Получить список адресатов которым ещё не отправлен документ
+
+        GET /api/document/{id}/not-sent-recipient
+        """
+        return await self._call(
+            self._op_get_document_not_sent_recipient_list,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_document_recipient_aismv_delivery_history = Operation('GET', 'api/document/{id}/recipient/{recipientId}/aismv-delivery-history', response=lambda: m.DocumentRecipientDto)
+
+    async def get_document_recipient_aismv_delivery_history(
+        self,
+        id: UUID,
+        recipient_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentRecipientDto:
+        """
+        Получить список адресатов документа
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{id}/recipient/{recipientId}/aismv-delivery-history
+        """
+        return await self._call(
+            self._op_get_document_recipient_aismv_delivery_history,
+            path={'id': id, 'recipientId': recipient_id},
+            service_token=service_token,
+        )
+
+    _op_get_document_recipient_list = Operation('GET', 'api/document/{id}/recipient', response=lambda: m.DocumentRecipientDto)
+
+    async def get_document_recipient_list(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentRecipientDto:
+        """
+        Получить список адресатов документа
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{id}/recipient
+        """
+        return await self._call(
+            self._op_get_document_recipient_list,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_document_recipient_list_1 = Operation('GET', 'api/document/{id}/recipient/{recipientId}/history', response=lambda: m.DocumentRecipientDeliveryHistoryDto)
+
+    async def get_document_recipient_list_1(
+        self,
+        id: UUID,
+        recipient_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentRecipientDeliveryHistoryDto:
+        """
+        Получить историю отправки адресата
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{id}/recipient/{recipientId}/history
+        """
+        return await self._call(
+            self._op_get_document_recipient_list_1,
+            path={'id': id, 'recipientId': recipient_id},
+            service_token=service_token,
+        )
+
+    _op_get_employees_for_notify = Operation('GET', 'api/document/{documentId}/employees-for-notify')
+
+    async def get_employees_for_notify(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Совещание - получить список сотрудников для выборки в оповещение
+
+        GET /api/document/{documentId}/employees-for-notify
+        """
+        return await self._call(
+            self._op_get_employees_for_notify,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_identical_link = Operation('GET', 'api/document/{docId}/link/{docLinkId}/identical', response=lambda: m.DocumentVersionDto)
+
+    async def get_identical_link(
+        self,
+        doc_id: UUID,
+        doc_link_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentVersionDto:
+        """
+        Получить связные идентичные обращения
+
+        GET /api/document/{docId}/link/{docLinkId}/identical
+        """
+        return await self._call(
+            self._op_get_identical_link,
+            path={'docId': doc_id, 'docLinkId': doc_link_id},
+            service_token=service_token,
+        )
+
+    _op_get_nomenclature = Operation('GET', 'api/document/{docId}/nomenclature', response=lambda: m.DocumentNomenclatureDto)
+
+    async def get_nomenclature(
+        self,
+        doc_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentNomenclatureDto:
+        """
+        Получить список номенклатур дел в которые списан документ
+
+        GET /api/document/{docId}/nomenclature
+        """
+        return await self._call(
+            self._op_get_nomenclature,
+            path={'docId': doc_id},
+            service_token=service_token,
+        )
+
+    _op_get_nomenclature_affair = Operation('GET', 'api/document/{docId}/nomenclature/v2', response=lambda: m.DocumentNomenclatureDto)
+
+    async def get_nomenclature_affair(
+        self,
+        doc_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentNomenclatureDto:
+        """
+        Получить список номенклатур дел в которые списан документ
+
+        GET /api/document/{docId}/nomenclature/v2
+        """
+        return await self._call(
+            self._op_get_nomenclature_affair,
+            path={'docId': doc_id},
+            service_token=service_token,
+        )
+
+    _op_get_online = Operation('GET', 'api/document/{id}/online-user', response=lambda: m.DocumentDto)
+
+    async def get_online(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Получить документ по id
+
+        GET /api/document/{id}/online-user
+        """
+        return await self._call(
+            self._op_get_online,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_permissions = Operation('GET', 'api/document/{id}/permission', response=lambda: m.DocPermissionContainer)
+
+    async def get_permissions(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocPermissionContainer:
+        """
+        Получить права доступа для документа по id
+
+        GET /api/document/{id}/permission
+        """
+        return await self._call(
+            self._op_get_permissions,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_permissions_1 = Operation('GET', 'api/document/test-count', response=str)
+
+    async def get_permissions_1(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+
+        GET /api/document/test-count
+        """
+        return await self._call(
+            self._op_get_permissions_1,
+            service_token=service_token,
+        )
+
+    _op_get_pre_nomenclature = Operation('GET', 'api/document/{docId}/pre-nomenclature', response=lambda: m.DocumentPreNomenclatureDto)
+
+    async def get_pre_nomenclature(
+        self,
+        doc_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentPreNomenclatureDto:
+        """
+        Получить список предварительных номенклатур дел
+
+        GET /api/document/{docId}/pre-nomenclature
+        """
+        return await self._call(
+            self._op_get_pre_nomenclature,
+            path={'docId': doc_id},
+            service_token=service_token,
+        )
+
+    _op_get_process_activity = Operation('GET', 'api/document/{id}/bpmn', response=lambda: m.DocumentPropertiesDto)
+
+    async def get_process_activity(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentPropertiesDto:
+        """
+        Получить текущий процесс с активностями документа по id
+
+        GET /api/document/{id}/bpmn
+        """
+        return await self._call(
+            self._op_get_process_activity,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_properties = Operation('GET', 'api/document/{id}/properties', response=lambda: m.DocumentPropertiesDto)
+
+    async def get_properties(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentPropertiesDto:
+        """
+        Получить свойства документа по id
+
+        GET /api/document/{id}/properties
+        """
+        return await self._call(
+            self._op_get_properties,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_repeat_identical = Operation('GET', 'api/document/{documentId}/repeat-identical', response=lambda: m.DocumentVersionDto)
+
+    async def get_repeat_identical(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentVersionDto:
+        """
+        Получить повторные и идентичные обращения
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/repeat-identical
+        """
+        return await self._call(
+            self._op_get_repeat_identical,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_repeat_link = Operation('GET', 'api/document/{docId}/link/{docLinkId}/repeat', response=lambda: m.DocumentVersionDto)
+
+    async def get_repeat_link(
+        self,
+        doc_id: UUID,
+        doc_link_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentVersionDto:
+        """
+        Получить связные повторные обращения
+
+        GET /api/document/{docId}/link/{docLinkId}/repeat
+        """
+        return await self._call(
+            self._op_get_repeat_link,
+            path={'docId': doc_id, 'docLinkId': doc_link_id},
+            service_token=service_token,
+        )
+
+    _op_get_status = Operation('GET', 'api/document/status', response=lambda: m.DocumentDto)
+
+    async def get_status(
+        self,
+        *,
+        filter: m.DocumentFilter,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Получить статусы документов
+
+        GET /api/document/status
+        """
+        return await self._call(
+            self._op_get_status,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_tasks_with_projects = Operation('GET', 'api/document/{id}/task-task-project', response=lambda: m.NomenclatureAffairDto)
+
+    async def get_tasks_with_projects(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+        Получить список дел в которые добавлен документ и связи документов
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{id}/task-task-project
+        """
+        return await self._call(
+            self._op_get_tasks_with_projects,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_user_smdo_stat = Operation('GET', 'api/document/stat/user-smdo', response=lambda: m.ExecutionDocumentStatCount)
+
+    async def get_user_smdo_stat(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ExecutionDocumentStatCount:
+        """
+
+        GET /api/document/stat/user-smdo
+        """
+        return await self._call(
+            self._op_get_user_smdo_stat,
+            service_token=service_token,
+        )
+
+    _op_get_version_info = Operation('GET', 'api/document/{documentId}/contract-version-info', response=lambda: m.ContractVersionInfoDto)
+
+    async def get_version_info(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ContractVersionInfoDto:
+        """
+        Получить информацию о версии договора
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/contract-version-info
+        """
+        return await self._call(
+            self._op_get_version_info,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_view_documents = Operation('GET', 'api/document/view/{id}/entry', response=str)
+
+    async def get_view_documents(
+        self,
+        id: UUID,
+        *,
+        p: m.Pageable,
+        f: m.DocumentFilter,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+
+        GET /api/document/view/{id}/entry
+        """
+        return await self._call(
+            self._op_get_view_documents,
+            path={'id': id},
+            query={'p': p, 'f': f},
+            service_token=service_token,
+        )
+
+    _op_get_year = Operation('GET', 'api/document/year', response=lambda: m.DocumentDto)
+
+    async def get_year(
+        self,
+        *,
+        f: m.DocumentFilter,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Получить все документы
+
+        GET /api/document/year
+        """
+        return await self._call(
+            self._op_get_year,
+            query={'f': f},
+            service_token=service_token,
+        )
+
+    _op_in_archive = Operation('PUT', 'api/document/{documentId}/archive', response=lambda: m.DocumentDto, body=lambda: m.DocumentArchiveRequest)
+
+    async def in_archive(
+        self,
+        document_id: UUID,
+        *,
+        body: m.DocumentArchiveRequest,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Отправить документ в архив
+
+        Для доступа к этому API необходимо: [DOCUMENT_IN_ARCHIVE_UPDATE]
+
+        PUT /api/document/{documentId}/archive
+        """
+        return await self._call(
+            self._op_in_archive,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_new_version = Operation('POST', 'api/document/{documentId}/version', response=lambda: m.DocumentDto, body=lambda: m.DocumentBasedExistingBody)
+
+    async def new_version(
+        self,
+        document_id: UUID,
+        *,
+        body: m.DocumentBasedExistingBody,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Создать новую версию документа
+
+        POST /api/document/{documentId}/version
+        """
+        return await self._call(
+            self._op_new_version,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_next_process = Operation('POST', 'api/document/process/next', body=lambda: m.DocumentNextProcessRequest)
+
+    async def next_process(
+        self,
+        *,
+        body: m.DocumentNextProcessRequest,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Отправить документ на следующий процесс
+
+        POST /api/document/process/next
+        """
+        return await self._call(
+            self._op_next_process,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_notify_meeting = Operation('POST', 'api/document/{documentId}/notify-meeting', body=lambda: m.NotifyMeetingBody)
+
+    async def notify_meeting(
+        self,
+        document_id: UUID,
+        *,
+        body: m.NotifyMeetingBody,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Совещание - оповестить / Кнопка
+
+        Для доступа к этому API необходимо: [DOCUMENT_PREPARATION_NOTIFY]
+
+        POST /api/document/{documentId}/notify-meeting
+        """
+        return await self._call(
+            self._op_notify_meeting,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_notify_meeting_next = Operation('POST', 'api/document/{documentId}/notify-to-preparation', body=lambda: m.IdUUID)
+
+    async def notify_meeting_next(
+        self,
+        document_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Совещание - оповестить и перейти на следующий этап / Кнопка
+
+        Для доступа к этому API необходимо: [DOCUMENT_TO_PREPARATION]
+
+        POST /api/document/{documentId}/notify-to-preparation
+        """
+        return await self._call(
+            self._op_notify_meeting_next,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_notify_meeting_question = Operation('POST', 'api/document/{documentId}/notify-meeting-question')
+
+    async def notify_meeting_question(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Повестка заседания - оповещение / Кнопка
+
+        Для доступа к этому API необходимо: [DOCUMENT_NOTIFY_MEETING_QUESTION]
+
+        POST /api/document/{documentId}/notify-meeting-question
+        """
+        return await self._call(
+            self._op_notify_meeting_question,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/document', response=lambda: m.DocumentDto, body=lambda: m.IdUUID)
+
+    async def post(
+        self,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Создать новый документ
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_DOCUMENT
+
+        POST /api/document
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_redo_protocol = Operation('POST', 'api/document/{documentId}/redo-protocol', body=lambda: m.PaperworkProcessAction)
+
+    async def redo_protocol(
+        self,
+        document_id: UUID,
+        *,
+        body: m.PaperworkProcessAction,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Изменение протокола в совещании
+
+        Для доступа к этому API необходимо: [DOCUMENT_REDO_PROTOCOL]
+
+        POST /api/document/{documentId}/redo-protocol
+        """
+        return await self._call(
+            self._op_redo_protocol,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_remove_control = Operation('PUT', 'api/document/control', body=lambda: m.IdUUID)
+
+    async def remove_control(
+        self,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Снять с контроля документ
+
+        PUT /api/document/control
+        """
+        return await self._call(
+            self._op_remove_control,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_retry_aismv_ack_delivery = Operation('POST', 'api/document/{id}/aismv-ack-delivery/{deliveryId}/retry', response=lambda: m.DocumentRecipientDto)
+
+    async def retry_aismv_ack_delivery(
+        self,
+        id: UUID,
+        delivery_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentRecipientDto:
+        """
+        Получить историю отправки квитанций аисмв
+
+        Для доступа к этому API необходимо: [DOCUMENT_SMDO_RETRY_ACK_DELIVERY]
+
+        POST /api/document/{id}/aismv-ack-delivery/{deliveryId}/retry
+        """
+        return await self._call(
+            self._op_retry_aismv_ack_delivery,
+            path={'id': id, 'deliveryId': delivery_id},
+            service_token=service_token,
+        )
+
+    _op_smdo_recipient_add_documents = Operation('POST', 'api/document/{id}/recipient/{recipientId}/add-documents', response=lambda: m.DocumentRecipientDeliveryHistoryDto, body=lambda: m.IdsUUID)
+
+    async def smdo_recipient_add_documents(
+        self,
+        id: UUID,
+        recipient_id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentRecipientDeliveryHistoryDto:
+        """
+        Выполнить доссылку доп. материалов адресату
+
+        Для доступа к этому API необходимо: [DOCUMENT_ADD_DOCUMENTS]
+
+        POST /api/document/{id}/recipient/{recipientId}/add-documents
+        """
+        return await self._call(
+            self._op_smdo_recipient_add_documents,
+            path={'id': id, 'recipientId': recipient_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_start = Operation('POST', 'api/document/start', body=lambda: m.IdUUID)
+
+    async def start(
+        self,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Запустить маршрут документа
+
+        POST /api/document/start
+        """
+        return await self._call(
+            self._op_start,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_to_control = Operation('POST', 'api/document/{docId}/control', response=lambda: m.ControlDto, body=lambda: m.ControlRequest)
+
+    async def to_control(
+        self,
+        doc_id: UUID,
+        *,
+        body: m.ControlRequest,
+        service_token: Optional[str] = None,
+    ) -> m.ControlDto:
+        """
+        Отправить документ на контроль
+
+        POST /api/document/{docId}/control
+        """
+        return await self._call(
+            self._op_to_control,
+            path={'docId': doc_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update_color = Operation('PUT', 'api/document/{id}/color', response=lambda: m.DocumentUserColorDto, body=lambda: m.DocumentUserColorDto)
+
+    async def update_color(
+        self,
+        id: UUID,
+        *,
+        body: m.DocumentUserColorDto,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentUserColorDto:
+        """
+        Получить документ по id
+
+        PUT /api/document/{id}/color
+        """
+        return await self._call(
+            self._op_update_color,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update_color_1 = Operation('DELETE', 'api/document/color', response=lambda: m.DocumentDto, body=lambda: m.IdsUUID)
+
+    async def update_color_1(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Получить документ по id
+
+        DELETE /api/document/color
+        """
+        return await self._call(
+            self._op_update_color_1,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update_reg_number = Operation('PUT', 'api/document/{documentId}/reg-number', response=lambda: m.DocumentDto, body=lambda: m.ChangeRegNumberRequest)
+
+    async def update_reg_number(
+        self,
+        document_id: UUID,
+        *,
+        body: m.ChangeRegNumberRequest,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Изменить рег номер
+
+        Для доступа к этому API необходимо: [DOCUMENT_CHANGE_REGNUMBER]
+
+        PUT /api/document/{documentId}/reg-number
+        """
+        return await self._call(
+            self._op_update_reg_number,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_write_off2 = Operation('PUT', 'api/document/{documentId}/write-off', response=lambda: m.DocumentNomenclatureDto, body=lambda: m.IdsUUID)
+
+    async def write_off2(
+        self,
+        document_id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentNomenclatureDto:
+        """
+        Списание документа в список номенклатур дел
+
+        Для доступа к этому API необходимо: [DOCUMENT_WRITE_OFF_NOMENCLATURE_AFFAIR_UPDATE]
+
+        PUT /api/document/{documentId}/write-off
+        """
+        return await self._call(
+            self._op_write_off2,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+
+class DolzhnostiApi(ApiGroup):
+    """
+    Должности
+    API для работы с должностями
+    Константы для получения истории: POST
+    """
+
+    _op_delete_list = Operation('DELETE', 'api/post', body=lambda: m.IdsLong)
+
+    async def delete_list(
+        self,
+        *,
+        body: m.IdsLong,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список должностей
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_POST
+
+        DELETE /api/post
+        """
+        return await self._call(
+            self._op_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/post/{id}', response=lambda: m.PostDto)
+
+    async def get(
+        self,
+        id: int,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.PostDto:
+        """
+        Получить должность по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_POST
+
+        GET /api/post/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/post', response=lambda: m.PostDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.PostDto:
+        """
+        Получить список должностей
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_POST
+
+        GET /api/post
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/post', response=lambda: m.PostDto, body=lambda: m.PostRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.PostRequest,
+        service_token: Optional[str] = None,
+    ) -> m.PostDto:
+        """
+        Создать новую должность
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_POST
+
+        POST /api/post
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/post', response=lambda: m.PostDto, body=lambda: m.PostRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.PostRequest,
+        service_token: Optional[str] = None,
+    ) -> m.PostDto:
+        """
+        Изменить должность
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_POST
+
+        PUT /api/post
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class DopolnitelnoeSoglasovanieApi(ApiGroup):
+    """
+    Дополнительное согласование
+    API для работы с дополнительным согласованием документа
+    """
+
+    _op_create = Operation('POST', 'api/document/{documentId}/additional-agreement', response=lambda: m.AdditionalAgreementDto, body=lambda: m.IdsUUID)
+
+    async def create(
+        self,
+        document_id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.AdditionalAgreementDto:
+        """
+        Создание список дополнительного согласования
+
+        Для доступа к этому API необходимо: [DOCUMENT_ADDITIONAL_AGREEMENT_CREATE]
+
+        POST /api/document/{documentId}/additional-agreement
+        """
+        return await self._call(
+            self._op_create,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_list = Operation('DELETE', 'api/document/{documentId}/additional-agreement', body=lambda: m.IdsUUID)
+
+    async def delete_list(
+        self,
+        document_id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список дополнительного согласования
+
+        Для доступа к этому API необходимо: [DOCUMENT_ADDITIONAL_AGREEMENT_DELETE, DOCUMENT_ADDITIONAL_AGREEMENT_DELETE_ALL]
+
+        DELETE /api/document/{documentId}/additional-agreement
+        """
+        return await self._call(
+            self._op_delete_list,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/document/{documentId}/additional-agreement', response=lambda: m.AdditionalAgreementDto)
+
+    async def get(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AdditionalAgreementDto:
+        """
+        Получить список дополнительного согласования по документу
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/additional-agreement
+        """
+        return await self._call(
+            self._op_get,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_put_stamp = Operation('PUT', 'api/document/{documentId}/additional-agreement/stamp', response=lambda: m.AdditionalAgreementDto, body=lambda: m.AdditionalAgreementRequest)
+
+    async def put_stamp(
+        self,
+        document_id: UUID,
+        *,
+        body: m.AdditionalAgreementRequest,
+        service_token: Optional[str] = None,
+    ) -> m.AdditionalAgreementDto:
+        """
+        Проставить отметку согласование/отклонение
+
+        Для доступа к этому API необходимо: [DOCUMENT_ADDITIONAL_AGREEMENT_EXECUTE]
+
+        PUT /api/document/{documentId}/additional-agreement/stamp
+        """
+        return await self._call(
+            self._op_put_stamp,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_validate = Operation('GET', 'api/document/{documentId}/additional-agreement/user-agreement-validate', response=lambda: m.BoolResult)
+
+    async def validate(
+        self,
+        document_id: UUID,
+        *,
+        employee_id: UUID | None = None,
+        service_token: Optional[str] = None,
+    ) -> m.BoolResult:
+        """
+        Проверка, доп согласований которые инициировал пользователь
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/additional-agreement/user-agreement-validate
+        """
+        return await self._call(
+            self._op_validate,
+            path={'documentId': document_id},
+            query={'employeeId': employee_id},
+            service_token=service_token,
+        )
+
+
+class DopolnitelnyiDokumentDogovoraApi(ApiGroup):
+    """
+    Дополнительный документ договора
+    API для работы с дополнительными документами договора
+    """
+
+    _op_create = Operation('POST', 'api/document/{documentId}/additional-document', response=lambda: m.AdditionalDocumentDto, body=lambda: m.AdditionalDocumentRequest)
+
+    async def create(
+        self,
+        document_id: UUID,
+        *,
+        body: m.AdditionalDocumentRequest,
+        service_token: Optional[str] = None,
+    ) -> m.AdditionalDocumentDto:
+        """
+        Создать дополнительный документ договора
+
+        Для доступа к этому API необходимо: [DOCUMENT_ADDITIONAL_DOCUMENT_CREATE]
+
+        POST /api/document/{documentId}/additional-document
+        """
+        return await self._call(
+            self._op_create,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create_child = Operation('POST', 'api/document/{documentId}/additional-document/child', response=lambda: m.AdditionalDocumentDto, body=lambda: m.AdditionalDocumentRequest)
+
+    async def create_child(
+        self,
+        document_id: UUID,
+        *,
+        body: m.AdditionalDocumentRequest,
+        service_token: Optional[str] = None,
+    ) -> m.AdditionalDocumentDto:
+        """
+        Создать дочерний дополнительный документ договора
+
+        Для доступа к этому API необходимо: [DOCUMENT_ADDITIONAL_DOCUMENT_CREATE_CHILD]
+
+        POST /api/document/{documentId}/additional-document/child
+        """
+        return await self._call(
+            self._op_create_child,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/document/{documentId}/additional-document/{id}', response=lambda: m.AdditionalDocumentDto)
+
+    async def delete(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AdditionalDocumentDto:
+        """
+        Удалить дополнительный документ договора
+
+        Для доступа к этому API необходимо: [DOCUMENT_ADDITIONAL_DOCUMENT_DELETE]
+
+        DELETE /api/document/{documentId}/additional-document/{id}
+        """
+        return await self._call(
+            self._op_delete,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_download = Operation('GET', 'api/document/{documentId}/additional-document/{id}/attachment/{attachId}/download', binary=True)
+
+    def download(
+        self,
+        document_id: UUID,
+        id: UUID,
+        attach_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/additional-document/{id}/attachment/{attachId}/download
+        """
+        return self._stream(
+            self._op_download,
+            path={'documentId': document_id, 'id': id, 'attachId': attach_id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_download_zip = Operation('GET', 'api/document/{documentId}/additional-document/{id}/attachment/zip/download', binary=True)
+
+    def download_zip(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файлы в zip формате
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/additional-document/{id}/attachment/zip/download
+        """
+        return self._stream(
+            self._op_download_zip,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_download_zip_as_stream = Operation('GET', 'api/document/{documentId}/additional-document/{id}/attachment/zip/download-stream', binary=True)
+
+    def download_zip_as_stream(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файлы в zip формате (потоковая передача)
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/additional-document/{id}/attachment/zip/download-stream
+        """
+        return self._stream(
+            self._op_download_zip_as_stream,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_edit = Operation('PUT', 'api/document/{documentId}/additional-document/{id}', response=lambda: m.AdditionalDocumentDto, body=lambda: m.AdditionalDocumentRequest)
+
+    async def edit(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.AdditionalDocumentRequest,
+        service_token: Optional[str] = None,
+    ) -> m.AdditionalDocumentDto:
+        """
+        Изменить дополнительный документ договора
+
+        Для доступа к этому API необходимо: [DOCUMENT_ADDITIONAL_DOCUMENT_UPDATE]
+
+        PUT /api/document/{documentId}/additional-document/{id}
+        """
+        return await self._call(
+            self._op_edit,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/document/{documentId}/additional-document/{id}', response=lambda: m.AdditionalDocumentDto)
+
+    async def get(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        includes: list[str],
+        service_token: Optional[str] = None,
+    ) -> m.AdditionalDocumentDto:
+        """
+        Получить дополнительный документ договора
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/additional-document/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'documentId': document_id, 'id': id},
+            query={'includes': includes},
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/document/{documentId}/additional-document', response=lambda: m.AdditionalDocumentDto)
+
+    async def get_all(
+        self,
+        document_id: UUID,
+        *,
+        filter: m.AdditionalDocumentFilter,
+        service_token: Optional[str] = None,
+    ) -> m.AdditionalDocumentDto:
+        """
+        Получить список дополнительных документов договора
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/additional-document
+        """
+        return await self._call(
+            self._op_get_all,
+            path={'documentId': document_id},
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_attachments = Operation('GET', 'api/document/{documentId}/additional-document/{id}/attachment', response=lambda: m.AdditionalDocumentDto)
+
+    async def get_attachments(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AdditionalDocumentDto:
+        """
+        Получить вложения дополнительного документа договора
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/additional-document/{id}/attachment
+        """
+        return await self._call(
+            self._op_get_attachments,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_responsible = Operation('GET', 'api/document/{documentId}/additional-document/{id}/responsible', response=lambda: m.AdditionalDocumentDto)
+
+    async def get_responsible(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AdditionalDocumentDto:
+        """
+        Получить ответственных дополнительного документа договора
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/additional-document/{id}/responsible
+        """
+        return await self._call(
+            self._op_get_responsible,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_with_permission = Operation('GET', 'api/document/{documentId}/additional-document/{id}/all', response=lambda: m.AdditionalDocumentDto)
+
+    async def get_with_permission(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        includes: list[str],
+        service_token: Optional[str] = None,
+    ) -> m.AdditionalDocumentDto:
+        """
+        Получить дополнительный документ договора и пермишены
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/additional-document/{id}/all
+        """
+        return await self._call(
+            self._op_get_with_permission,
+            path={'documentId': document_id, 'id': id},
+            query={'includes': includes},
+            service_token=service_token,
+        )
+
+    _op_history = Operation('GET', 'api/document/{documentId}/additional-document/{id}/history', response=lambda: m.AdditionalDocumentDto)
+
+    async def history(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.AdditionalDocumentDto:
+        """
+        Получить вложения дополнительного документа договора
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/additional-document/{id}/history
+        """
+        return await self._call(
+            self._op_history,
+            path={'documentId': document_id, 'id': id},
+            query={'p': p},
+            service_token=service_token,
+        )
+
+
+class DostupKMiniDokumentamApi(ApiGroup):
+    """
+    Доступ к мини документам
+    API для работы с доступом к мини документам
+    Константы для получения истории: MINI_DOCUMENT_ACCESS
+    """
+
+    _op_create = Operation('POST', 'api/nomenclature-affair/{affairId}/mini-document/{docId}/access', response=lambda: m.MiniDocumentAccessDto, body=lambda: m.MiniDocumentAccessRequest)
+
+    async def create(
+        self,
+        affair_id: UUID,
+        doc_id: UUID,
+        *,
+        body: m.MiniDocumentAccessRequest,
+        service_token: Optional[str] = None,
+    ) -> m.MiniDocumentAccessDto:
+        """
+        Создать список доступов к мини документу
+
+        POST /api/nomenclature-affair/{affairId}/mini-document/{docId}/access
+        """
+        return await self._call(
+            self._op_create,
+            path={'affairId': affair_id, 'docId': doc_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/nomenclature-affair/{affairId}/mini-document/{docId}/access', response=lambda: m.MiniDocumentAccessDto, body=lambda: m.IdsUUID)
+
+    async def delete(
+        self,
+        affair_id: UUID,
+        doc_id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.MiniDocumentAccessDto:
+        """
+        Изменить дату доступа к мини документу
+
+        DELETE /api/nomenclature-affair/{affairId}/mini-document/{docId}/access
+        """
+        return await self._call(
+            self._op_delete,
+            path={'affairId': affair_id, 'docId': doc_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_edit_access_by = Operation('PUT', 'api/nomenclature-affair/{affairId}/mini-document/{docId}/access/{id}', response=lambda: m.MiniDocumentAccessDto, body=lambda: m.MiniDocumentAccessByRequest)
+
+    async def edit_access_by(
+        self,
+        affair_id: UUID,
+        doc_id: UUID,
+        id: UUID,
+        *,
+        body: m.MiniDocumentAccessByRequest,
+        service_token: Optional[str] = None,
+    ) -> m.MiniDocumentAccessDto:
+        """
+        Изменить дату доступа к мини документу
+
+        PUT /api/nomenclature-affair/{affairId}/mini-document/{docId}/access/{id}
+        """
+        return await self._call(
+            self._op_edit_access_by,
+            path={'affairId': affair_id, 'docId': doc_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/nomenclature-affair/{affairId}/mini-document/{docId}/access/{id}', response=lambda: m.MiniDocumentAccessDto)
+
+    async def get(
+        self,
+        affair_id: UUID,
+        doc_id: UUID,
+        id: UUID,
+        *,
+        filter: m.MiniDocumentAccessFilter,
+        service_token: Optional[str] = None,
+    ) -> m.MiniDocumentAccessDto:
+        """
+        Получить доступ к мини документу по ID
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_MINI_DOCUMENT_ACCESS
+
+        GET /api/nomenclature-affair/{affairId}/mini-document/{docId}/access/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'affairId': affair_id, 'docId': doc_id, 'id': id},
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/nomenclature-affair/{affairId}/mini-document/{docId}/access', response=lambda: m.MiniDocumentAccessDto)
+
+    async def get_all(
+        self,
+        affair_id: UUID,
+        doc_id: UUID,
+        *,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.MiniDocumentAccessDto:
+        """
+        Получить список доступов к мини документу
+
+        GET /api/nomenclature-affair/{affairId}/mini-document/{docId}/access
+        """
+        return await self._call(
+            self._op_get_all,
+            path={'affairId': affair_id, 'docId': doc_id},
+            query={'p': p},
+            service_token=service_token,
+        )
+
+
+class EksportKalendariaVFormateIcsApi(ApiGroup):
+    """
+    Экспорт календаря в формате .ics
+    API для работы с календарем рабочего времени
+    """
+
+    _op_download_calendar = Operation('GET', 'public-resources/download-calendar/{employeeId}', binary=True)
+
+    def download_calendar(
+        self,
+        employee_id: UUID,
+        *,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Получить календарь в формате .ics
+
+        GET /public-resources/download-calendar/{employeeId}
+        """
+        return self._stream(
+            self._op_download_calendar,
+            path={'employeeId': employee_id},
+            query={'start': start, 'end': end},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+
+class EmployeeAuthorizationAuditControllerApi(ApiGroup):
+    """
+    employee-authorization-audit-controller
+    """
+
+    _op_get_collection_by_id_and_year = Operation('GET', 'api/authorization-dates/{id}/{year}', response=lambda: list[m.EmployeeAuthorizationAuditDto])
+
+    async def get_collection_by_id_and_year(
+        self,
+        id: UUID,
+        year: int,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.EmployeeAuthorizationAuditDto]:
+        """
+
+        GET /api/authorization-dates/{id}/{year}
+        """
+        return await self._call(
+            self._op_get_collection_by_id_and_year,
+            path={'id': id, 'year': year},
+            service_token=service_token,
+        )
+
+
+class EntityHistoryControllerApi(ApiGroup):
+    """
+    entity-history-controller
+    """
+
+    _op_find_by_long_id = Operation('GET', 'api/entity-history/{type}/long-id/{id}', response=lambda: m.IntroductionDto)
+
+    async def find_by_long_id(
+        self,
+        id: int,
+        type: str,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.IntroductionDto:
+        """
+        Получить историю изменений
+
+        GET /api/entity-history/{type}/long-id/{id}
+        """
+        return await self._call(
+            self._op_find_by_long_id,
+            path={'id': id, 'type': type},
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_find_by_string_id = Operation('GET', 'api/entity-history/{type}/string-id/{id}', response=lambda: m.IntroductionDto)
+
+    async def find_by_string_id(
+        self,
+        id: str,
+        type: str,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.IntroductionDto:
+        """
+        Получить историю изменений
+
+        GET /api/entity-history/{type}/string-id/{id}
+        """
+        return await self._call(
+            self._op_find_by_string_id,
+            path={'id': id, 'type': type},
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_find_by_uuid_id = Operation('GET', 'api/entity-history/{type}/uuid-id/{id}', response=lambda: m.IntroductionDto)
+
+    async def find_by_uuid_id(
+        self,
+        id: UUID,
+        type: str,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.IntroductionDto:
+        """
+        Получить историю изменений
+
+        GET /api/entity-history/{type}/uuid-id/{id}
+        """
+        return await self._call(
+            self._op_find_by_uuid_id,
+            path={'id': id, 'type': type},
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+
+class ErrorHistoryControllerApi(ApiGroup):
+    """
+    error-history-controller
+    """
+
+    _op_find_by_id = Operation('GET', 'api/error-history/{id}', response=lambda: m.ErrorHistoryDto)
+
+    async def find_by_id(
+        self,
+        id: int,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ErrorHistoryDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ERROR_HISTORY
+
+        GET /api/error-history/{id}
+        """
+        return await self._call(
+            self._op_find_by_id,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/error-history', response=lambda: m.SliceDtoErrorHistoryDto)
+
+    async def get_all(
+        self,
+        *,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoErrorHistoryDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ERROR_HISTORY
+
+        GET /api/error-history
+        """
+        return await self._call(
+            self._op_get_all,
+            query={'p': p},
+            service_token=service_token,
+        )
+
+
+class FormyDokumentovApi(ApiGroup):
+    """
+    Формы документов
+    API для работы с формами документов
+    """
+
+    _op_delete_list = Operation('DELETE', 'api/document-form', body=lambda: m.IdsUUID)
+
+    async def delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить формы документов по ids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_DOCUMENT_FORM
+
+        DELETE /api/document-form
+        """
+        return await self._call(
+            self._op_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/document-form/{id}', response=lambda: m.DocumentFormDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFormDto:
+        """
+        Получить форму документа по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DOCUMENT_FORM
+
+        GET /api/document-form/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/document-form', response=lambda: m.SliceDtoDocumentFormDto)
+
+    async def get_collection(
+        self,
+        *,
+        filter: m.DocumentFormFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoDocumentFormDto:
+        """
+        Получить список форм документов
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DOCUMENT_FORM
+
+        GET /api/document-form
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/document-form', response=lambda: m.DocumentFormDto, body=lambda: m.DocumentFormDto)
+
+    async def post(
+        self,
+        *,
+        body: m.DocumentFormDto,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFormDto:
+        """
+        Создать новую форму документа
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_DOCUMENT_FORM
+
+        POST /api/document-form
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/document-form/{id}', response=lambda: m.DocumentFormDto, body=lambda: m.DocumentFormDto)
+
+    async def put(
+        self,
+        id: UUID,
+        *,
+        body: m.DocumentFormDto,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFormDto:
+        """
+        Изменить форму документа
+
+        PUT /api/document-form/{id}
+        """
+        return await self._call(
+            self._op_put,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+
+class GorodaApi(ApiGroup):
+    """
+    Города
+    API для работы с городами
+    Константы для получения истории: CITY
+    """
+
+    _op_find_all_by_district_id = Operation('GET', 'api/city/{districtId}/district', response=lambda: m.CityDto)
+
+    async def find_all_by_district_id(
+        self,
+        district_id: UUID,
+        *,
+        list_attribute: bool,
+        filter: m.CityFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.CityDto:
+        """
+        Получить все города по id района через Slice либо List
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CITY
+
+        GET /api/city/{districtId}/district
+        """
+        return await self._call(
+            self._op_find_all_by_district_id,
+            path={'districtId': district_id},
+            query={'listAttribute': list_attribute, 'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_fts_name = Operation('GET', 'api/city/fts-name', response=lambda: m.CityDto)
+
+    async def fts_name(
+        self,
+        *,
+        fts: str,
+        service_token: Optional[str] = None,
+    ) -> m.CityDto:
+        """
+        Полнотекстовый поиск города по названию
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CITY
+
+        GET /api/city/fts-name
+        """
+        return await self._call(
+            self._op_fts_name,
+            query={'fts': fts},
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/city/{id}', response=lambda: m.CityDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        filter: m.CityFilter,
+        service_token: Optional[str] = None,
+    ) -> m.CityDto:
+        """
+        Получить город по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CITY
+
+        GET /api/city/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/city', response=lambda: m.CityDto)
+
+    async def get_collection(
+        self,
+        *,
+        list_attribute: bool,
+        filter: m.CityFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.CityDto:
+        """
+        Получить список городов через Slice либо List
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CITY
+
+        GET /api/city
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'listAttribute': list_attribute, 'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_collection_by_region_id = Operation('GET', 'api/city/{regionId}/region', response=lambda: m.CityDto)
+
+    async def get_collection_by_region_id(
+        self,
+        region_id: UUID,
+        *,
+        filter: m.CityFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.CityDto:
+        """
+        Получить список городов по id области
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CITY
+
+        GET /api/city/{regionId}/region
+        """
+        return await self._call(
+            self._op_get_collection_by_region_id,
+            path={'regionId': region_id},
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_mark_delete_list = Operation('DELETE', 'api/city', body=lambda: m.IdsUUID)
+
+    async def mark_delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку об удалении для списка городов по ids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_CITY
+
+        DELETE /api/city
+        """
+        return await self._call(
+            self._op_mark_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/city', response=lambda: m.CityDto, body=lambda: m.CityDto)
+
+    async def post(
+        self,
+        *,
+        body: m.CityDto,
+        service_token: Optional[str] = None,
+    ) -> m.CityDto:
+        """
+        Создать новый город
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_CITY
+
+        POST /api/city
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/city', response=lambda: m.CityDto, body=lambda: m.CityDto)
+
+    async def put(
+        self,
+        *,
+        body: m.CityDto,
+        service_token: Optional[str] = None,
+    ) -> m.CityDto:
+        """
+        Изменить город
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_CITY
+
+        PUT /api/city
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class GrifyDostupaApi(ApiGroup):
+    """
+    Грифы доступа
+    API для работы с грифами доступа
+    Константы для получения истории: ACCESS_GRIEF
+    """
+
+    _op_get = Operation('GET', 'api/access-grief/{id}', response=lambda: m.AccessGriefDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AccessGriefDto:
+        """
+        Получить гриф доступа по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ACCESS_GRIEF
+
+        GET /api/access-grief/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/access-grief', response=dict[str, Any])
+
+    async def get_collection(
+        self,
+        *,
+        filter: m.AccessGriefFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Получить список грифов доступа через Slice либо List
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ACCESS_GRIEF
+
+        GET /api/access-grief
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_employees = Operation('GET', 'api/access-grief/{id}/employees', response=lambda: m.SliceDtoEmployeeAccessGriefDto)
+
+    async def get_employees(
+        self,
+        id: UUID,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoEmployeeAccessGriefDto:
+        """
+        Получить список сотрудников связанных с грифом доступа
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ACCESS_GRIEF
+
+        GET /api/access-grief/{id}/employees
+        """
+        return await self._call(
+            self._op_get_employees,
+            path={'id': id},
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_mark_delete = Operation('DELETE', 'api/access-grief/{id}')
+
+    async def mark_delete(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить гриф доступа
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_ACCESS_GRIEF
+
+        DELETE /api/access-grief/{id}
+        """
+        return await self._call(
+            self._op_mark_delete,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_mark_delete_list = Operation('DELETE', 'api/access-grief', body=lambda: m.IdsUUID)
+
+    async def mark_delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список грифов доступа
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_ACCESS_GRIEF
+
+        DELETE /api/access-grief
+        """
+        return await self._call(
+            self._op_mark_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/access-grief', response=lambda: m.AccessGriefDto, body=lambda: m.AccessGriefRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.AccessGriefRequest,
+        service_token: Optional[str] = None,
+    ) -> m.AccessGriefDto:
+        """
+        Создать новый гриф доступа
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_ACCESS_GRIEF
+
+        POST /api/access-grief
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/access-grief/{id}', response=lambda: m.AccessGriefDto, body=lambda: m.AccessGriefRequest)
+
+    async def put(
+        self,
+        id: UUID,
+        *,
+        body: m.AccessGriefRequest,
+        service_token: Optional[str] = None,
+    ) -> m.AccessGriefDto:
+        """
+        Изменить гриф доступа
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_ACCESS_GRIEF
+
+        PUT /api/access-grief/{id}
+        """
+        return await self._call(
+            self._op_put,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+
+class GruppyAdresatovKorrespondentovApi(ApiGroup):
+    """
+    Группы адресатов/корреспондентов
+    API для работы с группами адресатов и корреспондентов
+    Константы для получения истории: CORRESPONDENT, CORRESPONDENT_GROUP
+    """
+
+    _op_delete_group = Operation('DELETE', 'api/correspondent-group', body=lambda: m.IdsUUID)
+
+    async def delete_group(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список групп адресатов/корреспондентов
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_CORRESPONDENT_GROUP
+
+        DELETE /api/correspondent-group
+        """
+        return await self._call(
+            self._op_delete_group,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_link = Operation('DELETE', 'api/correspondent-group/link', body=lambda: m.IntermediateCorrespondentRequest)
+
+    async def delete_link(
+        self,
+        *,
+        body: m.IntermediateCorrespondentRequest,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список связей групп адресатов/корреспондентов с адресатами/корреспондентами
+
+        DELETE /api/correspondent-group/link
+        """
+        return await self._call(
+            self._op_delete_link,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/correspondent-group/{id}', response=lambda: m.CorrespondentGroupDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.CorrespondentGroupDto:
+        """
+        Получить группу адресата/корреспондента по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CORRESPONDENT_GROUP
+
+        GET /api/correspondent-group/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_all_by_group_id = Operation('GET', 'api/correspondent-group/group/{groupId}', response=lambda: m.CorrespondentDto)
+
+    async def get_all_by_group_id(
+        self,
+        group_id: UUID,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.CorrespondentDto:
+        """
+        Получить список адресатов/корреспондентов по id группы
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CORRESPONDENT
+
+        GET /api/correspondent-group/group/{groupId}
+        """
+        return await self._call(
+            self._op_get_all_by_group_id,
+            path={'groupId': group_id},
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_all_in_group = Operation('GET', 'api/correspondent-group/{groupId}/all', response=lambda: list[m.CorrespondentDto])
+
+    async def get_all_in_group(
+        self,
+        group_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.CorrespondentDto]:
+        """
+        Получить список всех адресатов в группе
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CORRESPONDENT
+
+        GET /api/correspondent-group/{groupId}/all
+        """
+        return await self._call(
+            self._op_get_all_in_group,
+            path={'groupId': group_id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/correspondent-group', response=lambda: m.CorrespondentGroupDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.CorrespondentGroupDto:
+        """
+        Получить список групп адресатов/корреспондентов
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CORRESPONDENT_GROUP
+
+        GET /api/correspondent-group
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/correspondent-group', response=lambda: m.CorrespondentGroupDto, body=lambda: m.CorrespondentGroupRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.CorrespondentGroupRequest,
+        service_token: Optional[str] = None,
+    ) -> m.CorrespondentGroupDto:
+        """
+        Создать новую группу адресата/корреспондента
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_CORRESPONDENT_GROUP
+
+        POST /api/correspondent-group
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post_v2 = Operation('POST', 'api/correspondent-group/v2', response=lambda: m.CorrespondentGroupDto, body=lambda: m.CorrespondentGroupAddRequest)
+
+    async def post_v2(
+        self,
+        *,
+        body: m.CorrespondentGroupAddRequest,
+        service_token: Optional[str] = None,
+    ) -> m.CorrespondentGroupDto:
+        """
+        Создать новую группу адресата/корреспондента
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_CORRESPONDENT_GROUP
+
+        POST /api/correspondent-group/v2
+        """
+        return await self._call(
+            self._op_post_v2,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/correspondent-group', response=lambda: m.CorrespondentGroupDto, body=lambda: m.CorrespondentGroupRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.CorrespondentGroupRequest,
+        service_token: Optional[str] = None,
+    ) -> m.CorrespondentGroupDto:
+        """
+        Изменить группу адресата/корреспондента
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_CORRESPONDENT_GROUP
+
+        PUT /api/correspondent-group
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put_v2 = Operation('PUT', 'api/correspondent-group/v2', response=lambda: m.CorrespondentGroupDto, body=lambda: m.CorrespondentGroupUpdateRequest)
+
+    async def put_v2(
+        self,
+        *,
+        body: m.CorrespondentGroupUpdateRequest,
+        service_token: Optional[str] = None,
+    ) -> m.CorrespondentGroupDto:
+        """
+        Изменить группу адресата/корреспондента
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_CORRESPONDENT_GROUP
+
+        PUT /api/correspondent-group/v2
+        """
+        return await self._call(
+            self._op_put_v2,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_save = Operation('POST', 'api/correspondent-group/link', response=lambda: m.CorrespondentGroupDto, body=lambda: m.IntermediateCorrespondentRequest)
+
+    async def save(
+        self,
+        *,
+        body: m.IntermediateCorrespondentRequest,
+        service_token: Optional[str] = None,
+    ) -> m.CorrespondentGroupDto:
+        """
+        Создать новую связь групп адресатов/корреспондентов с адресатами/корреспондентами
+
+        POST /api/correspondent-group/link
+        """
+        return await self._call(
+            self._op_save,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class GruppyPolzovateleiApi(ApiGroup):
+    """
+    Группы пользователей
+    Константы для получения истории: GROUP, ROLE_GROUP, GROUP_EMPLOYEE, EMPLOYEE
+    """
+
+    _op_add_employee = Operation('POST', 'api/group/{groupId}/employee', response=lambda: m.DocumentFolderDto, body=lambda: m.IdUUID)
+
+    async def add_employee(
+        self,
+        group_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFolderDto:
+        """
+        Добавить сотрудника в группу
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_GROUP
+
+        POST /api/group/{groupId}/employee
+        """
+        return await self._call(
+            self._op_add_employee,
+            path={'groupId': group_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_add_employees = Operation('POST', 'api/group/{groupId}/employee/batch', response=lambda: m.DocumentFolderDto, body=lambda: m.IdsUUID)
+
+    async def add_employees(
+        self,
+        group_id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFolderDto:
+        """
+        Добавить сотрудника в группу
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_GROUP
+
+        POST /api/group/{groupId}/employee/batch
+        """
+        return await self._call(
+            self._op_add_employees,
+            path={'groupId': group_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_add_role = Operation('POST', 'api/group/{groupId}/role', response=lambda: m.DocumentFolderDto, body=lambda: m.IdUUID)
+
+    async def add_role(
+        self,
+        group_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFolderDto:
+        """
+        Добавить роль в группу
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_GROUP
+
+        POST /api/group/{groupId}/role
+        """
+        return await self._call(
+            self._op_add_role,
+            path={'groupId': group_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_add_roles = Operation('POST', 'api/group/{groupId}/role/batch', response=lambda: m.DocumentFolderDto, body=lambda: m.IdsUUID)
+
+    async def add_roles(
+        self,
+        group_id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFolderDto:
+        """
+        Добавить роли
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_GROUP
+
+        POST /api/group/{groupId}/role/batch
+        """
+        return await self._call(
+            self._op_add_roles,
+            path={'groupId': group_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_by_id = Operation('DELETE', 'api/group', response=lambda: m.GroupDto, body=lambda: m.IdUUID)
+
+    async def delete_by_id(
+        self,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.GroupDto:
+        """
+        Удалить группу
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_GROUP
+
+        DELETE /api/group
+        """
+        return await self._call(
+            self._op_delete_by_id,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_by_ids = Operation('DELETE', 'api/group/batch', response=lambda: m.GroupDto, body=lambda: m.IdsUUID)
+
+    async def delete_by_ids(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.GroupDto:
+        """
+        Удалить группу
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_GROUP
+
+        DELETE /api/group/batch
+        """
+        return await self._call(
+            self._op_delete_by_ids,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_employee = Operation('DELETE', 'api/group/{groupId}/employee', response=lambda: m.DocumentFolderDto, body=lambda: m.IdLong)
+
+    async def delete_employee(
+        self,
+        group_id: UUID,
+        *,
+        body: m.IdLong,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFolderDto:
+        """
+        Удалить сотрудника из группы
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_GROUP
+
+        DELETE /api/group/{groupId}/employee
+        """
+        return await self._call(
+            self._op_delete_employee,
+            path={'groupId': group_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_edit = Operation('PUT', 'api/group', response=lambda: m.GroupDto, body=lambda: m.GroupDto)
+
+    async def edit(
+        self,
+        *,
+        body: m.GroupDto,
+        service_token: Optional[str] = None,
+    ) -> m.GroupDto:
+        """
+        Создать новую группу
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_GROUP
+
+        PUT /api/group
+        """
+        return await self._call(
+            self._op_edit,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_edit_v2 = Operation('PUT', 'api/group/v2', response=lambda: m.GroupDto, body=lambda: m.GroupUpdateRequest)
+
+    async def edit_v2(
+        self,
+        *,
+        body: m.GroupUpdateRequest,
+        service_token: Optional[str] = None,
+    ) -> m.GroupDto:
+        """
+        Изменить группу
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_GROUP
+
+        PUT /api/group/v2
+        """
+        return await self._call(
+            self._op_edit_v2,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_all_2 = Operation('GET', 'api/group', response=lambda: m.GroupDto)
+
+    async def get_all_2(
+        self,
+        *,
+        p: m.Pageable,
+        request: m.GroupFilter,
+        service_token: Optional[str] = None,
+    ) -> m.GroupDto:
+        """
+        Получить все группы
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_GROUP
+
+        GET /api/group
+        """
+        return await self._call(
+            self._op_get_all_2,
+            query={'p': p, 'request': request},
+            service_token=service_token,
+        )
+
+    _op_get_all_22 = Operation('GET', 'api/group/{groupId}', response=lambda: m.GroupDto)
+
+    async def get_all_22(
+        self,
+        group_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.GroupDto:
+        """
+        Получить группу
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_GROUP
+
+        GET /api/group/{groupId}
+        """
+        return await self._call(
+            self._op_get_all_22,
+            path={'groupId': group_id},
+            service_token=service_token,
+        )
+
+    _op_get_all_employee_1 = Operation('GET', 'api/group/{groupId}/employee', response=lambda: m.GroupEmployeeDto)
+
+    async def get_all_employee_1(
+        self,
+        group_id: UUID,
+        *,
+        filter: m.GroupEmployeeFilter,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.GroupEmployeeDto:
+        """
+        Получить сотрудников в группе
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_GROUP
+
+        GET /api/group/{groupId}/employee
+        """
+        return await self._call(
+            self._op_get_all_employee_1,
+            path={'groupId': group_id},
+            query={'filter': filter, 'p': p},
+            service_token=service_token,
+        )
+
+    _op_get_all_employee_2 = Operation('GET', 'api/group/{groupId}/employee/all', response=lambda: list[m.GroupEmployeeDto])
+
+    async def get_all_employee_2(
+        self,
+        group_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.GroupEmployeeDto]:
+        """
+        Получить всех участников группы
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_GROUP
+
+        GET /api/group/{groupId}/employee/all
+        """
+        return await self._call(
+            self._op_get_all_employee_2,
+            path={'groupId': group_id},
+            service_token=service_token,
+        )
+
+    _op_get_all_employee_3 = Operation('GET', 'api/group/employee/all', response=lambda: list[m.GroupEmployeeDto])
+
+    async def get_all_employee_3(
+        self,
+        *,
+        ids: m.ListUuid,
+        filter: m.GroupEmployeeFilter,
+        service_token: Optional[str] = None,
+    ) -> list[m.GroupEmployeeDto]:
+        """
+        Получить всех участников групп
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_GROUP
+
+        GET /api/group/employee/all
+        """
+        return await self._call(
+            self._op_get_all_employee_3,
+            query={'ids': ids, 'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_all_roles = Operation('GET', 'api/group/{groupId}/role', response=lambda: m.GroupRoleDto)
+
+    async def get_all_roles(
+        self,
+        group_id: UUID,
+        *,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.GroupRoleDto:
+        """
+        Получить роли в группе
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_GROUP
+
+        GET /api/group/{groupId}/role
+        """
+        return await self._call(
+            self._op_get_all_roles,
+            path={'groupId': group_id},
+            query={'p': p},
+            service_token=service_token,
+        )
+
+    _op_get_employee_exclude = Operation('GET', 'api/group/{groupId}/employee-exclude', response=lambda: m.EmployeeDto)
+
+    async def get_employee_exclude(
+        self,
+        group_id: UUID,
+        *,
+        p: m.Pageable,
+        filter: m.EmployeeFilter,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeDto:
+        """
+        Получить сотрудников за исключением существующих
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ROLE
+
+        GET /api/group/{groupId}/employee-exclude
+        """
+        return await self._call(
+            self._op_get_employee_exclude,
+            path={'groupId': group_id},
+            query={'p': p, 'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_remove_employees = Operation('DELETE', 'api/group/{groupId}/employee/batch', response=lambda: m.DocumentFolderDto, body=lambda: m.IdsLong)
+
+    async def remove_employees(
+        self,
+        group_id: UUID,
+        *,
+        body: m.IdsLong,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFolderDto:
+        """
+        Удалить сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_GROUP
+
+        DELETE /api/group/{groupId}/employee/batch
+        """
+        return await self._call(
+            self._op_remove_employees,
+            path={'groupId': group_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_remove_role = Operation('DELETE', 'api/group/{groupId}/role/', response=lambda: m.DocumentFolderDto, body=lambda: m.IdUUID)
+
+    async def remove_role(
+        self,
+        group_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFolderDto:
+        """
+        Удалить роль
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_GROUP
+
+        DELETE /api/group/{groupId}/role/
+        """
+        return await self._call(
+            self._op_remove_role,
+            path={'groupId': group_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_remove_roles = Operation('DELETE', 'api/group/{groupId}/role/batch', response=lambda: m.DocumentFolderDto, body=lambda: m.IdsUUID)
+
+    async def remove_roles(
+        self,
+        group_id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFolderDto:
+        """
+        Удалить роли
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_GROUP
+
+        DELETE /api/group/{groupId}/role/batch
+        """
+        return await self._call(
+            self._op_remove_roles,
+            path={'groupId': group_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_save = Operation('POST', 'api/group', response=lambda: m.GroupDto, body=lambda: m.GroupDto)
+
+    async def save(
+        self,
+        *,
+        body: m.GroupDto,
+        service_token: Optional[str] = None,
+    ) -> m.GroupDto:
+        """
+        Создать новую группу
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_GROUP
+
+        POST /api/group
+        """
+        return await self._call(
+            self._op_save,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_save_v2 = Operation('POST', 'api/group/v2', response=lambda: m.GroupDto, body=lambda: m.GroupAddRequest)
+
+    async def save_v2(
+        self,
+        *,
+        body: m.GroupAddRequest,
+        service_token: Optional[str] = None,
+    ) -> m.GroupDto:
+        """
+        Создать новую группу
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_GROUP
+
+        POST /api/group/v2
+        """
+        return await self._call(
+            self._op_save_v2,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_search_fts_top_by_name = Operation('GET', 'api/group/fts-name', response=lambda: m.GroupDto)
+
+    async def search_fts_top_by_name(
+        self,
+        *,
+        fts: str,
+        service_token: Optional[str] = None,
+    ) -> m.GroupDto:
+        """
+        Полнотекстовый поиск группы по названию
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_GROUP
+
+        GET /api/group/fts-name
+        """
+        return await self._call(
+            self._op_search_fts_top_by_name,
+            query={'fts': fts},
+            service_token=service_token,
+        )
+
+
+class IazykiDokumentovApi(ApiGroup):
+    """
+    Языки документов
+    API для работы с языками документов
+    Константы для получения истории: DOCUMENT_LANGUAGE
+    """
+
+    _op_delete_list = Operation('DELETE', 'api/document-language', body=lambda: m.IdsUUID)
+
+    async def delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список языков документов
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_DOCUMENT_LANGUAGE
+
+        DELETE /api/document-language
+        """
+        return await self._call(
+            self._op_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/document-language/{id}', response=lambda: m.DocumentLanguageDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentLanguageDto:
+        """
+        Получить язык документа по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DOCUMENT_LANGUAGE
+
+        GET /api/document-language/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/document-language', response=lambda: m.DocumentLanguageDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentLanguageDto:
+        """
+        Получить список языков документов
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DOCUMENT_LANGUAGE
+
+        GET /api/document-language
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/document-language', response=lambda: m.DocumentLanguageDto, body=lambda: m.DocumentLanguageRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.DocumentLanguageRequest,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentLanguageDto:
+        """
+        Создать новый язык документа
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_DOCUMENT_LANGUAGE
+
+        POST /api/document-language
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/document-language', response=lambda: m.DocumentLanguageDto, body=lambda: m.DocumentLanguageRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.DocumentLanguageRequest,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentLanguageDto:
+        """
+        Изменить язык документа
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_DOCUMENT_LANGUAGE
+
+        PUT /api/document-language
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class ImportEksportApi(ApiGroup):
+    """
+    Импорт/Экспорт
+    API для работы с импортом и экспортом
+    """
+
+    _op_export_countries = Operation('GET', 'api/impex/export-countries', binary=True)
+
+    def export_countries(
+        self,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Экспорт стран в файл json
+
+        GET /api/impex/export-countries
+        """
+        return self._stream(
+            self._op_export_countries,
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_export_regions = Operation('GET', 'api/impex/export-regions', binary=True)
+
+    def export_regions(
+        self,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Экспорт регионов в файл json
+
+        GET /api/impex/export-regions
+        """
+        return self._stream(
+            self._op_export_regions,
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_import_countries = Operation('GET', 'api/impex/import-countries', binary=True)
+
+    def import_countries(
+        self,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Импорт стран
+
+        GET /api/impex/import-countries
+        """
+        return self._stream(
+            self._op_import_countries,
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_import_regions = Operation('GET', 'api/impex/import-regions', binary=True)
+
+    def import_regions(
+        self,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Импорт стран
+
+        GET /api/impex/import-regions
+        """
+        return self._stream(
+            self._op_import_regions,
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+
+class InfoControllerApi(ApiGroup):
+    """
+    info-controller
+    """
+
+    _op_get = Operation('GET', 'info', response=lambda: m.ServerInfo)
+
+    async def get(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ServerInfo:
+        """
+
+        GET /info
+        """
+        return await self._call(
+            self._op_get,
+            service_token=service_token,
+        )
+
+
+class InformatsionnyePaneliDeistviiPolzovateliaApi(ApiGroup):
+    """
+    Информационные панели действий пользователя
+    API для работы с информационными панелями действий пользователя
+    """
+
+    _op_get_data_panels = Operation('GET', 'api/user-action-panel', response=lambda: m.UserActionPanelCountResponse)
+
+    async def get_data_panels(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.UserActionPanelCountResponse:
+        """
+        Получить информационные панели действий пользователя
+
+        GET /api/user-action-panel
+        """
+        return await self._call(
+            self._op_get_data_panels,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/user-action-panel', response=lambda: m.UserActionPanelCountResponse, body=lambda: m.UserActionPanelRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.UserActionPanelRequest,
+        service_token: Optional[str] = None,
+    ) -> m.UserActionPanelCountResponse:
+        """
+        Изменить настройки информационных панелей действий пользователя
+
+        PUT /api/user-action-panel
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class InnerInventoryDataControllerApi(ApiGroup):
+    """
+    inner-inventory-data-controller
+    Константы для получения истории: NOMENCLATURE_AFFAIR
+    """
+
+    _op_conversion = Operation('POST', 'api/nomenclature-affair/{affairId}/inner-inventory', response=lambda: m.NomenclatureAffairDto, body=lambda: m.IdUUID)
+
+    async def conversion(
+        self,
+        affair_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+
+        POST /api/nomenclature-affair/{affairId}/inner-inventory
+        """
+        return await self._call(
+            self._op_conversion,
+            path={'affairId': affair_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_deconversion = Operation('DELETE', 'api/nomenclature-affair/{affairId}/inner-inventory', response=lambda: m.NomenclatureAffairDto, body=lambda: m.IdUUID)
+
+    async def deconversion(
+        self,
+        affair_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+
+        DELETE /api/nomenclature-affair/{affairId}/inner-inventory
+        """
+        return await self._call(
+            self._op_deconversion,
+            path={'affairId': affair_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/nomenclature-affair/{affairId}/inner-inventory/{id}', response=lambda: m.InnerInventoryDataDto)
+
+    async def get(
+        self,
+        id: UUID,
+        affair_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.InnerInventoryDataDto:
+        """
+
+        GET /api/nomenclature-affair/{affairId}/inner-inventory/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id, 'affairId': affair_id},
+            service_token=service_token,
+        )
+
+    _op_get_inner_base64 = Operation('GET', 'api/nomenclature-affair/{affairId}/inner-inventory/{id}/base64', binary=True)
+
+    def get_inner_base64(
+        self,
+        id: UUID,
+        affair_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+
+        GET /api/nomenclature-affair/{affairId}/inner-inventory/{id}/base64
+        """
+        return self._stream(
+            self._op_get_inner_base64,
+            path={'id': id, 'affairId': affair_id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_save_inner_bytes = Operation('PUT', 'api/nomenclature-affair/{affairId}/inner-inventory/{id}/sign', response=dict[str, Any], body=lambda: m.SimpleCmsDTO)
+
+    async def save_inner_bytes(
+        self,
+        id: UUID,
+        affair_id: UUID,
+        *,
+        body: m.SimpleCmsDTO,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+
+        PUT /api/nomenclature-affair/{affairId}/inner-inventory/{id}/sign
+        """
+        return await self._call(
+            self._op_save_inner_bytes,
+            path={'id': id, 'affairId': affair_id},
+            body=body,
+            service_token=service_token,
+        )
+
+
+class IntegrationConfigControllerApi(ApiGroup):
+    """
+    integration-config-controller
+    """
+
+    _op_get = Operation('GET', 'api/nces-archive/config', response=lambda: m.IntegrationConfigDto)
+
+    async def get(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.IntegrationConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_INTEGRATION_CONFIG
+
+        GET /api/nces-archive/config
+        """
+        return await self._call(
+            self._op_get,
+            service_token=service_token,
+        )
+
+    _op_save_or_edit = Operation('POST', 'api/nces-archive/config', response=lambda: m.IntegrationConfigDto, body=lambda: m.IntegrationConfigRequest)
+
+    async def save_or_edit(
+        self,
+        *,
+        body: m.IntegrationConfigRequest,
+        service_token: Optional[str] = None,
+    ) -> m.IntegrationConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_INTEGRATION_CONFIG
+
+        POST /api/nces-archive/config
+        """
+        return await self._call(
+            self._op_save_or_edit,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_test_connect = Operation('GET', 'api/nces-archive/config/test', response=dict[str, Any])
+
+    async def test_connect(
+        self,
+        *,
+        request: m.IntegrationConfigRequest,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_INTEGRATION_CONFIG
+
+        GET /api/nces-archive/config/test
+        """
+        return await self._call(
+            self._op_test_connect,
+            query={'request': request},
+            service_token=service_token,
+        )
+
+
+class KalendarRabochikhDneiApi(ApiGroup):
+    """
+    Календарь рабочих дней
+    API для работы с календарем рабочего времени
+    Константы для получения истории: WORK_CALENDAR
+    """
+
+    _op_day_round_down = Operation('GET', 'api/calendar/day-round-down', response=datetime)
+
+    async def day_round_down(
+        self,
+        *,
+        days_execution: int,
+        date: datetime | None = None,
+        service_token: Optional[str] = None,
+    ) -> datetime:
+        """
+        Получить дату исполнения с округлением до ближайшего рабочего дня
+
+        GET /api/calendar/day-round-down
+        """
+        return await self._call(
+            self._op_day_round_down,
+            query={'daysExecution': days_execution, 'date': date},
+            service_token=service_token,
+        )
+
+    _op_day_round_up = Operation('GET', 'api/calendar/day-round-up', response=datetime)
+
+    async def day_round_up(
+        self,
+        *,
+        days_execution: int,
+        date: datetime | None = None,
+        service_token: Optional[str] = None,
+    ) -> datetime:
+        """
+        Получить дату исполнения с округлением до следующего рабочего дня
+
+        GET /api/calendar/day-round-up
+        """
+        return await self._call(
+            self._op_day_round_up,
+            query={'daysExecution': days_execution, 'date': date},
+            service_token=service_token,
+        )
+
+    _op_delete_list = Operation('DELETE', 'api/calendar', body=lambda: m.IdsUUID)
+
+    async def delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить календарь
+
+        DELETE /api/calendar
+        """
+        return await self._call(
+            self._op_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_edit = Operation('PUT', 'api/calendar', response=lambda: m.WorkCalendarDto, body=lambda: m.WorkCalendarRequest)
+
+    async def edit(
+        self,
+        *,
+        body: m.WorkCalendarRequest,
+        service_token: Optional[str] = None,
+    ) -> m.WorkCalendarDto:
+        """
+        Изменить календарь
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_WORK_CALENDAR
+
+        PUT /api/calendar
+        """
+        return await self._call(
+            self._op_edit,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_execution_day_by_general_setup = Operation('GET', 'api/calendar/execution-day-general-setup', response=datetime)
+
+    async def execution_day_by_general_setup(
+        self,
+        *,
+        days_execution: int,
+        date: datetime | None = None,
+        service_token: Optional[str] = None,
+    ) -> datetime:
+        """
+        Получить дату исполнения поручений, с округлением согласной настройках организации
+
+        GET /api/calendar/execution-day-general-setup
+        """
+        return await self._call(
+            self._op_execution_day_by_general_setup,
+            query={'daysExecution': days_execution, 'date': date},
+            service_token=service_token,
+        )
+
+    _op_generate_weekends = Operation('GET', 'api/calendar/weekends', response=lambda: m.WorkCalendarDto)
+
+    async def generate_weekends(
+        self,
+        *,
+        year: int,
+        service_token: Optional[str] = None,
+    ) -> m.WorkCalendarDto:
+        """
+        Получить всех выходные и праздничные дни по году
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_WORK_CALENDAR
+
+        GET /api/calendar/weekends
+        """
+        return await self._call(
+            self._op_generate_weekends,
+            query={'year': year},
+            service_token=service_token,
+        )
+
+    _op_get_81 = Operation('GET', 'api/calendar/{id}', response=lambda: m.WorkCalendarDto)
+
+    async def get_81(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.WorkCalendarDto:
+        """
+        Получить календарь по id
+
+        GET /api/calendar/{id}
+        """
+        return await self._call(
+            self._op_get_81,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_82 = Operation('GET', 'api/calendar/year/{year}', response=lambda: m.WorkCalendarDto)
+
+    async def get_82(
+        self,
+        year: int,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.WorkCalendarDto:
+        """
+        Получить календарь по году
+
+        GET /api/calendar/year/{year}
+        """
+        return await self._call(
+            self._op_get_82,
+            path={'year': year},
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/calendar', response=lambda: m.SliceDtoWorkCalendarDto)
+
+    async def get_all(
+        self,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoWorkCalendarDto:
+        """
+        Получить список всех годов
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_WORK_CALENDAR
+
+        GET /api/calendar
+        """
+        return await self._call(
+            self._op_get_all,
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_save = Operation('POST', 'api/calendar', response=lambda: m.WorkCalendarDto, body=lambda: m.WorkCalendarRequest)
+
+    async def save(
+        self,
+        *,
+        body: m.WorkCalendarRequest,
+        service_token: Optional[str] = None,
+    ) -> m.WorkCalendarDto:
+        """
+        Создать календарь
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_WORK_CALENDAR
+
+        POST /api/calendar
+        """
+        return await self._call(
+            self._op_save,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class KolichestvoDannykhApi(ApiGroup):
+    """
+    Количество данных
+    API для получения количества данных
+    """
+
+    _op_all = Operation('GET', 'api/count')
+
+    async def all(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Получить кол-во
+
+        GET /api/count
+        """
+        return await self._call(
+            self._op_all,
+            service_token=service_token,
+        )
+
+    _op_doc_count_additional_agreement = Operation('GET', 'api/count/document/additional-agreement')
+
+    async def doc_count_additional_agreement(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Получить кол-во документов 'Доп. согласование' для видов
+
+        GET /api/count/document/additional-agreement
+        """
+        return await self._call(
+            self._op_doc_count_additional_agreement,
+            service_token=service_token,
+        )
+
+    _op_doc_count_control = Operation('GET', 'api/count/document/control')
+
+    async def doc_count_control(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Получить кол-во документов 'На контроле' для видов
+
+        GET /api/count/document/control
+        """
+        return await self._call(
+            self._op_doc_count_control,
+            service_token=service_token,
+        )
+
+    _op_doc_count_for_sending_to_rout = Operation('GET', 'api/count/document/for-sending-to-rout')
+
+    async def doc_count_for_sending_to_rout(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Получить кол-во документов 'Для отправки на этап' для видов
+
+        GET /api/count/document/for-sending-to-rout
+        """
+        return await self._call(
+            self._op_doc_count_for_sending_to_rout,
+            service_token=service_token,
+        )
+
+    _op_doc_count_in_work = Operation('GET', 'api/count/document/in-work')
+
+    async def doc_count_in_work(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Получить кол-во документов 'В работе' для видов
+
+        GET /api/count/document/in-work
+        """
+        return await self._call(
+            self._op_doc_count_in_work,
+            service_token=service_token,
+        )
+
+    _op_doc_count_introduction = Operation('GET', 'api/count/document/introduction')
+
+    async def doc_count_introduction(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Получить кол-во документов 'Ознакомление' для видов
+
+        GET /api/count/document/introduction
+        """
+        return await self._call(
+            self._op_doc_count_introduction,
+            service_token=service_token,
+        )
+
+    _op_document = Operation('GET', 'api/count/document')
+
+    async def document(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Получить кол-во документов для видов
+
+        GET /api/count/document
+        """
+        return await self._call(
+            self._op_document,
+            service_token=service_token,
+        )
+
+    _op_task = Operation('GET', 'api/count/task')
+
+    async def task(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Получить кол-во поручений для видов
+
+        GET /api/count/task
+        """
+        return await self._call(
+            self._op_task,
+            service_token=service_token,
+        )
+
+    _op_task_expires_count = Operation('GET', 'api/count/task/expires')
+
+    async def task_expires_count(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Получить кол-во поручений у которых истекает срок для видов
+
+        GET /api/count/task/expires
+        """
+        return await self._call(
+            self._op_task_expires_count,
+            service_token=service_token,
+        )
+
+    _op_task_on_control_count = Operation('GET', 'api/count/task/on-control')
+
+    async def task_on_control_count(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Получить кол-во просроченных поручений для видов
+
+        GET /api/count/task/on-control
+        """
+        return await self._call(
+            self._op_task_on_control_count,
+            service_token=service_token,
+        )
+
+    _op_task_on_execution_count = Operation('GET', 'api/count/task/on-execution')
+
+    async def task_on_execution_count(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Получить кол-во поручений на исполнении для видов
+
+        GET /api/count/task/on-execution
+        """
+        return await self._call(
+            self._op_task_on_execution_count,
+            service_token=service_token,
+        )
+
+    _op_task_overdue_count = Operation('GET', 'api/count/task/overdue')
+
+    async def task_overdue_count(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Получить кол-во просроченных поручений для видов
+
+        GET /api/count/task/overdue
+        """
+        return await self._call(
+            self._op_task_overdue_count,
+            service_token=service_token,
+        )
+
+
+class KommentariiKDokumentuApi(ApiGroup):
+    """
+    Комментарии к документу
+    API для работы с комментариями к документу
+    """
+
+    _op_get_collection = Operation('GET', 'api/document-comment/{documentId}', response=lambda: m.SimpleDocumentCommentDto)
+
+    async def get_collection(
+        self,
+        document_id: UUID,
+        *,
+        filter: m.DocumentCommentFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SimpleDocumentCommentDto:
+        """
+        Получить все комментарии
+
+        Разрешенные поля для сортировки: id, dateTime
+
+        GET /api/document-comment/{documentId}
+        """
+        return await self._call(
+            self._op_get_collection,
+            path={'documentId': document_id},
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_mark_delete = Operation('DELETE', 'api/document-comment/{id}', response=lambda: m.SimpleDocumentCommentDto)
+
+    async def mark_delete(
+        self,
+        id: int,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.SimpleDocumentCommentDto:
+        """
+        Проставить отметку об удалении комментария
+
+        DELETE /api/document-comment/{id}
+        """
+        return await self._call(
+            self._op_mark_delete,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/document-comment', response=lambda: m.SimpleDocumentCommentDto, body=lambda: m.DocumentCommentRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.DocumentCommentRequest,
+        service_token: Optional[str] = None,
+    ) -> m.SimpleDocumentCommentDto:
+        """
+        Создать новый комментарий
+
+        POST /api/document-comment
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/document-comment', response=lambda: m.SimpleDocumentCommentDto, body=lambda: m.DocumentCommentRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.DocumentCommentRequest,
+        service_token: Optional[str] = None,
+    ) -> m.SimpleDocumentCommentDto:
+        """
+        Изменить комментарий
+
+        PUT /api/document-comment
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class KontaktnyeLitsaDliaKorrespondentovApi(ApiGroup):
+    """
+    Контактные лица для корреспондентов
+    API для работы с контактными лицами
+    Константы для получения истории: CONTACT_FACE
+    """
+
+    _op_delete = Operation('DELETE', 'api/contact-face', body=lambda: m.IdsUUID)
+
+    async def delete(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+
+        DELETE /api/contact-face
+        """
+        return await self._call(
+            self._op_delete,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/contact-face/{id}', response=lambda: m.ContactFaceDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ContactFaceDto:
+        """
+
+        GET /api/contact-face/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_by_correspondent = Operation('GET', 'api/contact-face/correspondent/{id}', response=lambda: list[m.ContactFaceDto])
+
+    async def get_by_correspondent(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.ContactFaceDto]:
+        """
+
+        GET /api/contact-face/correspondent/{id}
+        """
+        return await self._call(
+            self._op_get_by_correspondent,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/contact-face', response=lambda: m.ContactFaceDto, body=lambda: m.ContactFaceRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.ContactFaceRequest,
+        service_token: Optional[str] = None,
+    ) -> m.ContactFaceDto:
+        """
+
+        POST /api/contact-face
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/contact-face', response=lambda: m.ContactFaceDto, body=lambda: m.ContactFaceRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.ContactFaceRequest,
+        service_token: Optional[str] = None,
+    ) -> m.ContactFaceDto:
+        """
+
+        PUT /api/contact-face
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class KontrolnyeTochkiIspolneniiaDogovoraApi(ApiGroup):
+    """
+    Контрольные точки исполнения договора
+    API для работы с контрольными точками исполнения договора
+    Константы для получения истории: CONTROL_POINT, CONTROL_POINT_RESPONSIBLE, CONTROL_POINT_LINK, CONTROL_POINT_ATTACHMENT
+    """
+
+    _op_complete = Operation('PUT', 'api/document/{documentId}/control-point/{id}/complete', response=lambda: m.ContractControlPointDto)
+
+    async def complete(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ContractControlPointDto:
+        """
+        Поставить контрольную точку исполнения договора как выполненную
+
+        PUT /api/document/{documentId}/control-point/{id}/complete
+        """
+        return await self._call(
+            self._op_complete,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/document/{documentId}/control-point/{id}')
+
+    async def delete(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить контрольную точку исполнения договора по id
+
+        DELETE /api/document/{documentId}/control-point/{id}
+        """
+        return await self._call(
+            self._op_delete,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_file = Operation('DELETE', 'api/document/{documentId}/control-point/{pointId}/attachment/{attachId}', binary=True)
+
+    async def delete_file(
+        self,
+        document_id: UUID,
+        point_id: UUID,
+        attach_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> bytes:
+        """
+        Удалить файл
+
+        DELETE /api/document/{documentId}/control-point/{pointId}/attachment/{attachId}
+        """
+        return await self._call(
+            self._op_delete_file,
+            path={'documentId': document_id, 'pointId': point_id, 'attachId': attach_id},
+            service_token=service_token,
+        )
+
+    _op_download = Operation('GET', 'api/document/{documentId}/control-point/attachment/{attachId}/download', binary=True)
+
+    def download(
+        self,
+        document_id: UUID,
+        attach_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/control-point/attachment/{attachId}/download
+        """
+        return self._stream(
+            self._op_download,
+            path={'documentId': document_id, 'attachId': attach_id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_execute = Operation('POST', 'api/document/{documentId}/control-point/{id}', response=lambda: m.ContractControlPointDto, body=lambda: list[m.DocOperation])
+
+    async def execute(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: list[m.DocOperation],
+        service_token: Optional[str] = None,
+    ) -> m.ContractControlPointDto:
+        """
+        Изменить контрольную точку исполнения договора
+
+        POST /api/document/{documentId}/control-point/{id}
+        """
+        return await self._call(
+            self._op_execute,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/document/{documentId}/control-point/{id}', response=lambda: m.ContractControlPointDto)
+
+    async def get(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ContractControlPointDto:
+        """
+        Получить контрольные точки исполнения договора по id
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/control-point/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_attachments = Operation('GET', 'api/document/{documentId}/control-point/{id}/attachment', response=lambda: m.ContractControlPointAttachmentDto)
+
+    async def get_attachments(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ContractControlPointAttachmentDto:
+        """
+        Получить вложения контрольной точки исполнения договора
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/control-point/{id}/attachment
+        """
+        return await self._call(
+            self._op_get_attachments,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/document/{documentId}/control-point', response=lambda: m.ContractControlPointDto)
+
+    async def get_collection(
+        self,
+        document_id: UUID,
+        *,
+        filter: m.ContractControlPointFilter,
+        service_token: Optional[str] = None,
+    ) -> m.ContractControlPointDto:
+        """
+        Получить список контрольных точек исполнения договора
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/control-point
+        """
+        return await self._call(
+            self._op_get_collection,
+            path={'documentId': document_id},
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_document_link = Operation('GET', 'api/document/{documentId}/control-point/{id}/link', response=lambda: m.ContractControlPointLinkDto)
+
+    async def get_document_link(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ContractControlPointLinkDto:
+        """
+        Получить ссылки на документы контрольной точки исполнения договора
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/control-point/{id}/link
+        """
+        return await self._call(
+            self._op_get_document_link,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_responsible = Operation('GET', 'api/document/{documentId}/control-point/{id}/responsible', response=lambda: m.ContractControlPointResponsibleDto)
+
+    async def get_responsible(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ContractControlPointResponsibleDto:
+        """
+        Получить ответственных контрольной точки исполнения договора
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/control-point/{id}/responsible
+        """
+        return await self._call(
+            self._op_get_responsible,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_with_permission = Operation('GET', 'api/document/{documentId}/control-point/{id}/all', response=lambda: m.ContractControlPointDto)
+
+    async def get_with_permission(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ContractControlPointDto:
+        """
+        Получить контрольные точки исполнения договора по id
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/control-point/{id}/all
+        """
+        return await self._call(
+            self._op_get_with_permission,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_move = Operation('PUT', 'api/document/{documentId}/control-point/move/{moveId}/{targetId}', response=lambda: m.ContractControlPointDto)
+
+    async def move(
+        self,
+        document_id: UUID,
+        move_id: UUID,
+        target_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ContractControlPointDto:
+        """
+        Переместить контрольную точку исполнения договора
+
+        Для доступа к этому API необходимо: [DOCUMENT_CONTROL_POINT_MOVE]
+
+        PUT /api/document/{documentId}/control-point/move/{moveId}/{targetId}
+        """
+        return await self._call(
+            self._op_move,
+            path={'documentId': document_id, 'moveId': move_id, 'targetId': target_id},
+            service_token=service_token,
+        )
+
+    _op_permission = Operation('GET', 'api/document/{documentId}/control-point/{id}/permission', response=lambda: m.ContractControlPointDto)
+
+    async def permission(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ContractControlPointDto:
+        """
+        Получить пермишены контрольной точки исполнения договора по id
+
+        GET /api/document/{documentId}/control-point/{id}/permission
+        """
+        return await self._call(
+            self._op_permission,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/document/{documentId}/control-point', response=lambda: m.ContractControlPointDto, body=lambda: m.ControlPointMainFields)
+
+    async def post(
+        self,
+        document_id: UUID,
+        *,
+        body: m.ControlPointMainFields,
+        service_token: Optional[str] = None,
+    ) -> m.ContractControlPointDto:
+        """
+        Создать новую контрольную точку исполнения договора
+
+        Для доступа к этому API необходимо: [DOCUMENT_CONTROL_POINT_CREATE]
+
+        POST /api/document/{documentId}/control-point
+        """
+        return await self._call(
+            self._op_post,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_revision = Operation('PUT', 'api/document/{documentId}/control-point/{id}/revision', response=lambda: m.ContractControlPointDto, body=lambda: m.ControlPointRevisionRequest)
+
+    async def revision(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.ControlPointRevisionRequest,
+        service_token: Optional[str] = None,
+    ) -> m.ContractControlPointDto:
+        """
+        Поставить контрольную точку исполнения договора как не выполненную
+
+        PUT /api/document/{documentId}/control-point/{id}/revision
+        """
+        return await self._call(
+            self._op_revision,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+
+class KonturySedApi(ApiGroup):
+    """
+    Контуры СЭД
+    """
+
+    _op_get_all = Operation('GET', 'api/sed-org', response=lambda: list[m.SedOrgDto])
+
+    async def get_all(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.SedOrgDto]:
+        """
+
+        GET /api/sed-org
+        """
+        return await self._call(
+            self._op_get_all,
+            service_token=service_token,
+        )
+
+
+class LichnyePapkiV2Api(ApiGroup):
+    """
+    Личные папки V2
+    API для работы с личными папками
+    Константы для получения истории: FOLDER
+    """
+
+    _op_create = Operation('POST', 'api/v2/folder', response=lambda: m.FolderDto, body=lambda: m.FolderRequest)
+
+    async def create(
+        self,
+        *,
+        body: m.FolderRequest,
+        service_token: Optional[str] = None,
+    ) -> m.FolderDto:
+        """
+        Создать папку
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_FOLDER
+
+        POST /api/v2/folder
+        """
+        return await self._call(
+            self._op_create,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/v2/folder', body=lambda: m.FolderRequest)
+
+    async def delete(
+        self,
+        *,
+        body: m.FolderRequest,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить документы и папки из папки
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_FOLDER
+
+        DELETE /api/v2/folder
+        """
+        return await self._call(
+            self._op_delete,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_document_search = Operation('GET', 'api/v2/folder/document', response=lambda: m.FolderDto)
+
+    async def document_search(
+        self,
+        *,
+        filter: m.FolderFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.FolderDto:
+        """
+        Получить документы по id родителя с фильтрацией для текущего пользователя
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_FOLDER
+
+        GET /api/v2/folder/document
+        """
+        return await self._call(
+            self._op_document_search,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_edit = Operation('PUT', 'api/v2/folder', response=lambda: m.FolderDto, body=lambda: m.FolderRequest)
+
+    async def edit(
+        self,
+        *,
+        body: m.FolderRequest,
+        service_token: Optional[str] = None,
+    ) -> m.FolderDto:
+        """
+        Изменить папку
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_FOLDER
+
+        PUT /api/v2/folder
+        """
+        return await self._call(
+            self._op_edit,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/v2/folder/{id}', response=lambda: m.FolderDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.FolderDto:
+        """
+        Получить папку по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_FOLDER
+
+        GET /api/v2/folder/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/v2/folder/all', response=lambda: m.FolderDto)
+
+    async def get_all(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.FolderDto:
+        """
+        Получить все папки для текущего пользователя
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_FOLDER
+
+        GET /api/v2/folder/all
+        """
+        return await self._call(
+            self._op_get_all,
+            service_token=service_token,
+        )
+
+    _op_get_folders = Operation('GET', 'api/v2/folder', response=lambda: m.FolderDto)
+
+    async def get_folders(
+        self,
+        *,
+        filter: m.FolderFilter,
+        service_token: Optional[str] = None,
+    ) -> m.FolderDto:
+        """
+        Получить корневые или по id родителя папки с фильтрацией для текущего пользователя
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_FOLDER
+
+        GET /api/v2/folder
+        """
+        return await self._call(
+            self._op_get_folders,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_move = Operation('PUT', 'api/v2/folder/move', response=lambda: m.FolderDto, body=lambda: m.FolderRequest)
+
+    async def move(
+        self,
+        *,
+        body: m.FolderRequest,
+        service_token: Optional[str] = None,
+    ) -> m.FolderDto:
+        """
+        Перемещение папок и документов в одну определенную папку
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_FOLDER
+
+        PUT /api/v2/folder/move
+        """
+        return await self._call(
+            self._op_move,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_move_document_in_folders = Operation('PUT', 'api/v2/folder/document/move', response=lambda: m.FolderDto, body=lambda: m.FolderRequest)
+
+    async def move_document_in_folders(
+        self,
+        *,
+        body: m.FolderRequest,
+        service_token: Optional[str] = None,
+    ) -> m.FolderDto:
+        """
+        Перемещение одного документа в массив папок
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_FOLDER
+
+        PUT /api/v2/folder/document/move
+        """
+        return await self._call(
+            self._op_move_document_in_folders,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_move_documents_in_folders = Operation('PUT', 'api/v2/folder/documents/move', response=lambda: m.FolderDto, body=lambda: m.FolderRequest)
+
+    async def move_documents_in_folders(
+        self,
+        *,
+        body: m.FolderRequest,
+        service_token: Optional[str] = None,
+    ) -> m.FolderDto:
+        """
+        Перемещение массива документов в массив папок
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_FOLDER
+
+        PUT /api/v2/folder/documents/move
+        """
+        return await self._call(
+            self._op_move_documents_in_folders,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_move_folder_in_root = Operation('PUT', 'api/v2/folder/in-root', response=lambda: m.FolderDto, body=lambda: m.FolderRequest)
+
+    async def move_folder_in_root(
+        self,
+        *,
+        body: m.FolderRequest,
+        service_token: Optional[str] = None,
+    ) -> m.FolderDto:
+        """
+        Перемещение папки в корень
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_FOLDER
+
+        PUT /api/v2/folder/in-root
+        """
+        return await self._call(
+            self._op_move_folder_in_root,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class LichnyiKalendarPolzovateliaApi(ApiGroup):
+    """
+    Личный календарь пользователя
+    Константы для получения истории: SUBJECT
+    """
+
+    _op_delete = Operation('DELETE', 'api/user-calendar', response=lambda: m.SubjectDto, body=lambda: m.IdsUUID)
+
+    async def delete(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.SubjectDto:
+        """
+        Удалить событие
+
+        DELETE /api/user-calendar
+        """
+        return await self._call(
+            self._op_delete,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_edit = Operation('PUT', 'api/user-calendar', response=lambda: m.SubjectDto, body=lambda: m.CalendarEventRequest)
+
+    async def edit(
+        self,
+        *,
+        body: m.CalendarEventRequest,
+        service_token: Optional[str] = None,
+    ) -> m.SubjectDto:
+        """
+        Изменить событие
+
+        PUT /api/user-calendar
+        """
+        return await self._call(
+            self._op_edit,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/user-calendar/{id}', response=lambda: m.CalendarEventDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.CalendarEventDto:
+        """
+        Получить событие по id
+
+        GET /api/user-calendar/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/user-calendar', response=lambda: list[m.CalendarEventDto])
+
+    async def get_all(
+        self,
+        *,
+        filter: m.CalendarEventFilter,
+        service_token: Optional[str] = None,
+    ) -> list[m.CalendarEventDto]:
+        """
+        Пользовательские события за период
+
+        GET /api/user-calendar
+        """
+        return await self._call(
+            self._op_get_all,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_all_15 = Operation('GET', 'api/user-calendar/document', response=lambda: list[m.TermDocumentUserCalendarEntry])
+
+    async def get_all_15(
+        self,
+        *,
+        start: datetime,
+        end: datetime,
+        service_token: Optional[str] = None,
+    ) -> list[m.TermDocumentUserCalendarEntry]:
+        """
+        Документы на исполнении за периуд
+
+        GET /api/user-calendar/document
+        """
+        return await self._call(
+            self._op_get_all_15,
+            query={'start': start, 'end': end},
+            service_token=service_token,
+        )
+
+    _op_get_all_control_tasks = Operation('GET', 'api/user-calendar/task/control', response=lambda: list[m.TaskControlUserCalendarEntry])
+
+    async def get_all_control_tasks(
+        self,
+        *,
+        start: datetime,
+        end: datetime,
+        service_token: Optional[str] = None,
+    ) -> list[m.TaskControlUserCalendarEntry]:
+        """
+        Поручения на контроле за период
+
+        GET /api/user-calendar/task/control
+        """
+        return await self._call(
+            self._op_get_all_control_tasks,
+            query={'start': start, 'end': end},
+            service_token=service_token,
+        )
+
+    _op_get_all_events = Operation('GET', 'api/user-calendar/all', response=lambda: m.UserCalendarEntry)
+
+    async def get_all_events(
+        self,
+        *,
+        start: datetime,
+        end: datetime,
+        service_token: Optional[str] = None,
+    ) -> m.UserCalendarEntry:
+        """
+        Все события за период
+
+        GET /api/user-calendar/all
+        """
+        return await self._call(
+            self._op_get_all_events,
+            query={'start': start, 'end': end},
+            service_token=service_token,
+        )
+
+    _op_get_all_tasks = Operation('GET', 'api/user-calendar/task', response=lambda: list[m.TaskUserCalendarEntry])
+
+    async def get_all_tasks(
+        self,
+        *,
+        start: datetime,
+        end: datetime,
+        service_token: Optional[str] = None,
+    ) -> list[m.TaskUserCalendarEntry]:
+        """
+        Поручения на исполнении за период
+
+        GET /api/user-calendar/task
+        """
+        return await self._call(
+            self._op_get_all_tasks,
+            query={'start': start, 'end': end},
+            service_token=service_token,
+        )
+
+    _op_get_all_termless = Operation('GET', 'api/user-calendar/document-termless', response=lambda: list[m.DocumentUserCalendarEntry])
+
+    async def get_all_termless(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.DocumentUserCalendarEntry]:
+        """
+        Документы без срока исполнения
+
+        GET /api/user-calendar/document-termless
+        """
+        return await self._call(
+            self._op_get_all_termless,
+            service_token=service_token,
+        )
+
+    _op_get_all_user_additional_agreements = Operation('GET', 'api/user-calendar/document/control', response=lambda: list[m.DocumentControlUserCalendarEntry])
+
+    async def get_all_user_additional_agreements(
+        self,
+        *,
+        start: datetime,
+        end: datetime,
+        service_token: Optional[str] = None,
+    ) -> list[m.DocumentControlUserCalendarEntry]:
+        """
+        Документы на контроле
+
+        GET /api/user-calendar/document/control
+        """
+        return await self._call(
+            self._op_get_all_user_additional_agreements,
+            query={'start': start, 'end': end},
+            service_token=service_token,
+        )
+
+    _op_get_all_user_additional_agreements_1 = Operation('GET', 'api/user-calendar/document/additional-agreement', response=lambda: list[m.AdditionalAgreementUserCalendarEntry])
+
+    async def get_all_user_additional_agreements_1(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.AdditionalAgreementUserCalendarEntry]:
+        """
+        Документы на доп согласовании
+
+        GET /api/user-calendar/document/additional-agreement
+        """
+        return await self._call(
+            self._op_get_all_user_additional_agreements_1,
+            service_token=service_token,
+        )
+
+    _op_get_export_url = Operation('GET', 'api/user-calendar/ical-export', response=str)
+
+    async def get_export_url(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Получить ссылку для экспорта
+
+        GET /api/user-calendar/ical-export
+        """
+        return await self._call(
+            self._op_get_export_url,
+            service_token=service_token,
+        )
+
+    _op_get_invited = Operation('GET', 'api/user-calendar/document/invited', response=lambda: list[m.DocumentInvitedConfirmCalendar])
+
+    async def get_invited(
+        self,
+        *,
+        start: datetime,
+        end: datetime,
+        service_token: Optional[str] = None,
+    ) -> list[m.DocumentInvitedConfirmCalendar]:
+        """
+        Документы совещания для подтверждения
+
+        GET /api/user-calendar/document/invited
+        """
+        return await self._call(
+            self._op_get_invited,
+            query={'start': start, 'end': end},
+            service_token=service_token,
+        )
+
+    _op_save = Operation('POST', 'api/user-calendar', response=lambda: m.SubjectDto, body=lambda: m.CalendarEventRequest)
+
+    async def save(
+        self,
+        *,
+        body: m.CalendarEventRequest,
+        service_token: Optional[str] = None,
+    ) -> m.SubjectDto:
+        """
+        Создать событие
+
+        POST /api/user-calendar
+        """
+        return await self._call(
+            self._op_save,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class LogirovanieSobytiiApi(ApiGroup):
+    """
+    Логирование событий
+    API для работы с логирование событий
+    """
+
+    _op_export_to_excel = Operation('GET', 'api/user-action/export')
+
+    async def export_to_excel(
+        self,
+        *,
+        filter: m.UserActionFilter,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Экспорт логирований событий
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ALL_ORGANIZATION_USER_ACTION
+
+        GET /api/user-action/export
+        """
+        return await self._call(
+            self._op_export_to_excel,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_find_all_by_current_employee_id = Operation('GET', 'api/user-action/current', response=lambda: m.UserActionDto)
+
+    async def find_all_by_current_employee_id(
+        self,
+        *,
+        filter: m.UserActionFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.UserActionDto:
+        """
+        Получить все логирования событий текущего пользователя
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ALL_ORGANIZATION_USER_ACTION
+
+        GET /api/user-action/current
+        """
+        return await self._call(
+            self._op_find_all_by_current_employee_id,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_find_all_by_employee_id = Operation('GET', 'api/user-action/employee/{employeeId}', response=lambda: m.UserActionDto)
+
+    async def find_all_by_employee_id(
+        self,
+        employee_id: UUID,
+        *,
+        filter: m.UserActionFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.UserActionDto:
+        """
+        Получить все логирования событий по id пользователя
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ALL_ORGANIZATION_USER_ACTION
+
+        GET /api/user-action/employee/{employeeId}
+        """
+        return await self._call(
+            self._op_find_all_by_employee_id,
+            path={'employeeId': employee_id},
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/user-action/{id}', response=lambda: m.UserActionDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.UserActionDto:
+        """
+        Получить логирование события по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ALL_ORGANIZATION_USER_ACTION
+
+        GET /api/user-action/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/user-action', response=lambda: m.UserActionDto)
+
+    async def get_collection(
+        self,
+        *,
+        filter: m.UserActionFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.UserActionDto:
+        """
+        Получить все логирования событий текущего пользователя
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ALL_ORGANIZATION_USER_ACTION
+
+        GET /api/user-action
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_dashboard = Operation('GET', 'api/user-action/interval', response=lambda: m.UserActionDashboard)
+
+    async def get_dashboard(
+        self,
+        *,
+        filter: m.UserActionFilter,
+        service_token: Optional[str] = None,
+    ) -> m.UserActionDashboard:
+        """
+        Получить данные логирования событий для графика
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ALL_ORGANIZATION_USER_ACTION
+
+        GET /api/user-action/interval
+        """
+        return await self._call(
+            self._op_get_dashboard,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+
+class MigratsiiaApi(ApiGroup):
+    """
+    Миграция
+    API для работы с миграцией
+    Константы для получения истории: CORRESPONDENT, NOMENCLATURE_AFFAIR
+    """
+
+    _op_change_status = Operation('GET', 'api/migration/change-status', response=lambda: m.NomenclatureAffairDto)
+
+    async def change_status(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+        Изменить статус номенклатуры дел по типу создания
+
+        GET /api/migration/change-status
+        """
+        return await self._call(
+            self._op_change_status,
+            service_token=service_token,
+        )
+
+    _op_dp = Operation('GET', 'api/migration/dp', response=Any)
+
+    async def dp(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> Any:
+        """
+        Создать ссылку между документами
+
+        GET /api/migration/dp
+        """
+        return await self._call(
+            self._op_dp,
+            service_token=service_token,
+        )
+
+    _op_save_correspondent = Operation('POST', 'api/migration/correspondent', response=Any, body=lambda: m.Correspondent)
+
+    async def save_correspondent(
+        self,
+        *,
+        body: m.Correspondent,
+        service_token: Optional[str] = None,
+    ) -> Any:
+        """
+        Создать нового адресата/корреспондента
+
+        POST /api/migration/correspondent
+        """
+        return await self._call(
+            self._op_save_correspondent,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_save_document = Operation('POST', 'api/migration/document', response=Any, body=lambda: m.Document)
+
+    async def save_document(
+        self,
+        *,
+        body: m.Document,
+        service_token: Optional[str] = None,
+    ) -> Any:
+        """
+        Создать новый документ
+
+        POST /api/migration/document
+        """
+        return await self._call(
+            self._op_save_document,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_save_document_comment_recipient = Operation('POST', 'api/migration/save-document-comment-recipient', response=Any, body=lambda: m.Recipient)
+
+    async def save_document_comment_recipient(
+        self,
+        *,
+        body: m.Recipient,
+        service_token: Optional[str] = None,
+    ) -> Any:
+        """
+        Добавить в документ комментарий со списком адресатов
+
+        POST /api/migration/save-document-comment-recipient
+        """
+        return await self._call(
+            self._op_save_document_comment_recipient,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_save_document_link = Operation('POST', 'api/migration/document-link', response=Any, body=lambda: m.DocumentLink)
+
+    async def save_document_link(
+        self,
+        *,
+        body: m.DocumentLink,
+        service_token: Optional[str] = None,
+    ) -> Any:
+        """
+        Создать ссылку между документами
+
+        POST /api/migration/document-link
+        """
+        return await self._call(
+            self._op_save_document_link,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_save_document_list = Operation('POST', 'api/migration/document-list', response=Any, body=lambda: list[m.Document])
+
+    async def save_document_list(
+        self,
+        *,
+        body: list[m.Document],
+        service_token: Optional[str] = None,
+    ) -> Any:
+        """
+        Создать список новых документов
+
+        POST /api/migration/document-list
+        """
+        return await self._call(
+            self._op_save_document_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_save_nomenclature_affair = Operation('POST', 'api/migration/nomenclature-affair', response=Any, body=lambda: m.NomenclatureAffair)
+
+    async def save_nomenclature_affair(
+        self,
+        *,
+        body: m.NomenclatureAffair,
+        service_token: Optional[str] = None,
+    ) -> Any:
+        """
+        Создать новую номенклатуру дел
+
+        POST /api/migration/nomenclature-affair
+        """
+        return await self._call(
+            self._op_save_nomenclature_affair,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update_type = Operation('POST', 'api/migration/update-document-type', response=Any, body=lambda: m.UpdateDocumentType)
+
+    async def update_type(
+        self,
+        *,
+        body: m.UpdateDocumentType,
+        service_token: Optional[str] = None,
+    ) -> Any:
+        """
+        Обновить вид документа в документе
+
+        POST /api/migration/update-document-type
+        """
+        return await self._call(
+            self._op_update_type,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update_type_list = Operation('POST', 'api/migration/update-document-type-list', response=Any, body=lambda: list[m.UpdateDocumentType])
+
+    async def update_type_list(
+        self,
+        *,
+        body: list[m.UpdateDocumentType],
+        service_token: Optional[str] = None,
+    ) -> Any:
+        """
+        Обновить вид документа в документах
+
+        POST /api/migration/update-document-type-list
+        """
+        return await self._call(
+            self._op_update_type_list,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class MiniDokumentApi(ApiGroup):
+    """
+    Мини документ
+    API для работы с мини документами
+    Константы для получения истории: DOCUMENT_LANGUAGE
+    """
+
+    _op_add_sign = Operation('PUT', 'api/nomenclature-affair/{affairId}/mini-document/{id}/attachment/{attachId}/sign', body=lambda: m.SimpleCmsDTO)
+
+    async def add_sign(
+        self,
+        affair_id: UUID,
+        attach_id: UUID,
+        id: UUID,
+        *,
+        body: m.SimpleCmsDTO,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Прикрепить подпись ЭЦП
+
+        PUT /api/nomenclature-affair/{affairId}/mini-document/{id}/attachment/{attachId}/sign
+        """
+        return await self._call(
+            self._op_add_sign,
+            path={'affairId': affair_id, 'attachId': attach_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_check_sign = Operation('POST', 'api/nomenclature-affair/{affairId}/mini-document/{id}/attachment/{attachId}/verify-sign', response=dict[str, Any], body=lambda: m.CheckAttachmentSignRequest)
+
+    async def check_sign(
+        self,
+        affair_id: UUID,
+        attach_id: UUID,
+        id: UUID,
+        *,
+        body: m.CheckAttachmentSignRequest,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Проверить ЭЦП
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_MINI_DOCUMENT
+
+        POST /api/nomenclature-affair/{affairId}/mini-document/{id}/attachment/{attachId}/verify-sign
+        """
+        return await self._call(
+            self._op_check_sign,
+            path={'affairId': affair_id, 'attachId': attach_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create = Operation('POST', 'api/nomenclature-affair/{affairId}/mini-document', response=lambda: m.MiniDocumentDto, body=lambda: m.MiniDocumentRequest)
+
+    async def create(
+        self,
+        affair_id: UUID,
+        *,
+        body: m.MiniDocumentRequest,
+        service_token: Optional[str] = None,
+    ) -> m.MiniDocumentDto:
+        """
+        Создать мини-документ в ручную
+
+        POST /api/nomenclature-affair/{affairId}/mini-document
+        """
+        return await self._call(
+            self._op_create,
+            path={'affairId': affair_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_attachment = Operation('DELETE', 'api/nomenclature-affair/{affairId}/mini-document/{id}/attachment', response=lambda: m.MiniDocumentDto, body=lambda: m.IdsUUID)
+
+    async def delete_attachment(
+        self,
+        affair_id: UUID,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.MiniDocumentDto:
+        """
+        Удалить список вложений по IDs
+
+        DELETE /api/nomenclature-affair/{affairId}/mini-document/{id}/attachment
+        """
+        return await self._call(
+            self._op_delete_attachment,
+            path={'affairId': affair_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_download = Operation('GET', 'api/nomenclature-affair/{affairId}/mini-document/{id}/attachment/{attachId}/download', binary=True)
+
+    def download(
+        self,
+        affair_id: UUID,
+        id: UUID,
+        attach_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл
+
+        GET /api/nomenclature-affair/{affairId}/mini-document/{id}/attachment/{attachId}/download
+        """
+        return self._stream(
+            self._op_download,
+            path={'affairId': affair_id, 'id': id, 'attachId': attach_id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_download_base64 = Operation('GET', 'api/nomenclature-affair/{affairId}/mini-document/{id}/attachment/{attachId}/base64', binary=True)
+
+    def download_base64(
+        self,
+        affair_id: UUID,
+        attach_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл base64 из MinIO по uuid
+
+        GET /api/nomenclature-affair/{affairId}/mini-document/{id}/attachment/{attachId}/base64
+        """
+        return self._stream(
+            self._op_download_base64,
+            path={'affairId': affair_id, 'attachId': attach_id, 'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_edit = Operation('PUT', 'api/nomenclature-affair/{affairId}/mini-document/{id}', response=lambda: m.MiniDocumentDto, body=lambda: m.MiniDocumentRequest)
+
+    async def edit(
+        self,
+        affair_id: UUID,
+        id: UUID,
+        *,
+        body: m.MiniDocumentRequest,
+        service_token: Optional[str] = None,
+    ) -> m.MiniDocumentDto:
+        """
+        Изменить мини документ
+
+        PUT /api/nomenclature-affair/{affairId}/mini-document/{id}
+        """
+        return await self._call(
+            self._op_edit,
+            path={'affairId': affair_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_12 = Operation('GET', 'api/nomenclature-affair/{affairId}/mini-document/{id}', response=lambda: m.MiniDocumentDto)
+
+    async def get_12(
+        self,
+        affair_id: UUID,
+        id: UUID,
+        *,
+        includes: list[str],
+        service_token: Optional[str] = None,
+    ) -> m.MiniDocumentDto:
+        """
+        Получить мини-документ по ID
+
+        GET /api/nomenclature-affair/{affairId}/mini-document/{id}
+        """
+        return await self._call(
+            self._op_get_12,
+            path={'affairId': affair_id, 'id': id},
+            query={'includes': includes},
+            service_token=service_token,
+        )
+
+    _op_get_57 = Operation('GET', 'api/mini-document/language', response=lambda: m.DocumentLanguageDto)
+
+    async def get_57(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentLanguageDto:
+        """
+        Получить язык документа из настроечного
+
+        GET /api/mini-document/language
+        """
+        return await self._call(
+            self._op_get_57,
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/mini-document', response=lambda: m.MiniDocumentDto)
+
+    async def get_all(
+        self,
+        *,
+        filter: m.MiniDocumentFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.MiniDocumentDto:
+        """
+        Получить список мини-документов с фильтрацией
+
+        GET /api/mini-document
+        """
+        return await self._call(
+            self._op_get_all,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_attachments = Operation('GET', 'api/nomenclature-affair/{affairId}/mini-document/{id}/attachment', response=lambda: m.MiniDocumentDto)
+
+    async def get_attachments(
+        self,
+        affair_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.MiniDocumentDto:
+        """
+        Получить список вложений по ID мини-документа
+
+        GET /api/nomenclature-affair/{affairId}/mini-document/{id}/attachment
+        """
+        return await self._call(
+            self._op_get_attachments,
+            path={'affairId': affair_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_links = Operation('GET', 'api/nomenclature-affair/{affairId}/mini-document/{id}/link', response=lambda: m.MiniDocumentDto)
+
+    async def get_links(
+        self,
+        affair_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.MiniDocumentDto:
+        """
+        Получить список мини документов по ID мини-документа на которые есть ссылки
+
+        GET /api/nomenclature-affair/{affairId}/mini-document/{id}/link
+        """
+        return await self._call(
+            self._op_get_links,
+            path={'affairId': affair_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_permission = Operation('GET', 'api/nomenclature-affair/{affairId}/mini-document/{id}/permission', response=lambda: list[m.MiniDocumentPermission])
+
+    async def get_permission(
+        self,
+        affair_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.MiniDocumentPermission]:
+        """
+        Получить пермишены мини-документа по ID
+
+        GET /api/nomenclature-affair/{affairId}/mini-document/{id}/permission
+        """
+        return await self._call(
+            self._op_get_permission,
+            path={'affairId': affair_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_with_permission = Operation('GET', 'api/nomenclature-affair/{affairId}/mini-document/{id}/all', response=lambda: m.MiniDocumentWithPermission)
+
+    async def get_with_permission(
+        self,
+        affair_id: UUID,
+        id: UUID,
+        *,
+        includes: list[str],
+        service_token: Optional[str] = None,
+    ) -> m.MiniDocumentWithPermission:
+        """
+        Получить мини-документ по ID и пермишены
+
+        GET /api/nomenclature-affair/{affairId}/mini-document/{id}/all
+        """
+        return await self._call(
+            self._op_get_with_permission,
+            path={'affairId': affair_id, 'id': id},
+            query={'includes': includes},
+            service_token=service_token,
+        )
+
+    _op_history = Operation('GET', 'api/nomenclature-affair/{affairId}/mini-document/{id}/history', response=lambda: m.MiniDocumentHistoryDto)
+
+    async def history(
+        self,
+        affair_id: UUID,
+        id: UUID,
+        *,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.MiniDocumentHistoryDto:
+        """
+        Получить историю мини документа
+
+        GET /api/nomenclature-affair/{affairId}/mini-document/{id}/history
+        """
+        return await self._call(
+            self._op_history,
+            path={'affairId': affair_id, 'id': id},
+            query={'p': p},
+            service_token=service_token,
+        )
+
+    _op_remove_sign = Operation('DELETE', 'api/nomenclature-affair/{affairId}/mini-document/{id}/attachment/{attachId}/sign/{signId}', response=dict[str, Any])
+
+    async def remove_sign(
+        self,
+        affair_id: UUID,
+        attach_id: UUID,
+        id: UUID,
+        sign_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Удалить подпись ЭЦП
+
+        DELETE /api/nomenclature-affair/{affairId}/mini-document/{id}/attachment/{attachId}/sign/{signId}
+        """
+        return await self._call(
+            self._op_remove_sign,
+            path={'affairId': affair_id, 'attachId': attach_id, 'id': id, 'signId': sign_id},
+            service_token=service_token,
+        )
+
+    _op_upload_agreement = Operation('POST', 'api/nomenclature-affair/{affairId}/mini-document/{id}/attachment/agreement', response=dict[str, Any], multipart=True)
+
+    async def upload_agreement(
+        self,
+        affair_id: UUID,
+        id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Загрузить лист согласования
+
+        POST /api/nomenclature-affair/{affairId}/mini-document/{id}/attachment/agreement
+        """
+        return await self._call(
+            self._op_upload_agreement,
+            path={'affairId': affair_id, 'id': id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_attachment = Operation('POST', 'api/nomenclature-affair/{affairId}/mini-document/{id}/attachment', response=dict[str, Any], multipart=True)
+
+    async def upload_attachment(
+        self,
+        affair_id: UUID,
+        id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Загрузить файлы документа
+
+        POST /api/nomenclature-affair/{affairId}/mini-document/{id}/attachment
+        """
+        return await self._call(
+            self._op_upload_attachment,
+            path={'affairId': affair_id, 'id': id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_introduction = Operation('POST', 'api/nomenclature-affair/{affairId}/mini-document/{id}/attachment/introduction', response=dict[str, Any], multipart=True)
+
+    async def upload_introduction(
+        self,
+        affair_id: UUID,
+        id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Загрузить лист ознакомления
+
+        POST /api/nomenclature-affair/{affairId}/mini-document/{id}/attachment/introduction
+        """
+        return await self._call(
+            self._op_upload_introduction,
+            path={'affairId': affair_id, 'id': id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_rkk = Operation('POST', 'api/nomenclature-affair/{affairId}/mini-document/{id}/attachment/rkk', response=dict[str, Any], multipart=True)
+
+    async def upload_rkk(
+        self,
+        affair_id: UUID,
+        id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Загрузить РКК
+
+        POST /api/nomenclature-affair/{affairId}/mini-document/{id}/attachment/rkk
+        """
+        return await self._call(
+            self._op_upload_rkk,
+            path={'affairId': affair_id, 'id': id},
+            body=files,
+            service_token=service_token,
+        )
+
+
+class NapominaniiaApi(ApiGroup):
+    """
+    Напоминания
+    API для работы c напоминаниями
+    """
+
+    _op_get = Operation('GET', 'api/reminder-rule/{id}', response=lambda: m.RemindersRulesDto)
+
+    async def get(
+        self,
+        id: str,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.RemindersRulesDto:
+        """
+        Получить правило напоминания по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_REMINDERS_RULES
+
+        GET /api/reminder-rule/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/reminder-rule', response=lambda: m.RemindersRulesDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.RemindersRulesDto:
+        """
+        Получить все правила напоминаний
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_REMINDERS_RULES
+
+        GET /api/reminder-rule
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/reminder-rule', response=lambda: m.RemindersRulesDto, body=lambda: m.RemindersRulesDto)
+
+    async def put(
+        self,
+        *,
+        body: m.RemindersRulesDto,
+        service_token: Optional[str] = None,
+    ) -> m.RemindersRulesDto:
+        """
+        Изменить правило напоминания
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_REMINDERS_RULES
+
+        PUT /api/reminder-rule
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class NastroechnyiSpravochnikModuliaApi(ApiGroup):
+    """
+    Настроечный справочник модуля
+    API для работы с настроечным справочником модуля
+    Константы для получения истории: ARCHIVE_SETUP
+    """
+
+    _op_get_collection = Operation('GET', 'api/archive-setup', response=lambda: m.NomenclatureArchiveConfigDto)
+
+    async def get_collection(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureArchiveConfigDto:
+        """
+        Получить список настроечного справочника модуля
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ARCHIVE_SETUP
+
+        GET /api/archive-setup
+        """
+        return await self._call(
+            self._op_get_collection,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/archive-setup', response=lambda: m.NomenclatureArchiveConfigDto, body=lambda: m.NomenclatureArchiveConfigRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.NomenclatureArchiveConfigRequest,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureArchiveConfigDto:
+        """
+        Создать новый/изменить настроечный справочник модуля
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_ARCHIVE_SETUP
+
+        POST /api/archive-setup
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class NastroikaDliaMigratsiiDokumentovSpravochnikovApi(ApiGroup):
+    """
+    Настройка для миграции документов/справочников
+    API для работы с настройкой для миграции документов/справочников
+    Константы для получения истории: MIGRATION_SETUP
+    """
+
+    _op_get_14 = Operation('GET', 'api/migration-setup', response=lambda: m.MigrationSetupDto)
+
+    async def get_14(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.MigrationSetupDto:
+        """
+        Получить настройку для миграции (organizationId достается из CustomUserDetails)
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_MIGRATION_SETUP
+
+        GET /api/migration-setup
+        """
+        return await self._call(
+            self._op_get_14,
+            service_token=service_token,
+        )
+
+    _op_get_58 = Operation('GET', 'api/migration-setup/{id}', response=lambda: m.MigrationSetupDto)
+
+    async def get_58(
+        self,
+        id: str,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.MigrationSetupDto:
+        """
+        Получить настройку для миграции
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_MIGRATION_SETUP
+
+        GET /api/migration-setup/{id}
+        """
+        return await self._call(
+            self._op_get_58,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/migration-setup/all-org', response=lambda: list[m.MigrationSetupDto])
+
+    async def get_all(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.MigrationSetupDto]:
+        """
+        Получить список настроек для миграции (реально всех)
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_MIGRATION_SETUP
+
+        GET /api/migration-setup/all-org
+        """
+        return await self._call(
+            self._op_get_all,
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/migration-setup/all', response=lambda: m.SliceDtoMigrationSetupDto)
+
+    async def get_collection(
+        self,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoMigrationSetupDto:
+        """
+        Получить список настроек для миграции
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_MIGRATION_SETUP
+
+        GET /api/migration-setup/all
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/migration-setup', response=lambda: m.MigrationSetupDto, body=lambda: m.MigrationSetupDto)
+
+    async def post(
+        self,
+        *,
+        body: m.MigrationSetupDto,
+        service_token: Optional[str] = None,
+    ) -> m.MigrationSetupDto:
+        """
+        Создать новую настройку для миграции
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_MIGRATION_SETUP
+
+        POST /api/migration-setup
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/migration-setup', response=lambda: m.MigrationSetupDto, body=lambda: m.MigrationSetupDto)
+
+    async def put(
+        self,
+        *,
+        body: m.MigrationSetupDto,
+        service_token: Optional[str] = None,
+    ) -> m.MigrationSetupDto:
+        """
+        Изменить настройку для миграции
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_MIGRATION_SETUP
+
+        PUT /api/migration-setup
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class NastroikaDokumentaRaspoznavaniiaApi(ApiGroup):
+    """
+    Настройка документа распознавания
+    API для работы с настройками распознавания документов
+    Константы для получения истории: RECOGNITION_SETUP
+    """
+
+    _op_get = Operation('GET', 'api/recognition-setup', response=lambda: m.RecognitionSetupDto)
+
+    async def get(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.RecognitionSetupDto:
+        """
+        Получить настройку документа распознавания
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_RECOGNITION_SETUP
+
+        GET /api/recognition-setup
+        """
+        return await self._call(
+            self._op_get,
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/recognition-setup/all', response=lambda: m.RecognitionSetupDto)
+
+    async def get_collection(
+        self,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.RecognitionSetupDto:
+        """
+        Получить список настроек распознавания документов
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_RECOGNITION_SETUP
+
+        GET /api/recognition-setup/all
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/recognition-setup', response=lambda: m.RecognitionSetupDto, body=lambda: m.RecognitionSetupDto)
+
+    async def post(
+        self,
+        *,
+        body: m.RecognitionSetupDto,
+        service_token: Optional[str] = None,
+    ) -> m.RecognitionSetupDto:
+        """
+        Создать новую настройку документа распознавания
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_RECOGNITION_SETUP
+
+        POST /api/recognition-setup
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/recognition-setup', response=lambda: m.RecognitionSetupDto, body=lambda: m.RecognitionSetupDto)
+
+    async def put(
+        self,
+        *,
+        body: m.RecognitionSetupDto,
+        service_token: Optional[str] = None,
+    ) -> m.RecognitionSetupDto:
+        """
+        Изменить настройку документа распознавания
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_RECOGNITION_SETUP
+
+        PUT /api/recognition-setup
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class NastroikaPochtyApi(ApiGroup):
+    """
+    Настройка почты
+    Системное API для работы с настройкой почты
+    Константы для получения истории: MAIL_SETUP
+    """
+
+    _op_get_15 = Operation('GET', 'api/mail-setup', response=lambda: m.MailSetupDto)
+
+    async def get_15(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.MailSetupDto:
+        """
+        Получить настройку почты (organizationId достается из CustomUserDetails)
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_MAIL_SETUP
+
+        GET /api/mail-setup
+        """
+        return await self._call(
+            self._op_get_15,
+            service_token=service_token,
+        )
+
+    _op_get_26 = Operation('POST', 'system/api/mail-setup', response=lambda: m.MailSetupDto, body=lambda: m.MailSetupDto)
+
+    async def get_26(
+        self,
+        *,
+        body: m.MailSetupDto,
+        service_token: Optional[str] = None,
+    ) -> m.MailSetupDto:
+        """
+        Получить настройку почты
+
+        POST /system/api/mail-setup
+        """
+        return await self._call(
+            self._op_get_26,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/mail-setup/all', response=lambda: m.MailSetupDto)
+
+    async def get_collection(
+        self,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.MailSetupDto:
+        """
+        Получить список настроек почты
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_MAIL_SETUP
+
+        GET /api/mail-setup/all
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/mail-setup', response=lambda: m.MailSetupDto, body=lambda: m.MailSetupDto)
+
+    async def post(
+        self,
+        *,
+        body: m.MailSetupDto,
+        service_token: Optional[str] = None,
+    ) -> m.MailSetupDto:
+        """
+        Создать новую настройку почты
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_MAIL_SETUP
+
+        POST /api/mail-setup
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post_mail_setup = Operation('POST', 'api/mail-setup/test', response=lambda: m.MailSetupDto, body=lambda: m.MailSetupDto)
+
+    async def post_mail_setup(
+        self,
+        *,
+        body: m.MailSetupDto,
+        service_token: Optional[str] = None,
+    ) -> m.MailSetupDto:
+        """
+        Отправить тестовое письмо
+
+        POST /api/mail-setup/test
+        """
+        return await self._call(
+            self._op_post_mail_setup,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/mail-setup', response=lambda: m.MailSetupDto, body=lambda: m.MailSetupDto)
+
+    async def put(
+        self,
+        *,
+        body: m.MailSetupDto,
+        service_token: Optional[str] = None,
+    ) -> m.MailSetupDto:
+        """
+        Изменить настройку почты
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_MAIL_SETUP
+
+        PUT /api/mail-setup
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class NastroikaShablonovRkkPoUmolchaniiuApi(ApiGroup):
+    """
+    Настройка шаблонов РКК по умолчанию
+    API для выбора печатной формы РКК по умолчанию
+    Константы для получения истории: RECOGNITION_SETUP
+    """
+
+    _op_edit_or_save = Operation('PUT', 'api/template-rkk-setup', response=lambda: m.RecognitionSetupDto, body=lambda: m.TemplateRkkSetupRequest)
+
+    async def edit_or_save(
+        self,
+        *,
+        body: m.TemplateRkkSetupRequest,
+        service_token: Optional[str] = None,
+    ) -> m.RecognitionSetupDto:
+        """
+        Создать/изменить шаблон по умолчанию
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_TEMPLATE_RKK_SETUP
+
+        PUT /api/template-rkk-setup
+        """
+        return await self._call(
+            self._op_edit_or_save,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/template-rkk-setup', response=lambda: m.RecognitionSetupDto)
+
+    async def get(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.RecognitionSetupDto:
+        """
+        Получить шаблон по умолчанию по своей организации
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_TEMPLATE_RKK_SETUP
+
+        GET /api/template-rkk-setup
+        """
+        return await self._call(
+            self._op_get,
+            service_token=service_token,
+        )
+
+
+class NastroikiAisMvApi(ApiGroup):
+    """
+    Настройки АИС МВ
+    Константы для получения истории: OAIS_APIM_AUTH_CONFIG
+    """
+
+    _op_create = Operation('POST', 'api/oais-apim-auth-config', response=lambda: m.OaisApimAuthConfigDto, body=lambda: m.OaisApimAuthConfigDto)
+
+    async def create(
+        self,
+        *,
+        body: m.OaisApimAuthConfigDto,
+        service_token: Optional[str] = None,
+    ) -> m.OaisApimAuthConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_AISMV_SETTING
+
+        POST /api/oais-apim-auth-config
+        """
+        return await self._call(
+            self._op_create,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/oais-apim-auth-config', response=str)
+
+    async def delete(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_AISMV_SETTING
+
+        DELETE /api/oais-apim-auth-config
+        """
+        return await self._call(
+            self._op_delete,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/oais-apim-auth-config', response=lambda: m.OaisApimAuthConfigDto)
+
+    async def get(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.OaisApimAuthConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_AISMV_SETTING
+
+        GET /api/oais-apim-auth-config
+        """
+        return await self._call(
+            self._op_get,
+            service_token=service_token,
+        )
+
+    _op_test = Operation('POST', 'api/oais-apim-auth-config/test', response=str, body=lambda: m.OaisApimAuthConfigDto)
+
+    async def test(
+        self,
+        *,
+        body: m.OaisApimAuthConfigDto,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+
+        POST /api/oais-apim-auth-config/test
+        """
+        return await self._call(
+            self._op_test,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update = Operation('PUT', 'api/oais-apim-auth-config', response=lambda: m.OaisApimAuthConfigDto, body=lambda: m.OaisApimAuthConfigDto)
+
+    async def update(
+        self,
+        *,
+        body: m.OaisApimAuthConfigDto,
+        service_token: Optional[str] = None,
+    ) -> m.OaisApimAuthConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_AISMV_SETTING
+
+        PUT /api/oais-apim-auth-config
+        """
+        return await self._call(
+            self._op_update,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class NastroikiAisMvAisMvApiApi(ApiGroup):
+    """
+    Настройки АИС МВ / АИС МВ API
+    API для работы с АИС МВ API
+    Константы для получения истории: AISMV_API_CONFIG
+    """
+
+    _op_create = Operation('POST', 'api/aismv-api-config', response=lambda: m.AismvApiConfigDto, body=lambda: m.AismvApiConfigDto)
+
+    async def create(
+        self,
+        *,
+        body: m.AismvApiConfigDto,
+        service_token: Optional[str] = None,
+    ) -> m.AismvApiConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_AISMV_SETTING
+
+        POST /api/aismv-api-config
+        """
+        return await self._call(
+            self._op_create,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/aismv-api-config', response=str)
+
+    async def delete(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_AISMV_SETTING
+
+        DELETE /api/aismv-api-config
+        """
+        return await self._call(
+            self._op_delete,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/aismv-api-config', response=lambda: m.AismvApiConfigDto)
+
+    async def get(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AismvApiConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_AISMV_SETTING
+
+        GET /api/aismv-api-config
+        """
+        return await self._call(
+            self._op_get,
+            service_token=service_token,
+        )
+
+    _op_test = Operation('POST', 'api/aismv-api-config/test', response=lambda: m.AismvApiConfigDto, body=lambda: m.AismvApiConfigDto)
+
+    async def test(
+        self,
+        *,
+        body: m.AismvApiConfigDto,
+        service_token: Optional[str] = None,
+    ) -> m.AismvApiConfigDto:
+        """
+
+        POST /api/aismv-api-config/test
+        """
+        return await self._call(
+            self._op_test,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update = Operation('PUT', 'api/aismv-api-config', response=lambda: m.AismvApiConfigDto, body=lambda: m.AismvApiConfigDto)
+
+    async def update(
+        self,
+        *,
+        body: m.AismvApiConfigDto,
+        service_token: Optional[str] = None,
+    ) -> m.AismvApiConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_AISMV_SETTING
+
+        PUT /api/aismv-api-config
+        """
+        return await self._call(
+            self._op_update,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class NastroikiAisMvSkhemaFormataObmenaApi(ApiGroup):
+    """
+    Настройки АИС МВ / Схема формата обмена
+    API для работы со схемой формата обмена
+    Константы для получения истории: AISMV_ROUTER_API_CONFIG
+    """
+
+    _op_create = Operation('POST', 'api/aismv-router-config', response=lambda: m.AismvRouterConfigDto, body=lambda: m.AismvRouterConfigDto)
+
+    async def create(
+        self,
+        *,
+        body: m.AismvRouterConfigDto,
+        service_token: Optional[str] = None,
+    ) -> m.AismvRouterConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_AISMV_SETTING
+
+        POST /api/aismv-router-config
+        """
+        return await self._call(
+            self._op_create,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/aismv-router-config', response=dict[str, Any])
+
+    async def delete(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_AISMV_SETTING
+
+        DELETE /api/aismv-router-config
+        """
+        return await self._call(
+            self._op_delete,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/aismv-router-config', response=lambda: m.AismvRouterConfigDto)
+
+    async def get(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AismvRouterConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_AISMV_SETTING
+
+        GET /api/aismv-router-config
+        """
+        return await self._call(
+            self._op_get,
+            service_token=service_token,
+        )
+
+    _op_update = Operation('PUT', 'api/aismv-router-config', response=lambda: m.AismvRouterConfigDto, body=lambda: m.AismvRouterConfigDto)
+
+    async def update(
+        self,
+        *,
+        body: m.AismvRouterConfigDto,
+        service_token: Optional[str] = None,
+    ) -> m.AismvRouterConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_AISMV_SETTING
+
+        PUT /api/aismv-router-config
+        """
+        return await self._call(
+            self._op_update,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class NastroikiAisMvSpravochnikOrganizatsiiAbonentovApi(ApiGroup):
+    """
+    Настройки АИС МВ / Справочник организаций абонентов
+    API для работы со справочником организаций абонентов
+    Константы для получения истории: OAIS_SUBSCRIBER_NSI_CONFIG
+    """
+
+    _op_create = Operation('POST', 'api/oais-smdo-subscriber-config', response=lambda: m.OaisSmdoSubscriberConfigDto, body=lambda: m.OaisSmdoSubscriberConfigDto)
+
+    async def create(
+        self,
+        *,
+        body: m.OaisSmdoSubscriberConfigDto,
+        service_token: Optional[str] = None,
+    ) -> m.OaisSmdoSubscriberConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_AISMV_NSI_CONFIG
+
+        POST /api/oais-smdo-subscriber-config
+        """
+        return await self._call(
+            self._op_create,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/oais-smdo-subscriber-config', response=str)
+
+    async def delete(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_AISMV_NSI_CONFIG
+
+        DELETE /api/oais-smdo-subscriber-config
+        """
+        return await self._call(
+            self._op_delete,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/oais-smdo-subscriber-config', response=lambda: m.OaisSmdoSubscriberConfigDto)
+
+    async def get(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.OaisSmdoSubscriberConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_AISMV_NSI_CONFIG
+
+        GET /api/oais-smdo-subscriber-config
+        """
+        return await self._call(
+            self._op_get,
+            service_token=service_token,
+        )
+
+    _op_refresh = Operation('POST', 'api/oais-smdo-subscriber-config/refresh', response=str)
+
+    async def refresh(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_AISMV_NSI_CONFIG
+
+        POST /api/oais-smdo-subscriber-config/refresh
+        """
+        return await self._call(
+            self._op_refresh,
+            service_token=service_token,
+        )
+
+    _op_sync = Operation('POST', 'api/oais-smdo-subscriber-config/sync', response=str)
+
+    async def sync(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_AISMV_NSI_CONFIG
+
+        POST /api/oais-smdo-subscriber-config/sync
+        """
+        return await self._call(
+            self._op_sync,
+            service_token=service_token,
+        )
+
+    _op_test = Operation('POST', 'api/oais-smdo-subscriber-config/test', response=str, body=lambda: m.OaisSmdoSubscriberConfigDto)
+
+    async def test(
+        self,
+        *,
+        body: m.OaisSmdoSubscriberConfigDto,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+
+        POST /api/oais-smdo-subscriber-config/test
+        """
+        return await self._call(
+            self._op_test,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update = Operation('PUT', 'api/oais-smdo-subscriber-config', response=lambda: m.OaisSmdoSubscriberConfigDto, body=lambda: m.OaisSmdoSubscriberConfigDto)
+
+    async def update(
+        self,
+        *,
+        body: m.OaisSmdoSubscriberConfigDto,
+        service_token: Optional[str] = None,
+    ) -> m.OaisSmdoSubscriberConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_AISMV_NSI_CONFIG
+
+        PUT /api/oais-smdo-subscriber-config
+        """
+        return await self._call(
+            self._op_update,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class NastroikiAisMvSpravochnikTipovFailovApi(ApiGroup):
+    """
+    Настройки АИС МВ / Справочник типов файлов
+    API для работы со справочником типов файлов
+    Константы для получения истории: OAIS_FILE_TYPE_NSI_CONFIG
+    """
+
+    _op_create = Operation('POST', 'api/oais-smdo-file-type-config', response=lambda: m.OaisSmdoFileTypeConfigDto, body=lambda: m.OaisSmdoFileTypeConfigDto)
+
+    async def create(
+        self,
+        *,
+        body: m.OaisSmdoFileTypeConfigDto,
+        service_token: Optional[str] = None,
+    ) -> m.OaisSmdoFileTypeConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_AISMV_NSI_CONFIG
+
+        POST /api/oais-smdo-file-type-config
+        """
+        return await self._call(
+            self._op_create,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/oais-smdo-file-type-config', response=str)
+
+    async def delete(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_AISMV_NSI_CONFIG
+
+        DELETE /api/oais-smdo-file-type-config
+        """
+        return await self._call(
+            self._op_delete,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/oais-smdo-file-type-config', response=lambda: m.OaisSmdoFileTypeConfigDto)
+
+    async def get(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.OaisSmdoFileTypeConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_AISMV_NSI_CONFIG
+
+        GET /api/oais-smdo-file-type-config
+        """
+        return await self._call(
+            self._op_get,
+            service_token=service_token,
+        )
+
+    _op_sync = Operation('POST', 'api/oais-smdo-file-type-config/sync', response=str)
+
+    async def sync(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+
+        POST /api/oais-smdo-file-type-config/sync
+        """
+        return await self._call(
+            self._op_sync,
+            service_token=service_token,
+        )
+
+    _op_test = Operation('POST', 'api/oais-smdo-file-type-config/test', response=str, body=lambda: m.OaisSmdoFileTypeConfigDto)
+
+    async def test(
+        self,
+        *,
+        body: m.OaisSmdoFileTypeConfigDto,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+
+        POST /api/oais-smdo-file-type-config/test
+        """
+        return await self._call(
+            self._op_test,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update = Operation('PUT', 'api/oais-smdo-file-type-config', response=lambda: m.OaisSmdoFileTypeConfigDto, body=lambda: m.OaisSmdoFileTypeConfigDto)
+
+    async def update(
+        self,
+        *,
+        body: m.OaisSmdoFileTypeConfigDto,
+        service_token: Optional[str] = None,
+    ) -> m.OaisSmdoFileTypeConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_AISMV_NSI_CONFIG
+
+        PUT /api/oais-smdo-file-type-config
+        """
+        return await self._call(
+            self._op_update,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class NastroikiAisMvSpravochnikVidovDokumentovApi(ApiGroup):
+    """
+    Настройки АИС МВ / Справочник видов документов
+    API для работы со справочником видов документов
+    Константы для получения истории: OAIS_DOC_TYPE_NSI_CONFIG
+    """
+
+    _op_create = Operation('POST', 'api/oais-smdo-doc-type-config', response=lambda: m.OaisSmdoDocTypeConfigDto, body=lambda: m.OaisSmdoDocTypeConfigDto)
+
+    async def create(
+        self,
+        *,
+        body: m.OaisSmdoDocTypeConfigDto,
+        service_token: Optional[str] = None,
+    ) -> m.OaisSmdoDocTypeConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_AISMV_NSI_CONFIG
+
+        POST /api/oais-smdo-doc-type-config
+        """
+        return await self._call(
+            self._op_create,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/oais-smdo-doc-type-config', response=str)
+
+    async def delete(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_AISMV_NSI_CONFIG
+
+        DELETE /api/oais-smdo-doc-type-config
+        """
+        return await self._call(
+            self._op_delete,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/oais-smdo-doc-type-config', response=lambda: m.OaisSmdoDocTypeConfigDto)
+
+    async def get(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.OaisSmdoDocTypeConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_AISMV_NSI_CONFIG
+
+        GET /api/oais-smdo-doc-type-config
+        """
+        return await self._call(
+            self._op_get,
+            service_token=service_token,
+        )
+
+    _op_sync = Operation('POST', 'api/oais-smdo-doc-type-config/sync', response=str)
+
+    async def sync(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+
+        POST /api/oais-smdo-doc-type-config/sync
+        """
+        return await self._call(
+            self._op_sync,
+            service_token=service_token,
+        )
+
+    _op_test = Operation('POST', 'api/oais-smdo-doc-type-config/test', response=str, body=lambda: m.OaisSmdoDocTypeConfigDto)
+
+    async def test(
+        self,
+        *,
+        body: m.OaisSmdoDocTypeConfigDto,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+
+        POST /api/oais-smdo-doc-type-config/test
+        """
+        return await self._call(
+            self._op_test,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update = Operation('PUT', 'api/oais-smdo-doc-type-config', response=lambda: m.OaisSmdoDocTypeConfigDto, body=lambda: m.OaisSmdoDocTypeConfigDto)
+
+    async def update(
+        self,
+        *,
+        body: m.OaisSmdoDocTypeConfigDto,
+        service_token: Optional[str] = None,
+    ) -> m.OaisSmdoDocTypeConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_AISMV_NSI_CONFIG
+
+        PUT /api/oais-smdo-doc-type-config
+        """
+        return await self._call(
+            self._op_update,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class NastroikiAisMvSpravochnikVidovVedomstvennykhSedApi(ApiGroup):
+    """
+    Настройки АИС МВ / Справочник видов ведомственных СЭД
+    API для работы со справочником видов ведомственных СЭД
+    Константы для получения истории: OAIS_SED_TYPE_NSI_CONFIG
+    """
+
+    _op_create = Operation('POST', 'api/oais-smdo-sed-type-config', response=lambda: m.OaisSmdoSedTypeConfigDto, body=lambda: m.OaisSmdoSedTypeConfigDto)
+
+    async def create(
+        self,
+        *,
+        body: m.OaisSmdoSedTypeConfigDto,
+        service_token: Optional[str] = None,
+    ) -> m.OaisSmdoSedTypeConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_AISMV_NSI_CONFIG
+
+        POST /api/oais-smdo-sed-type-config
+        """
+        return await self._call(
+            self._op_create,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/oais-smdo-sed-type-config', response=str)
+
+    async def delete(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_AISMV_NSI_CONFIG
+
+        DELETE /api/oais-smdo-sed-type-config
+        """
+        return await self._call(
+            self._op_delete,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/oais-smdo-sed-type-config', response=lambda: m.OaisSmdoSedTypeConfigDto)
+
+    async def get(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.OaisSmdoSedTypeConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_AISMV_NSI_CONFIG
+
+        GET /api/oais-smdo-sed-type-config
+        """
+        return await self._call(
+            self._op_get,
+            service_token=service_token,
+        )
+
+    _op_sync = Operation('POST', 'api/oais-smdo-sed-type-config/sync', response=str)
+
+    async def sync(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+
+        POST /api/oais-smdo-sed-type-config/sync
+        """
+        return await self._call(
+            self._op_sync,
+            service_token=service_token,
+        )
+
+    _op_test = Operation('POST', 'api/oais-smdo-sed-type-config/test', response=str, body=lambda: m.OaisSmdoSedTypeConfigDto)
+
+    async def test(
+        self,
+        *,
+        body: m.OaisSmdoSedTypeConfigDto,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+
+        POST /api/oais-smdo-sed-type-config/test
+        """
+        return await self._call(
+            self._op_test,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update = Operation('PUT', 'api/oais-smdo-sed-type-config', response=lambda: m.OaisSmdoSedTypeConfigDto, body=lambda: m.OaisSmdoSedTypeConfigDto)
+
+    async def update(
+        self,
+        *,
+        body: m.OaisSmdoSedTypeConfigDto,
+        service_token: Optional[str] = None,
+    ) -> m.OaisSmdoSedTypeConfigDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_AISMV_NSI_CONFIG
+
+        PUT /api/oais-smdo-sed-type-config
+        """
+        return await self._call(
+            self._op_update,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class NastroikiOtobrazheniiaApi(ApiGroup):
+    """
+    Настройки отображения
+    API для работы с пользовательскими настройками отображения
+    """
+
+    _op_delete = Operation('DELETE', 'api/custom-view', body=lambda: m.IdsUUID)
+
+    async def delete(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список настроек отображения
+
+        DELETE /api/custom-view
+        """
+        return await self._call(
+            self._op_delete,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/custom-view/{id}', response=lambda: m.CustomViewDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.CustomViewDto:
+        """
+        Получить настройку отображения по id
+
+        GET /api/custom-view/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_by_employee = Operation('GET', 'api/custom-view', response=lambda: list[m.CustomViewDto])
+
+    async def get_by_employee(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.CustomViewDto]:
+        """
+        Получить настройки отображения текущего пользователя
+
+        GET /api/custom-view
+        """
+        return await self._call(
+            self._op_get_by_employee,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/custom-view', response=lambda: m.CustomViewDto, body=lambda: m.CustomViewDto)
+
+    async def post(
+        self,
+        *,
+        body: m.CustomViewDto,
+        service_token: Optional[str] = None,
+    ) -> m.CustomViewDto:
+        """
+        Создать новую настройку отображения
+
+        POST /api/custom-view
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/custom-view/{id}', response=lambda: m.CustomViewDto, body=lambda: m.CustomViewDto)
+
+    async def put(
+        self,
+        id: UUID,
+        *,
+        body: m.CustomViewDto,
+        service_token: Optional[str] = None,
+    ) -> m.CustomViewDto:
+        """
+        Изменить настройку отображения
+
+        PUT /api/custom-view/{id}
+        """
+        return await self._call(
+            self._op_put,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+
+class NomenklaturaDelKartochkaDelaApi(ApiGroup):
+    """
+    Номенклатура дел (карточка дела)
+    API для работы с номенклатурой дел (с карточкой дел)
+    Константы для получения истории: TEMPLATE, UNIFIED_DOCUMENTATION_SYSTEM, NOMENCLATURE_AFFAIR
+    """
+
+    _op_actualize = Operation('PUT', 'api/nomenclature-affair/{id}/actualize', response=lambda: m.NomenclatureAffairDto)
+
+    async def actualize(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+        Актуализировать мини РКК в деле
+
+        PUT /api/nomenclature-affair/{id}/actualize
+        """
+        return await self._call(
+            self._op_actualize,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_add_document = Operation('POST', 'api/nomenclature-affair/{id}/document', response=lambda: m.DocumentNomenclatureDto, body=lambda: m.DocumentNomenclatureDto)
+
+    async def add_document(
+        self,
+        id: UUID,
+        *,
+        body: m.DocumentNomenclatureDto,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentNomenclatureDto:
+        """
+        Добавить документ в дело
+
+        POST /api/nomenclature-affair/{id}/document
+        """
+        return await self._call(
+            self._op_add_document,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_calculation_sheets = Operation('PUT', 'api/nomenclature-affair/{id}/calculation', response=lambda: m.NomenclatureAffairDto)
+
+    async def calculation_sheets(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+        Пересчет страниц в мини документах созданных в ручную
+
+        PUT /api/nomenclature-affair/{id}/calculation
+        """
+        return await self._call(
+            self._op_calculation_sheets,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_completed = Operation('PUT', 'api/nomenclature-affair/{id}/completed', response=lambda: m.NomenclatureAffairDto, body=lambda: m.NomenclatureAffairCompletedRequest)
+
+    async def completed(
+        self,
+        id: UUID,
+        *,
+        body: m.NomenclatureAffairCompletedRequest,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+        Перевести номенклатуру дел в статус 'Завершено'/'Комплектование'
+
+        PUT /api/nomenclature-affair/{id}/completed
+        """
+        return await self._call(
+            self._op_completed,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_copy = Operation('POST', 'api/nomenclature-affair/copy/{year}', response=lambda: m.DocumentNomenclatureDto, body=lambda: m.CopyAffairWrapperUUID)
+
+    async def copy(
+        self,
+        year: int,
+        *,
+        body: m.CopyAffairWrapperUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentNomenclatureDto:
+        """
+        Создать шаблоны карточек дел на определенный год
+
+        POST /api/nomenclature-affair/copy/{year}
+        """
+        return await self._call(
+            self._op_copy,
+            path={'year': year},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_copy_by_department = Operation('POST', 'api/nomenclature-affair/copy-department/{year}', response=lambda: m.DocumentNomenclatureDto, body=lambda: m.CopyAffairWrapperNomenclatureAffairOperationCopyDepDto)
+
+    async def copy_by_department(
+        self,
+        year: int,
+        *,
+        body: m.CopyAffairWrapperNomenclatureAffairOperationCopyDepDto,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentNomenclatureDto:
+        """
+        Копировать подразделение на определенный год
+
+        POST /api/nomenclature-affair/copy-department/{year}
+        """
+        return await self._call(
+            self._op_copy_by_department,
+            path={'year': year},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_copy_year = Operation('POST', 'api/nomenclature-affair/copy-year/{year}', response=lambda: m.DocumentNomenclatureDto, body=lambda: m.CopyAffairWrapperInteger)
+
+    async def copy_year(
+        self,
+        year: int,
+        *,
+        body: m.CopyAffairWrapperInteger,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentNomenclatureDto:
+        """
+        Копировать с года на год
+
+        POST /api/nomenclature-affair/copy-year/{year}
+        """
+        return await self._call(
+            self._op_copy_year,
+            path={'year': year},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/nomenclature-affair/{id}', response=lambda: m.DocumentNomenclatureDto)
+
+    async def delete(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentNomenclatureDto:
+        """
+        Удалить записи id
+
+        DELETE /api/nomenclature-affair/{id}
+        """
+        return await self._call(
+            self._op_delete,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_by_department = Operation('DELETE', 'api/nomenclature-affair/delete-department', response=lambda: m.DocumentNomenclatureDto, body=lambda: list[m.NomenclatureAffairOperationCopyDepDto])
+
+    async def delete_by_department(
+        self,
+        *,
+        body: list[m.NomenclatureAffairOperationCopyDepDto],
+        service_token: Optional[str] = None,
+    ) -> m.DocumentNomenclatureDto:
+        """
+        Удалить записи по году и департаменту
+
+        DELETE /api/nomenclature-affair/delete-department
+        """
+        return await self._call(
+            self._op_delete_by_department,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_by_expiration_year = Operation('DELETE', 'api/nomenclature-affair/expiration-year', response=lambda: m.DocumentNomenclatureDto, body=lambda: m.NomenclatureAffairDeleteRequest)
+
+    async def delete_by_expiration_year(
+        self,
+        *,
+        body: m.NomenclatureAffairDeleteRequest,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentNomenclatureDto:
+        """
+        Удалить по году окончания срока хранения
+
+        DELETE /api/nomenclature-affair/expiration-year
+        """
+        return await self._call(
+            self._op_delete_by_expiration_year,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_by_year = Operation('DELETE', 'api/nomenclature-affair/delete-year', response=lambda: m.DocumentNomenclatureDto, body=lambda: m.NomenclatureAffairDeleteRequest)
+
+    async def delete_by_year(
+        self,
+        *,
+        body: m.NomenclatureAffairDeleteRequest,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentNomenclatureDto:
+        """
+        Удалить по году
+
+        DELETE /api/nomenclature-affair/delete-year
+        """
+        return await self._call(
+            self._op_delete_by_year,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_case_file_cover = Operation('DELETE', 'api/nomenclature-affair/{id}/case-file-cover', binary=True)
+
+    async def delete_case_file_cover(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> bytes:
+        """
+        Удалить файл 'Обложка дела'
+
+        DELETE /api/nomenclature-affair/{id}/case-file-cover
+        """
+        return await self._call(
+            self._op_delete_case_file_cover,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_certification_sheet = Operation('DELETE', 'api/nomenclature-affair/{id}/certification-sheet', binary=True)
+
+    async def delete_certification_sheet(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> bytes:
+        """
+        Удалить файл 'Лист заверитель'
+
+        DELETE /api/nomenclature-affair/{id}/certification-sheet
+        """
+        return await self._call(
+            self._op_delete_certification_sheet,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_mini_document = Operation('DELETE', 'api/nomenclature-affair/{id}/mini-document', body=lambda: m.IdsUUID)
+
+    async def delete_mini_document(
+        self,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список мини документов дела
+
+        DELETE /api/nomenclature-affair/{id}/mini-document
+        """
+        return await self._call(
+            self._op_delete_mini_document,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_dividing = Operation('PUT', 'api/nomenclature-affair/{id}/dividing', response=lambda: m.NomenclatureAffairDto)
+
+    async def dividing(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+        Деление дела на тома (части)
+
+        PUT /api/nomenclature-affair/{id}/dividing
+        """
+        return await self._call(
+            self._op_dividing,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_download_case_file_cover = Operation('GET', 'api/nomenclature-affair/{id}/case-file-cover/download', binary=True)
+
+    def download_case_file_cover(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл 'Обложка дела'
+
+        GET /api/nomenclature-affair/{id}/case-file-cover/download
+        """
+        return self._stream(
+            self._op_download_case_file_cover,
+            path={'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_download_certification_sheet = Operation('GET', 'api/nomenclature-affair/{id}/certification-sheet/download', binary=True)
+
+    def download_certification_sheet(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл 'Лист заверитель'
+
+        GET /api/nomenclature-affair/{id}/certification-sheet/download
+        """
+        return self._stream(
+            self._op_download_certification_sheet,
+            path={'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_expertise = Operation('PUT', 'api/nomenclature-affair/{id}/expertise', response=lambda: m.NomenclatureAffairDto, body=lambda: m.NomenclatureAffairExpertiseRequest)
+
+    async def expertise(
+        self,
+        id: UUID,
+        *,
+        body: m.NomenclatureAffairExpertiseRequest,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+        Поставить/снять экспертизу
+
+        PUT /api/nomenclature-affair/{id}/expertise
+        """
+        return await self._call(
+            self._op_expertise,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_expiration_date = Operation('PUT', 'api/nomenclature-affair/{id}/expiration', response=lambda: m.NomenclatureAffairDto, body=lambda: m.NomenclatureAffairExpirationRequest)
+
+    async def expiration_date(
+        self,
+        id: UUID,
+        *,
+        body: m.NomenclatureAffairExpirationRequest,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+        Изменить срок хранения дела
+
+        PUT /api/nomenclature-affair/{id}/expiration
+        """
+        return await self._call(
+            self._op_expiration_date,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_extract_mini_document = Operation('PUT', 'api/nomenclature-affair/{id}/extract/mini-document', response=lambda: m.NomenclatureAffairDto, body=lambda: m.IdsUUID)
+
+    async def extract_mini_document(
+        self,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+        Извлечение мини документов по массиву ID
+
+        PUT /api/nomenclature-affair/{id}/extract/mini-document
+        """
+        return await self._call(
+            self._op_extract_mini_document,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_11 = Operation('GET', 'api/nomenclature-affair/{id}', response=lambda: m.NomenclatureAffairDto)
+
+    async def get_11(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+        Получить номенклатуру дел по id
+
+        GET /api/nomenclature-affair/{id}
+        """
+        return await self._call(
+            self._op_get_11,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_27 = Operation('GET', 'api/nomenclature-affair/{id}/document', response=lambda: m.DocumentNomenclatureDto)
+
+    async def get_27(
+        self,
+        id: UUID,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentNomenclatureDto:
+        """
+        Получить номенклатуру дел документа
+
+        GET /api/nomenclature-affair/{id}/document
+        """
+        return await self._call(
+            self._op_get_27,
+            path={'id': id},
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/nomenclature-affair/all', response=str)
+
+    async def get_all(
+        self,
+        *,
+        filter: m.NomenclatureAffairFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+
+        GET /api/nomenclature-affair/all
+        """
+        return await self._call(
+            self._op_get_all,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_attachment = Operation('GET', 'api/nomenclature-affair/{id}/attachment', response=lambda: m.NomenclatureAffairDto)
+
+    async def get_attachment(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+        Получить номенклатуру дел по id
+
+        GET /api/nomenclature-affair/{id}/attachment
+        """
+        return await self._call(
+            self._op_get_attachment,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_child_departments = Operation('GET', 'api/nomenclature-affair/departments/child-departments/{id}', response=lambda: m.SliceDtoDepartmentDto)
+
+    async def get_child_departments(
+        self,
+        id: UUID,
+        *,
+        filter: m.DepartmentFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoDepartmentDto:
+        """
+
+        GET /api/nomenclature-affair/departments/child-departments/{id}
+        """
+        return await self._call(
+            self._op_get_child_departments,
+            path={'id': id},
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/nomenclature-affair', response=lambda: m.NomenclatureAffairDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        status: list[str] | None = None,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+        Получить список номенклатуры дел
+
+        GET /api/nomenclature-affair
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'status': status, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_collection_by_department_id = Operation('GET', 'api/nomenclature-affair/by-department/{departmentId}/{year}', response=str)
+
+    async def get_collection_by_department_id(
+        self,
+        department_id: UUID,
+        year: int,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Получить список номенклатур по id департамента
+
+        GET /api/nomenclature-affair/by-department/{departmentId}/{year}
+        """
+        return await self._call(
+            self._op_get_collection_by_department_id,
+            path={'departmentId': department_id, 'year': year},
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_collection_expiration_years = Operation('GET', 'api/nomenclature-affair/years/expiration', response=str)
+
+    async def get_collection_expiration_years(
+        self,
+        *,
+        filter: m.NomenclatureAffairFilter,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Получить список корней (года окончания хранения)
+
+        GET /api/nomenclature-affair/years/expiration
+        """
+        return await self._call(
+            self._op_get_collection_expiration_years,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_collection_funds = Operation('GET', 'api/nomenclature-affair/funds', response=str)
+
+    async def get_collection_funds(
+        self,
+        *,
+        filter: m.NomenclatureAffairFilter,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Получить список корней (фонда)
+
+        GET /api/nomenclature-affair/funds
+        """
+        return await self._call(
+            self._op_get_collection_funds,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_collection_years = Operation('GET', 'api/nomenclature-affair/years', response=str)
+
+    async def get_collection_years(
+        self,
+        *,
+        filter: m.NomenclatureAffairFilter,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Получить список корней (года)
+
+        GET /api/nomenclature-affair/years
+        """
+        return await self._call(
+            self._op_get_collection_years,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_departments = Operation('GET', 'api/nomenclature-affair/departments/extended', response=lambda: m.SliceDtoDepartmentDto)
+
+    async def get_departments(
+        self,
+        *,
+        filter: m.DepartmentFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoDepartmentDto:
+        """
+
+        GET /api/nomenclature-affair/departments/extended
+        """
+        return await self._call(
+            self._op_get_departments,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_document_classes = Operation('GET', 'api/nomenclature-affair/document-classes', response=lambda: m.UnifiedDocumentationSystemDto)
+
+    async def get_document_classes(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.UnifiedDocumentationSystemDto:
+        """
+        Получить класс документа по умолчанию
+
+        GET /api/nomenclature-affair/document-classes
+        """
+        return await self._call(
+            self._op_get_document_classes,
+            service_token=service_token,
+        )
+
+    _op_get_documents = Operation('GET', 'api/nomenclature-affair/{id}/mini-document', response=lambda: m.DocumentNomenclatureDto)
+
+    async def get_documents(
+        self,
+        id: UUID,
+        *,
+        pageable: m.Pageable,
+        filter: m.MiniDocumentFilter,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentNomenclatureDto:
+        """
+        Получить документы дела
+
+        GET /api/nomenclature-affair/{id}/mini-document
+        """
+        return await self._call(
+            self._op_get_documents,
+            path={'id': id},
+            query={'pageable': pageable, 'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_documents_count = Operation('GET', 'api/nomenclature-affair/{id}/mini-document/count', response=int)
+
+    async def get_documents_count(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> int:
+        """
+        Получить количество мини документов в деле
+
+        GET /api/nomenclature-affair/{id}/mini-document/count
+        """
+        return await self._call(
+            self._op_get_documents_count,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_nomenclature_affair_history = Operation('GET', 'api/nomenclature-affair/{id}/history', response=lambda: m.TaskHistoryDto)
+
+    async def get_nomenclature_affair_history(
+        self,
+        id: UUID,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.TaskHistoryDto:
+        """
+        Получить историю изменений по id дела
+
+        GET /api/nomenclature-affair/{id}/history
+        """
+        return await self._call(
+            self._op_get_nomenclature_affair_history,
+            path={'id': id},
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_permission = Operation('GET', 'api/nomenclature-affair/{id}/permission', response=lambda: list[m.NomenclatureAffairPermission])
+
+    async def get_permission(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.NomenclatureAffairPermission]:
+        """
+        Получить пермишены номенклатуры дел по id
+
+        GET /api/nomenclature-affair/{id}/permission
+        """
+        return await self._call(
+            self._op_get_permission,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_roots = Operation('GET', 'api/nomenclature-affair/departments/roots', response=lambda: m.SliceDtoDepartmentDto)
+
+    async def get_roots(
+        self,
+        *,
+        filter: m.DepartmentFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoDepartmentDto:
+        """
+
+        GET /api/nomenclature-affair/departments/roots
+        """
+        return await self._call(
+            self._op_get_roots,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_storage_periods = Operation('GET', 'api/nomenclature-affair/period', response=list[str])
+
+    async def get_storage_periods(
+        self,
+        *,
+        filter: m.NomenclatureAffairFilter,
+        service_token: Optional[str] = None,
+    ) -> list[str]:
+        """
+        Получить список периодов по фильтру
+
+        GET /api/nomenclature-affair/period
+        """
+        return await self._call(
+            self._op_get_storage_periods,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_with_permission = Operation('GET', 'api/nomenclature-affair/{id}/all', response=lambda: m.NomenclatureAffairWithPermission)
+
+    async def get_with_permission(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairWithPermission:
+        """
+        Получить номенклатуру дел по id и пермишены
+
+        GET /api/nomenclature-affair/{id}/all
+        """
+        return await self._call(
+            self._op_get_with_permission,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_mark_delete_list = Operation('DELETE', 'api/nomenclature-affair', body=lambda: m.IdsUUID)
+
+    async def mark_delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список номенклатуры дел
+
+        DELETE /api/nomenclature-affair
+        """
+        return await self._call(
+            self._op_mark_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_move = Operation('PUT', 'api/nomenclature-affair/{id}/move', response=lambda: m.MiniDocumentDto, body=lambda: m.MiniDocumentAffairRequest)
+
+    async def move(
+        self,
+        id: UUID,
+        *,
+        body: m.MiniDocumentAffairRequest,
+        service_token: Optional[str] = None,
+    ) -> m.MiniDocumentDto:
+        """
+        Перемещение документа из одного дела в другое в ручном режиме
+
+        PUT /api/nomenclature-affair/{id}/move
+        """
+        return await self._call(
+            self._op_move,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/nomenclature-affair', response=lambda: m.NomenclatureAffairDto, body=lambda: m.NomenclatureAffairDto)
+
+    async def post(
+        self,
+        *,
+        body: m.NomenclatureAffairDto,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+        Создать новую номенклатуру дел
+
+        POST /api/nomenclature-affair
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_print_case_file_cover = Operation('PUT', 'api/nomenclature-affair/{id}/print-case-file-cover', response=lambda: m.AttachmentDto, body=lambda: m.CaseFileCoverRequest)
+
+    async def print_case_file_cover(
+        self,
+        id: UUID,
+        *,
+        body: m.CaseFileCoverRequest,
+        service_token: Optional[str] = None,
+    ) -> m.AttachmentDto:
+        """
+        Распечатать обложку дела по шаблону
+
+        PUT /api/nomenclature-affair/{id}/print-case-file-cover
+        """
+        return await self._call(
+            self._op_print_case_file_cover,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_print_certification_sheet = Operation('PUT', 'api/nomenclature-affair/{id}/print-certification-sheet', response=lambda: m.AttachmentDto, body=lambda: m.CertificationSheetRequest)
+
+    async def print_certification_sheet(
+        self,
+        id: UUID,
+        *,
+        body: m.CertificationSheetRequest,
+        service_token: Optional[str] = None,
+    ) -> m.AttachmentDto:
+        """
+        Распечатать лист заверитель по шаблону
+
+        PUT /api/nomenclature-affair/{id}/print-certification-sheet
+        """
+        return await self._call(
+            self._op_print_certification_sheet,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/nomenclature-affair/{id}', response=lambda: m.NomenclatureAffairDto, body=lambda: m.NomenclatureAffairDto)
+
+    async def put(
+        self,
+        id: UUID,
+        *,
+        body: m.NomenclatureAffairDto,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+        Изменить номенклатуру дел
+
+        PUT /api/nomenclature-affair/{id}
+        """
+        return await self._call(
+            self._op_put,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_shelving_shelve = Operation('PUT', 'api/nomenclature-affair/{id}/shelving-shelve', response=lambda: m.NomenclatureAffairDto, body=lambda: m.NomenclatureAffairShelvingShelveRequest)
+
+    async def shelving_shelve(
+        self,
+        id: UUID,
+        *,
+        body: m.NomenclatureAffairShelvingShelveRequest,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairDto:
+        """
+        Изменить стеллажи и полки для бумажного дела в статусе 'Архивное'
+
+        PUT /api/nomenclature-affair/{id}/shelving-shelve
+        """
+        return await self._call(
+            self._op_shelving_shelve,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_upload_case_file_cover = Operation('POST', 'api/nomenclature-affair/{id}/case-file-cover', response=lambda: m.Template, multipart=True)
+
+    async def upload_case_file_cover(
+        self,
+        id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> m.Template:
+        """
+        Загрузить файл 'Обложка дела'
+
+        POST /api/nomenclature-affair/{id}/case-file-cover
+        """
+        return await self._call(
+            self._op_upload_case_file_cover,
+            path={'id': id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_certification_sheet = Operation('POST', 'api/nomenclature-affair/{id}/certification-sheet', response=lambda: m.Template, multipart=True)
+
+    async def upload_certification_sheet(
+        self,
+        id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> m.Template:
+        """
+        Загрузить файл 'Лист заверитель'
+
+        POST /api/nomenclature-affair/{id}/certification-sheet
+        """
+        return await self._call(
+            self._op_upload_certification_sheet,
+            path={'id': id},
+            body=files,
+            service_token=service_token,
+        )
+
+
+class NomenklaturnyeStellazhiIPolkiApi(ApiGroup):
+    """
+    Номенклатурные стеллажи и полки
+    API для работы со справочником «Стеллажи и полки»
+    Константы для получения истории: NOMENCLATURE_SHELVING_SHELVE
+    """
+
+    _op_get = Operation('GET', 'api/nomenclature-shelving-shelve/{id}', response=lambda: m.NomenclatureShelvingShelveDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        filter: m.NomenclatureShelvingShelveFilter,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureShelvingShelveDto:
+        """
+        Получить стеллаж или полку по ID
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_NOMENCLATURE_SHELVING_SHELVE
+
+        GET /api/nomenclature-shelving-shelve/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/nomenclature-shelving-shelve', response=lambda: m.NomenclatureShelvingShelveDto)
+
+    async def get_collection(
+        self,
+        *,
+        filter: m.NomenclatureShelvingShelveFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureShelvingShelveDto:
+        """
+        Получить список стеллажей и полок
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_NOMENCLATURE_SHELVING_SHELVE
+
+        GET /api/nomenclature-shelving-shelve
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_mark_delete_list = Operation('DELETE', 'api/nomenclature-shelving-shelve', body=lambda: m.IdsUUID)
+
+    async def mark_delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку об удалении для списка стеллажей и полок по ID
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_NOMENCLATURE_SHELVING_SHELVE
+
+        DELETE /api/nomenclature-shelving-shelve
+        """
+        return await self._call(
+            self._op_mark_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/nomenclature-shelving-shelve', response=lambda: m.NomenclatureShelvingShelveDto, body=lambda: m.NomenclatureShelvingShelveRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.NomenclatureShelvingShelveRequest,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureShelvingShelveDto:
+        """
+        Создать новый стеллаж или полку
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_NOMENCLATURE_SHELVING_SHELVE
+
+        POST /api/nomenclature-shelving-shelve
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/nomenclature-shelving-shelve', response=lambda: m.NomenclatureShelvingShelveDto, body=lambda: m.NomenclatureShelvingShelveRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.NomenclatureShelvingShelveRequest,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureShelvingShelveDto:
+        """
+        Изменить существующий стеллаж или полку
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_NOMENCLATURE_SHELVING_SHELVE
+
+        PUT /api/nomenclature-shelving-shelve
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class NomenklaturyDelPodrazdeleniiaApi(ApiGroup):
+    """
+    Номенклатуры дел подразделения
+    API для работы c номенклатурами дел подразделения
+    """
+
+    _op_agreement = Operation('PUT', 'api/nomenclature-department/{id}/process/{itemId}/agreement', response=dict[str, Any], body=lambda: m.NumDepSimpleProcessAction)
+
+    async def agreement(
+        self,
+        id: UUID,
+        item_id: UUID,
+        *,
+        body: m.NumDepSimpleProcessAction,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Согласовать
+
+        Для доступа к этому API необходимо: [NOMENCLATURE_DEPARTMENT_AGREEMENT]
+
+        PUT /api/nomenclature-department/{id}/process/{itemId}/agreement
+        """
+        return await self._call(
+            self._op_agreement,
+            path={'id': id, 'itemId': item_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_cancel = Operation('PUT', 'api/nomenclature-department/{id}/cancel', body=lambda: m.NomenclatureDepartmentCancelRequest)
+
+    async def cancel(
+        self,
+        id: UUID,
+        *,
+        body: m.NomenclatureDepartmentCancelRequest,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Аннулировать оптсь СП
+
+        Для доступа к этому API необходимо: [NOMENCLATURE_DEPARTMENT_CANCEL]
+
+        PUT /api/nomenclature-department/{id}/cancel
+        """
+        return await self._call(
+            self._op_cancel,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create = Operation('POST', 'api/nomenclature-department', response=lambda: m.NomenclatureDepartmentDto, body=lambda: m.NomenclatureDepartmentRequest)
+
+    async def create(
+        self,
+        *,
+        body: m.NomenclatureDepartmentRequest,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureDepartmentDto:
+        """
+        Создать номенклатуру дел подразделения
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_NOMENCLATURE_DEPARTMENT
+
+        POST /api/nomenclature-department
+        """
+        return await self._call(
+            self._op_create,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/nomenclature-department', body=lambda: m.IdsUUID)
+
+    async def delete(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список номенклатур подразделений
+
+        DELETE /api/nomenclature-department
+        """
+        return await self._call(
+            self._op_delete,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_by_year = Operation('DELETE', 'api/nomenclature-department/delete-year', response=lambda: m.DocumentNomenclatureDto, body=lambda: m.IdsInteger)
+
+    async def delete_by_year(
+        self,
+        *,
+        body: m.IdsInteger,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentNomenclatureDto:
+        """
+        Удалить по году
+
+        DELETE /api/nomenclature-department/delete-year
+        """
+        return await self._call(
+            self._op_delete_by_year,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_download_empty_template = Operation('GET', 'api/nomenclature-department/template/download', binary=True)
+
+    def download_empty_template(
+        self,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Скачать шаблон номенклатуры дел подразделения
+
+        GET /api/nomenclature-department/template/download
+        """
+        return self._stream(
+            self._op_download_empty_template,
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_download_filled_template = Operation('GET', 'api/nomenclature-department/{id}/template/download', binary=True)
+
+    def download_filled_template(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Скачать заполненный шаблон номенклатуры
+
+        GET /api/nomenclature-department/{id}/template/download
+        """
+        return self._stream(
+            self._op_download_filled_template,
+            path={'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_execute = Operation('PUT', 'api/nomenclature-department/{id}', response=lambda: m.NomenclatureDepartmentDto, body=lambda: list[m.NomDepOperation])
+
+    async def execute(
+        self,
+        id: UUID,
+        *,
+        body: list[m.NomDepOperation],
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureDepartmentDto:
+        """
+        Изменить номенклатуру дел подразделения
+
+        PUT /api/nomenclature-department/{id}
+        """
+        return await self._call(
+            self._op_execute,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/nomenclature-department/{id}', response=lambda: m.NomenclatureDepartmentDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureDepartmentDto:
+        """
+        Получить номенклатуру дел подразделения по id
+
+        Для доступа к этому API необходимо: [NOMENCLATURE_DEPARTMENT_READ]
+
+        GET /api/nomenclature-department/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_child_departments = Operation('GET', 'api/nomenclature-department/departments/child-departments/{id}', response=lambda: m.SliceDtoDepartmentDto)
+
+    async def get_child_departments(
+        self,
+        id: UUID,
+        *,
+        filter: m.DepartmentFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoDepartmentDto:
+        """
+
+        GET /api/nomenclature-department/departments/child-departments/{id}
+        """
+        return await self._call(
+            self._op_get_child_departments,
+            path={'id': id},
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/nomenclature-department', response=lambda: m.NomenclatureDepartmentDto)
+
+    async def get_collection(
+        self,
+        *,
+        filter: m.NomenclatureDepartmentFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureDepartmentDto:
+        """
+        Получить список номенклатур дел подразделения
+
+        GET /api/nomenclature-department
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_collection_years = Operation('GET', 'api/nomenclature-department/years', response=str)
+
+    async def get_collection_years(
+        self,
+        *,
+        filter: m.NomenclatureDepartmentFilter,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Получить список корней (года)
+
+        GET /api/nomenclature-department/years
+        """
+        return await self._call(
+            self._op_get_collection_years,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_departments = Operation('GET', 'api/nomenclature-department/departments/extended', response=lambda: m.SliceDtoDepartmentDto)
+
+    async def get_departments(
+        self,
+        *,
+        filter: m.DepartmentFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoDepartmentDto:
+        """
+
+        GET /api/nomenclature-department/departments/extended
+        """
+        return await self._call(
+            self._op_get_departments,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_executors = Operation('GET', 'api/nomenclature-department/process/{id}/executor', response=lambda: m.NomenclatureDepartmentProcessExecutorDto)
+
+    async def get_executors(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureDepartmentProcessExecutorDto:
+        """
+        Получить исполнителей этапа
+
+        Для доступа к этому API необходимо: [NOMENCLATURE_DEPARTMENT_READ]
+
+        GET /api/nomenclature-department/process/{id}/executor
+        """
+        return await self._call(
+            self._op_get_executors,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_permission = Operation('GET', 'api/nomenclature-department/{id}/permission', response=lambda: list[m.NomenclatureDepartmentPermission])
+
+    async def get_permission(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.NomenclatureDepartmentPermission]:
+        """
+        Получить пермишены номенклатуру дел подразделения по id
+
+        GET /api/nomenclature-department/{id}/permission
+        """
+        return await self._call(
+            self._op_get_permission,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_roots = Operation('GET', 'api/nomenclature-department/departments/roots', response=lambda: m.SliceDtoDepartmentDto)
+
+    async def get_roots(
+        self,
+        *,
+        filter: m.DepartmentFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoDepartmentDto:
+        """
+
+        GET /api/nomenclature-department/departments/roots
+        """
+        return await self._call(
+            self._op_get_roots,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_with_permission = Operation('GET', 'api/nomenclature-department/{id}/all', response=lambda: m.NomenclatureDepartmentWithPermission)
+
+    async def get_with_permission(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureDepartmentWithPermission:
+        """
+        Получить номенклатуру дел подразделения по id и пермишены
+
+        GET /api/nomenclature-department/{id}/all
+        """
+        return await self._call(
+            self._op_get_with_permission,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_history = Operation('GET', 'api/nomenclature-department/{id}/history', response=lambda: m.NomenclatureDepartmentHistoryDto)
+
+    async def history(
+        self,
+        id: UUID,
+        *,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureDepartmentHistoryDto:
+        """
+        Получить историю номенклатуры дел подразделения
+
+        GET /api/nomenclature-department/{id}/history
+        """
+        return await self._call(
+            self._op_history,
+            path={'id': id},
+            query={'p': p},
+            service_token=service_token,
+        )
+
+    _op_signing = Operation('PUT', 'api/nomenclature-department/{id}/process/{itemId}/signing', response=dict[str, Any], body=lambda: m.NumDepSimpleProcessAction)
+
+    async def signing(
+        self,
+        id: UUID,
+        item_id: UUID,
+        *,
+        body: m.NumDepSimpleProcessAction,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Подписать без эцп
+
+        Для доступа к этому API необходимо: [NOMENCLATURE_DEPARTMENT_SIGNING]
+
+        PUT /api/nomenclature-department/{id}/process/{itemId}/signing
+        """
+        return await self._call(
+            self._op_signing,
+            path={'id': id, 'itemId': item_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_start = Operation('PUT', 'api/nomenclature-department/{id}/start', response=lambda: m.NomenclatureDepartmentDto)
+
+    async def start(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureDepartmentDto:
+        """
+        Отправка на маршрут номенклатуру дел подразделения
+
+        Для доступа к этому API необходимо: [NOMENCLATURE_DEPARTMENT_START]
+
+        PUT /api/nomenclature-department/{id}/start
+        """
+        return await self._call(
+            self._op_start,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_upload_template = Operation('POST', 'api/nomenclature-department/{id}/template/upload', response=lambda: m.NomenclatureDepartmentDto)
+
+    async def upload_template(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureDepartmentDto:
+        """
+        Загрузить заполненный шаблон номенклатуры
+
+        POST /api/nomenclature-department/{id}/template/upload
+        """
+        return await self._call(
+            self._op_upload_template,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+
+class ObektInvestprogrammyApi(ApiGroup):
+    """
+    Объект инвестпрограммы
+    API для работы с объектами инвестпрограмм
+    Константы для получения истории: INVESTMENT_PROGRAM
+    """
+
+    _op_delete = Operation('DELETE', 'api/investment-program', body=lambda: m.IdsUUID)
+
+    async def delete(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список объектов инвестпрограмм
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_INVESTMENT_PROGRAM
+
+        DELETE /api/investment-program
+        """
+        return await self._call(
+            self._op_delete,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/investment-program/{id}', response=lambda: m.InvestmentProgramDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.InvestmentProgramDto:
+        """
+        Получить объект инвестпрограммы по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_INVESTMENT_PROGRAM
+
+        GET /api/investment-program/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/investment-program', response=lambda: m.InvestmentProgramDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.InvestmentProgramDto:
+        """
+        Получить список объектов инвестпрограмм
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_INVESTMENT_PROGRAM
+
+        GET /api/investment-program
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/investment-program', response=lambda: m.InvestmentProgramDto, body=lambda: m.InvestmentProgramRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.InvestmentProgramRequest,
+        service_token: Optional[str] = None,
+    ) -> m.InvestmentProgramDto:
+        """
+        Создать новый объект инвестпрограммы
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_INVESTMENT_PROGRAM
+
+        POST /api/investment-program
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/investment-program', response=lambda: m.InvestmentProgramDto, body=lambda: m.InvestmentProgramRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.InvestmentProgramRequest,
+        service_token: Optional[str] = None,
+    ) -> m.InvestmentProgramDto:
+        """
+        Изменить объект инвестпрограммы
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_INVESTMENT_PROGRAM
+
+        PUT /api/investment-program
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class OblastiApi(ApiGroup):
+    """
+    Области
+    API для работы с областями
+    Константы для получения истории: REGION
+    """
+
+    _op_fts_name = Operation('GET', 'api/region/fts-name', response=lambda: m.RegionDto)
+
+    async def fts_name(
+        self,
+        *,
+        fts: str,
+        service_token: Optional[str] = None,
+    ) -> m.RegionDto:
+        """
+        Полнотекстовый поиск области по названию
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_REGION
+
+        GET /api/region/fts-name
+        """
+        return await self._call(
+            self._op_fts_name,
+            query={'fts': fts},
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/region/{id}', response=lambda: m.RegionDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.RegionDto:
+        """
+        Получить область по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_REGION
+
+        GET /api/region/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/region', response=lambda: m.RegionDto)
+
+    async def get_collection(
+        self,
+        *,
+        list_attribute: bool,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.RegionDto:
+        """
+        Получить список областей через Slice либо List
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_REGION
+
+        GET /api/region
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'listAttribute': list_attribute, 'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_mark_delete_list = Operation('DELETE', 'api/region', body=lambda: m.IdsUUID)
+
+    async def mark_delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку об удалении для списка областей по ids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_REGION
+
+        DELETE /api/region
+        """
+        return await self._call(
+            self._op_mark_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/region', response=lambda: m.RegionDto, body=lambda: m.RegionDto)
+
+    async def post(
+        self,
+        *,
+        body: m.RegionDto,
+        service_token: Optional[str] = None,
+    ) -> m.RegionDto:
+        """
+        Создать новую область
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_REGION
+
+        POST /api/region
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/region', response=lambda: m.RegionDto, body=lambda: m.RegionDto)
+
+    async def put(
+        self,
+        *,
+        body: m.RegionDto,
+        service_token: Optional[str] = None,
+    ) -> m.RegionDto:
+        """
+        Изменить область
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_REGION
+
+        PUT /api/region
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class ObshchaiaNastroikaDokumentaSedApi(ApiGroup):
+    """
+    Общая настройка документа СЭД
+    API для работы с общими настройками документа СЭД
+    Константы для получения истории: GENERAL_SETUP, TEMPLATE
+    """
+
+    _op_delete_file_sign = Operation('DELETE', 'api/general-setup/delete-file-sign', response=str)
+
+    async def delete_file_sign(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Удалить изображение подписи ЭЦП
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_GENERAL_SETUP
+
+        DELETE /api/general-setup/delete-file-sign
+        """
+        return await self._call(
+            self._op_delete_file_sign,
+            service_token=service_token,
+        )
+
+    _op_download_file_sign = Operation('GET', 'api/general-setup/download-file-sign', binary=True)
+
+    def download_file_sign(
+        self,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Скачать изображение подписи ЭЦП
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_GENERAL_SETUP
+
+        GET /api/general-setup/download-file-sign
+        """
+        return self._stream(
+            self._op_download_file_sign,
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_get_16 = Operation('GET', 'api/general-setup', response=lambda: m.GeneralSetupDto)
+
+    async def get_16(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.GeneralSetupDto:
+        """
+        Получить общую настройку документа СЭД (organizationId достается из CustomUserDetails)
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_GENERAL_SETUP
+
+        GET /api/general-setup
+        """
+        return await self._call(
+            self._op_get_16,
+            service_token=service_token,
+        )
+
+    _op_get_60 = Operation('GET', 'api/general-setup/{id}', response=lambda: m.GeneralSetupDto)
+
+    async def get_60(
+        self,
+        id: str,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.GeneralSetupDto:
+        """
+        Получить общую настройку документа СЭД
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_GENERAL_SETUP
+
+        GET /api/general-setup/{id}
+        """
+        return await self._call(
+            self._op_get_60,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/general-setup/all-org', response=lambda: list[m.GeneralSetupDto])
+
+    async def get_all(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.GeneralSetupDto]:
+        """
+        Получить список общих настроек документа СЭД (реально всех)
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_GENERAL_SETUP
+
+        GET /api/general-setup/all-org
+        """
+        return await self._call(
+            self._op_get_all,
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/general-setup/all', response=lambda: m.SliceDtoGeneralSetupDto)
+
+    async def get_collection(
+        self,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoGeneralSetupDto:
+        """
+        Получить список общих настроек документа СЭД
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_GENERAL_SETUP
+
+        GET /api/general-setup/all
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/general-setup', response=lambda: m.GeneralSetupDto, body=lambda: m.GeneralSetupRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.GeneralSetupRequest,
+        service_token: Optional[str] = None,
+    ) -> m.GeneralSetupDto:
+        """
+        Создать новую общую настройку документа СЭД
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_GENERAL_SETUP
+
+        POST /api/general-setup
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/general-setup', response=lambda: m.GeneralSetupDto, body=lambda: m.GeneralSetupRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.GeneralSetupRequest,
+        service_token: Optional[str] = None,
+    ) -> m.GeneralSetupDto:
+        """
+        Изменить общую настройку документа СЭД
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_GENERAL_SETUP
+
+        PUT /api/general-setup
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_reindex = Operation('PUT', 'api/general-setup/reindex/{schema}', response=lambda: m.GeneralSetupDto)
+
+    async def reindex(
+        self,
+        schema: str,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.GeneralSetupDto:
+        """
+        Переиндексировать ES
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_GENERAL_SETUP
+
+        PUT /api/general-setup/reindex/{schema}
+        """
+        return await self._call(
+            self._op_reindex,
+            path={'schema': schema},
+            service_token=service_token,
+        )
+
+    _op_upload_file_sign = Operation('POST', 'api/general-setup/upload-file-sign', response=lambda: m.Template, multipart=True)
+
+    async def upload_file_sign(
+        self,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> m.Template:
+        """
+        Загрузить изображение подписи ЭЦП
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_GENERAL_SETUP
+
+        POST /api/general-setup/upload-file-sign
+        """
+        return await self._call(
+            self._op_upload_file_sign,
+            body=files,
+            service_token=service_token,
+        )
+
+
+class OpisStrukturnykhPodrazdeleniiOpisSpApi(ApiGroup):
+    """
+    Опись структурных подразделений (опись СП)
+    API для работы с описью структурных подразделений (опись СП)
+    """
+
+    _op_agreement = Operation('PUT', 'api/acceptance-inventory/{id}/process/{itemId}/agreement', response=dict[str, Any], body=lambda: m.AcceptanceInventoryProcessAction)
+
+    async def agreement(
+        self,
+        id: UUID,
+        item_id: UUID,
+        *,
+        body: m.AcceptanceInventoryProcessAction,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Выполнить действие согласования в описи СП
+
+        PUT /api/acceptance-inventory/{id}/process/{itemId}/agreement
+        """
+        return await self._call(
+            self._op_agreement,
+            path={'id': id, 'itemId': item_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_cancel = Operation('PUT', 'api/acceptance-inventory/{id}/cancel', body=lambda: m.AcceptanceInventoryCancelRequest)
+
+    async def cancel(
+        self,
+        id: UUID,
+        *,
+        body: m.AcceptanceInventoryCancelRequest,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Аннулировать оптсь СП
+
+        PUT /api/acceptance-inventory/{id}/cancel
+        """
+        return await self._call(
+            self._op_cancel,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_conversion = Operation('PUT', 'api/acceptance-inventory/{id}/conversion', response=lambda: m.AcceptanceInventoryDataDto)
+
+    async def conversion(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AcceptanceInventoryDataDto:
+        """
+        Сформировать опись СП
+
+        PUT /api/acceptance-inventory/{id}/conversion
+        """
+        return await self._call(
+            self._op_conversion,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_create_by_affairs = Operation('POST', 'api/acceptance-inventory', response=lambda: m.AcceptanceInventoryDataDto, body=lambda: m.AcceptanceInventoryDataRequest)
+
+    async def create_by_affairs(
+        self,
+        *,
+        body: m.AcceptanceInventoryDataRequest,
+        service_token: Optional[str] = None,
+    ) -> m.AcceptanceInventoryDataDto:
+        """
+        Создать опись СП
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_ACCEPTANCE_INVENTORY
+
+        POST /api/acceptance-inventory
+        """
+        return await self._call(
+            self._op_create_by_affairs,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create_by_years = Operation('POST', 'api/acceptance-inventory/year', response=lambda: m.AcceptanceInventoryDataDto, body=lambda: m.AcceptanceInventoryDataRequest)
+
+    async def create_by_years(
+        self,
+        *,
+        body: m.AcceptanceInventoryDataRequest,
+        service_token: Optional[str] = None,
+    ) -> m.AcceptanceInventoryDataDto:
+        """
+        Создать опись СП по выбранным годам
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_ACCEPTANCE_INVENTORY
+
+        POST /api/acceptance-inventory/year
+        """
+        return await self._call(
+            self._op_create_by_years,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_deconversion = Operation('PUT', 'api/acceptance-inventory/{id}/deconversion', response=dict[str, Any])
+
+    async def deconversion(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Расформировать опись СП
+
+        PUT /api/acceptance-inventory/{id}/deconversion
+        """
+        return await self._call(
+            self._op_deconversion,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_dispatch_1 = Operation('POST', 'api/acceptance-inventory/{id}/nces/dispatch', response=dict[str, Any])
+
+    async def dispatch_1(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Создать задачу отправки описи СП в вендомственный архив НЦЭУ
+
+        POST /api/acceptance-inventory/{id}/nces/dispatch
+        """
+        return await self._call(
+            self._op_dispatch_1,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_dispatch_2 = Operation('POST', 'api/acceptance-inventory/nces/dispatch', response=dict[str, Any], body=lambda: m.IdsUUID)
+
+    async def dispatch_2(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Создать задачу отправки описи СП в вендомственный архив НЦЭУ
+
+        POST /api/acceptance-inventory/nces/dispatch
+        """
+        return await self._call(
+            self._op_dispatch_2,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_execute = Operation('POST', 'api/acceptance-inventory/{id}/execute', response=dict[str, Any], body=lambda: list[m.AcceptanceInventoryOperation])
+
+    async def execute(
+        self,
+        id: UUID,
+        *,
+        body: list[m.AcceptanceInventoryOperation],
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Выполнить операции над описью СП
+
+        POST /api/acceptance-inventory/{id}/execute
+        """
+        return await self._call(
+            self._op_execute,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/acceptance-inventory/{id}', response=lambda: m.AcceptanceInventoryDataDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AcceptanceInventoryDataDto:
+        """
+        Получить опись СП по ID
+
+        GET /api/acceptance-inventory/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_acceptance_base64 = Operation('GET', 'api/acceptance-inventory/{id}/base64', binary=True)
+
+    def get_acceptance_base64(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Получить base64 файла
+
+        GET /api/acceptance-inventory/{id}/base64
+        """
+        return self._stream(
+            self._op_get_acceptance_base64,
+            path={'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_get_affairs = Operation('GET', 'api/acceptance-inventory/{id}/affair', response=lambda: m.AcceptanceInventoryDataDto)
+
+    async def get_affairs(
+        self,
+        id: UUID,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.AcceptanceInventoryDataDto:
+        """
+        Получить дела по id описи
+
+        GET /api/acceptance-inventory/{id}/affair
+        """
+        return await self._call(
+            self._op_get_affairs,
+            path={'id': id},
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/acceptance-inventory', response=lambda: m.AcceptanceInventoryDataDto)
+
+    async def get_all(
+        self,
+        *,
+        filter: m.AcceptanceInventoryDataFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.AcceptanceInventoryDataDto:
+        """
+        Получить список описей СП
+
+        GET /api/acceptance-inventory
+        """
+        return await self._call(
+            self._op_get_all,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_by_acceptance = Operation('GET', 'api/acceptance-inventory/{id}/acceptance', response=lambda: m.SliceDtoInnerInventoryDataDto)
+
+    async def get_by_acceptance(
+        self,
+        id: UUID,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoInnerInventoryDataDto:
+        """
+
+        GET /api/acceptance-inventory/{id}/acceptance
+        """
+        return await self._call(
+            self._op_get_by_acceptance,
+            path={'id': id},
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_departments = Operation('GET', 'api/acceptance-inventory/department', response=lambda: m.AcceptanceInventoryDataDto)
+
+    async def get_departments(
+        self,
+        *,
+        filter: m.AcceptanceInventoryDataFilter,
+        service_token: Optional[str] = None,
+    ) -> m.AcceptanceInventoryDataDto:
+        """
+        Получить подразделения описей СП
+
+        GET /api/acceptance-inventory/department
+        """
+        return await self._call(
+            self._op_get_departments,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_executors = Operation('GET', 'api/acceptance-inventory/process/{id}/executor', response=lambda: m.AcceptanceInventoryProcessExecutorDto)
+
+    async def get_executors(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AcceptanceInventoryProcessExecutorDto:
+        """
+        Получить исполнителей этапа
+
+        GET /api/acceptance-inventory/process/{id}/executor
+        """
+        return await self._call(
+            self._op_get_executors,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_permission = Operation('GET', 'api/acceptance-inventory/{id}/permission', response=lambda: list[m.AcceptanceInventoryPermission])
+
+    async def get_permission(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.AcceptanceInventoryPermission]:
+        """
+        Получить пермишены описи СП по id
+
+        GET /api/acceptance-inventory/{id}/permission
+        """
+        return await self._call(
+            self._op_get_permission,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_status_reject_cancel = Operation('GET', 'api/acceptance-inventory/status', response=lambda: m.AcceptanceInventoryDataDto)
+
+    async def get_status_reject_cancel(
+        self,
+        *,
+        filter: m.AcceptanceInventoryDataFilter,
+        service_token: Optional[str] = None,
+    ) -> m.AcceptanceInventoryDataDto:
+        """
+        Получить статусы «Отклонен» и «Аннулирован» для описей СП
+
+        GET /api/acceptance-inventory/status
+        """
+        return await self._call(
+            self._op_get_status_reject_cancel,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_with_permission = Operation('GET', 'api/acceptance-inventory/{id}/all', response=lambda: m.AcceptanceInventoryWithPermission)
+
+    async def get_with_permission(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AcceptanceInventoryWithPermission:
+        """
+        Получить опись СП по id и пермишены
+
+        GET /api/acceptance-inventory/{id}/all
+        """
+        return await self._call(
+            self._op_get_with_permission,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_years = Operation('GET', 'api/acceptance-inventory/year', response=lambda: m.AcceptanceInventoryDataDto)
+
+    async def get_years(
+        self,
+        *,
+        filter: m.AcceptanceInventoryDataFilter,
+        service_token: Optional[str] = None,
+    ) -> m.AcceptanceInventoryDataDto:
+        """
+        Получить года описей СП
+
+        GET /api/acceptance-inventory/year
+        """
+        return await self._call(
+            self._op_get_years,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_history = Operation('GET', 'api/acceptance-inventory/{id}/history', response=lambda: m.SliceDtoAcceptanceInventoryHistoryDto)
+
+    async def history(
+        self,
+        id: UUID,
+        *,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoAcceptanceInventoryHistoryDto:
+        """
+        Получить историю описи СП
+
+        GET /api/acceptance-inventory/{id}/history
+        """
+        return await self._call(
+            self._op_history,
+            path={'id': id},
+            query={'p': p},
+            service_token=service_token,
+        )
+
+    _op_kancler_dispatch = Operation('POST', 'api/acceptance-inventory/kancler/dispatch', response=dict[str, Any], body=lambda: m.AcceptanceKanclerArchiveRequest)
+
+    async def kancler_dispatch(
+        self,
+        *,
+        body: m.AcceptanceKanclerArchiveRequest,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Создать задачу отправки описи СП
+
+        POST /api/acceptance-inventory/kancler/dispatch
+        """
+        return await self._call(
+            self._op_kancler_dispatch,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_save_acceptance_bytes = Operation('PUT', 'api/acceptance-inventory/{id}/sign', response=dict[str, Any], body=lambda: m.SimpleCmsDTO)
+
+    async def save_acceptance_bytes(
+        self,
+        id: UUID,
+        *,
+        body: m.SimpleCmsDTO,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Прикрепить ЭЦП в файл
+
+        PUT /api/acceptance-inventory/{id}/sign
+        """
+        return await self._call(
+            self._op_save_acceptance_bytes,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_signing = Operation('PUT', 'api/acceptance-inventory/{id}/process/{itemId}/signing', response=dict[str, Any], body=lambda: m.AcceptanceInventoryProcessAction)
+
+    async def signing(
+        self,
+        id: UUID,
+        item_id: UUID,
+        *,
+        body: m.AcceptanceInventoryProcessAction,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Выполнить действие подписания в описи СП
+
+        PUT /api/acceptance-inventory/{id}/process/{itemId}/signing
+        """
+        return await self._call(
+            self._op_signing,
+            path={'id': id, 'itemId': item_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_start = Operation('PUT', 'api/acceptance-inventory/{id}/start', response=dict[str, Any])
+
+    async def start(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Отправка на маршрут описи СП
+
+        PUT /api/acceptance-inventory/{id}/start
+        """
+        return await self._call(
+            self._op_start,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_statement = Operation('PUT', 'api/acceptance-inventory/{id}/process/{itemId}/statement', response=dict[str, Any], body=lambda: m.AcceptanceInventoryProcessAction)
+
+    async def statement(
+        self,
+        id: UUID,
+        item_id: UUID,
+        *,
+        body: m.AcceptanceInventoryProcessAction,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Выполнить действие утверждения в описи СП
+
+        PUT /api/acceptance-inventory/{id}/process/{itemId}/statement
+        """
+        return await self._call(
+            self._op_statement,
+            path={'id': id, 'itemId': item_id},
+            body=body,
+            service_token=service_token,
+        )
+
+
+class OtchetyApi(ApiGroup):
+    """
+    Отчеты
+    API для работы с отчетами
+    """
+
+    _op_delete = Operation('DELETE', 'api/report/{id}')
+
+    async def delete(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить сформированный отчет по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_REPORT
+
+        DELETE /api/report/{id}
+        """
+        return await self._call(
+            self._op_delete,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_list = Operation('DELETE', 'api/report', body=lambda: m.IdsUUID)
+
+    async def delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить сформированные отчеты по массиву id
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_REPORT
+
+        DELETE /api/report
+        """
+        return await self._call(
+            self._op_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_download = Operation('GET', 'api/report/{id}/download', response=lambda: m.Report)
+
+    async def download(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.Report:
+        """
+        Скачать сформированный отчет по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_REPORT
+
+        GET /api/report/{id}/download
+        """
+        return await self._call(
+            self._op_download,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/report/{id}', response=lambda: m.Report)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.Report:
+        """
+        Получить сформированный отчет по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_REPORT
+
+        GET /api/report/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_construct_report_task_control_xlsx = Operation('POST', 'api/report/task-control', response=lambda: m.Report, body=dict[str, str])
+
+    async def get_construct_report_task_control_xlsx(
+        self,
+        *,
+        body: dict[str, str] | None = None,
+        service_token: Optional[str] = None,
+    ) -> m.Report:
+        """
+        Формирование отчета 'Данные о количестве исполненных и не исполненных контрольных поручений' по конструктору
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_REPORT
+
+        POST /api/report/task-control
+        """
+        return await self._call(
+            self._op_get_construct_report_task_control_xlsx,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_construct_report_xlsx = Operation('POST', 'api/report/construct-report/{type}', response=lambda: m.Report, body=lambda: m.ReportConstructorDto)
+
+    async def get_construct_report_xlsx(
+        self,
+        type: str,
+        *,
+        body: m.ReportConstructorDto,
+        service_token: Optional[str] = None,
+    ) -> m.Report:
+        """
+        Формирование отчета по конструктору
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_REPORT
+
+        POST /api/report/construct-report/{type}
+        """
+        return await self._call(
+            self._op_get_construct_report_xlsx,
+            path={'type': type},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_document_on_control = Operation('POST', 'api/report/document-on-control', response=lambda: m.Report, body=lambda: m.DocumentOnControlReportFilter)
+
+    async def get_document_on_control(
+        self,
+        *,
+        body: m.DocumentOnControlReportFilter,
+        service_token: Optional[str] = None,
+    ) -> m.Report:
+        """
+        Формирование отчета по всем контрольным документам за период
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_REPORT
+
+        POST /api/report/document-on-control
+        """
+        return await self._call(
+            self._op_get_document_on_control,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_document_on_registration = Operation('POST', 'api/report/document-on-registration', response=lambda: m.Report, body=lambda: m.DocumentOnRegistrationReportFilter)
+
+    async def get_document_on_registration(
+        self,
+        *,
+        body: m.DocumentOnRegistrationReportFilter,
+        service_token: Optional[str] = None,
+    ) -> m.Report:
+        """
+        Формирование отчета по всем зарегистрированным документам за период
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_REPORT
+
+        POST /api/report/document-on-registration
+        """
+        return await self._call(
+            self._op_get_document_on_registration,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_document_on_status = Operation('POST', 'api/report/document-on-status', response=lambda: m.Report, body=lambda: m.DocumentOnStatusReportFilter)
+
+    async def get_document_on_status(
+        self,
+        *,
+        body: m.DocumentOnStatusReportFilter,
+        service_token: Optional[str] = None,
+    ) -> m.Report:
+        """
+        Формирование отчета по статусам документов за период
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_REPORT
+
+        POST /api/report/document-on-status
+        """
+        return await self._call(
+            self._op_get_document_on_status,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_generated_reports = Operation('GET', 'api/report/generated-reports', response=lambda: m.ReportDto)
+
+    async def get_generated_reports(
+        self,
+        *,
+        pageable: m.Pageable,
+        request: m.ReportFilter,
+        service_token: Optional[str] = None,
+    ) -> m.ReportDto:
+        """
+        Получить все сформированные отчеты
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_REPORT
+
+        GET /api/report/generated-reports
+        """
+        return await self._call(
+            self._op_get_generated_reports,
+            query={'pageable': pageable, 'request': request},
+            service_token=service_token,
+        )
+
+    _op_get_in_progress = Operation('GET', 'api/report/document-in-progress', response=lambda: m.Report)
+
+    async def get_in_progress(
+        self,
+        *,
+        filter: m.DocumentInProgressReportFilter,
+        service_token: Optional[str] = None,
+    ) -> m.Report:
+        """
+        Формирование отчета документы в работе
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_REPORT
+
+        GET /api/report/document-in-progress
+        """
+        return await self._call(
+            self._op_get_in_progress,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_on_execution = Operation('GET', 'api/report/document-on-execution', response=lambda: m.Report)
+
+    async def get_on_execution(
+        self,
+        *,
+        filter: m.DocumentOnExecutionReportFilter,
+        service_token: Optional[str] = None,
+    ) -> m.Report:
+        """
+        Формирование отчета документы на исполнении
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_REPORT
+
+        GET /api/report/document-on-execution
+        """
+        return await self._call(
+            self._op_get_on_execution,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_task_on_control = Operation('POST', 'api/report/task-on-control', response=lambda: m.Report, body=lambda: m.TaskOnControlReportFilter)
+
+    async def get_task_on_control(
+        self,
+        *,
+        body: m.TaskOnControlReportFilter,
+        service_token: Optional[str] = None,
+    ) -> m.Report:
+        """
+        Формирование отчета по контролю поручений
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_REPORT
+
+        POST /api/report/task-on-control
+        """
+        return await self._call(
+            self._op_get_task_on_control,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_task_on_status = Operation('POST', 'api/report/task-on-status', response=lambda: m.Report, body=lambda: m.TaskOnStatusReportFilter)
+
+    async def get_task_on_status(
+        self,
+        *,
+        body: m.TaskOnStatusReportFilter,
+        service_token: Optional[str] = None,
+    ) -> m.Report:
+        """
+        Формирование отчета по поручениям
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_REPORT
+
+        POST /api/report/task-on-status
+        """
+        return await self._call(
+            self._op_get_task_on_status,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class OttControllerApi(ApiGroup):
+    """
+    ott-controller
+    """
+
+    _op_get_ott = Operation('GET', 'api/ott', response=str)
+
+    async def get_ott(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+
+        GET /api/ott
+        """
+        return await self._call(
+            self._op_get_ott,
+            service_token=service_token,
+        )
+
+
+class OtvetstvennyeZaPodgotovkuMaterialovApi(ApiGroup):
+    """
+    Ответственные за подготовку материалов
+    API для работы с ответственными за подготовку материалов
+    """
+
+    _op_get_all = Operation('GET', 'api/document/{documentId}/responsible-executor', response=lambda: m.DocumentRecipientDeliveryHistoryDto)
+
+    async def get_all(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentRecipientDeliveryHistoryDto:
+        """
+        Получить список ответственных за подготовку материалов
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/responsible-executor
+        """
+        return await self._call(
+            self._op_get_all,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+
+class OznakomlenieApi(ApiGroup):
+    """
+    Ознакомление
+    API для работы с ознакомлением
+    """
+
+    _op_delete_list = Operation('DELETE', 'api/document/{documentId}/introduction', body=lambda: m.IdsUUID)
+
+    async def delete_list(
+        self,
+        document_id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список ознакомителей
+
+        Для доступа к этому API необходимо: [DOCUMENT_INTRODUCTION_DELETE, DOCUMENT_INTRODUCTION_DELETE_ALL]
+
+        DELETE /api/document/{documentId}/introduction
+        """
+        return await self._call(
+            self._op_delete_list,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/document/{documentId}/introduction', response=lambda: m.IntroductionDto)
+
+    async def get_collection(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.IntroductionDto:
+        """
+        Получить список ознакомления
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/introduction
+        """
+        return await self._call(
+            self._op_get_collection,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/document/{documentId}/introduction', response=lambda: m.IntroductionDto, body=lambda: m.PostIntroductionRequest)
+
+    async def post(
+        self,
+        document_id: UUID,
+        *,
+        body: m.PostIntroductionRequest,
+        service_token: Optional[str] = None,
+    ) -> m.IntroductionDto:
+        """
+        Создать список ознакомления
+
+        Для доступа к этому API необходимо: [DOCUMENT_INTRODUCTION_CREATE]
+
+        POST /api/document/{documentId}/introduction
+        """
+        return await self._call(
+            self._op_post,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put_stamp = Operation('POST', 'api/document/{documentId}/introduction/execute', response=lambda: m.IntroductionDto, body=lambda: m.IdUUID)
+
+    async def put_stamp(
+        self,
+        document_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.IntroductionDto:
+        """
+        Проставить отметку об ознакомлении
+
+        Для доступа к этому API необходимо: [DOCUMENT_INTRODUCTION_EXECUTE]
+
+        POST /api/document/{documentId}/introduction/execute
+        """
+        return await self._call(
+            self._op_put_stamp,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+
+class PechatDokumentovApi(ApiGroup):
+    """
+    Печать документов
+    API для работы с печатью документов
+    """
+
+    _op_print_additional_agreement = Operation('GET', 'api/document/{documentId}/print-additional-agreement', binary=True)
+
+    def print_additional_agreement(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Печать листа доп. согласования по uuid документа (только для исходящих, внутренних, распорядительных документов)
+
+        Для доступа к этому API необходимо: [DOCUMENT_PRINT_ADDITIONAL_AGREEMENT]
+
+        GET /api/document/{documentId}/print-additional-agreement
+        """
+        return self._stream(
+            self._op_print_additional_agreement,
+            path={'documentId': document_id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_print_by_attachment = Operation('GET', 'api/document/{documentId}/print-by-attachment/{attachmentId}', binary=True)
+
+    def print_by_attachment(
+        self,
+        document_id: UUID,
+        attachment_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Создать печатную форму документа по uuid документ и uuid вложения
+
+        Для доступа к этому API необходимо: [DOCUMENT_PRINT_ATTACHMENT]
+
+        GET /api/document/{documentId}/print-by-attachment/{attachmentId}
+        """
+        return self._stream(
+            self._op_print_by_attachment,
+            path={'documentId': document_id, 'attachmentId': attachment_id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_print_by_attachment_pdf = Operation('GET', 'api/document/{documentId}/print-pdf/{attachmentId}', binary=True)
+
+    def print_by_attachment_pdf(
+        self,
+        document_id: UUID,
+        attachment_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Создать печатную форму документа по uuid документ и uuid вложения
+
+        Для доступа к этому API необходимо: [DOCUMENT_PRINT_ATTACHMENT]
+
+        GET /api/document/{documentId}/print-pdf/{attachmentId}
+        """
+        return self._stream(
+            self._op_print_by_attachment_pdf,
+            path={'documentId': document_id, 'attachmentId': attachment_id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_print_by_attachment_pdf_and_save = Operation('GET', 'api/document/{documentId}/pdf-and-save/{attachmentId}', binary=True)
+
+    def print_by_attachment_pdf_and_save(
+        self,
+        document_id: UUID,
+        attachment_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Создать печатную форму документа по uuid документ и uuid вложения
+
+        Для доступа к этому API необходимо: [DOCUMENT_PRINT_ATTACHMENT]
+
+        GET /api/document/{documentId}/pdf-and-save/{attachmentId}
+        """
+        return self._stream(
+            self._op_print_by_attachment_pdf_and_save,
+            path={'documentId': document_id, 'attachmentId': attachment_id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_print_by_attachment_pdf_and_save_no_download = Operation('POST', 'api/document/{documentId}/pdf-and-save/{attachmentId}', binary=True)
+
+    async def print_by_attachment_pdf_and_save_no_download(
+        self,
+        document_id: UUID,
+        attachment_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> bytes:
+        """
+        Создать печатную форму документа по uuid документ и uuid вложения без скачивания
+
+        Для доступа к этому API необходимо: [DOCUMENT_PRINT_ATTACHMENT]
+
+        POST /api/document/{documentId}/pdf-and-save/{attachmentId}
+        """
+        return await self._call(
+            self._op_print_by_attachment_pdf_and_save_no_download,
+            path={'documentId': document_id, 'attachmentId': attachment_id},
+            service_token=service_token,
+        )
+
+    _op_print_by_template = Operation('GET', 'api/document/{documentId}/print-by-template/{id}', binary=True)
+
+    def print_by_template(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        org_id: str,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Создать печатную форму документа по uuid документ и uuid шаблона печатной формы
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ, DOCUMENT_PRINT]
+
+        GET /api/document/{documentId}/print-by-template/{id}
+        """
+        return self._stream(
+            self._op_print_by_template,
+            path={'documentId': document_id, 'id': id},
+            query={'orgId': org_id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_print_contract_execution = Operation('GET', 'api/document/{documentId}/print-contract-execution', binary=True)
+
+    def print_contract_execution(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Печать исполнения договора по uuid документа
+
+        Для доступа к этому API необходимо: [DOCUMENT_PRINT_CONTRACT_EXECUTION]
+
+        GET /api/document/{documentId}/print-contract-execution
+        """
+        return self._stream(
+            self._op_print_contract_execution,
+            path={'documentId': document_id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_print_introduction = Operation('GET', 'api/document/{documentId}/print-introduction', binary=True)
+
+    def print_introduction(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Печать листа ознакомления по uuid документа
+
+        Для доступа к этому API необходимо: [DOCUMENT_PRINT_INTRODUCTION]
+
+        GET /api/document/{documentId}/print-introduction
+        """
+        return self._stream(
+            self._op_print_introduction,
+            path={'documentId': document_id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_print_journal = Operation('GET', 'api/document/{documentId}/print-journal', binary=True)
+
+    def print_journal(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Печать журнала электрнного документа по uuid документа
+
+        Для доступа к этому API необходимо: [DOCUMENT_PRINT_JOURNAL]
+
+        GET /api/document/{documentId}/print-journal
+        """
+        return self._stream(
+            self._op_print_journal,
+            path={'documentId': document_id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_print_link = Operation('GET', 'api/document/{documentId}/print-link', binary=True)
+
+    def print_link(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Печать ссылок документа по uuid документа
+
+        Для доступа к этому API необходимо: [DOCUMENT_PRINT_LINK]
+
+        GET /api/document/{documentId}/print-link
+        """
+        return self._stream(
+            self._op_print_link,
+            path={'documentId': document_id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_print_meeting_question = Operation('GET', 'api/document/{documentId}/print-meeting-question', binary=True)
+
+    def print_meeting_question(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Печать заседания по uuid документа
+
+        Для доступа к этому API необходимо: [DOCUMENT_PRINT_MEETING_QUESTION]
+
+        GET /api/document/{documentId}/print-meeting-question
+        """
+        return self._stream(
+            self._op_print_meeting_question,
+            path={'documentId': document_id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_print_referatka = Operation('GET', 'api/document/{documentId}/print-referatka', binary=True)
+
+    def print_referatka(
+        self,
+        document_id: UUID,
+        *,
+        ids: list[str] | None = None,
+        ids_projects: list[str] | None = None,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Печать рефератки по uuid документа
+
+        Для доступа к этому API необходимо: [DOCUMENT_PRINT_REFERATKA]
+
+        GET /api/document/{documentId}/print-referatka
+        """
+        return self._stream(
+            self._op_print_referatka,
+            path={'documentId': document_id},
+            query={'ids': ids, 'idsProjects': ids_projects},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_print_referatka_by_author = Operation('GET', 'api/document/{documentId}/print-referatka-by-author/{pageType}', binary=True)
+
+    def print_referatka_by_author(
+        self,
+        document_id: UUID,
+        page_type: str,
+        *,
+        ids: list[str] | None = None,
+        ids_projects: list[str] | None = None,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Печать рефератки по uuid документа
+
+        Для доступа к этому API необходимо: [DOCUMENT_PRINT_REFERATKA]
+
+        GET /api/document/{documentId}/print-referatka-by-author/{pageType}
+        """
+        return self._stream(
+            self._op_print_referatka_by_author,
+            path={'documentId': document_id, 'pageType': page_type},
+            query={'ids': ids, 'idsProjects': ids_projects},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_print_sheet = Operation('GET', 'api/document/{documentId}/print-sheet/{processType}', binary=True)
+
+    def print_sheet(
+        self,
+        document_id: UUID,
+        process_type: str,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Печать листа по заданным uuid документа и этапу маршрута
+
+        Для доступа к этому API необходимо: [DOCUMENT_PRINT_SHEET]
+
+        GET /api/document/{documentId}/print-sheet/{processType}
+        """
+        return self._stream(
+            self._op_print_sheet,
+            path={'documentId': document_id, 'processType': process_type},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+
+class PechatDostupaApi(ApiGroup):
+    """
+    Печать доступа
+    API для работы с печатью доступа
+    """
+
+    _op_print_permission_by_directory = Operation('GET', 'api/permission/print-by-directory', binary=True)
+
+    def print_permission_by_directory(
+        self,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Печать пермишенов по справочникам
+
+        GET /api/permission/print-by-directory
+        """
+        return self._stream(
+            self._op_print_permission_by_directory,
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_print_permission_by_document = Operation('GET', 'api/permission/print-by-document', binary=True)
+
+    def print_permission_by_document(
+        self,
+        *,
+        document_category_filter: m.DocumentCategoryFilter,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Печать пермишенов по документам
+
+        GET /api/permission/print-by-document
+        """
+        return self._stream(
+            self._op_print_permission_by_document,
+            query={'documentCategoryFilter': document_category_filter},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+
+class PechatKalendariaApi(ApiGroup):
+    """
+    Печать календаря
+    API для работы с печатью календаря
+    """
+
+    _op_print_by_range = Operation('GET', 'api/user-calendar/print-by-range', binary=True)
+
+    def print_by_range(
+        self,
+        *,
+        start: datetime,
+        end: datetime,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Печать дней в календаре (документов, поручений, событий), в рамках выбранных дат
+
+        GET /api/user-calendar/print-by-range
+        """
+        return self._stream(
+            self._op_print_by_range,
+            query={'start': start, 'end': end},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+
+class PechatPoNomenklatureDelApi(ApiGroup):
+    """
+    Печать по номенклатуре дел
+    API для работы с печатью по номенклатуре дел
+    """
+
+    _op_add_sign_1 = Operation('PUT', 'api/nomenclature-affair/{id}/file-internal-inventory-archive/sign', body=lambda: m.SimpleCmsDTO)
+
+    async def add_sign_1(
+        self,
+        id: UUID,
+        *,
+        body: m.SimpleCmsDTO,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Прикрепить подпись ЭЦП
+
+        PUT /api/nomenclature-affair/{id}/file-internal-inventory-archive/sign
+        """
+        return await self._call(
+            self._op_add_sign_1,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_add_sign_5 = Operation('PUT', 'api/acceptance-inventory/{id}/file-inventory/sign', body=lambda: m.SimpleCmsDTO)
+
+    async def add_sign_5(
+        self,
+        id: UUID,
+        *,
+        body: m.SimpleCmsDTO,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Прикрепить подпись ЭЦП
+
+        PUT /api/acceptance-inventory/{id}/file-inventory/sign
+        """
+        return await self._call(
+            self._op_add_sign_5,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_check_sign_1 = Operation('POST', 'api/nomenclature-affair/{id}/file-internal-inventory-archive/verify-sign', response=dict[str, Any], body=lambda: m.CheckAttachmentSignRequest)
+
+    async def check_sign_1(
+        self,
+        id: UUID,
+        *,
+        body: m.CheckAttachmentSignRequest,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Проверить ЭЦП
+
+        POST /api/nomenclature-affair/{id}/file-internal-inventory-archive/verify-sign
+        """
+        return await self._call(
+            self._op_check_sign_1,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_check_sign_4 = Operation('POST', 'api/acceptance-inventory/{id}/file-inventory/verify-sign', response=dict[str, Any], body=lambda: m.CheckAttachmentSignRequest)
+
+    async def check_sign_4(
+        self,
+        id: UUID,
+        *,
+        body: m.CheckAttachmentSignRequest,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Проверить ЭЦП
+
+        POST /api/acceptance-inventory/{id}/file-inventory/verify-sign
+        """
+        return await self._call(
+            self._op_check_sign_4,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create_file_internal_inventory = Operation('POST', 'api/nomenclature-affair/{id}/file-internal-inventory', response=lambda: m.AttachmentDto)
+
+    async def create_file_internal_inventory(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AttachmentDto:
+        """
+        Создать печатный документ внутренней описи документов дела по uuid номенклатуры дела
+
+        POST /api/nomenclature-affair/{id}/file-internal-inventory
+        """
+        return await self._call(
+            self._op_create_file_internal_inventory,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_create_file_internal_inventory_archive = Operation('PUT', 'api/nomenclature-affair/{id}/file-internal-inventory-archive', response=lambda: m.AttachmentDto, body=lambda: m.InternalInventoryArchiveRequest)
+
+    async def create_file_internal_inventory_archive(
+        self,
+        id: UUID,
+        *,
+        body: m.InternalInventoryArchiveRequest,
+        service_token: Optional[str] = None,
+    ) -> m.AttachmentDto:
+        """
+        Создать печатный документ описи дел подразделения по шаблону (Архив)
+
+        PUT /api/nomenclature-affair/{id}/file-internal-inventory-archive
+        """
+        return await self._call(
+            self._op_create_file_internal_inventory_archive,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create_file_inventory = Operation('POST', 'api/acceptance-inventory/{id}/file-inventory', response=lambda: m.AttachmentDto)
+
+    async def create_file_inventory(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AttachmentDto:
+        """
+        Создать печатный документ описи дел подразделения по uuid
+
+        POST /api/acceptance-inventory/{id}/file-inventory
+        """
+        return await self._call(
+            self._op_create_file_inventory,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_file_internal_inventory = Operation('DELETE', 'api/nomenclature-affair/{id}/file-internal-inventory')
+
+    async def delete_file_internal_inventory(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить печатный документ внутренней описи документов дела по uuid номенклатуры дела
+
+        DELETE /api/nomenclature-affair/{id}/file-internal-inventory
+        """
+        return await self._call(
+            self._op_delete_file_internal_inventory,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_file_internal_inventory_archive = Operation('DELETE', 'api/nomenclature-affair/{id}/file-internal-inventory-archive')
+
+    async def delete_file_internal_inventory_archive(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить печатный документ описи дел подразделения по uuid (Архив)
+
+        DELETE /api/nomenclature-affair/{id}/file-internal-inventory-archive
+        """
+        return await self._call(
+            self._op_delete_file_internal_inventory_archive,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_file_inventory = Operation('DELETE', 'api/acceptance-inventory/{id}/file-inventory')
+
+    async def delete_file_inventory(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить печатный документ описи дел подразделения по uuid
+
+        DELETE /api/acceptance-inventory/{id}/file-inventory
+        """
+        return await self._call(
+            self._op_delete_file_inventory,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_download_base64_1 = Operation('GET', 'api/nomenclature-affair/{id}/file-internal-inventory-archive/base64', binary=True)
+
+    def download_base64_1(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл base64 из MinIO по uuid
+
+        GET /api/nomenclature-affair/{id}/file-internal-inventory-archive/base64
+        """
+        return self._stream(
+            self._op_download_base64_1,
+            path={'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_download_base64_4 = Operation('GET', 'api/acceptance-inventory/{id}/file-inventory/base64', binary=True)
+
+    def download_base64_4(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл base64 из MinIO по uuid
+
+        GET /api/acceptance-inventory/{id}/file-inventory/base64
+        """
+        return self._stream(
+            self._op_download_base64_4,
+            path={'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_download_file_internal_inventory = Operation('GET', 'api/nomenclature-affair/{id}/file-internal-inventory', binary=True)
+
+    def download_file_internal_inventory(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить печатный документ внутренней описи документов дела по uuid номенклатуры дела
+
+        GET /api/nomenclature-affair/{id}/file-internal-inventory
+        """
+        return self._stream(
+            self._op_download_file_internal_inventory,
+            path={'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_download_file_internal_inventory_archive = Operation('GET', 'api/nomenclature-affair/{id}/file-internal-inventory-archive', binary=True)
+
+    def download_file_internal_inventory_archive(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить печатный документ описи дел подразделения по uuid (Архив)
+
+        GET /api/nomenclature-affair/{id}/file-internal-inventory-archive
+        """
+        return self._stream(
+            self._op_download_file_internal_inventory_archive,
+            path={'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_download_file_inventory = Operation('GET', 'api/acceptance-inventory/{id}/file-inventory', binary=True)
+
+    def download_file_inventory(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить печатный документ описи дел подразделения по uuid
+
+        GET /api/acceptance-inventory/{id}/file-inventory
+        """
+        return self._stream(
+            self._op_download_file_inventory,
+            path={'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_remove_sign_2 = Operation('DELETE', 'api/nomenclature-affair/{id}/file-internal-inventory-archive/sign/{signId}', response=dict[str, Any])
+
+    async def remove_sign_2(
+        self,
+        id: UUID,
+        sign_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Удалить подпись ЭЦП
+
+        DELETE /api/nomenclature-affair/{id}/file-internal-inventory-archive/sign/{signId}
+        """
+        return await self._call(
+            self._op_remove_sign_2,
+            path={'id': id, 'signId': sign_id},
+            service_token=service_token,
+        )
+
+    _op_remove_sign_5 = Operation('DELETE', 'api/acceptance-inventory/{id}/file-inventory/sign/{signId}', response=dict[str, Any])
+
+    async def remove_sign_5(
+        self,
+        id: UUID,
+        sign_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Удалить подпись ЭЦП
+
+        DELETE /api/acceptance-inventory/{id}/file-inventory/sign/{signId}
+        """
+        return await self._call(
+            self._op_remove_sign_5,
+            path={'id': id, 'signId': sign_id},
+            service_token=service_token,
+        )
+
+
+class PechatRoleiApi(ApiGroup):
+    """
+    Печать ролей
+    API для работы с печатью ролей
+    """
+
+    _op_print_employee_with_role = Operation('GET', 'api/role/print-employee-with-role', binary=True)
+
+    def print_employee_with_role(
+        self,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Печать сотрудников с ролями всех филиалов(организаций)
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_ROLE
+
+        GET /api/role/print-employee-with-role
+        """
+        return self._stream(
+            self._op_print_employee_with_role,
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+
+class PersonalnyeNastroikiPolzovateliaApi(ApiGroup):
+    """
+    Персональные настройки пользователя
+    Персональные настройки пользователя
+    """
+
+    _op_delete_attachment = Operation('DELETE', 'api/personal-setup/attachment/{id}')
+
+    async def delete_attachment(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить файл из личных настроек
+
+        Для доступа к этому API необходимо: Требуется право доступа: PERSONAL_SETUP_ATTACHMENT
+
+        DELETE /api/personal-setup/attachment/{id}
+        """
+        return await self._call(
+            self._op_delete_attachment,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_download_attachment = Operation('GET', 'api/personal-setup/attachment/{id}/download', binary=True)
+
+    def download_attachment(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл из личных настроек
+
+        GET /api/personal-setup/attachment/{id}/download
+        """
+        return self._stream(
+            self._op_download_attachment,
+            path={'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_edit = Operation('PUT', 'api/personal-setup', response=lambda: m.PersonalSetupDto, body=lambda: m.PersonalSetupRequest)
+
+    async def edit(
+        self,
+        *,
+        body: m.PersonalSetupRequest,
+        service_token: Optional[str] = None,
+    ) -> m.PersonalSetupDto:
+        """
+        Изменить настройки пользователя
+
+        PUT /api/personal-setup
+        """
+        return await self._call(
+            self._op_edit,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_attachments = Operation('GET', 'api/personal-setup/attachment', response=lambda: list[m.AttachmentPersonalSetupDto])
+
+    async def get_attachments(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.AttachmentPersonalSetupDto]:
+        """
+        Получить вложения
+
+        GET /api/personal-setup/attachment
+        """
+        return await self._call(
+            self._op_get_attachments,
+            service_token=service_token,
+        )
+
+    _op_get_install_settings = Operation('GET', 'api/personal-setup/scan/install', binary=True)
+
+    def get_install_settings(
+        self,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Скачать клиент для сканирования
+
+        GET /api/personal-setup/scan/install
+        """
+        return self._stream(
+            self._op_get_install_settings,
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_get_settings = Operation('GET', 'api/personal-setup', response=lambda: m.PersonalSetupDto)
+
+    async def get_settings(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.PersonalSetupDto:
+        """
+        Получить настройки пользователя
+
+        GET /api/personal-setup
+        """
+        return await self._call(
+            self._op_get_settings,
+            service_token=service_token,
+        )
+
+    _op_get_settings_scan = Operation('GET', 'api/personal-setup/scan', response=lambda: m.ScanSettingJsonB)
+
+    async def get_settings_scan(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ScanSettingJsonB:
+        """
+        Получить настройки пользователя для сканирования
+
+        GET /api/personal-setup/scan
+        """
+        return await self._call(
+            self._op_get_settings_scan,
+            service_token=service_token,
+        )
+
+    _op_localization = Operation('PUT', 'api/personal-setup/localization', response=dict[str, Any], body=lambda: m.PersonalSetupLocalizationRequest)
+
+    async def localization(
+        self,
+        *,
+        body: m.PersonalSetupLocalizationRequest,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Изменить локализацию пользователя
+
+        PUT /api/personal-setup/localization
+        """
+        return await self._call(
+            self._op_localization,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_upload_file_attachment = Operation('POST', 'api/personal-setup/attachment/upload', multipart=True)
+
+    async def upload_file_attachment(
+        self,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить файл в личные настройки
+
+        Для доступа к этому API необходимо: Требуется право доступа: PERSONAL_SETUP_ATTACHMENT
+
+        POST /api/personal-setup/attachment/upload
+        """
+        return await self._call(
+            self._op_upload_file_attachment,
+            body=files,
+            service_token=service_token,
+        )
+
+
+class PolnotekstovyiPoiskApi(ApiGroup):
+    """
+    Полнотекстовый поиск
+    API для работы с полнотекстовым поиском
+    """
+
+    _op_get_collection_47 = Operation('GET', 'api/full-search', response=str)
+
+    async def get_collection_47(
+        self,
+        *,
+        search: str,
+        in_archive: bool,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Полнотекстовый поиск
+
+        GET /api/full-search
+        """
+        return await self._call(
+            self._op_get_collection_47,
+            query={'search': search, 'inArchive': in_archive, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_collection_48 = Operation('GET', 'api/full-search/ext', response=str)
+
+    async def get_collection_48(
+        self,
+        *,
+        f: m.DocumentFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Поиск по фильтру
+
+        GET /api/full-search/ext
+        """
+        return await self._call(
+            self._op_get_collection_48,
+            query={'f': f, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+
+class PolzovatelskieKonfiguratsiiOtchetaApi(ApiGroup):
+    """
+    Пользовательские конфигурации отчета
+    API для работы с пользовательскими конфигурациями отчета
+    """
+
+    _op_delete = Operation('DELETE', 'api/report-user-config', response=lambda: m.ReportUserConfigDto, body=lambda: m.IdsUUID)
+
+    async def delete(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.ReportUserConfigDto:
+        """
+        Удалить конфигурацию отчета
+
+        DELETE /api/report-user-config
+        """
+        return await self._call(
+            self._op_delete,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_edit = Operation('PUT', 'api/report-user-config', response=lambda: m.ReportUserConfigDto, body=lambda: m.ReportUserConfigRequest)
+
+    async def edit(
+        self,
+        *,
+        body: m.ReportUserConfigRequest,
+        service_token: Optional[str] = None,
+    ) -> m.ReportUserConfigDto:
+        """
+        Изменить конфигурацию отчета
+
+        PUT /api/report-user-config
+        """
+        return await self._call(
+            self._op_edit,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/report-user-config/{id}', response=lambda: m.ReportUserConfigDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ReportUserConfigDto:
+        """
+        Получить конфигурацию отчета по id
+
+        GET /api/report-user-config/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection_user = Operation('GET', 'api/report-user-config', response=lambda: m.ReportUserConfigDto)
+
+    async def get_collection_user(
+        self,
+        *,
+        filter: m.ReportUserConfigFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.ReportUserConfigDto:
+        """
+        Получить конфигурации отчетов пользователя
+
+        GET /api/report-user-config
+        """
+        return await self._call(
+            self._op_get_collection_user,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_save = Operation('POST', 'api/report-user-config', response=lambda: m.ReportUserConfigDto, body=lambda: m.ReportUserConfigRequest)
+
+    async def save(
+        self,
+        *,
+        body: m.ReportUserConfigRequest,
+        service_token: Optional[str] = None,
+    ) -> m.ReportUserConfigDto:
+        """
+        Создать конфигурацию отчета
+
+        POST /api/report-user-config
+        """
+        return await self._call(
+            self._op_save,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class PorucheniiaApi(ApiGroup):
+    """
+    Поручения
+    API для работы с поручениями
+    """
+
+    _op_add_batch_executors = Operation('POST', 'api/document/{documentId}/task/{id}/executor', response=str, body=lambda: m.IdsUUID)
+
+    async def add_batch_executors(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Добавить исполнителей поручения
+
+        POST /api/document/{documentId}/task/{id}/executor
+        """
+        return await self._call(
+            self._op_add_batch_executors,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_add_child_batch_executors = Operation('POST', 'api/document/{documentId}/task/{parentId}/task/{id}/executor', response=str, body=lambda: m.IdsUUID)
+
+    async def add_child_batch_executors(
+        self,
+        document_id: UUID,
+        parent_id: UUID,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Добавить исполнителей поручения в дочернее поручение
+
+        POST /api/document/{documentId}/task/{parentId}/task/{id}/executor
+        """
+        return await self._call(
+            self._op_add_child_batch_executors,
+            path={'documentId': document_id, 'parentId': parent_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_change_child_responsible_user = Operation('PUT', 'api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{executorId}/responsible', response=lambda: m.TaskExecutorsDto, body=lambda: m.ChangeResponsibleStatus)
+
+    async def change_child_responsible_user(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        executor_id: UUID,
+        *,
+        body: m.ChangeResponsibleStatus,
+        service_token: Optional[str] = None,
+    ) -> m.TaskExecutorsDto:
+        """
+        Изменить статус отвественного в дочернем поручении
+
+        Только один исполнитель может иметь статус ответсвенного, если уже существует отвественный исполинтель у него признак будет имзенен на false
+
+        PUT /api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{executorId}/responsible
+        """
+        return await self._call(
+            self._op_change_child_responsible_user,
+            path={'documentId': document_id, 'taskId': task_id, 'executorId': executor_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_change_responsible_user = Operation('PUT', 'api/document/{documentId}/task/{taskId}/executor/{executorId}/responsible', response=lambda: m.TaskExecutorsDto, body=lambda: m.ChangeResponsibleStatus)
+
+    async def change_responsible_user(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        executor_id: UUID,
+        *,
+        body: m.ChangeResponsibleStatus,
+        service_token: Optional[str] = None,
+    ) -> m.TaskExecutorsDto:
+        """
+        Изменить статус отвественного
+
+        Только один исполнитель может иметь статус ответсвенного, если уже существует отвественный исполинтель у него признак будет имзенен на false
+
+        PUT /api/document/{documentId}/task/{taskId}/executor/{executorId}/responsible
+        """
+        return await self._call(
+            self._op_change_responsible_user,
+            path={'documentId': document_id, 'taskId': task_id, 'executorId': executor_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create = Operation('POST', 'api/document/{documentId}/task', response=lambda: m.TaskDto, body=lambda: m.CreateTaskRequest)
+
+    async def create(
+        self,
+        document_id: UUID,
+        *,
+        body: m.CreateTaskRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Создать поручение
+
+        POST /api/document/{documentId}/task
+        """
+        return await self._call(
+            self._op_create,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create_batch = Operation('POST', 'api/document/{documentId}/task/batch', response=lambda: list[m.TaskDto], body=lambda: list[m.CreateTaskRequest])
+
+    async def create_batch(
+        self,
+        document_id: UUID,
+        *,
+        body: list[m.CreateTaskRequest],
+        service_token: Optional[str] = None,
+    ) -> list[m.TaskDto]:
+        """
+        Создать массив поручений
+
+        Для доступа к этому API необходимо: [DOCUMENT_TASK_CREATE]
+
+        POST /api/document/{documentId}/task/batch
+        """
+        return await self._call(
+            self._op_create_batch,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create_child = Operation('POST', 'api/document/{documentId}/task/{parentId}/task', response=lambda: m.TaskDto, body=lambda: m.CreateTaskRequest)
+
+    async def create_child(
+        self,
+        document_id: UUID,
+        parent_id: UUID,
+        *,
+        body: m.CreateTaskRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Создать дочернее поручение
+
+        POST /api/document/{documentId}/task/{parentId}/task
+        """
+        return await self._call(
+            self._op_create_child,
+            path={'documentId': document_id, 'parentId': parent_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create_child_batch = Operation('POST', 'api/document/{documentId}/task/{parentId}/task/batch', response=lambda: list[m.TaskDto], body=lambda: list[m.CreateTaskRequest])
+
+    async def create_child_batch(
+        self,
+        document_id: UUID,
+        parent_id: UUID,
+        *,
+        body: list[m.CreateTaskRequest],
+        service_token: Optional[str] = None,
+    ) -> list[m.TaskDto]:
+        """
+        Создать массив дочерних поручений
+
+        Для доступа к этому API необходимо: [TASK_CHILD_CREATE]
+
+        POST /api/document/{documentId}/task/{parentId}/task/batch
+        """
+        return await self._call(
+            self._op_create_child_batch,
+            path={'documentId': document_id, 'parentId': parent_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/document/{documentId}/task/{id}')
+
+    async def delete(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить поручение по id
+
+        DELETE /api/document/{documentId}/task/{id}
+        """
+        return await self._call(
+            self._op_delete,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_attachment = Operation('DELETE', 'api/document/{documentId}/task/{taskId}/executor/{executorId}/attach/{id}')
+
+    async def delete_attachment(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        id: UUID,
+        executor_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить вложенный файл по id
+
+        DELETE /api/document/{documentId}/task/{taskId}/executor/{executorId}/attach/{id}
+        """
+        return await self._call(
+            self._op_delete_attachment,
+            path={'documentId': document_id, 'taskId': task_id, 'id': id, 'executorId': executor_id},
+            service_token=service_token,
+        )
+
+    _op_delete_attachment2 = Operation('DELETE', 'api/document/{documentId}/task/{taskId}/executor/{executorId}/attach', body=lambda: m.IdUUID)
+
+    async def delete_attachment2(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        executor_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить вложенный файл по id
+
+        DELETE /api/document/{documentId}/task/{taskId}/executor/{executorId}/attach
+        """
+        return await self._call(
+            self._op_delete_attachment2,
+            path={'documentId': document_id, 'taskId': task_id, 'executorId': executor_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_batch_executors = Operation('DELETE', 'api/document/{documentId}/task/{id}/executor', response=str, body=lambda: m.IdsUUID)
+
+    async def delete_batch_executors(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Удалить исполнителей поручения
+
+        DELETE /api/document/{documentId}/task/{id}/executor
+        """
+        return await self._call(
+            self._op_delete_batch_executors,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_child_attachment = Operation('DELETE', 'api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{executorId}/attach/{id}')
+
+    async def delete_child_attachment(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        id: UUID,
+        executor_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить вложенный файл по id
+
+        DELETE /api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{executorId}/attach/{id}
+        """
+        return await self._call(
+            self._op_delete_child_attachment,
+            path={'documentId': document_id, 'taskId': task_id, 'id': id, 'executorId': executor_id},
+            service_token=service_token,
+        )
+
+    _op_delete_child_attachment2 = Operation('DELETE', 'api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{executorId}/attach', body=lambda: m.IdUUID)
+
+    async def delete_child_attachment2(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        executor_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить вложенный файл по id
+
+        DELETE /api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{executorId}/attach
+        """
+        return await self._call(
+            self._op_delete_child_attachment2,
+            path={'documentId': document_id, 'taskId': task_id, 'executorId': executor_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_child_batch_executors = Operation('DELETE', 'api/document/{documentId}/task/{parentId}/task/{id}/executor', response=str, body=lambda: m.IdsUUID)
+
+    async def delete_child_batch_executors(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Удалить исполнителей дочернего поручения
+
+        DELETE /api/document/{documentId}/task/{parentId}/task/{id}/executor
+        """
+        return await self._call(
+            self._op_delete_child_batch_executors,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_child_executor = Operation('DELETE', 'api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{id}')
+
+    async def delete_child_executor(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить исполнителя дочернего поручения по id
+
+        DELETE /api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{id}
+        """
+        return await self._call(
+            self._op_delete_child_executor,
+            path={'documentId': document_id, 'taskId': task_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_child_task = Operation('DELETE', 'api/document/{documentId}/task/{parentId}/task', response=lambda: m.TaskDto, body=lambda: m.IdUUID)
+
+    async def delete_child_task(
+        self,
+        document_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Удалить дочернее поручение
+
+        DELETE /api/document/{documentId}/task/{parentId}/task
+        """
+        return await self._call(
+            self._op_delete_child_task,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_executor = Operation('DELETE', 'api/document/{documentId}/task/{taskId}/executor/{id}')
+
+    async def delete_executor(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить исполнителя по id
+
+        DELETE /api/document/{documentId}/task/{taskId}/executor/{id}
+        """
+        return await self._call(
+            self._op_delete_executor,
+            path={'documentId': document_id, 'taskId': task_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_task = Operation('DELETE', 'api/document/{documentId}/task', response=lambda: m.TaskDto, body=lambda: m.IdUUID)
+
+    async def delete_task(
+        self,
+        document_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Удалить поручение
+
+        DELETE /api/document/{documentId}/task
+        """
+        return await self._call(
+            self._op_delete_task,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_download_child_file = Operation('GET', 'api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{executorId}/attach/{id}', binary=True)
+
+    def download_child_file(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Скачать файл по id файла
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{executorId}/attach/{id}
+        """
+        return self._stream(
+            self._op_download_child_file,
+            path={'documentId': document_id, 'taskId': task_id, 'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_download_file = Operation('GET', 'api/document/{documentId}/task/{taskId}/executor/{executorId}/attach/{id}', binary=True)
+
+    def download_file(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Скачать файл по id файла
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{taskId}/executor/{executorId}/attach/{id}
+        """
+        return self._stream(
+            self._op_download_file,
+            path={'documentId': document_id, 'taskId': task_id, 'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_download_file_by_id = Operation('GET', 'api/document/{documentId}/task/{taskId}/attach/{id}', binary=True)
+
+    def download_file_by_id(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Скачать файл по id файла
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{taskId}/attach/{id}
+        """
+        return self._stream(
+            self._op_download_file_by_id,
+            path={'documentId': document_id, 'taskId': task_id, 'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_execute_child_task = Operation('PUT', 'api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{executorId}/execute', response=lambda: m.TaskExecutionResult, body=lambda: m.ExecuteTaskRequest)
+
+    async def execute_child_task(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        executor_id: UUID,
+        *,
+        body: m.ExecuteTaskRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TaskExecutionResult:
+        """
+        Исполнить дочернее поручение
+
+        PUT /api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{executorId}/execute
+        """
+        return await self._call(
+            self._op_execute_child_task,
+            path={'documentId': document_id, 'taskId': task_id, 'executorId': executor_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_execute_child_task_for_all = Operation('PUT', 'api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{executorId}/execute-all', response=str, body=lambda: m.ExecuteTaskRequest)
+
+    async def execute_child_task_for_all(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        executor_id: UUID,
+        *,
+        body: m.ExecuteTaskRequest,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Исполнить дочернее поручение за всех
+
+        PUT /api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{executorId}/execute-all
+        """
+        return await self._call(
+            self._op_execute_child_task_for_all,
+            path={'documentId': document_id, 'taskId': task_id, 'executorId': executor_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_execute_task = Operation('PUT', 'api/document/{documentId}/task/{taskId}/executor/{executorId}/execute', response=lambda: m.TaskExecutionResult, body=lambda: m.ExecuteTaskRequest)
+
+    async def execute_task(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        executor_id: UUID,
+        *,
+        body: m.ExecuteTaskRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TaskExecutionResult:
+        """
+        Исполнить поручение
+
+        PUT /api/document/{documentId}/task/{taskId}/executor/{executorId}/execute
+        """
+        return await self._call(
+            self._op_execute_task,
+            path={'documentId': document_id, 'taskId': task_id, 'executorId': executor_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_execute_task_for_all = Operation('PUT', 'api/document/{documentId}/task/{taskId}/executor/{executorId}/execute-all', response=str, body=lambda: m.ExecuteTaskRequest)
+
+    async def execute_task_for_all(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        executor_id: UUID,
+        *,
+        body: m.ExecuteTaskRequest,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Исполнить поручение за всех
+
+        PUT /api/document/{documentId}/task/{taskId}/executor/{executorId}/execute-all
+        """
+        return await self._call(
+            self._op_execute_task_for_all,
+            path={'documentId': document_id, 'taskId': task_id, 'executorId': executor_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/document/{documentId}/task/{id}', response=lambda: m.TaskDto)
+
+    async def get(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Получить поручение по id
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_all_attachments = Operation('GET', 'api/document/{documentId}/task/{taskId}/executor/{id}/attach', response=lambda: m.AttachmentTaskDto)
+
+    async def get_all_attachments(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AttachmentTaskDto:
+        """
+        Получить вложенные файлы
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{taskId}/executor/{id}/attach
+        """
+        return await self._call(
+            self._op_get_all_attachments,
+            path={'documentId': document_id, 'taskId': task_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_all_child_attachments = Operation('GET', 'api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{id}/attach', response=lambda: m.AttachmentTaskDto)
+
+    async def get_all_child_attachments(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AttachmentTaskDto:
+        """
+        Получить вложенные файлы
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{id}/attach
+        """
+        return await self._call(
+            self._op_get_all_child_attachments,
+            path={'documentId': document_id, 'taskId': task_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_all_document_executors = Operation('GET', 'api/document/{documentId}/task/executor', response=lambda: list[m.TaskExecutorsDto])
+
+    async def get_all_document_executors(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.TaskExecutorsDto]:
+        """
+        Получить всех исполнителей поручений
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/executor
+        """
+        return await self._call(
+            self._op_get_all_document_executors,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_all_document_task = Operation('GET', 'api/document/{documentId}/task', response=lambda: list[m.TaskDto])
+
+    async def get_all_document_task(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.TaskDto]:
+        """
+        Получить поручение в документе
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task
+        """
+        return await self._call(
+            self._op_get_all_document_task,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_all_main_task_executors = Operation('GET', 'api/document/{documentId}/task/main-user', response=lambda: list[m.TaskExecutorsDto])
+
+    async def get_all_main_task_executors(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.TaskExecutorsDto]:
+        """
+        Получить всех исполнителей поручений первого уровня по документу
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/main-user
+        """
+        return await self._call(
+            self._op_get_all_main_task_executors,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_all_task_author = Operation('GET', 'api/document/{documentId}/task/all-author', response=lambda: list[m.UserInfoDto])
+
+    async def get_all_task_author(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.UserInfoDto]:
+        """
+        Получить всех авторов всех поручений в документе
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/all-author
+        """
+        return await self._call(
+            self._op_get_all_task_author,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_all_task_responsible_users = Operation('GET', 'api/document/{documentId}/task/responsible-user', response=lambda: list[m.TaskExecutorsDto])
+
+    async def get_all_task_responsible_users(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.TaskExecutorsDto]:
+        """
+        Получить всех отвественных исполнителей по документу
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/responsible-user
+        """
+        return await self._call(
+            self._op_get_all_task_responsible_users,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_child_info = Operation('GET', 'api/document/{documentId}/task/{id}/child-info', response=lambda: m.TaskDto)
+
+    async def get_child_info(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Получить информацию о дочерних поручениях
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{id}/child-info
+        """
+        return await self._call(
+            self._op_get_child_info,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_child_permission = Operation('GET', 'api/document/{documentId}/task/{parentId}/task/{id}/permission', response=lambda: m.UserDocPermission)
+
+    async def get_child_permission(
+        self,
+        document_id: UUID,
+        parent_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.UserDocPermission:
+        """
+        Получить все разрешения по дочернему поручению
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{parentId}/task/{id}/permission
+        """
+        return await self._call(
+            self._op_get_child_permission,
+            path={'documentId': document_id, 'parentId': parent_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_child_task = Operation('GET', 'api/document/{documentId}/task/{parentId}/task/{id}', response=lambda: m.TaskDto)
+
+    async def get_child_task(
+        self,
+        document_id: UUID,
+        parent_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Получить поручение по id
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{parentId}/task/{id}
+        """
+        return await self._call(
+            self._op_get_child_task,
+            path={'documentId': document_id, 'parentId': parent_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_child_task_executor = Operation('GET', 'api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{id}', response=lambda: m.TaskExecutorsDto)
+
+    async def get_child_task_executor(
+        self,
+        document_id: UUID,
+        parent_id: UUID,
+        task_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TaskExecutorsDto:
+        """
+        Получить исполнителя дочернего поручения
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{id}
+        """
+        return await self._call(
+            self._op_get_child_task_executor,
+            path={'documentId': document_id, 'parentId': parent_id, 'taskId': task_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_child_task_executors = Operation('GET', 'api/document/{documentId}/task/{parentId}/task/{id}/executor', response=lambda: m.TaskExecutorsDto)
+
+    async def get_child_task_executors(
+        self,
+        document_id: UUID,
+        parent_id: UUID,
+        id: UUID,
+        *,
+        pageable: m.Pageable,
+        ids: list[UUID] | None = None,
+        service_token: Optional[str] = None,
+    ) -> m.TaskExecutorsDto:
+        """
+        Получить исполнителей дочернего поручения
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{parentId}/task/{id}/executor
+        """
+        return await self._call(
+            self._op_get_child_task_executors,
+            path={'documentId': document_id, 'parentId': parent_id, 'id': id},
+            query={'ids': ids, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_child_task_history = Operation('GET', 'api/document/{documentId}/task/{parentId}/task/{id}/history', response=lambda: m.TaskHistoryDto)
+
+    async def get_child_task_history(
+        self,
+        id: UUID,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TaskHistoryDto:
+        """
+        Получить историю изменений дочернего поручения
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{parentId}/task/{id}/history
+        """
+        return await self._call(
+            self._op_get_child_task_history,
+            path={'id': id, 'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_permission = Operation('GET', 'api/document/{documentId}/task/{id}/permission', response=lambda: m.UserDocPermission)
+
+    async def get_permission(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.UserDocPermission:
+        """
+        Получить все разрешения по поручению
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{id}/permission
+        """
+        return await self._call(
+            self._op_get_permission,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_task_executor = Operation('GET', 'api/document/{documentId}/task/{taskId}/executor/{id}', response=lambda: m.TaskExecutorsDto)
+
+    async def get_task_executor(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TaskExecutorsDto:
+        """
+        Получить исполнителя
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{taskId}/executor/{id}
+        """
+        return await self._call(
+            self._op_get_task_executor,
+            path={'documentId': document_id, 'taskId': task_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_task_executors = Operation('GET', 'api/document/{documentId}/task/{taskId}/executor', response=lambda: m.TaskExecutorsDto)
+
+    async def get_task_executors(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        *,
+        pageable: m.Pageable,
+        ids: list[UUID] | None = None,
+        service_token: Optional[str] = None,
+    ) -> m.TaskExecutorsDto:
+        """
+        Получить исполнителей
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{taskId}/executor
+        """
+        return await self._call(
+            self._op_get_task_executors,
+            path={'documentId': document_id, 'taskId': task_id},
+            query={'ids': ids, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_task_history = Operation('GET', 'api/document/{documentId}/task/{id}/history', response=lambda: m.TaskHistoryDto)
+
+    async def get_task_history(
+        self,
+        id: UUID,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TaskHistoryDto:
+        """
+        Получить историю изменений по id поручения
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{id}/history
+        """
+        return await self._call(
+            self._op_get_task_history,
+            path={'id': id, 'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_task_history_v2 = Operation('GET', 'api/document/{documentId}/task/{id}/history/v2', response=lambda: m.TaskHistoryDto)
+
+    async def get_task_history_v2(
+        self,
+        id: UUID,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TaskHistoryDto:
+        """
+        Получить историю изменений по id поручения
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{id}/history/v2
+        """
+        return await self._call(
+            self._op_get_task_history_v2,
+            path={'id': id, 'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_task_with_all = Operation('GET', 'api/document/{documentId}/task/{id}/all', response=lambda: m.TaskDto)
+
+    async def get_task_with_all(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Получить поручение по id
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{id}/all
+        """
+        return await self._call(
+            self._op_get_task_with_all,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_task_child_revision = Operation('PUT', 'api/document/{documentId}/task/{parentId}/task/{taskId}/revision', response=lambda: m.TaskDto, body=lambda: m.TaskRevisionRequest)
+
+    async def task_child_revision(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        *,
+        body: m.TaskRevisionRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Отправить на доработку дочернее поручение
+
+        Только один исполнитель может иметь статус ответсвенного, если уже существует отвественный исполинтель у него признак будет имзенен на false
+
+        PUT /api/document/{documentId}/task/{parentId}/task/{taskId}/revision
+        """
+        return await self._call(
+            self._op_task_child_revision,
+            path={'documentId': document_id, 'taskId': task_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_task_revision = Operation('PUT', 'api/document/{documentId}/task/{taskId}/revision', response=lambda: m.TaskDto, body=lambda: m.TaskRevisionRequest)
+
+    async def task_revision(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        *,
+        body: m.TaskRevisionRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Отправить на доработку
+
+        Только один исполнитель может иметь статус ответсвенного, если уже существует отвественный исполинтель у него признак будет имзенен на false
+
+        PUT /api/document/{documentId}/task/{taskId}/revision
+        """
+        return await self._call(
+            self._op_task_revision,
+            path={'documentId': document_id, 'taskId': task_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update = Operation('PUT', 'api/document/{documentId}/task', response=lambda: m.TaskDto, body=lambda: m.UpdateTaskRequest)
+
+    async def update(
+        self,
+        document_id: UUID,
+        *,
+        body: m.UpdateTaskRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Обновить основную информацию в поручении
+
+        PUT /api/document/{documentId}/task
+        """
+        return await self._call(
+            self._op_update,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update_child = Operation('PUT', 'api/document/{documentId}/task/{parentId}/task', response=lambda: m.TaskDto, body=lambda: m.UpdateTaskRequest)
+
+    async def update_child(
+        self,
+        document_id: UUID,
+        parent_id: UUID,
+        *,
+        body: m.UpdateTaskRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Обновить основную информацию в дочернем поручении
+
+        PUT /api/document/{documentId}/task/{parentId}/task
+        """
+        return await self._call(
+            self._op_update_child,
+            path={'documentId': document_id, 'parentId': parent_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update_task_author = Operation('PUT', 'api/document/{documentId}/task/{taskId}/author', response=lambda: m.TaskDto, body=lambda: m.IdUUID)
+
+    async def update_task_author(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Изменить автора поручений
+
+        PUT /api/document/{documentId}/task/{taskId}/author
+        """
+        return await self._call(
+            self._op_update_task_author,
+            path={'documentId': document_id, 'taskId': task_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_upload_attach = Operation('POST', 'api/document/{documentId}/task/{taskId}/executor/{id}/attach', response=lambda: m.AttachmentTaskDto)
+
+    async def upload_attach(
+        self,
+        document_id: UUID,
+        id: UUID,
+        task_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AttachmentTaskDto:
+        """
+        Загрузить файл
+
+        POST /api/document/{documentId}/task/{taskId}/executor/{id}/attach
+        """
+        return await self._call(
+            self._op_upload_attach,
+            path={'documentId': document_id, 'id': id, 'taskId': task_id},
+            service_token=service_token,
+        )
+
+    _op_upload_child_attach = Operation('POST', 'api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{id}/attach', response=lambda: m.AttachmentTaskDto)
+
+    async def upload_child_attach(
+        self,
+        document_id: UUID,
+        id: UUID,
+        task_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AttachmentTaskDto:
+        """
+        Загрузить файл в дочернее поручение
+
+        POST /api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{id}/attach
+        """
+        return await self._call(
+            self._op_upload_child_attach,
+            path={'documentId': document_id, 'id': id, 'taskId': task_id},
+            service_token=service_token,
+        )
+
+
+class PorucheniiaDokumentyIspolneniiaApi(ApiGroup):
+    """
+    Поручения (Документы исполнения)
+    """
+
+    _op_create_child_document_link = Operation('POST', 'api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{executorId}/link', response=lambda: m.TaskDocumentLinkDto, body=lambda: m.IdsOrgKey)
+
+    async def create_child_document_link(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        executor_id: UUID,
+        *,
+        body: m.IdsOrgKey,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDocumentLinkDto:
+        """
+        Добавить ссылки на документ
+
+        POST /api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{executorId}/link
+        """
+        return await self._call(
+            self._op_create_child_document_link,
+            path={'documentId': document_id, 'taskId': task_id, 'executorId': executor_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create_document_link = Operation('POST', 'api/document/{documentId}/task/{taskId}/executor/{executorId}/link', response=lambda: m.TaskDocumentLinkDto, body=lambda: m.IdsOrgKey)
+
+    async def create_document_link(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        executor_id: UUID,
+        *,
+        body: m.IdsOrgKey,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDocumentLinkDto:
+        """
+        Добавить ссылки на документ
+
+        POST /api/document/{documentId}/task/{taskId}/executor/{executorId}/link
+        """
+        return await self._call(
+            self._op_create_document_link,
+            path={'documentId': document_id, 'taskId': task_id, 'executorId': executor_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_child_document_link = Operation('DELETE', 'api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{executorId}/link/{linkId}')
+
+    async def delete_child_document_link(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        executor_id: UUID,
+        link_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить ссылку
+
+        DELETE /api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{executorId}/link/{linkId}
+        """
+        return await self._call(
+            self._op_delete_child_document_link,
+            path={'documentId': document_id, 'taskId': task_id, 'executorId': executor_id, 'linkId': link_id},
+            service_token=service_token,
+        )
+
+    _op_delete_child_document_link2 = Operation('DELETE', 'api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{executorId}/link', body=lambda: m.IdUUID)
+
+    async def delete_child_document_link2(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        executor_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить ссылку
+
+        DELETE /api/document/{documentId}/task/{parentId}/task/{taskId}/executor/{executorId}/link
+        """
+        return await self._call(
+            self._op_delete_child_document_link2,
+            path={'documentId': document_id, 'taskId': task_id, 'executorId': executor_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_document_link = Operation('DELETE', 'api/document/{documentId}/task/{taskId}/executor/{executorId}/link/{linkId}')
+
+    async def delete_document_link(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        executor_id: UUID,
+        link_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить ссылку
+
+        DELETE /api/document/{documentId}/task/{taskId}/executor/{executorId}/link/{linkId}
+        """
+        return await self._call(
+            self._op_delete_document_link,
+            path={'documentId': document_id, 'taskId': task_id, 'executorId': executor_id, 'linkId': link_id},
+            service_token=service_token,
+        )
+
+    _op_delete_document_link2 = Operation('DELETE', 'api/document/{documentId}/task/{taskId}/executor/{executorId}/link', body=lambda: m.IdUUID)
+
+    async def delete_document_link2(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        executor_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить ссылку
+
+        DELETE /api/document/{documentId}/task/{taskId}/executor/{executorId}/link
+        """
+        return await self._call(
+            self._op_delete_document_link2,
+            path={'documentId': document_id, 'taskId': task_id, 'executorId': executor_id},
+            body=body,
+            service_token=service_token,
+        )
+
+
+class PorucheniiaKontrolApi(ApiGroup):
+    """
+    Поручения (Контроль)
+    """
+
+    _op_change_child_control = Operation('PUT', 'api/document/{documentId}/task/{parentId}/task/{taskId}/control', response=lambda: m.ControlDto, body=lambda: m.ControlRequest)
+
+    async def change_child_control(
+        self,
+        task_id: UUID,
+        document_id: UUID,
+        *,
+        body: m.ControlRequest,
+        service_token: Optional[str] = None,
+    ) -> m.ControlDto:
+        """
+        Изменение контроля дочернего поручения
+
+        PUT /api/document/{documentId}/task/{parentId}/task/{taskId}/control
+        """
+        return await self._call(
+            self._op_change_child_control,
+            path={'taskId': task_id, 'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_change_control = Operation('PUT', 'api/document/{documentId}/task/{taskId}/control', response=lambda: m.ControlDto, body=lambda: m.ControlRequest)
+
+    async def change_control(
+        self,
+        task_id: UUID,
+        document_id: UUID,
+        *,
+        body: m.ControlRequest,
+        service_token: Optional[str] = None,
+    ) -> m.ControlDto:
+        """
+        Изменение контроля поручения
+
+        PUT /api/document/{documentId}/task/{taskId}/control
+        """
+        return await self._call(
+            self._op_change_control,
+            path={'taskId': task_id, 'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_change_order = Operation('POST', 'api/task/kanban/column/{columnId}/tasks/change-order', response=lambda: m.TaskDto, body=lambda: m.IdsOrgKey)
+
+    async def change_order(
+        self,
+        column_id: UUID,
+        *,
+        body: m.IdsOrgKey,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Получить все поручения данного пользователя со статусом на исполнении
+
+        POST /api/task/kanban/column/{columnId}/tasks/change-order
+        """
+        return await self._call(
+            self._op_change_order,
+            path={'columnId': column_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_change_order_1 = Operation('POST', 'api/task/kanban/change-order', response=lambda: m.TaskDto, body=lambda: m.IdsUUID)
+
+    async def change_order_1(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Получить все поручения данного пользователя со статусом на исполнении
+
+        POST /api/task/kanban/change-order
+        """
+        return await self._call(
+            self._op_change_order_1,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_child_to_control = Operation('POST', 'api/document/{documentId}/task/{parentId}/task/{taskId}/control', response=lambda: m.ControlDto, body=lambda: m.ControlRequest)
+
+    async def child_to_control(
+        self,
+        task_id: UUID,
+        document_id: UUID,
+        *,
+        body: m.ControlRequest,
+        service_token: Optional[str] = None,
+    ) -> m.ControlDto:
+        """
+        Поставить дочернее поручение на контроль
+
+        POST /api/document/{documentId}/task/{parentId}/task/{taskId}/control
+        """
+        return await self._call(
+            self._op_child_to_control,
+            path={'taskId': task_id, 'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create_kanban_column = Operation('POST', 'api/task/kanban/column', response=lambda: m.TaskDto, body=lambda: m.TaskKanbanColumnDto)
+
+    async def create_kanban_column(
+        self,
+        *,
+        body: m.TaskKanbanColumnDto,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Получить все поручения данного пользователя со статусом на исполнении
+
+        POST /api/task/kanban/column
+        """
+        return await self._call(
+            self._op_create_kanban_column,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_child_control = Operation('DELETE', 'api/document/{documentId}/task/{parentId}/task/{taskId}/control')
+
+    async def delete_child_control(
+        self,
+        task_id: UUID,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить контроль в дочернем поручении
+
+        DELETE /api/document/{documentId}/task/{parentId}/task/{taskId}/control
+        """
+        return await self._call(
+            self._op_delete_child_control,
+            path={'taskId': task_id, 'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_delete_control = Operation('DELETE', 'api/document/{documentId}/task/{taskId}/control')
+
+    async def delete_control(
+        self,
+        task_id: UUID,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить контроль
+
+        DELETE /api/document/{documentId}/task/{taskId}/control
+        """
+        return await self._call(
+            self._op_delete_control,
+            path={'taskId': task_id, 'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_delete_kanban_column = Operation('DELETE', 'api/task/kanban/column/{id}', response=lambda: m.TaskDto, body=lambda: m.IdUUID)
+
+    async def delete_kanban_column(
+        self,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Получить все поручения данного пользователя со статусом на исполнении
+
+        DELETE /api/task/kanban/column/{id}
+        """
+        return await self._call(
+            self._op_delete_kanban_column,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_link = Operation('DELETE', 'api/task/kanban/column/tasks', response=lambda: m.TaskDto, body=lambda: m.IdUUID)
+
+    async def delete_link(
+        self,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Получить все поручения данного пользователя со статусом на исполнении
+
+        DELETE /api/task/kanban/column/tasks
+        """
+        return await self._call(
+            self._op_delete_link,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/task', response=lambda: m.TaskDto)
+
+    async def get_all(
+        self,
+        *,
+        pageable: m.Pageable,
+        filter: m.TaskFilter,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Получить все поручения данного пользователя со статусом на исполнении
+
+        GET /api/task
+        """
+        return await self._call(
+            self._op_get_all,
+            query={'pageable': pageable, 'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_by_user_author = Operation('GET', 'api/task/stat/user-author', response=lambda: m.ExecutionTaskStatCount)
+
+    async def get_by_user_author(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ExecutionTaskStatCount:
+        """
+
+        GET /api/task/stat/user-author
+        """
+        return await self._call(
+            self._op_get_by_user_author,
+            service_token=service_token,
+        )
+
+    _op_get_by_user_control = Operation('GET', 'api/task/stat/user-control', response=lambda: m.ExecutionTaskStatCount)
+
+    async def get_by_user_control(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ExecutionTaskStatCount:
+        """
+
+        GET /api/task/stat/user-control
+        """
+        return await self._call(
+            self._op_get_by_user_control,
+            service_token=service_token,
+        )
+
+    _op_get_by_user_executor = Operation('GET', 'api/task/stat/user-executor', response=lambda: m.ExecutionTaskStatCount)
+
+    async def get_by_user_executor(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ExecutionTaskStatCount:
+        """
+
+        GET /api/task/stat/user-executor
+        """
+        return await self._call(
+            self._op_get_by_user_executor,
+            service_token=service_token,
+        )
+
+    _op_get_child_control = Operation('GET', 'api/document/{documentId}/task/{parentId}/task/{taskId}/control', response=lambda: m.ControlDto)
+
+    async def get_child_control(
+        self,
+        task_id: UUID,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ControlDto:
+        """
+        Получить контроль дочернего поручения
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{parentId}/task/{taskId}/control
+        """
+        return await self._call(
+            self._op_get_child_control,
+            path={'taskId': task_id, 'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_control = Operation('GET', 'api/document/{documentId}/task/{taskId}/control', response=lambda: m.ControlDto)
+
+    async def get_control(
+        self,
+        task_id: UUID,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ControlDto:
+        """
+        Получить контроль поручения
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{taskId}/control
+        """
+        return await self._call(
+            self._op_get_control,
+            path={'taskId': task_id, 'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_execution_stat_by_period = Operation('GET', 'api/task/stat/execution-period', response=lambda: m.ExecutionTaskStatCount)
+
+    async def get_execution_stat_by_period(
+        self,
+        *,
+        start: datetime,
+        end: datetime,
+        service_token: Optional[str] = None,
+    ) -> m.ExecutionTaskStatCount:
+        """
+
+        GET /api/task/stat/execution-period
+        """
+        return await self._call(
+            self._op_get_execution_stat_by_period,
+            query={'start': start, 'end': end},
+            service_token=service_token,
+        )
+
+    _op_get_kanban = Operation('GET', 'api/task/kanban', response=lambda: m.TaskDto)
+
+    async def get_kanban(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Получить все поручения данного пользователя со статусом на исполнении
+
+        GET /api/task/kanban
+        """
+        return await self._call(
+            self._op_get_kanban,
+            service_token=service_token,
+        )
+
+    _op_remove_child_control = Operation('PUT', 'api/document/{documentId}/task/{parentId}/task/control', body=lambda: m.IdUUID)
+
+    async def remove_child_control(
+        self,
+        document_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Снять дочернее поручение с контроля
+
+        PUT /api/document/{documentId}/task/{parentId}/task/control
+        """
+        return await self._call(
+            self._op_remove_child_control,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_remove_control = Operation('PUT', 'api/document/{documentId}/task/control', body=lambda: m.IdUUID)
+
+    async def remove_control(
+        self,
+        document_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Снять поручение с контроля
+
+        PUT /api/document/{documentId}/task/control
+        """
+        return await self._call(
+            self._op_remove_control,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_to_control = Operation('POST', 'api/document/{documentId}/task/{taskId}/control', response=lambda: m.ControlDto, body=lambda: m.ControlRequest)
+
+    async def to_control(
+        self,
+        task_id: UUID,
+        document_id: UUID,
+        *,
+        body: m.ControlRequest,
+        service_token: Optional[str] = None,
+    ) -> m.ControlDto:
+        """
+        Поставить поручение на контроль
+
+        POST /api/document/{documentId}/task/{taskId}/control
+        """
+        return await self._call(
+            self._op_to_control,
+            path={'taskId': task_id, 'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update_kanban_column = Operation('PUT', 'api/task/kanban/column/{id}', response=lambda: m.TaskDto, body=lambda: m.TaskKanbanColumnDto)
+
+    async def update_kanban_column(
+        self,
+        *,
+        body: m.TaskKanbanColumnDto,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Получить все поручения данного пользователя со статусом на исполнении
+
+        PUT /api/task/kanban/column/{id}
+        """
+        return await self._call(
+            self._op_update_kanban_column,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class PorucheniiaPerenosSrokaIspolneniiaApi(ApiGroup):
+    """
+    Поручения (Перенос срока исполнения)
+    """
+
+    _op_date_child_request = Operation('GET', 'api/document/{documentId}/task/{parentId}/task/{id}/date-request', response=lambda: list[m.TaskChangeDateRequestDto])
+
+    async def date_child_request(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.TaskChangeDateRequestDto]:
+        """
+        Получить все заявки на перенос срока дочернего поручения
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{parentId}/task/{id}/date-request
+        """
+        return await self._call(
+            self._op_date_child_request,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_date_child_request_1 = Operation('POST', 'api/document/{documentId}/task/{parentId}/task/{id}/date-request', response=lambda: m.TaskChangeDateRequestDto, body=lambda: m.TaskChangeDateRequest)
+
+    async def date_child_request_1(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.TaskChangeDateRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TaskChangeDateRequestDto:
+        """
+        Создать заявку на перенос срока дочернего поручения
+
+        POST /api/document/{documentId}/task/{parentId}/task/{id}/date-request
+        """
+        return await self._call(
+            self._op_date_child_request_1,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_date_request = Operation('GET', 'api/document/{documentId}/task/{id}/date-request', response=lambda: list[m.TaskChangeDateRequestDto])
+
+    async def date_request(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.TaskChangeDateRequestDto]:
+        """
+        Получить все заявки на перенос срока
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/{id}/date-request
+        """
+        return await self._call(
+            self._op_date_request,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_date_request_1 = Operation('POST', 'api/document/{documentId}/task/{id}/date-request', response=lambda: m.TaskChangeDateRequestDto, body=lambda: m.TaskChangeDateRequest)
+
+    async def date_request_1(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.TaskChangeDateRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TaskChangeDateRequestDto:
+        """
+        Создать заявку на перенос срока
+
+        POST /api/document/{documentId}/task/{id}/date-request
+        """
+        return await self._call(
+            self._op_date_request_1,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_execute_child_date_request = Operation('POST', 'api/document/{documentId}/task/{parentId}/task/{id}/date-request/{requestId}/execute', response=lambda: m.TaskDto, body=lambda: m.RequestDateExecutionResult)
+
+    async def execute_child_date_request(
+        self,
+        document_id: UUID,
+        id: UUID,
+        request_id: UUID,
+        *,
+        body: m.RequestDateExecutionResult,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Принять запрос на перенос срока дочернего поручения
+
+        POST /api/document/{documentId}/task/{parentId}/task/{id}/date-request/{requestId}/execute
+        """
+        return await self._call(
+            self._op_execute_child_date_request,
+            path={'documentId': document_id, 'id': id, 'requestId': request_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_execute_date_request = Operation('POST', 'api/document/{documentId}/task/{id}/date-request/{requestId}/execute', response=lambda: m.TaskDto, body=lambda: m.RequestDateExecutionResult)
+
+    async def execute_date_request(
+        self,
+        document_id: UUID,
+        id: UUID,
+        request_id: UUID,
+        *,
+        body: m.RequestDateExecutionResult,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Принять запрос на перенос срока
+
+        POST /api/document/{documentId}/task/{id}/date-request/{requestId}/execute
+        """
+        return await self._call(
+            self._op_execute_date_request,
+            path={'documentId': document_id, 'id': id, 'requestId': request_id},
+            body=body,
+            service_token=service_token,
+        )
+
+
+class PoslednieOtkrytyeDokumentyApi(ApiGroup):
+    """
+    Последние открытые документы
+    API для работы с последними открытыми документами
+    """
+
+    _op_delete = Operation('DELETE', 'api/latest-document', response=UUID, body=lambda: m.IdsUUID)
+
+    async def delete(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> UUID:
+        """
+        Удалить открытый документ
+
+        DELETE /api/latest-document
+        """
+        return await self._call(
+            self._op_delete,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_opened_documents = Operation('GET', 'api/latest-document', response=lambda: m.DocumentDto)
+
+    async def get_opened_documents(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentDto:
+        """
+        Получить массив id открытых документов
+
+        GET /api/latest-document
+        """
+        return await self._call(
+            self._op_get_opened_documents,
+            service_token=service_token,
+        )
+
+    _op_opened_document = Operation('POST', 'api/latest-document/{documentId}', response=dict[str, Any])
+
+    async def opened_document(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Добавить открытый документ в коллекцию
+
+        POST /api/latest-document/{documentId}
+        """
+        return await self._call(
+            self._op_opened_document,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+
+class ProektyPorucheniiaApi(ApiGroup):
+    """
+    Проекты поручения
+    API для работы с проектами поручений
+    """
+
+    _op_get_all = Operation('GET', 'api/task-project', response=lambda: m.TaskDto)
+
+    async def get_all(
+        self,
+        *,
+        pageable: m.Pageable,
+        filter: m.TaskProjectFilter,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Получить все поручения данного пользователя со статусом на исполнении
+
+        GET /api/task-project
+        """
+        return await self._call(
+            self._op_get_all,
+            query={'pageable': pageable, 'filter': filter},
+            service_token=service_token,
+        )
+
+
+class ProektyPorucheniiaVDokumenteApi(ApiGroup):
+    """
+    Проекты поручения в документе
+    API для работы с проектами поручений
+    """
+
+    _op_add_batch_executors = Operation('POST', 'api/document/{documentId}/task-project/{id}/executor', response=str, body=lambda: m.IdsUUID)
+
+    async def add_batch_executors(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Добавить исполнителей проекта поручения
+
+        POST /api/document/{documentId}/task-project/{id}/executor
+        """
+        return await self._call(
+            self._op_add_batch_executors,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_change_child_responsible_user = Operation('PUT', 'api/document/{documentId}/task-project/{id}/executor/{executorId}/responsible', response=lambda: m.TaskProjectExecutorDto, body=lambda: m.ChangeResponsibleStatus)
+
+    async def change_child_responsible_user(
+        self,
+        document_id: UUID,
+        id: UUID,
+        executor_id: UUID,
+        *,
+        body: m.ChangeResponsibleStatus,
+        service_token: Optional[str] = None,
+    ) -> m.TaskProjectExecutorDto:
+        """
+        Изменить статус отвественного в поручении
+
+        Только один исполнитель может иметь статус ответсвенного, если уже существует отвественный исполинтель у него признак будет имзенен на false
+
+        PUT /api/document/{documentId}/task-project/{id}/executor/{executorId}/responsible
+        """
+        return await self._call(
+            self._op_change_child_responsible_user,
+            path={'documentId': document_id, 'id': id, 'executorId': executor_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create_batch = Operation('POST', 'api/document/{documentId}/task/{taskId}/task-project/batch', response=lambda: list[m.TaskProjectDto], body=lambda: list[m.CreateTaskProjectRequest])
+
+    async def create_batch(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        *,
+        body: list[m.CreateTaskProjectRequest],
+        service_token: Optional[str] = None,
+    ) -> list[m.TaskProjectDto]:
+        """
+        Создать массив проектов поручений
+
+        POST /api/document/{documentId}/task/{taskId}/task-project/batch
+        """
+        return await self._call(
+            self._op_create_batch,
+            path={'documentId': document_id, 'taskId': task_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create_task = Operation('POST', 'api/document/{documentId}/task-project/{id}/execute', response=lambda: m.TaskDto)
+
+    async def create_task(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Создать поручение из проекта поручения
+
+        POST /api/document/{documentId}/task-project/{id}/execute
+        """
+        return await self._call(
+            self._op_create_task,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_create_task_by_author_id = Operation('POST', 'api/document/{documentId}/task/{taskId}/task-project/execute', response=lambda: list[m.TaskDto], body=lambda: m.IdUUID)
+
+    async def create_task_by_author_id(
+        self,
+        document_id: UUID,
+        task_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> list[m.TaskDto]:
+        """
+        Создать поручение из проекта поручения где автор юзер
+
+        POST /api/document/{documentId}/task/{taskId}/task-project/execute
+        """
+        return await self._call(
+            self._op_create_task_by_author_id,
+            path={'documentId': document_id, 'taskId': task_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/document/{documentId}/task-project/{id}')
+
+    async def delete(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить проект поручения по id
+
+        DELETE /api/document/{documentId}/task-project/{id}
+        """
+        return await self._call(
+            self._op_delete,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_batch_executors = Operation('DELETE', 'api/document/{documentId}/task-project/{id}/executor', response=str, body=lambda: m.IdsUUID)
+
+    async def delete_batch_executors(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Удалить исполнителей поручения
+
+        DELETE /api/document/{documentId}/task-project/{id}/executor
+        """
+        return await self._call(
+            self._op_delete_batch_executors,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_executor = Operation('DELETE', 'api/document/{documentId}/task-project/{taskProjectId}/executor/{id}')
+
+    async def delete_executor(
+        self,
+        document_id: UUID,
+        task_project_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить исполнителя проекта поручения по id
+
+        DELETE /api/document/{documentId}/task-project/{taskProjectId}/executor/{id}
+        """
+        return await self._call(
+            self._op_delete_executor,
+            path={'documentId': document_id, 'taskProjectId': task_project_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_project = Operation('DELETE', 'api/document/{documentId}', response=dict[str, Any], body=lambda: m.IdUUID)
+
+    async def delete_project(
+        self,
+        document_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Удалить проект поручения
+
+        DELETE /api/document/{documentId}
+        """
+        return await self._call(
+            self._op_delete_project,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/document/{documentId}/task-project/{id}', response=lambda: m.TaskDto)
+
+    async def get(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Получить проект поручения по id
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task-project/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_all_task_projects = Operation('GET', 'api/document/{documentId}/task/task-project', response=lambda: list[m.TaskProjectDto])
+
+    async def get_all_task_projects(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.TaskProjectDto]:
+        """
+        Получить проекты поручений в документе
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task/task-project
+        """
+        return await self._call(
+            self._op_get_all_task_projects,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_permission = Operation('GET', 'api/document/{documentId}/task-project/{id}/permission', response=lambda: m.UserDocPermission)
+
+    async def get_permission(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.UserDocPermission:
+        """
+        Получить все разрешения по проекту поручению
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task-project/{id}/permission
+        """
+        return await self._call(
+            self._op_get_permission,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_task_executor = Operation('GET', 'api/document/{documentId}/task-project/{taskProjectId}/executor/{id}', response=lambda: m.TaskProjectExecutorDto)
+
+    async def get_task_executor(
+        self,
+        document_id: UUID,
+        task_project_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TaskProjectExecutorDto:
+        """
+        Получить исполнителя
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task-project/{taskProjectId}/executor/{id}
+        """
+        return await self._call(
+            self._op_get_task_executor,
+            path={'documentId': document_id, 'taskProjectId': task_project_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_task_executors = Operation('GET', 'api/document/{documentId}/task-project/{id}/executor', response=lambda: m.TaskExecutorsDto)
+
+    async def get_task_executors(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.TaskExecutorsDto:
+        """
+        Получить исполнителей
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task-project/{id}/executor
+        """
+        return await self._call(
+            self._op_get_task_executors,
+            path={'documentId': document_id, 'id': id},
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_task_history = Operation('GET', 'api/document/{documentId}/task-project/{id}/history', response=lambda: m.TaskHistoryDto)
+
+    async def get_task_history(
+        self,
+        id: UUID,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TaskHistoryDto:
+        """
+        Получить историю изменений по id
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/task-project/{id}/history
+        """
+        return await self._call(
+            self._op_get_task_history,
+            path={'id': id, 'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_update = Operation('PUT', 'api/document/{documentId}/task-project/{id}', response=lambda: m.TaskDto, body=lambda: m.UpdateTaskProjectRequest)
+
+    async def update(
+        self,
+        document_id: UUID,
+        *,
+        body: m.UpdateTaskProjectRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Изменить проект поручения по id
+
+        PUT /api/document/{documentId}/task-project/{id}
+        """
+        return await self._call(
+            self._op_update,
+            path={'documentId': document_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update_task_author = Operation('PUT', 'api/document/{documentId}/task-project/{id}/author', response=lambda: m.TaskDto, body=lambda: m.IdUUID)
+
+    async def update_task_author(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.TaskDto:
+        """
+        Изменить автора проекта поручений
+
+        PUT /api/document/{documentId}/task-project/{id}/author
+        """
+        return await self._call(
+            self._op_update_task_author,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+
+class ProfiliDokumentaApi(ApiGroup):
+    """
+    Профили документа
+    API для работы с профилями документа
+    Константы для получения истории: DOCUMENT_PROFILE
+    """
+
+    _op_add = Operation('POST', 'api/doc-profile/{id}/contract-attachment', response=lambda: m.AttachmentDto, multipart=True)
+
+    async def add(
+        self,
+        id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> m.AttachmentDto:
+        """
+        Загрузить файл шаблона печатной формы для договоров в MinIO по uuid шаблона
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_DOCUMENT_PROFILE
+
+        POST /api/doc-profile/{id}/contract-attachment
+        """
+        return await self._call(
+            self._op_add,
+            path={'id': id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_add_employee = Operation('POST', 'api/doc-profile/{id}/access-employee/batch', body=lambda: m.IdsUUID)
+
+    async def add_employee(
+        self,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Добавить сотрудников в список доступа для профиля
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_DOCUMENT_PROFILE
+
+        POST /api/doc-profile/{id}/access-employee/batch
+        """
+        return await self._call(
+            self._op_add_employee,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_add_group = Operation('POST', 'api/doc-profile/{id}/access-group/batch', body=lambda: m.IdsUUID)
+
+    async def add_group(
+        self,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Добавить группу в список доступа для профиля
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_DOCUMENT_PROFILE
+
+        POST /api/doc-profile/{id}/access-group/batch
+        """
+        return await self._call(
+            self._op_add_group,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_bpmn_deploy = Operation('PUT', 'api/doc-profile/{id}/bpmn-deploy', response=lambda: m.DocumentProfileDto, body=lambda: m.IdUUID)
+
+    async def bpmn_deploy(
+        self,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentProfileDto:
+        """
+        Изменить профиль документа
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_DOCUMENT_PROFILE
+
+        PUT /api/doc-profile/{id}/bpmn-deploy
+        """
+        return await self._call(
+            self._op_bpmn_deploy,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/doc-profile/{id}')
+
+    async def delete(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить профиль документа по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_DOCUMENT_PROFILE
+
+        DELETE /api/doc-profile/{id}
+        """
+        return await self._call(
+            self._op_delete,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_attachment = Operation('DELETE', 'api/doc-profile/contract-attachment/{id}')
+
+    async def delete_attachment(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить вложения шаблона договора по uuid профиля документа
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_DOCUMENT_PROFILE
+
+        DELETE /api/doc-profile/contract-attachment/{id}
+        """
+        return await self._call(
+            self._op_delete_attachment,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_employees = Operation('DELETE', 'api/doc-profile/{id}/access-employee/batch', body=lambda: m.IdsUUID)
+
+    async def delete_employees(
+        self,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить сотрудников в список доступа для профиля
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_DOCUMENT_PROFILE
+
+        DELETE /api/doc-profile/{id}/access-employee/batch
+        """
+        return await self._call(
+            self._op_delete_employees,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_files = Operation('DELETE', 'api/doc-profile/{id}/attachment/{attachmentId}', response=str)
+
+    async def delete_files(
+        self,
+        id: UUID,
+        attachment_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Удалить шаблоны печати
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DOCUMENT_PROFILE
+
+        DELETE /api/doc-profile/{id}/attachment/{attachmentId}
+        """
+        return await self._call(
+            self._op_delete_files,
+            path={'id': id, 'attachmentId': attachment_id},
+            service_token=service_token,
+        )
+
+    _op_delete_groups = Operation('DELETE', 'api/doc-profile/{id}/access-group/batch', body=lambda: m.IdsUUID)
+
+    async def delete_groups(
+        self,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить группу в список доступа для профиля
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_DOCUMENT_PROFILE
+
+        DELETE /api/doc-profile/{id}/access-group/batch
+        """
+        return await self._call(
+            self._op_delete_groups,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_list = Operation('DELETE', 'api/doc-profile', body=lambda: m.IdsUUID)
+
+    async def delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить профили документа по ids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_DOCUMENT_PROFILE
+
+        DELETE /api/doc-profile
+        """
+        return await self._call(
+            self._op_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_download_file = Operation('GET', 'api/doc-profile/{profileId}/attachment/{id}', binary=True)
+
+    def download_file(
+        self,
+        profile_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Скачать файл
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DOCUMENT_PROFILE
+
+        GET /api/doc-profile/{profileId}/attachment/{id}
+        """
+        return self._stream(
+            self._op_download_file,
+            path={'profileId': profile_id, 'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_download_file_template_contract = Operation('GET', 'api/doc-profile/contract-attachment/{id}/download', binary=True)
+
+    def download_file_template_contract(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл шаблона договоров из MinIO по uuid профиля документа
+
+        GET /api/doc-profile/contract-attachment/{id}/download
+        """
+        return self._stream(
+            self._op_download_file_template_contract,
+            path={'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_download_xml = Operation('GET', 'api/doc-profile/{id}/xml', response=dict[str, Any])
+
+    async def download_xml(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DOCUMENT_PROFILE
+
+        GET /api/doc-profile/{id}/xml
+        """
+        return await self._call(
+            self._op_download_xml,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/doc-profile/{id}', response=lambda: m.DocumentProfileDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentProfileDto:
+        """
+        Получить профиль документа по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DOCUMENT_PROFILE
+
+        GET /api/doc-profile/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection_21 = Operation('GET', 'api/doc-profile', response=lambda: m.DocumentProfileDto)
+
+    async def get_collection_21(
+        self,
+        *,
+        filter: m.DocumentProfileFilter,
+        list_attribute: bool,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentProfileDto:
+        """
+        Получить список профилей документа
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DOCUMENT_PROFILE
+
+        GET /api/doc-profile
+        """
+        return await self._call(
+            self._op_get_collection_21,
+            query={'filter': filter, 'listAttribute': list_attribute, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_collection_39 = Operation('GET', 'api/doc-profile/{id}/contract-attachment', response=lambda: m.ProfileContractAttachmentDto)
+
+    async def get_collection_39(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ProfileContractAttachmentDto:
+        """
+        Получить вложения шаблона договора по uuid профиля документа
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DOCUMENT_PROFILE
+
+        GET /api/doc-profile/{id}/contract-attachment
+        """
+        return await self._call(
+            self._op_get_collection_39,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_employee = Operation('GET', 'api/doc-profile/{id}/access-employee')
+
+    async def get_employee(
+        self,
+        id: UUID,
+        *,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Получить сотрудников списка доступа
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DOCUMENT_PROFILE
+
+        GET /api/doc-profile/{id}/access-employee
+        """
+        return await self._call(
+            self._op_get_employee,
+            path={'id': id},
+            query={'p': p},
+            service_token=service_token,
+        )
+
+    _op_get_files = Operation('GET', 'api/doc-profile/{id}/attachment', response=lambda: list[m.ProfileAttachmentDto])
+
+    async def get_files(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.ProfileAttachmentDto]:
+        """
+        Получить шаблоны печати
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DOCUMENT_PROFILE
+
+        GET /api/doc-profile/{id}/attachment
+        """
+        return await self._call(
+            self._op_get_files,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_group = Operation('GET', 'api/doc-profile/{id}/access-group')
+
+    async def get_group(
+        self,
+        id: UUID,
+        *,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Получить группы списка доступа
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DOCUMENT_PROFILE
+
+        GET /api/doc-profile/{id}/access-group
+        """
+        return await self._call(
+            self._op_get_group,
+            path={'id': id},
+            query={'p': p},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/doc-profile', response=lambda: m.DocumentProfileDto, body=lambda: m.DocumentProfileDto)
+
+    async def post(
+        self,
+        *,
+        body: m.DocumentProfileDto,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentProfileDto:
+        """
+        Создать новый профиль документа
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_DOCUMENT_PROFILE
+
+        POST /api/doc-profile
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put_29 = Operation('PUT', 'api/doc-profile', response=lambda: m.DocumentProfileDto, body=lambda: m.DocumentProfileDto)
+
+    async def put_29(
+        self,
+        *,
+        body: m.DocumentProfileDto,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentProfileDto:
+        """
+        Изменить профиль документа
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_DOCUMENT_PROFILE
+
+        PUT /api/doc-profile
+        """
+        return await self._call(
+            self._op_put_29,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put_44 = Operation('POST', 'api/doc-profile/copy', response=lambda: m.DocumentProfileDto, body=lambda: m.IdsUUID)
+
+    async def put_44(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentProfileDto:
+        """
+        Изменить профиль документа
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_DOCUMENT_PROFILE
+
+        POST /api/doc-profile/copy
+        """
+        return await self._call(
+            self._op_put_44,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_upload_file = Operation('POST', 'api/doc-profile/{id}/attachment', multipart=True)
+
+    async def upload_file(
+        self,
+        id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить файл
+
+        POST /api/doc-profile/{id}/attachment
+        """
+        return await self._call(
+            self._op_upload_file,
+            path={'id': id},
+            body=files,
+            service_token=service_token,
+        )
+
+
+class ProtsessyDokumentaApi(ApiGroup):
+    """
+    Процессы документа
+    API для работы с процессами документа
+    """
+
+    _op_accepted = Operation('POST', 'api/document/{documentId}/process/{id}/accepted', body=lambda: m.SimpleProcessAction)
+
+    async def accepted(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.SimpleProcessAction,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку завершения этапа одобрение
+
+        Для доступа к этому API необходимо: [DOCUMENT_ACCEPTANCE_COMPLETED]
+
+        POST /api/document/{documentId}/process/{id}/accepted
+        """
+        return await self._call(
+            self._op_accepted,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_agreement = Operation('POST', 'api/document/{documentId}/process/{id}/agreement', body=lambda: m.SimpleProcessAction)
+
+    async def agreement(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.SimpleProcessAction,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку согласования
+
+        Для доступа к этому API необходимо: [DOCUMENT_PROCESS_AGREEMENT]
+
+        POST /api/document/{documentId}/process/{id}/agreement
+        """
+        return await self._call(
+            self._op_agreement,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_contract_execution = Operation('POST', 'api/document/{documentId}/process/{id}/contract-execution', body=lambda: m.SimpleProcessAction)
+
+    async def contract_execution(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.SimpleProcessAction,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку исполнения договора
+
+        Для доступа к этому API необходимо: [DOCUMENT_PROCESS_CONTRACT_EXECUTION]
+
+        POST /api/document/{documentId}/process/{id}/contract-execution
+        """
+        return await self._call(
+            self._op_contract_execution,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_dispatch = Operation('POST', 'api/document/{documentId}/process/{id}/dispatch')
+
+    async def dispatch(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Отправить документ
+
+        Для доступа к этому API необходимо: [DOCUMENT_PROCESS_SENT]
+
+        POST /api/document/{documentId}/process/{id}/dispatch
+        """
+        return await self._call(
+            self._op_dispatch,
+            path={'documentId': document_id, 'id': id},
+            service_token=service_token,
+        )
+
+    _op_free_registration = Operation('POST', 'api/document/{documentId}/process/{id}/free-registration', body=lambda: m.FreeRegistrationProcessRequest)
+
+    async def free_registration(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.FreeRegistrationProcessRequest,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Зарегистрировать документ произвольным номером
+
+        Для доступа к этому API необходимо: [DOCUMENT_PROCESS_FREE_REGISTRATION]
+
+        POST /api/document/{documentId}/process/{id}/free-registration
+        """
+        return await self._call(
+            self._op_free_registration,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/document/{documentId}/process', response=lambda: m.DocumentProcessDto)
+
+    async def get(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentProcessDto:
+        """
+        Получить процесс документа
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/process
+        """
+        return await self._call(
+            self._op_get,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+    _op_get_process_bpmn_activity = Operation('GET', 'api/document/{documentId}/process/{processId}/bpmn/activity/{activityId}', response=lambda: m.BpmnProcessItemDefinitionDto)
+
+    async def get_process_bpmn_activity(
+        self,
+        document_id: UUID,
+        process_id: UUID,
+        activity_id: str,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.BpmnProcessItemDefinitionDto:
+        """
+        Получить описание этапа
+
+        GET /api/document/{documentId}/process/{processId}/bpmn/activity/{activityId}
+        """
+        return await self._call(
+            self._op_get_process_bpmn_activity,
+            path={'documentId': document_id, 'processId': process_id, 'activityId': activity_id},
+            service_token=service_token,
+        )
+
+    _op_get_process_bpmn_activity_definition = Operation('GET', 'api/document/{documentId}/process/{processId}/bpmn/activity/{activityId}/definition', response=lambda: m.BpmnProcessItemDefinitionDto)
+
+    async def get_process_bpmn_activity_definition(
+        self,
+        document_id: UUID,
+        process_id: UUID,
+        activity_id: str,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.BpmnProcessItemDefinitionDto:
+        """
+
+        GET /api/document/{documentId}/process/{processId}/bpmn/activity/{activityId}/definition
+        """
+        return await self._call(
+            self._op_get_process_bpmn_activity_definition,
+            path={'documentId': document_id, 'processId': process_id, 'activityId': activity_id},
+            service_token=service_token,
+        )
+
+    _op_get_process_executors = Operation('GET', 'api/document/{documentId}/process/{id}/executors', response=lambda: m.DocumentProcessExecutorDto)
+
+    async def get_process_executors(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        page: bool,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentProcessExecutorDto:
+        """
+        Получить участников процесса
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/process/{id}/executors
+        """
+        return await self._call(
+            self._op_get_process_executors,
+            path={'documentId': document_id, 'id': id},
+            query={'page': page, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_process_executors_by_item_type = Operation('GET', 'api/document/{documentId}/process/{id}/{type}/executors', response=lambda: m.DocumentProcessExecutorDto)
+
+    async def get_process_executors_by_item_type(
+        self,
+        document_id: UUID,
+        id: UUID,
+        type: str,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentProcessExecutorDto:
+        """
+        Получить участников по типу этапа
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document/{documentId}/process/{id}/{type}/executors
+        """
+        return await self._call(
+            self._op_get_process_executors_by_item_type,
+            path={'documentId': document_id, 'id': id, 'type': type},
+            service_token=service_token,
+        )
+
+    _op_paperwork_completed = Operation('POST', 'api/document/{documentId}/process/{id}/paperwork-completed', body=lambda: m.PaperworkProcessAction)
+
+    async def paperwork_completed(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.PaperworkProcessAction,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку завершения этапа подготовки
+
+        Для доступа к этому API необходимо: [DOCUMENT_PAPERWORK_COMPLETED]
+
+        POST /api/document/{documentId}/process/{id}/paperwork-completed
+        """
+        return await self._call(
+            self._op_paperwork_completed,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_preparation_completed = Operation('POST', 'api/document/{documentId}/process/{id}/preparation-completed', body=lambda: m.SimpleProcessAction)
+
+    async def preparation_completed(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.SimpleProcessAction,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку завершения этапа подготовки
+
+        Для доступа к этому API необходимо: [DOCUMENT_PREPARATION_COMPLETED]
+
+        POST /api/document/{documentId}/process/{id}/preparation-completed
+        """
+        return await self._call(
+            self._op_preparation_completed,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_redirect_review = Operation('POST', 'api/document/{documentId}/process/{id}/redirect-review', body=lambda: m.RedirectReviewProcessAction)
+
+    async def redirect_review(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.RedirectReviewProcessAction,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Перенаправить рассмотрение
+
+        Для доступа к этому API необходимо: [DOCUMENT_PROCESS_REDIRECT_REVIEW]
+
+        POST /api/document/{documentId}/process/{id}/redirect-review
+        """
+        return await self._call(
+            self._op_redirect_review,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_registration = Operation('POST', 'api/document/{documentId}/process/{id}/registration', body=lambda: m.RegistrationProcessRequest)
+
+    async def registration(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.RegistrationProcessRequest,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Зарегистрировать документ
+
+        Для доступа к этому API необходимо: [DOCUMENT_PROCESS_REGISTRATION]
+
+        POST /api/document/{documentId}/process/{id}/registration
+        """
+        return await self._call(
+            self._op_registration,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_reserve_regnumber = Operation('POST', 'api/document/{documentId}/process/{id}/reserve-regnumber', response=str, body=lambda: m.ReserveRegnumberRequest)
+
+    async def reserve_regnumber(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.ReserveRegnumberRequest,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Зарезервировать рег номер и дату регистрации документа
+
+        Для доступа к этому API необходимо: [DOCUMENT_RESERVE_REGNUMBER]
+
+        POST /api/document/{documentId}/process/{id}/reserve-regnumber
+        """
+        return await self._call(
+            self._op_reserve_regnumber,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_review = Operation('POST', 'api/document/{documentId}/process/{id}/review', body=lambda: m.SimpleProcessAction)
+
+    async def review(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.SimpleProcessAction,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку рассмотрения
+
+        Для доступа к этому API необходимо: [DOCUMENT_PROCESS_REVIEW]
+
+        POST /api/document/{documentId}/process/{id}/review
+        """
+        return await self._call(
+            self._op_review,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_signing = Operation('POST', 'api/document/{documentId}/process/{id}/signing', body=lambda: m.ProcessActionWithSign)
+
+    async def signing(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.ProcessActionWithSign,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку подписания
+
+        Для доступа к этому API необходимо: [DOCUMENT_PROCESS_SIGNING]
+
+        POST /api/document/{documentId}/process/{id}/signing
+        """
+        return await self._call(
+            self._op_signing,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_smdo_registration_reject = Operation('POST', 'api/document/{documentId}/process/{id}/smdo-registration-reject', body=lambda: m.SmdoRegistrationReject)
+
+    async def smdo_registration_reject(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.SmdoRegistrationReject,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Отказать в регистрации документа
+
+        Для доступа к этому API необходимо: [DOCUMENT_PROCESS_SMDO_REGISTRATION_REJECT]
+
+        POST /api/document/{documentId}/process/{id}/smdo-registration-reject
+        """
+        return await self._call(
+            self._op_smdo_registration_reject,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_smdo_registration_skip = Operation('POST', 'api/document/{documentId}/process/{id}/smdo-registration-skip', body=lambda: m.RegistrationProcessRequest)
+
+    async def smdo_registration_skip(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.RegistrationProcessRequest,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Принять без регистрации
+
+        Для доступа к этому API необходимо: [DOCUMENT_PROCESS_SMDO_REGISTRATION_SKIP]
+
+        POST /api/document/{documentId}/process/{id}/smdo-registration-skip
+        """
+        return await self._call(
+            self._op_smdo_registration_skip,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_start_after = Operation('PUT', 'api/document/{documentId}/process/{processId}/bpmn/start-after', response=lambda: m.DocumentPropertiesDto, body=lambda: m.BpmnStartBeforeRequest)
+
+    async def start_after(
+        self,
+        document_id: UUID,
+        process_id: UUID,
+        *,
+        body: m.BpmnStartBeforeRequest,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentPropertiesDto:
+        """
+        Для доступа к этому API необходимо: [DOCUMENT_PROCESS_MOVE]
+
+        PUT /api/document/{documentId}/process/{processId}/bpmn/start-after
+        """
+        return await self._call(
+            self._op_start_after,
+            path={'documentId': document_id, 'processId': process_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_start_before = Operation('PUT', 'api/document/{documentId}/process/{processId}/bpmn/start-before', response=lambda: m.DocumentPropertiesDto, body=lambda: m.BpmnStartBeforeRequest)
+
+    async def start_before(
+        self,
+        document_id: UUID,
+        process_id: UUID,
+        *,
+        body: m.BpmnStartBeforeRequest,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentPropertiesDto:
+        """
+        Для доступа к этому API необходимо: [DOCUMENT_PROCESS_MOVE]
+
+        PUT /api/document/{documentId}/process/{processId}/bpmn/start-before
+        """
+        return await self._call(
+            self._op_start_before,
+            path={'documentId': document_id, 'processId': process_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_statement = Operation('POST', 'api/document/{documentId}/process/{id}/statement', body=lambda: m.ProcessActionWithSign)
+
+    async def statement(
+        self,
+        document_id: UUID,
+        id: UUID,
+        *,
+        body: m.ProcessActionWithSign,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку утверждения
+
+        Для доступа к этому API необходимо: [DOCUMENT_PROCESS_STATEMENT]
+
+        POST /api/document/{documentId}/process/{id}/statement
+        """
+        return await self._call(
+            self._op_statement,
+            path={'documentId': document_id, 'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update_process_bpmn_activity = Operation('PUT', 'api/document/{documentId}/process/{processId}/bpmn/activity/{activityId}', response=str, body=lambda: m.CamundaProcessItemDefinitionRequest)
+
+    async def update_process_bpmn_activity(
+        self,
+        document_id: UUID,
+        process_id: UUID,
+        activity_id: str,
+        *,
+        body: m.CamundaProcessItemDefinitionRequest,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Получить текущее состояние этапа
+
+        Для доступа к этому API необходимо: [DOCUMENT_PROCESS_EXECUTORS_UPDATE, DOCUMENT_PROCESS_ITEM_UPDATE]
+
+        PUT /api/document/{documentId}/process/{processId}/bpmn/activity/{activityId}
+        """
+        return await self._call(
+            self._op_update_process_bpmn_activity,
+            path={'documentId': document_id, 'processId': process_id, 'activityId': activity_id},
+            body=body,
+            service_token=service_token,
+        )
+
+
+class RaionyApi(ApiGroup):
+    """
+    Районы
+    API для работы с районами
+    Константы для получения истории: DISTRICT
+    """
+
+    _op_find_all_by_region_id = Operation('GET', 'api/district/{regionId}/region', response=lambda: m.DistrictDto)
+
+    async def find_all_by_region_id(
+        self,
+        region_id: UUID,
+        *,
+        list_attribute: bool,
+        filter: m.DistrictFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.DistrictDto:
+        """
+        Получить все районы по id области через Slice либо List
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DISTRICT
+
+        GET /api/district/{regionId}/region
+        """
+        return await self._call(
+            self._op_find_all_by_region_id,
+            path={'regionId': region_id},
+            query={'listAttribute': list_attribute, 'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_fts_name = Operation('GET', 'api/district/fts-name', response=lambda: m.DistrictDto)
+
+    async def fts_name(
+        self,
+        *,
+        fts: str,
+        service_token: Optional[str] = None,
+    ) -> m.DistrictDto:
+        """
+        Полнотекстовый поиск района по названию
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DISTRICT
+
+        GET /api/district/fts-name
+        """
+        return await self._call(
+            self._op_fts_name,
+            query={'fts': fts},
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/district/{id}', response=lambda: m.DistrictDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        filter: m.DistrictFilter,
+        service_token: Optional[str] = None,
+    ) -> m.DistrictDto:
+        """
+        Получить район по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DISTRICT
+
+        GET /api/district/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/district', response=lambda: m.DistrictDto)
+
+    async def get_collection(
+        self,
+        *,
+        list_attribute: bool,
+        filter: m.DistrictFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.DistrictDto:
+        """
+        Получить список районов через Slice либо List
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DISTRICT
+
+        GET /api/district
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'listAttribute': list_attribute, 'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_mark_delete_list = Operation('DELETE', 'api/district', body=lambda: m.IdsUUID)
+
+    async def mark_delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку об удалении для списка районов по ids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_DISTRICT
+
+        DELETE /api/district
+        """
+        return await self._call(
+            self._op_mark_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/district', response=lambda: m.DistrictDto, body=lambda: m.DistrictDto)
+
+    async def post(
+        self,
+        *,
+        body: m.DistrictDto,
+        service_token: Optional[str] = None,
+    ) -> m.DistrictDto:
+        """
+        Создать новый район
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_DISTRICT
+
+        POST /api/district
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/district', response=lambda: m.DistrictDto, body=lambda: m.DistrictDto)
+
+    async def put(
+        self,
+        *,
+        body: m.DistrictDto,
+        service_token: Optional[str] = None,
+    ) -> m.DistrictDto:
+        """
+        Изменить район
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_DISTRICT
+
+        PUT /api/district
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class ReestrPoleiFormApi(ApiGroup):
+    """
+    Реестр полей форм
+    API для работы с реестром полей форм
+    """
+
+    _op_create = Operation('POST', 'api/form-field-registry', response=lambda: m.FormFieldRegistryEntryDto, body=lambda: m.FormFieldRegistryEntryDto)
+
+    async def create(
+        self,
+        *,
+        body: m.FormFieldRegistryEntryDto,
+        service_token: Optional[str] = None,
+    ) -> m.FormFieldRegistryEntryDto:
+        """
+        Создать новое поле формы
+
+        POST /api/form-field-registry
+        """
+        return await self._call(
+            self._op_create,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/form-field-registry', response=Any, body=lambda: m.IdsString)
+
+    async def delete(
+        self,
+        *,
+        body: m.IdsString,
+        service_token: Optional[str] = None,
+    ) -> Any:
+        """
+        Удалить поля форм по списку ids
+
+        DELETE /api/form-field-registry
+        """
+        return await self._call(
+            self._op_delete,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/form-field-registry/all', response=lambda: list[m.FormFieldRegistryEntryDto])
+
+    async def get_all(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.FormFieldRegistryEntryDto]:
+        """
+        Получить все поля форм без пагинации
+
+        GET /api/form-field-registry/all
+        """
+        return await self._call(
+            self._op_get_all,
+            service_token=service_token,
+        )
+
+    _op_get_by_id = Operation('GET', 'api/form-field-registry/{id}', response=lambda: m.FormFieldRegistryEntryDto)
+
+    async def get_by_id(
+        self,
+        id: str,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.FormFieldRegistryEntryDto:
+        """
+        Получить поле формы по id
+
+        GET /api/form-field-registry/{id}
+        """
+        return await self._call(
+            self._op_get_by_id,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/form-field-registry', response=lambda: m.SliceDtoFormFieldRegistryEntryDto)
+
+    async def get_collection(
+        self,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoFormFieldRegistryEntryDto:
+        """
+        Получить список полей форм с пагинацией
+
+        GET /api/form-field-registry
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_update = Operation('PUT', 'api/form-field-registry/{id}', response=lambda: m.FormFieldRegistryEntryDto, body=lambda: m.FormFieldRegistryEntryDto)
+
+    async def update(
+        self,
+        id: str,
+        *,
+        body: m.FormFieldRegistryEntryDto,
+        service_token: Optional[str] = None,
+    ) -> m.FormFieldRegistryEntryDto:
+        """
+        Обновить поле формы
+
+        PUT /api/form-field-registry/{id}
+        """
+        return await self._call(
+            self._op_update,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+
+class RezultatResheniiaApi(ApiGroup):
+    """
+    Результат решения
+    API для работы с результатами решений
+    Константы для получения истории: SOLUTION_RESULT
+    """
+
+    _op_delete_list = Operation('DELETE', 'api/solution-result', body=lambda: m.IdsUUID)
+
+    async def delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список результатов решений
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_SOLUTION_RESULT
+
+        DELETE /api/solution-result
+        """
+        return await self._call(
+            self._op_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/solution-result/{id}', response=lambda: m.SolutionResultDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.SolutionResultDto:
+        """
+        Получить результат решения по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_SOLUTION_RESULT
+
+        GET /api/solution-result/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/solution-result', response=lambda: m.SolutionResultDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SolutionResultDto:
+        """
+        Получить список результатов решений
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_SOLUTION_RESULT
+
+        GET /api/solution-result
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/solution-result', response=lambda: m.SolutionResultDto, body=lambda: m.SolutionResultRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.SolutionResultRequest,
+        service_token: Optional[str] = None,
+    ) -> m.SolutionResultDto:
+        """
+        Создать новый результат решения
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_SOLUTION_RESULT
+
+        POST /api/solution-result
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/solution-result', response=lambda: m.SolutionResultDto, body=lambda: m.SolutionResultRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.SolutionResultRequest,
+        service_token: Optional[str] = None,
+    ) -> m.SolutionResultDto:
+        """
+        Изменить результат решения
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_SOLUTION_RESULT
+
+        PUT /api/solution-result
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class RoliPolzovateleiApi(ApiGroup):
+    """
+    Роли пользователей
+    Константы для получения истории: ROLE, GROUP_EMPLOYEE, EMPLOYEE
+    """
+
+    _op_add_employee = Operation('POST', 'api/role/{roleId}/employee', response=lambda: m.DocumentFolderDto, body=lambda: m.IdUUID)
+
+    async def add_employee(
+        self,
+        role_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFolderDto:
+        """
+        Добавить сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_ROLE
+
+        POST /api/role/{roleId}/employee
+        """
+        return await self._call(
+            self._op_add_employee,
+            path={'roleId': role_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_add_employees = Operation('POST', 'api/role/{roleId}/employee/batch', response=lambda: m.DocumentFolderDto, body=lambda: m.IdsUUID)
+
+    async def add_employees(
+        self,
+        role_id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFolderDto:
+        """
+        Добавить сотрудников
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_ROLE
+
+        POST /api/role/{roleId}/employee/batch
+        """
+        return await self._call(
+            self._op_add_employees,
+            path={'roleId': role_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_add_group = Operation('POST', 'api/role/{roleId}/group', response=lambda: m.DocumentFolderDto, body=lambda: m.IdUUID)
+
+    async def add_group(
+        self,
+        role_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFolderDto:
+        """
+        Добавить группу
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_ROLE
+
+        POST /api/role/{roleId}/group
+        """
+        return await self._call(
+            self._op_add_group,
+            path={'roleId': role_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_add_groups = Operation('POST', 'api/role/{roleId}/group/batch', response=lambda: m.DocumentFolderDto, body=lambda: m.IdsUUID)
+
+    async def add_groups(
+        self,
+        role_id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFolderDto:
+        """
+        Добавить группы
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_ROLE
+
+        POST /api/role/{roleId}/group/batch
+        """
+        return await self._call(
+            self._op_add_groups,
+            path={'roleId': role_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_employee = Operation('DELETE', 'api/role/{roleId}/employee', response=lambda: m.DocumentFolderDto, body=lambda: m.IdUUID)
+
+    async def delete_employee(
+        self,
+        role_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFolderDto:
+        """
+        Удалить сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_ROLE
+
+        DELETE /api/role/{roleId}/employee
+        """
+        return await self._call(
+            self._op_delete_employee,
+            path={'roleId': role_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_group = Operation('DELETE', 'api/role/{roleId}/group', response=lambda: m.DocumentFolderDto, body=lambda: m.IdUUID)
+
+    async def delete_group(
+        self,
+        role_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFolderDto:
+        """
+        Удалить группу
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_ROLE
+
+        DELETE /api/role/{roleId}/group
+        """
+        return await self._call(
+            self._op_delete_group,
+            path={'roleId': role_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_groups = Operation('DELETE', 'api/role/{roleId}/group/batch', response=lambda: m.DocumentFolderDto, body=lambda: m.IdsUUID)
+
+    async def delete_groups(
+        self,
+        role_id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFolderDto:
+        """
+        Удалить сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_ROLE
+
+        DELETE /api/role/{roleId}/group/batch
+        """
+        return await self._call(
+            self._op_delete_groups,
+            path={'roleId': role_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_role = Operation('DELETE', 'api/role', response=lambda: m.RoleDto, body=lambda: m.IdUUID)
+
+    async def delete_role(
+        self,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.RoleDto:
+        """
+        Удалить роль
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_ROLE
+
+        DELETE /api/role
+        """
+        return await self._call(
+            self._op_delete_role,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_roles = Operation('DELETE', 'api/role/batch', response=lambda: m.RoleDto, body=lambda: m.IdsUUID)
+
+    async def delete_roles(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.RoleDto:
+        """
+        Удалить роль
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_ROLE
+
+        DELETE /api/role/batch
+        """
+        return await self._call(
+            self._op_delete_roles,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_edit = Operation('PUT', 'api/role', response=lambda: m.RoleDto, body=lambda: m.RoleDto)
+
+    async def edit(
+        self,
+        *,
+        body: m.RoleDto,
+        service_token: Optional[str] = None,
+    ) -> m.RoleDto:
+        """
+        Создать новую роль
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_ROLE
+
+        PUT /api/role
+        """
+        return await self._call(
+            self._op_edit,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_edit_v2 = Operation('PUT', 'api/role/v2', response=lambda: m.RoleDto, body=lambda: m.RoleUpdateRequest)
+
+    async def edit_v2(
+        self,
+        *,
+        body: m.RoleUpdateRequest,
+        service_token: Optional[str] = None,
+    ) -> m.RoleDto:
+        """
+        Создать новую роль
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_ROLE
+
+        PUT /api/role/v2
+        """
+        return await self._call(
+            self._op_edit_v2,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_find_all = Operation('GET', 'api/role/all', response=lambda: m.RoleDto)
+
+    async def find_all(
+        self,
+        *,
+        type: list[str] | None = None,
+        service_token: Optional[str] = None,
+    ) -> m.RoleDto:
+        """
+        Получить все системные роли
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ROLE
+
+        GET /api/role/all
+        """
+        return await self._call(
+            self._op_find_all,
+            query={'type': type},
+            service_token=service_token,
+        )
+
+    _op_find_by_id = Operation('GET', 'api/role/{id}', response=lambda: m.RoleDto)
+
+    async def find_by_id(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.RoleDto:
+        """
+        Получить роль
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ROLE
+
+        GET /api/role/{id}
+        """
+        return await self._call(
+            self._op_find_by_id,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/role', response=lambda: m.RoleDto)
+
+    async def get_all(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.RoleDto:
+        """
+        Получить все системные роли
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ROLE
+
+        GET /api/role
+        """
+        return await self._call(
+            self._op_get_all,
+            query={'request': request, 'p': p},
+            service_token=service_token,
+        )
+
+    _op_get_all_employee = Operation('GET', 'api/role/{roleId}/employee', response=lambda: m.GroupEmployeeDto)
+
+    async def get_all_employee(
+        self,
+        role_id: UUID,
+        *,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.GroupEmployeeDto:
+        """
+        Получить сотрудников
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ROLE
+
+        GET /api/role/{roleId}/employee
+        """
+        return await self._call(
+            self._op_get_all_employee,
+            path={'roleId': role_id},
+            query={'p': p},
+            service_token=service_token,
+        )
+
+    _op_get_all_groups = Operation('GET', 'api/role/{roleId}/group', response=lambda: m.GroupEmployeeDto)
+
+    async def get_all_groups(
+        self,
+        role_id: UUID,
+        *,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.GroupEmployeeDto:
+        """
+        Получить группы
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ROLE
+
+        GET /api/role/{roleId}/group
+        """
+        return await self._call(
+            self._op_get_all_groups,
+            path={'roleId': role_id},
+            query={'p': p},
+            service_token=service_token,
+        )
+
+    _op_get_employee_exclude = Operation('GET', 'api/role/{roleId}/employee-exclude', response=lambda: m.EmployeeDto)
+
+    async def get_employee_exclude(
+        self,
+        role_id: UUID,
+        *,
+        p: m.Pageable,
+        filter: m.EmployeeFilter,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeDto:
+        """
+        Получить сотрудников за исключением существующих
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ROLE
+
+        GET /api/role/{roleId}/employee-exclude
+        """
+        return await self._call(
+            self._op_get_employee_exclude,
+            path={'roleId': role_id},
+            query={'p': p, 'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_remove_employees = Operation('DELETE', 'api/role/{roleId}/employee/batch', response=lambda: m.DocumentFolderDto, body=lambda: m.IdsUUID)
+
+    async def remove_employees(
+        self,
+        role_id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentFolderDto:
+        """
+        Удалить сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_ROLE
+
+        DELETE /api/role/{roleId}/employee/batch
+        """
+        return await self._call(
+            self._op_remove_employees,
+            path={'roleId': role_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_save = Operation('POST', 'api/role', response=lambda: m.RoleDto, body=lambda: m.RoleDto)
+
+    async def save(
+        self,
+        *,
+        body: m.RoleDto,
+        service_token: Optional[str] = None,
+    ) -> m.RoleDto:
+        """
+        Создать новую роль
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_ROLE
+
+        POST /api/role
+        """
+        return await self._call(
+            self._op_save,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_save_v2 = Operation('POST', 'api/role/v2', response=lambda: m.RoleDto, body=lambda: m.RoleAddRequest)
+
+    async def save_v2(
+        self,
+        *,
+        body: m.RoleAddRequest,
+        service_token: Optional[str] = None,
+    ) -> m.RoleDto:
+        """
+        Создать новую роль
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_ROLE
+
+        POST /api/role/v2
+        """
+        return await self._call(
+            self._op_save_v2,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class SertifikatySotrudnikaApi(ApiGroup):
+    """
+    Сертификаты сотрудника
+    API для работы с сертификатами сотрудника
+    """
+
+    _op_delete_all = Operation('DELETE', 'api/employee/{employeeId}/certificate')
+
+    async def delete_all(
+        self,
+        employee_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить все сертификаты сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_EMPLOYEE ИЛИ Доступ по условию: employeeId должен совпадать с user.id И user.subordinates не должен быть null
+
+        DELETE /api/employee/{employeeId}/certificate
+        """
+        return await self._call(
+            self._op_delete_all,
+            path={'employeeId': employee_id},
+            service_token=service_token,
+        )
+
+    _op_delete_certificate = Operation('DELETE', 'api/employee/{employeeId}/certificate/{certificateId}')
+
+    async def delete_certificate(
+        self,
+        employee_id: UUID,
+        certificate_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить сертификат сотрудника по идентификатору
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_EMPLOYEE ИЛИ Доступ по условию: employeeId должен совпадать с user.id И user.subordinates не должен быть null
+
+        DELETE /api/employee/{employeeId}/certificate/{certificateId}
+        """
+        return await self._call(
+            self._op_delete_certificate,
+            path={'employeeId': employee_id, 'certificateId': certificate_id},
+            service_token=service_token,
+        )
+
+    _op_extract_certificate_from_signature = Operation('POST', 'api/employee/{employeeId}/certificate/extract-from-signature', body=lambda: m.ExtractCertificateRequest)
+
+    async def extract_certificate_from_signature(
+        self,
+        employee_id: UUID,
+        *,
+        body: m.ExtractCertificateRequest,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Извлечь и сохранить сертификат из ЭЦП
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_EMPLOYEE ИЛИ Доступ по условию: employeeId должен совпадать с user.id И user.subordinates не должен быть null
+
+        POST /api/employee/{employeeId}/certificate/extract-from-signature
+        """
+        return await self._call(
+            self._op_extract_certificate_from_signature,
+            path={'employeeId': employee_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/employee/{employeeId}/certificate', response=lambda: m.EmployeeCertInfoDto)
+
+    async def get_all(
+        self,
+        employee_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeCertInfoDto:
+        """
+        Получить список сертификатов сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_EMPLOYEE ИЛИ Доступ по условию: employeeId должен совпадать с user.id И user.subordinates не должен быть null
+
+        GET /api/employee/{employeeId}/certificate
+        """
+        return await self._call(
+            self._op_get_all,
+            path={'employeeId': employee_id},
+            service_token=service_token,
+        )
+
+    _op_import_certificate = Operation('POST', 'api/employee/{employeeId}/certificate', multipart=True)
+
+    async def import_certificate(
+        self,
+        employee_id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить сертификат сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_EMPLOYEE ИЛИ Доступ по условию: employeeId должен совпадать с user.id И user.subordinates не должен быть null
+
+        POST /api/employee/{employeeId}/certificate
+        """
+        return await self._call(
+            self._op_import_certificate,
+            path={'employeeId': employee_id},
+            body=files,
+            service_token=service_token,
+        )
+
+
+class ShablonyDogovorovApi(ApiGroup):
+    """
+    Шаблоны договоров
+    API для работы с шаблонами печатных форм для договоров
+    Константы для получения истории: TEMPLATE_CONTRACT
+    """
+
+    _op_delete_2 = Operation('DELETE', 'api/template-contract', body=lambda: m.IdsUUID)
+
+    async def delete_2(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить шаблоны печатных форм для договоров по uuids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_TEMPLATE_CONTRACT
+
+        DELETE /api/template-contract
+        """
+        return await self._call(
+            self._op_delete_2,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_28 = Operation('DELETE', 'api/template-contract/{id}')
+
+    async def delete_28(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить шаблон печатной формы для договоров по uuid
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_TEMPLATE_CONTRACT
+
+        DELETE /api/template-contract/{id}
+        """
+        return await self._call(
+            self._op_delete_28,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_attachment = Operation('DELETE', 'api/template-contract/attachment/{id}')
+
+    async def delete_attachment(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить файл печатной формы для договоров по uuid
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_TEMPLATE_CONTRACT
+
+        DELETE /api/template-contract/attachment/{id}
+        """
+        return await self._call(
+            self._op_delete_attachment,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_download_file_template_contract = Operation('GET', 'api/template-contract/attachment/{id}/download', binary=True)
+
+    def download_file_template_contract(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл шаблона печатной формы для договоров из MinIO по uuid шаблона
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_TEMPLATE_CONTRACT
+
+        GET /api/template-contract/attachment/{id}/download
+        """
+        return self._stream(
+            self._op_download_file_template_contract,
+            path={'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_get = Operation('GET', 'api/template-contract/{id}', response=lambda: m.TemplateContractDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TemplateContractDto:
+        """
+        Получить шаблон печатной формы для договоров по uuid
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_TEMPLATE_CONTRACT
+
+        GET /api/template-contract/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/template-contract', response=lambda: m.TemplateContractDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.TemplateContractDto:
+        """
+        Получить шаблоны печатных форм для договоров
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_TEMPLATE_CONTRACT
+
+        GET /api/template-contract
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/template-contract', response=lambda: m.TemplateContractDto, body=lambda: m.TemplateContractAddRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.TemplateContractAddRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TemplateContractDto:
+        """
+        Создать шаблон печатной формы для договоров
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_TEMPLATE_CONTRACT
+
+        POST /api/template-contract
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/template-contract', response=lambda: m.TemplateContractDto, body=lambda: m.TemplateContractUpdateRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.TemplateContractUpdateRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TemplateContractDto:
+        """
+        Изменить/Сохранить шаблон печатной формы для договоров
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_TEMPLATE_CONTRACT
+
+        PUT /api/template-contract
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_upload_file_template_contract = Operation('POST', 'api/template-contract/{id}/file', response=lambda: m.AttachmentDto, multipart=True)
+
+    async def upload_file_template_contract(
+        self,
+        id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> m.AttachmentDto:
+        """
+        Загрузить файл шаблона печатной формы для договоров в MinIO по uuid шаблона
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_TEMPLATE_CONTRACT
+
+        POST /api/template-contract/{id}/file
+        """
+        return await self._call(
+            self._op_upload_file_template_contract,
+            path={'id': id},
+            body=files,
+            service_token=service_token,
+        )
+
+
+class ShablonyPechatnykhFormApi(ApiGroup):
+    """
+    Шаблоны печатных форм
+    API для работы с шаблонами печатных форм
+    Константы для получения истории: TEMPLATE
+    """
+
+    _op_delete_file_template = Operation('DELETE', 'api/template/{id}/file')
+
+    async def delete_file_template(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить файл печатной формы по uuid
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_TEMPLATE
+
+        DELETE /api/template/{id}/file
+        """
+        return await self._call(
+            self._op_delete_file_template,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_list_min_iofile = Operation('DELETE', 'api/template', body=lambda: m.IdsUUID)
+
+    async def delete_list_min_iofile(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить шаблоны печатных форм по uuids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_TEMPLATE
+
+        DELETE /api/template
+        """
+        return await self._call(
+            self._op_delete_list_min_iofile,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_min_iofile = Operation('DELETE', 'api/template/{id}')
+
+    async def delete_min_iofile(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить шаблон печатной формы по uuid
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_TEMPLATE
+
+        DELETE /api/template/{id}
+        """
+        return await self._call(
+            self._op_delete_min_iofile,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_download_file_template = Operation('GET', 'api/template/{id}/download', binary=True)
+
+    def download_file_template(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл шаблона печатной формы из MinIO по uuid шаблона
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_TEMPLATE
+
+        GET /api/template/{id}/download
+        """
+        return self._stream(
+            self._op_download_file_template,
+            path={'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_get = Operation('GET', 'api/template/{id}', response=lambda: m.Template)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.Template:
+        """
+        Получить шаблон печатной формы по uuid
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_TEMPLATE
+
+        GET /api/template/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/template', response=lambda: m.Template)
+
+    async def get_collection(
+        self,
+        *,
+        doc_category_constant: str,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.Template:
+        """
+        Получить шаблоны печатных форм
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_TEMPLATE
+
+        GET /api/template
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'docCategoryConstant': doc_category_constant, 'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/template', response=lambda: m.Template)
+
+    async def post(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.Template:
+        """
+        Создать пустой шаблон печатной формы
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_TEMPLATE
+
+        POST /api/template
+        """
+        return await self._call(
+            self._op_post,
+            service_token=service_token,
+        )
+
+    _op_post2 = Operation('POST', 'api/template/post', response=lambda: m.Template, body=lambda: m.TemplateRequest)
+
+    async def post2(
+        self,
+        *,
+        body: m.TemplateRequest,
+        service_token: Optional[str] = None,
+    ) -> m.Template:
+        """
+        Создать пустой шаблон печатной формы
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_TEMPLATE
+
+        POST /api/template/post
+        """
+        return await self._call(
+            self._op_post2,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post_v2 = Operation('POST', 'api/template/v2', response=lambda: m.TemplateDto, body=lambda: m.TemplateAddRequest)
+
+    async def post_v2(
+        self,
+        *,
+        body: m.TemplateAddRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TemplateDto:
+        """
+        Создать пустой шаблон печатной формы
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_TEMPLATE
+
+        POST /api/template/v2
+        """
+        return await self._call(
+            self._op_post_v2,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/template', response=lambda: m.Template, body=lambda: m.TemplateRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.TemplateRequest,
+        service_token: Optional[str] = None,
+    ) -> m.Template:
+        """
+        Изменить/Сохранить шаблон печатной формы
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_TEMPLATE
+
+        PUT /api/template
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put_v2 = Operation('PUT', 'api/template/v2', response=lambda: m.TemplateDto, body=lambda: m.TemplateUpdateRequest)
+
+    async def put_v2(
+        self,
+        *,
+        body: m.TemplateUpdateRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TemplateDto:
+        """
+        Изменить/Сохранить шаблон печатной формы
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_TEMPLATE
+
+        PUT /api/template/v2
+        """
+        return await self._call(
+            self._op_put_v2,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_upload_file_template = Operation('POST', 'api/template/{id}/file', response=lambda: m.Template, multipart=True)
+
+    async def upload_file_template(
+        self,
+        id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> m.Template:
+        """
+        Загрузить файл шаблона печатной формы в MinIO по uuid шаблона
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_TEMPLATE
+
+        POST /api/template/{id}/file
+        """
+        return await self._call(
+            self._op_upload_file_template,
+            path={'id': id},
+            body=files,
+            service_token=service_token,
+        )
+
+
+class ShablonyPechatnykhFormNomenklaturnykhDelApi(ApiGroup):
+    """
+    Шаблоны печатных форм номенклатурных дел
+    API для работы с шаблонами печатных форм для номенклатуры дел
+    Константы для получения истории: NOMENCLATURE_AFFAIR_PRINT_TEMPLATE
+    """
+
+    _op_delete_list_min_iofile = Operation('DELETE', 'api/nomenclature-affair-print-template', body=lambda: m.IdsUUID)
+
+    async def delete_list_min_iofile(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить шаблоны печатных форм для наменклатуры дел по uuids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_NOMENCLATURE_AFFAIR_PRINT_TEMPLATE
+
+        DELETE /api/nomenclature-affair-print-template
+        """
+        return await self._call(
+            self._op_delete_list_min_iofile,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_min_iofile = Operation('DELETE', 'api/nomenclature-affair-print-template/{id}')
+
+    async def delete_min_iofile(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить шаблон печатной формы для наменклатуры дел по uuid
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_NOMENCLATURE_AFFAIR_PRINT_TEMPLATE
+
+        DELETE /api/nomenclature-affair-print-template/{id}
+        """
+        return await self._call(
+            self._op_delete_min_iofile,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_download_file_template_contract = Operation('GET', 'api/nomenclature-affair-print-template/attachment/{id}/download', binary=True)
+
+    def download_file_template_contract(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл шаблона печатной формы для наменклатуры дел из MinIO по uuid шаблона
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_NOMENCLATURE_AFFAIR_PRINT_TEMPLATE
+
+        GET /api/nomenclature-affair-print-template/attachment/{id}/download
+        """
+        return self._stream(
+            self._op_download_file_template_contract,
+            path={'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_get = Operation('GET', 'api/nomenclature-affair-print-template/{id}', response=lambda: m.NomenclatureAffairPrintTemplateDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairPrintTemplateDto:
+        """
+        Получить шаблон печатной формы для наменклатуры дел по uuid
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_NOMENCLATURE_AFFAIR_PRINT_TEMPLATE
+
+        GET /api/nomenclature-affair-print-template/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/nomenclature-affair-print-template', response=lambda: m.NomenclatureAffairPrintTemplateDto)
+
+    async def get_collection(
+        self,
+        *,
+        filter: m.NomenclatureAffairPrintTemplateFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairPrintTemplateDto:
+        """
+        Получить шаблоны печатных форм для наменклатуры дел
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_NOMENCLATURE_AFFAIR_PRINT_TEMPLATE
+
+        GET /api/nomenclature-affair-print-template
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/nomenclature-affair-print-template', response=lambda: m.NomenclatureAffairPrintTemplateDto, body=lambda: m.NomenclatureAffairPrintTemplateAddRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.NomenclatureAffairPrintTemplateAddRequest,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairPrintTemplateDto:
+        """
+        Создать шаблон печатной формы для наменклатуры дел
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_NOMENCLATURE_AFFAIR_PRINT_TEMPLATE
+
+        POST /api/nomenclature-affair-print-template
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/nomenclature-affair-print-template', response=lambda: m.NomenclatureAffairPrintTemplateDto, body=lambda: m.NomenclatureAffairPrintTemplateUpdateRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.NomenclatureAffairPrintTemplateUpdateRequest,
+        service_token: Optional[str] = None,
+    ) -> m.NomenclatureAffairPrintTemplateDto:
+        """
+        Изменить/Сохранить шаблон печатной формы для наменклатуры дел
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_NOMENCLATURE_AFFAIR_PRINT_TEMPLATE
+
+        PUT /api/nomenclature-affair-print-template
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_upload_file_template_contract = Operation('POST', 'api/nomenclature-affair-print-template/{id}/file', response=lambda: m.AttachmentDto, multipart=True)
+
+    async def upload_file_template_contract(
+        self,
+        id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> m.AttachmentDto:
+        """
+        Загрузить файл шаблона печатной формы для наменклатуры дел в MinIO по uuid шаблона
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_NOMENCLATURE_AFFAIR_PRINT_TEMPLATE
+
+        POST /api/nomenclature-affair-print-template/{id}/file
+        """
+        return await self._call(
+            self._op_upload_file_template_contract,
+            path={'id': id},
+            body=files,
+            service_token=service_token,
+        )
+
+
+class SmdoDocTypeControllerApi(ApiGroup):
+    """
+    smdo-doc-type-controller
+    Константы для получения истории: OAIS_DOC_TYPE_NSI
+    """
+
+    _op_delete_all = Operation('DELETE', 'api/oais-smdo-doc-type', response=str)
+
+    async def delete_all(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+
+        DELETE /api/oais-smdo-doc-type
+        """
+        return await self._call(
+            self._op_delete_all,
+            service_token=service_token,
+        )
+
+    _op_find_all = Operation('GET', 'api/oais-smdo-doc-type', response=lambda: m.SliceDtoDocTypeDto)
+
+    async def find_all(
+        self,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoDocTypeDto:
+        """
+
+        GET /api/oais-smdo-doc-type
+        """
+        return await self._call(
+            self._op_find_all,
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_find_by_id = Operation('GET', 'api/oais-smdo-doc-type/{id}', response=lambda: m.DocTypeDto)
+
+    async def find_by_id(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocTypeDto:
+        """
+
+        GET /api/oais-smdo-doc-type/{id}
+        """
+        return await self._call(
+            self._op_find_by_id,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+
+class SmdoFileTypeControllerApi(ApiGroup):
+    """
+    smdo-file-type-controller
+    Константы для получения истории: OAIS_FILE_TYPE_NSI
+    """
+
+    _op_delete_all = Operation('DELETE', 'api/oais-smdo-file-type', response=str)
+
+    async def delete_all(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+
+        DELETE /api/oais-smdo-file-type
+        """
+        return await self._call(
+            self._op_delete_all,
+            service_token=service_token,
+        )
+
+    _op_find_all = Operation('GET', 'api/oais-smdo-file-type', response=lambda: m.SliceDtoFileTypeDto)
+
+    async def find_all(
+        self,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoFileTypeDto:
+        """
+
+        GET /api/oais-smdo-file-type
+        """
+        return await self._call(
+            self._op_find_all,
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_find_by_id = Operation('GET', 'api/oais-smdo-file-type/{id}', response=lambda: m.FileTypeDto)
+
+    async def find_by_id(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.FileTypeDto:
+        """
+
+        GET /api/oais-smdo-file-type/{id}
+        """
+        return await self._call(
+            self._op_find_by_id,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+
+class SmdoSedTypeControllerApi(ApiGroup):
+    """
+    smdo-sed-type-controller
+    Константы для получения истории: OAIS_SED_TYPE_NSI
+    """
+
+    _op_delete_all = Operation('DELETE', 'api/oais-smdo-sed-type', response=str)
+
+    async def delete_all(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+
+        DELETE /api/oais-smdo-sed-type
+        """
+        return await self._call(
+            self._op_delete_all,
+            service_token=service_token,
+        )
+
+    _op_find_all = Operation('GET', 'api/oais-smdo-sed-type', response=lambda: m.SliceDtoSedTypeDto)
+
+    async def find_all(
+        self,
+        *,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoSedTypeDto:
+        """
+
+        GET /api/oais-smdo-sed-type
+        """
+        return await self._call(
+            self._op_find_all,
+            query={'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_find_by_id = Operation('GET', 'api/oais-smdo-sed-type/{id}', response=lambda: m.SedTypeDto)
+
+    async def find_by_id(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.SedTypeDto:
+        """
+
+        GET /api/oais-smdo-sed-type/{id}
+        """
+        return await self._call(
+            self._op_find_by_id,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+
+class SmdoSubscriberControllerApi(ApiGroup):
+    """
+    smdo-subscriber-controller
+    Константы для получения истории: OAIS_SUBSCRIBER_NSI
+    """
+
+    _op_delete_all = Operation('DELETE', 'api/oais-smdo-subscriber', response=str)
+
+    async def delete_all(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+
+        DELETE /api/oais-smdo-subscriber
+        """
+        return await self._call(
+            self._op_delete_all,
+            service_token=service_token,
+        )
+
+    _op_find_all = Operation('GET', 'api/oais-smdo-subscriber', response=lambda: m.SliceDtoSubscriberDto)
+
+    async def find_all(
+        self,
+        *,
+        filter: m.SubscriberFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoSubscriberDto:
+        """
+
+        GET /api/oais-smdo-subscriber
+        """
+        return await self._call(
+            self._op_find_all,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_find_by_id = Operation('GET', 'api/oais-smdo-subscriber/{id}', response=lambda: m.SubscriberDto)
+
+    async def find_by_id(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.SubscriberDto:
+        """
+
+        GET /api/oais-smdo-subscriber/{id}
+        """
+        return await self._call(
+            self._op_find_by_id,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+
+class SokhranennyeFiltryDokumentaDliaRasshirennogoPoiskaApi(ApiGroup):
+    """
+    Сохраненные фильтры документа (для расширенного поиска)
+    API для работы с сохраненными фильтрами документа
+    """
+
+    _op_delete = Operation('DELETE', 'api/filter', body=lambda: m.IdUUID)
+
+    async def delete(
+        self,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить фильтр документа
+
+        DELETE /api/filter
+        """
+        return await self._call(
+            self._op_delete,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_list = Operation('DELETE', 'api/filter/list', body=lambda: m.IdsUUID)
+
+    async def delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список фильтров документа
+
+        DELETE /api/filter/list
+        """
+        return await self._call(
+            self._op_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_61 = Operation('GET', 'api/filter/name/{name}', response=lambda: m.FilterDto)
+
+    async def get_61(
+        self,
+        name: str,
+        *,
+        list_attribute: bool,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.FilterDto:
+        """
+        Получить сохраненные фильтры документа текущего пользователя по наименованию
+
+        GET /api/filter/name/{name}
+        """
+        return await self._call(
+            self._op_get_61,
+            path={'name': name},
+            query={'listAttribute': list_attribute, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_62 = Operation('GET', 'api/filter/id/{id}', response=lambda: m.FilterDto)
+
+    async def get_62(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.FilterDto:
+        """
+        Получить сохраненный фильтр документа текущего пользователя по id
+
+        GET /api/filter/id/{id}
+        """
+        return await self._call(
+            self._op_get_62,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection_17 = Operation('GET', 'api/filter', response=lambda: m.FilterDto)
+
+    async def get_collection_17(
+        self,
+        *,
+        list_attribute: bool,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.FilterDto:
+        """
+        Получить все сохраненные фильтры документа
+
+        GET /api/filter
+        """
+        return await self._call(
+            self._op_get_collection_17,
+            query={'listAttribute': list_attribute, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_collection_49 = Operation('GET', 'api/filter/employee', response=lambda: m.FilterDto)
+
+    async def get_collection_49(
+        self,
+        *,
+        list_attribute: bool,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.FilterDto:
+        """
+        Получить все сохраненные фильтры документа текущего пользователя
+
+        GET /api/filter/employee
+        """
+        return await self._call(
+            self._op_get_collection_49,
+            query={'listAttribute': list_attribute, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/filter', response=lambda: m.FilterDto, body=lambda: m.FilterFieldFilter)
+
+    async def post(
+        self,
+        *,
+        body: m.FilterFieldFilter,
+        service_token: Optional[str] = None,
+    ) -> m.FilterDto:
+        """
+        Сохранить фильтр документа
+
+        POST /api/filter
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/filter', response=lambda: m.FilterDto, body=lambda: m.FilterFieldFilter)
+
+    async def put(
+        self,
+        *,
+        body: m.FilterFieldFilter,
+        service_token: Optional[str] = None,
+    ) -> m.FilterDto:
+        """
+        Изменить фильтр документа
+
+        PUT /api/filter
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class SotrudnikiApi(ApiGroup):
+    """
+    Сотрудники
+    API для работы с сотрудниками
+    Константы для получения истории: ROLE, GROUP, EMPLOYEE
+    """
+
+    _op_add_grief = Operation('POST', 'api/employee/{id}/griefs', response=str, body=lambda: m.IdsUUID)
+
+    async def add_grief(
+        self,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Добавить гриф
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_EMPLOYEE_ACCESS_GRIEF
+
+        POST /api/employee/{id}/griefs
+        """
+        return await self._call(
+            self._op_add_grief,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_add_group = Operation('POST', 'api/employee/{id}/group', response=lambda: m.GroupDto, body=lambda: m.IdsUUID)
+
+    async def add_group(
+        self,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.GroupDto:
+        """
+        Добавить группу
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_GROUP
+
+        POST /api/employee/{id}/group
+        """
+        return await self._call(
+            self._op_add_group,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_add_role = Operation('POST', 'api/employee/{id}/role', response=lambda: m.RoleDto, body=lambda: m.IdsUUID)
+
+    async def add_role(
+        self,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.RoleDto:
+        """
+        Добавить роль
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_ROLE
+
+        POST /api/employee/{id}/role
+        """
+        return await self._call(
+            self._op_add_role,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_facsimile = Operation('DELETE', 'api/employee/{id}/facsimile')
+
+    async def delete_facsimile(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+
+        DELETE /api/employee/{id}/facsimile
+        """
+        return await self._call(
+            self._op_delete_facsimile,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_grief = Operation('DELETE', 'api/employee/{id}/griefs', response=str, body=lambda: m.IdUUID)
+
+    async def delete_grief(
+        self,
+        id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Удалить гриф
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_EMPLOYEE_ACCESS_GRIEF
+
+        DELETE /api/employee/{id}/griefs
+        """
+        return await self._call(
+            self._op_delete_grief,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_user_avatars = Operation('DELETE', 'api/employee/{id}/avatar', response=str)
+
+    async def delete_user_avatars(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_EMPLOYEE ИЛИ Доступ по условию: employeeId должен совпадать с user.id
+
+        DELETE /api/employee/{id}/avatar
+        """
+        return await self._call(
+            self._op_delete_user_avatars,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_user_small_avatars = Operation('DELETE', 'api/employee/{id}/avatar_small', response=str)
+
+    async def delete_user_small_avatars(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_EMPLOYEE ИЛИ Доступ по условию: employeeId должен совпадать с user.id
+
+        DELETE /api/employee/{id}/avatar_small
+        """
+        return await self._call(
+            self._op_delete_user_small_avatars,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_disable = Operation('POST', 'api/employee/disable', body=lambda: m.EmployeeDelegate)
+
+    async def disable(
+        self,
+        *,
+        body: m.EmployeeDelegate,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Деактивировать сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_EMPLOYEE
+
+        POST /api/employee/disable
+        """
+        return await self._call(
+            self._op_disable,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_dismiss = Operation('POST', 'api/employee/dismiss', body=lambda: m.EmployeeDelegate)
+
+    async def dismiss(
+        self,
+        *,
+        body: m.EmployeeDelegate,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Уволить сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_EMPLOYEE
+
+        POST /api/employee/dismiss
+        """
+        return await self._call(
+            self._op_dismiss,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_edit_io_dismissal = Operation('PUT', 'api/employee/io-dismissal', body=lambda: m.EmployeeDelegate)
+
+    async def edit_io_dismissal(
+        self,
+        *,
+        body: m.EmployeeDelegate,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Изменить ио назначеного при увольнении
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_EMPLOYEE
+
+        PUT /api/employee/io-dismissal
+        """
+        return await self._call(
+            self._op_edit_io_dismissal,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_enable = Operation('POST', 'api/employee/enable', body=lambda: m.IdUUID)
+
+    async def enable(
+        self,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Активировать сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_EMPLOYEE
+
+        POST /api/employee/enable
+        """
+        return await self._call(
+            self._op_enable,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_fts_last_name = Operation('GET', 'api/employee/fts-lastname', response=lambda: m.EmployeeDto)
+
+    async def fts_last_name(
+        self,
+        *,
+        fts: str,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeDto:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_EMPLOYEE
+
+        GET /api/employee/fts-lastname
+        """
+        return await self._call(
+            self._op_fts_last_name,
+            query={'fts': fts},
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/employee/{id}', response=lambda: m.EmployeeDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeDto:
+        """
+        Получить сотрудника по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_EMPLOYEE ИЛИ Доступ по условию: id должен совпадать с user.id И user.subordinates не должен быть null
+
+        GET /api/employee/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_activities = Operation('GET', 'api/employee/{id}/user-action', response=lambda: m.EmployeeDto)
+
+    async def get_activities(
+        self,
+        id: UUID,
+        *,
+        start: datetime,
+        end: datetime,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeDto:
+        """
+        Получить сотрудника по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ALL_USER_ACTION ИЛИ Доступ по условию: id должен совпадать с user.id И user.subordinates не должен быть null
+
+        GET /api/employee/{id}/user-action
+        """
+        return await self._call(
+            self._op_get_activities,
+            path={'id': id},
+            query={'start': start, 'end': end},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/employee', response=lambda: m.EmployeeDto)
+
+    async def get_collection(
+        self,
+        *,
+        filter: m.EmployeeFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeDto:
+        """
+        Получить список сотрудников
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_EMPLOYEE ИЛИ Доступ по условию: filter.departmentId[0] должен совпадать с user.departmentId)) И filter.departmentId не должен быть null
+        Разрешенные поля для сортировки: firstName, lastName, order, middleName, post.postName
+
+        GET /api/employee
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_collection_post = Operation('POST', 'api/employee/search', response=lambda: m.EmployeeDto, body=lambda: m.EmployeeFilter)
+
+    async def get_collection_post(
+        self,
+        *,
+        body: m.EmployeeFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeDto:
+        """
+        Получить список сотрудников. Аналог операции поиска через метод GET, но для тех случаев когда параметров слишком много
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_EMPLOYEE ИЛИ Доступ по условию: filter.departmentId[0] должен совпадать с user.departmentId)) И filter.departmentId не должен быть null
+        Разрешенные поля для сортировки: firstName, lastName, order, middleName, post.postName
+
+        POST /api/employee/search
+        """
+        return await self._call(
+            self._op_get_collection_post,
+            query={'pageable': pageable},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_griefs = Operation('GET', 'api/employee/{id}/griefs', response=lambda: list[m.EmployeeAccessGriefDto])
+
+    async def get_griefs(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.EmployeeAccessGriefDto]:
+        """
+        Получить грифы сотрудника по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_EMPLOYEE ИЛИ Доступ по условию: id должен совпадать с user.id И user.subordinates не должен быть null
+
+        GET /api/employee/{id}/griefs
+        """
+        return await self._call(
+            self._op_get_griefs,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_profile_user_avatar = Operation('GET', 'api/employee/{id}/profile_avatar')
+
+    async def get_profile_user_avatar(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+
+        GET /api/employee/{id}/profile_avatar
+        """
+        return await self._call(
+            self._op_get_profile_user_avatar,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_profile_user_small_avatar = Operation('GET', 'api/employee/{id}/profile_avatar_small')
+
+    async def get_profile_user_small_avatar(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+
+        GET /api/employee/{id}/profile_avatar_small
+        """
+        return await self._call(
+            self._op_get_profile_user_small_avatar,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_user_avatar = Operation('GET', 'api/employee/{id}/avatar')
+
+    async def get_user_avatar(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+
+        GET /api/employee/{id}/avatar
+        """
+        return await self._call(
+            self._op_get_user_avatar,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_user_facsimile = Operation('GET', 'api/employee/{id}/facsimile')
+
+    async def get_user_facsimile(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+
+        GET /api/employee/{id}/facsimile
+        """
+        return await self._call(
+            self._op_get_user_facsimile,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_user_groups = Operation('GET', 'api/employee/{id}/group', response=lambda: m.GroupDto)
+
+    async def get_user_groups(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.GroupDto:
+        """
+        Получить группы сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_EMPLOYEE ИЛИ Доступ по условию: id должен совпадать с user.id И user.subordinates не должен быть null
+
+        GET /api/employee/{id}/group
+        """
+        return await self._call(
+            self._op_get_user_groups,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_user_role = Operation('GET', 'api/employee/{id}/role', response=lambda: m.RoleDto)
+
+    async def get_user_role(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.RoleDto:
+        """
+        Получить роли сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_EMPLOYEE ИЛИ Доступ по условию: id должен совпадать с user.id И user.subordinates не должен быть null
+
+        GET /api/employee/{id}/role
+        """
+        return await self._call(
+            self._op_get_user_role,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_user_small_avatar = Operation('GET', 'api/employee/{id}/avatar_small')
+
+    async def get_user_small_avatar(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+
+        GET /api/employee/{id}/avatar_small
+        """
+        return await self._call(
+            self._op_get_user_small_avatar,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/employee', response=lambda: m.EmployeeDto, body=lambda: m.EmployeeApi)
+
+    async def post(
+        self,
+        *,
+        body: m.EmployeeApi,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeDto:
+        """
+        Создать нового сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_EMPLOYEE
+
+        POST /api/employee
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post_v2 = Operation('POST', 'api/employee/v2', response=lambda: m.EmployeeDto, body=lambda: m.EmployeeAddRequest)
+
+    async def post_v2(
+        self,
+        *,
+        body: m.EmployeeAddRequest,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeDto:
+        """
+        Создать нового сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_EMPLOYEE
+
+        POST /api/employee/v2
+        """
+        return await self._call(
+            self._op_post_v2,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/employee', response=lambda: m.EmployeeDto, body=lambda: m.EmployeeApi)
+
+    async def put(
+        self,
+        *,
+        body: m.EmployeeApi,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeDto:
+        """
+        Отредактировать данные сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_EMPLOYEE
+
+        PUT /api/employee
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put_v2 = Operation('PUT', 'api/employee/v2', response=lambda: m.EmployeeDto, body=lambda: m.EmployeeUpdateRequest)
+
+    async def put_v2(
+        self,
+        *,
+        body: m.EmployeeUpdateRequest,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeDto:
+        """
+        Отредактировать данные сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_EMPLOYEE
+
+        PUT /api/employee/v2
+        """
+        return await self._call(
+            self._op_put_v2,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_recover = Operation('POST', 'api/employee/recover', body=lambda: m.IdUUID)
+
+    async def recover(
+        self,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Восстановить сотрудника
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_EMPLOYEE
+
+        POST /api/employee/recover
+        """
+        return await self._call(
+            self._op_recover,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_remove_group = Operation('DELETE', 'api/employee/{id}/group', response=lambda: m.GroupDto, body=lambda: m.IdsUUID)
+
+    async def remove_group(
+        self,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.GroupDto:
+        """
+        Удалить группу
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_GROUP
+
+        DELETE /api/employee/{id}/group
+        """
+        return await self._call(
+            self._op_remove_group,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_remove_role = Operation('DELETE', 'api/employee/{id}/role', response=lambda: m.RoleDto, body=lambda: m.IdsUUID)
+
+    async def remove_role(
+        self,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.RoleDto:
+        """
+        Удалить роль
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_ROLE
+
+        DELETE /api/employee/{id}/role
+        """
+        return await self._call(
+            self._op_remove_role,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_upload_avatar = Operation('POST', 'api/employee/{id}/avatar', response=str)
+
+    async def upload_avatar(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_EMPLOYEE ИЛИ Доступ по условию: employeeId должен совпадать с user.id
+
+        POST /api/employee/{id}/avatar
+        """
+        return await self._call(
+            self._op_upload_avatar,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_upload_facsimile = Operation('POST', 'api/employee/{id}/facsimile', response=str)
+
+    async def upload_facsimile(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_EMPLOYEE ИЛИ Доступ по условию: employeeId должен совпадать с user.id
+
+        POST /api/employee/{id}/facsimile
+        """
+        return await self._call(
+            self._op_upload_facsimile,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_upload_small_avatar = Operation('POST', 'api/employee/{id}/avatar_small', response=str)
+
+    async def upload_small_avatar(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_EMPLOYEE ИЛИ Доступ по условию: employeeId должен совпадать с user.id
+
+        POST /api/employee/{id}/avatar_small
+        """
+        return await self._call(
+            self._op_upload_small_avatar,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_whoame = Operation('GET', 'api/employee/me', response=lambda: m.CurrentUser)
+
+    async def whoame(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.CurrentUser:
+        """
+        Получить информацию о текущем сотруднике
+
+        GET /api/employee/me
+        """
+        return await self._call(
+            self._op_whoame,
+            service_token=service_token,
+        )
+
+
+class SotrudnikiIoApi(ApiGroup):
+    """
+    Сотрудники ИО
+    API для работы с сотрудниками ИО
+    """
+
+    _op_delete = Operation('DELETE', 'api/employee/io', response=lambda: m.EmployeeIoDto, body=lambda: m.EmployeeIoRequest)
+
+    async def delete(
+        self,
+        *,
+        body: m.EmployeeIoRequest,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeIoDto:
+        """
+        Удалить сотрудника ИО
+
+        DELETE /api/employee/io
+        """
+        return await self._call(
+            self._op_delete,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_secretary = Operation('DELETE', 'api/employee/io/secretary', response=lambda: m.EmployeeIoDto, body=lambda: m.SecretaryRequest)
+
+    async def delete_secretary(
+        self,
+        *,
+        body: m.SecretaryRequest,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeIoDto:
+        """
+        Удалить список секретарей
+
+        DELETE /api/employee/io/secretary
+        """
+        return await self._call(
+            self._op_delete_secretary,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/employee/io/{id}', response=lambda: m.EmployeeIoDto)
+
+    async def get_collection(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeIoDto:
+        """
+        Получить список сотрудников ИО
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_EMPLOYEE ИЛИ Доступ по условию: id должен совпадать с user.id
+
+        GET /api/employee/io/{id}
+        """
+        return await self._call(
+            self._op_get_collection,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_target = Operation('GET', 'api/employee/io/{id}/target', response=lambda: m.EmployeeIoDto)
+
+    async def get_target(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeIoDto:
+        """
+        Получить список сотрудников у которых текущий пользователь ИО
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_EMPLOYEE ИЛИ Доступ по условию: id должен совпадать с user.id
+
+        GET /api/employee/io/{id}/target
+        """
+        return await self._call(
+            self._op_get_target,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/employee/io', response=lambda: m.EmployeeIoDto, body=lambda: m.EmployeeIoDto)
+
+    async def post(
+        self,
+        *,
+        body: m.EmployeeIoDto,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeIoDto:
+        """
+        Добавить сотрудника ИО
+
+        POST /api/employee/io
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_secretary_post = Operation('POST', 'api/employee/io/secretary', response=lambda: m.EmployeeIoDto, body=lambda: m.SecretaryRequest)
+
+    async def secretary_post(
+        self,
+        *,
+        body: m.SecretaryRequest,
+        service_token: Optional[str] = None,
+    ) -> m.EmployeeIoDto:
+        """
+        Добавить список секрктарей
+
+        POST /api/employee/io/secretary
+        """
+        return await self._call(
+            self._op_secretary_post,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class SposobyDostavkiApi(ApiGroup):
+    """
+    Способы доставки
+    API для работы со способами доставки
+    Константы для получения истории: DELIVERY_METHOD
+    """
+
+    _op_delete_list = Operation('DELETE', 'api/delivery-method', body=lambda: m.IdsLong)
+
+    async def delete_list(
+        self,
+        *,
+        body: m.IdsLong,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Пометить способы доставки как удаленные
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_DELIVERY_METHOD
+
+        DELETE /api/delivery-method
+        """
+        return await self._call(
+            self._op_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/delivery-method/{id}', response=lambda: m.DeliveryMethodDto)
+
+    async def get(
+        self,
+        id: int,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DeliveryMethodDto:
+        """
+        Получить способ доставки по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DELIVERY_METHOD
+
+        GET /api/delivery-method/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_aismv_delivery = Operation('GET', 'api/delivery-method/aismv', response=lambda: m.DeliveryMethodDto)
+
+    async def get_aismv_delivery(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DeliveryMethodDto:
+        """
+        Получить способ доставки для АИСМВ
+
+        GET /api/delivery-method/aismv
+        """
+        return await self._call(
+            self._op_get_aismv_delivery,
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/delivery-method', response=lambda: m.DeliveryMethodDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.DeliveryMethodFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.DeliveryMethodDto:
+        """
+        Получить список всех способов доставки
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DELIVERY_METHOD
+
+        GET /api/delivery-method
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_kancler_next_delivery = Operation('GET', 'api/delivery-method/kancler-next', response=lambda: m.DeliveryMethodDto)
+
+    async def get_kancler_next_delivery(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DeliveryMethodDto:
+        """
+        Получить способ доставки Канцлер НЕКСТ
+
+        GET /api/delivery-method/kancler-next
+        """
+        return await self._call(
+            self._op_get_kancler_next_delivery,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/delivery-method', response=lambda: m.DeliveryMethodDto, body=lambda: m.DeliveryMethodRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.DeliveryMethodRequest,
+        service_token: Optional[str] = None,
+    ) -> m.DeliveryMethodDto:
+        """
+        Создать новый способ доставки
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_DELIVERY_METHOD
+
+        POST /api/delivery-method
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/delivery-method', response=lambda: m.DeliveryMethodDto, body=lambda: m.DeliveryMethodRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.DeliveryMethodRequest,
+        service_token: Optional[str] = None,
+    ) -> m.DeliveryMethodDto:
+        """
+        Изменить способ доставки
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_DELIVERY_METHOD
+
+        PUT /api/delivery-method
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_search_fts_top_by_name = Operation('GET', 'api/delivery-method/fts-name', response=lambda: m.DeliveryMethodDto)
+
+    async def search_fts_top_by_name(
+        self,
+        *,
+        fts: str,
+        service_token: Optional[str] = None,
+    ) -> m.DeliveryMethodDto:
+        """
+        Полнотекстовый поиск способа доставки по названию
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DELIVERY_METHOD
+
+        GET /api/delivery-method/fts-name
+        """
+        return await self._call(
+            self._op_search_fts_top_by_name,
+            query={'fts': fts},
+            service_token=service_token,
+        )
+
+
+class SpravochnikMarshrutovApi(ApiGroup):
+    """
+    Справочник маршрутов
+    API для работы со справочником маршрутов
+    Константы для получения истории: ROUTER_DIRECTORY
+    """
+
+    _op_create = Operation('POST', 'api/route', response=lambda: m.RouterDirectoryDto, body=lambda: m.RouterDirectoryDto)
+
+    async def create(
+        self,
+        *,
+        body: m.RouterDirectoryDto,
+        service_token: Optional[str] = None,
+    ) -> m.RouterDirectoryDto:
+        """
+        Создать новый маршрут
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_ROUTER_DIRECTORY
+
+        POST /api/route
+        """
+        return await self._call(
+            self._op_create,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_batch = Operation('DELETE', 'api/route', body=lambda: m.IdsUUID)
+
+    async def delete_batch(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список маршрутов по ids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_ROUTER_DIRECTORY
+
+        DELETE /api/route
+        """
+        return await self._call(
+            self._op_delete_batch,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_by_id = Operation('DELETE', 'api/route/{id}')
+
+    async def delete_by_id(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить маршрут по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_ROUTER_DIRECTORY
+
+        DELETE /api/route/{id}
+        """
+        return await self._call(
+            self._op_delete_by_id,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_find_all = Operation('GET', 'api/route', response=lambda: m.RouterDirectoryDto)
+
+    async def find_all(
+        self,
+        *,
+        f: m.RouterDirectoryFilter,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.RouterDirectoryDto:
+        """
+        Получить список всех маршрутов
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ROUTER_DIRECTORY
+        Разрешенные поля для сортировки: name
+
+        GET /api/route
+        """
+        return await self._call(
+            self._op_find_all,
+            query={'f': f, 'p': p},
+            service_token=service_token,
+        )
+
+    _op_find_by_id = Operation('GET', 'api/route/{id}', response=lambda: m.RouterDirectoryDto)
+
+    async def find_by_id(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.RouterDirectoryDto:
+        """
+        Получить маршрут по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ROUTER_DIRECTORY
+
+        GET /api/route/{id}
+        """
+        return await self._call(
+            self._op_find_by_id,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_process_items_definitions = Operation('GET', 'api/route/process-item-definitions', response=lambda: m.ProcessItemDefinition)
+
+    async def get_process_items_definitions(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ProcessItemDefinition:
+        """
+        Получить описание этапов документов
+
+        GET /api/route/process-item-definitions
+        """
+        return await self._call(
+            self._op_get_process_items_definitions,
+            service_token=service_token,
+        )
+
+    _op_get_process_items_definitions_v2 = Operation('GET', 'api/route/v2/process-item-definitions', response=lambda: m.ProcessItemDefinition)
+
+    async def get_process_items_definitions_v2(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ProcessItemDefinition:
+        """
+        Получить описание этапов документов
+
+        GET /api/route/v2/process-item-definitions
+        """
+        return await self._call(
+            self._op_get_process_items_definitions_v2,
+            service_token=service_token,
+        )
+
+    _op_update = Operation('PUT', 'api/route', response=lambda: m.RouterDirectoryDto, body=lambda: m.RouterDirectoryDto)
+
+    async def update(
+        self,
+        *,
+        body: m.RouterDirectoryDto,
+        service_token: Optional[str] = None,
+    ) -> m.RouterDirectoryDto:
+        """
+        Отредактировать маршрут
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_ROUTER_DIRECTORY
+
+        PUT /api/route
+        """
+        return await self._call(
+            self._op_update,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class SrokKhraneniiaApi(ApiGroup):
+    """
+    Срок хранения
+    API для работы с сроками хранения
+    Константы для получения истории: STORAGE_PERIOD
+    """
+
+    _op_get = Operation('GET', 'api/storage-period/{id}', response=lambda: m.StoragePeriod)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.StoragePeriod:
+        """
+        Получить срок хранения по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_STORAGE_PERIOD
+
+        GET /api/storage-period/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/storage-period', response=lambda: m.StoragePeriod)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.StoragePeriod:
+        """
+        Получить список сроков хранения
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_STORAGE_PERIOD
+
+        GET /api/storage-period
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_mark_delete = Operation('DELETE', 'api/storage-period/{id}')
+
+    async def mark_delete(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить срок хранения
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_STORAGE_PERIOD
+
+        DELETE /api/storage-period/{id}
+        """
+        return await self._call(
+            self._op_mark_delete,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_mark_delete_list = Operation('DELETE', 'api/storage-period', body=lambda: m.IdsUUID)
+
+    async def mark_delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список сроков хранения
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_STORAGE_PERIOD
+
+        DELETE /api/storage-period
+        """
+        return await self._call(
+            self._op_mark_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/storage-period', response=lambda: m.StoragePeriod, body=lambda: m.StoragePeriodRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.StoragePeriodRequest,
+        service_token: Optional[str] = None,
+    ) -> m.StoragePeriod:
+        """
+        Создать новый срок хранения
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_STORAGE_PERIOD
+
+        POST /api/storage-period
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/storage-period', response=lambda: m.StoragePeriod, body=lambda: m.StoragePeriodRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.StoragePeriodRequest,
+        service_token: Optional[str] = None,
+    ) -> m.StoragePeriod:
+        """
+        Изменить срок хранения
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_STORAGE_PERIOD
+
+        PUT /api/storage-period
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class SsylkiNaDokumentApi(ApiGroup):
+    """
+    Ссылки на документ
+    API для работы с ссылками на документ
+    """
+
+    _op_get_collection = Operation('GET', 'api/document-link/{documentId}', response=lambda: m.DocumentLinkDto)
+
+    async def get_collection(
+        self,
+        document_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentLinkDto:
+        """
+        Получить список ссылок на документ
+
+        Для доступа к этому API необходимо: [DOCUMENT_READ]
+
+        GET /api/document-link/{documentId}
+        """
+        return await self._call(
+            self._op_get_collection,
+            path={'documentId': document_id},
+            service_token=service_token,
+        )
+
+
+class StatistikaDliaPolzovateliaApi(ApiGroup):
+    """
+    Статистика для пользователя
+    """
+
+    _op_get_statistics = Operation('GET', 'api/stat', response=dict[str, dict[str, Any]])
+
+    async def get_statistics(
+        self,
+        *,
+        providers: list[str],
+        service_token: Optional[str] = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Получить статистику по доступную пользователю
+
+        Доступные провайдеры статистики: documentAndTaskCategoryCounter, documentIntroductionCounter, documentCounter, taskOnExecutionCounter, documentInWorkCounter, taskCounter, documentControlCounter, taskOnControlCounter, userNotification, acceptanceInventoryDataInWorkUser, summaryNomenclatureDepartmentInWorkUser, destructionActInWorkUser, documentsInWorkUser, nomenclatureDepartmentInWorkUser
+
+        GET /api/stat
+        """
+        return await self._call(
+            self._op_get_statistics,
+            query={'providers': providers},
+            service_token=service_token,
+        )
+
+    _op_get_statistics_1 = Operation('POST', 'api/stat', response=dict[str, dict[str, Any]], body=lambda: list[m.ProviderParams])
+
+    async def get_statistics_1(
+        self,
+        *,
+        body: list[m.ProviderParams],
+        service_token: Optional[str] = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Получить статистику по доступную пользователю
+
+        Доступные провайдеры статистики: documentAndTaskCategoryCounter, documentIntroductionCounter, documentCounter, taskOnExecutionCounter, documentInWorkCounter, taskCounter, documentControlCounter, taskOnControlCounter, userNotification, acceptanceInventoryDataInWorkUser, summaryNomenclatureDepartmentInWorkUser, destructionActInWorkUser, documentsInWorkUser, nomenclatureDepartmentInWorkUser
+
+        POST /api/stat
+        """
+        return await self._call(
+            self._op_get_statistics_1,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class StranyApi(ApiGroup):
+    """
+    Страны
+    API для работы со странами
+    Константы для получения истории: COUNTRY
+    """
+
+    _op_delete = Operation('DELETE', 'api/country', body=lambda: m.IdsUUID)
+
+    async def delete(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку об удалении для списка стран по ids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_COUNTRY
+
+        DELETE /api/country
+        """
+        return await self._call(
+            self._op_delete,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_fts_name = Operation('GET', 'api/country/fts-name', response=lambda: m.CountryDto)
+
+    async def fts_name(
+        self,
+        *,
+        fts: str,
+        service_token: Optional[str] = None,
+    ) -> m.CountryDto:
+        """
+        Полнотекстовый поиск страны по названию
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_COUNTRY
+
+        GET /api/country/fts-name
+        """
+        return await self._call(
+            self._op_fts_name,
+            query={'fts': fts},
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/country/{id}', response=lambda: m.CountryDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.CountryDto:
+        """
+        Получить страну по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_COUNTRY
+
+        GET /api/country/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/country', response=lambda: m.CountryDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.CountryDto:
+        """
+        Получить список стран
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_COUNTRY
+
+        GET /api/country
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/country', response=lambda: m.CountryDto, body=lambda: m.CountryDto)
+
+    async def post(
+        self,
+        *,
+        body: m.CountryDto,
+        service_token: Optional[str] = None,
+    ) -> m.CountryDto:
+        """
+        Создать новую страну
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_COUNTRY
+
+        POST /api/country
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/country', response=lambda: m.CountryDto, body=lambda: m.CountryDto)
+
+    async def put(
+        self,
+        *,
+        body: m.CountryDto,
+        service_token: Optional[str] = None,
+    ) -> m.CountryDto:
+        """
+        Изменить страну
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_COUNTRY
+
+        PUT /api/country
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class SvodnaiaOpisDelApi(ApiGroup):
+    """
+    Сводная опись дел
+    API для работы со сводными описями дел
+    Константы для получения истории: SUMMARY_INVENTORY_REPORT
+    """
+
+    _op_create = Operation('POST', 'api/summary-inventory-report', response=lambda: m.SummaryInventoryReportDto, body=lambda: m.SummaryInventoryReportRequest)
+
+    async def create(
+        self,
+        *,
+        body: m.SummaryInventoryReportRequest,
+        service_token: Optional[str] = None,
+    ) -> m.SummaryInventoryReportDto:
+        """
+        Создать сводную опись дел
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_SUMMARY_INVENTORY_REPORT
+
+        POST /api/summary-inventory-report
+        """
+        return await self._call(
+            self._op_create,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_download = Operation('GET', 'api/summary-inventory-report/{id}/attachment/download', binary=True)
+
+    def download(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_SUMMARY_INVENTORY_REPORT
+
+        GET /api/summary-inventory-report/{id}/attachment/download
+        """
+        return self._stream(
+            self._op_download,
+            path={'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_edit = Operation('PUT', 'api/summary-inventory-report/{id}', response=lambda: m.SummaryInventoryReportDto, body=lambda: m.SummaryInventoryReportEditRequest)
+
+    async def edit(
+        self,
+        id: UUID,
+        *,
+        body: m.SummaryInventoryReportEditRequest,
+        service_token: Optional[str] = None,
+    ) -> m.SummaryInventoryReportDto:
+        """
+        Изменить номер сводной описи дел
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_SUMMARY_INVENTORY_REPORT
+
+        PUT /api/summary-inventory-report/{id}
+        """
+        return await self._call(
+            self._op_edit,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_find_all = Operation('GET', 'api/summary-inventory-report', response=lambda: list[m.SummaryInventoryReportDto])
+
+    async def find_all(
+        self,
+        *,
+        filter: m.SummaryInventoryReportFilter,
+        service_token: Optional[str] = None,
+    ) -> list[m.SummaryInventoryReportDto]:
+        """
+        Получить список описей дел по фильтру
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_SUMMARY_INVENTORY_REPORT
+
+        GET /api/summary-inventory-report
+        """
+        return await self._call(
+            self._op_find_all,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_find_by_id = Operation('GET', 'api/summary-inventory-report/{id}', response=lambda: m.SummaryInventoryReportDto)
+
+    async def find_by_id(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.SummaryInventoryReportDto:
+        """
+        Получить сводную опись по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_SUMMARY_INVENTORY_REPORT
+
+        GET /api/summary-inventory-report/{id}
+        """
+        return await self._call(
+            self._op_find_by_id,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_archive_years = Operation('GET', 'api/summary-inventory-report/year', response=list[int])
+
+    async def get_archive_years(
+        self,
+        *,
+        filter: m.SummaryInventoryReportFilter,
+        service_token: Optional[str] = None,
+    ) -> list[int]:
+        """
+        Получить список годов описей дел по фильтру
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_SUMMARY_INVENTORY_REPORT
+
+        GET /api/summary-inventory-report/year
+        """
+        return await self._call(
+            self._op_get_archive_years,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_funds = Operation('GET', 'api/summary-inventory-report/fund', response=lambda: list[m.ArchiveFundDto])
+
+    async def get_funds(
+        self,
+        *,
+        filter: m.SummaryInventoryReportFilter,
+        service_token: Optional[str] = None,
+    ) -> list[m.ArchiveFundDto]:
+        """
+        Получить список фондов описей дел по фильтру
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_SUMMARY_INVENTORY_REPORT
+
+        GET /api/summary-inventory-report/fund
+        """
+        return await self._call(
+            self._op_get_funds,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_storage_periods = Operation('GET', 'api/summary-inventory-report/period', response=list[str])
+
+    async def get_storage_periods(
+        self,
+        *,
+        filter: m.SummaryInventoryReportFilter,
+        service_token: Optional[str] = None,
+    ) -> list[str]:
+        """
+        Получить список периодов описей дел по фильтру
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_SUMMARY_INVENTORY_REPORT
+
+        GET /api/summary-inventory-report/period
+        """
+        return await self._call(
+            self._op_get_storage_periods,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+
+class SvodnyeNomenklaturyDelApi(ApiGroup):
+    """
+    Сводные номенклатуры дел
+    API для работы со сводными номенклатурами дел
+    """
+
+    _op_cancel = Operation('PUT', 'api/summary-nomenclature-department/{id}/cancel', response=dict[str, Any], body=lambda: m.SummaryCancelRequest)
+
+    async def cancel(
+        self,
+        id: UUID,
+        *,
+        body: m.SummaryCancelRequest,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Аннулировать
+
+        Для доступа к этому API необходимо: SUMMARY_NOMENCLATURE_DEPARTMENT_CANCEL
+
+        PUT /api/summary-nomenclature-department/{id}/cancel
+        """
+        return await self._call(
+            self._op_cancel,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create = Operation('POST', 'api/summary-nomenclature-department', response=lambda: m.SummaryNomenclatureDepartmentDto, body=lambda: m.CreateSummaryNomenclatureDepartmentDto)
+
+    async def create(
+        self,
+        *,
+        body: m.CreateSummaryNomenclatureDepartmentDto,
+        service_token: Optional[str] = None,
+    ) -> m.SummaryNomenclatureDepartmentDto:
+        """
+        Создать сводную номенклатуру дел
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_SUMMARY_NOMENCLATURE_DEPARTMENT
+
+        POST /api/summary-nomenclature-department
+        """
+        return await self._call(
+            self._op_create,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create_introductions = Operation('POST', 'api/summary-nomenclature-department/{id}/introduction', response=lambda: list[m.SummaryNomenclatureDepartmentIntroductionDto], body=lambda: m.SummaryNomenclatureDepartmentIntroductionRequest)
+
+    async def create_introductions(
+        self,
+        id: UUID,
+        *,
+        body: m.SummaryNomenclatureDepartmentIntroductionRequest,
+        service_token: Optional[str] = None,
+    ) -> list[m.SummaryNomenclatureDepartmentIntroductionDto]:
+        """
+        Добавить список ознакомителей для сводной номенклатуры дел
+
+        Для доступа к этому API необходимо: SUMMARY_NOMENCLATURE_DEPARTMENT_INTRODUCTION_CREATE
+
+        POST /api/summary-nomenclature-department/{id}/introduction
+        """
+        return await self._call(
+            self._op_create_introductions,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_create_nomenclature = Operation('POST', 'api/summary-nomenclature-department/{id}/create-nomenclature', response=lambda: m.SummaryNomenclatureDepartmentDto)
+
+    async def create_nomenclature(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.SummaryNomenclatureDepartmentDto:
+        """
+        Создать сводную номенклатуру дел
+
+        Для доступа к этому API необходимо: SUMMARY_NOMENCLATURE_DEPARTMENT_CREATE_NOMENCLATURE
+
+        POST /api/summary-nomenclature-department/{id}/create-nomenclature
+        """
+        return await self._call(
+            self._op_create_nomenclature,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_attachment = Operation('DELETE', 'api/summary-nomenclature-department/{id}/attachment', response=dict[str, Any])
+
+    async def delete_attachment(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Удалить вложение сводной номенклатуры дел
+
+        Для доступа к этому API необходимо: SUMMARY_NOMENCLATURE_DEPARTMENT_UPDATE
+
+        DELETE /api/summary-nomenclature-department/{id}/attachment
+        """
+        return await self._call(
+            self._op_delete_attachment,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_delete_list = Operation('DELETE', 'api/summary-nomenclature-department/{id}/introduction', response=dict[str, Any], body=lambda: m.IdsUUID)
+
+    async def delete_list(
+        self,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Удалить список ознакомлений для сводной номенклатуры дел
+
+        Для доступа к этому API необходимо: SUMMARY_NOMENCLATURE_DEPARTMENT_INTRODUCTION_DELETE
+
+        DELETE /api/summary-nomenclature-department/{id}/introduction
+        """
+        return await self._call(
+            self._op_delete_list,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_download_attachment = Operation('GET', 'api/summary-nomenclature-department/{id}/attachment', binary=True)
+
+    def download_attachment(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Скачать вложение сводной номенклатуры дел
+
+        Для доступа к этому API необходимо: SUMMARY_NOMENCLATURE_DEPARTMENT_READ
+
+        GET /api/summary-nomenclature-department/{id}/attachment
+        """
+        return self._stream(
+            self._op_download_attachment,
+            path={'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_execute = Operation('POST', 'api/summary-nomenclature-department/{id}/execute', response=dict[str, Any], body=lambda: list[m.SummaryNomDepOperation])
+
+    async def execute(
+        self,
+        id: UUID,
+        *,
+        body: list[m.SummaryNomDepOperation],
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Выполнить операции над сводной номенклатурой
+
+        POST /api/summary-nomenclature-department/{id}/execute
+        """
+        return await self._call(
+            self._op_execute,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_find_all = Operation('GET', 'api/summary-nomenclature-department', response=lambda: m.SliceDtoSummaryNomenclatureDepartmentDto)
+
+    async def find_all(
+        self,
+        *,
+        filter: m.SummaryNomenclatureDepartmentFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoSummaryNomenclatureDepartmentDto:
+        """
+        Получить постраничный список сводных номенклатур дел по фильтру
+
+        GET /api/summary-nomenclature-department
+        """
+        return await self._call(
+            self._op_find_all,
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_find_all_list = Operation('GET', 'api/summary-nomenclature-department/all', response=lambda: list[m.SummaryNomenclatureDepartmentDto])
+
+    async def find_all_list(
+        self,
+        *,
+        filter: m.SummaryNomenclatureDepartmentFilter,
+        service_token: Optional[str] = None,
+    ) -> list[m.SummaryNomenclatureDepartmentDto]:
+        """
+        Получить полный список сводных номенклатур дел по фильтру
+
+        GET /api/summary-nomenclature-department/all
+        """
+        return await self._call(
+            self._op_find_all_list,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_by_id = Operation('GET', 'api/summary-nomenclature-department/{id}', response=lambda: m.SummaryNomenclatureDepartmentDto)
+
+    async def get_by_id(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.SummaryNomenclatureDepartmentDto:
+        """
+        Получить сводную номенклатуру дел по id
+
+        Для доступа к этому API необходимо: SUMMARY_NOMENCLATURE_DEPARTMENT_READ
+
+        GET /api/summary-nomenclature-department/{id}
+        """
+        return await self._call(
+            self._op_get_by_id,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_introductions = Operation('GET', 'api/summary-nomenclature-department/{id}/introduction', response=lambda: list[m.SummaryNomenclatureDepartmentIntroductionDto])
+
+    async def get_introductions(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.SummaryNomenclatureDepartmentIntroductionDto]:
+        """
+        Получить список ознакомлений сводной номенклатуры дел
+
+        Для доступа к этому API необходимо: SUMMARY_NOMENCLATURE_DEPARTMENT_READ
+
+        GET /api/summary-nomenclature-department/{id}/introduction
+        """
+        return await self._call(
+            self._op_get_introductions,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_nomenclature_department_links = Operation('GET', 'api/summary-nomenclature-department/{id}/nomenclature-departments', response=lambda: m.SliceDtoSummaryNomenclatureDepartmentLinkDto)
+
+    async def get_nomenclature_department_links(
+        self,
+        id: UUID,
+        *,
+        filter: m.SummaryNomenclatureDepartmentLinkFilter,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoSummaryNomenclatureDepartmentLinkDto:
+        """
+        Получить список ссылок на номенклатуры подразделений по идентификатору сводной номенклатуры
+
+        Для доступа к этому API необходимо: SUMMARY_NOMENCLATURE_DEPARTMENT_READ
+
+        GET /api/summary-nomenclature-department/{id}/nomenclature-departments
+        """
+        return await self._call(
+            self._op_get_nomenclature_department_links,
+            path={'id': id},
+            query={'filter': filter, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_get_permission = Operation('GET', 'api/summary-nomenclature-department/{id}/permission', response=lambda: list[m.SummaryNomenclatureDepartmentPermission])
+
+    async def get_permission(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.SummaryNomenclatureDepartmentPermission]:
+        """
+        Получить пермишены сводной номенклатуры дел по id
+
+        GET /api/summary-nomenclature-department/{id}/permission
+        """
+        return await self._call(
+            self._op_get_permission,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_process_executors = Operation('GET', 'api/summary-nomenclature-department/{id}/process/items/{itemId}/executors', response=lambda: list[m.SummaryNomenclatureDepartmentProcessExecutorDto])
+
+    async def get_process_executors(
+        self,
+        id: UUID,
+        item_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.SummaryNomenclatureDepartmentProcessExecutorDto]:
+        """
+        Получить список исполнителей элемента процесса сводной номенклатуры
+
+        Для доступа к этому API необходимо: SUMMARY_NOMENCLATURE_DEPARTMENT_READ
+
+        GET /api/summary-nomenclature-department/{id}/process/items/{itemId}/executors
+        """
+        return await self._call(
+            self._op_get_process_executors,
+            path={'id': id, 'itemId': item_id},
+            service_token=service_token,
+        )
+
+    _op_get_process_items = Operation('GET', 'api/summary-nomenclature-department/{id}/process/items', response=lambda: list[m.SummaryNomenclatureDepartmentProcessItemDto])
+
+    async def get_process_items(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.SummaryNomenclatureDepartmentProcessItemDto]:
+        """
+        Получить список элементов процесса сводной номенклатуры
+
+        Для доступа к этому API необходимо: SUMMARY_NOMENCLATURE_DEPARTMENT_READ
+
+        GET /api/summary-nomenclature-department/{id}/process/items
+        """
+        return await self._call(
+            self._op_get_process_items,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_with_permission = Operation('GET', 'api/summary-nomenclature-department/{id}/all', response=lambda: m.SummaryNomenclatureDepartmentWithPermission)
+
+    async def get_with_permission(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.SummaryNomenclatureDepartmentWithPermission:
+        """
+        Получить сводную номенклатуру дел по id и пермишены
+
+        GET /api/summary-nomenclature-department/{id}/all
+        """
+        return await self._call(
+            self._op_get_with_permission,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_years = Operation('GET', 'api/summary-nomenclature-department/years', response=list[int])
+
+    async def get_years(
+        self,
+        *,
+        filter: m.SummaryNomenclatureDepartmentFilter,
+        service_token: Optional[str] = None,
+    ) -> list[int]:
+        """
+        Получить уникальный список годов сводных номенклатур дел
+
+        GET /api/summary-nomenclature-department/years
+        """
+        return await self._call(
+            self._op_get_years,
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_history = Operation('GET', 'api/summary-nomenclature-department/{id}/history', response=lambda: m.SliceDtoSummaryNomenclatureDepartmentHistoryDto)
+
+    async def history(
+        self,
+        id: UUID,
+        *,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoSummaryNomenclatureDepartmentHistoryDto:
+        """
+        Получить историю сводной номенклатуры дел
+
+        Для доступа к этому API необходимо: SUMMARY_NOMENCLATURE_DEPARTMENT_READ
+
+        GET /api/summary-nomenclature-department/{id}/history
+        """
+        return await self._call(
+            self._op_history,
+            path={'id': id},
+            query={'p': p},
+            service_token=service_token,
+        )
+
+    _op_print_by_template = Operation('PUT', 'api/summary-nomenclature-department/{id}/print', response=lambda: m.AttachmentDto, body=lambda: m.SummaryNomenclatureDepartmentRequest)
+
+    async def print_by_template(
+        self,
+        id: UUID,
+        *,
+        body: m.SummaryNomenclatureDepartmentRequest,
+        service_token: Optional[str] = None,
+    ) -> m.AttachmentDto:
+        """
+        Печать сводной номенклатуры по шаблону
+
+        Для доступа к этому API необходимо: SUMMARY_NOMENCLATURE_DEPARTMENT_READ
+
+        PUT /api/summary-nomenclature-department/{id}/print
+        """
+        return await self._call(
+            self._op_print_by_template,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put_stamp = Operation('PUT', 'api/summary-nomenclature-department/{summaryId}/introduction/execute', response=lambda: m.SummaryNomenclatureDepartmentIntroductionDto, body=lambda: m.IdUUID)
+
+    async def put_stamp(
+        self,
+        summary_id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> m.SummaryNomenclatureDepartmentIntroductionDto:
+        """
+        Проставить отметку ознакомления для сводной номенклатуры дел
+
+        PUT /api/summary-nomenclature-department/{summaryId}/introduction/execute
+        """
+        return await self._call(
+            self._op_put_stamp,
+            path={'summaryId': summary_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_signing = Operation('PUT', 'api/summary-nomenclature-department/{id}/process/{itemId}/signing', response=dict[str, Any], body=lambda: m.SummaryNomenclatureDepartmentProcessAction)
+
+    async def signing(
+        self,
+        id: UUID,
+        item_id: UUID,
+        *,
+        body: m.SummaryNomenclatureDepartmentProcessAction,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Выполнить действие подписания сводной номенклатуры
+
+        Для доступа к этому API необходимо: SUMMARY_NOMENCLATURE_DEPARTMENT_SIGNING
+
+        PUT /api/summary-nomenclature-department/{id}/process/{itemId}/signing
+        """
+        return await self._call(
+            self._op_signing,
+            path={'id': id, 'itemId': item_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_start = Operation('PUT', 'api/summary-nomenclature-department/{id}/start', response=dict[str, Any])
+
+    async def start(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Запустить процесс согласования сводной номенклатуры
+
+        Для доступа к этому API необходимо: SUMMARY_NOMENCLATURE_DEPARTMENT_START
+
+        PUT /api/summary-nomenclature-department/{id}/start
+        """
+        return await self._call(
+            self._op_start,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_statement = Operation('PUT', 'api/summary-nomenclature-department/{id}/process/{itemId}/statement', response=dict[str, Any], body=lambda: m.SummaryNomenclatureDepartmentProcessAction)
+
+    async def statement(
+        self,
+        id: UUID,
+        item_id: UUID,
+        *,
+        body: m.SummaryNomenclatureDepartmentProcessAction,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Выполнить действие утверждения сводной номенклатуры
+
+        Для доступа к этому API необходимо: SUMMARY_NOMENCLATURE_DEPARTMENT_STATEMENT
+
+        PUT /api/summary-nomenclature-department/{id}/process/{itemId}/statement
+        """
+        return await self._call(
+            self._op_statement,
+            path={'id': id, 'itemId': item_id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update = Operation('PUT', 'api/summary-nomenclature-department/{id}', response=lambda: m.SummaryNomenclatureDepartmentDto, body=lambda: m.SummaryNomenclatureDepartmentDto)
+
+    async def update(
+        self,
+        id: UUID,
+        *,
+        body: m.SummaryNomenclatureDepartmentDto,
+        service_token: Optional[str] = None,
+    ) -> m.SummaryNomenclatureDepartmentDto:
+        """
+        Обновить сводную номенклатуру дел
+
+        Для доступа к этому API необходимо: SUMMARY_NOMENCLATURE_DEPARTMENT_UPDATE
+
+        PUT /api/summary-nomenclature-department/{id}
+        """
+        return await self._call(
+            self._op_update,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_upload_attachment = Operation('POST', 'api/summary-nomenclature-department/{id}/attachment', response=Any, multipart=True)
+
+    async def upload_attachment(
+        self,
+        id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> Any:
+        """
+        Загрузить вложение сводной номенклатуры дел
+
+        Для доступа к этому API необходимо: SUMMARY_NOMENCLATURE_DEPARTMENT_UPDATE
+
+        POST /api/summary-nomenclature-department/{id}/attachment
+        """
+        return await self._call(
+            self._op_upload_attachment,
+            path={'id': id},
+            body=files,
+            service_token=service_token,
+        )
+
+
+class TematikaApi(ApiGroup):
+    """
+    Тематика
+    API для работы с тематиками
+    Константы для получения истории: SUBJECT
+    """
+
+    _op_delete = Operation('DELETE', 'api/subject', body=lambda: m.IdsUUID)
+
+    async def delete(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список тематик
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_SUBJECT
+
+        DELETE /api/subject
+        """
+        return await self._call(
+            self._op_delete,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/subject/{id}', response=lambda: m.SubjectDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.SubjectDto:
+        """
+        Получить тематику по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_SUBJECT
+
+        GET /api/subject/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_child = Operation('GET', 'api/subject/parent/{id}', response=lambda: m.SubjectDto)
+
+    async def get_child(
+        self,
+        id: UUID,
+        *,
+        filter: m.SubjectFilter,
+        service_token: Optional[str] = None,
+    ) -> m.SubjectDto:
+        """
+        Получить дочерние тематики по id родительской тематики
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_SUBJECT
+
+        GET /api/subject/parent/{id}
+        """
+        return await self._call(
+            self._op_get_child,
+            path={'id': id},
+            query={'filter': filter},
+            service_token=service_token,
+        )
+
+    _op_get_children = Operation('GET', 'api/subject/children', response=lambda: m.SubjectDto)
+
+    async def get_children(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        service_token: Optional[str] = None,
+    ) -> m.SubjectDto:
+        """
+        Получить все дочерние тематики
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_SUBJECT
+
+        GET /api/subject/children
+        """
+        return await self._call(
+            self._op_get_children,
+            query={'request': request},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/subject', response=lambda: m.SubjectDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        service_token: Optional[str] = None,
+    ) -> m.SubjectDto:
+        """
+        Получить все тематики
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_SUBJECT
+
+        GET /api/subject
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request},
+            service_token=service_token,
+        )
+
+    _op_get_parents = Operation('GET', 'api/subject/parents', response=lambda: m.SubjectDto)
+
+    async def get_parents(
+        self,
+        *,
+        list_attribute: bool,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SubjectDto:
+        """
+        Получить родительские тематики
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_SUBJECT
+
+        GET /api/subject/parents
+        """
+        return await self._call(
+            self._op_get_parents,
+            query={'listAttribute': list_attribute, 'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_post_child = Operation('POST', 'api/subject/child', response=lambda: m.SubjectDto, body=lambda: m.SubjectRequest)
+
+    async def post_child(
+        self,
+        *,
+        body: m.SubjectRequest,
+        service_token: Optional[str] = None,
+    ) -> m.SubjectDto:
+        """
+        Создать новую подтематику
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_SUBJECT
+
+        POST /api/subject/child
+        """
+        return await self._call(
+            self._op_post_child,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post_parent = Operation('POST', 'api/subject', response=lambda: m.SubjectDto, body=lambda: m.SubjectRequest)
+
+    async def post_parent(
+        self,
+        *,
+        body: m.SubjectRequest,
+        service_token: Optional[str] = None,
+    ) -> m.SubjectDto:
+        """
+        Создать новую тематику
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_SUBJECT
+
+        POST /api/subject
+        """
+        return await self._call(
+            self._op_post_parent,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/subject', response=lambda: m.SubjectDto, body=lambda: m.SubjectRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.SubjectRequest,
+        service_token: Optional[str] = None,
+    ) -> m.SubjectDto:
+        """
+        Изменить тематику
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_SUBJECT
+
+        PUT /api/subject
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put_child = Operation('PUT', 'api/subject/child', response=lambda: m.SubjectDto, body=lambda: m.SubjectRequest)
+
+    async def put_child(
+        self,
+        *,
+        body: m.SubjectRequest,
+        service_token: Optional[str] = None,
+    ) -> m.SubjectDto:
+        """
+        Изменить подтематику
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_SUBJECT
+
+        PUT /api/subject/child
+        """
+        return await self._call(
+            self._op_put_child,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class TipovyeKontrolnyeTochkiApi(ApiGroup):
+    """
+    Типовые контрольные точки
+    API для работы с типовыми контрольными точками
+    Константы для получения истории: TYPICAL_CONTROL_POINT
+    """
+
+    _op_get = Operation('GET', 'api/typical-control-point/{id}', response=lambda: m.TypicalControlPointDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TypicalControlPointDto:
+        """
+        Получить типовую контрольную точку по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_TYPICAL_CONTROL_POINT
+
+        GET /api/typical-control-point/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/typical-control-point', response=lambda: m.TypicalControlPointDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.TypicalControlPointDto:
+        """
+        Получить список типовых контрольных точек
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_TYPICAL_CONTROL_POINT
+
+        GET /api/typical-control-point
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_mark_delete_list = Operation('DELETE', 'api/typical-control-point', body=lambda: m.IdsUUID)
+
+    async def mark_delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку об удалении для списка типовых контрольных точек по ids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_TYPICAL_CONTROL_POINT
+
+        DELETE /api/typical-control-point
+        """
+        return await self._call(
+            self._op_mark_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/typical-control-point', response=lambda: m.TypicalControlPointDto, body=lambda: m.TypicalControlPointRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.TypicalControlPointRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TypicalControlPointDto:
+        """
+        Создать новую типовую контрольную точку
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_TYPICAL_CONTROL_POINT
+
+        POST /api/typical-control-point
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/typical-control-point', response=lambda: m.TypicalControlPointDto, body=lambda: m.TypicalControlPointRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.TypicalControlPointRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TypicalControlPointDto:
+        """
+        Изменить типовую контрольную точку
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_TYPICAL_CONTROL_POINT
+
+        PUT /api/typical-control-point
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class TipovyeKratkieSoderzhaniiaApi(ApiGroup):
+    """
+    Типовые краткие содержания
+    API для работы с типовыми краткими содержаниями
+    Константы для получения истории: TYPICAL_SUMMARY
+    """
+
+    _op_get = Operation('GET', 'api/typical-summary/{id}', response=lambda: m.TypicalSummary)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TypicalSummary:
+        """
+        Получить типовое краткое содержание по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_TYPICAL_SUMMARY
+
+        GET /api/typical-summary/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/typical-summary', response=lambda: m.TypicalSummary)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.TypicalSummary:
+        """
+        Получить список типовых кратких содержаний
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_TYPICAL_SUMMARY
+
+        GET /api/typical-summary
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_mark_delete = Operation('DELETE', 'api/typical-summary/{id}')
+
+    async def mark_delete(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить типовое краткое содержание по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_TYPICAL_SUMMARY
+
+        DELETE /api/typical-summary/{id}
+        """
+        return await self._call(
+            self._op_mark_delete,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_mark_delete_list = Operation('DELETE', 'api/typical-summary', body=lambda: m.IdsUUID)
+
+    async def mark_delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список типовых кратких содержаний по ids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_TYPICAL_SUMMARY
+
+        DELETE /api/typical-summary
+        """
+        return await self._call(
+            self._op_mark_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/typical-summary', response=lambda: m.TypicalSummary, body=lambda: m.TypicalSummary)
+
+    async def post(
+        self,
+        *,
+        body: m.TypicalSummary,
+        service_token: Optional[str] = None,
+    ) -> m.TypicalSummary:
+        """
+        Создать новое типовое краткое содержание
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_TYPICAL_SUMMARY
+
+        POST /api/typical-summary
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/typical-summary', response=lambda: m.TypicalSummary, body=lambda: m.TypicalSummary)
+
+    async def put(
+        self,
+        *,
+        body: m.TypicalSummary,
+        service_token: Optional[str] = None,
+    ) -> m.TypicalSummary:
+        """
+        Изменить типовое краткое содержание
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_TYPICAL_SUMMARY
+
+        PUT /api/typical-summary
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class TipovyeKratkieSoderzhaniiaPorucheniiaApi(ApiGroup):
+    """
+    Типовые краткие содержания поручения
+    API для работы с типовыми краткими содержаниями поручения
+    Константы для получения истории: TYPICAL_SUMMARY_TASK
+    """
+
+    _op_get = Operation('GET', 'api/typical-summary-task/{id}', response=lambda: m.TypicalSummaryTaskDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TypicalSummaryTaskDto:
+        """
+        Получить типовое краткое содержание поручения по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_TYPICAL_SUMMARY_TASK
+
+        GET /api/typical-summary-task/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/typical-summary-task', response=lambda: m.TypicalSummaryTaskDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.TypicalSummaryTaskDto:
+        """
+        Получить список типовых кратких содержаний поручения
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_TYPICAL_SUMMARY_TASK
+
+        GET /api/typical-summary-task
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_mark_delete_list = Operation('DELETE', 'api/typical-summary-task', body=lambda: m.IdsUUID)
+
+    async def mark_delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку об удалении для списка типовых кратких содержаний поручения по ids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_TYPICAL_SUMMARY_TASK
+
+        DELETE /api/typical-summary-task
+        """
+        return await self._call(
+            self._op_mark_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/typical-summary-task', response=lambda: m.TypicalSummaryTaskDto, body=lambda: m.TypicalSummaryTaskRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.TypicalSummaryTaskRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TypicalSummaryTaskDto:
+        """
+        Создать новое типовое краткое содержание поручения
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_TYPICAL_SUMMARY_TASK
+
+        POST /api/typical-summary-task
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/typical-summary-task', response=lambda: m.TypicalSummaryTaskDto, body=lambda: m.TypicalSummaryTaskRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.TypicalSummaryTaskRequest,
+        service_token: Optional[str] = None,
+    ) -> m.TypicalSummaryTaskDto:
+        """
+        Изменить типовое краткое содержание поручения
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_TYPICAL_SUMMARY_TASK
+
+        PUT /api/typical-summary-task
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class TipyDokumentovApi(ApiGroup):
+    """
+    Типы документов
+    API для работы с типами документов
+    Константы для получения истории: DOCUMENT_TYPE
+    """
+
+    _op_delete_list = Operation('DELETE', 'api/document-type', body=lambda: m.IdsLong)
+
+    async def delete_list(
+        self,
+        *,
+        body: m.IdsLong,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить типы документов по ids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_DOCUMENT_TYPE
+
+        DELETE /api/document-type
+        """
+        return await self._call(
+            self._op_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/document-type/{id}', response=lambda: m.DocumentType)
+
+    async def get(
+        self,
+        id: int,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentType:
+        """
+        Получить тип документа по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DOCUMENT_TYPE
+
+        GET /api/document-type/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/document-type', response=lambda: m.DocumentType)
+
+    async def get_collection(
+        self,
+        *,
+        filter: m.DocumentTypeFilter,
+        list_attribute: bool,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentType:
+        """
+        Получить список типов документов
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_DOCUMENT_TYPE
+
+        GET /api/document-type
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'filter': filter, 'listAttribute': list_attribute, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/document-type', response=lambda: m.DocumentType, body=lambda: m.DocumentTypeRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.DocumentTypeRequest,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentType:
+        """
+        Создать новый тип документа
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_DOCUMENT_TYPE
+
+        POST /api/document-type
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/document-type', response=lambda: m.DocumentType, body=lambda: m.DocumentTypeRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.DocumentTypeRequest,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentType:
+        """
+        Изменить тип документа
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_DOCUMENT_TYPE
+
+        PUT /api/document-type
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class TipyKontroliaApi(ApiGroup):
+    """
+    Типы контроля
+    API для работы с типами контроля
+    Константы для получения истории: CONTROL_TYPE
+    """
+
+    _op_get = Operation('GET', 'api/control-type/{id}', response=lambda: m.ControlType)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.ControlType:
+        """
+        Получить тип контроля по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CONTROL_TYPE
+
+        GET /api/control-type/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/control-type', response=lambda: m.ControlType)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.ControlType:
+        """
+        Получить список всех типов контроля
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CONTROL_TYPE
+
+        GET /api/control-type
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_mark_delete_list = Operation('DELETE', 'api/control-type', body=lambda: m.IdsUUID)
+
+    async def mark_delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Пометить типы контроля как удаленные
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_CONTROL_TYPE
+
+        DELETE /api/control-type
+        """
+        return await self._call(
+            self._op_mark_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/control-type', response=lambda: m.ControlType, body=lambda: m.ControlTypeRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.ControlTypeRequest,
+        service_token: Optional[str] = None,
+    ) -> m.ControlType:
+        """
+        Создать новый тип контроля
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_CONTROL_TYPE
+
+        POST /api/control-type
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/control-type', response=lambda: m.ControlType, body=lambda: m.ControlTypeRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.ControlTypeRequest,
+        service_token: Optional[str] = None,
+    ) -> m.ControlType:
+        """
+        Изменить тип контроля
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_CONTROL_TYPE
+
+        PUT /api/control-type
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class UsdApi(ApiGroup):
+    """
+    УСД
+    API для работы с унифицированной системой документации (УСД)
+    Константы для получения истории: UNIFIED_DOCUMENTATION_SYSTEM
+    """
+
+    _op_get = Operation('GET', 'api/unified-documentation-system/{id}', response=lambda: m.UnifiedDocumentationSystemDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.UnifiedDocumentationSystemDto:
+        """
+        Получить УСД по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_UNIFIED_DOCUMENTATION_SYSTEM
+
+        GET /api/unified-documentation-system/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/unified-documentation-system', response=lambda: m.UnifiedDocumentationSystemDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.UnifiedDocumentationSystemDto:
+        """
+        Получить список УСД
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_UNIFIED_DOCUMENTATION_SYSTEM
+
+        GET /api/unified-documentation-system
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_mark_delete_list = Operation('DELETE', 'api/unified-documentation-system', body=lambda: m.IdsUUID)
+
+    async def mark_delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку об удалении для списка УСД по ids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_UNIFIED_DOCUMENTATION_SYSTEM
+
+        DELETE /api/unified-documentation-system
+        """
+        return await self._call(
+            self._op_mark_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/unified-documentation-system', response=lambda: m.UnifiedDocumentationSystemDto, body=lambda: m.UnifiedDocumentationSystemRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.UnifiedDocumentationSystemRequest,
+        service_token: Optional[str] = None,
+    ) -> m.UnifiedDocumentationSystemDto:
+        """
+        Создать новую УСД
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_UNIFIED_DOCUMENTATION_SYSTEM
+
+        POST /api/unified-documentation-system
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/unified-documentation-system', response=lambda: m.UnifiedDocumentationSystemDto, body=lambda: m.UnifiedDocumentationSystemRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.UnifiedDocumentationSystemRequest,
+        service_token: Optional[str] = None,
+    ) -> m.UnifiedDocumentationSystemDto:
+        """
+        Изменить УСД
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_UNIFIED_DOCUMENTATION_SYSTEM
+
+        PUT /api/unified-documentation-system
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class UserAdAccountControllerApi(ApiGroup):
+    """
+    user-ad-account-controller
+    """
+
+    _op_get = Operation('GET', 'api/user-ad-account/{id}', response=lambda: m.NoPasswordUserAccount)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NoPasswordUserAccount:
+        """
+        Для доступа к этому API необходимо: Требуется право доступа: READ_USER_BASIC_AUTH ИЛИ Доступ по условию: id должен совпадать с user.id
+
+        GET /api/user-ad-account/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+
+class UserHomeDashboardControllerApi(ApiGroup):
+    """
+    user-home-dashboard-controller
+    """
+
+    _op_edit = Operation('PUT', 'api/user-home-dashboard', response=lambda: m.UserDashboardDto, body=lambda: m.UserDashboardDto)
+
+    async def edit(
+        self,
+        *,
+        body: m.UserDashboardDto,
+        service_token: Optional[str] = None,
+    ) -> m.UserDashboardDto:
+        """
+
+        PUT /api/user-home-dashboard
+        """
+        return await self._call(
+            self._op_edit,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/user-home-dashboard', response=lambda: m.UserDashboardDto)
+
+    async def get(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.UserDashboardDto:
+        """
+
+        GET /api/user-home-dashboard
+        """
+        return await self._call(
+            self._op_get,
+            service_token=service_token,
+        )
+
+
+class UserHomeDashboardTodolistControllerApi(ApiGroup):
+    """
+    user-home-dashboard-todolist-controller
+    """
+
+    _op_edit = Operation('PUT', 'api/user-home-dashboard-todolist', response=lambda: m.UserDashboardTodolistDto, body=lambda: m.UserDashboardTodolistDto)
+
+    async def edit(
+        self,
+        *,
+        body: m.UserDashboardTodolistDto,
+        service_token: Optional[str] = None,
+    ) -> m.UserDashboardTodolistDto:
+        """
+
+        PUT /api/user-home-dashboard-todolist
+        """
+        return await self._call(
+            self._op_edit,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get = Operation('GET', 'api/user-home-dashboard-todolist', response=lambda: m.UserDashboardTodolistDto)
+
+    async def get(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.UserDashboardTodolistDto:
+        """
+
+        GET /api/user-home-dashboard-todolist
+        """
+        return await self._call(
+            self._op_get,
+            service_token=service_token,
+        )
+
+
+class UvedomleniiaApi(ApiGroup):
+    """
+    Уведомления
+    API для работы c уведомлениями
+    Константы для получения истории: NOTIFICATIONS_RULES
+    """
+
+    _op_get = Operation('GET', 'api/notification-rule/{id}', response=lambda: m.NotificationsRulesDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.NotificationsRulesDto:
+        """
+        Получить правило уведомления по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_NOTIFICATIONS_RULES
+
+        GET /api/notification-rule/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/notification-rule', response=lambda: m.NotificationsRulesDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.NotificationsRulesDto:
+        """
+        Получить все правила уведомлений
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_NOTIFICATIONS_RULES
+
+        GET /api/notification-rule
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/notification-rule', response=lambda: m.NotificationsRulesDto, body=lambda: m.NotificationsRulesDto)
+
+    async def put(
+        self,
+        *,
+        body: m.NotificationsRulesDto,
+        service_token: Optional[str] = None,
+    ) -> m.NotificationsRulesDto:
+        """
+        Изменить текст правила и активность уведомления
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_NOTIFICATIONS_RULES
+
+        PUT /api/notification-rule
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class UvedomleniiaPolzovateliaApi(ApiGroup):
+    """
+    Уведомления пользователя
+    """
+
+    _op_delete = Operation('DELETE', 'api/user-notification', response=lambda: m.UserNotificationStatDto, body=lambda: m.IdsUUID)
+
+    async def delete(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.UserNotificationStatDto:
+        """
+
+        DELETE /api/user-notification
+        """
+        return await self._call(
+            self._op_delete,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_get_all = Operation('GET', 'api/user-notification', response=lambda: m.SliceDtoUserNotificationDto)
+
+    async def get_all(
+        self,
+        *,
+        filter: m.UserNotificationFilter,
+        p: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.SliceDtoUserNotificationDto:
+        """
+
+        GET /api/user-notification
+        """
+        return await self._call(
+            self._op_get_all,
+            query={'filter': filter, 'p': p},
+            service_token=service_token,
+        )
+
+    _op_get_by_id = Operation('GET', 'api/user-notification/{id}', response=lambda: m.UserNotificationDto)
+
+    async def get_by_id(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.UserNotificationDto:
+        """
+
+        GET /api/user-notification/{id}
+        """
+        return await self._call(
+            self._op_get_by_id,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_stat = Operation('GET', 'api/user-notification/stat', response=lambda: m.UserNotificationStatDto)
+
+    async def get_stat(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.UserNotificationStatDto:
+        """
+
+        GET /api/user-notification/stat
+        """
+        return await self._call(
+            self._op_get_stat,
+            service_token=service_token,
+        )
+
+    _op_read = Operation('POST', 'api/user-notification/read', response=lambda: m.UserNotificationStatDto, body=lambda: m.IdsUUID)
+
+    async def read(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.UserNotificationStatDto:
+        """
+
+        POST /api/user-notification/read
+        """
+        return await self._call(
+            self._op_read,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_read_all = Operation('POST', 'api/user-notification/read/all', response=lambda: m.UserNotificationStatDto)
+
+    async def read_all(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.UserNotificationStatDto:
+        """
+
+        POST /api/user-notification/read/all
+        """
+        return await self._call(
+            self._op_read_all,
+            service_token=service_token,
+        )
+
+    _op_unread = Operation('POST', 'api/user-notification/unread', response=lambda: m.UserNotificationStatDto, body=lambda: m.IdsUUID)
+
+    async def unread(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.UserNotificationStatDto:
+        """
+
+        POST /api/user-notification/unread
+        """
+        return await self._call(
+            self._op_unread,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class ValiutyApi(ApiGroup):
+    """
+    Валюты
+    API для работы с валютой
+    Константы для получения истории: CURRENCY
+    """
+
+    _op_get = Operation('GET', 'api/currency/{id}', response=lambda: m.CurrencyDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.CurrencyDto:
+        """
+        Получить валюты по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CURRENCY
+
+        GET /api/currency/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/currency', response=lambda: m.CurrencyDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.CurrencyDto:
+        """
+        Получить список валют
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CURRENCY
+
+        GET /api/currency
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_mark_delete_list = Operation('DELETE', 'api/currency', body=lambda: m.IdsUUID)
+
+    async def mark_delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку об удалении для списка валют по ids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_CURRENCY
+
+        DELETE /api/currency
+        """
+        return await self._call(
+            self._op_mark_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/currency', response=lambda: m.CurrencyDto, body=lambda: m.CurrencyRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.CurrencyRequest,
+        service_token: Optional[str] = None,
+    ) -> m.CurrencyDto:
+        """
+        Создать новую валюту
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_CURRENCY
+
+        POST /api/currency
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/currency', response=lambda: m.CurrencyDto, body=lambda: m.CurrencyRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.CurrencyRequest,
+        service_token: Optional[str] = None,
+    ) -> m.CurrencyDto:
+        """
+        Изменить валюту
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_CURRENCY
+
+        PUT /api/currency
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class VidObrashcheniiApi(ApiGroup):
+    """
+    Вид обращений
+    API для работы с видами обращений
+    Константы для получения истории: CITIZEN_TYPE
+    """
+
+    _op_get = Operation('GET', 'api/citizen-type/{id}', response=lambda: m.CitizenTypeDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.CitizenTypeDto:
+        """
+        Получить вид обращения по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CITIZEN_TYPE
+
+        GET /api/citizen-type/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/citizen-type', response=lambda: m.CitizenTypeDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.CitizenTypeDto:
+        """
+        Получить список видов обращений
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CITIZEN_TYPE
+
+        GET /api/citizen-type
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_mark_delete_list = Operation('DELETE', 'api/citizen-type', body=lambda: m.IdsUUID)
+
+    async def mark_delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку об удалении для списка видов обращений по ids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_CITIZEN_TYPE
+
+        DELETE /api/citizen-type
+        """
+        return await self._call(
+            self._op_mark_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/citizen-type', response=lambda: m.CitizenTypeDto, body=lambda: m.CitizenTypeRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.CitizenTypeRequest,
+        service_token: Optional[str] = None,
+    ) -> m.CitizenTypeDto:
+        """
+        Создать новый вид обращения
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_CITIZEN_TYPE
+
+        POST /api/citizen-type
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/citizen-type', response=lambda: m.CitizenTypeDto, body=lambda: m.CitizenTypeRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.CitizenTypeRequest,
+        service_token: Optional[str] = None,
+    ) -> m.CitizenTypeDto:
+        """
+        Изменить вид обращения
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_CITIZEN_TYPE
+
+        PUT /api/citizen-type
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_search_fts_top_by_name = Operation('GET', 'api/citizen-type/fts-name', response=lambda: m.CitizenTypeDto)
+
+    async def search_fts_top_by_name(
+        self,
+        *,
+        fts: str,
+        service_token: Optional[str] = None,
+    ) -> m.CitizenTypeDto:
+        """
+        Полнотекстовый поиск вида обращения по названию
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_CITIZEN_TYPE
+
+        GET /api/citizen-type/fts-name
+        """
+        return await self._call(
+            self._op_search_fts_top_by_name,
+            query={'fts': fts},
+            service_token=service_token,
+        )
+
+
+class VidyDopDokumentovApi(ApiGroup):
+    """
+    Виды доп документов
+    API для работы с видами доп документов
+    Константы для получения истории: ADDITIONAL_DOCUMENT_TYPE
+    """
+
+    _op_get = Operation('GET', 'api/additional-document-type/{id}', response=lambda: m.AdditionalDocumentTypeDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.AdditionalDocumentTypeDto:
+        """
+        Получить виды доп документов по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ADDITIONAL_DOCUMENT_TYPE
+
+        GET /api/additional-document-type/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/additional-document-type', response=lambda: m.AdditionalDocumentTypeDto)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.AdditionalDocumentTypeDto:
+        """
+        Получить список видов доп документов
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_ADDITIONAL_DOCUMENT_TYPE
+
+        GET /api/additional-document-type
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_mark_delete_list = Operation('DELETE', 'api/additional-document-type', body=lambda: m.IdsUUID)
+
+    async def mark_delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Проставить отметку об удалении для списка вида доп документов по ids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_ADDITIONAL_DOCUMENT_TYPE
+
+        DELETE /api/additional-document-type
+        """
+        return await self._call(
+            self._op_mark_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/additional-document-type', response=lambda: m.AdditionalDocumentTypeDto, body=lambda: m.AdditionalDocumentTypeRequest)
+
+    async def post(
+        self,
+        *,
+        body: m.AdditionalDocumentTypeRequest,
+        service_token: Optional[str] = None,
+    ) -> m.AdditionalDocumentTypeDto:
+        """
+        Создать новый вид доп документов
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_ADDITIONAL_DOCUMENT_TYPE
+
+        POST /api/additional-document-type
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/additional-document-type', response=lambda: m.AdditionalDocumentTypeDto, body=lambda: m.AdditionalDocumentTypeRequest)
+
+    async def put(
+        self,
+        *,
+        body: m.AdditionalDocumentTypeRequest,
+        service_token: Optional[str] = None,
+    ) -> m.AdditionalDocumentTypeDto:
+        """
+        Изменить виды доп документов
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_ADDITIONAL_DOCUMENT_TYPE
+
+        PUT /api/additional-document-type
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class VnutrenniePriglashennyeApi(ApiGroup):
+    """
+    Внутренние приглашенные
+    API для работы с внутренними приглашенными
+    """
+
+    _op_get_all = Operation('GET', 'api/document/{docId}/invited', response=lambda: m.DocumentInvitedDto)
+
+    async def get_all(
+        self,
+        doc_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.DocumentInvitedDto:
+        """
+        Получить список внутренних приглашенных
+
+        GET /api/document/{docId}/invited
+        """
+        return await self._call(
+            self._op_get_all,
+            path={'docId': doc_id},
+            service_token=service_token,
+        )
+
+
+class VozmozhnostiPolzovateliaApi(ApiGroup):
+    """
+    Возможности пользователя
+    """
+
+    _op_add_role = Operation('POST', 'api/permission/{id}/role', response=str, body=lambda: m.IdUUID)
+
+    async def add_role(
+        self,
+        id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Добавить роль
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_PERMISSION
+
+        POST /api/permission/{id}/role
+        """
+        return await self._call(
+            self._op_add_role,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_add_roles = Operation('POST', 'api/permission/{id}/role/batch', response=str, body=lambda: m.IdsUUID)
+
+    async def add_roles(
+        self,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Добавить роль
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_PERMISSION
+
+        POST /api/permission/{id}/role/batch
+        """
+        return await self._call(
+            self._op_add_roles,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_find_by_id_3 = Operation('GET', 'api/permission/{id}', response=lambda: m.PermissionDto)
+
+    async def find_by_id_3(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.PermissionDto:
+        """
+        Получить по ид
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_PERMISSION
+
+        GET /api/permission/{id}
+        """
+        return await self._call(
+            self._op_find_by_id_3,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_find_by_id_4 = Operation('GET', 'api/permission/system-name', response=lambda: m.PermissionDto)
+
+    async def find_by_id_4(
+        self,
+        *,
+        system_name: str,
+        status: str | None = None,
+        category: str | None = None,
+        task_type: str | None = None,
+        nomenclature_department_status: str | None = None,
+        summary_nomenclature_department_status: str | None = None,
+        destruction_act_status: str | None = None,
+        acceptance_inventory_status: str | None = None,
+        service_token: Optional[str] = None,
+    ) -> m.PermissionDto:
+        """
+        Получить по системному имени
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_PERMISSION
+
+        GET /api/permission/system-name
+        """
+        return await self._call(
+            self._op_find_by_id_4,
+            query={'systemName': system_name, 'status': status, 'category': category, 'taskType': task_type, 'nomenclatureDepartmentStatus': nomenclature_department_status, 'summaryNomenclatureDepartmentStatus': summary_nomenclature_department_status, 'destructionActStatus': destruction_act_status, 'acceptanceInventoryStatus': acceptance_inventory_status},
+            service_token=service_token,
+        )
+
+    _op_find_roles = Operation('GET', 'api/permission/{id}/role', response=lambda: list[m.PermissionRoleDto])
+
+    async def find_roles(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> list[m.PermissionRoleDto]:
+        """
+        Получить роли
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_PERMISSION
+
+        GET /api/permission/{id}/role
+        """
+        return await self._call(
+            self._op_find_roles,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_preset_permissions = Operation('GET', 'api/permission/export', binary=True)
+
+    def get_preset_permissions(
+        self,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Получить текущие настройки пермишенов
+
+        GET /api/permission/export
+        """
+        return self._stream(
+            self._op_get_preset_permissions,
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_preset_permission = Operation('POST', 'api/permission/import', response=dict[str, Any], body=lambda: m.PresetPermissionDefinition)
+
+    async def preset_permission(
+        self,
+        *,
+        body: m.PresetPermissionDefinition,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Пересоздать пермишены
+
+        POST /api/permission/import
+        """
+        return await self._call(
+            self._op_preset_permission,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_reload = Operation('POST', 'api/permission/reload', response=str)
+
+    async def reload(
+        self,
+        *,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Перезагрузить пермишены
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_PERMISSION
+
+        POST /api/permission/reload
+        """
+        return await self._call(
+            self._op_reload,
+            service_token=service_token,
+        )
+
+    _op_remove_role = Operation('DELETE', 'api/permission/{id}/role', response=str, body=lambda: m.IdUUID)
+
+    async def remove_role(
+        self,
+        id: UUID,
+        *,
+        body: m.IdUUID,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Удалить роль
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_PERMISSION
+
+        DELETE /api/permission/{id}/role
+        """
+        return await self._call(
+            self._op_remove_role,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_remove_roles = Operation('DELETE', 'api/permission/{id}/role/batch', response=str, body=lambda: m.IdsUUID)
+
+    async def remove_roles(
+        self,
+        id: UUID,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> str:
+        """
+        Удалить роль
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_PERMISSION
+
+        DELETE /api/permission/{id}/role/batch
+        """
+        return await self._call(
+            self._op_remove_roles,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_update = Operation('PUT', 'api/permission', response=lambda: m.PermissionDto, body=lambda: m.PermissionDto)
+
+    async def update(
+        self,
+        *,
+        body: m.PermissionDto,
+        service_token: Optional[str] = None,
+    ) -> m.PermissionDto:
+        """
+        Обновить запись
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_PERMISSION
+
+        PUT /api/permission
+        """
+        return await self._call(
+            self._op_update,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class VremennyeVlozheniiaDokumentaApi(ApiGroup):
+    """
+    Временные вложения документа
+    API для работы с вложения документа
+    """
+
+    _op_add_sign = Operation('PUT', 'api/temporary-attachment/{id}/mini-document/sign', body=lambda: m.SimpleCmsDTO)
+
+    async def add_sign(
+        self,
+        id: UUID,
+        *,
+        body: m.SimpleCmsDTO,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Прикрепить подпись ЭЦП
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_MINI_DOCUMENT
+
+        PUT /api/temporary-attachment/{id}/mini-document/sign
+        """
+        return await self._call(
+            self._op_add_sign,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_check_sign = Operation('POST', 'api/temporary-attachment/{id}/mini-document/verify-sign', response=dict[str, Any], body=lambda: m.CheckAttachmentSignRequest)
+
+    async def check_sign(
+        self,
+        id: UUID,
+        *,
+        body: m.CheckAttachmentSignRequest,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Проверить ЭЦП
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_MINI_DOCUMENT
+
+        POST /api/temporary-attachment/{id}/mini-document/verify-sign
+        """
+        return await self._call(
+            self._op_check_sign,
+            path={'id': id},
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete = Operation('DELETE', 'api/temporary-attachment', body=lambda: m.IdsUUID)
+
+    async def delete(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список временных вложений по ids из БД
+
+        DELETE /api/temporary-attachment
+        """
+        return await self._call(
+            self._op_delete,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_delete_full = Operation('DELETE', 'api/temporary-attachment/full', body=lambda: m.IdsUUID)
+
+    async def delete_full(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить список временных вложений по ids из БД и MINIO
+
+        DELETE /api/temporary-attachment/full
+        """
+        return await self._call(
+            self._op_delete_full,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_download_base64 = Operation('GET', 'api/temporary-attachment/{id}/mini-document/base64', binary=True)
+
+    def download_base64(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгрузить файл base64 из MinIO по uuid
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_MINI_DOCUMENT
+
+        GET /api/temporary-attachment/{id}/mini-document/base64
+        """
+        return self._stream(
+            self._op_download_base64,
+            path={'id': id},
+            service_token=service_token,
+            max_bytes=max_bytes,
+        )
+
+    _op_get = Operation('GET', 'api/temporary-attachment/{id}', response=lambda: m.TemporaryAttachmentDto)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.TemporaryAttachmentDto:
+        """
+        Получить временное вложение по id
+
+        GET /api/temporary-attachment/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_remove_sign = Operation('DELETE', 'api/temporary-attachment/{id}/mini-document/sign/{signId}', response=dict[str, Any])
+
+    async def remove_sign(
+        self,
+        id: UUID,
+        sign_id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Удалить подпись ЭЦП
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_MINI_DOCUMENT
+
+        DELETE /api/temporary-attachment/{id}/mini-document/sign/{signId}
+        """
+        return await self._call(
+            self._op_remove_sign,
+            path={'id': id, 'signId': sign_id},
+            service_token=service_token,
+        )
+
+    _op_upload_additional_attachment = Operation('POST', 'api/temporary-attachment/document/{documentId}/additional-attachment', multipart=True)
+
+    async def upload_additional_attachment(
+        self,
+        document_id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить файл в документ
+
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ADDITIONAL_ATTACHMENT, DOCUMENT_ADD_DOCUMENTS]
+
+        POST /api/temporary-attachment/document/{documentId}/additional-attachment
+        """
+        return await self._call(
+            self._op_upload_additional_attachment,
+            path={'documentId': document_id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_agreement_mini_document = Operation('POST', 'api/temporary-attachment/mini-document/agreement', multipart=True)
+
+    async def upload_file_agreement_mini_document(
+        self,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить временное вложение лист согласования для мини документа
+
+        POST /api/temporary-attachment/mini-document/agreement
+        """
+        return await self._call(
+            self._op_upload_file_agreement_mini_document,
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_attachment = Operation('POST', 'api/temporary-attachment/template', multipart=True)
+
+    async def upload_file_attachment(
+        self,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить временное вложение
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_TEMPLATE
+
+        POST /api/temporary-attachment/template
+        """
+        return await self._call(
+            self._op_upload_file_attachment,
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_attachment_additional_document = Operation('POST', 'api/temporary-attachment/additional-document/attachment', multipart=True)
+
+    async def upload_file_attachment_additional_document(
+        self,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить временное вложение для дополнительного документа договора
+
+        POST /api/temporary-attachment/additional-document/attachment
+        """
+        return await self._call(
+            self._op_upload_file_attachment_additional_document,
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_attachment_control_point = Operation('POST', 'api/temporary-attachment/control-point/attachment', multipart=True)
+
+    async def upload_file_attachment_control_point(
+        self,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить временное вложение для контрольной точки исполнения договора
+
+        POST /api/temporary-attachment/control-point/attachment
+        """
+        return await self._call(
+            self._op_upload_file_attachment_control_point,
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_attachment_document = Operation('POST', 'api/temporary-attachment/document/{documentId}', multipart=True)
+
+    async def upload_file_attachment_document(
+        self,
+        document_id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить временное вложение для документа
+
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ATTACHMENT, DOCUMENT_ADD_DOCUMENTS]
+
+        POST /api/temporary-attachment/document/{documentId}
+        """
+        return await self._call(
+            self._op_upload_file_attachment_document,
+            path={'documentId': document_id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_attachment_mini_document = Operation('POST', 'api/temporary-attachment/mini-document/attachment', multipart=True)
+
+    async def upload_file_attachment_mini_document(
+        self,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить временное вложение для мини документа
+
+        POST /api/temporary-attachment/mini-document/attachment
+        """
+        return await self._call(
+            self._op_upload_file_attachment_mini_document,
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_decision = Operation('POST', 'api/temporary-attachment/document/{documentId}/decision', multipart=True)
+
+    async def upload_file_decision(
+        self,
+        document_id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить файл в документ
+
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ATTACHMENT, DOCUMENT_ADD_DOCUMENTS]
+
+        POST /api/temporary-attachment/document/{documentId}/decision
+        """
+        return await self._call(
+            self._op_upload_file_decision,
+            path={'documentId': document_id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_documents_question = Operation('POST', 'api/temporary-attachment/document/{documentId}/documents-question', multipart=True)
+
+    async def upload_file_documents_question(
+        self,
+        document_id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить файл в документ
+
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ATTACHMENT, DOCUMENT_ADD_DOCUMENTS]
+
+        POST /api/temporary-attachment/document/{documentId}/documents-question
+        """
+        return await self._call(
+            self._op_upload_file_documents_question,
+            path={'documentId': document_id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_introduction_mini_document = Operation('POST', 'api/temporary-attachment/mini-document/introduction', multipart=True)
+
+    async def upload_file_introduction_mini_document(
+        self,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить временное вложение лист ознакомления для мини документа
+
+        POST /api/temporary-attachment/mini-document/introduction
+        """
+        return await self._call(
+            self._op_upload_file_introduction_mini_document,
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_print_document = Operation('POST', 'api/temporary-attachment/document/{documentId}/print-document', multipart=True)
+
+    async def upload_file_print_document(
+        self,
+        document_id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить файл в документ
+
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ATTACHMENT, DOCUMENT_ADD_DOCUMENTS]
+
+        POST /api/temporary-attachment/document/{documentId}/print-document
+        """
+        return await self._call(
+            self._op_upload_file_print_document,
+            path={'documentId': document_id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_project_solution = Operation('POST', 'api/temporary-attachment/document/{documentId}/project-solution', multipart=True)
+
+    async def upload_file_project_solution(
+        self,
+        document_id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить файл в документ
+
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ATTACHMENT, DOCUMENT_ADD_DOCUMENTS]
+
+        POST /api/temporary-attachment/document/{documentId}/project-solution
+        """
+        return await self._call(
+            self._op_upload_file_project_solution,
+            path={'documentId': document_id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_rationale = Operation('POST', 'api/temporary-attachment/document/{documentId}/rationale', multipart=True)
+
+    async def upload_file_rationale(
+        self,
+        document_id: UUID,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить файл в документ
+
+        Для доступа к этому API необходимо: [DOCUMENT_UPDATE_ATTACHMENT, DOCUMENT_ADD_DOCUMENTS]
+
+        POST /api/temporary-attachment/document/{documentId}/rationale
+        """
+        return await self._call(
+            self._op_upload_file_rationale,
+            path={'documentId': document_id},
+            body=files,
+            service_token=service_token,
+        )
+
+    _op_upload_file_rkk_mini_document = Operation('POST', 'api/temporary-attachment/mini-document/rkk', multipart=True)
+
+    async def upload_file_rkk_mini_document(
+        self,
+        *,
+        files: Any | None = None,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Загрузить временное вложение РКК для мини документа
+
+        POST /api/temporary-attachment/mini-document/rkk
+        """
+        return await self._call(
+            self._op_upload_file_rkk_mini_document,
+            body=files,
+            service_token=service_token,
+        )
+
+
+class ZhurnalyRegistratsiiApi(ApiGroup):
+    """
+    Журналы регистрации
+    API для работы с журналами регистрации
+    Константы для получения истории: REG_JOURNAL
+    """
+
+    _op_get = Operation('GET', 'api/reg-journal/{id}', response=lambda: m.RegistrationJournal)
+
+    async def get(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> m.RegistrationJournal:
+        """
+        Получить журнал регистрации по id
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_REGISTRATION_JOURNAL
+
+        GET /api/reg-journal/{id}
+        """
+        return await self._call(
+            self._op_get,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_get_collection = Operation('GET', 'api/reg-journal', response=lambda: m.RegistrationJournal)
+
+    async def get_collection(
+        self,
+        *,
+        request: m.BasicSearchRequest,
+        pageable: m.Pageable,
+        service_token: Optional[str] = None,
+    ) -> m.RegistrationJournal:
+        """
+        Получить список журналов регистрации
+
+        Для доступа к этому API необходимо: Требуется право доступа: READ_REGISTRATION_JOURNAL
+
+        GET /api/reg-journal
+        """
+        return await self._call(
+            self._op_get_collection,
+            query={'request': request, 'pageable': pageable},
+            service_token=service_token,
+        )
+
+    _op_mark_delete = Operation('DELETE', 'api/reg-journal/{id}')
+
+    async def mark_delete(
+        self,
+        id: UUID,
+        *,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить журнал регистрации
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_REGISTRATION_JOURNAL
+
+        DELETE /api/reg-journal/{id}
+        """
+        return await self._call(
+            self._op_mark_delete,
+            path={'id': id},
+            service_token=service_token,
+        )
+
+    _op_mark_delete_list = Operation('DELETE', 'api/reg-journal', body=lambda: m.IdsUUID)
+
+    async def mark_delete_list(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> None:
+        """
+        Удалить журналы регистрации по ids
+
+        Для доступа к этому API необходимо: Требуется право доступа: DELETE_REGISTRATION_JOURNAL
+
+        DELETE /api/reg-journal
+        """
+        return await self._call(
+            self._op_mark_delete_list,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_post = Operation('POST', 'api/reg-journal', response=lambda: m.RegistrationJournal, body=lambda: m.RegistrationJournal)
+
+    async def post(
+        self,
+        *,
+        body: m.RegistrationJournal,
+        service_token: Optional[str] = None,
+    ) -> m.RegistrationJournal:
+        """
+        Создать новый журнал регистрации
+
+        Для доступа к этому API необходимо: Требуется право доступа: CREATE_REGISTRATION_JOURNAL
+
+        POST /api/reg-journal
+        """
+        return await self._call(
+            self._op_post,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_put = Operation('PUT', 'api/reg-journal', response=lambda: m.RegistrationJournal, body=lambda: m.RegistrationJournal)
+
+    async def put(
+        self,
+        *,
+        body: m.RegistrationJournal,
+        service_token: Optional[str] = None,
+    ) -> m.RegistrationJournal:
+        """
+        Изменить журнал регистрации
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_REGISTRATION_JOURNAL
+
+        PUT /api/reg-journal
+        """
+        return await self._call(
+            self._op_put,
+            body=body,
+            service_token=service_token,
+        )
+
+    _op_reset_counter = Operation('PUT', 'api/reg-journal/reset-counter', response=lambda: m.RegistrationJournal, body=lambda: m.IdsUUID)
+
+    async def reset_counter(
+        self,
+        *,
+        body: m.IdsUUID,
+        service_token: Optional[str] = None,
+    ) -> m.RegistrationJournal:
+        """
+        Обнулить счетчик журнала регистрации
+
+        Для доступа к этому API необходимо: Требуется право доступа: UPDATE_REGISTRATION_JOURNAL
+
+        PUT /api/reg-journal/reset-counter
+        """
+        return await self._call(
+            self._op_reset_counter,
+            body=body,
+            service_token=service_token,
+        )
+
+
+class EDMSApi:
+    """Все операции EDMS, сгруппированные по тегам OpenAPI."""
+
+    def __init__(self, transport: DocumentClient):
+        self.ad_config_controller = AdConfigControllerApi(transport)
+        self.adresaty_korrespondenty = AdresatyKorrespondentyApi(transport)
+        self.aismv_cert_info_controller = AismvCertInfoControllerApi(transport)
+        self.aismv_org_package_controller = AismvOrgPackageControllerApi(transport)
+        self.aismv_recycle_settings_controller = AismvRecycleSettingsControllerApi(transport)
+        self.akt_ob_unichtozhenii_del = AktObUnichtozheniiDelApi(transport)
+        self.archive_registration_controller = ArchiveRegistrationControllerApi(transport)
+        self.arkhivnye_fondy = ArkhivnyeFondyApi(transport)
+        self.atributnye_sertifikaty_sotrudnika = AtributnyeSertifikatySotrudnikaApi(transport)
+        self.attachi_dokumenta = AttachiDokumentaApi(transport)
+        self.avtorizatsiia = AvtorizatsiiaApi(transport)
+        self.basic_user_account_controller = BasicUserAccountControllerApi(transport)
+        self.bpmn_process_directory_controller = BpmnProcessDirectoryControllerApi(transport)
+        self.departamenty = DepartamentyApi(transport)
+        self.dokument = DokumentApi(transport)
+        self.dolzhnosti = DolzhnostiApi(transport)
+        self.dopolnitelnoe_soglasovanie = DopolnitelnoeSoglasovanieApi(transport)
+        self.dopolnitelnyi_dokument_dogovora = DopolnitelnyiDokumentDogovoraApi(transport)
+        self.dostup_k_mini_dokumentam = DostupKMiniDokumentamApi(transport)
+        self.eksport_kalendaria_v_formate_ics = EksportKalendariaVFormateIcsApi(transport)
+        self.employee_authorization_audit_controller = EmployeeAuthorizationAuditControllerApi(transport)
+        self.entity_history_controller = EntityHistoryControllerApi(transport)
+        self.error_history_controller = ErrorHistoryControllerApi(transport)
+        self.formy_dokumentov = FormyDokumentovApi(transport)
+        self.goroda = GorodaApi(transport)
+        self.grify_dostupa = GrifyDostupaApi(transport)
+        self.gruppy_adresatov_korrespondentov = GruppyAdresatovKorrespondentovApi(transport)
+        self.gruppy_polzovatelei = GruppyPolzovateleiApi(transport)
+        self.iazyki_dokumentov = IazykiDokumentovApi(transport)
+        self.import_eksport = ImportEksportApi(transport)
+        self.info_controller = InfoControllerApi(transport)
+        self.informatsionnye_paneli_deistvii_polzovatelia = InformatsionnyePaneliDeistviiPolzovateliaApi(transport)
+        self.inner_inventory_data_controller = InnerInventoryDataControllerApi(transport)
+        self.integration_config_controller = IntegrationConfigControllerApi(transport)
+        self.kalendar_rabochikh_dnei = KalendarRabochikhDneiApi(transport)
+        self.kolichestvo_dannykh = KolichestvoDannykhApi(transport)
+        self.kommentarii_k_dokumentu = KommentariiKDokumentuApi(transport)
+        self.kontaktnye_litsa_dlia_korrespondentov = KontaktnyeLitsaDliaKorrespondentovApi(transport)
+        self.kontrolnye_tochki_ispolneniia_dogovora = KontrolnyeTochkiIspolneniiaDogovoraApi(transport)
+        self.kontury_sed = KonturySedApi(transport)
+        self.lichnye_papki_v2 = LichnyePapkiV2Api(transport)
+        self.lichnyi_kalendar_polzovatelia = LichnyiKalendarPolzovateliaApi(transport)
+        self.logirovanie_sobytii = LogirovanieSobytiiApi(transport)
+        self.migratsiia = MigratsiiaApi(transport)
+        self.mini_dokument = MiniDokumentApi(transport)
+        self.napominaniia = NapominaniiaApi(transport)
+        self.nastroechnyi_spravochnik_modulia = NastroechnyiSpravochnikModuliaApi(transport)
+        self.nastroika_dlia_migratsii_dokumentov_spravochnikov = NastroikaDliaMigratsiiDokumentovSpravochnikovApi(transport)
+        self.nastroika_dokumenta_raspoznavaniia = NastroikaDokumentaRaspoznavaniiaApi(transport)
+        self.nastroika_pochty = NastroikaPochtyApi(transport)
+        self.nastroika_shablonov_rkk_po_umolchaniiu = NastroikaShablonovRkkPoUmolchaniiuApi(transport)
+        self.nastroiki_ais_mv = NastroikiAisMvApi(transport)
+        self.nastroiki_ais_mv_ais_mv_api = NastroikiAisMvAisMvApiApi(transport)
+        self.nastroiki_ais_mv_skhema_formata_obmena = NastroikiAisMvSkhemaFormataObmenaApi(transport)
+        self.nastroiki_ais_mv_spravochnik_organizatsii_abonentov = NastroikiAisMvSpravochnikOrganizatsiiAbonentovApi(transport)
+        self.nastroiki_ais_mv_spravochnik_tipov_failov = NastroikiAisMvSpravochnikTipovFailovApi(transport)
+        self.nastroiki_ais_mv_spravochnik_vidov_dokumentov = NastroikiAisMvSpravochnikVidovDokumentovApi(transport)
+        self.nastroiki_ais_mv_spravochnik_vidov_vedomstvennykh_sed = NastroikiAisMvSpravochnikVidovVedomstvennykhSedApi(transport)
+        self.nastroiki_otobrazheniia = NastroikiOtobrazheniiaApi(transport)
+        self.nomenklatura_del_kartochka_dela = NomenklaturaDelKartochkaDelaApi(transport)
+        self.nomenklaturnye_stellazhi_i_polki = NomenklaturnyeStellazhiIPolkiApi(transport)
+        self.nomenklatury_del_podrazdeleniia = NomenklaturyDelPodrazdeleniiaApi(transport)
+        self.obekt_investprogrammy = ObektInvestprogrammyApi(transport)
+        self.oblasti = OblastiApi(transport)
+        self.obshchaia_nastroika_dokumenta_sed = ObshchaiaNastroikaDokumentaSedApi(transport)
+        self.opis_strukturnykh_podrazdelenii_opis_sp = OpisStrukturnykhPodrazdeleniiOpisSpApi(transport)
+        self.otchety = OtchetyApi(transport)
+        self.ott_controller = OttControllerApi(transport)
+        self.otvetstvennye_za_podgotovku_materialov = OtvetstvennyeZaPodgotovkuMaterialovApi(transport)
+        self.oznakomlenie = OznakomlenieApi(transport)
+        self.pechat_dokumentov = PechatDokumentovApi(transport)
+        self.pechat_dostupa = PechatDostupaApi(transport)
+        self.pechat_kalendaria = PechatKalendariaApi(transport)
+        self.pechat_po_nomenklature_del = PechatPoNomenklatureDelApi(transport)
+        self.pechat_rolei = PechatRoleiApi(transport)
+        self.personalnye_nastroiki_polzovatelia = PersonalnyeNastroikiPolzovateliaApi(transport)
+        self.polnotekstovyi_poisk = PolnotekstovyiPoiskApi(transport)
+        self.polzovatelskie_konfiguratsii_otcheta = PolzovatelskieKonfiguratsiiOtchetaApi(transport)
+        self.porucheniia = PorucheniiaApi(transport)
+        self.porucheniia_dokumenty_ispolneniia = PorucheniiaDokumentyIspolneniiaApi(transport)
+        self.porucheniia_kontrol = PorucheniiaKontrolApi(transport)
+        self.porucheniia_perenos_sroka_ispolneniia = PorucheniiaPerenosSrokaIspolneniiaApi(transport)
+        self.poslednie_otkrytye_dokumenty = PoslednieOtkrytyeDokumentyApi(transport)
+        self.proekty_porucheniia = ProektyPorucheniiaApi(transport)
+        self.proekty_porucheniia_v_dokumente = ProektyPorucheniiaVDokumenteApi(transport)
+        self.profili_dokumenta = ProfiliDokumentaApi(transport)
+        self.protsessy_dokumenta = ProtsessyDokumentaApi(transport)
+        self.raiony = RaionyApi(transport)
+        self.reestr_polei_form = ReestrPoleiFormApi(transport)
+        self.rezultat_resheniia = RezultatResheniiaApi(transport)
+        self.roli_polzovatelei = RoliPolzovateleiApi(transport)
+        self.sertifikaty_sotrudnika = SertifikatySotrudnikaApi(transport)
+        self.shablony_dogovorov = ShablonyDogovorovApi(transport)
+        self.shablony_pechatnykh_form = ShablonyPechatnykhFormApi(transport)
+        self.shablony_pechatnykh_form_nomenklaturnykh_del = ShablonyPechatnykhFormNomenklaturnykhDelApi(transport)
+        self.smdo_doc_type_controller = SmdoDocTypeControllerApi(transport)
+        self.smdo_file_type_controller = SmdoFileTypeControllerApi(transport)
+        self.smdo_sed_type_controller = SmdoSedTypeControllerApi(transport)
+        self.smdo_subscriber_controller = SmdoSubscriberControllerApi(transport)
+        self.sokhranennye_filtry_dokumenta_dlia_rasshirennogo_poiska = SokhranennyeFiltryDokumentaDliaRasshirennogoPoiskaApi(transport)
+        self.sotrudniki = SotrudnikiApi(transport)
+        self.sotrudniki_io = SotrudnikiIoApi(transport)
+        self.sposoby_dostavki = SposobyDostavkiApi(transport)
+        self.spravochnik_marshrutov = SpravochnikMarshrutovApi(transport)
+        self.srok_khraneniia = SrokKhraneniiaApi(transport)
+        self.ssylki_na_dokument = SsylkiNaDokumentApi(transport)
+        self.statistika_dlia_polzovatelia = StatistikaDliaPolzovateliaApi(transport)
+        self.strany = StranyApi(transport)
+        self.svodnaia_opis_del = SvodnaiaOpisDelApi(transport)
+        self.svodnye_nomenklatury_del = SvodnyeNomenklaturyDelApi(transport)
+        self.tematika = TematikaApi(transport)
+        self.tipovye_kontrolnye_tochki = TipovyeKontrolnyeTochkiApi(transport)
+        self.tipovye_kratkie_soderzhaniia = TipovyeKratkieSoderzhaniiaApi(transport)
+        self.tipovye_kratkie_soderzhaniia_porucheniia = TipovyeKratkieSoderzhaniiaPorucheniiaApi(transport)
+        self.tipy_dokumentov = TipyDokumentovApi(transport)
+        self.tipy_kontrolia = TipyKontroliaApi(transport)
+        self.usd = UsdApi(transport)
+        self.user_ad_account_controller = UserAdAccountControllerApi(transport)
+        self.user_home_dashboard_controller = UserHomeDashboardControllerApi(transport)
+        self.user_home_dashboard_todolist_controller = UserHomeDashboardTodolistControllerApi(transport)
+        self.uvedomleniia = UvedomleniiaApi(transport)
+        self.uvedomleniia_polzovatelia = UvedomleniiaPolzovateliaApi(transport)
+        self.valiuty = ValiutyApi(transport)
+        self.vid_obrashchenii = VidObrashcheniiApi(transport)
+        self.vidy_dop_dokumentov = VidyDopDokumentovApi(transport)
+        self.vnutrennie_priglashennye = VnutrenniePriglashennyeApi(transport)
+        self.vozmozhnosti_polzovatelia = VozmozhnostiPolzovateliaApi(transport)
+        self.vremennye_vlozheniia_dokumenta = VremennyeVlozheniiaDokumentaApi(transport)
+        self.zhurnaly_registratsii = ZhurnalyRegistratsiiApi(transport)
+
+
+# Глобальный экземпляр
+edms_api = EDMSApi(document_client)
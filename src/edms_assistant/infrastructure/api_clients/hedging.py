@@ -0,0 +1,166 @@
+# src/edms_assistant/infrastructure/api_clients/hedging.py
+"""
+Хеджирование GET-запросов к EDMS.
+
+Если ответ на GET не пришёл за время, обычно достаточное для этого эндпоинта
+(перцентиль недавних задержек), отправляется второй такой же запрос, и используется
+тот ответ, что пришёл первым; второй запрос отменяется. Так «хвост» задержек
+бэкенда (p99 намного больше медианы) не попадает в ответ пользователю.
+
+Дополнительная нагрузка ограничена бюджетом: каждый запрос пополняет его на
+budget_ratio, каждый хедж тратит единицу, поэтому хеджей не больше budget_ratio
+от общего числа запросов, даже если EDMS медленный целиком.
+"""
+import asyncio
+import logging
+import re
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+import httpx
+
+from src.edms_assistant.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+UUID_SEGMENT = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+
+# Сколько неизрасходованных хеджей может накопиться в бюджете
+MAX_BUDGET = 10.0
+
+
+def route_of(url: str) -> str:
+    """Маршрут запроса для статистики задержек: путь с идентификаторами, заменёнными на '*'."""
+    return UUID_SEGMENT.sub("*", httpx.URL(url).path)
+
+
+class RequestHedger:
+    """
+    Хеджирование запросов с задержкой по перцентилю и ограниченным бюджетом.
+
+    - `run()` выполняет send(), при необходимости дублируя запрос
+    - `hedge_delay()` — задержка перед хеджем для маршрута (None — хедж не выполняется)
+    - `stats()` — число хеджей, их выигрыши и остаток бюджета
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        percentile: float,
+        min_delay: float,
+        max_delay: float,
+        budget_ratio: float,
+        window: int = 200,
+        min_samples: int = 20,
+    ):
+        self.enabled = enabled
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.budget_ratio = budget_ratio
+        self.window = window
+        self.min_samples = min_samples
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._budget = 0.0
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._budget_exhausted = 0
+
+    def hedge_delay(self, route: str) -> Optional[float]:
+        """Перцентиль недавних задержек маршрута; пока замеров мало, хедж не выполняется."""
+        samples = self._latencies.get(route)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(int(len(ordered) * self.percentile / 100), len(ordered) - 1)
+        return min(max(ordered[index], self.min_delay), self.max_delay)
+
+    def _record(self, route: str, latency: float) -> None:
+        samples = self._latencies.get(route)
+        if samples is None:
+            samples = self._latencies[route] = deque(maxlen=self.window)
+        samples.append(latency)
+
+    def _take_budget(self) -> bool:
+        if self._budget < 1.0:
+            self._budget_exhausted += 1
+            return False
+        self._budget -= 1.0
+        return True
+
+    async def run(self, url: str, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Выполняет идемпотентный запрос; возвращает первый полученный ответ."""
+        if not self.enabled:
+            return await send()
+
+        self._requests += 1
+        self._budget = min(self._budget + self.budget_ratio, MAX_BUDGET)
+        route = route_of(url)
+        started = time.monotonic()
+
+        primary = asyncio.ensure_future(send())
+        delay = self.hedge_delay(route)
+        if delay is not None:
+            try:
+                done, _ = await asyncio.wait({primary}, timeout=delay)
+            except asyncio.CancelledError:
+                primary.cancel()
+                raise
+            if not done and self._take_budget():
+                self._hedged += 1
+                logger.debug(f"RequestHedger: no response for {route} after {delay:.3f}s, sending hedge")
+                return await self._race(route, started, primary, asyncio.ensure_future(send()))
+
+        response = await primary
+        self._record(route, time.monotonic() - started)
+        return response
+
+    async def _race(
+        self, route: str, started: float, primary: asyncio.Future, hedge: asyncio.Future
+    ) -> httpx.Response:
+        """Ждёт первый успешный ответ из двух; проигравший запрос отменяется."""
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        continue
+                    if task is hedge:
+                        self._hedge_wins += 1
+                    self._record(route, time.monotonic() - started)
+                    return task.result()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "requests": self._requests,
+            "hedged": self._hedged,
+            "hedge_rate": round(self._hedged / self._requests, 4) if self._requests else 0.0,
+            "hedge_wins": self._hedge_wins,
+            "budget": round(self._budget, 2),
+            "budget_exhausted": self._budget_exhausted,
+            "delays": {
+                route: round(delay, 3)
+                for route in self._latencies
+                if (delay := self.hedge_delay(route)) is not None
+            },
+        }
+
+
+# Глобальный экземпляр
+edms_hedger = RequestHedger(
+    enabled=settings.hedging.enabled,
+    percentile=settings.hedging.percentile,
+    min_delay=settings.hedging.min_delay,
+    max_delay=settings.hedging.max_delay,
+    budget_ratio=settings.hedging.budget_ratio,
+)
@@ -0,0 +1,145 @@
+# src/edms_assistant/infrastructure/api_clients/http_pool.py
+"""
+Общий пул HTTP-соединений к EDMS.
+
+Один httpx.AsyncClient на процесс: соединения (TCP/TLS) переиспользуются всеми
+запросами к EDMS, а токен передаётся в заголовках каждого запроса, поэтому пул не
+привязан к пользователю. Открывается и закрывается в lifespan FastAPI; вне lifespan
+(фоновые скрипты) создаётся лениво при первом запросе.
+"""
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+from src.edms_assistant.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class EDMSHttpPool:
+    """
+    Владелец общего httpx.AsyncClient.
+
+    - `startup()/shutdown()` открывают и закрывают пул (вызываются из lifespan)
+    - `request()/stream()` выполняют запрос через пул, считая занятость соединений
+    - `stats()` возвращает метрики использования пула
+    """
+
+    def __init__(
+        self,
+        timeout: float,
+        max_connections: int,
+        max_keepalive_connections: int,
+        keepalive_expiry: float,
+        http2: bool = False,
+    ):
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self._client: Optional[httpx.AsyncClient] = None
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._requests = 0
+        self._errors = 0
+
+    def _create_client(self) -> httpx.AsyncClient:
+        http2 = self.http2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("EDMSHttpPool: http2 requested but 'h2' is not installed, using HTTP/1.1")
+                http2 = False
+        logger.info(
+            f"EDMSHttpPool: opening pool (max_connections={self.limits.max_connections}, "
+            f"keepalive={self.limits.max_keepalive_connections}, http2={http2})"
+        )
+        return httpx.AsyncClient(timeout=self.timeout, limits=self.limits, http2=http2)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+
+    async def startup(self) -> None:
+        """Открывает пул при старте приложения."""
+        _ = self.client
+
+    async def shutdown(self) -> None:
+        """Закрывает все соединения пула."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info(f"EDMSHttpPool: closed after {self._requests} requests")
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Выполняет запрос через общий пул."""
+        self._requests += 1
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        try:
+            return await self.client.request(method, url, **kwargs)
+        except httpx.RequestError:
+            self._errors += 1
+            raise
+        finally:
+            self._in_flight -= 1
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """Потоковый запрос: тело ответа читается блоками, соединение занято до выхода из контекста."""
+        self._requests += 1
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        try:
+            async with self.client.stream(method, url, **kwargs) as response:
+                yield response
+        except httpx.RequestError:
+            self._errors += 1
+            raise
+        finally:
+            self._in_flight -= 1
+
+    def _connection_stats(self) -> Dict[str, int]:
+        """Состояние соединений httpcore (внутренний API, поэтому защищённо)."""
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is None:
+            return {}
+        idle = sum(1 for c in connections if c.is_idle())
+        return {"connections": len(connections), "idle": idle, "active": len(connections) - idle}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "open": self._client is not None and not self._client.is_closed,
+            "http2": self.http2,
+            "requests": self._requests,
+            "errors": self._errors,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "utilization": round(self._in_flight / self.limits.max_connections, 3)
+            if self.limits.max_connections else None,
+            "limits": {
+                "max_connections": self.limits.max_connections,
+                "max_keepalive_connections": self.limits.max_keepalive_connections,
+                "keepalive_expiry": self.limits.keepalive_expiry,
+            },
+            **self._connection_stats(),
+        }
+
+
+# Глобальный экземпляр
+edms_http_pool = EDMSHttpPool(
+    timeout=settings.edms.timeout,
+    max_connections=settings.edms.max_connections,
+    max_keepalive_connections=settings.edms.max_keepalive_connections,
+    keepalive_expiry=settings.edms.keepalive_expiry,
+    http2=settings.edms.http2,
+)
@@ -0,0 +1,81 @@
+# src/edms_assistant/infrastructure/api_clients/model_adapters.py
+"""
+Разбор ответов EDMS в модели resources_openapi прямо из байтов.
+
+pydantic-core разбирает JSON и валидирует модель за один проход, без
+промежуточного dict (в отличие от `Model(**response.json())`). TypeAdapter
+строится один раз на тип и переиспользуется.
+
+Проекция (include) оставляет в ответе только нужные поля: валидируется модель-срез
+с одними выбранными полями верхнего уровня (остальное тело только разбирается), а в
+dict попадают лишь выбранные поддеревья.
+"""
+import json
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, create_model
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp: Type[T]) -> TypeAdapter[T]:
+    """TypeAdapter для типа (модели, list[Model] и т.п.), создаётся один раз."""
+    return TypeAdapter(tp)
+
+
+def validate_json(tp: Type[T], content: bytes) -> T:
+    """
+    Валидирует ответ из байтов.
+
+    Raises:
+        pydantic.ValidationError: тело не соответствует схеме.
+    """
+    return type_adapter(tp).validate_json(content)
+
+
+@lru_cache(maxsize=None)
+def projection_model(model: Type[BaseModel], fields: FrozenSet[str]) -> Type[BaseModel]:
+    """Модель-срез: только поля fields модели model (лишние ключи JSON игнорируются)."""
+    # Модели собираются отложенно (defer_build): типы полей нужны уже разрешёнными
+    model.model_rebuild()
+    return create_model(
+        f"{model.__name__}Projection",
+        **{name: (model.model_fields[name].annotation, None) for name in sorted(fields) if name in model.model_fields},
+    )
+
+
+def project(data: Any, include: Optional[Mapping[str, Any]]) -> Any:
+    """Проекция уже разобранного JSON по спецификации include в формате pydantic."""
+    if include is None or include is True:
+        return data
+    if isinstance(data, list):
+        return [project(item, include.get("__all__", include) if isinstance(include, Mapping) else include) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if not isinstance(include, Mapping):
+        include = dict.fromkeys(include, True)
+    return {key: project(data[key], sub) for key, sub in include.items() if key in data}
+
+
+def to_payload(
+    content: bytes,
+    model: Type[BaseModel],
+    trusted: bool = False,
+    include: Optional[Mapping[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    JSON-совместимый dict ответа для инструментов.
+
+    trusted=True — доверенный режим: тело только разбирается как JSON, без проверки
+    схемы. Иначе тело валидируется моделью и сериализуется обратно (только заданные
+    поля), как раньше делал инструмент. include — проекция: в dict попадают только
+    указанные поля (формат include из pydantic: {"author": {"lastName"}, "status": True}).
+    """
+    if trusted:
+        return project(json.loads(content), include)
+    if include is None:
+        return validate_json(model, content).model_dump(mode="json", exclude_unset=True)
+    view = projection_model(model, frozenset(include))
+    return validate_json(view, content).model_dump(mode="json", exclude_unset=True, include=include)
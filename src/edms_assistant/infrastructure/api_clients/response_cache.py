@@ -0,0 +1,207 @@
+# src/edms_assistant/infrastructure/api_clients/response_cache.py
+"""
+Кэш ответов GET-эндпоинтов EDMS.
+
+- TTL задаётся на эндпоинт шаблоном пути (`*` — один сегмент); эндпоинты без
+  правила не кэшируются
+- после истечения TTL запрос уходит с If-None-Match / If-Modified-Since, и ответ
+  304 продлевает запись без повторной передачи тела
+- записи ограничены по количеству и объёму и вытесняются по LRU
+- одновременные промахи по одному ключу выполняют один запрос (защита от stampede)
+- ключ включает область видимости токена, поэтому права вызывающих не смешиваются
+- записи документа сбрасываются после его изменения (`invalidate_document`)
+"""
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Pattern, Tuple
+
+import httpx
+
+from src.edms_assistant.config.settings import settings
+from src.edms_assistant.infrastructure.api_clients.single_flight import FlightKey, SingleFlight
+
+logger = logging.getLogger(__name__)
+
+DOCUMENT_ID_PATTERN = re.compile(r"api/document/([0-9a-fA-F-]{36})(?:/|$)")
+
+# Заголовки ответа, которые имеет смысл хранить вместе с телом
+STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+ConditionalSend = Callable[[Dict[str, str]], Awaitable[httpx.Response]]
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    content: bytes
+    headers: Dict[str, str]
+    ttl: float
+    document_id: Optional[str] = None
+    stored_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() - self.stored_at <= self.ttl
+
+    def validators(self) -> Dict[str, str]:
+        """Заголовки условного запроса для ревалидации записи."""
+        conditional = {}
+        if "etag" in self.headers:
+            conditional["If-None-Match"] = self.headers["etag"]
+        if "last-modified" in self.headers:
+            conditional["If-Modified-Since"] = self.headers["last-modified"]
+        return conditional
+
+    def to_response(self) -> httpx.Response:
+        """Новый объект ответа на каждый вызов: вызывающие разбирают тело независимо."""
+        return httpx.Response(
+            200, headers=self.headers, content=self.content, request=httpx.Request("GET", self.url)
+        )
+
+
+def _compile_rule(pattern: str) -> Pattern[str]:
+    parts = [r"[^/]+" if part == "*" else re.escape(part) for part in pattern.strip("/").split("/")]
+    return re.compile("/".join(parts))
+
+
+class ResponseCache:
+    """
+    LRU-кэш ответов с TTL по эндпоинтам и условной ревалидацией.
+
+    - `ttl_for()` — TTL для пути запроса (None — не кэшировать)
+    - `fetch()` — ответ из кэша или через send() с ревалидацией и сохранением
+    - `invalidate_document()` — удаляет записи, относящиеся к документу
+    """
+
+    def __init__(self, ttls: Dict[str, float], max_entries: int, max_bytes: int, enabled: bool = True):
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._rules: List[Tuple[Pattern[str], float]] = [
+            (_compile_rule(pattern), ttl) for pattern, ttl in ttls.items()
+        ]
+        self._entries: "OrderedDict[FlightKey, CachedResponse]" = OrderedDict()
+        self._total_bytes = 0
+        self._refreshes = SingleFlight()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._revalidated = 0
+        self._invalidations = 0
+        self._evictions = 0
+
+    def ttl_for(self, url: str) -> Optional[float]:
+        """Первое подходящее правило побеждает; TTL 0 отключает кэширование эндпоинта."""
+        if not self.enabled:
+            return None
+        path = httpx.URL(url).path.strip("/")
+        for rule, ttl in self._rules:
+            if rule.fullmatch(path):
+                return ttl or None
+        return None
+
+    async def fetch(self, key: FlightKey, url: str, ttl: float, send: ConditionalSend) -> httpx.Response:
+        """
+        Возвращает ответ на GET url.
+
+        Args:
+            key: Ключ записи (область токена, метод, URL, параметры).
+            url: Полный URL запроса.
+            ttl: Время свежести записи, сек.
+            send: Выполняет запрос с дополнительными (условными) заголовками.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry.is_fresh:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry.to_response()
+        return await self._refreshes.do(key, lambda: self._refresh(key, url, ttl, send))
+
+    async def _refresh(self, key: FlightKey, url: str, ttl: float, send: ConditionalSend) -> httpx.Response:
+        entry = self._entries.get(key)
+        generation = self._generation
+        response = await send(entry.validators() if entry is not None else {})
+
+        # Документ мог измениться, пока шёл запрос, — такой ответ не сохраняем
+        invalidated = generation != self._generation
+
+        if response.status_code == 304 and entry is not None:
+            self._revalidated += 1
+            if not invalidated and self._entries.get(key) is entry:
+                entry.stored_at = time.monotonic()
+                self._entries.move_to_end(key)
+            return entry.to_response()
+
+        self._misses += 1
+        cache_control = response.headers.get("cache-control", "").lower()
+        if response.status_code == 200 and "no-store" not in cache_control and not invalidated:
+            await response.aread()
+            self._store(key, CachedResponse(
+                url=url,
+                content=response.content,
+                headers={h: response.headers[h] for h in STORED_HEADERS if h in response.headers},
+                ttl=ttl,
+                document_id=self._document_id(url),
+            ))
+        else:
+            self._remove(key)
+        return response
+
+    @staticmethod
+    def _document_id(url: str) -> Optional[str]:
+        match = DOCUMENT_ID_PATTERN.search(url)
+        return match.group(1).lower() if match else None
+
+    def _store(self, key: FlightKey, entry: CachedResponse) -> None:
+        if len(entry.content) > self.max_bytes:
+            return
+        self._remove(key)
+        self._entries[key] = entry
+        self._total_bytes += len(entry.content)
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+            _, victim = self._entries.popitem(last=False)
+            self._total_bytes -= len(victim.content)
+            self._evictions += 1
+
+    def _remove(self, key: FlightKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= len(entry.content)
+
+    def invalidate_document(self, document_id: Any) -> None:
+        """Удаляет ответы, относящиеся к документу, для всех токенов."""
+        document_id = str(document_id).lower()
+        self._generation += 1
+        stale = [key for key, entry in self._entries.items() if entry.document_id == document_id]
+        for key in stale:
+            self._remove(key)
+        if stale:
+            self._invalidations += 1
+            logger.info(f"ResponseCache: invalidated {len(stale)} responses for document {document_id}")
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._hits + self._misses + self._revalidated
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "revalidated": self._revalidated,
+            "hit_rate": round((self._hits + self._revalidated) / lookups, 3) if lookups else 0.0,
+            "coalesced_refreshes": self._refreshes.stats()["coalesced"],
+            "invalidations": self._invalidations,
+            "evictions": self._evictions,
+        }
+
+
+# Глобальный экземпляр
+edms_response_cache = ResponseCache(
+    ttls=settings.response_cache.ttls,
+    max_entries=settings.response_cache.max_entries,
+    max_bytes=settings.response_cache.max_size_mb * 1024 * 1024,
+    enabled=settings.response_cache.enabled,
+)
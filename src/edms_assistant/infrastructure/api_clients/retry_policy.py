@@ -0,0 +1,266 @@
+# src/edms_assistant/infrastructure/api_clients/retry_policy.py
+"""
+Политика повторов запросов к EDMS и circuit breaker по хостам.
+
+- повторяются только временные сбои: ошибки соединения/таймауты и ответы 5xx/429;
+  ответы 4xx (нет документа, нет прав, неверный запрос) возвращаются сразу
+- неидемпотентные запросы (POST, PATCH) повторяются только если запрос заведомо не
+  дошёл до сервера (не удалось установить соединение), чтобы не выполнить операцию дважды
+- пауза между попытками — decorrelated jitter; Retry-After сервера соблюдается, а если
+  он больше max_delay, повтор не выполняется
+- circuit breaker на хост: после серии сбоев подряд запросы к хосту сразу завершаются
+  ошибкой CircuitOpenError, пока не пройдёт reset_timeout и пробный запрос не окажется успешным
+"""
+import asyncio
+import email.utils
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+
+from src.edms_assistant.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Ошибки, при которых запрос гарантированно не был отправлен серверу
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(httpx.RequestError):
+    """Хост EDMS временно считается недоступным — запрос не отправлялся."""
+
+    def __init__(self, host: str, retry_in: float, request: Optional[httpx.Request] = None):
+        super().__init__(f"EDMS host {host} is unavailable (circuit open, retry in {retry_in:.0f}s)", request=request)
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    Состояние доступности одного хоста.
+
+    closed — запросы идут как обычно; open — запросы отклоняются до истечения
+    reset_timeout; half_open — пропускается один пробный запрос, его исход
+    закрывает или снова открывает цепь.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, host: str, failure_threshold: int, reset_timeout: float):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.opened = 0
+        self.rejected = 0
+
+    def retry_in(self) -> float:
+        return max(self.reset_timeout - (time.monotonic() - self._opened_at), 0.0)
+
+    def allow(self) -> bool:
+        """Можно ли отправить запрос сейчас."""
+        if self.state == self.OPEN and self.retry_in() == 0:
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            logger.info(f"CircuitBreaker: {self.host} recovered, closing circuit")
+        self.state = self.CLOSED
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """
+        Пробный запрос завершился без результата (отменён или упал не на транспорте):
+        цепь остаётся полуоткрытой, следующий запрос станет новым пробным.
+        """
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.opened += 1
+                logger.warning(
+                    f"CircuitBreaker: opening circuit for {self.host} after {self._failures} failures"
+                )
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+            "retry_in": round(self.retry_in(), 1) if self.state == self.OPEN else None,
+        }
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After в секундах: число секунд или HTTP-дата."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class RetryPolicy:
+    """
+    Выполнение запроса с повторами по классу ошибки.
+
+    - `execute()` выполняет send() с повторами и учётом circuit breaker хоста
+    - `stats()` — число попыток, повторов по причинам и состояние цепей
+    """
+
+    def __init__(
+        self,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float,
+        failure_threshold: int,
+        reset_timeout: float,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._calls = 0
+        self._attempts = 0
+        self._retries: Dict[str, int] = {}
+        self._exhausted = 0
+        self._short_circuited = 0
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        host = httpx.URL(url).netloc.decode("ascii")
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(host, self.failure_threshold, self.reset_timeout)
+        return breaker
+
+    def _next_delay(self, previous: float) -> float:
+        """Decorrelated jitter: случайная пауза между base_delay и утроенной предыдущей."""
+        return min(self.max_delay, random.uniform(self.base_delay, max(previous, self.base_delay) * 3))
+
+    def _count_retry(self, reason: str) -> None:
+        self._retries[reason] = self._retries.get(reason, 0) + 1
+
+    async def execute(
+        self, method: str, url: str, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """
+        Выполняет запрос с повторами.
+
+        Возвращает последний ответ (в том числе с ошибкой — его разбирает вызывающий)
+        или поднимает последнее исключение транспорта.
+
+        Raises:
+            CircuitOpenError: если хост сейчас считается недоступным.
+        """
+        self._calls += 1
+        breaker = self.breaker(url)
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        delay = self.base_delay
+
+        for attempt in range(1, self.max_attempts + 1):
+            if not breaker.allow():
+                self._short_circuited += 1
+                raise CircuitOpenError(breaker.host, breaker.retry_in())
+
+            self._attempts += 1
+            is_last = attempt == self.max_attempts
+            try:
+                response = await send()
+            except httpx.RequestError as e:
+                breaker.record_failure()
+                retryable = isinstance(e, NOT_SENT_ERRORS) or (
+                    idempotent and isinstance(e, httpx.TransportError)
+                )
+                if not retryable or is_last:
+                    if retryable:
+                        self._exhausted += 1
+                    raise
+                reason = type(e).__name__
+                delay = self._next_delay(delay)
+            except BaseException:
+                # Отмена или ошибка вне транспорта: исход неизвестен, но пробный
+                # запрос half_open больше не в полёте — иначе цепь зависнет закрытой для всех
+                breaker.release_probe()
+                raise
+            else:
+                status = response.status_code
+                if status < 500:
+                    # 4xx означает, что сервер отвечает, — для цепи это успех
+                    breaker.record_success()
+                else:
+                    breaker.record_failure()
+                if status not in RETRYABLE_STATUSES or not idempotent:
+                    return response
+                if is_last:
+                    self._exhausted += 1
+                    return response
+                retry_after = parse_retry_after(response.headers.get("retry-after"))
+                if retry_after is not None and retry_after > self.max_delay:
+                    logger.warning(f"RetryPolicy: {method} {url} asks to retry in {retry_after:.0f}s, giving up")
+                    return response
+                reason = str(status)
+                delay = self._next_delay(delay)
+                if retry_after is not None:
+                    delay = max(delay, retry_after)
+                await response.aclose()
+
+            self._count_retry(reason)
+            logger.warning(
+                f"RetryPolicy: attempt {attempt} of {method} {url} failed ({reason}), retrying in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
+
+        raise AssertionError("unreachable")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self._calls,
+            "attempts": self._attempts,
+            "retries": dict(self._retries),
+            "exhausted": self._exhausted,
+            "short_circuited": self._short_circuited,
+            "breakers": {host: breaker.stats() for host, breaker in self._breakers.items()},
+        }
+
+
+# Глобальный экземпляр
+edms_retry_policy = RetryPolicy(
+    max_attempts=settings.retry.max_attempts,
+    base_delay=settings.retry.base_delay,
+    max_delay=settings.retry.max_delay,
+    failure_threshold=settings.retry.breaker_failure_threshold,
+    reset_timeout=settings.retry.breaker_reset_timeout,
+)
@@ -0,0 +1,75 @@
+# src/edms_assistant/infrastructure/api_clients/single_flight.py
+"""
+Single-flight: объединение одновременных одинаковых запросов к EDMS.
+
+Пока идёт GET с некоторым ключом, остальные такие же запросы не уходят в сеть, а
+ждут тот же ответ. Ключ включает область видимости токена, поэтому вызывающие с
+разными токенами никогда не получают ответы друг друга.
+"""
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import httpx
+
+from src.edms_assistant.config.settings import settings
+from src.edms_assistant.utils.api_utils import token_scope
+
+logger = logging.getLogger(__name__)
+
+FlightKey = Tuple[str, str, str, str]
+
+
+class SingleFlight:
+    """
+    Реестр запросов в полёте.
+
+    - `key()` строит ключ из токена, метода, URL и параметров
+    - `do()` выполняет запрос или присоединяется к уже выполняющемуся
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._flights: Dict[FlightKey, asyncio.Future] = {}
+        self._leaders = 0
+        self._shared = 0
+
+    @staticmethod
+    def key(service_token: Optional[str], method: str, url: str, params: Any = None) -> FlightKey:
+        params_key = json.dumps(params, sort_keys=True, default=str) if params else ""
+        return token_scope(service_token or ""), method.upper(), url, params_key
+
+    async def do(self, key: FlightKey, fetch: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """
+        Возвращает ответ на запрос с ключом key, выполняя fetch() не более одного раза
+        на всех одновременных вызывающих.
+        """
+        if not self.enabled:
+            return await fetch()
+
+        flight = self._flights.get(key)
+        if flight is not None:
+            self._shared += 1
+            logger.debug(f"SingleFlight: joined in-flight {key[1]} {key[2]}")
+        else:
+            self._leaders += 1
+            flight = asyncio.ensure_future(fetch())
+            self._flights[key] = flight
+            flight.add_done_callback(lambda _: self._flights.pop(key, None))
+        # shield: отмена одного из ожидающих не должна прерывать запрос для остальных
+        return await asyncio.shield(flight)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self._leaders + self._shared
+        return {
+            "enabled": self.enabled,
+            "in_flight": len(self._flights),
+            "requests": total,
+            "coalesced": self._shared,
+            "hit_rate": round(self._shared / total, 3) if total else 0.0,
+        }
+
+
+# Глобальный экземпляр
+edms_single_flight = SingleFlight(enabled=settings.edms.single_flight)
@@ -0,0 +1,270 @@
+# src/edms_assistant/infrastructure/jobs/job_manager.py
+"""
+Фоновые задания с пулом воркеров внутри процесса.
+
+Долгие операции (например, суммаризация больших вложений) выполняются вне HTTP-запроса:
+клиент получает job_id и опрашивает статус или подписывается на события. Состояние
+заданий сохраняется на диск (без секретов), поэтому результаты переживают перезапуск
+и видны всем воркерам uvicorn, а прерванные перезапуском задания помечаются как failed.
+"""
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from src.edms_assistant.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[], Awaitable[str]]
+
+
+class JobStatus:
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    FINAL = (SUCCEEDED, FAILED)
+
+
+class JobQueueFull(Exception):
+    """Очередь заданий заполнена."""
+
+
+@dataclass
+class Job:
+    """Состояние задания. Сохраняется на диск целиком, поэтому не должно содержать токенов."""
+
+    id: str
+    kind: str
+    owner: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    pid: int = field(default_factory=os.getpid)
+    status: str = JobStatus.QUEUED
+    result: Optional[str] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class JobManager:
+    """
+    Очередь заданий с фиксированным числом воркеров.
+
+    - `submit()` ставит задание в очередь и сразу возвращает его
+    - `get()` возвращает текущее состояние, `wait()` ждёт смены статуса
+    - `startup()/shutdown()` управляют воркерами (вызываются из lifespan)
+    """
+
+    def __init__(self, state_dir: Path, workers: int, max_pending: int, result_ttl: float):
+        self.state_dir = state_dir
+        self.workers = workers
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self._jobs: Dict[str, Job] = {}
+        self._handlers: Dict[str, JobHandler] = {}
+        self._changed: Dict[str, asyncio.Event] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+
+    # === Жизненный цикл ===
+    async def startup(self) -> None:
+        """Загружает сохранённые задания и запускает воркеры."""
+        await asyncio.to_thread(self.state_dir.mkdir, parents=True, exist_ok=True)
+        for job in await asyncio.to_thread(self._load_all):
+            if job.status not in JobStatus.FINAL and not _process_alive(job.pid):
+                # Обработчик (и токен) жили только в памяти завершившегося процесса
+                job.status = JobStatus.FAILED
+                job.error = "Задание прервано перезапуском сервиса."
+                job.finished_at = time.time()
+                await self._persist(job)
+            self._jobs[job.id] = job
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(i), name=f"job-worker-{i}") for i in range(self.workers)
+        ]
+        logger.info(f"JobManager: started {self.workers} workers, restored {len(self._jobs)} jobs")
+
+    async def shutdown(self) -> None:
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+    # === API ===
+    async def submit(self, kind: str, owner: str, params: Dict[str, Any], handler: JobHandler) -> Job:
+        """
+        Ставит задание в очередь.
+
+        Args:
+            kind: Тип задания (для отображения и метрик).
+            owner: Владелец — только он может читать задание.
+            params: Сохраняемые параметры (без секретов).
+            handler: Корутина-фабрика, возвращающая текст результата.
+
+        Raises:
+            JobQueueFull: если в очереди уже max_pending заданий.
+        """
+        if self._queue is None:
+            raise RuntimeError("JobManager is not started")
+        if self._queue.full():
+            raise JobQueueFull()
+
+        job = Job(id=str(uuid.uuid4()), kind=kind, owner=owner, params=params)
+        self._jobs[job.id] = job
+        self._handlers[job.id] = handler
+        self._changed[job.id] = asyncio.Event()
+        await self._persist(job)
+        try:
+            self._queue.put_nowait(job.id)
+        except asyncio.QueueFull:
+            # Пока сохранялось состояние, очередь заполнили параллельные submit()
+            self._jobs.pop(job.id, None)
+            self._handlers.pop(job.id, None)
+            self._changed.pop(job.id, None)
+            await asyncio.to_thread(self._path(job.id).unlink, True)
+            raise JobQueueFull()
+        logger.info(f"JobManager: queued {kind} job {job.id}")
+        return job
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        """Возвращает задание; задания других воркеров читаются с диска."""
+        job = self._jobs.get(job_id)
+        if job is not None and job.pid == os.getpid():
+            return job
+        return await asyncio.to_thread(self._read, job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[Job]:
+        """Ждёт следующей смены статуса задания (или timeout) и возвращает задание."""
+        job = await self.get(job_id)
+        if job is None or job.status in JobStatus.FINAL:
+            return job
+        if job.pid != os.getpid():
+            # Задание выполняет другой процесс — опрашиваем файл состояния
+            await asyncio.sleep(min(timeout, 1.0))
+            return await self.get(job_id)
+        event = self._changed.setdefault(job_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self._jobs.get(job_id)
+
+    # === Внутреннее ===
+    async def _worker(self, index: int) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except Exception as e:
+                logger.error(f"JobManager: worker {index} failed on job {job_id}: {e}", exc_info=True)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str) -> None:
+        job = self._jobs[job_id]
+        handler = self._handlers.pop(job_id)
+        job.status = JobStatus.RUNNING
+        job.started_at = time.time()
+        await self._set_changed(job)
+        try:
+            job.result = await handler()
+            job.status = JobStatus.SUCCEEDED
+        except Exception as e:
+            logger.error(f"JobManager: job {job_id} failed: {e}", exc_info=True)
+            job.error = str(e)
+            job.status = JobStatus.FAILED
+        job.finished_at = time.time()
+        await self._set_changed(job)
+        await self._prune()
+
+    async def _set_changed(self, job: Job) -> None:
+        await self._persist(job)
+        event = self._changed.pop(job.id, None)
+        if event is not None:
+            event.set()
+        if job.status not in JobStatus.FINAL:
+            self._changed[job.id] = asyncio.Event()
+
+    async def _prune(self) -> None:
+        """Удаляет завершённые задания старше result_ttl."""
+        now = time.time()
+        expired = [
+            job for job in self._jobs.values()
+            if job.status in JobStatus.FINAL and job.finished_at and now - job.finished_at > self.result_ttl
+        ]
+        for job in expired:
+            del self._jobs[job.id]
+            await asyncio.to_thread(self._path(job.id).unlink, True)
+
+    def _path(self, job_id: str) -> Path:
+        return self.state_dir / f"{job_id}.json"
+
+    async def _persist(self, job: Job) -> None:
+        await asyncio.to_thread(self._write, job)
+
+    def _write(self, job: Job) -> None:
+        tmp_path = self._path(job.id).with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(job.to_dict(), ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(self._path(job.id))
+
+    def _read(self, job_id: str) -> Optional[Job]:
+        path = self._path(job_id)
+        if not path.exists():
+            return None
+        try:
+            return Job(**json.loads(path.read_text(encoding="utf-8")))
+        except Exception as e:
+            logger.warning(f"JobManager: unreadable job file {path}: {e}")
+            return None
+
+    def _load_all(self) -> List[Job]:
+        jobs = []
+        for path in self.state_dir.glob("*.json"):
+            try:
+                jobs.append(Job(**json.loads(path.read_text(encoding="utf-8"))))
+            except Exception as e:
+                logger.warning(f"JobManager: skipping unreadable job file {path}: {e}")
+        return jobs
+
+    def stats(self) -> Dict[str, Any]:
+        counts: Dict[str, int] = {}
+        for job in self._jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            "workers": len(self._worker_tasks),
+            "pending": self._queue.qsize() if self._queue else 0,
+            "jobs": counts,
+        }
+
+
+def _process_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+# Глобальный экземпляр
+job_manager = JobManager(
+    state_dir=Path(settings.jobs.state_dir or Path(tempfile.gettempdir()) / "edms_agent_jobs"),
+    workers=settings.jobs.workers,
+    max_pending=settings.jobs.max_pending,
+    result_ttl=settings.jobs.result_ttl,
+)
@@ -1,10823 +0,0 @@
-from __future__ import annotations
-
-# generated by datamodel-codegen:
-#   filename:  openapi_spec.json
-#   timestamp: 2025-10-30T06:21:23+00:00
-from pydantic import BaseModel, Field, RootModel
-
-
-from datetime import date, datetime
-from enum import Enum
-from typing import Annotated, Any
-from uuid import UUID
-
-
-class Pageable(BaseModel):
-    page: Annotated[Any | None, Field(example=0)] = None
-    size: Annotated[Any | None, Field(example=20)] = None
-    sort: Annotated[list[str] | None, Field(example=["id,asc"])] = None
-
-
-class DocMoveInFoldersOperation(BaseModel):
-    documentId: UUID | None = None
-    inFolderIds: list[UUID] | None = None
-
-
-class DocsMoveInFoldersOperation(BaseModel):
-    documentIds: list[UUID] | None = None
-    inFolderIds: list[UUID] | None = None
-
-
-class FolderInRootOperation(BaseModel):
-    folderId: UUID | None = None
-
-
-class FolderInsertOrUpdateOperation(BaseModel):
-    id: UUID | None = None
-    parentId: UUID | None = None
-    name: str | None = None
-
-
-class FoldersDocsDeleteOperation(BaseModel):
-    folderIds: list[UUID] | None = None
-    linkDocIds: list[UUID] | None = None
-    fromFolderId: UUID | None = None
-
-
-class FoldersDocsMoveOperation(BaseModel):
-    folderIds: list[UUID] | None = None
-    linkDocIds: list[UUID] | None = None
-    inFolderId: UUID | None = None
-    fromFolderId: UUID | None = None
-    ignore: bool | None = None
-
-
-class StoreAttribute(Enum):
-    PERMANENT = "PERMANENT"
-    TEMPORARY = "TEMPORARY"
-    END_OF_NEED = "END_OF_NEED"
-    BY_STAFF = "BY_STAFF"
-
-
-class JobStatus(Enum):
-    NEW = "NEW"
-    AWAITING_CONVERSION = "AWAITING_CONVERSION"
-    READY = "READY"
-    IN_WORK_CONVERSION = "IN_WORK_CONVERSION"
-    COMPLETED = "COMPLETED"
-    SIGNED = "SIGNED"
-    DISPATCH = "DISPATCH"
-    IN_WORK_DISPATCH = "IN_WORK_DISPATCH"
-    SENT = "SENT"
-    ERROR_CONVERSION = "ERROR_CONVERSION"
-    ERROR_DISPATCH = "ERROR_DISPATCH"
-
-
-class Status(Enum):
-    NEW = "NEW"
-    SIGNING = "SIGNING"
-    SIGNED = "SIGNED"
-    STATEMENT = "STATEMENT"
-    APPROVED = "APPROVED"
-    AGREEMENT = "AGREEMENT"
-    AGREED = "AGREED"
-    REJECT = "REJECT"
-    CANCEL = "CANCEL"
-
-
-class MethodAssemblyType(Enum):
-    ED = "ED"
-    GD = "GD"
-    PAPER = "PAPER"
-    IR = "IR"
-
-
-class Type(Enum):
-    """
-    Перечисление для описания типов процесса
-    """
-
-    NEW = "NEW"
-    SIGNING = "SIGNING"
-    STATEMENT = "STATEMENT"
-    AGREEMENT = "AGREEMENT"
-
-
-class AccessGriefDto(BaseModel):
-    """
-    Гриф доступа
-    """
-
-    id: UUID | None = None
-    name: str | None = None
-    shortName: str | None = None
-    active: bool | None = None
-    createDate: datetime | None = None
-
-
-class AdditionalDocumentTypeDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор доп документов")] = None
-    name: Annotated[str | None, Field(description="Название доп документа")] = None
-    active: Annotated[
-        bool | None, Field(description="Признак активно ли до документ")
-    ] = None
-    createDate: datetime | None = None
-
-
-class ArchiveFundDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор архивного фонда")] = (
-        None
-    )
-    code: Annotated[str | None, Field(description="Код архивного фонда")] = None
-    name: Annotated[str | None, Field(description="Наименование архивного фонда")] = (
-        None
-    )
-    active: Annotated[bool | None, Field(description="Статус активности")] = None
-
-
-class Attachment(BaseModel):
-    originalName: str | None = None
-    size: int | None = None
-    bucketName: str | None = None
-    minioName: str | None = None
-
-
-class Type1(Enum):
-    MAIN_ATTACHMENT = "MAIN_ATTACHMENT"
-    ADDITIONAL_ATTACHMENT = "ADDITIONAL_ATTACHMENT"
-
-
-class AttachmentDocumentType(Enum):
-    """
-    Тип вложения
-    """
-
-    ATTACHMENT = "ATTACHMENT"
-    PRINT_DOCUMENT = "PRINT_DOCUMENT"
-    PROJECT_SOLUTION = "PROJECT_SOLUTION"
-    RATIONALE = "RATIONALE"
-    DOCUMENTS_QUESTION = "DOCUMENTS_QUESTION"
-    INTRODUCTION_LIST = "INTRODUCTION_LIST"
-    AGREEMENT_LIST = "AGREEMENT_LIST"
-    DECISION = "DECISION"
-    RKK = "RKK"
-
-
-class AttachmentDto(BaseModel):
-    name: Annotated[str | None, Field(description="Наименование вложенного файла")] = (
-        None
-    )
-    size: Annotated[int | None, Field(description="Размер вложенного файла")] = None
-
-
-class AttachmentTaskDto(BaseModel):
-    id: Annotated[
-        UUID | None,
-        Field(description="Идентификатор вложения прикрепленного к поручению"),
-    ] = None
-    name: Annotated[
-        str | None,
-        Field(description="Наименование вложения прикрепленного к поручению"),
-    ] = None
-    size: Annotated[
-        int | None, Field(description="Размер вложения прикрепленного к поручению")
-    ] = None
-    executorId: Annotated[
-        UUID | None, Field(description="Идентификатор исполнителя поручения")
-    ] = None
-    taskExecutors: Annotated[Any | None, Field(description="Исполнитель поручения")] = (
-        None
-    )
-
-
-class AutoControl(BaseModel):
-    autoControl: bool | None = None
-    controlDays: int | None = None
-    controlTypeId: UUID | None = None
-    controlTypeOrgId: str | None = None
-
-
-class DocCategory(Enum):
-    INTERN = "INTERN"
-    INCOMING = "INCOMING"
-    OUTGOING = "OUTGOING"
-    MEETING = "MEETING"
-    QUESTION = "QUESTION"
-    MEETING_QUESTION = "MEETING_QUESTION"
-    APPEAL = "APPEAL"
-    CONTRACT = "CONTRACT"
-    CUSTOM = "CUSTOM"
-
-
-class BpmnProcessDirectoryDto(BaseModel):
-    id: UUID | None = None
-    name: str | None = None
-    docCategory: DocCategory | None = None
-    createDate: datetime | None = None
-    active: bool | None = None
-
-
-class CitizenTypeDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор вида обращения")] = None
-    name: Annotated[str | None, Field(description="Наименование вида обращения")] = None
-    active: Annotated[
-        bool | None, Field(description="Признак активен ли вид обращения")
-    ] = None
-    report: Annotated[bool | None, Field(description="Признак жалобы")] = None
-    createDate: datetime | None = None
-
-
-class Type2(Enum):
-    NORMAL = "NORMAL"
-    AISMV = "AISMV"
-    DIRECTUM = "DIRECTUM"
-    GTB_ORG = "GTB_ORG"
-
-
-class CountryDto(BaseModel):
-    """
-    Страна
-    """
-
-    id: Annotated[UUID | None, Field(description="Идентификатор страны")] = None
-    code: Annotated[
-        int | None, Field(description="Цифровой код страны", ge=1, le=999)
-    ] = None
-    shortName: Annotated[
-        str | None, Field(description="Краткое наименование страны")
-    ] = None
-    fullName: Annotated[str | None, Field(description="Полное наименование страны")] = (
-        None
-    )
-    alphaCodeTwo: Annotated[str | None, Field(description="Альфа код два")] = None
-    alphaCodeThree: Annotated[str | None, Field(description="Альфа код три")] = None
-    active: Annotated[bool | None, Field(description="Признак активна ли страна")] = (
-        None
-    )
-    createDate: datetime | None = None
-
-
-class CurrencyDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор валюты")] = None
-    name: Annotated[str | None, Field(description="Название валюты")] = None
-    active: Annotated[bool | None, Field(description="Признак активна ли валюта")] = (
-        None
-    )
-    createDate: datetime | None = None
-    code: str | None = None
-
-
-class DeliveryMethodDto(BaseModel):
-    """
-    Способ доставки
-    """
-
-    id: Annotated[int | None, Field(description="Идентификатор способа доставки")] = (
-        None
-    )
-    deliveryName: Annotated[
-        str | None, Field(description="Наименование способа доставки")
-    ] = None
-    aismv: Annotated[bool | None, Field(description="Доставка АИСМВ")] = None
-    kanclerNext: Annotated[bool | None, Field(description="Доставка Канцлер НЕКСТ")] = (
-        None
-    )
-    active: Annotated[
-        bool | None, Field(description="Признак активен ли способ доставки")
-    ] = None
-    system: bool | None = None
-    createDate: datetime | None = None
-
-
-class Status1(Enum):
-    """
-    Статус акта
-    """
-
-    NEW = "NEW"
-    AGREEMENT = "AGREEMENT"
-    AGREED = "AGREED"
-    SIGNING = "SIGNING"
-    SIGNED = "SIGNED"
-    STATEMENT = "STATEMENT"
-    APPROVED = "APPROVED"
-    CANCEL = "CANCEL"
-
-
-class StorageType(Enum):
-    """
-    Статус дел, выделенных к уничтожению
-    """
-
-    ARCHIVE = "ARCHIVE"
-    OPERATIONAL = "OPERATIONAL"
-
-
-class MethodAssemblyType1(Enum):
-    """
-    Вид дел
-    """
-
-    ED = "ED"
-    GD = "GD"
-    PAPER = "PAPER"
-    IR = "IR"
-
-
-class Type3(Enum):
-    """
-    Тип процесса
-    """
-
-    NEW = "NEW"
-    AGREEMENT = "AGREEMENT"
-    SIGNING = "SIGNING"
-    STATEMENT = "STATEMENT"
-
-
-class Type4(Enum):
-    """
-    Перечисление для описания типов процесса
-    """
-
-    NEW = "NEW"
-    AGREEMENT = "AGREEMENT"
-    SIGNING = "SIGNING"
-    STATEMENT = "STATEMENT"
-    REGISTRATION = "REGISTRATION"
-    REVIEW = "REVIEW"
-    EXECUTION = "EXECUTION"
-    DISPATCH = "DISPATCH"
-    PREPARATION = "PREPARATION"
-    PAPERWORK = "PAPERWORK"
-    ACCEPTANCE = "ACCEPTANCE"
-    CONTRACT_EXECUTION = "CONTRACT_EXECUTION"
-
-
-class EmpActionQueueType(Enum):
-    """
-    Тип выполнения действий в процессе, null = ANY
-    """
-
-    ANY = "ANY"
-    ORDERED = "ORDERED"
-
-
-class DeclarantType(Enum):
-    """
-    Признак, является заявитель физическим или юридическим лицом
-    """
-
-    INDIVIDUAL = "INDIVIDUAL"
-    ENTITY = "ENTITY"
-
-
-class RequiredFieldEnum(Enum):
-    ATTACHMENT = "ATTACHMENT"
-    OUT_CORRESPONDENT_ORG_NUM = "OUT_CORRESPONDENT_ORG_NUM"
-    OUT_CORRESPONDENT_ORG_DATE = "OUT_CORRESPONDENT_ORG_DATE"
-    OUT_CORRESPONDENT_NAME = "OUT_CORRESPONDENT_NAME"
-    DOC_SIGNERS = "DOC_SIGNERS"
-    RECIPIENT_NAME = "RECIPIENT_NAME"
-    AFFAIRS = "AFFAIRS"
-    CONTRACT_CORRESPONDENT = "CONTRACT_CORRESPONDENT"
-
-
-class Status2(Enum):
-    """
-    Перечисление для описания статусов документов
-    """
-
-    DRAFT = "DRAFT"
-    NEW = "NEW"
-    STATEMENT = "STATEMENT"
-    APPROVED = "APPROVED"
-    SIGNING = "SIGNING"
-    SIGNED = "SIGNED"
-    AGREEMENT = "AGREEMENT"
-    AGREED = "AGREED"
-    REVIEW = "REVIEW"
-    REVIEWED = "REVIEWED"
-    REGISTRATION = "REGISTRATION"
-    REGISTERED = "REGISTERED"
-    EXECUTION = "EXECUTION"
-    EXECUTED = "EXECUTED"
-    DISPATCH = "DISPATCH"
-    SENT = "SENT"
-    REJECT = "REJECT"
-    CANCEL = "CANCEL"
-    PREPARATION = "PREPARATION"
-    PAPERWORK = "PAPERWORK"
-    FORMALIZED = "FORMALIZED"
-    ACCEPTANCE = "ACCEPTANCE"
-    ACCEPTED = "ACCEPTED"
-    CONTRACT_EXECUTION = "CONTRACT_EXECUTION"
-    CONTRACT_CLOSED = "CONTRACT_CLOSED"
-    ARCHIVE = "ARCHIVE"
-    DELETED = "DELETED"
-    ALL = "ALL"
-
-
-class CreateType(Enum):
-    """
-    Перечисление для описания типов как создан документ
-    """
-
-    MANUAL = "MANUAL"
-    AISMV = "AISMV"
-    DIRECTUM = "DIRECTUM"
-
-
-class FormMeetingType(Enum):
-    """
-    Форма проведения заседания
-    """
-
-    INTRAMURAL = "INTRAMURAL"
-    POLLING_METHOD = "POLLING_METHOD"
-
-
-class DocumentConstant(Enum):
-    """
-    Константа документа
-    """
-
-    INTERN = "INTERN"
-    INCOMING = "INCOMING"
-    OUTGOING = "OUTGOING"
-    MEETING = "MEETING"
-    QUESTION = "QUESTION"
-    MEETING_QUESTION = "MEETING_QUESTION"
-    APPEAL = "APPEAL"
-    CONTRACT = "CONTRACT"
-    CUSTOM = "CUSTOM"
-
-
-class DocumentFormField(BaseModel):
-    """
-    Поля формы документа
-    """
-
-    id: str | None = None
-    payload: dict[str, dict[str, Any]] | None = None
-
-
-class DocumentLanguageDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор шаблона языка документа")
-    ] = None
-    languageCode: Annotated[str | None, Field(description="Код языка документа")] = None
-    active: Annotated[
-        bool | None, Field(description="Признак активен ли язык документа")
-    ] = None
-
-
-class ActionQueueType(Enum):
-    """
-    Тип исполнения процесса
-    """
-
-    ANY = "ANY"
-    ORDERED = "ORDERED"
-
-
-class DocumentCategory(Enum):
-    """
-    Тип документа
-    """
-
-    INTERN = "INTERN"
-    INCOMING = "INCOMING"
-    OUTGOING = "OUTGOING"
-    MEETING = "MEETING"
-    QUESTION = "QUESTION"
-    MEETING_QUESTION = "MEETING_QUESTION"
-    APPEAL = "APPEAL"
-    CONTRACT = "CONTRACT"
-    CUSTOM = "CUSTOM"
-
-
-class RequiredFieldEnum1(Enum):
-    """
-    обязательные поля
-    """
-
-    ATTACHMENT = "ATTACHMENT"
-    OUT_CORRESPONDENT_ORG_NUM = "OUT_CORRESPONDENT_ORG_NUM"
-    OUT_CORRESPONDENT_ORG_DATE = "OUT_CORRESPONDENT_ORG_DATE"
-    OUT_CORRESPONDENT_NAME = "OUT_CORRESPONDENT_NAME"
-    DOC_SIGNERS = "DOC_SIGNERS"
-    RECIPIENT_NAME = "RECIPIENT_NAME"
-    AFFAIRS = "AFFAIRS"
-    CONTRACT_CORRESPONDENT = "CONTRACT_CORRESPONDENT"
-
-
-class Status4(Enum):
-    SENDING = "SENDING"
-    SENDED = "SENDED"
-    RECEIVED = "RECEIVED"
-    AISMV_SENDED = "AISMV_SENDED"
-    AISMV_RECEIVED = "AISMV_RECEIVED"
-    CANCEL = "CANCEL"
-    FAILED = "FAILED"
-
-
-class AismvPackageType(Enum):
-    DOCUMENT = "DOCUMENT"
-    ADD_DOCUMENT = "ADD_DOCUMENT"
-    ACCEPT_ACK = "ACCEPT_ACK"
-    REG_REJECT_ACK = "REG_REJECT_ACK"
-    REG_ACK = "REG_ACK"
-    DOCUMENT_ANSWER = "DOCUMENT_ANSWER"
-
-
-class DocumentTypeDto(BaseModel):
-    """
-    Тип документа
-    """
-
-    id: Annotated[int | None, Field(description="Идентификатор вида документа")] = None
-    typeName: Annotated[
-        str | None, Field(description="Наименование вида документа")
-    ] = None
-    docCategoryConst: DocCategory | None = None
-    active: Annotated[
-        bool | None, Field(description="Признак активен ли вид документа")
-    ] = None
-    objectType: Annotated[
-        str | None,
-        Field(
-            description="вид по таблицы 2 окб (https://minjust.gov.by/upload/iblock/d97/OKRB.pdf)",
-            max_length=3,
-            min_length=3,
-        ),
-    ] = None
-    createDate: datetime | None = None
-
-
-class DocumentUserColorDto(BaseModel):
-    id: UUID | None = None
-    documentId: UUID | None = None
-    documentOrgId: str | None = None
-    color: str | None = None
-
-
-class DocumentUserPropsDto(BaseModel):
-    documentId: UUID | None = None
-    employeeId: UUID | None = None
-    createTaskCount: int | None = None
-    createTaskExecutedCount: int | None = None
-
-
-class DocumentVersionDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор версии")] = None
-    version: Annotated[int | None, Field(description="Номер версии")] = None
-    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
-        None
-    )
-    document: Annotated[Any | None, Field(description="Документ")] = None
-    deleted: bool | None = None
-
-
-class CreateType1(Enum):
-    MANUAL = "MANUAL"
-    LDAP = "LDAP"
-
-
-class BlockedField(Enum):
-    FIRST_NAME = "FIRST_NAME"
-    LAST_NAME = "LAST_NAME"
-    MIDDLE_NAME = "MIDDLE_NAME"
-    POST = "POST"
-    PHONE = "PHONE"
-    EMAIL = "EMAIL"
-    PHOTO = "PHOTO"
-    DEPARTMENT = "DEPARTMENT"
-
-
-class ExecutionDateRoundPolicy(Enum):
-    UP = "UP"
-    DOWN = "DOWN"
-
-
-class Type7(Enum):
-    ACCESS = "ACCESS"
-    DISTRIBUTION = "DISTRIBUTION"
-
-
-class GroupDto(BaseModel):
-    """
-    Группа пользователей
-    """
-
-    id: UUID | None = None
-    name: Annotated[str | None, Field(max_length=255, min_length=1)] = None
-    type: Type7
-    mixed: bool
-    createDate: datetime | None = None
-
-
-class InformationItem(BaseModel):
-    errorcode: str | None = None
-    errortext: str | None = None
-    idSystem: str | None = None
-    invIndex: str | None = None
-    extIndex: str | None = None
-    akIndex: str | None = None
-    eoIndex: int | None = None
-    fileId: int | None = None
-    number: int | None = None
-    fileName: str | None = None
-    actIndex: int | None = None
-    code: int | None = None
-    fundNumber: int | None = None
-    prevResponse: str | None = None
-
-
-class Type8(Enum):
-    REG_PACKAGE = "REG_PACKAGE"
-    ACCEPTANCE_INVENTORY = "ACCEPTANCE_INVENTORY"
-    ELECTRONIC_OBJECT = "ELECTRONIC_OBJECT"
-    STATUS_INVENTORY = "STATUS_INVENTORY"
-    ERROR_RESPONSE = "ERROR_RESPONSE"
-    INNER_INVENTORY = "INNER_INVENTORY"
-    INVENTORY_TRANSFER_COMPLETED = "INVENTORY_TRANSFER_COMPLETED"
-    ELECTRONIC_DOCUMENT = "ELECTRONIC_DOCUMENT"
-    DOCUMENT_FILE = "DOCUMENT_FILE"
-
-
-class InvestmentProgramDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор объекта инвестпрограммы")
-    ] = None
-    name: Annotated[
-        str | None, Field(description="Наименование объекта инвестпрограммы")
-    ] = None
-    active: Annotated[bool | None, Field(description="Признак активности")] = None
-    createDate: datetime | None = None
-
-
-class JobInfo(BaseModel):
-    endDate: datetime | None = None
-    delayedTo: datetime | None = None
-    attempt: int
-    errorText: str | None = None
-    startDate: datetime | None = None
-
-
-class ListInformation(BaseModel):
-    information: list[InformationItem] | None = None
-
-
-class ContentType(Enum):
-    DOC = "DOC"
-    DOCX = "DOCX"
-    TIF = "TIF"
-    TIFF = "TIFF"
-    JPG = "JPG"
-    JPEG = "JPEG"
-    BMP = "BMP"
-    PDF = "PDF"
-    GIF = "GIF"
-    PNG = "PNG"
-    OTHER = "OTHER"
-
-
-class MiniUserInfoDto(BaseModel):
-    firstName: Annotated[str | None, Field(description="Имя сотрудника")] = None
-    lastName: Annotated[str | None, Field(description="Фамилия сотрудника")] = None
-    middleName: Annotated[str | None, Field(description="Отчество сотрудника")] = None
-    id: Annotated[UUID | None, Field(description="ИД сотрудника")] = None
-
-
-class Status6(Enum):
-    """
-    Статус дела
-    """
-
-    FORMING = "FORMING"
-    COMPLETED = "COMPLETED"
-    CLOSED = "CLOSED"
-    ARCHIVE = "ARCHIVE"
-    DESTROYED = "DESTROYED"
-
-
-class CreateType2(Enum):
-    """
-    Тип создания
-    """
-
-    MANUAL = "MANUAL"
-    DIRECTUM = "DIRECTUM"
-
-
-class MethodAssemblyType2(Enum):
-    """
-    Способ комплектования дела
-    """
-
-    ED = "ED"
-    GD = "GD"
-    PAPER = "PAPER"
-    IR = "IR"
-
-
-class ExpertiseType(Enum):
-    """
-    Признак экспертизы дела
-    """
-
-    EPK = "EPK"
-    CEK = "CEK"
-    EK = "EK"
-
-
-class NomenclatureShelvingShelveDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор стеллажа и полки")] = (
-        None
-    )
-    fundId: Annotated[
-        UUID | None,
-        Field(description="Идентификатор фонда, к которому относится стеллаж"),
-    ] = None
-    fund: Annotated[
-        ArchiveFundDto | None, Field(description="Фонд, к которому относится стеллаж")
-    ] = None
-    shelvingName: Annotated[
-        str | None, Field(description="Название или номер стеллажа")
-    ] = None
-    shelveName: Annotated[str | None, Field(description="Название или номер полки")] = (
-        None
-    )
-    active: Annotated[bool | None, Field(description="Статус активности")] = None
-
-
-class OrgApprovePerson(BaseModel):
-    position: str
-    name: str
-
-
-class PackageEoResponse(BaseModel):
-    listInformation: ListInformation
-    idpackage: str | None = None
-    type: str | None = None
-    dateoftransmission: str | None = None
-
-
-class PostDto(BaseModel):
-    """
-    Должность сотрудника
-    """
-
-    id: Annotated[int | None, Field(description="Идентификатор должности")] = None
-    postName: Annotated[str | None, Field(description="Наименование должности")] = None
-    postCode: Annotated[str | None, Field(description="Код должности")] = None
-    createDate: datetime | None = None
-
-
-class RegistrationJournalDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор журнала регистрации")
-    ] = None
-    journalName: Annotated[
-        str | None, Field(description="Наименование журнала регистрации")
-    ] = None
-    counterValue: Annotated[int | None, Field(description="Значение счетчика")] = None
-    active: Annotated[
-        bool | None, Field(description="Признак активен ли журнал регистрации")
-    ] = None
-    createDate: datetime | None = None
-
-
-class Type10(Enum):
-    """
-    Тип повторных обращений
-    """
-
-    IDENTICAL = "IDENTICAL"
-    REPEAT = "REPEAT"
-
-
-class RepeatIdenticalAppealDto(BaseModel):
-    """
-    Повторные и идентичные обращения
-    """
-
-    id: UUID | None = None
-    docId: Annotated[UUID | None, Field(description="Идентификатор документа")] = None
-    regNumber: str | None = None
-    regDate: datetime | None = None
-    shortSummary: str | None = None
-    number: Annotated[int | None, Field(description="Номер повторного обращения")] = (
-        None
-    )
-    repeatAppealGroupId: Annotated[
-        UUID | None, Field(description="Идентификатор группы повторных обращений")
-    ] = None
-    type: Annotated[Type10 | None, Field(description="Тип повторных обращений")] = None
-    deleted: bool | None = None
-
-
-class SaveInventoryResponse(PackageEoResponse):
-    pass
-
-
-class Signature(BaseModel):
-    keyId: Annotated[
-        str | None, Field(description="Идентификатор открытого ключа подписавшего")
-    ] = None
-    signer: Annotated[str | None, Field(description="Имя подписавшего")] = None
-    signtime: Annotated[datetime | None, Field(description="Дата/время подписи")] = None
-    operationType: Annotated[
-        str | None, Field(description="Тип операции подписания")
-    ] = None
-    origSignature: Annotated[
-        str | None,
-        Field(
-            description="Значение ЭЦП в исходной системе (если выполнялось заверение третьей стороной)"
-        ),
-    ] = None
-    data: Annotated[str, Field(description="ЭЦП подпись в base64")]
-    certSerial: Annotated[str | None, Field(description="Номер сертификата")] = None
-    signerFio: Annotated[str | None, Field(description="ФИО подписавшего")] = None
-    signerDate: Annotated[datetime | None, Field(description="Дата подписания")] = None
-    signerPost: Annotated[str | None, Field(description="Должность подписавшего")] = (
-        None
-    )
-    signerOrg: Annotated[str | None, Field(description="Организация подписавшего")] = (
-        None
-    )
-    personalNumber: Annotated[str | None, Field(description="Личный номер")] = None
-    issuer: Annotated[str | None, Field(description="Издатель сертификата")] = None
-    start: datetime | None = None
-    end: datetime | None = None
-    signCount: int | None = None
-    attrCertIssuer: str | None = None
-    attrCertIssuerId: str | None = None
-    attrOrganizationName: str | None = None
-    attrPost: str | None = None
-    attrUnp: str | None = None
-    attrUnpf: str | None = None
-    attrAddress: str | None = None
-    attrStart: datetime | None = None
-    attrEnd: datetime | None = None
-
-
-class SolutionResultDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор результата решения")
-    ] = None
-    name: Annotated[
-        str | None, Field(description="Наименование результата решения")
-    ] = None
-    active: Annotated[bool | None, Field(description="Признак активности")] = None
-    createDate: datetime | None = None
-
-
-class Type11(Enum):
-    SPEAKER = "SPEAKER"
-    CO_REPORTER = "CO_REPORTER"
-
-
-class GroupByStoragePeriod(Enum):
-    S_T_UP_TO_10_Y = "S_T_UP_TO_10_Y"
-    S_T_OVER_10_Y = "S_T_OVER_10_Y"
-    P_S = "P_S"
-
-
-class YearPostfix(Enum):
-    """
-    Добавочный текст к количеству лет хранения
-    """
-
-    год = "год"
-    года = "года"
-    лет = "лет"
-
-
-class StoragePeriodType(Enum):
-    """
-    Другой тип хранения
-    """
-
-    Числовой = "Числовой"
-    Постоянно = "Постоянно"
-    До_минования_надобности = "До минования надобности"
-    До_замены_новыми = "До замены новыми"
-
-
-class StoragePeriodDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор срока хранения")] = None
-    name: Annotated[str | None, Field(description="Наименование срока хранения")] = None
-    groupByStoragePeriod: GroupByStoragePeriod | None = None
-    active: Annotated[
-        bool | None, Field(description="Признак активен ли срок хранения")
-    ] = None
-    createDate: datetime | None = None
-    byStaff: Annotated[
-        bool | None, Field(description="Признак - по личному составу")
-    ] = None
-    storageYears: Annotated[
-        int | None, Field(description="Срок хранения дела в годах")
-    ] = None
-    yearPostfix: Annotated[
-        YearPostfix | None,
-        Field(description="Добавочный текст к количеству лет хранения"),
-    ] = None
-    storagePeriodType: Annotated[
-        StoragePeriodType | None, Field(description="Другой тип хранения")
-    ] = None
-
-
-class SubjectDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор тематики")] = None
-    name: Annotated[str | None, Field(description="Наименование тематики")] = None
-    code: Annotated[int | None, Field(description="Код тематики")] = None
-    parentSubjectId: Annotated[
-        UUID | None, Field(description="Идентификатор родительской тематики")
-    ] = None
-    parentSubject: Annotated[Any | None, Field(description="Родительская тематика")] = (
-        None
-    )
-    active: Annotated[bool | None, Field(description="Признак активности")] = None
-    createDate: datetime | None = None
-
-
-class SubscriberDto(BaseModel):
-    id: UUID | None = None
-    smdoCode: str | None = None
-    endDate: str | None = None
-    connectionDate: str | None = None
-    easId: str | None = None
-    oaisAbonent: bool | None = None
-    startDate: str | None = None
-    status: str | None = None
-    fax: str | None = None
-    home: str | None = None
-    phone: str | None = None
-    subscriberStatus: str | None = None
-    unp: str | None = None
-    corpus: str | None = None
-    email: str | None = None
-    postIndex: str | None = None
-    soato: str | None = None
-    street: str | None = None
-    objid: UUID | None = None
-    rowId: str | None = None
-    createdOn: datetime | None = None
-    updatedOn: datetime | None = None
-    oaisOrgId: UUID | None = None
-    name: str | None = None
-    shortName: str | None = None
-    sedTypeId: UUID | None = None
-    sedTypeObjectId: UUID | None = None
-    typesedRowId: str | None = None
-    typesedValue: str | None = None
-    createDate: datetime | None = None
-    updatedDate: datetime | None = None
-
-
-class Type12(Enum):
-    """
-    Тип поручения
-    """
-
-    INFORMATION = "INFORMATION"
-    GENERAL = "GENERAL"
-
-
-class TaskStatus(Enum):
-    ON_EXECUTION = "ON_EXECUTION"
-    EXECUTED = "EXECUTED"
-
-
-class Period(Enum):
-    WEEK = "WEEK"
-    MONTH = "MONTH"
-    THREE_MONTHS = "THREE_MONTHS"
-    SIX_MONTHS = "SIX_MONTHS"
-    YEAR = "YEAR"
-
-
-class UnifiedDocumentationSystemDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор УСД")] = None
-    code: Annotated[str | None, Field(description="Код УСД")] = None
-    name: Annotated[str | None, Field(description="Название валюты")] = None
-    active: Annotated[bool | None, Field(description="Статус активности")] = None
-
-
-class WsSystem(BaseModel):
-    sysid: str | None = None
-    sysname: str | None = None
-    sysversion: str | None = None
-    url: str | None = None
-
-
-class UserDashboardDto(BaseModel):
-    data: dict[str, Any] | None = None
-
-
-class UserDashboardTodolistDto(UserDashboardDto):
-    pass
-
-
-class CalendarEventRequest(BaseModel):
-    id: UUID | None = None
-    start: datetime | None = None
-    end: datetime | None = None
-    color: str | None = None
-    text: str | None = None
-    title: str | None = None
-
-
-class BasicUserAccountUpdate(BaseModel):
-    login: Annotated[str, Field(min_length=1)]
-    password: Annotated[str, Field(min_length=1)]
-    oldPassword: Annotated[str, Field(min_length=1)]
-
-
-class BasicUserAccountChange(BaseModel):
-    login: str | None = None
-    password: str | None = None
-
-
-class PanelType(Enum):
-    ACTIVE_USER = "ACTIVE_USER"
-    DOCUMENT_CREATE = "DOCUMENT_CREATE"
-    DOCUMENT_REGISTERED = "DOCUMENT_REGISTERED"
-
-
-class Period1(Enum):
-    DAY = "DAY"
-    WEEK = "WEEK"
-    MONTH = "MONTH"
-    YEAR = "YEAR"
-
-
-class UserActionPanelRequest(BaseModel):
-    id: UUID
-    panelType: PanelType
-    period: Period1
-    sort: int
-
-
-class UserActionPanelBase(BaseModel):
-    panelType: PanelType | None = None
-    period: Period1 | None = None
-
-
-class UserActionPanelCountResponse(BaseModel):
-    id: UUID | None = None
-    data: UserActionPanelBase | None = None
-    panelType: PanelType | None = None
-    sort: int | None = None
-    count: int | None = None
-    createDate: datetime | None = None
-
-
-class UnifiedDocumentationSystemRequest(BaseModel):
-    id: UUID
-    code: str
-    name: str
-    active: bool
-
-
-class TypicalSummary(BaseModel):
-    id: UUID | None = None
-    summaryText: Annotated[str, Field(max_length=255, min_length=0)]
-    active: bool
-    createDate: datetime | None = None
-
-
-class TypicalSummaryTaskRequest(BaseModel):
-    id: UUID
-    summaryTaskText: str
-    active: bool
-
-
-class TypicalSummaryTaskDto(BaseModel):
-    id: Annotated[
-        UUID | None,
-        Field(description="Идентификатор типового краткого содержания для поручения"),
-    ] = None
-    summaryTaskText: Annotated[
-        str | None,
-        Field(description="Текст типового краткого содержания для поручения"),
-    ] = None
-    active: Annotated[
-        bool | None,
-        Field(
-            description="Признак активно ли типовое краткое содержание для поручения"
-        ),
-    ] = None
-    createDate: datetime | None = None
-
-
-class TypicalControlPointRequest(BaseModel):
-    id: UUID
-    name: str
-    active: bool
-
-
-class TypicalControlPointDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор типовой контрольной точки")
-    ] = None
-    name: Annotated[
-        str | None, Field(description="Текст типовой контрольной точки")
-    ] = None
-    active: Annotated[
-        bool | None, Field(description="Признак активно ли типовая контрольная точка")
-    ] = None
-    createDate: datetime | None = None
-
-
-class SimpleCmsDTO(BaseModel):
-    cms: Annotated[str | None, Field(description="CMS в base64")] = None
-
-
-class TemplateRequest(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор шаблона печатной формы")
-    ] = None
-    templateName: Annotated[
-        str | None, Field(description="Наименование шаблона печатной формы")
-    ] = None
-    docCategoryConstant: DocCategory | None = None
-    active: Annotated[
-        bool | None, Field(description="Признак активен ли шаблон печатной формы")
-    ] = None
-    attachId: UUID | None = None
-
-
-class Template(BaseModel):
-    id: UUID | None = None
-    templateName: str | None = None
-    contentType: ContentType | None = None
-    attachment: Attachment | None = None
-    docCategoryConstant: DocCategory | None = None
-    tag: list[str] | None = None
-    active: bool
-
-
-class TemplateUpdateRequest(BaseModel):
-    template: TemplateRequest
-    attachmentAddId: UUID | None = None
-
-
-class TemplateDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор шаблона печатной формы")
-    ] = None
-    templateName: Annotated[
-        str | None, Field(description="Наименование шаблона печатной формы")
-    ] = None
-    attachment: Annotated[
-        AttachmentDto | None, Field(description="Файл шаблона печатной формы")
-    ] = None
-    docCategoryConstant: DocCategory | None = None
-    active: Annotated[
-        bool | None, Field(description="Признак активен ли шаблон печатной формы")
-    ] = None
-
-
-class TemplateRkkSetupRequest(BaseModel):
-    templateInternId: UUID | None = None
-    templateIncomingId: UUID | None = None
-    templateOutgoingId: UUID | None = None
-    templateAppealId: UUID | None = None
-    templateContractId: UUID | None = None
-
-
-class RecognitionLanguageEnum(Enum):
-    RUS = "RUS"
-    ENG = "ENG"
-
-
-class RecognitionFileTypeEnum(Enum):
-    TIFF = "TIFF"
-    TIF = "TIF"
-    JPEG = "JPEG"
-    JPG = "JPG"
-    BMP = "BMP"
-    PDF = "PDF"
-    GIF = "GIF"
-    PNG = "PNG"
-    DOC = "DOC"
-    DOCX = "DOCX"
-
-
-class RecognitionSetupDto(BaseModel):
-    organizationId: Annotated[
-        str | None,
-        Field(description="Идентификатор организации настройка распознавания"),
-    ] = None
-    organizationName: Annotated[
-        str | None,
-        Field(description="Наименование организации настройки распознавания"),
-    ] = None
-    recognitionLanguage: list[RecognitionLanguageEnum] | None = None
-    docCategoryConstant: list[DocCategory] | None = None
-    recognitionFileType: list[RecognitionFileTypeEnum] | None = None
-    active: Annotated[
-        bool | None, Field(description="Признак активна ли настройка распознавания")
-    ] = None
-
-
-class TemplateContractRequest(BaseModel):
-    id: Annotated[
-        UUID | None,
-        Field(description="Идентификатор шаблона печатной формы для договора"),
-    ] = None
-    name: Annotated[
-        str, Field(description="Наименование шаблона печатной формы для договора")
-    ]
-    active: Annotated[
-        bool, Field(description="Признак активен ли шаблон печатной формы для договора")
-    ]
-
-
-class TemplateContractUpdateRequest(BaseModel):
-    template: TemplateContractRequest
-    attachmentAddIds: list[UUID] | None = None
-
-
-class AttachmentTemplateContractDto(BaseModel):
-    id: Annotated[
-        UUID | None,
-        Field(description="Идентификатор файла шаблона печатной формы для договора"),
-    ] = None
-    name: Annotated[str | None, Field(description="Наименование вложенного файла")] = (
-        None
-    )
-    size: Annotated[int | None, Field(description="Размер вложенного файла")] = None
-
-
-class TemplateContractDto(BaseModel):
-    id: Annotated[
-        UUID | None,
-        Field(description="Идентификатор шаблона печатной формы для договора"),
-    ] = None
-    name: Annotated[
-        str | None,
-        Field(description="Наименование шаблона печатной формы для договора"),
-    ] = None
-    attachments: Annotated[
-        list[AttachmentTemplateContractDto] | None,
-        Field(description="Файл шаблона печатной формы для договора"),
-    ] = None
-    active: Annotated[
-        bool | None,
-        Field(description="Признак активен ли шаблон печатной формы для договора"),
-    ] = None
-
-
-class TaskKanbanColumnDto(BaseModel):
-    id: UUID | None = None
-    employeeId: UUID | None = None
-    name: str | None = None
-    color: str | None = None
-    order: int | None = None
-
-
-class IdUUID(BaseModel):
-    """
-    Идентификатор
-    """
-
-    id: UUID
-
-
-class Status7(Enum):
-    """
-    Статус
-    """
-
-    DRAFT = "DRAFT"
-    NEW = "NEW"
-    SIGNING = "SIGNING"
-    SIGNED = "SIGNED"
-    STATEMENT = "STATEMENT"
-    APPROVED = "APPROVED"
-    REJECT = "REJECT"
-    CANCEL = "CANCEL"
-
-
-class NomenclatureType(Enum):
-    """
-    Тип номенклатуры
-    """
-
-    MAIN = "MAIN"
-    ADDITIONAL = "ADDITIONAL"
-
-
-class Type13(Enum):
-    """
-    Тип этапа процесса
-    """
-
-    NEW = "NEW"
-    SIGNING = "SIGNING"
-    STATEMENT = "STATEMENT"
-
-
-class SummaryNomenclatureDepartmentProcessAction(BaseModel):
-    result: Annotated[
-        bool,
-        Field(description="Признак результата действия положительный/отрицательный"),
-    ]
-    employeeId: Annotated[
-        UUID,
-        Field(
-            description="Идентификатор участника процесса от лица которого делается действие"
-        ),
-    ]
-    comment: Annotated[str | None, Field(description="Комментарий")] = None
-
-
-class SummaryNomenclatureDepartmentRequest(BaseModel):
-    templateId: UUID
-
-
-class SummaryCancelRequest(BaseModel):
-    comment: Annotated[str, Field(min_length=1)]
-
-
-class SummaryInventoryReportEditRequest(BaseModel):
-    number: Annotated[str, Field(description="Номер описи")]
-
-
-class GroupByStoragePeriod1(Enum):
-    """
-    Категория хранения
-    """
-
-    S_T_UP_TO_10_Y = "S_T_UP_TO_10_Y"
-    S_T_OVER_10_Y = "S_T_OVER_10_Y"
-    P_S = "P_S"
-
-
-class SubjectRequest(BaseModel):
-    id: UUID
-    name: str
-    code: int
-    parentSubjectId: UUID | None = None
-    active: bool
-
-
-class StoragePeriodRequest(BaseModel):
-    id: UUID | None = None
-    groupByStoragePeriod: GroupByStoragePeriod | None = None
-    active: bool | None = None
-    byStaff: bool | None = None
-    storageYears: int | None = None
-    yearPostfix: Annotated[
-        YearPostfix | None,
-        Field(description="Добавочный текст к количеству лет хранения"),
-    ] = None
-    storagePeriodType: Annotated[
-        StoragePeriodType | None, Field(description="Другой тип хранения")
-    ] = None
-
-
-class YearPostfix2(Enum):
-    год = "год"
-    года = "года"
-    лет = "лет"
-
-
-class StoragePeriodType2(Enum):
-    Числовой = "Числовой"
-    Постоянно = "Постоянно"
-    До_минования_надобности = "До минования надобности"
-    До_замены_новыми = "До замены новыми"
-
-
-class StoragePeriod(BaseModel):
-    id: UUID | None = None
-    name: Annotated[str, Field(max_length=255, min_length=0)]
-    groupByStoragePeriod: GroupByStoragePeriod
-    active: bool
-    createDate: datetime | None = None
-    byStaff: bool
-    storageYears: Annotated[int | None, Field(ge=1, le=99)] = None
-    yearPostfix: YearPostfix2 | None = None
-    storagePeriodType: StoragePeriodType2
-
-
-class SolutionResultRequest(TypicalControlPointRequest):
-    pass
-
-
-class Type14(Enum):
-    DOCUMENT = "DOCUMENT"
-    TASK = "TASK"
-    TASK_PROJECT = "TASK_PROJECT"
-    NOMENCLATURE_DEPARTMENT = "NOMENCLATURE_DEPARTMENT"
-    SUMMARY_NOMENCLATURE_DEPARTMENT = "SUMMARY_NOMENCLATURE_DEPARTMENT"
-    DESTRUCTION_ACT = "DESTRUCTION_ACT"
-    NOMENCLATURE_AFFAIR = "NOMENCLATURE_AFFAIR"
-    MINI_DOCUMENT = "MINI_DOCUMENT"
-    SYSTEM = "SYSTEM"
-    ACCEPTANCE_INVENTORY = "ACCEPTANCE_INVENTORY"
-    CUSTOM = "CUSTOM"
-    ADDITIONAL_DOCUMENT = "ADDITIONAL_DOCUMENT"
-    CONTRACT = "CONTRACT"
-
-
-class RoleDto(BaseModel):
-    id: UUID | None = None
-    name: Annotated[str | None, Field(max_length=255, min_length=0)] = None
-    systemName: str | None = None
-    system: bool | None = None
-    type: Type14 | None = None
-    systemManage: bool | None = None
-    createDate: datetime | None = None
-
-
-class RoleRequest(BaseModel):
-    id: UUID
-    name: str
-    system: bool | None = None
-    type: Type14 | None = None
-    createDate: datetime | None = None
-
-
-class RoleUpdateRequest(BaseModel):
-    role: RoleRequest
-    groupAdd: Annotated[set[UUID] | None, Field()] = None
-    employeeAdd: Annotated[set[UUID] | None, Field()] = None
-    groupDelete: list[UUID] | None = None
-    employeeDelete: list[UUID] | None = None
-
-
-class Column(Enum):
-    """
-    Перечисление колонок для построения отчета
-    """
-
-    DOC_PROFILE = "DOC_PROFILE"
-    DOC_TYPE = "DOC_TYPE"
-    DOC_CATEGORY = "DOC_CATEGORY"
-    DATE_REG = "DATE_REG"
-    AUTHOR_DOC = "AUTHOR_DOC"
-    REG_NUMBER = "REG_NUMBER"
-    DESTINATION = "DESTINATION"
-    CORRESPONDENT = "CORRESPONDENT"
-    OUTGOING_NUMBER = "OUTGOING_NUMBER"
-    OUTGOING_DATE = "OUTGOING_DATE"
-    SIGNED_BY = "SIGNED_BY"
-    STATUS = "STATUS"
-    EXECUTOR_STAGE = "EXECUTOR_STAGE"
-    DATE_STAGE = "DATE_STAGE"
-    AUTHOR_TASK = "AUTHOR_TASK"
-    TASK_EXECUTOR = "TASK_EXECUTOR"
-    TASK_LEADER = "TASK_LEADER"
-    TASK_NUMBER = "TASK_NUMBER"
-    DOC_SHORT_SUMMARY = "DOC_SHORT_SUMMARY"
-    DATE_TASK_EXECUTE = "DATE_TASK_EXECUTE"
-    TASK_ON_CONTROL = "TASK_ON_CONTROL"
-    DOC_ON_CONTROL = "DOC_ON_CONTROL"
-    DOC_DATE_CONTROL = "DOC_DATE_CONTROL"
-    REPORT_TASK = "REPORT_TASK"
-    TASK_SHORT_SUMMARY = "TASK_SHORT_SUMMARY"
-    CONTRACT_SIGNING_DATE = "CONTRACT_SIGNING_DATE"
-    CONTRACT_START_DATE = "CONTRACT_START_DATE"
-    CONTRACT_DAYS_TO_COMPLETION = "CONTRACT_DAYS_TO_COMPLETION"
-    CONTRACT_SUM = "CONTRACT_SUM"
-    CURRENCY = "CURRENCY"
-    CONTRACT_RECIPIENT = "CONTRACT_RECIPIENT"
-
-
-class Type16(Enum):
-    """
-    Тип отчета
-    """
-
-    DOC = "DOC"
-    TASK = "TASK"
-
-
-class ReportUserField(BaseModel):
-    docProfileName: list[str] | None = None
-    docTypeName: list[str] | None = None
-    destinationId: UUID | None = None
-    signedById: UUID | None = None
-
-
-class ReportUserConfigDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор конфигурации отчета")
-    ] = None
-    type: Annotated[Type16 | None, Field(description="Тип отчета")] = None
-    name: Annotated[str | None, Field(description="Наименование шаблона отчета")] = None
-    employeeId: Annotated[UUID | None, Field(description="Идентификатор автора")] = None
-    fields: Annotated[
-        dict[str, str] | None,
-        Field(description="Перечисление полей для построения отчета"),
-    ] = None
-    userFields: Annotated[
-        ReportUserField | None,
-        Field(description="Дополнительные поля для отображения в генераторе отчетов"),
-    ] = None
-    columns: Annotated[list[Column] | None, Field(description="Колонки для отчета")] = (
-        None
-    )
-
-
-class Id(Enum):
-    """
-    Тип напоминания
-    """
-
-    DEADLINE_CONTROL_DOCUMENT = "DEADLINE_CONTROL_DOCUMENT"
-    DEADLINE_CONTROL_TASK = "DEADLINE_CONTROL_TASK"
-    DEADLINE_EXECUTION_PROCESS = "DEADLINE_EXECUTION_PROCESS"
-    DEADLINE_EXECUTION_TASK = "DEADLINE_EXECUTION_TASK"
-    INACTION_SUMMARY_NOMENCLATURE = "INACTION_SUMMARY_NOMENCLATURE"
-    INACTION_NOMENCLATURE_DEPARTMENT = "INACTION_NOMENCLATURE_DEPARTMENT"
-    INACTION_DESTRUCTION_ACT = "INACTION_DESTRUCTION_ACT"
-    INACTION_ACCEPTANCE_INVENTORY = "INACTION_ACCEPTANCE_INVENTORY"
-    DEADLINE_CONTRACT_DURATION_END = "DEADLINE_CONTRACT_DURATION_END"
-    DEADLINE_EXECUTION_DOCUMENT_CONTROL_POINT = (
-        "DEADLINE_EXECUTION_DOCUMENT_CONTROL_POINT"
-    )
-
-
-class RemindersRulesDto(BaseModel):
-    id: Annotated[Id | None, Field(description="Тип напоминания")] = None
-    organizationId: Annotated[str | None, Field(description="Id организации")] = None
-    cron: Annotated[str | None, Field(description="Время в cron формате")] = None
-    plainDate: Annotated[
-        datetime | None, Field(description="Следующая дата запуска")
-    ] = None
-    days: Annotated[int | None, Field(description="Количество дней до напоминания")] = (
-        None
-    )
-    active: Annotated[bool | None, Field(description="Признак активности")] = None
-    subject: Annotated[str | None, Field(description="Тема напоминания")] = None
-    text: Annotated[str | None, Field(description="Текст напоминания")] = None
-    ignoreWeekends: Annotated[
-        bool | None, Field(description="Признак игнорирования по выходным дням")
-    ] = None
-
-
-class RegionDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор области")] = None
-    nameRegion: Annotated[str | None, Field(description="Наименование области")] = None
-    codeRegion: Annotated[int | None, Field(description="Код области")] = None
-    active: Annotated[
-        bool | None,
-        Field(
-            description="Признак активно ли типовое краткое содержание для поручения"
-        ),
-    ] = None
-    createDate: datetime | None = None
-
-
-class RegistrationJournal(BaseModel):
-    id: UUID | None = None
-    journalName: Annotated[str, Field(max_length=255, min_length=0)]
-    counterValue: int
-    active: bool
-    createDate: datetime | None = None
-
-
-class IdsUUID(BaseModel):
-    """
-    Список идентификаторов
-    """
-
-    ids: Annotated[list[UUID], Field(max_items=2147483647, min_items=1)]
-
-
-class PostRequest(BaseModel):
-    id: int | None = None
-    postName: str | None = None
-    postCode: str | None = None
-
-
-class Id1(Enum):
-    DOC_CONTROL_START = "DOC_CONTROL_START"
-    DOC_CONTROL_END = "DOC_CONTROL_END"
-    DOC_CONTROL_DELETE = "DOC_CONTROL_DELETE"
-    DOC_CONTROL_EDIT_CONTROLLERS = "DOC_CONTROL_EDIT_CONTROLLERS"
-    TASK_CONTROL_START = "TASK_CONTROL_START"
-    TASK_CONTROL_END = "TASK_CONTROL_END"
-    TASK_CONTROL_REMOVE = "TASK_CONTROL_REMOVE"
-    TASK_CONTROL_EDIT_CONTROLLERS = "TASK_CONTROL_EDIT_CONTROLLERS"
-    TASK_CONTROL_AFTER_EXECUTION = "TASK_CONTROL_AFTER_EXECUTION"
-    TASK_FOR_REVISION = "TASK_FOR_REVISION"
-    TASK_CREATE = "TASK_CREATE"
-    TASK_EDIT = "TASK_EDIT"
-    TASK_EDIT_FOR_NEW = "TASK_EDIT_FOR_NEW"
-    TASK_REQUEST_CHANGE_PLANNED_DATE = "TASK_REQUEST_CHANGE_PLANNED_DATE"
-    TASK_CHANGE_PLANNED_DATE = "TASK_CHANGE_PLANNED_DATE"
-    TASK_DECLINE_CHANGE_PLANNED_DATE = "TASK_DECLINE_CHANGE_PLANNED_DATE"
-    TASK_AFTER_EXECUTION_ALL_FOR_DOC_CONTROL = (
-        "TASK_AFTER_EXECUTION_ALL_FOR_DOC_CONTROL"
-    )
-    TASK_AFTER_EXECUTION = "TASK_AFTER_EXECUTION"
-    EXECUTION_START = "EXECUTION_START"
-    REVIEW_START = "REVIEW_START"
-    REGISTRATION_START = "REGISTRATION_START"
-    REGISTRATION_END = "REGISTRATION_END"
-    INTRODUCTION_ADD = "INTRODUCTION_ADD"
-    AGREEMENT_START = "AGREEMENT_START"
-    AGREEMENT_END_SUCCESS = "AGREEMENT_END_SUCCESS"
-    AGREEMENT_END_REJECTED = "AGREEMENT_END_REJECTED"
-    ADDITIONAL_AGREEMENT_START = "ADDITIONAL_AGREEMENT_START"
-    ADDITIONAL_AGREEMENT_APPROVED = "ADDITIONAL_AGREEMENT_APPROVED"
-    ADDITIONAL_AGREEMENT_REJECTED = "ADDITIONAL_AGREEMENT_REJECTED"
-    SIGNING_START = "SIGNING_START"
-    SIGNING_END_SUCCESS = "SIGNING_END_SUCCESS"
-    SIGNING_END_REJECTED = "SIGNING_END_REJECTED"
-    STATEMENT_START = "STATEMENT_START"
-    STATEMENT_END_SUCCESS = "STATEMENT_END_SUCCESS"
-    STATEMENT_END_REJECTED = "STATEMENT_END_REJECTED"
-    DISPATCH_START = "DISPATCH_START"
-    DISPATCH_END = "DISPATCH_END"
-    DISPATCH_TO_EXTERNAL = "DISPATCH_TO_EXTERNAL"
-    DOCUMENT_REDIRECT_ON_REVIEW = "DOCUMENT_REDIRECT_ON_REVIEW"
-    MEETING_START = "MEETING_START"
-    MEETING_EDIT = "MEETING_EDIT"
-    MEETING_CANCEL = "MEETING_CANCEL"
-    ACCEPTANCE_START = "ACCEPTANCE_START"
-    MEETING_PAPERWORK_START = "MEETING_PAPERWORK_START"
-    ACCEPTANCE_END = "ACCEPTANCE_END"
-    ACCEPTANCE_END_REJECTED = "ACCEPTANCE_END_REJECTED"
-    MEETING_QUESTION = "MEETING_QUESTION"
-    AGREEMENT_QUESTION_END = "AGREEMENT_QUESTION_END"
-    AGREEMENT_QUESTION_END_REJECTED = "AGREEMENT_QUESTION_END_REJECTED"
-    STATEMENT_QUESTION_END = "STATEMENT_QUESTION_END"
-    STATEMENT_QUESTION_END_REJECTED = "STATEMENT_QUESTION_END_REJECTED"
-    TASK_PROJECT_CREATE = "TASK_PROJECT_CREATE"
-    DEADLINE_CONTROL_DOCUMENT = "DEADLINE_CONTROL_DOCUMENT"
-    DEADLINE_CONTROL_TASK = "DEADLINE_CONTROL_TASK"
-    DEADLINE_EXECUTION_PROCESS = "DEADLINE_EXECUTION_PROCESS"
-    DEADLINE_EXECUTION_TASK = "DEADLINE_EXECUTION_TASK"
-    DEADLINE_EXECUTION_DOCUMENT_CONTROL_POINT = (
-        "DEADLINE_EXECUTION_DOCUMENT_CONTROL_POINT"
-    )
-    INACTION_SUMMARY_NOMENCLATURE = "INACTION_SUMMARY_NOMENCLATURE"
-    INACTION_NOMENCLATURE_DEPARTMENT = "INACTION_NOMENCLATURE_DEPARTMENT"
-    INACTION_DESTRUCTION_ACT = "INACTION_DESTRUCTION_ACT"
-    INACTION_ACCEPTANCE_INVENTORY = "INACTION_ACCEPTANCE_INVENTORY"
-    DEADLINE_CONTRACT_DURATION_END = "DEADLINE_CONTRACT_DURATION_END"
-    INCOMING_NEW_AISMV_DOCUMENT = "INCOMING_NEW_AISMV_DOCUMENT"
-    AUTHOR_SMDO_DOCUMENT_ERROR = "AUTHOR_SMDO_DOCUMENT_ERROR"
-    AUTHOR_SMDO_ACCEPT_ACK_ERROR = "AUTHOR_SMDO_ACCEPT_ACK_ERROR"
-    AUTHOR_SMDO_REG_ACK_ERROR = "AUTHOR_SMDO_REG_ACK_ERROR"
-    AUTHOR_SMDO_REG_REJECT_ACK_ERROR = "AUTHOR_SMDO_REG_REJECT_ACK_ERROR"
-    REPORT_COMPLETE = "REPORT_COMPLETE"
-    REPORT_ERROR = "REPORT_ERROR"
-    REPORT_EMPTY = "REPORT_EMPTY"
-    NOTIFY_AUTHOR_INITIATE_SEND = "NOTIFY_AUTHOR_INITIATE_SEND"
-    NOMENCLATURE_DEPARTMENT_SIGNING_START = "NOMENCLATURE_DEPARTMENT_SIGNING_START"
-    NOMENCLATURE_DEPARTMENT_SIGNING_END_SUCCESS = (
-        "NOMENCLATURE_DEPARTMENT_SIGNING_END_SUCCESS"
-    )
-    NOMENCLATURE_DEPARTMENT_SIGNING_END_REJECTED = (
-        "NOMENCLATURE_DEPARTMENT_SIGNING_END_REJECTED"
-    )
-    NOMENCLATURE_DEPARTMENT_AGREEMENT_START = "NOMENCLATURE_DEPARTMENT_AGREEMENT_START"
-    NOMENCLATURE_DEPARTMENT_AGREEMENT_END_SUCCESS = (
-        "NOMENCLATURE_DEPARTMENT_AGREEMENT_END_SUCCESS"
-    )
-    NOMENCLATURE_DEPARTMENT_AGREEMENT_END_REJECTED = (
-        "NOMENCLATURE_DEPARTMENT_AGREEMENT_END_REJECTED"
-    )
-    SUMMARY_NOMENCLATURE_SIGNING_START = "SUMMARY_NOMENCLATURE_SIGNING_START"
-    SUMMARY_NOMENCLATURE_SIGNING_END_SUCCESS = (
-        "SUMMARY_NOMENCLATURE_SIGNING_END_SUCCESS"
-    )
-    SUMMARY_NOMENCLATURE_SIGNING_END_REJECTED = (
-        "SUMMARY_NOMENCLATURE_SIGNING_END_REJECTED"
-    )
-    SUMMARY_NOMENCLATURE_STATEMENT_START = "SUMMARY_NOMENCLATURE_STATEMENT_START"
-    SUMMARY_NOMENCLATURE_STATEMENT_END_SUCCESS = (
-        "SUMMARY_NOMENCLATURE_STATEMENT_END_SUCCESS"
-    )
-    SUMMARY_NOMENCLATURE_STATEMENT_END_REJECTED = (
-        "SUMMARY_NOMENCLATURE_STATEMENT_END_REJECTED"
-    )
-    SUMMARY_NOMENCLATURE_INTRODUCTION_ADD = "SUMMARY_NOMENCLATURE_INTRODUCTION_ADD"
-    DESTRUCTION_ACT_SIGNING_START = "DESTRUCTION_ACT_SIGNING_START"
-    DESTRUCTION_ACT_SIGNING_END_SUCCESS = "DESTRUCTION_ACT_SIGNING_END_SUCCESS"
-    DESTRUCTION_ACT_SIGNING_END_REJECTED = "DESTRUCTION_ACT_SIGNING_END_REJECTED"
-    DESTRUCTION_ACT_AGREEMENT_START = "DESTRUCTION_ACT_AGREEMENT_START"
-    DESTRUCTION_ACT_AGREEMENT_END_SUCCESS = "DESTRUCTION_ACT_AGREEMENT_END_SUCCESS"
-    DESTRUCTION_ACT_AGREEMENT_END_REJECTED = "DESTRUCTION_ACT_AGREEMENT_END_REJECTED"
-    DESTRUCTION_ACT_STATEMENT_START = "DESTRUCTION_ACT_STATEMENT_START"
-    DESTRUCTION_ACT_STATEMENT_END_SUCCESS = "DESTRUCTION_ACT_STATEMENT_END_SUCCESS"
-    DESTRUCTION_ACT_STATEMENT_END_REJECTED = "DESTRUCTION_ACT_STATEMENT_END_REJECTED"
-    DESTRUCTION_ACT_CANCELLED = "DESTRUCTION_ACT_CANCELLED"
-    DESTRUCTION_ACT_COMPLETED = "DESTRUCTION_ACT_COMPLETED"
-    ACCEPTANCE_INVENTORY_SIGNING_START = "ACCEPTANCE_INVENTORY_SIGNING_START"
-    ACCEPTANCE_INVENTORY_SIGNING_END_SUCCESS = (
-        "ACCEPTANCE_INVENTORY_SIGNING_END_SUCCESS"
-    )
-    ACCEPTANCE_INVENTORY_SIGNING_END_REJECTED = (
-        "ACCEPTANCE_INVENTORY_SIGNING_END_REJECTED"
-    )
-    ACCEPTANCE_INVENTORY_STATEMENT_START = "ACCEPTANCE_INVENTORY_STATEMENT_START"
-    ACCEPTANCE_INVENTORY_STATEMENT_END_SUCCESS = (
-        "ACCEPTANCE_INVENTORY_STATEMENT_END_SUCCESS"
-    )
-    ACCEPTANCE_INVENTORY_STATEMENT_END_REJECTED = (
-        "ACCEPTANCE_INVENTORY_STATEMENT_END_REJECTED"
-    )
-    ACCEPTANCE_INVENTORY_AGREEMENT_START = "ACCEPTANCE_INVENTORY_AGREEMENT_START"
-    ACCEPTANCE_INVENTORY_AGREEMENT_END_SUCCESS = (
-        "ACCEPTANCE_INVENTORY_AGREEMENT_END_SUCCESS"
-    )
-    ACCEPTANCE_INVENTORY_AGREEMENT_END_REJECTED = (
-        "ACCEPTANCE_INVENTORY_AGREEMENT_END_REJECTED"
-    )
-    CONTROL_POINT_EXECUTION_END_SUCCESS = "CONTROL_POINT_EXECUTION_END_SUCCESS"
-    CONTROL_POINT_ADD_RESPONSIBLE = "CONTROL_POINT_ADD_RESPONSIBLE"
-    CONTROL_POINT_FOR_REVISION = "CONTROL_POINT_FOR_REVISION"
-    CONTRACT_EXECUTION_START = "CONTRACT_EXECUTION_START"
-    CONTRACT_EXECUTION_END_SUCCESS = "CONTRACT_EXECUTION_END_SUCCESS"
-
-
-class PersonalNotificationSettingDto(BaseModel):
-    id: Id1 | None = None
-    email: bool | None = None
-    userNotification: bool | None = None
-    name: str | None = None
-
-
-class Localization(Enum):
-    RU = "RU"
-    EN = "EN"
-    GE = "GE"
-
-
-class DefaultSignType(Enum):
-    TOKEN = "TOKEN"
-    KTA = "KTA"
-
-
-class ScanSettingJsonB(BaseModel):
-    duplex: bool | None = None
-    scanWia: bool | None = None
-    paperSize: int | None = None
-    pixelType: int | None = None
-    resolution: int | None = None
-    bitDepth: int | None = None
-    autoDeskew: int | None = None
-    widgets: bool | None = None
-    hideCategories: bool | None = None
-    docEllipsis: bool | None = None
-    docEllipsisRow: int | None = None
-    showEventDesign: bool | None = None
-    showCollegiate: bool | None = None
-    showMeeting: bool | None = None
-    showAppeal: bool | None = None
-    showIncoming: bool | None = None
-    showInternal: bool | None = None
-    showOutgoing: bool | None = None
-    showNomenclatureAffair: bool | None = None
-    showNomenclatureDepartment: bool | None = None
-    showSummaryNomenclatureDepartment: bool | None = None
-    showAcceptanceInventory: bool | None = None
-    showDestructionAct: bool | None = None
-    showContract: bool | None = None
-    showCustomDocument: bool | None = None
-    showArchiveAffairs: bool | None = None
-    defaultSignType: DefaultSignType | None = None
-
-
-class PersonalSetupDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор")] = None
-    setting: Annotated[ScanSettingJsonB | None, Field(description="Настройки")] = None
-    notifications: list[PersonalNotificationSettingDto] | None = None
-    notify: Annotated[
-        bool | None, Field(description="Уведомлять ли сотрудника сообщениями на почту")
-    ] = None
-    localization: Localization | None = None
-
-
-class PersonalSetupLocalizationRequest(BaseModel):
-    localization: Localization
-
-
-class Type18(Enum):
-    """
-    Тип
-    """
-
-    DIRECTORY = "DIRECTORY"
-    DOCUMENT = "DOCUMENT"
-    NOMENCLATURE_DEPARTMENT = "NOMENCLATURE_DEPARTMENT"
-    SUMMARY_NOMENCLATURE_DEPARTMENT = "SUMMARY_NOMENCLATURE_DEPARTMENT"
-    DESTRUCTION_ACT = "DESTRUCTION_ACT"
-    ACCEPTANCE_INVENTORY = "ACCEPTANCE_INVENTORY"
-    NOMENCLATURE_AFFAIR = "NOMENCLATURE_AFFAIR"
-    MINI_DOCUMENT = "MINI_DOCUMENT"
-    TASK = "TASK"
-    CONTROL_POINT = "CONTROL_POINT"
-
-
-class DocStatus(Enum):
-    """
-    Статус документа
-    """
-
-    DRAFT = "DRAFT"
-    NEW = "NEW"
-    STATEMENT = "STATEMENT"
-    APPROVED = "APPROVED"
-    SIGNING = "SIGNING"
-    SIGNED = "SIGNED"
-    AGREEMENT = "AGREEMENT"
-    AGREED = "AGREED"
-    REVIEW = "REVIEW"
-    REVIEWED = "REVIEWED"
-    REGISTRATION = "REGISTRATION"
-    REGISTERED = "REGISTERED"
-    EXECUTION = "EXECUTION"
-    EXECUTED = "EXECUTED"
-    DISPATCH = "DISPATCH"
-    SENT = "SENT"
-    REJECT = "REJECT"
-    CANCEL = "CANCEL"
-    PREPARATION = "PREPARATION"
-    PAPERWORK = "PAPERWORK"
-    FORMALIZED = "FORMALIZED"
-    ACCEPTANCE = "ACCEPTANCE"
-    ACCEPTED = "ACCEPTED"
-    CONTRACT_EXECUTION = "CONTRACT_EXECUTION"
-    CONTRACT_CLOSED = "CONTRACT_CLOSED"
-    ARCHIVE = "ARCHIVE"
-    DELETED = "DELETED"
-    ALL = "ALL"
-
-
-class ResolvePolicy(Enum):
-    """
-    Политики обработки доступа
-    """
-
-    ANY = "ANY"
-    MERGE = "MERGE"
-
-
-class CreateType3(Enum):
-    """
-    Типсоздания документа
-    """
-
-    MANUAL = "MANUAL"
-    AISMV = "AISMV"
-    DIRECTUM = "DIRECTUM"
-
-
-class NomenclatureDepartmentStatus(Enum):
-    """
-    Статус нумераторы подразделения
-    """
-
-    NEW = "NEW"
-    SIGNING = "SIGNING"
-    SIGNED = "SIGNED"
-    AGREEMENT = "AGREEMENT"
-    AGREED = "AGREED"
-    DELETED = "DELETED"
-    CANCEL = "CANCEL"
-
-
-class SummaryNomenclatureDepartmentStatus(Enum):
-    """
-    Сводный статус подразделения
-    """
-
-    DRAFT = "DRAFT"
-    NEW = "NEW"
-    SIGNING = "SIGNING"
-    SIGNED = "SIGNED"
-    STATEMENT = "STATEMENT"
-    APPROVED = "APPROVED"
-    REJECT = "REJECT"
-    CANCEL = "CANCEL"
-
-
-class DestructionActStatus(Enum):
-    """
-    Статус акта уничтожения
-    """
-
-    NEW = "NEW"
-    AGREEMENT = "AGREEMENT"
-    AGREED = "AGREED"
-    SIGNING = "SIGNING"
-    SIGNED = "SIGNED"
-    STATEMENT = "STATEMENT"
-    APPROVED = "APPROVED"
-    CANCEL = "CANCEL"
-
-
-class Merge(Enum):
-    """
-    Политика обработки слияния ИД
-    """
-
-    ALL = "ALL"
-    SELF = "SELF"
-    SELF_AND_IO = "SELF_AND_IO"
-    SUBORDINATES_AND_SELF = "SUBORDINATES_AND_SELF"
-    SUBORDINATES_AND_SELF_AND_IO = "SUBORDINATES_AND_SELF_AND_IO"
-
-
-class RoleMergeDto(BaseModel):
-    roleId: Annotated[UUID | None, Field(description="ИД роли")] = None
-    merge: Annotated[
-        Merge | None, Field(description="Политика обработки слияния ИД")
-    ] = None
-
-
-class OaisSmdoSubscriberConfigDto(BaseModel):
-    enabled: bool | None = None
-    delta: datetime | None = None
-    protocol: str | None = None
-    server: str | None = None
-    path: str | None = None
-    login: str | None = None
-    password: str | None = None
-    authPath: str | None = None
-
-
-class OaisSmdoSedTypeConfigDto(OaisSmdoSubscriberConfigDto):
-    pass
-
-
-class OaisSmdoFileTypeConfigDto(OaisSmdoSubscriberConfigDto):
-    pass
-
-
-class OaisSmdoDocTypeConfigDto(OaisSmdoSubscriberConfigDto):
-    pass
-
-
-class OaisApimAuthConfigDto(BaseModel):
-    login: str | None = None
-    password: str | None = None
-    protocol: str | None = None
-    server: str | None = None
-    path: str | None = None
-
-
-class RuleType(Enum):
-    """
-    Тип отправки уведомления
-    """
-
-    DOC_CONTROL_START = "DOC_CONTROL_START"
-    DOC_CONTROL_END = "DOC_CONTROL_END"
-    DOC_CONTROL_DELETE = "DOC_CONTROL_DELETE"
-    DOC_CONTROL_EDIT_CONTROLLERS = "DOC_CONTROL_EDIT_CONTROLLERS"
-    TASK_CONTROL_START = "TASK_CONTROL_START"
-    TASK_CONTROL_END = "TASK_CONTROL_END"
-    TASK_CONTROL_REMOVE = "TASK_CONTROL_REMOVE"
-    TASK_CONTROL_EDIT_CONTROLLERS = "TASK_CONTROL_EDIT_CONTROLLERS"
-    TASK_CONTROL_AFTER_EXECUTION = "TASK_CONTROL_AFTER_EXECUTION"
-    TASK_FOR_REVISION = "TASK_FOR_REVISION"
-    TASK_CREATE = "TASK_CREATE"
-    TASK_EDIT = "TASK_EDIT"
-    TASK_EDIT_FOR_NEW = "TASK_EDIT_FOR_NEW"
-    TASK_REQUEST_CHANGE_PLANNED_DATE = "TASK_REQUEST_CHANGE_PLANNED_DATE"
-    TASK_CHANGE_PLANNED_DATE = "TASK_CHANGE_PLANNED_DATE"
-    TASK_DECLINE_CHANGE_PLANNED_DATE = "TASK_DECLINE_CHANGE_PLANNED_DATE"
-    TASK_AFTER_EXECUTION_ALL_FOR_DOC_CONTROL = (
-        "TASK_AFTER_EXECUTION_ALL_FOR_DOC_CONTROL"
-    )
-    TASK_AFTER_EXECUTION = "TASK_AFTER_EXECUTION"
-    EXECUTION_START = "EXECUTION_START"
-    REVIEW_START = "REVIEW_START"
-    REGISTRATION_START = "REGISTRATION_START"
-    REGISTRATION_END = "REGISTRATION_END"
-    INTRODUCTION_ADD = "INTRODUCTION_ADD"
-    AGREEMENT_START = "AGREEMENT_START"
-    AGREEMENT_END_SUCCESS = "AGREEMENT_END_SUCCESS"
-    AGREEMENT_END_REJECTED = "AGREEMENT_END_REJECTED"
-    ADDITIONAL_AGREEMENT_START = "ADDITIONAL_AGREEMENT_START"
-    ADDITIONAL_AGREEMENT_APPROVED = "ADDITIONAL_AGREEMENT_APPROVED"
-    ADDITIONAL_AGREEMENT_REJECTED = "ADDITIONAL_AGREEMENT_REJECTED"
-    SIGNING_START = "SIGNING_START"
-    SIGNING_END_SUCCESS = "SIGNING_END_SUCCESS"
-    SIGNING_END_REJECTED = "SIGNING_END_REJECTED"
-    STATEMENT_START = "STATEMENT_START"
-    STATEMENT_END_SUCCESS = "STATEMENT_END_SUCCESS"
-    STATEMENT_END_REJECTED = "STATEMENT_END_REJECTED"
-    DISPATCH_START = "DISPATCH_START"
-    DISPATCH_END = "DISPATCH_END"
-    DISPATCH_TO_EXTERNAL = "DISPATCH_TO_EXTERNAL"
-    DOCUMENT_REDIRECT_ON_REVIEW = "DOCUMENT_REDIRECT_ON_REVIEW"
-    MEETING_START = "MEETING_START"
-    MEETING_EDIT = "MEETING_EDIT"
-    MEETING_CANCEL = "MEETING_CANCEL"
-    ACCEPTANCE_START = "ACCEPTANCE_START"
-    MEETING_PAPERWORK_START = "MEETING_PAPERWORK_START"
-    ACCEPTANCE_END = "ACCEPTANCE_END"
-    ACCEPTANCE_END_REJECTED = "ACCEPTANCE_END_REJECTED"
-    MEETING_QUESTION = "MEETING_QUESTION"
-    AGREEMENT_QUESTION_END = "AGREEMENT_QUESTION_END"
-    AGREEMENT_QUESTION_END_REJECTED = "AGREEMENT_QUESTION_END_REJECTED"
-    STATEMENT_QUESTION_END = "STATEMENT_QUESTION_END"
-    STATEMENT_QUESTION_END_REJECTED = "STATEMENT_QUESTION_END_REJECTED"
-    TASK_PROJECT_CREATE = "TASK_PROJECT_CREATE"
-    DEADLINE_CONTROL_DOCUMENT = "DEADLINE_CONTROL_DOCUMENT"
-    DEADLINE_CONTROL_TASK = "DEADLINE_CONTROL_TASK"
-    DEADLINE_EXECUTION_PROCESS = "DEADLINE_EXECUTION_PROCESS"
-    DEADLINE_EXECUTION_TASK = "DEADLINE_EXECUTION_TASK"
-    DEADLINE_EXECUTION_DOCUMENT_CONTROL_POINT = (
-        "DEADLINE_EXECUTION_DOCUMENT_CONTROL_POINT"
-    )
-    INACTION_SUMMARY_NOMENCLATURE = "INACTION_SUMMARY_NOMENCLATURE"
-    INACTION_NOMENCLATURE_DEPARTMENT = "INACTION_NOMENCLATURE_DEPARTMENT"
-    INACTION_DESTRUCTION_ACT = "INACTION_DESTRUCTION_ACT"
-    INACTION_ACCEPTANCE_INVENTORY = "INACTION_ACCEPTANCE_INVENTORY"
-    DEADLINE_CONTRACT_DURATION_END = "DEADLINE_CONTRACT_DURATION_END"
-    INCOMING_NEW_AISMV_DOCUMENT = "INCOMING_NEW_AISMV_DOCUMENT"
-    AUTHOR_SMDO_DOCUMENT_ERROR = "AUTHOR_SMDO_DOCUMENT_ERROR"
-    AUTHOR_SMDO_ACCEPT_ACK_ERROR = "AUTHOR_SMDO_ACCEPT_ACK_ERROR"
-    AUTHOR_SMDO_REG_ACK_ERROR = "AUTHOR_SMDO_REG_ACK_ERROR"
-    AUTHOR_SMDO_REG_REJECT_ACK_ERROR = "AUTHOR_SMDO_REG_REJECT_ACK_ERROR"
-    REPORT_COMPLETE = "REPORT_COMPLETE"
-    REPORT_ERROR = "REPORT_ERROR"
-    REPORT_EMPTY = "REPORT_EMPTY"
-    NOTIFY_AUTHOR_INITIATE_SEND = "NOTIFY_AUTHOR_INITIATE_SEND"
-    NOMENCLATURE_DEPARTMENT_SIGNING_START = "NOMENCLATURE_DEPARTMENT_SIGNING_START"
-    NOMENCLATURE_DEPARTMENT_SIGNING_END_SUCCESS = (
-        "NOMENCLATURE_DEPARTMENT_SIGNING_END_SUCCESS"
-    )
-    NOMENCLATURE_DEPARTMENT_SIGNING_END_REJECTED = (
-        "NOMENCLATURE_DEPARTMENT_SIGNING_END_REJECTED"
-    )
-    NOMENCLATURE_DEPARTMENT_AGREEMENT_START = "NOMENCLATURE_DEPARTMENT_AGREEMENT_START"
-    NOMENCLATURE_DEPARTMENT_AGREEMENT_END_SUCCESS = (
-        "NOMENCLATURE_DEPARTMENT_AGREEMENT_END_SUCCESS"
-    )
-    NOMENCLATURE_DEPARTMENT_AGREEMENT_END_REJECTED = (
-        "NOMENCLATURE_DEPARTMENT_AGREEMENT_END_REJECTED"
-    )
-    SUMMARY_NOMENCLATURE_SIGNING_START = "SUMMARY_NOMENCLATURE_SIGNING_START"
-    SUMMARY_NOMENCLATURE_SIGNING_END_SUCCESS = (
-        "SUMMARY_NOMENCLATURE_SIGNING_END_SUCCESS"
-    )
-    SUMMARY_NOMENCLATURE_SIGNING_END_REJECTED = (
-        "SUMMARY_NOMENCLATURE_SIGNING_END_REJECTED"
-    )
-    SUMMARY_NOMENCLATURE_STATEMENT_START = "SUMMARY_NOMENCLATURE_STATEMENT_START"
-    SUMMARY_NOMENCLATURE_STATEMENT_END_SUCCESS = (
-        "SUMMARY_NOMENCLATURE_STATEMENT_END_SUCCESS"
-    )
-    SUMMARY_NOMENCLATURE_STATEMENT_END_REJECTED = (
-        "SUMMARY_NOMENCLATURE_STATEMENT_END_REJECTED"
-    )
-    SUMMARY_NOMENCLATURE_INTRODUCTION_ADD = "SUMMARY_NOMENCLATURE_INTRODUCTION_ADD"
-    DESTRUCTION_ACT_SIGNING_START = "DESTRUCTION_ACT_SIGNING_START"
-    DESTRUCTION_ACT_SIGNING_END_SUCCESS = "DESTRUCTION_ACT_SIGNING_END_SUCCESS"
-    DESTRUCTION_ACT_SIGNING_END_REJECTED = "DESTRUCTION_ACT_SIGNING_END_REJECTED"
-    DESTRUCTION_ACT_AGREEMENT_START = "DESTRUCTION_ACT_AGREEMENT_START"
-    DESTRUCTION_ACT_AGREEMENT_END_SUCCESS = "DESTRUCTION_ACT_AGREEMENT_END_SUCCESS"
-    DESTRUCTION_ACT_AGREEMENT_END_REJECTED = "DESTRUCTION_ACT_AGREEMENT_END_REJECTED"
-    DESTRUCTION_ACT_STATEMENT_START = "DESTRUCTION_ACT_STATEMENT_START"
-    DESTRUCTION_ACT_STATEMENT_END_SUCCESS = "DESTRUCTION_ACT_STATEMENT_END_SUCCESS"
-    DESTRUCTION_ACT_STATEMENT_END_REJECTED = "DESTRUCTION_ACT_STATEMENT_END_REJECTED"
-    DESTRUCTION_ACT_CANCELLED = "DESTRUCTION_ACT_CANCELLED"
-    DESTRUCTION_ACT_COMPLETED = "DESTRUCTION_ACT_COMPLETED"
-    ACCEPTANCE_INVENTORY_SIGNING_START = "ACCEPTANCE_INVENTORY_SIGNING_START"
-    ACCEPTANCE_INVENTORY_SIGNING_END_SUCCESS = (
-        "ACCEPTANCE_INVENTORY_SIGNING_END_SUCCESS"
-    )
-    ACCEPTANCE_INVENTORY_SIGNING_END_REJECTED = (
-        "ACCEPTANCE_INVENTORY_SIGNING_END_REJECTED"
-    )
-    ACCEPTANCE_INVENTORY_STATEMENT_START = "ACCEPTANCE_INVENTORY_STATEMENT_START"
-    ACCEPTANCE_INVENTORY_STATEMENT_END_SUCCESS = (
-        "ACCEPTANCE_INVENTORY_STATEMENT_END_SUCCESS"
-    )
-    ACCEPTANCE_INVENTORY_STATEMENT_END_REJECTED = (
-        "ACCEPTANCE_INVENTORY_STATEMENT_END_REJECTED"
-    )
-    ACCEPTANCE_INVENTORY_AGREEMENT_START = "ACCEPTANCE_INVENTORY_AGREEMENT_START"
-    ACCEPTANCE_INVENTORY_AGREEMENT_END_SUCCESS = (
-        "ACCEPTANCE_INVENTORY_AGREEMENT_END_SUCCESS"
-    )
-    ACCEPTANCE_INVENTORY_AGREEMENT_END_REJECTED = (
-        "ACCEPTANCE_INVENTORY_AGREEMENT_END_REJECTED"
-    )
-    CONTROL_POINT_EXECUTION_END_SUCCESS = "CONTROL_POINT_EXECUTION_END_SUCCESS"
-    CONTROL_POINT_ADD_RESPONSIBLE = "CONTROL_POINT_ADD_RESPONSIBLE"
-    CONTROL_POINT_FOR_REVISION = "CONTROL_POINT_FOR_REVISION"
-    CONTRACT_EXECUTION_START = "CONTRACT_EXECUTION_START"
-    CONTRACT_EXECUTION_END_SUCCESS = "CONTRACT_EXECUTION_END_SUCCESS"
-
-
-class Destination(Enum):
-    """
-    Тип адресата
-    """
-
-    DOC_CONTROLLER = "DOC_CONTROLLER"
-    TASK_CONTROLLER = "TASK_CONTROLLER"
-    TASK_EXECUTORS = "TASK_EXECUTORS"
-    DOC_EXECUTORS = "DOC_EXECUTORS"
-    REVIEW_EXECUTOR = "REVIEW_EXECUTOR"
-    DOC_INTRODUCTION_USER = "DOC_INTRODUCTION_USER"
-    DOC_ADDITIONAL_AGREEMENT_USER = "DOC_ADDITIONAL_AGREEMENT_USER"
-    ADDITIONAL_AGREEMENT_INITIATOR = "ADDITIONAL_AGREEMENT_INITIATOR"
-    DOC_AUTHOR = "DOC_AUTHOR"
-    TASK_AUTHOR = "TASK_AUTHOR"
-    TASK_PROJECT_AUTHOR = "TASK_PROJECT_AUTHOR"
-    MEETING_SELECTED_PARTICIPANTS = "MEETING_SELECTED_PARTICIPANTS"
-    MEETING_PARTICIPANTS = "MEETING_PARTICIPANTS"
-    QUESTION_INITIATOR = "QUESTION_INITIATOR"
-    QUESTION_AUTHOR = "QUESTION_AUTHOR"
-    MEETING_QUESTION_ALL = "MEETING_QUESTION_ALL"
-    QUESTION_RESPONSIBLE = "QUESTION_RESPONSIBLE"
-    QUESTION_AUTHOR_QUESTION_RESPONSIBLE = "QUESTION_AUTHOR_QUESTION_RESPONSIBLE"
-    REPORT_AUTHOR = "REPORT_AUTHOR"
-    NOMENCLATURE_DEPARTMENT_PROCESS_EXECUTOR = (
-        "NOMENCLATURE_DEPARTMENT_PROCESS_EXECUTOR"
-    )
-    NOMENCLATURE_DEPARTMENT_AUTHOR = "NOMENCLATURE_DEPARTMENT_AUTHOR"
-    SUMMARY_NOMENCLATURE_PROCESS_EXECUTOR = "SUMMARY_NOMENCLATURE_PROCESS_EXECUTOR"
-    SUMMARY_NOMENCLATURE_AUTHOR = "SUMMARY_NOMENCLATURE_AUTHOR"
-    SUMMARY_NOMENCLATURE_INTRODUCTION_USER = "SUMMARY_NOMENCLATURE_INTRODUCTION_USER"
-    DESTRUCTION_ACT_PROCESS_EXECUTOR = "DESTRUCTION_ACT_PROCESS_EXECUTOR"
-    ACCEPTANCE_INVENTORY_PROCESS_EXECUTOR = "ACCEPTANCE_INVENTORY_PROCESS_EXECUTOR"
-    ACCEPTANCE_INVENTORY_AUTHOR = "ACCEPTANCE_INVENTORY_AUTHOR"
-    DESTRUCTION_ACT_AUTHOR = "DESTRUCTION_ACT_AUTHOR"
-    RESPONSIBLE_EXECUTOR = "RESPONSIBLE_EXECUTOR"
-    CONTRACT_RESPONSIBLE = "CONTRACT_RESPONSIBLE"
-    CONTRACT_RESPONSIBLE_AND_DOC_AUTHOR = "CONTRACT_RESPONSIBLE_AND_DOC_AUTHOR"
-
-
-class NotificationsRulesDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор заявки")] = None
-    organizationId: Annotated[
-        str | None, Field(description="Идентификатор организации")
-    ] = None
-    ruleType: Annotated[
-        RuleType | None, Field(description="Тип отправки уведомления")
-    ] = None
-    destination: Annotated[Destination | None, Field(description="Тип адресата")] = None
-    ruleTypeText: Annotated[
-        str | None, Field(description="Тип отправки уведомления (Текстом)")
-    ] = None
-    destinationText: Annotated[
-        str | None, Field(description="Тип адресата (Текстом)")
-    ] = None
-    subject: Annotated[str | None, Field(description="Тема уведомления")] = None
-    text: Annotated[str | None, Field(description="Текст уведомления")] = None
-    active: Annotated[bool | None, Field(description="Признак активности правила")] = (
-        None
-    )
-
-
-class NomenclatureShelvingShelveRequest(BaseModel):
-    id: UUID
-    fundId: UUID
-    shelvingName: str
-    shelveName: str
-    active: bool
-
-
-class OperationType(Enum):
-    """
-    Тип операции
-    """
-
-    NOMENCLATURE_DEPARTMENT_READ = "NOMENCLATURE_DEPARTMENT_READ"
-    NOMENCLATURE_DEPARTMENT_MAIN_FIELDS_UPDATE = (
-        "NOMENCLATURE_DEPARTMENT_MAIN_FIELDS_UPDATE"
-    )
-    NOMENCLATURE_DEPARTMENT_TABLE_UPDATE = "NOMENCLATURE_DEPARTMENT_TABLE_UPDATE"
-    NOMENCLATURE_DEPARTMENT_PROCESS_EXECUTORS_UPDATE = (
-        "NOMENCLATURE_DEPARTMENT_PROCESS_EXECUTORS_UPDATE"
-    )
-    NOMENCLATURE_DEPARTMENT_PROCESS_ITEM_UPDATE = (
-        "NOMENCLATURE_DEPARTMENT_PROCESS_ITEM_UPDATE"
-    )
-    NOMENCLATURE_DEPARTMENT_START = "NOMENCLATURE_DEPARTMENT_START"
-    NOMENCLATURE_DEPARTMENT_SIGNING = "NOMENCLATURE_DEPARTMENT_SIGNING"
-    NOMENCLATURE_DEPARTMENT_AGREEMENT = "NOMENCLATURE_DEPARTMENT_AGREEMENT"
-    NOMENCLATURE_DEPARTMENT_SIGNING_ECP = "NOMENCLATURE_DEPARTMENT_SIGNING_ECP"
-    NOMENCLATURE_DEPARTMENT_DELETE_ECP = "NOMENCLATURE_DEPARTMENT_DELETE_ECP"
-    NOMENCLATURE_DEPARTMENT_DELETE = "NOMENCLATURE_DEPARTMENT_DELETE"
-    NOMENCLATURE_DEPARTMENT_CANCEL = "NOMENCLATURE_DEPARTMENT_CANCEL"
-
-
-class NomDepOperation(BaseModel):
-    operationType: Annotated[OperationType, Field(description="Тип операции")]
-    body: Annotated[Any | None, Field(description="Тело операции")] = None
-
-
-class Status8(Enum):
-    NEW = "NEW"
-    SIGNING = "SIGNING"
-    SIGNED = "SIGNED"
-    AGREEMENT = "AGREEMENT"
-    AGREED = "AGREED"
-    DELETED = "DELETED"
-    CANCEL = "CANCEL"
-
-
-class NomenclatureDepartmentEntryDto(BaseModel):
-    id: Annotated[UUID, Field(description="Идендификатор")]
-    name: Annotated[str, Field(description="Заголовок дела", min_length=1)]
-    index: Annotated[str, Field(description="Индекс дела", min_length=1)]
-    period: Annotated[StoragePeriodDto, Field(description="Срок хранения")]
-    expertiseType: Annotated[
-        ExpertiseType | None, Field(description="Признак экспертизы дела")
-    ] = None
-    transitionalAffair: Annotated[
-        bool | None,
-        Field(
-            description="Признак, показывающий – является ли дело переходящим на следующие годы"
-        ),
-    ] = None
-    personnel: Annotated[
-        bool | None,
-        Field(
-            description="Признак, показывающий – является ли дело делом по личному составу"
-        ),
-    ] = None
-    methodAssemblyType: Annotated[
-        MethodAssemblyType2 | None, Field(description="Способ комплектования дела")
-    ] = None
-    itemNumber: Annotated[
-        str | None,
-        Field(
-            description="Согласно какого пункта (статьи) государственного Перечня выбран срок хранения для данного дела"
-        ),
-    ] = None
-    note: Annotated[str | None, Field(description="Примечание")] = None
-
-
-class NomenclatureDepartmentProcessDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор процесса")] = None
-    currentId: Annotated[
-        UUID | None, Field(description="Идентификатор текущего этапа процесса")
-    ] = None
-    current: Annotated[Any | None, Field(description="Текущий этап процесса")] = None
-    nextId: Annotated[
-        UUID | None, Field(description="Идентификатор следующего этапа процесса")
-    ] = None
-    next: Annotated[Any | None, Field(description="Следующий этап процесса")] = None
-    nomenclatureDepartmentId: Annotated[
-        UUID | None, Field(description="Идентификатор номенклатуры дел подразделения")
-    ] = None
-    nomenclatureDepartment: Annotated[
-        Any | None, Field(description="Номенклатура дел подразделения")
-    ] = None
-    items: Annotated[list | None, Field(description="Список этапов процесса")] = None
-    completed: Annotated[
-        bool | None, Field(description="Признак прошел ли документ все этапы")
-    ] = None
-    started: Annotated[
-        bool | None, Field(description="Признак начал ли документ движение по маршруту")
-    ] = None
-    stepCount: Annotated[
-        int | None, Field(description="Количество этапов в процессе")
-    ] = None
-
-
-class Type19(Enum):
-    """
-    Тип этапа процесса
-    """
-
-    NEW = "NEW"
-    AGREEMENT = "AGREEMENT"
-    SIGNING = "SIGNING"
-
-
-class NumDepSimpleProcessAction(SummaryNomenclatureDepartmentProcessAction):
-    pass
-
-
-class NomenclatureDepartmentCancelRequest(BaseModel):
-    comment: str | None = None
-
-
-class NomenclatureAffairShelvingShelveRequest(BaseModel):
-    shelvingShelveId: UUID | None = None
-    information: str | None = None
-
-
-class CertificationSheetRequest(SummaryNomenclatureDepartmentRequest):
-    pass
-
-
-class CaseFileCoverRequest(SummaryNomenclatureDepartmentRequest):
-    pass
-
-
-class MiniDocumentAffairRequest(BaseModel):
-    ids: list[UUID] | None = None
-    toAffairId: UUID | None = None
-
-
-class InternalInventoryArchiveRequest(SummaryNomenclatureDepartmentRequest):
-    pass
-
-
-class NomenclatureAffairExpirationRequest(BaseModel):
-    expirationDate: int
-
-
-class NomenclatureAffairExpertiseRequest(BaseModel):
-    expertise: bool
-
-
-class NomenclatureAffairCompletedRequest(BaseModel):
-    completed: bool | None = None
-
-
-class MiniDocumentRequest(BaseModel):
-    regNumber: Annotated[str | None, Field(description="Регистрационный номер")] = None
-    regDate: Annotated[datetime | None, Field(description="Дата регистрации")] = None
-    docCategoryConstant: Annotated[
-        DocumentCategory | None, Field(description="Тип документа")
-    ] = None
-    shortSummary: Annotated[str | None, Field(description="Краткое содержание")] = None
-    documentLanguageId: Annotated[UUID | None, Field(description="Язык документа")] = (
-        None
-    )
-    pagesCount: Annotated[int | None, Field(description="Количество страниц")] = None
-    startPage: Annotated[int | None, Field(description="Начальная страница")] = None
-    endPage: Annotated[int | None, Field(description="Конечная страница")] = None
-    temporaryAttachmentIds: Annotated[
-        list[UUID] | None,
-        Field(description="Массив id из временного хранилища вложений"),
-    ] = None
-    nomenclatureAffairIds: Annotated[
-        list[UUID] | None,
-        Field(
-            description="Массив идентификаторов номенклатурных дел в которых нужно создать документы"
-        ),
-    ] = None
-    sourceApproveTs: Annotated[
-        datetime | None, Field(description="Дата подписания или утверждения документа")
-    ] = None
-    linkIds: Annotated[
-        list[UUID] | None, Field(description="Ссылки на мини документы")
-    ] = None
-    journalNumber: Annotated[
-        int | None,
-        Field(description="Номер журнала регистрации при регистрации документа"),
-    ] = None
-
-
-class MiniDocumentAccessByRequest(BaseModel):
-    accessBy: datetime
-
-
-class NomenclatureAffairPrintType(Enum):
-    """
-    Тип шаблона печатной формы для номенклатуры дел
-    """
-
-    ACT_DESTRUCTION = "ACT_DESTRUCTION"
-    CASE_COVER = "CASE_COVER"
-    CERTIFICATION_SHEET = "CERTIFICATION_SHEET"
-    INTERNAL_INVENTORY_ARCHIVE = "INTERNAL_INVENTORY_ARCHIVE"
-    SUMMARY_NOMENCLATURE_DEPARTMENT = "SUMMARY_NOMENCLATURE_DEPARTMENT"
-
-
-class NomenclatureAffairPrintTemplateRequest(BaseModel):
-    id: Annotated[
-        UUID | None,
-        Field(description="Идентификатор шаблона печатной формы для наменклатуры дел"),
-    ] = None
-    name: Annotated[
-        str,
-        Field(description="Наименование шаблона печатной формы для наменклатуры дел"),
-    ]
-    nomenclatureAffairPrintType: Annotated[
-        NomenclatureAffairPrintType,
-        Field(description="Тип шаблона печатной формы для номенклатуры дел"),
-    ]
-    active: Annotated[
-        bool,
-        Field(
-            description="Признак активен ли шаблон печатной формы для наменклатуры дел"
-        ),
-    ]
-
-
-class NomenclatureAffairPrintTemplateUpdateRequest(BaseModel):
-    template: NomenclatureAffairPrintTemplateRequest
-    attachmentAddId: UUID | None = None
-
-
-class NomenclatureAffairPrintTemplateDto(BaseModel):
-    id: Annotated[
-        UUID | None,
-        Field(description="Идентификатор шаблона печатной формы для наменклатуры дел"),
-    ] = None
-    name: Annotated[
-        str | None,
-        Field(description="Наименование шаблона печатной формы для наменклатуры дел"),
-    ] = None
-    attachment: Annotated[
-        AttachmentDto | None,
-        Field(description="Файл шаблона печатной формы для наменклатуры дел"),
-    ] = None
-    nomenclatureAffairPrintType: Annotated[
-        NomenclatureAffairPrintType | None,
-        Field(description="Тип шаблона печатной формы для номенклатуры дел"),
-    ] = None
-    active: Annotated[
-        bool | None,
-        Field(
-            description="Признак активен ли шаблон печатной формы для наменклатуры дел"
-        ),
-    ] = None
-
-
-class MailSetupDto(BaseModel):
-    organizationId: Annotated[
-        str | None, Field(description="Идентификатор организации настройки почты")
-    ] = None
-    organizationName: Annotated[
-        str | None, Field(description="Наименование организации настройки почты")
-    ] = None
-    mailServer: Annotated[str | None, Field(description="Почтовый сервер (ip)")] = None
-    port: Annotated[str | None, Field(description="Порт")] = None
-    mailbox: Annotated[str | None, Field(description="Почтовый ящик")] = None
-    mailboxTo: Annotated[
-        str | None,
-        Field(description="Почтовый ящик на который отправлять тестовое письмо"),
-    ] = None
-    ssl: Annotated[bool | None, Field(description="Протокол")] = None
-    password: Annotated[str | None, Field(description="Пароль")] = None
-
-
-class InvestmentProgramRequest(TypicalControlPointRequest):
-    pass
-
-
-class GroupRequest(BaseModel):
-    id: UUID | None = None
-    name: Annotated[str | None, Field(max_length=255, min_length=1)] = None
-    type: Type7 | None = None
-    mixed: bool | None = None
-
-
-class GroupUpdateRequest(BaseModel):
-    group: GroupRequest
-    employeeAdd: list[UUID] | None = None
-    employeeDelete: list[int] | None = None
-
-
-class GeneralSetupRequest(BaseModel):
-    organizationName: Annotated[
-        str | None,
-        Field(description="Наименование организации общей настройки документа СЭД"),
-    ] = None
-    countryId: Annotated[UUID | None, Field(description="Идентификатор страны")] = None
-    profileId: Annotated[
-        UUID | None, Field(description="Идентификатор профиля документа")
-    ] = None
-    aismvProfileId: UUID | None = None
-    aismvAppealProfileId: UUID | None = None
-    aismvAuthorEmployeeId: UUID | None = None
-    employeeId: Annotated[
-        UUID | None, Field(description="Идентификатор сотрудника")
-    ] = None
-    groupId: Annotated[
-        UUID | None, Field(description="Идентификатор группы пользователей")
-    ] = None
-    subscriberId: UUID | None = None
-    classDoc: Annotated[
-        str | None,
-        Field(
-            description="Унифицированный код из окрб 010-95 таблица 1 (https://minjust.gov.by/upload/iblock/d97/OKRB.pdf)"
-        ),
-    ] = None
-    objectType: Annotated[
-        str | None,
-        Field(
-            description="Вид по таблицы 2 окб (https://minjust.gov.by/upload/iblock/d97/OKRB.pdf)"
-        ),
-    ] = None
-    disableSignedFilEdit: bool | None = None
-    enableRemoveDraftDocs: bool | None = None
-    daysToKeepDraftDocs: int | None = None
-    executionDateRoundPolicy: ExecutionDateRoundPolicy | None = None
-    defaultProcessDateRoundPolicy: ExecutionDateRoundPolicy | None = None
-    workDayStart: Annotated[
-        str | None, Field(description="Продолжительность рабочего дня")
-    ] = None
-    workDayEnd: str | None = None
-    signAttachment: Attachment | None = None
-
-
-class Type21(Enum):
-    STRING = "STRING"
-    DATE = "DATE"
-    BOOLEAN = "BOOLEAN"
-    DOUBLE = "DOUBLE"
-    EMPLOYEE = "EMPLOYEE"
-    CORRESPONDENT = "CORRESPONDENT"
-
-
-class FormFieldRegistryEntryDto(BaseModel):
-    id: str | None = None
-    active: bool | None = None
-    name: str | None = None
-    description: str | None = None
-    type: Type21 | None = None
-    locale: str | None = None
-    used: bool | None = None
-
-
-class FilterFieldFilter(BaseModel):
-    id: UUID
-    name: Annotated[str, Field(description="Наименование фильтра")]
-    color: Annotated[str, Field(description="Цвет для фильтра")]
-    field: Annotated[dict[str, Any] | None, Field(description="Поля фильтра")] = None
-
-
-class FilterDto(BaseModel):
-    id: UUID | None = None
-    employeeId: Annotated[
-        UUID | None, Field(description="Идентификатор сотрудника")
-    ] = None
-    name: Annotated[str | None, Field(description="Наименование фильтра")] = None
-    createDate: Annotated[
-        datetime | None, Field(description="Дата создания фильтра")
-    ] = None
-    color: Annotated[str | None, Field(description="Цвет для фильтра")] = None
-    field: Annotated[dict[str, Any] | None, Field(description="Поля фильтра")] = None
-
-
-class Role(Enum):
-    """
-    Список ролей сотрудника
-    """
-
-    ADMIN = "ADMIN"
-    MAIN_CLERK = "MAIN_CLERK"
-    CLERK = "CLERK"
-
-
-class EmployeeApi(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор сотрудника")] = None
-    getuId: Annotated[str, Field(description="Идентификатор аккаунта сотрудника")]
-    firstName: Annotated[str, Field(description="Имя сотрудника", min_length=1)]
-    lastName: Annotated[str, Field(description="Фамилия сотрудника", min_length=1)]
-    middleName: Annotated[str | None, Field(description="Отчество сотрудника")] = None
-    fired: Annotated[bool, Field(description="Признак уволен ли сотрудник")]
-    active: Annotated[bool, Field(description="Признак активен ли сотрудник")]
-    fullPostName: Annotated[str | None, Field(description="ФИО сотрудника")] = None
-    roles: Annotated[set[Role], Field(min_items=1)]
-    postId: Annotated[int | None, Field(description="Идентификатор должности")] = None
-    departmentId: Annotated[
-        UUID,
-        Field(description="Идентификатор департамента в котором работает сотрудник"),
-    ]
-
-
-class EmployeeIoRequest(BaseModel):
-    employeeId: Annotated[UUID, Field(description="Идентификатор сотрудника")]
-    revocationDate: Annotated[datetime, Field(description="Дата аннулирования прав")]
-
-
-class EmployeeRequest(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор сотрудника")] = None
-    getuId: Annotated[str, Field(description="Идентификатор аккаунта сотрудника")]
-    firstName: Annotated[str, Field(description="Имя сотрудника")]
-    lastName: Annotated[str, Field(description="Фамилия сотрудника")]
-    middleName: Annotated[str | None, Field(description="Отчество сотрудника")] = None
-    personalNumber: Annotated[
-        str | None, Field(description="Персональный номер сотрудника")
-    ] = None
-    ldapName: Annotated[str | None, Field(description="LDAP Имя")] = None
-    address: Annotated[str | None, Field(description="Адрес")] = None
-    phone: Annotated[str | None, Field(description="Телефон")] = None
-    email: Annotated[str | None, Field(description="E-mail")] = None
-    place: Annotated[str | None, Field(description="Площадка")] = None
-    postId: Annotated[int | None, Field(description="Идентификатор должности")] = None
-    url: Annotated[str | None, Field(description="URL")] = None
-    departmentId: Annotated[
-        UUID,
-        Field(description="Идентификатор департамента в котором работает сотрудник"),
-    ]
-    order: Annotated[int | None, Field(description="Порядок сортировки")] = None
-
-
-class EmployeeUpdateRequest(BaseModel):
-    employee: EmployeeRequest
-    ioAdd: EmployeeIoRequest | None = None
-    ioDelete: UUID | None = None
-    secretaryAdd: list[UUID] | None = None
-    secretaryDelete: list[UUID] | None = None
-
-
-class EmployeeDelegate(BaseModel):
-    id: Annotated[UUID, Field(description="Идентификатор сотрудника")]
-    to: Annotated[
-        UUID,
-        Field(
-            description="Идентификатор сотрудника которому будут переданы документы/обязанности"
-        ),
-    ]
-
-
-class Period3(Enum):
-    """
-    Интервал создания поручения (обязательно к заполнению если periodTask != null)
-    """
-
-    WEEK = "WEEK"
-    MONTH = "MONTH"
-    THREE_MONTHS = "THREE_MONTHS"
-    SIX_MONTHS = "SIX_MONTHS"
-    YEAR = "YEAR"
-
-
-class UpdateTaskRequest(BaseModel):
-    id: Annotated[UUID, Field(description="ИД поручения")]
-    taskText: Annotated[str, Field(description="Текст поручения", min_length=1)]
-    planedDateEnd: Annotated[
-        datetime | None, Field(description="Планируемая дата исполнения поручения")
-    ] = None
-    endless: Annotated[
-        bool,
-        Field(
-            description="бессрочное поручение (если false, то planedDateEnd обязательно к заполнению)"
-        ),
-    ]
-    periodTask: Annotated[bool, Field(description="Поручение периодическое")]
-    period: Annotated[
-        Period3 | None,
-        Field(
-            description="Интервал создания поручения (обязательно к заполнению если periodTask != null)"
-        ),
-    ] = None
-
-
-class TaskRevisionRequest(BaseModel):
-    text: str | None = None
-    ids: Annotated[list[UUID], Field(max_items=2147483647, min_items=1)]
-
-
-class ChangeResponsibleStatus(BaseModel):
-    responsible: bool
-
-
-class ExecuteTaskRequest(BaseModel):
-    stampText: Annotated[str | None, Field(description="Текст поручения")] = None
-
-
-class TaskExecutionResult(BaseModel):
-    affairWriteOffCount: int | None = None
-
-
-class UpdateTaskProjectRequest(BaseModel):
-    id: Annotated[UUID, Field(description="ИД поручения")]
-    taskText: Annotated[str, Field(description="Текст поручения", min_length=1)]
-    planedDateEnd: Annotated[
-        datetime, Field(description="Планируемая дата исполнения поручения")
-    ]
-
-
-class ChangeRegNumberRequest(BaseModel):
-    regDate: datetime
-    regNum: Annotated[str, Field(min_length=1)]
-    journalNumber: int | None = None
-
-
-class BpmnStartBeforeRequest(BaseModel):
-    id: str
-    employees: list[UUID] | None = None
-
-
-class AdditionalFields(BaseModel):
-    retryPrefix: str | None = None
-    retryPostfix: str | None = None
-    identicalPrefix: str | None = None
-    identicalPostfix: str | None = None
-    repetitionCounterInitial: int | None = None
-    identityCounterInitial: int | None = None
-    anonymousSuffix: str | None = None
-    collectiveSuffix: str | None = None
-    appealOrganizationJournalId: UUID | None = None
-    journalId: UUID | None = None
-    correspondentId: UUID | None = None
-
-
-class DocRegOperationAudit(BaseModel):
-    operation: str | None = None
-    result: str | None = None
-    success: bool | None = None
-
-
-class DocumentPropertiesDto(BaseModel):
-    id: UUID | None = None
-    autoControl: AutoControl | None = None
-    gtbAutoRoutingAfterSigning: bool | None = None
-    autoRegistration: bool | None = None
-    formula: list[str] | None = None
-    registrationAudit: list[DocRegOperationAudit] | None = None
-    anyNum: bool | None = None
-    fields: AdditionalFields | None = None
-
-
-class RepeatExecutionPolicy(Enum):
-    ALL = "ALL"
-    REJECT = "REJECT"
-
-
-class ActionQueueType1(Enum):
-    ANY = "ANY"
-    ORDERED = "ORDERED"
-
-
-class ProcessExecutorWithPos(BaseModel):
-    employeeId: UUID | None = None
-    groupId: UUID | None = None
-    departmentId: UUID | None = None
-    order: int | None = None
-
-
-class ControlPointRevisionRequest(BaseModel):
-    revisionComment: str | None = None
-
-
-class Status9(Enum):
-    """
-    Статус контрольной точки исполнения договора
-    """
-
-    EXECUTION = "EXECUTION"
-    EXECUTED = "EXECUTED"
-
-
-class Type22(Enum):
-    """
-    Тип ссылки
-    """
-
-    RECEIVED_IN_RESPONSE_TO = "RECEIVED_IN_RESPONSE_TO"
-    CREATE_IN_RESPONSE_TO = "CREATE_IN_RESPONSE_TO"
-    LINK_DOC = "LINK_DOC"
-    TASK_DOC_LINK = "TASK_DOC_LINK"
-    CHILD_LINK_DOC = "CHILD_LINK_DOC"
-    CHILD_DOCUMENT = "CHILD_DOCUMENT"
-    PROTOCOL = "PROTOCOL"
-    CHILD_PROTOCOL = "CHILD_PROTOCOL"
-    REPLY_TO_APPLICANT = "REPLY_TO_APPLICANT"
-    PROTOCOL_MEETING_QUESTION = "PROTOCOL_MEETING_QUESTION"
-    QUESTION_DOCUMENTS = "QUESTION_DOCUMENTS"
-
-
-class KtaSign(BaseModel):
-    cok: Annotated[
-        str, Field(description="Сертификат открытого ключа в base64", min_length=1)
-    ]
-    sig: Annotated[
-        str, Field(description="Хэш подписи (48 байт) в base64", min_length=1)
-    ]
-
-
-class RenameFileRequest(BaseModel):
-    name: Annotated[str, Field(min_length=1)]
-
-
-class AttachmentDocumentType1(Enum):
-    ATTACHMENT = "ATTACHMENT"
-    PRINT_DOCUMENT = "PRINT_DOCUMENT"
-    PROJECT_SOLUTION = "PROJECT_SOLUTION"
-    RATIONALE = "RATIONALE"
-    DOCUMENTS_QUESTION = "DOCUMENTS_QUESTION"
-    INTRODUCTION_LIST = "INTRODUCTION_LIST"
-    AGREEMENT_LIST = "AGREEMENT_LIST"
-    DECISION = "DECISION"
-    RKK = "RKK"
-
-
-class ChangeAttachmentDocumentTypeRequest(BaseModel):
-    attachmentDocumentType: AttachmentDocumentType1
-
-
-class DocumentArchiveRequest(BaseModel):
-    inArchive: bool
-
-
-class AdditionalDocumentRequest(BaseModel):
-    additionalDocumentTypeId: UUID | None = None
-    note: str | None = None
-    parentId: UUID | None = None
-    attachmentAddIds: list[UUID] | None = None
-    attachmentDelIds: list[UUID] | None = None
-    responsibleAddIds: list[UUID] | None = None
-    responsibleDelIds: list[UUID] | None = None
-    date: datetime | None = None
-    docNumber: str | None = None
-
-
-class AdditionalAgreementRequest(BaseModel):
-    id: UUID
-    cause: str | None = None
-    result: bool
-
-
-class CountResult(BaseModel):
-    count: int | None = None
-
-
-class DocumentTypeRequest(BaseModel):
-    id: int | None = None
-    typeName: str | None = None
-    docCategoryConst: DocCategory | None = None
-    objectType: Annotated[str | None, Field(max_length=3, min_length=3)] = None
-    active: bool | None = None
-
-
-class DocumentType(BaseModel):
-    id: int | None = None
-    typeName: Annotated[str, Field(max_length=255, min_length=0)]
-    docCategoryConst: DocCategory
-    active: bool
-    objectType: Annotated[str | None, Field(max_length=3, min_length=3)] = None
-    createDate: datetime | None = None
-
-
-class DocumentLanguageRequest(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор шаблона языка документа")
-    ] = None
-    languageCode: Annotated[
-        str | None, Field(description="Код языка документа", max_length=3, min_length=0)
-    ] = None
-    active: Annotated[
-        bool | None, Field(description="Признак активен ли языка документа")
-    ] = None
-
-
-class DocumentCommentRequest(BaseModel):
-    id: int | None = None
-    documentId: UUID | None = None
-    text: str | None = None
-
-
-class CommentStatus(Enum):
-    CHANGED = "CHANGED"
-    DELETED = "DELETED"
-
-
-class SimpleDocumentCommentDto(BaseModel):
-    id: Annotated[int | None, Field(description="Идентификатор комментария")] = None
-    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
-        None
-    )
-    text: Annotated[str | None, Field(description="Текст комментария")] = None
-    dateTime: Annotated[
-        datetime | None, Field(description="Дата и время создания комментария")
-    ] = None
-    employeeId: Annotated[
-        UUID | None, Field(description="Идентификатор сотрудника")
-    ] = None
-    firstName: Annotated[str | None, Field(description="Имя сотрудника")] = None
-    lastName: Annotated[str | None, Field(description="Фамилия сотрудника")] = None
-    middleName: Annotated[str | None, Field(description="Отчество сотрудника")] = None
-    post: Annotated[
-        str | None, Field(description="Наименование должность сотрудника")
-    ] = None
-    department: Annotated[
-        str | None, Field(description="Наименование департамента сотрудника")
-    ] = None
-    commentStatus: CommentStatus | None = None
-
-
-class DistrictDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор района")] = None
-    nameDistrict: Annotated[str | None, Field(description="Наименование района")] = None
-    codeDistrict: Annotated[int | None, Field(description="Код района")] = None
-    regionId: Annotated[UUID | None, Field(description="Идентификатор области")] = None
-    region: Annotated[RegionDto | None, Field(description="Область")] = None
-    active: Annotated[
-        bool | None,
-        Field(
-            description="Признак активно ли типовое краткое содержание для поручения"
-        ),
-    ] = None
-    createDate: datetime | None = None
-
-
-class DestructionActProcessAction(SummaryNomenclatureDepartmentProcessAction):
-    pass
-
-
-class DestructionActRequest(SummaryNomenclatureDepartmentRequest):
-    pass
-
-
-class DestroyAckRequestBody(BaseModel):
-    date: datetime
-
-
-class DestructionActCancelRequest(BaseModel):
-    comment: Annotated[
-        str | None, Field(description="Комментарий к отмене акта уничтожения")
-    ] = None
-
-
-class DeliveryMethodRequest(BaseModel):
-    id: int | None = None
-    deliveryName: str | None = None
-    aismv: bool | None = None
-    active: bool | None = None
-
-
-class CustomViewColumn(BaseModel):
-    field: str | None = None
-    width: int | None = None
-    autoWidth: bool | None = None
-
-
-class Include(Enum):
-    DOCUMENT_TYPE = "DOCUMENT_TYPE"
-    DELIVERY_METHOD = "DELIVERY_METHOD"
-    CORRESPONDENT = "CORRESPONDENT"
-    RECIPIENT = "RECIPIENT"
-    USER_COLOR = "USER_COLOR"
-    PRE_NOMENCLATURE_AFFAIRS = "PRE_NOMENCLATURE_AFFAIRS"
-    CITIZEN_TYPE = "CITIZEN_TYPE"
-    CURRENCY = "CURRENCY"
-    PARENT_SUBJECT = "PARENT_SUBJECT"
-    REGISTRATION_JOURNAL = "REGISTRATION_JOURNAL"
-    SOLUTION_RESULT = "SOLUTION_RESULT"
-    ADDITIONAL_DOCUMENT_AND_TYPE = "ADDITIONAL_DOCUMENT_AND_TYPE"
-
-
-class IoOption(Enum):
-    SELF = "SELF"
-    IO = "IO"
-    SUBORDINATES = "SUBORDINATES"
-    SELF_AND_IO = "SELF_AND_IO"
-    SUBORDINATES_AND_SELF_AND_IO = "SUBORDINATES_AND_SELF_AND_IO"
-
-
-class DeclarantType1(Enum):
-    INDIVIDUAL = "INDIVIDUAL"
-    ENTITY = "ENTITY"
-
-
-class DocumentFilter(BaseModel):
-    """
-    Фильтр представления
-    """
-
-    includes: Annotated[
-        list[Include] | None,
-        Field(description="Список моделей которые могу быть добавлены при отображении"),
-    ] = None
-    categoryConstants: list[DocCategory] | None = None
-    documentTypeIds: Annotated[
-        list[int] | None, Field(description="Виды документов")
-    ] = None
-    ioOption: IoOption | None = None
-    documentTypeNames: Annotated[
-        list[str] | None, Field(description="Виды документов имена")
-    ] = None
-    regNumber: Annotated[
-        str | None, Field(description="Регистрационный номер документа")
-    ] = None
-    createType: Annotated[
-        CreateType | None,
-        Field(description="Перечисление для описания типов как создан документ"),
-    ] = None
-    dateRegStart: Annotated[
-        datetime | None, Field(description="Дата начала регистрации документа")
-    ] = None
-    dateRegEnd: Annotated[
-        datetime | None, Field(description="Дата окончания регистрации документа")
-    ] = None
-    shortSummary: Annotated[
-        str | None,
-        Field(
-            description="Краткое содержание, может выбираться из справочника кратких содержаний"
-        ),
-    ] = None
-    authorId: Annotated[
-        UUID | None, Field(description="Идентификатор автора документа")
-    ] = None
-    authorFirstName: Annotated[str | None, Field(description="Имя автора")] = None
-    authorLastName: Annotated[str | None, Field(description="Фамилия автора")] = None
-    authorMiddleName: Annotated[str | None, Field(description="Отчество автора")] = None
-    executorSigningStageId: Annotated[
-        UUID | None, Field(description="Идентификатор исполнителя этапа Подписание")
-    ] = None
-    executorSigningStageFirstName: Annotated[
-        str | None, Field(description="Имя исполнителя этапа Подписание")
-    ] = None
-    executorSigningStageLastName: Annotated[
-        str | None, Field(description="Фамилия исполнителя этапа Подписание")
-    ] = None
-    executorSigningStageMiddleName: Annotated[
-        str | None, Field(description="Отчество исполнителя этапа Подписание")
-    ] = None
-    outRegNumber: Annotated[
-        str | None, Field(description="Исходящий регистрационный номер")
-    ] = None
-    recipientIds: Annotated[
-        list[UUID] | None, Field(description="Список идентификаторов адресатов")
-    ] = None
-    recipientName: Annotated[str | None, Field(description="Наименование адресата")] = (
-        None
-    )
-    recipientNameOr: Annotated[
-        str | None, Field(description="Наименование адресата")
-    ] = None
-    correspondentIds: Annotated[
-        list[UUID] | None, Field(description="Список идентификаторов корреспондентов")
-    ] = None
-    correspondentName: Annotated[
-        str | None, Field(description="Наименование корреспондента")
-    ] = None
-    status: list[Status2] | None = None
-    excludeStatuses: list[Status2] | None = None
-    deliveryMethod: Annotated[
-        str | None, Field(description="Способ получения документа")
-    ] = None
-    deliveryMethodId: Annotated[
-        int | None, Field(description="Способ получения документа ИД")
-    ] = None
-    investmentProgramIds: Annotated[
-        list[UUID] | None, Field(description="Идентификаторы объектов инвестпрограммы")
-    ] = None
-    dateControlStart: Annotated[
-        datetime | None, Field(description="Дата начала контроля документа")
-    ] = None
-    dateControlEnd: Annotated[
-        datetime | None, Field(description="Дата окончания контроля документа")
-    ] = None
-    taskExecutorIds: Annotated[
-        list[UUID] | None, Field(description="Идентификатор исполнителя поручения")
-    ] = None
-    taskExecutorFirstName: Annotated[
-        str | None, Field(description="Имя исполнителя поручения")
-    ] = None
-    taskExecutorLastName: Annotated[
-        str | None, Field(description="Фамилия исполнителя поручения")
-    ] = None
-    taskExecutorMiddleName: Annotated[
-        str | None, Field(description="Отчество исполнителя поручения")
-    ] = None
-    dateTaskStart: Annotated[
-        datetime | None, Field(description="Дата начала исполнения поручения")
-    ] = None
-    dateTaskEnd: Annotated[
-        datetime | None, Field(description="Дата окончания исполнения поручения")
-    ] = None
-    authorCurrentUser: Annotated[
-        bool | None,
-        Field(description="Признак является ли текущий пользователь автором документа"),
-    ] = None
-    processExecutorCurrentUser: Annotated[
-        bool | None,
-        Field(
-            description="Признак является ли текущий пользователь участником текущего процесса без метки"
-        ),
-    ] = None
-    meetingExecutorCurrentUser: Annotated[
-        bool | None,
-        Field(
-            description="Признак является ли текущий пользователь председателем, секретарем, приглашенным, автором в совещании"
-        ),
-    ] = None
-    meetingQuestionExecutorCurrentUser: Annotated[
-        bool | None,
-        Field(
-            description="Признак является ли текущий пользователь докладчиком, содокладчиком, автором в повестке заседания"
-        ),
-    ] = None
-    questionExecutorCurrentUser: Annotated[
-        bool | None,
-        Field(
-            description="Признак является ли текущий пользователь инициатором, автором в вопросе повестки"
-        ),
-    ] = None
-    contractExecutorCurrentUser: Annotated[
-        bool | None,
-        Field(
-            description="Признак является ли текущий пользователь исполнителем, ответственным, доп. согл, ознакомителем, автором в договоре"
-        ),
-    ] = None
-    controlUserCurrentUser: Annotated[
-        bool | None,
-        Field(
-            description="Признак является ли текущий пользователь контролером в документе"
-        ),
-    ] = None
-    introductionCurrentUser: Annotated[
-        bool | None,
-        Field(
-            description="Признак является ли текущий пользователь ознакомителем в документе"
-        ),
-    ] = None
-    additionalAgreementUser: Annotated[
-        bool | None,
-        Field(
-            description="Признак является ли текущий пользователь доп. согласующим в документе"
-        ),
-    ] = None
-    additionalAgreementAllUser: bool | None = None
-    signingCurrentUser: bool | None = None
-    reviewCurrentUser: bool | None = None
-    agreementCurrentUser: bool | None = None
-    statementCurrentUser: bool | None = None
-    taskExecutorCurrentUser: bool | None = None
-    introductionAllCurrentUser: bool | None = None
-    controlOffCurrentUser: bool | None = None
-    controlExpireCurrentUser: bool | None = None
-    controlExpireExecutionCurrentUser: bool | None = None
-    executionExpireCurrentUser: bool | None = None
-    executionOverdueCurrentUser: bool | None = None
-    authorExpireExecutionCurrentUser: bool | None = None
-    authorOverdueExecutionCurrentUser: bool | None = None
-    smdoWaitOutgoingUser: bool | None = None
-    userColorIsNull: bool | None = None
-    userColor: str | None = None
-    smdoFailOutgoingUser: bool | None = None
-    onlyUserOrganization: bool | None = None
-    organizationName: str | None = None
-    fioApplicant: str | None = None
-    regNumberAnd: Annotated[
-        str | None, Field(description="Регистрационный номер документа")
-    ] = None
-    shortSummaryAnd: Annotated[
-        str | None,
-        Field(
-            description="Краткое содержание, может выбираться из справочника кратких содержаний"
-        ),
-    ] = None
-    journalId: UUID | None = None
-    processCompleted: bool | None = None
-    hasRegDate: bool | None = None
-    declarantType: DeclarantType1 | None = None
-    repeatIdentical: str | None = None
-    affairExist: bool | None = None
-    outRegNumberOr: str | None = None
-    correspondentNameOr: str | None = None
-    authorLastNameOr: str | None = None
-    organizationNameOr: str | None = None
-    fioApplicantOr: str | None = None
-    citizenTypeId: UUID | None = None
-    anonymous: bool | None = None
-    collective: bool | None = None
-    reasonably: bool | None = None
-    regionId: UUID | None = None
-    countryAppealId: UUID | None = None
-    districtId: UUID | None = None
-    cityId: UUID | None = None
-    receiptDateStart: datetime | None = None
-    receiptDateEnd: datetime | None = None
-    contractAgreement: bool | None = None
-    contractAutoProlongation: bool | None = None
-    contractTypical: bool | None = None
-    hasAdditionalDocument: bool | None = None
-    recipientId: UUID | None = None
-    recipientSignedFrom: datetime | None = None
-    recipientSignedTo: datetime | None = None
-    signDateFrom: datetime | None = None
-    signDateTo: datetime | None = None
-    currencyIds: list[UUID] | None = None
-    contractSumFrom: float | None = None
-    contractSumTo: float | None = None
-    daysToCompletion: int | None = None
-    correspondentRecipientId: UUID | None = None
-    recipientCorrespondentId: UUID | None = None
-    recipientContractNumberOr: str | None = None
-    createYear: int | None = None
-    mapperRules: list[int] | None = None
-
-
-class CurrencyRequest(BaseModel):
-    id: UUID
-    name: str
-    active: bool
-    code: str
-
-
-class ContactFaceRequest(BaseModel):
-    id: UUID | None = None
-    lastName: str | None = None
-    firstName: str | None = None
-    middleName: str | None = None
-    post: str | None = None
-    mail: str | None = None
-    phone: str | None = None
-    fax: str | None = None
-    correspondentId: Annotated[UUID | None, Field(description="В V2 не требуется")] = (
-        None
-    )
-
-
-class Type23(Enum):
-    """
-    Тип организации
-    """
-
-    NORMAL = "NORMAL"
-    AISMV = "AISMV"
-    DIRECTUM = "DIRECTUM"
-    GTB_ORG = "GTB_ORG"
-
-
-class CorrespondentGroupRequest(BaseModel):
-    id: Annotated[
-        UUID, Field(description="Идентификатор группы адресатов/корреспондентов")
-    ]
-    name: Annotated[
-        str, Field(description="Наименование группы адресатов/корреспондентов")
-    ]
-    active: Annotated[
-        bool,
-        Field(
-            description="Признак является ли группа адресатов/корреспондентов действующей или упраздненной"
-        ),
-    ]
-
-
-class CorrespondentGroupDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор группы адресата/корреспондента")
-    ] = None
-    name: Annotated[
-        str | None, Field(description="Наименование группы адресата/корреспондента")
-    ] = None
-    active: Annotated[
-        bool | None,
-        Field(
-            description="Признак является ли группа адресатов/корреспондентов действующей или упраздненной"
-        ),
-    ] = None
-    createDate: datetime | None = None
-
-
-class CorrespondentGroupUpdateRequest(BaseModel):
-    correspondentGroup: CorrespondentGroupRequest
-    correspondentAdd: Annotated[set[UUID] | None, Field()] = None
-    correspondentDelete: list[UUID] | None = None
-
-
-class DepartmentEmployeeNomenclature(BaseModel):
-    id: UUID | None = None
-    departmentId: UUID
-    departmentOrgId: str
-    department: Any | None = None
-    employeeId: UUID
-    employee: Any | None = None
-
-
-class DeputyLeaderDepartment(BaseModel):
-    id: UUID | None = None
-    departmentId: UUID
-    departmentOrgId: str
-    department: Any | None = None
-    employeeId: UUID
-    employeeOrgId: str
-    employee: Any | None = None
-
-
-class Type24(Enum):
-    SECRETARY = "SECRETARY"
-    IO = "IO"
-    IO_DISMISSAL = "IO_DISMISSAL"
-
-
-class Organization(BaseModel):
-    organizationId: str | None = None
-
-
-class Type26(Enum):
-    DIRECTORY = "DIRECTORY"
-    DOCUMENT = "DOCUMENT"
-    NOMENCLATURE_DEPARTMENT = "NOMENCLATURE_DEPARTMENT"
-    SUMMARY_NOMENCLATURE_DEPARTMENT = "SUMMARY_NOMENCLATURE_DEPARTMENT"
-    DESTRUCTION_ACT = "DESTRUCTION_ACT"
-    ACCEPTANCE_INVENTORY = "ACCEPTANCE_INVENTORY"
-    NOMENCLATURE_AFFAIR = "NOMENCLATURE_AFFAIR"
-    MINI_DOCUMENT = "MINI_DOCUMENT"
-    TASK = "TASK"
-    CONTROL_POINT = "CONTROL_POINT"
-
-
-class TaskType1(Enum):
-    INFORMATION = "INFORMATION"
-    GENERAL = "GENERAL"
-
-
-class ResolvePolicy1(Enum):
-    ANY = "ANY"
-    MERGE = "MERGE"
-
-
-class SummaryNomenclatureDepartmentStatus1(Enum):
-    DRAFT = "DRAFT"
-    NEW = "NEW"
-    SIGNING = "SIGNING"
-    SIGNED = "SIGNED"
-    STATEMENT = "STATEMENT"
-    APPROVED = "APPROVED"
-    REJECT = "REJECT"
-    CANCEL = "CANCEL"
-
-
-class DestructionActStatus1(Enum):
-    NEW = "NEW"
-    AGREEMENT = "AGREEMENT"
-    AGREED = "AGREED"
-    SIGNING = "SIGNING"
-    SIGNED = "SIGNED"
-    STATEMENT = "STATEMENT"
-    APPROVED = "APPROVED"
-    CANCEL = "CANCEL"
-
-
-class Post(BaseModel):
-    id: int | None = None
-    postName: Annotated[str, Field(max_length=255, min_length=0)]
-    postCode: Annotated[str | None, Field(max_length=255, min_length=0)] = None
-    createDate: datetime | None = None
-
-
-class Merge1(Enum):
-    ALL = "ALL"
-    SELF = "SELF"
-    SELF_AND_IO = "SELF_AND_IO"
-    SUBORDINATES_AND_SELF = "SUBORDINATES_AND_SELF"
-    SUBORDINATES_AND_SELF_AND_IO = "SUBORDINATES_AND_SELF_AND_IO"
-
-
-class RoleMerge(BaseModel):
-    roleId: UUID | None = None
-    merge: Merge1 | None = None
-
-
-class CityDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор города")] = None
-    nameCity: Annotated[str | None, Field(description="Наименование города")] = None
-    codeCity: Annotated[int | None, Field(description="Код города")] = None
-    districtId: Annotated[UUID | None, Field(description="Идентификатор района")] = None
-    district: Annotated[DistrictDto | None, Field(description="Район")] = None
-    active: Annotated[bool | None, Field(description="Признак активен ли город")] = None
-    createDate: datetime | None = None
-
-
-class CitizenTypeRequest(BaseModel):
-    id: UUID
-    name: str
-    report: bool
-    active: bool
-
-
-class SettingWorkDay(BaseModel):
-    date: datetime | None = None
-    workDayStart: str | None = None
-    workDayEnd: str | None = None
-
-
-class WorkCalendarRequest(BaseModel):
-    id: Annotated[UUID, Field(description="Идентификатор календаря")]
-    name: Annotated[str, Field(description="Наименование календаря")]
-    year: Annotated[int, Field(description="Год календаря")]
-    weekends: Annotated[set[datetime], Field(description="Перечень выходных")]
-    workingDays: Annotated[
-        set[SettingWorkDay] | None,
-        Field(description="Продолжительность рабочего дня"),
-    ] = None
-
-
-class WorkCalendarDto(BaseModel):
-    id: UUID | None = None
-    name: str | None = None
-    year: int | None = None
-    weekends: Annotated[set[datetime] | None, Field()] = None
-    createDate: datetime | None = None
-    workingDays: Annotated[
-        set[SettingWorkDay] | None,
-        Field(description="Продолжительность рабочего дня"),
-    ] = None
-
-
-class BpmnProcessDirectoryRequest(BaseModel):
-    id: UUID | None = None
-    name: Annotated[str, Field(min_length=1)]
-    xml: Annotated[str, Field(min_length=1)]
-    docCategory: DocCategory
-    active: bool
-
-
-class ArchiveFundRequest(UnifiedDocumentationSystemRequest):
-    pass
-
-
-class AismvRouterConfigDto(BaseModel):
-    smdoSchema: str | None = None
-    routerAcceptAckSchema: str | None = None
-    routerErrorAckSchema: str | None = None
-
-
-class AismvOrgPackageRecycleSettingsDto(BaseModel):
-    id: str | None = None
-    enabled: bool | None = None
-    days: int | None = None
-
-
-class AismvApiConfigDto(BaseModel):
-    protocol: str | None = None
-    server: str | None = None
-    receiverPath: str | None = None
-    senderPath: str | None = None
-
-
-class AdditionalDocumentTypeRequest(TypicalControlPointRequest):
-    pass
-
-
-class AccessGriefRequest(BaseModel):
-    id: UUID | None = None
-    name: Annotated[str, Field(max_length=255, min_length=0)]
-    shortName: Annotated[str, Field(max_length=255, min_length=0)]
-    active: bool | None = None
-    employeeAdd: Annotated[set[UUID] | None, Field()] = None
-    employeeDelete: list[UUID] | None = None
-
-
-class AcceptanceInventoryProcessAction(SummaryNomenclatureDepartmentProcessAction):
-    pass
-
-
-class AcceptanceInventoryCancelRequest(NomenclatureDepartmentCancelRequest):
-    pass
-
-
-class GrantedAuthority(BaseModel):
-    authority: str | None = None
-
-
-class Io(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор исполнителя обязанностей")
-    ] = None
-    createDate: Annotated[
-        datetime | None, Field(description="Дата назначения прав")
-    ] = None
-    revocationDate: Annotated[
-        datetime | None, Field(description="Дата аннулирования прав")
-    ] = None
-
-
-class Secretary(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор секретаря")] = None
-    createDate: Annotated[
-        datetime | None, Field(description="Дата назначения прав")
-    ] = None
-    revocationDate: Annotated[
-        datetime | None, Field(description="Дата аннулирования прав")
-    ] = None
-
-
-class RefreshToken(BaseModel):
-    refreshToken: Annotated[str, Field(min_length=1)]
-
-
-class BasicAuthRequest(BaseModel):
-    login: Annotated[str, Field(min_length=1)]
-    password: Annotated[str, Field(min_length=1)]
-
-
-class UserNotificationStatDto(BaseModel):
-    id: UUID | None = None
-    total: int | None = None
-    read: int | None = None
-
-
-class BasicUserAccountCreate(BasicUserAccountChange):
-    pass
-
-
-class CheckAttachmentSignRequest(BaseModel):
-    id: UUID
-    checkSmdoCert: bool | None = None
-
-
-class TemplateAddRequest(BaseModel):
-    template: TemplateRequest
-    attachmentAddId: Annotated[UUID, Field(min_length=1)]
-
-
-class TemplateContractAddRequest(BaseModel):
-    template: TemplateContractRequest
-    attachmentAddIds: Annotated[list[UUID], Field(min_items=1)]
-
-
-class OrgKey(BaseModel):
-    id: UUID | None = None
-    organizationId: str | None = None
-
-
-class CreateSummaryNomenclatureDepartmentDto(BaseModel):
-    """
-    DTO для создания сводной номенклатуры дел
-    """
-
-    year: Annotated[int, Field(description="Год номенклатуры")]
-    nomenclatureType: Annotated[NomenclatureType, Field(description="Тип номенклатуры")]
-    registrationNumber: str | None = None
-    regDate: datetime | None = None
-
-
-class SummaryNomenclatureDepartmentIntroductionRequest(BaseModel):
-    """
-    Идентификаторы сотрудников
-    """
-
-    executorListIds: Annotated[list[UUID], Field(max_items=2147483647, min_items=1)]
-    comment: str
-
-
-class OperationType1(Enum):
-    """
-    Тип операции
-    """
-
-    SUMMARY_NOMENCLATURE_DEPARTMENT_READ = "SUMMARY_NOMENCLATURE_DEPARTMENT_READ"
-    SUMMARY_NOMENCLATURE_DEPARTMENT_UPDATE = "SUMMARY_NOMENCLATURE_DEPARTMENT_UPDATE"
-    SUMMARY_NOMENCLATURE_DEPARTMENT_PROCESS_EXECUTORS_UPDATE = (
-        "SUMMARY_NOMENCLATURE_DEPARTMENT_PROCESS_EXECUTORS_UPDATE"
-    )
-    SUMMARY_NOMENCLATURE_DEPARTMENT_PROCESS_ITEM_UPDATE = (
-        "SUMMARY_NOMENCLATURE_DEPARTMENT_PROCESS_ITEM_UPDATE"
-    )
-    SUMMARY_NOMENCLATURE_DEPARTMENT_START = "SUMMARY_NOMENCLATURE_DEPARTMENT_START"
-    SUMMARY_NOMENCLATURE_DEPARTMENT_SIGNING = "SUMMARY_NOMENCLATURE_DEPARTMENT_SIGNING"
-    SUMMARY_NOMENCLATURE_DEPARTMENT_STATEMENT = (
-        "SUMMARY_NOMENCLATURE_DEPARTMENT_STATEMENT"
-    )
-    SUMMARY_NOMENCLATURE_DEPARTMENT_CANCEL = "SUMMARY_NOMENCLATURE_DEPARTMENT_CANCEL"
-    SUMMARY_NOMENCLATURE_DEPARTMENT_CREATE_NOMENCLATURE = (
-        "SUMMARY_NOMENCLATURE_DEPARTMENT_CREATE_NOMENCLATURE"
-    )
-    SUMMARY_NOMENCLATURE_DEPARTMENT_INTRODUCTION_CREATE = (
-        "SUMMARY_NOMENCLATURE_DEPARTMENT_INTRODUCTION_CREATE"
-    )
-    SUMMARY_NOMENCLATURE_DEPARTMENT_INTRODUCTION_DELETE = (
-        "SUMMARY_NOMENCLATURE_DEPARTMENT_INTRODUCTION_DELETE"
-    )
-
-
-class SummaryNomDepOperation(BaseModel):
-    operationType: Annotated[OperationType1, Field(description="Тип операции")]
-    body: Annotated[Any | None, Field(description="Тело операции")] = None
-
-
-class SummaryInventoryReportRequest(BaseModel):
-    number: Annotated[str, Field(description="Номер описи")]
-    fundId: UUID
-    archiveYear: Annotated[int, Field(description="Год поступления дела в архив")]
-    groupByStoragePeriod: Annotated[
-        GroupByStoragePeriod1, Field(description="Категория хранения")
-    ]
-    personnel: Annotated[bool, Field(description="Метка по личному составу")]
-    methodAssemblyType: Annotated[
-        MethodAssemblyType2, Field(description="Способ комплектования дела")
-    ]
-
-
-class ProviderParams(BaseModel):
-    provider: str | None = None
-    params: dict[str, Any] | None = None
-
-
-class RoleAddRequest(BaseModel):
-    role: RoleRequest
-    groupAdd: Annotated[set[UUID] | None, Field()] = None
-    employeeAdd: Annotated[set[UUID] | None, Field()] = None
-
-
-class Type28(Enum):
-    PDF = "PDF"
-    XLSX = "XLSX"
-    DOCX = "DOCX"
-
-
-class TaskOnStatusReportFilter(BaseModel):
-    type: Type28
-    inArchive: bool | None = None
-    dateTaskStart: datetime
-    dateTaskEnd: datetime
-    taskStatuses: list[TaskStatus]
-    taskAuthorId: UUID | None = None
-    taskExecutorId: UUID | None = None
-    taskResponsibleExecutorId: UUID | None = None
-    flagEndless: bool | None = None
-
-
-class Template1(Enum):
-    """
-    Перечисление для описания констант шаблонов отчета
-    """
-
-    DOCUMENT_IN_PROGRESS = "DOCUMENT_IN_PROGRESS"
-    DOCUMENT_ON_EXECUTION = "DOCUMENT_ON_EXECUTION"
-    CONSTRUCTOR = "CONSTRUCTOR"
-    TASK_CONTROL = "TASK_CONTROL"
-    DOCUMENT_ON_REGISTRATION = "DOCUMENT_ON_REGISTRATION"
-    DOCUMENT_ON_CONTROL = "DOCUMENT_ON_CONTROL"
-    DOCUMENT_ON_STATUS = "DOCUMENT_ON_STATUS"
-    TASK_ON_STATUS = "TASK_ON_STATUS"
-    TASK_ON_CONTROL = "TASK_ON_CONTROL"
-    VOLUME_OF_DOCUMENT_FLOW = "VOLUME_OF_DOCUMENT_FLOW"
-    PERFORMING_DISCIPLINE = "PERFORMING_DISCIPLINE"
-    RECEIVED_APPEALS = "RECEIVED_APPEALS"
-    COUNT_OF_EXECUTED_AND_UNEXECUTED_CONTROL_TASK = (
-        "COUNT_OF_EXECUTED_AND_UNEXECUTED_CONTROL_TASK"
-    )
-
-
-class TaskOnControlReportFilter(BaseModel):
-    type: Type28
-    inArchive: bool | None = None
-    dateControlStart: datetime
-    dateControlEnd: datetime
-    controlEmployeeId: UUID | None = None
-
-
-class DocumentOnStatusReportFilter(BaseModel):
-    type: Type28
-    inArchive: bool | None = None
-    docCategoryConstants: list[DocCategory]
-    status: list[Status2]
-    documentAuthorIds: list[UUID] | None = None
-    documentTypeIds: list[UUID] | None = None
-
-
-class DocumentOnRegistrationReportFilter(BaseModel):
-    type: Type28
-    inArchive: bool | None = None
-    dateRegStart: Annotated[
-        datetime, Field(description="Начальная дата регистрации документа")
-    ]
-    dateRegEnd: Annotated[
-        datetime, Field(description="Конечная дата регистрации документа")
-    ]
-    docCategoryConstants: list[DocCategory]
-
-
-class DocumentOnControlReportFilter(BaseModel):
-    type: Type28
-    inArchive: bool | None = None
-    dateControlStart: Annotated[
-        datetime, Field(description="Начальная дата контроля документа")
-    ]
-    dateControlEnd: Annotated[
-        datetime, Field(description="Конечная дата контроля документа")
-    ]
-    docCategoryConstants: list[DocCategory]
-    controlUserIds: list[UUID] | None = None
-
-
-class ReportConstructorDto(BaseModel):
-    fields: Annotated[dict[str, str] | None, Field(description="Поля для отчета")] = (
-        None
-    )
-    columns: Annotated[list[Column] | None, Field(description="Колонки для отчета")] = (
-        None
-    )
-
-
-class PresetPermissionMergeRole(BaseModel):
-    role: str | None = None
-    merge: Merge1 | None = None
-
-
-class PresetPermissionRoleField(BaseModel):
-    roles: Annotated[list[str] | None, Field(description="Роли")] = None
-    mergeRoles: Annotated[
-        list[PresetPermissionMergeRole] | None,
-        Field(description="Политика обработки слияния ИД"),
-    ] = None
-    resolvePolicy: Annotated[
-        ResolvePolicy | None, Field(description="Политики обработки доступа")
-    ] = None
-
-
-class PresetPermissionSetting(BaseModel):
-    type: Annotated[Type18 | None, Field(description="Тип")] = None
-    roleField: Annotated[
-        PresetPermissionRoleField | None,
-        Field(
-            description="Роли, Политика обработки слияния ИД, Политики обработки доступа"
-        ),
-    ] = None
-    processCompleted: Annotated[
-        bool | None, Field(description="Признак выполнения процесса")
-    ] = None
-    currentStepCompleted: Annotated[
-        bool | None, Field(description="Признак выполнения текущего этапа")
-    ] = None
-    lastStep: Annotated[
-        bool | None,
-        Field(description="Признак того что текущий этап является последним"),
-    ] = None
-    processStarted: Annotated[
-        bool | None, Field(description="Признак того что процесс начал выполнение")
-    ] = None
-    onControl: Annotated[
-        bool | None, Field(description="Документ стоит на контроле")
-    ] = None
-    taskOnControl: Annotated[
-        bool | None, Field(description="Поручение стоит на контроле")
-    ] = None
-    hasRegNumber: Annotated[bool | None, Field(description="Регномер")] = None
-    documentHasItems: Annotated[
-        list[Type4] | None,
-        Field(description="Типы этапов в документе при которых доступно"),
-    ] = None
-    createType: Annotated[
-        CreateType3 | None, Field(description="Типсоздания документа")
-    ] = None
-    taskCompleted: Annotated[bool | None, Field(description="Поручение исполненно")] = (
-        None
-    )
-    taskOnRevision: Annotated[
-        bool | None, Field(description="Поручение на доработке")
-    ] = None
-    childTask: Annotated[bool | None, Field(description="Дочернее поручение")] = None
-    taskType: Annotated[Type12 | None, Field(description="Тип поручения")] = None
-    taskBeginExecution: Annotated[
-        bool | None, Field(description="Поручение начало исполнение")
-    ] = None
-    archive: Annotated[
-        bool | None, Field(description="Документ находится в архиве")
-    ] = None
-    taskCreateByPeriod: Annotated[
-        bool | None,
-        Field(description="Поручение создано для из-за переодического выполнения"),
-    ] = None
-    hasPeriodTasks: Annotated[
-        bool | None,
-        Field(
-            description="На основании этого поручения были созданны переодические поручения"
-        ),
-    ] = None
-    docStatus: Annotated[
-        Status2 | None,
-        Field(description="Перечисление для описания статусов документов"),
-    ] = None
-
-
-class PresetPermissionStatusRoleFieldAcceptanceInventoryStatus(BaseModel):
-    status: Status | None = None
-    roleField: PresetPermissionRoleField | None = None
-
-
-class PresetPermissionStatusRoleFieldDestructionActStatus(BaseModel):
-    status: DestructionActStatus1 | None = None
-    roleField: PresetPermissionRoleField | None = None
-
-
-class PresetPermissionStatusRoleFieldNomenclatureDepartmentStatus(BaseModel):
-    status: Status8 | None = None
-    roleField: PresetPermissionRoleField | None = None
-
-
-class PresetPermissionStatusRoleFieldSummaryNomenclatureDepartmentStatus(BaseModel):
-    status: SummaryNomenclatureDepartmentStatus1 | None = None
-    roleField: PresetPermissionRoleField | None = None
-
-
-class PresetPermissionString(BaseModel):
-    permission: str | None = None
-    data: list[str] | None = None
-
-
-class PresetPermissionTaskDocStatus(BaseModel):
-    status: Annotated[
-        Status2 | None,
-        Field(description="Перечисление для описания статусов документов"),
-    ] = None
-    taskTypes: list[PresetPermissionSetting] | None = None
-
-
-class NomenclatureDepartmentRequest(BaseModel):
-    id: UUID | None = None
-    indexPrefix: str | None = None
-    departmentId: UUID
-    calendarYear: int | None = None
-
-
-class MiniDocumentAccessRequest(BaseModel):
-    addEmployeeIds: Annotated[set[UUID], Field(min_items=1)]
-    accessBy: datetime
-
-
-class CopyAffairWrapperUUID(BaseModel):
-    ids: list[UUID] | None = None
-    active: bool | None = None
-    refreshDepPath: bool | None = None
-
-
-class CopyAffairWrapperInteger(BaseModel):
-    ids: list[int] | None = None
-    active: bool | None = None
-    refreshDepPath: bool | None = None
-
-
-class NomenclatureAffairOperationCopyDepDto(BaseModel):
-    calendarYear: Annotated[int | None, Field(description="Календарный год")] = None
-    departmentId: Annotated[
-        UUID | None, Field(description="Идентификатор департамента")
-    ] = None
-    excludedIds: Annotated[
-        list[UUID] | None, Field(description="Исключающие записи")
-    ] = None
-
-
-class NomenclatureAffairPrintTemplateAddRequest(BaseModel):
-    template: NomenclatureAffairPrintTemplateRequest
-    attachmentAddId: Annotated[UUID, Field(min_length=1)]
-
-
-class ArchiveRegistrationRequest(BaseModel):
-    orgName: str | None = None
-    unp: str | None = None
-    unpf: str | None = None
-    sysId: str | None = None
-    sedSysId: str | None = None
-    fundNumber: int | None = None
-
-
-class PackageRegSystemResponse(PackageEoResponse):
-    pass
-
-
-class IntegrationConfigRequest(BaseModel):
-    nceoAddr: str | None = None
-    proxyAddr: str | None = None
-    proxyPort: str | None = None
-    proxyAuthUser: str | None = None
-    proxyAuthPass: str | None = None
-
-
-class IntegrationConfigDto(IntegrationConfigRequest):
-    pass
-
-
-class CitizenType(BaseModel):
-    citizenTypeId: int | None = None
-    citizenType: str | None = None
-
-
-class DocumentCategoryConstants(Enum):
-    INTERN = "INTERN"
-    INCOMING = "INCOMING"
-    OUTGOING = "OUTGOING"
-    APPEAL = "APPEAL"
-
-
-class UpdateDocumentType(BaseModel):
-    id: int | None = None
-    documentCategoryConstants: DocumentCategoryConstants | None = None
-    documentType: DocumentType | None = None
-    citizenType: CitizenType | None = None
-    regNumber: str | None = None
-    regDate: datetime | None = None
-
-
-class Recipient(BaseModel):
-    id: int | None = None
-    recipientName: str | None = None
-
-
-class NomenclatureAffair(BaseModel):
-    id: int | None = None
-    departmentId: int | None = None
-    departmentName: str | None = None
-    nameAffair: str | None = None
-    storagePeriodId: int | None = None
-    storagePeriodName: str | None = None
-    index: str | None = None
-    collectingStart: datetime | None = None
-    collectingEnd: datetime | None = None
-    note: str | None = None
-
-
-class AddresseeDocument(BaseModel):
-    addresseeId: int | None = None
-    addresseeName: str | None = None
-    addresseeFullName: str | None = None
-    addresseeSmdoCode: str | None = None
-    toPeople: str | None = None
-    deliveryMethod: str | None = None
-    dateSend: datetime | None = None
-
-
-class CorrespondentDocument(BaseModel):
-    correspondentId: int | None = None
-    correspondentName: str | None = None
-    correspondentFullName: str | None = None
-    correspondentUnp: str | None = None
-    correspondentSmdoCode: str | None = None
-
-
-class NomenclatureAffairDocument(BaseModel):
-    nomenclatureAffairId: int | None = None
-    nomenclatureAffairName: str | None = None
-    nomenclatureAffairDate: datetime | None = None
-
-
-class OrganizationDocument(BaseModel):
-    organizationId: int | None = None
-    organizationName: str | None = None
-
-
-class TypeDirectum(Enum):
-    R = "R"
-    S = "S"
-    P = "P"
-    C = "C"
-
-
-class TaskStatusDirectum(Enum):
-    I = "I"
-    W = "W"
-    K = "K"
-    C = "C"
-    N = "N"
-
-
-class DocumentLinkType(Enum):
-    RECEIVED_IN_RESPONSE_TO = "RECEIVED_IN_RESPONSE_TO"
-    CREATE_IN_RESPONSE_TO = "CREATE_IN_RESPONSE_TO"
-    LINK_DOC = "LINK_DOC"
-
-
-class DocumentLink(BaseModel):
-    id: int | None = None
-    docRkkId: int | None = None
-    docRkkLinkId: int | None = None
-    documentLinkType: DocumentLinkType | None = None
-
-
-class Correspondent(BaseModel):
-    id: int | None = None
-    name: str | None = None
-    fullName: str | None = None
-    unp: str | None = None
-    address: str | None = None
-    smdoCode: str | None = None
-
-
-class GroupAddRequest(BaseModel):
-    group: GroupRequest
-    employeeAdd: list[UUID] | None = None
-
-
-class ExtractCertificateRequest(BaseModel):
-    cms: Annotated[str, Field(description="Данные ЭЦП в формате Base64", min_length=1)]
-
-
-class EmployeeAddRequest(BaseModel):
-    employee: EmployeeRequest
-    ioAdd: EmployeeIoRequest | None = None
-    secretaryAdd: list[UUID] | None = None
-
-
-class Include1(Enum):
-    POST = "POST"
-    DEPARTMENT = "DEPARTMENT"
-
-
-class EmployeeFilter(BaseModel):
-    firstName: Annotated[str | None, Field(description="Имя сотрудника")] = None
-    lastName: Annotated[str | None, Field(description="Фамилия сотрудника")] = None
-    middleName: Annotated[str | None, Field(description="Отчество сотрудника")] = None
-    fired: Annotated[bool | None, Field(description="Признак уволен ли сотрудник")] = (
-        None
-    )
-    active: Annotated[
-        bool | None, Field(description="Признак активен ли сотрудник")
-    ] = None
-    fullPostName: Annotated[str | None, Field(description="ФИО сотрудника")] = None
-    postId: Annotated[int | None, Field(description="Идентификатор должности")] = None
-    ids: Annotated[set[UUID] | None, Field(description="Список идентификаторов")] = None
-    departmentId: Annotated[
-        list[UUID] | None,
-        Field(description="Идентификатор департамента в котором работает сотрудник"),
-    ] = None
-    includes: Annotated[
-        list[Include1] | None,
-        Field(description="Список моделей которые могу быть добавлены при отображении"),
-    ] = None
-    orgId: Annotated[str | None, Field(description="ИД филиала")] = None
-    excludeRoleId: UUID | None = None
-    excludeGroupId: UUID | None = None
-    excludeGriefId: UUID | None = None
-    all: bool | None = None
-    childDepartments: Annotated[
-        bool | None,
-        Field(
-            description="Признак поиска по всех коллег включая дочернии подразделения"
-        ),
-    ] = None
-
-
-class Type36(Enum):
-    """
-    Признак секретаря
-    """
-
-    SECRETARY = "SECRETARY"
-    IO = "IO"
-    IO_DISMISSAL = "IO_DISMISSAL"
-
-
-class SecretaryRequest(BaseModel):
-    targetId: Annotated[
-        UUID,
-        Field(
-            description="Идентификатор сотрудника за которого будут исполнять обязанности"
-        ),
-    ]
-    ioIds: Annotated[
-        list[UUID] | None,
-        Field(
-            description="Идентификатор сотрудника который будет исполнять обязанности"
-        ),
-    ] = None
-
-
-class DocumentRecipientDeliveryHistoryDto(BaseModel):
-    id: Annotated[
-        UUID | None,
-        Field(description="Идентификатор истории доставки документа адресату"),
-    ] = None
-    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
-    log: Annotated[
-        str | None,
-        Field(description="Информация об изменениях доставки документа адресату"),
-    ] = None
-    docRecipientId: Annotated[
-        UUID | None, Field(description="Идентификатор адресата")
-    ] = None
-
-
-class OperationType2(Enum):
-    """
-    Доступные типы операций: DOCUMENT_ACCESS_GRIEF_UPDATE, DOCUMENT_CONTRACT_AGREEMENT_UPDATE, DOCUMENT_CONTRACT_AUTO_PROLONGATION_UPDATE, DOCUMENT_CONTRACT_CORRESPONDENT_UPDATE, DOCUMENT_CONTRACT_FIELDS_UPDATE, DOCUMENT_CONTRACT_RESPONSIBLE, DOCUMENT_CONTRACT_TYPICAL_UPDATE, DOCUMENT_CORRESPONDENT_UPDATE, DOCUMENT_UPDATE_CUSTOM_FIELDS, DOCUMENT_FIELDS_MEETING_UPDATE, DOCUMENT_FIELDS_MEETING_QUESTION_UPDATE, DOCUMENT_FIELDS_QUESTION_UPDATE, DOCUMENT_MEETING_INVITEES_UPDATE, DOCUMENT_LINK_UPDATE, DOCUMENT_MAIN_FIELDS_APPEAL_UPDATE, DOCUMENT_MAIN_FIELDS_UPDATE, DOCUMENT_NOMENCLATURE_AFFAIR_UPDATE, DOCUMENT_PROCESS_EXECUTORS_UPDATE, DOCUMENT_PROCESS_ITEM_UPDATE, DOCUMENT_RECIPIENT_LIST_UPDATE, DOCUMENT_REPEAT_IDENTICAL_UPDATE, DOCUMENT_QUESTION_RESPONSIBLE_EXECUTOR_UPDATE, DOCUMENT_SPEAKERS_MEETING_QUESTION_UPDATE, DOCUMENT_UNDRAFT
-    """
-
-    DOCUMENT_ACCESS_GRIEF_UPDATE = "DOCUMENT_ACCESS_GRIEF_UPDATE"
-    DOCUMENT_CONTRACT_AGREEMENT_UPDATE = "DOCUMENT_CONTRACT_AGREEMENT_UPDATE"
-    DOCUMENT_CONTRACT_AUTO_PROLONGATION_UPDATE = (
-        "DOCUMENT_CONTRACT_AUTO_PROLONGATION_UPDATE"
-    )
-    DOCUMENT_CONTRACT_CORRESPONDENT_UPDATE = "DOCUMENT_CONTRACT_CORRESPONDENT_UPDATE"
-    DOCUMENT_CONTRACT_FIELDS_UPDATE = "DOCUMENT_CONTRACT_FIELDS_UPDATE"
-    DOCUMENT_CONTRACT_RESPONSIBLE = "DOCUMENT_CONTRACT_RESPONSIBLE"
-    DOCUMENT_CONTRACT_TYPICAL_UPDATE = "DOCUMENT_CONTRACT_TYPICAL_UPDATE"
-    DOCUMENT_CORRESPONDENT_UPDATE = "DOCUMENT_CORRESPONDENT_UPDATE"
-    DOCUMENT_UPDATE_CUSTOM_FIELDS = "DOCUMENT_UPDATE_CUSTOM_FIELDS"
-    DOCUMENT_FIELDS_MEETING_UPDATE = "DOCUMENT_FIELDS_MEETING_UPDATE"
-    DOCUMENT_FIELDS_MEETING_QUESTION_UPDATE = "DOCUMENT_FIELDS_MEETING_QUESTION_UPDATE"
-    DOCUMENT_FIELDS_QUESTION_UPDATE = "DOCUMENT_FIELDS_QUESTION_UPDATE"
-    DOCUMENT_MEETING_INVITEES_UPDATE = "DOCUMENT_MEETING_INVITEES_UPDATE"
-    DOCUMENT_LINK_UPDATE = "DOCUMENT_LINK_UPDATE"
-    DOCUMENT_MAIN_FIELDS_APPEAL_UPDATE = "DOCUMENT_MAIN_FIELDS_APPEAL_UPDATE"
-    DOCUMENT_MAIN_FIELDS_UPDATE = "DOCUMENT_MAIN_FIELDS_UPDATE"
-    DOCUMENT_NOMENCLATURE_AFFAIR_UPDATE = "DOCUMENT_NOMENCLATURE_AFFAIR_UPDATE"
-    DOCUMENT_PROCESS_EXECUTORS_UPDATE = "DOCUMENT_PROCESS_EXECUTORS_UPDATE"
-    DOCUMENT_PROCESS_ITEM_UPDATE = "DOCUMENT_PROCESS_ITEM_UPDATE"
-    DOCUMENT_RECIPIENT_LIST_UPDATE = "DOCUMENT_RECIPIENT_LIST_UPDATE"
-    DOCUMENT_REPEAT_IDENTICAL_UPDATE = "DOCUMENT_REPEAT_IDENTICAL_UPDATE"
-    DOCUMENT_QUESTION_RESPONSIBLE_EXECUTOR_UPDATE = (
-        "DOCUMENT_QUESTION_RESPONSIBLE_EXECUTOR_UPDATE"
-    )
-    DOCUMENT_SPEAKERS_MEETING_QUESTION_UPDATE = (
-        "DOCUMENT_SPEAKERS_MEETING_QUESTION_UPDATE"
-    )
-    DOCUMENT_UNDRAFT = "DOCUMENT_UNDRAFT"
-
-
-class JsonNode(RootModel[Any]):
-    pass
-
-
-class DocumentLinkCopyType(Enum):
-    DOCUMENT = "DOCUMENT"
-    NONE = "NONE"
-
-
-class RecipientCopyType(Enum):
-    CONTRACT = "CONTRACT"
-    DOCUMENT = "DOCUMENT"
-    NONE = "NONE"
-
-
-class AttachmentCopyType(Enum):
-    DOCUMENT = "DOCUMENT"
-    PROFILE = "PROFILE"
-    PROFILE_AND_DOCUMENT = "PROFILE_AND_DOCUMENT"
-    NONE = "NONE"
-
-
-class ProcessCopyType(Enum):
-    DOCUMENT = "DOCUMENT"
-    PROFILE = "PROFILE"
-
-
-class DocumentBasedExistingBody(BaseModel):
-    documentLinkCopyType: DocumentLinkCopyType | None = None
-    documentIntroductionCopyType: DocumentLinkCopyType | None = None
-    recipientCopyType: RecipientCopyType | None = None
-    attachmentCopyType: AttachmentCopyType | None = None
-    processCopyType: ProcessCopyType
-    baseFieldsCopyType: ProcessCopyType
-    responsibleExecutorsCopyType: DocumentLinkCopyType | None = None
-
-
-class CreateTaskRequestExecutor(BaseModel):
-    employeeId: UUID | None = None
-    responsible: bool | None = None
-    stampText: str | None = None
-    createDate: datetime | None = None
-    executedDate: datetime | None = None
-
-
-class CreateTaskProjectRequest(BaseModel):
-    planedDateEnd: Annotated[
-        datetime | None, Field(description="Планируемая дата исполнения поручения")
-    ] = None
-    taskText: Annotated[str, Field(description="Текст поручения", min_length=1)]
-    authorId: Annotated[UUID | None, Field(description="Автор поручения")] = None
-    type: Annotated[Type12, Field(description="Тип поручения")]
-    executors: Annotated[
-        list[CreateTaskRequestExecutor] | None, Field(description="Исполнители")
-    ] = None
-
-
-class RequestDateExecutionResult(BaseModel):
-    result: Annotated[bool | None, Field(description="Результат")] = None
-    comment: str | None = None
-
-
-class PaperworkProcessAction(BaseModel):
-    result: Annotated[
-        bool,
-        Field(description="Признак результата действия положительный/отрицательный"),
-    ]
-    employeeId: Annotated[
-        UUID,
-        Field(
-            description="Идентификатор участника процесса от лица которого делается действие"
-        ),
-    ]
-    comment: Annotated[str | None, Field(description="Комментарий")] = None
-    ignoreErrors: Annotated[
-        bool | None, Field(description="Признак игнорирования ошибок")
-    ] = None
-    profileId: UUID | None = None
-
-
-class DocumentAttachmentSignEntry(BaseModel):
-    attachmentId: UUID | None = None
-    cms: str | None = None
-
-
-class ProcessActionWithSign(BaseModel):
-    result: Annotated[
-        bool,
-        Field(description="Признак результата действия положительный/отрицательный"),
-    ]
-    employeeId: Annotated[
-        UUID,
-        Field(
-            description="Идентификатор участника процесса от лица которого делается действие"
-        ),
-    ]
-    comment: Annotated[str | None, Field(description="Комментарий")] = None
-    ignoreErrors: Annotated[
-        bool | None, Field(description="Признак игнорирования ошибок")
-    ] = None
-    signs: list[DocumentAttachmentSignEntry] | None = None
-
-
-class RegistrationProcessRequest(BaseModel):
-    employeeId: Annotated[UUID, Field(description="Идентификатор сотрудника")]
-    ignoreErrors: Annotated[bool, Field(description="Признак игнорирования ошибок")]
-    regDate: Annotated[datetime | None, Field(description="Рег. дата")] = None
-
-
-class SmdoRegistrationReject(BaseModel):
-    employeeId: Annotated[UUID, Field(description="Идентификатор сотрудника")]
-    comment: Annotated[str, Field(description="Комментарий", min_length=1)]
-
-
-class SimpleProcessAction(BaseModel):
-    result: Annotated[
-        bool,
-        Field(description="Признак результата действия положительный/отрицательный"),
-    ]
-    employeeId: Annotated[
-        UUID,
-        Field(
-            description="Идентификатор участника процесса от лица которого делается действие"
-        ),
-    ]
-    comment: Annotated[str | None, Field(description="Комментарий")] = None
-    ignoreErrors: Annotated[
-        bool | None, Field(description="Признак игнорирования ошибок")
-    ] = None
-
-
-class ReserveRegnumberRequest(BaseModel):
-    ignoreErrors: bool | None = None
-
-
-class RedirectReviewProcessAction(BaseModel):
-    employeeId: Annotated[
-        UUID,
-        Field(
-            description="Идентификатор участника процесса от лица которого делается действие"
-        ),
-    ]
-    redirectEmployeeId: Annotated[
-        UUID,
-        Field(
-            description="ИД сотрудника котору будет выдан доступ к этапу рассмотрения"
-        ),
-    ]
-    comment: Annotated[str | None, Field(description="Комментарий")] = None
-
-
-class FreeRegistrationProcessRequest(BaseModel):
-    employeeId: Annotated[
-        UUID | None, Field(description="Идентификатор сотрудника")
-    ] = None
-    regDate: Annotated[datetime, Field(description="Рег. дата")]
-    regNum: Annotated[str, Field(description="Рег. номер", min_length=1)]
-    journalNumber: int | None = None
-    ignoreErrors: bool | None = None
-
-
-class NotifyMeetingBody(BaseModel):
-    ids: list[UUID]
-
-
-class PostIntroductionRequest(SummaryNomenclatureDepartmentIntroductionRequest):
-    """
-    Идентификаторы сотрудников
-    """
-
-
-class ControlPointMainFields(BaseModel):
-    description: str | None = None
-    number: str | None = None
-    deadline: datetime | None = None
-    responsibleContractor: str | None = None
-    responsibleEmployeesAddIds: list[UUID] | None = None
-    responsibleEmployeesDelIds: list[UUID] | None = None
-
-
-class DocumentNextProcessRequest(BaseModel):
-    id: Annotated[UUID, Field(description="Ид документа")]
-    nextId: Annotated[UUID, Field(description="Ид следующего этапа")]
-    employees: Annotated[set[UUID] | None, Field(description="Ид исполнителей")] = None
-
-
-class DocumentCancelAction(BaseModel):
-    id: UUID
-    comment: Annotated[str, Field(min_length=1)]
-
-
-class StorageType1(Enum):
-    """
-    Тип хранения (ARCHIVE - архивное, OPERATIONAL - оперативное)
-    """
-
-    ARCHIVE = "ARCHIVE"
-    OPERATIONAL = "OPERATIONAL"
-
-
-class DestructionActCreateRequest(BaseModel):
-    nomenclatureAffairIds: Annotated[
-        list[UUID],
-        Field(
-            description="Идентификаторы номенклатурных дел для уничтожения", min_items=1
-        ),
-    ]
-    storageType: Annotated[
-        StorageType1,
-        Field(
-            description="Тип хранения (ARCHIVE - архивное, OPERATIONAL - оперативное)"
-        ),
-    ]
-
-
-class OperationType3(Enum):
-    """
-    Тип операции
-    """
-
-    DESTRUCTION_ACT_READ = "DESTRUCTION_ACT_READ"
-    DESTRUCTION_ACT_UPDATE = "DESTRUCTION_ACT_UPDATE"
-    DESTRUCTION_ACT_DELETE = "DESTRUCTION_ACT_DELETE"
-    DESTRUCTION_ACT_PROCESS_EXECUTORS_UPDATE = (
-        "DESTRUCTION_ACT_PROCESS_EXECUTORS_UPDATE"
-    )
-    DESTRUCTION_ACT_PROCESS_ITEM_UPDATE = "DESTRUCTION_ACT_PROCESS_ITEM_UPDATE"
-    DESTRUCTION_ACT_START = "DESTRUCTION_ACT_START"
-    DESTRUCTION_ACT_AGREEMENT = "DESTRUCTION_ACT_AGREEMENT"
-    DESTRUCTION_ACT_SIGNING = "DESTRUCTION_ACT_SIGNING"
-    DESTRUCTION_ACT_STATEMENT = "DESTRUCTION_ACT_STATEMENT"
-    DESTRUCTION_ACT_CANCEL = "DESTRUCTION_ACT_CANCEL"
-    DESTRUCTION_ACT_DESTROY = "DESTRUCTION_ACT_DESTROY"
-    DESTRUCTION_ACT_DESTROY_CHANGE_DATE = "DESTRUCTION_ACT_DESTROY_CHANGE_DATE"
-    DESTRUCTION_ACT_PRINT = "DESTRUCTION_ACT_PRINT"
-
-
-class DestructionActOperation(BaseModel):
-    operationType: Annotated[OperationType3, Field(description="Тип операции")]
-    body: Annotated[Any | None, Field(description="Тело операции")] = None
-
-
-class CorrespondentGroupAddRequest(BaseModel):
-    correspondentGroup: CorrespondentGroupRequest
-    correspondentAdd: Annotated[set[UUID] | None, Field()] = None
-
-
-class IntermediateCorrespondentRequest(BaseModel):
-    ids: list[UUID]
-    id: UUID
-
-
-class NomenclatureArchiveConfigRequest(BaseModel):
-    id: Annotated[
-        str | None,
-        Field(
-            description="Идентификатор ответственного за настроечный справочник модуля"
-        ),
-    ] = None
-    archivistId: Annotated[
-        UUID,
-        Field(
-            description="Идентификатор ответственного за настроечный справочник модуля"
-        ),
-    ]
-    documentLanguageId: Annotated[
-        UUID, Field(description="Идентификатор языка документа")
-    ]
-    documentClassesId: Annotated[
-        UUID, Field(description="Идентификатор класса документа")
-    ]
-    fundId: Annotated[UUID, Field(description="Идентификатор фонда")]
-    countPage: Annotated[int, Field(description="Количество страниц в томе")]
-
-
-class LdapUser(BaseModel):
-    phone: str | None = None
-    email: str | None = None
-    photo: str | None = None
-    fio: str | None = None
-    post: str | None = None
-    departmentName: str | None = None
-    getsAMAccountName: str | None = None
-    sid: str | None = None
-    firstName: str | None = None
-    lastName: str | None = None
-    middleName: str | None = None
-
-
-class TestAdAuth(BaseModel):
-    url: str | None = None
-    dn: str | None = None
-    password: str | None = None
-
-
-class AcceptanceInventoryDataRequest(BaseModel):
-    ids: list[UUID] | None = None
-    years: list[int] | None = None
-    title: str | None = None
-    index: str | None = None
-    description: str | None = None
-    date: datetime | None = None
-    storagePeriodType: StoragePeriodType2 | None = None
-    groupByStoragePeriod: GroupByStoragePeriod | None = None
-    personnel: bool | None = None
-    ignoreErrors: bool | None = None
-
-
-class OperationType4(Enum):
-    """
-    Тип операции
-    """
-
-    ACCEPTANCE_INVENTORY_READ = "ACCEPTANCE_INVENTORY_READ"
-    ACCEPTANCE_INVENTORY_UPDATE = "ACCEPTANCE_INVENTORY_UPDATE"
-    ACCEPTANCE_INVENTORY_PROCESS_EXECUTORS_UPDATE = (
-        "ACCEPTANCE_INVENTORY_PROCESS_EXECUTORS_UPDATE"
-    )
-    ACCEPTANCE_INVENTORY_PROCESS_ITEM_UPDATE = (
-        "ACCEPTANCE_INVENTORY_PROCESS_ITEM_UPDATE"
-    )
-    ACCEPTANCE_INVENTORY_START = "ACCEPTANCE_INVENTORY_START"
-    ACCEPTANCE_INVENTORY_SIGNING = "ACCEPTANCE_INVENTORY_SIGNING"
-    ACCEPTANCE_INVENTORY_STATEMENT = "ACCEPTANCE_INVENTORY_STATEMENT"
-    ACCEPTANCE_INVENTORY_AGREEMENT = "ACCEPTANCE_INVENTORY_AGREEMENT"
-    ACCEPTANCE_INVENTORY_CANCEL = "ACCEPTANCE_INVENTORY_CANCEL"
-    ACCEPTANCE_INVENTORY_DISPATCH = "ACCEPTANCE_INVENTORY_DISPATCH"
-
-
-class AcceptanceInventoryOperation(BaseModel):
-    operationType: Annotated[OperationType4, Field(description="Тип операции")]
-    body: Annotated[Any | None, Field(description="Тело операции")] = None
-
-
-class AcceptanceKanclerArchiveRequest(BaseModel):
-    ids: Annotated[list[UUID], Field(min_items=1)]
-    fundId: UUID
-
-
-class BasicModuleDefinition(BaseModel):
-    enabled: bool | None = None
-    name: str | None = None
-
-
-class ServerInfo(BaseModel):
-    version: str | None = None
-    startDate: datetime | None = None
-    modules: dict[str, BasicModuleDefinition] | None = None
-
-
-class Include2(Enum):
-    DOCUMENT_FOLDERS = "DOCUMENT_FOLDERS"
-    DOCUMENT_FOLDERS_DOCUMENT = "DOCUMENT_FOLDERS_DOCUMENT"
-    PARENT_FOLDER = "PARENT_FOLDER"
-
-
-class FolderFilter(BaseModel):
-    parentId: UUID | None = None
-    name: str | None = None
-    currentFolder: bool | None = None
-    includes: list[Include2] | None = None
-    mapperRules: list[int] | None = None
-
-
-class UserNotificationFilter(BaseModel):
-    read: bool | None = None
-
-
-class Type40(Enum):
-    DOCUMENT = "DOCUMENT"
-    REPORT = "REPORT"
-    NOMENCLATURE_DEPARTMENT = "NOMENCLATURE_DEPARTMENT"
-    SUMMARY_NOMENCLATURE = "SUMMARY_NOMENCLATURE"
-    DESTRUCTION_ACT = "DESTRUCTION_ACT"
-    ACCEPTANCE_INVENTORY = "ACCEPTANCE_INVENTORY"
-    OTHER = "OTHER"
-
-
-class UserNotificationDto(BaseModel):
-    id: UUID | None = None
-    employeeId: UUID | None = None
-    createDate: datetime | None = None
-    label: str | None = None
-    text: str | None = None
-    documentId: UUID | None = None
-    reportId: UUID | None = None
-    nomenclatureDepartmentId: UUID | None = None
-    summaryNomenclatureId: UUID | None = None
-    destructionActId: UUID | None = None
-    acceptanceInventoryId: UUID | None = None
-    type: Type40 | None = None
-    read: bool | None = None
-
-
-class CalendarEventFilter(BaseModel):
-    start: datetime | None = None
-    end: datetime | None = None
-
-
-class CalendarEventDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор пользовательского события")
-    ] = None
-    start: Annotated[datetime | None, Field(description="Дата начала события")] = None
-    end: Annotated[datetime | None, Field(description="Дата окончания события")] = None
-    color: Annotated[str | None, Field(description="Цвет события")] = None
-    text: Annotated[str | None, Field(description="Текст события")] = None
-    title: Annotated[str | None, Field(description="Заголовок события")] = None
-    employeeId: Annotated[
-        UUID | None, Field(description="Идентификатор сотрудника")
-    ] = None
-
-
-class TaskUserCalendarEntry(BaseModel):
-    name: str | None = None
-    id: UUID | None = None
-    documentId: UUID | None = None
-    number: str | None = None
-    start: datetime | None = None
-    end: datetime | None = None
-    onControl: bool | None = None
-    removeControl: bool | None = None
-    skipRegistration: bool | None = None
-
-
-class TaskControlUserCalendarEntry(BaseModel):
-    name: str | None = None
-    id: UUID | None = None
-    documentId: UUID | None = None
-    number: str | None = None
-    taskStatus: TaskStatus | None = None
-    start: datetime | None = None
-    end: datetime | None = None
-    onControl: bool | None = None
-    removeControl: bool | None = None
-    skipRegistration: bool | None = None
-
-
-class TermDocumentUserCalendarEntry(BaseModel):
-    name: str | None = None
-    id: UUID | None = None
-    status: Annotated[
-        Status2 | None,
-        Field(description="Перечисление для описания статусов документов"),
-    ] = None
-    start: datetime | None = None
-    end: datetime | None = None
-    regDate: datetime | None = None
-    regNum: str | None = None
-    onControl: bool | None = None
-    removeControl: bool | None = None
-    skipRegistration: bool | None = None
-
-
-class DocumentInvitedConfirmCalendar(BaseModel):
-    id: UUID | None = None
-    name: str | None = None
-    status: Annotated[
-        Status2 | None,
-        Field(description="Перечисление для описания статусов документов"),
-    ] = None
-    placeMeeting: str | None = None
-    date: datetime | None = None
-    start: datetime | None = None
-    end: datetime | None = None
-    skipRegistration: bool | None = None
-
-
-class DocumentControlUserCalendarEntry(BaseModel):
-    id: UUID | None = None
-    name: str | None = None
-    regDate: datetime | None = None
-    regNum: str | None = None
-    status: Annotated[
-        Status2 | None,
-        Field(description="Перечисление для описания статусов документов"),
-    ] = None
-    start: datetime | None = None
-    end: datetime | None = None
-    onControl: bool | None = None
-    removeControl: bool | None = None
-    skipRegistration: bool | None = None
-
-
-class AdditionalAgreementUserCalendarEntry(BaseModel):
-    id: UUID | None = None
-    name: str | None = None
-    regDate: datetime | None = None
-    regNum: str | None = None
-    status: Annotated[
-        Status2 | None,
-        Field(description="Перечисление для описания статусов документов"),
-    ] = None
-    onControl: bool | None = None
-    removeControl: bool | None = None
-    skipRegistration: bool | None = None
-
-
-class DocumentUserCalendarEntry(BaseModel):
-    name: str | None = None
-    id: UUID | None = None
-    regDate: datetime | None = None
-    regNum: str | None = None
-    status: Annotated[
-        Status2 | None,
-        Field(description="Перечисление для описания статусов документов"),
-    ] = None
-
-
-class UserCalendarEntry(BaseModel):
-    allTasks: list[TaskUserCalendarEntry] | None = None
-    allControlTasks: list[TaskControlUserCalendarEntry] | None = None
-    allDocuments: list[TermDocumentUserCalendarEntry] | None = None
-    allControlDocuments: list[DocumentControlUserCalendarEntry] | None = None
-    calendarEvents: list[CalendarEventDto] | None = None
-    invited: list[DocumentInvitedConfirmCalendar] | None = None
-
-
-class NoPasswordUserAccount(BaseModel):
-    employeeId: UUID | None = None
-    login: str | None = None
-    exists: bool | None = None
-
-
-class Type41(Enum):
-    DOCUMENT_CREATE = "DOCUMENT_CREATE"
-    DOCUMENT_UN_DRAFT = "DOCUMENT_UN_DRAFT"
-    DOCUMENT_CANCEL = "DOCUMENT_CANCEL"
-    DOCUMENT_PROCESS_AGREEMENT = "DOCUMENT_PROCESS_AGREEMENT"
-    DOCUMENT_PROCESS_SIGNING = "DOCUMENT_PROCESS_SIGNING"
-    DOCUMENT_PROCESS_STATEMENT = "DOCUMENT_PROCESS_STATEMENT"
-    DOCUMENT_PROCESS_REGISTRATION = "DOCUMENT_PROCESS_REGISTRATION"
-    DOCUMENT_PROCESS_FREE_REGISTRATION = "DOCUMENT_PROCESS_FREE_REGISTRATION"
-    DOCUMENT_PROCESS_REVIEW = "DOCUMENT_PROCESS_REVIEW"
-    DOCUMENT_PROCESS_EXECUTION = "DOCUMENT_PROCESS_EXECUTION"
-    DOCUMENT_PROCESS_DISPATCH = "DOCUMENT_PROCESS_DISPATCH"
-    DOCUMENT_PROCESS_PREPARATION = "DOCUMENT_PROCESS_PREPARATION"
-    DOCUMENT_PROCESS_PAPERWORK = "DOCUMENT_PROCESS_PAPERWORK"
-    DOCUMENT_PROCESS_ACCEPTANCE = "DOCUMENT_PROCESS_ACCEPTANCE"
-    DOCUMENT_PROCESS_REDIRECT_REVIEW = "DOCUMENT_PROCESS_REDIRECT_REVIEW"
-    DOCUMENT_IN_ARCHIVE = "DOCUMENT_IN_ARCHIVE"
-    DOCUMENT_EXTRACT_ARCHIVE = "DOCUMENT_EXTRACT_ARCHIVE"
-    DOCUMENT_WRITE_OFF_NOMENCLATURE_AFFAIR = "DOCUMENT_WRITE_OFF_NOMENCLATURE_AFFAIR"
-    DOCUMENT_EXTRACT_NOMENCLATURE_AFFAIR = "DOCUMENT_EXTRACT_NOMENCLATURE_AFFAIR"
-    DOCUMENT_TO_CONTROL = "DOCUMENT_TO_CONTROL"
-    DOCUMENT_REMOVE_CONTROL = "DOCUMENT_REMOVE_CONTROL"
-    DOCUMENT_DELETE_CONTROL = "DOCUMENT_DELETE_CONTROL"
-    DOCUMENT_ADD_INTRODUCTIONS = "DOCUMENT_ADD_INTRODUCTIONS"
-    DOCUMENT_DELETE_INTRODUCTIONS = "DOCUMENT_DELETE_INTRODUCTIONS"
-    DOCUMENT_STAMP_INTRODUCTION = "DOCUMENT_STAMP_INTRODUCTION"
-    DOCUMENT_ADD_ADDITIONAL_AGREEMENTS = "DOCUMENT_ADD_ADDITIONAL_AGREEMENTS"
-    DOCUMENT_DELETE_ADDITIONAL_AGREEMENTS = "DOCUMENT_DELETE_ADDITIONAL_AGREEMENTS"
-    DOCUMENT_STAMP_ADDITIONAL_AGREEMENT = "DOCUMENT_STAMP_ADDITIONAL_AGREEMENT"
-    DOCUMENT_UPLOAD_ATTACHMENT = "DOCUMENT_UPLOAD_ATTACHMENT"
-    DOCUMENT_DOWNLOAD_ATTACHMENT = "DOCUMENT_DOWNLOAD_ATTACHMENT"
-    DOCUMENT_DOWNLOAD_ATTACHMENT_WOPI = "DOCUMENT_DOWNLOAD_ATTACHMENT_WOPI"
-    DOCUMENT_DELETE_ATTACHMENT = "DOCUMENT_DELETE_ATTACHMENT"
-    DOCUMENT_CREATE_COPY = "DOCUMENT_CREATE_COPY"
-    DOCUMENT_CREATE_NEW_VERSION = "DOCUMENT_CREATE_NEW_VERSION"
-    DOCUMENT_ADD_SIGN = "DOCUMENT_ADD_SIGN"
-    TASK_CREATE = "TASK_CREATE"
-    TASK_DELETE = "TASK_DELETE"
-    TASK_TO_CONTROL = "TASK_TO_CONTROL"
-    TASK_REMOVE_CONTROL = "TASK_REMOVE_CONTROL"
-    TASK_DELETE_CONTROL = "TASK_DELETE_CONTROL"
-    TASK_ADD_LINK = "TASK_ADD_LINK"
-    TASK_DELETE_LINK = "TASK_DELETE_LINK"
-    TASK_UPLOAD_ATTACHMENT = "TASK_UPLOAD_ATTACHMENT"
-    TASK_DOWNLOAD_ATTACHMENT = "TASK_DOWNLOAD_ATTACHMENT"
-    TASK_DELETE_ATTACHMENT = "TASK_DELETE_ATTACHMENT"
-    DOCUMENT_PROCESS_CONTRACT_EXECUTION = "DOCUMENT_PROCESS_CONTRACT_EXECUTION"
-
-
-class UserActionFilter(BaseModel):
-    types: list[Type41] | None = None
-    groupIds: list[UUID] | None = None
-    departmentIds: list[UUID] | None = None
-    employeeIds: list[UUID] | None = None
-    start: datetime | None = None
-    end: datetime | None = None
-
-
-class UserActionDashboard(BaseModel):
-    point: datetime | None = None
-    count: int | None = None
-
-
-class BasicSearchRequest(BaseModel):
-    search: Annotated[str | None, Field(description="Строка поиска")] = None
-    active: Annotated[bool | None, Field(description="Признак активности")] = None
-
-
-class Include3(Enum):
-    DOCUMENT = "DOCUMENT"
-    DOCUMENT_CORRESPONDENT = "DOCUMENT_CORRESPONDENT"
-
-
-class TaskFilter(BaseModel):
-    currentUserAuthor: Annotated[
-        bool | None, Field(description="Текущий юзер автор поручения")
-    ] = None
-    currentUserOnControl: Annotated[
-        bool | None, Field(description="Текущий юзер контролер в поручении")
-    ] = None
-    currentUserOnExecution: Annotated[
-        bool | None, Field(description="Текущий юзер исполнитель поручения")
-    ] = None
-    currentUserExpiresTask: Annotated[
-        bool | None,
-        Field(
-            description="Текущий юзер исполнитель поручения и срок исполнения подходит к концу"
-        ),
-    ] = None
-    currentUserOverdue: Annotated[
-        bool | None,
-        Field(
-            description="Текущий юзер исполнитель поручения и срок исполнения просрочен"
-        ),
-    ] = None
-    currentUserEndless: Annotated[
-        bool | None,
-        Field(
-            description="Текущий юзер исполнитель без отметки и поручения без срока исполнения"
-        ),
-    ] = None
-    taskText: Annotated[str | None, Field(description="Текст поручения")] = None
-    taskStatus: TaskStatus | None = None
-    documentRegNum: str | None = None
-    executorFirstName: str | None = None
-    executorLastName: str | None = None
-    executorMiddleName: str | None = None
-    fetchExecutors: bool | None = None
-    includes: list[Include3] | None = None
-    mapperRules: list[int] | None = None
-
-
-class ExecutionTaskStatCount(BaseModel):
-    work: int | None = None
-    limited: int | None = None
-    expire: int | None = None
-
-
-class TaskProjectFilter(BaseModel):
-    taskText: str | None = None
-    documentRegNum: str | None = None
-
-
-class NomenclatureType2(Enum):
-    MAIN = "MAIN"
-    ADDITIONAL = "ADDITIONAL"
-
-
-class SummaryNomenclatureDepartmentFilter(BaseModel):
-    year: int | None = None
-    nomenclatureType: NomenclatureType2 | None = None
-    status: SummaryNomenclatureDepartmentStatus1 | None = None
-    currentUserExecutor: bool | None = None
-
-
-class Operation(Enum):
-    """
-    Перечисления доступных операций над сущностями в сводной номенклатуре
-    """
-
-    SUMMARY_NOMENCLATURE_DEPARTMENT_READ = "SUMMARY_NOMENCLATURE_DEPARTMENT_READ"
-    SUMMARY_NOMENCLATURE_DEPARTMENT_UPDATE = "SUMMARY_NOMENCLATURE_DEPARTMENT_UPDATE"
-    SUMMARY_NOMENCLATURE_DEPARTMENT_PROCESS_EXECUTORS_UPDATE = (
-        "SUMMARY_NOMENCLATURE_DEPARTMENT_PROCESS_EXECUTORS_UPDATE"
-    )
-    SUMMARY_NOMENCLATURE_DEPARTMENT_PROCESS_ITEM_UPDATE = (
-        "SUMMARY_NOMENCLATURE_DEPARTMENT_PROCESS_ITEM_UPDATE"
-    )
-    SUMMARY_NOMENCLATURE_DEPARTMENT_START = "SUMMARY_NOMENCLATURE_DEPARTMENT_START"
-    SUMMARY_NOMENCLATURE_DEPARTMENT_SIGNING = "SUMMARY_NOMENCLATURE_DEPARTMENT_SIGNING"
-    SUMMARY_NOMENCLATURE_DEPARTMENT_STATEMENT = (
-        "SUMMARY_NOMENCLATURE_DEPARTMENT_STATEMENT"
-    )
-    SUMMARY_NOMENCLATURE_DEPARTMENT_CANCEL = "SUMMARY_NOMENCLATURE_DEPARTMENT_CANCEL"
-    SUMMARY_NOMENCLATURE_DEPARTMENT_CREATE_NOMENCLATURE = (
-        "SUMMARY_NOMENCLATURE_DEPARTMENT_CREATE_NOMENCLATURE"
-    )
-    SUMMARY_NOMENCLATURE_DEPARTMENT_INTRODUCTION_CREATE = (
-        "SUMMARY_NOMENCLATURE_DEPARTMENT_INTRODUCTION_CREATE"
-    )
-    SUMMARY_NOMENCLATURE_DEPARTMENT_INTRODUCTION_DELETE = (
-        "SUMMARY_NOMENCLATURE_DEPARTMENT_INTRODUCTION_DELETE"
-    )
-
-
-class SummaryNomenclatureDepartmentPermission(BaseModel):
-    operation: Annotated[
-        Operation | None,
-        Field(
-            description="Перечисления доступных операций над сущностями в сводной номенклатуре"
-        ),
-    ] = None
-    employees: Annotated[set[UUID] | None, Field()] = None
-
-
-class Include4(Enum):
-    NOMENCLATURE_DEPARTMENT = "NOMENCLATURE_DEPARTMENT"
-    DEPARTMENT = "DEPARTMENT"
-
-
-class SummaryNomenclatureDepartmentLinkFilter(BaseModel):
-    includes: list[Include4] | None = None
-    name: str | None = None
-
-
-class ActionType(Enum):
-    CREATE = "CREATE"
-    UPDATE = "UPDATE"
-    REJECT = "REJECT"
-    CREATED = "CREATED"
-    STEP_END = "STEP_END"
-    STEP_START = "STEP_START"
-    PROCESS_START = "PROCESS_START"
-    NOMENCLATURES_CREATED = "NOMENCLATURES_CREATED"
-    MAIN_FIELDS_UPDATE = "MAIN_FIELDS_UPDATE"
-    PROCESS_ITEM_UPDATE = "PROCESS_ITEM_UPDATE"
-    PROCESS_ITEM_EXECUTORS_UPDATE = "PROCESS_ITEM_EXECUTORS_UPDATE"
-    START = "START"
-    SIGNING = "SIGNING"
-    STATEMENT = "STATEMENT"
-    DELETE = "DELETE"
-    CANCEL = "CANCEL"
-    ACTION = "ACTION"
-    ATTACHMENT_PRINT = "ATTACHMENT_PRINT"
-    ATTACHMENT_ADDED = "ATTACHMENT_ADDED"
-    ATTACHMENT_DELETED = "ATTACHMENT_DELETED"
-    INTRODUCTION_CREATE = "INTRODUCTION_CREATE"
-    INTRODUCTION_DELETE = "INTRODUCTION_DELETE"
-    INTRODUCTION_STAMP = "INTRODUCTION_STAMP"
-
-
-class SummaryNomDepHistoryActionData(BaseModel):
-    actionType: ActionType | None = None
-    data: dict[str, Any] | None = None
-
-
-class SummaryInventoryReportFilter(BaseModel):
-    id: UUID | None = None
-    number: str | None = None
-    fundId: UUID | None = None
-    year: int | None = None
-    groupByStoragePeriod: GroupByStoragePeriod | None = None
-    personnel: bool | None = None
-    methodAssemblyType: MethodAssemblyType | None = None
-
-
-class Include5(Enum):
-    PARENT_SUBJECT = "PARENT_SUBJECT"
-
-
-class SubjectFilter(BaseModel):
-    includes: Annotated[
-        list[Include5] | None,
-        Field(description="Список моделей которые могу быть добавлены при отображении"),
-    ] = None
-
-
-class SedOrgDto(BaseModel):
-    id: str | None = None
-    name: str | None = None
-
-
-class RouterDirectoryFilter(BaseModel):
-    name: Annotated[str | None, Field(description="Наименование")] = None
-    active: Annotated[bool | None, Field(description="Признак активена ли запись")] = (
-        None
-    )
-    docCategory: DocCategory | None = None
-
-
-class ProcessItemDefinition(BaseModel):
-    type: Annotated[
-        Type4 | None, Field(description="Перечисление для описания типов процесса")
-    ] = None
-    before: Annotated[
-        list[Type4] | None, Field(description="Процессы после которых может следовать")
-    ] = None
-    after: Annotated[
-        list[Type4] | None, Field(description="Процессы которые могут следовать после")
-    ] = None
-    start: Annotated[
-        bool | None, Field(description="Признак может ли быть первым процессом")
-    ] = None
-    end: Annotated[
-        bool | None, Field(description="Признак может ли быть последний процессом")
-    ] = None
-    days: Annotated[
-        bool | None, Field(description="Признак может ли ограничеваться кол-во дней")
-    ] = None
-    employees: Annotated[
-        bool | None, Field(description="Признак может ли иметь участников")
-    ] = None
-    externalEmployees: Annotated[
-        bool | None, Field(description="Может содержать работников других фелиалов")
-    ] = None
-    empActionQueueType: Annotated[
-        list[ActionQueueType1] | None,
-        Field(description="Доступные типы действий для участников процесса"),
-    ] = None
-    docs: Annotated[
-        list[DocCategory] | None,
-        Field(description="Типы документов в которых доступен процесс"),
-    ] = None
-
-
-class ReportFilter(BaseModel):
-    dateStart: Annotated[
-        datetime | None, Field(description="Дата начала поиска сформированных отчетов")
-    ] = None
-    dateEnd: Annotated[
-        datetime | None,
-        Field(description="Дата окончания поиска сформированных отчетов"),
-    ] = None
-    template: Annotated[
-        Template1 | None,
-        Field(description="Перечисление для описания констант шаблонов отчета"),
-    ] = None
-    type: Type28 | None = None
-
-
-class DocumentOnExecutionReportFilter(BaseModel):
-    type: Type28
-    docCategoryConstants: list[DocCategory]
-    subAuthors: Annotated[
-        list[UUID] | None, Field(description="Список идентификаторов авторов документа")
-    ] = None
-    subExecutors: Annotated[
-        list[UUID] | None,
-        Field(description="Список идентификаторов исполнителей поручения"),
-    ] = None
-    subProcessExecutors: Annotated[
-        list[UUID] | None,
-        Field(description="Список идентификаторов исполнителей пройессов"),
-    ] = None
-    subControlUser: Annotated[
-        list[UUID] | None, Field(description="Список идентификаторов контролеров")
-    ] = None
-    subTaskControlUser: Annotated[
-        list[UUID] | None,
-        Field(description="Список идентификаторов контролеров поручений"),
-    ] = None
-
-
-class DocumentInProgressReportFilter(BaseModel):
-    type: Type28
-    docCategoryConstants: list[DocCategory]
-    statuses: list[Status2]
-    dateRegStart: Annotated[
-        datetime, Field(description="Начальная дата регистрации документа")
-    ]
-    dateRegEnd: Annotated[
-        datetime, Field(description="Конечная дата регистрации документа")
-    ]
-    executedCurrentProcess: Annotated[
-        list[UUID] | None,
-        Field(description="Идентификаторы исполнителей текущего процесса"),
-    ] = None
-    subAuthors: Annotated[
-        list[UUID] | None, Field(description="Список идентификаторов авторов документа")
-    ] = None
-    subExecutors: Annotated[
-        list[UUID] | None,
-        Field(description="Список идентификаторов исполнителей поручения"),
-    ] = None
-    subProcessExecutors: Annotated[
-        list[UUID] | None,
-        Field(description="Список идентификаторов исполнителей пройессов"),
-    ] = None
-    subControlUser: Annotated[
-        list[UUID] | None, Field(description="Список идентификаторов контролеров")
-    ] = None
-    subTaskControlUser: Annotated[
-        list[UUID] | None,
-        Field(description="Список идентификаторов контролеров поручений"),
-    ] = None
-
-
-class ReportUserConfigFilter(BaseModel):
-    type: str | None = None
-    name: str | None = None
-
-
-class AttachmentPersonalSetupDto(BaseModel):
-    id: UUID | None = None
-    contentType: ContentType | None = None
-    uploadDate: Annotated[datetime | None, Field(description="Дата загрузки")] = None
-    name: Annotated[str | None, Field(description="Наименование вложения")] = None
-    size: Annotated[int | None, Field(description="Размер вложения")] = None
-
-
-class DocumentCategory1(Enum):
-    INTERN = "INTERN"
-    INCOMING = "INCOMING"
-    OUTGOING = "OUTGOING"
-    MEETING = "MEETING"
-    QUESTION = "QUESTION"
-    MEETING_QUESTION = "MEETING_QUESTION"
-    APPEAL = "APPEAL"
-    CONTRACT = "CONTRACT"
-    ALL = "ALL"
-
-
-class DocumentCategoryFilter(BaseModel):
-    documentCategory: DocumentCategory1 | None = None
-
-
-class SubscriberFilter(BaseModel):
-    smdoCode: str | None = None
-    name: str | None = None
-
-
-class SliceDtoSubscriberDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[SubscriberDto] | None = None
-
-
-class SedTypeDto(BaseModel):
-    id: UUID | None = None
-    createdOn: datetime | None = None
-    objid: UUID | None = None
-    updatedOn: datetime | None = None
-    description: str | None = None
-    name: str | None = None
-    startDate: str | None = None
-    endDate: str | None = None
-    version: str | None = None
-    status: str | None = None
-    rowId: str | None = None
-    createDate: datetime | None = None
-    updatedDate: datetime | None = None
-
-
-class SliceDtoSedTypeDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[SedTypeDto] | None = None
-
-
-class FileTypeDto(BaseModel):
-    id: UUID | None = None
-    extension: str | None = None
-    endDate: str | None = None
-    rowId: str | None = None
-    createdOn: datetime | None = None
-    updatedOn: datetime | None = None
-    objid: UUID | None = None
-    startDate: str | None = None
-    status: str | None = None
-    name: str | None = None
-    updatedDate: datetime | None = None
-
-
-class SliceDtoFileTypeDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[FileTypeDto] | None = None
-
-
-class DocTypeDto(BaseModel):
-    id: UUID | None = None
-    status: str | None = None
-    objid: UUID | None = None
-    startDate: str | None = None
-    endDate: str | None = None
-    createdOn: datetime | None = None
-    updatedOn: datetime | None = None
-    name: str | None = None
-    rowId: str | None = None
-    createDate: datetime | None = None
-    updatedDate: datetime | None = None
-
-
-class SliceDtoDocTypeDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[DocTypeDto] | None = None
-
-
-class Include6(Enum):
-    ARCHIVE_FUND = "ARCHIVE_FUND"
-
-
-class NomenclatureShelvingShelveFilter(BaseModel):
-    fundId: UUID | None = None
-    fundIds: list[UUID] | None = None
-    includes: list[Include6] | None = None
-    search: str | None = None
-    active: bool | None = None
-
-
-class Include7(Enum):
-    DEPARTMENT = "DEPARTMENT"
-    NOMENCLATURE_DEPARTMENT_DATA = "NOMENCLATURE_DEPARTMENT_DATA"
-
-
-class NomenclatureDepartmentFilter(BaseModel):
-    search: str | None = None
-    statuses: list[Status8] | None = None
-    excludeStatuses: list[Status8] | None = None
-    departmentId: UUID | None = None
-    calendarYearStart: int | None = None
-    calendarYearEnd: int | None = None
-    calendarYears: list[int] | None = None
-    calendarYear: int | None = None
-    departmentIds: list[UUID] | None = None
-    includes: list[Include7] | None = None
-    currentUserExecutor: bool | None = None
-
-
-class Operation1(Enum):
-    """
-    Перечисления доступных операций над сущностями в номенклатуре подразделений
-    """
-
-    NOMENCLATURE_DEPARTMENT_READ = "NOMENCLATURE_DEPARTMENT_READ"
-    NOMENCLATURE_DEPARTMENT_MAIN_FIELDS_UPDATE = (
-        "NOMENCLATURE_DEPARTMENT_MAIN_FIELDS_UPDATE"
-    )
-    NOMENCLATURE_DEPARTMENT_TABLE_UPDATE = "NOMENCLATURE_DEPARTMENT_TABLE_UPDATE"
-    NOMENCLATURE_DEPARTMENT_PROCESS_EXECUTORS_UPDATE = (
-        "NOMENCLATURE_DEPARTMENT_PROCESS_EXECUTORS_UPDATE"
-    )
-    NOMENCLATURE_DEPARTMENT_PROCESS_ITEM_UPDATE = (
-        "NOMENCLATURE_DEPARTMENT_PROCESS_ITEM_UPDATE"
-    )
-    NOMENCLATURE_DEPARTMENT_START = "NOMENCLATURE_DEPARTMENT_START"
-    NOMENCLATURE_DEPARTMENT_SIGNING = "NOMENCLATURE_DEPARTMENT_SIGNING"
-    NOMENCLATURE_DEPARTMENT_AGREEMENT = "NOMENCLATURE_DEPARTMENT_AGREEMENT"
-    NOMENCLATURE_DEPARTMENT_SIGNING_ECP = "NOMENCLATURE_DEPARTMENT_SIGNING_ECP"
-    NOMENCLATURE_DEPARTMENT_DELETE_ECP = "NOMENCLATURE_DEPARTMENT_DELETE_ECP"
-    NOMENCLATURE_DEPARTMENT_DELETE = "NOMENCLATURE_DEPARTMENT_DELETE"
-    NOMENCLATURE_DEPARTMENT_CANCEL = "NOMENCLATURE_DEPARTMENT_CANCEL"
-
-
-class NomenclatureDepartmentPermission(BaseModel):
-    operation: Annotated[
-        Operation1 | None,
-        Field(
-            description="Перечисления доступных операций над сущностями в номенклатуре подразделений"
-        ),
-    ] = None
-    employees: Annotated[set[UUID] | None, Field()] = None
-
-
-class ActionType1(Enum):
-    CREATED = "CREATED"
-    MAIN_FIELDS_UPDATE = "MAIN_FIELDS_UPDATE"
-    PROCESS_ITEM_EXECUTORS_UPDATE = "PROCESS_ITEM_EXECUTORS_UPDATE"
-    PROCESS_ITEM_UPDATE = "PROCESS_ITEM_UPDATE"
-    ENTRY_DATA_UPDATE = "ENTRY_DATA_UPDATE"
-    REJECT = "REJECT"
-    PROCESS_START = "PROCESS_START"
-    PROCESS_FINISH = "PROCESS_FINISH"
-    STEP_START = "STEP_START"
-    STEP_END = "STEP_END"
-    ACTION = "ACTION"
-    CANCELED = "CANCELED"
-
-
-class NomDepHistoryActionData(BaseModel):
-    actionType: ActionType1 | None = None
-    data: dict[str, Any] | None = None
-
-
-class Include8(Enum):
-    LEADER = "LEADER"
-    LEADER_WITH_POST = "LEADER_WITH_POST"
-    PARENT_DEPARTMENT = "PARENT_DEPARTMENT"
-    EMPLOYEES = "EMPLOYEES"
-    EMPLOYEES_WITH_POST = "EMPLOYEES_WITH_POST"
-    DEPUTY_LEADER = "DEPUTY_LEADER"
-    RESPONSIBLE_NOMENCLATURE = "RESPONSIBLE_NOMENCLATURE"
-
-
-class Operation2(Enum):
-    NOMENCLATURE_AFFAIR_READ = "NOMENCLATURE_AFFAIR_READ"
-    NOMENCLATURE_AFFAIR_UPDATE = "NOMENCLATURE_AFFAIR_UPDATE"
-    NOMENCLATURE_AFFAIR_DELETE = "NOMENCLATURE_AFFAIR_DELETE"
-    NOMENCLATURE_AFFAIR_PRINT_CASE_FILE_COVER = (
-        "NOMENCLATURE_AFFAIR_PRINT_CASE_FILE_COVER"
-    )
-    NOMENCLATURE_AFFAIR_PRINT_CERTIFICATION_SHEET = (
-        "NOMENCLATURE_AFFAIR_PRINT_CERTIFICATION_SHEET"
-    )
-    NOMENCLATURE_AFFAIR_DOCUMENT_CREATE = "NOMENCLATURE_AFFAIR_DOCUMENT_CREATE"
-    NOMENCLATURE_AFFAIR_DOCUMENT_ACCESS = "NOMENCLATURE_AFFAIR_DOCUMENT_ACCESS"
-
-
-class NomenclatureAffairPermission(BaseModel):
-    operation: Operation2 | None = None
-    employees: Annotated[set[UUID] | None, Field()] = None
-
-
-class DocCategoryConstant11(Enum):
-    """
-    Категория документа
-    """
-
-    INTERN = "INTERN"
-    INCOMING = "INCOMING"
-    OUTGOING = "OUTGOING"
-    MEETING = "MEETING"
-    QUESTION = "QUESTION"
-    MEETING_QUESTION = "MEETING_QUESTION"
-    APPEAL = "APPEAL"
-    CONTRACT = "CONTRACT"
-    CUSTOM = "CUSTOM"
-
-
-class Include9(Enum):
-    DOCUMENT = "DOCUMENT"
-    ATTACHMENTS = "ATTACHMENTS"
-    ATTACHMENTS_AND_ADDITIONAL_TYPE = "ATTACHMENTS_AND_ADDITIONAL_TYPE"
-    NOMENCLATURE_AFFAIR = "NOMENCLATURE_AFFAIR"
-    DOCUMENT_LANGUAGE = "DOCUMENT_LANGUAGE"
-    DOCUMENT_INVENTORY = "DOCUMENT_INVENTORY"
-
-
-class MiniDocumentFilter(BaseModel):
-    """
-    Фильтр для поиска мини-документов
-    """
-
-    ids: list[UUID] | None = None
-    number: Annotated[int | None, Field(description="Номер документа")] = None
-    regNumber: Annotated[str | None, Field(description="Регистрационный номер")] = None
-    regDateFrom: Annotated[datetime | None, Field(description="Дата регистрации с")] = (
-        None
-    )
-    regDateTo: Annotated[datetime | None, Field(description="Дата регистрации по")] = (
-        None
-    )
-    yearFrom: Annotated[datetime | None, Field(description="Год с")] = None
-    yearTo: Annotated[datetime | None, Field(description="Год по")] = None
-    affairIndex: Annotated[str | None, Field(description="Индекс дела")] = None
-    docCategoryConstant: Annotated[
-        DocCategoryConstant11 | None, Field(description="Категория документа")
-    ] = None
-    shortSummary: Annotated[str | None, Field(description="Краткое содержание")] = None
-    documentLanguage: Annotated[str | None, Field(description="Язык документа")] = None
-    affairIds: Annotated[
-        list[UUID] | None, Field(description="ID номенклатуры дел")
-    ] = None
-    customDocument: Annotated[
-        bool | None, Field(description="Документ создан в ручную")
-    ] = None
-    accessIds: list[UUID] | None = None
-    deleted: bool | None = None
-    includes: Annotated[
-        list[Include9] | None, Field(description="Включаемые связанные данные")
-    ] = None
-
-
-class Operation3(Enum):
-    MINI_DOCUMENT_READ = "MINI_DOCUMENT_READ"
-    MINI_DOCUMENT_UPDATE = "MINI_DOCUMENT_UPDATE"
-    MINI_DOCUMENT_DELETE = "MINI_DOCUMENT_DELETE"
-
-
-class MiniDocumentPermission(BaseModel):
-    operation: Operation3 | None = None
-    employees: Annotated[set[UUID] | None, Field()] = None
-
-
-class ActionType2(Enum):
-    CREATED = "CREATED"
-    CREATED_WRITE_OFF = "CREATED_WRITE_OFF"
-    UPDATE = "UPDATE"
-    MOVE = "MOVE"
-    UPLOAD_ATTACHMENT = "UPLOAD_ATTACHMENT"
-    UPLOAD_RKK = "UPLOAD_RKK"
-    UPLOAD_AGREEMENT = "UPLOAD_AGREEMENT"
-    UPLOAD_INTRODUCTION = "UPLOAD_INTRODUCTION"
-    DELETE_ATTACHMENT = "DELETE_ATTACHMENT"
-    ADD_SIGN = "ADD_SIGN"
-    DELETE_SIGN = "DELETE_SIGN"
-    DELETE = "DELETE"
-
-
-class MiniDocumentHistoryActionData(BaseModel):
-    actionType: ActionType2 | None = None
-    data: dict[str, Any] | None = None
-
-
-class Include10(Enum):
-    EMPLOYEE = "EMPLOYEE"
-    AUTHOR = "AUTHOR"
-
-
-class MiniDocumentAccessFilter(BaseModel):
-    miniDocId: Annotated[
-        UUID | None, Field(description="Идендификатор мини документа")
-    ] = None
-    includes: Annotated[
-        list[Include10] | None, Field(description="Включаемые связанные данные")
-    ] = None
-
-
-class StatusEnum2(Enum):
-    FORMING = "FORMING"
-    COMPLETED = "COMPLETED"
-    CLOSED = "CLOSED"
-    ARCHIVE = "ARCHIVE"
-    DESTROYED = "DESTROYED"
-
-
-class Include11(Enum):
-    PERIOD = "PERIOD"
-    DEPARTMENT = "DEPARTMENT"
-    INNER_INVENTORY = "INNER_INVENTORY"
-    SHELVING_SHELVE = "SHELVING_SHELVE"
-    FUND = "FUND"
-
-
-class NomenclatureAffairFilter(BaseModel):
-    departmentId: UUID | None = None
-    year: int | None = None
-    expiration: bool | None = None
-    expirationDate: int | None = None
-    expirationDates: list[int] | None = None
-    years: list[int] | None = None
-    active: bool | None = None
-    name: str | None = None
-    personnel: bool | None = None
-    status: list[StatusEnum2] | None = None
-    groupByStoragePeriod: list[GroupByStoragePeriod] | None = None
-    storagePeriodType: list[StoragePeriodType2] | None = None
-    miniDocSearch: str | None = None
-    fundId: UUID | None = None
-    notExistsInDestructionAct: bool | None = None
-    includes: list[Include11] | None = None
-
-
-class Type49(Enum):
-    ACT_DESTRUCTION = "ACT_DESTRUCTION"
-    CASE_COVER = "CASE_COVER"
-    CERTIFICATION_SHEET = "CERTIFICATION_SHEET"
-    INTERNAL_INVENTORY_ARCHIVE = "INTERNAL_INVENTORY_ARCHIVE"
-    SUMMARY_NOMENCLATURE_DEPARTMENT = "SUMMARY_NOMENCLATURE_DEPARTMENT"
-
-
-class NomenclatureAffairPrintTemplateFilter(BaseModel):
-    search: str | None = None
-    types: list[Type49] | None = None
-    active: bool | None = None
-
-
-class ReturnInventoryStatus(BaseModel):
-    inventoryId: int | None = None
-    status: str
-    comment: str | None = None
-
-
-class GroupFilter(BaseModel):
-    search: str | None = None
-    type: Type7 | None = None
-    mixed: bool | None = None
-    excludeRoleId: UUID | None = None
-
-
-class GroupRoleDto(BaseModel):
-    id: UUID | None = None
-    role: RoleDto | None = None
-    roleId: UUID | None = None
-    group: GroupDto | None = None
-    groupId: UUID | None = None
-
-
-class GroupEmployeeFilter(BaseModel):
-    excludeGroupId: UUID | None = None
-    search: str | None = None
-
-
-class ListUuid(IdsUUID):
-    """
-    Список идентификаторов
-    """
-
-
-class SliceDtoFormFieldRegistryEntryDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[FormFieldRegistryEntryDto] | None = None
-
-
-class CertInfo(BaseModel):
-    start: datetime | None = None
-    end: datetime | None = None
-    issuer: str | None = None
-    subject: str | None = None
-    serialNumber: str | None = None
-
-
-class EmployeeCertInfoDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор записи сертификата сотрудника")
-    ] = None
-    employeeId: Annotated[
-        UUID | None, Field(description="Идентификатор сотрудника")
-    ] = None
-    certificate: Annotated[
-        CertInfo | None, Field(description="Информация о сертификате сотрудника")
-    ] = None
-    serialNumber: Annotated[
-        str | None, Field(description="Серийный номер сертификата")
-    ] = None
-
-
-class AttrCertInfo(BaseModel):
-    start: datetime | None = None
-    end: datetime | None = None
-    issuer: str | None = None
-    holder: str | None = None
-    serialNumber: str | None = None
-    unp: str | None = None
-    unpf: str | None = None
-    organizationName: str | None = None
-    position: str | None = None
-    base64: str | None = None
-
-
-class EmployeeAttrCertInfoDto(BaseModel):
-    id: Annotated[
-        UUID | None,
-        Field(description="Идентификатор записи атрибутного сертификата сотрудника"),
-    ] = None
-    employeeId: Annotated[
-        UUID | None, Field(description="Идентификатор сотрудника")
-    ] = None
-    certificate: Annotated[
-        AttrCertInfo | None,
-        Field(description="Информация об атрибутном сертификате сотрудника"),
-    ] = None
-    serialNumber: Annotated[
-        str | None, Field(description="Серийный номер сертификата")
-    ] = None
-
-
-class AdditionalAgreementPair(BaseModel):
-    additionalAgreementId: UUID | None = None
-    employeeId: UUID | None = None
-
-
-class CurrentStepProcessType(Enum):
-    """
-    Тип процесса текущего этапа
-    """
-
-    NEW = "NEW"
-    AGREEMENT = "AGREEMENT"
-    SIGNING = "SIGNING"
-    STATEMENT = "STATEMENT"
-    REGISTRATION = "REGISTRATION"
-    REVIEW = "REVIEW"
-    EXECUTION = "EXECUTION"
-    DISPATCH = "DISPATCH"
-    PREPARATION = "PREPARATION"
-    PAPERWORK = "PAPERWORK"
-    ACCEPTANCE = "ACCEPTANCE"
-    CONTRACT_EXECUTION = "CONTRACT_EXECUTION"
-
-
-class NextStepProcessType(Enum):
-    """
-    Тип процесса следующего этапа
-    """
-
-    NEW = "NEW"
-    AGREEMENT = "AGREEMENT"
-    SIGNING = "SIGNING"
-    STATEMENT = "STATEMENT"
-    REGISTRATION = "REGISTRATION"
-    REVIEW = "REVIEW"
-    EXECUTION = "EXECUTION"
-    DISPATCH = "DISPATCH"
-    PREPARATION = "PREPARATION"
-    PAPERWORK = "PAPERWORK"
-    ACCEPTANCE = "ACCEPTANCE"
-    CONTRACT_EXECUTION = "CONTRACT_EXECUTION"
-
-
-class DocumentContext(BaseModel):
-    docId: Annotated[UUID | None, Field(description="Идентификатор документа")] = None
-    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
-        None
-    )
-    processStart: Annotated[
-        bool | None, Field(description="Признак того что процесс начался")
-    ] = None
-    processEnd: Annotated[
-        bool | None, Field(description="Признак того что процесс закончился")
-    ] = None
-    currentStepId: Annotated[
-        UUID | None, Field(description="Идентификатор текущего этапа")
-    ] = None
-    currentStepProcessType: Annotated[
-        CurrentStepProcessType | None, Field(description="Тип процесса текущего этапа")
-    ] = None
-    currentStepEnd: Annotated[
-        bool | None, Field(description="Признак того завершен ли текущий этап")
-    ] = None
-    currentStepFileSign: bool | None = None
-    currentStepOrder: int | None = None
-    nextStepId: Annotated[
-        UUID | None, Field(description="Идентификатор следующего этапа")
-    ] = None
-    nextStepProcessType: Annotated[
-        NextStepProcessType | None, Field(description="Тип процесса следующего этапа")
-    ] = None
-    stepTypes: list[Type4] | None = None
-    authorId: Annotated[
-        UUID | None, Field(description="Идентификатор автора документа")
-    ] = None
-    introductionId: Annotated[
-        UUID | None, Field(description="Идентификатор ознакомления")
-    ] = None
-    additionalAgreementId: Annotated[
-        UUID | None, Field(description="Идентификатор дополнительного согласования")
-    ] = None
-    additionalAgreement: list[AdditionalAgreementPair] | None = None
-    introductionDeleteIds: Annotated[
-        list[UUID] | None,
-        Field(description="ИД записей которые может удалить пользователь"),
-    ] = None
-    additionalAgreementDeleteIds: Annotated[
-        list[UUID] | None,
-        Field(description="ИД записей которые может удалить пользователь"),
-    ] = None
-    inArchive: Annotated[
-        bool | None, Field(description="Находиться ли документ в архиве")
-    ] = None
-    status: Annotated[
-        Status2 | None,
-        Field(description="Перечисление для описания статусов документов"),
-    ] = None
-    controlPlannedEnd: Annotated[
-        datetime | None, Field(description="Планируемая дата окончания контроля")
-    ] = None
-    writeOffAffairCount: int | None = None
-    preAffairCount: int | None = None
-    meetingQuestionNotifyCount: int | None = None
-    formulaHasNum: bool | None = None
-    controlFlag: bool | None = None
-    currentBpmnTaskId: UUID | None = None
-    refDocId: UUID | None = None
-    refDocOrgId: str | None = None
-
-
-class Operation4(Enum):
-    """
-    Перечисления доступных операций над сущностями в документе
-    """
-
-    DOCUMENT_READ = "DOCUMENT_READ"
-    DOCUMENT_CHANGE_REGNUMBER = "DOCUMENT_CHANGE_REGNUMBER"
-    DOCUMENT_FIELDS_MEETING_QUESTION_UPDATE = "DOCUMENT_FIELDS_MEETING_QUESTION_UPDATE"
-    DOCUMENT_QUESTION_RESPONSIBLE_EXECUTOR_UPDATE = (
-        "DOCUMENT_QUESTION_RESPONSIBLE_EXECUTOR_UPDATE"
-    )
-    DOCUMENT_FIELDS_QUESTION_UPDATE = "DOCUMENT_FIELDS_QUESTION_UPDATE"
-    DOCUMENT_FIELDS_MEETING_UPDATE = "DOCUMENT_FIELDS_MEETING_UPDATE"
-    DOCUMENT_MEETING_INVITEES_UPDATE = "DOCUMENT_MEETING_INVITEES_UPDATE"
-    DOCUMENT_CONTRACT_FIELDS_UPDATE = "DOCUMENT_CONTRACT_FIELDS_UPDATE"
-    DOCUMENT_CONTRACT_AUTO_PROLONGATION_UPDATE = (
-        "DOCUMENT_CONTRACT_AUTO_PROLONGATION_UPDATE"
-    )
-    DOCUMENT_CONTRACT_TYPICAL_UPDATE = "DOCUMENT_CONTRACT_TYPICAL_UPDATE"
-    DOCUMENT_CONTRACT_CORRESPONDENT_UPDATE = "DOCUMENT_CONTRACT_CORRESPONDENT_UPDATE"
-    DOCUMENT_CONTRACT_AGREEMENT_UPDATE = "DOCUMENT_CONTRACT_AGREEMENT_UPDATE"
-    DOCUMENT_MAIN_FIELDS_UPDATE = "DOCUMENT_MAIN_FIELDS_UPDATE"
-    DOCUMENT_MAIN_FIELDS_APPEAL_UPDATE = "DOCUMENT_MAIN_FIELDS_APPEAL_UPDATE"
-    DOCUMENT_REPEAT_IDENTICAL_UPDATE = "DOCUMENT_REPEAT_IDENTICAL_UPDATE"
-    DOCUMENT_CORRESPONDENT_UPDATE = "DOCUMENT_CORRESPONDENT_UPDATE"
-    DOCUMENT_PROCESS_ITEM_UPDATE = "DOCUMENT_PROCESS_ITEM_UPDATE"
-    DOCUMENT_PROCESS_MOVE = "DOCUMENT_PROCESS_MOVE"
-    DOCUMENT_PROCESS_EXECUTORS_UPDATE = "DOCUMENT_PROCESS_EXECUTORS_UPDATE"
-    DOCUMENT_PREPARATION_COMPLETED = "DOCUMENT_PREPARATION_COMPLETED"
-    DOCUMENT_PAPERWORK_COMPLETED = "DOCUMENT_PAPERWORK_COMPLETED"
-    DOCUMENT_ACCEPTANCE_COMPLETED = "DOCUMENT_ACCEPTANCE_COMPLETED"
-    DOCUMENT_TEST = "DOCUMENT_TEST"
-    DOCUMENT_CANCEL = "DOCUMENT_CANCEL"
-    DOCUMENT_NEXT_PROCESS = "DOCUMENT_NEXT_PROCESS"
-    DOCUMENT_START = "DOCUMENT_START"
-    DOCUMENT_ACCESS_GRIEF_UPDATE = "DOCUMENT_ACCESS_GRIEF_UPDATE"
-    DOCUMENT_UNDRAFT = "DOCUMENT_UNDRAFT"
-    DOCUMENT_PROCESS_STATEMENT = "DOCUMENT_PROCESS_STATEMENT"
-    DOCUMENT_PROCESS_SIGNING = "DOCUMENT_PROCESS_SIGNING"
-    DOCUMENT_PROCESS_AGREEMENT = "DOCUMENT_PROCESS_AGREEMENT"
-    DOCUMENT_PROCESS_CONTRACT_EXECUTION = "DOCUMENT_PROCESS_CONTRACT_EXECUTION"
-    DOCUMENT_PROCESS_REVIEW = "DOCUMENT_PROCESS_REVIEW"
-    DOCUMENT_PROCESS_REDIRECT_REVIEW = "DOCUMENT_PROCESS_REDIRECT_REVIEW"
-    DOCUMENT_PROCESS_SENT = "DOCUMENT_PROCESS_SENT"
-    DOCUMENT_PROCESS_REGISTRATION = "DOCUMENT_PROCESS_REGISTRATION"
-    DOCUMENT_PROCESS_FREE_REGISTRATION = "DOCUMENT_PROCESS_FREE_REGISTRATION"
-    DOCUMENT_RESERVE_REGNUMBER = "DOCUMENT_RESERVE_REGNUMBER"
-    DOCUMENT_PROCESS_SMDO_REGISTRATION_SKIP = "DOCUMENT_PROCESS_SMDO_REGISTRATION_SKIP"
-    DOCUMENT_PROCESS_SMDO_REGISTRATION_REJECT = (
-        "DOCUMENT_PROCESS_SMDO_REGISTRATION_REJECT"
-    )
-    DOCUMENT_SMDO_CREATE_ANSWER = "DOCUMENT_SMDO_CREATE_ANSWER"
-    DOCUMENT_CREATE_ANSWER = "DOCUMENT_CREATE_ANSWER"
-    DOCUMENT_SMDO_RETRY_ACK_DELIVERY = "DOCUMENT_SMDO_RETRY_ACK_DELIVERY"
-    DOCUMENT_SMDO_RETRY_DOCUMENT_DELIVERY = "DOCUMENT_SMDO_RETRY_DOCUMENT_DELIVERY"
-    DOCUMENT_SMDO_CONFIRM_DELIVERY = "DOCUMENT_SMDO_CONFIRM_DELIVERY"
-    DOCUMENT_SMDO_CANCEL_DELIVERY = "DOCUMENT_SMDO_CANCEL_DELIVERY"
-    DOCUMENT_LINK_UPDATE = "DOCUMENT_LINK_UPDATE"
-    DOCUMENT_INTRODUCTION_CREATE = "DOCUMENT_INTRODUCTION_CREATE"
-    DOCUMENT_INTRODUCTION_DELETE = "DOCUMENT_INTRODUCTION_DELETE"
-    DOCUMENT_INTRODUCTION_DELETE_ALL = "DOCUMENT_INTRODUCTION_DELETE_ALL"
-    DOCUMENT_INTRODUCTION_EXECUTE = "DOCUMENT_INTRODUCTION_EXECUTE"
-    DOCUMENT_ADDITIONAL_AGREEMENT_CREATE = "DOCUMENT_ADDITIONAL_AGREEMENT_CREATE"
-    DOCUMENT_ADDITIONAL_AGREEMENT_DELETE = "DOCUMENT_ADDITIONAL_AGREEMENT_DELETE"
-    DOCUMENT_ADDITIONAL_AGREEMENT_DELETE_ALL = (
-        "DOCUMENT_ADDITIONAL_AGREEMENT_DELETE_ALL"
-    )
-    DOCUMENT_ADDITIONAL_AGREEMENT_EXECUTE = "DOCUMENT_ADDITIONAL_AGREEMENT_EXECUTE"
-    DOCUMENT_NEW_VERSION = "DOCUMENT_NEW_VERSION"
-    DOCUMENT_CONTROL_CREATE = "DOCUMENT_CONTROL_CREATE"
-    DOCUMENT_CONTROL_UPDATE = "DOCUMENT_CONTROL_UPDATE"
-    DOCUMENT_CONTROL_REMOVE = "DOCUMENT_CONTROL_REMOVE"
-    DOCUMENT_CONTROL_DELETE = "DOCUMENT_CONTROL_DELETE"
-    DOCUMENT_RECIPIENT_LIST_UPDATE = "DOCUMENT_RECIPIENT_LIST_UPDATE"
-    DOCUMENT_PRINT_REFERATKA = "DOCUMENT_PRINT_REFERATKA"
-    DOCUMENT_PRINT_SHEET = "DOCUMENT_PRINT_SHEET"
-    DOCUMENT_PRINT = "DOCUMENT_PRINT"
-    DOCUMENT_PRINT_ATTACHMENT = "DOCUMENT_PRINT_ATTACHMENT"
-    DOCUMENT_PRINT_JOURNAL = "DOCUMENT_PRINT_JOURNAL"
-    DOCUMENT_PRINT_INTRODUCTION = "DOCUMENT_PRINT_INTRODUCTION"
-    DOCUMENT_PRINT_CONTRACT_EXECUTION = "DOCUMENT_PRINT_CONTRACT_EXECUTION"
-    DOCUMENT_PRINT_LINK = "DOCUMENT_PRINT_LINK"
-    DOCUMENT_PRINT_MEETING_QUESTION = "DOCUMENT_PRINT_MEETING_QUESTION"
-    DOCUMENT_PRINT_ADDITIONAL_AGREEMENT = "DOCUMENT_PRINT_ADDITIONAL_AGREEMENT"
-    DOCUMENT_ATTACHMENT_EDS_UPLOAD = "DOCUMENT_ATTACHMENT_EDS_UPLOAD"
-    DOCUMENT_ATTACHMENT_EDS_REMOVE = "DOCUMENT_ATTACHMENT_EDS_REMOVE"
-    DOCUMENT_ATTACHMENT_EDS_CHECK = "DOCUMENT_ATTACHMENT_EDS_CHECK"
-    DOCUMENT_ADD_DOCUMENTS = "DOCUMENT_ADD_DOCUMENTS"
-    DOCUMENT_UPDATE_ATTACHMENT = "DOCUMENT_UPDATE_ATTACHMENT"
-    DOCUMENT_DELETE_ATTACHMENT = "DOCUMENT_DELETE_ATTACHMENT"
-    DOCUMENT_READ_ATTACHMENT = "DOCUMENT_READ_ATTACHMENT"
-    DOCUMENT_UPDATE_ADDITIONAL_ATTACHMENT = "DOCUMENT_UPDATE_ADDITIONAL_ATTACHMENT"
-    DOCUMENT_DELETE_ADDITIONAL_ATTACHMENT = "DOCUMENT_DELETE_ADDITIONAL_ATTACHMENT"
-    DOCUMENT_READ_ADDITIONAL_ATTACHMENT = "DOCUMENT_READ_ADDITIONAL_ATTACHMENT"
-    DOCUMENT_NOMENCLATURE_AFFAIR_UPDATE = "DOCUMENT_NOMENCLATURE_AFFAIR_UPDATE"
-    DOCUMENT_WRITE_OFF_NOMENCLATURE_AFFAIR_UPDATE = (
-        "DOCUMENT_WRITE_OFF_NOMENCLATURE_AFFAIR_UPDATE"
-    )
-    DOCUMENT_CHANGE_AUTHOR = "DOCUMENT_CHANGE_AUTHOR"
-    DOCUMENT_EXTRACT_NOMENCLATURE_AFFAIR_UPDATE = (
-        "DOCUMENT_EXTRACT_NOMENCLATURE_AFFAIR_UPDATE"
-    )
-    DOCUMENT_IN_ARCHIVE_UPDATE = "DOCUMENT_IN_ARCHIVE_UPDATE"
-    DOCUMENT_TASK_CREATE = "DOCUMENT_TASK_CREATE"
-    DOCUMENT_FOLDER_USER = "DOCUMENT_FOLDER_USER"
-    DOCUMENT_TO_PREPARATION = "DOCUMENT_TO_PREPARATION"
-    DOCUMENT_PREPARATION_NOTIFY = "DOCUMENT_PREPARATION_NOTIFY"
-    DOCUMENT_REDO_PROTOCOL = "DOCUMENT_REDO_PROTOCOL"
-    DOCUMENT_LIST_QUESTIONS_UPDATE = "DOCUMENT_LIST_QUESTIONS_UPDATE"
-    DOCUMENT_SPEAKERS_MEETING_QUESTION_UPDATE = (
-        "DOCUMENT_SPEAKERS_MEETING_QUESTION_UPDATE"
-    )
-    DOCUMENT_NOTIFY_MEETING_QUESTION = "DOCUMENT_NOTIFY_MEETING_QUESTION"
-    DOCUMENT_CONTRACT_RESPONSIBLE = "DOCUMENT_CONTRACT_RESPONSIBLE"
-    DOCUMENT_UPDATE_CUSTOM_FIELDS = "DOCUMENT_UPDATE_CUSTOM_FIELDS"
-    TASK_UPDATE = "TASK_UPDATE"
-    TASK_PERIOD_UPDATE = "TASK_PERIOD_UPDATE"
-    TASK_EXECUTOR_UPDATE = "TASK_EXECUTOR_UPDATE"
-    TASK_EXECUTE_ONE_FOR_ALL = "TASK_EXECUTE_ONE_FOR_ALL"
-    TASK_REVISION = "TASK_REVISION"
-    TASK_DELETE = "TASK_DELETE"
-    TASK_EXECUTE_CHANGE_DATE_REQUEST = "TASK_EXECUTE_CHANGE_DATE_REQUEST"
-    TASK_EXECUTE = "TASK_EXECUTE"
-    TASK_CHANGE_DATE_REQUEST = "TASK_CHANGE_DATE_REQUEST"
-    TASK_CHILD_CREATE = "TASK_CHILD_CREATE"
-    TASK_CONTROL_CREATE = "TASK_CONTROL_CREATE"
-    TASK_CONTROL_UPDATE = "TASK_CONTROL_UPDATE"
-    TASK_CONTROL_REMOVE = "TASK_CONTROL_REMOVE"
-    TASK_CONTROL_DELETE = "TASK_CONTROL_DELETE"
-    TASK_AUTHOR_CHANGE = "TASK_AUTHOR_CHANGE"
-    TASK_EXECUTE_ALL = "TASK_EXECUTE_ALL"
-    DOCUMENT_TASK_ENDLESS = "DOCUMENT_TASK_ENDLESS"
-    DOCUMENT_TASK_PERIOD = "DOCUMENT_TASK_PERIOD"
-    TASK_TASK_PROJECT_CREATE = "TASK_TASK_PROJECT_CREATE"
-    TASK_TASK_PROJECT_EXECUTE_BY_AUTHOR = "TASK_TASK_PROJECT_EXECUTE_BY_AUTHOR"
-    TASK_PROJECT_AUTHOR_CHANGE = "TASK_PROJECT_AUTHOR_CHANGE"
-    TASK_PROJECT_DELETE = "TASK_PROJECT_DELETE"
-    TASK_PROJECT_EXECUTOR_UPDATE = "TASK_PROJECT_EXECUTOR_UPDATE"
-    TASK_PROJECT_UPDATE = "TASK_PROJECT_UPDATE"
-    TASK_PROJECT_EXECUTE = "TASK_PROJECT_EXECUTE"
-    DOCUMENT_ADDITIONAL_DOCUMENT_CREATE = "DOCUMENT_ADDITIONAL_DOCUMENT_CREATE"
-    DOCUMENT_ADDITIONAL_DOCUMENT_CREATE_CHILD = (
-        "DOCUMENT_ADDITIONAL_DOCUMENT_CREATE_CHILD"
-    )
-    DOCUMENT_ADDITIONAL_DOCUMENT_UPDATE = "DOCUMENT_ADDITIONAL_DOCUMENT_UPDATE"
-    DOCUMENT_ADDITIONAL_DOCUMENT_DELETE = "DOCUMENT_ADDITIONAL_DOCUMENT_DELETE"
-    DOCUMENT_CONTROL_POINT_CREATE = "DOCUMENT_CONTROL_POINT_CREATE"
-    DOCUMENT_CONTROL_POINT_MOVE = "DOCUMENT_CONTROL_POINT_MOVE"
-    CONTROL_POINT_UPDATE = "CONTROL_POINT_UPDATE"
-    CONTROL_POINT_COMPLETE = "CONTROL_POINT_COMPLETE"
-    CONTROL_POINT_REVISION = "CONTROL_POINT_REVISION"
-    CONTROL_POINT_DELETE = "CONTROL_POINT_DELETE"
-
-
-class UserDocPermission(BaseModel):
-    operation: Annotated[
-        Operation4 | None,
-        Field(description="Перечисления доступных операций над сущностями в документе"),
-    ] = None
-    employees: Annotated[set[UUID] | None, Field()] = None
-
-
-class Include12(Enum):
-    CONTRACT_CONTROL_POINT_RESPONSIBLE_EMPLOYEES = (
-        "CONTRACT_CONTROL_POINT_RESPONSIBLE_EMPLOYEES"
-    )
-
-
-class ContractControlPointFilter(BaseModel):
-    search: str | None = None
-    status: bool | None = None
-    includes: Annotated[
-        list[Include12] | None,
-        Field(description="Список моделей которые могу быть добавлены при отображении"),
-    ] = None
-
-
-class Include13(Enum):
-    PARENT = "PARENT"
-    ATTACHMENT = "ATTACHMENT"
-    ADDITIONAL_DOCUMENT_TYPE = "ADDITIONAL_DOCUMENT_TYPE"
-    ADDITIONAL_DOCUMENT_RESPONSIBLE = "ADDITIONAL_DOCUMENT_RESPONSIBLE"
-
-
-class AdditionalDocumentFilter(BaseModel):
-    documentTypeId: UUID | None = None
-    includes: Annotated[
-        list[Include13] | None,
-        Field(description="Список моделей которые могу быть добавлены при отображении"),
-    ] = None
-
-
-class BoolResult(BaseModel):
-    value: bool | None = None
-
-
-class ExecutionDocumentStatCount(ExecutionTaskStatCount):
-    pass
-
-
-class DocumentTypeFilter(BaseModel):
-    typeName: str | None = None
-    docCategoryConst: list[DocCategory] | None = None
-    active: bool | None = None
-
-
-class Type52(Enum):
-    RECEIVED_IN_RESPONSE_TO = "RECEIVED_IN_RESPONSE_TO"
-    CREATE_IN_RESPONSE_TO = "CREATE_IN_RESPONSE_TO"
-    LINK_DOC = "LINK_DOC"
-    TASK_DOC_LINK = "TASK_DOC_LINK"
-    CHILD_LINK_DOC = "CHILD_LINK_DOC"
-    CHILD_DOCUMENT = "CHILD_DOCUMENT"
-    PROTOCOL = "PROTOCOL"
-    CHILD_PROTOCOL = "CHILD_PROTOCOL"
-    REPLY_TO_APPLICANT = "REPLY_TO_APPLICANT"
-    PROTOCOL_MEETING_QUESTION = "PROTOCOL_MEETING_QUESTION"
-    QUESTION_DOCUMENTS = "QUESTION_DOCUMENTS"
-
-
-class Include14(Enum):
-    DOCUMENT_TYPE = "DOCUMENT_TYPE"
-    DOCUMENT_FORM_DEFINITION = "DOCUMENT_FORM_DEFINITION"
-
-
-class DocumentFormFilter(BaseModel):
-    includes: Annotated[
-        list[Include14] | None,
-        Field(description="Список моделей которые могу быть добавлены при отображении"),
-    ] = None
-    name: Annotated[str | None, Field(description="Наименование формы документа")] = (
-        None
-    )
-    search: str | None = None
-    active: Annotated[
-        bool | None, Field(description="Признак активен ли форма документа")
-    ] = None
-    system: Annotated[
-        bool | None, Field(description="Признак системной формы документа")
-    ] = None
-    documentConstant: Annotated[
-        DocumentConstant | None, Field(description="Константа документа")
-    ] = None
-    documentTypeId: Annotated[
-        int | None, Field(description="Идентификатор типа документа")
-    ] = None
-    mapperRules: list[int] | None = None
-
-
-class DocumentCommentFilter(BaseModel):
-    search: Annotated[str | None, Field(description="Строка поиска")] = None
-    start: Annotated[datetime | None, Field(description="Дата начала")] = None
-    end: Annotated[datetime | None, Field(description="Дата конца")] = None
-    commentStatus: CommentStatus | None = None
-
-
-class Include15(Enum):
-    BPMN_PROCESS_DIRECTORY = "BPMN_PROCESS_DIRECTORY"
-
-
-class DocumentProfileFilter(BaseModel):
-    name: Annotated[str | None, Field(description="Наименование профиля документа")] = (
-        None
-    )
-    docTypeName: Annotated[
-        str | None, Field(description="Наименование вида документа")
-    ] = None
-    docCategoryName: Annotated[
-        str | None, Field(description="Наименование типа документа")
-    ] = None
-    regJournalName: Annotated[
-        str | None, Field(description="Наименование журнала регистрации")
-    ] = None
-    active: Annotated[
-        bool | None, Field(description="Признак активен ли профиль документа")
-    ] = None
-    docTypeId: Annotated[
-        int | None, Field(description="Идентификатор вида документа")
-    ] = None
-    docCategoryId: Annotated[
-        UUID | None, Field(description="Идентификатор типа документа")
-    ] = None
-    regJournalId: Annotated[
-        UUID | None, Field(description="Идентификатор журнала регистрации")
-    ] = None
-    correspondentId: Annotated[
-        UUID | None, Field(description="Идентификатор корреспондента")
-    ] = None
-    docCategoryConst: DocCategory | None = None
-    withAccess: Annotated[
-        bool | None, Field(description="Только доступные профили по списку доступа")
-    ] = None
-    includes: list[Include15] | None = None
-
-
-class ProfileAttachmentDto(BaseModel):
-    id: UUID | None = None
-    name: str | None = None
-    size: int | None = None
-    uploadDate: datetime | None = None
-    minioName: str | None = None
-    bucketName: str | None = None
-    profileId: UUID | None = None
-
-
-class Include16(Enum):
-    REGION = "REGION"
-
-
-class DistrictFilter(BaseModel):
-    search: Annotated[str | None, Field(description="Строка поиска")] = None
-    active: Annotated[bool | None, Field(description="Признак активен ли город")] = None
-    includes: Annotated[
-        list[Include16] | None,
-        Field(description="Список моделей которые могу быть добавлены при отображении"),
-    ] = None
-
-
-class Include17(Enum):
-    AUTHOR = "AUTHOR"
-    PROCESS = "PROCESS"
-    PROTOCOL_DOCUMENT = "PROTOCOL_DOCUMENT"
-    FUND = "FUND"
-
-
-class DestructionActFilter(BaseModel):
-    destructionDateIsNotNull: bool | None = None
-    year: int | None = None
-    number: str | None = None
-    statuses: list[DestructionActStatus1] | None = None
-    includes: list[Include17] | None = None
-    currentUserExecutor: bool | None = None
-
-
-class Operation5(Enum):
-    """
-    Перечисления доступных операций над сущностями в акте уничтожения дел
-    """
-
-    DESTRUCTION_ACT_READ = "DESTRUCTION_ACT_READ"
-    DESTRUCTION_ACT_UPDATE = "DESTRUCTION_ACT_UPDATE"
-    DESTRUCTION_ACT_DELETE = "DESTRUCTION_ACT_DELETE"
-    DESTRUCTION_ACT_PROCESS_EXECUTORS_UPDATE = (
-        "DESTRUCTION_ACT_PROCESS_EXECUTORS_UPDATE"
-    )
-    DESTRUCTION_ACT_PROCESS_ITEM_UPDATE = "DESTRUCTION_ACT_PROCESS_ITEM_UPDATE"
-    DESTRUCTION_ACT_START = "DESTRUCTION_ACT_START"
-    DESTRUCTION_ACT_AGREEMENT = "DESTRUCTION_ACT_AGREEMENT"
-    DESTRUCTION_ACT_SIGNING = "DESTRUCTION_ACT_SIGNING"
-    DESTRUCTION_ACT_STATEMENT = "DESTRUCTION_ACT_STATEMENT"
-    DESTRUCTION_ACT_CANCEL = "DESTRUCTION_ACT_CANCEL"
-    DESTRUCTION_ACT_DESTROY = "DESTRUCTION_ACT_DESTROY"
-    DESTRUCTION_ACT_DESTROY_CHANGE_DATE = "DESTRUCTION_ACT_DESTROY_CHANGE_DATE"
-    DESTRUCTION_ACT_PRINT = "DESTRUCTION_ACT_PRINT"
-
-
-class DestructionActPermission(BaseModel):
-    operation: Annotated[
-        Operation5 | None,
-        Field(
-            description="Перечисления доступных операций над сущностями в акте уничтожения дел"
-        ),
-    ] = None
-    employees: Annotated[set[UUID] | None, Field()] = None
-
-
-class Status25(Enum):
-    ACTIVE = "ACTIVE"
-    CANCEL = "CANCEL"
-    ERROR = "ERROR"
-    COMPLETED = "COMPLETED"
-
-
-class ActionType3(Enum):
-    CREATE = "CREATE"
-    UPDATE = "UPDATE"
-    REJECT = "REJECT"
-    ACTION = "ACTION"
-    CREATED = "CREATED"
-    STEP_END = "STEP_END"
-    STEP_START = "STEP_START"
-    PROCESS_START = "PROCESS_START"
-    MAIN_FIELDS_UPDATE = "MAIN_FIELDS_UPDATE"
-    PROCESS_ITEM_UPDATE = "PROCESS_ITEM_UPDATE"
-    PROCESS_ITEM_EXECUTORS_UPDATE = "PROCESS_ITEM_EXECUTORS_UPDATE"
-    START = "START"
-    AGREEMENT = "AGREEMENT"
-    SIGNING = "SIGNING"
-    STATEMENT = "STATEMENT"
-    DELETE = "DELETE"
-    DOCUMENT_PROTOCOL_DELETE = "DOCUMENT_PROTOCOL_DELETE"
-    CANCEL = "CANCEL"
-    AFFAIRS_CANCELLED = "AFFAIRS_CANCELLED"
-    AFFAIRS_RESTORED = "AFFAIRS_RESTORED"
-    ATTACHMENT_ADDED = "ATTACHMENT_ADDED"
-    ATTACHMENT_DELETED = "ATTACHMENT_DELETED"
-    DESTRUCTION_ACT_PRINT = "DESTRUCTION_ACT_PRINT"
-    DESTROY_COMPLETED = "DESTROY_COMPLETED"
-    DESTROYED = "DESTROYED"
-
-
-class DestructionActHistoryActionData(BaseModel):
-    actionType: ActionType3 | None = None
-    data: dict[str, Any] | None = None
-
-
-class DestructionActNomenclatureAffairFilter(BaseModel):
-    destructionActId: UUID | None = None
-    name: Annotated[str | None, Field(description="Имя номенклатурного дела")] = None
-    nextRetryIsNotNull: Annotated[
-        bool | None, Field(description="Только те у которых определенно время удаления")
-    ] = None
-
-
-class BasicSearchEmployeeRequest(BaseModel):
-    search: str | None = None
-    departmentId: str | None = None
-    fired: bool | None = None
-    active: bool | None = None
-
-
-class DeliveryMethodFilter(BaseModel):
-    search: Annotated[str | None, Field(description="Строка поиска")] = None
-    active: Annotated[
-        bool | None, Field(description="Признак активен ли адресат/корреспондент")
-    ] = None
-    aismv: bool | None = None
-    kanclerNext: bool | None = None
-    system: bool | None = None
-
-
-class Include18(Enum):
-    DELIVERY_METHOD = "DELIVERY_METHOD"
-    DEPARTMENT = "DEPARTMENT"
-    SUBSCRIBER = "SUBSCRIBER"
-    COUNTRY = "COUNTRY"
-
-
-class CorrespondentFilter(BaseModel):
-    search: Annotated[str | None, Field(description="Строка поиска")] = None
-    active: Annotated[
-        bool | None, Field(description="Признак активен ли адресат/корреспондент")
-    ] = None
-    excludeCorrespondentGroupId: Annotated[
-        UUID | None,
-        Field(description="Id группы адресатов/корреспондентов для исключения"),
-    ] = None
-    type: Type2 | None = None
-    includes: Annotated[
-        list[Include18] | None,
-        Field(description="Список моделей которые могу быть добавлены при отображении"),
-    ] = None
-
-
-class Include19(Enum):
-    DISTRICT_WITH_REGION = "DISTRICT_WITH_REGION"
-    DISTRICT = "DISTRICT"
-
-
-class CityFilter(BaseModel):
-    search: Annotated[str | None, Field(description="Строка поиска")] = None
-    active: Annotated[bool | None, Field(description="Признак активен ли город")] = None
-    includes: Annotated[
-        list[Include19] | None,
-        Field(description="Список моделей которые могу быть добавлены при отображении"),
-    ] = None
-
-
-class SliceDtoWorkCalendarDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[WorkCalendarDto] | None = None
-
-
-class BpmnSearchRequest(BaseModel):
-    docCategory: DocCategory | None = None
-    search: Annotated[str | None, Field(description="Строка поиска")] = None
-    active: Annotated[bool | None, Field(description="Признак активности")] = None
-
-
-class SliceDtoBpmnProcessDirectoryDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[BpmnProcessDirectoryDto] | None = None
-
-
-class EmployeeAuthorizationAuditDto(BaseModel):
-    createDate: datetime | None = None
-
-
-class SliceDtoArchiveFundDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[ArchiveFundDto] | None = None
-
-
-class AismvOrgPackageFilter(BaseModel):
-    errors: bool | None = None
-    processed: bool | None = None
-    dateInLte: datetime | None = None
-
-
-class MinioAttachment(BaseModel):
-    minioName: str | None = None
-    bucketName: str | None = None
-    size: int | None = None
-    originalName: str | None = None
-    beltHash: str | None = None
-
-
-class SenderAttachment(BaseModel):
-    id: UUID | None = None
-    size: int | None = None
-    name: str | None = None
-    antivirus: bool | None = None
-    antivirusStmp: datetime | None = None
-    eds: bool | None = None
-    edsStmp: datetime | None = None
-    sign: list[Signature] | None = None
-
-
-class CrlInfo(BaseModel):
-    start: datetime | None = None
-    end: datetime | None = None
-    issuer: str | None = None
-    serialNumber: str | None = None
-
-
-class AccessGriefFilter(BaseModel):
-    search: Annotated[
-        str | None, Field(description="Строка поиска по названию или краткому названию")
-    ] = None
-    active: Annotated[bool | None, Field(description="Признак активности")] = None
-
-
-class Include20(Enum):
-    DEPARTMENT = "DEPARTMENT"
-    PROCESS = "PROCESS"
-
-
-class AcceptanceInventoryDataFilter(BaseModel):
-    jobStatus: JobStatus | None = None
-    storeAttribute: StoreAttribute | None = None
-    ids: list[UUID] | None = None
-    search: str | None = None
-    statuses: list[Status] | None = None
-    excludeStatuses: list[Status] | None = None
-    departmentId: UUID | None = None
-    calendarYearStart: int | None = None
-    calendarYearEnd: int | None = None
-    calendarYears: list[int] | None = None
-    calendarYear: int | None = None
-    departmentIds: list[UUID] | None = None
-    includes: list[Include20] | None = None
-    currentUserExecutor: bool | None = None
-
-
-class Operation6(Enum):
-    """
-    Перечисления доступных операций над сущностями в СП
-    """
-
-    ACCEPTANCE_INVENTORY_READ = "ACCEPTANCE_INVENTORY_READ"
-    ACCEPTANCE_INVENTORY_UPDATE = "ACCEPTANCE_INVENTORY_UPDATE"
-    ACCEPTANCE_INVENTORY_PROCESS_EXECUTORS_UPDATE = (
-        "ACCEPTANCE_INVENTORY_PROCESS_EXECUTORS_UPDATE"
-    )
-    ACCEPTANCE_INVENTORY_PROCESS_ITEM_UPDATE = (
-        "ACCEPTANCE_INVENTORY_PROCESS_ITEM_UPDATE"
-    )
-    ACCEPTANCE_INVENTORY_START = "ACCEPTANCE_INVENTORY_START"
-    ACCEPTANCE_INVENTORY_SIGNING = "ACCEPTANCE_INVENTORY_SIGNING"
-    ACCEPTANCE_INVENTORY_STATEMENT = "ACCEPTANCE_INVENTORY_STATEMENT"
-    ACCEPTANCE_INVENTORY_AGREEMENT = "ACCEPTANCE_INVENTORY_AGREEMENT"
-    ACCEPTANCE_INVENTORY_CANCEL = "ACCEPTANCE_INVENTORY_CANCEL"
-    ACCEPTANCE_INVENTORY_DISPATCH = "ACCEPTANCE_INVENTORY_DISPATCH"
-
-
-class AcceptanceInventoryPermission(BaseModel):
-    operation: Annotated[
-        Operation6 | None,
-        Field(description="Перечисления доступных операций над сущностями в СП"),
-    ] = None
-    employees: Annotated[set[UUID] | None, Field()] = None
-
-
-class ActionType4(Enum):
-    CREATED = "CREATED"
-    MAIN_FIELDS_UPDATE = "MAIN_FIELDS_UPDATE"
-    PROCESS_ITEM_EXECUTORS_UPDATE = "PROCESS_ITEM_EXECUTORS_UPDATE"
-    PROCESS_ITEM_UPDATE = "PROCESS_ITEM_UPDATE"
-    REJECT = "REJECT"
-    CANCELED = "CANCELED"
-    PROCESS_START = "PROCESS_START"
-    PROCESS_FINISH = "PROCESS_FINISH"
-    STEP_START = "STEP_START"
-    STEP_END = "STEP_END"
-    ACTION = "ACTION"
-    INCORRECT_DISPATCH = "INCORRECT_DISPATCH"
-    DISPATCHED = "DISPATCHED"
-    ERROR_DISPATCH = "ERROR_DISPATCH"
-    FATAL_ERROR_DISPATCH = "FATAL_ERROR_DISPATCH"
-    SIGN = "SIGN"
-    SIGN_ATTACHMENT = "SIGN_ATTACHMENT"
-    DELETE_SIGN_ATTACHMENT = "DELETE_SIGN_ATTACHMENT"
-    DECONVERSION = "DECONVERSION"
-    CONVERSION = "CONVERSION"
-    INIT_DISPATCH = "INIT_DISPATCH"
-    CREATE_FILE_INVENTORY = "CREATE_FILE_INVENTORY"
-    DELETE_FILE_INVENTORY = "DELETE_FILE_INVENTORY"
-
-
-class AcceptanceInventoryHistoryActionData(BaseModel):
-    actionType: ActionType4 | None = None
-    data: dict[str, Any] | None = None
-
-
-class IdsLong(BaseModel):
-    """
-    Список идентификаторов
-    """
-
-    ids: Annotated[list[int], Field(max_items=2147483647, min_items=1)]
-
-
-class IdsInteger(IdsLong):
-    """
-    Список идентификаторов
-    """
-
-
-class NomenclatureAffairDeleteRequest(BaseModel):
-    years: list[int] | None = None
-    personnel: bool | None = None
-    periods: list[GroupByStoragePeriod] | None = None
-
-
-class IdLong(BaseModel):
-    """
-    Идентификатор
-    """
-
-    id: int
-
-
-class IdsString(BaseModel):
-    """
-    Список идентификаторов
-    """
-
-    ids: Annotated[list[str], Field(max_items=2147483647, min_items=1)]
-
-
-class IdString(BaseModel):
-    """
-    Идентификатор
-    """
-
-    id: str
-
-
-class DocumentAccessGriefUpdate(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_ACCESS_GRIEF_UPDATE
-    """
-
-    accessGriefId: UUID | None = None
-
-
-class ContractAgreementUpdate(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_CONTRACT_AGREEMENT_UPDATE
-    """
-
-    contractAgreement: bool | None = None
-
-
-class AutoProlongationUpdate(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_CONTRACT_AUTO_PROLONGATION_UPDATE
-    """
-
-    contractAutoProlongation: bool | None = None
-
-
-class DocContractFields(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_CONTRACT_FIELDS_UPDATE
-    """
-
-    currencyId: UUID | None = None
-    contractSigningDate: datetime | None = None
-    contractStartDate: datetime | None = None
-    contractDurationStart: datetime | None = None
-    contractDurationEnd: datetime | None = None
-    contractNumber: str | None = None
-    contractDate: datetime | None = None
-    contractSum: float | None = None
-
-
-class ResponsibleUpdate(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_CONTRACT_RESPONSIBLE
-    """
-
-    addIds: list[UUID] | None = None
-    delIds: list[UUID] | None = None
-
-
-class ContractTypicalUpdate(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_CONTRACT_TYPICAL_UPDATE
-    """
-
-    contractTypical: bool | None = None
-
-
-class DocCorrespondentUpdate(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_CORRESPONDENT_UPDATE
-    """
-
-    outRegDate: datetime | None = None
-    outRegNumber: str | None = None
-    correspondentName: str | None = None
-    correspondentId: UUID | None = None
-    inDocSigners: str | None = None
-    countryName: str | None = None
-    countryId: UUID | None = None
-
-
-class DocFieldsMeeting(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_FIELDS_MEETING_UPDATE
-    """
-
-    externalInvitees: Annotated[
-        str | None, Field(description="Внешние приглашенные")
-    ] = None
-    chairpersonEmployeeId: Annotated[UUID | None, Field(description="Председатель")] = (
-        None
-    )
-    secretaryEmployeeId: Annotated[UUID | None, Field(description="Секретарь")] = None
-    dateMeeting: Annotated[datetime | None, Field(description="Дата совещания")] = None
-    startMeeting: Annotated[datetime | None, Field(description="Начало совещания")] = (
-        None
-    )
-    endMeeting: Annotated[datetime | None, Field(description="Окончание совещания")] = (
-        None
-    )
-    placeMeeting: Annotated[str | None, Field(description="Место совещания")] = None
-
-
-class DocFieldsMeetingQuestion(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_FIELDS_MEETING_QUESTION_UPDATE
-    """
-
-    formMeetingType: Annotated[
-        FormMeetingType | None, Field(description="Форма проведения заседания")
-    ] = None
-    dateMeetingQuestion: Annotated[
-        datetime | None, Field(description="Дата проведения заседания")
-    ] = None
-    addition: Annotated[
-        bool | None, Field(description="Признак дополнения к повестке вопросов")
-    ] = None
-    additionMeetingQuestionId: Annotated[
-        UUID | None,
-        Field(
-            description="Идентификатор документа для которого создается дополнительное заседание по вопросам"
-        ),
-    ] = None
-
-
-class DocFieldsQuestion(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_FIELDS_QUESTION_UPDATE
-    """
-
-    initiatorId: Annotated[
-        UUID | None, Field(description="Идентификатор инициатора вопроса")
-    ] = None
-    numberQuestion: Annotated[int | None, Field(description="Номер вопроса")] = None
-    dateQuestion: Annotated[datetime | None, Field(description="Дата заседания")] = None
-    commentQuestion: Annotated[
-        str | None, Field(description="Комментарии для руководителя")
-    ] = None
-
-
-class DocInvitees(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_MEETING_INVITEES_UPDATE
-    """
-
-    invitees: list[UUID] | None = None
-
-
-class DocumentLinkUpdatePart(BaseModel):
-    docLinkId: UUID | None = None
-    documentOrgId: str | None = None
-    documentLinkType: Type52 | None = None
-
-
-class DocMainFieldsAppeal(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_MAIN_FIELDS_APPEAL_UPDATE
-    """
-
-    receiptDate: Annotated[
-        datetime | None, Field(description="Содержит дату поступления обращения")
-    ] = None
-    declarantType: Annotated[
-        DeclarantType | None,
-        Field(
-            description="Признак, является заявитель физическим или юридическим лицом"
-        ),
-    ] = None
-    citizenTypeId: Annotated[
-        UUID | None, Field(description="Идентификатор вида обращения")
-    ] = None
-    collective: Annotated[
-        bool | None, Field(description="Признак коллективного обращения")
-    ] = None
-    anonymous: Annotated[
-        bool | None, Field(description="Признак анонимного обращения")
-    ] = None
-    fioApplicant: Annotated[
-        str | None, Field(description="Содержит Ф.И.О. заявителя")
-    ] = None
-    countryAppealId: Annotated[
-        UUID | None, Field(description="Идентификатор страны")
-    ] = None
-    countryAppealName: Annotated[
-        str | None, Field(description="Наименование страны")
-    ] = None
-    regionId: Annotated[UUID | None, Field(description="Идентификатор области")] = None
-    regionName: Annotated[str | None, Field(description="Область")] = None
-    districtId: Annotated[UUID | None, Field(description="Идентификатор района")] = None
-    districtName: Annotated[str | None, Field(description="Район")] = None
-    cityId: Annotated[UUID | None, Field(description="Идентификатор города")] = None
-    cityName: Annotated[str | None, Field(description="Город")] = None
-    index: Annotated[str | None, Field(description="Индекс")] = None
-    fullAddress: Annotated[
-        str | None, Field(description="Содержит улицу, дом, корпус, квартиру")
-    ] = None
-    phone: Annotated[str | None, Field(description="Контактный телефон")] = None
-    email: Annotated[str | None, Field(description="e-mail заявителя")] = None
-    organizationName: Annotated[
-        str | None, Field(description="Содержит наименование организации-заявителя")
-    ] = None
-    signed: Annotated[
-        str | None, Field(description="Содержит Ф.И.О. лица, подписавшего документ")
-    ] = None
-    correspondentOrgNumber: Annotated[
-        str | None,
-        Field(
-            description="Содержит исходящий регистрационный индекс, присвоенный документу организацией-корреспондентом"
-        ),
-    ] = None
-    dateDocCorrespondentOrg: Annotated[
-        datetime | None,
-        Field(
-            description="Содержит дату присвоения организацией-корреспондентом документу исходящего регистрационного номера"
-        ),
-    ] = None
-    subjectId: Annotated[UUID | None, Field(description="Идентификатор тематики")] = (
-        None
-    )
-    correspondentAppeal: Annotated[
-        str | None,
-        Field(
-            description="Заполняется, если обращение в ГТБ переслала другая организация, куда оно поступило первоначально (адресаты/корреспонденты)"
-        ),
-    ] = None
-    correspondentAppealId: Annotated[
-        UUID | None, Field(description="Корреспондент ид")
-    ] = None
-    indexDateCoverLetter: Annotated[
-        str | None, Field(description="Дата и индекс сопроводительного письма")
-    ] = None
-    reviewProgress: Annotated[str | None, Field(description="Ход рассмотрения")] = None
-    solutionResultId: Annotated[
-        UUID | None, Field(description="Идентификатор результата решения")
-    ] = None
-    nomenclatureAffairId: Annotated[
-        UUID | None, Field(description="Идентификатор номенклатуры дел")
-    ] = None
-    reasonably: Annotated[bool | None, Field(description="Признак обоснованности")] = (
-        None
-    )
-
-
-class DocMainFields(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_MAIN_FIELDS_UPDATE
-    """
-
-    additionalPages: str | None = None
-    exemplarCount: int | None = None
-    investProgramId: UUID | None = None
-    shortSummary: str | None = None
-    documentTypeId: int | None = None
-    deliveryMethodId: int | None = None
-    pages: int | None = None
-    inArchive: bool | None = None
-    whoAddressed: list[MiniUserInfoDto] | None = None
-    whoSignedId: UUID | None = None
-    note: str | None = None
-
-
-class DocumentNomenclatureUpdate1(BaseModel):
-    documentId: UUID | None = None
-    nomenclatureAffairId: UUID | None = None
-
-
-class EmployeeWithPosition(BaseModel):
-    order: int | None = None
-    id: UUID | None = None
-
-
-class DocumentProcessItemUpdate(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_PROCESS_ITEM_UPDATE
-    """
-
-    id: UUID | None = None
-    days: int | None = None
-    actionQueueType: ActionQueueType1 | None = None
-
-
-class DocRepeatIdentical(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_REPEAT_IDENTICAL_UPDATE
-    """
-
-    repeatIdenticalAppeals: Annotated[
-        list[RepeatIdenticalAppealDto] | None,
-        Field(description="Повторные и идентичные обращения"),
-    ] = None
-
-
-class DocumentResponsibleUpdate(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_QUESTION_RESPONSIBLE_EXECUTOR_UPDATE
-    """
-
-    ids: list[UUID] | None = None
-
-
-class Speaker(BaseModel):
-    questionId: UUID | None = None
-    ids: list[UUID] | None = None
-    type: Type11 | None = None
-
-
-class DocumentUndraft(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_UNDRAFT
-    """
-
-    id: UUID | None = None
-
-
-class ContractCorrespondentDto(JsonNode):
-    pass
-
-
-class DocumentNomenclatureUpdate(JsonNode):
-    pass
-
-
-class DocumentRecipientDto(JsonNode):
-    pass
-
-
-class FolderRequest(BaseModel):
-    folderInsertOrUpdate: Annotated[
-        FolderInsertOrUpdateOperation,
-        Field(description="Модель редактирования или создания папки"),
-    ]
-    foldersDocsMove: Annotated[
-        FoldersDocsMoveOperation | None,
-        Field(description="Модель перемещения массива папок и документов в папку"),
-    ] = None
-    docMoveInFolders: Annotated[
-        DocMoveInFoldersOperation | None,
-        Field(description="Модель перемещения документа в массив папок"),
-    ] = None
-    docsMoveInFolders: Annotated[
-        DocsMoveInFoldersOperation | None,
-        Field(description="Модель перемещения массива документов в массив папок"),
-    ] = None
-    foldersDocsDelete: Annotated[
-        FoldersDocsDeleteOperation | None,
-        Field(description="Модель удаления массива папок и документов"),
-    ] = None
-    folderInRoot: Annotated[
-        FolderInRootOperation | None,
-        Field(description="Модель перемещения папки в корень"),
-    ] = None
-
-
-class AdditionalDocumentAttachmentDto(BaseModel):
-    id: UUID | None = None
-    attachment: AttachmentDto | None = None
-    additionalDocumentId: UUID | None = None
-    additionalDocument: Any | None = None
-    documentId: UUID | None = None
-    createDate: datetime | None = None
-
-
-class AttachmentSignature(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор ЭЦП")] = None
-    date: Annotated[
-        datetime | None, Field(description="Дата формирования подписи ЭЦП")
-    ] = None
-    check: Annotated[
-        bool | None,
-        Field(description="Признак была ли выполнена проверка валидности ЭЦП"),
-    ] = None
-    sign: Annotated[Signature | None, Field(description="ЭЦП")] = None
-
-
-class DocumentFormDefinitionDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор определения формы документа")
-    ] = None
-    general: Annotated[
-        dict[str, Any] | None, Field(description="Общие настройки формы")
-    ] = None
-    fields: Annotated[
-        list[DocumentFormField] | None, Field(description="Поля формы документа")
-    ] = None
-
-
-class DocumentFormDto(BaseModel):
-    """
-    Форма документа
-    """
-
-    id: Annotated[UUID | None, Field(description="Идентификатор формы документа")] = (
-        None
-    )
-    name: Annotated[
-        str, Field(description="Наименование формы документа", min_length=1)
-    ]
-    documentConstant: Annotated[
-        DocumentConstant, Field(description="Константа документа")
-    ]
-    active: Annotated[
-        bool | None, Field(description="Признак активен ли форма документа")
-    ] = None
-    system: Annotated[
-        bool | None, Field(description="Признак системной формы документа")
-    ] = None
-    documentTypeId: Annotated[int, Field(description="Идентификатор типа документа")]
-    documentType: DocumentTypeDto | None = None
-    general: Annotated[
-        dict[str, dict[str, Any]] | None, Field(description="Общие настройки формы")
-    ] = None
-    fields: Annotated[
-        list[DocumentFormField] | None, Field(description="Поля формы документа")
-    ] = None
-
-
-class InnerInventory(BaseModel):
-    archiveKeepingId: int | None = None
-    document: str
-    signature: str
-    signatureTime: str
-    orgApprovePerson: OrgApprovePerson
-
-
-class InnerInventoryResponse(PackageEoResponse):
-    pass
-
-
-class MiniDocumentAttachmentDto(BaseModel):
-    """
-    DTO для вложений мини-документа
-    """
-
-    id: Annotated[UUID | None, Field(description="Идентификатор вложения")] = None
-    miniDocumentId: Annotated[
-        UUID | None, Field(description="Идентификатор мини-документа")
-    ] = None
-    type: Annotated[
-        AttachmentDocumentType | None, Field(description="Тип вложения")
-    ] = None
-    attachment: AttachmentDto | None = None
-    contentType: ContentType | None = None
-    uploadDate: Annotated[datetime | None, Field(description="Дата загрузки")] = None
-    signs: Annotated[
-        list[AttachmentSignature] | None, Field(description="Список ЭЦП вложения")
-    ] = None
-    additionalDocumentTypeId: Annotated[
-        UUID | None, Field(description="Id вида дополнительного документа")
-    ] = None
-    additionalDocumentType: Annotated[
-        AdditionalDocumentTypeDto | None,
-        Field(description="Вид дополнительного документа"),
-    ] = None
-    docAttachmentId: UUID | None = None
-    additionalDocAttachmentId: UUID | None = None
-
-
-class ReportUserConfigRequest(BaseModel):
-    id: Annotated[UUID, Field(description="Идентификатор конфигурации отчета")]
-    fields: Annotated[
-        dict[str, str], Field(description="Перечень полей в генераторе отчетов")
-    ]
-    userFields: Annotated[
-        ReportUserField,
-        Field(description="Дополнительные поля для отображения в генераторе отчетов"),
-    ]
-    columns: Annotated[list[Column] | None, Field(description="Колонки для отчета")] = (
-        None
-    )
-    type: Annotated[Type16, Field(description="Тип отчета")]
-    name: Annotated[str, Field(description="Наименование шаблона отчета")]
-
-
-class PersonalSetupRequest(BaseModel):
-    id: UUID | None = None
-    setting: ScanSettingJsonB | None = None
-    notify: bool | None = None
-    localization: Localization | None = None
-    notifications: list[PersonalNotificationSettingDto] | None = None
-
-
-class PermissionDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="ИД")] = None
-    systemName: Annotated[str | None, Field(description="Системное имя")] = None
-    type: Annotated[Type18 | None, Field(description="Тип")] = None
-    docStatus: Annotated[DocStatus | None, Field(description="Статус документа")] = None
-    docCategory: Annotated[
-        DocumentCategory | None, Field(description="Тип документа")
-    ] = None
-    mergeRoles: Annotated[
-        list[RoleMergeDto] | None, Field(description="Политика обработки слияния ИД")
-    ] = None
-    processCompleted: Annotated[
-        bool | None, Field(description="Признак выполнения процесса")
-    ] = None
-    currentStepCompleted: Annotated[
-        bool | None, Field(description="Признак выполнения текущего этапа")
-    ] = None
-    lastStep: Annotated[
-        bool | None,
-        Field(description="Признак того что текущий этап является последним"),
-    ] = None
-    processStarted: Annotated[
-        bool | None, Field(description="Признак того что процесс начал выполнение")
-    ] = None
-    onControl: Annotated[
-        bool | None, Field(description="Документ стоит на контроле")
-    ] = None
-    taskOnControl: Annotated[
-        bool | None, Field(description="Поручение стоит на контроле")
-    ] = None
-    resolvePolicy: Annotated[
-        ResolvePolicy | None, Field(description="Политики обработки доступа")
-    ] = None
-    hasRegNumber: Annotated[bool | None, Field(description="Регномер")] = None
-    documentHasItems: Annotated[
-        list[Type4] | None,
-        Field(description="Типы этапов в документе при которых доступно"),
-    ] = None
-    createType: Annotated[
-        CreateType3 | None, Field(description="Типсоздания документа")
-    ] = None
-    taskCompleted: Annotated[bool | None, Field(description="Поручение исполненно")] = (
-        None
-    )
-    taskOnRevision: Annotated[
-        bool | None, Field(description="Поручение на доработке")
-    ] = None
-    childTask: Annotated[bool | None, Field(description="Дочернее поручение")] = None
-    taskType: Annotated[Type12 | None, Field(description="Тип поручения")] = None
-    taskBeginExecution: Annotated[
-        bool | None, Field(description="Поручение начало исполнение")
-    ] = None
-    archive: Annotated[
-        bool | None, Field(description="Документ находится в архиве")
-    ] = None
-    taskCreateByPeriod: Annotated[
-        bool | None,
-        Field(description="Поручение создано для из-за переодического выполнения"),
-    ] = None
-    hasPeriodTasks: Annotated[
-        bool | None,
-        Field(
-            description="На основании этого поручения были созданны переодические поручения"
-        ),
-    ] = None
-    nomenclatureDepartmentStatus: Annotated[
-        NomenclatureDepartmentStatus | None,
-        Field(description="Статус нумераторы подразделения"),
-    ] = None
-    summaryNomenclatureDepartmentStatus: Annotated[
-        SummaryNomenclatureDepartmentStatus | None,
-        Field(description="Сводный статус подразделения"),
-    ] = None
-    destructionActStatus: Annotated[
-        DestructionActStatus | None, Field(description="Статус акта уничтожения")
-    ] = None
-    acceptanceInventoryStatus: Status | None = None
-
-
-class CamundaProcessItemDefinitionRequest(BaseModel):
-    days: int | None = None
-    completeAfterRejectCount: int | None = None
-    repeatExecutionPolicy: RepeatExecutionPolicy | None = None
-    autoRegistration: bool | None = None
-    transientExecution: bool | None = None
-    oneForAll: bool | None = None
-    fileSign: bool | None = None
-    actionQueueType: ActionQueueType1 | None = None
-    employees: list[ProcessExecutorWithPos] | None = None
-
-
-class CustomViewDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор пользовательского представления")
-    ] = None
-    name: Annotated[
-        str | None, Field(description="Название представления", max_length=50)
-    ] = None
-    columns: Annotated[
-        list[CustomViewColumn] | None, Field(description="Настройки колонок")
-    ] = None
-    filter: Annotated[
-        DocumentFilter | None, Field(description="Фильтр представления")
-    ] = None
-    employeeId: Annotated[
-        UUID | None, Field(description="Идентификатор сотрудника")
-    ] = None
-    defaultSortColumn: Annotated[
-        str | None, Field(description="Поле сортировки по умолчанию", max_length=100)
-    ] = None
-    defaultSortDirection: Annotated[
-        str | None,
-        Field(description="Направление сортировки по умолчанию", max_length=10),
-    ] = None
-
-
-class CurrentUser(BaseModel):
-    id: UUID | None = None
-    orgId: str | None = None
-    firstName: str | None = None
-    lastName: str | None = None
-    middleName: str | None = None
-    fullPostName: str | None = None
-    meIo: list[Io] | None = None
-    secretaries: list[Secretary] | None = None
-    roles: Annotated[set[UUID] | None, Field()] = None
-    postId: int | None = None
-    departmentId: UUID | None = None
-    departmentName: str | None = None
-    post: PostDto | None = None
-    fired: bool | None = None
-    country: CountryDto | None = None
-    active: bool | None = None
-    authorities: list[GrantedAuthority] | None = None
-    localization: Localization | None = None
-    widgets: bool | None = None
-    scanWia: bool | None = None
-    docEllipsis: bool | None = None
-    docEllipsisRow: int | None = None
-    showEventDesign: bool | None = None
-    settings: ScanSettingJsonB | None = None
-    griefIds: Annotated[set[UUID] | None, Field()] = None
-    responsibleNomenclatureDepartmentIds: list[UUID] | None = None
-    subordinatesDepartments: list[UUID] | None = None
-    archivist: bool | None = None
-    views: list[CustomViewDto] | None = None
-
-
-class TokenResponse(BaseModel):
-    token: str | None = None
-    refreshToken: str | None = None
-    me: CurrentUser | None = None
-
-
-class IdsOrgKey(BaseModel):
-    """
-    Список идентификаторов
-    """
-
-    ids: Annotated[list[OrgKey], Field(max_items=2147483647, min_items=1)]
-
-
-class PresetPermissionDocCategoryPresetPermissionSetting(BaseModel):
-    docCategoryConst: DocCategory | None = None
-    statuses: list[PresetPermissionSetting] | None = None
-
-
-class PresetPermissionDocCategoryPresetPermissionTaskDocStatus(BaseModel):
-    docCategoryConst: DocCategory | None = None
-    statuses: list[PresetPermissionTaskDocStatus] | None = None
-
-
-class PresetPermissionPresetPermissionDocCategoryPresetPermissionSetting(BaseModel):
-    permission: str | None = None
-    data: list[PresetPermissionDocCategoryPresetPermissionSetting] | None = None
-
-
-class PresetPermissionPresetPermissionDocCategoryPresetPermissionTaskDocStatus(
-    BaseModel
-):
-    permission: str | None = None
-    data: list[PresetPermissionDocCategoryPresetPermissionTaskDocStatus] | None = None
-
-
-class PresetPermissionPresetPermissionRoleField(BaseModel):
-    permission: str | None = None
-    data: list[PresetPermissionRoleField] | None = None
-
-
-class PresetPermissionPresetPermissionStatusRoleFieldAcceptanceInventoryStatus(
-    BaseModel
-):
-    permission: str | None = None
-    data: list[PresetPermissionStatusRoleFieldAcceptanceInventoryStatus] | None = None
-
-
-class PresetPermissionPresetPermissionStatusRoleFieldDestructionActStatus(BaseModel):
-    permission: str | None = None
-    data: list[PresetPermissionStatusRoleFieldDestructionActStatus] | None = None
-
-
-class PresetPermissionPresetPermissionStatusRoleFieldNomenclatureDepartmentStatus(
-    BaseModel
-):
-    permission: str | None = None
-    data: list[PresetPermissionStatusRoleFieldNomenclatureDepartmentStatus] | None = (
-        None
-    )
-
-
-class PresetPermissionPresetPermissionStatusRoleFieldSummaryNomenclatureDepartmentStatus(
-    BaseModel
-):
-    permission: str | None = None
-    data: (
-        list[PresetPermissionStatusRoleFieldSummaryNomenclatureDepartmentStatus] | None
-    ) = None
-
-
-class CopyAffairWrapperNomenclatureAffairOperationCopyDepDto(BaseModel):
-    ids: list[NomenclatureAffairOperationCopyDepDto] | None = None
-    active: bool | None = None
-    refreshDepPath: bool | None = None
-
-
-class ArchiveRegistrationDto(BaseModel):
-    orgName: str | None = None
-    unp: str | None = None
-    unpf: str | None = None
-    sysId: str | None = None
-    sedSysId: str | None = None
-    fundNumber: int | None = None
-    data: PackageRegSystemResponse | None = None
-
-
-class CreateTaskRequest(BaseModel):
-    planedDateEnd: Annotated[
-        datetime | None, Field(description="Планируемая дата исполнения поручения")
-    ] = None
-    taskText: Annotated[str, Field(description="Текст поручения", min_length=1)]
-    authorId: Annotated[
-        UUID | None,
-        Field(description="Автор поручения, если не заполнен, то текущий пользователь"),
-    ] = None
-    type: Annotated[Type12, Field(description="Тип поручения")]
-    executors: Annotated[
-        list[CreateTaskRequestExecutor] | None, Field(description="Исполнители")
-    ] = None
-    endless: Annotated[
-        bool,
-        Field(
-            description="бессрочное поручение (если false, то planedDateEnd обязательно к заполнению)"
-        ),
-    ]
-    periodTask: Annotated[bool, Field(description="Поручение периодическое")]
-    period: Annotated[
-        Period3 | None,
-        Field(
-            description="Интервал создания поручения (обязательно к заполнению если periodTask != null)"
-        ),
-    ] = None
-
-
-class SpnegoAuthDebug(BaseModel):
-    domainName: str | None = None
-    ldapPersonalNumber: str | None = None
-    user: CurrentUser | None = None
-    dbUserCount: int | None = None
-    ldapAttributes: dict[str, Any] | None = None
-
-
-class SliceDtoUserNotificationDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[UserNotificationDto] | None = None
-
-
-class TemporaryAttachmentDto(BaseModel):
-    id: UUID | None = None
-    name: str | None = None
-    uploadDate: datetime | None = None
-    size: int | None = None
-    type: Type1 | None = None
-    signs: list[AttachmentSignature] | None = None
-    attachmentDocumentType: AttachmentDocumentType1 | None = None
-
-
-class PermissionRoleDto(BaseModel):
-    id: UUID | None = None
-    role: RoleDto | None = None
-    roleId: UUID | None = None
-    permission: PermissionDto | None = None
-    permissionId: UUID | None = None
-
-
-class GetInventoryStatusResponse2(BaseModel):
-    listInformation: ListInformation
-    idpackage: str | None = None
-    type: str | None = None
-    dateoftransmission: str | None = None
-    inventory: ReturnInventoryStatus | None = None
-
-
-class DocPermissionContainer(BaseModel):
-    permissions: Annotated[
-        list[UserDocPermission] | None,
-        Field(description="Список прав доступа для документа"),
-    ] = None
-    context: Annotated[
-        DocumentContext | None, Field(description="Контекст документа")
-    ] = None
-
-
-class SliceDtoDocumentFormDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[DocumentFormDto] | None = None
-
-
-class DownloadedSenderAttachment(BaseModel):
-    senderAttachment: SenderAttachment | None = None
-    minioAttachment: MinioAttachment | None = None
-
-
-class AismvCertInfoDto(BaseModel):
-    enabled: bool | None = None
-    roots: list[CertInfo] | None = None
-    ca: list[CertInfo] | None = None
-    crls: list[CrlInfo] | None = None
-
-
-class DocumentLinkUpdate(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_LINK_UPDATE
-    """
-
-    links: list[DocumentLinkUpdatePart] | None = None
-
-
-class DocumentProcessExecutorUpdate(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_PROCESS_EXECUTORS_UPDATE
-    """
-
-    id: UUID | None = None
-    employees: list[EmployeeWithPosition] | None = None
-
-
-class DocSpeakerUpdate(BaseModel):
-    """
-    Тип параметра для операции DOCUMENT_SPEAKERS_MEETING_QUESTION_UPDATE
-    """
-
-    speakers: list[Speaker] | None = None
-
-
-class AttachmentDocumentDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор вложения")] = None
-    name: Annotated[str | None, Field(description="Наименование вложения")] = None
-    uploadDate: datetime | None = None
-    size: Annotated[int | None, Field(description="Размер вложения")] = None
-    type: Type1 | None = None
-    signs: Annotated[
-        list[AttachmentSignature] | None, Field(description="Список ЭЦП вложения")
-    ] = None
-    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
-        None
-    )
-    attachmentDocumentType: Annotated[
-        AttachmentDocumentType | None, Field(description="Тип вложения")
-    ] = None
-    authorId: UUID | None = None
-    lastModifyUserId: UUID | None = None
-    modifyDate: datetime | None = None
-    sourceOriginalName: str | None = None
-
-
-class InnerInventories(BaseModel):
-    innerInventory: list[InnerInventory]
-
-
-class InnerInventoryRequestBody(BaseModel):
-    system: WsSystem
-    innerInventories: InnerInventories
-
-
-class PresetPermissionDefinition(BaseModel):
-    documents: (
-        list[PresetPermissionPresetPermissionDocCategoryPresetPermissionSetting] | None
-    ) = None
-    tasks: (
-        list[PresetPermissionPresetPermissionDocCategoryPresetPermissionTaskDocStatus]
-        | None
-    ) = None
-    directories: list[PresetPermissionString] | None = None
-    nomenclatureAffairs: list[PresetPermissionPresetPermissionRoleField] | None = None
-    miniDocuments: list[PresetPermissionPresetPermissionRoleField] | None = None
-    contractControlPoints: (
-        list[PresetPermissionPresetPermissionDocCategoryPresetPermissionSetting] | None
-    ) = None
-    acceptanceInventories: (
-        list[PresetPermissionPresetPermissionStatusRoleFieldAcceptanceInventoryStatus]
-        | None
-    ) = None
-    summaryNomenclatureDepartments: (
-        list[
-            PresetPermissionPresetPermissionStatusRoleFieldSummaryNomenclatureDepartmentStatus
-        ]
-        | None
-    ) = None
-    nomenclatureDepartments: (
-        list[
-            PresetPermissionPresetPermissionStatusRoleFieldNomenclatureDepartmentStatus
-        ]
-        | None
-    ) = None
-    destructionAct: (
-        list[PresetPermissionPresetPermissionStatusRoleFieldDestructionActStatus] | None
-    ) = None
-
-
-class DocOperation(BaseModel):
-    operationType: Annotated[
-        OperationType2,
-        Field(
-            description="Доступные типы операций: DOCUMENT_ACCESS_GRIEF_UPDATE, DOCUMENT_CONTRACT_AGREEMENT_UPDATE, DOCUMENT_CONTRACT_AUTO_PROLONGATION_UPDATE, DOCUMENT_CONTRACT_CORRESPONDENT_UPDATE, DOCUMENT_CONTRACT_FIELDS_UPDATE, DOCUMENT_CONTRACT_RESPONSIBLE, DOCUMENT_CONTRACT_TYPICAL_UPDATE, DOCUMENT_CORRESPONDENT_UPDATE, DOCUMENT_UPDATE_CUSTOM_FIELDS, DOCUMENT_FIELDS_MEETING_UPDATE, DOCUMENT_FIELDS_MEETING_QUESTION_UPDATE, DOCUMENT_FIELDS_QUESTION_UPDATE, DOCUMENT_MEETING_INVITEES_UPDATE, DOCUMENT_LINK_UPDATE, DOCUMENT_MAIN_FIELDS_APPEAL_UPDATE, DOCUMENT_MAIN_FIELDS_UPDATE, DOCUMENT_NOMENCLATURE_AFFAIR_UPDATE, DOCUMENT_PROCESS_EXECUTORS_UPDATE, DOCUMENT_PROCESS_ITEM_UPDATE, DOCUMENT_RECIPIENT_LIST_UPDATE, DOCUMENT_REPEAT_IDENTICAL_UPDATE, DOCUMENT_QUESTION_RESPONSIBLE_EXECUTOR_UPDATE, DOCUMENT_SPEAKERS_MEETING_QUESTION_UPDATE, DOCUMENT_UNDRAFT"
-        ),
-    ]
-    body: (
-        DocumentAccessGriefUpdate
-        | ContractAgreementUpdate
-        | AutoProlongationUpdate
-        | DocContractFields
-        | ResponsibleUpdate
-        | ContractTypicalUpdate
-        | DocCorrespondentUpdate
-        | DocFieldsMeeting
-        | DocFieldsMeetingQuestion
-        | DocFieldsQuestion
-        | DocInvitees
-        | DocumentLinkUpdate
-        | DocMainFieldsAppeal
-        | DocMainFields
-        | DocumentProcessExecutorUpdate
-        | DocumentProcessItemUpdate
-        | DocRepeatIdentical
-        | DocumentResponsibleUpdate
-        | DocSpeakerUpdate
-        | DocumentUndraft
-        | Any
-        | None
-    ) = None
-
-
-class AismvOrgPackageDto(BaseModel):
-    id: UUID | None = None
-    packageId: UUID | None = None
-    parentId: UUID | None = None
-    idFrom: str | None = None
-    typeFrom: str | None = None
-    nameFrom: str | None = None
-    headerId: str | None = None
-    ack: bool | None = None
-    body: dict[str, Any] | None = None
-    attachments: list[DownloadedSenderAttachment] | None = None
-    processed: bool | None = None
-    errors: bool | None = None
-    errorMessage: str | None = None
-    trace: str | None = None
-    dateIn: datetime | None = None
-
-
-class SliceDtoAismvOrgPackageDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[AismvOrgPackageDto] | None = None
-
-
-class InnerInventoryRequest(BaseModel):
-    entry: str | None = None
-    idpackage: str | None = None
-    type: Type8 | None = None
-    dateoftransmission: str | None = None
-    packageBody: InnerInventoryRequestBody
-
-
-class AcceptanceInventoryDataDto(BaseModel):
-    id: UUID | None = None
-    description: str | None = None
-    title: str | None = None
-    storeAttribute: StoreAttribute | None = None
-    departmentId: UUID | None = None
-    department: DepartmentDto | None = None
-    dataDispatch: SaveInventoryResponse | None = None
-    conversionEndDate: datetime | None = None
-    jobStatus: JobStatus | None = None
-    status: Status | None = None
-    dispatchEndDate: datetime | None = None
-    idPackage: UUID | None = None
-    invIndex: str | None = None
-    index: str | None = None
-    createDate: datetime | None = None
-    date: datetime | None = None
-    dispatchJobInfo: JobInfo | None = None
-    innerInventories: list | None = None
-    signature: Signature | None = None
-    calendarYear: int | None = None
-    byStaff: bool | None = None
-    author: UserInfoDto | None = None
-    methodAssemblyType: MethodAssemblyType | None = None
-    toArchiveDate: datetime | None = None
-    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
-        None
-    )
-    process: Annotated[
-        AcceptanceInventoryProcessDto | None, Field(description="Процесс СП")
-    ] = None
-    rejectCancelDate: Annotated[
-        datetime | None, Field(description="Дата отклонения/аннулирования")
-    ] = None
-    inventoryAttachment: AttachmentDto | None = None
-    signs: Annotated[
-        list[AttachmentSignature] | None, Field(description="Список ЭЦП вложения")
-    ] = None
-
-
-class AcceptanceInventoryProcessDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор процесса")] = None
-    currentId: Annotated[
-        UUID | None, Field(description="Идентификатор текущего этапа процесса")
-    ] = None
-    current: Annotated[
-        AcceptanceInventoryProcessItemDto | None,
-        Field(description="Текущий этап процесса"),
-    ] = None
-    nextId: Annotated[
-        UUID | None, Field(description="Идентификатор следующего этапа процесса")
-    ] = None
-    next: Annotated[
-        AcceptanceInventoryProcessItemDto | None,
-        Field(description="Следующий этап процесса"),
-    ] = None
-    acceptanceInventoryId: Annotated[
-        UUID | None, Field(description="Идентификатор номенклатуры дел подразделения")
-    ] = None
-    acceptanceInventory: Annotated[Any | None, Field(description="СП")] = None
-    items: Annotated[
-        list[AcceptanceInventoryProcessItemDto] | None,
-        Field(description="Список этапов процесса"),
-    ] = None
-    completed: Annotated[
-        bool | None, Field(description="Признак прошел ли документ все этапы")
-    ] = None
-    started: Annotated[
-        bool | None, Field(description="Признак начал ли документ движение по маршруту")
-    ] = None
-    stepCount: Annotated[
-        int | None, Field(description="Количество этапов в процессе")
-    ] = None
-
-
-class AcceptanceInventoryProcessExecutorDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор исполнителя процесса в СП")
-    ] = None
-    start: Annotated[datetime | None, Field(description="Дата начала исполнения")] = (
-        None
-    )
-    executionEnd: Annotated[
-        datetime | None, Field(description="Дата окончания исполнения")
-    ] = None
-    end: Annotated[datetime | None, Field(description="Дата окончания исполнения")] = (
-        None
-    )
-    processId: UUID | None = None
-    processItemId: Annotated[
-        UUID | None, Field(description="Идентификатор этапа процесса")
-    ] = None
-    item: Annotated[Any | None, Field(description="Этап процесса")] = None
-    comment: Annotated[str | None, Field(description="Комментарий")] = None
-    result: Annotated[
-        bool | None, Field(description="Признак результата исполнения")
-    ] = None
-    executor: Annotated[UserInfoDto | None, Field(description="Исполнитель")] = None
-    acceptanceInventoryId: Annotated[
-        UUID | None, Field(description="Идентификатор СП")
-    ] = None
-    acceptanceInventoryOrgId: Annotated[
-        str | None, Field(description="Идентификатор организации СП")
-    ] = None
-    acceptanceInventory: Annotated[Any | None, Field(description="СП")] = None
-
-
-class AcceptanceInventoryProcessItemDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор этапа процесса")] = None
-    type: Annotated[
-        Type | None, Field(description="Перечисление для описания типов процесса")
-    ] = None
-    order: Annotated[int | None, Field(description="Порядковый номер")] = None
-    startStamp: Annotated[
-        datetime | None, Field(description="Дата начала этапа процесса")
-    ] = None
-    endStamp: Annotated[
-        datetime | None, Field(description="Дата окончания этапа процесса")
-    ] = None
-    completed: Annotated[
-        bool | None, Field(description="Признак был ли завершен этап процесса")
-    ] = None
-    started: Annotated[
-        bool | None,
-        Field(description="Признак был ли начаты действия по этапу процесса"),
-    ] = None
-    oneForAll: bool | None = None
-    executors: Annotated[
-        list[AcceptanceInventoryProcessExecutorDto] | None,
-        Field(description="Список исполнителей этапа процесса"),
-    ] = None
-    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
-        None
-    )
-    process: Annotated[Any | None, Field(description="Процесс документа")] = None
-    executorsCount: Annotated[int | None, Field(description="Кол-во исполнителей")] = (
-        None
-    )
-    acceptanceInventoryId: Annotated[
-        UUID | None, Field(description="Идентификатор номенклатуры дел подразделения")
-    ] = None
-    acceptanceInventory: Annotated[
-        Any | None, Field(description="Номенклатура дел подразделения")
-    ] = None
-
-
-class AdditionalDocumentDto(BaseModel):
-    id: UUID | None = None
-    documentId: UUID | None = None
-    additionalDocumentTypeId: UUID | None = None
-    additionalDocumentType: AdditionalDocumentTypeDto | None = None
-    parentId: UUID | None = None
-    parent: Any | None = None
-    attachments: list[AdditionalDocumentAttachmentDto] | None = None
-    responsibles: list[AdditionalDocumentResponsibleDto] | None = None
-    date: datetime | None = None
-    docNumber: str | None = None
-    author: UserInfoDto | None = None
-    note: str | None = None
-    createDate: datetime | None = None
-
-
-class AdditionalDocumentResponsibleDto(BaseModel):
-    id: UUID | None = None
-    additionalDocumentId: UUID | None = None
-    user: UserInfoDto | None = None
-    createDate: datetime | None = None
-
-
-class ControlDto(BaseModel):
-    controlTypeId: Annotated[
-        UUID | None, Field(description="Идентификатор типа контроля")
-    ] = None
-    controlTypeOrgId: str | None = None
-    controlType: Annotated[ControlTypeDto | None, Field(description="Тип контроля")] = (
-        None
-    )
-    controlDateStart: Annotated[
-        datetime | None, Field(description="Дата начала контроля")
-    ] = None
-    controlPlanDateEnd: Annotated[
-        datetime | None, Field(description="Планируемая дата окончания контроля")
-    ] = None
-    controlRealDateEnd: Annotated[
-        datetime | None, Field(description="Реальная дата окончания контроля")
-    ] = None
-    controlTermDays: Annotated[
-        int | None,
-        Field(
-            description="Срок контроля в днях, изначально копируется из типа контроля"
-        ),
-    ] = None
-    controlInitiator: Annotated[
-        EmployeeDto | None, Field(description="Сотрудник который поставил на контроль")
-    ] = None
-    controlInitiatorId: Annotated[
-        UUID | None,
-        Field(description="Идентификатор сотрудника который поставил на контроль"),
-    ] = None
-    controlEmployee: Annotated[EmployeeDto | None, Field(description="Контролер")] = (
-        None
-    )
-    controlEmployeeId: Annotated[
-        UUID | None, Field(description="Идентификатор контролера")
-    ] = None
-    controlExecutor: Annotated[
-        EmployeeDto | None, Field(description="Сотрудник который снял с контроля")
-    ] = None
-    controlExecutorId: Annotated[
-        UUID | None,
-        Field(description="Идентификатор сотрудника который снял с контроля"),
-    ] = None
-    onControl: Annotated[
-        bool | None, Field(description="Активен ли сейчас контроль")
-    ] = None
-    removeControl: Annotated[
-        bool | None, Field(description="Метка снятия с контроля")
-    ] = None
-
-
-class ControlTypeDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор типа контроля")] = None
-    organizationId: str | None = None
-    name: Annotated[str | None, Field(description="Наименование типа контроля")] = None
-    shortName: Annotated[
-        str | None, Field(description="Краткое наименование типа контроля")
-    ] = None
-    term: Annotated[int | None, Field(description="Срок контроля (кол-во дней)")] = None
-    employee: EmployeeDto | None = None
-    employeeId: Annotated[
-        UUID | None, Field(description="Идентификатор ответственного за контроль")
-    ] = None
-    active: Annotated[
-        bool | None, Field(description="Признак активен ли тип контроля")
-    ] = None
-    createDate: datetime | None = None
-
-
-class CorrespondentDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор адресата/корреспондента")
-    ] = None
-    externalId: Annotated[str | None, Field(description="Внешний идентификатор")] = None
-    name: Annotated[
-        str | None, Field(description="Наименование адресата/корреспондента")
-    ] = None
-    deliveryMethodId: Annotated[
-        int | None, Field(description="Идентификатор способа доставки")
-    ] = None
-    deliveryMethod: DeliveryMethodDto | None = None
-    address: Annotated[str | None, Field(description="Адрес")] = None
-    postfix: Annotated[str | None, Field(description="Постфикс")] = None
-    country: CountryDto | None = None
-    countryId: UUID | None = None
-    cityId: UUID | None = None
-    cityName: str | None = None
-    regionId: UUID | None = None
-    regionName: str | None = None
-    districtId: UUID | None = None
-    districtName: str | None = None
-    code: Annotated[str, Field(description="Код")]
-    stateOrgan: Annotated[
-        bool | None,
-        Field(description="Отметка является ли адресат/корреспондент гос. органом"),
-    ] = None
-    postcode: Annotated[str | None, Field(description="Почтовый индекс")] = None
-    phone: Annotated[str | None, Field(description="Телефон")] = None
-    mail: Annotated[str | None, Field(description="Почта")] = None
-    active: Annotated[
-        bool | None,
-        Field(
-            description="Признак является ли данный адресат/корреспондент действующим или упраздненным"
-        ),
-    ] = None
-    type: Type2 | None = None
-    department: DepartmentDto | None = None
-    departmentId: UUID | None = None
-    setup: GeneralSetupDto | None = None
-    setupId: str | None = None
-    subscriberId: UUID | None = None
-    subscriber: SubscriberDto | None = None
-    employeeIds: Annotated[
-        list[UUID] | None, Field(description="Список сотрудников организации")
-    ] = None
-    createDate: datetime | None = None
-
-
-class DepartmentDto(BaseModel):
-    """
-    Департамент сотрудника
-    """
-
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор департамента/подразделения")
-    ] = None
-    name: Annotated[
-        str | None, Field(description="Наименование департамента/подразделения")
-    ] = None
-    number: Annotated[
-        str | None,
-        Field(description="Номер департамента/подразделения в номенклатуре дел"),
-    ] = None
-    parentDepartmentId: Annotated[
-        UUID | None,
-        Field(description="Идентификатор родительского департамента/подразделения"),
-    ] = None
-    parentDepartment: DepartmentDto | None = None
-    rank: Annotated[str | None, Field(description="Номер по классификатору")] = None
-    departmentCode: Annotated[
-        str | None, Field(description="Код департамента/подразделения")
-    ] = None
-    phone: Annotated[str | None, Field(description="Телефон")] = None
-    email: Annotated[str | None, Field(description="Email")] = None
-    address: Annotated[str | None, Field(description="Адрес")] = None
-    room: Annotated[str | None, Field(description="Площадка")] = None
-    leaderId: Annotated[
-        UUID | None,
-        Field(description="Идентификатор руководителя департамента/подразделения"),
-    ] = None
-    leader: EmployeeDto | None = None
-    employees: Annotated[
-        list[EmployeeDto] | None,
-        Field(
-            description="Список сотрудников департамента/подразделения, поле игнорируется при обновлении записи"
-        ),
-    ] = None
-    deputyLeaders: Annotated[
-        list[DeputyLeaderDepartmentDto] | None,
-        Field(
-            description="Список заместителей руководителя департамента/подразделения"
-        ),
-    ] = None
-    employeeNomenclatures: Annotated[
-        list[DepartmentEmployeeNomenclatureDto] | None,
-        Field(description="Список ответственных по номенклатуре"),
-    ] = None
-    createDate: datetime | None = None
-    order: Annotated[int | None, Field(description="Порядок сортировки")] = None
-    currentUserLeader: bool | None = None
-
-
-class DepartmentEmployeeNomenclatureDto(BaseModel):
-    """
-    Список ответственных по номенклатуре
-    """
-
-    id: UUID | None = None
-    departmentId: UUID | None = None
-    department: DepartmentDto | None = None
-    employeeId: UUID | None = None
-    employee: EmployeeDto | None = None
-
-
-class DeputyLeaderDepartmentDto(BaseModel):
-    """
-    Список заместителей руководителя департамента/подразделения
-    """
-
-    id: UUID | None = None
-    departmentId: UUID | None = None
-    department: DepartmentDto | None = None
-    employeeId: UUID | None = None
-    employee: EmployeeDto | None = None
-
-
-class DestructionActDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор акта уничтожения дел")
-    ] = None
-    organizationId: Annotated[
-        str | None, Field(description="Идентификатор организации")
-    ] = None
-    status: Annotated[Status1 | None, Field(description="Статус акта")] = None
-    storageType: Annotated[
-        StorageType | None, Field(description="Статус дел, выделенных к уничтожению")
-    ] = None
-    methodAssemblyType: Annotated[
-        MethodAssemblyType1 | None, Field(description="Вид дел")
-    ] = None
-    weight: Annotated[
-        float | None, Field(description="Вес бумажных документов в кг")
-    ] = None
-    fondId: Annotated[UUID | None, Field(description="Идентификатор фонда")] = None
-    archiveFund: Annotated[
-        ArchiveFundDto | None, Field(description="Архивный фонд")
-    ] = None
-    date: Annotated[datetime | None, Field(description="Дата акта")] = None
-    number: Annotated[str | None, Field(description="Регистрационный номер акта")] = (
-        None
-    )
-    authorId: Annotated[
-        UUID | None, Field(description="Идентификатор составителя акта")
-    ] = None
-    author: Annotated[EmployeeDto | None, Field(description="Составитель акта")] = None
-    creationDate: Annotated[
-        datetime | None, Field(description="Дата создания акта")
-    ] = None
-    reason: Annotated[
-        str | None, Field(description="Основание (названия и номера нормативных актов)")
-    ] = None
-    description: Annotated[
-        str | None, Field(description="Описание акта уничтожения")
-    ] = None
-    protocolDocumentId: Annotated[
-        UUID | None, Field(description="Идентификатор документа протокола ЦЭК (ЭК)")
-    ] = None
-    protocolDocument: Annotated[Any | None, Field(description="Протокол ЦЭК (ЭК)")] = (
-        None
-    )
-    isDestroyed: Annotated[
-        bool | None, Field(description="Признак уничтожения дел")
-    ] = None
-    destructionDate: Annotated[
-        datetime | None, Field(description="Дата уничтожения дел")
-    ] = None
-    attachment: Annotated[AttachmentDto | None, Field(description="Файл акта")] = None
-    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
-        None
-    )
-    processOrganizationId: Annotated[
-        str | None, Field(description="Идентификатор организации процесса")
-    ] = None
-    year: Annotated[int | None, Field(description="Год акта уничтожения")] = None
-    process: Annotated[
-        DestructionActProcessDto | None,
-        Field(description="Процесс акта уничтожения дел"),
-    ] = None
-    destroyed: bool | None = None
-
-
-class DestructionActProcessDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор процесса")] = None
-    organizationId: Annotated[
-        str | None, Field(description="Идентификатор организации")
-    ] = None
-    currentId: Annotated[
-        UUID | None, Field(description="Идентификатор текущего этапа процесса")
-    ] = None
-    currentOrgId: Annotated[
-        str | None,
-        Field(description="Идентификатор организации текущего этапа процесса"),
-    ] = None
-    current: Annotated[
-        DestructionActProcessItemDto | None, Field(description="Текущий этап процесса")
-    ] = None
-    nextId: Annotated[
-        UUID | None, Field(description="Идентификатор следующего этапа процесса")
-    ] = None
-    nextOrgId: Annotated[
-        str | None,
-        Field(description="Идентификатор организации следующего этапа процесса"),
-    ] = None
-    next: Annotated[
-        DestructionActProcessItemDto | None,
-        Field(description="Следующий этап процесса"),
-    ] = None
-    destructionActId: Annotated[
-        UUID | None, Field(description="Идентификатор акта уничтожения дел")
-    ] = None
-    destructionActOrgId: Annotated[
-        str | None, Field(description="Идентификатор организации акта уничтожения дел")
-    ] = None
-    items: Annotated[
-        list[DestructionActProcessItemDto] | None,
-        Field(description="Список этапов процесса"),
-    ] = None
-    completed: Annotated[
-        bool | None, Field(description="Признак прошел ли документ все этапы")
-    ] = None
-    started: Annotated[
-        bool | None, Field(description="Признак начал ли документ движение по маршруту")
-    ] = None
-    stepCount: Annotated[
-        int | None, Field(description="Количество этапов в процессе")
-    ] = None
-
-
-class DestructionActProcessExecutorDto(BaseModel):
-    id: Annotated[
-        UUID | None,
-        Field(description="Идентификатор исполнителя процесса в акте уничтожения дел"),
-    ] = None
-    organizationId: Annotated[
-        str | None, Field(description="Идентификатор организации")
-    ] = None
-    start: Annotated[datetime | None, Field(description="Дата начала исполнения")] = (
-        None
-    )
-    executionEnd: Annotated[
-        datetime | None, Field(description="Дата окончания исполнения")
-    ] = None
-    end: Annotated[datetime | None, Field(description="Дата окончания исполнения")] = (
-        None
-    )
-    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
-        None
-    )
-    processOrgId: Annotated[
-        str | None, Field(description="Идентификатор организации процесса")
-    ] = None
-    processItemId: Annotated[
-        UUID | None, Field(description="Идентификатор этапа процесса")
-    ] = None
-    processItemOrgId: Annotated[
-        str | None, Field(description="Идентификатор организации этапа процесса")
-    ] = None
-    comment: Annotated[str | None, Field(description="Комментарий")] = None
-    result: Annotated[
-        bool | None, Field(description="Признак результата исполнения")
-    ] = None
-    executor: Annotated[UserInfoDto | None, Field(description="Исполнитель")] = None
-    destructionActId: Annotated[
-        UUID | None, Field(description="Идентификатор акта уничтожения дел")
-    ] = None
-    destructionActOrgId: Annotated[
-        str | None, Field(description="Идентификатор организации акта уничтожения дел")
-    ] = None
-
-
-class DestructionActProcessItemDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор этапа процесса")] = None
-    organizationId: Annotated[
-        str | None, Field(description="Идентификатор организации")
-    ] = None
-    type: Annotated[Type3 | None, Field(description="Тип процесса")] = None
-    order: Annotated[int | None, Field(description="Порядковый номер")] = None
-    startStamp: Annotated[
-        datetime | None, Field(description="Дата начала этапа процесса")
-    ] = None
-    endStamp: Annotated[
-        datetime | None, Field(description="Дата окончания этапа процесса")
-    ] = None
-    completed: Annotated[
-        bool | None, Field(description="Признак был ли завершен этап процесса")
-    ] = None
-    started: Annotated[
-        bool | None,
-        Field(description="Признак был ли начаты действия по этапу процесса"),
-    ] = None
-    oneForAll: Annotated[
-        bool | None, Field(description="Признак один исполнитель для всех дел")
-    ] = None
-    executors: Annotated[
-        list[DestructionActProcessExecutorDto] | None,
-        Field(description="Список исполнителей этапа процесса"),
-    ] = None
-    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
-        None
-    )
-    processOrgId: Annotated[
-        str | None, Field(description="Идентификатор организации процесса")
-    ] = None
-    executorsCount: Annotated[int | None, Field(description="Кол-во исполнителей")] = (
-        None
-    )
-    destructionActId: Annotated[
-        UUID | None, Field(description="Идентификатор акта уничтожения дел")
-    ] = None
-    destructionActOrgId: Annotated[
-        str | None, Field(description="Идентификатор организации акта уничтожения дел")
-    ] = None
-
-
-class DirectoryProcessDefinition(BaseModel):
-    order: Annotated[int, Field(description="Порядковый номер процесса", ge=1)]
-    employees: Annotated[
-        list[DirectoryProcessEmployee] | None,
-        Field(description="Список сотрудников (исполнителей) процесса"),
-    ] = None
-    type: Annotated[
-        Type4, Field(description="Перечисление для описания типов процесса")
-    ]
-    name: Annotated[
-        str, Field(description="Наименование процесса", max_length=254, min_length=0)
-    ]
-    days: Annotated[
-        int | None, Field(description="Количество дней для исполнения процесса")
-    ] = None
-    empActionQueueType: Annotated[
-        EmpActionQueueType | None,
-        Field(description="Тип выполнения действий в процессе, null = ANY"),
-    ] = None
-
-
-class DirectoryProcessEmployee(BaseModel):
-    """
-    Список сотрудников (исполнителей) процесса
-    """
-
-    order: int
-    employee: EmployeeDto
-
-
-class DocumentAppealDto(BaseModel):
-    countryAppealId: Annotated[
-        UUID | None, Field(description="Идентификатор страны заявителя")
-    ] = None
-    countryAppealName: Annotated[
-        str | None, Field(description="Наименование страны заявителя")
-    ] = None
-    receiptDate: Annotated[
-        datetime | None, Field(description="Содержит дату поступления")
-    ] = None
-    declarantType: Annotated[
-        DeclarantType | None,
-        Field(
-            description="Признак, является заявитель физическим или юридическим лицом"
-        ),
-    ] = None
-    citizenTypeId: Annotated[
-        UUID | None, Field(description="Идентификатор вида обращения")
-    ] = None
-    citizenType: CitizenTypeDto | None = None
-    collective: Annotated[
-        bool | None, Field(description="Признак коллективного обращения")
-    ] = None
-    anonymous: Annotated[
-        bool | None, Field(description="Признак анонимного обращения")
-    ] = None
-    fioApplicant: Annotated[
-        str | None, Field(description="Содержит Ф.И.О. заявителя")
-    ] = None
-    cityId: Annotated[UUID | None, Field(description="Идентификатор города")] = None
-    cityName: Annotated[str | None, Field(description="Город")] = None
-    regionId: Annotated[UUID | None, Field(description="Идентификатор области")] = None
-    regionName: Annotated[str | None, Field(description="Область")] = None
-    districtId: Annotated[UUID | None, Field(description="Идентификатор района")] = None
-    districtName: Annotated[str | None, Field(description="Район")] = None
-    index: Annotated[str | None, Field(description="Индекс")] = None
-    fullAddress: Annotated[
-        str | None, Field(description="Содержит улицу, дом, корпус, квартиру")
-    ] = None
-    phone: Annotated[str | None, Field(description="Контактный телефон")] = None
-    email: Annotated[str | None, Field(description="e-mail заявителя")] = None
-    organizationName: Annotated[
-        str | None, Field(description="Содержит наименование организации-заявителя")
-    ] = None
-    signed: Annotated[
-        str | None, Field(description="Содержит Ф.И.О. лица, подписавшего документ")
-    ] = None
-    correspondentOrgNumber: Annotated[
-        str | None,
-        Field(
-            description="Содержит исходящий регистрационный индекс, присвоенный документу организацией-корреспондентом"
-        ),
-    ] = None
-    dateDocCorrespondentOrg: Annotated[
-        datetime | None,
-        Field(
-            description="Содержит дату присвоения организацией-корреспондентом документу исходящего регистрационного номера"
-        ),
-    ] = None
-    subjectId: Annotated[UUID | None, Field(description="Идентификатор тематики")] = (
-        None
-    )
-    subject: SubjectDto | None = None
-    correspondentAppeal: Annotated[
-        str | None,
-        Field(
-            description="Заполняется, если обращение в ГТБ переслала другая организация, куда оно поступило первоначально (адресаты/корреспонденты)"
-        ),
-    ] = None
-    correspondentAppealId: UUID | None = None
-    indexDateCoverLetter: Annotated[
-        str | None, Field(description="Дата и индекс сопроводительного письма")
-    ] = None
-    repeatIdenticalAppeals: Annotated[
-        list[RepeatIdenticalAppealDto] | None,
-        Field(description="Повторные и идентичные обращения"),
-    ] = None
-    reviewProgress: Annotated[str | None, Field(description="Ход рассмотрения")] = None
-    solutionResultId: Annotated[
-        UUID | None, Field(description="Идентификатор результата решения")
-    ] = None
-    solutionResult: SolutionResultDto | None = None
-    nomenclatureAffairId: Annotated[
-        UUID | None, Field(description="Идентификатор результата решения")
-    ] = None
-    nomenclatureAffair: NomenclatureAffairDto | None = None
-    reasonably: bool | None = None
-
-
-class DocumentDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор документа")] = None
-    organizationId: str | None = None
-    docCategoryConstant: DocCategory | None = None
-    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
-    daysExecution: Annotated[
-        int | None, Field(description="Кол-во дней исполнения")
-    ] = None
-    profileName: str | None = None
-    requiredField: Annotated[
-        list[RequiredFieldEnum] | None, Field(description="Список обязательных полей")
-    ] = None
-    author: Annotated[UserInfoDto | None, Field(description="Автор документа")] = None
-    responsibleExecutor: UserInfoDto | None = None
-    status: Annotated[
-        Status2 | None,
-        Field(description="Перечисление для описания статусов документов"),
-    ] = None
-    color: DocumentUserColorDto | None = None
-    prevStatus: Annotated[
-        Status2 | None,
-        Field(description="Перечисление для описания статусов документов"),
-    ] = None
-    regNumber: Annotated[
-        str | None, Field(description="Регистрационный номер документа")
-    ] = None
-    reservedRegNumber: Annotated[
-        str | None,
-        Field(description="Зарезервированный регистрационный номер документа"),
-    ] = None
-    reservedRegDate: Annotated[
-        datetime | None,
-        Field(description="Дата резервирования регистрационного номера документа"),
-    ] = None
-    regDate: Annotated[
-        datetime | None, Field(description="Дата регистрации документа")
-    ] = None
-    dspFlag: Annotated[
-        bool | None,
-        Field(description="Признак документа с грифом ДСП. По умолчанию признак снят."),
-    ] = None
-    pages: Annotated[int | None, Field(description="Кол-во страниц документа")] = None
-    exemplarNumber: Annotated[int | None, Field(description="Номер экземпляра")] = None
-    shortSummary: Annotated[
-        str | None,
-        Field(
-            description="Краткое содержание, может выбираться из справочника кратких содержаний"
-        ),
-    ] = None
-    summary: Annotated[str | None, Field(description="Текст документа")] = None
-    correspondentName: Annotated[
-        str | None, Field(description="Наименование корреспондента")
-    ] = None
-    recipients: Annotated[
-        bool | None, Field(description="Есть ли в документе адресаты")
-    ] = None
-    profileId: Annotated[
-        UUID | None, Field(description="Идентификатор профиля документа")
-    ] = None
-    documentVersionId: Annotated[
-        UUID | None, Field(description="Идентификатор версии документа")
-    ] = None
-    controlFlag: Annotated[
-        bool | None, Field(description="Признак стоит ли документ на контроле")
-    ] = None
-    removeControl: Annotated[
-        bool | None, Field(description="Метка снятия с контроля")
-    ] = None
-    journalId: Annotated[
-        UUID | None, Field(description="Идентификатор журнала регистрации")
-    ] = None
-    documentType: Annotated[
-        DocumentTypeDto | None, Field(description="Вид документа")
-    ] = None
-    documentTypeId: Annotated[
-        int | None, Field(description="Идентификатор вида документа")
-    ] = None
-    refDocId: UUID | None = None
-    refDocOrgId: str | None = None
-    versionFlag: bool | None = None
-    formula: Annotated[list[str] | None, Field(description="Формула рег. номера")] = (
-        None
-    )
-    taskList: Annotated[list[TaskDto] | None, Field(description="Список поручений")] = (
-        None
-    )
-    deliveryMethod: Annotated[
-        DeliveryMethodDto | None, Field(description="Способ получения документа")
-    ] = None
-    deliveryMethodId: int | None = None
-    correspondentId: Annotated[
-        UUID | None, Field(description="Идентификатор корреспондент")
-    ] = None
-    outRegNumber: Annotated[
-        str | None, Field(description="Исходящий регистрационный номер")
-    ] = None
-    outRegDate: Annotated[
-        datetime | None, Field(description="Исходящая дата регистрации документа")
-    ] = None
-    additionalPages: Annotated[
-        str | None, Field(description="Кол-во листов приложений к документу")
-    ] = None
-    exemplarCount: Annotated[
-        int | None, Field(description="Кол-во экземлпяров документа")
-    ] = None
-    investProgramId: Annotated[
-        UUID | None, Field(description="Ид инвест программы")
-    ] = None
-    investmentProgram: Annotated[
-        InvestmentProgramDto | None, Field(description="Инвест программа")
-    ] = None
-    receivedDocId: Annotated[
-        UUID | None,
-        Field(
-            description="Идентификатор документа который получен в ответ на другой документ"
-        ),
-    ] = None
-    answerDocId: Annotated[
-        UUID | None,
-        Field(description="Идентификатор документа создан в ответ на другой документ"),
-    ] = None
-    receivedAsAnswerByDoc: Annotated[
-        DocumentDto | None,
-        Field(description="Документ который получен в ответ на другой документ"),
-    ] = None
-    createAsAnswerByDoc: Annotated[
-        DocumentDto | None,
-        Field(description="Документ который создан в ответ на другой документ"),
-    ] = None
-    version: Annotated[
-        DocumentVersionDto | None, Field(description="Версия документа")
-    ] = None
-    process: Annotated[
-        DocumentProcessDto | None, Field(description="Процесс документа")
-    ] = None
-    processId: UUID | None = None
-    attachmentDocument: Annotated[
-        list[AttachmentDocumentDto] | None,
-        Field(description="Список вложений к документу"),
-    ] = None
-    correspondent: Annotated[
-        DocumentRecipientDtoModel | None, Field(description="Корреспондент")
-    ] = None
-    recipientList: Annotated[
-        list[DocumentRecipientDtoModel] | None, Field(description="Список адресатов")
-    ] = None
-    control: Annotated[ControlDto | None, Field(description="Контроль")] = None
-    createType: Annotated[
-        CreateType | None,
-        Field(description="Перечисление для описания типов как создан документ"),
-    ] = None
-    dateMeeting: Annotated[
-        datetime | None, Field(description="Дата проведения совещания")
-    ] = None
-    dateMeetingQuestion: Annotated[
-        datetime | None, Field(description="Дата проведения заседания")
-    ] = None
-    startMeeting: Annotated[
-        datetime | None, Field(description="Время начала совещания")
-    ] = None
-    endMeeting: Annotated[
-        datetime | None, Field(description="Время начала совещания")
-    ] = None
-    placeMeeting: Annotated[
-        str | None, Field(description="Место проведения совещания")
-    ] = None
-    chairperson: Annotated[UserInfoDto | None, Field(description="Председатель")] = None
-    secretary: Annotated[UserInfoDto | None, Field(description="Секретарь")] = None
-    externalInvitees: Annotated[
-        str | None, Field(description="Внешние приглашенные")
-    ] = None
-    inviteesCount: Annotated[
-        int | None, Field(description="Количество внутренних приглашенных")
-    ] = None
-    addition: Annotated[
-        bool | None, Field(description="Признак дополнения к повестке вопросов")
-    ] = None
-    additionMeetingQuestionId: Annotated[
-        UUID | None,
-        Field(
-            description="Идентификатор документа дополнительного заседания по вопросам"
-        ),
-    ] = None
-    additionMeetingQuestion: Annotated[
-        DocumentDto | None,
-        Field(description="Документ дополнительного заседания по вопросам"),
-    ] = None
-    formMeetingType: Annotated[
-        FormMeetingType | None, Field(description="Форма проведения заседания")
-    ] = None
-    numberQuestion: Annotated[
-        int | None,
-        Field(
-            description="Содержит информацию о порядковом номере вопроса в повестке дня"
-        ),
-    ] = None
-    documentQuestions: Annotated[
-        list[DocumentQuestionDto] | None, Field(description="Список вопросов")
-    ] = None
-    hasQuestion: Annotated[
-        bool | None, Field(description="Отметка о наличии вопросов в повестке")
-    ] = None
-    documentMeetingQuestionId: Annotated[
-        UUID | None, Field(description="Идентификатор документа заседание по вопросам")
-    ] = None
-    documentMeetingQuestionOrgId: Annotated[
-        str | None,
-        Field(description="Идентификатор организации документа заседание по вопросам"),
-    ] = None
-    documentMeetingQuestion: Annotated[
-        DocumentDto | None, Field(description="Документ заседание по вопросам")
-    ] = None
-    whoAddressed: Annotated[
-        list[MiniUserInfoDto] | None, Field(description="Лист 'Кто подписал'")
-    ] = None
-    writeOffAffairCount: int | None = None
-    preAffairCount: int | None = None
-    inDocSigners: str | None = None
-    countryName: str | None = None
-    countryId: UUID | None = None
-    introduction: list[IntroductionDto] | None = None
-    introductionCount: int | None = None
-    introductionCompleteCount: int | None = None
-    autoControl: AutoControl | None = None
-    skipRegistration: bool | None = None
-    documentAppeal: DocumentAppealDto | None = None
-    responsibleExecutors: Annotated[
-        list[DocumentResponsibleExecutorDto] | None,
-        Field(description="Список ответственных за подготовку материалов"),
-    ] = None
-    hasResponsibleExecutor: Annotated[
-        bool | None,
-        Field(description="Присутствие ответственных за подготовку материалов"),
-    ] = None
-    responsibleExecutorsCount: Annotated[
-        int | None,
-        Field(description="количество ответственных за подготовку материалов"),
-    ] = None
-    documentLinksCount: Annotated[
-        int | None, Field(description="Кол-во связей документа")
-    ] = None
-    dateQuestion: Annotated[
-        datetime | None,
-        Field(description="Дата проведения заседания для документа по вопросу"),
-    ] = None
-    commentQuestion: Annotated[
-        str | None, Field(description="Комментарии для руководителя")
-    ] = None
-    initiator: UserInfoDto | None = None
-    preNomenclatureAffairs: Annotated[
-        list[DocumentPreNomenclatureDto] | None,
-        Field(description="Список предварительных номенклатур"),
-    ] = None
-    registrationJournal: RegistrationJournalDto | None = None
-    whoSigned: Annotated[
-        UserInfoDto | None,
-        Field(description="Кем подписан (для внутреннего и исходя-щего документа)"),
-    ] = None
-    meetingQuestionNotifyCount: int | None = None
-    userProps: DocumentUserPropsDto | None = None
-    note: str | None = None
-    enableAccessGrief: Annotated[
-        bool | None, Field(description="Включение грифа доступа")
-    ] = None
-    accessGriefId: Annotated[
-        UUID | None, Field(description="Идентификатор грифа доступа")
-    ] = None
-    accessGrief: Annotated[AccessGriefDto | None, Field(description="Гриф доступа")] = (
-        None
-    )
-    autoRouting: bool | None = None
-    contractSum: float | None = None
-    contractDurationStart: datetime | None = None
-    currency: CurrencyDto | None = None
-    currencyId: UUID | None = None
-    contractSigningDate: datetime | None = None
-    contractStartDate: datetime | None = None
-    contractDurationEnd: datetime | None = None
-    contractAgreement: bool | None = None
-    contractAutoProlongation: bool | None = None
-    contractTypical: bool | None = None
-    contractNumber: str | None = None
-    contractDate: datetime | None = None
-    countTask: int | None = None
-    taskProjectCount: int | None = None
-    completedTaskCount: int | None = None
-    documentInventoryData: DocumentInventoryDataDto | None = None
-    currentBpmnTaskName: str | None = None
-    documentFormDefinition: DocumentFormDefinitionDto | None = None
-    customFields: Annotated[
-        dict[str, Any] | None, Field(description="Пользовательские поля документа")
-    ] = None
-    additionalDocuments: list[AdditionalDocumentDto] | None = None
-    documentFormId: UUID | None = None
-    journalNumber: Annotated[
-        int | None,
-        Field(description="Номер журнала регистрации при регистрации документа"),
-    ] = None
-
-
-class DocumentFolderDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор документа в папке")] = (
-        None
-    )
-    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
-        None
-    )
-    document: Annotated[DocumentDto | None, Field(description="Документ")] = None
-    employeeId: Annotated[
-        UUID | None,
-        Field(description="Идентификатор сотрудника который добавил документ в папку"),
-    ] = None
-    employee: Annotated[
-        EmployeeDto | None,
-        Field(description="Сотрудник который добавил документ в папку"),
-    ] = None
-    folderId: Annotated[UUID | None, Field(description="Идентификатор папки")] = None
-    folder: Annotated[FolderDto | None, Field(description="Папка")] = None
-
-
-class DocumentInventoryDataDto(BaseModel):
-    id: UUID | None = None
-    miniDocument: MiniDocumentDto | None = None
-    innerInventoryId: UUID | None = None
-    dataDispatch: PackageEoResponse | None = None
-    createDate: datetime | None = None
-    docHash: str | None = None
-    numEDinArch: int | None = None
-    idPackage: UUID | None = None
-    countFile: int | None = None
-    status: JobStatus | None = None
-    dispatchJobInfo: JobInfo | None = None
-
-
-class DocumentPreNomenclatureDto(BaseModel):
-    id: Annotated[
-        UUID | None,
-        Field(description="Идентификатор документа который лежит в номенклатуре дел"),
-    ] = None
-    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
-        None
-    )
-    document: Annotated[Any | None, Field(description="Документ")] = None
-    nomenclatureAffairId: Annotated[
-        UUID | None, Field(description="Идентификатор номенклатуры дел")
-    ] = None
-    nomenclatureAffair: Annotated[
-        NomenclatureAffairDto | None, Field(description="Номенклатура дел")
-    ] = None
-    writeOff: Annotated[
-        bool | None, Field(description="Метка списания документа в номенклатуру дела")
-    ] = None
-    deleted: bool | None = None
-
-
-class DocumentProcessDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор процесса")] = None
-    currentId: Annotated[
-        UUID | None, Field(description="Идентификатор текущего этапа процесса")
-    ] = None
-    current: Annotated[
-        DocumentProcessItemDto | None, Field(description="Текущий этап процесса")
-    ] = None
-    nextId: Annotated[
-        UUID | None, Field(description="Идентификатор следующего этапа процесса")
-    ] = None
-    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
-        None
-    )
-    items: Annotated[
-        list[DocumentProcessItemDto] | None, Field(description="Список этапов процесса")
-    ] = None
-    completed: Annotated[
-        bool | None, Field(description="Признак прошел ли документ все этапы")
-    ] = None
-    started: Annotated[
-        bool | None, Field(description="Признак начал ли документ движение по маршруту")
-    ] = None
-
-
-class DocumentProcessExecutorDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор исполнителя процесса в документе")
-    ] = None
-    start: Annotated[datetime | None, Field(description="Дата начала исполнения")] = (
-        None
-    )
-    executionEnd: Annotated[
-        datetime | None, Field(description="Дата окончания исполнения")
-    ] = None
-    end: Annotated[datetime | None, Field(description="Дата окончания исполнения")] = (
-        None
-    )
-    documentProcessItemId: Annotated[
-        UUID | None, Field(description="Идентификатор этапа процесса")
-    ] = None
-    comment: Annotated[str | None, Field(description="Комментарий")] = None
-    result: Annotated[
-        bool | None, Field(description="Признак результата исполнения")
-    ] = None
-    executor: Annotated[UserInfoDto | None, Field(description="Исполнитель")] = None
-    order: Annotated[
-        int | None, Field(description="Позиция исполнителя в процессе")
-    ] = None
-
-
-class DocumentProcessItemDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор этапа процесса")] = None
-    type: Annotated[
-        Type4 | None, Field(description="Перечисление для описания типов процесса")
-    ] = None
-    order: Annotated[int | None, Field(description="Порядковый номер")] = None
-    name: Annotated[str | None, Field(description="Наименование")] = None
-    days: Annotated[int | None, Field(description="Количество дней исполнения")] = None
-    start: Annotated[
-        datetime | None, Field(description="Дата начала этапа процесса")
-    ] = None
-    end: Annotated[
-        datetime | None, Field(description="Дата окончания этапа процесса")
-    ] = None
-    fileSign: bool | None = None
-    completed: Annotated[
-        bool | None, Field(description="Признак был ли завершен этап процесса")
-    ] = None
-    started: Annotated[
-        bool | None,
-        Field(description="Признак был ли начаты действия по этапу процесса"),
-    ] = None
-    executors: Annotated[
-        list[DocumentProcessExecutorDto] | None,
-        Field(description="Список исполнителей этапа процесса"),
-    ] = None
-    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
-        None
-    )
-    nextExecutorId: Annotated[
-        UUID | None, Field(description="ИД следующего исполнителя")
-    ] = None
-    actionQueueType: Annotated[
-        ActionQueueType | None, Field(description="Тип исполнения процесса")
-    ] = None
-    taskDefinitionKey: Annotated[
-        str | None, Field(description="ИД таски из дефинишена")
-    ] = None
-    documentId: UUID | None = None
-
-
-class DocumentProfileDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор профиля документа")] = (
-        None
-    )
-    organizationId: str | None = None
-    name: Annotated[str | None, Field(description="Наименование профиля документа")] = (
-        None
-    )
-    formula: Annotated[list[str] | None, Field(description="Формула рег. номера")] = (
-        None
-    )
-    autoCreateIncomingDoc: Annotated[
-        bool | None,
-        Field(
-            description="Признак того что этот профиль будет использоваться для создания документов прищедших по АИСМВ"
-        ),
-    ] = None
-    active: Annotated[
-        bool | None, Field(description="Признак активен ли профиль документа")
-    ] = None
-    documentTypeId: Annotated[
-        int | None, Field(description="Идентификатор вида документа")
-    ] = None
-    deploymentId: str | None = None
-    journalId: Annotated[
-        UUID | None, Field(description="Идентификатор журнала регистрации")
-    ] = None
-    registrationJournal: RegistrationJournalDto | None = None
-    documentType: DocumentTypeDto | None = None
-    documentCategory: Annotated[
-        DocumentCategory | None, Field(description="Тип документа")
-    ] = None
-    docAuthorId: Annotated[
-        UUID | None, Field(description="Идентификатор автора документа")
-    ] = None
-    docAuthor: EmployeeDto | None = None
-    correspondentId: Annotated[
-        UUID | None, Field(description="Идентификатор корреспондента")
-    ] = None
-    correspondent: CorrespondentDto | None = None
-    daysExecution: Annotated[
-        int | None, Field(description="Кол-во дней исполнения")
-    ] = None
-    autoRegistration: bool | None = None
-    autoRouting: Annotated[
-        bool | None, Field(description="Автоматическое движение по маршруту")
-    ] = None
-    autoControl: Annotated[
-        bool | None,
-        Field(description="Автоматически ставить на контроль после регистрации"),
-    ] = None
-    controlDays: Annotated[int | None, Field(description="Кол-во дней контроля")] = None
-    controlType: ControlTypeDto | None = None
-    controlTypeId: UUID | None = None
-    processDirectoryId: UUID | None = None
-    processDirectory: BpmnProcessDirectoryDto | None = None
-    xml: str | None = None
-    processDefinition: list[DirectoryProcessDefinition] | None = None
-    retryPrefix: Annotated[
-        str | None, Field(description="Префикс повторных обращений")
-    ] = None
-    retryPostfix: Annotated[
-        str | None, Field(description="Постфикс повторных обращений")
-    ] = None
-    identicalPrefix: Annotated[
-        str | None, Field(description="Префикс идентичных обращений")
-    ] = None
-    identicalPostfix: Annotated[
-        str | None, Field(description="Постфикс идентичных обращений")
-    ] = None
-    repetitionCounterInitial: Annotated[
-        int | None, Field(description="Начальное значение счетчика повторности")
-    ] = None
-    identityCounterInitial: Annotated[
-        int | None, Field(description="Начальное значение счетчика идентичности")
-    ] = None
-    anonymousSuffix: Annotated[
-        str | None, Field(description="Суффикс анонимного обращения")
-    ] = None
-    collectiveSuffix: Annotated[
-        str | None, Field(description="Суффикс коллективного обращения")
-    ] = None
-    requiredField: Annotated[
-        list[RequiredFieldEnum1] | None, Field(description="обязательные поля")
-    ] = None
-    access: Annotated[bool | None, Field(description="Включить списки доступа")] = None
-    createDate: datetime | None = None
-    appealOrganizationJournalId: UUID | None = None
-    appealOrganizationJournalOrgId: str | None = None
-    appealOrganizationJournal: RegistrationJournalDto | None = None
-    accessGriefId: Annotated[
-        UUID | None, Field(description="Идентификатор грифа доступа")
-    ] = None
-    accessGrief: AccessGriefDto | None = None
-    enableAccessGrief: Annotated[
-        bool | None, Field(description="Включить использование грифа доступа")
-    ] = None
-    contractTypical: Annotated[
-        bool | None, Field(description="Признак типовой ли контракт")
-    ] = None
-    documentFormId: Annotated[
-        UUID | None, Field(description="Идентификатор формы документа")
-    ] = None
-    documentForm: DocumentFormDto | None = None
-
-
-class DocumentQuestionDto(BaseModel):
-    id: UUID | None = None
-    questionNumber: Annotated[int | None, Field(description="Номер вопроса")] = None
-    question: Annotated[str | None, Field(description="Формулировка вопроса")] = None
-    documentId: UUID | None = None
-    documentOrgId: str | None = None
-    document: Any | None = None
-    documentMeetingQuestionId: Annotated[
-        UUID | None, Field(description="Идентификатор документа заседания")
-    ] = None
-    documentMeetingQuestionOrgId: Annotated[
-        str | None, Field(description="Идентификатор организации документа заседания")
-    ] = None
-    documentMeetingQuestion: Any | None = None
-    speakers: Annotated[
-        list[SpeakerDto] | None, Field(description="Список докладчиков")
-    ] = None
-
-
-class DocumentRecipientDtoModel(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор адресата документа")
-    ] = None
-    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
-        None
-    )
-    name: Annotated[str | None, Field(description="Наименование адресата")] = None
-    status: Status4 | None = None
-    from_: Annotated[EmployeeDto | None, Field(alias="from")] = None
-    fromId: Annotated[UUID | None, Field(description="ИД отправителя")] = None
-    dateSend: Annotated[datetime | None, Field(description="Дата отправки")] = None
-    toPeople: Annotated[str | None, Field(description="Кому отправить")] = None
-    delivered: Annotated[bool | None, Field(description="Признак доставки")] = None
-    system: Annotated[
-        bool | None, Field(description="Признак отправлено ли системой")
-    ] = None
-    subscriberId: Annotated[
-        UUID | None, Field(description="Идентификатор адресата СМДО")
-    ] = None
-    deliveryMethodId: Annotated[
-        int | None, Field(description="Идентификатор способа доставки")
-    ] = None
-    deliveryMethod: DeliveryMethodDto | None = None
-    correspondent: CorrespondentDto | None = None
-    subscriber: SubscriberDto | None = None
-    correspondentId: UUID | None = None
-    type: Type2 | None = None
-    lock: bool | None = None
-    aismvPackageType: AismvPackageType | None = None
-    aismvCurrentDeliveryId: UUID | None = None
-    aismvRouterAccept: bool | None = None
-    aismvAbonentAccept: bool | None = None
-    aismvRouterError: bool | None = None
-    aismvAbobentAcceptAck: bool | None = None
-    aismvAbonentAcceptError: bool | None = None
-    aismvAbonentRegAck: bool | None = None
-    aismbAbonentRegReject: bool | None = None
-    unp: str | None = None
-    signDate: datetime | None = None
-    contractNumber: str | None = None
-
-
-class DocumentResponsibleExecutorDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор исполнителя процесса в документе")
-    ] = None
-    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
-        None
-    )
-    document: Annotated[Any | None, Field(description="Документ")] = None
-    executor: Annotated[UserInfoDto | None, Field(description="Исполнитель")] = None
-
-
-class EmployeeDto(BaseModel):
-    """
-    Автор документов для аис мв
-    """
-
-    id: Annotated[UUID | None, Field(description="Идентификатор сотрудника")] = None
-    getuId: Annotated[
-        str | None, Field(description="Идентификатор аккаунта сотрудника")
-    ] = None
-    personalNumber: Annotated[
-        str | None, Field(description="Персональный номер сотрудника")
-    ] = None
-    firstName: Annotated[str | None, Field(description="Имя сотрудника")] = None
-    lastName: Annotated[str | None, Field(description="Фамилия сотрудника")] = None
-    middleName: Annotated[str | None, Field(description="Отчество сотрудника")] = None
-    fired: Annotated[bool | None, Field(description="Признак уволен ли сотрудник")] = (
-        None
-    )
-    active: Annotated[
-        bool | None, Field(description="Признак активен ли сотрудник")
-    ] = None
-    fullPostName: Annotated[str | None, Field(description="ФИО сотрудника")] = None
-    postId: Annotated[int | None, Field(description="Идентификатор должности")] = None
-    post: PostDto | None = None
-    departmentId: Annotated[
-        UUID | None,
-        Field(description="Идентификатор департамента в котором работает сотрудник"),
-    ] = None
-    department: DepartmentDto | None = None
-    org: OrgDto | None = None
-    address: Annotated[str | None, Field(description="Адрес")] = None
-    place: Annotated[str | None, Field(description="Площадка")] = None
-    url: Annotated[str | None, Field(description="URL")] = None
-    email: Annotated[str | None, Field(description="E-mail")] = None
-    phone: Annotated[str | None, Field(description="Телефон")] = None
-    ldapName: Annotated[str | None, Field(description="LDAP Имя")] = None
-    io: Annotated[bool | None, Field(description="Я вляется ИО")] = None
-    haveIo: Annotated[bool | None, Field(description="Присутствуют ИО")] = None
-    notify: Annotated[
-        bool | None, Field(description="Уведомлять ли сотрудника сообщениями на почту")
-    ] = None
-    createDate: datetime | None = None
-    lastManualAvatarUploadDate: Annotated[
-        datetime | None, Field(description="Дата последней ручной загрузки аватара")
-    ] = None
-    createType: CreateType1 | None = None
-    sid: str | None = None
-    currentUserLeader: bool | None = None
-    blockedFields: list[BlockedField] | None = None
-    order: Annotated[int | None, Field(description="Порядок сортировки")] = None
-    organizationId: str | None = None
-
-
-class FolderDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор папки")] = None
-    parentId: Annotated[
-        UUID | None, Field(description="Идентификатор родительской папки")
-    ] = None
-    parentFolder: Any | None = None
-    name: Annotated[str | None, Field(description="Наименование папки")] = None
-    documentFolders: Annotated[
-        list[DocumentFolderDto] | None, Field(description="Список документов в папке")
-    ] = None
-    folderCount: Annotated[
-        int | None, Field(description="Количество папок в папке")
-    ] = None
-    docCount: Annotated[
-        int | None, Field(description="Количество документов в папке")
-    ] = None
-    path: Annotated[
-        list | None, Field(description="Путь от текущей папки к родительской")
-    ] = None
-
-
-class GeneralSetupDto(BaseModel):
-    organizationId: Annotated[
-        str | None,
-        Field(description="Идентификатор организации общей настройки документа СЭД"),
-    ] = None
-    organizationName: Annotated[
-        str | None,
-        Field(description="Наименование организации общей настройки документа СЭД"),
-    ] = None
-    countryId: Annotated[UUID | None, Field(description="Идентификатор страны")] = None
-    country: CountryDto | None = None
-    profileId: Annotated[
-        UUID | None, Field(description="Идентификатор профиля документа")
-    ] = None
-    profile: DocumentProfileDto | None = None
-    aismvProfileId: Annotated[
-        UUID | None, Field(description="Профиль для входящих документов аис мв")
-    ] = None
-    aismvProfile: DocumentProfileDto | None = None
-    employeeId: Annotated[
-        UUID | None,
-        Field(
-            description="Идентификатор автора для автоматически создаваемых входящих документов"
-        ),
-    ] = None
-    employee: EmployeeDto | None = None
-    aismvAuthorEmployeeId: Annotated[
-        UUID | None, Field(description="Автор документов для аис мв")
-    ] = None
-    aismvAuthor: EmployeeDto | None = None
-    groupId: Annotated[
-        UUID | None, Field(description="Идентификатор группы пользователей")
-    ] = None
-    group: GroupDto | None = None
-    subscriber: SubscriberDto | None = None
-    subscriberId: UUID | None = None
-    classDoc: Annotated[
-        str | None,
-        Field(
-            description="Унифицированный код из окрб 010-95 таблица 1 (https://minjust.gov.by/upload/iblock/d97/OKRB.pdf)"
-        ),
-    ] = None
-    objectType: Annotated[
-        str | None,
-        Field(
-            description="Вид по таблицы 2 окб (https://minjust.gov.by/upload/iblock/d97/OKRB.pdf)"
-        ),
-    ] = None
-    aismvAppealProfileId: UUID | None = None
-    aismvAppealProfile: DocumentProfileDto | None = None
-    disableSignedFilEdit: Annotated[
-        bool | None, Field(description="Отключение редактирования подписанных файлов")
-    ] = None
-    enableRemoveDraftDocs: bool | None = None
-    daysToKeepDraftDocs: int | None = None
-    executionDateRoundPolicy: ExecutionDateRoundPolicy | None = None
-    defaultProcessDateRoundPolicy: ExecutionDateRoundPolicy | None = None
-    workDayStart: Annotated[
-        str | None, Field(description="Продолжительность рабочего дня")
-    ] = None
-    workDayEnd: str | None = None
-    signAttachment: Attachment | None = None
-
-
-class InnerInventoryDataDto(BaseModel):
-    id: UUID | None = None
-    countDoc: int | None = None
-    countFile: int | None = None
-    countVolumeDoc: int | None = None
-    dataDispatch: InnerInventoryResponse | None = None
-    status: JobStatus | None = None
-    conversionEndDate: datetime | None = None
-    dispatchEndDate: datetime | None = None
-    idPackage: UUID | None = None
-    createDate: datetime | None = None
-    acceptanceId: UUID | None = None
-    acceptanceInventoryData: AcceptanceInventoryDataDto | None = None
-    indexInInventory: str | None = None
-    storeAttribute: StoreAttribute | None = None
-    documentInventories: list[DocumentInventoryDataDto] | None = None
-    nomenclatureAffair: Any | None = None
-    dataConversion: InnerInventoryRequest | None = None
-    signature: Signature | None = None
-    calendarYear: int | None = None
-
-
-class IntroductionDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор листа ознакомления")
-    ] = None
-    createDate: Annotated[
-        datetime | None, Field(description="Дата создания ознакомления")
-    ] = None
-    author: Annotated[
-        UserInfoDto | None, Field(description="Автор создания ознакомления")
-    ] = None
-    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
-        None
-    )
-    introductionDate: Annotated[
-        datetime | None, Field(description="Дата ознакомления")
-    ] = None
-    introductionStamp: Annotated[
-        UserInfoDto | None,
-        Field(description="Сотрудник который проставил отметку об ознакомлении"),
-    ] = None
-    comment: Annotated[
-        str | None, Field(description="Комментарий при постановке на ознакомление")
-    ] = None
-
-
-class MiniDocumentDto(BaseModel):
-    """
-    DTO для мини-документа
-    """
-
-    id: Annotated[UUID | None, Field(description="Идентификатор мини-документа")] = None
-    regNumber: Annotated[str | None, Field(description="Регистрационный номер")] = None
-    regDate: Annotated[datetime | None, Field(description="Дата регистрации")] = None
-    docCategoryConstant: Annotated[
-        DocumentCategory | None, Field(description="Тип документа")
-    ] = None
-    shortSummary: Annotated[str | None, Field(description="Краткое содержание")] = None
-    documentLanguageId: Annotated[
-        UUID | None, Field(description="Идентификатор языка документа")
-    ] = None
-    documentLanguage: Annotated[
-        DocumentLanguageDto | None, Field(description="Язык документа")
-    ] = None
-    pagesCount: Annotated[int | None, Field(description="Количество страниц")] = None
-    startPage: Annotated[int | None, Field(description="Начальная страница")] = None
-    endPage: Annotated[int | None, Field(description="Конечная страница")] = None
-    documentSize: Annotated[int | None, Field(description="Размер документа")] = None
-    author: UserInfoDto | None = None
-    docCreateDate: Annotated[
-        datetime | None, Field(description="Дата создания основного документа")
-    ] = None
-    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
-    modifyDate: Annotated[datetime | None, Field(description="Дата изменения")] = None
-    documentId: Annotated[
-        UUID | None, Field(description="Идентификатор основного документа")
-    ] = None
-    document: Annotated[Any | None, Field(description="Основной документ")] = None
-    attachments: Annotated[
-        list[MiniDocumentAttachmentDto] | None, Field(description="Вложения")
-    ] = None
-    nomenclatureAffair: Annotated[
-        Any | None, Field(description="Номенклатурное дело")
-    ] = None
-    nomenclatureAffairId: Annotated[
-        UUID | None, Field(description="Идентификатор номенклатурного дела")
-    ] = None
-    documentInventory: Annotated[Any | None, Field(description="Опись документа")] = (
-        None
-    )
-    objectType: Annotated[
-        str | None,
-        Field(
-            description="Вид документа (Унифицированный код из окрб 010-95 таблица 1)"
-        ),
-    ] = None
-    sourceApproveTs: Annotated[
-        datetime | None, Field(description="Дата подписания или утверждения документа")
-    ] = None
-    signs: Annotated[
-        list[AttachmentSignature] | None, Field(description="Список ЭЦП вложения")
-    ] = None
-    numberPagesPerVolume: Annotated[
-        int | None, Field(description="Числовое значение номера тома (части дела)")
-    ] = None
-    hashED: Annotated[
-        str | None, Field(description="контрольная характеристика файлов документа")
-    ] = None
-    journalNumber: Annotated[
-        int | None,
-        Field(description="Номер журнала регистрации при регистрации документа"),
-    ] = None
-    regDateWithoutTime: Annotated[
-        date | None, Field(description="Дата регистрации без времени")
-    ] = None
-    deleted: Annotated[
-        bool | None,
-        Field(description="Удалено на статусе архивное и должно отображаться в списке"),
-    ] = None
-    attachmentCount: Annotated[int | None, Field(description="Количество вложений")] = (
-        None
-    )
-
-
-class NomenclatureAffairDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор номенклатуры дел")] = (
-        None
-    )
-    externalId: Annotated[str | None, Field(description="Внешний идентификатор")] = None
-    status: Annotated[Status6 | None, Field(description="Статус дела")] = None
-    createType: Annotated[CreateType2 | None, Field(description="Тип создания")] = None
-    calendarYear: Annotated[int | None, Field(description="Календарный год")] = None
-    transitionalAffair: Annotated[
-        bool | None, Field(description="Признак,является ли дело переходящим")
-    ] = None
-    collectingStart: Annotated[
-        datetime | None, Field(description="Дата начала комплектования")
-    ] = None
-    collectingEnd: Annotated[
-        datetime | None, Field(description="Дата окончания комплектования")
-    ] = None
-    personnel: Annotated[
-        bool | None,
-        Field(description="Признак, является ли дело делом по личному составу"),
-    ] = None
-    active: Annotated[
-        bool | None, Field(description="Признак активна ли номенклатура дел")
-    ] = None
-    departmentId: Annotated[
-        UUID | None, Field(description="Идентификатор департамента")
-    ] = None
-    department: Annotated[DepartmentDto | None, Field(description="Департамент")] = None
-    name: Annotated[str | None, Field(description="Наименование номенклатуры дел")] = (
-        None
-    )
-    index: Annotated[str | None, Field(description="Индекс номенклатуры дел")] = None
-    storagePeriodId: Annotated[
-        UUID | None, Field(description="Идентификатор срока хранения")
-    ] = None
-    period: Annotated[StoragePeriodDto | None, Field(description="Срок хранения")] = (
-        None
-    )
-    articleNumber: Annotated[
-        str | None,
-        Field(description="Номер статьи - Хранит информацию о номере статье в Перечне"),
-    ] = None
-    storagePlace: Annotated[
-        str | None,
-        Field(description="Место хранения - Хранит информацию о месте хранения дела"),
-    ] = None
-    note: Annotated[
-        str | None,
-        Field(description="Примечание - хранит произвольный текст с примечанием"),
-    ] = None
-    attachment: Annotated[AttachmentDto | None, Field(description="Файл отчета")] = None
-    departmentPath: Annotated[
-        list[NomenclatureDepartmentPath] | None,
-        Field(description="Цепочка подразделений"),
-    ] = None
-    writeOff: Annotated[
-        bool | None, Field(description="метка списания документа в дело")
-    ] = None
-    docCounter: Annotated[int | None, Field(description="Кол-во доков в деле")] = None
-    innerInventoryData: InnerInventoryDataDto | None = None
-    expirationDate: Annotated[
-        int | None, Field(description="Дата окончания хранения")
-    ] = None
-    methodAssemblyType: Annotated[
-        MethodAssemblyType2 | None, Field(description="Способ комплектования дела")
-    ] = None
-    expertiseType: Annotated[
-        ExpertiseType | None, Field(description="Признак экспертизы дела")
-    ] = None
-    expertise: Annotated[
-        bool,
-        Field(description="Признак, показывающий, что дело находится на экспертизе"),
-    ]
-    documentClassesId: UUID | None = None
-    documentClasses: UnifiedDocumentationSystemDto | None = None
-    countSheets: Annotated[
-        int | None, Field(description="Количество листов в деле")
-    ] = None
-    numberPagesPerVolume: Annotated[
-        int | None, Field(description="Числовое значение номера тома (части дела)")
-    ] = None
-    caseFileCover: Annotated[
-        AttachmentDto | None, Field(description="Файл Обложки дела")
-    ] = None
-    certificationSheet: Annotated[
-        AttachmentDto | None, Field(description="лист заверитель")
-    ] = None
-    acceptanceInventoryId: Annotated[
-        UUID | None, Field(description="Идентификатор СП")
-    ] = None
-    acceptanceInventory: Annotated[
-        AcceptanceInventoryDataDto | None, Field(description="СП")
-    ] = None
-    hasInner: Annotated[
-        bool | None, Field(description="Включено в внутреннюю опись НЦЭУ")
-    ] = None
-    hasInnerArchive: Annotated[
-        bool | None, Field(description="Включено в внутреннюю опись архив СЭД")
-    ] = None
-    archiveDate: Annotated[
-        datetime | None, Field(description="Дата поступления дела в архив ")
-    ] = None
-    whoAccepted: Annotated[
-        UserInfoDto | None,
-        Field(description="Ф.И.О и должность Архивиста, который принял дело по описи"),
-    ] = None
-    fundId: Annotated[UUID | None, Field(description="Идентификатор фонда")] = None
-    fund: Annotated[ArchiveFundDto | None, Field(description="Фонд")] = None
-    shelvingShelveId: Annotated[
-        UUID | None, Field(description="Идентификатор полки/стелажи")
-    ] = None
-    shelvingShelve: Annotated[
-        NomenclatureShelvingShelveDto | None, Field(description="Полки/стелажи")
-    ] = None
-    information: str | None = None
-    caseFileCoverId: UUID | None = None
-    certificationSheetId: UUID | None = None
-    destructionActs: list[DestructionActDto] | None = None
-    documentSize: Annotated[
-        int | None, Field(description="Объем документов в деле")
-    ] = None
-    hashED: Annotated[
-        str | None, Field(description="контрольная характеристика файлов документов")
-    ] = None
-    signs: Annotated[
-        list[AttachmentSignature] | None, Field(description="Список ЭЦП вложения")
-    ] = None
-    completed: Annotated[
-        bool | None, Field(description="Метка о присвоении статуса COMPLETED")
-    ] = None
-
-
-class NomenclatureDepartmentPath(BaseModel):
-    order: int | None = None
-    department: DepartmentDto | None = None
-
-
-class OrgDto(BaseModel):
-    """
-    Организация сотрудника
-    """
-
-    id: Annotated[str | None, Field(description="Идентификатор организации")] = None
-    name: Annotated[str | None, Field(description="Наименование организации")] = None
-    currentCount: Annotated[
-        int | None, Field(description="Текущее кол-во активных учетных записей в СЭД")
-    ] = None
-    maxCount: Annotated[
-        int | None, Field(description="Максимально кол-во активных учетных записей")
-    ] = None
-    active: Annotated[
-        bool | None, Field(description="Признак активена ли организация")
-    ] = None
-    employees: Annotated[
-        list[EmployeeDto] | None, Field(description="Список сотрудников организации")
-    ] = None
-
-
-class SpeakerDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор докладчика")] = None
-    questionId: Annotated[UUID | None, Field(description="Идентификатор вопроса")] = (
-        None
-    )
-    question: Annotated[Any | None, Field(description="Вопрос")] = None
-    employee: Annotated[UserInfoDto | None, Field(description="Докладчик")] = None
-    type: Type11
-
-
-class TaskChangeDateRequestDto(BaseModel):
-    id: UUID | None = None
-    executed: Annotated[bool | None, Field(description="Была ли расмотрена заявка")] = (
-        None
-    )
-    result: Annotated[bool | None, Field(description="Результат рассмотрения")] = None
-    taskId: UUID | None = None
-    date: Annotated[datetime | None, Field(description="Запрашиваемая дата")] = None
-    dateCreate: Annotated[
-        datetime | None, Field(description="Дата создания заявки")
-    ] = None
-    text: Annotated[str | None, Field(description="Пречина переноса")] = None
-    currentExecutionDate: Annotated[
-        datetime | None, Field(description="Текущая дата исполнения")
-    ] = None
-    author: UserInfoDto | None = None
-
-
-class TaskDocumentLinkDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор документа исполнения")
-    ] = None
-    executorId: Annotated[
-        UUID | None,
-        Field(description="Идентификатор исполнителя поручения в документе"),
-    ] = None
-    taskExecutor: Annotated[Any | None, Field(description="Исполнитель поручения")] = (
-        None
-    )
-    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
-        None
-    )
-    executionDocuments: Annotated[
-        DocumentDto | None, Field(description="Документ исполнения")
-    ] = None
-    deleted: bool | None = None
-
-
-class TaskDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор поручения")] = None
-    externalId: str | None = None
-    type: Annotated[Type12 | None, Field(description="Тип поручения")] = None
-    organizationId: str | None = None
-    parentId: Annotated[
-        UUID | None, Field(description="Идентификатор родительского поручения")
-    ] = None
-    documentRegDate: datetime | None = None
-    taskNumber: Annotated[str | None, Field(description="Номер поручения")] = None
-    createDate: Annotated[
-        datetime | None, Field(description="Дата создания поручения")
-    ] = None
-    taskStatus: TaskStatus | None = None
-    author: Annotated[UserInfoDto | None, Field(description="Автор поручения")] = None
-    taskExecutors: Annotated[
-        list[TaskExecutorsDto] | None,
-        Field(description="Список исполнителей поручения"),
-    ] = None
-    planedDateEnd: Annotated[
-        datetime | None, Field(description="Запланированная дата окончания поручения")
-    ] = None
-    realDateEnd: Annotated[
-        datetime | None, Field(description="Реальная дата окончания поручения")
-    ] = None
-    taskChangeDateRequests: Annotated[
-        list[TaskChangeDateRequestDto] | None,
-        Field(description="Список изменений переносов даты исполнения"),
-    ] = None
-    taskText: Annotated[str | None, Field(description="Текст поручения")] = None
-    onControl: Annotated[
-        bool | None, Field(description="Признак стоит ли поручение на контроле")
-    ] = None
-    removeControl: Annotated[
-        bool | None, Field(description="Метка снятия с контроля")
-    ] = None
-    control: Annotated[ControlDto | None, Field(description="Контроль поручения")] = (
-        None
-    )
-    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
-        None
-    )
-    document: Annotated[DocumentDto | None, Field(description="Документ")] = None
-    revision: Annotated[
-        bool | None, Field(description="Признак стоит ли поручение на доработке")
-    ] = None
-    countExec: Annotated[int | None, Field(description="Количество исполнителей")] = (
-        None
-    )
-    documentRegNum: Annotated[str | None, Field(description="Рег номер документа")] = (
-        None
-    )
-    periodTaskParentNumber: str | None = None
-    parentTaskNumber: str | None = None
-    countCompletedExec: Annotated[
-        int | None, Field(description="Количество исполнителей которые исполнели")
-    ] = None
-    dateRequestCount: int | None = None
-    executedDateRequestCount: int | None = None
-    endless: Annotated[bool | None, Field(description="Бес срока исполнения")] = None
-    periodTask: bool | None = None
-    periodTaskCount: int | None = None
-    period: Period | None = None
-    periodTaskParentId: UUID | None = None
-    periodTaskParentOrgId: str | None = None
-    firstExecution: datetime | None = None
-
-
-class TaskExecutorsDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор исполнителя поручения")
-    ] = None
-    taskId: Annotated[UUID | None, Field(description="Идентификатор поручения")] = None
-    task: Annotated[Any | None, Field(description="Поручение")] = None
-    createDate: Annotated[datetime | None, Field(description="Дата назначения")] = None
-    executedDate: Annotated[datetime | None, Field(description="Дата исполнения")] = (
-        None
-    )
-    executor: Annotated[
-        UserInfoDto | None, Field(description="Исполнитель поручения")
-    ] = None
-    taskDocumentLinks: Annotated[
-        list[TaskDocumentLinkDto] | None,
-        Field(description="Список документов исполнения"),
-    ] = None
-    attachments: Annotated[
-        list[AttachmentTaskDto] | None,
-        Field(description="Список вложений прикрепленных к поручению"),
-    ] = None
-    responsible: Annotated[
-        bool | None, Field(description="Ответственный исполнитель")
-    ] = None
-    executedByExecuteForAll: Annotated[
-        bool | None, Field(description="Исполнен методом выполнения за всех")
-    ] = None
-    executedForAll: Annotated[bool | None, Field(description="Исполнил за всех")] = None
-    revision: Annotated[bool | None, Field(description="Отправлено на доработку")] = (
-        None
-    )
-    parentTaskId: Annotated[
-        UUID | None, Field(description="ИД родительского поручения")
-    ] = None
-    stampText: Annotated[
-        str | None, Field(description="Текст исполнения поручения")
-    ] = None
-    linkCount: Annotated[
-        int | None, Field(description="Кол-во ссылок на документы")
-    ] = None
-    executionDocCount: Annotated[
-        int | None, Field(description="Кол-во загруженных файлов")
-    ] = None
-    childTaskCount: int | None = None
-
-
-class UserInfoDto(BaseModel):
-    firstName: Annotated[str | None, Field(description="Имя сотрудника")] = None
-    lastName: Annotated[str | None, Field(description="Фамилия сотрудника")] = None
-    middleName: Annotated[str | None, Field(description="Отчество сотрудника")] = None
-    authorPost: Annotated[
-        str | None, Field(description="Наименование должность сотрудника")
-    ] = None
-    authorDepartmentName: Annotated[
-        str | None, Field(description="Наименование департамента сотрудника")
-    ] = None
-    authorDepartment: Annotated[
-        DepartmentDto | None, Field(description="Департамент сотрудника")
-    ] = None
-    authorDepartmentId: Annotated[
-        UUID | None, Field(description="Идентификатор департамента сотрудника")
-    ] = None
-    employee: Annotated[EmployeeDto | None, Field(description="Сотрудник")] = None
-    employeeId: Annotated[UUID | None, Field(description="Идентификатор сотрудник")] = (
-        None
-    )
-
-
-class SummaryNomenclatureDepartmentIntroductionDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор листа ознакомления")
-    ] = None
-    createDate: Annotated[
-        datetime | None, Field(description="Дата создания ознакомления")
-    ] = None
-    author: Annotated[
-        UserInfoDto | None, Field(description="Автор создания ознакомления")
-    ] = None
-    summaryNomenclatureDepartmentId: Annotated[
-        UUID | None, Field(description="Идентификатор сводной номенклатуры")
-    ] = None
-    introductionDate: Annotated[
-        datetime | None, Field(description="Дата ознакомления")
-    ] = None
-    introductionStamp: Annotated[
-        UserInfoDto | None,
-        Field(description="Сотрудник который проставил отметку об ознакомлении"),
-    ] = None
-    comment: Annotated[
-        str | None, Field(description="Комментарий при постановке на ознакомление")
-    ] = None
-
-
-class SummaryNomenclatureDepartmentDto(BaseModel):
-    """
-    DTO для сущности 'Карточка сводной номенклатуры'
-    """
-
-    id: Annotated[UUID | None, Field(description="Идентификатор")] = None
-    organizationId: Annotated[
-        str | None, Field(description="Идентификатор организации")
-    ] = None
-    createDate: Annotated[
-        datetime | None, Field(description="Дата создания/регистрации документа")
-    ] = None
-    authorId: Annotated[UUID, Field(description="Идентификатор автора")]
-    author: Annotated[EmployeeDto | None, Field(description="Информация об авторе")] = (
-        None
-    )
-    status: Annotated[Status7 | None, Field(description="Статус")] = None
-    year: Annotated[int, Field(description="Год номенклатуры")]
-    size: Annotated[int | None, Field(description="Количество записей")] = None
-    nomenclatureType: Annotated[
-        NomenclatureType | None, Field(description="Тип номенклатуры")
-    ] = None
-    registrationNumber: Annotated[
-        str | None, Field(description="Регистрационный номер сводной номенклатуры")
-    ] = None
-    regDate: Annotated[datetime | None, Field(description="Дата регистрации")] = None
-    description: Annotated[
-        str | None,
-        Field(description="Основание (нормативные акты, определяющие сроки хранения)"),
-    ] = None
-    created: Annotated[bool | None, Field(description="Признак создания дел")] = None
-    process: Annotated[
-        SummaryNomenclatureDepartmentProcessDto | None,
-        Field(description="Процесс сводной номенклатуры"),
-    ] = None
-    processId: UUID | None = None
-    attachment: AttachmentDto | None = None
-
-
-class SummaryNomenclatureDepartmentProcessDto(BaseModel):
-    """
-    DTO для процесса сводной номенклатуры
-    """
-
-    id: Annotated[UUID | None, Field(description="Идентификатор процесса")] = None
-    organizationId: Annotated[
-        str | None, Field(description="Идентификатор организации")
-    ] = None
-    currentId: Annotated[
-        UUID | None, Field(description="Идентификатор текущего этапа процесса")
-    ] = None
-    nextId: Annotated[
-        UUID | None, Field(description="Идентификатор следующего этапа процесса")
-    ] = None
-    completed: Annotated[
-        bool | None, Field(description="Признак прошел ли документ все этапы")
-    ] = None
-    started: Annotated[
-        bool | None, Field(description="Признак начал ли документ движение по маршруту")
-    ] = None
-    stepCount: Annotated[
-        int | None, Field(description="Количество этапов в процессе")
-    ] = None
-    items: list[SummaryNomenclatureDepartmentProcessItemDto] | None = None
-
-
-class SummaryNomenclatureDepartmentProcessExecutorDto(BaseModel):
-    """
-    DTO для исполнителя процесса сводной номенклатуры
-    """
-
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор исполнителя процесса")
-    ] = None
-    organizationId: Annotated[
-        str | None, Field(description="Идентификатор организации")
-    ] = None
-    itemId: Annotated[
-        UUID | None, Field(description="Идентификатор элемента процесса")
-    ] = None
-    itemOrgId: Annotated[
-        str | None, Field(description="Идентификатор организации элемента процесса")
-    ] = None
-    employeeId: Annotated[
-        UUID | None, Field(description="Идентификатор сотрудника")
-    ] = None
-    employeeOrgId: Annotated[
-        str | None, Field(description="Идентификатор организации сотрудника")
-    ] = None
-    employee: Annotated[
-        EmployeeDto | None, Field(description="Информация о сотруднике")
-    ] = None
-    comment: str | None = None
-    result: bool | None = None
-
-
-class SummaryNomenclatureDepartmentProcessItemDto(BaseModel):
-    """
-    DTO для элемента процесса сводной номенклатуры
-    """
-
-    id: Annotated[UUID | None, Field(description="Идентификатор элемента процесса")] = (
-        None
-    )
-    organizationId: Annotated[
-        str | None, Field(description="Идентификатор организации")
-    ] = None
-    type: Annotated[Type13 | None, Field(description="Тип этапа процесса")] = None
-    orderNumber: Annotated[int | None, Field(description="Порядковый номер этапа")] = (
-        None
-    )
-    completed: Annotated[bool | None, Field(description="Признак завершения этапа")] = (
-        None
-    )
-    completedDate: Annotated[
-        datetime | None, Field(description="Дата завершения этапа")
-    ] = None
-    comment: Annotated[str | None, Field(description="Комментарий")] = None
-    oneForAll: Annotated[bool | None, Field(description="Признак 'один за всех'")] = (
-        None
-    )
-    executorsCount: int | None = None
-    started: bool | None = None
-    executors: list[SummaryNomenclatureDepartmentProcessExecutorDto] | None = None
-
-
-class SummaryInventoryReportDto(BaseModel):
-    id: UUID | None = None
-    number: Annotated[str | None, Field(description="Номер описи")] = None
-    fundId: UUID | None = None
-    fund: ArchiveFundDto | None = None
-    archiveYear: Annotated[
-        int | None, Field(description="Год поступления дела в архив")
-    ] = None
-    groupByStoragePeriod: Annotated[
-        GroupByStoragePeriod1 | None, Field(description="Категория хранения")
-    ] = None
-    personnel: Annotated[bool | None, Field(description="Метка по личному составу")] = (
-        None
-    )
-    methodAssemblyType: Annotated[
-        MethodAssemblyType2 | None, Field(description="Способ комплектования дела")
-    ] = None
-    attachment: Annotated[
-        AttachmentDto | None, Field(description="Вложение 'Сводная опись дел'")
-    ] = None
-    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
-    author: UserInfoDto | None = None
-
-
-class RouterDirectoryDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор справочника маршрутов")
-    ] = None
-    active: Annotated[
-        bool, Field(description="Признак активен ли справочник маршрутов")
-    ]
-    name: Annotated[
-        str, Field(description="Наименование справочника маршрутов", min_length=1)
-    ]
-    docCategory: DocCategory
-    processDefinition: Annotated[
-        list[DirectoryProcessDefinition],
-        Field(description="Список этапов маршрута", max_items=2147483647, min_items=1),
-    ]
-    createDate: datetime | None = None
-
-
-class NomenclatureDepartmentDto(BaseModel):
-    id: UUID | None = None
-    indexPrefix: str | None = None
-    author: UserInfoDto | None = None
-    status: Status8 | None = None
-    departmentPath: list[NomenclatureDepartmentPath] | None = None
-    departmentId: UUID | None = None
-    department: DepartmentDto | None = None
-    calendarYear: int | None = None
-    data: list[NomenclatureDepartmentEntryDto] | None = None
-    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
-        None
-    )
-    process: NomenclatureDepartmentProcessDto | None = None
-    currentUserLeader: bool | None = None
-    countData: int | None = None
-    createDate: datetime | None = None
-    affairsCreated: Annotated[
-        bool | None, Field(description="Признак созданных дел")
-    ] = None
-
-
-class NomenclatureDepartmentProcessExecutorDto(BaseModel):
-    id: Annotated[
-        UUID | None,
-        Field(
-            description="Идентификатор исполнителя процесса в номенклатуре дел подразделения"
-        ),
-    ] = None
-    start: Annotated[datetime | None, Field(description="Дата начала исполнения")] = (
-        None
-    )
-    executionEnd: Annotated[
-        datetime | None, Field(description="Дата окончания исполнения")
-    ] = None
-    end: Annotated[datetime | None, Field(description="Дата окончания исполнения")] = (
-        None
-    )
-    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
-        None
-    )
-    processItemId: Annotated[
-        UUID | None, Field(description="Идентификатор этапа процесса")
-    ] = None
-    item: Annotated[
-        NomenclatureDepartmentProcessItemDto | None, Field(description="Этап процесса")
-    ] = None
-    comment: Annotated[str | None, Field(description="Комментарий")] = None
-    result: Annotated[
-        bool | None, Field(description="Признак результата исполнения")
-    ] = None
-    executor: Annotated[UserInfoDto | None, Field(description="Исполнитель")] = None
-    nomenclatureDepartmentId: Annotated[
-        UUID | None, Field(description="Идентификатор номенклатуры дел подразделения")
-    ] = None
-    nomenclatureDepartment: Annotated[
-        NomenclatureDepartmentDto | None,
-        Field(description="Номенклатура дел подразделения"),
-    ] = None
-
-
-class NomenclatureDepartmentProcessItemDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор этапа процесса")] = None
-    type: Annotated[Type19 | None, Field(description="Тип этапа процесса")] = None
-    order: Annotated[int | None, Field(description="Порядковый номер")] = None
-    startStamp: Annotated[
-        datetime | None, Field(description="Дата начала этапа процесса")
-    ] = None
-    endStamp: Annotated[
-        datetime | None, Field(description="Дата окончания этапа процесса")
-    ] = None
-    completed: Annotated[
-        bool | None, Field(description="Признак был ли завершен этап процесса")
-    ] = None
-    started: Annotated[
-        bool | None,
-        Field(description="Признак был ли начаты действия по этапу процесса"),
-    ] = None
-    oneForAll: Annotated[
-        bool | None, Field(description="Признак исполнения за всех")
-    ] = None
-    executors: Annotated[
-        list[NomenclatureDepartmentProcessExecutorDto] | None,
-        Field(description="Список исполнителей этапа процесса"),
-    ] = None
-    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
-        None
-    )
-    process: Annotated[
-        NomenclatureDepartmentProcessDto | None, Field(description="Процесс документа")
-    ] = None
-    executorsCount: Annotated[int | None, Field(description="Кол-во исполнителей")] = (
-        None
-    )
-    nomenclatureDepartmentId: Annotated[
-        UUID | None, Field(description="Идентификатор номенклатуры дел подразделения")
-    ] = None
-    nomenclatureDepartment: Annotated[
-        NomenclatureDepartmentDto | None,
-        Field(description="Номенклатура дел подразделения"),
-    ] = None
-
-
-class MiniDocumentAccessDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор доступа мини документа")
-    ] = None
-    miniDocumentId: Annotated[
-        UUID | None, Field(description="Идентификатор мини документа")
-    ] = None
-    miniDocumentOrgId: Annotated[
-        str | None, Field(description="Идентификатор организации мини документа")
-    ] = None
-    employeeId: Annotated[
-        UUID | None, Field(description="Идентификатор сотрудника")
-    ] = None
-    employee: Annotated[
-        EmployeeDto | None, Field(description="Сотрудник для доступа")
-    ] = None
-    authorId: Annotated[UUID | None, Field(description="Идентификатор автора")] = None
-    author: Annotated[EmployeeDto | None, Field(description="Автор")] = None
-    accessBy: Annotated[datetime | None, Field(description="Доступ на дата по")] = None
-    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
-
-
-class MigrationSetupDto(BaseModel):
-    organizationId: Annotated[
-        str | None,
-        Field(description="Идентификатор организации настройки миграции СЭД"),
-    ] = None
-    internProfileId: Annotated[
-        UUID | None, Field(description="Идентификатор профиля внутреннего документа")
-    ] = None
-    internProfile: Annotated[
-        DocumentProfileDto | None, Field(description="Профиль внутреннего документа")
-    ] = None
-    incomingProfileId: Annotated[
-        UUID | None, Field(description="Идентификатор профиля входящего документа")
-    ] = None
-    incomingProfile: Annotated[
-        DocumentProfileDto | None, Field(description="Профиль входящего документа")
-    ] = None
-    outgoingProfileId: Annotated[
-        UUID | None, Field(description="Идентификатор профиля исходящего документа")
-    ] = None
-    outgoingProfile: Annotated[
-        DocumentProfileDto | None, Field(description="Профиль исходящего документа")
-    ] = None
-    appealProfileId: Annotated[
-        UUID | None, Field(description="Идентификатор профиля документа обращения")
-    ] = None
-    appealProfile: Annotated[
-        DocumentProfileDto | None, Field(description="Профиль документа обращения")
-    ] = None
-    citizenTypeId: Annotated[
-        UUID | None, Field(description="Идентификатор вида обращения")
-    ] = None
-    citizenType: Annotated[
-        CitizenTypeDto | None, Field(description="Вид обращения")
-    ] = None
-    appealEmployeeId: Annotated[
-        UUID | None, Field(description="Идентификатор автора для документа обращения")
-    ] = None
-    appealEmployee: Annotated[
-        EmployeeDto | None, Field(description="Автор для документа обращения")
-    ] = None
-    documentRecipientDeliveryMethodId: Annotated[
-        int | None, Field(description="Идентификатор способа доставки для адресатов")
-    ] = None
-    documentRecipientDeliveryMethod: Annotated[
-        DeliveryMethodDto | None, Field(description="Способ доставки для адресатов")
-    ] = None
-    documentDeliveryMethodId: Annotated[
-        int | None, Field(description="Идентификатор способа доставки для документов")
-    ] = None
-    documentDeliveryMethod: Annotated[
-        DeliveryMethodDto | None, Field(description="Способ доставки для документов")
-    ] = None
-    correspondentDeliveryMethodId: Annotated[
-        int | None,
-        Field(
-            description="Идентификатор способа доставки для справочника адресатов/корреспондентов"
-        ),
-    ] = None
-    correspondentDeliveryMethod: Annotated[
-        DeliveryMethodDto | None,
-        Field(description="Способ доставки для справочника адресатов/корреспондентов"),
-    ] = None
-    employeeDepartmentId: Annotated[
-        UUID | None,
-        Field(
-            description="Идентификатор департамента для пользователя (будет выбран при создании нового пользователя)"
-        ),
-    ] = None
-    employeeDepartment: Annotated[
-        DepartmentDto | None,
-        Field(
-            description="Департамент для пользователя (будет выбран при создании нового пользователя)"
-        ),
-    ] = None
-    nomenclatureAffairDepartmentId: Annotated[
-        UUID | None,
-        Field(description="Идентификатор департамента для номенклатуры дел"),
-    ] = None
-    nomenclatureAffairDepartment: Annotated[
-        DepartmentDto | None, Field(description="Департамент для номенклатуры дел")
-    ] = None
-    storagePeriodId: Annotated[
-        UUID | None,
-        Field(description="Идентификатор срока хранения для номенклатуры дел"),
-    ] = None
-    storagePeriod: Annotated[
-        StoragePeriodDto | None, Field(description="Срок хранения для номенклатуры дел")
-    ] = None
-    defaultEmployeeId: Annotated[
-        UUID | None, Field(description="Идентификатор пользователя по умолчания")
-    ] = None
-    defaultEmployee: Annotated[
-        EmployeeDto | None, Field(description="Пользователь по умолчанию")
-    ] = None
-
-
-class DocumentNomenclatureDto(BaseModel):
-    id: Annotated[
-        UUID | None,
-        Field(description="Идентификатор документа который лежит в номенклатуре дел"),
-    ] = None
-    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
-        None
-    )
-    document: Annotated[DocumentDto | None, Field(description="Документ")] = None
-    nomenclatureAffairId: Annotated[
-        UUID | None, Field(description="Идентификатор номенклатуры дел")
-    ] = None
-    nomenclatureAffair: Annotated[
-        NomenclatureAffairDto | None, Field(description="Номенклатура дел")
-    ] = None
-    documentInventoryId: UUID | None = None
-    documentInventory: DocumentInventoryDataDto | None = None
-
-
-class ControlRequest(BaseModel):
-    controlTypeId: Annotated[UUID, Field(description="Идентификатор типа контроля")]
-    controlTypeOrgId: str | None = None
-    controlType: ControlTypeDto | None = None
-    controlDateStart: Annotated[datetime, Field(description="Дата начала контроля")]
-    controlPlanDateEnd: Annotated[
-        datetime, Field(description="Планируемая дата окончания контроля")
-    ]
-    controlTermDays: Annotated[
-        int,
-        Field(
-            description="Срок контроля в днях, изначально копируется из типа контроля"
-        ),
-    ]
-    controlEmployeeId: Annotated[UUID, Field(description="Идентификатор контролера")]
-
-
-class TaskProjectExecutorDto(BaseModel):
-    id: UUID | None = None
-    organizationId: str | None = None
-    documentId: UUID | None = None
-    documentOrgId: str | None = None
-    taskProjectId: UUID | None = None
-    taskProjectOrgId: str | None = None
-    createDate: datetime | None = None
-    responsible: bool | None = None
-    executor: UserInfoDto | None = None
-
-
-class ContractControlPointAttachmentDto(BaseModel):
-    id: UUID | None = None
-    attachment: AttachmentDto | None = None
-    contractControlPointId: UUID | None = None
-    contractControlPoint: Annotated[
-        ContractControlPointDto | None,
-        Field(description="Контрольная точка исполнения договора"),
-    ] = None
-    createDate: datetime | None = None
-
-
-class ContractControlPointDto(BaseModel):
-    id: Annotated[
-        UUID | None,
-        Field(description="Идентификатор контрольной точки исполнения договора"),
-    ] = None
-    sequence: Annotated[
-        int | None, Field(description="Порядковый номер контрольной точки")
-    ] = None
-    number: Annotated[str | None, Field(description="Номер контрольной точки")] = None
-    status: Annotated[
-        Status9 | None,
-        Field(description="Статус контрольной точки исполнения договора"),
-    ] = None
-    description: Annotated[
-        str | None, Field(description="Описание контрольной точки исполнения договора")
-    ] = None
-    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
-    deadline: Annotated[
-        datetime | None, Field(description="Дата окончания работ на этапе")
-    ] = None
-    responsibleEmployees: list[ContractControlPointResponsibleDto] | None = None
-    responsibleContractor: Annotated[
-        str | None, Field(description="Ответственный со стороны Контрагента")
-    ] = None
-    executionContract: DocumentDto | None = None
-    executionDate: Annotated[datetime | None, Field(description="Дата исполнения")] = (
-        None
-    )
-    documentId: Annotated[
-        UUID | None, Field(description="Идентификатор исполнительного договора")
-    ] = None
-    comment: Annotated[
-        str | None,
-        Field(description="Комментарий к исполнению контрольной точки договора"),
-    ] = None
-    attachments: Annotated[
-        list[ContractControlPointAttachmentDto] | None,
-        Field(description="Вложения контрольной точки исполнения договора"),
-    ] = None
-    documentLinks: Annotated[
-        list[ContractControlPointLinkDto] | None,
-        Field(description="Ссылки на документы контрольной точки исполнения договора"),
-    ] = None
-
-
-class ContractControlPointLinkDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор ссылки")] = None
-    contractControlPointId: Annotated[
-        UUID | None,
-        Field(description="Идентификатор контрольной точки исполнения договора"),
-    ] = None
-    docLinkId: Annotated[
-        UUID | None,
-        Field(
-            description="Идентификатор документа на который ссылается контрольная точка исполнения договора"
-        ),
-    ] = None
-    docLink: Annotated[
-        DocumentDto | None,
-        Field(
-            description="Документ на который ссылается контрольная точка исполнения договора"
-        ),
-    ] = None
-    type: Annotated[Type22 | None, Field(description="Тип ссылки")] = None
-
-
-class ContractControlPointResponsibleDto(BaseModel):
-    id: Annotated[
-        UUID | None,
-        Field(
-            description="Идентификатор ответственного организации за контрольную точку исполнения договора"
-        ),
-    ] = None
-    contractControlPointId: Annotated[
-        UUID | None,
-        Field(description="Идентификатор контрольной точки исполнения договора"),
-    ] = None
-    contractControlPointOrgId: str | None = None
-    user: UserInfoDto | None = None
-    completed: bool | None = None
-    createDate: datetime | None = None
-
-
-class AdditionalAgreementDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор дополнительного согласования")
-    ] = None
-    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
-    initiator: Annotated[UserInfoDto | None, Field(description="Инициатор")] = None
-    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
-        None
-    )
-    document: Annotated[DocumentDto | None, Field(description="Документ")] = None
-    agreedDate: Annotated[
-        datetime | None, Field(description="Дата доп. согласования")
-    ] = None
-    agreedStampAuthor: Annotated[
-        UserInfoDto | None,
-        Field(description="Сотрудник который проставил отметку об согласовании"),
-    ] = None
-    cause: Annotated[str | None, Field(description="Причина отклонения")] = None
-    result: Annotated[bool | None, Field(description="Статус")] = None
-
-
-class CorrespondentRequest(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор адресата/корреспондента")
-    ] = None
-    name: Annotated[
-        str | None, Field(description="Наименование адресата/корреспондента")
-    ] = None
-    code: Annotated[str, Field(description="Код")]
-    postfix: Annotated[str | None, Field(description="Постфикс")] = None
-    countryId: Annotated[UUID | None, Field(description="Идентификатор страны")] = None
-    country: Annotated[CountryDto | None, Field(description="Страна")] = None
-    regionId: Annotated[UUID | None, Field(description="Идентификатор области")] = None
-    districtId: Annotated[UUID | None, Field(description="Идентификатор района")] = None
-    cityId: Annotated[UUID | None, Field(description="Идентификатор города")] = None
-    address: Annotated[str | None, Field(description="Адрес")] = None
-    postcode: Annotated[str | None, Field(description="Почтовый индекс")] = None
-    mail: Annotated[str | None, Field(description="Почта")] = None
-    phone: Annotated[str | None, Field(description="Телефон")] = None
-    deliveryMethodId: Annotated[
-        int | None, Field(description="Идентификатор способа доставки")
-    ] = None
-    type: Annotated[Type23 | None, Field(description="Тип организации")] = None
-    setupId: Annotated[
-        str | None,
-        Field(description="Идентификатор организации общей настройки документа СЭД"),
-    ] = None
-    setup: Annotated[
-        GeneralSetupDto | None, Field(description="Общий настроечный документ СЭД")
-    ] = None
-    active: Annotated[
-        bool | None,
-        Field(
-            description="Признак является ли данный адресат/корреспондент действующим или упраздненным"
-        ),
-    ] = None
-    stateOrgan: Annotated[
-        bool | None,
-        Field(description="Отметка является ли адресат/корреспондент гос. органом"),
-    ] = None
-    cityName: str | None = None
-    regionName: str | None = None
-    districtName: str | None = None
-
-
-class CorrespondentUpdateRequest(BaseModel):
-    correspondent: CorrespondentRequest
-    contactFaces: list[ContactFaceRequest] | None = None
-    contactFaceDelete: list[UUID] | None = None
-
-
-class ControlTypeRequest(BaseModel):
-    id: Annotated[UUID, Field(description="Идентификатор типа контроля")]
-    employeeId: Annotated[
-        UUID | None, Field(description="Идентификатор сотрудника")
-    ] = None
-    employee: EmployeeDto | None = None
-    name: Annotated[str, Field(description="Наименование типа контроля")]
-    shortName: Annotated[str, Field(description="Краткое наименование типа контроля")]
-    term: Annotated[int, Field(description="Срок контроля (кол-во дней)")]
-    active: Annotated[bool, Field(description="Признак активен ли тип контроля")]
-
-
-class ControlType(BaseModel):
-    id: UUID | None = None
-    name: Annotated[str, Field(max_length=255, min_length=0)]
-    shortName: Annotated[str, Field(max_length=255, min_length=0)]
-    term: Annotated[int | None, Field(ge=0)] = None
-    employeeId: UUID | None = None
-    employeeOrgId: str | None = None
-    employee: Employee | None = None
-    active: bool
-    createDate: datetime | None = None
-
-
-class Department(BaseModel):
-    id: UUID | None = None
-    name: Annotated[str, Field(max_length=255, min_length=0)]
-    number: str | None = None
-    parentDepartmentId: UUID | None = None
-    parentDepartmentOrgId: str | None = None
-    parentDepartment: Department | None = None
-    rank: str | None = None
-    departmentCode: str | None = None
-    phone: str | None = None
-    email: str | None = None
-    address: str | None = None
-    room: str | None = None
-    leaderId: UUID | None = None
-    leaderOrgId: str | None = None
-    leader: Employee | None = None
-    deputyLeaders: list[DeputyLeaderDepartment] | None = None
-    createDate: datetime | None = None
-    order: Annotated[int, Field(ge=0)]
-    responsibleLinkNomenclatures: list[DepartmentEmployeeNomenclature] | None = None
-
-
-class Employee(BaseModel):
-    id: UUID | None = None
-    externalId: str | None = None
-    getuId: str | None = None
-    personalNumber: str | None = None
-    firstName: Annotated[str, Field(min_length=1)]
-    lastName: Annotated[str, Field(min_length=1)]
-    middleName: str | None = None
-    fired: bool
-    active: bool
-    fullPostName: str | None = None
-    postId: int | None = None
-    post: Post | None = None
-    departmentId: UUID
-    departmentOrgId: str
-    org: Org | None = None
-    department: Department | None = None
-    meIo: list[EmployeeIo] | None = None
-    groups: list[GroupEmployee] | None = None
-    employeeRoles: list[RoleEmployee] | None = None
-    address: Annotated[str | None, Field(max_length=255, min_length=0)] = None
-    place: Annotated[str | None, Field(max_length=255, min_length=0)] = None
-    url: Annotated[str | None, Field(max_length=255, min_length=0)] = None
-    email: Annotated[str | None, Field(max_length=255, min_length=0)] = None
-    phone: Annotated[str | None, Field(max_length=255, min_length=0)] = None
-    ldapName: Annotated[str | None, Field(max_length=255, min_length=0)] = None
-    io: bool | None = None
-    haveIo: bool | None = None
-    createType: CreateType1 | None = None
-    sid: str | None = None
-    createDate: datetime | None = None
-    avatarId: int | None = None
-    smallAvatarId: int | None = None
-    facsimileId: int | None = None
-    lastManualAvatarUploadDate: datetime | None = None
-    order: Annotated[int, Field(ge=0)]
-    organization: Organization | None = None
-    responsibleLinkNomenclatures: list[DepartmentEmployeeNomenclature] | None = None
-
-
-class EmployeeIo(BaseModel):
-    id: UUID | None = None
-    system: bool
-    createDate: datetime
-    revocationDate: datetime | None = None
-    transferDocs: bool
-    targetId: UUID
-    target: Employee | None = None
-    ioId: UUID
-    io: Employee | None = None
-    type: Type24
-
-
-class Group(BaseModel):
-    id: UUID | None = None
-    organizationId: str | None = None
-    type: Type7
-    mixed: bool | None = None
-    name: Annotated[str | None, Field(max_length=255, min_length=1)] = None
-    roles: list[GroupRole] | None = None
-    employees: list[GroupEmployee] | None = None
-    createDate: datetime | None = None
-
-
-class GroupEmployee(BaseModel):
-    id: int | None = None
-    employeeId: UUID | None = None
-    employee: Employee | None = None
-    group: Group | None = None
-    groupId: UUID | None = None
-    groupOrgId: str | None = None
-
-
-class GroupRole(BaseModel):
-    id: UUID | None = None
-    role: Any | None = None
-    roleId: UUID
-    group: Group | None = None
-    groupId: UUID
-    groupOrgId: str | None = None
-
-
-class Org(BaseModel):
-    id: str | None = None
-    currentCount: int
-    name: str
-    maxCount: int
-    active: bool
-    employees: list[Employee] | None = None
-
-
-class Permission(BaseModel):
-    id: UUID | None = None
-    systemName: str | None = None
-    type: Type26 | None = None
-    docStatus: Annotated[
-        Status2 | None,
-        Field(description="Перечисление для описания статусов документов"),
-    ] = None
-    docCategory: DocCategory | None = None
-    mergeRoles: list[RoleMerge] | None = None
-    processCompleted: bool | None = None
-    currentStepCompleted: bool | None = None
-    lastStep: bool | None = None
-    processStarted: bool | None = None
-    onControl: bool | None = None
-    taskOnControl: bool | None = None
-    taskCompleted: bool | None = None
-    taskOnRevision: bool | None = None
-    childTask: bool | None = None
-    taskType: TaskType1 | None = None
-    resolvePolicy: ResolvePolicy1 | None = None
-    hasRegNumber: bool | None = None
-    documentHasItems: list[Type4] | None = None
-    createType: Annotated[
-        CreateType | None,
-        Field(description="Перечисление для описания типов как создан документ"),
-    ] = None
-    roles: list[RolePermission] | None = None
-    taskBeginExecution: bool | None = None
-    archive: bool | None = None
-    taskCreateByPeriod: bool | None = None
-    hasPeriodTasks: bool | None = None
-    nomenclatureDepartmentStatus: Status8 | None = None
-    summaryNomenclatureDepartmentStatus: SummaryNomenclatureDepartmentStatus1 | None = (
-        None
-    )
-    destructionActStatus: DestructionActStatus1 | None = None
-    acceptanceInventoryStatus: Status | None = None
-
-
-class Role1(BaseModel):
-    id: UUID | None = None
-    name: Annotated[str | None, Field(max_length=255, min_length=0)] = None
-    systemName: str | None = None
-    system: bool | None = None
-    systemManage: bool | None = None
-    type: Type14
-    groups: list[GroupRole] | None = None
-    employees: list[RoleEmployee] | None = None
-    permissions: list[RolePermission] | None = None
-    createDate: datetime | None = None
-
-
-class RoleEmployee(BaseModel):
-    id: UUID | None = None
-    employeeId: UUID | None = None
-    employee: Any | None = None
-    role: Role1 | None = None
-    roleId: UUID | None = None
-    systemEntityHistoryEvent: bool | None = None
-    systemHistory: RoleEmployee | None = None
-
-
-class RolePermission(BaseModel):
-    id: UUID | None = None
-    role: Role1 | None = None
-    roleId: UUID | None = None
-    permission: Permission | None = None
-    permissionId: UUID | None = None
-
-
-class ContactFaceDto(BaseModel):
-    id: UUID | None = None
-    lastName: str | None = None
-    firstName: str | None = None
-    middleName: str | None = None
-    post: str | None = None
-    mail: str | None = None
-    phone: str | None = None
-    fax: str | None = None
-    correspondentId: UUID | None = None
-    correspondent: CorrespondentDto | None = None
-
-
-class AdConfigDto(BaseModel):
-    enabled: bool | None = None
-    filter: str
-    dn: str
-    departmentId: UUID
-    department: DepartmentDto | None = None
-    phone: str | None = None
-    email: str | None = None
-    photo: str | None = None
-    fioSingleField: bool
-    syncExistUsers: bool
-    fio: str | None = None
-    firstName: str | None = None
-    lastName: str | None = None
-    middleName: str | None = None
-    post: str | None = None
-    departmentName: str | None = None
-
-
-class Report(BaseModel):
-    id: UUID | None = None
-    author: UserInfo
-    template: Annotated[
-        Template1,
-        Field(description="Перечисление для описания констант шаблонов отчета"),
-    ]
-    type: Type28
-    createDate: datetime
-    size: int
-    originalName: str
-    bucketName: str | None = None
-    minioName: str
-
-
-class UserInfo(BaseModel):
-    firstName: str | None = None
-    lastName: Annotated[str, Field(min_length=1)]
-    middleName: str | None = None
-    authorPost: str | None = None
-    authorDepartmentName: Annotated[str, Field(min_length=1)]
-    departmentId: UUID
-    departmentOrgId: str
-    employeeId: UUID
-    employeeOrgId: str
-    authorDepartment: Department | None = None
-    employee: Employee | None = None
-
-
-class DirectumAttachmentDocument(BaseModel):
-    id: int | None = None
-    docCardId: int | None = None
-    docRkkId: int | None = None
-    taskId: int | None = None
-    author: Employee | None = None
-    uploadDate: datetime | None = None
-    name: str | None = None
-    contentType: str | None = None
-    size: int | None = None
-    data: str | None = None
-    crc: str | None = None
-    signatures: list[Signature] | None = None
-
-
-class Document(BaseModel):
-    id: int | None = None
-    createDate: datetime | None = None
-    documentCategoryConstants: DocumentCategoryConstants | None = None
-    documentType: DocumentType | None = None
-    citizenType: CitizenType | None = None
-    shortSummary: str | None = None
-    author: Employee | None = None
-    correspondent: CorrespondentDocument | None = None
-    addressee: AddresseeDocument | None = None
-    outRegNumber: str | None = None
-    outRegDate: datetime | None = None
-    regNumber: str | None = None
-    regDate: datetime | None = None
-    skipRegistration: bool | None = None
-    whoSigned: Employee | None = None
-    inDocSigners: str | None = None
-    deliveryMethod: str | None = None
-    declarantType: DeclarantType1 | None = None
-    receiptDate: datetime | None = None
-    fullAddress: str | None = None
-    fioApplicant: str | None = None
-    organization: OrganizationDocument | None = None
-    collective: bool | None = None
-    anonymous: bool | None = None
-    nomenclatureAffairDocument: NomenclatureAffairDocument | None = None
-    attachmentDocuments: list[DirectumAttachmentDocument] | None = None
-    histories: list[History] | None = None
-    tasks: list[Task] | None = None
-    introductions: list[Introduction] | None = None
-    employeesAccess: Annotated[set[Employee] | None, Field()] = None
-    introductionIds: list[int] | None = None
-    taskComments: list[TaskComment] | None = None
-
-
-class History(BaseModel):
-    id: int | None = None
-    rkkId: int | None = None
-    docCardId: int | None = None
-    taskId: int | None = None
-    jobId: int | None = None
-    action: str | None = None
-    dateAction: datetime | None = None
-    author: Employee | None = None
-    detail: str | None = None
-    detailInfo: str | None = None
-    text: str | None = None
-
-
-class Introduction(BaseModel):
-    id: int | None = None
-    taskId: int | None = None
-    createDate: datetime | None = None
-    author: Employee | None = None
-    introductionDate: datetime | None = None
-    introductionStampAuthor: Employee | None = None
-    comment: str | None = None
-
-
-class Task(BaseModel):
-    id: int | None = None
-    rkkId: int | None = None
-    typeDirectum: TypeDirectum | None = None
-    type: TaskType1 | None = None
-    taskNumber: str | None = None
-    createDate: datetime | None = None
-    taskText: str | None = None
-    planedDateEnd: datetime | None = None
-    realDateEnd: datetime | None = None
-    taskStatusDirectum: TaskStatusDirectum | None = None
-    taskStatus: TaskStatus | None = None
-    author: Employee | None = None
-    parentId: int | None = None
-    taskExecutors: Annotated[set[TaskExecutors] | None, Field()] = None
-    taskHistory: list[History] | None = None
-
-
-class TaskComment(BaseModel):
-    id: int | None = None
-    taskId: int | None = None
-    jobId: int | None = None
-    parentTaskId: int | None = None
-    createDate: datetime | None = None
-    author: Employee | None = None
-    parentTopic: str | None = None
-    topic: str | None = None
-    comment: str | None = None
-    status: str | None = None
-
-
-class TaskExecutors(BaseModel):
-    id: int | None = None
-    taskId: int | None = None
-    rkkId: int | None = None
-    createDate: datetime | None = None
-    responsible: bool | None = None
-    executedDate: datetime | None = None
-    stampText: str | None = None
-    executor: Employee | None = None
-    number: int | None = None
-    taskExecutorsStatusDirectum: TaskStatusDirectum | None = None
-    parentTaskId: int | None = None
-
-
-class EmployeeIoDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор исполнителя обязанностей")
-    ] = None
-    createDate: Annotated[
-        datetime | None, Field(description="Дата назначения прав")
-    ] = None
-    targetId: Annotated[
-        UUID | None,
-        Field(
-            description="Идентификатор сотрудника за которого будут исполнять обязанности"
-        ),
-    ] = None
-    target: Annotated[
-        EmployeeDto | None,
-        Field(description="Сотрудник за которого будут исполнять обязанности"),
-    ] = None
-    ioId: Annotated[
-        UUID | None,
-        Field(
-            description="Идентификатор сотрудника который будет исполнять обязанности"
-        ),
-    ] = None
-    io: Annotated[
-        EmployeeDto | None,
-        Field(description="Сотрудник который будет исполнять обязанности"),
-    ] = None
-    system: Annotated[
-        bool | None,
-        Field(
-            description="Признак того что исполнение обязанностей было назначено системой"
-        ),
-    ] = None
-    revocationDate: Annotated[
-        datetime | None, Field(description="Дата аннулирования прав")
-    ] = None
-    transferDocs: Annotated[
-        bool | None,
-        Field(
-            description="Признак передавать ли документы при исполнении обязанностей"
-        ),
-    ] = None
-    type: Annotated[Type36 | None, Field(description="Признак секретаря")] = None
-
-
-class TaskChangeDateRequest(BaseModel):
-    id: UUID | None = None
-    executed: bool | None = None
-    taskId: UUID
-    date: datetime | None = None
-    dateCreate: datetime | None = None
-    text: str | None = None
-    currentExecutionDate: datetime | None = None
-    author: UserInfo | None = None
-    task: Task | None = None
-    result: bool | None = None
-
-
-class TaskProjectDto(BaseModel):
-    id: UUID | None = None
-    organizationId: str | None = None
-    documentRegNum: str | None = None
-    documentRegDate: datetime | None = None
-    type: TaskType1 | None = None
-    parentId: UUID | None = None
-    parentOrg: str | None = None
-    parentTask: Task | None = None
-    createDate: datetime | None = None
-    author: UserInfoDto | None = None
-    taskExecutors: list[TaskProjectExecutorDto] | None = None
-    planedDateEnd: datetime | None = None
-    taskText: str | None = None
-    documentId: UUID | None = None
-    documentOrgId: str | None = None
-    countExec: int | None = None
-
-
-class CorrespondentAddRequest(BaseModel):
-    correspondent: CorrespondentRequest
-    contactFaceAdd: list[ContactFaceRequest] | None = None
-
-
-class NomenclatureArchiveConfigDto(BaseModel):
-    id: Annotated[
-        str | None, Field(description="Идентификатор настроечного справочника модуля")
-    ] = None
-    archivistId: Annotated[
-        UUID | None,
-        Field(
-            description="Идентификатор ответственного за настроечный справочник модуля"
-        ),
-    ] = None
-    archivist: EmployeeDto | None = None
-    documentLanguageId: Annotated[
-        UUID | None, Field(description="Идентификатор языка документа")
-    ] = None
-    documentLanguage: DocumentLanguageDto | None = None
-    documentClassesId: Annotated[
-        UUID | None, Field(description="Идентификатор класса документа")
-    ] = None
-    documentClasses: UnifiedDocumentationSystemDto | None = None
-    fundId: Annotated[UUID | None, Field(description="Идентификатор фонда")] = None
-    fund: Annotated[ArchiveFundDto | None, Field(description="Фонд")] = None
-    countPage: Annotated[int | None, Field(description="Количество страниц в томе")] = (
-        None
-    )
-    attachment: Annotated[
-        AttachmentDto | None,
-        Field(description="Файл шаблона печатной формы для сводной номенклутуры"),
-    ] = None
-    actDestructionAttachment: Annotated[
-        AttachmentDto | None,
-        Field(description="Файл шаблона печатной формы для акта уничтожения"),
-    ] = None
-
-
-class TestWithAuth(BaseModel):
-    config: AdConfigDto | None = None
-    auth: TestAdAuth | None = None
-
-
-class UserActionDto(BaseModel):
-    id: UUID | None = None
-    createDate: datetime | None = None
-    employeeId: UUID | None = None
-    employee: EmployeeDto | None = None
-    data: dict[str, Any] | None = None
-    type: Type41 | None = None
-
-
-class SliceDtoSummaryNomenclatureDepartmentDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[SummaryNomenclatureDepartmentDto] | None = None
-
-
-class SliceDtoSummaryNomenclatureDepartmentLinkDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[SummaryNomenclatureDepartmentLinkDto] | None = None
-
-
-class SummaryNomenclatureDepartmentLinkDto(BaseModel):
-    id: UUID | None = None
-    summaryNomenclatureId: UUID | None = None
-    nomenclatureDepartmentId: UUID | None = None
-    summaryOrganizationId: str | None = None
-    nomenclatureOrganizationId: str | None = None
-    active: bool | None = None
-    nomenclatureDepartment: NomenclatureDepartmentDto | None = None
-    department: DepartmentDto | None = None
-
-
-class SliceDtoSummaryNomenclatureDepartmentHistoryDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[SummaryNomenclatureDepartmentHistoryDto] | None = None
-
-
-class SummaryNomenclatureDepartmentHistoryDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор истории")] = None
-    organizationId: Annotated[
-        str | None, Field(description="Идентификатор организации")
-    ] = None
-    summaryNomenclatureDepartmentId: Annotated[
-        UUID | None, Field(description="Идентификатор сводной номенклатуры")
-    ] = None
-    summaryNomenclatureDepartmentOrgId: Annotated[
-        str | None, Field(description="Идентификатор организации сводной номенклатуры")
-    ] = None
-    author: Annotated[UserInfoDto | None, Field(description="Автор")] = None
-    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
-    data: Annotated[
-        list[SummaryNomDepHistoryActionData] | None, Field(description="Данные истории")
-    ] = None
-
-
-class SummaryNomenclatureDepartmentWithPermission(BaseModel):
-    nomenclature: SummaryNomenclatureDepartmentDto | None = None
-    permission: list[SummaryNomenclatureDepartmentPermission] | None = None
-
-
-class GroupEmployeeDto(BaseModel):
-    id: int | None = None
-    employeeId: UUID | None = None
-    employee: EmployeeDto | None = None
-    group: GroupDto | None = None
-    groupId: UUID | None = None
-
-
-class ReportDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор отчета")] = None
-    author: Annotated[UserInfoDto | None, Field(description="Автор отчета")] = None
-    template: Annotated[
-        Template1 | None,
-        Field(description="Перечисление для описания констант шаблонов отчета"),
-    ] = None
-    type: Type28 | None = None
-    createDate: Annotated[
-        datetime | None, Field(description="Дата создания отчета")
-    ] = None
-    size: Annotated[int | None, Field(description="Размер отчета")] = None
-    name: Annotated[str | None, Field(description="Наименование отчета")] = None
-
-
-class NomenclatureDepartmentHistoryDto(BaseModel):
-    id: Annotated[
-        UUID | None,
-        Field(description="Идентификатор истории номенклатуры подразделения"),
-    ] = None
-    nomenclatureDepartmentId: Annotated[
-        UUID | None, Field(description="Идентификатор номенклатуры подразделения")
-    ] = None
-    nomenclatureDepartment: NomenclatureDepartmentDto | None = None
-    author: Annotated[
-        UserInfoDto | None, Field(description="Сотрудник который выполнил действие")
-    ] = None
-    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
-    data: Annotated[
-        list[NomDepHistoryActionData] | None, Field(description="Данные об изменении")
-    ] = None
-
-
-class NomenclatureDepartmentWithPermission(BaseModel):
-    nomenclature: NomenclatureDepartmentDto | None = None
-    permission: list[NomenclatureDepartmentPermission] | None = None
-
-
-class DepartmentFilter(BaseModel):
-    name: Annotated[
-        str | None, Field(description="Наименование департамента/подразделения")
-    ] = None
-    number: Annotated[
-        str | None,
-        Field(description="Номер департамента/подразделения в номенклатуре дел"),
-    ] = None
-    parentDepartmentId: Annotated[
-        UUID | None,
-        Field(description="Идентификатор родительского департамента/подразделения"),
-    ] = None
-    rank: Annotated[int | None, Field(description="Код сортировки")] = None
-    departmentCode: Annotated[
-        str | None, Field(description="Код департамента/подразделения")
-    ] = None
-    phone: Annotated[str | None, Field(description="Телефон")] = None
-    email: Annotated[str | None, Field(description="Email")] = None
-    address: Annotated[str | None, Field(description="Адрес")] = None
-    room: Annotated[str | None, Field(description="Площадка")] = None
-    leaderId: Annotated[
-        UUID | None,
-        Field(description="Идентификатор руководителя департамента/подразделения"),
-    ] = None
-    employees: Annotated[
-        list[Employee] | None,
-        Field(description="Список сотрудников департамента/подразделения"),
-    ] = None
-    ids: list[UUID] | None = None
-    responsibleDeps: bool | None = None
-    includes: Annotated[
-        list[Include8] | None,
-        Field(description="Список моделей которые могу быть добавлены при отображении"),
-    ] = None
-
-
-class SliceDtoDepartmentDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[DepartmentDto] | None = None
-
-
-class TaskHistoryDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор истории поручения")] = (
-        None
-    )
-    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
-    log: Annotated[
-        str | None, Field(description="Информация об изменениях поручения")
-    ] = None
-    taskId: Annotated[UUID | None, Field(description="Идентификатор поручения")] = None
-    taskDto: Annotated[TaskDto | None, Field(description="Поручение")] = None
-    logUser: Annotated[UserInfoDto | None, Field(description="Инициатор изменения")] = (
-        None
-    )
-
-
-class NomenclatureAffairWithPermission(BaseModel):
-    nomenclatureAffair: NomenclatureAffairDto | None = None
-    permission: list[NomenclatureAffairPermission] | None = None
-
-
-class MiniDocumentHistoryDto(BaseModel):
-    id: Annotated[
-        UUID | None, Field(description="Идентификатор истории мини документа")
-    ] = None
-    miniDocumentId: Annotated[
-        UUID | None, Field(description="Идентификатор мини документа")
-    ] = None
-    miniDocument: Annotated[
-        MiniDocumentDto | None, Field(description="Мини документ")
-    ] = None
-    author: Annotated[
-        UserInfoDto | None, Field(description="Сотрудник который выполнил действие")
-    ] = None
-    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
-    data: Annotated[
-        list[MiniDocumentHistoryActionData] | None,
-        Field(description="Данные об изменении"),
-    ] = None
-
-
-class MiniDocumentWithPermission(BaseModel):
-    miniDocument: MiniDocumentDto | None = None
-    permission: list[MiniDocumentPermission] | None = None
-
-
-class SliceDtoMigrationSetupDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[MigrationSetupDto] | None = None
-
-
-class SliceDtoGeneralSetupDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[GeneralSetupDto] | None = None
-
-
-class ErrorHistoryDto(BaseModel):
-    id: int | None = None
-    organizationId: str | None = None
-    author: UserInfoDto | None = None
-    date: datetime | None = None
-    path: str | None = None
-    requestType: str | None = None
-    body: dict[str, Any] | None = None
-    params: dict[str, list[str]] | None = None
-    message: str | None = None
-    trace: str | None = None
-
-
-class SliceDtoErrorHistoryDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[ErrorHistoryDto] | None = None
-
-
-class EmployeeAccessGriefDto(BaseModel):
-    id: UUID | None = None
-    employeeId: UUID | None = None
-    accessGriefId: UUID | None = None
-    organizationId: str | None = None
-    employee: EmployeeDto | None = None
-    accessGrief: AccessGriefDto | None = None
-
-
-class DocumentHistoryDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор истории документа")] = (
-        None
-    )
-    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
-    log: Annotated[
-        str | None, Field(description="Информация об изменениях документа")
-    ] = None
-    docId: Annotated[UUID | None, Field(description="Идентификатор документа")] = None
-    user: Annotated[UserInfoDto | None, Field(description="Инициатор изменения")] = None
-
-
-class BpmnProcessItemDefinitionDto(BaseModel):
-    documentProcessItemId: UUID | None = None
-    activityId: str | None = None
-    started: bool | None = None
-    completed: bool | None = None
-    name: str | None = None
-    days: int | None = None
-    actionQueueType: ActionQueueType1 | None = None
-    type: Annotated[
-        Type4 | None, Field(description="Перечисление для описания типов процесса")
-    ] = None
-    executors: list[BpmnProcessItemExecutorDefinitionDto] | None = None
-    oneForAll: bool | None = None
-    transientExecution: bool | None = None
-    autoRegistration: bool | None = None
-    fileSign: bool | None = None
-    repeatExecutionPolicy: RepeatExecutionPolicy | None = None
-    completeAfterRejectCount: int | None = None
-    rejectCount: int | None = None
-
-
-class BpmnProcessItemExecutorDefinitionDto(BaseModel):
-    """
-    Заполняется только для тех этапов которые не начинались, будет заполнена либо группа либо исполнитель либо депортамент
-    """
-
-    id: UUID | None = None
-    comment: str | None = None
-    documentProcessItemId: UUID | None = None
-    end: datetime | None = None
-    executionEnd: datetime | None = None
-    result: bool | None = None
-    start: datetime | None = None
-    order: int | None = None
-    executor: UserInfoDto | None = None
-    groupId: Annotated[
-        UUID | None,
-        Field(description="Заполняется только для тех этапов которые не начинались"),
-    ] = None
-    group: GroupDto | None = None
-    departmentId: Annotated[
-        UUID | None,
-        Field(description="Заполняется только для тех этапов которые не начинались"),
-    ] = None
-    department: DepartmentDto | None = None
-
-
-class ContractVersionAttachmentDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор вложения договора")] = (
-        None
-    )
-    contractVersionInfoId: Annotated[
-        UUID | None, Field(description="Идентификатор версии договора")
-    ] = None
-    contractVersionInfo: Annotated[
-        ContractVersionInfoDto | None, Field(description="Версия договора")
-    ] = None
-    attachment: Annotated[
-        AttachmentDto | None, Field(description="Вложение договора")
-    ] = None
-    uploadDate: Annotated[
-        datetime | None, Field(description="Дата загрузки вложения")
-    ] = None
-
-
-class ContractVersionInfoDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор версии договора")] = (
-        None
-    )
-    documentId: Annotated[UUID | None, Field(description="Идентификатор договора")] = (
-        None
-    )
-    versionNumber: Annotated[int | None, Field(description="Номер версии договора")] = (
-        None
-    )
-    createDate: Annotated[
-        datetime | None, Field(description="Дата создания договора")
-    ] = None
-    attachments: Annotated[
-        list[ContractVersionAttachmentDto] | None,
-        Field(description="Вложения договора"),
-    ] = None
-    fileName: Annotated[str | None, Field(description="Имя файла договора")] = None
-
-
-class DocumentInvitedDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор приглашенного")] = None
-    employee: UserInfoDto | None = None
-    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
-        None
-    )
-    document: Annotated[DocumentDto | None, Field(description="Документ")] = None
-
-
-class DocumentLinkDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор ссылки")] = None
-    docId: Annotated[UUID | None, Field(description="Идентификатор документа")] = None
-    docLinkId: Annotated[
-        UUID | None,
-        Field(
-            description="Идентификатор документа на который ссылается текущий документ"
-        ),
-    ] = None
-    docLink: Annotated[
-        DocumentDto | None,
-        Field(description="Документ на который ссылается текущий документ"),
-    ] = None
-    type: Type52 | None = None
-    deleted: bool | None = None
-
-
-class ProfileContractAttachmentDto(BaseModel):
-    id: Annotated[
-        UUID | None,
-        Field(
-            description="Идентификатор вложения шаблона договора в профиле документа "
-        ),
-    ] = None
-    documentProfileId: Annotated[
-        UUID | None, Field(description="Идентификатор профиля документа")
-    ] = None
-    documentProfile: Annotated[
-        DocumentProfileDto | None, Field(description="Профиль документа")
-    ] = None
-    attachment: Annotated[
-        AttachmentDto | None,
-        Field(description="Файл шаблона печатной формы для договора"),
-    ] = None
-    tag: Annotated[list[str] | None, Field(description="Список меток шаблона")] = None
-    template: Annotated[bool | None, Field(description="Наличие меток")] = None
-    uploadDate: Annotated[datetime | None, Field(description="Дата загрузки")] = None
-
-
-class SliceDtoDestructionActDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[DestructionActDto] | None = None
-
-
-class DestructionActNomenclatureAffairLinkDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор связи")] = None
-    organizationId: Annotated[
-        str | None, Field(description="Идентификатор организации")
-    ] = None
-    destructionActId: Annotated[
-        UUID | None, Field(description="Идентификатор акта уничтожения дел")
-    ] = None
-    destructionAct: Annotated[
-        DestructionActDto | None, Field(description="Акт уничтожения дел")
-    ] = None
-    nomenclatureAffairId: Annotated[
-        UUID | None, Field(description="Идентификатор номенклатурного дела")
-    ] = None
-    nomenclatureAffair: Annotated[
-        NomenclatureAffairDto | None, Field(description="Номенклатурное дело")
-    ] = None
-    order: Annotated[int | None, Field(description="Порядковый номер в списке")] = None
-    status: Status25 | None = None
-    retryCount: int | None = None
-    nextRetry: datetime | None = None
-    errorMessage: str | None = None
-
-
-class SliceDtoDestructionActNomenclatureAffairLinkDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[DestructionActNomenclatureAffairLinkDto] | None = None
-
-
-class DestructionActHistoryDto(BaseModel):
-    id: UUID | None = None
-    organizationId: str | None = None
-    destructionActId: UUID | None = None
-    author: UserInfoDto | None = None
-    createDate: datetime | None = None
-    data: list[DestructionActHistoryActionData] | None = None
-
-
-class SliceDtoDestructionActHistoryDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[DestructionActHistoryDto] | None = None
-
-
-class DestructionActWithPermission(BaseModel):
-    destructionAct: DestructionActDto | None = None
-    permission: list[DestructionActPermission] | None = None
-
-
-class SliceDtoEmployeeAccessGriefDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[EmployeeAccessGriefDto] | None = None
-
-
-class AcceptanceInventoryHistoryDto(BaseModel):
-    id: Annotated[UUID | None, Field(description="Идентификатор истории СП")] = None
-    acceptanceInventoryId: Annotated[
-        UUID | None, Field(description="Идентификатор СП")
-    ] = None
-    acceptanceInventory: AcceptanceInventoryDataDto | None = None
-    author: Annotated[
-        UserInfoDto | None, Field(description="Сотрудник который выполнил действие")
-    ] = None
-    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
-    data: Annotated[
-        list[AcceptanceInventoryHistoryActionData] | None,
-        Field(description="Данные об изменении"),
-    ] = None
-
-
-class SliceDtoAcceptanceInventoryHistoryDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[AcceptanceInventoryHistoryDto] | None = None
-
-
-class AcceptanceInventoryWithPermission(BaseModel):
-    acceptanceInventory: AcceptanceInventoryDataDto | None = None
-    permission: list[AcceptanceInventoryPermission] | None = None
-
-
-class SliceDtoInnerInventoryDataDto(BaseModel):
-    number: int | None = None
-    size: int | None = None
-    numberOfElements: int | None = None
-    hasNext: bool | None = None
-    content: list[InnerInventoryDataDto] | None = None
-
-
-class ContractCorrespondentDto1(BaseModel):
-    id: UUID | None = None
-    correspondentId: UUID | None = None
-    documentId: UUID | None = None
-    documentOrganizationId: str | None = None
-    correspondent: CorrespondentDto | None = None
-    name: str
-    unp: str | None = None
-    signDate: datetime | None = None
-    order: int | None = None
-    contractNumber: str | None = None
-    contractDate: datetime | None = None
-
-
-AcceptanceInventoryDataDto.update_forward_refs()
-AcceptanceInventoryProcessDto.update_forward_refs()
-AcceptanceInventoryProcessExecutorDto.update_forward_refs()
-AdditionalDocumentDto.update_forward_refs()
-AdditionalDocumentResponsibleDto.update_forward_refs()
-ControlDto.update_forward_refs()
-ControlTypeDto.update_forward_refs()
-CorrespondentDto.update_forward_refs()
-DepartmentDto.update_forward_refs()
-DepartmentEmployeeNomenclatureDto.update_forward_refs()
-DeputyLeaderDepartmentDto.update_forward_refs()
-DestructionActDto.update_forward_refs()
-DestructionActProcessDto.update_forward_refs()
-DestructionActProcessExecutorDto.update_forward_refs()
-DirectoryProcessDefinition.update_forward_refs()
-DirectoryProcessEmployee.update_forward_refs()
-DocumentAppealDto.update_forward_refs()
-DocumentDto.update_forward_refs()
-DocumentFolderDto.update_forward_refs()
-DocumentInventoryDataDto.update_forward_refs()
-DocumentPreNomenclatureDto.update_forward_refs()
-DocumentProcessDto.update_forward_refs()
-DocumentProcessExecutorDto.update_forward_refs()
-DocumentProfileDto.update_forward_refs()
-DocumentQuestionDto.update_forward_refs()
-DocumentRecipientDtoModel.update_forward_refs()
-DocumentResponsibleExecutorDto.update_forward_refs()
-EmployeeDto.update_forward_refs()
-IntroductionDto.update_forward_refs()
-MiniDocumentDto.update_forward_refs()
-NomenclatureAffairDto.update_forward_refs()
-SpeakerDto.update_forward_refs()
-TaskChangeDateRequestDto.update_forward_refs()
-TaskDto.update_forward_refs()
-TaskExecutorsDto.update_forward_refs()
-SummaryNomenclatureDepartmentDto.update_forward_refs()
-SummaryNomenclatureDepartmentProcessDto.update_forward_refs()
-NomenclatureDepartmentProcessExecutorDto.update_forward_refs()
-ContractControlPointAttachmentDto.update_forward_refs()
-ContractControlPointDto.update_forward_refs()
-ControlType.update_forward_refs()
-Department.update_forward_refs()
-Employee.update_forward_refs()
-Group.update_forward_refs()
-Permission.update_forward_refs()
-Role1.update_forward_refs()
-Report.update_forward_refs()
-Document.update_forward_refs()
-Task.update_forward_refs()
-SliceDtoSummaryNomenclatureDepartmentLinkDto.update_forward_refs()
-SliceDtoSummaryNomenclatureDepartmentHistoryDto.update_forward_refs()
-BpmnProcessItemDefinitionDto.update_forward_refs()
-ContractVersionAttachmentDto.update_forward_refs()
@@ -0,0 +1,781 @@
+# src/edms_assistant/infrastructure/resources_openapi/__init__.py
+# generated by download_openapi.py from openapi_spec.json — не редактировать вручную
+"""
+Pydantic-модели EDMS, сгенерированные из OpenAPI и разбитые по тегам.
+
+Модели, которые используют операции только одного тега, лежат в модуле этого
+тега, общие для нескольких тегов — в common, не используемые ни одной
+операцией — в other. Модуль импортируется при первом обращении к его
+модели (`from ...resources_openapi import DocumentDto`), поэтому процесс строит
+только те модели, которые ему действительно нужны.
+"""
+import importlib
+from typing import Any, List
+
+# Модель -> модуль пакета, в котором она определена
+_MODULES = {
+    'AcceptanceInventoryCancelRequest': 'opis_strukturnykh_podrazdelenii_opis_sp',
+    'AcceptanceInventoryDataDto': 'common',
+    'AcceptanceInventoryDataFilter': 'opis_strukturnykh_podrazdelenii_opis_sp',
+    'AcceptanceInventoryDataRequest': 'opis_strukturnykh_podrazdelenii_opis_sp',
+    'AcceptanceInventoryHistoryActionData': 'opis_strukturnykh_podrazdelenii_opis_sp',
+    'AcceptanceInventoryHistoryDto': 'opis_strukturnykh_podrazdelenii_opis_sp',
+    'AcceptanceInventoryOperation': 'opis_strukturnykh_podrazdelenii_opis_sp',
+    'AcceptanceInventoryPermission': 'opis_strukturnykh_podrazdelenii_opis_sp',
+    'AcceptanceInventoryProcessAction': 'opis_strukturnykh_podrazdelenii_opis_sp',
+    'AcceptanceInventoryProcessDto': 'common',
+    'AcceptanceInventoryProcessExecutorDto': 'common',
+    'AcceptanceInventoryProcessItemDto': 'common',
+    'AcceptanceInventoryWithPermission': 'opis_strukturnykh_podrazdelenii_opis_sp',
+    'AcceptanceKanclerArchiveRequest': 'opis_strukturnykh_podrazdelenii_opis_sp',
+    'AccessGriefDto': 'common',
+    'AccessGriefFilter': 'grify_dostupa',
+    'AccessGriefRequest': 'grify_dostupa',
+    'ActionQueueType': 'common',
+    'ActionQueueType1': 'common',
+    'ActionType': 'svodnye_nomenklatury_del',
+    'ActionType1': 'nomenklatury_del_podrazdeleniia',
+    'ActionType2': 'mini_dokument',
+    'ActionType3': 'akt_ob_unichtozhenii_del',
+    'ActionType4': 'opis_strukturnykh_podrazdelenii_opis_sp',
+    'AdConfigDto': 'ad_config_controller',
+    'AdditionalAgreementDto': 'dopolnitelnoe_soglasovanie',
+    'AdditionalAgreementPair': 'dokument',
+    'AdditionalAgreementRequest': 'dopolnitelnoe_soglasovanie',
+    'AdditionalAgreementUserCalendarEntry': 'lichnyi_kalendar_polzovatelia',
+    'AdditionalDocumentAttachmentDto': 'common',
+    'AdditionalDocumentDto': 'common',
+    'AdditionalDocumentFilter': 'dopolnitelnyi_dokument_dogovora',
+    'AdditionalDocumentRequest': 'dopolnitelnyi_dokument_dogovora',
+    'AdditionalDocumentResponsibleDto': 'common',
+    'AdditionalDocumentTypeDto': 'common',
+    'AdditionalDocumentTypeRequest': 'vidy_dop_dokumentov',
+    'AdditionalFields': 'common',
+    'AddresseeDocument': 'migratsiia',
+    'AismvApiConfigDto': 'nastroiki_ais_mv_ais_mv_api',
+    'AismvCertInfoDto': 'aismv_cert_info_controller',
+    'AismvOrgPackageDto': 'aismv_org_package_controller',
+    'AismvOrgPackageFilter': 'aismv_org_package_controller',
+    'AismvOrgPackageRecycleSettingsDto': 'aismv_recycle_settings_controller',
+    'AismvPackageType': 'common',
+    'AismvRouterConfigDto': 'nastroiki_ais_mv_skhema_formata_obmena',
+    'ArchiveFundDto': 'common',
+    'ArchiveFundRequest': 'arkhivnye_fondy',
+    'ArchiveRegistrationDto': 'archive_registration_controller',
+    'ArchiveRegistrationRequest': 'archive_registration_controller',
+    'Attachment': 'common',
+    'AttachmentCopyType': 'dokument',
+    'AttachmentDocumentDto': 'common',
+    'AttachmentDocumentType': 'common',
+    'AttachmentDocumentType1': 'common',
+    'AttachmentDto': 'common',
+    'AttachmentPersonalSetupDto': 'personalnye_nastroiki_polzovatelia',
+    'AttachmentSignature': 'common',
+    'AttachmentTaskDto': 'common',
+    'AttachmentTemplateContractDto': 'shablony_dogovorov',
+    'AttrCertInfo': 'atributnye_sertifikaty_sotrudnika',
+    'AutoControl': 'common',
+    'AutoProlongationUpdate': 'common',
+    'BasicAuthRequest': 'avtorizatsiia',
+    'BasicModuleDefinition': 'info_controller',
+    'BasicSearchEmployeeRequest': 'departamenty',
+    'BasicSearchRequest': 'common',
+    'BasicUserAccountChange': 'basic_user_account_controller',
+    'BasicUserAccountCreate': 'basic_user_account_controller',
+    'BasicUserAccountUpdate': 'basic_user_account_controller',
+    'BlockedField': 'common',
+    'BoolResult': 'dopolnitelnoe_soglasovanie',
+    'BpmnProcessDirectoryDto': 'common',
+    'BpmnProcessDirectoryRequest': 'bpmn_process_directory_controller',
+    'BpmnProcessItemDefinitionDto': 'protsessy_dokumenta',
+    'BpmnProcessItemExecutorDefinitionDto': 'protsessy_dokumenta',
+    'BpmnSearchRequest': 'bpmn_process_directory_controller',
+    'BpmnStartBeforeRequest': 'protsessy_dokumenta',
+    'CalendarEventDto': 'lichnyi_kalendar_polzovatelia',
+    'CalendarEventFilter': 'lichnyi_kalendar_polzovatelia',
+    'CalendarEventRequest': 'lichnyi_kalendar_polzovatelia',
+    'CamundaProcessItemDefinitionRequest': 'protsessy_dokumenta',
+    'CaseFileCoverRequest': 'nomenklatura_del_kartochka_dela',
+    'CertInfo': 'common',
+    'CertificationSheetRequest': 'nomenklatura_del_kartochka_dela',
+    'ChangeAttachmentDocumentTypeRequest': 'attachi_dokumenta',
+    'ChangeRegNumberRequest': 'dokument',
+    'ChangeResponsibleStatus': 'common',
+    'CheckAttachmentSignRequest': 'common',
+    'CitizenType': 'migratsiia',
+    'CitizenTypeDto': 'common',
+    'CitizenTypeRequest': 'vid_obrashchenii',
+    'CityDto': 'goroda',
+    'CityFilter': 'goroda',
+    'Column': 'common',
+    'CommentStatus': 'kommentarii_k_dokumentu',
+    'ContactFaceDto': 'kontaktnye_litsa_dlia_korrespondentov',
+    'ContactFaceRequest': 'common',
+    'ContentType': 'common',
+    'ContractAgreementUpdate': 'common',
+    'ContractControlPointAttachmentDto': 'kontrolnye_tochki_ispolneniia_dogovora',
+    'ContractControlPointDto': 'kontrolnye_tochki_ispolneniia_dogovora',
+    'ContractControlPointFilter': 'kontrolnye_tochki_ispolneniia_dogovora',
+    'ContractControlPointLinkDto': 'kontrolnye_tochki_ispolneniia_dogovora',
+    'ContractControlPointResponsibleDto': 'kontrolnye_tochki_ispolneniia_dogovora',
+    'ContractCorrespondentDto': 'other',
+    'ContractCorrespondentDto1': 'other',
+    'ContractTypicalUpdate': 'common',
+    'ContractVersionAttachmentDto': 'dokument',
+    'ContractVersionInfoDto': 'dokument',
+    'ControlDto': 'common',
+    'ControlPointMainFields': 'kontrolnye_tochki_ispolneniia_dogovora',
+    'ControlPointRevisionRequest': 'kontrolnye_tochki_ispolneniia_dogovora',
+    'ControlRequest': 'common',
+    'ControlType': 'tipy_kontrolia',
+    'ControlTypeDto': 'common',
+    'ControlTypeRequest': 'tipy_kontrolia',
+    'CopyAffairWrapperInteger': 'nomenklatura_del_kartochka_dela',
+    'CopyAffairWrapperNomenclatureAffairOperationCopyDepDto': 'nomenklatura_del_kartochka_dela',
+    'CopyAffairWrapperUUID': 'nomenklatura_del_kartochka_dela',
+    'Correspondent': 'migratsiia',
+    'CorrespondentAddRequest': 'adresaty_korrespondenty',
+    'CorrespondentDocument': 'migratsiia',
+    'CorrespondentDto': 'common',
+    'CorrespondentFilter': 'adresaty_korrespondenty',
+    'CorrespondentGroupAddRequest': 'gruppy_adresatov_korrespondentov',
+    'CorrespondentGroupDto': 'gruppy_adresatov_korrespondentov',
+    'CorrespondentGroupRequest': 'gruppy_adresatov_korrespondentov',
+    'CorrespondentGroupUpdateRequest': 'gruppy_adresatov_korrespondentov',
+    'CorrespondentRequest': 'adresaty_korrespondenty',
+    'CorrespondentUpdateRequest': 'adresaty_korrespondenty',
+    'CountResult': 'dokument',
+    'CountryDto': 'common',
+    'CreateSummaryNomenclatureDepartmentDto': 'svodnye_nomenklatury_del',
+    'CreateTaskProjectRequest': 'proekty_porucheniia_v_dokumente',
+    'CreateTaskRequest': 'porucheniia',
+    'CreateTaskRequestExecutor': 'common',
+    'CreateType': 'common',
+    'CreateType1': 'common',
+    'CreateType2': 'common',
+    'CreateType3': 'vozmozhnosti_polzovatelia',
+    'CrlInfo': 'aismv_cert_info_controller',
+    'CurrencyDto': 'common',
+    'CurrencyRequest': 'valiuty',
+    'CurrentStepProcessType': 'dokument',
+    'CurrentUser': 'common',
+    'CustomViewColumn': 'common',
+    'CustomViewDto': 'common',
+    'DeclarantType': 'common',
+    'DeclarantType1': 'common',
+    'DefaultSignType': 'common',
+    'DeliveryMethodDto': 'common',
+    'DeliveryMethodFilter': 'sposoby_dostavki',
+    'DeliveryMethodRequest': 'sposoby_dostavki',
+    'Department': 'common',
+    'DepartmentDto': 'common',
+    'DepartmentEmployeeNomenclature': 'common',
+    'DepartmentEmployeeNomenclatureDto': 'common',
+    'DepartmentFilter': 'common',
+    'DeputyLeaderDepartment': 'common',
+    'DeputyLeaderDepartmentDto': 'common',
+    'Destination': 'uvedomleniia',
+    'DestroyAckRequestBody': 'akt_ob_unichtozhenii_del',
+    'DestructionActCancelRequest': 'akt_ob_unichtozhenii_del',
+    'DestructionActCreateRequest': 'akt_ob_unichtozhenii_del',
+    'DestructionActDto': 'common',
+    'DestructionActFilter': 'akt_ob_unichtozhenii_del',
+    'DestructionActHistoryActionData': 'akt_ob_unichtozhenii_del',
+    'DestructionActHistoryDto': 'akt_ob_unichtozhenii_del',
+    'DestructionActNomenclatureAffairFilter': 'akt_ob_unichtozhenii_del',
+    'DestructionActNomenclatureAffairLinkDto': 'akt_ob_unichtozhenii_del',
+    'DestructionActOperation': 'akt_ob_unichtozhenii_del',
+    'DestructionActPermission': 'akt_ob_unichtozhenii_del',
+    'DestructionActProcessAction': 'akt_ob_unichtozhenii_del',
+    'DestructionActProcessDto': 'common',
+    'DestructionActProcessExecutorDto': 'common',
+    'DestructionActProcessItemDto': 'common',
+    'DestructionActRequest': 'akt_ob_unichtozhenii_del',
+    'DestructionActStatus': 'vozmozhnosti_polzovatelia',
+    'DestructionActStatus1': 'common',
+    'DestructionActWithPermission': 'akt_ob_unichtozhenii_del',
+    'DirectoryProcessDefinition': 'common',
+    'DirectoryProcessEmployee': 'common',
+    'DirectumAttachmentDocument': 'migratsiia',
+    'DistrictDto': 'common',
+    'DistrictFilter': 'raiony',
+    'DocCategory': 'common',
+    'DocCategoryConstant11': 'common',
+    'DocContractFields': 'common',
+    'DocCorrespondentUpdate': 'common',
+    'DocFieldsMeeting': 'common',
+    'DocFieldsMeetingQuestion': 'common',
+    'DocFieldsQuestion': 'common',
+    'DocInvitees': 'common',
+    'DocMainFields': 'common',
+    'DocMainFieldsAppeal': 'common',
+    'DocMoveInFoldersOperation': 'lichnye_papki_v2',
+    'DocOperation': 'common',
+    'DocPermissionContainer': 'dokument',
+    'DocRegOperationAudit': 'common',
+    'DocRepeatIdentical': 'common',
+    'DocSpeakerUpdate': 'common',
+    'DocStatus': 'vozmozhnosti_polzovatelia',
+    'DocTypeDto': 'smdo_doc_type_controller',
+    'DocsMoveInFoldersOperation': 'lichnye_papki_v2',
+    'Document': 'migratsiia',
+    'DocumentAccessGriefUpdate': 'common',
+    'DocumentAppealDto': 'common',
+    'DocumentArchiveRequest': 'dokument',
+    'DocumentAttachmentSignEntry': 'protsessy_dokumenta',
+    'DocumentBasedExistingBody': 'dokument',
+    'DocumentCancelAction': 'dokument',
+    'DocumentCategory': 'common',
+    'DocumentCategory1': 'pechat_dostupa',
+    'DocumentCategoryConstants': 'migratsiia',
+    'DocumentCategoryFilter': 'pechat_dostupa',
+    'DocumentCommentFilter': 'kommentarii_k_dokumentu',
+    'DocumentCommentRequest': 'kommentarii_k_dokumentu',
+    'DocumentConstant': 'common',
+    'DocumentContext': 'dokument',
+    'DocumentControlUserCalendarEntry': 'lichnyi_kalendar_polzovatelia',
+    'DocumentDto': 'common',
+    'DocumentFilter': 'common',
+    'DocumentFolderDto': 'common',
+    'DocumentFormDefinitionDto': 'common',
+    'DocumentFormDto': 'common',
+    'DocumentFormField': 'common',
+    'DocumentFormFilter': 'formy_dokumentov',
+    'DocumentHistoryDto': 'dokument',
+    'DocumentInProgressReportFilter': 'otchety',
+    'DocumentInventoryDataDto': 'common',
+    'DocumentInvitedConfirmCalendar': 'lichnyi_kalendar_polzovatelia',
+    'DocumentInvitedDto': 'vnutrennie_priglashennye',
+    'DocumentLanguageDto': 'common',
+    'DocumentLanguageRequest': 'iazyki_dokumentov',
+    'DocumentLink': 'migratsiia',
+    'DocumentLinkCopyType': 'dokument',
+    'DocumentLinkDto': 'ssylki_na_dokument',
+    'DocumentLinkType': 'migratsiia',
+    'DocumentLinkUpdate': 'common',
+    'DocumentLinkUpdatePart': 'common',
+    'DocumentNextProcessRequest': 'dokument',
+    'DocumentNomenclatureDto': 'common',
+    'DocumentNomenclatureUpdate': 'other',
+    'DocumentNomenclatureUpdate1': 'other',
+    'DocumentOnControlReportFilter': 'otchety',
+    'DocumentOnExecutionReportFilter': 'otchety',
+    'DocumentOnRegistrationReportFilter': 'otchety',
+    'DocumentOnStatusReportFilter': 'otchety',
+    'DocumentPreNomenclatureDto': 'common',
+    'DocumentProcessDto': 'common',
+    'DocumentProcessExecutorDto': 'common',
+    'DocumentProcessExecutorUpdate': 'common',
+    'DocumentProcessItemDto': 'common',
+    'DocumentProcessItemUpdate': 'common',
+    'DocumentProfileDto': 'common',
+    'DocumentProfileFilter': 'profili_dokumenta',
+    'DocumentPropertiesDto': 'common',
+    'DocumentQuestionDto': 'common',
+    'DocumentRecipientDeliveryHistoryDto': 'common',
+    'DocumentRecipientDto': 'dokument',
+    'DocumentRecipientDtoModel': 'common',
+    'DocumentResponsibleExecutorDto': 'common',
+    'DocumentResponsibleUpdate': 'common',
+    'DocumentType': 'common',
+    'DocumentTypeDto': 'common',
+    'DocumentTypeFilter': 'tipy_dokumentov',
+    'DocumentTypeRequest': 'tipy_dokumentov',
+    'DocumentUndraft': 'common',
+    'DocumentUserCalendarEntry': 'lichnyi_kalendar_polzovatelia',
+    'DocumentUserColorDto': 'common',
+    'DocumentUserPropsDto': 'common',
+    'DocumentVersionDto': 'common',
+    'DownloadedSenderAttachment': 'aismv_org_package_controller',
+    'EmpActionQueueType': 'common',
+    'Employee': 'common',
+    'EmployeeAccessGriefDto': 'common',
+    'EmployeeAddRequest': 'sotrudniki',
+    'EmployeeApi': 'sotrudniki',
+    'EmployeeAttrCertInfoDto': 'atributnye_sertifikaty_sotrudnika',
+    'EmployeeAuthorizationAuditDto': 'employee_authorization_audit_controller',
+    'EmployeeCertInfoDto': 'sertifikaty_sotrudnika',
+    'EmployeeDelegate': 'sotrudniki',
+    'EmployeeDto': 'common',
+    'EmployeeFilter': 'common',
+    'EmployeeIo': 'common',
+    'EmployeeIoDto': 'sotrudniki_io',
+    'EmployeeIoRequest': 'common',
+    'EmployeeRequest': 'sotrudniki',
+    'EmployeeUpdateRequest': 'sotrudniki',
+    'EmployeeWithPosition': 'common',
+    'ErrorHistoryDto': 'error_history_controller',
+    'ExecuteTaskRequest': 'porucheniia',
+    'ExecutionDateRoundPolicy': 'common',
+    'ExecutionDocumentStatCount': 'dokument',
+    'ExecutionTaskStatCount': 'common',
+    'ExpertiseType': 'common',
+    'ExtractCertificateRequest': 'sertifikaty_sotrudnika',
+    'FileTypeDto': 'smdo_file_type_controller',
+    'FilterDto': 'sokhranennye_filtry_dokumenta_dlia_rasshirennogo_poiska',
+    'FilterFieldFilter': 'sokhranennye_filtry_dokumenta_dlia_rasshirennogo_poiska',
+    'FolderDto': 'common',
+    'FolderFilter': 'lichnye_papki_v2',
+    'FolderInRootOperation': 'lichnye_papki_v2',
+    'FolderInsertOrUpdateOperation': 'lichnye_papki_v2',
+    'FolderRequest': 'lichnye_papki_v2',
+    'FoldersDocsDeleteOperation': 'lichnye_papki_v2',
+    'FoldersDocsMoveOperation': 'lichnye_papki_v2',
+    'FormFieldRegistryEntryDto': 'reestr_polei_form',
+    'FormMeetingType': 'common',
+    'FreeRegistrationProcessRequest': 'protsessy_dokumenta',
+    'GeneralSetupDto': 'common',
+    'GeneralSetupRequest': 'obshchaia_nastroika_dokumenta_sed',
+    'GetInventoryStatusResponse2': 'archive_registration_controller',
+    'GrantedAuthority': 'common',
+    'Group': 'common',
+    'GroupAddRequest': 'gruppy_polzovatelei',
+    'GroupByStoragePeriod': 'common',
+    'GroupByStoragePeriod1': 'svodnaia_opis_del',
+    'GroupDto': 'common',
+    'GroupEmployee': 'common',
+    'GroupEmployeeDto': 'common',
+    'GroupEmployeeFilter': 'gruppy_polzovatelei',
+    'GroupFilter': 'gruppy_polzovatelei',
+    'GroupRequest': 'gruppy_polzovatelei',
+    'GroupRole': 'common',
+    'GroupRoleDto': 'gruppy_polzovatelei',
+    'GroupUpdateRequest': 'gruppy_polzovatelei',
+    'History': 'common',
+    'Id': 'napominaniia',
+    'Id1': 'personalnye_nastroiki_polzovatelia',
+    'IdLong': 'gruppy_polzovatelei',
+    'IdString': 'aismv_cert_info_controller',
+    'IdUUID': 'common',
+    'IdsInteger': 'nomenklatury_del_podrazdeleniia',
+    'IdsLong': 'common',
+    'IdsOrgKey': 'common',
+    'IdsString': 'reestr_polei_form',
+    'IdsUUID': 'common',
+    'Include': 'common',
+    'Include1': 'common',
+    'Include10': 'dostup_k_mini_dokumentam',
+    'Include11': 'nomenklatura_del_kartochka_dela',
+    'Include12': 'kontrolnye_tochki_ispolneniia_dogovora',
+    'Include13': 'dopolnitelnyi_dokument_dogovora',
+    'Include14': 'formy_dokumentov',
+    'Include15': 'profili_dokumenta',
+    'Include16': 'raiony',
+    'Include17': 'akt_ob_unichtozhenii_del',
+    'Include18': 'adresaty_korrespondenty',
+    'Include19': 'goroda',
+    'Include2': 'lichnye_papki_v2',
+    'Include20': 'opis_strukturnykh_podrazdelenii_opis_sp',
+    'Include3': 'porucheniia_kontrol',
+    'Include4': 'svodnye_nomenklatury_del',
+    'Include5': 'tematika',
+    'Include6': 'nomenklaturnye_stellazhi_i_polki',
+    'Include7': 'nomenklatury_del_podrazdeleniia',
+    'Include8': 'common',
+    'Include9': 'common',
+    'InformationItem': 'common',
+    'InnerInventories': 'common',
+    'InnerInventory': 'common',
+    'InnerInventoryDataDto': 'common',
+    'InnerInventoryRequest': 'common',
+    'InnerInventoryRequestBody': 'common',
+    'InnerInventoryResponse': 'common',
+    'IntegrationConfigDto': 'integration_config_controller',
+    'IntegrationConfigRequest': 'integration_config_controller',
+    'IntermediateCorrespondentRequest': 'gruppy_adresatov_korrespondentov',
+    'InternalInventoryArchiveRequest': 'pechat_po_nomenklature_del',
+    'Introduction': 'migratsiia',
+    'IntroductionDto': 'common',
+    'InvestmentProgramDto': 'common',
+    'InvestmentProgramRequest': 'obekt_investprogrammy',
+    'Io': 'common',
+    'IoOption': 'common',
+    'JobInfo': 'common',
+    'JobStatus': 'common',
+    'JsonNode': 'dokument',
+    'KtaSign': 'attachi_dokumenta',
+    'LdapUser': 'ad_config_controller',
+    'ListInformation': 'common',
+    'ListUuid': 'gruppy_polzovatelei',
+    'Localization': 'common',
+    'MailSetupDto': 'nastroika_pochty',
+    'Merge': 'vozmozhnosti_polzovatelia',
+    'Merge1': 'common',
+    'MethodAssemblyType': 'common',
+    'MethodAssemblyType1': 'common',
+    'MethodAssemblyType2': 'common',
+    'MigrationSetupDto': 'nastroika_dlia_migratsii_dokumentov_spravochnikov',
+    'MiniDocumentAccessByRequest': 'dostup_k_mini_dokumentam',
+    'MiniDocumentAccessDto': 'dostup_k_mini_dokumentam',
+    'MiniDocumentAccessFilter': 'dostup_k_mini_dokumentam',
+    'MiniDocumentAccessRequest': 'dostup_k_mini_dokumentam',
+    'MiniDocumentAffairRequest': 'nomenklatura_del_kartochka_dela',
+    'MiniDocumentAttachmentDto': 'common',
+    'MiniDocumentDto': 'common',
+    'MiniDocumentFilter': 'common',
+    'MiniDocumentHistoryActionData': 'mini_dokument',
+    'MiniDocumentHistoryDto': 'mini_dokument',
+    'MiniDocumentPermission': 'mini_dokument',
+    'MiniDocumentRequest': 'mini_dokument',
+    'MiniDocumentWithPermission': 'mini_dokument',
+    'MiniUserInfoDto': 'common',
+    'MinioAttachment': 'aismv_org_package_controller',
+    'NextStepProcessType': 'dokument',
+    'NoPasswordUserAccount': 'common',
+    'NomDepHistoryActionData': 'nomenklatury_del_podrazdeleniia',
+    'NomDepOperation': 'nomenklatury_del_podrazdeleniia',
+    'NomenclatureAffair': 'migratsiia',
+    'NomenclatureAffairCompletedRequest': 'nomenklatura_del_kartochka_dela',
+    'NomenclatureAffairDeleteRequest': 'nomenklatura_del_kartochka_dela',
+    'NomenclatureAffairDocument': 'migratsiia',
+    'NomenclatureAffairDto': 'common',
+    'NomenclatureAffairExpertiseRequest': 'nomenklatura_del_kartochka_dela',
+    'NomenclatureAffairExpirationRequest': 'nomenklatura_del_kartochka_dela',
+    'NomenclatureAffairFilter': 'nomenklatura_del_kartochka_dela',
+    'NomenclatureAffairOperationCopyDepDto': 'nomenklatura_del_kartochka_dela',
+    'NomenclatureAffairPermission': 'nomenklatura_del_kartochka_dela',
+    'NomenclatureAffairPrintTemplateAddRequest': 'shablony_pechatnykh_form_nomenklaturnykh_del',
+    'NomenclatureAffairPrintTemplateDto': 'shablony_pechatnykh_form_nomenklaturnykh_del',
+    'NomenclatureAffairPrintTemplateFilter': 'shablony_pechatnykh_form_nomenklaturnykh_del',
+    'NomenclatureAffairPrintTemplateRequest': 'shablony_pechatnykh_form_nomenklaturnykh_del',
+    'NomenclatureAffairPrintTemplateUpdateRequest': 'shablony_pechatnykh_form_nomenklaturnykh_del',
+    'NomenclatureAffairPrintType': 'shablony_pechatnykh_form_nomenklaturnykh_del',
+    'NomenclatureAffairShelvingShelveRequest': 'nomenklatura_del_kartochka_dela',
+    'NomenclatureAffairWithPermission': 'nomenklatura_del_kartochka_dela',
+    'NomenclatureArchiveConfigDto': 'nastroechnyi_spravochnik_modulia',
+    'NomenclatureArchiveConfigRequest': 'nastroechnyi_spravochnik_modulia',
+    'NomenclatureDepartmentCancelRequest': 'common',
+    'NomenclatureDepartmentDto': 'common',
+    'NomenclatureDepartmentEntryDto': 'common',
+    'NomenclatureDepartmentFilter': 'nomenklatury_del_podrazdeleniia',
+    'NomenclatureDepartmentHistoryDto': 'nomenklatury_del_podrazdeleniia',
+    'NomenclatureDepartmentPath': 'common',
+    'NomenclatureDepartmentPermission': 'nomenklatury_del_podrazdeleniia',
+    'NomenclatureDepartmentProcessDto': 'common',
+    'NomenclatureDepartmentProcessExecutorDto': 'nomenklatury_del_podrazdeleniia',
+    'NomenclatureDepartmentProcessItemDto': 'nomenklatury_del_podrazdeleniia',
+    'NomenclatureDepartmentRequest': 'nomenklatury_del_podrazdeleniia',
+    'NomenclatureDepartmentStatus': 'vozmozhnosti_polzovatelia',
+    'NomenclatureDepartmentWithPermission': 'nomenklatury_del_podrazdeleniia',
+    'NomenclatureShelvingShelveDto': 'common',
+    'NomenclatureShelvingShelveFilter': 'nomenklaturnye_stellazhi_i_polki',
+    'NomenclatureShelvingShelveRequest': 'nomenklaturnye_stellazhi_i_polki',
+    'NomenclatureType': 'svodnye_nomenklatury_del',
+    'NomenclatureType2': 'svodnye_nomenklatury_del',
+    'NotificationsRulesDto': 'uvedomleniia',
+    'NotifyMeetingBody': 'dokument',
+    'NumDepSimpleProcessAction': 'nomenklatury_del_podrazdeleniia',
+    'OaisApimAuthConfigDto': 'nastroiki_ais_mv',
+    'OaisSmdoDocTypeConfigDto': 'nastroiki_ais_mv_spravochnik_vidov_dokumentov',
+    'OaisSmdoFileTypeConfigDto': 'nastroiki_ais_mv_spravochnik_tipov_failov',
+    'OaisSmdoSedTypeConfigDto': 'nastroiki_ais_mv_spravochnik_vidov_vedomstvennykh_sed',
+    'OaisSmdoSubscriberConfigDto': 'common',
+    'Operation': 'svodnye_nomenklatury_del',
+    'Operation1': 'nomenklatury_del_podrazdeleniia',
+    'Operation2': 'nomenklatura_del_kartochka_dela',
+    'Operation3': 'mini_dokument',
+    'Operation4': 'common',
+    'Operation5': 'akt_ob_unichtozhenii_del',
+    'Operation6': 'opis_strukturnykh_podrazdelenii_opis_sp',
+    'OperationType': 'nomenklatury_del_podrazdeleniia',
+    'OperationType1': 'svodnye_nomenklatury_del',
+    'OperationType2': 'common',
+    'OperationType3': 'akt_ob_unichtozhenii_del',
+    'OperationType4': 'opis_strukturnykh_podrazdelenii_opis_sp',
+    'Org': 'common',
+    'OrgApprovePerson': 'common',
+    'OrgDto': 'common',
+    'OrgKey': 'common',
+    'Organization': 'common',
+    'OrganizationDocument': 'migratsiia',
+    'PackageEoResponse': 'common',
+    'PackageRegSystemResponse': 'archive_registration_controller',
+    'Pageable': 'common',
+    'PanelType': 'informatsionnye_paneli_deistvii_polzovatelia',
+    'PaperworkProcessAction': 'common',
+    'Period': 'common',
+    'Period1': 'informatsionnye_paneli_deistvii_polzovatelia',
+    'Period3': 'porucheniia',
+    'Permission': 'common',
+    'PermissionDto': 'vozmozhnosti_polzovatelia',
+    'PermissionRoleDto': 'vozmozhnosti_polzovatelia',
+    'PersonalNotificationSettingDto': 'personalnye_nastroiki_polzovatelia',
+    'PersonalSetupDto': 'personalnye_nastroiki_polzovatelia',
+    'PersonalSetupLocalizationRequest': 'personalnye_nastroiki_polzovatelia',
+    'PersonalSetupRequest': 'personalnye_nastroiki_polzovatelia',
+    'Post': 'common',
+    'PostDto': 'common',
+    'PostIntroductionRequest': 'oznakomlenie',
+    'PostRequest': 'dolzhnosti',
+    'PresetPermissionDefinition': 'vozmozhnosti_polzovatelia',
+    'PresetPermissionDocCategoryPresetPermissionSetting': 'vozmozhnosti_polzovatelia',
+    'PresetPermissionDocCategoryPresetPermissionTaskDocStatus': 'vozmozhnosti_polzovatelia',
+    'PresetPermissionMergeRole': 'vozmozhnosti_polzovatelia',
+    'PresetPermissionPresetPermissionDocCategoryPresetPermissionSetting': 'vozmozhnosti_polzovatelia',
+    'PresetPermissionPresetPermissionDocCategoryPresetPermissionTaskDocStatus': 'vozmozhnosti_polzovatelia',
+    'PresetPermissionPresetPermissionRoleField': 'vozmozhnosti_polzovatelia',
+    'PresetPermissionPresetPermissionStatusRoleFieldAcceptanceInventoryStatus': 'vozmozhnosti_polzovatelia',
+    'PresetPermissionPresetPermissionStatusRoleFieldDestructionActStatus': 'vozmozhnosti_polzovatelia',
+    'PresetPermissionPresetPermissionStatusRoleFieldNomenclatureDepartmentStatus': 'vozmozhnosti_polzovatelia',
+    'PresetPermissionPresetPermissionStatusRoleFieldSummaryNomenclatureDepartmentStatus': 'vozmozhnosti_polzovatelia',
+    'PresetPermissionRoleField': 'vozmozhnosti_polzovatelia',
+    'PresetPermissionSetting': 'vozmozhnosti_polzovatelia',
+    'PresetPermissionStatusRoleFieldAcceptanceInventoryStatus': 'vozmozhnosti_polzovatelia',
+    'PresetPermissionStatusRoleFieldDestructionActStatus': 'vozmozhnosti_polzovatelia',
+    'PresetPermissionStatusRoleFieldNomenclatureDepartmentStatus': 'vozmozhnosti_polzovatelia',
+    'PresetPermissionStatusRoleFieldSummaryNomenclatureDepartmentStatus': 'vozmozhnosti_polzovatelia',
+    'PresetPermissionString': 'vozmozhnosti_polzovatelia',
+    'PresetPermissionTaskDocStatus': 'vozmozhnosti_polzovatelia',
+    'ProcessActionWithSign': 'protsessy_dokumenta',
+    'ProcessCopyType': 'dokument',
+    'ProcessExecutorWithPos': 'protsessy_dokumenta',
+    'ProcessItemDefinition': 'spravochnik_marshrutov',
+    'ProfileAttachmentDto': 'profili_dokumenta',
+    'ProfileContractAttachmentDto': 'profili_dokumenta',
+    'ProviderParams': 'statistika_dlia_polzovatelia',
+    'Recipient': 'migratsiia',
+    'RecipientCopyType': 'dokument',
+    'RecognitionFileTypeEnum': 'common',
+    'RecognitionLanguageEnum': 'common',
+    'RecognitionSetupDto': 'common',
+    'RedirectReviewProcessAction': 'protsessy_dokumenta',
+    'RefreshToken': 'avtorizatsiia',
+    'RegionDto': 'common',
+    'RegistrationJournal': 'zhurnaly_registratsii',
+    'RegistrationJournalDto': 'common',
+    'RegistrationProcessRequest': 'protsessy_dokumenta',
+    'RemindersRulesDto': 'napominaniia',
+    'RenameFileRequest': 'attachi_dokumenta',
+    'RepeatExecutionPolicy': 'protsessy_dokumenta',
+    'RepeatIdenticalAppealDto': 'common',
+    'Report': 'otchety',
+    'ReportConstructorDto': 'otchety',
+    'ReportDto': 'otchety',
+    'ReportFilter': 'otchety',
+    'ReportUserConfigDto': 'polzovatelskie_konfiguratsii_otcheta',
+    'ReportUserConfigFilter': 'polzovatelskie_konfiguratsii_otcheta',
+    'ReportUserConfigRequest': 'polzovatelskie_konfiguratsii_otcheta',
+    'ReportUserField': 'polzovatelskie_konfiguratsii_otcheta',
+    'RequestDateExecutionResult': 'porucheniia_perenos_sroka_ispolneniia',
+    'RequiredFieldEnum': 'common',
+    'RequiredFieldEnum1': 'common',
+    'ReserveRegnumberRequest': 'protsessy_dokumenta',
+    'ResolvePolicy': 'vozmozhnosti_polzovatelia',
+    'ResolvePolicy1': 'common',
+    'ResponsibleUpdate': 'common',
+    'ReturnInventoryStatus': 'archive_registration_controller',
+    'Role': 'sotrudniki',
+    'Role1': 'common',
+    'RoleAddRequest': 'roli_polzovatelei',
+    'RoleDto': 'common',
+    'RoleEmployee': 'common',
+    'RoleMerge': 'common',
+    'RoleMergeDto': 'vozmozhnosti_polzovatelia',
+    'RolePermission': 'common',
+    'RoleRequest': 'roli_polzovatelei',
+    'RoleUpdateRequest': 'roli_polzovatelei',
+    'RouterDirectoryDto': 'spravochnik_marshrutov',
+    'RouterDirectoryFilter': 'spravochnik_marshrutov',
+    'RuleType': 'uvedomleniia',
+    'SaveInventoryResponse': 'common',
+    'ScanSettingJsonB': 'common',
+    'Secretary': 'common',
+    'SecretaryRequest': 'sotrudniki_io',
+    'SedOrgDto': 'kontury_sed',
+    'SedTypeDto': 'smdo_sed_type_controller',
+    'SenderAttachment': 'aismv_org_package_controller',
+    'ServerInfo': 'info_controller',
+    'SettingWorkDay': 'kalendar_rabochikh_dnei',
+    'Signature': 'common',
+    'SimpleCmsDTO': 'common',
+    'SimpleDocumentCommentDto': 'kommentarii_k_dokumentu',
+    'SimpleProcessAction': 'protsessy_dokumenta',
+    'SliceDtoAcceptanceInventoryHistoryDto': 'opis_strukturnykh_podrazdelenii_opis_sp',
+    'SliceDtoAismvOrgPackageDto': 'aismv_org_package_controller',
+    'SliceDtoArchiveFundDto': 'arkhivnye_fondy',
+    'SliceDtoBpmnProcessDirectoryDto': 'bpmn_process_directory_controller',
+    'SliceDtoDepartmentDto': 'common',
+    'SliceDtoDestructionActDto': 'akt_ob_unichtozhenii_del',
+    'SliceDtoDestructionActHistoryDto': 'akt_ob_unichtozhenii_del',
+    'SliceDtoDestructionActNomenclatureAffairLinkDto': 'akt_ob_unichtozhenii_del',
+    'SliceDtoDocTypeDto': 'smdo_doc_type_controller',
+    'SliceDtoDocumentFormDto': 'formy_dokumentov',
+    'SliceDtoEmployeeAccessGriefDto': 'grify_dostupa',
+    'SliceDtoErrorHistoryDto': 'error_history_controller',
+    'SliceDtoFileTypeDto': 'smdo_file_type_controller',
+    'SliceDtoFormFieldRegistryEntryDto': 'reestr_polei_form',
+    'SliceDtoGeneralSetupDto': 'obshchaia_nastroika_dokumenta_sed',
+    'SliceDtoInnerInventoryDataDto': 'opis_strukturnykh_podrazdelenii_opis_sp',
+    'SliceDtoMigrationSetupDto': 'nastroika_dlia_migratsii_dokumentov_spravochnikov',
+    'SliceDtoSedTypeDto': 'smdo_sed_type_controller',
+    'SliceDtoSubscriberDto': 'smdo_subscriber_controller',
+    'SliceDtoSummaryNomenclatureDepartmentDto': 'svodnye_nomenklatury_del',
+    'SliceDtoSummaryNomenclatureDepartmentHistoryDto': 'svodnye_nomenklatury_del',
+    'SliceDtoSummaryNomenclatureDepartmentLinkDto': 'svodnye_nomenklatury_del',
+    'SliceDtoUserNotificationDto': 'uvedomleniia_polzovatelia',
+    'SliceDtoWorkCalendarDto': 'kalendar_rabochikh_dnei',
+    'SmdoRegistrationReject': 'protsessy_dokumenta',
+    'SolutionResultDto': 'common',
+    'SolutionResultRequest': 'rezultat_resheniia',
+    'Speaker': 'common',
+    'SpeakerDto': 'common',
+    'SpnegoAuthDebug': 'avtorizatsiia',
+    'Status': 'common',
+    'Status1': 'common',
+    'Status2': 'common',
+    'Status25': 'akt_ob_unichtozhenii_del',
+    'Status4': 'common',
+    'Status6': 'common',
+    'Status7': 'svodnye_nomenklatury_del',
+    'Status8': 'common',
+    'Status9': 'kontrolnye_tochki_ispolneniia_dogovora',
+    'StatusEnum2': 'nomenklatura_del_kartochka_dela',
+    'StoragePeriod': 'srok_khraneniia',
+    'StoragePeriodDto': 'common',
+    'StoragePeriodRequest': 'srok_khraneniia',
+    'StoragePeriodType': 'common',
+    'StoragePeriodType2': 'common',
+    'StorageType': 'common',
+    'StorageType1': 'akt_ob_unichtozhenii_del',
+    'StoreAttribute': 'common',
+    'SubjectDto': 'common',
+    'SubjectFilter': 'tematika',
+    'SubjectRequest': 'tematika',
+    'SubscriberDto': 'common',
+    'SubscriberFilter': 'smdo_subscriber_controller',
+    'SummaryCancelRequest': 'svodnye_nomenklatury_del',
+    'SummaryInventoryReportDto': 'svodnaia_opis_del',
+    'SummaryInventoryReportEditRequest': 'svodnaia_opis_del',
+    'SummaryInventoryReportFilter': 'svodnaia_opis_del',
+    'SummaryInventoryReportRequest': 'svodnaia_opis_del',
+    'SummaryNomDepHistoryActionData': 'svodnye_nomenklatury_del',
+    'SummaryNomDepOperation': 'svodnye_nomenklatury_del',
+    'SummaryNomenclatureDepartmentDto': 'svodnye_nomenklatury_del',
+    'SummaryNomenclatureDepartmentFilter': 'svodnye_nomenklatury_del',
+    'SummaryNomenclatureDepartmentHistoryDto': 'svodnye_nomenklatury_del',
+    'SummaryNomenclatureDepartmentIntroductionDto': 'svodnye_nomenklatury_del',
+    'SummaryNomenclatureDepartmentIntroductionRequest': 'common',
+    'SummaryNomenclatureDepartmentLinkDto': 'svodnye_nomenklatury_del',
+    'SummaryNomenclatureDepartmentLinkFilter': 'svodnye_nomenklatury_del',
+    'SummaryNomenclatureDepartmentPermission': 'svodnye_nomenklatury_del',
+    'SummaryNomenclatureDepartmentProcessAction': 'common',
+    'SummaryNomenclatureDepartmentProcessDto': 'svodnye_nomenklatury_del',
+    'SummaryNomenclatureDepartmentProcessExecutorDto': 'svodnye_nomenklatury_del',
+    'SummaryNomenclatureDepartmentProcessItemDto': 'svodnye_nomenklatury_del',
+    'SummaryNomenclatureDepartmentRequest': 'common',
+    'SummaryNomenclatureDepartmentStatus': 'vozmozhnosti_polzovatelia',
+    'SummaryNomenclatureDepartmentStatus1': 'common',
+    'SummaryNomenclatureDepartmentWithPermission': 'svodnye_nomenklatury_del',
+    'Task': 'common',
+    'TaskChangeDateRequest': 'porucheniia_perenos_sroka_ispolneniia',
+    'TaskChangeDateRequestDto': 'common',
+    'TaskComment': 'migratsiia',
+    'TaskControlUserCalendarEntry': 'lichnyi_kalendar_polzovatelia',
+    'TaskDocumentLinkDto': 'common',
+    'TaskDto': 'common',
+    'TaskExecutionResult': 'porucheniia',
+    'TaskExecutors': 'common',
+    'TaskExecutorsDto': 'common',
+    'TaskFilter': 'porucheniia_kontrol',
+    'TaskHistoryDto': 'common',
+    'TaskKanbanColumnDto': 'porucheniia_kontrol',
+    'TaskOnControlReportFilter': 'otchety',
+    'TaskOnStatusReportFilter': 'otchety',
+    'TaskProjectDto': 'proekty_porucheniia_v_dokumente',
+    'TaskProjectExecutorDto': 'proekty_porucheniia_v_dokumente',
+    'TaskProjectFilter': 'proekty_porucheniia',
+    'TaskRevisionRequest': 'porucheniia',
+    'TaskStatus': 'common',
+    'TaskStatusDirectum': 'common',
+    'TaskType1': 'common',
+    'TaskUserCalendarEntry': 'lichnyi_kalendar_polzovatelia',
+    'Template': 'common',
+    'Template1': 'otchety',
+    'TemplateAddRequest': 'shablony_pechatnykh_form',
+    'TemplateContractAddRequest': 'shablony_dogovorov',
+    'TemplateContractDto': 'shablony_dogovorov',
+    'TemplateContractRequest': 'shablony_dogovorov',
+    'TemplateContractUpdateRequest': 'shablony_dogovorov',
+    'TemplateDto': 'shablony_pechatnykh_form',
+    'TemplateRequest': 'shablony_pechatnykh_form',
+    'TemplateRkkSetupRequest': 'nastroika_shablonov_rkk_po_umolchaniiu',
+    'TemplateUpdateRequest': 'shablony_pechatnykh_form',
+    'TemporaryAttachmentDto': 'vremennye_vlozheniia_dokumenta',
+    'TermDocumentUserCalendarEntry': 'lichnyi_kalendar_polzovatelia',
+    'TestAdAuth': 'ad_config_controller',
+    'TestWithAuth': 'ad_config_controller',
+    'TokenResponse': 'avtorizatsiia',
+    'Type': 'common',
+    'Type1': 'common',
+    'Type10': 'common',
+    'Type11': 'common',
+    'Type12': 'common',
+    'Type13': 'svodnye_nomenklatury_del',
+    'Type14': 'common',
+    'Type16': 'polzovatelskie_konfiguratsii_otcheta',
+    'Type18': 'vozmozhnosti_polzovatelia',
+    'Type19': 'nomenklatury_del_podrazdeleniia',
+    'Type2': 'common',
+    'Type21': 'reestr_polei_form',
+    'Type22': 'kontrolnye_tochki_ispolneniia_dogovora',
+    'Type23': 'adresaty_korrespondenty',
+    'Type24': 'common',
+    'Type26': 'common',
+    'Type28': 'otchety',
+    'Type3': 'common',
+    'Type36': 'sotrudniki_io',
+    'Type4': 'common',
+    'Type40': 'uvedomleniia_polzovatelia',
+    'Type41': 'logirovanie_sobytii',
+    'Type49': 'shablony_pechatnykh_form_nomenklaturnykh_del',
+    'Type52': 'common',
+    'Type7': 'common',
+    'Type8': 'common',
+    'TypeDirectum': 'common',
+    'TypicalControlPointDto': 'tipovye_kontrolnye_tochki',
+    'TypicalControlPointRequest': 'common',
+    'TypicalSummary': 'tipovye_kratkie_soderzhaniia',
+    'TypicalSummaryTaskDto': 'tipovye_kratkie_soderzhaniia_porucheniia',
+    'TypicalSummaryTaskRequest': 'tipovye_kratkie_soderzhaniia_porucheniia',
+    'UnifiedDocumentationSystemDto': 'common',
+    'UnifiedDocumentationSystemRequest': 'common',
+    'UpdateDocumentType': 'migratsiia',
+    'UpdateTaskProjectRequest': 'proekty_porucheniia_v_dokumente',
+    'UpdateTaskRequest': 'porucheniia',
+    'UserActionDashboard': 'logirovanie_sobytii',
+    'UserActionDto': 'logirovanie_sobytii',
+    'UserActionFilter': 'logirovanie_sobytii',
+    'UserActionPanelBase': 'informatsionnye_paneli_deistvii_polzovatelia',
+    'UserActionPanelCountResponse': 'informatsionnye_paneli_deistvii_polzovatelia',
+    'UserActionPanelRequest': 'informatsionnye_paneli_deistvii_polzovatelia',
+    'UserCalendarEntry': 'lichnyi_kalendar_polzovatelia',
+    'UserDashboardDto': 'common',
+    'UserDashboardTodolistDto': 'user_home_dashboard_todolist_controller',
+    'UserDocPermission': 'common',
+    'UserInfo': 'common',
+    'UserInfoDto': 'common',
+    'UserNotificationDto': 'uvedomleniia_polzovatelia',
+    'UserNotificationFilter': 'uvedomleniia_polzovatelia',
+    'UserNotificationStatDto': 'uvedomleniia_polzovatelia',
+    'WorkCalendarDto': 'kalendar_rabochikh_dnei',
+    'WorkCalendarRequest': 'kalendar_rabochikh_dnei',
+    'WsSystem': 'common',
+    'YearPostfix': 'common',
+    'YearPostfix2': 'srok_khraneniia',
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    # Следующие обращения к модели идут мимо __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_MODULES))
@@ -0,0 +1,68 @@
+# src/edms_assistant/infrastructure/resources_openapi/ad_config_controller.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import DepartmentDto
+
+
+class LdapUser(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    phone: str | None = None
+    email: str | None = None
+    photo: str | None = None
+    fio: str | None = None
+    post: str | None = None
+    departmentName: str | None = None
+    getsAMAccountName: str | None = None
+    sid: str | None = None
+    firstName: str | None = None
+    lastName: str | None = None
+    middleName: str | None = None
+
+
+class TestAdAuth(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    url: str | None = None
+    dn: str | None = None
+    password: str | None = None
+
+
+class AdConfigDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    enabled: bool | None = None
+    filter: str
+    dn: str
+    departmentId: UUID
+    department: DepartmentDto | None = None
+    phone: str | None = None
+    email: str | None = None
+    photo: str | None = None
+    fioSingleField: bool
+    syncExistUsers: bool
+    fio: str | None = None
+    firstName: str | None = None
+    lastName: str | None = None
+    middleName: str | None = None
+    post: str | None = None
+    departmentName: str | None = None
+
+
+class TestWithAuth(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    config: AdConfigDto | None = None
+    auth: TestAdAuth | None = None
+
@@ -0,0 +1,118 @@
+# src/edms_assistant/infrastructure/resources_openapi/adresaty_korrespondenty.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    ContactFaceRequest,
+    CountryDto,
+    GeneralSetupDto,
+    Type2,
+)
+
+
+class Type23(Enum):
+    """
+    Тип организации
+    """
+
+    NORMAL = "NORMAL"
+    AISMV = "AISMV"
+    DIRECTUM = "DIRECTUM"
+    GTB_ORG = "GTB_ORG"
+
+
+class Include18(Enum):
+    DELIVERY_METHOD = "DELIVERY_METHOD"
+    DEPARTMENT = "DEPARTMENT"
+    SUBSCRIBER = "SUBSCRIBER"
+    COUNTRY = "COUNTRY"
+
+
+class CorrespondentFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    search: Annotated[str | None, Field(description="Строка поиска")] = None
+    active: Annotated[
+        bool | None, Field(description="Признак активен ли адресат/корреспондент")
+    ] = None
+    excludeCorrespondentGroupId: Annotated[
+        UUID | None,
+        Field(description="Id группы адресатов/корреспондентов для исключения"),
+    ] = None
+    type: Type2 | None = None
+    includes: Annotated[
+        list[Include18] | None,
+        Field(description="Список моделей которые могу быть добавлены при отображении"),
+    ] = None
+
+
+class CorrespondentRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор адресата/корреспондента")
+    ] = None
+    name: Annotated[
+        str | None, Field(description="Наименование адресата/корреспондента")
+    ] = None
+    code: Annotated[str, Field(description="Код")]
+    postfix: Annotated[str | None, Field(description="Постфикс")] = None
+    countryId: Annotated[UUID | None, Field(description="Идентификатор страны")] = None
+    country: Annotated[CountryDto | None, Field(description="Страна")] = None
+    regionId: Annotated[UUID | None, Field(description="Идентификатор области")] = None
+    districtId: Annotated[UUID | None, Field(description="Идентификатор района")] = None
+    cityId: Annotated[UUID | None, Field(description="Идентификатор города")] = None
+    address: Annotated[str | None, Field(description="Адрес")] = None
+    postcode: Annotated[str | None, Field(description="Почтовый индекс")] = None
+    mail: Annotated[str | None, Field(description="Почта")] = None
+    phone: Annotated[str | None, Field(description="Телефон")] = None
+    deliveryMethodId: Annotated[
+        int | None, Field(description="Идентификатор способа доставки")
+    ] = None
+    type: Annotated[Type23 | None, Field(description="Тип организации")] = None
+    setupId: Annotated[
+        str | None,
+        Field(description="Идентификатор организации общей настройки документа СЭД"),
+    ] = None
+    setup: Annotated[
+        GeneralSetupDto | None, Field(description="Общий настроечный документ СЭД")
+    ] = None
+    active: Annotated[
+        bool | None,
+        Field(
+            description="Признак является ли данный адресат/корреспондент действующим или упраздненным"
+        ),
+    ] = None
+    stateOrgan: Annotated[
+        bool | None,
+        Field(description="Отметка является ли адресат/корреспондент гос. органом"),
+    ] = None
+    cityName: str | None = None
+    regionName: str | None = None
+    districtName: str | None = None
+
+
+class CorrespondentUpdateRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    correspondent: CorrespondentRequest
+    contactFaces: list[ContactFaceRequest] | None = None
+    contactFaceDelete: list[UUID] | None = None
+
+
+class CorrespondentAddRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    correspondent: CorrespondentRequest
+    contactFaceAdd: list[ContactFaceRequest] | None = None
+
@@ -0,0 +1,43 @@
+# src/edms_assistant/infrastructure/resources_openapi/aismv_cert_info_controller.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import CertInfo
+
+
+class CrlInfo(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    start: datetime | None = None
+    end: datetime | None = None
+    issuer: str | None = None
+    serialNumber: str | None = None
+
+
+class IdString(BaseModel):
+    """
+    Идентификатор
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: str
+
+
+class AismvCertInfoDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    enabled: bool | None = None
+    roots: list[CertInfo] | None = None
+    ca: list[CertInfo] | None = None
+    crls: list[CrlInfo] | None = None
+
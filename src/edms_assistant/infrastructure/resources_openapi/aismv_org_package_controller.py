@@ -0,0 +1,84 @@
+# src/edms_assistant/infrastructure/resources_openapi/aismv_org_package_controller.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import Signature
+
+
+class AismvOrgPackageFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    errors: bool | None = None
+    processed: bool | None = None
+    dateInLte: datetime | None = None
+
+
+class MinioAttachment(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    minioName: str | None = None
+    bucketName: str | None = None
+    size: int | None = None
+    originalName: str | None = None
+    beltHash: str | None = None
+
+
+class SenderAttachment(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    size: int | None = None
+    name: str | None = None
+    antivirus: bool | None = None
+    antivirusStmp: datetime | None = None
+    eds: bool | None = None
+    edsStmp: datetime | None = None
+    sign: list[Signature] | None = None
+
+
+class DownloadedSenderAttachment(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    senderAttachment: SenderAttachment | None = None
+    minioAttachment: MinioAttachment | None = None
+
+
+class AismvOrgPackageDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    packageId: UUID | None = None
+    parentId: UUID | None = None
+    idFrom: str | None = None
+    typeFrom: str | None = None
+    nameFrom: str | None = None
+    headerId: str | None = None
+    ack: bool | None = None
+    body: dict[str, Any] | None = None
+    attachments: list[DownloadedSenderAttachment] | None = None
+    processed: bool | None = None
+    errors: bool | None = None
+    errorMessage: str | None = None
+    trace: str | None = None
+    dateIn: datetime | None = None
+
+
+class SliceDtoAismvOrgPackageDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[AismvOrgPackageDto] | None = None
+
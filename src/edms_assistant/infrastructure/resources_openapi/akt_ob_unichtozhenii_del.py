@@ -0,0 +1,278 @@
+# src/edms_assistant/infrastructure/resources_openapi/akt_ob_unichtozhenii_del.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    DestructionActDto,
+    DestructionActStatus1,
+    NomenclatureAffairDto,
+    SummaryNomenclatureDepartmentProcessAction,
+    SummaryNomenclatureDepartmentRequest,
+    UserInfoDto,
+)
+
+
+class DestructionActProcessAction(SummaryNomenclatureDepartmentProcessAction):
+    pass
+
+
+class DestructionActRequest(SummaryNomenclatureDepartmentRequest):
+    pass
+
+
+class DestroyAckRequestBody(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    date: datetime
+
+
+class DestructionActCancelRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    comment: Annotated[
+        str | None, Field(description="Комментарий к отмене акта уничтожения")
+    ] = None
+
+
+class StorageType1(Enum):
+    """
+    Тип хранения (ARCHIVE - архивное, OPERATIONAL - оперативное)
+    """
+
+    ARCHIVE = "ARCHIVE"
+    OPERATIONAL = "OPERATIONAL"
+
+
+class DestructionActCreateRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    nomenclatureAffairIds: Annotated[
+        list[UUID],
+        Field(
+            description="Идентификаторы номенклатурных дел для уничтожения", min_items=1
+        ),
+    ]
+    storageType: Annotated[
+        StorageType1,
+        Field(
+            description="Тип хранения (ARCHIVE - архивное, OPERATIONAL - оперативное)"
+        ),
+    ]
+
+
+class OperationType3(Enum):
+    """
+    Тип операции
+    """
+
+    DESTRUCTION_ACT_READ = "DESTRUCTION_ACT_READ"
+    DESTRUCTION_ACT_UPDATE = "DESTRUCTION_ACT_UPDATE"
+    DESTRUCTION_ACT_DELETE = "DESTRUCTION_ACT_DELETE"
+    DESTRUCTION_ACT_PROCESS_EXECUTORS_UPDATE = (
+        "DESTRUCTION_ACT_PROCESS_EXECUTORS_UPDATE"
+    )
+    DESTRUCTION_ACT_PROCESS_ITEM_UPDATE = "DESTRUCTION_ACT_PROCESS_ITEM_UPDATE"
+    DESTRUCTION_ACT_START = "DESTRUCTION_ACT_START"
+    DESTRUCTION_ACT_AGREEMENT = "DESTRUCTION_ACT_AGREEMENT"
+    DESTRUCTION_ACT_SIGNING = "DESTRUCTION_ACT_SIGNING"
+    DESTRUCTION_ACT_STATEMENT = "DESTRUCTION_ACT_STATEMENT"
+    DESTRUCTION_ACT_CANCEL = "DESTRUCTION_ACT_CANCEL"
+    DESTRUCTION_ACT_DESTROY = "DESTRUCTION_ACT_DESTROY"
+    DESTRUCTION_ACT_DESTROY_CHANGE_DATE = "DESTRUCTION_ACT_DESTROY_CHANGE_DATE"
+    DESTRUCTION_ACT_PRINT = "DESTRUCTION_ACT_PRINT"
+
+
+class DestructionActOperation(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    operationType: Annotated[OperationType3, Field(description="Тип операции")]
+    body: Annotated[Any | None, Field(description="Тело операции")] = None
+
+
+class Include17(Enum):
+    AUTHOR = "AUTHOR"
+    PROCESS = "PROCESS"
+    PROTOCOL_DOCUMENT = "PROTOCOL_DOCUMENT"
+    FUND = "FUND"
+
+
+class DestructionActFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    destructionDateIsNotNull: bool | None = None
+    year: int | None = None
+    number: str | None = None
+    statuses: list[DestructionActStatus1] | None = None
+    includes: list[Include17] | None = None
+    currentUserExecutor: bool | None = None
+
+
+class Operation5(Enum):
+    """
+    Перечисления доступных операций над сущностями в акте уничтожения дел
+    """
+
+    DESTRUCTION_ACT_READ = "DESTRUCTION_ACT_READ"
+    DESTRUCTION_ACT_UPDATE = "DESTRUCTION_ACT_UPDATE"
+    DESTRUCTION_ACT_DELETE = "DESTRUCTION_ACT_DELETE"
+    DESTRUCTION_ACT_PROCESS_EXECUTORS_UPDATE = (
+        "DESTRUCTION_ACT_PROCESS_EXECUTORS_UPDATE"
+    )
+    DESTRUCTION_ACT_PROCESS_ITEM_UPDATE = "DESTRUCTION_ACT_PROCESS_ITEM_UPDATE"
+    DESTRUCTION_ACT_START = "DESTRUCTION_ACT_START"
+    DESTRUCTION_ACT_AGREEMENT = "DESTRUCTION_ACT_AGREEMENT"
+    DESTRUCTION_ACT_SIGNING = "DESTRUCTION_ACT_SIGNING"
+    DESTRUCTION_ACT_STATEMENT = "DESTRUCTION_ACT_STATEMENT"
+    DESTRUCTION_ACT_CANCEL = "DESTRUCTION_ACT_CANCEL"
+    DESTRUCTION_ACT_DESTROY = "DESTRUCTION_ACT_DESTROY"
+    DESTRUCTION_ACT_DESTROY_CHANGE_DATE = "DESTRUCTION_ACT_DESTROY_CHANGE_DATE"
+    DESTRUCTION_ACT_PRINT = "DESTRUCTION_ACT_PRINT"
+
+
+class DestructionActPermission(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    operation: Annotated[
+        Operation5 | None,
+        Field(
+            description="Перечисления доступных операций над сущностями в акте уничтожения дел"
+        ),
+    ] = None
+    employees: Annotated[set[UUID] | None, Field()] = None
+
+
+class Status25(Enum):
+    ACTIVE = "ACTIVE"
+    CANCEL = "CANCEL"
+    ERROR = "ERROR"
+    COMPLETED = "COMPLETED"
+
+
+class ActionType3(Enum):
+    CREATE = "CREATE"
+    UPDATE = "UPDATE"
+    REJECT = "REJECT"
+    ACTION = "ACTION"
+    CREATED = "CREATED"
+    STEP_END = "STEP_END"
+    STEP_START = "STEP_START"
+    PROCESS_START = "PROCESS_START"
+    MAIN_FIELDS_UPDATE = "MAIN_FIELDS_UPDATE"
+    PROCESS_ITEM_UPDATE = "PROCESS_ITEM_UPDATE"
+    PROCESS_ITEM_EXECUTORS_UPDATE = "PROCESS_ITEM_EXECUTORS_UPDATE"
+    START = "START"
+    AGREEMENT = "AGREEMENT"
+    SIGNING = "SIGNING"
+    STATEMENT = "STATEMENT"
+    DELETE = "DELETE"
+    DOCUMENT_PROTOCOL_DELETE = "DOCUMENT_PROTOCOL_DELETE"
+    CANCEL = "CANCEL"
+    AFFAIRS_CANCELLED = "AFFAIRS_CANCELLED"
+    AFFAIRS_RESTORED = "AFFAIRS_RESTORED"
+    ATTACHMENT_ADDED = "ATTACHMENT_ADDED"
+    ATTACHMENT_DELETED = "ATTACHMENT_DELETED"
+    DESTRUCTION_ACT_PRINT = "DESTRUCTION_ACT_PRINT"
+    DESTROY_COMPLETED = "DESTROY_COMPLETED"
+    DESTROYED = "DESTROYED"
+
+
+class DestructionActHistoryActionData(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    actionType: ActionType3 | None = None
+    data: dict[str, Any] | None = None
+
+
+class DestructionActNomenclatureAffairFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    destructionActId: UUID | None = None
+    name: Annotated[str | None, Field(description="Имя номенклатурного дела")] = None
+    nextRetryIsNotNull: Annotated[
+        bool | None, Field(description="Только те у которых определенно время удаления")
+    ] = None
+
+
+class SliceDtoDestructionActDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[DestructionActDto] | None = None
+
+
+class DestructionActNomenclatureAffairLinkDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор связи")] = None
+    organizationId: Annotated[
+        str | None, Field(description="Идентификатор организации")
+    ] = None
+    destructionActId: Annotated[
+        UUID | None, Field(description="Идентификатор акта уничтожения дел")
+    ] = None
+    destructionAct: Annotated[
+        DestructionActDto | None, Field(description="Акт уничтожения дел")
+    ] = None
+    nomenclatureAffairId: Annotated[
+        UUID | None, Field(description="Идентификатор номенклатурного дела")
+    ] = None
+    nomenclatureAffair: Annotated[
+        NomenclatureAffairDto | None, Field(description="Номенклатурное дело")
+    ] = None
+    order: Annotated[int | None, Field(description="Порядковый номер в списке")] = None
+    status: Status25 | None = None
+    retryCount: int | None = None
+    nextRetry: datetime | None = None
+    errorMessage: str | None = None
+
+
+class SliceDtoDestructionActNomenclatureAffairLinkDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[DestructionActNomenclatureAffairLinkDto] | None = None
+
+
+class DestructionActHistoryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    organizationId: str | None = None
+    destructionActId: UUID | None = None
+    author: UserInfoDto | None = None
+    createDate: datetime | None = None
+    data: list[DestructionActHistoryActionData] | None = None
+
+
+class SliceDtoDestructionActHistoryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[DestructionActHistoryDto] | None = None
+
+
+class DestructionActWithPermission(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    destructionAct: DestructionActDto | None = None
+    permission: list[DestructionActPermission] | None = None
+
@@ -0,0 +1,64 @@
+# src/edms_assistant/infrastructure/resources_openapi/archive_registration_controller.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    ListInformation,
+    PackageEoResponse,
+)
+
+
+class ArchiveRegistrationRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    orgName: str | None = None
+    unp: str | None = None
+    unpf: str | None = None
+    sysId: str | None = None
+    sedSysId: str | None = None
+    fundNumber: int | None = None
+
+
+class PackageRegSystemResponse(PackageEoResponse):
+    pass
+
+
+class ReturnInventoryStatus(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    inventoryId: int | None = None
+    status: str
+    comment: str | None = None
+
+
+class ArchiveRegistrationDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    orgName: str | None = None
+    unp: str | None = None
+    unpf: str | None = None
+    sysId: str | None = None
+    sedSysId: str | None = None
+    fundNumber: int | None = None
+    data: PackageRegSystemResponse | None = None
+
+
+class GetInventoryStatusResponse2(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    listInformation: ListInformation
+    idpackage: str | None = None
+    type: str | None = None
+    dateoftransmission: str | None = None
+    inventory: ReturnInventoryStatus | None = None
+
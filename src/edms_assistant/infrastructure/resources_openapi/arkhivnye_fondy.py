@@ -0,0 +1,33 @@
+# src/edms_assistant/infrastructure/resources_openapi/arkhivnye_fondy.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    ArchiveFundDto,
+    UnifiedDocumentationSystemRequest,
+)
+
+
+class ArchiveFundRequest(UnifiedDocumentationSystemRequest):
+    pass
+
+
+class SliceDtoArchiveFundDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[ArchiveFundDto] | None = None
+
@@ -0,0 +1,48 @@
+# src/edms_assistant/infrastructure/resources_openapi/atributnye_sertifikaty_sotrudnika.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class AttrCertInfo(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    start: datetime | None = None
+    end: datetime | None = None
+    issuer: str | None = None
+    holder: str | None = None
+    serialNumber: str | None = None
+    unp: str | None = None
+    unpf: str | None = None
+    organizationName: str | None = None
+    position: str | None = None
+    base64: str | None = None
+
+
+class EmployeeAttrCertInfoDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None,
+        Field(description="Идентификатор записи атрибутного сертификата сотрудника"),
+    ] = None
+    employeeId: Annotated[
+        UUID | None, Field(description="Идентификатор сотрудника")
+    ] = None
+    certificate: Annotated[
+        AttrCertInfo | None,
+        Field(description="Информация об атрибутном сертификате сотрудника"),
+    ] = None
+    serialNumber: Annotated[
+        str | None, Field(description="Серийный номер сертификата")
+    ] = None
+
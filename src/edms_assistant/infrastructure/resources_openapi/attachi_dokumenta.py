@@ -0,0 +1,39 @@
+# src/edms_assistant/infrastructure/resources_openapi/attachi_dokumenta.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import AttachmentDocumentType1
+
+
+class KtaSign(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    cok: Annotated[
+        str, Field(description="Сертификат открытого ключа в base64", min_length=1)
+    ]
+    sig: Annotated[
+        str, Field(description="Хэш подписи (48 байт) в base64", min_length=1)
+    ]
+
+
+class RenameFileRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: Annotated[str, Field(min_length=1)]
+
+
+class ChangeAttachmentDocumentTypeRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    attachmentDocumentType: AttachmentDocumentType1
+
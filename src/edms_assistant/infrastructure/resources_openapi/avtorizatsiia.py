@@ -0,0 +1,47 @@
+# src/edms_assistant/infrastructure/resources_openapi/avtorizatsiia.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import CurrentUser
+
+
+class RefreshToken(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    refreshToken: Annotated[str, Field(min_length=1)]
+
+
+class BasicAuthRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    login: Annotated[str, Field(min_length=1)]
+    password: Annotated[str, Field(min_length=1)]
+
+
+class TokenResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    token: str | None = None
+    refreshToken: str | None = None
+    me: CurrentUser | None = None
+
+
+class SpnegoAuthDebug(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    domainName: str | None = None
+    ldapPersonalNumber: str | None = None
+    user: CurrentUser | None = None
+    dbUserCount: int | None = None
+    ldapAttributes: dict[str, Any] | None = None
+
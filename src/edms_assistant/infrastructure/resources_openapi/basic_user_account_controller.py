@@ -0,0 +1,33 @@
+# src/edms_assistant/infrastructure/resources_openapi/basic_user_account_controller.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class BasicUserAccountUpdate(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    login: Annotated[str, Field(min_length=1)]
+    password: Annotated[str, Field(min_length=1)]
+    oldPassword: Annotated[str, Field(min_length=1)]
+
+
+class BasicUserAccountChange(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    login: str | None = None
+    password: str | None = None
+
+
+class BasicUserAccountCreate(BasicUserAccountChange):
+    pass
+
@@ -0,0 +1,47 @@
+# src/edms_assistant/infrastructure/resources_openapi/bpmn_process_directory_controller.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    BpmnProcessDirectoryDto,
+    DocCategory,
+)
+
+
+class BpmnProcessDirectoryRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    name: Annotated[str, Field(min_length=1)]
+    xml: Annotated[str, Field(min_length=1)]
+    docCategory: DocCategory
+    active: bool
+
+
+class BpmnSearchRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    docCategory: DocCategory | None = None
+    search: Annotated[str | None, Field(description="Строка поиска")] = None
+    active: Annotated[bool | None, Field(description="Признак активности")] = None
+
+
+class SliceDtoBpmnProcessDirectoryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[BpmnProcessDirectoryDto] | None = None
+
@@ -0,0 +1,5394 @@
+# src/edms_assistant/infrastructure/resources_openapi/common.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class Pageable(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    page: Annotated[Any | None, Field(example=0)] = None
+    size: Annotated[Any | None, Field(example=20)] = None
+    sort: Annotated[list[str] | None, Field(example=["id,asc"])] = None
+
+
+class StoreAttribute(Enum):
+    PERMANENT = "PERMANENT"
+    TEMPORARY = "TEMPORARY"
+    END_OF_NEED = "END_OF_NEED"
+    BY_STAFF = "BY_STAFF"
+
+
+class JobStatus(Enum):
+    NEW = "NEW"
+    AWAITING_CONVERSION = "AWAITING_CONVERSION"
+    READY = "READY"
+    IN_WORK_CONVERSION = "IN_WORK_CONVERSION"
+    COMPLETED = "COMPLETED"
+    SIGNED = "SIGNED"
+    DISPATCH = "DISPATCH"
+    IN_WORK_DISPATCH = "IN_WORK_DISPATCH"
+    SENT = "SENT"
+    ERROR_CONVERSION = "ERROR_CONVERSION"
+    ERROR_DISPATCH = "ERROR_DISPATCH"
+
+
+class Status(Enum):
+    NEW = "NEW"
+    SIGNING = "SIGNING"
+    SIGNED = "SIGNED"
+    STATEMENT = "STATEMENT"
+    APPROVED = "APPROVED"
+    AGREEMENT = "AGREEMENT"
+    AGREED = "AGREED"
+    REJECT = "REJECT"
+    CANCEL = "CANCEL"
+
+
+class MethodAssemblyType(Enum):
+    ED = "ED"
+    GD = "GD"
+    PAPER = "PAPER"
+    IR = "IR"
+
+
+class Type(Enum):
+    """
+    Перечисление для описания типов процесса
+    """
+
+    NEW = "NEW"
+    SIGNING = "SIGNING"
+    STATEMENT = "STATEMENT"
+    AGREEMENT = "AGREEMENT"
+
+
+class AccessGriefDto(BaseModel):
+    """
+    Гриф доступа
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    name: str | None = None
+    shortName: str | None = None
+    active: bool | None = None
+    createDate: datetime | None = None
+
+
+class AdditionalDocumentTypeDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор доп документов")] = None
+    name: Annotated[str | None, Field(description="Название доп документа")] = None
+    active: Annotated[
+        bool | None, Field(description="Признак активно ли до документ")
+    ] = None
+    createDate: datetime | None = None
+
+
+class ArchiveFundDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор архивного фонда")] = (
+        None
+    )
+    code: Annotated[str | None, Field(description="Код архивного фонда")] = None
+    name: Annotated[str | None, Field(description="Наименование архивного фонда")] = (
+        None
+    )
+    active: Annotated[bool | None, Field(description="Статус активности")] = None
+
+
+class Attachment(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    originalName: str | None = None
+    size: int | None = None
+    bucketName: str | None = None
+    minioName: str | None = None
+
+
+class Type1(Enum):
+    MAIN_ATTACHMENT = "MAIN_ATTACHMENT"
+    ADDITIONAL_ATTACHMENT = "ADDITIONAL_ATTACHMENT"
+
+
+class AttachmentDocumentType(Enum):
+    """
+    Тип вложения
+    """
+
+    ATTACHMENT = "ATTACHMENT"
+    PRINT_DOCUMENT = "PRINT_DOCUMENT"
+    PROJECT_SOLUTION = "PROJECT_SOLUTION"
+    RATIONALE = "RATIONALE"
+    DOCUMENTS_QUESTION = "DOCUMENTS_QUESTION"
+    INTRODUCTION_LIST = "INTRODUCTION_LIST"
+    AGREEMENT_LIST = "AGREEMENT_LIST"
+    DECISION = "DECISION"
+    RKK = "RKK"
+
+
+class AttachmentDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: Annotated[str | None, Field(description="Наименование вложенного файла")] = (
+        None
+    )
+    size: Annotated[int | None, Field(description="Размер вложенного файла")] = None
+
+
+class AttachmentTaskDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None,
+        Field(description="Идентификатор вложения прикрепленного к поручению"),
+    ] = None
+    name: Annotated[
+        str | None,
+        Field(description="Наименование вложения прикрепленного к поручению"),
+    ] = None
+    size: Annotated[
+        int | None, Field(description="Размер вложения прикрепленного к поручению")
+    ] = None
+    executorId: Annotated[
+        UUID | None, Field(description="Идентификатор исполнителя поручения")
+    ] = None
+    taskExecutors: Annotated[Any | None, Field(description="Исполнитель поручения")] = (
+        None
+    )
+
+
+class AutoControl(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    autoControl: bool | None = None
+    controlDays: int | None = None
+    controlTypeId: UUID | None = None
+    controlTypeOrgId: str | None = None
+
+
+class DocCategory(Enum):
+    INTERN = "INTERN"
+    INCOMING = "INCOMING"
+    OUTGOING = "OUTGOING"
+    MEETING = "MEETING"
+    QUESTION = "QUESTION"
+    MEETING_QUESTION = "MEETING_QUESTION"
+    APPEAL = "APPEAL"
+    CONTRACT = "CONTRACT"
+    CUSTOM = "CUSTOM"
+
+
+class BpmnProcessDirectoryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    name: str | None = None
+    docCategory: DocCategory | None = None
+    createDate: datetime | None = None
+    active: bool | None = None
+
+
+class CitizenTypeDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор вида обращения")] = None
+    name: Annotated[str | None, Field(description="Наименование вида обращения")] = None
+    active: Annotated[
+        bool | None, Field(description="Признак активен ли вид обращения")
+    ] = None
+    report: Annotated[bool | None, Field(description="Признак жалобы")] = None
+    createDate: datetime | None = None
+
+
+class Type2(Enum):
+    NORMAL = "NORMAL"
+    AISMV = "AISMV"
+    DIRECTUM = "DIRECTUM"
+    GTB_ORG = "GTB_ORG"
+
+
+class CountryDto(BaseModel):
+    """
+    Страна
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор страны")] = None
+    code: Annotated[
+        int | None, Field(description="Цифровой код страны", ge=1, le=999)
+    ] = None
+    shortName: Annotated[
+        str | None, Field(description="Краткое наименование страны")
+    ] = None
+    fullName: Annotated[str | None, Field(description="Полное наименование страны")] = (
+        None
+    )
+    alphaCodeTwo: Annotated[str | None, Field(description="Альфа код два")] = None
+    alphaCodeThree: Annotated[str | None, Field(description="Альфа код три")] = None
+    active: Annotated[bool | None, Field(description="Признак активна ли страна")] = (
+        None
+    )
+    createDate: datetime | None = None
+
+
+class CurrencyDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор валюты")] = None
+    name: Annotated[str | None, Field(description="Название валюты")] = None
+    active: Annotated[bool | None, Field(description="Признак активна ли валюта")] = (
+        None
+    )
+    createDate: datetime | None = None
+    code: str | None = None
+
+
+class DeliveryMethodDto(BaseModel):
+    """
+    Способ доставки
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[int | None, Field(description="Идентификатор способа доставки")] = (
+        None
+    )
+    deliveryName: Annotated[
+        str | None, Field(description="Наименование способа доставки")
+    ] = None
+    aismv: Annotated[bool | None, Field(description="Доставка АИСМВ")] = None
+    kanclerNext: Annotated[bool | None, Field(description="Доставка Канцлер НЕКСТ")] = (
+        None
+    )
+    active: Annotated[
+        bool | None, Field(description="Признак активен ли способ доставки")
+    ] = None
+    system: bool | None = None
+    createDate: datetime | None = None
+
+
+class Status1(Enum):
+    """
+    Статус акта
+    """
+
+    NEW = "NEW"
+    AGREEMENT = "AGREEMENT"
+    AGREED = "AGREED"
+    SIGNING = "SIGNING"
+    SIGNED = "SIGNED"
+    STATEMENT = "STATEMENT"
+    APPROVED = "APPROVED"
+    CANCEL = "CANCEL"
+
+
+class StorageType(Enum):
+    """
+    Статус дел, выделенных к уничтожению
+    """
+
+    ARCHIVE = "ARCHIVE"
+    OPERATIONAL = "OPERATIONAL"
+
+
+class MethodAssemblyType1(Enum):
+    """
+    Вид дел
+    """
+
+    ED = "ED"
+    GD = "GD"
+    PAPER = "PAPER"
+    IR = "IR"
+
+
+class Type3(Enum):
+    """
+    Тип процесса
+    """
+
+    NEW = "NEW"
+    AGREEMENT = "AGREEMENT"
+    SIGNING = "SIGNING"
+    STATEMENT = "STATEMENT"
+
+
+class Type4(Enum):
+    """
+    Перечисление для описания типов процесса
+    """
+
+    NEW = "NEW"
+    AGREEMENT = "AGREEMENT"
+    SIGNING = "SIGNING"
+    STATEMENT = "STATEMENT"
+    REGISTRATION = "REGISTRATION"
+    REVIEW = "REVIEW"
+    EXECUTION = "EXECUTION"
+    DISPATCH = "DISPATCH"
+    PREPARATION = "PREPARATION"
+    PAPERWORK = "PAPERWORK"
+    ACCEPTANCE = "ACCEPTANCE"
+    CONTRACT_EXECUTION = "CONTRACT_EXECUTION"
+
+
+class EmpActionQueueType(Enum):
+    """
+    Тип выполнения действий в процессе, null = ANY
+    """
+
+    ANY = "ANY"
+    ORDERED = "ORDERED"
+
+
+class DeclarantType(Enum):
+    """
+    Признак, является заявитель физическим или юридическим лицом
+    """
+
+    INDIVIDUAL = "INDIVIDUAL"
+    ENTITY = "ENTITY"
+
+
+class RequiredFieldEnum(Enum):
+    ATTACHMENT = "ATTACHMENT"
+    OUT_CORRESPONDENT_ORG_NUM = "OUT_CORRESPONDENT_ORG_NUM"
+    OUT_CORRESPONDENT_ORG_DATE = "OUT_CORRESPONDENT_ORG_DATE"
+    OUT_CORRESPONDENT_NAME = "OUT_CORRESPONDENT_NAME"
+    DOC_SIGNERS = "DOC_SIGNERS"
+    RECIPIENT_NAME = "RECIPIENT_NAME"
+    AFFAIRS = "AFFAIRS"
+    CONTRACT_CORRESPONDENT = "CONTRACT_CORRESPONDENT"
+
+
+class Status2(Enum):
+    """
+    Перечисление для описания статусов документов
+    """
+
+    DRAFT = "DRAFT"
+    NEW = "NEW"
+    STATEMENT = "STATEMENT"
+    APPROVED = "APPROVED"
+    SIGNING = "SIGNING"
+    SIGNED = "SIGNED"
+    AGREEMENT = "AGREEMENT"
+    AGREED = "AGREED"
+    REVIEW = "REVIEW"
+    REVIEWED = "REVIEWED"
+    REGISTRATION = "REGISTRATION"
+    REGISTERED = "REGISTERED"
+    EXECUTION = "EXECUTION"
+    EXECUTED = "EXECUTED"
+    DISPATCH = "DISPATCH"
+    SENT = "SENT"
+    REJECT = "REJECT"
+    CANCEL = "CANCEL"
+    PREPARATION = "PREPARATION"
+    PAPERWORK = "PAPERWORK"
+    FORMALIZED = "FORMALIZED"
+    ACCEPTANCE = "ACCEPTANCE"
+    ACCEPTED = "ACCEPTED"
+    CONTRACT_EXECUTION = "CONTRACT_EXECUTION"
+    CONTRACT_CLOSED = "CONTRACT_CLOSED"
+    ARCHIVE = "ARCHIVE"
+    DELETED = "DELETED"
+    ALL = "ALL"
+
+
+class CreateType(Enum):
+    """
+    Перечисление для описания типов как создан документ
+    """
+
+    MANUAL = "MANUAL"
+    AISMV = "AISMV"
+    DIRECTUM = "DIRECTUM"
+
+
+class FormMeetingType(Enum):
+    """
+    Форма проведения заседания
+    """
+
+    INTRAMURAL = "INTRAMURAL"
+    POLLING_METHOD = "POLLING_METHOD"
+
+
+class DocumentConstant(Enum):
+    """
+    Константа документа
+    """
+
+    INTERN = "INTERN"
+    INCOMING = "INCOMING"
+    OUTGOING = "OUTGOING"
+    MEETING = "MEETING"
+    QUESTION = "QUESTION"
+    MEETING_QUESTION = "MEETING_QUESTION"
+    APPEAL = "APPEAL"
+    CONTRACT = "CONTRACT"
+    CUSTOM = "CUSTOM"
+
+
+class DocumentFormField(BaseModel):
+    """
+    Поля формы документа
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: str | None = None
+    payload: dict[str, dict[str, Any]] | None = None
+
+
+class DocumentLanguageDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор шаблона языка документа")
+    ] = None
+    languageCode: Annotated[str | None, Field(description="Код языка документа")] = None
+    active: Annotated[
+        bool | None, Field(description="Признак активен ли язык документа")
+    ] = None
+
+
+class ActionQueueType(Enum):
+    """
+    Тип исполнения процесса
+    """
+
+    ANY = "ANY"
+    ORDERED = "ORDERED"
+
+
+class DocumentCategory(Enum):
+    """
+    Тип документа
+    """
+
+    INTERN = "INTERN"
+    INCOMING = "INCOMING"
+    OUTGOING = "OUTGOING"
+    MEETING = "MEETING"
+    QUESTION = "QUESTION"
+    MEETING_QUESTION = "MEETING_QUESTION"
+    APPEAL = "APPEAL"
+    CONTRACT = "CONTRACT"
+    CUSTOM = "CUSTOM"
+
+
+class RequiredFieldEnum1(Enum):
+    """
+    обязательные поля
+    """
+
+    ATTACHMENT = "ATTACHMENT"
+    OUT_CORRESPONDENT_ORG_NUM = "OUT_CORRESPONDENT_ORG_NUM"
+    OUT_CORRESPONDENT_ORG_DATE = "OUT_CORRESPONDENT_ORG_DATE"
+    OUT_CORRESPONDENT_NAME = "OUT_CORRESPONDENT_NAME"
+    DOC_SIGNERS = "DOC_SIGNERS"
+    RECIPIENT_NAME = "RECIPIENT_NAME"
+    AFFAIRS = "AFFAIRS"
+    CONTRACT_CORRESPONDENT = "CONTRACT_CORRESPONDENT"
+
+
+class Status4(Enum):
+    SENDING = "SENDING"
+    SENDED = "SENDED"
+    RECEIVED = "RECEIVED"
+    AISMV_SENDED = "AISMV_SENDED"
+    AISMV_RECEIVED = "AISMV_RECEIVED"
+    CANCEL = "CANCEL"
+    FAILED = "FAILED"
+
+
+class AismvPackageType(Enum):
+    DOCUMENT = "DOCUMENT"
+    ADD_DOCUMENT = "ADD_DOCUMENT"
+    ACCEPT_ACK = "ACCEPT_ACK"
+    REG_REJECT_ACK = "REG_REJECT_ACK"
+    REG_ACK = "REG_ACK"
+    DOCUMENT_ANSWER = "DOCUMENT_ANSWER"
+
+
+class DocumentTypeDto(BaseModel):
+    """
+    Тип документа
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[int | None, Field(description="Идентификатор вида документа")] = None
+    typeName: Annotated[
+        str | None, Field(description="Наименование вида документа")
+    ] = None
+    docCategoryConst: DocCategory | None = None
+    active: Annotated[
+        bool | None, Field(description="Признак активен ли вид документа")
+    ] = None
+    objectType: Annotated[
+        str | None,
+        Field(
+            description="вид по таблицы 2 окб (https://minjust.gov.by/upload/iblock/d97/OKRB.pdf)",
+            max_length=3,
+            min_length=3,
+        ),
+    ] = None
+    createDate: datetime | None = None
+
+
+class DocumentUserColorDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    documentId: UUID | None = None
+    documentOrgId: str | None = None
+    color: str | None = None
+
+
+class DocumentUserPropsDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    documentId: UUID | None = None
+    employeeId: UUID | None = None
+    createTaskCount: int | None = None
+    createTaskExecutedCount: int | None = None
+
+
+class DocumentVersionDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор версии")] = None
+    version: Annotated[int | None, Field(description="Номер версии")] = None
+    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
+        None
+    )
+    document: Annotated[Any | None, Field(description="Документ")] = None
+    deleted: bool | None = None
+
+
+class CreateType1(Enum):
+    MANUAL = "MANUAL"
+    LDAP = "LDAP"
+
+
+class BlockedField(Enum):
+    FIRST_NAME = "FIRST_NAME"
+    LAST_NAME = "LAST_NAME"
+    MIDDLE_NAME = "MIDDLE_NAME"
+    POST = "POST"
+    PHONE = "PHONE"
+    EMAIL = "EMAIL"
+    PHOTO = "PHOTO"
+    DEPARTMENT = "DEPARTMENT"
+
+
+class ExecutionDateRoundPolicy(Enum):
+    UP = "UP"
+    DOWN = "DOWN"
+
+
+class Type7(Enum):
+    ACCESS = "ACCESS"
+    DISTRIBUTION = "DISTRIBUTION"
+
+
+class GroupDto(BaseModel):
+    """
+    Группа пользователей
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    name: Annotated[str | None, Field(max_length=255, min_length=1)] = None
+    type: Type7
+    mixed: bool
+    createDate: datetime | None = None
+
+
+class InformationItem(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    errorcode: str | None = None
+    errortext: str | None = None
+    idSystem: str | None = None
+    invIndex: str | None = None
+    extIndex: str | None = None
+    akIndex: str | None = None
+    eoIndex: int | None = None
+    fileId: int | None = None
+    number: int | None = None
+    fileName: str | None = None
+    actIndex: int | None = None
+    code: int | None = None
+    fundNumber: int | None = None
+    prevResponse: str | None = None
+
+
+class Type8(Enum):
+    REG_PACKAGE = "REG_PACKAGE"
+    ACCEPTANCE_INVENTORY = "ACCEPTANCE_INVENTORY"
+    ELECTRONIC_OBJECT = "ELECTRONIC_OBJECT"
+    STATUS_INVENTORY = "STATUS_INVENTORY"
+    ERROR_RESPONSE = "ERROR_RESPONSE"
+    INNER_INVENTORY = "INNER_INVENTORY"
+    INVENTORY_TRANSFER_COMPLETED = "INVENTORY_TRANSFER_COMPLETED"
+    ELECTRONIC_DOCUMENT = "ELECTRONIC_DOCUMENT"
+    DOCUMENT_FILE = "DOCUMENT_FILE"
+
+
+class InvestmentProgramDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор объекта инвестпрограммы")
+    ] = None
+    name: Annotated[
+        str | None, Field(description="Наименование объекта инвестпрограммы")
+    ] = None
+    active: Annotated[bool | None, Field(description="Признак активности")] = None
+    createDate: datetime | None = None
+
+
+class JobInfo(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    endDate: datetime | None = None
+    delayedTo: datetime | None = None
+    attempt: int
+    errorText: str | None = None
+    startDate: datetime | None = None
+
+
+class ListInformation(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    information: list[InformationItem] | None = None
+
+
+class ContentType(Enum):
+    DOC = "DOC"
+    DOCX = "DOCX"
+    TIF = "TIF"
+    TIFF = "TIFF"
+    JPG = "JPG"
+    JPEG = "JPEG"
+    BMP = "BMP"
+    PDF = "PDF"
+    GIF = "GIF"
+    PNG = "PNG"
+    OTHER = "OTHER"
+
+
+class MiniUserInfoDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    firstName: Annotated[str | None, Field(description="Имя сотрудника")] = None
+    lastName: Annotated[str | None, Field(description="Фамилия сотрудника")] = None
+    middleName: Annotated[str | None, Field(description="Отчество сотрудника")] = None
+    id: Annotated[UUID | None, Field(description="ИД сотрудника")] = None
+
+
+class Status6(Enum):
+    """
+    Статус дела
+    """
+
+    FORMING = "FORMING"
+    COMPLETED = "COMPLETED"
+    CLOSED = "CLOSED"
+    ARCHIVE = "ARCHIVE"
+    DESTROYED = "DESTROYED"
+
+
+class CreateType2(Enum):
+    """
+    Тип создания
+    """
+
+    MANUAL = "MANUAL"
+    DIRECTUM = "DIRECTUM"
+
+
+class MethodAssemblyType2(Enum):
+    """
+    Способ комплектования дела
+    """
+
+    ED = "ED"
+    GD = "GD"
+    PAPER = "PAPER"
+    IR = "IR"
+
+
+class ExpertiseType(Enum):
+    """
+    Признак экспертизы дела
+    """
+
+    EPK = "EPK"
+    CEK = "CEK"
+    EK = "EK"
+
+
+class NomenclatureShelvingShelveDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор стеллажа и полки")] = (
+        None
+    )
+    fundId: Annotated[
+        UUID | None,
+        Field(description="Идентификатор фонда, к которому относится стеллаж"),
+    ] = None
+    fund: Annotated[
+        ArchiveFundDto | None, Field(description="Фонд, к которому относится стеллаж")
+    ] = None
+    shelvingName: Annotated[
+        str | None, Field(description="Название или номер стеллажа")
+    ] = None
+    shelveName: Annotated[str | None, Field(description="Название или номер полки")] = (
+        None
+    )
+    active: Annotated[bool | None, Field(description="Статус активности")] = None
+
+
+class OrgApprovePerson(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    position: str
+    name: str
+
+
+class PackageEoResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    listInformation: ListInformation
+    idpackage: str | None = None
+    type: str | None = None
+    dateoftransmission: str | None = None
+
+
+class PostDto(BaseModel):
+    """
+    Должность сотрудника
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[int | None, Field(description="Идентификатор должности")] = None
+    postName: Annotated[str | None, Field(description="Наименование должности")] = None
+    postCode: Annotated[str | None, Field(description="Код должности")] = None
+    createDate: datetime | None = None
+
+
+class RegistrationJournalDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор журнала регистрации")
+    ] = None
+    journalName: Annotated[
+        str | None, Field(description="Наименование журнала регистрации")
+    ] = None
+    counterValue: Annotated[int | None, Field(description="Значение счетчика")] = None
+    active: Annotated[
+        bool | None, Field(description="Признак активен ли журнал регистрации")
+    ] = None
+    createDate: datetime | None = None
+
+
+class Type10(Enum):
+    """
+    Тип повторных обращений
+    """
+
+    IDENTICAL = "IDENTICAL"
+    REPEAT = "REPEAT"
+
+
+class RepeatIdenticalAppealDto(BaseModel):
+    """
+    Повторные и идентичные обращения
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    docId: Annotated[UUID | None, Field(description="Идентификатор документа")] = None
+    regNumber: str | None = None
+    regDate: datetime | None = None
+    shortSummary: str | None = None
+    number: Annotated[int | None, Field(description="Номер повторного обращения")] = (
+        None
+    )
+    repeatAppealGroupId: Annotated[
+        UUID | None, Field(description="Идентификатор группы повторных обращений")
+    ] = None
+    type: Annotated[Type10 | None, Field(description="Тип повторных обращений")] = None
+    deleted: bool | None = None
+
+
+class SaveInventoryResponse(PackageEoResponse):
+    pass
+
+
+class Signature(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    keyId: Annotated[
+        str | None, Field(description="Идентификатор открытого ключа подписавшего")
+    ] = None
+    signer: Annotated[str | None, Field(description="Имя подписавшего")] = None
+    signtime: Annotated[datetime | None, Field(description="Дата/время подписи")] = None
+    operationType: Annotated[
+        str | None, Field(description="Тип операции подписания")
+    ] = None
+    origSignature: Annotated[
+        str | None,
+        Field(
+            description="Значение ЭЦП в исходной системе (если выполнялось заверение третьей стороной)"
+        ),
+    ] = None
+    data: Annotated[str, Field(description="ЭЦП подпись в base64")]
+    certSerial: Annotated[str | None, Field(description="Номер сертификата")] = None
+    signerFio: Annotated[str | None, Field(description="ФИО подписавшего")] = None
+    signerDate: Annotated[datetime | None, Field(description="Дата подписания")] = None
+    signerPost: Annotated[str | None, Field(description="Должность подписавшего")] = (
+        None
+    )
+    signerOrg: Annotated[str | None, Field(description="Организация подписавшего")] = (
+        None
+    )
+    personalNumber: Annotated[str | None, Field(description="Личный номер")] = None
+    issuer: Annotated[str | None, Field(description="Издатель сертификата")] = None
+    start: datetime | None = None
+    end: datetime | None = None
+    signCount: int | None = None
+    attrCertIssuer: str | None = None
+    attrCertIssuerId: str | None = None
+    attrOrganizationName: str | None = None
+    attrPost: str | None = None
+    attrUnp: str | None = None
+    attrUnpf: str | None = None
+    attrAddress: str | None = None
+    attrStart: datetime | None = None
+    attrEnd: datetime | None = None
+
+
+class SolutionResultDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор результата решения")
+    ] = None
+    name: Annotated[
+        str | None, Field(description="Наименование результата решения")
+    ] = None
+    active: Annotated[bool | None, Field(description="Признак активности")] = None
+    createDate: datetime | None = None
+
+
+class Type11(Enum):
+    SPEAKER = "SPEAKER"
+    CO_REPORTER = "CO_REPORTER"
+
+
+class GroupByStoragePeriod(Enum):
+    S_T_UP_TO_10_Y = "S_T_UP_TO_10_Y"
+    S_T_OVER_10_Y = "S_T_OVER_10_Y"
+    P_S = "P_S"
+
+
+class YearPostfix(Enum):
+    """
+    Добавочный текст к количеству лет хранения
+    """
+
+    год = "год"
+    года = "года"
+    лет = "лет"
+
+
+class StoragePeriodType(Enum):
+    """
+    Другой тип хранения
+    """
+
+    Числовой = "Числовой"
+    Постоянно = "Постоянно"
+    До_минования_надобности = "До минования надобности"
+    До_замены_новыми = "До замены новыми"
+
+
+class StoragePeriodDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор срока хранения")] = None
+    name: Annotated[str | None, Field(description="Наименование срока хранения")] = None
+    groupByStoragePeriod: GroupByStoragePeriod | None = None
+    active: Annotated[
+        bool | None, Field(description="Признак активен ли срок хранения")
+    ] = None
+    createDate: datetime | None = None
+    byStaff: Annotated[
+        bool | None, Field(description="Признак - по личному составу")
+    ] = None
+    storageYears: Annotated[
+        int | None, Field(description="Срок хранения дела в годах")
+    ] = None
+    yearPostfix: Annotated[
+        YearPostfix | None,
+        Field(description="Добавочный текст к количеству лет хранения"),
+    ] = None
+    storagePeriodType: Annotated[
+        StoragePeriodType | None, Field(description="Другой тип хранения")
+    ] = None
+
+
+class SubjectDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор тематики")] = None
+    name: Annotated[str | None, Field(description="Наименование тематики")] = None
+    code: Annotated[int | None, Field(description="Код тематики")] = None
+    parentSubjectId: Annotated[
+        UUID | None, Field(description="Идентификатор родительской тематики")
+    ] = None
+    parentSubject: Annotated[Any | None, Field(description="Родительская тематика")] = (
+        None
+    )
+    active: Annotated[bool | None, Field(description="Признак активности")] = None
+    createDate: datetime | None = None
+
+
+class SubscriberDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    smdoCode: str | None = None
+    endDate: str | None = None
+    connectionDate: str | None = None
+    easId: str | None = None
+    oaisAbonent: bool | None = None
+    startDate: str | None = None
+    status: str | None = None
+    fax: str | None = None
+    home: str | None = None
+    phone: str | None = None
+    subscriberStatus: str | None = None
+    unp: str | None = None
+    corpus: str | None = None
+    email: str | None = None
+    postIndex: str | None = None
+    soato: str | None = None
+    street: str | None = None
+    objid: UUID | None = None
+    rowId: str | None = None
+    createdOn: datetime | None = None
+    updatedOn: datetime | None = None
+    oaisOrgId: UUID | None = None
+    name: str | None = None
+    shortName: str | None = None
+    sedTypeId: UUID | None = None
+    sedTypeObjectId: UUID | None = None
+    typesedRowId: str | None = None
+    typesedValue: str | None = None
+    createDate: datetime | None = None
+    updatedDate: datetime | None = None
+
+
+class Type12(Enum):
+    """
+    Тип поручения
+    """
+
+    INFORMATION = "INFORMATION"
+    GENERAL = "GENERAL"
+
+
+class TaskStatus(Enum):
+    ON_EXECUTION = "ON_EXECUTION"
+    EXECUTED = "EXECUTED"
+
+
+class Period(Enum):
+    WEEK = "WEEK"
+    MONTH = "MONTH"
+    THREE_MONTHS = "THREE_MONTHS"
+    SIX_MONTHS = "SIX_MONTHS"
+    YEAR = "YEAR"
+
+
+class UnifiedDocumentationSystemDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор УСД")] = None
+    code: Annotated[str | None, Field(description="Код УСД")] = None
+    name: Annotated[str | None, Field(description="Название валюты")] = None
+    active: Annotated[bool | None, Field(description="Статус активности")] = None
+
+
+class WsSystem(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    sysid: str | None = None
+    sysname: str | None = None
+    sysversion: str | None = None
+    url: str | None = None
+
+
+class UserDashboardDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    data: dict[str, Any] | None = None
+
+
+class UnifiedDocumentationSystemRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID
+    code: str
+    name: str
+    active: bool
+
+
+class TypicalControlPointRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID
+    name: str
+    active: bool
+
+
+class SimpleCmsDTO(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    cms: Annotated[str | None, Field(description="CMS в base64")] = None
+
+
+class Template(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    templateName: str | None = None
+    contentType: ContentType | None = None
+    attachment: Attachment | None = None
+    docCategoryConstant: DocCategory | None = None
+    tag: list[str] | None = None
+    active: bool
+
+
+class RecognitionLanguageEnum(Enum):
+    RUS = "RUS"
+    ENG = "ENG"
+
+
+class RecognitionFileTypeEnum(Enum):
+    TIFF = "TIFF"
+    TIF = "TIF"
+    JPEG = "JPEG"
+    JPG = "JPG"
+    BMP = "BMP"
+    PDF = "PDF"
+    GIF = "GIF"
+    PNG = "PNG"
+    DOC = "DOC"
+    DOCX = "DOCX"
+
+
+class RecognitionSetupDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    organizationId: Annotated[
+        str | None,
+        Field(description="Идентификатор организации настройка распознавания"),
+    ] = None
+    organizationName: Annotated[
+        str | None,
+        Field(description="Наименование организации настройки распознавания"),
+    ] = None
+    recognitionLanguage: list[RecognitionLanguageEnum] | None = None
+    docCategoryConstant: list[DocCategory] | None = None
+    recognitionFileType: list[RecognitionFileTypeEnum] | None = None
+    active: Annotated[
+        bool | None, Field(description="Признак активна ли настройка распознавания")
+    ] = None
+
+
+class IdUUID(BaseModel):
+    """
+    Идентификатор
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID
+
+
+class SummaryNomenclatureDepartmentProcessAction(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    result: Annotated[
+        bool,
+        Field(description="Признак результата действия положительный/отрицательный"),
+    ]
+    employeeId: Annotated[
+        UUID,
+        Field(
+            description="Идентификатор участника процесса от лица которого делается действие"
+        ),
+    ]
+    comment: Annotated[str | None, Field(description="Комментарий")] = None
+
+
+class SummaryNomenclatureDepartmentRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    templateId: UUID
+
+
+class StoragePeriodType2(Enum):
+    Числовой = "Числовой"
+    Постоянно = "Постоянно"
+    До_минования_надобности = "До минования надобности"
+    До_замены_новыми = "До замены новыми"
+
+
+class Type14(Enum):
+    DOCUMENT = "DOCUMENT"
+    TASK = "TASK"
+    TASK_PROJECT = "TASK_PROJECT"
+    NOMENCLATURE_DEPARTMENT = "NOMENCLATURE_DEPARTMENT"
+    SUMMARY_NOMENCLATURE_DEPARTMENT = "SUMMARY_NOMENCLATURE_DEPARTMENT"
+    DESTRUCTION_ACT = "DESTRUCTION_ACT"
+    NOMENCLATURE_AFFAIR = "NOMENCLATURE_AFFAIR"
+    MINI_DOCUMENT = "MINI_DOCUMENT"
+    SYSTEM = "SYSTEM"
+    ACCEPTANCE_INVENTORY = "ACCEPTANCE_INVENTORY"
+    CUSTOM = "CUSTOM"
+    ADDITIONAL_DOCUMENT = "ADDITIONAL_DOCUMENT"
+    CONTRACT = "CONTRACT"
+
+
+class RoleDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    name: Annotated[str | None, Field(max_length=255, min_length=0)] = None
+    systemName: str | None = None
+    system: bool | None = None
+    type: Type14 | None = None
+    systemManage: bool | None = None
+    createDate: datetime | None = None
+
+
+class Column(Enum):
+    """
+    Перечисление колонок для построения отчета
+    """
+
+    DOC_PROFILE = "DOC_PROFILE"
+    DOC_TYPE = "DOC_TYPE"
+    DOC_CATEGORY = "DOC_CATEGORY"
+    DATE_REG = "DATE_REG"
+    AUTHOR_DOC = "AUTHOR_DOC"
+    REG_NUMBER = "REG_NUMBER"
+    DESTINATION = "DESTINATION"
+    CORRESPONDENT = "CORRESPONDENT"
+    OUTGOING_NUMBER = "OUTGOING_NUMBER"
+    OUTGOING_DATE = "OUTGOING_DATE"
+    SIGNED_BY = "SIGNED_BY"
+    STATUS = "STATUS"
+    EXECUTOR_STAGE = "EXECUTOR_STAGE"
+    DATE_STAGE = "DATE_STAGE"
+    AUTHOR_TASK = "AUTHOR_TASK"
+    TASK_EXECUTOR = "TASK_EXECUTOR"
+    TASK_LEADER = "TASK_LEADER"
+    TASK_NUMBER = "TASK_NUMBER"
+    DOC_SHORT_SUMMARY = "DOC_SHORT_SUMMARY"
+    DATE_TASK_EXECUTE = "DATE_TASK_EXECUTE"
+    TASK_ON_CONTROL = "TASK_ON_CONTROL"
+    DOC_ON_CONTROL = "DOC_ON_CONTROL"
+    DOC_DATE_CONTROL = "DOC_DATE_CONTROL"
+    REPORT_TASK = "REPORT_TASK"
+    TASK_SHORT_SUMMARY = "TASK_SHORT_SUMMARY"
+    CONTRACT_SIGNING_DATE = "CONTRACT_SIGNING_DATE"
+    CONTRACT_START_DATE = "CONTRACT_START_DATE"
+    CONTRACT_DAYS_TO_COMPLETION = "CONTRACT_DAYS_TO_COMPLETION"
+    CONTRACT_SUM = "CONTRACT_SUM"
+    CURRENCY = "CURRENCY"
+    CONTRACT_RECIPIENT = "CONTRACT_RECIPIENT"
+
+
+class RegionDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор области")] = None
+    nameRegion: Annotated[str | None, Field(description="Наименование области")] = None
+    codeRegion: Annotated[int | None, Field(description="Код области")] = None
+    active: Annotated[
+        bool | None,
+        Field(
+            description="Признак активно ли типовое краткое содержание для поручения"
+        ),
+    ] = None
+    createDate: datetime | None = None
+
+
+class IdsUUID(BaseModel):
+    """
+    Список идентификаторов
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    ids: Annotated[list[UUID], Field(max_items=2147483647, min_items=1)]
+
+
+class Localization(Enum):
+    RU = "RU"
+    EN = "EN"
+    GE = "GE"
+
+
+class DefaultSignType(Enum):
+    TOKEN = "TOKEN"
+    KTA = "KTA"
+
+
+class ScanSettingJsonB(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    duplex: bool | None = None
+    scanWia: bool | None = None
+    paperSize: int | None = None
+    pixelType: int | None = None
+    resolution: int | None = None
+    bitDepth: int | None = None
+    autoDeskew: int | None = None
+    widgets: bool | None = None
+    hideCategories: bool | None = None
+    docEllipsis: bool | None = None
+    docEllipsisRow: int | None = None
+    showEventDesign: bool | None = None
+    showCollegiate: bool | None = None
+    showMeeting: bool | None = None
+    showAppeal: bool | None = None
+    showIncoming: bool | None = None
+    showInternal: bool | None = None
+    showOutgoing: bool | None = None
+    showNomenclatureAffair: bool | None = None
+    showNomenclatureDepartment: bool | None = None
+    showSummaryNomenclatureDepartment: bool | None = None
+    showAcceptanceInventory: bool | None = None
+    showDestructionAct: bool | None = None
+    showContract: bool | None = None
+    showCustomDocument: bool | None = None
+    showArchiveAffairs: bool | None = None
+    defaultSignType: DefaultSignType | None = None
+
+
+class OaisSmdoSubscriberConfigDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    enabled: bool | None = None
+    delta: datetime | None = None
+    protocol: str | None = None
+    server: str | None = None
+    path: str | None = None
+    login: str | None = None
+    password: str | None = None
+    authPath: str | None = None
+
+
+class Status8(Enum):
+    NEW = "NEW"
+    SIGNING = "SIGNING"
+    SIGNED = "SIGNED"
+    AGREEMENT = "AGREEMENT"
+    AGREED = "AGREED"
+    DELETED = "DELETED"
+    CANCEL = "CANCEL"
+
+
+class NomenclatureDepartmentEntryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID, Field(description="Идендификатор")]
+    name: Annotated[str, Field(description="Заголовок дела", min_length=1)]
+    index: Annotated[str, Field(description="Индекс дела", min_length=1)]
+    period: Annotated[StoragePeriodDto, Field(description="Срок хранения")]
+    expertiseType: Annotated[
+        ExpertiseType | None, Field(description="Признак экспертизы дела")
+    ] = None
+    transitionalAffair: Annotated[
+        bool | None,
+        Field(
+            description="Признак, показывающий – является ли дело переходящим на следующие годы"
+        ),
+    ] = None
+    personnel: Annotated[
+        bool | None,
+        Field(
+            description="Признак, показывающий – является ли дело делом по личному составу"
+        ),
+    ] = None
+    methodAssemblyType: Annotated[
+        MethodAssemblyType2 | None, Field(description="Способ комплектования дела")
+    ] = None
+    itemNumber: Annotated[
+        str | None,
+        Field(
+            description="Согласно какого пункта (статьи) государственного Перечня выбран срок хранения для данного дела"
+        ),
+    ] = None
+    note: Annotated[str | None, Field(description="Примечание")] = None
+
+
+class NomenclatureDepartmentProcessDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор процесса")] = None
+    currentId: Annotated[
+        UUID | None, Field(description="Идентификатор текущего этапа процесса")
+    ] = None
+    current: Annotated[Any | None, Field(description="Текущий этап процесса")] = None
+    nextId: Annotated[
+        UUID | None, Field(description="Идентификатор следующего этапа процесса")
+    ] = None
+    next: Annotated[Any | None, Field(description="Следующий этап процесса")] = None
+    nomenclatureDepartmentId: Annotated[
+        UUID | None, Field(description="Идентификатор номенклатуры дел подразделения")
+    ] = None
+    nomenclatureDepartment: Annotated[
+        Any | None, Field(description="Номенклатура дел подразделения")
+    ] = None
+    items: Annotated[list | None, Field(description="Список этапов процесса")] = None
+    completed: Annotated[
+        bool | None, Field(description="Признак прошел ли документ все этапы")
+    ] = None
+    started: Annotated[
+        bool | None, Field(description="Признак начал ли документ движение по маршруту")
+    ] = None
+    stepCount: Annotated[
+        int | None, Field(description="Количество этапов в процессе")
+    ] = None
+
+
+class NomenclatureDepartmentCancelRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    comment: str | None = None
+
+
+class EmployeeIoRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    employeeId: Annotated[UUID, Field(description="Идентификатор сотрудника")]
+    revocationDate: Annotated[datetime, Field(description="Дата аннулирования прав")]
+
+
+class ChangeResponsibleStatus(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    responsible: bool
+
+
+class AdditionalFields(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    retryPrefix: str | None = None
+    retryPostfix: str | None = None
+    identicalPrefix: str | None = None
+    identicalPostfix: str | None = None
+    repetitionCounterInitial: int | None = None
+    identityCounterInitial: int | None = None
+    anonymousSuffix: str | None = None
+    collectiveSuffix: str | None = None
+    appealOrganizationJournalId: UUID | None = None
+    journalId: UUID | None = None
+    correspondentId: UUID | None = None
+
+
+class DocRegOperationAudit(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    operation: str | None = None
+    result: str | None = None
+    success: bool | None = None
+
+
+class DocumentPropertiesDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    autoControl: AutoControl | None = None
+    gtbAutoRoutingAfterSigning: bool | None = None
+    autoRegistration: bool | None = None
+    formula: list[str] | None = None
+    registrationAudit: list[DocRegOperationAudit] | None = None
+    anyNum: bool | None = None
+    fields: AdditionalFields | None = None
+
+
+class ActionQueueType1(Enum):
+    ANY = "ANY"
+    ORDERED = "ORDERED"
+
+
+class AttachmentDocumentType1(Enum):
+    ATTACHMENT = "ATTACHMENT"
+    PRINT_DOCUMENT = "PRINT_DOCUMENT"
+    PROJECT_SOLUTION = "PROJECT_SOLUTION"
+    RATIONALE = "RATIONALE"
+    DOCUMENTS_QUESTION = "DOCUMENTS_QUESTION"
+    INTRODUCTION_LIST = "INTRODUCTION_LIST"
+    AGREEMENT_LIST = "AGREEMENT_LIST"
+    DECISION = "DECISION"
+    RKK = "RKK"
+
+
+class DocumentType(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    typeName: Annotated[str, Field(max_length=255, min_length=0)]
+    docCategoryConst: DocCategory
+    active: bool
+    objectType: Annotated[str | None, Field(max_length=3, min_length=3)] = None
+    createDate: datetime | None = None
+
+
+class DistrictDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор района")] = None
+    nameDistrict: Annotated[str | None, Field(description="Наименование района")] = None
+    codeDistrict: Annotated[int | None, Field(description="Код района")] = None
+    regionId: Annotated[UUID | None, Field(description="Идентификатор области")] = None
+    region: Annotated[RegionDto | None, Field(description="Область")] = None
+    active: Annotated[
+        bool | None,
+        Field(
+            description="Признак активно ли типовое краткое содержание для поручения"
+        ),
+    ] = None
+    createDate: datetime | None = None
+
+
+class CustomViewColumn(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    field: str | None = None
+    width: int | None = None
+    autoWidth: bool | None = None
+
+
+class Include(Enum):
+    DOCUMENT_TYPE = "DOCUMENT_TYPE"
+    DELIVERY_METHOD = "DELIVERY_METHOD"
+    CORRESPONDENT = "CORRESPONDENT"
+    RECIPIENT = "RECIPIENT"
+    USER_COLOR = "USER_COLOR"
+    PRE_NOMENCLATURE_AFFAIRS = "PRE_NOMENCLATURE_AFFAIRS"
+    CITIZEN_TYPE = "CITIZEN_TYPE"
+    CURRENCY = "CURRENCY"
+    PARENT_SUBJECT = "PARENT_SUBJECT"
+    REGISTRATION_JOURNAL = "REGISTRATION_JOURNAL"
+    SOLUTION_RESULT = "SOLUTION_RESULT"
+    ADDITIONAL_DOCUMENT_AND_TYPE = "ADDITIONAL_DOCUMENT_AND_TYPE"
+
+
+class IoOption(Enum):
+    SELF = "SELF"
+    IO = "IO"
+    SUBORDINATES = "SUBORDINATES"
+    SELF_AND_IO = "SELF_AND_IO"
+    SUBORDINATES_AND_SELF_AND_IO = "SUBORDINATES_AND_SELF_AND_IO"
+
+
+class DeclarantType1(Enum):
+    INDIVIDUAL = "INDIVIDUAL"
+    ENTITY = "ENTITY"
+
+
+class DocumentFilter(BaseModel):
+    """
+    Фильтр представления
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    includes: Annotated[
+        list[Include] | None,
+        Field(description="Список моделей которые могу быть добавлены при отображении"),
+    ] = None
+    categoryConstants: list[DocCategory] | None = None
+    documentTypeIds: Annotated[
+        list[int] | None, Field(description="Виды документов")
+    ] = None
+    ioOption: IoOption | None = None
+    documentTypeNames: Annotated[
+        list[str] | None, Field(description="Виды документов имена")
+    ] = None
+    regNumber: Annotated[
+        str | None, Field(description="Регистрационный номер документа")
+    ] = None
+    createType: Annotated[
+        CreateType | None,
+        Field(description="Перечисление для описания типов как создан документ"),
+    ] = None
+    dateRegStart: Annotated[
+        datetime | None, Field(description="Дата начала регистрации документа")
+    ] = None
+    dateRegEnd: Annotated[
+        datetime | None, Field(description="Дата окончания регистрации документа")
+    ] = None
+    shortSummary: Annotated[
+        str | None,
+        Field(
+            description="Краткое содержание, может выбираться из справочника кратких содержаний"
+        ),
+    ] = None
+    authorId: Annotated[
+        UUID | None, Field(description="Идентификатор автора документа")
+    ] = None
+    authorFirstName: Annotated[str | None, Field(description="Имя автора")] = None
+    authorLastName: Annotated[str | None, Field(description="Фамилия автора")] = None
+    authorMiddleName: Annotated[str | None, Field(description="Отчество автора")] = None
+    executorSigningStageId: Annotated[
+        UUID | None, Field(description="Идентификатор исполнителя этапа Подписание")
+    ] = None
+    executorSigningStageFirstName: Annotated[
+        str | None, Field(description="Имя исполнителя этапа Подписание")
+    ] = None
+    executorSigningStageLastName: Annotated[
+        str | None, Field(description="Фамилия исполнителя этапа Подписание")
+    ] = None
+    executorSigningStageMiddleName: Annotated[
+        str | None, Field(description="Отчество исполнителя этапа Подписание")
+    ] = None
+    outRegNumber: Annotated[
+        str | None, Field(description="Исходящий регистрационный номер")
+    ] = None
+    recipientIds: Annotated[
+        list[UUID] | None, Field(description="Список идентификаторов адресатов")
+    ] = None
+    recipientName: Annotated[str | None, Field(description="Наименование адресата")] = (
+        None
+    )
+    recipientNameOr: Annotated[
+        str | None, Field(description="Наименование адресата")
+    ] = None
+    correspondentIds: Annotated[
+        list[UUID] | None, Field(description="Список идентификаторов корреспондентов")
+    ] = None
+    correspondentName: Annotated[
+        str | None, Field(description="Наименование корреспондента")
+    ] = None
+    status: list[Status2] | None = None
+    excludeStatuses: list[Status2] | None = None
+    deliveryMethod: Annotated[
+        str | None, Field(description="Способ получения документа")
+    ] = None
+    deliveryMethodId: Annotated[
+        int | None, Field(description="Способ получения документа ИД")
+    ] = None
+    investmentProgramIds: Annotated[
+        list[UUID] | None, Field(description="Идентификаторы объектов инвестпрограммы")
+    ] = None
+    dateControlStart: Annotated[
+        datetime | None, Field(description="Дата начала контроля документа")
+    ] = None
+    dateControlEnd: Annotated[
+        datetime | None, Field(description="Дата окончания контроля документа")
+    ] = None
+    taskExecutorIds: Annotated[
+        list[UUID] | None, Field(description="Идентификатор исполнителя поручения")
+    ] = None
+    taskExecutorFirstName: Annotated[
+        str | None, Field(description="Имя исполнителя поручения")
+    ] = None
+    taskExecutorLastName: Annotated[
+        str | None, Field(description="Фамилия исполнителя поручения")
+    ] = None
+    taskExecutorMiddleName: Annotated[
+        str | None, Field(description="Отчество исполнителя поручения")
+    ] = None
+    dateTaskStart: Annotated[
+        datetime | None, Field(description="Дата начала исполнения поручения")
+    ] = None
+    dateTaskEnd: Annotated[
+        datetime | None, Field(description="Дата окончания исполнения поручения")
+    ] = None
+    authorCurrentUser: Annotated[
+        bool | None,
+        Field(description="Признак является ли текущий пользователь автором документа"),
+    ] = None
+    processExecutorCurrentUser: Annotated[
+        bool | None,
+        Field(
+            description="Признак является ли текущий пользователь участником текущего процесса без метки"
+        ),
+    ] = None
+    meetingExecutorCurrentUser: Annotated[
+        bool | None,
+        Field(
+            description="Признак является ли текущий пользователь председателем, секретарем, приглашенным, автором в совещании"
+        ),
+    ] = None
+    meetingQuestionExecutorCurrentUser: Annotated[
+        bool | None,
+        Field(
+            description="Признак является ли текущий пользователь докладчиком, содокладчиком, автором в повестке заседания"
+        ),
+    ] = None
+    questionExecutorCurrentUser: Annotated[
+        bool | None,
+        Field(
+            description="Признак является ли текущий пользователь инициатором, автором в вопросе повестки"
+        ),
+    ] = None
+    contractExecutorCurrentUser: Annotated[
+        bool | None,
+        Field(
+            description="Признак является ли текущий пользователь исполнителем, ответственным, доп. согл, ознакомителем, автором в договоре"
+        ),
+    ] = None
+    controlUserCurrentUser: Annotated[
+        bool | None,
+        Field(
+            description="Признак является ли текущий пользователь контролером в документе"
+        ),
+    ] = None
+    introductionCurrentUser: Annotated[
+        bool | None,
+        Field(
+            description="Признак является ли текущий пользователь ознакомителем в документе"
+        ),
+    ] = None
+    additionalAgreementUser: Annotated[
+        bool | None,
+        Field(
+            description="Признак является ли текущий пользователь доп. согласующим в документе"
+        ),
+    ] = None
+    additionalAgreementAllUser: bool | None = None
+    signingCurrentUser: bool | None = None
+    reviewCurrentUser: bool | None = None
+    agreementCurrentUser: bool | None = None
+    statementCurrentUser: bool | None = None
+    taskExecutorCurrentUser: bool | None = None
+    introductionAllCurrentUser: bool | None = None
+    controlOffCurrentUser: bool | None = None
+    controlExpireCurrentUser: bool | None = None
+    controlExpireExecutionCurrentUser: bool | None = None
+    executionExpireCurrentUser: bool | None = None
+    executionOverdueCurrentUser: bool | None = None
+    authorExpireExecutionCurrentUser: bool | None = None
+    authorOverdueExecutionCurrentUser: bool | None = None
+    smdoWaitOutgoingUser: bool | None = None
+    userColorIsNull: bool | None = None
+    userColor: str | None = None
+    smdoFailOutgoingUser: bool | None = None
+    onlyUserOrganization: bool | None = None
+    organizationName: str | None = None
+    fioApplicant: str | None = None
+    regNumberAnd: Annotated[
+        str | None, Field(description="Регистрационный номер документа")
+    ] = None
+    shortSummaryAnd: Annotated[
+        str | None,
+        Field(
+            description="Краткое содержание, может выбираться из справочника кратких содержаний"
+        ),
+    ] = None
+    journalId: UUID | None = None
+    processCompleted: bool | None = None
+    hasRegDate: bool | None = None
+    declarantType: DeclarantType1 | None = None
+    repeatIdentical: str | None = None
+    affairExist: bool | None = None
+    outRegNumberOr: str | None = None
+    correspondentNameOr: str | None = None
+    authorLastNameOr: str | None = None
+    organizationNameOr: str | None = None
+    fioApplicantOr: str | None = None
+    citizenTypeId: UUID | None = None
+    anonymous: bool | None = None
+    collective: bool | None = None
+    reasonably: bool | None = None
+    regionId: UUID | None = None
+    countryAppealId: UUID | None = None
+    districtId: UUID | None = None
+    cityId: UUID | None = None
+    receiptDateStart: datetime | None = None
+    receiptDateEnd: datetime | None = None
+    contractAgreement: bool | None = None
+    contractAutoProlongation: bool | None = None
+    contractTypical: bool | None = None
+    hasAdditionalDocument: bool | None = None
+    recipientId: UUID | None = None
+    recipientSignedFrom: datetime | None = None
+    recipientSignedTo: datetime | None = None
+    signDateFrom: datetime | None = None
+    signDateTo: datetime | None = None
+    currencyIds: list[UUID] | None = None
+    contractSumFrom: float | None = None
+    contractSumTo: float | None = None
+    daysToCompletion: int | None = None
+    correspondentRecipientId: UUID | None = None
+    recipientCorrespondentId: UUID | None = None
+    recipientContractNumberOr: str | None = None
+    createYear: int | None = None
+    mapperRules: list[int] | None = None
+
+
+class ContactFaceRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    lastName: str | None = None
+    firstName: str | None = None
+    middleName: str | None = None
+    post: str | None = None
+    mail: str | None = None
+    phone: str | None = None
+    fax: str | None = None
+    correspondentId: Annotated[UUID | None, Field(description="В V2 не требуется")] = (
+        None
+    )
+
+
+class DepartmentEmployeeNomenclature(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    departmentId: UUID
+    departmentOrgId: str
+    department: Any | None = None
+    employeeId: UUID
+    employee: Any | None = None
+
+
+class DeputyLeaderDepartment(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    departmentId: UUID
+    departmentOrgId: str
+    department: Any | None = None
+    employeeId: UUID
+    employeeOrgId: str
+    employee: Any | None = None
+
+
+class Type24(Enum):
+    SECRETARY = "SECRETARY"
+    IO = "IO"
+    IO_DISMISSAL = "IO_DISMISSAL"
+
+
+class Organization(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    organizationId: str | None = None
+
+
+class Type26(Enum):
+    DIRECTORY = "DIRECTORY"
+    DOCUMENT = "DOCUMENT"
+    NOMENCLATURE_DEPARTMENT = "NOMENCLATURE_DEPARTMENT"
+    SUMMARY_NOMENCLATURE_DEPARTMENT = "SUMMARY_NOMENCLATURE_DEPARTMENT"
+    DESTRUCTION_ACT = "DESTRUCTION_ACT"
+    ACCEPTANCE_INVENTORY = "ACCEPTANCE_INVENTORY"
+    NOMENCLATURE_AFFAIR = "NOMENCLATURE_AFFAIR"
+    MINI_DOCUMENT = "MINI_DOCUMENT"
+    TASK = "TASK"
+    CONTROL_POINT = "CONTROL_POINT"
+
+
+class TaskType1(Enum):
+    INFORMATION = "INFORMATION"
+    GENERAL = "GENERAL"
+
+
+class ResolvePolicy1(Enum):
+    ANY = "ANY"
+    MERGE = "MERGE"
+
+
+class SummaryNomenclatureDepartmentStatus1(Enum):
+    DRAFT = "DRAFT"
+    NEW = "NEW"
+    SIGNING = "SIGNING"
+    SIGNED = "SIGNED"
+    STATEMENT = "STATEMENT"
+    APPROVED = "APPROVED"
+    REJECT = "REJECT"
+    CANCEL = "CANCEL"
+
+
+class DestructionActStatus1(Enum):
+    NEW = "NEW"
+    AGREEMENT = "AGREEMENT"
+    AGREED = "AGREED"
+    SIGNING = "SIGNING"
+    SIGNED = "SIGNED"
+    STATEMENT = "STATEMENT"
+    APPROVED = "APPROVED"
+    CANCEL = "CANCEL"
+
+
+class Post(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    postName: Annotated[str, Field(max_length=255, min_length=0)]
+    postCode: Annotated[str | None, Field(max_length=255, min_length=0)] = None
+    createDate: datetime | None = None
+
+
+class Merge1(Enum):
+    ALL = "ALL"
+    SELF = "SELF"
+    SELF_AND_IO = "SELF_AND_IO"
+    SUBORDINATES_AND_SELF = "SUBORDINATES_AND_SELF"
+    SUBORDINATES_AND_SELF_AND_IO = "SUBORDINATES_AND_SELF_AND_IO"
+
+
+class RoleMerge(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    roleId: UUID | None = None
+    merge: Merge1 | None = None
+
+
+class GrantedAuthority(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    authority: str | None = None
+
+
+class Io(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор исполнителя обязанностей")
+    ] = None
+    createDate: Annotated[
+        datetime | None, Field(description="Дата назначения прав")
+    ] = None
+    revocationDate: Annotated[
+        datetime | None, Field(description="Дата аннулирования прав")
+    ] = None
+
+
+class Secretary(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор секретаря")] = None
+    createDate: Annotated[
+        datetime | None, Field(description="Дата назначения прав")
+    ] = None
+    revocationDate: Annotated[
+        datetime | None, Field(description="Дата аннулирования прав")
+    ] = None
+
+
+class CheckAttachmentSignRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID
+    checkSmdoCert: bool | None = None
+
+
+class OrgKey(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    organizationId: str | None = None
+
+
+class SummaryNomenclatureDepartmentIntroductionRequest(BaseModel):
+    """
+    Идентификаторы сотрудников
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    executorListIds: Annotated[list[UUID], Field(max_items=2147483647, min_items=1)]
+    comment: str
+
+
+class TypeDirectum(Enum):
+    R = "R"
+    S = "S"
+    P = "P"
+    C = "C"
+
+
+class TaskStatusDirectum(Enum):
+    I = "I"
+    W = "W"
+    K = "K"
+    C = "C"
+    N = "N"
+
+
+class Include1(Enum):
+    POST = "POST"
+    DEPARTMENT = "DEPARTMENT"
+
+
+class EmployeeFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    firstName: Annotated[str | None, Field(description="Имя сотрудника")] = None
+    lastName: Annotated[str | None, Field(description="Фамилия сотрудника")] = None
+    middleName: Annotated[str | None, Field(description="Отчество сотрудника")] = None
+    fired: Annotated[bool | None, Field(description="Признак уволен ли сотрудник")] = (
+        None
+    )
+    active: Annotated[
+        bool | None, Field(description="Признак активен ли сотрудник")
+    ] = None
+    fullPostName: Annotated[str | None, Field(description="ФИО сотрудника")] = None
+    postId: Annotated[int | None, Field(description="Идентификатор должности")] = None
+    ids: Annotated[set[UUID] | None, Field(description="Список идентификаторов")] = None
+    departmentId: Annotated[
+        list[UUID] | None,
+        Field(description="Идентификатор департамента в котором работает сотрудник"),
+    ] = None
+    includes: Annotated[
+        list[Include1] | None,
+        Field(description="Список моделей которые могу быть добавлены при отображении"),
+    ] = None
+    orgId: Annotated[str | None, Field(description="ИД филиала")] = None
+    excludeRoleId: UUID | None = None
+    excludeGroupId: UUID | None = None
+    excludeGriefId: UUID | None = None
+    all: bool | None = None
+    childDepartments: Annotated[
+        bool | None,
+        Field(
+            description="Признак поиска по всех коллег включая дочернии подразделения"
+        ),
+    ] = None
+
+
+class DocumentRecipientDeliveryHistoryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None,
+        Field(description="Идентификатор истории доставки документа адресату"),
+    ] = None
+    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
+    log: Annotated[
+        str | None,
+        Field(description="Информация об изменениях доставки документа адресату"),
+    ] = None
+    docRecipientId: Annotated[
+        UUID | None, Field(description="Идентификатор адресата")
+    ] = None
+
+
+class OperationType2(Enum):
+    """
+    Доступные типы операций: DOCUMENT_ACCESS_GRIEF_UPDATE, DOCUMENT_CONTRACT_AGREEMENT_UPDATE, DOCUMENT_CONTRACT_AUTO_PROLONGATION_UPDATE, DOCUMENT_CONTRACT_CORRESPONDENT_UPDATE, DOCUMENT_CONTRACT_FIELDS_UPDATE, DOCUMENT_CONTRACT_RESPONSIBLE, DOCUMENT_CONTRACT_TYPICAL_UPDATE, DOCUMENT_CORRESPONDENT_UPDATE, DOCUMENT_UPDATE_CUSTOM_FIELDS, DOCUMENT_FIELDS_MEETING_UPDATE, DOCUMENT_FIELDS_MEETING_QUESTION_UPDATE, DOCUMENT_FIELDS_QUESTION_UPDATE, DOCUMENT_MEETING_INVITEES_UPDATE, DOCUMENT_LINK_UPDATE, DOCUMENT_MAIN_FIELDS_APPEAL_UPDATE, DOCUMENT_MAIN_FIELDS_UPDATE, DOCUMENT_NOMENCLATURE_AFFAIR_UPDATE, DOCUMENT_PROCESS_EXECUTORS_UPDATE, DOCUMENT_PROCESS_ITEM_UPDATE, DOCUMENT_RECIPIENT_LIST_UPDATE, DOCUMENT_REPEAT_IDENTICAL_UPDATE, DOCUMENT_QUESTION_RESPONSIBLE_EXECUTOR_UPDATE, DOCUMENT_SPEAKERS_MEETING_QUESTION_UPDATE, DOCUMENT_UNDRAFT
+    """
+
+    DOCUMENT_ACCESS_GRIEF_UPDATE = "DOCUMENT_ACCESS_GRIEF_UPDATE"
+    DOCUMENT_CONTRACT_AGREEMENT_UPDATE = "DOCUMENT_CONTRACT_AGREEMENT_UPDATE"
+    DOCUMENT_CONTRACT_AUTO_PROLONGATION_UPDATE = (
+        "DOCUMENT_CONTRACT_AUTO_PROLONGATION_UPDATE"
+    )
+    DOCUMENT_CONTRACT_CORRESPONDENT_UPDATE = "DOCUMENT_CONTRACT_CORRESPONDENT_UPDATE"
+    DOCUMENT_CONTRACT_FIELDS_UPDATE = "DOCUMENT_CONTRACT_FIELDS_UPDATE"
+    DOCUMENT_CONTRACT_RESPONSIBLE = "DOCUMENT_CONTRACT_RESPONSIBLE"
+    DOCUMENT_CONTRACT_TYPICAL_UPDATE = "DOCUMENT_CONTRACT_TYPICAL_UPDATE"
+    DOCUMENT_CORRESPONDENT_UPDATE = "DOCUMENT_CORRESPONDENT_UPDATE"
+    DOCUMENT_UPDATE_CUSTOM_FIELDS = "DOCUMENT_UPDATE_CUSTOM_FIELDS"
+    DOCUMENT_FIELDS_MEETING_UPDATE = "DOCUMENT_FIELDS_MEETING_UPDATE"
+    DOCUMENT_FIELDS_MEETING_QUESTION_UPDATE = "DOCUMENT_FIELDS_MEETING_QUESTION_UPDATE"
+    DOCUMENT_FIELDS_QUESTION_UPDATE = "DOCUMENT_FIELDS_QUESTION_UPDATE"
+    DOCUMENT_MEETING_INVITEES_UPDATE = "DOCUMENT_MEETING_INVITEES_UPDATE"
+    DOCUMENT_LINK_UPDATE = "DOCUMENT_LINK_UPDATE"
+    DOCUMENT_MAIN_FIELDS_APPEAL_UPDATE = "DOCUMENT_MAIN_FIELDS_APPEAL_UPDATE"
+    DOCUMENT_MAIN_FIELDS_UPDATE = "DOCUMENT_MAIN_FIELDS_UPDATE"
+    DOCUMENT_NOMENCLATURE_AFFAIR_UPDATE = "DOCUMENT_NOMENCLATURE_AFFAIR_UPDATE"
+    DOCUMENT_PROCESS_EXECUTORS_UPDATE = "DOCUMENT_PROCESS_EXECUTORS_UPDATE"
+    DOCUMENT_PROCESS_ITEM_UPDATE = "DOCUMENT_PROCESS_ITEM_UPDATE"
+    DOCUMENT_RECIPIENT_LIST_UPDATE = "DOCUMENT_RECIPIENT_LIST_UPDATE"
+    DOCUMENT_REPEAT_IDENTICAL_UPDATE = "DOCUMENT_REPEAT_IDENTICAL_UPDATE"
+    DOCUMENT_QUESTION_RESPONSIBLE_EXECUTOR_UPDATE = (
+        "DOCUMENT_QUESTION_RESPONSIBLE_EXECUTOR_UPDATE"
+    )
+    DOCUMENT_SPEAKERS_MEETING_QUESTION_UPDATE = (
+        "DOCUMENT_SPEAKERS_MEETING_QUESTION_UPDATE"
+    )
+    DOCUMENT_UNDRAFT = "DOCUMENT_UNDRAFT"
+
+
+class CreateTaskRequestExecutor(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    employeeId: UUID | None = None
+    responsible: bool | None = None
+    stampText: str | None = None
+    createDate: datetime | None = None
+    executedDate: datetime | None = None
+
+
+class PaperworkProcessAction(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    result: Annotated[
+        bool,
+        Field(description="Признак результата действия положительный/отрицательный"),
+    ]
+    employeeId: Annotated[
+        UUID,
+        Field(
+            description="Идентификатор участника процесса от лица которого делается действие"
+        ),
+    ]
+    comment: Annotated[str | None, Field(description="Комментарий")] = None
+    ignoreErrors: Annotated[
+        bool | None, Field(description="Признак игнорирования ошибок")
+    ] = None
+    profileId: UUID | None = None
+
+
+class NoPasswordUserAccount(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    employeeId: UUID | None = None
+    login: str | None = None
+    exists: bool | None = None
+
+
+class BasicSearchRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    search: Annotated[str | None, Field(description="Строка поиска")] = None
+    active: Annotated[bool | None, Field(description="Признак активности")] = None
+
+
+class ExecutionTaskStatCount(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    work: int | None = None
+    limited: int | None = None
+    expire: int | None = None
+
+
+class Include8(Enum):
+    LEADER = "LEADER"
+    LEADER_WITH_POST = "LEADER_WITH_POST"
+    PARENT_DEPARTMENT = "PARENT_DEPARTMENT"
+    EMPLOYEES = "EMPLOYEES"
+    EMPLOYEES_WITH_POST = "EMPLOYEES_WITH_POST"
+    DEPUTY_LEADER = "DEPUTY_LEADER"
+    RESPONSIBLE_NOMENCLATURE = "RESPONSIBLE_NOMENCLATURE"
+
+
+class DocCategoryConstant11(Enum):
+    """
+    Категория документа
+    """
+
+    INTERN = "INTERN"
+    INCOMING = "INCOMING"
+    OUTGOING = "OUTGOING"
+    MEETING = "MEETING"
+    QUESTION = "QUESTION"
+    MEETING_QUESTION = "MEETING_QUESTION"
+    APPEAL = "APPEAL"
+    CONTRACT = "CONTRACT"
+    CUSTOM = "CUSTOM"
+
+
+class Include9(Enum):
+    DOCUMENT = "DOCUMENT"
+    ATTACHMENTS = "ATTACHMENTS"
+    ATTACHMENTS_AND_ADDITIONAL_TYPE = "ATTACHMENTS_AND_ADDITIONAL_TYPE"
+    NOMENCLATURE_AFFAIR = "NOMENCLATURE_AFFAIR"
+    DOCUMENT_LANGUAGE = "DOCUMENT_LANGUAGE"
+    DOCUMENT_INVENTORY = "DOCUMENT_INVENTORY"
+
+
+class MiniDocumentFilter(BaseModel):
+    """
+    Фильтр для поиска мини-документов
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    ids: list[UUID] | None = None
+    number: Annotated[int | None, Field(description="Номер документа")] = None
+    regNumber: Annotated[str | None, Field(description="Регистрационный номер")] = None
+    regDateFrom: Annotated[datetime | None, Field(description="Дата регистрации с")] = (
+        None
+    )
+    regDateTo: Annotated[datetime | None, Field(description="Дата регистрации по")] = (
+        None
+    )
+    yearFrom: Annotated[datetime | None, Field(description="Год с")] = None
+    yearTo: Annotated[datetime | None, Field(description="Год по")] = None
+    affairIndex: Annotated[str | None, Field(description="Индекс дела")] = None
+    docCategoryConstant: Annotated[
+        DocCategoryConstant11 | None, Field(description="Категория документа")
+    ] = None
+    shortSummary: Annotated[str | None, Field(description="Краткое содержание")] = None
+    documentLanguage: Annotated[str | None, Field(description="Язык документа")] = None
+    affairIds: Annotated[
+        list[UUID] | None, Field(description="ID номенклатуры дел")
+    ] = None
+    customDocument: Annotated[
+        bool | None, Field(description="Документ создан в ручную")
+    ] = None
+    accessIds: list[UUID] | None = None
+    deleted: bool | None = None
+    includes: Annotated[
+        list[Include9] | None, Field(description="Включаемые связанные данные")
+    ] = None
+
+
+class CertInfo(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    start: datetime | None = None
+    end: datetime | None = None
+    issuer: str | None = None
+    subject: str | None = None
+    serialNumber: str | None = None
+
+
+class Operation4(Enum):
+    """
+    Перечисления доступных операций над сущностями в документе
+    """
+
+    DOCUMENT_READ = "DOCUMENT_READ"
+    DOCUMENT_CHANGE_REGNUMBER = "DOCUMENT_CHANGE_REGNUMBER"
+    DOCUMENT_FIELDS_MEETING_QUESTION_UPDATE = "DOCUMENT_FIELDS_MEETING_QUESTION_UPDATE"
+    DOCUMENT_QUESTION_RESPONSIBLE_EXECUTOR_UPDATE = (
+        "DOCUMENT_QUESTION_RESPONSIBLE_EXECUTOR_UPDATE"
+    )
+    DOCUMENT_FIELDS_QUESTION_UPDATE = "DOCUMENT_FIELDS_QUESTION_UPDATE"
+    DOCUMENT_FIELDS_MEETING_UPDATE = "DOCUMENT_FIELDS_MEETING_UPDATE"
+    DOCUMENT_MEETING_INVITEES_UPDATE = "DOCUMENT_MEETING_INVITEES_UPDATE"
+    DOCUMENT_CONTRACT_FIELDS_UPDATE = "DOCUMENT_CONTRACT_FIELDS_UPDATE"
+    DOCUMENT_CONTRACT_AUTO_PROLONGATION_UPDATE = (
+        "DOCUMENT_CONTRACT_AUTO_PROLONGATION_UPDATE"
+    )
+    DOCUMENT_CONTRACT_TYPICAL_UPDATE = "DOCUMENT_CONTRACT_TYPICAL_UPDATE"
+    DOCUMENT_CONTRACT_CORRESPONDENT_UPDATE = "DOCUMENT_CONTRACT_CORRESPONDENT_UPDATE"
+    DOCUMENT_CONTRACT_AGREEMENT_UPDATE = "DOCUMENT_CONTRACT_AGREEMENT_UPDATE"
+    DOCUMENT_MAIN_FIELDS_UPDATE = "DOCUMENT_MAIN_FIELDS_UPDATE"
+    DOCUMENT_MAIN_FIELDS_APPEAL_UPDATE = "DOCUMENT_MAIN_FIELDS_APPEAL_UPDATE"
+    DOCUMENT_REPEAT_IDENTICAL_UPDATE = "DOCUMENT_REPEAT_IDENTICAL_UPDATE"
+    DOCUMENT_CORRESPONDENT_UPDATE = "DOCUMENT_CORRESPONDENT_UPDATE"
+    DOCUMENT_PROCESS_ITEM_UPDATE = "DOCUMENT_PROCESS_ITEM_UPDATE"
+    DOCUMENT_PROCESS_MOVE = "DOCUMENT_PROCESS_MOVE"
+    DOCUMENT_PROCESS_EXECUTORS_UPDATE = "DOCUMENT_PROCESS_EXECUTORS_UPDATE"
+    DOCUMENT_PREPARATION_COMPLETED = "DOCUMENT_PREPARATION_COMPLETED"
+    DOCUMENT_PAPERWORK_COMPLETED = "DOCUMENT_PAPERWORK_COMPLETED"
+    DOCUMENT_ACCEPTANCE_COMPLETED = "DOCUMENT_ACCEPTANCE_COMPLETED"
+    DOCUMENT_TEST = "DOCUMENT_TEST"
+    DOCUMENT_CANCEL = "DOCUMENT_CANCEL"
+    DOCUMENT_NEXT_PROCESS = "DOCUMENT_NEXT_PROCESS"
+    DOCUMENT_START = "DOCUMENT_START"
+    DOCUMENT_ACCESS_GRIEF_UPDATE = "DOCUMENT_ACCESS_GRIEF_UPDATE"
+    DOCUMENT_UNDRAFT = "DOCUMENT_UNDRAFT"
+    DOCUMENT_PROCESS_STATEMENT = "DOCUMENT_PROCESS_STATEMENT"
+    DOCUMENT_PROCESS_SIGNING = "DOCUMENT_PROCESS_SIGNING"
+    DOCUMENT_PROCESS_AGREEMENT = "DOCUMENT_PROCESS_AGREEMENT"
+    DOCUMENT_PROCESS_CONTRACT_EXECUTION = "DOCUMENT_PROCESS_CONTRACT_EXECUTION"
+    DOCUMENT_PROCESS_REVIEW = "DOCUMENT_PROCESS_REVIEW"
+    DOCUMENT_PROCESS_REDIRECT_REVIEW = "DOCUMENT_PROCESS_REDIRECT_REVIEW"
+    DOCUMENT_PROCESS_SENT = "DOCUMENT_PROCESS_SENT"
+    DOCUMENT_PROCESS_REGISTRATION = "DOCUMENT_PROCESS_REGISTRATION"
+    DOCUMENT_PROCESS_FREE_REGISTRATION = "DOCUMENT_PROCESS_FREE_REGISTRATION"
+    DOCUMENT_RESERVE_REGNUMBER = "DOCUMENT_RESERVE_REGNUMBER"
+    DOCUMENT_PROCESS_SMDO_REGISTRATION_SKIP = "DOCUMENT_PROCESS_SMDO_REGISTRATION_SKIP"
+    DOCUMENT_PROCESS_SMDO_REGISTRATION_REJECT = (
+        "DOCUMENT_PROCESS_SMDO_REGISTRATION_REJECT"
+    )
+    DOCUMENT_SMDO_CREATE_ANSWER = "DOCUMENT_SMDO_CREATE_ANSWER"
+    DOCUMENT_CREATE_ANSWER = "DOCUMENT_CREATE_ANSWER"
+    DOCUMENT_SMDO_RETRY_ACK_DELIVERY = "DOCUMENT_SMDO_RETRY_ACK_DELIVERY"
+    DOCUMENT_SMDO_RETRY_DOCUMENT_DELIVERY = "DOCUMENT_SMDO_RETRY_DOCUMENT_DELIVERY"
+    DOCUMENT_SMDO_CONFIRM_DELIVERY = "DOCUMENT_SMDO_CONFIRM_DELIVERY"
+    DOCUMENT_SMDO_CANCEL_DELIVERY = "DOCUMENT_SMDO_CANCEL_DELIVERY"
+    DOCUMENT_LINK_UPDATE = "DOCUMENT_LINK_UPDATE"
+    DOCUMENT_INTRODUCTION_CREATE = "DOCUMENT_INTRODUCTION_CREATE"
+    DOCUMENT_INTRODUCTION_DELETE = "DOCUMENT_INTRODUCTION_DELETE"
+    DOCUMENT_INTRODUCTION_DELETE_ALL = "DOCUMENT_INTRODUCTION_DELETE_ALL"
+    DOCUMENT_INTRODUCTION_EXECUTE = "DOCUMENT_INTRODUCTION_EXECUTE"
+    DOCUMENT_ADDITIONAL_AGREEMENT_CREATE = "DOCUMENT_ADDITIONAL_AGREEMENT_CREATE"
+    DOCUMENT_ADDITIONAL_AGREEMENT_DELETE = "DOCUMENT_ADDITIONAL_AGREEMENT_DELETE"
+    DOCUMENT_ADDITIONAL_AGREEMENT_DELETE_ALL = (
+        "DOCUMENT_ADDITIONAL_AGREEMENT_DELETE_ALL"
+    )
+    DOCUMENT_ADDITIONAL_AGREEMENT_EXECUTE = "DOCUMENT_ADDITIONAL_AGREEMENT_EXECUTE"
+    DOCUMENT_NEW_VERSION = "DOCUMENT_NEW_VERSION"
+    DOCUMENT_CONTROL_CREATE = "DOCUMENT_CONTROL_CREATE"
+    DOCUMENT_CONTROL_UPDATE = "DOCUMENT_CONTROL_UPDATE"
+    DOCUMENT_CONTROL_REMOVE = "DOCUMENT_CONTROL_REMOVE"
+    DOCUMENT_CONTROL_DELETE = "DOCUMENT_CONTROL_DELETE"
+    DOCUMENT_RECIPIENT_LIST_UPDATE = "DOCUMENT_RECIPIENT_LIST_UPDATE"
+    DOCUMENT_PRINT_REFERATKA = "DOCUMENT_PRINT_REFERATKA"
+    DOCUMENT_PRINT_SHEET = "DOCUMENT_PRINT_SHEET"
+    DOCUMENT_PRINT = "DOCUMENT_PRINT"
+    DOCUMENT_PRINT_ATTACHMENT = "DOCUMENT_PRINT_ATTACHMENT"
+    DOCUMENT_PRINT_JOURNAL = "DOCUMENT_PRINT_JOURNAL"
+    DOCUMENT_PRINT_INTRODUCTION = "DOCUMENT_PRINT_INTRODUCTION"
+    DOCUMENT_PRINT_CONTRACT_EXECUTION = "DOCUMENT_PRINT_CONTRACT_EXECUTION"
+    DOCUMENT_PRINT_LINK = "DOCUMENT_PRINT_LINK"
+    DOCUMENT_PRINT_MEETING_QUESTION = "DOCUMENT_PRINT_MEETING_QUESTION"
+    DOCUMENT_PRINT_ADDITIONAL_AGREEMENT = "DOCUMENT_PRINT_ADDITIONAL_AGREEMENT"
+    DOCUMENT_ATTACHMENT_EDS_UPLOAD = "DOCUMENT_ATTACHMENT_EDS_UPLOAD"
+    DOCUMENT_ATTACHMENT_EDS_REMOVE = "DOCUMENT_ATTACHMENT_EDS_REMOVE"
+    DOCUMENT_ATTACHMENT_EDS_CHECK = "DOCUMENT_ATTACHMENT_EDS_CHECK"
+    DOCUMENT_ADD_DOCUMENTS = "DOCUMENT_ADD_DOCUMENTS"
+    DOCUMENT_UPDATE_ATTACHMENT = "DOCUMENT_UPDATE_ATTACHMENT"
+    DOCUMENT_DELETE_ATTACHMENT = "DOCUMENT_DELETE_ATTACHMENT"
+    DOCUMENT_READ_ATTACHMENT = "DOCUMENT_READ_ATTACHMENT"
+    DOCUMENT_UPDATE_ADDITIONAL_ATTACHMENT = "DOCUMENT_UPDATE_ADDITIONAL_ATTACHMENT"
+    DOCUMENT_DELETE_ADDITIONAL_ATTACHMENT = "DOCUMENT_DELETE_ADDITIONAL_ATTACHMENT"
+    DOCUMENT_READ_ADDITIONAL_ATTACHMENT = "DOCUMENT_READ_ADDITIONAL_ATTACHMENT"
+    DOCUMENT_NOMENCLATURE_AFFAIR_UPDATE = "DOCUMENT_NOMENCLATURE_AFFAIR_UPDATE"
+    DOCUMENT_WRITE_OFF_NOMENCLATURE_AFFAIR_UPDATE = (
+        "DOCUMENT_WRITE_OFF_NOMENCLATURE_AFFAIR_UPDATE"
+    )
+    DOCUMENT_CHANGE_AUTHOR = "DOCUMENT_CHANGE_AUTHOR"
+    DOCUMENT_EXTRACT_NOMENCLATURE_AFFAIR_UPDATE = (
+        "DOCUMENT_EXTRACT_NOMENCLATURE_AFFAIR_UPDATE"
+    )
+    DOCUMENT_IN_ARCHIVE_UPDATE = "DOCUMENT_IN_ARCHIVE_UPDATE"
+    DOCUMENT_TASK_CREATE = "DOCUMENT_TASK_CREATE"
+    DOCUMENT_FOLDER_USER = "DOCUMENT_FOLDER_USER"
+    DOCUMENT_TO_PREPARATION = "DOCUMENT_TO_PREPARATION"
+    DOCUMENT_PREPARATION_NOTIFY = "DOCUMENT_PREPARATION_NOTIFY"
+    DOCUMENT_REDO_PROTOCOL = "DOCUMENT_REDO_PROTOCOL"
+    DOCUMENT_LIST_QUESTIONS_UPDATE = "DOCUMENT_LIST_QUESTIONS_UPDATE"
+    DOCUMENT_SPEAKERS_MEETING_QUESTION_UPDATE = (
+        "DOCUMENT_SPEAKERS_MEETING_QUESTION_UPDATE"
+    )
+    DOCUMENT_NOTIFY_MEETING_QUESTION = "DOCUMENT_NOTIFY_MEETING_QUESTION"
+    DOCUMENT_CONTRACT_RESPONSIBLE = "DOCUMENT_CONTRACT_RESPONSIBLE"
+    DOCUMENT_UPDATE_CUSTOM_FIELDS = "DOCUMENT_UPDATE_CUSTOM_FIELDS"
+    TASK_UPDATE = "TASK_UPDATE"
+    TASK_PERIOD_UPDATE = "TASK_PERIOD_UPDATE"
+    TASK_EXECUTOR_UPDATE = "TASK_EXECUTOR_UPDATE"
+    TASK_EXECUTE_ONE_FOR_ALL = "TASK_EXECUTE_ONE_FOR_ALL"
+    TASK_REVISION = "TASK_REVISION"
+    TASK_DELETE = "TASK_DELETE"
+    TASK_EXECUTE_CHANGE_DATE_REQUEST = "TASK_EXECUTE_CHANGE_DATE_REQUEST"
+    TASK_EXECUTE = "TASK_EXECUTE"
+    TASK_CHANGE_DATE_REQUEST = "TASK_CHANGE_DATE_REQUEST"
+    TASK_CHILD_CREATE = "TASK_CHILD_CREATE"
+    TASK_CONTROL_CREATE = "TASK_CONTROL_CREATE"
+    TASK_CONTROL_UPDATE = "TASK_CONTROL_UPDATE"
+    TASK_CONTROL_REMOVE = "TASK_CONTROL_REMOVE"
+    TASK_CONTROL_DELETE = "TASK_CONTROL_DELETE"
+    TASK_AUTHOR_CHANGE = "TASK_AUTHOR_CHANGE"
+    TASK_EXECUTE_ALL = "TASK_EXECUTE_ALL"
+    DOCUMENT_TASK_ENDLESS = "DOCUMENT_TASK_ENDLESS"
+    DOCUMENT_TASK_PERIOD = "DOCUMENT_TASK_PERIOD"
+    TASK_TASK_PROJECT_CREATE = "TASK_TASK_PROJECT_CREATE"
+    TASK_TASK_PROJECT_EXECUTE_BY_AUTHOR = "TASK_TASK_PROJECT_EXECUTE_BY_AUTHOR"
+    TASK_PROJECT_AUTHOR_CHANGE = "TASK_PROJECT_AUTHOR_CHANGE"
+    TASK_PROJECT_DELETE = "TASK_PROJECT_DELETE"
+    TASK_PROJECT_EXECUTOR_UPDATE = "TASK_PROJECT_EXECUTOR_UPDATE"
+    TASK_PROJECT_UPDATE = "TASK_PROJECT_UPDATE"
+    TASK_PROJECT_EXECUTE = "TASK_PROJECT_EXECUTE"
+    DOCUMENT_ADDITIONAL_DOCUMENT_CREATE = "DOCUMENT_ADDITIONAL_DOCUMENT_CREATE"
+    DOCUMENT_ADDITIONAL_DOCUMENT_CREATE_CHILD = (
+        "DOCUMENT_ADDITIONAL_DOCUMENT_CREATE_CHILD"
+    )
+    DOCUMENT_ADDITIONAL_DOCUMENT_UPDATE = "DOCUMENT_ADDITIONAL_DOCUMENT_UPDATE"
+    DOCUMENT_ADDITIONAL_DOCUMENT_DELETE = "DOCUMENT_ADDITIONAL_DOCUMENT_DELETE"
+    DOCUMENT_CONTROL_POINT_CREATE = "DOCUMENT_CONTROL_POINT_CREATE"
+    DOCUMENT_CONTROL_POINT_MOVE = "DOCUMENT_CONTROL_POINT_MOVE"
+    CONTROL_POINT_UPDATE = "CONTROL_POINT_UPDATE"
+    CONTROL_POINT_COMPLETE = "CONTROL_POINT_COMPLETE"
+    CONTROL_POINT_REVISION = "CONTROL_POINT_REVISION"
+    CONTROL_POINT_DELETE = "CONTROL_POINT_DELETE"
+
+
+class UserDocPermission(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    operation: Annotated[
+        Operation4 | None,
+        Field(description="Перечисления доступных операций над сущностями в документе"),
+    ] = None
+    employees: Annotated[set[UUID] | None, Field()] = None
+
+
+class Type52(Enum):
+    RECEIVED_IN_RESPONSE_TO = "RECEIVED_IN_RESPONSE_TO"
+    CREATE_IN_RESPONSE_TO = "CREATE_IN_RESPONSE_TO"
+    LINK_DOC = "LINK_DOC"
+    TASK_DOC_LINK = "TASK_DOC_LINK"
+    CHILD_LINK_DOC = "CHILD_LINK_DOC"
+    CHILD_DOCUMENT = "CHILD_DOCUMENT"
+    PROTOCOL = "PROTOCOL"
+    CHILD_PROTOCOL = "CHILD_PROTOCOL"
+    REPLY_TO_APPLICANT = "REPLY_TO_APPLICANT"
+    PROTOCOL_MEETING_QUESTION = "PROTOCOL_MEETING_QUESTION"
+    QUESTION_DOCUMENTS = "QUESTION_DOCUMENTS"
+
+
+class IdsLong(BaseModel):
+    """
+    Список идентификаторов
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    ids: Annotated[list[int], Field(max_items=2147483647, min_items=1)]
+
+
+class DocumentAccessGriefUpdate(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_ACCESS_GRIEF_UPDATE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    accessGriefId: UUID | None = None
+
+
+class ContractAgreementUpdate(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_CONTRACT_AGREEMENT_UPDATE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    contractAgreement: bool | None = None
+
+
+class AutoProlongationUpdate(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_CONTRACT_AUTO_PROLONGATION_UPDATE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    contractAutoProlongation: bool | None = None
+
+
+class DocContractFields(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_CONTRACT_FIELDS_UPDATE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    currencyId: UUID | None = None
+    contractSigningDate: datetime | None = None
+    contractStartDate: datetime | None = None
+    contractDurationStart: datetime | None = None
+    contractDurationEnd: datetime | None = None
+    contractNumber: str | None = None
+    contractDate: datetime | None = None
+    contractSum: float | None = None
+
+
+class ResponsibleUpdate(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_CONTRACT_RESPONSIBLE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    addIds: list[UUID] | None = None
+    delIds: list[UUID] | None = None
+
+
+class ContractTypicalUpdate(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_CONTRACT_TYPICAL_UPDATE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    contractTypical: bool | None = None
+
+
+class DocCorrespondentUpdate(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_CORRESPONDENT_UPDATE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    outRegDate: datetime | None = None
+    outRegNumber: str | None = None
+    correspondentName: str | None = None
+    correspondentId: UUID | None = None
+    inDocSigners: str | None = None
+    countryName: str | None = None
+    countryId: UUID | None = None
+
+
+class DocFieldsMeeting(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_FIELDS_MEETING_UPDATE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    externalInvitees: Annotated[
+        str | None, Field(description="Внешние приглашенные")
+    ] = None
+    chairpersonEmployeeId: Annotated[UUID | None, Field(description="Председатель")] = (
+        None
+    )
+    secretaryEmployeeId: Annotated[UUID | None, Field(description="Секретарь")] = None
+    dateMeeting: Annotated[datetime | None, Field(description="Дата совещания")] = None
+    startMeeting: Annotated[datetime | None, Field(description="Начало совещания")] = (
+        None
+    )
+    endMeeting: Annotated[datetime | None, Field(description="Окончание совещания")] = (
+        None
+    )
+    placeMeeting: Annotated[str | None, Field(description="Место совещания")] = None
+
+
+class DocFieldsMeetingQuestion(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_FIELDS_MEETING_QUESTION_UPDATE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    formMeetingType: Annotated[
+        FormMeetingType | None, Field(description="Форма проведения заседания")
+    ] = None
+    dateMeetingQuestion: Annotated[
+        datetime | None, Field(description="Дата проведения заседания")
+    ] = None
+    addition: Annotated[
+        bool | None, Field(description="Признак дополнения к повестке вопросов")
+    ] = None
+    additionMeetingQuestionId: Annotated[
+        UUID | None,
+        Field(
+            description="Идентификатор документа для которого создается дополнительное заседание по вопросам"
+        ),
+    ] = None
+
+
+class DocFieldsQuestion(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_FIELDS_QUESTION_UPDATE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    initiatorId: Annotated[
+        UUID | None, Field(description="Идентификатор инициатора вопроса")
+    ] = None
+    numberQuestion: Annotated[int | None, Field(description="Номер вопроса")] = None
+    dateQuestion: Annotated[datetime | None, Field(description="Дата заседания")] = None
+    commentQuestion: Annotated[
+        str | None, Field(description="Комментарии для руководителя")
+    ] = None
+
+
+class DocInvitees(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_MEETING_INVITEES_UPDATE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    invitees: list[UUID] | None = None
+
+
+class DocumentLinkUpdatePart(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    docLinkId: UUID | None = None
+    documentOrgId: str | None = None
+    documentLinkType: Type52 | None = None
+
+
+class DocMainFieldsAppeal(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_MAIN_FIELDS_APPEAL_UPDATE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    receiptDate: Annotated[
+        datetime | None, Field(description="Содержит дату поступления обращения")
+    ] = None
+    declarantType: Annotated[
+        DeclarantType | None,
+        Field(
+            description="Признак, является заявитель физическим или юридическим лицом"
+        ),
+    ] = None
+    citizenTypeId: Annotated[
+        UUID | None, Field(description="Идентификатор вида обращения")
+    ] = None
+    collective: Annotated[
+        bool | None, Field(description="Признак коллективного обращения")
+    ] = None
+    anonymous: Annotated[
+        bool | None, Field(description="Признак анонимного обращения")
+    ] = None
+    fioApplicant: Annotated[
+        str | None, Field(description="Содержит Ф.И.О. заявителя")
+    ] = None
+    countryAppealId: Annotated[
+        UUID | None, Field(description="Идентификатор страны")
+    ] = None
+    countryAppealName: Annotated[
+        str | None, Field(description="Наименование страны")
+    ] = None
+    regionId: Annotated[UUID | None, Field(description="Идентификатор области")] = None
+    regionName: Annotated[str | None, Field(description="Область")] = None
+    districtId: Annotated[UUID | None, Field(description="Идентификатор района")] = None
+    districtName: Annotated[str | None, Field(description="Район")] = None
+    cityId: Annotated[UUID | None, Field(description="Идентификатор города")] = None
+    cityName: Annotated[str | None, Field(description="Город")] = None
+    index: Annotated[str | None, Field(description="Индекс")] = None
+    fullAddress: Annotated[
+        str | None, Field(description="Содержит улицу, дом, корпус, квартиру")
+    ] = None
+    phone: Annotated[str | None, Field(description="Контактный телефон")] = None
+    email: Annotated[str | None, Field(description="e-mail заявителя")] = None
+    organizationName: Annotated[
+        str | None, Field(description="Содержит наименование организации-заявителя")
+    ] = None
+    signed: Annotated[
+        str | None, Field(description="Содержит Ф.И.О. лица, подписавшего документ")
+    ] = None
+    correspondentOrgNumber: Annotated[
+        str | None,
+        Field(
+            description="Содержит исходящий регистрационный индекс, присвоенный документу организацией-корреспондентом"
+        ),
+    ] = None
+    dateDocCorrespondentOrg: Annotated[
+        datetime | None,
+        Field(
+            description="Содержит дату присвоения организацией-корреспондентом документу исходящего регистрационного номера"
+        ),
+    ] = None
+    subjectId: Annotated[UUID | None, Field(description="Идентификатор тематики")] = (
+        None
+    )
+    correspondentAppeal: Annotated[
+        str | None,
+        Field(
+            description="Заполняется, если обращение в ГТБ переслала другая организация, куда оно поступило первоначально (адресаты/корреспонденты)"
+        ),
+    ] = None
+    correspondentAppealId: Annotated[
+        UUID | None, Field(description="Корреспондент ид")
+    ] = None
+    indexDateCoverLetter: Annotated[
+        str | None, Field(description="Дата и индекс сопроводительного письма")
+    ] = None
+    reviewProgress: Annotated[str | None, Field(description="Ход рассмотрения")] = None
+    solutionResultId: Annotated[
+        UUID | None, Field(description="Идентификатор результата решения")
+    ] = None
+    nomenclatureAffairId: Annotated[
+        UUID | None, Field(description="Идентификатор номенклатуры дел")
+    ] = None
+    reasonably: Annotated[bool | None, Field(description="Признак обоснованности")] = (
+        None
+    )
+
+
+class DocMainFields(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_MAIN_FIELDS_UPDATE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    additionalPages: str | None = None
+    exemplarCount: int | None = None
+    investProgramId: UUID | None = None
+    shortSummary: str | None = None
+    documentTypeId: int | None = None
+    deliveryMethodId: int | None = None
+    pages: int | None = None
+    inArchive: bool | None = None
+    whoAddressed: list[MiniUserInfoDto] | None = None
+    whoSignedId: UUID | None = None
+    note: str | None = None
+
+
+class EmployeeWithPosition(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    order: int | None = None
+    id: UUID | None = None
+
+
+class DocumentProcessItemUpdate(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_PROCESS_ITEM_UPDATE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    days: int | None = None
+    actionQueueType: ActionQueueType1 | None = None
+
+
+class DocRepeatIdentical(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_REPEAT_IDENTICAL_UPDATE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    repeatIdenticalAppeals: Annotated[
+        list[RepeatIdenticalAppealDto] | None,
+        Field(description="Повторные и идентичные обращения"),
+    ] = None
+
+
+class DocumentResponsibleUpdate(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_QUESTION_RESPONSIBLE_EXECUTOR_UPDATE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    ids: list[UUID] | None = None
+
+
+class Speaker(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    questionId: UUID | None = None
+    ids: list[UUID] | None = None
+    type: Type11 | None = None
+
+
+class DocumentUndraft(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_UNDRAFT
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+
+
+class AdditionalDocumentAttachmentDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    attachment: AttachmentDto | None = None
+    additionalDocumentId: UUID | None = None
+    additionalDocument: Any | None = None
+    documentId: UUID | None = None
+    createDate: datetime | None = None
+
+
+class AttachmentSignature(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор ЭЦП")] = None
+    date: Annotated[
+        datetime | None, Field(description="Дата формирования подписи ЭЦП")
+    ] = None
+    check: Annotated[
+        bool | None,
+        Field(description="Признак была ли выполнена проверка валидности ЭЦП"),
+    ] = None
+    sign: Annotated[Signature | None, Field(description="ЭЦП")] = None
+
+
+class DocumentFormDefinitionDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор определения формы документа")
+    ] = None
+    general: Annotated[
+        dict[str, Any] | None, Field(description="Общие настройки формы")
+    ] = None
+    fields: Annotated[
+        list[DocumentFormField] | None, Field(description="Поля формы документа")
+    ] = None
+
+
+class DocumentFormDto(BaseModel):
+    """
+    Форма документа
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор формы документа")] = (
+        None
+    )
+    name: Annotated[
+        str, Field(description="Наименование формы документа", min_length=1)
+    ]
+    documentConstant: Annotated[
+        DocumentConstant, Field(description="Константа документа")
+    ]
+    active: Annotated[
+        bool | None, Field(description="Признак активен ли форма документа")
+    ] = None
+    system: Annotated[
+        bool | None, Field(description="Признак системной формы документа")
+    ] = None
+    documentTypeId: Annotated[int, Field(description="Идентификатор типа документа")]
+    documentType: DocumentTypeDto | None = None
+    general: Annotated[
+        dict[str, dict[str, Any]] | None, Field(description="Общие настройки формы")
+    ] = None
+    fields: Annotated[
+        list[DocumentFormField] | None, Field(description="Поля формы документа")
+    ] = None
+
+
+class InnerInventory(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    archiveKeepingId: int | None = None
+    document: str
+    signature: str
+    signatureTime: str
+    orgApprovePerson: OrgApprovePerson
+
+
+class InnerInventoryResponse(PackageEoResponse):
+    pass
+
+
+class MiniDocumentAttachmentDto(BaseModel):
+    """
+    DTO для вложений мини-документа
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор вложения")] = None
+    miniDocumentId: Annotated[
+        UUID | None, Field(description="Идентификатор мини-документа")
+    ] = None
+    type: Annotated[
+        AttachmentDocumentType | None, Field(description="Тип вложения")
+    ] = None
+    attachment: AttachmentDto | None = None
+    contentType: ContentType | None = None
+    uploadDate: Annotated[datetime | None, Field(description="Дата загрузки")] = None
+    signs: Annotated[
+        list[AttachmentSignature] | None, Field(description="Список ЭЦП вложения")
+    ] = None
+    additionalDocumentTypeId: Annotated[
+        UUID | None, Field(description="Id вида дополнительного документа")
+    ] = None
+    additionalDocumentType: Annotated[
+        AdditionalDocumentTypeDto | None,
+        Field(description="Вид дополнительного документа"),
+    ] = None
+    docAttachmentId: UUID | None = None
+    additionalDocAttachmentId: UUID | None = None
+
+
+class CustomViewDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор пользовательского представления")
+    ] = None
+    name: Annotated[
+        str | None, Field(description="Название представления", max_length=50)
+    ] = None
+    columns: Annotated[
+        list[CustomViewColumn] | None, Field(description="Настройки колонок")
+    ] = None
+    filter: Annotated[
+        DocumentFilter | None, Field(description="Фильтр представления")
+    ] = None
+    employeeId: Annotated[
+        UUID | None, Field(description="Идентификатор сотрудника")
+    ] = None
+    defaultSortColumn: Annotated[
+        str | None, Field(description="Поле сортировки по умолчанию", max_length=100)
+    ] = None
+    defaultSortDirection: Annotated[
+        str | None,
+        Field(description="Направление сортировки по умолчанию", max_length=10),
+    ] = None
+
+
+class CurrentUser(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    orgId: str | None = None
+    firstName: str | None = None
+    lastName: str | None = None
+    middleName: str | None = None
+    fullPostName: str | None = None
+    meIo: list[Io] | None = None
+    secretaries: list[Secretary] | None = None
+    roles: Annotated[set[UUID] | None, Field()] = None
+    postId: int | None = None
+    departmentId: UUID | None = None
+    departmentName: str | None = None
+    post: PostDto | None = None
+    fired: bool | None = None
+    country: CountryDto | None = None
+    active: bool | None = None
+    authorities: list[GrantedAuthority] | None = None
+    localization: Localization | None = None
+    widgets: bool | None = None
+    scanWia: bool | None = None
+    docEllipsis: bool | None = None
+    docEllipsisRow: int | None = None
+    showEventDesign: bool | None = None
+    settings: ScanSettingJsonB | None = None
+    griefIds: Annotated[set[UUID] | None, Field()] = None
+    responsibleNomenclatureDepartmentIds: list[UUID] | None = None
+    subordinatesDepartments: list[UUID] | None = None
+    archivist: bool | None = None
+    views: list[CustomViewDto] | None = None
+
+
+class IdsOrgKey(BaseModel):
+    """
+    Список идентификаторов
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    ids: Annotated[list[OrgKey], Field(max_items=2147483647, min_items=1)]
+
+
+class DocumentLinkUpdate(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_LINK_UPDATE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    links: list[DocumentLinkUpdatePart] | None = None
+
+
+class DocumentProcessExecutorUpdate(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_PROCESS_EXECUTORS_UPDATE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    employees: list[EmployeeWithPosition] | None = None
+
+
+class DocSpeakerUpdate(BaseModel):
+    """
+    Тип параметра для операции DOCUMENT_SPEAKERS_MEETING_QUESTION_UPDATE
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    speakers: list[Speaker] | None = None
+
+
+class AttachmentDocumentDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор вложения")] = None
+    name: Annotated[str | None, Field(description="Наименование вложения")] = None
+    uploadDate: datetime | None = None
+    size: Annotated[int | None, Field(description="Размер вложения")] = None
+    type: Type1 | None = None
+    signs: Annotated[
+        list[AttachmentSignature] | None, Field(description="Список ЭЦП вложения")
+    ] = None
+    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
+        None
+    )
+    attachmentDocumentType: Annotated[
+        AttachmentDocumentType | None, Field(description="Тип вложения")
+    ] = None
+    authorId: UUID | None = None
+    lastModifyUserId: UUID | None = None
+    modifyDate: datetime | None = None
+    sourceOriginalName: str | None = None
+
+
+class InnerInventories(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    innerInventory: list[InnerInventory]
+
+
+class InnerInventoryRequestBody(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    system: WsSystem
+    innerInventories: InnerInventories
+
+
+class DocOperation(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    operationType: Annotated[
+        OperationType2,
+        Field(
+            description="Доступные типы операций: DOCUMENT_ACCESS_GRIEF_UPDATE, DOCUMENT_CONTRACT_AGREEMENT_UPDATE, DOCUMENT_CONTRACT_AUTO_PROLONGATION_UPDATE, DOCUMENT_CONTRACT_CORRESPONDENT_UPDATE, DOCUMENT_CONTRACT_FIELDS_UPDATE, DOCUMENT_CONTRACT_RESPONSIBLE, DOCUMENT_CONTRACT_TYPICAL_UPDATE, DOCUMENT_CORRESPONDENT_UPDATE, DOCUMENT_UPDATE_CUSTOM_FIELDS, DOCUMENT_FIELDS_MEETING_UPDATE, DOCUMENT_FIELDS_MEETING_QUESTION_UPDATE, DOCUMENT_FIELDS_QUESTION_UPDATE, DOCUMENT_MEETING_INVITEES_UPDATE, DOCUMENT_LINK_UPDATE, DOCUMENT_MAIN_FIELDS_APPEAL_UPDATE, DOCUMENT_MAIN_FIELDS_UPDATE, DOCUMENT_NOMENCLATURE_AFFAIR_UPDATE, DOCUMENT_PROCESS_EXECUTORS_UPDATE, DOCUMENT_PROCESS_ITEM_UPDATE, DOCUMENT_RECIPIENT_LIST_UPDATE, DOCUMENT_REPEAT_IDENTICAL_UPDATE, DOCUMENT_QUESTION_RESPONSIBLE_EXECUTOR_UPDATE, DOCUMENT_SPEAKERS_MEETING_QUESTION_UPDATE, DOCUMENT_UNDRAFT"
+        ),
+    ]
+    body: (
+        DocumentAccessGriefUpdate
+        | ContractAgreementUpdate
+        | AutoProlongationUpdate
+        | DocContractFields
+        | ResponsibleUpdate
+        | ContractTypicalUpdate
+        | DocCorrespondentUpdate
+        | DocFieldsMeeting
+        | DocFieldsMeetingQuestion
+        | DocFieldsQuestion
+        | DocInvitees
+        | DocumentLinkUpdate
+        | DocMainFieldsAppeal
+        | DocMainFields
+        | DocumentProcessExecutorUpdate
+        | DocumentProcessItemUpdate
+        | DocRepeatIdentical
+        | DocumentResponsibleUpdate
+        | DocSpeakerUpdate
+        | DocumentUndraft
+        | Any
+        | None
+    ) = None
+
+
+class InnerInventoryRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    entry: str | None = None
+    idpackage: str | None = None
+    type: Type8 | None = None
+    dateoftransmission: str | None = None
+    packageBody: InnerInventoryRequestBody
+
+
+class AcceptanceInventoryDataDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    description: str | None = None
+    title: str | None = None
+    storeAttribute: StoreAttribute | None = None
+    departmentId: UUID | None = None
+    department: DepartmentDto | None = None
+    dataDispatch: SaveInventoryResponse | None = None
+    conversionEndDate: datetime | None = None
+    jobStatus: JobStatus | None = None
+    status: Status | None = None
+    dispatchEndDate: datetime | None = None
+    idPackage: UUID | None = None
+    invIndex: str | None = None
+    index: str | None = None
+    createDate: datetime | None = None
+    date: datetime | None = None
+    dispatchJobInfo: JobInfo | None = None
+    innerInventories: list | None = None
+    signature: Signature | None = None
+    calendarYear: int | None = None
+    byStaff: bool | None = None
+    author: UserInfoDto | None = None
+    methodAssemblyType: MethodAssemblyType | None = None
+    toArchiveDate: datetime | None = None
+    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
+        None
+    )
+    process: Annotated[
+        AcceptanceInventoryProcessDto | None, Field(description="Процесс СП")
+    ] = None
+    rejectCancelDate: Annotated[
+        datetime | None, Field(description="Дата отклонения/аннулирования")
+    ] = None
+    inventoryAttachment: AttachmentDto | None = None
+    signs: Annotated[
+        list[AttachmentSignature] | None, Field(description="Список ЭЦП вложения")
+    ] = None
+
+
+class AcceptanceInventoryProcessDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор процесса")] = None
+    currentId: Annotated[
+        UUID | None, Field(description="Идентификатор текущего этапа процесса")
+    ] = None
+    current: Annotated[
+        AcceptanceInventoryProcessItemDto | None,
+        Field(description="Текущий этап процесса"),
+    ] = None
+    nextId: Annotated[
+        UUID | None, Field(description="Идентификатор следующего этапа процесса")
+    ] = None
+    next: Annotated[
+        AcceptanceInventoryProcessItemDto | None,
+        Field(description="Следующий этап процесса"),
+    ] = None
+    acceptanceInventoryId: Annotated[
+        UUID | None, Field(description="Идентификатор номенклатуры дел подразделения")
+    ] = None
+    acceptanceInventory: Annotated[Any | None, Field(description="СП")] = None
+    items: Annotated[
+        list[AcceptanceInventoryProcessItemDto] | None,
+        Field(description="Список этапов процесса"),
+    ] = None
+    completed: Annotated[
+        bool | None, Field(description="Признак прошел ли документ все этапы")
+    ] = None
+    started: Annotated[
+        bool | None, Field(description="Признак начал ли документ движение по маршруту")
+    ] = None
+    stepCount: Annotated[
+        int | None, Field(description="Количество этапов в процессе")
+    ] = None
+
+
+class AcceptanceInventoryProcessExecutorDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор исполнителя процесса в СП")
+    ] = None
+    start: Annotated[datetime | None, Field(description="Дата начала исполнения")] = (
+        None
+    )
+    executionEnd: Annotated[
+        datetime | None, Field(description="Дата окончания исполнения")
+    ] = None
+    end: Annotated[datetime | None, Field(description="Дата окончания исполнения")] = (
+        None
+    )
+    processId: UUID | None = None
+    processItemId: Annotated[
+        UUID | None, Field(description="Идентификатор этапа процесса")
+    ] = None
+    item: Annotated[Any | None, Field(description="Этап процесса")] = None
+    comment: Annotated[str | None, Field(description="Комментарий")] = None
+    result: Annotated[
+        bool | None, Field(description="Признак результата исполнения")
+    ] = None
+    executor: Annotated[UserInfoDto | None, Field(description="Исполнитель")] = None
+    acceptanceInventoryId: Annotated[
+        UUID | None, Field(description="Идентификатор СП")
+    ] = None
+    acceptanceInventoryOrgId: Annotated[
+        str | None, Field(description="Идентификатор организации СП")
+    ] = None
+    acceptanceInventory: Annotated[Any | None, Field(description="СП")] = None
+
+
+class AcceptanceInventoryProcessItemDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор этапа процесса")] = None
+    type: Annotated[
+        Type | None, Field(description="Перечисление для описания типов процесса")
+    ] = None
+    order: Annotated[int | None, Field(description="Порядковый номер")] = None
+    startStamp: Annotated[
+        datetime | None, Field(description="Дата начала этапа процесса")
+    ] = None
+    endStamp: Annotated[
+        datetime | None, Field(description="Дата окончания этапа процесса")
+    ] = None
+    completed: Annotated[
+        bool | None, Field(description="Признак был ли завершен этап процесса")
+    ] = None
+    started: Annotated[
+        bool | None,
+        Field(description="Признак был ли начаты действия по этапу процесса"),
+    ] = None
+    oneForAll: bool | None = None
+    executors: Annotated[
+        list[AcceptanceInventoryProcessExecutorDto] | None,
+        Field(description="Список исполнителей этапа процесса"),
+    ] = None
+    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
+        None
+    )
+    process: Annotated[Any | None, Field(description="Процесс документа")] = None
+    executorsCount: Annotated[int | None, Field(description="Кол-во исполнителей")] = (
+        None
+    )
+    acceptanceInventoryId: Annotated[
+        UUID | None, Field(description="Идентификатор номенклатуры дел подразделения")
+    ] = None
+    acceptanceInventory: Annotated[
+        Any | None, Field(description="Номенклатура дел подразделения")
+    ] = None
+
+
+class AdditionalDocumentDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    documentId: UUID | None = None
+    additionalDocumentTypeId: UUID | None = None
+    additionalDocumentType: AdditionalDocumentTypeDto | None = None
+    parentId: UUID | None = None
+    parent: Any | None = None
+    attachments: list[AdditionalDocumentAttachmentDto] | None = None
+    responsibles: list[AdditionalDocumentResponsibleDto] | None = None
+    date: datetime | None = None
+    docNumber: str | None = None
+    author: UserInfoDto | None = None
+    note: str | None = None
+    createDate: datetime | None = None
+
+
+class AdditionalDocumentResponsibleDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    additionalDocumentId: UUID | None = None
+    user: UserInfoDto | None = None
+    createDate: datetime | None = None
+
+
+class ControlDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    controlTypeId: Annotated[
+        UUID | None, Field(description="Идентификатор типа контроля")
+    ] = None
+    controlTypeOrgId: str | None = None
+    controlType: Annotated[ControlTypeDto | None, Field(description="Тип контроля")] = (
+        None
+    )
+    controlDateStart: Annotated[
+        datetime | None, Field(description="Дата начала контроля")
+    ] = None
+    controlPlanDateEnd: Annotated[
+        datetime | None, Field(description="Планируемая дата окончания контроля")
+    ] = None
+    controlRealDateEnd: Annotated[
+        datetime | None, Field(description="Реальная дата окончания контроля")
+    ] = None
+    controlTermDays: Annotated[
+        int | None,
+        Field(
+            description="Срок контроля в днях, изначально копируется из типа контроля"
+        ),
+    ] = None
+    controlInitiator: Annotated[
+        EmployeeDto | None, Field(description="Сотрудник который поставил на контроль")
+    ] = None
+    controlInitiatorId: Annotated[
+        UUID | None,
+        Field(description="Идентификатор сотрудника который поставил на контроль"),
+    ] = None
+    controlEmployee: Annotated[EmployeeDto | None, Field(description="Контролер")] = (
+        None
+    )
+    controlEmployeeId: Annotated[
+        UUID | None, Field(description="Идентификатор контролера")
+    ] = None
+    controlExecutor: Annotated[
+        EmployeeDto | None, Field(description="Сотрудник который снял с контроля")
+    ] = None
+    controlExecutorId: Annotated[
+        UUID | None,
+        Field(description="Идентификатор сотрудника который снял с контроля"),
+    ] = None
+    onControl: Annotated[
+        bool | None, Field(description="Активен ли сейчас контроль")
+    ] = None
+    removeControl: Annotated[
+        bool | None, Field(description="Метка снятия с контроля")
+    ] = None
+
+
+class ControlTypeDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор типа контроля")] = None
+    organizationId: str | None = None
+    name: Annotated[str | None, Field(description="Наименование типа контроля")] = None
+    shortName: Annotated[
+        str | None, Field(description="Краткое наименование типа контроля")
+    ] = None
+    term: Annotated[int | None, Field(description="Срок контроля (кол-во дней)")] = None
+    employee: EmployeeDto | None = None
+    employeeId: Annotated[
+        UUID | None, Field(description="Идентификатор ответственного за контроль")
+    ] = None
+    active: Annotated[
+        bool | None, Field(description="Признак активен ли тип контроля")
+    ] = None
+    createDate: datetime | None = None
+
+
+class CorrespondentDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор адресата/корреспондента")
+    ] = None
+    externalId: Annotated[str | None, Field(description="Внешний идентификатор")] = None
+    name: Annotated[
+        str | None, Field(description="Наименование адресата/корреспондента")
+    ] = None
+    deliveryMethodId: Annotated[
+        int | None, Field(description="Идентификатор способа доставки")
+    ] = None
+    deliveryMethod: DeliveryMethodDto | None = None
+    address: Annotated[str | None, Field(description="Адрес")] = None
+    postfix: Annotated[str | None, Field(description="Постфикс")] = None
+    country: CountryDto | None = None
+    countryId: UUID | None = None
+    cityId: UUID | None = None
+    cityName: str | None = None
+    regionId: UUID | None = None
+    regionName: str | None = None
+    districtId: UUID | None = None
+    districtName: str | None = None
+    code: Annotated[str, Field(description="Код")]
+    stateOrgan: Annotated[
+        bool | None,
+        Field(description="Отметка является ли адресат/корреспондент гос. органом"),
+    ] = None
+    postcode: Annotated[str | None, Field(description="Почтовый индекс")] = None
+    phone: Annotated[str | None, Field(description="Телефон")] = None
+    mail: Annotated[str | None, Field(description="Почта")] = None
+    active: Annotated[
+        bool | None,
+        Field(
+            description="Признак является ли данный адресат/корреспондент действующим или упраздненным"
+        ),
+    ] = None
+    type: Type2 | None = None
+    department: DepartmentDto | None = None
+    departmentId: UUID | None = None
+    setup: GeneralSetupDto | None = None
+    setupId: str | None = None
+    subscriberId: UUID | None = None
+    subscriber: SubscriberDto | None = None
+    employeeIds: Annotated[
+        list[UUID] | None, Field(description="Список сотрудников организации")
+    ] = None
+    createDate: datetime | None = None
+
+
+class DepartmentDto(BaseModel):
+    """
+    Департамент сотрудника
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор департамента/подразделения")
+    ] = None
+    name: Annotated[
+        str | None, Field(description="Наименование департамента/подразделения")
+    ] = None
+    number: Annotated[
+        str | None,
+        Field(description="Номер департамента/подразделения в номенклатуре дел"),
+    ] = None
+    parentDepartmentId: Annotated[
+        UUID | None,
+        Field(description="Идентификатор родительского департамента/подразделения"),
+    ] = None
+    parentDepartment: DepartmentDto | None = None
+    rank: Annotated[str | None, Field(description="Номер по классификатору")] = None
+    departmentCode: Annotated[
+        str | None, Field(description="Код департамента/подразделения")
+    ] = None
+    phone: Annotated[str | None, Field(description="Телефон")] = None
+    email: Annotated[str | None, Field(description="Email")] = None
+    address: Annotated[str | None, Field(description="Адрес")] = None
+    room: Annotated[str | None, Field(description="Площадка")] = None
+    leaderId: Annotated[
+        UUID | None,
+        Field(description="Идентификатор руководителя департамента/подразделения"),
+    ] = None
+    leader: EmployeeDto | None = None
+    employees: Annotated[
+        list[EmployeeDto] | None,
+        Field(
+            description="Список сотрудников департамента/подразделения, поле игнорируется при обновлении записи"
+        ),
+    ] = None
+    deputyLeaders: Annotated[
+        list[DeputyLeaderDepartmentDto] | None,
+        Field(
+            description="Список заместителей руководителя департамента/подразделения"
+        ),
+    ] = None
+    employeeNomenclatures: Annotated[
+        list[DepartmentEmployeeNomenclatureDto] | None,
+        Field(description="Список ответственных по номенклатуре"),
+    ] = None
+    createDate: datetime | None = None
+    order: Annotated[int | None, Field(description="Порядок сортировки")] = None
+    currentUserLeader: bool | None = None
+
+
+class DepartmentEmployeeNomenclatureDto(BaseModel):
+    """
+    Список ответственных по номенклатуре
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    departmentId: UUID | None = None
+    department: DepartmentDto | None = None
+    employeeId: UUID | None = None
+    employee: EmployeeDto | None = None
+
+
+class DeputyLeaderDepartmentDto(BaseModel):
+    """
+    Список заместителей руководителя департамента/подразделения
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    departmentId: UUID | None = None
+    department: DepartmentDto | None = None
+    employeeId: UUID | None = None
+    employee: EmployeeDto | None = None
+
+
+class DestructionActDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор акта уничтожения дел")
+    ] = None
+    organizationId: Annotated[
+        str | None, Field(description="Идентификатор организации")
+    ] = None
+    status: Annotated[Status1 | None, Field(description="Статус акта")] = None
+    storageType: Annotated[
+        StorageType | None, Field(description="Статус дел, выделенных к уничтожению")
+    ] = None
+    methodAssemblyType: Annotated[
+        MethodAssemblyType1 | None, Field(description="Вид дел")
+    ] = None
+    weight: Annotated[
+        float | None, Field(description="Вес бумажных документов в кг")
+    ] = None
+    fondId: Annotated[UUID | None, Field(description="Идентификатор фонда")] = None
+    archiveFund: Annotated[
+        ArchiveFundDto | None, Field(description="Архивный фонд")
+    ] = None
+    date: Annotated[datetime | None, Field(description="Дата акта")] = None
+    number: Annotated[str | None, Field(description="Регистрационный номер акта")] = (
+        None
+    )
+    authorId: Annotated[
+        UUID | None, Field(description="Идентификатор составителя акта")
+    ] = None
+    author: Annotated[EmployeeDto | None, Field(description="Составитель акта")] = None
+    creationDate: Annotated[
+        datetime | None, Field(description="Дата создания акта")
+    ] = None
+    reason: Annotated[
+        str | None, Field(description="Основание (названия и номера нормативных актов)")
+    ] = None
+    description: Annotated[
+        str | None, Field(description="Описание акта уничтожения")
+    ] = None
+    protocolDocumentId: Annotated[
+        UUID | None, Field(description="Идентификатор документа протокола ЦЭК (ЭК)")
+    ] = None
+    protocolDocument: Annotated[Any | None, Field(description="Протокол ЦЭК (ЭК)")] = (
+        None
+    )
+    isDestroyed: Annotated[
+        bool | None, Field(description="Признак уничтожения дел")
+    ] = None
+    destructionDate: Annotated[
+        datetime | None, Field(description="Дата уничтожения дел")
+    ] = None
+    attachment: Annotated[AttachmentDto | None, Field(description="Файл акта")] = None
+    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
+        None
+    )
+    processOrganizationId: Annotated[
+        str | None, Field(description="Идентификатор организации процесса")
+    ] = None
+    year: Annotated[int | None, Field(description="Год акта уничтожения")] = None
+    process: Annotated[
+        DestructionActProcessDto | None,
+        Field(description="Процесс акта уничтожения дел"),
+    ] = None
+    destroyed: bool | None = None
+
+
+class DestructionActProcessDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор процесса")] = None
+    organizationId: Annotated[
+        str | None, Field(description="Идентификатор организации")
+    ] = None
+    currentId: Annotated[
+        UUID | None, Field(description="Идентификатор текущего этапа процесса")
+    ] = None
+    currentOrgId: Annotated[
+        str | None,
+        Field(description="Идентификатор организации текущего этапа процесса"),
+    ] = None
+    current: Annotated[
+        DestructionActProcessItemDto | None, Field(description="Текущий этап процесса")
+    ] = None
+    nextId: Annotated[
+        UUID | None, Field(description="Идентификатор следующего этапа процесса")
+    ] = None
+    nextOrgId: Annotated[
+        str | None,
+        Field(description="Идентификатор организации следующего этапа процесса"),
+    ] = None
+    next: Annotated[
+        DestructionActProcessItemDto | None,
+        Field(description="Следующий этап процесса"),
+    ] = None
+    destructionActId: Annotated[
+        UUID | None, Field(description="Идентификатор акта уничтожения дел")
+    ] = None
+    destructionActOrgId: Annotated[
+        str | None, Field(description="Идентификатор организации акта уничтожения дел")
+    ] = None
+    items: Annotated[
+        list[DestructionActProcessItemDto] | None,
+        Field(description="Список этапов процесса"),
+    ] = None
+    completed: Annotated[
+        bool | None, Field(description="Признак прошел ли документ все этапы")
+    ] = None
+    started: Annotated[
+        bool | None, Field(description="Признак начал ли документ движение по маршруту")
+    ] = None
+    stepCount: Annotated[
+        int | None, Field(description="Количество этапов в процессе")
+    ] = None
+
+
+class DestructionActProcessExecutorDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None,
+        Field(description="Идентификатор исполнителя процесса в акте уничтожения дел"),
+    ] = None
+    organizationId: Annotated[
+        str | None, Field(description="Идентификатор организации")
+    ] = None
+    start: Annotated[datetime | None, Field(description="Дата начала исполнения")] = (
+        None
+    )
+    executionEnd: Annotated[
+        datetime | None, Field(description="Дата окончания исполнения")
+    ] = None
+    end: Annotated[datetime | None, Field(description="Дата окончания исполнения")] = (
+        None
+    )
+    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
+        None
+    )
+    processOrgId: Annotated[
+        str | None, Field(description="Идентификатор организации процесса")
+    ] = None
+    processItemId: Annotated[
+        UUID | None, Field(description="Идентификатор этапа процесса")
+    ] = None
+    processItemOrgId: Annotated[
+        str | None, Field(description="Идентификатор организации этапа процесса")
+    ] = None
+    comment: Annotated[str | None, Field(description="Комментарий")] = None
+    result: Annotated[
+        bool | None, Field(description="Признак результата исполнения")
+    ] = None
+    executor: Annotated[UserInfoDto | None, Field(description="Исполнитель")] = None
+    destructionActId: Annotated[
+        UUID | None, Field(description="Идентификатор акта уничтожения дел")
+    ] = None
+    destructionActOrgId: Annotated[
+        str | None, Field(description="Идентификатор организации акта уничтожения дел")
+    ] = None
+
+
+class DestructionActProcessItemDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор этапа процесса")] = None
+    organizationId: Annotated[
+        str | None, Field(description="Идентификатор организации")
+    ] = None
+    type: Annotated[Type3 | None, Field(description="Тип процесса")] = None
+    order: Annotated[int | None, Field(description="Порядковый номер")] = None
+    startStamp: Annotated[
+        datetime | None, Field(description="Дата начала этапа процесса")
+    ] = None
+    endStamp: Annotated[
+        datetime | None, Field(description="Дата окончания этапа процесса")
+    ] = None
+    completed: Annotated[
+        bool | None, Field(description="Признак был ли завершен этап процесса")
+    ] = None
+    started: Annotated[
+        bool | None,
+        Field(description="Признак был ли начаты действия по этапу процесса"),
+    ] = None
+    oneForAll: Annotated[
+        bool | None, Field(description="Признак один исполнитель для всех дел")
+    ] = None
+    executors: Annotated[
+        list[DestructionActProcessExecutorDto] | None,
+        Field(description="Список исполнителей этапа процесса"),
+    ] = None
+    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
+        None
+    )
+    processOrgId: Annotated[
+        str | None, Field(description="Идентификатор организации процесса")
+    ] = None
+    executorsCount: Annotated[int | None, Field(description="Кол-во исполнителей")] = (
+        None
+    )
+    destructionActId: Annotated[
+        UUID | None, Field(description="Идентификатор акта уничтожения дел")
+    ] = None
+    destructionActOrgId: Annotated[
+        str | None, Field(description="Идентификатор организации акта уничтожения дел")
+    ] = None
+
+
+class DirectoryProcessDefinition(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    order: Annotated[int, Field(description="Порядковый номер процесса", ge=1)]
+    employees: Annotated[
+        list[DirectoryProcessEmployee] | None,
+        Field(description="Список сотрудников (исполнителей) процесса"),
+    ] = None
+    type: Annotated[
+        Type4, Field(description="Перечисление для описания типов процесса")
+    ]
+    name: Annotated[
+        str, Field(description="Наименование процесса", max_length=254, min_length=0)
+    ]
+    days: Annotated[
+        int | None, Field(description="Количество дней для исполнения процесса")
+    ] = None
+    empActionQueueType: Annotated[
+        EmpActionQueueType | None,
+        Field(description="Тип выполнения действий в процессе, null = ANY"),
+    ] = None
+
+
+class DirectoryProcessEmployee(BaseModel):
+    """
+    Список сотрудников (исполнителей) процесса
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    order: int
+    employee: EmployeeDto
+
+
+class DocumentAppealDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    countryAppealId: Annotated[
+        UUID | None, Field(description="Идентификатор страны заявителя")
+    ] = None
+    countryAppealName: Annotated[
+        str | None, Field(description="Наименование страны заявителя")
+    ] = None
+    receiptDate: Annotated[
+        datetime | None, Field(description="Содержит дату поступления")
+    ] = None
+    declarantType: Annotated[
+        DeclarantType | None,
+        Field(
+            description="Признак, является заявитель физическим или юридическим лицом"
+        ),
+    ] = None
+    citizenTypeId: Annotated[
+        UUID | None, Field(description="Идентификатор вида обращения")
+    ] = None
+    citizenType: CitizenTypeDto | None = None
+    collective: Annotated[
+        bool | None, Field(description="Признак коллективного обращения")
+    ] = None
+    anonymous: Annotated[
+        bool | None, Field(description="Признак анонимного обращения")
+    ] = None
+    fioApplicant: Annotated[
+        str | None, Field(description="Содержит Ф.И.О. заявителя")
+    ] = None
+    cityId: Annotated[UUID | None, Field(description="Идентификатор города")] = None
+    cityName: Annotated[str | None, Field(description="Город")] = None
+    regionId: Annotated[UUID | None, Field(description="Идентификатор области")] = None
+    regionName: Annotated[str | None, Field(description="Область")] = None
+    districtId: Annotated[UUID | None, Field(description="Идентификатор района")] = None
+    districtName: Annotated[str | None, Field(description="Район")] = None
+    index: Annotated[str | None, Field(description="Индекс")] = None
+    fullAddress: Annotated[
+        str | None, Field(description="Содержит улицу, дом, корпус, квартиру")
+    ] = None
+    phone: Annotated[str | None, Field(description="Контактный телефон")] = None
+    email: Annotated[str | None, Field(description="e-mail заявителя")] = None
+    organizationName: Annotated[
+        str | None, Field(description="Содержит наименование организации-заявителя")
+    ] = None
+    signed: Annotated[
+        str | None, Field(description="Содержит Ф.И.О. лица, подписавшего документ")
+    ] = None
+    correspondentOrgNumber: Annotated[
+        str | None,
+        Field(
+            description="Содержит исходящий регистрационный индекс, присвоенный документу организацией-корреспондентом"
+        ),
+    ] = None
+    dateDocCorrespondentOrg: Annotated[
+        datetime | None,
+        Field(
+            description="Содержит дату присвоения организацией-корреспондентом документу исходящего регистрационного номера"
+        ),
+    ] = None
+    subjectId: Annotated[UUID | None, Field(description="Идентификатор тематики")] = (
+        None
+    )
+    subject: SubjectDto | None = None
+    correspondentAppeal: Annotated[
+        str | None,
+        Field(
+            description="Заполняется, если обращение в ГТБ переслала другая организация, куда оно поступило первоначально (адресаты/корреспонденты)"
+        ),
+    ] = None
+    correspondentAppealId: UUID | None = None
+    indexDateCoverLetter: Annotated[
+        str | None, Field(description="Дата и индекс сопроводительного письма")
+    ] = None
+    repeatIdenticalAppeals: Annotated[
+        list[RepeatIdenticalAppealDto] | None,
+        Field(description="Повторные и идентичные обращения"),
+    ] = None
+    reviewProgress: Annotated[str | None, Field(description="Ход рассмотрения")] = None
+    solutionResultId: Annotated[
+        UUID | None, Field(description="Идентификатор результата решения")
+    ] = None
+    solutionResult: SolutionResultDto | None = None
+    nomenclatureAffairId: Annotated[
+        UUID | None, Field(description="Идентификатор результата решения")
+    ] = None
+    nomenclatureAffair: NomenclatureAffairDto | None = None
+    reasonably: bool | None = None
+
+
+class DocumentDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор документа")] = None
+    organizationId: str | None = None
+    docCategoryConstant: DocCategory | None = None
+    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
+    daysExecution: Annotated[
+        int | None, Field(description="Кол-во дней исполнения")
+    ] = None
+    profileName: str | None = None
+    requiredField: Annotated[
+        list[RequiredFieldEnum] | None, Field(description="Список обязательных полей")
+    ] = None
+    author: Annotated[UserInfoDto | None, Field(description="Автор документа")] = None
+    responsibleExecutor: UserInfoDto | None = None
+    status: Annotated[
+        Status2 | None,
+        Field(description="Перечисление для описания статусов документов"),
+    ] = None
+    color: DocumentUserColorDto | None = None
+    prevStatus: Annotated[
+        Status2 | None,
+        Field(description="Перечисление для описания статусов документов"),
+    ] = None
+    regNumber: Annotated[
+        str | None, Field(description="Регистрационный номер документа")
+    ] = None
+    reservedRegNumber: Annotated[
+        str | None,
+        Field(description="Зарезервированный регистрационный номер документа"),
+    ] = None
+    reservedRegDate: Annotated[
+        datetime | None,
+        Field(description="Дата резервирования регистрационного номера документа"),
+    ] = None
+    regDate: Annotated[
+        datetime | None, Field(description="Дата регистрации документа")
+    ] = None
+    dspFlag: Annotated[
+        bool | None,
+        Field(description="Признак документа с грифом ДСП. По умолчанию признак снят."),
+    ] = None
+    pages: Annotated[int | None, Field(description="Кол-во страниц документа")] = None
+    exemplarNumber: Annotated[int | None, Field(description="Номер экземпляра")] = None
+    shortSummary: Annotated[
+        str | None,
+        Field(
+            description="Краткое содержание, может выбираться из справочника кратких содержаний"
+        ),
+    ] = None
+    summary: Annotated[str | None, Field(description="Текст документа")] = None
+    correspondentName: Annotated[
+        str | None, Field(description="Наименование корреспондента")
+    ] = None
+    recipients: Annotated[
+        bool | None, Field(description="Есть ли в документе адресаты")
+    ] = None
+    profileId: Annotated[
+        UUID | None, Field(description="Идентификатор профиля документа")
+    ] = None
+    documentVersionId: Annotated[
+        UUID | None, Field(description="Идентификатор версии документа")
+    ] = None
+    controlFlag: Annotated[
+        bool | None, Field(description="Признак стоит ли документ на контроле")
+    ] = None
+    removeControl: Annotated[
+        bool | None, Field(description="Метка снятия с контроля")
+    ] = None
+    journalId: Annotated[
+        UUID | None, Field(description="Идентификатор журнала регистрации")
+    ] = None
+    documentType: Annotated[
+        DocumentTypeDto | None, Field(description="Вид документа")
+    ] = None
+    documentTypeId: Annotated[
+        int | None, Field(description="Идентификатор вида документа")
+    ] = None
+    refDocId: UUID | None = None
+    refDocOrgId: str | None = None
+    versionFlag: bool | None = None
+    formula: Annotated[list[str] | None, Field(description="Формула рег. номера")] = (
+        None
+    )
+    taskList: Annotated[list[TaskDto] | None, Field(description="Список поручений")] = (
+        None
+    )
+    deliveryMethod: Annotated[
+        DeliveryMethodDto | None, Field(description="Способ получения документа")
+    ] = None
+    deliveryMethodId: int | None = None
+    correspondentId: Annotated[
+        UUID | None, Field(description="Идентификатор корреспондент")
+    ] = None
+    outRegNumber: Annotated[
+        str | None, Field(description="Исходящий регистрационный номер")
+    ] = None
+    outRegDate: Annotated[
+        datetime | None, Field(description="Исходящая дата регистрации документа")
+    ] = None
+    additionalPages: Annotated[
+        str | None, Field(description="Кол-во листов приложений к документу")
+    ] = None
+    exemplarCount: Annotated[
+        int | None, Field(description="Кол-во экземлпяров документа")
+    ] = None
+    investProgramId: Annotated[
+        UUID | None, Field(description="Ид инвест программы")
+    ] = None
+    investmentProgram: Annotated[
+        InvestmentProgramDto | None, Field(description="Инвест программа")
+    ] = None
+    receivedDocId: Annotated[
+        UUID | None,
+        Field(
+            description="Идентификатор документа который получен в ответ на другой документ"
+        ),
+    ] = None
+    answerDocId: Annotated[
+        UUID | None,
+        Field(description="Идентификатор документа создан в ответ на другой документ"),
+    ] = None
+    receivedAsAnswerByDoc: Annotated[
+        DocumentDto | None,
+        Field(description="Документ который получен в ответ на другой документ"),
+    ] = None
+    createAsAnswerByDoc: Annotated[
+        DocumentDto | None,
+        Field(description="Документ который создан в ответ на другой документ"),
+    ] = None
+    version: Annotated[
+        DocumentVersionDto | None, Field(description="Версия документа")
+    ] = None
+    process: Annotated[
+        DocumentProcessDto | None, Field(description="Процесс документа")
+    ] = None
+    processId: UUID | None = None
+    attachmentDocument: Annotated[
+        list[AttachmentDocumentDto] | None,
+        Field(description="Список вложений к документу"),
+    ] = None
+    correspondent: Annotated[
+        DocumentRecipientDtoModel | None, Field(description="Корреспондент")
+    ] = None
+    recipientList: Annotated[
+        list[DocumentRecipientDtoModel] | None, Field(description="Список адресатов")
+    ] = None
+    control: Annotated[ControlDto | None, Field(description="Контроль")] = None
+    createType: Annotated[
+        CreateType | None,
+        Field(description="Перечисление для описания типов как создан документ"),
+    ] = None
+    dateMeeting: Annotated[
+        datetime | None, Field(description="Дата проведения совещания")
+    ] = None
+    dateMeetingQuestion: Annotated[
+        datetime | None, Field(description="Дата проведения заседания")
+    ] = None
+    startMeeting: Annotated[
+        datetime | None, Field(description="Время начала совещания")
+    ] = None
+    endMeeting: Annotated[
+        datetime | None, Field(description="Время начала совещания")
+    ] = None
+    placeMeeting: Annotated[
+        str | None, Field(description="Место проведения совещания")
+    ] = None
+    chairperson: Annotated[UserInfoDto | None, Field(description="Председатель")] = None
+    secretary: Annotated[UserInfoDto | None, Field(description="Секретарь")] = None
+    externalInvitees: Annotated[
+        str | None, Field(description="Внешние приглашенные")
+    ] = None
+    inviteesCount: Annotated[
+        int | None, Field(description="Количество внутренних приглашенных")
+    ] = None
+    addition: Annotated[
+        bool | None, Field(description="Признак дополнения к повестке вопросов")
+    ] = None
+    additionMeetingQuestionId: Annotated[
+        UUID | None,
+        Field(
+            description="Идентификатор документа дополнительного заседания по вопросам"
+        ),
+    ] = None
+    additionMeetingQuestion: Annotated[
+        DocumentDto | None,
+        Field(description="Документ дополнительного заседания по вопросам"),
+    ] = None
+    formMeetingType: Annotated[
+        FormMeetingType | None, Field(description="Форма проведения заседания")
+    ] = None
+    numberQuestion: Annotated[
+        int | None,
+        Field(
+            description="Содержит информацию о порядковом номере вопроса в повестке дня"
+        ),
+    ] = None
+    documentQuestions: Annotated[
+        list[DocumentQuestionDto] | None, Field(description="Список вопросов")
+    ] = None
+    hasQuestion: Annotated[
+        bool | None, Field(description="Отметка о наличии вопросов в повестке")
+    ] = None
+    documentMeetingQuestionId: Annotated[
+        UUID | None, Field(description="Идентификатор документа заседание по вопросам")
+    ] = None
+    documentMeetingQuestionOrgId: Annotated[
+        str | None,
+        Field(description="Идентификатор организации документа заседание по вопросам"),
+    ] = None
+    documentMeetingQuestion: Annotated[
+        DocumentDto | None, Field(description="Документ заседание по вопросам")
+    ] = None
+    whoAddressed: Annotated[
+        list[MiniUserInfoDto] | None, Field(description="Лист 'Кто подписал'")
+    ] = None
+    writeOffAffairCount: int | None = None
+    preAffairCount: int | None = None
+    inDocSigners: str | None = None
+    countryName: str | None = None
+    countryId: UUID | None = None
+    introduction: list[IntroductionDto] | None = None
+    introductionCount: int | None = None
+    introductionCompleteCount: int | None = None
+    autoControl: AutoControl | None = None
+    skipRegistration: bool | None = None
+    documentAppeal: DocumentAppealDto | None = None
+    responsibleExecutors: Annotated[
+        list[DocumentResponsibleExecutorDto] | None,
+        Field(description="Список ответственных за подготовку материалов"),
+    ] = None
+    hasResponsibleExecutor: Annotated[
+        bool | None,
+        Field(description="Присутствие ответственных за подготовку материалов"),
+    ] = None
+    responsibleExecutorsCount: Annotated[
+        int | None,
+        Field(description="количество ответственных за подготовку материалов"),
+    ] = None
+    documentLinksCount: Annotated[
+        int | None, Field(description="Кол-во связей документа")
+    ] = None
+    dateQuestion: Annotated[
+        datetime | None,
+        Field(description="Дата проведения заседания для документа по вопросу"),
+    ] = None
+    commentQuestion: Annotated[
+        str | None, Field(description="Комментарии для руководителя")
+    ] = None
+    initiator: UserInfoDto | None = None
+    preNomenclatureAffairs: Annotated[
+        list[DocumentPreNomenclatureDto] | None,
+        Field(description="Список предварительных номенклатур"),
+    ] = None
+    registrationJournal: RegistrationJournalDto | None = None
+    whoSigned: Annotated[
+        UserInfoDto | None,
+        Field(description="Кем подписан (для внутреннего и исходя-щего документа)"),
+    ] = None
+    meetingQuestionNotifyCount: int | None = None
+    userProps: DocumentUserPropsDto | None = None
+    note: str | None = None
+    enableAccessGrief: Annotated[
+        bool | None, Field(description="Включение грифа доступа")
+    ] = None
+    accessGriefId: Annotated[
+        UUID | None, Field(description="Идентификатор грифа доступа")
+    ] = None
+    accessGrief: Annotated[AccessGriefDto | None, Field(description="Гриф доступа")] = (
+        None
+    )
+    autoRouting: bool | None = None
+    contractSum: float | None = None
+    contractDurationStart: datetime | None = None
+    currency: CurrencyDto | None = None
+    currencyId: UUID | None = None
+    contractSigningDate: datetime | None = None
+    contractStartDate: datetime | None = None
+    contractDurationEnd: datetime | None = None
+    contractAgreement: bool | None = None
+    contractAutoProlongation: bool | None = None
+    contractTypical: bool | None = None
+    contractNumber: str | None = None
+    contractDate: datetime | None = None
+    countTask: int | None = None
+    taskProjectCount: int | None = None
+    completedTaskCount: int | None = None
+    documentInventoryData: DocumentInventoryDataDto | None = None
+    currentBpmnTaskName: str | None = None
+    documentFormDefinition: DocumentFormDefinitionDto | None = None
+    customFields: Annotated[
+        dict[str, Any] | None, Field(description="Пользовательские поля документа")
+    ] = None
+    additionalDocuments: list[AdditionalDocumentDto] | None = None
+    documentFormId: UUID | None = None
+    journalNumber: Annotated[
+        int | None,
+        Field(description="Номер журнала регистрации при регистрации документа"),
+    ] = None
+
+
+class DocumentFolderDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор документа в папке")] = (
+        None
+    )
+    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
+        None
+    )
+    document: Annotated[DocumentDto | None, Field(description="Документ")] = None
+    employeeId: Annotated[
+        UUID | None,
+        Field(description="Идентификатор сотрудника который добавил документ в папку"),
+    ] = None
+    employee: Annotated[
+        EmployeeDto | None,
+        Field(description="Сотрудник который добавил документ в папку"),
+    ] = None
+    folderId: Annotated[UUID | None, Field(description="Идентификатор папки")] = None
+    folder: Annotated[FolderDto | None, Field(description="Папка")] = None
+
+
+class DocumentInventoryDataDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    miniDocument: MiniDocumentDto | None = None
+    innerInventoryId: UUID | None = None
+    dataDispatch: PackageEoResponse | None = None
+    createDate: datetime | None = None
+    docHash: str | None = None
+    numEDinArch: int | None = None
+    idPackage: UUID | None = None
+    countFile: int | None = None
+    status: JobStatus | None = None
+    dispatchJobInfo: JobInfo | None = None
+
+
+class DocumentPreNomenclatureDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None,
+        Field(description="Идентификатор документа который лежит в номенклатуре дел"),
+    ] = None
+    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
+        None
+    )
+    document: Annotated[Any | None, Field(description="Документ")] = None
+    nomenclatureAffairId: Annotated[
+        UUID | None, Field(description="Идентификатор номенклатуры дел")
+    ] = None
+    nomenclatureAffair: Annotated[
+        NomenclatureAffairDto | None, Field(description="Номенклатура дел")
+    ] = None
+    writeOff: Annotated[
+        bool | None, Field(description="Метка списания документа в номенклатуру дела")
+    ] = None
+    deleted: bool | None = None
+
+
+class DocumentProcessDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор процесса")] = None
+    currentId: Annotated[
+        UUID | None, Field(description="Идентификатор текущего этапа процесса")
+    ] = None
+    current: Annotated[
+        DocumentProcessItemDto | None, Field(description="Текущий этап процесса")
+    ] = None
+    nextId: Annotated[
+        UUID | None, Field(description="Идентификатор следующего этапа процесса")
+    ] = None
+    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
+        None
+    )
+    items: Annotated[
+        list[DocumentProcessItemDto] | None, Field(description="Список этапов процесса")
+    ] = None
+    completed: Annotated[
+        bool | None, Field(description="Признак прошел ли документ все этапы")
+    ] = None
+    started: Annotated[
+        bool | None, Field(description="Признак начал ли документ движение по маршруту")
+    ] = None
+
+
+class DocumentProcessExecutorDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор исполнителя процесса в документе")
+    ] = None
+    start: Annotated[datetime | None, Field(description="Дата начала исполнения")] = (
+        None
+    )
+    executionEnd: Annotated[
+        datetime | None, Field(description="Дата окончания исполнения")
+    ] = None
+    end: Annotated[datetime | None, Field(description="Дата окончания исполнения")] = (
+        None
+    )
+    documentProcessItemId: Annotated[
+        UUID | None, Field(description="Идентификатор этапа процесса")
+    ] = None
+    comment: Annotated[str | None, Field(description="Комментарий")] = None
+    result: Annotated[
+        bool | None, Field(description="Признак результата исполнения")
+    ] = None
+    executor: Annotated[UserInfoDto | None, Field(description="Исполнитель")] = None
+    order: Annotated[
+        int | None, Field(description="Позиция исполнителя в процессе")
+    ] = None
+
+
+class DocumentProcessItemDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор этапа процесса")] = None
+    type: Annotated[
+        Type4 | None, Field(description="Перечисление для описания типов процесса")
+    ] = None
+    order: Annotated[int | None, Field(description="Порядковый номер")] = None
+    name: Annotated[str | None, Field(description="Наименование")] = None
+    days: Annotated[int | None, Field(description="Количество дней исполнения")] = None
+    start: Annotated[
+        datetime | None, Field(description="Дата начала этапа процесса")
+    ] = None
+    end: Annotated[
+        datetime | None, Field(description="Дата окончания этапа процесса")
+    ] = None
+    fileSign: bool | None = None
+    completed: Annotated[
+        bool | None, Field(description="Признак был ли завершен этап процесса")
+    ] = None
+    started: Annotated[
+        bool | None,
+        Field(description="Признак был ли начаты действия по этапу процесса"),
+    ] = None
+    executors: Annotated[
+        list[DocumentProcessExecutorDto] | None,
+        Field(description="Список исполнителей этапа процесса"),
+    ] = None
+    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
+        None
+    )
+    nextExecutorId: Annotated[
+        UUID | None, Field(description="ИД следующего исполнителя")
+    ] = None
+    actionQueueType: Annotated[
+        ActionQueueType | None, Field(description="Тип исполнения процесса")
+    ] = None
+    taskDefinitionKey: Annotated[
+        str | None, Field(description="ИД таски из дефинишена")
+    ] = None
+    documentId: UUID | None = None
+
+
+class DocumentProfileDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор профиля документа")] = (
+        None
+    )
+    organizationId: str | None = None
+    name: Annotated[str | None, Field(description="Наименование профиля документа")] = (
+        None
+    )
+    formula: Annotated[list[str] | None, Field(description="Формула рег. номера")] = (
+        None
+    )
+    autoCreateIncomingDoc: Annotated[
+        bool | None,
+        Field(
+            description="Признак того что этот профиль будет использоваться для создания документов прищедших по АИСМВ"
+        ),
+    ] = None
+    active: Annotated[
+        bool | None, Field(description="Признак активен ли профиль документа")
+    ] = None
+    documentTypeId: Annotated[
+        int | None, Field(description="Идентификатор вида документа")
+    ] = None
+    deploymentId: str | None = None
+    journalId: Annotated[
+        UUID | None, Field(description="Идентификатор журнала регистрации")
+    ] = None
+    registrationJournal: RegistrationJournalDto | None = None
+    documentType: DocumentTypeDto | None = None
+    documentCategory: Annotated[
+        DocumentCategory | None, Field(description="Тип документа")
+    ] = None
+    docAuthorId: Annotated[
+        UUID | None, Field(description="Идентификатор автора документа")
+    ] = None
+    docAuthor: EmployeeDto | None = None
+    correspondentId: Annotated[
+        UUID | None, Field(description="Идентификатор корреспондента")
+    ] = None
+    correspondent: CorrespondentDto | None = None
+    daysExecution: Annotated[
+        int | None, Field(description="Кол-во дней исполнения")
+    ] = None
+    autoRegistration: bool | None = None
+    autoRouting: Annotated[
+        bool | None, Field(description="Автоматическое движение по маршруту")
+    ] = None
+    autoControl: Annotated[
+        bool | None,
+        Field(description="Автоматически ставить на контроль после регистрации"),
+    ] = None
+    controlDays: Annotated[int | None, Field(description="Кол-во дней контроля")] = None
+    controlType: ControlTypeDto | None = None
+    controlTypeId: UUID | None = None
+    processDirectoryId: UUID | None = None
+    processDirectory: BpmnProcessDirectoryDto | None = None
+    xml: str | None = None
+    processDefinition: list[DirectoryProcessDefinition] | None = None
+    retryPrefix: Annotated[
+        str | None, Field(description="Префикс повторных обращений")
+    ] = None
+    retryPostfix: Annotated[
+        str | None, Field(description="Постфикс повторных обращений")
+    ] = None
+    identicalPrefix: Annotated[
+        str | None, Field(description="Префикс идентичных обращений")
+    ] = None
+    identicalPostfix: Annotated[
+        str | None, Field(description="Постфикс идентичных обращений")
+    ] = None
+    repetitionCounterInitial: Annotated[
+        int | None, Field(description="Начальное значение счетчика повторности")
+    ] = None
+    identityCounterInitial: Annotated[
+        int | None, Field(description="Начальное значение счетчика идентичности")
+    ] = None
+    anonymousSuffix: Annotated[
+        str | None, Field(description="Суффикс анонимного обращения")
+    ] = None
+    collectiveSuffix: Annotated[
+        str | None, Field(description="Суффикс коллективного обращения")
+    ] = None
+    requiredField: Annotated[
+        list[RequiredFieldEnum1] | None, Field(description="обязательные поля")
+    ] = None
+    access: Annotated[bool | None, Field(description="Включить списки доступа")] = None
+    createDate: datetime | None = None
+    appealOrganizationJournalId: UUID | None = None
+    appealOrganizationJournalOrgId: str | None = None
+    appealOrganizationJournal: RegistrationJournalDto | None = None
+    accessGriefId: Annotated[
+        UUID | None, Field(description="Идентификатор грифа доступа")
+    ] = None
+    accessGrief: AccessGriefDto | None = None
+    enableAccessGrief: Annotated[
+        bool | None, Field(description="Включить использование грифа доступа")
+    ] = None
+    contractTypical: Annotated[
+        bool | None, Field(description="Признак типовой ли контракт")
+    ] = None
+    documentFormId: Annotated[
+        UUID | None, Field(description="Идентификатор формы документа")
+    ] = None
+    documentForm: DocumentFormDto | None = None
+
+
+class DocumentQuestionDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    questionNumber: Annotated[int | None, Field(description="Номер вопроса")] = None
+    question: Annotated[str | None, Field(description="Формулировка вопроса")] = None
+    documentId: UUID | None = None
+    documentOrgId: str | None = None
+    document: Any | None = None
+    documentMeetingQuestionId: Annotated[
+        UUID | None, Field(description="Идентификатор документа заседания")
+    ] = None
+    documentMeetingQuestionOrgId: Annotated[
+        str | None, Field(description="Идентификатор организации документа заседания")
+    ] = None
+    documentMeetingQuestion: Any | None = None
+    speakers: Annotated[
+        list[SpeakerDto] | None, Field(description="Список докладчиков")
+    ] = None
+
+
+class DocumentRecipientDtoModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор адресата документа")
+    ] = None
+    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
+        None
+    )
+    name: Annotated[str | None, Field(description="Наименование адресата")] = None
+    status: Status4 | None = None
+    from_: Annotated[EmployeeDto | None, Field(alias="from")] = None
+    fromId: Annotated[UUID | None, Field(description="ИД отправителя")] = None
+    dateSend: Annotated[datetime | None, Field(description="Дата отправки")] = None
+    toPeople: Annotated[str | None, Field(description="Кому отправить")] = None
+    delivered: Annotated[bool | None, Field(description="Признак доставки")] = None
+    system: Annotated[
+        bool | None, Field(description="Признак отправлено ли системой")
+    ] = None
+    subscriberId: Annotated[
+        UUID | None, Field(description="Идентификатор адресата СМДО")
+    ] = None
+    deliveryMethodId: Annotated[
+        int | None, Field(description="Идентификатор способа доставки")
+    ] = None
+    deliveryMethod: DeliveryMethodDto | None = None
+    correspondent: CorrespondentDto | None = None
+    subscriber: SubscriberDto | None = None
+    correspondentId: UUID | None = None
+    type: Type2 | None = None
+    lock: bool | None = None
+    aismvPackageType: AismvPackageType | None = None
+    aismvCurrentDeliveryId: UUID | None = None
+    aismvRouterAccept: bool | None = None
+    aismvAbonentAccept: bool | None = None
+    aismvRouterError: bool | None = None
+    aismvAbobentAcceptAck: bool | None = None
+    aismvAbonentAcceptError: bool | None = None
+    aismvAbonentRegAck: bool | None = None
+    aismbAbonentRegReject: bool | None = None
+    unp: str | None = None
+    signDate: datetime | None = None
+    contractNumber: str | None = None
+
+
+class DocumentResponsibleExecutorDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор исполнителя процесса в документе")
+    ] = None
+    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
+        None
+    )
+    document: Annotated[Any | None, Field(description="Документ")] = None
+    executor: Annotated[UserInfoDto | None, Field(description="Исполнитель")] = None
+
+
+class EmployeeDto(BaseModel):
+    """
+    Автор документов для аис мв
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор сотрудника")] = None
+    getuId: Annotated[
+        str | None, Field(description="Идентификатор аккаунта сотрудника")
+    ] = None
+    personalNumber: Annotated[
+        str | None, Field(description="Персональный номер сотрудника")
+    ] = None
+    firstName: Annotated[str | None, Field(description="Имя сотрудника")] = None
+    lastName: Annotated[str | None, Field(description="Фамилия сотрудника")] = None
+    middleName: Annotated[str | None, Field(description="Отчество сотрудника")] = None
+    fired: Annotated[bool | None, Field(description="Признак уволен ли сотрудник")] = (
+        None
+    )
+    active: Annotated[
+        bool | None, Field(description="Признак активен ли сотрудник")
+    ] = None
+    fullPostName: Annotated[str | None, Field(description="ФИО сотрудника")] = None
+    postId: Annotated[int | None, Field(description="Идентификатор должности")] = None
+    post: PostDto | None = None
+    departmentId: Annotated[
+        UUID | None,
+        Field(description="Идентификатор департамента в котором работает сотрудник"),
+    ] = None
+    department: DepartmentDto | None = None
+    org: OrgDto | None = None
+    address: Annotated[str | None, Field(description="Адрес")] = None
+    place: Annotated[str | None, Field(description="Площадка")] = None
+    url: Annotated[str | None, Field(description="URL")] = None
+    email: Annotated[str | None, Field(description="E-mail")] = None
+    phone: Annotated[str | None, Field(description="Телефон")] = None
+    ldapName: Annotated[str | None, Field(description="LDAP Имя")] = None
+    io: Annotated[bool | None, Field(description="Я вляется ИО")] = None
+    haveIo: Annotated[bool | None, Field(description="Присутствуют ИО")] = None
+    notify: Annotated[
+        bool | None, Field(description="Уведомлять ли сотрудника сообщениями на почту")
+    ] = None
+    createDate: datetime | None = None
+    lastManualAvatarUploadDate: Annotated[
+        datetime | None, Field(description="Дата последней ручной загрузки аватара")
+    ] = None
+    createType: CreateType1 | None = None
+    sid: str | None = None
+    currentUserLeader: bool | None = None
+    blockedFields: list[BlockedField] | None = None
+    order: Annotated[int | None, Field(description="Порядок сортировки")] = None
+    organizationId: str | None = None
+
+
+class FolderDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор папки")] = None
+    parentId: Annotated[
+        UUID | None, Field(description="Идентификатор родительской папки")
+    ] = None
+    parentFolder: Any | None = None
+    name: Annotated[str | None, Field(description="Наименование папки")] = None
+    documentFolders: Annotated[
+        list[DocumentFolderDto] | None, Field(description="Список документов в папке")
+    ] = None
+    folderCount: Annotated[
+        int | None, Field(description="Количество папок в папке")
+    ] = None
+    docCount: Annotated[
+        int | None, Field(description="Количество документов в папке")
+    ] = None
+    path: Annotated[
+        list | None, Field(description="Путь от текущей папки к родительской")
+    ] = None
+
+
+class GeneralSetupDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    organizationId: Annotated[
+        str | None,
+        Field(description="Идентификатор организации общей настройки документа СЭД"),
+    ] = None
+    organizationName: Annotated[
+        str | None,
+        Field(description="Наименование организации общей настройки документа СЭД"),
+    ] = None
+    countryId: Annotated[UUID | None, Field(description="Идентификатор страны")] = None
+    country: CountryDto | None = None
+    profileId: Annotated[
+        UUID | None, Field(description="Идентификатор профиля документа")
+    ] = None
+    profile: DocumentProfileDto | None = None
+    aismvProfileId: Annotated[
+        UUID | None, Field(description="Профиль для входящих документов аис мв")
+    ] = None
+    aismvProfile: DocumentProfileDto | None = None
+    employeeId: Annotated[
+        UUID | None,
+        Field(
+            description="Идентификатор автора для автоматически создаваемых входящих документов"
+        ),
+    ] = None
+    employee: EmployeeDto | None = None
+    aismvAuthorEmployeeId: Annotated[
+        UUID | None, Field(description="Автор документов для аис мв")
+    ] = None
+    aismvAuthor: EmployeeDto | None = None
+    groupId: Annotated[
+        UUID | None, Field(description="Идентификатор группы пользователей")
+    ] = None
+    group: GroupDto | None = None
+    subscriber: SubscriberDto | None = None
+    subscriberId: UUID | None = None
+    classDoc: Annotated[
+        str | None,
+        Field(
+            description="Унифицированный код из окрб 010-95 таблица 1 (https://minjust.gov.by/upload/iblock/d97/OKRB.pdf)"
+        ),
+    ] = None
+    objectType: Annotated[
+        str | None,
+        Field(
+            description="Вид по таблицы 2 окб (https://minjust.gov.by/upload/iblock/d97/OKRB.pdf)"
+        ),
+    ] = None
+    aismvAppealProfileId: UUID | None = None
+    aismvAppealProfile: DocumentProfileDto | None = None
+    disableSignedFilEdit: Annotated[
+        bool | None, Field(description="Отключение редактирования подписанных файлов")
+    ] = None
+    enableRemoveDraftDocs: bool | None = None
+    daysToKeepDraftDocs: int | None = None
+    executionDateRoundPolicy: ExecutionDateRoundPolicy | None = None
+    defaultProcessDateRoundPolicy: ExecutionDateRoundPolicy | None = None
+    workDayStart: Annotated[
+        str | None, Field(description="Продолжительность рабочего дня")
+    ] = None
+    workDayEnd: str | None = None
+    signAttachment: Attachment | None = None
+
+
+class InnerInventoryDataDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    countDoc: int | None = None
+    countFile: int | None = None
+    countVolumeDoc: int | None = None
+    dataDispatch: InnerInventoryResponse | None = None
+    status: JobStatus | None = None
+    conversionEndDate: datetime | None = None
+    dispatchEndDate: datetime | None = None
+    idPackage: UUID | None = None
+    createDate: datetime | None = None
+    acceptanceId: UUID | None = None
+    acceptanceInventoryData: AcceptanceInventoryDataDto | None = None
+    indexInInventory: str | None = None
+    storeAttribute: StoreAttribute | None = None
+    documentInventories: list[DocumentInventoryDataDto] | None = None
+    nomenclatureAffair: Any | None = None
+    dataConversion: InnerInventoryRequest | None = None
+    signature: Signature | None = None
+    calendarYear: int | None = None
+
+
+class IntroductionDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор листа ознакомления")
+    ] = None
+    createDate: Annotated[
+        datetime | None, Field(description="Дата создания ознакомления")
+    ] = None
+    author: Annotated[
+        UserInfoDto | None, Field(description="Автор создания ознакомления")
+    ] = None
+    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
+        None
+    )
+    introductionDate: Annotated[
+        datetime | None, Field(description="Дата ознакомления")
+    ] = None
+    introductionStamp: Annotated[
+        UserInfoDto | None,
+        Field(description="Сотрудник который проставил отметку об ознакомлении"),
+    ] = None
+    comment: Annotated[
+        str | None, Field(description="Комментарий при постановке на ознакомление")
+    ] = None
+
+
+class MiniDocumentDto(BaseModel):
+    """
+    DTO для мини-документа
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор мини-документа")] = None
+    regNumber: Annotated[str | None, Field(description="Регистрационный номер")] = None
+    regDate: Annotated[datetime | None, Field(description="Дата регистрации")] = None
+    docCategoryConstant: Annotated[
+        DocumentCategory | None, Field(description="Тип документа")
+    ] = None
+    shortSummary: Annotated[str | None, Field(description="Краткое содержание")] = None
+    documentLanguageId: Annotated[
+        UUID | None, Field(description="Идентификатор языка документа")
+    ] = None
+    documentLanguage: Annotated[
+        DocumentLanguageDto | None, Field(description="Язык документа")
+    ] = None
+    pagesCount: Annotated[int | None, Field(description="Количество страниц")] = None
+    startPage: Annotated[int | None, Field(description="Начальная страница")] = None
+    endPage: Annotated[int | None, Field(description="Конечная страница")] = None
+    documentSize: Annotated[int | None, Field(description="Размер документа")] = None
+    author: UserInfoDto | None = None
+    docCreateDate: Annotated[
+        datetime | None, Field(description="Дата создания основного документа")
+    ] = None
+    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
+    modifyDate: Annotated[datetime | None, Field(description="Дата изменения")] = None
+    documentId: Annotated[
+        UUID | None, Field(description="Идентификатор основного документа")
+    ] = None
+    document: Annotated[Any | None, Field(description="Основной документ")] = None
+    attachments: Annotated[
+        list[MiniDocumentAttachmentDto] | None, Field(description="Вложения")
+    ] = None
+    nomenclatureAffair: Annotated[
+        Any | None, Field(description="Номенклатурное дело")
+    ] = None
+    nomenclatureAffairId: Annotated[
+        UUID | None, Field(description="Идентификатор номенклатурного дела")
+    ] = None
+    documentInventory: Annotated[Any | None, Field(description="Опись документа")] = (
+        None
+    )
+    objectType: Annotated[
+        str | None,
+        Field(
+            description="Вид документа (Унифицированный код из окрб 010-95 таблица 1)"
+        ),
+    ] = None
+    sourceApproveTs: Annotated[
+        datetime | None, Field(description="Дата подписания или утверждения документа")
+    ] = None
+    signs: Annotated[
+        list[AttachmentSignature] | None, Field(description="Список ЭЦП вложения")
+    ] = None
+    numberPagesPerVolume: Annotated[
+        int | None, Field(description="Числовое значение номера тома (части дела)")
+    ] = None
+    hashED: Annotated[
+        str | None, Field(description="контрольная характеристика файлов документа")
+    ] = None
+    journalNumber: Annotated[
+        int | None,
+        Field(description="Номер журнала регистрации при регистрации документа"),
+    ] = None
+    regDateWithoutTime: Annotated[
+        date | None, Field(description="Дата регистрации без времени")
+    ] = None
+    deleted: Annotated[
+        bool | None,
+        Field(description="Удалено на статусе архивное и должно отображаться в списке"),
+    ] = None
+    attachmentCount: Annotated[int | None, Field(description="Количество вложений")] = (
+        None
+    )
+
+
+class NomenclatureAffairDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор номенклатуры дел")] = (
+        None
+    )
+    externalId: Annotated[str | None, Field(description="Внешний идентификатор")] = None
+    status: Annotated[Status6 | None, Field(description="Статус дела")] = None
+    createType: Annotated[CreateType2 | None, Field(description="Тип создания")] = None
+    calendarYear: Annotated[int | None, Field(description="Календарный год")] = None
+    transitionalAffair: Annotated[
+        bool | None, Field(description="Признак,является ли дело переходящим")
+    ] = None
+    collectingStart: Annotated[
+        datetime | None, Field(description="Дата начала комплектования")
+    ] = None
+    collectingEnd: Annotated[
+        datetime | None, Field(description="Дата окончания комплектования")
+    ] = None
+    personnel: Annotated[
+        bool | None,
+        Field(description="Признак, является ли дело делом по личному составу"),
+    ] = None
+    active: Annotated[
+        bool | None, Field(description="Признак активна ли номенклатура дел")
+    ] = None
+    departmentId: Annotated[
+        UUID | None, Field(description="Идентификатор департамента")
+    ] = None
+    department: Annotated[DepartmentDto | None, Field(description="Департамент")] = None
+    name: Annotated[str | None, Field(description="Наименование номенклатуры дел")] = (
+        None
+    )
+    index: Annotated[str | None, Field(description="Индекс номенклатуры дел")] = None
+    storagePeriodId: Annotated[
+        UUID | None, Field(description="Идентификатор срока хранения")
+    ] = None
+    period: Annotated[StoragePeriodDto | None, Field(description="Срок хранения")] = (
+        None
+    )
+    articleNumber: Annotated[
+        str | None,
+        Field(description="Номер статьи - Хранит информацию о номере статье в Перечне"),
+    ] = None
+    storagePlace: Annotated[
+        str | None,
+        Field(description="Место хранения - Хранит информацию о месте хранения дела"),
+    ] = None
+    note: Annotated[
+        str | None,
+        Field(description="Примечание - хранит произвольный текст с примечанием"),
+    ] = None
+    attachment: Annotated[AttachmentDto | None, Field(description="Файл отчета")] = None
+    departmentPath: Annotated[
+        list[NomenclatureDepartmentPath] | None,
+        Field(description="Цепочка подразделений"),
+    ] = None
+    writeOff: Annotated[
+        bool | None, Field(description="метка списания документа в дело")
+    ] = None
+    docCounter: Annotated[int | None, Field(description="Кол-во доков в деле")] = None
+    innerInventoryData: InnerInventoryDataDto | None = None
+    expirationDate: Annotated[
+        int | None, Field(description="Дата окончания хранения")
+    ] = None
+    methodAssemblyType: Annotated[
+        MethodAssemblyType2 | None, Field(description="Способ комплектования дела")
+    ] = None
+    expertiseType: Annotated[
+        ExpertiseType | None, Field(description="Признак экспертизы дела")
+    ] = None
+    expertise: Annotated[
+        bool,
+        Field(description="Признак, показывающий, что дело находится на экспертизе"),
+    ]
+    documentClassesId: UUID | None = None
+    documentClasses: UnifiedDocumentationSystemDto | None = None
+    countSheets: Annotated[
+        int | None, Field(description="Количество листов в деле")
+    ] = None
+    numberPagesPerVolume: Annotated[
+        int | None, Field(description="Числовое значение номера тома (части дела)")
+    ] = None
+    caseFileCover: Annotated[
+        AttachmentDto | None, Field(description="Файл Обложки дела")
+    ] = None
+    certificationSheet: Annotated[
+        AttachmentDto | None, Field(description="лист заверитель")
+    ] = None
+    acceptanceInventoryId: Annotated[
+        UUID | None, Field(description="Идентификатор СП")
+    ] = None
+    acceptanceInventory: Annotated[
+        AcceptanceInventoryDataDto | None, Field(description="СП")
+    ] = None
+    hasInner: Annotated[
+        bool | None, Field(description="Включено в внутреннюю опись НЦЭУ")
+    ] = None
+    hasInnerArchive: Annotated[
+        bool | None, Field(description="Включено в внутреннюю опись архив СЭД")
+    ] = None
+    archiveDate: Annotated[
+        datetime | None, Field(description="Дата поступления дела в архив ")
+    ] = None
+    whoAccepted: Annotated[
+        UserInfoDto | None,
+        Field(description="Ф.И.О и должность Архивиста, который принял дело по описи"),
+    ] = None
+    fundId: Annotated[UUID | None, Field(description="Идентификатор фонда")] = None
+    fund: Annotated[ArchiveFundDto | None, Field(description="Фонд")] = None
+    shelvingShelveId: Annotated[
+        UUID | None, Field(description="Идентификатор полки/стелажи")
+    ] = None
+    shelvingShelve: Annotated[
+        NomenclatureShelvingShelveDto | None, Field(description="Полки/стелажи")
+    ] = None
+    information: str | None = None
+    caseFileCoverId: UUID | None = None
+    certificationSheetId: UUID | None = None
+    destructionActs: list[DestructionActDto] | None = None
+    documentSize: Annotated[
+        int | None, Field(description="Объем документов в деле")
+    ] = None
+    hashED: Annotated[
+        str | None, Field(description="контрольная характеристика файлов документов")
+    ] = None
+    signs: Annotated[
+        list[AttachmentSignature] | None, Field(description="Список ЭЦП вложения")
+    ] = None
+    completed: Annotated[
+        bool | None, Field(description="Метка о присвоении статуса COMPLETED")
+    ] = None
+
+
+class NomenclatureDepartmentPath(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    order: int | None = None
+    department: DepartmentDto | None = None
+
+
+class OrgDto(BaseModel):
+    """
+    Организация сотрудника
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[str | None, Field(description="Идентификатор организации")] = None
+    name: Annotated[str | None, Field(description="Наименование организации")] = None
+    currentCount: Annotated[
+        int | None, Field(description="Текущее кол-во активных учетных записей в СЭД")
+    ] = None
+    maxCount: Annotated[
+        int | None, Field(description="Максимально кол-во активных учетных записей")
+    ] = None
+    active: Annotated[
+        bool | None, Field(description="Признак активена ли организация")
+    ] = None
+    employees: Annotated[
+        list[EmployeeDto] | None, Field(description="Список сотрудников организации")
+    ] = None
+
+
+class SpeakerDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор докладчика")] = None
+    questionId: Annotated[UUID | None, Field(description="Идентификатор вопроса")] = (
+        None
+    )
+    question: Annotated[Any | None, Field(description="Вопрос")] = None
+    employee: Annotated[UserInfoDto | None, Field(description="Докладчик")] = None
+    type: Type11
+
+
+class TaskChangeDateRequestDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    executed: Annotated[bool | None, Field(description="Была ли расмотрена заявка")] = (
+        None
+    )
+    result: Annotated[bool | None, Field(description="Результат рассмотрения")] = None
+    taskId: UUID | None = None
+    date: Annotated[datetime | None, Field(description="Запрашиваемая дата")] = None
+    dateCreate: Annotated[
+        datetime | None, Field(description="Дата создания заявки")
+    ] = None
+    text: Annotated[str | None, Field(description="Пречина переноса")] = None
+    currentExecutionDate: Annotated[
+        datetime | None, Field(description="Текущая дата исполнения")
+    ] = None
+    author: UserInfoDto | None = None
+
+
+class TaskDocumentLinkDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор документа исполнения")
+    ] = None
+    executorId: Annotated[
+        UUID | None,
+        Field(description="Идентификатор исполнителя поручения в документе"),
+    ] = None
+    taskExecutor: Annotated[Any | None, Field(description="Исполнитель поручения")] = (
+        None
+    )
+    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
+        None
+    )
+    executionDocuments: Annotated[
+        DocumentDto | None, Field(description="Документ исполнения")
+    ] = None
+    deleted: bool | None = None
+
+
+class TaskDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор поручения")] = None
+    externalId: str | None = None
+    type: Annotated[Type12 | None, Field(description="Тип поручения")] = None
+    organizationId: str | None = None
+    parentId: Annotated[
+        UUID | None, Field(description="Идентификатор родительского поручения")
+    ] = None
+    documentRegDate: datetime | None = None
+    taskNumber: Annotated[str | None, Field(description="Номер поручения")] = None
+    createDate: Annotated[
+        datetime | None, Field(description="Дата создания поручения")
+    ] = None
+    taskStatus: TaskStatus | None = None
+    author: Annotated[UserInfoDto | None, Field(description="Автор поручения")] = None
+    taskExecutors: Annotated[
+        list[TaskExecutorsDto] | None,
+        Field(description="Список исполнителей поручения"),
+    ] = None
+    planedDateEnd: Annotated[
+        datetime | None, Field(description="Запланированная дата окончания поручения")
+    ] = None
+    realDateEnd: Annotated[
+        datetime | None, Field(description="Реальная дата окончания поручения")
+    ] = None
+    taskChangeDateRequests: Annotated[
+        list[TaskChangeDateRequestDto] | None,
+        Field(description="Список изменений переносов даты исполнения"),
+    ] = None
+    taskText: Annotated[str | None, Field(description="Текст поручения")] = None
+    onControl: Annotated[
+        bool | None, Field(description="Признак стоит ли поручение на контроле")
+    ] = None
+    removeControl: Annotated[
+        bool | None, Field(description="Метка снятия с контроля")
+    ] = None
+    control: Annotated[ControlDto | None, Field(description="Контроль поручения")] = (
+        None
+    )
+    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
+        None
+    )
+    document: Annotated[DocumentDto | None, Field(description="Документ")] = None
+    revision: Annotated[
+        bool | None, Field(description="Признак стоит ли поручение на доработке")
+    ] = None
+    countExec: Annotated[int | None, Field(description="Количество исполнителей")] = (
+        None
+    )
+    documentRegNum: Annotated[str | None, Field(description="Рег номер документа")] = (
+        None
+    )
+    periodTaskParentNumber: str | None = None
+    parentTaskNumber: str | None = None
+    countCompletedExec: Annotated[
+        int | None, Field(description="Количество исполнителей которые исполнели")
+    ] = None
+    dateRequestCount: int | None = None
+    executedDateRequestCount: int | None = None
+    endless: Annotated[bool | None, Field(description="Бес срока исполнения")] = None
+    periodTask: bool | None = None
+    periodTaskCount: int | None = None
+    period: Period | None = None
+    periodTaskParentId: UUID | None = None
+    periodTaskParentOrgId: str | None = None
+    firstExecution: datetime | None = None
+
+
+class TaskExecutorsDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор исполнителя поручения")
+    ] = None
+    taskId: Annotated[UUID | None, Field(description="Идентификатор поручения")] = None
+    task: Annotated[Any | None, Field(description="Поручение")] = None
+    createDate: Annotated[datetime | None, Field(description="Дата назначения")] = None
+    executedDate: Annotated[datetime | None, Field(description="Дата исполнения")] = (
+        None
+    )
+    executor: Annotated[
+        UserInfoDto | None, Field(description="Исполнитель поручения")
+    ] = None
+    taskDocumentLinks: Annotated[
+        list[TaskDocumentLinkDto] | None,
+        Field(description="Список документов исполнения"),
+    ] = None
+    attachments: Annotated[
+        list[AttachmentTaskDto] | None,
+        Field(description="Список вложений прикрепленных к поручению"),
+    ] = None
+    responsible: Annotated[
+        bool | None, Field(description="Ответственный исполнитель")
+    ] = None
+    executedByExecuteForAll: Annotated[
+        bool | None, Field(description="Исполнен методом выполнения за всех")
+    ] = None
+    executedForAll: Annotated[bool | None, Field(description="Исполнил за всех")] = None
+    revision: Annotated[bool | None, Field(description="Отправлено на доработку")] = (
+        None
+    )
+    parentTaskId: Annotated[
+        UUID | None, Field(description="ИД родительского поручения")
+    ] = None
+    stampText: Annotated[
+        str | None, Field(description="Текст исполнения поручения")
+    ] = None
+    linkCount: Annotated[
+        int | None, Field(description="Кол-во ссылок на документы")
+    ] = None
+    executionDocCount: Annotated[
+        int | None, Field(description="Кол-во загруженных файлов")
+    ] = None
+    childTaskCount: int | None = None
+
+
+class UserInfoDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    firstName: Annotated[str | None, Field(description="Имя сотрудника")] = None
+    lastName: Annotated[str | None, Field(description="Фамилия сотрудника")] = None
+    middleName: Annotated[str | None, Field(description="Отчество сотрудника")] = None
+    authorPost: Annotated[
+        str | None, Field(description="Наименование должность сотрудника")
+    ] = None
+    authorDepartmentName: Annotated[
+        str | None, Field(description="Наименование департамента сотрудника")
+    ] = None
+    authorDepartment: Annotated[
+        DepartmentDto | None, Field(description="Департамент сотрудника")
+    ] = None
+    authorDepartmentId: Annotated[
+        UUID | None, Field(description="Идентификатор департамента сотрудника")
+    ] = None
+    employee: Annotated[EmployeeDto | None, Field(description="Сотрудник")] = None
+    employeeId: Annotated[UUID | None, Field(description="Идентификатор сотрудник")] = (
+        None
+    )
+
+
+class NomenclatureDepartmentDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    indexPrefix: str | None = None
+    author: UserInfoDto | None = None
+    status: Status8 | None = None
+    departmentPath: list[NomenclatureDepartmentPath] | None = None
+    departmentId: UUID | None = None
+    department: DepartmentDto | None = None
+    calendarYear: int | None = None
+    data: list[NomenclatureDepartmentEntryDto] | None = None
+    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
+        None
+    )
+    process: NomenclatureDepartmentProcessDto | None = None
+    currentUserLeader: bool | None = None
+    countData: int | None = None
+    createDate: datetime | None = None
+    affairsCreated: Annotated[
+        bool | None, Field(description="Признак созданных дел")
+    ] = None
+
+
+class DocumentNomenclatureDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None,
+        Field(description="Идентификатор документа который лежит в номенклатуре дел"),
+    ] = None
+    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
+        None
+    )
+    document: Annotated[DocumentDto | None, Field(description="Документ")] = None
+    nomenclatureAffairId: Annotated[
+        UUID | None, Field(description="Идентификатор номенклатуры дел")
+    ] = None
+    nomenclatureAffair: Annotated[
+        NomenclatureAffairDto | None, Field(description="Номенклатура дел")
+    ] = None
+    documentInventoryId: UUID | None = None
+    documentInventory: DocumentInventoryDataDto | None = None
+
+
+class ControlRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    controlTypeId: Annotated[UUID, Field(description="Идентификатор типа контроля")]
+    controlTypeOrgId: str | None = None
+    controlType: ControlTypeDto | None = None
+    controlDateStart: Annotated[datetime, Field(description="Дата начала контроля")]
+    controlPlanDateEnd: Annotated[
+        datetime, Field(description="Планируемая дата окончания контроля")
+    ]
+    controlTermDays: Annotated[
+        int,
+        Field(
+            description="Срок контроля в днях, изначально копируется из типа контроля"
+        ),
+    ]
+    controlEmployeeId: Annotated[UUID, Field(description="Идентификатор контролера")]
+
+
+class Department(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    name: Annotated[str, Field(max_length=255, min_length=0)]
+    number: str | None = None
+    parentDepartmentId: UUID | None = None
+    parentDepartmentOrgId: str | None = None
+    parentDepartment: Department | None = None
+    rank: str | None = None
+    departmentCode: str | None = None
+    phone: str | None = None
+    email: str | None = None
+    address: str | None = None
+    room: str | None = None
+    leaderId: UUID | None = None
+    leaderOrgId: str | None = None
+    leader: Employee | None = None
+    deputyLeaders: list[DeputyLeaderDepartment] | None = None
+    createDate: datetime | None = None
+    order: Annotated[int, Field(ge=0)]
+    responsibleLinkNomenclatures: list[DepartmentEmployeeNomenclature] | None = None
+
+
+class Employee(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    externalId: str | None = None
+    getuId: str | None = None
+    personalNumber: str | None = None
+    firstName: Annotated[str, Field(min_length=1)]
+    lastName: Annotated[str, Field(min_length=1)]
+    middleName: str | None = None
+    fired: bool
+    active: bool
+    fullPostName: str | None = None
+    postId: int | None = None
+    post: Post | None = None
+    departmentId: UUID
+    departmentOrgId: str
+    org: Org | None = None
+    department: Department | None = None
+    meIo: list[EmployeeIo] | None = None
+    groups: list[GroupEmployee] | None = None
+    employeeRoles: list[RoleEmployee] | None = None
+    address: Annotated[str | None, Field(max_length=255, min_length=0)] = None
+    place: Annotated[str | None, Field(max_length=255, min_length=0)] = None
+    url: Annotated[str | None, Field(max_length=255, min_length=0)] = None
+    email: Annotated[str | None, Field(max_length=255, min_length=0)] = None
+    phone: Annotated[str | None, Field(max_length=255, min_length=0)] = None
+    ldapName: Annotated[str | None, Field(max_length=255, min_length=0)] = None
+    io: bool | None = None
+    haveIo: bool | None = None
+    createType: CreateType1 | None = None
+    sid: str | None = None
+    createDate: datetime | None = None
+    avatarId: int | None = None
+    smallAvatarId: int | None = None
+    facsimileId: int | None = None
+    lastManualAvatarUploadDate: datetime | None = None
+    order: Annotated[int, Field(ge=0)]
+    organization: Organization | None = None
+    responsibleLinkNomenclatures: list[DepartmentEmployeeNomenclature] | None = None
+
+
+class EmployeeIo(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    system: bool
+    createDate: datetime
+    revocationDate: datetime | None = None
+    transferDocs: bool
+    targetId: UUID
+    target: Employee | None = None
+    ioId: UUID
+    io: Employee | None = None
+    type: Type24
+
+
+class Group(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    organizationId: str | None = None
+    type: Type7
+    mixed: bool | None = None
+    name: Annotated[str | None, Field(max_length=255, min_length=1)] = None
+    roles: list[GroupRole] | None = None
+    employees: list[GroupEmployee] | None = None
+    createDate: datetime | None = None
+
+
+class GroupEmployee(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    employeeId: UUID | None = None
+    employee: Employee | None = None
+    group: Group | None = None
+    groupId: UUID | None = None
+    groupOrgId: str | None = None
+
+
+class GroupRole(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    role: Any | None = None
+    roleId: UUID
+    group: Group | None = None
+    groupId: UUID
+    groupOrgId: str | None = None
+
+
+class Org(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: str | None = None
+    currentCount: int
+    name: str
+    maxCount: int
+    active: bool
+    employees: list[Employee] | None = None
+
+
+class Permission(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    systemName: str | None = None
+    type: Type26 | None = None
+    docStatus: Annotated[
+        Status2 | None,
+        Field(description="Перечисление для описания статусов документов"),
+    ] = None
+    docCategory: DocCategory | None = None
+    mergeRoles: list[RoleMerge] | None = None
+    processCompleted: bool | None = None
+    currentStepCompleted: bool | None = None
+    lastStep: bool | None = None
+    processStarted: bool | None = None
+    onControl: bool | None = None
+    taskOnControl: bool | None = None
+    taskCompleted: bool | None = None
+    taskOnRevision: bool | None = None
+    childTask: bool | None = None
+    taskType: TaskType1 | None = None
+    resolvePolicy: ResolvePolicy1 | None = None
+    hasRegNumber: bool | None = None
+    documentHasItems: list[Type4] | None = None
+    createType: Annotated[
+        CreateType | None,
+        Field(description="Перечисление для описания типов как создан документ"),
+    ] = None
+    roles: list[RolePermission] | None = None
+    taskBeginExecution: bool | None = None
+    archive: bool | None = None
+    taskCreateByPeriod: bool | None = None
+    hasPeriodTasks: bool | None = None
+    nomenclatureDepartmentStatus: Status8 | None = None
+    summaryNomenclatureDepartmentStatus: SummaryNomenclatureDepartmentStatus1 | None = (
+        None
+    )
+    destructionActStatus: DestructionActStatus1 | None = None
+    acceptanceInventoryStatus: Status | None = None
+
+
+class Role1(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    name: Annotated[str | None, Field(max_length=255, min_length=0)] = None
+    systemName: str | None = None
+    system: bool | None = None
+    systemManage: bool | None = None
+    type: Type14
+    groups: list[GroupRole] | None = None
+    employees: list[RoleEmployee] | None = None
+    permissions: list[RolePermission] | None = None
+    createDate: datetime | None = None
+
+
+class RoleEmployee(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    employeeId: UUID | None = None
+    employee: Any | None = None
+    role: Role1 | None = None
+    roleId: UUID | None = None
+    systemEntityHistoryEvent: bool | None = None
+    systemHistory: RoleEmployee | None = None
+
+
+class RolePermission(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    role: Role1 | None = None
+    roleId: UUID | None = None
+    permission: Permission | None = None
+    permissionId: UUID | None = None
+
+
+class UserInfo(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    firstName: str | None = None
+    lastName: Annotated[str, Field(min_length=1)]
+    middleName: str | None = None
+    authorPost: str | None = None
+    authorDepartmentName: Annotated[str, Field(min_length=1)]
+    departmentId: UUID
+    departmentOrgId: str
+    employeeId: UUID
+    employeeOrgId: str
+    authorDepartment: Department | None = None
+    employee: Employee | None = None
+
+
+class History(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    rkkId: int | None = None
+    docCardId: int | None = None
+    taskId: int | None = None
+    jobId: int | None = None
+    action: str | None = None
+    dateAction: datetime | None = None
+    author: Employee | None = None
+    detail: str | None = None
+    detailInfo: str | None = None
+    text: str | None = None
+
+
+class Task(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    rkkId: int | None = None
+    typeDirectum: TypeDirectum | None = None
+    type: TaskType1 | None = None
+    taskNumber: str | None = None
+    createDate: datetime | None = None
+    taskText: str | None = None
+    planedDateEnd: datetime | None = None
+    realDateEnd: datetime | None = None
+    taskStatusDirectum: TaskStatusDirectum | None = None
+    taskStatus: TaskStatus | None = None
+    author: Employee | None = None
+    parentId: int | None = None
+    taskExecutors: Annotated[set[TaskExecutors] | None, Field()] = None
+    taskHistory: list[History] | None = None
+
+
+class TaskExecutors(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    taskId: int | None = None
+    rkkId: int | None = None
+    createDate: datetime | None = None
+    responsible: bool | None = None
+    executedDate: datetime | None = None
+    stampText: str | None = None
+    executor: Employee | None = None
+    number: int | None = None
+    taskExecutorsStatusDirectum: TaskStatusDirectum | None = None
+    parentTaskId: int | None = None
+
+
+class GroupEmployeeDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    employeeId: UUID | None = None
+    employee: EmployeeDto | None = None
+    group: GroupDto | None = None
+    groupId: UUID | None = None
+
+
+class DepartmentFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: Annotated[
+        str | None, Field(description="Наименование департамента/подразделения")
+    ] = None
+    number: Annotated[
+        str | None,
+        Field(description="Номер департамента/подразделения в номенклатуре дел"),
+    ] = None
+    parentDepartmentId: Annotated[
+        UUID | None,
+        Field(description="Идентификатор родительского департамента/подразделения"),
+    ] = None
+    rank: Annotated[int | None, Field(description="Код сортировки")] = None
+    departmentCode: Annotated[
+        str | None, Field(description="Код департамента/подразделения")
+    ] = None
+    phone: Annotated[str | None, Field(description="Телефон")] = None
+    email: Annotated[str | None, Field(description="Email")] = None
+    address: Annotated[str | None, Field(description="Адрес")] = None
+    room: Annotated[str | None, Field(description="Площадка")] = None
+    leaderId: Annotated[
+        UUID | None,
+        Field(description="Идентификатор руководителя департамента/подразделения"),
+    ] = None
+    employees: Annotated[
+        list[Employee] | None,
+        Field(description="Список сотрудников департамента/подразделения"),
+    ] = None
+    ids: list[UUID] | None = None
+    responsibleDeps: bool | None = None
+    includes: Annotated[
+        list[Include8] | None,
+        Field(description="Список моделей которые могу быть добавлены при отображении"),
+    ] = None
+
+
+class SliceDtoDepartmentDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[DepartmentDto] | None = None
+
+
+class TaskHistoryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор истории поручения")] = (
+        None
+    )
+    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
+    log: Annotated[
+        str | None, Field(description="Информация об изменениях поручения")
+    ] = None
+    taskId: Annotated[UUID | None, Field(description="Идентификатор поручения")] = None
+    taskDto: Annotated[TaskDto | None, Field(description="Поручение")] = None
+    logUser: Annotated[UserInfoDto | None, Field(description="Инициатор изменения")] = (
+        None
+    )
+
+
+class EmployeeAccessGriefDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    employeeId: UUID | None = None
+    accessGriefId: UUID | None = None
+    organizationId: str | None = None
+    employee: EmployeeDto | None = None
+    accessGrief: AccessGriefDto | None = None
+
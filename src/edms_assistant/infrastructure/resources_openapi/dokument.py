@@ -0,0 +1,293 @@
+# src/edms_assistant/infrastructure/resources_openapi/dokument.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    AttachmentDto,
+    ExecutionTaskStatCount,
+    Status2,
+    Type4,
+    UserDocPermission,
+    UserInfoDto,
+)
+
+
+class ChangeRegNumberRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    regDate: datetime
+    regNum: Annotated[str, Field(min_length=1)]
+    journalNumber: int | None = None
+
+
+class DocumentArchiveRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    inArchive: bool
+
+
+class CountResult(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    count: int | None = None
+
+
+class JsonNode(RootModel[Any]):
+    model_config = ConfigDict(defer_build=True)
+
+
+class DocumentLinkCopyType(Enum):
+    DOCUMENT = "DOCUMENT"
+    NONE = "NONE"
+
+
+class RecipientCopyType(Enum):
+    CONTRACT = "CONTRACT"
+    DOCUMENT = "DOCUMENT"
+    NONE = "NONE"
+
+
+class AttachmentCopyType(Enum):
+    DOCUMENT = "DOCUMENT"
+    PROFILE = "PROFILE"
+    PROFILE_AND_DOCUMENT = "PROFILE_AND_DOCUMENT"
+    NONE = "NONE"
+
+
+class ProcessCopyType(Enum):
+    DOCUMENT = "DOCUMENT"
+    PROFILE = "PROFILE"
+
+
+class DocumentBasedExistingBody(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    documentLinkCopyType: DocumentLinkCopyType | None = None
+    documentIntroductionCopyType: DocumentLinkCopyType | None = None
+    recipientCopyType: RecipientCopyType | None = None
+    attachmentCopyType: AttachmentCopyType | None = None
+    processCopyType: ProcessCopyType
+    baseFieldsCopyType: ProcessCopyType
+    responsibleExecutorsCopyType: DocumentLinkCopyType | None = None
+
+
+class NotifyMeetingBody(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    ids: list[UUID]
+
+
+class DocumentNextProcessRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID, Field(description="Ид документа")]
+    nextId: Annotated[UUID, Field(description="Ид следующего этапа")]
+    employees: Annotated[set[UUID] | None, Field(description="Ид исполнителей")] = None
+
+
+class DocumentCancelAction(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID
+    comment: Annotated[str, Field(min_length=1)]
+
+
+class AdditionalAgreementPair(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    additionalAgreementId: UUID | None = None
+    employeeId: UUID | None = None
+
+
+class CurrentStepProcessType(Enum):
+    """
+    Тип процесса текущего этапа
+    """
+
+    NEW = "NEW"
+    AGREEMENT = "AGREEMENT"
+    SIGNING = "SIGNING"
+    STATEMENT = "STATEMENT"
+    REGISTRATION = "REGISTRATION"
+    REVIEW = "REVIEW"
+    EXECUTION = "EXECUTION"
+    DISPATCH = "DISPATCH"
+    PREPARATION = "PREPARATION"
+    PAPERWORK = "PAPERWORK"
+    ACCEPTANCE = "ACCEPTANCE"
+    CONTRACT_EXECUTION = "CONTRACT_EXECUTION"
+
+
+class NextStepProcessType(Enum):
+    """
+    Тип процесса следующего этапа
+    """
+
+    NEW = "NEW"
+    AGREEMENT = "AGREEMENT"
+    SIGNING = "SIGNING"
+    STATEMENT = "STATEMENT"
+    REGISTRATION = "REGISTRATION"
+    REVIEW = "REVIEW"
+    EXECUTION = "EXECUTION"
+    DISPATCH = "DISPATCH"
+    PREPARATION = "PREPARATION"
+    PAPERWORK = "PAPERWORK"
+    ACCEPTANCE = "ACCEPTANCE"
+    CONTRACT_EXECUTION = "CONTRACT_EXECUTION"
+
+
+class DocumentContext(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    docId: Annotated[UUID | None, Field(description="Идентификатор документа")] = None
+    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
+        None
+    )
+    processStart: Annotated[
+        bool | None, Field(description="Признак того что процесс начался")
+    ] = None
+    processEnd: Annotated[
+        bool | None, Field(description="Признак того что процесс закончился")
+    ] = None
+    currentStepId: Annotated[
+        UUID | None, Field(description="Идентификатор текущего этапа")
+    ] = None
+    currentStepProcessType: Annotated[
+        CurrentStepProcessType | None, Field(description="Тип процесса текущего этапа")
+    ] = None
+    currentStepEnd: Annotated[
+        bool | None, Field(description="Признак того завершен ли текущий этап")
+    ] = None
+    currentStepFileSign: bool | None = None
+    currentStepOrder: int | None = None
+    nextStepId: Annotated[
+        UUID | None, Field(description="Идентификатор следующего этапа")
+    ] = None
+    nextStepProcessType: Annotated[
+        NextStepProcessType | None, Field(description="Тип процесса следующего этапа")
+    ] = None
+    stepTypes: list[Type4] | None = None
+    authorId: Annotated[
+        UUID | None, Field(description="Идентификатор автора документа")
+    ] = None
+    introductionId: Annotated[
+        UUID | None, Field(description="Идентификатор ознакомления")
+    ] = None
+    additionalAgreementId: Annotated[
+        UUID | None, Field(description="Идентификатор дополнительного согласования")
+    ] = None
+    additionalAgreement: list[AdditionalAgreementPair] | None = None
+    introductionDeleteIds: Annotated[
+        list[UUID] | None,
+        Field(description="ИД записей которые может удалить пользователь"),
+    ] = None
+    additionalAgreementDeleteIds: Annotated[
+        list[UUID] | None,
+        Field(description="ИД записей которые может удалить пользователь"),
+    ] = None
+    inArchive: Annotated[
+        bool | None, Field(description="Находиться ли документ в архиве")
+    ] = None
+    status: Annotated[
+        Status2 | None,
+        Field(description="Перечисление для описания статусов документов"),
+    ] = None
+    controlPlannedEnd: Annotated[
+        datetime | None, Field(description="Планируемая дата окончания контроля")
+    ] = None
+    writeOffAffairCount: int | None = None
+    preAffairCount: int | None = None
+    meetingQuestionNotifyCount: int | None = None
+    formulaHasNum: bool | None = None
+    controlFlag: bool | None = None
+    currentBpmnTaskId: UUID | None = None
+    refDocId: UUID | None = None
+    refDocOrgId: str | None = None
+
+
+class ExecutionDocumentStatCount(ExecutionTaskStatCount):
+    pass
+
+
+class DocumentRecipientDto(JsonNode):
+    pass
+
+
+class DocPermissionContainer(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    permissions: Annotated[
+        list[UserDocPermission] | None,
+        Field(description="Список прав доступа для документа"),
+    ] = None
+    context: Annotated[
+        DocumentContext | None, Field(description="Контекст документа")
+    ] = None
+
+
+class DocumentHistoryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор истории документа")] = (
+        None
+    )
+    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
+    log: Annotated[
+        str | None, Field(description="Информация об изменениях документа")
+    ] = None
+    docId: Annotated[UUID | None, Field(description="Идентификатор документа")] = None
+    user: Annotated[UserInfoDto | None, Field(description="Инициатор изменения")] = None
+
+
+class ContractVersionAttachmentDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор вложения договора")] = (
+        None
+    )
+    contractVersionInfoId: Annotated[
+        UUID | None, Field(description="Идентификатор версии договора")
+    ] = None
+    contractVersionInfo: Annotated[
+        ContractVersionInfoDto | None, Field(description="Версия договора")
+    ] = None
+    attachment: Annotated[
+        AttachmentDto | None, Field(description="Вложение договора")
+    ] = None
+    uploadDate: Annotated[
+        datetime | None, Field(description="Дата загрузки вложения")
+    ] = None
+
+
+class ContractVersionInfoDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор версии договора")] = (
+        None
+    )
+    documentId: Annotated[UUID | None, Field(description="Идентификатор договора")] = (
+        None
+    )
+    versionNumber: Annotated[int | None, Field(description="Номер версии договора")] = (
+        None
+    )
+    createDate: Annotated[
+        datetime | None, Field(description="Дата создания договора")
+    ] = None
+    attachments: Annotated[
+        list[ContractVersionAttachmentDto] | None,
+        Field(description="Вложения договора"),
+    ] = None
+    fileName: Annotated[str | None, Field(description="Имя файла договора")] = None
+
@@ -0,0 +1,56 @@
+# src/edms_assistant/infrastructure/resources_openapi/dopolnitelnoe_soglasovanie.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    DocumentDto,
+    UserInfoDto,
+)
+
+
+class AdditionalAgreementRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID
+    cause: str | None = None
+    result: bool
+
+
+class BoolResult(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    value: bool | None = None
+
+
+class AdditionalAgreementDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор дополнительного согласования")
+    ] = None
+    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
+    initiator: Annotated[UserInfoDto | None, Field(description="Инициатор")] = None
+    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
+        None
+    )
+    document: Annotated[DocumentDto | None, Field(description="Документ")] = None
+    agreedDate: Annotated[
+        datetime | None, Field(description="Дата доп. согласования")
+    ] = None
+    agreedStampAuthor: Annotated[
+        UserInfoDto | None,
+        Field(description="Сотрудник который проставил отметку об согласовании"),
+    ] = None
+    cause: Annotated[str | None, Field(description="Причина отклонения")] = None
+    result: Annotated[bool | None, Field(description="Статус")] = None
+
@@ -0,0 +1,45 @@
+# src/edms_assistant/infrastructure/resources_openapi/dopolnitelnyi_dokument_dogovora.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class AdditionalDocumentRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    additionalDocumentTypeId: UUID | None = None
+    note: str | None = None
+    parentId: UUID | None = None
+    attachmentAddIds: list[UUID] | None = None
+    attachmentDelIds: list[UUID] | None = None
+    responsibleAddIds: list[UUID] | None = None
+    responsibleDelIds: list[UUID] | None = None
+    date: datetime | None = None
+    docNumber: str | None = None
+
+
+class Include13(Enum):
+    PARENT = "PARENT"
+    ATTACHMENT = "ATTACHMENT"
+    ADDITIONAL_DOCUMENT_TYPE = "ADDITIONAL_DOCUMENT_TYPE"
+    ADDITIONAL_DOCUMENT_RESPONSIBLE = "ADDITIONAL_DOCUMENT_RESPONSIBLE"
+
+
+class AdditionalDocumentFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    documentTypeId: UUID | None = None
+    includes: Annotated[
+        list[Include13] | None,
+        Field(description="Список моделей которые могу быть добавлены при отображении"),
+    ] = None
+
@@ -0,0 +1,69 @@
+# src/edms_assistant/infrastructure/resources_openapi/dostup_k_mini_dokumentam.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import EmployeeDto
+
+
+class MiniDocumentAccessByRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    accessBy: datetime
+
+
+class MiniDocumentAccessRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    addEmployeeIds: Annotated[set[UUID], Field(min_items=1)]
+    accessBy: datetime
+
+
+class Include10(Enum):
+    EMPLOYEE = "EMPLOYEE"
+    AUTHOR = "AUTHOR"
+
+
+class MiniDocumentAccessFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    miniDocId: Annotated[
+        UUID | None, Field(description="Идендификатор мини документа")
+    ] = None
+    includes: Annotated[
+        list[Include10] | None, Field(description="Включаемые связанные данные")
+    ] = None
+
+
+class MiniDocumentAccessDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор доступа мини документа")
+    ] = None
+    miniDocumentId: Annotated[
+        UUID | None, Field(description="Идентификатор мини документа")
+    ] = None
+    miniDocumentOrgId: Annotated[
+        str | None, Field(description="Идентификатор организации мини документа")
+    ] = None
+    employeeId: Annotated[
+        UUID | None, Field(description="Идентификатор сотрудника")
+    ] = None
+    employee: Annotated[
+        EmployeeDto | None, Field(description="Сотрудник для доступа")
+    ] = None
+    authorId: Annotated[UUID | None, Field(description="Идентификатор автора")] = None
+    author: Annotated[EmployeeDto | None, Field(description="Автор")] = None
+    accessBy: Annotated[datetime | None, Field(description="Доступ на дата по")] = None
+    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
+
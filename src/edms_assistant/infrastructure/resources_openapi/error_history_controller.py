@@ -0,0 +1,41 @@
+# src/edms_assistant/infrastructure/resources_openapi/error_history_controller.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import UserInfoDto
+
+
+class ErrorHistoryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    organizationId: str | None = None
+    author: UserInfoDto | None = None
+    date: datetime | None = None
+    path: str | None = None
+    requestType: str | None = None
+    body: dict[str, Any] | None = None
+    params: dict[str, list[str]] | None = None
+    message: str | None = None
+    trace: str | None = None
+
+
+class SliceDtoErrorHistoryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[ErrorHistoryDto] | None = None
+
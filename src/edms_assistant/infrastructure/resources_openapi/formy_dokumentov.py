@@ -0,0 +1,60 @@
+# src/edms_assistant/infrastructure/resources_openapi/formy_dokumentov.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    DocumentConstant,
+    DocumentFormDto,
+)
+
+
+class Include14(Enum):
+    DOCUMENT_TYPE = "DOCUMENT_TYPE"
+    DOCUMENT_FORM_DEFINITION = "DOCUMENT_FORM_DEFINITION"
+
+
+class DocumentFormFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    includes: Annotated[
+        list[Include14] | None,
+        Field(description="Список моделей которые могу быть добавлены при отображении"),
+    ] = None
+    name: Annotated[str | None, Field(description="Наименование формы документа")] = (
+        None
+    )
+    search: str | None = None
+    active: Annotated[
+        bool | None, Field(description="Признак активен ли форма документа")
+    ] = None
+    system: Annotated[
+        bool | None, Field(description="Признак системной формы документа")
+    ] = None
+    documentConstant: Annotated[
+        DocumentConstant | None, Field(description="Константа документа")
+    ] = None
+    documentTypeId: Annotated[
+        int | None, Field(description="Идентификатор типа документа")
+    ] = None
+    mapperRules: list[int] | None = None
+
+
+class SliceDtoDocumentFormDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[DocumentFormDto] | None = None
+
@@ -0,0 +1,44 @@
+# src/edms_assistant/infrastructure/resources_openapi/goroda.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import DistrictDto
+
+
+class CityDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор города")] = None
+    nameCity: Annotated[str | None, Field(description="Наименование города")] = None
+    codeCity: Annotated[int | None, Field(description="Код города")] = None
+    districtId: Annotated[UUID | None, Field(description="Идентификатор района")] = None
+    district: Annotated[DistrictDto | None, Field(description="Район")] = None
+    active: Annotated[bool | None, Field(description="Признак активен ли город")] = None
+    createDate: datetime | None = None
+
+
+class Include19(Enum):
+    DISTRICT_WITH_REGION = "DISTRICT_WITH_REGION"
+    DISTRICT = "DISTRICT"
+
+
+class CityFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    search: Annotated[str | None, Field(description="Строка поиска")] = None
+    active: Annotated[bool | None, Field(description="Признак активен ли город")] = None
+    includes: Annotated[
+        list[Include19] | None,
+        Field(description="Список моделей которые могу быть добавлены при отображении"),
+    ] = None
+
@@ -0,0 +1,46 @@
+# src/edms_assistant/infrastructure/resources_openapi/grify_dostupa.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import EmployeeAccessGriefDto
+
+
+class AccessGriefRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    name: Annotated[str, Field(max_length=255, min_length=0)]
+    shortName: Annotated[str, Field(max_length=255, min_length=0)]
+    active: bool | None = None
+    employeeAdd: Annotated[set[UUID] | None, Field()] = None
+    employeeDelete: list[UUID] | None = None
+
+
+class AccessGriefFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    search: Annotated[
+        str | None, Field(description="Строка поиска по названию или краткому названию")
+    ] = None
+    active: Annotated[bool | None, Field(description="Признак активности")] = None
+
+
+class SliceDtoEmployeeAccessGriefDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[EmployeeAccessGriefDto] | None = None
+
@@ -0,0 +1,71 @@
+# src/edms_assistant/infrastructure/resources_openapi/gruppy_adresatov_korrespondentov.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class CorrespondentGroupRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID, Field(description="Идентификатор группы адресатов/корреспондентов")
+    ]
+    name: Annotated[
+        str, Field(description="Наименование группы адресатов/корреспондентов")
+    ]
+    active: Annotated[
+        bool,
+        Field(
+            description="Признак является ли группа адресатов/корреспондентов действующей или упраздненной"
+        ),
+    ]
+
+
+class CorrespondentGroupDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор группы адресата/корреспондента")
+    ] = None
+    name: Annotated[
+        str | None, Field(description="Наименование группы адресата/корреспондента")
+    ] = None
+    active: Annotated[
+        bool | None,
+        Field(
+            description="Признак является ли группа адресатов/корреспондентов действующей или упраздненной"
+        ),
+    ] = None
+    createDate: datetime | None = None
+
+
+class CorrespondentGroupUpdateRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    correspondentGroup: CorrespondentGroupRequest
+    correspondentAdd: Annotated[set[UUID] | None, Field()] = None
+    correspondentDelete: list[UUID] | None = None
+
+
+class CorrespondentGroupAddRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    correspondentGroup: CorrespondentGroupRequest
+    correspondentAdd: Annotated[set[UUID] | None, Field()] = None
+
+
+class IntermediateCorrespondentRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    ids: list[UUID]
+    id: UUID
+
@@ -0,0 +1,86 @@
+# src/edms_assistant/infrastructure/resources_openapi/gruppy_polzovatelei.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    GroupDto,
+    IdsUUID,
+    RoleDto,
+    Type7,
+)
+
+
+class GroupRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    name: Annotated[str | None, Field(max_length=255, min_length=1)] = None
+    type: Type7 | None = None
+    mixed: bool | None = None
+
+
+class GroupUpdateRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    group: GroupRequest
+    employeeAdd: list[UUID] | None = None
+    employeeDelete: list[int] | None = None
+
+
+class GroupAddRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    group: GroupRequest
+    employeeAdd: list[UUID] | None = None
+
+
+class GroupFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    search: str | None = None
+    type: Type7 | None = None
+    mixed: bool | None = None
+    excludeRoleId: UUID | None = None
+
+
+class GroupRoleDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    role: RoleDto | None = None
+    roleId: UUID | None = None
+    group: GroupDto | None = None
+    groupId: UUID | None = None
+
+
+class GroupEmployeeFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    excludeGroupId: UUID | None = None
+    search: str | None = None
+
+
+class ListUuid(IdsUUID):
+    """
+    Список идентификаторов
+    """
+
+
+class IdLong(BaseModel):
+    """
+    Идентификатор
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: int
+
@@ -0,0 +1,28 @@
+# src/edms_assistant/infrastructure/resources_openapi/iazyki_dokumentov.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class DocumentLanguageRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор шаблона языка документа")
+    ] = None
+    languageCode: Annotated[
+        str | None, Field(description="Код языка документа", max_length=3, min_length=0)
+    ] = None
+    active: Annotated[
+        bool | None, Field(description="Признак активен ли языка документа")
+    ] = None
+
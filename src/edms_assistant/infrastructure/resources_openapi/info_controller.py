@@ -0,0 +1,29 @@
+# src/edms_assistant/infrastructure/resources_openapi/info_controller.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class BasicModuleDefinition(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    enabled: bool | None = None
+    name: str | None = None
+
+
+class ServerInfo(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    version: str | None = None
+    startDate: datetime | None = None
+    modules: dict[str, BasicModuleDefinition] | None = None
+
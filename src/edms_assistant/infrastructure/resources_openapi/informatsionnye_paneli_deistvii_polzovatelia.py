@@ -0,0 +1,54 @@
+# src/edms_assistant/infrastructure/resources_openapi/informatsionnye_paneli_deistvii_polzovatelia.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class PanelType(Enum):
+    ACTIVE_USER = "ACTIVE_USER"
+    DOCUMENT_CREATE = "DOCUMENT_CREATE"
+    DOCUMENT_REGISTERED = "DOCUMENT_REGISTERED"
+
+
+class Period1(Enum):
+    DAY = "DAY"
+    WEEK = "WEEK"
+    MONTH = "MONTH"
+    YEAR = "YEAR"
+
+
+class UserActionPanelRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID
+    panelType: PanelType
+    period: Period1
+    sort: int
+
+
+class UserActionPanelBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    panelType: PanelType | None = None
+    period: Period1 | None = None
+
+
+class UserActionPanelCountResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    data: UserActionPanelBase | None = None
+    panelType: PanelType | None = None
+    sort: int | None = None
+    count: int | None = None
+    createDate: datetime | None = None
+
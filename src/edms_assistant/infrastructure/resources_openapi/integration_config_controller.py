@@ -0,0 +1,28 @@
+# src/edms_assistant/infrastructure/resources_openapi/integration_config_controller.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class IntegrationConfigRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    nceoAddr: str | None = None
+    proxyAddr: str | None = None
+    proxyPort: str | None = None
+    proxyAuthUser: str | None = None
+    proxyAuthPass: str | None = None
+
+
+class IntegrationConfigDto(IntegrationConfigRequest):
+    pass
+
@@ -0,0 +1,59 @@
+# src/edms_assistant/infrastructure/resources_openapi/kalendar_rabochikh_dnei.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class SettingWorkDay(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    date: datetime | None = None
+    workDayStart: str | None = None
+    workDayEnd: str | None = None
+
+
+class WorkCalendarRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID, Field(description="Идентификатор календаря")]
+    name: Annotated[str, Field(description="Наименование календаря")]
+    year: Annotated[int, Field(description="Год календаря")]
+    weekends: Annotated[set[datetime], Field(description="Перечень выходных")]
+    workingDays: Annotated[
+        set[SettingWorkDay] | None,
+        Field(description="Продолжительность рабочего дня"),
+    ] = None
+
+
+class WorkCalendarDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    name: str | None = None
+    year: int | None = None
+    weekends: Annotated[set[datetime] | None, Field()] = None
+    createDate: datetime | None = None
+    workingDays: Annotated[
+        set[SettingWorkDay] | None,
+        Field(description="Продолжительность рабочего дня"),
+    ] = None
+
+
+class SliceDtoWorkCalendarDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[WorkCalendarDto] | None = None
+
@@ -0,0 +1,62 @@
+# src/edms_assistant/infrastructure/resources_openapi/kommentarii_k_dokumentu.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class DocumentCommentRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    documentId: UUID | None = None
+    text: str | None = None
+
+
+class CommentStatus(Enum):
+    CHANGED = "CHANGED"
+    DELETED = "DELETED"
+
+
+class SimpleDocumentCommentDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[int | None, Field(description="Идентификатор комментария")] = None
+    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
+        None
+    )
+    text: Annotated[str | None, Field(description="Текст комментария")] = None
+    dateTime: Annotated[
+        datetime | None, Field(description="Дата и время создания комментария")
+    ] = None
+    employeeId: Annotated[
+        UUID | None, Field(description="Идентификатор сотрудника")
+    ] = None
+    firstName: Annotated[str | None, Field(description="Имя сотрудника")] = None
+    lastName: Annotated[str | None, Field(description="Фамилия сотрудника")] = None
+    middleName: Annotated[str | None, Field(description="Отчество сотрудника")] = None
+    post: Annotated[
+        str | None, Field(description="Наименование должность сотрудника")
+    ] = None
+    department: Annotated[
+        str | None, Field(description="Наименование департамента сотрудника")
+    ] = None
+    commentStatus: CommentStatus | None = None
+
+
+class DocumentCommentFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    search: Annotated[str | None, Field(description="Строка поиска")] = None
+    start: Annotated[datetime | None, Field(description="Дата начала")] = None
+    end: Annotated[datetime | None, Field(description="Дата конца")] = None
+    commentStatus: CommentStatus | None = None
+
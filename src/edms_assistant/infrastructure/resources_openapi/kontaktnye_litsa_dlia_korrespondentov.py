@@ -0,0 +1,31 @@
+# src/edms_assistant/infrastructure/resources_openapi/kontaktnye_litsa_dlia_korrespondentov.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import CorrespondentDto
+
+
+class ContactFaceDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    lastName: str | None = None
+    firstName: str | None = None
+    middleName: str | None = None
+    post: str | None = None
+    mail: str | None = None
+    phone: str | None = None
+    fax: str | None = None
+    correspondentId: UUID | None = None
+    correspondent: CorrespondentDto | None = None
+
@@ -0,0 +1,183 @@
+# src/edms_assistant/infrastructure/resources_openapi/kontrolnye_tochki_ispolneniia_dogovora.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    AttachmentDto,
+    DocumentDto,
+    UserInfoDto,
+)
+
+
+class ControlPointRevisionRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    revisionComment: str | None = None
+
+
+class Status9(Enum):
+    """
+    Статус контрольной точки исполнения договора
+    """
+
+    EXECUTION = "EXECUTION"
+    EXECUTED = "EXECUTED"
+
+
+class Type22(Enum):
+    """
+    Тип ссылки
+    """
+
+    RECEIVED_IN_RESPONSE_TO = "RECEIVED_IN_RESPONSE_TO"
+    CREATE_IN_RESPONSE_TO = "CREATE_IN_RESPONSE_TO"
+    LINK_DOC = "LINK_DOC"
+    TASK_DOC_LINK = "TASK_DOC_LINK"
+    CHILD_LINK_DOC = "CHILD_LINK_DOC"
+    CHILD_DOCUMENT = "CHILD_DOCUMENT"
+    PROTOCOL = "PROTOCOL"
+    CHILD_PROTOCOL = "CHILD_PROTOCOL"
+    REPLY_TO_APPLICANT = "REPLY_TO_APPLICANT"
+    PROTOCOL_MEETING_QUESTION = "PROTOCOL_MEETING_QUESTION"
+    QUESTION_DOCUMENTS = "QUESTION_DOCUMENTS"
+
+
+class ControlPointMainFields(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    description: str | None = None
+    number: str | None = None
+    deadline: datetime | None = None
+    responsibleContractor: str | None = None
+    responsibleEmployeesAddIds: list[UUID] | None = None
+    responsibleEmployeesDelIds: list[UUID] | None = None
+
+
+class Include12(Enum):
+    CONTRACT_CONTROL_POINT_RESPONSIBLE_EMPLOYEES = (
+        "CONTRACT_CONTROL_POINT_RESPONSIBLE_EMPLOYEES"
+    )
+
+
+class ContractControlPointFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    search: str | None = None
+    status: bool | None = None
+    includes: Annotated[
+        list[Include12] | None,
+        Field(description="Список моделей которые могу быть добавлены при отображении"),
+    ] = None
+
+
+class ContractControlPointAttachmentDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    attachment: AttachmentDto | None = None
+    contractControlPointId: UUID | None = None
+    contractControlPoint: Annotated[
+        ContractControlPointDto | None,
+        Field(description="Контрольная точка исполнения договора"),
+    ] = None
+    createDate: datetime | None = None
+
+
+class ContractControlPointDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None,
+        Field(description="Идентификатор контрольной точки исполнения договора"),
+    ] = None
+    sequence: Annotated[
+        int | None, Field(description="Порядковый номер контрольной точки")
+    ] = None
+    number: Annotated[str | None, Field(description="Номер контрольной точки")] = None
+    status: Annotated[
+        Status9 | None,
+        Field(description="Статус контрольной точки исполнения договора"),
+    ] = None
+    description: Annotated[
+        str | None, Field(description="Описание контрольной точки исполнения договора")
+    ] = None
+    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
+    deadline: Annotated[
+        datetime | None, Field(description="Дата окончания работ на этапе")
+    ] = None
+    responsibleEmployees: list[ContractControlPointResponsibleDto] | None = None
+    responsibleContractor: Annotated[
+        str | None, Field(description="Ответственный со стороны Контрагента")
+    ] = None
+    executionContract: DocumentDto | None = None
+    executionDate: Annotated[datetime | None, Field(description="Дата исполнения")] = (
+        None
+    )
+    documentId: Annotated[
+        UUID | None, Field(description="Идентификатор исполнительного договора")
+    ] = None
+    comment: Annotated[
+        str | None,
+        Field(description="Комментарий к исполнению контрольной точки договора"),
+    ] = None
+    attachments: Annotated[
+        list[ContractControlPointAttachmentDto] | None,
+        Field(description="Вложения контрольной точки исполнения договора"),
+    ] = None
+    documentLinks: Annotated[
+        list[ContractControlPointLinkDto] | None,
+        Field(description="Ссылки на документы контрольной точки исполнения договора"),
+    ] = None
+
+
+class ContractControlPointLinkDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор ссылки")] = None
+    contractControlPointId: Annotated[
+        UUID | None,
+        Field(description="Идентификатор контрольной точки исполнения договора"),
+    ] = None
+    docLinkId: Annotated[
+        UUID | None,
+        Field(
+            description="Идентификатор документа на который ссылается контрольная точка исполнения договора"
+        ),
+    ] = None
+    docLink: Annotated[
+        DocumentDto | None,
+        Field(
+            description="Документ на который ссылается контрольная точка исполнения договора"
+        ),
+    ] = None
+    type: Annotated[Type22 | None, Field(description="Тип ссылки")] = None
+
+
+class ContractControlPointResponsibleDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None,
+        Field(
+            description="Идентификатор ответственного организации за контрольную точку исполнения договора"
+        ),
+    ] = None
+    contractControlPointId: Annotated[
+        UUID | None,
+        Field(description="Идентификатор контрольной точки исполнения договора"),
+    ] = None
+    contractControlPointOrgId: str | None = None
+    user: UserInfoDto | None = None
+    completed: bool | None = None
+    createDate: datetime | None = None
+
@@ -0,0 +1,105 @@
+# src/edms_assistant/infrastructure/resources_openapi/lichnye_papki_v2.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class DocMoveInFoldersOperation(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    documentId: UUID | None = None
+    inFolderIds: list[UUID] | None = None
+
+
+class DocsMoveInFoldersOperation(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    documentIds: list[UUID] | None = None
+    inFolderIds: list[UUID] | None = None
+
+
+class FolderInRootOperation(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    folderId: UUID | None = None
+
+
+class FolderInsertOrUpdateOperation(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    parentId: UUID | None = None
+    name: str | None = None
+
+
+class FoldersDocsDeleteOperation(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    folderIds: list[UUID] | None = None
+    linkDocIds: list[UUID] | None = None
+    fromFolderId: UUID | None = None
+
+
+class FoldersDocsMoveOperation(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    folderIds: list[UUID] | None = None
+    linkDocIds: list[UUID] | None = None
+    inFolderId: UUID | None = None
+    fromFolderId: UUID | None = None
+    ignore: bool | None = None
+
+
+class Include2(Enum):
+    DOCUMENT_FOLDERS = "DOCUMENT_FOLDERS"
+    DOCUMENT_FOLDERS_DOCUMENT = "DOCUMENT_FOLDERS_DOCUMENT"
+    PARENT_FOLDER = "PARENT_FOLDER"
+
+
+class FolderFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    parentId: UUID | None = None
+    name: str | None = None
+    currentFolder: bool | None = None
+    includes: list[Include2] | None = None
+    mapperRules: list[int] | None = None
+
+
+class FolderRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    folderInsertOrUpdate: Annotated[
+        FolderInsertOrUpdateOperation,
+        Field(description="Модель редактирования или создания папки"),
+    ]
+    foldersDocsMove: Annotated[
+        FoldersDocsMoveOperation | None,
+        Field(description="Модель перемещения массива папок и документов в папку"),
+    ] = None
+    docMoveInFolders: Annotated[
+        DocMoveInFoldersOperation | None,
+        Field(description="Модель перемещения документа в массив папок"),
+    ] = None
+    docsMoveInFolders: Annotated[
+        DocsMoveInFoldersOperation | None,
+        Field(description="Модель перемещения массива документов в массив папок"),
+    ] = None
+    foldersDocsDelete: Annotated[
+        FoldersDocsDeleteOperation | None,
+        Field(description="Модель удаления массива папок и документов"),
+    ] = None
+    folderInRoot: Annotated[
+        FolderInRootOperation | None,
+        Field(description="Модель перемещения папки в корень"),
+    ] = None
+
@@ -0,0 +1,174 @@
+# src/edms_assistant/infrastructure/resources_openapi/lichnyi_kalendar_polzovatelia.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    Status2,
+    TaskStatus,
+)
+
+
+class CalendarEventRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    start: datetime | None = None
+    end: datetime | None = None
+    color: str | None = None
+    text: str | None = None
+    title: str | None = None
+
+
+class CalendarEventFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    start: datetime | None = None
+    end: datetime | None = None
+
+
+class CalendarEventDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор пользовательского события")
+    ] = None
+    start: Annotated[datetime | None, Field(description="Дата начала события")] = None
+    end: Annotated[datetime | None, Field(description="Дата окончания события")] = None
+    color: Annotated[str | None, Field(description="Цвет события")] = None
+    text: Annotated[str | None, Field(description="Текст события")] = None
+    title: Annotated[str | None, Field(description="Заголовок события")] = None
+    employeeId: Annotated[
+        UUID | None, Field(description="Идентификатор сотрудника")
+    ] = None
+
+
+class TaskUserCalendarEntry(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: str | None = None
+    id: UUID | None = None
+    documentId: UUID | None = None
+    number: str | None = None
+    start: datetime | None = None
+    end: datetime | None = None
+    onControl: bool | None = None
+    removeControl: bool | None = None
+    skipRegistration: bool | None = None
+
+
+class TaskControlUserCalendarEntry(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: str | None = None
+    id: UUID | None = None
+    documentId: UUID | None = None
+    number: str | None = None
+    taskStatus: TaskStatus | None = None
+    start: datetime | None = None
+    end: datetime | None = None
+    onControl: bool | None = None
+    removeControl: bool | None = None
+    skipRegistration: bool | None = None
+
+
+class TermDocumentUserCalendarEntry(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: str | None = None
+    id: UUID | None = None
+    status: Annotated[
+        Status2 | None,
+        Field(description="Перечисление для описания статусов документов"),
+    ] = None
+    start: datetime | None = None
+    end: datetime | None = None
+    regDate: datetime | None = None
+    regNum: str | None = None
+    onControl: bool | None = None
+    removeControl: bool | None = None
+    skipRegistration: bool | None = None
+
+
+class DocumentInvitedConfirmCalendar(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    name: str | None = None
+    status: Annotated[
+        Status2 | None,
+        Field(description="Перечисление для описания статусов документов"),
+    ] = None
+    placeMeeting: str | None = None
+    date: datetime | None = None
+    start: datetime | None = None
+    end: datetime | None = None
+    skipRegistration: bool | None = None
+
+
+class DocumentControlUserCalendarEntry(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    name: str | None = None
+    regDate: datetime | None = None
+    regNum: str | None = None
+    status: Annotated[
+        Status2 | None,
+        Field(description="Перечисление для описания статусов документов"),
+    ] = None
+    start: datetime | None = None
+    end: datetime | None = None
+    onControl: bool | None = None
+    removeControl: bool | None = None
+    skipRegistration: bool | None = None
+
+
+class AdditionalAgreementUserCalendarEntry(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    name: str | None = None
+    regDate: datetime | None = None
+    regNum: str | None = None
+    status: Annotated[
+        Status2 | None,
+        Field(description="Перечисление для описания статусов документов"),
+    ] = None
+    onControl: bool | None = None
+    removeControl: bool | None = None
+    skipRegistration: bool | None = None
+
+
+class DocumentUserCalendarEntry(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: str | None = None
+    id: UUID | None = None
+    regDate: datetime | None = None
+    regNum: str | None = None
+    status: Annotated[
+        Status2 | None,
+        Field(description="Перечисление для описания статусов документов"),
+    ] = None
+
+
+class UserCalendarEntry(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    allTasks: list[TaskUserCalendarEntry] | None = None
+    allControlTasks: list[TaskControlUserCalendarEntry] | None = None
+    allDocuments: list[TermDocumentUserCalendarEntry] | None = None
+    allControlDocuments: list[DocumentControlUserCalendarEntry] | None = None
+    calendarEvents: list[CalendarEventDto] | None = None
+    invited: list[DocumentInvitedConfirmCalendar] | None = None
+
@@ -0,0 +1,94 @@
+# src/edms_assistant/infrastructure/resources_openapi/logirovanie_sobytii.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import EmployeeDto
+
+
+class Type41(Enum):
+    DOCUMENT_CREATE = "DOCUMENT_CREATE"
+    DOCUMENT_UN_DRAFT = "DOCUMENT_UN_DRAFT"
+    DOCUMENT_CANCEL = "DOCUMENT_CANCEL"
+    DOCUMENT_PROCESS_AGREEMENT = "DOCUMENT_PROCESS_AGREEMENT"
+    DOCUMENT_PROCESS_SIGNING = "DOCUMENT_PROCESS_SIGNING"
+    DOCUMENT_PROCESS_STATEMENT = "DOCUMENT_PROCESS_STATEMENT"
+    DOCUMENT_PROCESS_REGISTRATION = "DOCUMENT_PROCESS_REGISTRATION"
+    DOCUMENT_PROCESS_FREE_REGISTRATION = "DOCUMENT_PROCESS_FREE_REGISTRATION"
+    DOCUMENT_PROCESS_REVIEW = "DOCUMENT_PROCESS_REVIEW"
+    DOCUMENT_PROCESS_EXECUTION = "DOCUMENT_PROCESS_EXECUTION"
+    DOCUMENT_PROCESS_DISPATCH = "DOCUMENT_PROCESS_DISPATCH"
+    DOCUMENT_PROCESS_PREPARATION = "DOCUMENT_PROCESS_PREPARATION"
+    DOCUMENT_PROCESS_PAPERWORK = "DOCUMENT_PROCESS_PAPERWORK"
+    DOCUMENT_PROCESS_ACCEPTANCE = "DOCUMENT_PROCESS_ACCEPTANCE"
+    DOCUMENT_PROCESS_REDIRECT_REVIEW = "DOCUMENT_PROCESS_REDIRECT_REVIEW"
+    DOCUMENT_IN_ARCHIVE = "DOCUMENT_IN_ARCHIVE"
+    DOCUMENT_EXTRACT_ARCHIVE = "DOCUMENT_EXTRACT_ARCHIVE"
+    DOCUMENT_WRITE_OFF_NOMENCLATURE_AFFAIR = "DOCUMENT_WRITE_OFF_NOMENCLATURE_AFFAIR"
+    DOCUMENT_EXTRACT_NOMENCLATURE_AFFAIR = "DOCUMENT_EXTRACT_NOMENCLATURE_AFFAIR"
+    DOCUMENT_TO_CONTROL = "DOCUMENT_TO_CONTROL"
+    DOCUMENT_REMOVE_CONTROL = "DOCUMENT_REMOVE_CONTROL"
+    DOCUMENT_DELETE_CONTROL = "DOCUMENT_DELETE_CONTROL"
+    DOCUMENT_ADD_INTRODUCTIONS = "DOCUMENT_ADD_INTRODUCTIONS"
+    DOCUMENT_DELETE_INTRODUCTIONS = "DOCUMENT_DELETE_INTRODUCTIONS"
+    DOCUMENT_STAMP_INTRODUCTION = "DOCUMENT_STAMP_INTRODUCTION"
+    DOCUMENT_ADD_ADDITIONAL_AGREEMENTS = "DOCUMENT_ADD_ADDITIONAL_AGREEMENTS"
+    DOCUMENT_DELETE_ADDITIONAL_AGREEMENTS = "DOCUMENT_DELETE_ADDITIONAL_AGREEMENTS"
+    DOCUMENT_STAMP_ADDITIONAL_AGREEMENT = "DOCUMENT_STAMP_ADDITIONAL_AGREEMENT"
+    DOCUMENT_UPLOAD_ATTACHMENT = "DOCUMENT_UPLOAD_ATTACHMENT"
+    DOCUMENT_DOWNLOAD_ATTACHMENT = "DOCUMENT_DOWNLOAD_ATTACHMENT"
+    DOCUMENT_DOWNLOAD_ATTACHMENT_WOPI = "DOCUMENT_DOWNLOAD_ATTACHMENT_WOPI"
+    DOCUMENT_DELETE_ATTACHMENT = "DOCUMENT_DELETE_ATTACHMENT"
+    DOCUMENT_CREATE_COPY = "DOCUMENT_CREATE_COPY"
+    DOCUMENT_CREATE_NEW_VERSION = "DOCUMENT_CREATE_NEW_VERSION"
+    DOCUMENT_ADD_SIGN = "DOCUMENT_ADD_SIGN"
+    TASK_CREATE = "TASK_CREATE"
+    TASK_DELETE = "TASK_DELETE"
+    TASK_TO_CONTROL = "TASK_TO_CONTROL"
+    TASK_REMOVE_CONTROL = "TASK_REMOVE_CONTROL"
+    TASK_DELETE_CONTROL = "TASK_DELETE_CONTROL"
+    TASK_ADD_LINK = "TASK_ADD_LINK"
+    TASK_DELETE_LINK = "TASK_DELETE_LINK"
+    TASK_UPLOAD_ATTACHMENT = "TASK_UPLOAD_ATTACHMENT"
+    TASK_DOWNLOAD_ATTACHMENT = "TASK_DOWNLOAD_ATTACHMENT"
+    TASK_DELETE_ATTACHMENT = "TASK_DELETE_ATTACHMENT"
+    DOCUMENT_PROCESS_CONTRACT_EXECUTION = "DOCUMENT_PROCESS_CONTRACT_EXECUTION"
+
+
+class UserActionFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    types: list[Type41] | None = None
+    groupIds: list[UUID] | None = None
+    departmentIds: list[UUID] | None = None
+    employeeIds: list[UUID] | None = None
+    start: datetime | None = None
+    end: datetime | None = None
+
+
+class UserActionDashboard(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    point: datetime | None = None
+    count: int | None = None
+
+
+class UserActionDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    createDate: datetime | None = None
+    employeeId: UUID | None = None
+    employee: EmployeeDto | None = None
+    data: dict[str, Any] | None = None
+    type: Type41 | None = None
+
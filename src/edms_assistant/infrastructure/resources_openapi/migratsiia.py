@@ -0,0 +1,214 @@
+# src/edms_assistant/infrastructure/resources_openapi/migratsiia.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    DeclarantType1,
+    DocumentType,
+    Employee,
+    History,
+    Signature,
+    Task,
+)
+
+
+class CitizenType(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    citizenTypeId: int | None = None
+    citizenType: str | None = None
+
+
+class DocumentCategoryConstants(Enum):
+    INTERN = "INTERN"
+    INCOMING = "INCOMING"
+    OUTGOING = "OUTGOING"
+    APPEAL = "APPEAL"
+
+
+class UpdateDocumentType(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    documentCategoryConstants: DocumentCategoryConstants | None = None
+    documentType: DocumentType | None = None
+    citizenType: CitizenType | None = None
+    regNumber: str | None = None
+    regDate: datetime | None = None
+
+
+class Recipient(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    recipientName: str | None = None
+
+
+class NomenclatureAffair(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    departmentId: int | None = None
+    departmentName: str | None = None
+    nameAffair: str | None = None
+    storagePeriodId: int | None = None
+    storagePeriodName: str | None = None
+    index: str | None = None
+    collectingStart: datetime | None = None
+    collectingEnd: datetime | None = None
+    note: str | None = None
+
+
+class AddresseeDocument(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    addresseeId: int | None = None
+    addresseeName: str | None = None
+    addresseeFullName: str | None = None
+    addresseeSmdoCode: str | None = None
+    toPeople: str | None = None
+    deliveryMethod: str | None = None
+    dateSend: datetime | None = None
+
+
+class CorrespondentDocument(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    correspondentId: int | None = None
+    correspondentName: str | None = None
+    correspondentFullName: str | None = None
+    correspondentUnp: str | None = None
+    correspondentSmdoCode: str | None = None
+
+
+class NomenclatureAffairDocument(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    nomenclatureAffairId: int | None = None
+    nomenclatureAffairName: str | None = None
+    nomenclatureAffairDate: datetime | None = None
+
+
+class OrganizationDocument(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    organizationId: int | None = None
+    organizationName: str | None = None
+
+
+class DocumentLinkType(Enum):
+    RECEIVED_IN_RESPONSE_TO = "RECEIVED_IN_RESPONSE_TO"
+    CREATE_IN_RESPONSE_TO = "CREATE_IN_RESPONSE_TO"
+    LINK_DOC = "LINK_DOC"
+
+
+class DocumentLink(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    docRkkId: int | None = None
+    docRkkLinkId: int | None = None
+    documentLinkType: DocumentLinkType | None = None
+
+
+class Correspondent(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    name: str | None = None
+    fullName: str | None = None
+    unp: str | None = None
+    address: str | None = None
+    smdoCode: str | None = None
+
+
+class DirectumAttachmentDocument(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    docCardId: int | None = None
+    docRkkId: int | None = None
+    taskId: int | None = None
+    author: Employee | None = None
+    uploadDate: datetime | None = None
+    name: str | None = None
+    contentType: str | None = None
+    size: int | None = None
+    data: str | None = None
+    crc: str | None = None
+    signatures: list[Signature] | None = None
+
+
+class Document(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    createDate: datetime | None = None
+    documentCategoryConstants: DocumentCategoryConstants | None = None
+    documentType: DocumentType | None = None
+    citizenType: CitizenType | None = None
+    shortSummary: str | None = None
+    author: Employee | None = None
+    correspondent: CorrespondentDocument | None = None
+    addressee: AddresseeDocument | None = None
+    outRegNumber: str | None = None
+    outRegDate: datetime | None = None
+    regNumber: str | None = None
+    regDate: datetime | None = None
+    skipRegistration: bool | None = None
+    whoSigned: Employee | None = None
+    inDocSigners: str | None = None
+    deliveryMethod: str | None = None
+    declarantType: DeclarantType1 | None = None
+    receiptDate: datetime | None = None
+    fullAddress: str | None = None
+    fioApplicant: str | None = None
+    organization: OrganizationDocument | None = None
+    collective: bool | None = None
+    anonymous: bool | None = None
+    nomenclatureAffairDocument: NomenclatureAffairDocument | None = None
+    attachmentDocuments: list[DirectumAttachmentDocument] | None = None
+    histories: list[History] | None = None
+    tasks: list[Task] | None = None
+    introductions: list[Introduction] | None = None
+    employeesAccess: Annotated[set[Employee] | None, Field()] = None
+    introductionIds: list[int] | None = None
+    taskComments: list[TaskComment] | None = None
+
+
+class Introduction(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    taskId: int | None = None
+    createDate: datetime | None = None
+    author: Employee | None = None
+    introductionDate: datetime | None = None
+    introductionStampAuthor: Employee | None = None
+    comment: str | None = None
+
+
+class TaskComment(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    taskId: int | None = None
+    jobId: int | None = None
+    parentTaskId: int | None = None
+    createDate: datetime | None = None
+    author: Employee | None = None
+    parentTopic: str | None = None
+    topic: str | None = None
+    comment: str | None = None
+    status: str | None = None
+
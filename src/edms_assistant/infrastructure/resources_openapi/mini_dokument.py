@@ -0,0 +1,121 @@
+# src/edms_assistant/infrastructure/resources_openapi/mini_dokument.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    DocumentCategory,
+    MiniDocumentDto,
+    UserInfoDto,
+)
+
+
+class MiniDocumentRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    regNumber: Annotated[str | None, Field(description="Регистрационный номер")] = None
+    regDate: Annotated[datetime | None, Field(description="Дата регистрации")] = None
+    docCategoryConstant: Annotated[
+        DocumentCategory | None, Field(description="Тип документа")
+    ] = None
+    shortSummary: Annotated[str | None, Field(description="Краткое содержание")] = None
+    documentLanguageId: Annotated[UUID | None, Field(description="Язык документа")] = (
+        None
+    )
+    pagesCount: Annotated[int | None, Field(description="Количество страниц")] = None
+    startPage: Annotated[int | None, Field(description="Начальная страница")] = None
+    endPage: Annotated[int | None, Field(description="Конечная страница")] = None
+    temporaryAttachmentIds: Annotated[
+        list[UUID] | None,
+        Field(description="Массив id из временного хранилища вложений"),
+    ] = None
+    nomenclatureAffairIds: Annotated[
+        list[UUID] | None,
+        Field(
+            description="Массив идентификаторов номенклатурных дел в которых нужно создать документы"
+        ),
+    ] = None
+    sourceApproveTs: Annotated[
+        datetime | None, Field(description="Дата подписания или утверждения документа")
+    ] = None
+    linkIds: Annotated[
+        list[UUID] | None, Field(description="Ссылки на мини документы")
+    ] = None
+    journalNumber: Annotated[
+        int | None,
+        Field(description="Номер журнала регистрации при регистрации документа"),
+    ] = None
+
+
+class Operation3(Enum):
+    MINI_DOCUMENT_READ = "MINI_DOCUMENT_READ"
+    MINI_DOCUMENT_UPDATE = "MINI_DOCUMENT_UPDATE"
+    MINI_DOCUMENT_DELETE = "MINI_DOCUMENT_DELETE"
+
+
+class MiniDocumentPermission(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    operation: Operation3 | None = None
+    employees: Annotated[set[UUID] | None, Field()] = None
+
+
+class ActionType2(Enum):
+    CREATED = "CREATED"
+    CREATED_WRITE_OFF = "CREATED_WRITE_OFF"
+    UPDATE = "UPDATE"
+    MOVE = "MOVE"
+    UPLOAD_ATTACHMENT = "UPLOAD_ATTACHMENT"
+    UPLOAD_RKK = "UPLOAD_RKK"
+    UPLOAD_AGREEMENT = "UPLOAD_AGREEMENT"
+    UPLOAD_INTRODUCTION = "UPLOAD_INTRODUCTION"
+    DELETE_ATTACHMENT = "DELETE_ATTACHMENT"
+    ADD_SIGN = "ADD_SIGN"
+    DELETE_SIGN = "DELETE_SIGN"
+    DELETE = "DELETE"
+
+
+class MiniDocumentHistoryActionData(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    actionType: ActionType2 | None = None
+    data: dict[str, Any] | None = None
+
+
+class MiniDocumentHistoryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор истории мини документа")
+    ] = None
+    miniDocumentId: Annotated[
+        UUID | None, Field(description="Идентификатор мини документа")
+    ] = None
+    miniDocument: Annotated[
+        MiniDocumentDto | None, Field(description="Мини документ")
+    ] = None
+    author: Annotated[
+        UserInfoDto | None, Field(description="Сотрудник который выполнил действие")
+    ] = None
+    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
+    data: Annotated[
+        list[MiniDocumentHistoryActionData] | None,
+        Field(description="Данные об изменении"),
+    ] = None
+
+
+class MiniDocumentWithPermission(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    miniDocument: MiniDocumentDto | None = None
+    permission: list[MiniDocumentPermission] | None = None
+
@@ -0,0 +1,53 @@
+# src/edms_assistant/infrastructure/resources_openapi/napominaniia.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class Id(Enum):
+    """
+    Тип напоминания
+    """
+
+    DEADLINE_CONTROL_DOCUMENT = "DEADLINE_CONTROL_DOCUMENT"
+    DEADLINE_CONTROL_TASK = "DEADLINE_CONTROL_TASK"
+    DEADLINE_EXECUTION_PROCESS = "DEADLINE_EXECUTION_PROCESS"
+    DEADLINE_EXECUTION_TASK = "DEADLINE_EXECUTION_TASK"
+    INACTION_SUMMARY_NOMENCLATURE = "INACTION_SUMMARY_NOMENCLATURE"
+    INACTION_NOMENCLATURE_DEPARTMENT = "INACTION_NOMENCLATURE_DEPARTMENT"
+    INACTION_DESTRUCTION_ACT = "INACTION_DESTRUCTION_ACT"
+    INACTION_ACCEPTANCE_INVENTORY = "INACTION_ACCEPTANCE_INVENTORY"
+    DEADLINE_CONTRACT_DURATION_END = "DEADLINE_CONTRACT_DURATION_END"
+    DEADLINE_EXECUTION_DOCUMENT_CONTROL_POINT = (
+        "DEADLINE_EXECUTION_DOCUMENT_CONTROL_POINT"
+    )
+
+
+class RemindersRulesDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[Id | None, Field(description="Тип напоминания")] = None
+    organizationId: Annotated[str | None, Field(description="Id организации")] = None
+    cron: Annotated[str | None, Field(description="Время в cron формате")] = None
+    plainDate: Annotated[
+        datetime | None, Field(description="Следующая дата запуска")
+    ] = None
+    days: Annotated[int | None, Field(description="Количество дней до напоминания")] = (
+        None
+    )
+    active: Annotated[bool | None, Field(description="Признак активности")] = None
+    subject: Annotated[str | None, Field(description="Тема напоминания")] = None
+    text: Annotated[str | None, Field(description="Текст напоминания")] = None
+    ignoreWeekends: Annotated[
+        bool | None, Field(description="Признак игнорирования по выходным дням")
+    ] = None
+
@@ -0,0 +1,83 @@
+# src/edms_assistant/infrastructure/resources_openapi/nastroechnyi_spravochnik_modulia.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    ArchiveFundDto,
+    AttachmentDto,
+    DocumentLanguageDto,
+    EmployeeDto,
+    UnifiedDocumentationSystemDto,
+)
+
+
+class NomenclatureArchiveConfigRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        str | None,
+        Field(
+            description="Идентификатор ответственного за настроечный справочник модуля"
+        ),
+    ] = None
+    archivistId: Annotated[
+        UUID,
+        Field(
+            description="Идентификатор ответственного за настроечный справочник модуля"
+        ),
+    ]
+    documentLanguageId: Annotated[
+        UUID, Field(description="Идентификатор языка документа")
+    ]
+    documentClassesId: Annotated[
+        UUID, Field(description="Идентификатор класса документа")
+    ]
+    fundId: Annotated[UUID, Field(description="Идентификатор фонда")]
+    countPage: Annotated[int, Field(description="Количество страниц в томе")]
+
+
+class NomenclatureArchiveConfigDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        str | None, Field(description="Идентификатор настроечного справочника модуля")
+    ] = None
+    archivistId: Annotated[
+        UUID | None,
+        Field(
+            description="Идентификатор ответственного за настроечный справочник модуля"
+        ),
+    ] = None
+    archivist: EmployeeDto | None = None
+    documentLanguageId: Annotated[
+        UUID | None, Field(description="Идентификатор языка документа")
+    ] = None
+    documentLanguage: DocumentLanguageDto | None = None
+    documentClassesId: Annotated[
+        UUID | None, Field(description="Идентификатор класса документа")
+    ] = None
+    documentClasses: UnifiedDocumentationSystemDto | None = None
+    fundId: Annotated[UUID | None, Field(description="Идентификатор фонда")] = None
+    fund: Annotated[ArchiveFundDto | None, Field(description="Фонд")] = None
+    countPage: Annotated[int | None, Field(description="Количество страниц в томе")] = (
+        None
+    )
+    attachment: Annotated[
+        AttachmentDto | None,
+        Field(description="Файл шаблона печатной формы для сводной номенклутуры"),
+    ] = None
+    actDestructionAttachment: Annotated[
+        AttachmentDto | None,
+        Field(description="Файл шаблона печатной формы для акта уничтожения"),
+    ] = None
+
@@ -0,0 +1,132 @@
+# src/edms_assistant/infrastructure/resources_openapi/nastroika_dlia_migratsii_dokumentov_spravochnikov.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    CitizenTypeDto,
+    DeliveryMethodDto,
+    DepartmentDto,
+    DocumentProfileDto,
+    EmployeeDto,
+    StoragePeriodDto,
+)
+
+
+class MigrationSetupDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    organizationId: Annotated[
+        str | None,
+        Field(description="Идентификатор организации настройки миграции СЭД"),
+    ] = None
+    internProfileId: Annotated[
+        UUID | None, Field(description="Идентификатор профиля внутреннего документа")
+    ] = None
+    internProfile: Annotated[
+        DocumentProfileDto | None, Field(description="Профиль внутреннего документа")
+    ] = None
+    incomingProfileId: Annotated[
+        UUID | None, Field(description="Идентификатор профиля входящего документа")
+    ] = None
+    incomingProfile: Annotated[
+        DocumentProfileDto | None, Field(description="Профиль входящего документа")
+    ] = None
+    outgoingProfileId: Annotated[
+        UUID | None, Field(description="Идентификатор профиля исходящего документа")
+    ] = None
+    outgoingProfile: Annotated[
+        DocumentProfileDto | None, Field(description="Профиль исходящего документа")
+    ] = None
+    appealProfileId: Annotated[
+        UUID | None, Field(description="Идентификатор профиля документа обращения")
+    ] = None
+    appealProfile: Annotated[
+        DocumentProfileDto | None, Field(description="Профиль документа обращения")
+    ] = None
+    citizenTypeId: Annotated[
+        UUID | None, Field(description="Идентификатор вида обращения")
+    ] = None
+    citizenType: Annotated[
+        CitizenTypeDto | None, Field(description="Вид обращения")
+    ] = None
+    appealEmployeeId: Annotated[
+        UUID | None, Field(description="Идентификатор автора для документа обращения")
+    ] = None
+    appealEmployee: Annotated[
+        EmployeeDto | None, Field(description="Автор для документа обращения")
+    ] = None
+    documentRecipientDeliveryMethodId: Annotated[
+        int | None, Field(description="Идентификатор способа доставки для адресатов")
+    ] = None
+    documentRecipientDeliveryMethod: Annotated[
+        DeliveryMethodDto | None, Field(description="Способ доставки для адресатов")
+    ] = None
+    documentDeliveryMethodId: Annotated[
+        int | None, Field(description="Идентификатор способа доставки для документов")
+    ] = None
+    documentDeliveryMethod: Annotated[
+        DeliveryMethodDto | None, Field(description="Способ доставки для документов")
+    ] = None
+    correspondentDeliveryMethodId: Annotated[
+        int | None,
+        Field(
+            description="Идентификатор способа доставки для справочника адресатов/корреспондентов"
+        ),
+    ] = None
+    correspondentDeliveryMethod: Annotated[
+        DeliveryMethodDto | None,
+        Field(description="Способ доставки для справочника адресатов/корреспондентов"),
+    ] = None
+    employeeDepartmentId: Annotated[
+        UUID | None,
+        Field(
+            description="Идентификатор департамента для пользователя (будет выбран при создании нового пользователя)"
+        ),
+    ] = None
+    employeeDepartment: Annotated[
+        DepartmentDto | None,
+        Field(
+            description="Департамент для пользователя (будет выбран при создании нового пользователя)"
+        ),
+    ] = None
+    nomenclatureAffairDepartmentId: Annotated[
+        UUID | None,
+        Field(description="Идентификатор департамента для номенклатуры дел"),
+    ] = None
+    nomenclatureAffairDepartment: Annotated[
+        DepartmentDto | None, Field(description="Департамент для номенклатуры дел")
+    ] = None
+    storagePeriodId: Annotated[
+        UUID | None,
+        Field(description="Идентификатор срока хранения для номенклатуры дел"),
+    ] = None
+    storagePeriod: Annotated[
+        StoragePeriodDto | None, Field(description="Срок хранения для номенклатуры дел")
+    ] = None
+    defaultEmployeeId: Annotated[
+        UUID | None, Field(description="Идентификатор пользователя по умолчания")
+    ] = None
+    defaultEmployee: Annotated[
+        EmployeeDto | None, Field(description="Пользователь по умолчанию")
+    ] = None
+
+
+class SliceDtoMigrationSetupDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[MigrationSetupDto] | None = None
+
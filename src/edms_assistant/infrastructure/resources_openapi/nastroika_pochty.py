@@ -0,0 +1,34 @@
+# src/edms_assistant/infrastructure/resources_openapi/nastroika_pochty.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class MailSetupDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    organizationId: Annotated[
+        str | None, Field(description="Идентификатор организации настройки почты")
+    ] = None
+    organizationName: Annotated[
+        str | None, Field(description="Наименование организации настройки почты")
+    ] = None
+    mailServer: Annotated[str | None, Field(description="Почтовый сервер (ip)")] = None
+    port: Annotated[str | None, Field(description="Порт")] = None
+    mailbox: Annotated[str | None, Field(description="Почтовый ящик")] = None
+    mailboxTo: Annotated[
+        str | None,
+        Field(description="Почтовый ящик на который отправлять тестовое письмо"),
+    ] = None
+    ssl: Annotated[bool | None, Field(description="Протокол")] = None
+    password: Annotated[str | None, Field(description="Пароль")] = None
+
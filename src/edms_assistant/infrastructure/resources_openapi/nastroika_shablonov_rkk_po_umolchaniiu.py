@@ -0,0 +1,24 @@
+# src/edms_assistant/infrastructure/resources_openapi/nastroika_shablonov_rkk_po_umolchaniiu.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class TemplateRkkSetupRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    templateInternId: UUID | None = None
+    templateIncomingId: UUID | None = None
+    templateOutgoingId: UUID | None = None
+    templateAppealId: UUID | None = None
+    templateContractId: UUID | None = None
+
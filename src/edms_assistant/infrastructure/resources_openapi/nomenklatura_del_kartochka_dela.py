@@ -0,0 +1,170 @@
+# src/edms_assistant/infrastructure/resources_openapi/nomenklatura_del_kartochka_dela.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    GroupByStoragePeriod,
+    NomenclatureAffairDto,
+    StoragePeriodType2,
+    SummaryNomenclatureDepartmentRequest,
+)
+
+
+class NomenclatureAffairShelvingShelveRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    shelvingShelveId: UUID | None = None
+    information: str | None = None
+
+
+class CertificationSheetRequest(SummaryNomenclatureDepartmentRequest):
+    pass
+
+
+class CaseFileCoverRequest(SummaryNomenclatureDepartmentRequest):
+    pass
+
+
+class MiniDocumentAffairRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    ids: list[UUID] | None = None
+    toAffairId: UUID | None = None
+
+
+class NomenclatureAffairExpirationRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    expirationDate: int
+
+
+class NomenclatureAffairExpertiseRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    expertise: bool
+
+
+class NomenclatureAffairCompletedRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    completed: bool | None = None
+
+
+class CopyAffairWrapperUUID(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    ids: list[UUID] | None = None
+    active: bool | None = None
+    refreshDepPath: bool | None = None
+
+
+class CopyAffairWrapperInteger(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    ids: list[int] | None = None
+    active: bool | None = None
+    refreshDepPath: bool | None = None
+
+
+class NomenclatureAffairOperationCopyDepDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    calendarYear: Annotated[int | None, Field(description="Календарный год")] = None
+    departmentId: Annotated[
+        UUID | None, Field(description="Идентификатор департамента")
+    ] = None
+    excludedIds: Annotated[
+        list[UUID] | None, Field(description="Исключающие записи")
+    ] = None
+
+
+class Operation2(Enum):
+    NOMENCLATURE_AFFAIR_READ = "NOMENCLATURE_AFFAIR_READ"
+    NOMENCLATURE_AFFAIR_UPDATE = "NOMENCLATURE_AFFAIR_UPDATE"
+    NOMENCLATURE_AFFAIR_DELETE = "NOMENCLATURE_AFFAIR_DELETE"
+    NOMENCLATURE_AFFAIR_PRINT_CASE_FILE_COVER = (
+        "NOMENCLATURE_AFFAIR_PRINT_CASE_FILE_COVER"
+    )
+    NOMENCLATURE_AFFAIR_PRINT_CERTIFICATION_SHEET = (
+        "NOMENCLATURE_AFFAIR_PRINT_CERTIFICATION_SHEET"
+    )
+    NOMENCLATURE_AFFAIR_DOCUMENT_CREATE = "NOMENCLATURE_AFFAIR_DOCUMENT_CREATE"
+    NOMENCLATURE_AFFAIR_DOCUMENT_ACCESS = "NOMENCLATURE_AFFAIR_DOCUMENT_ACCESS"
+
+
+class NomenclatureAffairPermission(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    operation: Operation2 | None = None
+    employees: Annotated[set[UUID] | None, Field()] = None
+
+
+class StatusEnum2(Enum):
+    FORMING = "FORMING"
+    COMPLETED = "COMPLETED"
+    CLOSED = "CLOSED"
+    ARCHIVE = "ARCHIVE"
+    DESTROYED = "DESTROYED"
+
+
+class Include11(Enum):
+    PERIOD = "PERIOD"
+    DEPARTMENT = "DEPARTMENT"
+    INNER_INVENTORY = "INNER_INVENTORY"
+    SHELVING_SHELVE = "SHELVING_SHELVE"
+    FUND = "FUND"
+
+
+class NomenclatureAffairFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    departmentId: UUID | None = None
+    year: int | None = None
+    expiration: bool | None = None
+    expirationDate: int | None = None
+    expirationDates: list[int] | None = None
+    years: list[int] | None = None
+    active: bool | None = None
+    name: str | None = None
+    personnel: bool | None = None
+    status: list[StatusEnum2] | None = None
+    groupByStoragePeriod: list[GroupByStoragePeriod] | None = None
+    storagePeriodType: list[StoragePeriodType2] | None = None
+    miniDocSearch: str | None = None
+    fundId: UUID | None = None
+    notExistsInDestructionAct: bool | None = None
+    includes: list[Include11] | None = None
+
+
+class NomenclatureAffairDeleteRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    years: list[int] | None = None
+    personnel: bool | None = None
+    periods: list[GroupByStoragePeriod] | None = None
+
+
+class CopyAffairWrapperNomenclatureAffairOperationCopyDepDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    ids: list[NomenclatureAffairOperationCopyDepDto] | None = None
+    active: bool | None = None
+    refreshDepPath: bool | None = None
+
+
+class NomenclatureAffairWithPermission(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    nomenclatureAffair: NomenclatureAffairDto | None = None
+    permission: list[NomenclatureAffairPermission] | None = None
+
@@ -0,0 +1,38 @@
+# src/edms_assistant/infrastructure/resources_openapi/nomenklaturnye_stellazhi_i_polki.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class NomenclatureShelvingShelveRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID
+    fundId: UUID
+    shelvingName: str
+    shelveName: str
+    active: bool
+
+
+class Include6(Enum):
+    ARCHIVE_FUND = "ARCHIVE_FUND"
+
+
+class NomenclatureShelvingShelveFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    fundId: UUID | None = None
+    fundIds: list[UUID] | None = None
+    includes: list[Include6] | None = None
+    search: str | None = None
+    active: bool | None = None
+
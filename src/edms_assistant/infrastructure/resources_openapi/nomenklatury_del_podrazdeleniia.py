@@ -0,0 +1,276 @@
+# src/edms_assistant/infrastructure/resources_openapi/nomenklatury_del_podrazdeleniia.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    IdsLong,
+    NomenclatureDepartmentDto,
+    NomenclatureDepartmentProcessDto,
+    Status8,
+    SummaryNomenclatureDepartmentProcessAction,
+    UserInfoDto,
+)
+
+
+class OperationType(Enum):
+    """
+    Тип операции
+    """
+
+    NOMENCLATURE_DEPARTMENT_READ = "NOMENCLATURE_DEPARTMENT_READ"
+    NOMENCLATURE_DEPARTMENT_MAIN_FIELDS_UPDATE = (
+        "NOMENCLATURE_DEPARTMENT_MAIN_FIELDS_UPDATE"
+    )
+    NOMENCLATURE_DEPARTMENT_TABLE_UPDATE = "NOMENCLATURE_DEPARTMENT_TABLE_UPDATE"
+    NOMENCLATURE_DEPARTMENT_PROCESS_EXECUTORS_UPDATE = (
+        "NOMENCLATURE_DEPARTMENT_PROCESS_EXECUTORS_UPDATE"
+    )
+    NOMENCLATURE_DEPARTMENT_PROCESS_ITEM_UPDATE = (
+        "NOMENCLATURE_DEPARTMENT_PROCESS_ITEM_UPDATE"
+    )
+    NOMENCLATURE_DEPARTMENT_START = "NOMENCLATURE_DEPARTMENT_START"
+    NOMENCLATURE_DEPARTMENT_SIGNING = "NOMENCLATURE_DEPARTMENT_SIGNING"
+    NOMENCLATURE_DEPARTMENT_AGREEMENT = "NOMENCLATURE_DEPARTMENT_AGREEMENT"
+    NOMENCLATURE_DEPARTMENT_SIGNING_ECP = "NOMENCLATURE_DEPARTMENT_SIGNING_ECP"
+    NOMENCLATURE_DEPARTMENT_DELETE_ECP = "NOMENCLATURE_DEPARTMENT_DELETE_ECP"
+    NOMENCLATURE_DEPARTMENT_DELETE = "NOMENCLATURE_DEPARTMENT_DELETE"
+    NOMENCLATURE_DEPARTMENT_CANCEL = "NOMENCLATURE_DEPARTMENT_CANCEL"
+
+
+class NomDepOperation(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    operationType: Annotated[OperationType, Field(description="Тип операции")]
+    body: Annotated[Any | None, Field(description="Тело операции")] = None
+
+
+class Type19(Enum):
+    """
+    Тип этапа процесса
+    """
+
+    NEW = "NEW"
+    AGREEMENT = "AGREEMENT"
+    SIGNING = "SIGNING"
+
+
+class NumDepSimpleProcessAction(SummaryNomenclatureDepartmentProcessAction):
+    pass
+
+
+class NomenclatureDepartmentRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    indexPrefix: str | None = None
+    departmentId: UUID
+    calendarYear: int | None = None
+
+
+class Include7(Enum):
+    DEPARTMENT = "DEPARTMENT"
+    NOMENCLATURE_DEPARTMENT_DATA = "NOMENCLATURE_DEPARTMENT_DATA"
+
+
+class NomenclatureDepartmentFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    search: str | None = None
+    statuses: list[Status8] | None = None
+    excludeStatuses: list[Status8] | None = None
+    departmentId: UUID | None = None
+    calendarYearStart: int | None = None
+    calendarYearEnd: int | None = None
+    calendarYears: list[int] | None = None
+    calendarYear: int | None = None
+    departmentIds: list[UUID] | None = None
+    includes: list[Include7] | None = None
+    currentUserExecutor: bool | None = None
+
+
+class Operation1(Enum):
+    """
+    Перечисления доступных операций над сущностями в номенклатуре подразделений
+    """
+
+    NOMENCLATURE_DEPARTMENT_READ = "NOMENCLATURE_DEPARTMENT_READ"
+    NOMENCLATURE_DEPARTMENT_MAIN_FIELDS_UPDATE = (
+        "NOMENCLATURE_DEPARTMENT_MAIN_FIELDS_UPDATE"
+    )
+    NOMENCLATURE_DEPARTMENT_TABLE_UPDATE = "NOMENCLATURE_DEPARTMENT_TABLE_UPDATE"
+    NOMENCLATURE_DEPARTMENT_PROCESS_EXECUTORS_UPDATE = (
+        "NOMENCLATURE_DEPARTMENT_PROCESS_EXECUTORS_UPDATE"
+    )
+    NOMENCLATURE_DEPARTMENT_PROCESS_ITEM_UPDATE = (
+        "NOMENCLATURE_DEPARTMENT_PROCESS_ITEM_UPDATE"
+    )
+    NOMENCLATURE_DEPARTMENT_START = "NOMENCLATURE_DEPARTMENT_START"
+    NOMENCLATURE_DEPARTMENT_SIGNING = "NOMENCLATURE_DEPARTMENT_SIGNING"
+    NOMENCLATURE_DEPARTMENT_AGREEMENT = "NOMENCLATURE_DEPARTMENT_AGREEMENT"
+    NOMENCLATURE_DEPARTMENT_SIGNING_ECP = "NOMENCLATURE_DEPARTMENT_SIGNING_ECP"
+    NOMENCLATURE_DEPARTMENT_DELETE_ECP = "NOMENCLATURE_DEPARTMENT_DELETE_ECP"
+    NOMENCLATURE_DEPARTMENT_DELETE = "NOMENCLATURE_DEPARTMENT_DELETE"
+    NOMENCLATURE_DEPARTMENT_CANCEL = "NOMENCLATURE_DEPARTMENT_CANCEL"
+
+
+class NomenclatureDepartmentPermission(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    operation: Annotated[
+        Operation1 | None,
+        Field(
+            description="Перечисления доступных операций над сущностями в номенклатуре подразделений"
+        ),
+    ] = None
+    employees: Annotated[set[UUID] | None, Field()] = None
+
+
+class ActionType1(Enum):
+    CREATED = "CREATED"
+    MAIN_FIELDS_UPDATE = "MAIN_FIELDS_UPDATE"
+    PROCESS_ITEM_EXECUTORS_UPDATE = "PROCESS_ITEM_EXECUTORS_UPDATE"
+    PROCESS_ITEM_UPDATE = "PROCESS_ITEM_UPDATE"
+    ENTRY_DATA_UPDATE = "ENTRY_DATA_UPDATE"
+    REJECT = "REJECT"
+    PROCESS_START = "PROCESS_START"
+    PROCESS_FINISH = "PROCESS_FINISH"
+    STEP_START = "STEP_START"
+    STEP_END = "STEP_END"
+    ACTION = "ACTION"
+    CANCELED = "CANCELED"
+
+
+class NomDepHistoryActionData(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    actionType: ActionType1 | None = None
+    data: dict[str, Any] | None = None
+
+
+class IdsInteger(IdsLong):
+    """
+    Список идентификаторов
+    """
+
+
+class NomenclatureDepartmentProcessExecutorDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None,
+        Field(
+            description="Идентификатор исполнителя процесса в номенклатуре дел подразделения"
+        ),
+    ] = None
+    start: Annotated[datetime | None, Field(description="Дата начала исполнения")] = (
+        None
+    )
+    executionEnd: Annotated[
+        datetime | None, Field(description="Дата окончания исполнения")
+    ] = None
+    end: Annotated[datetime | None, Field(description="Дата окончания исполнения")] = (
+        None
+    )
+    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
+        None
+    )
+    processItemId: Annotated[
+        UUID | None, Field(description="Идентификатор этапа процесса")
+    ] = None
+    item: Annotated[
+        NomenclatureDepartmentProcessItemDto | None, Field(description="Этап процесса")
+    ] = None
+    comment: Annotated[str | None, Field(description="Комментарий")] = None
+    result: Annotated[
+        bool | None, Field(description="Признак результата исполнения")
+    ] = None
+    executor: Annotated[UserInfoDto | None, Field(description="Исполнитель")] = None
+    nomenclatureDepartmentId: Annotated[
+        UUID | None, Field(description="Идентификатор номенклатуры дел подразделения")
+    ] = None
+    nomenclatureDepartment: Annotated[
+        NomenclatureDepartmentDto | None,
+        Field(description="Номенклатура дел подразделения"),
+    ] = None
+
+
+class NomenclatureDepartmentProcessItemDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор этапа процесса")] = None
+    type: Annotated[Type19 | None, Field(description="Тип этапа процесса")] = None
+    order: Annotated[int | None, Field(description="Порядковый номер")] = None
+    startStamp: Annotated[
+        datetime | None, Field(description="Дата начала этапа процесса")
+    ] = None
+    endStamp: Annotated[
+        datetime | None, Field(description="Дата окончания этапа процесса")
+    ] = None
+    completed: Annotated[
+        bool | None, Field(description="Признак был ли завершен этап процесса")
+    ] = None
+    started: Annotated[
+        bool | None,
+        Field(description="Признак был ли начаты действия по этапу процесса"),
+    ] = None
+    oneForAll: Annotated[
+        bool | None, Field(description="Признак исполнения за всех")
+    ] = None
+    executors: Annotated[
+        list[NomenclatureDepartmentProcessExecutorDto] | None,
+        Field(description="Список исполнителей этапа процесса"),
+    ] = None
+    processId: Annotated[UUID | None, Field(description="Идентификатор процесса")] = (
+        None
+    )
+    process: Annotated[
+        NomenclatureDepartmentProcessDto | None, Field(description="Процесс документа")
+    ] = None
+    executorsCount: Annotated[int | None, Field(description="Кол-во исполнителей")] = (
+        None
+    )
+    nomenclatureDepartmentId: Annotated[
+        UUID | None, Field(description="Идентификатор номенклатуры дел подразделения")
+    ] = None
+    nomenclatureDepartment: Annotated[
+        NomenclatureDepartmentDto | None,
+        Field(description="Номенклатура дел подразделения"),
+    ] = None
+
+
+class NomenclatureDepartmentHistoryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None,
+        Field(description="Идентификатор истории номенклатуры подразделения"),
+    ] = None
+    nomenclatureDepartmentId: Annotated[
+        UUID | None, Field(description="Идентификатор номенклатуры подразделения")
+    ] = None
+    nomenclatureDepartment: NomenclatureDepartmentDto | None = None
+    author: Annotated[
+        UserInfoDto | None, Field(description="Сотрудник который выполнил действие")
+    ] = None
+    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
+    data: Annotated[
+        list[NomDepHistoryActionData] | None, Field(description="Данные об изменении")
+    ] = None
+
+
+class NomenclatureDepartmentWithPermission(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    nomenclature: NomenclatureDepartmentDto | None = None
+    permission: list[NomenclatureDepartmentPermission] | None = None
+
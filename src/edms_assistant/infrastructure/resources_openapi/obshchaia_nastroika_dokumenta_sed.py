@@ -0,0 +1,75 @@
+# src/edms_assistant/infrastructure/resources_openapi/obshchaia_nastroika_dokumenta_sed.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    Attachment,
+    ExecutionDateRoundPolicy,
+    GeneralSetupDto,
+)
+
+
+class GeneralSetupRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    organizationName: Annotated[
+        str | None,
+        Field(description="Наименование организации общей настройки документа СЭД"),
+    ] = None
+    countryId: Annotated[UUID | None, Field(description="Идентификатор страны")] = None
+    profileId: Annotated[
+        UUID | None, Field(description="Идентификатор профиля документа")
+    ] = None
+    aismvProfileId: UUID | None = None
+    aismvAppealProfileId: UUID | None = None
+    aismvAuthorEmployeeId: UUID | None = None
+    employeeId: Annotated[
+        UUID | None, Field(description="Идентификатор сотрудника")
+    ] = None
+    groupId: Annotated[
+        UUID | None, Field(description="Идентификатор группы пользователей")
+    ] = None
+    subscriberId: UUID | None = None
+    classDoc: Annotated[
+        str | None,
+        Field(
+            description="Унифицированный код из окрб 010-95 таблица 1 (https://minjust.gov.by/upload/iblock/d97/OKRB.pdf)"
+        ),
+    ] = None
+    objectType: Annotated[
+        str | None,
+        Field(
+            description="Вид по таблицы 2 окб (https://minjust.gov.by/upload/iblock/d97/OKRB.pdf)"
+        ),
+    ] = None
+    disableSignedFilEdit: bool | None = None
+    enableRemoveDraftDocs: bool | None = None
+    daysToKeepDraftDocs: int | None = None
+    executionDateRoundPolicy: ExecutionDateRoundPolicy | None = None
+    defaultProcessDateRoundPolicy: ExecutionDateRoundPolicy | None = None
+    workDayStart: Annotated[
+        str | None, Field(description="Продолжительность рабочего дня")
+    ] = None
+    workDayEnd: str | None = None
+    signAttachment: Attachment | None = None
+
+
+class SliceDtoGeneralSetupDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[GeneralSetupDto] | None = None
+
@@ -0,0 +1,218 @@
+# src/edms_assistant/infrastructure/resources_openapi/opis_strukturnykh_podrazdelenii_opis_sp.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    AcceptanceInventoryDataDto,
+    GroupByStoragePeriod,
+    InnerInventoryDataDto,
+    JobStatus,
+    NomenclatureDepartmentCancelRequest,
+    Status,
+    StoragePeriodType2,
+    StoreAttribute,
+    SummaryNomenclatureDepartmentProcessAction,
+    UserInfoDto,
+)
+
+
+class AcceptanceInventoryProcessAction(SummaryNomenclatureDepartmentProcessAction):
+    pass
+
+
+class AcceptanceInventoryCancelRequest(NomenclatureDepartmentCancelRequest):
+    pass
+
+
+class AcceptanceInventoryDataRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    ids: list[UUID] | None = None
+    years: list[int] | None = None
+    title: str | None = None
+    index: str | None = None
+    description: str | None = None
+    date: datetime | None = None
+    storagePeriodType: StoragePeriodType2 | None = None
+    groupByStoragePeriod: GroupByStoragePeriod | None = None
+    personnel: bool | None = None
+    ignoreErrors: bool | None = None
+
+
+class OperationType4(Enum):
+    """
+    Тип операции
+    """
+
+    ACCEPTANCE_INVENTORY_READ = "ACCEPTANCE_INVENTORY_READ"
+    ACCEPTANCE_INVENTORY_UPDATE = "ACCEPTANCE_INVENTORY_UPDATE"
+    ACCEPTANCE_INVENTORY_PROCESS_EXECUTORS_UPDATE = (
+        "ACCEPTANCE_INVENTORY_PROCESS_EXECUTORS_UPDATE"
+    )
+    ACCEPTANCE_INVENTORY_PROCESS_ITEM_UPDATE = (
+        "ACCEPTANCE_INVENTORY_PROCESS_ITEM_UPDATE"
+    )
+    ACCEPTANCE_INVENTORY_START = "ACCEPTANCE_INVENTORY_START"
+    ACCEPTANCE_INVENTORY_SIGNING = "ACCEPTANCE_INVENTORY_SIGNING"
+    ACCEPTANCE_INVENTORY_STATEMENT = "ACCEPTANCE_INVENTORY_STATEMENT"
+    ACCEPTANCE_INVENTORY_AGREEMENT = "ACCEPTANCE_INVENTORY_AGREEMENT"
+    ACCEPTANCE_INVENTORY_CANCEL = "ACCEPTANCE_INVENTORY_CANCEL"
+    ACCEPTANCE_INVENTORY_DISPATCH = "ACCEPTANCE_INVENTORY_DISPATCH"
+
+
+class AcceptanceInventoryOperation(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    operationType: Annotated[OperationType4, Field(description="Тип операции")]
+    body: Annotated[Any | None, Field(description="Тело операции")] = None
+
+
+class AcceptanceKanclerArchiveRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    ids: Annotated[list[UUID], Field(min_items=1)]
+    fundId: UUID
+
+
+class Include20(Enum):
+    DEPARTMENT = "DEPARTMENT"
+    PROCESS = "PROCESS"
+
+
+class AcceptanceInventoryDataFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    jobStatus: JobStatus | None = None
+    storeAttribute: StoreAttribute | None = None
+    ids: list[UUID] | None = None
+    search: str | None = None
+    statuses: list[Status] | None = None
+    excludeStatuses: list[Status] | None = None
+    departmentId: UUID | None = None
+    calendarYearStart: int | None = None
+    calendarYearEnd: int | None = None
+    calendarYears: list[int] | None = None
+    calendarYear: int | None = None
+    departmentIds: list[UUID] | None = None
+    includes: list[Include20] | None = None
+    currentUserExecutor: bool | None = None
+
+
+class Operation6(Enum):
+    """
+    Перечисления доступных операций над сущностями в СП
+    """
+
+    ACCEPTANCE_INVENTORY_READ = "ACCEPTANCE_INVENTORY_READ"
+    ACCEPTANCE_INVENTORY_UPDATE = "ACCEPTANCE_INVENTORY_UPDATE"
+    ACCEPTANCE_INVENTORY_PROCESS_EXECUTORS_UPDATE = (
+        "ACCEPTANCE_INVENTORY_PROCESS_EXECUTORS_UPDATE"
+    )
+    ACCEPTANCE_INVENTORY_PROCESS_ITEM_UPDATE = (
+        "ACCEPTANCE_INVENTORY_PROCESS_ITEM_UPDATE"
+    )
+    ACCEPTANCE_INVENTORY_START = "ACCEPTANCE_INVENTORY_START"
+    ACCEPTANCE_INVENTORY_SIGNING = "ACCEPTANCE_INVENTORY_SIGNING"
+    ACCEPTANCE_INVENTORY_STATEMENT = "ACCEPTANCE_INVENTORY_STATEMENT"
+    ACCEPTANCE_INVENTORY_AGREEMENT = "ACCEPTANCE_INVENTORY_AGREEMENT"
+    ACCEPTANCE_INVENTORY_CANCEL = "ACCEPTANCE_INVENTORY_CANCEL"
+    ACCEPTANCE_INVENTORY_DISPATCH = "ACCEPTANCE_INVENTORY_DISPATCH"
+
+
+class AcceptanceInventoryPermission(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    operation: Annotated[
+        Operation6 | None,
+        Field(description="Перечисления доступных операций над сущностями в СП"),
+    ] = None
+    employees: Annotated[set[UUID] | None, Field()] = None
+
+
+class ActionType4(Enum):
+    CREATED = "CREATED"
+    MAIN_FIELDS_UPDATE = "MAIN_FIELDS_UPDATE"
+    PROCESS_ITEM_EXECUTORS_UPDATE = "PROCESS_ITEM_EXECUTORS_UPDATE"
+    PROCESS_ITEM_UPDATE = "PROCESS_ITEM_UPDATE"
+    REJECT = "REJECT"
+    CANCELED = "CANCELED"
+    PROCESS_START = "PROCESS_START"
+    PROCESS_FINISH = "PROCESS_FINISH"
+    STEP_START = "STEP_START"
+    STEP_END = "STEP_END"
+    ACTION = "ACTION"
+    INCORRECT_DISPATCH = "INCORRECT_DISPATCH"
+    DISPATCHED = "DISPATCHED"
+    ERROR_DISPATCH = "ERROR_DISPATCH"
+    FATAL_ERROR_DISPATCH = "FATAL_ERROR_DISPATCH"
+    SIGN = "SIGN"
+    SIGN_ATTACHMENT = "SIGN_ATTACHMENT"
+    DELETE_SIGN_ATTACHMENT = "DELETE_SIGN_ATTACHMENT"
+    DECONVERSION = "DECONVERSION"
+    CONVERSION = "CONVERSION"
+    INIT_DISPATCH = "INIT_DISPATCH"
+    CREATE_FILE_INVENTORY = "CREATE_FILE_INVENTORY"
+    DELETE_FILE_INVENTORY = "DELETE_FILE_INVENTORY"
+
+
+class AcceptanceInventoryHistoryActionData(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    actionType: ActionType4 | None = None
+    data: dict[str, Any] | None = None
+
+
+class AcceptanceInventoryHistoryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор истории СП")] = None
+    acceptanceInventoryId: Annotated[
+        UUID | None, Field(description="Идентификатор СП")
+    ] = None
+    acceptanceInventory: AcceptanceInventoryDataDto | None = None
+    author: Annotated[
+        UserInfoDto | None, Field(description="Сотрудник который выполнил действие")
+    ] = None
+    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
+    data: Annotated[
+        list[AcceptanceInventoryHistoryActionData] | None,
+        Field(description="Данные об изменении"),
+    ] = None
+
+
+class SliceDtoAcceptanceInventoryHistoryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[AcceptanceInventoryHistoryDto] | None = None
+
+
+class AcceptanceInventoryWithPermission(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    acceptanceInventory: AcceptanceInventoryDataDto | None = None
+    permission: list[AcceptanceInventoryPermission] | None = None
+
+
+class SliceDtoInnerInventoryDataDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[InnerInventoryDataDto] | None = None
+
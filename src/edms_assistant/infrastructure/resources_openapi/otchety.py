@@ -0,0 +1,238 @@
+# src/edms_assistant/infrastructure/resources_openapi/otchety.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    Column,
+    DocCategory,
+    Status2,
+    TaskStatus,
+    UserInfo,
+    UserInfoDto,
+)
+
+
+class Type28(Enum):
+    PDF = "PDF"
+    XLSX = "XLSX"
+    DOCX = "DOCX"
+
+
+class TaskOnStatusReportFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    type: Type28
+    inArchive: bool | None = None
+    dateTaskStart: datetime
+    dateTaskEnd: datetime
+    taskStatuses: list[TaskStatus]
+    taskAuthorId: UUID | None = None
+    taskExecutorId: UUID | None = None
+    taskResponsibleExecutorId: UUID | None = None
+    flagEndless: bool | None = None
+
+
+class Template1(Enum):
+    """
+    Перечисление для описания констант шаблонов отчета
+    """
+
+    DOCUMENT_IN_PROGRESS = "DOCUMENT_IN_PROGRESS"
+    DOCUMENT_ON_EXECUTION = "DOCUMENT_ON_EXECUTION"
+    CONSTRUCTOR = "CONSTRUCTOR"
+    TASK_CONTROL = "TASK_CONTROL"
+    DOCUMENT_ON_REGISTRATION = "DOCUMENT_ON_REGISTRATION"
+    DOCUMENT_ON_CONTROL = "DOCUMENT_ON_CONTROL"
+    DOCUMENT_ON_STATUS = "DOCUMENT_ON_STATUS"
+    TASK_ON_STATUS = "TASK_ON_STATUS"
+    TASK_ON_CONTROL = "TASK_ON_CONTROL"
+    VOLUME_OF_DOCUMENT_FLOW = "VOLUME_OF_DOCUMENT_FLOW"
+    PERFORMING_DISCIPLINE = "PERFORMING_DISCIPLINE"
+    RECEIVED_APPEALS = "RECEIVED_APPEALS"
+    COUNT_OF_EXECUTED_AND_UNEXECUTED_CONTROL_TASK = (
+        "COUNT_OF_EXECUTED_AND_UNEXECUTED_CONTROL_TASK"
+    )
+
+
+class TaskOnControlReportFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    type: Type28
+    inArchive: bool | None = None
+    dateControlStart: datetime
+    dateControlEnd: datetime
+    controlEmployeeId: UUID | None = None
+
+
+class DocumentOnStatusReportFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    type: Type28
+    inArchive: bool | None = None
+    docCategoryConstants: list[DocCategory]
+    status: list[Status2]
+    documentAuthorIds: list[UUID] | None = None
+    documentTypeIds: list[UUID] | None = None
+
+
+class DocumentOnRegistrationReportFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    type: Type28
+    inArchive: bool | None = None
+    dateRegStart: Annotated[
+        datetime, Field(description="Начальная дата регистрации документа")
+    ]
+    dateRegEnd: Annotated[
+        datetime, Field(description="Конечная дата регистрации документа")
+    ]
+    docCategoryConstants: list[DocCategory]
+
+
+class DocumentOnControlReportFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    type: Type28
+    inArchive: bool | None = None
+    dateControlStart: Annotated[
+        datetime, Field(description="Начальная дата контроля документа")
+    ]
+    dateControlEnd: Annotated[
+        datetime, Field(description="Конечная дата контроля документа")
+    ]
+    docCategoryConstants: list[DocCategory]
+    controlUserIds: list[UUID] | None = None
+
+
+class ReportConstructorDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    fields: Annotated[dict[str, str] | None, Field(description="Поля для отчета")] = (
+        None
+    )
+    columns: Annotated[list[Column] | None, Field(description="Колонки для отчета")] = (
+        None
+    )
+
+
+class ReportFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    dateStart: Annotated[
+        datetime | None, Field(description="Дата начала поиска сформированных отчетов")
+    ] = None
+    dateEnd: Annotated[
+        datetime | None,
+        Field(description="Дата окончания поиска сформированных отчетов"),
+    ] = None
+    template: Annotated[
+        Template1 | None,
+        Field(description="Перечисление для описания констант шаблонов отчета"),
+    ] = None
+    type: Type28 | None = None
+
+
+class DocumentOnExecutionReportFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    type: Type28
+    docCategoryConstants: list[DocCategory]
+    subAuthors: Annotated[
+        list[UUID] | None, Field(description="Список идентификаторов авторов документа")
+    ] = None
+    subExecutors: Annotated[
+        list[UUID] | None,
+        Field(description="Список идентификаторов исполнителей поручения"),
+    ] = None
+    subProcessExecutors: Annotated[
+        list[UUID] | None,
+        Field(description="Список идентификаторов исполнителей пройессов"),
+    ] = None
+    subControlUser: Annotated[
+        list[UUID] | None, Field(description="Список идентификаторов контролеров")
+    ] = None
+    subTaskControlUser: Annotated[
+        list[UUID] | None,
+        Field(description="Список идентификаторов контролеров поручений"),
+    ] = None
+
+
+class DocumentInProgressReportFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    type: Type28
+    docCategoryConstants: list[DocCategory]
+    statuses: list[Status2]
+    dateRegStart: Annotated[
+        datetime, Field(description="Начальная дата регистрации документа")
+    ]
+    dateRegEnd: Annotated[
+        datetime, Field(description="Конечная дата регистрации документа")
+    ]
+    executedCurrentProcess: Annotated[
+        list[UUID] | None,
+        Field(description="Идентификаторы исполнителей текущего процесса"),
+    ] = None
+    subAuthors: Annotated[
+        list[UUID] | None, Field(description="Список идентификаторов авторов документа")
+    ] = None
+    subExecutors: Annotated[
+        list[UUID] | None,
+        Field(description="Список идентификаторов исполнителей поручения"),
+    ] = None
+    subProcessExecutors: Annotated[
+        list[UUID] | None,
+        Field(description="Список идентификаторов исполнителей пройессов"),
+    ] = None
+    subControlUser: Annotated[
+        list[UUID] | None, Field(description="Список идентификаторов контролеров")
+    ] = None
+    subTaskControlUser: Annotated[
+        list[UUID] | None,
+        Field(description="Список идентификаторов контролеров поручений"),
+    ] = None
+
+
+class Report(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    author: UserInfo
+    template: Annotated[
+        Template1,
+        Field(description="Перечисление для описания констант шаблонов отчета"),
+    ]
+    type: Type28
+    createDate: datetime
+    size: int
+    originalName: str
+    bucketName: str | None = None
+    minioName: str
+
+
+class ReportDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор отчета")] = None
+    author: Annotated[UserInfoDto | None, Field(description="Автор отчета")] = None
+    template: Annotated[
+        Template1 | None,
+        Field(description="Перечисление для описания констант шаблонов отчета"),
+    ] = None
+    type: Type28 | None = None
+    createDate: Annotated[
+        datetime | None, Field(description="Дата создания отчета")
+    ] = None
+    size: Annotated[int | None, Field(description="Размер отчета")] = None
+    name: Annotated[str | None, Field(description="Наименование отчета")] = None
+
@@ -0,0 +1,48 @@
+# src/edms_assistant/infrastructure/resources_openapi/other.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import CorrespondentDto
+from .dokument import JsonNode
+
+
+class DocumentNomenclatureUpdate1(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    documentId: UUID | None = None
+    nomenclatureAffairId: UUID | None = None
+
+
+class ContractCorrespondentDto(JsonNode):
+    pass
+
+
+class DocumentNomenclatureUpdate(JsonNode):
+    pass
+
+
+class ContractCorrespondentDto1(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    correspondentId: UUID | None = None
+    documentId: UUID | None = None
+    documentOrganizationId: str | None = None
+    correspondent: CorrespondentDto | None = None
+    name: str
+    unp: str | None = None
+    signDate: datetime | None = None
+    order: int | None = None
+    contractNumber: str | None = None
+    contractDate: datetime | None = None
+
@@ -0,0 +1,32 @@
+# src/edms_assistant/infrastructure/resources_openapi/pechat_dostupa.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class DocumentCategory1(Enum):
+    INTERN = "INTERN"
+    INCOMING = "INCOMING"
+    OUTGOING = "OUTGOING"
+    MEETING = "MEETING"
+    QUESTION = "QUESTION"
+    MEETING_QUESTION = "MEETING_QUESTION"
+    APPEAL = "APPEAL"
+    CONTRACT = "CONTRACT"
+    ALL = "ALL"
+
+
+class DocumentCategoryFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    documentCategory: DocumentCategory1 | None = None
+
@@ -0,0 +1,20 @@
+# src/edms_assistant/infrastructure/resources_openapi/pechat_po_nomenklature_del.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import SummaryNomenclatureDepartmentRequest
+
+
+class InternalInventoryArchiveRequest(SummaryNomenclatureDepartmentRequest):
+    pass
+
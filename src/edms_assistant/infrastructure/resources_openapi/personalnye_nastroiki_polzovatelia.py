@@ -0,0 +1,211 @@
+# src/edms_assistant/infrastructure/resources_openapi/personalnye_nastroiki_polzovatelia.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    ContentType,
+    Localization,
+    ScanSettingJsonB,
+)
+
+
+class Id1(Enum):
+    DOC_CONTROL_START = "DOC_CONTROL_START"
+    DOC_CONTROL_END = "DOC_CONTROL_END"
+    DOC_CONTROL_DELETE = "DOC_CONTROL_DELETE"
+    DOC_CONTROL_EDIT_CONTROLLERS = "DOC_CONTROL_EDIT_CONTROLLERS"
+    TASK_CONTROL_START = "TASK_CONTROL_START"
+    TASK_CONTROL_END = "TASK_CONTROL_END"
+    TASK_CONTROL_REMOVE = "TASK_CONTROL_REMOVE"
+    TASK_CONTROL_EDIT_CONTROLLERS = "TASK_CONTROL_EDIT_CONTROLLERS"
+    TASK_CONTROL_AFTER_EXECUTION = "TASK_CONTROL_AFTER_EXECUTION"
+    TASK_FOR_REVISION = "TASK_FOR_REVISION"
+    TASK_CREATE = "TASK_CREATE"
+    TASK_EDIT = "TASK_EDIT"
+    TASK_EDIT_FOR_NEW = "TASK_EDIT_FOR_NEW"
+    TASK_REQUEST_CHANGE_PLANNED_DATE = "TASK_REQUEST_CHANGE_PLANNED_DATE"
+    TASK_CHANGE_PLANNED_DATE = "TASK_CHANGE_PLANNED_DATE"
+    TASK_DECLINE_CHANGE_PLANNED_DATE = "TASK_DECLINE_CHANGE_PLANNED_DATE"
+    TASK_AFTER_EXECUTION_ALL_FOR_DOC_CONTROL = (
+        "TASK_AFTER_EXECUTION_ALL_FOR_DOC_CONTROL"
+    )
+    TASK_AFTER_EXECUTION = "TASK_AFTER_EXECUTION"
+    EXECUTION_START = "EXECUTION_START"
+    REVIEW_START = "REVIEW_START"
+    REGISTRATION_START = "REGISTRATION_START"
+    REGISTRATION_END = "REGISTRATION_END"
+    INTRODUCTION_ADD = "INTRODUCTION_ADD"
+    AGREEMENT_START = "AGREEMENT_START"
+    AGREEMENT_END_SUCCESS = "AGREEMENT_END_SUCCESS"
+    AGREEMENT_END_REJECTED = "AGREEMENT_END_REJECTED"
+    ADDITIONAL_AGREEMENT_START = "ADDITIONAL_AGREEMENT_START"
+    ADDITIONAL_AGREEMENT_APPROVED = "ADDITIONAL_AGREEMENT_APPROVED"
+    ADDITIONAL_AGREEMENT_REJECTED = "ADDITIONAL_AGREEMENT_REJECTED"
+    SIGNING_START = "SIGNING_START"
+    SIGNING_END_SUCCESS = "SIGNING_END_SUCCESS"
+    SIGNING_END_REJECTED = "SIGNING_END_REJECTED"
+    STATEMENT_START = "STATEMENT_START"
+    STATEMENT_END_SUCCESS = "STATEMENT_END_SUCCESS"
+    STATEMENT_END_REJECTED = "STATEMENT_END_REJECTED"
+    DISPATCH_START = "DISPATCH_START"
+    DISPATCH_END = "DISPATCH_END"
+    DISPATCH_TO_EXTERNAL = "DISPATCH_TO_EXTERNAL"
+    DOCUMENT_REDIRECT_ON_REVIEW = "DOCUMENT_REDIRECT_ON_REVIEW"
+    MEETING_START = "MEETING_START"
+    MEETING_EDIT = "MEETING_EDIT"
+    MEETING_CANCEL = "MEETING_CANCEL"
+    ACCEPTANCE_START = "ACCEPTANCE_START"
+    MEETING_PAPERWORK_START = "MEETING_PAPERWORK_START"
+    ACCEPTANCE_END = "ACCEPTANCE_END"
+    ACCEPTANCE_END_REJECTED = "ACCEPTANCE_END_REJECTED"
+    MEETING_QUESTION = "MEETING_QUESTION"
+    AGREEMENT_QUESTION_END = "AGREEMENT_QUESTION_END"
+    AGREEMENT_QUESTION_END_REJECTED = "AGREEMENT_QUESTION_END_REJECTED"
+    STATEMENT_QUESTION_END = "STATEMENT_QUESTION_END"
+    STATEMENT_QUESTION_END_REJECTED = "STATEMENT_QUESTION_END_REJECTED"
+    TASK_PROJECT_CREATE = "TASK_PROJECT_CREATE"
+    DEADLINE_CONTROL_DOCUMENT = "DEADLINE_CONTROL_DOCUMENT"
+    DEADLINE_CONTROL_TASK = "DEADLINE_CONTROL_TASK"
+    DEADLINE_EXECUTION_PROCESS = "DEADLINE_EXECUTION_PROCESS"
+    DEADLINE_EXECUTION_TASK = "DEADLINE_EXECUTION_TASK"
+    DEADLINE_EXECUTION_DOCUMENT_CONTROL_POINT = (
+        "DEADLINE_EXECUTION_DOCUMENT_CONTROL_POINT"
+    )
+    INACTION_SUMMARY_NOMENCLATURE = "INACTION_SUMMARY_NOMENCLATURE"
+    INACTION_NOMENCLATURE_DEPARTMENT = "INACTION_NOMENCLATURE_DEPARTMENT"
+    INACTION_DESTRUCTION_ACT = "INACTION_DESTRUCTION_ACT"
+    INACTION_ACCEPTANCE_INVENTORY = "INACTION_ACCEPTANCE_INVENTORY"
+    DEADLINE_CONTRACT_DURATION_END = "DEADLINE_CONTRACT_DURATION_END"
+    INCOMING_NEW_AISMV_DOCUMENT = "INCOMING_NEW_AISMV_DOCUMENT"
+    AUTHOR_SMDO_DOCUMENT_ERROR = "AUTHOR_SMDO_DOCUMENT_ERROR"
+    AUTHOR_SMDO_ACCEPT_ACK_ERROR = "AUTHOR_SMDO_ACCEPT_ACK_ERROR"
+    AUTHOR_SMDO_REG_ACK_ERROR = "AUTHOR_SMDO_REG_ACK_ERROR"
+    AUTHOR_SMDO_REG_REJECT_ACK_ERROR = "AUTHOR_SMDO_REG_REJECT_ACK_ERROR"
+    REPORT_COMPLETE = "REPORT_COMPLETE"
+    REPORT_ERROR = "REPORT_ERROR"
+    REPORT_EMPTY = "REPORT_EMPTY"
+    NOTIFY_AUTHOR_INITIATE_SEND = "NOTIFY_AUTHOR_INITIATE_SEND"
+    NOMENCLATURE_DEPARTMENT_SIGNING_START = "NOMENCLATURE_DEPARTMENT_SIGNING_START"
+    NOMENCLATURE_DEPARTMENT_SIGNING_END_SUCCESS = (
+        "NOMENCLATURE_DEPARTMENT_SIGNING_END_SUCCESS"
+    )
+    NOMENCLATURE_DEPARTMENT_SIGNING_END_REJECTED = (
+        "NOMENCLATURE_DEPARTMENT_SIGNING_END_REJECTED"
+    )
+    NOMENCLATURE_DEPARTMENT_AGREEMENT_START = "NOMENCLATURE_DEPARTMENT_AGREEMENT_START"
+    NOMENCLATURE_DEPARTMENT_AGREEMENT_END_SUCCESS = (
+        "NOMENCLATURE_DEPARTMENT_AGREEMENT_END_SUCCESS"
+    )
+    NOMENCLATURE_DEPARTMENT_AGREEMENT_END_REJECTED = (
+        "NOMENCLATURE_DEPARTMENT_AGREEMENT_END_REJECTED"
+    )
+    SUMMARY_NOMENCLATURE_SIGNING_START = "SUMMARY_NOMENCLATURE_SIGNING_START"
+    SUMMARY_NOMENCLATURE_SIGNING_END_SUCCESS = (
+        "SUMMARY_NOMENCLATURE_SIGNING_END_SUCCESS"
+    )
+    SUMMARY_NOMENCLATURE_SIGNING_END_REJECTED = (
+        "SUMMARY_NOMENCLATURE_SIGNING_END_REJECTED"
+    )
+    SUMMARY_NOMENCLATURE_STATEMENT_START = "SUMMARY_NOMENCLATURE_STATEMENT_START"
+    SUMMARY_NOMENCLATURE_STATEMENT_END_SUCCESS = (
+        "SUMMARY_NOMENCLATURE_STATEMENT_END_SUCCESS"
+    )
+    SUMMARY_NOMENCLATURE_STATEMENT_END_REJECTED = (
+        "SUMMARY_NOMENCLATURE_STATEMENT_END_REJECTED"
+    )
+    SUMMARY_NOMENCLATURE_INTRODUCTION_ADD = "SUMMARY_NOMENCLATURE_INTRODUCTION_ADD"
+    DESTRUCTION_ACT_SIGNING_START = "DESTRUCTION_ACT_SIGNING_START"
+    DESTRUCTION_ACT_SIGNING_END_SUCCESS = "DESTRUCTION_ACT_SIGNING_END_SUCCESS"
+    DESTRUCTION_ACT_SIGNING_END_REJECTED = "DESTRUCTION_ACT_SIGNING_END_REJECTED"
+    DESTRUCTION_ACT_AGREEMENT_START = "DESTRUCTION_ACT_AGREEMENT_START"
+    DESTRUCTION_ACT_AGREEMENT_END_SUCCESS = "DESTRUCTION_ACT_AGREEMENT_END_SUCCESS"
+    DESTRUCTION_ACT_AGREEMENT_END_REJECTED = "DESTRUCTION_ACT_AGREEMENT_END_REJECTED"
+    DESTRUCTION_ACT_STATEMENT_START = "DESTRUCTION_ACT_STATEMENT_START"
+    DESTRUCTION_ACT_STATEMENT_END_SUCCESS = "DESTRUCTION_ACT_STATEMENT_END_SUCCESS"
+    DESTRUCTION_ACT_STATEMENT_END_REJECTED = "DESTRUCTION_ACT_STATEMENT_END_REJECTED"
+    DESTRUCTION_ACT_CANCELLED = "DESTRUCTION_ACT_CANCELLED"
+    DESTRUCTION_ACT_COMPLETED = "DESTRUCTION_ACT_COMPLETED"
+    ACCEPTANCE_INVENTORY_SIGNING_START = "ACCEPTANCE_INVENTORY_SIGNING_START"
+    ACCEPTANCE_INVENTORY_SIGNING_END_SUCCESS = (
+        "ACCEPTANCE_INVENTORY_SIGNING_END_SUCCESS"
+    )
+    ACCEPTANCE_INVENTORY_SIGNING_END_REJECTED = (
+        "ACCEPTANCE_INVENTORY_SIGNING_END_REJECTED"
+    )
+    ACCEPTANCE_INVENTORY_STATEMENT_START = "ACCEPTANCE_INVENTORY_STATEMENT_START"
+    ACCEPTANCE_INVENTORY_STATEMENT_END_SUCCESS = (
+        "ACCEPTANCE_INVENTORY_STATEMENT_END_SUCCESS"
+    )
+    ACCEPTANCE_INVENTORY_STATEMENT_END_REJECTED = (
+        "ACCEPTANCE_INVENTORY_STATEMENT_END_REJECTED"
+    )
+    ACCEPTANCE_INVENTORY_AGREEMENT_START = "ACCEPTANCE_INVENTORY_AGREEMENT_START"
+    ACCEPTANCE_INVENTORY_AGREEMENT_END_SUCCESS = (
+        "ACCEPTANCE_INVENTORY_AGREEMENT_END_SUCCESS"
+    )
+    ACCEPTANCE_INVENTORY_AGREEMENT_END_REJECTED = (
+        "ACCEPTANCE_INVENTORY_AGREEMENT_END_REJECTED"
+    )
+    CONTROL_POINT_EXECUTION_END_SUCCESS = "CONTROL_POINT_EXECUTION_END_SUCCESS"
+    CONTROL_POINT_ADD_RESPONSIBLE = "CONTROL_POINT_ADD_RESPONSIBLE"
+    CONTROL_POINT_FOR_REVISION = "CONTROL_POINT_FOR_REVISION"
+    CONTRACT_EXECUTION_START = "CONTRACT_EXECUTION_START"
+    CONTRACT_EXECUTION_END_SUCCESS = "CONTRACT_EXECUTION_END_SUCCESS"
+
+
+class PersonalNotificationSettingDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Id1 | None = None
+    email: bool | None = None
+    userNotification: bool | None = None
+    name: str | None = None
+
+
+class PersonalSetupDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор")] = None
+    setting: Annotated[ScanSettingJsonB | None, Field(description="Настройки")] = None
+    notifications: list[PersonalNotificationSettingDto] | None = None
+    notify: Annotated[
+        bool | None, Field(description="Уведомлять ли сотрудника сообщениями на почту")
+    ] = None
+    localization: Localization | None = None
+
+
+class PersonalSetupLocalizationRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    localization: Localization
+
+
+class AttachmentPersonalSetupDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    contentType: ContentType | None = None
+    uploadDate: Annotated[datetime | None, Field(description="Дата загрузки")] = None
+    name: Annotated[str | None, Field(description="Наименование вложения")] = None
+    size: Annotated[int | None, Field(description="Размер вложения")] = None
+
+
+class PersonalSetupRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    setting: ScanSettingJsonB | None = None
+    notify: bool | None = None
+    localization: Localization | None = None
+    notifications: list[PersonalNotificationSettingDto] | None = None
+
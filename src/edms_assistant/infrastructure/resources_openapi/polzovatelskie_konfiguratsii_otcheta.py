@@ -0,0 +1,81 @@
+# src/edms_assistant/infrastructure/resources_openapi/polzovatelskie_konfiguratsii_otcheta.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import Column
+
+
+class Type16(Enum):
+    """
+    Тип отчета
+    """
+
+    DOC = "DOC"
+    TASK = "TASK"
+
+
+class ReportUserField(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    docProfileName: list[str] | None = None
+    docTypeName: list[str] | None = None
+    destinationId: UUID | None = None
+    signedById: UUID | None = None
+
+
+class ReportUserConfigDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор конфигурации отчета")
+    ] = None
+    type: Annotated[Type16 | None, Field(description="Тип отчета")] = None
+    name: Annotated[str | None, Field(description="Наименование шаблона отчета")] = None
+    employeeId: Annotated[UUID | None, Field(description="Идентификатор автора")] = None
+    fields: Annotated[
+        dict[str, str] | None,
+        Field(description="Перечисление полей для построения отчета"),
+    ] = None
+    userFields: Annotated[
+        ReportUserField | None,
+        Field(description="Дополнительные поля для отображения в генераторе отчетов"),
+    ] = None
+    columns: Annotated[list[Column] | None, Field(description="Колонки для отчета")] = (
+        None
+    )
+
+
+class ReportUserConfigFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    type: str | None = None
+    name: str | None = None
+
+
+class ReportUserConfigRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID, Field(description="Идентификатор конфигурации отчета")]
+    fields: Annotated[
+        dict[str, str], Field(description="Перечень полей в генераторе отчетов")
+    ]
+    userFields: Annotated[
+        ReportUserField,
+        Field(description="Дополнительные поля для отображения в генераторе отчетов"),
+    ]
+    columns: Annotated[list[Column] | None, Field(description="Колонки для отчета")] = (
+        None
+    )
+    type: Annotated[Type16, Field(description="Тип отчета")]
+    name: Annotated[str, Field(description="Наименование шаблона отчета")]
+
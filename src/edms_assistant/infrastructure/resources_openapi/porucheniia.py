@@ -0,0 +1,103 @@
+# src/edms_assistant/infrastructure/resources_openapi/porucheniia.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    CreateTaskRequestExecutor,
+    Type12,
+)
+
+
+class Period3(Enum):
+    """
+    Интервал создания поручения (обязательно к заполнению если periodTask != null)
+    """
+
+    WEEK = "WEEK"
+    MONTH = "MONTH"
+    THREE_MONTHS = "THREE_MONTHS"
+    SIX_MONTHS = "SIX_MONTHS"
+    YEAR = "YEAR"
+
+
+class UpdateTaskRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID, Field(description="ИД поручения")]
+    taskText: Annotated[str, Field(description="Текст поручения", min_length=1)]
+    planedDateEnd: Annotated[
+        datetime | None, Field(description="Планируемая дата исполнения поручения")
+    ] = None
+    endless: Annotated[
+        bool,
+        Field(
+            description="бессрочное поручение (если false, то planedDateEnd обязательно к заполнению)"
+        ),
+    ]
+    periodTask: Annotated[bool, Field(description="Поручение периодическое")]
+    period: Annotated[
+        Period3 | None,
+        Field(
+            description="Интервал создания поручения (обязательно к заполнению если periodTask != null)"
+        ),
+    ] = None
+
+
+class TaskRevisionRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    text: str | None = None
+    ids: Annotated[list[UUID], Field(max_items=2147483647, min_items=1)]
+
+
+class ExecuteTaskRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    stampText: Annotated[str | None, Field(description="Текст поручения")] = None
+
+
+class TaskExecutionResult(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    affairWriteOffCount: int | None = None
+
+
+class CreateTaskRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    planedDateEnd: Annotated[
+        datetime | None, Field(description="Планируемая дата исполнения поручения")
+    ] = None
+    taskText: Annotated[str, Field(description="Текст поручения", min_length=1)]
+    authorId: Annotated[
+        UUID | None,
+        Field(description="Автор поручения, если не заполнен, то текущий пользователь"),
+    ] = None
+    type: Annotated[Type12, Field(description="Тип поручения")]
+    executors: Annotated[
+        list[CreateTaskRequestExecutor] | None, Field(description="Исполнители")
+    ] = None
+    endless: Annotated[
+        bool,
+        Field(
+            description="бессрочное поручение (если false, то planedDateEnd обязательно к заполнению)"
+        ),
+    ]
+    periodTask: Annotated[bool, Field(description="Поручение периодическое")]
+    period: Annotated[
+        Period3 | None,
+        Field(
+            description="Интервал создания поручения (обязательно к заполнению если periodTask != null)"
+        ),
+    ] = None
+
@@ -0,0 +1,72 @@
+# src/edms_assistant/infrastructure/resources_openapi/porucheniia_kontrol.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import TaskStatus
+
+
+class TaskKanbanColumnDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    employeeId: UUID | None = None
+    name: str | None = None
+    color: str | None = None
+    order: int | None = None
+
+
+class Include3(Enum):
+    DOCUMENT = "DOCUMENT"
+    DOCUMENT_CORRESPONDENT = "DOCUMENT_CORRESPONDENT"
+
+
+class TaskFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    currentUserAuthor: Annotated[
+        bool | None, Field(description="Текущий юзер автор поручения")
+    ] = None
+    currentUserOnControl: Annotated[
+        bool | None, Field(description="Текущий юзер контролер в поручении")
+    ] = None
+    currentUserOnExecution: Annotated[
+        bool | None, Field(description="Текущий юзер исполнитель поручения")
+    ] = None
+    currentUserExpiresTask: Annotated[
+        bool | None,
+        Field(
+            description="Текущий юзер исполнитель поручения и срок исполнения подходит к концу"
+        ),
+    ] = None
+    currentUserOverdue: Annotated[
+        bool | None,
+        Field(
+            description="Текущий юзер исполнитель поручения и срок исполнения просрочен"
+        ),
+    ] = None
+    currentUserEndless: Annotated[
+        bool | None,
+        Field(
+            description="Текущий юзер исполнитель без отметки и поручения без срока исполнения"
+        ),
+    ] = None
+    taskText: Annotated[str | None, Field(description="Текст поручения")] = None
+    taskStatus: TaskStatus | None = None
+    documentRegNum: str | None = None
+    executorFirstName: str | None = None
+    executorLastName: str | None = None
+    executorMiddleName: str | None = None
+    fetchExecutors: bool | None = None
+    includes: list[Include3] | None = None
+    mapperRules: list[int] | None = None
+
@@ -0,0 +1,41 @@
+# src/edms_assistant/infrastructure/resources_openapi/porucheniia_perenos_sroka_ispolneniia.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    Task,
+    UserInfo,
+)
+
+
+class RequestDateExecutionResult(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    result: Annotated[bool | None, Field(description="Результат")] = None
+    comment: str | None = None
+
+
+class TaskChangeDateRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    executed: bool | None = None
+    taskId: UUID
+    date: datetime | None = None
+    dateCreate: datetime | None = None
+    text: str | None = None
+    currentExecutionDate: datetime | None = None
+    author: UserInfo | None = None
+    task: Task | None = None
+    result: bool | None = None
+
@@ -0,0 +1,81 @@
+# src/edms_assistant/infrastructure/resources_openapi/proekty_porucheniia_v_dokumente.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    CreateTaskRequestExecutor,
+    Task,
+    TaskType1,
+    Type12,
+    UserInfoDto,
+)
+
+
+class UpdateTaskProjectRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID, Field(description="ИД поручения")]
+    taskText: Annotated[str, Field(description="Текст поручения", min_length=1)]
+    planedDateEnd: Annotated[
+        datetime, Field(description="Планируемая дата исполнения поручения")
+    ]
+
+
+class CreateTaskProjectRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    planedDateEnd: Annotated[
+        datetime | None, Field(description="Планируемая дата исполнения поручения")
+    ] = None
+    taskText: Annotated[str, Field(description="Текст поручения", min_length=1)]
+    authorId: Annotated[UUID | None, Field(description="Автор поручения")] = None
+    type: Annotated[Type12, Field(description="Тип поручения")]
+    executors: Annotated[
+        list[CreateTaskRequestExecutor] | None, Field(description="Исполнители")
+    ] = None
+
+
+class TaskProjectExecutorDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    organizationId: str | None = None
+    documentId: UUID | None = None
+    documentOrgId: str | None = None
+    taskProjectId: UUID | None = None
+    taskProjectOrgId: str | None = None
+    createDate: datetime | None = None
+    responsible: bool | None = None
+    executor: UserInfoDto | None = None
+
+
+class TaskProjectDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    organizationId: str | None = None
+    documentRegNum: str | None = None
+    documentRegDate: datetime | None = None
+    type: TaskType1 | None = None
+    parentId: UUID | None = None
+    parentOrg: str | None = None
+    parentTask: Task | None = None
+    createDate: datetime | None = None
+    author: UserInfoDto | None = None
+    taskExecutors: list[TaskProjectExecutorDto] | None = None
+    planedDateEnd: datetime | None = None
+    taskText: str | None = None
+    documentId: UUID | None = None
+    documentOrgId: str | None = None
+    countExec: int | None = None
+
@@ -0,0 +1,97 @@
+# src/edms_assistant/infrastructure/resources_openapi/profili_dokumenta.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    AttachmentDto,
+    DocCategory,
+    DocumentProfileDto,
+)
+
+
+class Include15(Enum):
+    BPMN_PROCESS_DIRECTORY = "BPMN_PROCESS_DIRECTORY"
+
+
+class DocumentProfileFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: Annotated[str | None, Field(description="Наименование профиля документа")] = (
+        None
+    )
+    docTypeName: Annotated[
+        str | None, Field(description="Наименование вида документа")
+    ] = None
+    docCategoryName: Annotated[
+        str | None, Field(description="Наименование типа документа")
+    ] = None
+    regJournalName: Annotated[
+        str | None, Field(description="Наименование журнала регистрации")
+    ] = None
+    active: Annotated[
+        bool | None, Field(description="Признак активен ли профиль документа")
+    ] = None
+    docTypeId: Annotated[
+        int | None, Field(description="Идентификатор вида документа")
+    ] = None
+    docCategoryId: Annotated[
+        UUID | None, Field(description="Идентификатор типа документа")
+    ] = None
+    regJournalId: Annotated[
+        UUID | None, Field(description="Идентификатор журнала регистрации")
+    ] = None
+    correspondentId: Annotated[
+        UUID | None, Field(description="Идентификатор корреспондента")
+    ] = None
+    docCategoryConst: DocCategory | None = None
+    withAccess: Annotated[
+        bool | None, Field(description="Только доступные профили по списку доступа")
+    ] = None
+    includes: list[Include15] | None = None
+
+
+class ProfileAttachmentDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    name: str | None = None
+    size: int | None = None
+    uploadDate: datetime | None = None
+    minioName: str | None = None
+    bucketName: str | None = None
+    profileId: UUID | None = None
+
+
+class ProfileContractAttachmentDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None,
+        Field(
+            description="Идентификатор вложения шаблона договора в профиле документа "
+        ),
+    ] = None
+    documentProfileId: Annotated[
+        UUID | None, Field(description="Идентификатор профиля документа")
+    ] = None
+    documentProfile: Annotated[
+        DocumentProfileDto | None, Field(description="Профиль документа")
+    ] = None
+    attachment: Annotated[
+        AttachmentDto | None,
+        Field(description="Файл шаблона печатной формы для договора"),
+    ] = None
+    tag: Annotated[list[str] | None, Field(description="Список меток шаблона")] = None
+    template: Annotated[bool | None, Field(description="Наличие меток")] = None
+    uploadDate: Annotated[datetime | None, Field(description="Дата загрузки")] = None
+
@@ -0,0 +1,204 @@
+# src/edms_assistant/infrastructure/resources_openapi/protsessy_dokumenta.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    ActionQueueType1,
+    DepartmentDto,
+    GroupDto,
+    Type4,
+    UserInfoDto,
+)
+
+
+class BpmnStartBeforeRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: str
+    employees: list[UUID] | None = None
+
+
+class RepeatExecutionPolicy(Enum):
+    ALL = "ALL"
+    REJECT = "REJECT"
+
+
+class ProcessExecutorWithPos(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    employeeId: UUID | None = None
+    groupId: UUID | None = None
+    departmentId: UUID | None = None
+    order: int | None = None
+
+
+class DocumentAttachmentSignEntry(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    attachmentId: UUID | None = None
+    cms: str | None = None
+
+
+class ProcessActionWithSign(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    result: Annotated[
+        bool,
+        Field(description="Признак результата действия положительный/отрицательный"),
+    ]
+    employeeId: Annotated[
+        UUID,
+        Field(
+            description="Идентификатор участника процесса от лица которого делается действие"
+        ),
+    ]
+    comment: Annotated[str | None, Field(description="Комментарий")] = None
+    ignoreErrors: Annotated[
+        bool | None, Field(description="Признак игнорирования ошибок")
+    ] = None
+    signs: list[DocumentAttachmentSignEntry] | None = None
+
+
+class RegistrationProcessRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    employeeId: Annotated[UUID, Field(description="Идентификатор сотрудника")]
+    ignoreErrors: Annotated[bool, Field(description="Признак игнорирования ошибок")]
+    regDate: Annotated[datetime | None, Field(description="Рег. дата")] = None
+
+
+class SmdoRegistrationReject(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    employeeId: Annotated[UUID, Field(description="Идентификатор сотрудника")]
+    comment: Annotated[str, Field(description="Комментарий", min_length=1)]
+
+
+class SimpleProcessAction(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    result: Annotated[
+        bool,
+        Field(description="Признак результата действия положительный/отрицательный"),
+    ]
+    employeeId: Annotated[
+        UUID,
+        Field(
+            description="Идентификатор участника процесса от лица которого делается действие"
+        ),
+    ]
+    comment: Annotated[str | None, Field(description="Комментарий")] = None
+    ignoreErrors: Annotated[
+        bool | None, Field(description="Признак игнорирования ошибок")
+    ] = None
+
+
+class ReserveRegnumberRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    ignoreErrors: bool | None = None
+
+
+class RedirectReviewProcessAction(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    employeeId: Annotated[
+        UUID,
+        Field(
+            description="Идентификатор участника процесса от лица которого делается действие"
+        ),
+    ]
+    redirectEmployeeId: Annotated[
+        UUID,
+        Field(
+            description="ИД сотрудника котору будет выдан доступ к этапу рассмотрения"
+        ),
+    ]
+    comment: Annotated[str | None, Field(description="Комментарий")] = None
+
+
+class FreeRegistrationProcessRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    employeeId: Annotated[
+        UUID | None, Field(description="Идентификатор сотрудника")
+    ] = None
+    regDate: Annotated[datetime, Field(description="Рег. дата")]
+    regNum: Annotated[str, Field(description="Рег. номер", min_length=1)]
+    journalNumber: int | None = None
+    ignoreErrors: bool | None = None
+
+
+class CamundaProcessItemDefinitionRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    days: int | None = None
+    completeAfterRejectCount: int | None = None
+    repeatExecutionPolicy: RepeatExecutionPolicy | None = None
+    autoRegistration: bool | None = None
+    transientExecution: bool | None = None
+    oneForAll: bool | None = None
+    fileSign: bool | None = None
+    actionQueueType: ActionQueueType1 | None = None
+    employees: list[ProcessExecutorWithPos] | None = None
+
+
+class BpmnProcessItemDefinitionDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    documentProcessItemId: UUID | None = None
+    activityId: str | None = None
+    started: bool | None = None
+    completed: bool | None = None
+    name: str | None = None
+    days: int | None = None
+    actionQueueType: ActionQueueType1 | None = None
+    type: Annotated[
+        Type4 | None, Field(description="Перечисление для описания типов процесса")
+    ] = None
+    executors: list[BpmnProcessItemExecutorDefinitionDto] | None = None
+    oneForAll: bool | None = None
+    transientExecution: bool | None = None
+    autoRegistration: bool | None = None
+    fileSign: bool | None = None
+    repeatExecutionPolicy: RepeatExecutionPolicy | None = None
+    completeAfterRejectCount: int | None = None
+    rejectCount: int | None = None
+
+
+class BpmnProcessItemExecutorDefinitionDto(BaseModel):
+    """
+    Заполняется только для тех этапов которые не начинались, будет заполнена либо группа либо исполнитель либо депортамент
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    comment: str | None = None
+    documentProcessItemId: UUID | None = None
+    end: datetime | None = None
+    executionEnd: datetime | None = None
+    result: bool | None = None
+    start: datetime | None = None
+    order: int | None = None
+    executor: UserInfoDto | None = None
+    groupId: Annotated[
+        UUID | None,
+        Field(description="Заполняется только для тех этапов которые не начинались"),
+    ] = None
+    group: GroupDto | None = None
+    departmentId: Annotated[
+        UUID | None,
+        Field(description="Заполняется только для тех этапов которые не начинались"),
+    ] = None
+    department: DepartmentDto | None = None
+
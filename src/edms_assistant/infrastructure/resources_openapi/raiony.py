@@ -0,0 +1,29 @@
+# src/edms_assistant/infrastructure/resources_openapi/raiony.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class Include16(Enum):
+    REGION = "REGION"
+
+
+class DistrictFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    search: Annotated[str | None, Field(description="Строка поиска")] = None
+    active: Annotated[bool | None, Field(description="Признак активен ли город")] = None
+    includes: Annotated[
+        list[Include16] | None,
+        Field(description="Список моделей которые могу быть добавлены при отображении"),
+    ] = None
+
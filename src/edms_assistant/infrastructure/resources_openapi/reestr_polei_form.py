@@ -0,0 +1,54 @@
+# src/edms_assistant/infrastructure/resources_openapi/reestr_polei_form.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class Type21(Enum):
+    STRING = "STRING"
+    DATE = "DATE"
+    BOOLEAN = "BOOLEAN"
+    DOUBLE = "DOUBLE"
+    EMPLOYEE = "EMPLOYEE"
+    CORRESPONDENT = "CORRESPONDENT"
+
+
+class FormFieldRegistryEntryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: str | None = None
+    active: bool | None = None
+    name: str | None = None
+    description: str | None = None
+    type: Type21 | None = None
+    locale: str | None = None
+    used: bool | None = None
+
+
+class SliceDtoFormFieldRegistryEntryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[FormFieldRegistryEntryDto] | None = None
+
+
+class IdsString(BaseModel):
+    """
+    Список идентификаторов
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    ids: Annotated[list[str], Field(max_items=2147483647, min_items=1)]
+
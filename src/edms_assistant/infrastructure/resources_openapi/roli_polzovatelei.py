@@ -0,0 +1,44 @@
+# src/edms_assistant/infrastructure/resources_openapi/roli_polzovatelei.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import Type14
+
+
+class RoleRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID
+    name: str
+    system: bool | None = None
+    type: Type14 | None = None
+    createDate: datetime | None = None
+
+
+class RoleUpdateRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    role: RoleRequest
+    groupAdd: Annotated[set[UUID] | None, Field()] = None
+    employeeAdd: Annotated[set[UUID] | None, Field()] = None
+    groupDelete: list[UUID] | None = None
+    employeeDelete: list[UUID] | None = None
+
+
+class RoleAddRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    role: RoleRequest
+    groupAdd: Annotated[set[UUID] | None, Field()] = None
+    employeeAdd: Annotated[set[UUID] | None, Field()] = None
+
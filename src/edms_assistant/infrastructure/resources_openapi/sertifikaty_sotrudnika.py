@@ -0,0 +1,39 @@
+# src/edms_assistant/infrastructure/resources_openapi/sertifikaty_sotrudnika.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import CertInfo
+
+
+class ExtractCertificateRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    cms: Annotated[str, Field(description="Данные ЭЦП в формате Base64", min_length=1)]
+
+
+class EmployeeCertInfoDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор записи сертификата сотрудника")
+    ] = None
+    employeeId: Annotated[
+        UUID | None, Field(description="Идентификатор сотрудника")
+    ] = None
+    certificate: Annotated[
+        CertInfo | None, Field(description="Информация о сертификате сотрудника")
+    ] = None
+    serialNumber: Annotated[
+        str | None, Field(description="Серийный номер сертификата")
+    ] = None
+
@@ -0,0 +1,77 @@
+# src/edms_assistant/infrastructure/resources_openapi/shablony_dogovorov.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class TemplateContractRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None,
+        Field(description="Идентификатор шаблона печатной формы для договора"),
+    ] = None
+    name: Annotated[
+        str, Field(description="Наименование шаблона печатной формы для договора")
+    ]
+    active: Annotated[
+        bool, Field(description="Признак активен ли шаблон печатной формы для договора")
+    ]
+
+
+class TemplateContractUpdateRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    template: TemplateContractRequest
+    attachmentAddIds: list[UUID] | None = None
+
+
+class AttachmentTemplateContractDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None,
+        Field(description="Идентификатор файла шаблона печатной формы для договора"),
+    ] = None
+    name: Annotated[str | None, Field(description="Наименование вложенного файла")] = (
+        None
+    )
+    size: Annotated[int | None, Field(description="Размер вложенного файла")] = None
+
+
+class TemplateContractDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None,
+        Field(description="Идентификатор шаблона печатной формы для договора"),
+    ] = None
+    name: Annotated[
+        str | None,
+        Field(description="Наименование шаблона печатной формы для договора"),
+    ] = None
+    attachments: Annotated[
+        list[AttachmentTemplateContractDto] | None,
+        Field(description="Файл шаблона печатной формы для договора"),
+    ] = None
+    active: Annotated[
+        bool | None,
+        Field(description="Признак активен ли шаблон печатной формы для договора"),
+    ] = None
+
+
+class TemplateContractAddRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    template: TemplateContractRequest
+    attachmentAddIds: Annotated[list[UUID], Field(min_items=1)]
+
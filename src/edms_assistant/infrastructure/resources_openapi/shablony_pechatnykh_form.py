@@ -0,0 +1,67 @@
+# src/edms_assistant/infrastructure/resources_openapi/shablony_pechatnykh_form.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    AttachmentDto,
+    DocCategory,
+)
+
+
+class TemplateRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор шаблона печатной формы")
+    ] = None
+    templateName: Annotated[
+        str | None, Field(description="Наименование шаблона печатной формы")
+    ] = None
+    docCategoryConstant: DocCategory | None = None
+    active: Annotated[
+        bool | None, Field(description="Признак активен ли шаблон печатной формы")
+    ] = None
+    attachId: UUID | None = None
+
+
+class TemplateUpdateRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    template: TemplateRequest
+    attachmentAddId: UUID | None = None
+
+
+class TemplateDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор шаблона печатной формы")
+    ] = None
+    templateName: Annotated[
+        str | None, Field(description="Наименование шаблона печатной формы")
+    ] = None
+    attachment: Annotated[
+        AttachmentDto | None, Field(description="Файл шаблона печатной формы")
+    ] = None
+    docCategoryConstant: DocCategory | None = None
+    active: Annotated[
+        bool | None, Field(description="Признак активен ли шаблон печатной формы")
+    ] = None
+
+
+class TemplateAddRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    template: TemplateRequest
+    attachmentAddId: Annotated[UUID, Field(min_length=1)]
+
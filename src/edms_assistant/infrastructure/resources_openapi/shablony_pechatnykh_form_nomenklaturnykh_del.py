@@ -0,0 +1,108 @@
+# src/edms_assistant/infrastructure/resources_openapi/shablony_pechatnykh_form_nomenklaturnykh_del.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import AttachmentDto
+
+
+class NomenclatureAffairPrintType(Enum):
+    """
+    Тип шаблона печатной формы для номенклатуры дел
+    """
+
+    ACT_DESTRUCTION = "ACT_DESTRUCTION"
+    CASE_COVER = "CASE_COVER"
+    CERTIFICATION_SHEET = "CERTIFICATION_SHEET"
+    INTERNAL_INVENTORY_ARCHIVE = "INTERNAL_INVENTORY_ARCHIVE"
+    SUMMARY_NOMENCLATURE_DEPARTMENT = "SUMMARY_NOMENCLATURE_DEPARTMENT"
+
+
+class NomenclatureAffairPrintTemplateRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None,
+        Field(description="Идентификатор шаблона печатной формы для наменклатуры дел"),
+    ] = None
+    name: Annotated[
+        str,
+        Field(description="Наименование шаблона печатной формы для наменклатуры дел"),
+    ]
+    nomenclatureAffairPrintType: Annotated[
+        NomenclatureAffairPrintType,
+        Field(description="Тип шаблона печатной формы для номенклатуры дел"),
+    ]
+    active: Annotated[
+        bool,
+        Field(
+            description="Признак активен ли шаблон печатной формы для наменклатуры дел"
+        ),
+    ]
+
+
+class NomenclatureAffairPrintTemplateUpdateRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    template: NomenclatureAffairPrintTemplateRequest
+    attachmentAddId: UUID | None = None
+
+
+class NomenclatureAffairPrintTemplateDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None,
+        Field(description="Идентификатор шаблона печатной формы для наменклатуры дел"),
+    ] = None
+    name: Annotated[
+        str | None,
+        Field(description="Наименование шаблона печатной формы для наменклатуры дел"),
+    ] = None
+    attachment: Annotated[
+        AttachmentDto | None,
+        Field(description="Файл шаблона печатной формы для наменклатуры дел"),
+    ] = None
+    nomenclatureAffairPrintType: Annotated[
+        NomenclatureAffairPrintType | None,
+        Field(description="Тип шаблона печатной формы для номенклатуры дел"),
+    ] = None
+    active: Annotated[
+        bool | None,
+        Field(
+            description="Признак активен ли шаблон печатной формы для наменклатуры дел"
+        ),
+    ] = None
+
+
+class NomenclatureAffairPrintTemplateAddRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    template: NomenclatureAffairPrintTemplateRequest
+    attachmentAddId: Annotated[UUID, Field(min_length=1)]
+
+
+class Type49(Enum):
+    ACT_DESTRUCTION = "ACT_DESTRUCTION"
+    CASE_COVER = "CASE_COVER"
+    CERTIFICATION_SHEET = "CERTIFICATION_SHEET"
+    INTERNAL_INVENTORY_ARCHIVE = "INTERNAL_INVENTORY_ARCHIVE"
+    SUMMARY_NOMENCLATURE_DEPARTMENT = "SUMMARY_NOMENCLATURE_DEPARTMENT"
+
+
+class NomenclatureAffairPrintTemplateFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    search: str | None = None
+    types: list[Type49] | None = None
+    active: bool | None = None
+
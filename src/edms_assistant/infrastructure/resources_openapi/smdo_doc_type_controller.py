@@ -0,0 +1,40 @@
+# src/edms_assistant/infrastructure/resources_openapi/smdo_doc_type_controller.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class DocTypeDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    status: str | None = None
+    objid: UUID | None = None
+    startDate: str | None = None
+    endDate: str | None = None
+    createdOn: datetime | None = None
+    updatedOn: datetime | None = None
+    name: str | None = None
+    rowId: str | None = None
+    createDate: datetime | None = None
+    updatedDate: datetime | None = None
+
+
+class SliceDtoDocTypeDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[DocTypeDto] | None = None
+
@@ -0,0 +1,40 @@
+# src/edms_assistant/infrastructure/resources_openapi/smdo_file_type_controller.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class FileTypeDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    extension: str | None = None
+    endDate: str | None = None
+    rowId: str | None = None
+    createdOn: datetime | None = None
+    updatedOn: datetime | None = None
+    objid: UUID | None = None
+    startDate: str | None = None
+    status: str | None = None
+    name: str | None = None
+    updatedDate: datetime | None = None
+
+
+class SliceDtoFileTypeDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[FileTypeDto] | None = None
+
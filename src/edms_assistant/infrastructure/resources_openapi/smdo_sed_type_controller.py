@@ -0,0 +1,42 @@
+# src/edms_assistant/infrastructure/resources_openapi/smdo_sed_type_controller.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class SedTypeDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    createdOn: datetime | None = None
+    objid: UUID | None = None
+    updatedOn: datetime | None = None
+    description: str | None = None
+    name: str | None = None
+    startDate: str | None = None
+    endDate: str | None = None
+    version: str | None = None
+    status: str | None = None
+    rowId: str | None = None
+    createDate: datetime | None = None
+    updatedDate: datetime | None = None
+
+
+class SliceDtoSedTypeDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[SedTypeDto] | None = None
+
@@ -0,0 +1,38 @@
+# src/edms_assistant/infrastructure/resources_openapi/sokhranennye_filtry_dokumenta_dlia_rasshirennogo_poiska.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class FilterFieldFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID
+    name: Annotated[str, Field(description="Наименование фильтра")]
+    color: Annotated[str, Field(description="Цвет для фильтра")]
+    field: Annotated[dict[str, Any] | None, Field(description="Поля фильтра")] = None
+
+
+class FilterDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    employeeId: Annotated[
+        UUID | None, Field(description="Идентификатор сотрудника")
+    ] = None
+    name: Annotated[str | None, Field(description="Наименование фильтра")] = None
+    createDate: Annotated[
+        datetime | None, Field(description="Дата создания фильтра")
+    ] = None
+    color: Annotated[str | None, Field(description="Цвет для фильтра")] = None
+    field: Annotated[dict[str, Any] | None, Field(description="Поля фильтра")] = None
+
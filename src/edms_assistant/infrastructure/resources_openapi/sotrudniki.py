@@ -0,0 +1,100 @@
+# src/edms_assistant/infrastructure/resources_openapi/sotrudniki.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import EmployeeIoRequest
+
+
+class Role(Enum):
+    """
+    Список ролей сотрудника
+    """
+
+    ADMIN = "ADMIN"
+    MAIN_CLERK = "MAIN_CLERK"
+    CLERK = "CLERK"
+
+
+class EmployeeApi(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор сотрудника")] = None
+    getuId: Annotated[str, Field(description="Идентификатор аккаунта сотрудника")]
+    firstName: Annotated[str, Field(description="Имя сотрудника", min_length=1)]
+    lastName: Annotated[str, Field(description="Фамилия сотрудника", min_length=1)]
+    middleName: Annotated[str | None, Field(description="Отчество сотрудника")] = None
+    fired: Annotated[bool, Field(description="Признак уволен ли сотрудник")]
+    active: Annotated[bool, Field(description="Признак активен ли сотрудник")]
+    fullPostName: Annotated[str | None, Field(description="ФИО сотрудника")] = None
+    roles: Annotated[set[Role], Field(min_items=1)]
+    postId: Annotated[int | None, Field(description="Идентификатор должности")] = None
+    departmentId: Annotated[
+        UUID,
+        Field(description="Идентификатор департамента в котором работает сотрудник"),
+    ]
+
+
+class EmployeeRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор сотрудника")] = None
+    getuId: Annotated[str, Field(description="Идентификатор аккаунта сотрудника")]
+    firstName: Annotated[str, Field(description="Имя сотрудника")]
+    lastName: Annotated[str, Field(description="Фамилия сотрудника")]
+    middleName: Annotated[str | None, Field(description="Отчество сотрудника")] = None
+    personalNumber: Annotated[
+        str | None, Field(description="Персональный номер сотрудника")
+    ] = None
+    ldapName: Annotated[str | None, Field(description="LDAP Имя")] = None
+    address: Annotated[str | None, Field(description="Адрес")] = None
+    phone: Annotated[str | None, Field(description="Телефон")] = None
+    email: Annotated[str | None, Field(description="E-mail")] = None
+    place: Annotated[str | None, Field(description="Площадка")] = None
+    postId: Annotated[int | None, Field(description="Идентификатор должности")] = None
+    url: Annotated[str | None, Field(description="URL")] = None
+    departmentId: Annotated[
+        UUID,
+        Field(description="Идентификатор департамента в котором работает сотрудник"),
+    ]
+    order: Annotated[int | None, Field(description="Порядок сортировки")] = None
+
+
+class EmployeeUpdateRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    employee: EmployeeRequest
+    ioAdd: EmployeeIoRequest | None = None
+    ioDelete: UUID | None = None
+    secretaryAdd: list[UUID] | None = None
+    secretaryDelete: list[UUID] | None = None
+
+
+class EmployeeDelegate(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID, Field(description="Идентификатор сотрудника")]
+    to: Annotated[
+        UUID,
+        Field(
+            description="Идентификатор сотрудника которому будут переданы документы/обязанности"
+        ),
+    ]
+
+
+class EmployeeAddRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    employee: EmployeeRequest
+    ioAdd: EmployeeIoRequest | None = None
+    secretaryAdd: list[UUID] | None = None
+
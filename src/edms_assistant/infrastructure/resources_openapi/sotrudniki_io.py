@@ -0,0 +1,90 @@
+# src/edms_assistant/infrastructure/resources_openapi/sotrudniki_io.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import EmployeeDto
+
+
+class Type36(Enum):
+    """
+    Признак секретаря
+    """
+
+    SECRETARY = "SECRETARY"
+    IO = "IO"
+    IO_DISMISSAL = "IO_DISMISSAL"
+
+
+class SecretaryRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    targetId: Annotated[
+        UUID,
+        Field(
+            description="Идентификатор сотрудника за которого будут исполнять обязанности"
+        ),
+    ]
+    ioIds: Annotated[
+        list[UUID] | None,
+        Field(
+            description="Идентификатор сотрудника который будет исполнять обязанности"
+        ),
+    ] = None
+
+
+class EmployeeIoDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор исполнителя обязанностей")
+    ] = None
+    createDate: Annotated[
+        datetime | None, Field(description="Дата назначения прав")
+    ] = None
+    targetId: Annotated[
+        UUID | None,
+        Field(
+            description="Идентификатор сотрудника за которого будут исполнять обязанности"
+        ),
+    ] = None
+    target: Annotated[
+        EmployeeDto | None,
+        Field(description="Сотрудник за которого будут исполнять обязанности"),
+    ] = None
+    ioId: Annotated[
+        UUID | None,
+        Field(
+            description="Идентификатор сотрудника который будет исполнять обязанности"
+        ),
+    ] = None
+    io: Annotated[
+        EmployeeDto | None,
+        Field(description="Сотрудник который будет исполнять обязанности"),
+    ] = None
+    system: Annotated[
+        bool | None,
+        Field(
+            description="Признак того что исполнение обязанностей было назначено системой"
+        ),
+    ] = None
+    revocationDate: Annotated[
+        datetime | None, Field(description="Дата аннулирования прав")
+    ] = None
+    transferDocs: Annotated[
+        bool | None,
+        Field(
+            description="Признак передавать ли документы при исполнении обязанностей"
+        ),
+    ] = None
+    type: Annotated[Type36 | None, Field(description="Признак секретаря")] = None
+
@@ -0,0 +1,35 @@
+# src/edms_assistant/infrastructure/resources_openapi/sposoby_dostavki.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class DeliveryMethodRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    deliveryName: str | None = None
+    aismv: bool | None = None
+    active: bool | None = None
+
+
+class DeliveryMethodFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    search: Annotated[str | None, Field(description="Строка поиска")] = None
+    active: Annotated[
+        bool | None, Field(description="Признак активен ли адресат/корреспондент")
+    ] = None
+    aismv: bool | None = None
+    kanclerNext: bool | None = None
+    system: bool | None = None
+
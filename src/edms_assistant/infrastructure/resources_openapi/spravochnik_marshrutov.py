@@ -0,0 +1,88 @@
+# src/edms_assistant/infrastructure/resources_openapi/spravochnik_marshrutov.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    ActionQueueType1,
+    DirectoryProcessDefinition,
+    DocCategory,
+    Type4,
+)
+
+
+class RouterDirectoryFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: Annotated[str | None, Field(description="Наименование")] = None
+    active: Annotated[bool | None, Field(description="Признак активена ли запись")] = (
+        None
+    )
+    docCategory: DocCategory | None = None
+
+
+class ProcessItemDefinition(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    type: Annotated[
+        Type4 | None, Field(description="Перечисление для описания типов процесса")
+    ] = None
+    before: Annotated[
+        list[Type4] | None, Field(description="Процессы после которых может следовать")
+    ] = None
+    after: Annotated[
+        list[Type4] | None, Field(description="Процессы которые могут следовать после")
+    ] = None
+    start: Annotated[
+        bool | None, Field(description="Признак может ли быть первым процессом")
+    ] = None
+    end: Annotated[
+        bool | None, Field(description="Признак может ли быть последний процессом")
+    ] = None
+    days: Annotated[
+        bool | None, Field(description="Признак может ли ограничеваться кол-во дней")
+    ] = None
+    employees: Annotated[
+        bool | None, Field(description="Признак может ли иметь участников")
+    ] = None
+    externalEmployees: Annotated[
+        bool | None, Field(description="Может содержать работников других фелиалов")
+    ] = None
+    empActionQueueType: Annotated[
+        list[ActionQueueType1] | None,
+        Field(description="Доступные типы действий для участников процесса"),
+    ] = None
+    docs: Annotated[
+        list[DocCategory] | None,
+        Field(description="Типы документов в которых доступен процесс"),
+    ] = None
+
+
+class RouterDirectoryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор справочника маршрутов")
+    ] = None
+    active: Annotated[
+        bool, Field(description="Признак активен ли справочник маршрутов")
+    ]
+    name: Annotated[
+        str, Field(description="Наименование справочника маршрутов", min_length=1)
+    ]
+    docCategory: DocCategory
+    processDefinition: Annotated[
+        list[DirectoryProcessDefinition],
+        Field(description="Список этапов маршрута", max_items=2147483647, min_items=1),
+    ]
+    createDate: datetime | None = None
+
@@ -0,0 +1,58 @@
+# src/edms_assistant/infrastructure/resources_openapi/srok_khraneniia.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    GroupByStoragePeriod,
+    StoragePeriodType,
+    StoragePeriodType2,
+    YearPostfix,
+)
+
+
+class StoragePeriodRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    groupByStoragePeriod: GroupByStoragePeriod | None = None
+    active: bool | None = None
+    byStaff: bool | None = None
+    storageYears: int | None = None
+    yearPostfix: Annotated[
+        YearPostfix | None,
+        Field(description="Добавочный текст к количеству лет хранения"),
+    ] = None
+    storagePeriodType: Annotated[
+        StoragePeriodType | None, Field(description="Другой тип хранения")
+    ] = None
+
+
+class YearPostfix2(Enum):
+    год = "год"
+    года = "года"
+    лет = "лет"
+
+
+class StoragePeriod(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    name: Annotated[str, Field(max_length=255, min_length=0)]
+    groupByStoragePeriod: GroupByStoragePeriod
+    active: bool
+    createDate: datetime | None = None
+    byStaff: bool
+    storageYears: Annotated[int | None, Field(ge=1, le=99)] = None
+    yearPostfix: YearPostfix2 | None = None
+    storagePeriodType: StoragePeriodType2
+
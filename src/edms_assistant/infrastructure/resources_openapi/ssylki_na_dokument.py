@@ -0,0 +1,38 @@
+# src/edms_assistant/infrastructure/resources_openapi/ssylki_na_dokument.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    DocumentDto,
+    Type52,
+)
+
+
+class DocumentLinkDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор ссылки")] = None
+    docId: Annotated[UUID | None, Field(description="Идентификатор документа")] = None
+    docLinkId: Annotated[
+        UUID | None,
+        Field(
+            description="Идентификатор документа на который ссылается текущий документ"
+        ),
+    ] = None
+    docLink: Annotated[
+        DocumentDto | None,
+        Field(description="Документ на который ссылается текущий документ"),
+    ] = None
+    type: Type52 | None = None
+    deleted: bool | None = None
+
@@ -0,0 +1,92 @@
+# src/edms_assistant/infrastructure/resources_openapi/svodnaia_opis_del.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    ArchiveFundDto,
+    AttachmentDto,
+    GroupByStoragePeriod,
+    MethodAssemblyType,
+    MethodAssemblyType2,
+    UserInfoDto,
+)
+
+
+class SummaryInventoryReportEditRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: Annotated[str, Field(description="Номер описи")]
+
+
+class GroupByStoragePeriod1(Enum):
+    """
+    Категория хранения
+    """
+
+    S_T_UP_TO_10_Y = "S_T_UP_TO_10_Y"
+    S_T_OVER_10_Y = "S_T_OVER_10_Y"
+    P_S = "P_S"
+
+
+class SummaryInventoryReportRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: Annotated[str, Field(description="Номер описи")]
+    fundId: UUID
+    archiveYear: Annotated[int, Field(description="Год поступления дела в архив")]
+    groupByStoragePeriod: Annotated[
+        GroupByStoragePeriod1, Field(description="Категория хранения")
+    ]
+    personnel: Annotated[bool, Field(description="Метка по личному составу")]
+    methodAssemblyType: Annotated[
+        MethodAssemblyType2, Field(description="Способ комплектования дела")
+    ]
+
+
+class SummaryInventoryReportFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    number: str | None = None
+    fundId: UUID | None = None
+    year: int | None = None
+    groupByStoragePeriod: GroupByStoragePeriod | None = None
+    personnel: bool | None = None
+    methodAssemblyType: MethodAssemblyType | None = None
+
+
+class SummaryInventoryReportDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    number: Annotated[str | None, Field(description="Номер описи")] = None
+    fundId: UUID | None = None
+    fund: ArchiveFundDto | None = None
+    archiveYear: Annotated[
+        int | None, Field(description="Год поступления дела в архив")
+    ] = None
+    groupByStoragePeriod: Annotated[
+        GroupByStoragePeriod1 | None, Field(description="Категория хранения")
+    ] = None
+    personnel: Annotated[bool | None, Field(description="Метка по личному составу")] = (
+        None
+    )
+    methodAssemblyType: Annotated[
+        MethodAssemblyType2 | None, Field(description="Способ комплектования дела")
+    ] = None
+    attachment: Annotated[
+        AttachmentDto | None, Field(description="Вложение 'Сводная опись дел'")
+    ] = None
+    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
+    author: UserInfoDto | None = None
+
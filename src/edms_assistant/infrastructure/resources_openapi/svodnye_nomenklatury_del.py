@@ -0,0 +1,440 @@
+# src/edms_assistant/infrastructure/resources_openapi/svodnye_nomenklatury_del.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    AttachmentDto,
+    DepartmentDto,
+    EmployeeDto,
+    NomenclatureDepartmentDto,
+    SummaryNomenclatureDepartmentStatus1,
+    UserInfoDto,
+)
+
+
+class Status7(Enum):
+    """
+    Статус
+    """
+
+    DRAFT = "DRAFT"
+    NEW = "NEW"
+    SIGNING = "SIGNING"
+    SIGNED = "SIGNED"
+    STATEMENT = "STATEMENT"
+    APPROVED = "APPROVED"
+    REJECT = "REJECT"
+    CANCEL = "CANCEL"
+
+
+class NomenclatureType(Enum):
+    """
+    Тип номенклатуры
+    """
+
+    MAIN = "MAIN"
+    ADDITIONAL = "ADDITIONAL"
+
+
+class Type13(Enum):
+    """
+    Тип этапа процесса
+    """
+
+    NEW = "NEW"
+    SIGNING = "SIGNING"
+    STATEMENT = "STATEMENT"
+
+
+class SummaryCancelRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    comment: Annotated[str, Field(min_length=1)]
+
+
+class CreateSummaryNomenclatureDepartmentDto(BaseModel):
+    """
+    DTO для создания сводной номенклатуры дел
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    year: Annotated[int, Field(description="Год номенклатуры")]
+    nomenclatureType: Annotated[NomenclatureType, Field(description="Тип номенклатуры")]
+    registrationNumber: str | None = None
+    regDate: datetime | None = None
+
+
+class OperationType1(Enum):
+    """
+    Тип операции
+    """
+
+    SUMMARY_NOMENCLATURE_DEPARTMENT_READ = "SUMMARY_NOMENCLATURE_DEPARTMENT_READ"
+    SUMMARY_NOMENCLATURE_DEPARTMENT_UPDATE = "SUMMARY_NOMENCLATURE_DEPARTMENT_UPDATE"
+    SUMMARY_NOMENCLATURE_DEPARTMENT_PROCESS_EXECUTORS_UPDATE = (
+        "SUMMARY_NOMENCLATURE_DEPARTMENT_PROCESS_EXECUTORS_UPDATE"
+    )
+    SUMMARY_NOMENCLATURE_DEPARTMENT_PROCESS_ITEM_UPDATE = (
+        "SUMMARY_NOMENCLATURE_DEPARTMENT_PROCESS_ITEM_UPDATE"
+    )
+    SUMMARY_NOMENCLATURE_DEPARTMENT_START = "SUMMARY_NOMENCLATURE_DEPARTMENT_START"
+    SUMMARY_NOMENCLATURE_DEPARTMENT_SIGNING = "SUMMARY_NOMENCLATURE_DEPARTMENT_SIGNING"
+    SUMMARY_NOMENCLATURE_DEPARTMENT_STATEMENT = (
+        "SUMMARY_NOMENCLATURE_DEPARTMENT_STATEMENT"
+    )
+    SUMMARY_NOMENCLATURE_DEPARTMENT_CANCEL = "SUMMARY_NOMENCLATURE_DEPARTMENT_CANCEL"
+    SUMMARY_NOMENCLATURE_DEPARTMENT_CREATE_NOMENCLATURE = (
+        "SUMMARY_NOMENCLATURE_DEPARTMENT_CREATE_NOMENCLATURE"
+    )
+    SUMMARY_NOMENCLATURE_DEPARTMENT_INTRODUCTION_CREATE = (
+        "SUMMARY_NOMENCLATURE_DEPARTMENT_INTRODUCTION_CREATE"
+    )
+    SUMMARY_NOMENCLATURE_DEPARTMENT_INTRODUCTION_DELETE = (
+        "SUMMARY_NOMENCLATURE_DEPARTMENT_INTRODUCTION_DELETE"
+    )
+
+
+class SummaryNomDepOperation(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    operationType: Annotated[OperationType1, Field(description="Тип операции")]
+    body: Annotated[Any | None, Field(description="Тело операции")] = None
+
+
+class NomenclatureType2(Enum):
+    MAIN = "MAIN"
+    ADDITIONAL = "ADDITIONAL"
+
+
+class SummaryNomenclatureDepartmentFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    year: int | None = None
+    nomenclatureType: NomenclatureType2 | None = None
+    status: SummaryNomenclatureDepartmentStatus1 | None = None
+    currentUserExecutor: bool | None = None
+
+
+class Operation(Enum):
+    """
+    Перечисления доступных операций над сущностями в сводной номенклатуре
+    """
+
+    SUMMARY_NOMENCLATURE_DEPARTMENT_READ = "SUMMARY_NOMENCLATURE_DEPARTMENT_READ"
+    SUMMARY_NOMENCLATURE_DEPARTMENT_UPDATE = "SUMMARY_NOMENCLATURE_DEPARTMENT_UPDATE"
+    SUMMARY_NOMENCLATURE_DEPARTMENT_PROCESS_EXECUTORS_UPDATE = (
+        "SUMMARY_NOMENCLATURE_DEPARTMENT_PROCESS_EXECUTORS_UPDATE"
+    )
+    SUMMARY_NOMENCLATURE_DEPARTMENT_PROCESS_ITEM_UPDATE = (
+        "SUMMARY_NOMENCLATURE_DEPARTMENT_PROCESS_ITEM_UPDATE"
+    )
+    SUMMARY_NOMENCLATURE_DEPARTMENT_START = "SUMMARY_NOMENCLATURE_DEPARTMENT_START"
+    SUMMARY_NOMENCLATURE_DEPARTMENT_SIGNING = "SUMMARY_NOMENCLATURE_DEPARTMENT_SIGNING"
+    SUMMARY_NOMENCLATURE_DEPARTMENT_STATEMENT = (
+        "SUMMARY_NOMENCLATURE_DEPARTMENT_STATEMENT"
+    )
+    SUMMARY_NOMENCLATURE_DEPARTMENT_CANCEL = "SUMMARY_NOMENCLATURE_DEPARTMENT_CANCEL"
+    SUMMARY_NOMENCLATURE_DEPARTMENT_CREATE_NOMENCLATURE = (
+        "SUMMARY_NOMENCLATURE_DEPARTMENT_CREATE_NOMENCLATURE"
+    )
+    SUMMARY_NOMENCLATURE_DEPARTMENT_INTRODUCTION_CREATE = (
+        "SUMMARY_NOMENCLATURE_DEPARTMENT_INTRODUCTION_CREATE"
+    )
+    SUMMARY_NOMENCLATURE_DEPARTMENT_INTRODUCTION_DELETE = (
+        "SUMMARY_NOMENCLATURE_DEPARTMENT_INTRODUCTION_DELETE"
+    )
+
+
+class SummaryNomenclatureDepartmentPermission(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    operation: Annotated[
+        Operation | None,
+        Field(
+            description="Перечисления доступных операций над сущностями в сводной номенклатуре"
+        ),
+    ] = None
+    employees: Annotated[set[UUID] | None, Field()] = None
+
+
+class Include4(Enum):
+    NOMENCLATURE_DEPARTMENT = "NOMENCLATURE_DEPARTMENT"
+    DEPARTMENT = "DEPARTMENT"
+
+
+class SummaryNomenclatureDepartmentLinkFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    includes: list[Include4] | None = None
+    name: str | None = None
+
+
+class ActionType(Enum):
+    CREATE = "CREATE"
+    UPDATE = "UPDATE"
+    REJECT = "REJECT"
+    CREATED = "CREATED"
+    STEP_END = "STEP_END"
+    STEP_START = "STEP_START"
+    PROCESS_START = "PROCESS_START"
+    NOMENCLATURES_CREATED = "NOMENCLATURES_CREATED"
+    MAIN_FIELDS_UPDATE = "MAIN_FIELDS_UPDATE"
+    PROCESS_ITEM_UPDATE = "PROCESS_ITEM_UPDATE"
+    PROCESS_ITEM_EXECUTORS_UPDATE = "PROCESS_ITEM_EXECUTORS_UPDATE"
+    START = "START"
+    SIGNING = "SIGNING"
+    STATEMENT = "STATEMENT"
+    DELETE = "DELETE"
+    CANCEL = "CANCEL"
+    ACTION = "ACTION"
+    ATTACHMENT_PRINT = "ATTACHMENT_PRINT"
+    ATTACHMENT_ADDED = "ATTACHMENT_ADDED"
+    ATTACHMENT_DELETED = "ATTACHMENT_DELETED"
+    INTRODUCTION_CREATE = "INTRODUCTION_CREATE"
+    INTRODUCTION_DELETE = "INTRODUCTION_DELETE"
+    INTRODUCTION_STAMP = "INTRODUCTION_STAMP"
+
+
+class SummaryNomDepHistoryActionData(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    actionType: ActionType | None = None
+    data: dict[str, Any] | None = None
+
+
+class SummaryNomenclatureDepartmentIntroductionDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор листа ознакомления")
+    ] = None
+    createDate: Annotated[
+        datetime | None, Field(description="Дата создания ознакомления")
+    ] = None
+    author: Annotated[
+        UserInfoDto | None, Field(description="Автор создания ознакомления")
+    ] = None
+    summaryNomenclatureDepartmentId: Annotated[
+        UUID | None, Field(description="Идентификатор сводной номенклатуры")
+    ] = None
+    introductionDate: Annotated[
+        datetime | None, Field(description="Дата ознакомления")
+    ] = None
+    introductionStamp: Annotated[
+        UserInfoDto | None,
+        Field(description="Сотрудник который проставил отметку об ознакомлении"),
+    ] = None
+    comment: Annotated[
+        str | None, Field(description="Комментарий при постановке на ознакомление")
+    ] = None
+
+
+class SummaryNomenclatureDepartmentDto(BaseModel):
+    """
+    DTO для сущности 'Карточка сводной номенклатуры'
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор")] = None
+    organizationId: Annotated[
+        str | None, Field(description="Идентификатор организации")
+    ] = None
+    createDate: Annotated[
+        datetime | None, Field(description="Дата создания/регистрации документа")
+    ] = None
+    authorId: Annotated[UUID, Field(description="Идентификатор автора")]
+    author: Annotated[EmployeeDto | None, Field(description="Информация об авторе")] = (
+        None
+    )
+    status: Annotated[Status7 | None, Field(description="Статус")] = None
+    year: Annotated[int, Field(description="Год номенклатуры")]
+    size: Annotated[int | None, Field(description="Количество записей")] = None
+    nomenclatureType: Annotated[
+        NomenclatureType | None, Field(description="Тип номенклатуры")
+    ] = None
+    registrationNumber: Annotated[
+        str | None, Field(description="Регистрационный номер сводной номенклатуры")
+    ] = None
+    regDate: Annotated[datetime | None, Field(description="Дата регистрации")] = None
+    description: Annotated[
+        str | None,
+        Field(description="Основание (нормативные акты, определяющие сроки хранения)"),
+    ] = None
+    created: Annotated[bool | None, Field(description="Признак создания дел")] = None
+    process: Annotated[
+        SummaryNomenclatureDepartmentProcessDto | None,
+        Field(description="Процесс сводной номенклатуры"),
+    ] = None
+    processId: UUID | None = None
+    attachment: AttachmentDto | None = None
+
+
+class SummaryNomenclatureDepartmentProcessDto(BaseModel):
+    """
+    DTO для процесса сводной номенклатуры
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор процесса")] = None
+    organizationId: Annotated[
+        str | None, Field(description="Идентификатор организации")
+    ] = None
+    currentId: Annotated[
+        UUID | None, Field(description="Идентификатор текущего этапа процесса")
+    ] = None
+    nextId: Annotated[
+        UUID | None, Field(description="Идентификатор следующего этапа процесса")
+    ] = None
+    completed: Annotated[
+        bool | None, Field(description="Признак прошел ли документ все этапы")
+    ] = None
+    started: Annotated[
+        bool | None, Field(description="Признак начал ли документ движение по маршруту")
+    ] = None
+    stepCount: Annotated[
+        int | None, Field(description="Количество этапов в процессе")
+    ] = None
+    items: list[SummaryNomenclatureDepartmentProcessItemDto] | None = None
+
+
+class SummaryNomenclatureDepartmentProcessExecutorDto(BaseModel):
+    """
+    DTO для исполнителя процесса сводной номенклатуры
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор исполнителя процесса")
+    ] = None
+    organizationId: Annotated[
+        str | None, Field(description="Идентификатор организации")
+    ] = None
+    itemId: Annotated[
+        UUID | None, Field(description="Идентификатор элемента процесса")
+    ] = None
+    itemOrgId: Annotated[
+        str | None, Field(description="Идентификатор организации элемента процесса")
+    ] = None
+    employeeId: Annotated[
+        UUID | None, Field(description="Идентификатор сотрудника")
+    ] = None
+    employeeOrgId: Annotated[
+        str | None, Field(description="Идентификатор организации сотрудника")
+    ] = None
+    employee: Annotated[
+        EmployeeDto | None, Field(description="Информация о сотруднике")
+    ] = None
+    comment: str | None = None
+    result: bool | None = None
+
+
+class SummaryNomenclatureDepartmentProcessItemDto(BaseModel):
+    """
+    DTO для элемента процесса сводной номенклатуры
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор элемента процесса")] = (
+        None
+    )
+    organizationId: Annotated[
+        str | None, Field(description="Идентификатор организации")
+    ] = None
+    type: Annotated[Type13 | None, Field(description="Тип этапа процесса")] = None
+    orderNumber: Annotated[int | None, Field(description="Порядковый номер этапа")] = (
+        None
+    )
+    completed: Annotated[bool | None, Field(description="Признак завершения этапа")] = (
+        None
+    )
+    completedDate: Annotated[
+        datetime | None, Field(description="Дата завершения этапа")
+    ] = None
+    comment: Annotated[str | None, Field(description="Комментарий")] = None
+    oneForAll: Annotated[bool | None, Field(description="Признак 'один за всех'")] = (
+        None
+    )
+    executorsCount: int | None = None
+    started: bool | None = None
+    executors: list[SummaryNomenclatureDepartmentProcessExecutorDto] | None = None
+
+
+class SliceDtoSummaryNomenclatureDepartmentDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[SummaryNomenclatureDepartmentDto] | None = None
+
+
+class SliceDtoSummaryNomenclatureDepartmentLinkDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[SummaryNomenclatureDepartmentLinkDto] | None = None
+
+
+class SummaryNomenclatureDepartmentLinkDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    summaryNomenclatureId: UUID | None = None
+    nomenclatureDepartmentId: UUID | None = None
+    summaryOrganizationId: str | None = None
+    nomenclatureOrganizationId: str | None = None
+    active: bool | None = None
+    nomenclatureDepartment: NomenclatureDepartmentDto | None = None
+    department: DepartmentDto | None = None
+
+
+class SliceDtoSummaryNomenclatureDepartmentHistoryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[SummaryNomenclatureDepartmentHistoryDto] | None = None
+
+
+class SummaryNomenclatureDepartmentHistoryDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор истории")] = None
+    organizationId: Annotated[
+        str | None, Field(description="Идентификатор организации")
+    ] = None
+    summaryNomenclatureDepartmentId: Annotated[
+        UUID | None, Field(description="Идентификатор сводной номенклатуры")
+    ] = None
+    summaryNomenclatureDepartmentOrgId: Annotated[
+        str | None, Field(description="Идентификатор организации сводной номенклатуры")
+    ] = None
+    author: Annotated[UserInfoDto | None, Field(description="Автор")] = None
+    createDate: Annotated[datetime | None, Field(description="Дата создания")] = None
+    data: Annotated[
+        list[SummaryNomDepHistoryActionData] | None, Field(description="Данные истории")
+    ] = None
+
+
+class SummaryNomenclatureDepartmentWithPermission(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    nomenclature: SummaryNomenclatureDepartmentDto | None = None
+    permission: list[SummaryNomenclatureDepartmentPermission] | None = None
+
@@ -0,0 +1,37 @@
+# src/edms_assistant/infrastructure/resources_openapi/tematika.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class SubjectRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID
+    name: str
+    code: int
+    parentSubjectId: UUID | None = None
+    active: bool
+
+
+class Include5(Enum):
+    PARENT_SUBJECT = "PARENT_SUBJECT"
+
+
+class SubjectFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    includes: Annotated[
+        list[Include5] | None,
+        Field(description="Список моделей которые могу быть добавлены при отображении"),
+    ] = None
+
@@ -0,0 +1,29 @@
+# src/edms_assistant/infrastructure/resources_openapi/tipovye_kontrolnye_tochki.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class TypicalControlPointDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None, Field(description="Идентификатор типовой контрольной точки")
+    ] = None
+    name: Annotated[
+        str | None, Field(description="Текст типовой контрольной точки")
+    ] = None
+    active: Annotated[
+        bool | None, Field(description="Признак активно ли типовая контрольная точка")
+    ] = None
+    createDate: datetime | None = None
+
@@ -0,0 +1,42 @@
+# src/edms_assistant/infrastructure/resources_openapi/tipovye_kratkie_soderzhaniia_porucheniia.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class TypicalSummaryTaskRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID
+    summaryTaskText: str
+    active: bool
+
+
+class TypicalSummaryTaskDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[
+        UUID | None,
+        Field(description="Идентификатор типового краткого содержания для поручения"),
+    ] = None
+    summaryTaskText: Annotated[
+        str | None,
+        Field(description="Текст типового краткого содержания для поручения"),
+    ] = None
+    active: Annotated[
+        bool | None,
+        Field(
+            description="Признак активно ли типовое краткое содержание для поручения"
+        ),
+    ] = None
+    createDate: datetime | None = None
+
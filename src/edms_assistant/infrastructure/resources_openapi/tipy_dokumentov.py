@@ -0,0 +1,34 @@
+# src/edms_assistant/infrastructure/resources_openapi/tipy_dokumentov.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import DocCategory
+
+
+class DocumentTypeRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: int | None = None
+    typeName: str | None = None
+    docCategoryConst: DocCategory | None = None
+    objectType: Annotated[str | None, Field(max_length=3, min_length=3)] = None
+    active: bool | None = None
+
+
+class DocumentTypeFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    typeName: str | None = None
+    docCategoryConst: list[DocCategory] | None = None
+    active: bool | None = None
+
@@ -0,0 +1,47 @@
+# src/edms_assistant/infrastructure/resources_openapi/tipy_kontrolia.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    Employee,
+    EmployeeDto,
+)
+
+
+class ControlTypeRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID, Field(description="Идентификатор типа контроля")]
+    employeeId: Annotated[
+        UUID | None, Field(description="Идентификатор сотрудника")
+    ] = None
+    employee: EmployeeDto | None = None
+    name: Annotated[str, Field(description="Наименование типа контроля")]
+    shortName: Annotated[str, Field(description="Краткое наименование типа контроля")]
+    term: Annotated[int, Field(description="Срок контроля (кол-во дней)")]
+    active: Annotated[bool, Field(description="Признак активен ли тип контроля")]
+
+
+class ControlType(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    name: Annotated[str, Field(max_length=255, min_length=0)]
+    shortName: Annotated[str, Field(max_length=255, min_length=0)]
+    term: Annotated[int | None, Field(ge=0)] = None
+    employeeId: UUID | None = None
+    employeeOrgId: str | None = None
+    employee: Employee | None = None
+    active: bool
+    createDate: datetime | None = None
+
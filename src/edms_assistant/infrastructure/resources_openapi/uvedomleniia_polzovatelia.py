@@ -0,0 +1,66 @@
+# src/edms_assistant/infrastructure/resources_openapi/uvedomleniia_polzovatelia.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class UserNotificationStatDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    total: int | None = None
+    read: int | None = None
+
+
+class UserNotificationFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    read: bool | None = None
+
+
+class Type40(Enum):
+    DOCUMENT = "DOCUMENT"
+    REPORT = "REPORT"
+    NOMENCLATURE_DEPARTMENT = "NOMENCLATURE_DEPARTMENT"
+    SUMMARY_NOMENCLATURE = "SUMMARY_NOMENCLATURE"
+    DESTRUCTION_ACT = "DESTRUCTION_ACT"
+    ACCEPTANCE_INVENTORY = "ACCEPTANCE_INVENTORY"
+    OTHER = "OTHER"
+
+
+class UserNotificationDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    employeeId: UUID | None = None
+    createDate: datetime | None = None
+    label: str | None = None
+    text: str | None = None
+    documentId: UUID | None = None
+    reportId: UUID | None = None
+    nomenclatureDepartmentId: UUID | None = None
+    summaryNomenclatureId: UUID | None = None
+    destructionActId: UUID | None = None
+    acceptanceInventoryId: UUID | None = None
+    type: Type40 | None = None
+    read: bool | None = None
+
+
+class SliceDtoUserNotificationDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    number: int | None = None
+    size: int | None = None
+    numberOfElements: int | None = None
+    hasNext: bool | None = None
+    content: list[UserNotificationDto] | None = None
+
@@ -0,0 +1,30 @@
+# src/edms_assistant/infrastructure/resources_openapi/vnutrennie_priglashennye.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    DocumentDto,
+    UserInfoDto,
+)
+
+
+class DocumentInvitedDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="Идентификатор приглашенного")] = None
+    employee: UserInfoDto | None = None
+    documentId: Annotated[UUID | None, Field(description="Идентификатор документа")] = (
+        None
+    )
+    document: Annotated[DocumentDto | None, Field(description="Документ")] = None
+
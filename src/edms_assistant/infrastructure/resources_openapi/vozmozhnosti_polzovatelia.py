@@ -0,0 +1,499 @@
+# src/edms_assistant/infrastructure/resources_openapi/vozmozhnosti_polzovatelia.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    DestructionActStatus1,
+    DocCategory,
+    DocumentCategory,
+    Merge1,
+    RoleDto,
+    Status,
+    Status2,
+    Status8,
+    SummaryNomenclatureDepartmentStatus1,
+    Type12,
+    Type4,
+)
+
+
+class Type18(Enum):
+    """
+    Тип
+    """
+
+    DIRECTORY = "DIRECTORY"
+    DOCUMENT = "DOCUMENT"
+    NOMENCLATURE_DEPARTMENT = "NOMENCLATURE_DEPARTMENT"
+    SUMMARY_NOMENCLATURE_DEPARTMENT = "SUMMARY_NOMENCLATURE_DEPARTMENT"
+    DESTRUCTION_ACT = "DESTRUCTION_ACT"
+    ACCEPTANCE_INVENTORY = "ACCEPTANCE_INVENTORY"
+    NOMENCLATURE_AFFAIR = "NOMENCLATURE_AFFAIR"
+    MINI_DOCUMENT = "MINI_DOCUMENT"
+    TASK = "TASK"
+    CONTROL_POINT = "CONTROL_POINT"
+
+
+class DocStatus(Enum):
+    """
+    Статус документа
+    """
+
+    DRAFT = "DRAFT"
+    NEW = "NEW"
+    STATEMENT = "STATEMENT"
+    APPROVED = "APPROVED"
+    SIGNING = "SIGNING"
+    SIGNED = "SIGNED"
+    AGREEMENT = "AGREEMENT"
+    AGREED = "AGREED"
+    REVIEW = "REVIEW"
+    REVIEWED = "REVIEWED"
+    REGISTRATION = "REGISTRATION"
+    REGISTERED = "REGISTERED"
+    EXECUTION = "EXECUTION"
+    EXECUTED = "EXECUTED"
+    DISPATCH = "DISPATCH"
+    SENT = "SENT"
+    REJECT = "REJECT"
+    CANCEL = "CANCEL"
+    PREPARATION = "PREPARATION"
+    PAPERWORK = "PAPERWORK"
+    FORMALIZED = "FORMALIZED"
+    ACCEPTANCE = "ACCEPTANCE"
+    ACCEPTED = "ACCEPTED"
+    CONTRACT_EXECUTION = "CONTRACT_EXECUTION"
+    CONTRACT_CLOSED = "CONTRACT_CLOSED"
+    ARCHIVE = "ARCHIVE"
+    DELETED = "DELETED"
+    ALL = "ALL"
+
+
+class ResolvePolicy(Enum):
+    """
+    Политики обработки доступа
+    """
+
+    ANY = "ANY"
+    MERGE = "MERGE"
+
+
+class CreateType3(Enum):
+    """
+    Типсоздания документа
+    """
+
+    MANUAL = "MANUAL"
+    AISMV = "AISMV"
+    DIRECTUM = "DIRECTUM"
+
+
+class NomenclatureDepartmentStatus(Enum):
+    """
+    Статус нумераторы подразделения
+    """
+
+    NEW = "NEW"
+    SIGNING = "SIGNING"
+    SIGNED = "SIGNED"
+    AGREEMENT = "AGREEMENT"
+    AGREED = "AGREED"
+    DELETED = "DELETED"
+    CANCEL = "CANCEL"
+
+
+class SummaryNomenclatureDepartmentStatus(Enum):
+    """
+    Сводный статус подразделения
+    """
+
+    DRAFT = "DRAFT"
+    NEW = "NEW"
+    SIGNING = "SIGNING"
+    SIGNED = "SIGNED"
+    STATEMENT = "STATEMENT"
+    APPROVED = "APPROVED"
+    REJECT = "REJECT"
+    CANCEL = "CANCEL"
+
+
+class DestructionActStatus(Enum):
+    """
+    Статус акта уничтожения
+    """
+
+    NEW = "NEW"
+    AGREEMENT = "AGREEMENT"
+    AGREED = "AGREED"
+    SIGNING = "SIGNING"
+    SIGNED = "SIGNED"
+    STATEMENT = "STATEMENT"
+    APPROVED = "APPROVED"
+    CANCEL = "CANCEL"
+
+
+class Merge(Enum):
+    """
+    Политика обработки слияния ИД
+    """
+
+    ALL = "ALL"
+    SELF = "SELF"
+    SELF_AND_IO = "SELF_AND_IO"
+    SUBORDINATES_AND_SELF = "SUBORDINATES_AND_SELF"
+    SUBORDINATES_AND_SELF_AND_IO = "SUBORDINATES_AND_SELF_AND_IO"
+
+
+class RoleMergeDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    roleId: Annotated[UUID | None, Field(description="ИД роли")] = None
+    merge: Annotated[
+        Merge | None, Field(description="Политика обработки слияния ИД")
+    ] = None
+
+
+class PresetPermissionMergeRole(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    role: str | None = None
+    merge: Merge1 | None = None
+
+
+class PresetPermissionRoleField(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    roles: Annotated[list[str] | None, Field(description="Роли")] = None
+    mergeRoles: Annotated[
+        list[PresetPermissionMergeRole] | None,
+        Field(description="Политика обработки слияния ИД"),
+    ] = None
+    resolvePolicy: Annotated[
+        ResolvePolicy | None, Field(description="Политики обработки доступа")
+    ] = None
+
+
+class PresetPermissionSetting(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    type: Annotated[Type18 | None, Field(description="Тип")] = None
+    roleField: Annotated[
+        PresetPermissionRoleField | None,
+        Field(
+            description="Роли, Политика обработки слияния ИД, Политики обработки доступа"
+        ),
+    ] = None
+    processCompleted: Annotated[
+        bool | None, Field(description="Признак выполнения процесса")
+    ] = None
+    currentStepCompleted: Annotated[
+        bool | None, Field(description="Признак выполнения текущего этапа")
+    ] = None
+    lastStep: Annotated[
+        bool | None,
+        Field(description="Признак того что текущий этап является последним"),
+    ] = None
+    processStarted: Annotated[
+        bool | None, Field(description="Признак того что процесс начал выполнение")
+    ] = None
+    onControl: Annotated[
+        bool | None, Field(description="Документ стоит на контроле")
+    ] = None
+    taskOnControl: Annotated[
+        bool | None, Field(description="Поручение стоит на контроле")
+    ] = None
+    hasRegNumber: Annotated[bool | None, Field(description="Регномер")] = None
+    documentHasItems: Annotated[
+        list[Type4] | None,
+        Field(description="Типы этапов в документе при которых доступно"),
+    ] = None
+    createType: Annotated[
+        CreateType3 | None, Field(description="Типсоздания документа")
+    ] = None
+    taskCompleted: Annotated[bool | None, Field(description="Поручение исполненно")] = (
+        None
+    )
+    taskOnRevision: Annotated[
+        bool | None, Field(description="Поручение на доработке")
+    ] = None
+    childTask: Annotated[bool | None, Field(description="Дочернее поручение")] = None
+    taskType: Annotated[Type12 | None, Field(description="Тип поручения")] = None
+    taskBeginExecution: Annotated[
+        bool | None, Field(description="Поручение начало исполнение")
+    ] = None
+    archive: Annotated[
+        bool | None, Field(description="Документ находится в архиве")
+    ] = None
+    taskCreateByPeriod: Annotated[
+        bool | None,
+        Field(description="Поручение создано для из-за переодического выполнения"),
+    ] = None
+    hasPeriodTasks: Annotated[
+        bool | None,
+        Field(
+            description="На основании этого поручения были созданны переодические поручения"
+        ),
+    ] = None
+    docStatus: Annotated[
+        Status2 | None,
+        Field(description="Перечисление для описания статусов документов"),
+    ] = None
+
+
+class PresetPermissionStatusRoleFieldAcceptanceInventoryStatus(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    status: Status | None = None
+    roleField: PresetPermissionRoleField | None = None
+
+
+class PresetPermissionStatusRoleFieldDestructionActStatus(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    status: DestructionActStatus1 | None = None
+    roleField: PresetPermissionRoleField | None = None
+
+
+class PresetPermissionStatusRoleFieldNomenclatureDepartmentStatus(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    status: Status8 | None = None
+    roleField: PresetPermissionRoleField | None = None
+
+
+class PresetPermissionStatusRoleFieldSummaryNomenclatureDepartmentStatus(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    status: SummaryNomenclatureDepartmentStatus1 | None = None
+    roleField: PresetPermissionRoleField | None = None
+
+
+class PresetPermissionString(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    permission: str | None = None
+    data: list[str] | None = None
+
+
+class PresetPermissionTaskDocStatus(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    status: Annotated[
+        Status2 | None,
+        Field(description="Перечисление для описания статусов документов"),
+    ] = None
+    taskTypes: list[PresetPermissionSetting] | None = None
+
+
+class PermissionDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: Annotated[UUID | None, Field(description="ИД")] = None
+    systemName: Annotated[str | None, Field(description="Системное имя")] = None
+    type: Annotated[Type18 | None, Field(description="Тип")] = None
+    docStatus: Annotated[DocStatus | None, Field(description="Статус документа")] = None
+    docCategory: Annotated[
+        DocumentCategory | None, Field(description="Тип документа")
+    ] = None
+    mergeRoles: Annotated[
+        list[RoleMergeDto] | None, Field(description="Политика обработки слияния ИД")
+    ] = None
+    processCompleted: Annotated[
+        bool | None, Field(description="Признак выполнения процесса")
+    ] = None
+    currentStepCompleted: Annotated[
+        bool | None, Field(description="Признак выполнения текущего этапа")
+    ] = None
+    lastStep: Annotated[
+        bool | None,
+        Field(description="Признак того что текущий этап является последним"),
+    ] = None
+    processStarted: Annotated[
+        bool | None, Field(description="Признак того что процесс начал выполнение")
+    ] = None
+    onControl: Annotated[
+        bool | None, Field(description="Документ стоит на контроле")
+    ] = None
+    taskOnControl: Annotated[
+        bool | None, Field(description="Поручение стоит на контроле")
+    ] = None
+    resolvePolicy: Annotated[
+        ResolvePolicy | None, Field(description="Политики обработки доступа")
+    ] = None
+    hasRegNumber: Annotated[bool | None, Field(description="Регномер")] = None
+    documentHasItems: Annotated[
+        list[Type4] | None,
+        Field(description="Типы этапов в документе при которых доступно"),
+    ] = None
+    createType: Annotated[
+        CreateType3 | None, Field(description="Типсоздания документа")
+    ] = None
+    taskCompleted: Annotated[bool | None, Field(description="Поручение исполненно")] = (
+        None
+    )
+    taskOnRevision: Annotated[
+        bool | None, Field(description="Поручение на доработке")
+    ] = None
+    childTask: Annotated[bool | None, Field(description="Дочернее поручение")] = None
+    taskType: Annotated[Type12 | None, Field(description="Тип поручения")] = None
+    taskBeginExecution: Annotated[
+        bool | None, Field(description="Поручение начало исполнение")
+    ] = None
+    archive: Annotated[
+        bool | None, Field(description="Документ находится в архиве")
+    ] = None
+    taskCreateByPeriod: Annotated[
+        bool | None,
+        Field(description="Поручение создано для из-за переодического выполнения"),
+    ] = None
+    hasPeriodTasks: Annotated[
+        bool | None,
+        Field(
+            description="На основании этого поручения были созданны переодические поручения"
+        ),
+    ] = None
+    nomenclatureDepartmentStatus: Annotated[
+        NomenclatureDepartmentStatus | None,
+        Field(description="Статус нумераторы подразделения"),
+    ] = None
+    summaryNomenclatureDepartmentStatus: Annotated[
+        SummaryNomenclatureDepartmentStatus | None,
+        Field(description="Сводный статус подразделения"),
+    ] = None
+    destructionActStatus: Annotated[
+        DestructionActStatus | None, Field(description="Статус акта уничтожения")
+    ] = None
+    acceptanceInventoryStatus: Status | None = None
+
+
+class PresetPermissionDocCategoryPresetPermissionSetting(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    docCategoryConst: DocCategory | None = None
+    statuses: list[PresetPermissionSetting] | None = None
+
+
+class PresetPermissionDocCategoryPresetPermissionTaskDocStatus(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    docCategoryConst: DocCategory | None = None
+    statuses: list[PresetPermissionTaskDocStatus] | None = None
+
+
+class PresetPermissionPresetPermissionDocCategoryPresetPermissionSetting(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    permission: str | None = None
+    data: list[PresetPermissionDocCategoryPresetPermissionSetting] | None = None
+
+
+class PresetPermissionPresetPermissionDocCategoryPresetPermissionTaskDocStatus(
+    BaseModel
+):
+    model_config = ConfigDict(defer_build=True)
+
+    permission: str | None = None
+    data: list[PresetPermissionDocCategoryPresetPermissionTaskDocStatus] | None = None
+
+
+class PresetPermissionPresetPermissionRoleField(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    permission: str | None = None
+    data: list[PresetPermissionRoleField] | None = None
+
+
+class PresetPermissionPresetPermissionStatusRoleFieldAcceptanceInventoryStatus(
+    BaseModel
+):
+    model_config = ConfigDict(defer_build=True)
+
+    permission: str | None = None
+    data: list[PresetPermissionStatusRoleFieldAcceptanceInventoryStatus] | None = None
+
+
+class PresetPermissionPresetPermissionStatusRoleFieldDestructionActStatus(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    permission: str | None = None
+    data: list[PresetPermissionStatusRoleFieldDestructionActStatus] | None = None
+
+
+class PresetPermissionPresetPermissionStatusRoleFieldNomenclatureDepartmentStatus(
+    BaseModel
+):
+    model_config = ConfigDict(defer_build=True)
+
+    permission: str | None = None
+    data: list[PresetPermissionStatusRoleFieldNomenclatureDepartmentStatus] | None = (
+        None
+    )
+
+
+class PresetPermissionPresetPermissionStatusRoleFieldSummaryNomenclatureDepartmentStatus(
+    BaseModel
+):
+    model_config = ConfigDict(defer_build=True)
+
+    permission: str | None = None
+    data: (
+        list[PresetPermissionStatusRoleFieldSummaryNomenclatureDepartmentStatus] | None
+    ) = None
+
+
+class PermissionRoleDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    role: RoleDto | None = None
+    roleId: UUID | None = None
+    permission: PermissionDto | None = None
+    permissionId: UUID | None = None
+
+
+class PresetPermissionDefinition(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    documents: (
+        list[PresetPermissionPresetPermissionDocCategoryPresetPermissionSetting] | None
+    ) = None
+    tasks: (
+        list[PresetPermissionPresetPermissionDocCategoryPresetPermissionTaskDocStatus]
+        | None
+    ) = None
+    directories: list[PresetPermissionString] | None = None
+    nomenclatureAffairs: list[PresetPermissionPresetPermissionRoleField] | None = None
+    miniDocuments: list[PresetPermissionPresetPermissionRoleField] | None = None
+    contractControlPoints: (
+        list[PresetPermissionPresetPermissionDocCategoryPresetPermissionSetting] | None
+    ) = None
+    acceptanceInventories: (
+        list[PresetPermissionPresetPermissionStatusRoleFieldAcceptanceInventoryStatus]
+        | None
+    ) = None
+    summaryNomenclatureDepartments: (
+        list[
+            PresetPermissionPresetPermissionStatusRoleFieldSummaryNomenclatureDepartmentStatus
+        ]
+        | None
+    ) = None
+    nomenclatureDepartments: (
+        list[
+            PresetPermissionPresetPermissionStatusRoleFieldNomenclatureDepartmentStatus
+        ]
+        | None
+    ) = None
+    destructionAct: (
+        list[PresetPermissionPresetPermissionStatusRoleFieldDestructionActStatus] | None
+    ) = None
+
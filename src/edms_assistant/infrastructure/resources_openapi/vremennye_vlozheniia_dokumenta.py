@@ -0,0 +1,32 @@
+# src/edms_assistant/infrastructure/resources_openapi/vremennye_vlozheniia_dokumenta.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from .common import (
+    AttachmentDocumentType1,
+    AttachmentSignature,
+    Type1,
+)
+
+
+class TemporaryAttachmentDto(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    name: str | None = None
+    uploadDate: datetime | None = None
+    size: int | None = None
+    type: Type1 | None = None
+    signs: list[AttachmentSignature] | None = None
+    attachmentDocumentType: AttachmentDocumentType1 | None = None
+
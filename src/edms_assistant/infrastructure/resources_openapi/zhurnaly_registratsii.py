@@ -0,0 +1,24 @@
+# src/edms_assistant/infrastructure/resources_openapi/zhurnaly_registratsii.py
+from __future__ import annotations
+
+# generated by datamodel-codegen:
+#   filename:  openapi_spec.json
+#   timestamp: 2025-10-30T06:21:23+00:00
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+
+class RegistrationJournal(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UUID | None = None
+    journalName: Annotated[str, Field(max_length=255, min_length=0)]
+    counterValue: int
+    active: bool
+    createDate: datetime | None = None
+
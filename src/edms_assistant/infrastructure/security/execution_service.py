@@ -1,8 +1,10 @@
 # src/edms_assistant/infrastructure/security/execution_service.py
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from uuid import UUID
 
+from langchain_core.runnables import RunnableConfig
+
 # Импортируем инструменты
 from src.edms_assistant.core.tools.document_tool import get_document_tool
 from src.edms_assistant.core.tools.attachment_tool import summarize_attachment_tool
@@ -21,7 +23,14 @@ class ExecutionService:
     def __init__(self, tools: Dict[str, Any] = None):
         self.tools = tools or ALL_TOOLS
 
-    async def execute_tool(self, tool_name: str, args: Dict[str, Any], user_id: UUID, service_token: str) -> Any:
+    async def execute_tool(
+            self,
+            tool_name: str,
+            args: Dict[str, Any],
+            user_id: UUID,
+            service_token: str,
+            config: Optional[RunnableConfig] = None,
+    ) -> Any:
         # 1. Проверка токена
         if not service_token or len(service_token) < 10:
             raise ValueError("Invalid service_token")
@@ -38,7 +47,8 @@ class ExecutionService:
         if not tool:
             raise ValueError(f"Tool {tool_name} not found")
 
-        result = await tool.ainvoke(args)
+        # config узла графа несёт загрузчик запроса: чтения EDMS не повторяются в пределах хода
+        result = await tool.ainvoke(args, config=config)
         return result
 
 # Глобальный экземпляр
@@ -0,0 +1,127 @@
+# src/edms_assistant/infrastructure/storage/answer_cache.py
+"""
+Кэш ответов на типовые вопросы о документе («статус», «кто автор» и т.п.).
+
+Ключ — (токен вызывающего, document_id, нормализованный intent вопроса), поэтому
+пользователи с разными правами никогда не видят ответы друг друга. Вместе с ответом
+хранится штамп документа — хеш тела ответа EDMS, по которому ответ был построен.
+Перед выдачей ответа документ запрашивается через кэш ответов DocumentClient (свежая
+запись или условный GET с If-None-Match → 304), и ответ отдаётся, только если штамп
+совпал: так изменения, сделанные другими клиентами EDMS или другими воркерами,
+видны сразу, а неизменный документ не разбирается и не форматируется заново.
+Изменения документа через этот процесс (любой запрос DocumentClient, кроме GET,
+к api/document/{id}) сбрасывают записи сразу.
+"""
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from src.edms_assistant.config.settings import settings
+from src.edms_assistant.utils.api_utils import token_scope
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, str]
+
+
+@dataclass
+class CachedAnswer:
+    answer: str
+    stamp: str
+    stored_at: float = field(default_factory=time.monotonic)
+
+
+def document_stamp(content: bytes) -> str:
+    """
+    Штамп версии документа по телу ответа GET api/document/{id}.
+
+    У DocumentDto нет даты изменения, а documentVersionId не меняется при смене
+    статуса или реквизитов, поэтому штамп — хеш всего тела.
+    """
+    return hashlib.sha256(content).hexdigest()[:32]
+
+
+class AnswerCache:
+    """
+    LRU-кэш ответов, проверяемых по штампу документа.
+
+    - `get()` — ответ, если штамп текущей версии документа совпал с сохранённым
+    - `put()` — сохраняет ответ вместе со штампом документа, по которому он построен
+    - `invalidate_document()` — сбрасывает все записи документа (после его изменения)
+
+    ttl — максимальный возраст записи: ограничивает, сколько держится ответ на
+    неизменный документ, а не свежесть (её определяет штамп).
+    """
+
+    def __init__(self, ttl: float, max_entries: int, enabled: bool = True):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: "OrderedDict[CacheKey, CachedAnswer]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._changed = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def key(service_token: str, document_id: str, intent: str) -> CacheKey:
+        return token_scope(service_token), str(document_id), intent
+
+    def get(self, service_token: str, document_id: str, intent: str, stamp: str) -> Optional[str]:
+        """Возвращает ответ, если запись есть, не старше ttl и построена по той же версии документа."""
+        if not self.enabled:
+            return None
+        key = self.key(service_token, document_id, intent)
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry.stored_at > self.ttl:
+            self._misses += 1
+            return None
+        if entry.stamp != stamp:
+            self._changed += 1
+            del self._entries[key]
+            logger.debug(f"AnswerCache: document {document_id} changed ({entry.stamp} -> {stamp})")
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry.answer
+
+    def put(self, service_token: str, document_id: str, intent: str, answer: str, stamp: str) -> None:
+        """Сохраняет ответ вместе со штампом документа, по которому он построен."""
+        if not self.enabled:
+            return
+        key = self.key(service_token, document_id, intent)
+        self._entries[key] = CachedAnswer(answer=answer, stamp=stamp)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate_document(self, document_id: str) -> None:
+        """Удаляет записи документа для всех токенов и вопросов."""
+        document_id = str(document_id)
+        stale = [key for key in self._entries if key[1] == document_id]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self._invalidations += 1
+            logger.info(f"AnswerCache: invalidated {len(stale)} answers for document {document_id}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "changed": self._changed,
+            "invalidations": self._invalidations,
+        }
+
+
+# Глобальный экземпляр
+answer_cache = AnswerCache(
+    ttl=settings.answer_cache.ttl,
+    max_entries=settings.answer_cache.max_entries,
+    enabled=settings.answer_cache.enabled,
+)
@@ -0,0 +1,62 @@
+# src/edms_assistant/infrastructure/storage/checkpointer.py
+"""
+Фабрика чекпоинтера LangGraph по настройкам `checkpointer_type`.
+
+- memory   — MemorySaver внутри процесса (только для одного воркера)
+- sqlite   — файл SQLite, общий для воркеров на одной машине
+- postgres — PostgreSQL, общий для воркеров на любых машинах
+
+Для sqlite/postgres любой воркер может продолжить любой thread_id.
+"""
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import MemorySaver
+
+from src.edms_assistant.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+SHARED_CHECKPOINTER_TYPES = ("sqlite", "postgres")
+
+
+def is_shared_checkpointer() -> bool:
+    """Переживает ли состояние потоков границы процесса."""
+    return settings.checkpointer_type.lower() in SHARED_CHECKPOINTER_TYPES
+
+
+@asynccontextmanager
+async def open_checkpointer() -> AsyncIterator[BaseCheckpointSaver]:
+    """Открывает чекпоинтер на время жизни приложения и закрывает соединение при выходе."""
+    checkpointer_type = settings.checkpointer_type.lower()
+
+    if checkpointer_type == "memory":
+        yield MemorySaver()
+
+    elif checkpointer_type == "sqlite":
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+        async with AsyncSqliteSaver.from_conn_string(settings.checkpointer_sqlite_path) as saver:
+            await saver.setup()
+            logger.info(f"Using SQLite checkpointer at {settings.checkpointer_sqlite_path}")
+            yield saver
+
+    elif checkpointer_type == "postgres":
+        if not settings.checkpointer_postgres_url:
+            raise ValueError("CHECKPOINTER_POSTGRES_URL is required for checkpointer_type=postgres")
+        try:
+            from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+        except ImportError:
+            raise ImportError(
+                "checkpointer_type=postgres requires langgraph-checkpoint-postgres"
+            )
+
+        async with AsyncPostgresSaver.from_conn_string(str(settings.checkpointer_postgres_url)) as saver:
+            await saver.setup()
+            logger.info("Using PostgreSQL checkpointer")
+            yield saver
+
+    else:
+        raise ValueError(f"Unknown checkpointer_type: {settings.checkpointer_type}")
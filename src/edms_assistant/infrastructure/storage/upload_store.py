@@ -0,0 +1,228 @@
+# src/edms_assistant/infrastructure/storage/upload_store.py
+"""
+Контентно-адресуемое хранилище загруженных файлов.
+
+Файлы хранятся по SHA-256 содержимого, поэтому повторная загрузка тех же байтов
+не создаёт новый файл, а извлечённый текст и сгенерированные краткие содержания
+привязываются к хешу и переиспользуются. Записи считают ссылки (запросы, которые
+сейчас используют файл) и вытесняются по LRU среди неиспользуемых.
+
+Каталог файлов свой у каждого процесса (воркера uvicorn): вытеснение в одном воркере
+не удаляет файлы, занятые другим. Поэтому дедупликация действует в пределах воркера.
+Каталог удаляется при остановке, а при запуске удаляются каталоги завершившихся
+процессов (например, после аварийного перезапуска воркера).
+"""
+import asyncio
+import contextlib
+import logging
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from src.edms_assistant.config.settings import settings
+from src.edms_assistant.utils.file_utils import SavedUpload
+
+logger = logging.getLogger(__name__)
+
+BLOBS_ROOT = Path(tempfile.gettempdir()) / "edms_agent_uploads" / "blobs"
+
+# Каталог на процесс: вытеснение в одном воркере uvicorn не удаляет файлы, занятые другим
+BLOB_DIR = BLOBS_ROOT / str(os.getpid())
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Процесс есть, но принадлежит другому пользователю
+        return True
+    return True
+
+
+@dataclass
+class UploadEntry:
+    """Запись хранилища: файл и производные от него данные."""
+
+    sha256: str
+    path: Path
+    size: int
+    filename: str
+    refcount: int = 0
+    text: Optional[str] = None
+    summaries: Dict[str, str] = field(default_factory=dict)
+    last_access: float = field(default_factory=time.monotonic)
+
+
+class UploadStore:
+    """
+    Хранилище загрузок с дедупликацией по SHA-256.
+
+    - `add()` помещает сохранённый файл в хранилище (или переиспользует существующий)
+    - `release()` освобождает ссылку после завершения запроса
+    - `get_text()/set_text()`, `get_summary()/set_summary()` — кэш производных данных
+    """
+
+    def __init__(self, root: Path, max_entries: int, max_bytes: int):
+        self.root = root
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, UploadEntry]" = OrderedDict()
+        # Блокировки add() по хешу: (блокировка, число ожидающих и владельца)
+        self._locks: Dict[str, Tuple[asyncio.Lock, int]] = {}
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def startup(self) -> None:
+        """Удаляет каталоги файлов процессов, которые уже завершились."""
+        if not self.root.parent.is_dir():
+            return
+        for stale in self.root.parent.iterdir():
+            if stale == self.root or not stale.name.isdigit() or _process_alive(int(stale.name)):
+                continue
+            shutil.rmtree(stale, ignore_errors=True)
+            logger.info(f"UploadStore: removed stale blob directory {stale}")
+
+    def shutdown(self) -> None:
+        """Удаляет каталог файлов этого процесса вместе с записями."""
+        self._entries.clear()
+        self._total_bytes = 0
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _touch(self, entry: UploadEntry) -> None:
+        entry.last_access = time.monotonic()
+        self._entries.move_to_end(entry.sha256)
+
+    @contextlib.asynccontextmanager
+    async def _locked(self, sha256: str) -> AsyncIterator[None]:
+        """Сериализует add() одного содержимого; блокировка удаляется, когда она никому не нужна."""
+        lock, users = self._locks.get(sha256) or (asyncio.Lock(), 0)
+        self._locks[sha256] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self._locks[sha256]
+            if users == 1:
+                del self._locks[sha256]
+            else:
+                self._locks[sha256] = (lock, users - 1)
+
+    async def add(self, saved: SavedUpload, filename: str) -> UploadEntry:
+        """
+        Помещает файл в хранилище и захватывает ссылку на него.
+
+        Если файл с таким хешем уже есть, временный файл удаляется, а возвращается
+        существующая запись вместе с ранее извлечённым текстом и резюме.
+        Одновременные загрузки одного содержимого получают одну запись.
+        """
+        async with self._locked(saved.sha256):
+            entry = self._entries.get(saved.sha256)
+            reused = entry is not None and entry.path.exists()
+            if reused:
+                self._hits += 1
+            else:
+                self._misses += 1
+                await asyncio.to_thread(self.root.mkdir, parents=True, exist_ok=True)
+                blob_path = self.root / saved.sha256
+                await asyncio.to_thread(saved.path.replace, blob_path)
+                # Запись перечитывается после ожидания: за это время её могли вытеснить
+                entry = self._entries.get(saved.sha256)
+                if entry is not None:
+                    # Файл был удалён с диска извне — восстанавливаем запись
+                    self._total_bytes -= entry.size
+                entry = UploadEntry(
+                    sha256=saved.sha256, path=blob_path, size=saved.size, filename=filename
+                )
+                self._entries[saved.sha256] = entry
+                self._total_bytes += entry.size
+                logger.info(f"UploadStore: stored {saved.sha256[:12]} ({saved.size} bytes) for '{filename}'")
+
+            # Ссылка захватывается до следующего await, чтобы запись не вытеснили
+            entry.refcount += 1
+            self._touch(entry)
+            self._evict()
+
+        if reused:
+            await asyncio.to_thread(saved.path.unlink, True)
+            logger.info(f"UploadStore: reuse {saved.sha256[:12]} for '{filename}'")
+        return entry
+
+    def staging_path(self) -> Path:
+        """Путь для временного файла, который затем помещается в хранилище через add()."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        return self.root / f"{uuid.uuid4().hex}.part"
+
+    def release(self, sha256: str) -> None:
+        """Освобождает ссылку на запись; неиспользуемые записи могут быть вытеснены."""
+        entry = self._entries.get(sha256)
+        if entry is None:
+            return
+        entry.refcount = max(entry.refcount - 1, 0)
+        self._evict()
+
+    def get(self, sha256: str) -> Optional[UploadEntry]:
+        entry = self._entries.get(sha256)
+        if entry is not None:
+            self._touch(entry)
+        return entry
+
+    def get_text(self, sha256: str) -> Optional[str]:
+        entry = self.get(sha256)
+        return entry.text if entry else None
+
+    def set_text(self, sha256: str, text: Optional[str]) -> None:
+        entry = self._entries.get(sha256)
+        if entry is not None:
+            entry.text = text
+
+    def get_summary(self, sha256: str, kind: str = "default") -> Optional[str]:
+        entry = self.get(sha256)
+        return entry.summaries.get(kind) if entry else None
+
+    def set_summary(self, sha256: str, summary: str, kind: str = "default") -> None:
+        entry = self._entries.get(sha256)
+        if entry is not None:
+            entry.summaries[kind] = summary
+
+    def _evict(self) -> None:
+        """Вытесняет давно не использованные записи без активных ссылок, пока не выполнены лимиты."""
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+            victim = next((e for e in self._entries.values() if e.refcount == 0), None)
+            if victim is None:
+                break
+            del self._entries[victim.sha256]
+            self._total_bytes -= victim.size
+            self._evictions += 1
+            try:
+                victim.path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"UploadStore: failed to remove {victim.path}: {e}")
+            logger.debug(f"UploadStore: evicted {victim.sha256[:12]}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "in_use": sum(1 for e in self._entries.values() if e.refcount > 0),
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
+
+
+# Глобальный экземпляр
+upload_store = UploadStore(
+    root=BLOB_DIR,
+    max_entries=settings.upload.store_max_entries,
+    max_bytes=settings.upload.store_max_size_mb * 1024 * 1024,
+)
@@ -1,10 +1,12 @@
 # src\edms_assistant\presentation\api.py
+import asyncio
 import logging
 import tempfile
 import uuid
 import json
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Any, AsyncIterator, Callable, Dict, List, Tuple
 from fastapi import (
     FastAPI,
     HTTPException,
@@ -13,22 +15,81 @@ from fastapi import (
     Form,
     BackgroundTasks,
     Body,
+    Request,
 )
 from fastapi.middleware.cors import CORSMiddleware
-from langchain_core.messages import ToolMessage
+from fastapi.responses import StreamingResponse, JSONResponse
 from langgraph.types import Command
-from src.edms_assistant.core.orchestrator.orchestrator import create_orchestrator_graph
-from src.edms_assistant.core.agents.employee_agent import create_employee_agent_graph
+from pydantic import BaseModel, Field
+from src.edms_assistant.core.loaders.document_loader import prefetch_document
+from src.edms_assistant.core.loaders.request_loader import RequestLoader, CONFIG_KEY as REQUEST_LOADER_KEY
+from src.edms_assistant.core.orchestrator.graph_registry import graph_registry
+from src.edms_assistant.core.state.credentials import CONFIG_KEY as SERVICE_TOKEN_KEY
+from src.edms_assistant.config.settings import settings
+from src.edms_assistant.infrastructure.admission.admission_controller import (
+    admission_controller,
+    AdmissionRejected,
+)
+from src.edms_assistant.infrastructure.api_clients.http_pool import edms_http_pool
+from src.edms_assistant.infrastructure.api_clients.response_cache import edms_response_cache
+from src.edms_assistant.infrastructure.api_clients.retry_policy import edms_retry_policy
+from src.edms_assistant.infrastructure.api_clients.hedging import edms_hedger
+from src.edms_assistant.infrastructure.api_clients.single_flight import edms_single_flight
+from src.edms_assistant.infrastructure.storage.checkpointer import open_checkpointer
+from src.edms_assistant.infrastructure.jobs.job_manager import job_manager, JobQueueFull, JobStatus
+from src.edms_assistant.infrastructure.storage.answer_cache import answer_cache
+from src.edms_assistant.infrastructure.storage.upload_store import upload_store, UploadEntry
+from src.edms_assistant.utils.file_utils import save_upload_stream, UploadTooLargeError
 
 logger = logging.getLogger(__name__)
 
 UPLOAD_DIR = Path(tempfile.gettempdir()) / "edms_agent_uploads"
 UPLOAD_DIR.mkdir(exist_ok=True)
 
+# Запас на служебные части multipart-запроса сверх размера файла
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# Узлы, о прогрессе которых сообщает /chat/stream
+STREAMED_NODES = {
+    "planner",
+    "document_agent",
+    "attachment_agent",
+    "employee_agent",
+    "cached_answer",
+    "load_document",
+    "format_and_respond",
+    "analyze_and_summarize",
+    "find_responsible",
+    "select_candidate",
+}
+
+# Узлы, токены LLM которых не отдаются клиенту (служебный JSON-план)
+SILENT_TOKEN_NODES = {"planner"}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Открывает общий чекпоинтер и пул соединений к EDMS, компилирует графы и запускает
+    воркеры заданий; при остановке удаляет каталог загрузок процесса.
+    """
+    async with open_checkpointer() as checkpointer:
+        upload_store.startup()
+        await edms_http_pool.startup()
+        await graph_registry.startup(checkpointer)
+        await job_manager.startup()
+        yield
+        await job_manager.shutdown()
+        await graph_registry.shutdown()
+        await edms_http_pool.shutdown()
+        upload_store.shutdown()
+
+
 app = FastAPI(
     title="EDMS Assistant API",
     description="API for interacting with the EDMS document management agent. Accepts text and files.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -39,110 +100,127 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-def _cleanup_file(file_path: Path):
-    """Фоновая задача для удаления временного файла."""
-    try:
-        file_path.unlink(missing_ok=True)
-        logger.debug(f"Cleaned up temporary file: {file_path}")
-    except Exception as e:
-        logger.warning(f"Failed to clean up {file_path}: {e}")
+@app.middleware("http")
+async def limit_upload_size(request: Request, call_next):
+    """Отклоняет заведомо слишком большие загрузки по Content-Length до разбора тела."""
+    content_length = request.headers.get("content-length")
+    if request.method == "POST" and content_length and content_length.isdigit():
+        if int(content_length) > settings.upload.max_size_bytes + MULTIPART_OVERHEAD_BYTES:
+            return JSONResponse(status_code=413, content={"detail": "Uploaded file is too large."})
+    return await call_next(request)
 
-@app.post("/chat")
-async def assistant_chat(
-        background_tasks: BackgroundTasks,
-        user_id: str = Form(None),
-        service_token: str = Form(None),
-        message: str = Form(None),
-        selected_candidate_id: str = Form(None),
-        document_id: Optional[str] = Form(None),
-        file: Optional[UploadFile] = File(None),
-        thread_id: Optional[str] = Form(None),
-):
-    logger.info(f"API received: user_id={user_id}, document_id={document_id}, message={message}, selected_candidate_id={selected_candidate_id}")
 
-    # === 1. Валидация thread_id ===
+@app.exception_handler(AdmissionRejected)
+async def admission_rejected_handler(request: Request, exc: AdmissionRejected):
+    """Перегрузка: 429 с рекомендацией, когда повторить запрос."""
+    return JSONResponse(
+        status_code=429,
+        content={"detail": "Server is overloaded, retry later.", "reason": exc.reason},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+def _release_upload(upload: Optional[UploadEntry]):
+    """Освобождает ссылку запроса на загруженный файл в хранилище."""
+    if upload is None:
+        return
+    upload_store.release(upload.sha256)
+    logger.debug(f"Released upload {upload.sha256[:12]} ({upload.filename})")
+
+
+def _resolve_thread_uuid(thread_id: Optional[str], user_id: Optional[str]) -> uuid.UUID:
+    """Определяет UUID потока: thread_id, а при его отсутствии — user_id."""
     if thread_id:
         try:
-            user_uuid = uuid.UUID(thread_id)
+            return uuid.UUID(thread_id)
         except ValueError:
             raise HTTPException(
                 status_code=400, detail="Invalid thread_id format. Must be a valid UUID."
             )
-    else:
-        if not user_id:
-            raise HTTPException(status_code=400, detail="user_id is required if no thread_id provided.")
-        try:
-            user_uuid = uuid.UUID(user_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=400, detail="Invalid user_id format. Must be a valid UUID."
-            )
+    if not user_id:
+        raise HTTPException(status_code=400, detail="user_id is required if no thread_id provided.")
+    try:
+        return uuid.UUID(user_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=400, detail="Invalid user_id format. Must be a valid UUID."
+        )
 
-    # === 2. Валидация service_token (если есть) ===
+
+def _validate_service_token(service_token: Optional[str]) -> None:
     if service_token and len(service_token) < 10:
         raise HTTPException(status_code=400, detail="Invalid service_token.")
 
-    # === 3. Обработка файла (если есть и это новый запрос) ===
-    file_path: Optional[Path] = None
-    if file and not selected_candidate_id:  # Только если это не уточнение
-        safe_filename = Path(file.filename).name
-        if not safe_filename:
-            raise HTTPException(status_code=400, detail="Invalid file name.")
 
-        file_path = UPLOAD_DIR / f"{user_uuid}_{safe_filename}"
-        try:
-            with open(file_path, "wb") as f:
-                content = await file.read()
-                f.write(content)
-            logger.info(f"Saved uploaded file to {file_path}")
-        except Exception as e:
-            logger.error(f"File save error: {e}")
-            raise HTTPException(
-                status_code=500, detail="Failed to process uploaded file."
-            )
+async def _save_upload(file: UploadFile, user_uuid: uuid.UUID) -> UploadEntry:
+    """
+    Потоково сохраняет загруженный файл и помещает его в контентно-адресуемое хранилище.
 
-    config = {"configurable": {"thread_id": str(user_uuid)}}
+    Повторная загрузка тех же байтов возвращает существующую запись хранилища.
+    """
+    safe_filename = Path(file.filename).name
+    if not safe_filename:
+        raise HTTPException(status_code=400, detail="Invalid file name.")
 
-    # === 4. Если пришло уточнение, вызываем employee_agent отдельно ===
-    if selected_candidate_id:
-        if not service_token:
-            raise HTTPException(status_code=400, detail="service_token is required for clarification.")
+    file_path = UPLOAD_DIR / f"{user_uuid}_{uuid.uuid4().hex}.part"
+    try:
+        saved = await save_upload_stream(
+            file,
+            file_path,
+            max_bytes=settings.upload.max_size_bytes,
+            chunk_size=settings.upload.chunk_size,
+        )
+        logger.info(f"Saved uploaded file to {file_path} ({saved.size} bytes, sha256={saved.sha256})")
+        return await upload_store.add(saved, safe_filename)
+    except UploadTooLargeError as e:
+        logger.warning(f"Rejected upload {safe_filename}: {e}")
+        raise HTTPException(status_code=413, detail="Uploaded file is too large.")
+    except Exception as e:
+        logger.error(f"File save error: {e}")
+        raise HTTPException(
+            status_code=500, detail="Failed to process uploaded file."
+        )
 
-        employee_graph = create_employee_agent_graph()
 
-        # Создаём ToolMessage с ID кандидата
-        tool_msg = ToolMessage(
-            content=json.dumps({"id": selected_candidate_id}), tool_call_id="mock"
-        )
+def _create_loader(
+        document_id: Optional[str],
+        service_token: Optional[str],
+        selected_candidate_id: Optional[str],
+) -> RequestLoader:
+    """
+    Загрузчик запроса: все узлы и инструменты хода читают EDMS через него, поэтому
+    каждая сущность запрашивается не более одного раза.
 
-        # Вызываем employee_agent_graph с ToolMessage
-        result = await employee_graph.ainvoke(
-            {
-                "messages": [tool_msg],
-                "service_token": service_token,
-                "user_message": "",
-            },
-            config=config
-        )
+    Загрузка документа запроса начинается сразу, до работы планировщика. Вложения
+    документа приходят в том же ответе (attachmentDocument), поэтому предзагрузка
+    документа покрывает и их список.
+    """
+    loader = RequestLoader()
+    if document_id and service_token and not selected_candidate_id:
+        prefetch_document(loader, document_id, service_token)
+    return loader
 
-        last_message = result["messages"][-1]
-        content = getattr(last_message, "content", "Нет ответа.")
-        return {"response": content}
 
-    # === 5. Иначе — обычный запуск оркестратора ===
-    if not message:
-        raise HTTPException(status_code=400, detail="Message is required for new request.")
+def _run_config(thread_id: str, loader: RequestLoader, service_token: Optional[str]) -> Dict[str, Any]:
+    """Конфигурация запуска графа: поток, загрузчик запроса и токен вызывающего."""
+    return {"configurable": {"thread_id": thread_id, REQUEST_LOADER_KEY: loader, SERVICE_TOKEN_KEY: service_token}}
 
-    graph = create_orchestrator_graph()
 
-    initial_state = {
+def _build_initial_state(
+        user_uuid: uuid.UUID,
+        document_id: Optional[str],
+        message: str,
+        upload: Optional[UploadEntry],
+        file_name: Optional[str],
+) -> Dict[str, Any]:
+    return {
         "user_id": user_uuid,
-        "service_token": service_token,
         "document_id": document_id,
         "user_message": message,
         "messages": [{"role": "user", "content": message}],
-        "uploaded_file_path": str(file_path) if file_path else None,
-        "uploaded_file_name": file.filename if file else None,
+        "uploaded_file_path": str(upload.path) if upload else None,
+        "uploaded_file_name": file_name if upload else None,
+        "uploaded_file_sha256": upload.sha256 if upload else None,
         # ✅ поля, которые ожидает orchestrator_planner
         "next_agent": None,
         "agent_input": None,
@@ -153,37 +231,501 @@ async def assistant_chat(
         "attachment_id": None,
         "attachment_name": None,
         "current_document": None,
+        "answer_cache_hit": None,
+        "document_stamp": None,
+        "employee_candidates": None,
+    }
+
+
+async def _prepare_run(
+        user_uuid: uuid.UUID,
+        service_token: Optional[str],
+        message: Optional[str],
+        selected_candidate_id: Optional[str],
+        document_id: Optional[str],
+        upload: Optional[UploadEntry],
+        file_name: Optional[str],
+) -> Tuple[Any, Any]:
+    """
+    Выбирает граф и входные данные для запуска.
+
+    Returns:
+        (граф, вход графа): для уточнения — Command(resume=...) для прерванного потока
+        оркестратора, иначе — начальное состояние.
+    """
+    graph = graph_registry.get_graph()
+
+    # === Если пришло уточнение, возобновляем прерванный поток ===
+    if selected_candidate_id:
+        if not service_token:
+            raise HTTPException(status_code=400, detail="service_token is required for clarification.")
+
+        snapshot = await graph.aget_state({"configurable": {"thread_id": str(user_uuid)}})
+        if not snapshot.interrupts:
+            raise HTTPException(status_code=409, detail="No pending clarification for this thread.")
+        return graph, Command(resume=selected_candidate_id)
+
+    # === Иначе — обычный запуск оркестратора ===
+    if not message:
+        raise HTTPException(status_code=400, detail="Message is required for new request.")
+
+    initial_state = _build_initial_state(
+        user_uuid, document_id, message, upload, file_name
+    )
+    return graph, initial_state
+
+
+def _format_clarification(interrupt_data: Dict[str, Any], thread_id: str) -> Optional[Dict[str, Any]]:
+    """Формирует ответ с вариантами выбора для прерывания типа clarification."""
+    if interrupt_data.get("type") != "clarification":
+        return None
+    candidates = interrupt_data["candidates"]
+    options = "\n".join(
+        f"{i + 1}. {c['last_name']} {c['first_name']} {c['middle_name']} (ID: {c['id']})"
+        for i, c in enumerate(candidates)
+    )
+    return {
+        "response": f"Найдено несколько ответственных:\n{options}\n\nУточните выбор (укажите номер или ID):",
+        "requires_clarification": True,
+        "thread_id": thread_id,
+        "candidates": candidates,
     }
 
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Кодирует один кадр Server-Sent Events."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+@app.post("/chat")
+async def assistant_chat(
+        user_id: str = Form(None),
+        service_token: str = Form(None),
+        message: str = Form(None),
+        selected_candidate_id: str = Form(None),
+        document_id: Optional[str] = Form(None),
+        file: Optional[UploadFile] = File(None),
+        thread_id: Optional[str] = Form(None),
+):
+    logger.info(f"API received: user_id={user_id}, document_id={document_id}, message={message}, selected_candidate_id={selected_candidate_id}")
+
+    # === 1. Валидация thread_id ===
+    user_uuid = _resolve_thread_uuid(thread_id, user_id)
+
+    # === 2. Валидация service_token (если есть) ===
+    _validate_service_token(service_token)
+
+    # === 3. Загрузчик запроса; документ загружается параллельно с сохранением файла и планировщиком ===
+    loader = _create_loader(document_id, service_token, selected_candidate_id)
+
+    upload: Optional[UploadEntry] = None
     try:
-        result = await graph.ainvoke(initial_state, config=config)
+        # === 4. Обработка файла (если есть и это новый запрос) ===
+        if file and not selected_candidate_id:  # Только если это не уточнение
+            upload = await _save_upload(file, user_uuid)
+
+        # === 5. Допуск к выполнению (429 при перегрузке) ===
+        async with admission_controller.admit(user_id or str(user_uuid)):
+            return await _run_chat(
+                user_uuid,
+                service_token,
+                message,
+                selected_candidate_id,
+                document_id,
+                upload,
+                file.filename if file else None,
+                loader,
+            )
+    finally:
+        _release_upload(upload)
+        loader.close()
+
+
+async def _run_chat(
+        user_uuid: uuid.UUID,
+        service_token: Optional[str],
+        message: Optional[str],
+        selected_candidate_id: Optional[str],
+        document_id: Optional[str],
+        upload: Optional[UploadEntry],
+        file_name: Optional[str],
+        loader: Optional[RequestLoader] = None,
+) -> Dict[str, Any]:
+    config = _run_config(str(user_uuid), loader or RequestLoader(), service_token)
+
+    # === 4. Выбор графа: уточнение или новый запрос ===
+    graph, graph_input = await _prepare_run(
+        user_uuid,
+        service_token,
+        message,
+        selected_candidate_id,
+        document_id,
+        upload,
+        file_name,
+    )
+
+    # === 5. Запуск (или возобновление) оркестратора ===
+    try:
+        result = await graph.ainvoke(graph_input, config=config)
 
         # === ПРОВЕРКА ПРЕРЫВАНИЯ ===
         if "__interrupt__" in result:
-            interrupt_data = result["__interrupt__"][0].value
-            if interrupt_data.get("type") == "clarification":
-                candidates = interrupt_data["candidates"]
-                options = "\n".join(
-                    f"{i + 1}. {c['last_name']} {c['first_name']} {c['middle_name']} (ID: {c['id']})"
-                    for i, c in enumerate(candidates)
-                )
-                return {
-                    "response": f"Найдено несколько ответственных:\n{options}\n\nУточните выбор (укажите номер или ID):",
-                    "requires_clarification": True,
-                    "thread_id": str(user_uuid),
-                    "candidates": candidates,
-                }
+            clarification = _format_clarification(
+                result["__interrupt__"][0].value, str(user_uuid)
+            )
+            if clarification:
+                return clarification
 
         last_message = result["messages"][-1]
         content = getattr(last_message, "content", "Нет ответа.")
-
-        if file_path:
-            background_tasks.add_task(_cleanup_file, file_path)
-
         return {"response": content}
 
     except Exception as e:
         logger.error(f"Agent execution failed: {e}", exc_info=True)
-        if file_path:
-            background_tasks.add_task(_cleanup_file, file_path)
         raise HTTPException(status_code=500, detail="Agent error")
+
+
+async def _stream_graph_events(
+        graph,
+        graph_input,
+        config: Dict[str, Any],
+        thread_id: str,
+) -> AsyncIterator[str]:
+    """
+    Транслирует события графа в кадры SSE:
+    - node: начало/завершение узла графа
+    - token: очередной токен ответа LLM
+    - clarification: прерывание с вариантами выбора
+    - done: итоговый ответ
+    - error: ошибка выполнения
+    """
+    try:
+        async for event in graph.astream_events(graph_input, config=config, version="v2"):
+            kind = event["event"]
+            metadata = event.get("metadata", {})
+            node = metadata.get("langgraph_node")
+
+            if kind in ("on_chain_start", "on_chain_end") and event["name"] == node and node in STREAMED_NODES:
+                status = "start" if kind == "on_chain_start" else "end"
+                yield _sse("node", {"node": node, "status": status})
+
+            elif kind == "on_chat_model_stream" and node not in SILENT_TOKEN_NODES:
+                chunk = event["data"].get("chunk")
+                content = getattr(chunk, "content", None)
+                if content:
+                    yield _sse("token", {"node": node, "content": content})
+
+        snapshot = await graph.aget_state(config)
+        for pending in snapshot.interrupts:
+            clarification = _format_clarification(pending.value, thread_id)
+            if clarification:
+                yield _sse("clarification", clarification)
+                return
+
+        messages = snapshot.values.get("messages") or []
+        content = getattr(messages[-1], "content", "Нет ответа.") if messages else "Нет ответа."
+        yield _sse("done", {"response": content, "thread_id": thread_id})
+
+    except Exception as e:
+        logger.error(f"Agent streaming failed: {e}", exc_info=True)
+        yield _sse("error", {"detail": "Agent error"})
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse, который вызывает on_close при любом завершении ответа.
+
+    finally генератора для этого не годится: если клиент отключился до первого кадра,
+    генератор не запускается и его finally не выполняется, а BackgroundTask не
+    вызывается при ClientDisconnect. Поэтому ответ сам закрывает генератор потока
+    и затем вызывает on_close.
+    """
+
+    def __init__(self, content: AsyncIterator[str], on_close: Callable[[], None], **kwargs):
+        super().__init__(content, **kwargs)
+        self._on_close = on_close
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            try:
+                await self.body_iterator.aclose()
+            finally:
+                self._on_close()
+
+
+@app.post("/chat/stream")
+async def assistant_chat_stream(
+        user_id: str = Form(None),
+        service_token: str = Form(None),
+        message: str = Form(None),
+        selected_candidate_id: str = Form(None),
+        document_id: Optional[str] = Form(None),
+        file: Optional[UploadFile] = File(None),
+        thread_id: Optional[str] = Form(None),
+):
+    """То же, что /chat, но ответ отдаётся потоком Server-Sent Events по мере выполнения графа."""
+    logger.info(f"API stream received: user_id={user_id}, document_id={document_id}, message={message}, selected_candidate_id={selected_candidate_id}")
+
+    user_uuid = _resolve_thread_uuid(thread_id, user_id)
+    _validate_service_token(service_token)
+    loader = _create_loader(document_id, service_token, selected_candidate_id)
+
+    upload: Optional[UploadEntry] = None
+    config = _run_config(str(user_uuid), loader, service_token)
+    try:
+        if file and not selected_candidate_id:
+            upload = await _save_upload(file, user_uuid)
+        graph, graph_input = await _prepare_run(
+            user_uuid,
+            service_token,
+            message,
+            selected_candidate_id,
+            document_id,
+            upload,
+            file.filename if file else None,
+        )
+        # Допуск проверяется до начала потока, чтобы перегрузка вернулась как 429
+        admission_key = user_id or str(user_uuid)
+        admitted_at = await admission_controller.acquire(admission_key)
+    except (HTTPException, AdmissionRejected):
+        _release_upload(upload)
+        loader.close()
+        raise
+
+    def on_close():
+        admission_controller.release(admission_key, admitted_at)
+        _release_upload(upload)
+        loader.close()
+
+    return ClosingStreamingResponse(
+        _stream_graph_events(graph, graph_input, config, str(user_uuid)),
+        on_close,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+class BatchChatItem(BaseModel):
+    document_id: Optional[str] = Field(None, description="UUID документа, к которому относится вопрос")
+    message: str = Field(..., min_length=1, description="Вопрос к ассистенту")
+
+
+class BatchChatRequest(BaseModel):
+    user_id: str = Field(..., description="UUID пользователя")
+    service_token: Optional[str] = Field(None, description="JWT-токен для EDMS")
+    items: List[BatchChatItem] = Field(..., min_length=1)
+    concurrency: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Сколько вопросов выполнять одновременно (не больше batch.max_concurrency и admission.max_per_user)",
+    )
+
+
+async def _run_batch_item(
+        index: int,
+        item: BatchChatItem,
+        user_uuid: uuid.UUID,
+        service_token: Optional[str],
+        loader: RequestLoader,
+        semaphore: asyncio.Semaphore,
+) -> Dict[str, Any]:
+    """Выполняет один вопрос пакета в отдельном потоке графа и удаляет поток после ответа."""
+    result: Dict[str, Any] = {"index": index, "document_id": item.document_id}
+    thread_id = str(uuid.uuid4())
+    config = _run_config(thread_id, loader, service_token)
+    graph = graph_registry.get_graph()
+    async with semaphore:
+        try:
+            state = _build_initial_state(
+                user_uuid, item.document_id, item.message, None, None
+            )
+            async with admission_controller.admit(str(user_uuid)):
+                output = await graph.ainvoke(state, config=config)
+            if "__interrupt__" in output:
+                clarification = _format_clarification(output["__interrupt__"][0].value, thread_id)
+                if clarification:
+                    # Пакет не интерактивен: возвращаем варианты, но поток не сохраняем
+                    clarification.pop("thread_id", None)
+                    return {**result, **clarification}
+            last_message = output["messages"][-1]
+            result["response"] = getattr(last_message, "content", "Нет ответа.")
+        except AdmissionRejected as e:
+            result["error"] = "overloaded"
+            result["retry_after"] = e.retry_after
+        except Exception as e:
+            logger.error(f"Batch item {index} failed: {e}", exc_info=True)
+            result["error"] = "Agent error"
+        finally:
+            await graph_registry.checkpointer.adelete_thread(thread_id)
+    return result
+
+
+async def _stream_batch(request: BatchChatRequest, user_uuid: uuid.UUID) -> AsyncIterator[str]:
+    """Запускает все вопросы пакета и отдаёт результаты в формате NDJSON по мере готовности."""
+    # Каждый элемент занимает слот допуска пользователя: больше max_per_user одновременно
+    # не пройдёт, а лишние элементы только ждали бы в общей очереди и получали бы отказ
+    limit = min(settings.batch.max_concurrency, settings.admission.max_per_user)
+    concurrency = min(request.concurrency or limit, limit)
+    semaphore = asyncio.Semaphore(concurrency)
+    loader = RequestLoader()
+    tasks = [
+        asyncio.create_task(
+            _run_batch_item(i, item, user_uuid, request.service_token, loader, semaphore)
+        )
+        for i, item in enumerate(request.items)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield json.dumps(await next_done, ensure_ascii=False, default=str) + "\n"
+        logger.info(f"Batch of {len(tasks)} items finished, EDMS reads: {loader.stats()}")
+    finally:
+        for task in tasks:
+            task.cancel()
+        loader.close()
+
+
+@app.post("/chat/batch")
+async def assistant_chat_batch(request: BatchChatRequest = Body(...)):
+    """
+    Выполняет пакет вопросов (document_id, message) с ограниченной параллельностью.
+
+    Загрузка одного и того же документа разделяется между всеми элементами пакета.
+    Результаты отдаются построчно (NDJSON) в порядке завершения, каждый с полем index.
+    """
+    logger.info(f"API batch received: user_id={request.user_id}, items={len(request.items)}")
+    try:
+        user_uuid = uuid.UUID(request.user_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid user_id format. Must be a valid UUID.")
+    _validate_service_token(request.service_token)
+    if len(request.items) > settings.batch.max_items:
+        raise HTTPException(
+            status_code=400, detail=f"Too many items in batch (max {settings.batch.max_items})."
+        )
+
+    return StreamingResponse(_stream_batch(request, user_uuid), media_type="application/x-ndjson")
+
+
+@app.post("/jobs/summarize", status_code=202)
+async def submit_summarize_job(
+        user_id: str = Form(...),
+        service_token: str = Form(None),
+        document_id: Optional[str] = Form(None),
+        attachment_id: Optional[str] = Form(None),
+        message: str = Form(""),
+        file: Optional[UploadFile] = File(None),
+):
+    """
+    Ставит суммаризацию в фоновое задание и сразу возвращает job_id.
+
+    Суммаризируется загруженный файл, либо вложение документа EDMS
+    (attachment_id или имя вложения в message; по умолчанию — первое вложение).
+    Результат: GET /jobs/{job_id} или поток событий GET /jobs/{job_id}/events.
+    """
+    from src.edms_assistant.core.agents.attachment_agent import (
+        summarize_uploaded_file,
+        summarize_document_attachment,
+    )
+
+    try:
+        user_uuid = uuid.UUID(user_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid user_id format. Must be a valid UUID.")
+    _validate_service_token(service_token)
+
+    if file:
+        upload = await _save_upload(file, user_uuid)
+        file_name = Path(file.filename).name
+
+        async def handler() -> str:
+            try:
+                return await summarize_uploaded_file(str(upload.path), file_name, upload.sha256)
+            finally:
+                _release_upload(upload)
+
+        kind, params = "summarize_file", {"file_name": file_name, "sha256": upload.sha256}
+    elif document_id:
+        if not service_token:
+            raise HTTPException(status_code=400, detail="service_token is required for document attachments.")
+        upload = None
+
+        async def handler() -> str:
+            return await summarize_document_attachment(
+                document_id, service_token, user_msg=message, attachment_id=attachment_id
+            )
+
+        kind, params = "summarize_attachment", {"document_id": document_id, "attachment_id": attachment_id}
+    else:
+        raise HTTPException(status_code=400, detail="Either file or document_id is required.")
+
+    try:
+        job = await job_manager.submit(kind, str(user_uuid), params, handler)
+    except JobQueueFull:
+        _release_upload(upload)
+        raise HTTPException(status_code=429, detail="Job queue is full.", headers={"Retry-After": "5"})
+    return {"job_id": job.id, "status": job.status}
+
+
+async def _get_owned_job(job_id: str, user_id: str):
+    job = await job_manager.get(job_id)
+    if job is None or job.owner != user_id:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return job
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str, user_id: str):
+    """Текущее состояние задания."""
+    return (await _get_owned_job(job_id, user_id)).to_dict()
+
+
+@app.get("/jobs/{job_id}/events")
+async def job_events(job_id: str, user_id: str):
+    """Поток SSE: кадр status при каждой смене статуса и итоговый done/error."""
+    await _get_owned_job(job_id, user_id)
+
+    async def events() -> AsyncIterator[str]:
+        last_status = None
+        job = await job_manager.get(job_id)
+        while True:
+            if job is None:
+                yield _sse("error", {"detail": "Job not found."})
+                return
+            if job.status != last_status:
+                last_status = job.status
+                yield _sse("status", {"job_id": job.id, "status": job.status})
+            else:
+                # Комментарий SSE поддерживает соединение живым через прокси
+                yield ": keep-alive\n\n"
+            if job.status == JobStatus.SUCCEEDED:
+                yield _sse("done", job.to_dict())
+                return
+            if job.status == JobStatus.FAILED:
+                yield _sse("error", job.to_dict())
+                return
+            job = await job_manager.wait(job_id, timeout=15.0)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/metrics")
+async def metrics():
+    """Метрики процесса: графы, хранилище загрузок, очередь допуска, задания, кэши, пул и повторы EDMS."""
+    return {
+        "graphs": graph_registry.stats(),
+        "uploads": upload_store.stats(),
+        "admission": admission_controller.stats(),
+        "jobs": job_manager.stats(),
+        "answer_cache": answer_cache.stats(),
+        "edms_pool": edms_http_pool.stats(),
+        "edms_single_flight": edms_single_flight.stats(),
+        "edms_response_cache": edms_response_cache.stats(),
+        "edms_retry": edms_retry_policy.stats(),
+        "edms_hedging": edms_hedger.stats(),
+    }
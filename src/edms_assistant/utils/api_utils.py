@@ -1,9 +1,11 @@
 # src/edms_assistant/utils/api_utils.py
+import asyncio
+import hashlib
 import uuid
 
 import httpx
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException
 
@@ -51,6 +53,15 @@ def prepare_auth_headers(token: str) -> Dict[str, str]:
     return {"Authorization": f"Bearer {token}"}
 
 
+def token_scope(token: str) -> str:
+    """
+    Область видимости данных вызывающего: хеш токена.
+
+    Используется в ключах кэшей и объединения запросов вместо самого токена.
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:32]
+
+
 # --- Валидация данных (простой пример) ---
 def validate_document_data(data: Dict[str, Any]) -> bool:
     """
@@ -83,7 +94,49 @@ def validate_document_id(doc_id: Optional[str]) -> Optional[uuid.UUID]:
 
 
 # --- функция для обработки paginated response ---
-async def fetch_all_pages(
+def _page_items(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Элементы страницы: Spring Page (content) или альтернативные обёртки."""
+    items = data.get("content", [])
+    if not items:
+        items = data.get("items", [])
+    if not items:
+        items = data.get("results", [])
+    return items
+
+
+def _page_size(data: Dict[str, Any], items: List[Any], requested: int) -> int:
+    """
+    Фактический размер страницы по первой странице: сервер может урезать запрошенный
+    size, и тогда считать страницы по запрошенному размеру — значит потерять хвост.
+    """
+    size = data.get("size") or data.get("numberOfElements") or len(items)
+    return int(size) if size else requested
+
+
+def _total_pages(data: Dict[str, Any], page_size: int) -> Optional[int]:
+    """Общее число страниц по totalPages или totalElements первой страницы."""
+    total_pages = data.get("totalPages")
+    if total_pages is not None:
+        return int(total_pages)
+    total_elements = data.get("totalElements")
+    if total_elements is not None and page_size:
+        return -(-int(total_elements) // page_size)
+    return None
+
+
+async def _fetch_page(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: Optional[Dict[str, str]],
+    params: Dict[str, Any],
+    description: str,
+) -> Dict[str, Any]:
+    response = await client.get(url, headers=headers, params=params)
+    await handle_api_error(response, description)
+    return response.json()
+
+
+async def iter_all_pages(
     client: httpx.AsyncClient,
     base_url: str,
     endpoint: str,
@@ -93,14 +146,19 @@ async def fetch_all_pages(
     page_start: int = 0,
     size_param: str = "size",
     default_page_size: int = 20,
-) -> List[Dict[str, Any]]:
+    max_concurrency: int = 4,
+    ordered: bool = True,
+) -> AsyncIterator[Dict[str, Any]]:
     """
-    Асинхронно извлекает все страницы paginated API-ответа.
+    Асинхронный генератор элементов paginated API-ответа.
 
-    Поддерживает:
-    - Начало с любой страницы (`page_start`)
-    - Настройку имени параметров пагинации
-    - Безопасную работу с параметрами (не мутирует входные данные)
+    Первая страница запрашивается отдельно: по её totalPages/totalElements остальные
+    страницы загружаются параллельно (не больше max_concurrency одновременно), а
+    элементы отдаются по мере прихода страниц. Вызывающий может прервать перебор в
+    любой момент — незавершённые запросы страниц отменяются.
+
+    Если общее число страниц неизвестно, страницы читаются последовательно до пустой
+    или неполной страницы. При ошибке загрузки страницы перебор завершается.
 
     Args:
         client: Экземпляр httpx.AsyncClient.
@@ -112,61 +170,128 @@ async def fetch_all_pages(
         page_start: Стартовый номер страницы (обычно 0 или 1).
         size_param: Имя параметра размера страницы.
         default_page_size: Размер страницы, если не задан в params.
-
-    Returns:
-        Список всех элементов из всех страниц.
+        max_concurrency: Сколько страниц загружать одновременно.
+        ordered: Отдавать элементы в порядке страниц (True) или в порядке прихода страниц.
     """
-    all_items = []
     base_params = params.copy() if params else {}
-
     if size_param not in base_params:
         base_params[size_param] = default_page_size
+    page_size = int(base_params[size_param])
+    url = f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+
+    def fetch(page: int) -> Awaitable[Dict[str, Any]]:
+        return _fetch_page(
+            client, url, headers, {**base_params, page_param: page},
+            f"Fetch {page_param}={page} of {endpoint}",
+        )
 
     page = page_start
+    try:
+        first = await fetch(page)
+    except Exception as e:
+        logger.error(f"Error fetching {page_param}={page} of {endpoint}: {e}")
+        return
+
+    items = _page_items(first)
+    for item in items:
+        yield item
+    if not items:
+        return
+
+    page_size = _page_size(first, items, page_size)
+    total_pages = _total_pages(first, page_size)
+
+    if total_pages is None:
+        # Число страниц неизвестно — читаем последовательно
+        while len(items) >= page_size:
+            page += 1
+            try:
+                items = _page_items(await fetch(page))
+            except Exception as e:
+                logger.error(f"Error fetching {page_param}={page} of {endpoint}: {e}")
+                return
+            for item in items:
+                yield item
+        return
+
+    remaining = range(page_start + 1, page_start + total_pages)
+    if not remaining:
+        return
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_limited(page_number: int) -> Tuple[int, Dict[str, Any]]:
+        async with semaphore:
+            return page_number, await fetch(page_number)
+
+    tasks = [asyncio.create_task(fetch_limited(p)) for p in remaining]
+    try:
+        if ordered:
+            for task in tasks:
+                page_number, data = await task
+                for item in _page_items(data):
+                    yield item
+        else:
+            for next_done in asyncio.as_completed(tasks):
+                page_number, data = await next_done
+                for item in _page_items(data):
+                    yield item
+    except Exception as e:
+        logger.error(f"Error fetching pages of {endpoint}: {e}")
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
-    while True:
-        request_params = {**base_params, page_param: page}
-        url = f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
 
-        try:
-            response = await client.get(url, headers=headers, params=request_params)
-            await handle_api_error(response, f"Fetch {page_param}={page} of {endpoint}")
-            data = response.json()
-
-            items = data.get("content", [])
-            if not items:
-                items = data.get("items", [])
-            if not items:
-                items = data.get("results", [])
-
-            total_pages = data.get("totalPages")
-            total_elements = data.get("totalElements")
-
-            all_items.extend(items)
-
-            if not items:
-                break
-
-            if total_pages is not None:
-                if page >= total_pages - 1:
-                    break
-            elif total_elements is not None:
-                fetched = len(all_items)
-                if fetched >= total_elements:
-                    break
-            else:
-                if len(items) < base_params[size_param]:
-                    break
+async def fetch_all_pages(
+    client: httpx.AsyncClient,
+    base_url: str,
+    endpoint: str,
+    headers: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    page_param: str = "page",
+    page_start: int = 0,
+    size_param: str = "size",
+    default_page_size: int = 20,
+    max_concurrency: int = 4,
+) -> List[Dict[str, Any]]:
+    """
+    Асинхронно извлекает все страницы paginated API-ответа.
 
-            page += 1
+    Поддерживает:
+    - Начало с любой страницы (`page_start`)
+    - Настройку имени параметров пагинации
+    - Безопасную работу с параметрами (не мутирует входные данные)
+    - Параллельную загрузку страниц после первой (см. iter_all_pages) с сохранением порядка
 
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error fetching {page_param}={page} of {endpoint}: {e}")
-            break
-        except Exception as e:
-            logger.error(
-                f"Unexpected error fetching {page_param}={page} of {endpoint}: {e}"
-            )
-            break
+    Args:
+        client: Экземпляр httpx.AsyncClient.
+        base_url: Базовый URL API (ожидается строка).
+        endpoint: Конечная точка API.
+        headers: Заголовки для запроса.
+        params: Базовые параметры запроса (не должны содержать page/size, если не нужно).
+        page_param: Имя параметра для номера страницы (по умолчанию "page").
+        page_start: Стартовый номер страницы (обычно 0 или 1).
+        size_param: Имя параметра размера страницы.
+        default_page_size: Размер страницы, если не задан в params.
+        max_concurrency: Сколько страниц загружать одновременно.
 
-    return all_items
+    Returns:
+        Список всех элементов из всех страниц (в порядке страниц).
+    """
+    return [
+        item
+        async for item in iter_all_pages(
+            client,
+            base_url,
+            endpoint,
+            headers=headers,
+            params=params,
+            page_param=page_param,
+            page_start=page_start,
+            size_param=size_param,
+            default_page_size=default_page_size,
+            max_concurrency=max_concurrency,
+        )
+    ]
@@ -1,5 +1,9 @@
+import asyncio
+import hashlib
 import io
-from typing import Optional
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,31 +17,140 @@ except ImportError:
     PdfReader = None
 
 
+def _extract_text(file_stream: BinaryIO, filename: str) -> Optional[str]:
+    ext = filename.lower().split(".")[-1] if "." in filename else ""
+
+    if ext == "pdf" and PdfReader:
+        reader = PdfReader(file_stream)
+        text = ""
+        for page in reader.pages:
+            text += page.extract_text() or ""
+        return text.strip()
+
+    elif ext == "docx" and docx2txt:
+        return docx2txt.process(file_stream)
+
+    elif ext == "txt":
+        return file_stream.read().decode("utf-8", errors="ignore").strip()
+
+    else:
+        logger.warning(f"Неподдерживаемый формат файла: {ext}")
+        return None
+
+
 def extract_text_from_bytes(file_bytes: bytes, filename: str) -> Optional[str]:
     """
     Извлекает текст из байтов файла (поддержка .docx, .pdf, .txt).
     """
     try:
-        file_stream = io.BytesIO(file_bytes)
-        ext = filename.lower().split(".")[-1] if "." in filename else ""
-
-        if ext == "pdf" and PdfReader:
-            reader = PdfReader(file_stream)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() or ""
-            return text.strip()
-
-        elif ext == "docx" and docx2txt:
-            return docx2txt.process(file_stream)
-
-        elif ext == "txt":
-            return file_bytes.decode("utf-8", errors="ignore").strip()
+        return _extract_text(io.BytesIO(file_bytes), filename)
+    except Exception as e:
+        logger.error(f"Ошибка извлечения текста из {filename}: {e}")
+        return None
 
-        else:
-            logger.warning(f"Неподдерживаемый формат файла: {ext}")
-            return None
 
+def extract_text_from_file(file_path: Path, filename: str) -> Optional[str]:
+    """
+    Извлекает текст из файла на диске, не загружая его в память целиком
+    (PDF и DOCX читаются из файла по мере разбора).
+    """
+    try:
+        with open(file_path, "rb") as file_stream:
+            return _extract_text(file_stream, filename)
     except Exception as e:
         logger.error(f"Ошибка извлечения текста из {filename}: {e}")
         return None
+
+
+class UploadTooLargeError(ValueError):
+    """Загружаемый файл превышает допустимый размер."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Файл превышает допустимый размер {max_bytes} байт")
+        self.max_bytes = max_bytes
+
+
+@dataclass(frozen=True)
+class SavedUpload:
+    """Результат потоковой записи загруженного файла."""
+
+    path: Path
+    size: int
+    sha256: str
+
+
+def _write_chunk(stream: BinaryIO, hasher, chunk: bytes) -> None:
+    stream.write(chunk)
+    hasher.update(chunk)
+
+
+async def save_byte_stream(chunks: AsyncIterator[bytes], destination: Path) -> SavedUpload:
+    """
+    Потоково записывает блоки байтов в файл, считая размер и SHA-256.
+
+    Запись и хеширование выполняются вне event loop, в памяти одновременно
+    находится не более одного блока. Ограничение размера — забота источника:
+    исключение из chunks прерывает запись, и частично записанный файл удаляется.
+
+    Args:
+        chunks: Асинхронный источник блоков.
+        destination: Путь для сохранения файла.
+
+    Returns:
+        SavedUpload с путём, размером и SHA-256 содержимого.
+    """
+    hasher = hashlib.sha256()
+    size = 0
+    stream = await asyncio.to_thread(open, destination, "wb")
+    try:
+        async for chunk in chunks:
+            size += len(chunk)
+            await asyncio.to_thread(_write_chunk, stream, hasher, chunk)
+    except BaseException:
+        await asyncio.to_thread(stream.close)
+        await asyncio.to_thread(destination.unlink, True)
+        raise
+    await asyncio.to_thread(stream.close)
+
+    return SavedUpload(path=destination, size=size, sha256=hasher.hexdigest())
+
+
+async def save_upload_stream(
+    upload,
+    destination: Path,
+    max_bytes: int,
+    chunk_size: int = 1024 * 1024,
+) -> SavedUpload:
+    """
+    Потоково сохраняет загруженный файл на диск блоками фиксированного размера.
+
+    Размер проверяется до чтения (если он известен) и после каждого блока.
+
+    Args:
+        upload: Объект с асинхронным методом read(size) (например, fastapi.UploadFile).
+        destination: Путь для сохранения файла.
+        max_bytes: Максимально допустимый размер файла.
+        chunk_size: Размер блока чтения/записи.
+
+    Returns:
+        SavedUpload с путём, размером и SHA-256 содержимого.
+
+    Raises:
+        UploadTooLargeError: Если файл превышает max_bytes (частично записанный файл удаляется).
+    """
+    declared_size = getattr(upload, "size", None)
+    if declared_size is not None and declared_size > max_bytes:
+        raise UploadTooLargeError(max_bytes)
+
+    async def read_chunks() -> AsyncIterator[bytes]:
+        size = 0
+        while True:
+            chunk = await upload.read(chunk_size)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadTooLargeError(max_bytes)
+            yield chunk
+
+    return await save_byte_stream(read_chunks(), destination)
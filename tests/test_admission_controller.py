@@ -0,0 +1,62 @@
+# tests/test_admission_controller.py
+import asyncio
+
+import pytest
+
+from src.edms_assistant.infrastructure.admission.admission_controller import (
+    AdmissionController,
+    AdmissionRejected,
+)
+
+
+def make_controller(**overrides) -> AdmissionController:
+    limits = {"max_concurrent": 16, "max_per_user": 4, "max_queue": 8, "queue_timeout": 5.0}
+    limits.update(overrides)
+    return AdmissionController(**limits)
+
+
+async def queue(controller: AdmissionController, user_key: str, count: int) -> list:
+    waiters = [asyncio.create_task(controller.acquire(user_key)) for _ in range(count)]
+    await asyncio.sleep(0)
+    return waiters
+
+
+def test_user_blocked_by_own_limit_does_not_block_others():
+    async def scenario():
+        controller = make_controller()
+        alice = [await controller.acquire("alice") for _ in range(4)]
+        alice_waiters = await queue(controller, "alice", 8)
+        assert controller.stats()["queue_depth"] == 8
+
+        # Bob идёт сразу: общих слотов 12, его лимит не исчерпан
+        admitted_at = await asyncio.wait_for(controller.acquire("bob"), timeout=0.1)
+        assert controller.stats()["active"] == 5
+
+        # Очередь Alice полна только для неё самой
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire("alice")
+        assert rejected.value.reason == "queue_full"
+
+        controller.release("bob", admitted_at)
+        controller.release("alice", alice[0])
+        done, _ = await asyncio.wait(alice_waiters, timeout=0.1, return_when=asyncio.FIRST_COMPLETED)
+        assert len(done) == 1
+        for waiter in alice_waiters:
+            waiter.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_waiters_for_global_slot_count_toward_queue_limit():
+    async def scenario():
+        controller = make_controller(max_concurrent=2, max_per_user=2, max_queue=1)
+        held = [await controller.acquire("alice") for _ in range(2)]
+        waiters = await queue(controller, "bob", 1)
+
+        with pytest.raises(AdmissionRejected):
+            await controller.acquire("carol")
+
+        controller.release("alice", held[0])
+        await asyncio.wait_for(waiters[0], timeout=0.1)
+
+    asyncio.run(scenario())
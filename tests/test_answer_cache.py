@@ -0,0 +1,71 @@
+# tests/test_answer_cache.py
+import asyncio
+from uuid import uuid4
+
+from src.edms_assistant.core.agents import document_agent
+from src.edms_assistant.core.state.credentials import CONFIG_KEY as SERVICE_TOKEN_KEY
+from src.edms_assistant.infrastructure.api_clients.document_client import document_client
+from src.edms_assistant.infrastructure.storage.answer_cache import AnswerCache, document_stamp
+
+V1 = document_stamp(b'{"id": "doc", "status": "DRAFT"}')
+V2 = document_stamp(b'{"id": "doc", "status": "SIGNED"}')
+
+
+def test_answer_served_while_document_unchanged():
+    cache = AnswerCache(ttl=3600, max_entries=10)
+    cache.put("token", "doc", "status", "Черновик", V1)
+
+    assert cache.get("token", "doc", "status", V1) == "Черновик"
+    assert cache.get("other-token", "doc", "status", V1) is None
+
+
+def test_changed_document_misses_and_drops_entry():
+    cache = AnswerCache(ttl=3600, max_entries=10)
+    cache.put("token", "doc", "status", "Черновик", V1)
+
+    assert cache.get("token", "doc", "status", V2) is None
+    assert cache.get("token", "doc", "status", V1) is None
+    assert cache.stats()["changed"] == 1
+
+
+def test_answer_expires_after_max_age():
+    cache = AnswerCache(ttl=30, max_entries=10)
+    cache.put("token", "doc", "status", "Черновик", V1)
+    for entry in cache._entries.values():
+        entry.stored_at -= 31
+
+    assert cache.get("token", "doc", "status", V1) is None
+
+
+def test_document_agent_reuses_answer_until_document_changes(monkeypatch):
+    document_id = str(uuid4())
+    body = {"content": f'{{"id": "{document_id}", "regNumber": "A-1"}}'.encode()}
+    rendered = []
+
+    async def get_document_content(doc_uuid, service_token=None):
+        return body["content"]
+
+    def render_document_answer(doc_data, intent):
+        rendered.append(doc_data.get("regNumber"))
+        return f"Номер: {doc_data.get('regNumber')}"
+
+    monkeypatch.setattr(document_client, "get_document_content", get_document_content)
+    monkeypatch.setattr(document_agent, "render_document_answer", render_document_answer)
+    monkeypatch.setattr(document_agent, "answer_cache", AnswerCache(ttl=3600, max_entries=10))
+
+    async def ask() -> str:
+        graph = document_agent.create_document_agent_graph()
+        state = {"user_message": "Какой регистрационный номер?", "agent_input": {"document_id": document_id}}
+        result = await graph.ainvoke(state, config={"configurable": {SERVICE_TOKEN_KEY: "token-0123456789"}})
+        return result["messages"][-1].content
+
+    async def scenario():
+        assert await ask() == "Номер: A-1"
+        assert await ask() == "Номер: A-1"
+        assert rendered == ["A-1"]
+
+        body["content"] = f'{{"id": "{document_id}", "regNumber": "A-2"}}'.encode()
+        assert await ask() == "Номер: A-2"
+        assert rendered == ["A-1", "A-2"]
+
+    asyncio.run(scenario())
@@ -0,0 +1,18 @@
+# tests/test_api_operations.py
+from uuid import UUID
+
+from src.edms_assistant.infrastructure.api_clients.api_operations import Operation
+
+
+def test_path_params_are_encoded():
+    operation = Operation("GET", "api/document/{id}/attachment/{name}")
+
+    endpoint = operation.endpoint({"id": "../employee/1?x=1#", "name": "отчёт 1.pdf"})
+
+    assert endpoint == "api/document/..%2Femployee%2F1%3Fx%3D1%23/attachment/%D0%BE%D1%82%D1%87%D1%91%D1%82%201.pdf"
+
+
+def test_uuid_path_param_is_unchanged():
+    document_id = UUID("7d5f2b8e-3b0a-4a7e-9b0e-1c2d3e4f5a6b")
+
+    assert Operation("GET", "api/document/{id}").endpoint({"id": document_id}) == f"api/document/{document_id}"
@@ -0,0 +1,105 @@
+# tests/test_bulk_documents.py
+import asyncio
+import json
+from uuid import uuid4
+
+import httpx
+
+from src.edms_assistant.infrastructure.api_clients.document_client import DocumentClient
+
+BASE_URL = "http://edms.test"
+
+
+class FakeFetch:
+    """Подмена DocumentClient._fetch: ответ на GET api/document/{id} с задержкой."""
+
+    def __init__(self, delay: float = 0.01, status: dict = None, bodies: dict = None):
+        self.delay = delay
+        self.status = status or {}
+        self.bodies = bodies or {}
+        self.requested = []
+        self.cancelled = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, method: str, endpoint: str, service_token=None, **kwargs) -> httpx.Response:
+        document_id = endpoint.rsplit("/", 1)[-1]
+        self.requested.append(document_id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        request = httpx.Request(method, f"{BASE_URL}/{endpoint}")
+        status = self.status.get(document_id, 200)
+        if status >= 400:
+            response = httpx.Response(status, request=request)
+            raise httpx.HTTPStatusError("error", request=request, response=response)
+        body = self.bodies.get(document_id, json.dumps({"id": document_id}).encode())
+        return httpx.Response(status, content=body, request=request)
+
+
+def make_client(fetch: FakeFetch) -> DocumentClient:
+    client = DocumentClient(base_url=BASE_URL)
+    client._fetch = fetch
+    return client
+
+
+def test_duplicates_are_loaded_once_and_results_keep_input_order():
+    async def scenario():
+        fetch = FakeFetch()
+        first, second = str(uuid4()), str(uuid4())
+        results = await make_client(fetch).get_documents([second, first.upper(), first, second])
+
+        assert list(results) == [second, first]
+        assert sorted(fetch.requested) == sorted([first, second])
+        assert all(result.ok and str(result.document.id) == key for key, result in results.items())
+
+    asyncio.run(scenario())
+
+
+def test_errors_are_reported_per_document():
+    async def scenario():
+        good, missing, broken = str(uuid4()), str(uuid4()), str(uuid4())
+        fetch = FakeFetch(status={missing: 404}, bodies={broken: b'{"id": 5}'})
+        results = await make_client(fetch).get_documents([good, "not-a-uuid", missing, broken])
+
+        assert results[good].ok
+        assert results["not-a-uuid"].error == "invalid_document_id"
+        assert (results[missing].error, results[missing].status_code) == ("http_error", 404)
+        assert results[broken].error.startswith("validation_error")
+        assert "not-a-uuid" not in fetch.requested
+
+    asyncio.run(scenario())
+
+
+def test_concurrency_is_bounded():
+    async def scenario():
+        fetch = FakeFetch()
+        ids = [str(uuid4()) for _ in range(10)]
+        results = await make_client(fetch).get_documents(ids, max_concurrency=3)
+
+        assert len(results) == 10
+        assert fetch.max_in_flight == 3
+
+    asyncio.run(scenario())
+
+
+def test_stopping_iteration_cancels_pending_loads():
+    async def scenario():
+        fetch = FakeFetch(delay=0.05)
+        documents = make_client(fetch).iter_documents([uuid4() for _ in range(6)], max_concurrency=2)
+        async for result in documents:
+            assert result.ok
+            break
+        await documents.aclose()
+
+        assert len(fetch.requested) < 6
+        assert fetch.cancelled >= 1
+        assert fetch.in_flight == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,120 @@
+# tests/test_chat_batch.py
+import asyncio
+import json
+import uuid
+
+from langchain_core.messages import AIMessage
+
+from src.edms_assistant.config.settings import settings
+from src.edms_assistant.core.loaders.request_loader import get_request_loader, load_once
+from src.edms_assistant.core.state.credentials import get_service_token
+from src.edms_assistant.presentation import api
+
+DOCUMENT_ID = str(uuid.uuid4())
+
+
+class FakeGraph:
+    """Граф, который читает документ элемента через загрузчик запроса."""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.fetches = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.loaders = set()
+
+    async def fetch(self) -> bytes:
+        self.fetches += 1
+        await asyncio.sleep(self.delay)
+        return b"document"
+
+    async def ainvoke(self, state, config):
+        self.loaders.add(id(get_request_loader(config)))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if state["user_message"] == "fail":
+                raise RuntimeError("graph failed")
+            key = ("document", state["document_id"], get_service_token(config))
+            await load_once(config, key, self.fetch)
+            return {"messages": [AIMessage(content=f"ответ: {state['user_message']}")]}
+        finally:
+            self.in_flight -= 1
+
+
+class FakeCheckpointer:
+    def __init__(self):
+        self.deleted = []
+
+    async def adelete_thread(self, thread_id):
+        self.deleted.append(thread_id)
+
+
+class FakeRegistry:
+    def __init__(self, graph: FakeGraph):
+        self.graph = graph
+        self.checkpointer = FakeCheckpointer()
+
+    def get_graph(self):
+        return self.graph
+
+
+def make_request(messages, concurrency=None, document_ids=None) -> api.BatchChatRequest:
+    document_ids = document_ids or [DOCUMENT_ID] * len(messages)
+    return api.BatchChatRequest(
+        user_id=str(uuid.uuid4()),
+        service_token="token",
+        items=[{"document_id": doc, "message": message} for doc, message in zip(document_ids, messages)],
+        concurrency=concurrency,
+    )
+
+
+def test_batch_shares_document_fetch_and_clamps_concurrency(monkeypatch):
+    async def scenario():
+        registry = FakeRegistry(FakeGraph())
+        monkeypatch.setattr(api, "graph_registry", registry)
+        request = make_request([f"вопрос {i}" for i in range(10)] + ["fail"], concurrency=100)
+
+        lines = [json.loads(line) async for line in api._stream_batch(request, uuid.UUID(request.user_id))]
+        results = {line["index"]: line for line in lines}
+
+        assert sorted(results) == list(range(11))
+        assert results[3]["response"] == "ответ: вопрос 3"
+        assert results[10]["error"] == "Agent error"
+        assert registry.graph.fetches == 1
+        assert len(registry.graph.loaders) == 1
+        assert registry.graph.max_in_flight == min(settings.batch.max_concurrency, settings.admission.max_per_user)
+        assert len(set(registry.checkpointer.deleted)) == 11
+
+    asyncio.run(scenario())
+
+
+def test_stopped_batch_closes_loader_and_cancels_items(monkeypatch):
+    async def scenario():
+        registry = FakeRegistry(FakeGraph(delay=0.05))
+        monkeypatch.setattr(api, "graph_registry", registry)
+        loaders = []
+
+        class TrackedLoader(api.RequestLoader):
+            def __init__(self):
+                super().__init__()
+                loaders.append(self)
+
+        monkeypatch.setattr(api, "RequestLoader", TrackedLoader)
+        # Разные документы: к моменту остановки загрузка следующего элемента ещё идёт
+        request = make_request(
+            [f"вопрос {i}" for i in range(6)], concurrency=1, document_ids=[str(uuid.uuid4()) for _ in range(6)]
+        )
+
+        stream = api._stream_batch(request, uuid.UUID(request.user_id))
+        assert json.loads(await stream.__anext__())["response"] == "ответ: вопрос 0"
+        await asyncio.sleep(0.01)
+        await stream.aclose()
+        await asyncio.sleep(0)
+
+        tasks = list(loaders[0]._tasks.values())
+        assert 1 < len(tasks) < 6
+        assert tasks[-1].cancelled()
+        assert registry.graph.fetches < 6
+
+    asyncio.run(scenario())
@@ -0,0 +1,55 @@
+# tests/test_chat_stream.py
+import asyncio
+
+import pytest
+from starlette.requests import ClientDisconnect
+
+from src.edms_assistant.presentation.api import ClosingStreamingResponse
+
+SCOPE = {"type": "http", "asgi": {"spec_version": "2.4"}}
+
+
+def make_response(started: list, closed: list) -> ClosingStreamingResponse:
+    async def frames():
+        started.append(True)
+        try:
+            yield "event: done\ndata: {}\n\n"
+        finally:
+            started.append("finally")
+
+    return ClosingStreamingResponse(frames(), lambda: closed.append(True), media_type="text/event-stream")
+
+
+async def receive():
+    return {"type": "http.disconnect"}
+
+
+def test_on_close_runs_when_client_disconnects_before_stream_starts():
+    async def scenario():
+        started, closed = [], []
+
+        async def send(message):
+            raise OSError("client went away")
+
+        with pytest.raises(ClientDisconnect):
+            await make_response(started, closed)(SCOPE, receive, send)
+        assert started == []
+        assert closed == [True]
+
+    asyncio.run(scenario())
+
+
+def test_on_close_runs_once_after_stream_completes():
+    async def scenario():
+        started, closed = [], []
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        await make_response(started, closed)(SCOPE, receive, send)
+        assert started == [True, "finally"]
+        assert closed == [True]
+        assert sent[-1] == {"type": "http.response.body", "body": b"", "more_body": False}
+
+    asyncio.run(scenario())
@@ -0,0 +1,77 @@
+# tests/test_clarification_resume.py
+import asyncio
+import json
+from uuid import uuid4
+
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, StateGraph
+from langgraph.types import Command
+
+from src.edms_assistant.core.agents.employee_agent import create_employee_agent_graph
+from src.edms_assistant.core.state.credentials import CONFIG_KEY as SERVICE_TOKEN_KEY
+from src.edms_assistant.core.state.global_state import GlobalState
+from src.edms_assistant.infrastructure.api_clients.document_client import document_client
+
+OWNER_TOKEN = "owner-token-0123456789"
+CALLER_TOKEN = "caller-token-0123456789"
+
+
+def make_graph():
+    # Как в оркестраторе: агент сотрудников — подграф потока с чекпоинтером
+    workflow = StateGraph(GlobalState)
+    workflow.add_node("employee_agent", create_employee_agent_graph())
+    workflow.set_entry_point("employee_agent")
+    workflow.add_edge("employee_agent", END)
+    return workflow.compile(checkpointer=MemorySaver())
+
+
+def run_config(token: str) -> dict:
+    return {"configurable": {"thread_id": "thread", SERVICE_TOKEN_KEY: token}}
+
+
+def test_resume_fetches_employee_with_resuming_callers_token(monkeypatch):
+    requested_with = []
+
+    async def search_employees(filter_data, service_token=None):
+        return {"content": [{"id": str(uuid4()), "lastName": "Иванов"} for _ in range(2)]}
+
+    async def get_employee_by_id(employee_id, service_token=None):
+        requested_with.append(service_token)
+        return {"id": str(employee_id)}
+
+    monkeypatch.setattr(document_client, "search_employees", search_employees)
+    monkeypatch.setattr(document_client, "get_employee_by_id", get_employee_by_id)
+
+    async def scenario():
+        graph = make_graph()
+        state = {
+            "user_message": "Кто такой Иванов?",
+            "agent_input": {"last_name": "Иванов"},
+            "messages": [],
+        }
+        first = await graph.ainvoke(state, config=run_config(OWNER_TOKEN))
+        assert "__interrupt__" in first
+
+        outsider_id = str(uuid4())
+        result = await graph.ainvoke(Command(resume=outsider_id), config=run_config(CALLER_TOKEN))
+        assert json.loads(result["messages"][-1].content) == {"id": outsider_id}
+
+    asyncio.run(scenario())
+    assert requested_with == [CALLER_TOKEN]
+
+
+def test_token_is_not_persisted_in_checkpoints(monkeypatch):
+    async def search_employees(filter_data, service_token=None):
+        return {"content": [{"id": str(uuid4()), "lastName": "Иванов"} for _ in range(2)]}
+
+    monkeypatch.setattr(document_client, "search_employees", search_employees)
+
+    async def scenario():
+        graph = make_graph()
+        state = {"user_message": "Кто такой Иванов?", "agent_input": {"last_name": "Иванов"}, "messages": []}
+        await graph.ainvoke(state, config=run_config(OWNER_TOKEN))
+        saver = graph.checkpointer
+        assert saver.storage
+        assert OWNER_TOKEN not in repr(saver.storage) + repr(saver.writes)
+
+    asyncio.run(scenario())
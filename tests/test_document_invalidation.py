@@ -0,0 +1,70 @@
+# tests/test_document_invalidation.py
+import asyncio
+from uuid import uuid4
+
+import httpx
+
+from src.edms_assistant.infrastructure.api_clients.api_operations import ApiGroup, Operation
+from src.edms_assistant.infrastructure.api_clients.document_client import DocumentClient
+from src.edms_assistant.infrastructure.api_clients.response_cache import ResponseCache
+from src.edms_assistant.infrastructure.storage.answer_cache import answer_cache, document_stamp
+
+TOKEN = "token"
+STAMP = document_stamp(b"{}")
+
+
+class FakePool:
+    """Отвечает 200 на любой запрос и считает обращения."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        self.calls.append((method, url))
+        return httpx.Response(200, json={"ok": True}, request=httpx.Request(method, url))
+
+
+class ColorApi(ApiGroup):
+    _op_update_color = Operation("PUT", "api/document/{id}/color")
+
+    async def update_color(self, id, *, service_token=None):
+        return await self._call(self._op_update_color, path={"id": id}, service_token=service_token)
+
+
+def make_client() -> DocumentClient:
+    client = DocumentClient(base_url="http://edms.test", service_token=TOKEN)
+    client.pool = FakePool()
+    client.response_cache = ResponseCache({"api/document/*": 30}, max_entries=100, max_bytes=1 << 20)
+    return client
+
+
+def test_generated_client_mutation_invalidates_document_caches():
+    async def scenario():
+        client = make_client()
+        document_id = uuid4()
+        answer_cache.put(TOKEN, str(document_id), "summary", "answer", STAMP)
+
+        await client._fetch("GET", f"api/document/{document_id}", TOKEN)
+        await client._fetch("GET", f"api/document/{document_id}", TOKEN)
+        assert len(client.pool.calls) == 1
+
+        await ColorApi(client).update_color(document_id, service_token=TOKEN)
+
+        assert answer_cache.get(TOKEN, str(document_id), "summary", STAMP) is None
+        await client._fetch("GET", f"api/document/{document_id}", TOKEN)
+        assert [method for method, _ in client.pool.calls] == ["GET", "PUT", "GET"]
+
+    asyncio.run(scenario())
+
+
+def test_get_does_not_invalidate():
+    async def scenario():
+        client = make_client()
+        document_id = uuid4()
+        answer_cache.put(TOKEN, str(document_id), "summary", "answer", STAMP)
+
+        await client._fetch("GET", f"api/document/{document_id}/properties", TOKEN)
+
+        assert answer_cache.get(TOKEN, str(document_id), "summary", STAMP) == "answer"
+
+    asyncio.run(scenario())
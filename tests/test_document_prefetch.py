@@ -0,0 +1,85 @@
+# tests/test_document_prefetch.py
+import asyncio
+import json
+from uuid import uuid4
+
+from src.edms_assistant.core.loaders.document_loader import load_document, peek_document, prefetch_document
+from src.edms_assistant.core.loaders.request_loader import CONFIG_KEY, RequestLoader
+from src.edms_assistant.infrastructure.api_clients.document_client import document_client
+from src.edms_assistant.presentation import api
+
+TOKEN = "token"
+
+
+class FakeEdms:
+    """Подмена document_client.get_document_content: отвечает после release."""
+
+    def __init__(self):
+        self.requested = []
+        self.release = asyncio.Event()
+
+    async def get_document_content(self, document_id, service_token=None) -> bytes:
+        self.requested.append((str(document_id), service_token))
+        await self.release.wait()
+        return json.dumps({"id": str(document_id), "regNumber": "42", "shortSummary": "Договор"}).encode()
+
+
+def install(monkeypatch) -> FakeEdms:
+    edms = FakeEdms()
+    monkeypatch.setattr(document_client, "get_document_content", edms.get_document_content)
+    return edms
+
+
+def test_agent_load_reuses_prefetched_document(monkeypatch):
+    async def scenario():
+        edms = install(monkeypatch)
+        document_id = str(uuid4())
+        loader = RequestLoader()
+        prefetch_document(loader, document_id, TOKEN)
+        await asyncio.sleep(0)
+        assert edms.requested == [(document_id, TOKEN)]
+
+        # Планировщик не ждёт EDMS: пока ответа нет, документа нет
+        assert peek_document(loader, document_id, TOKEN) is None
+
+        edms.release.set()
+        document = await load_document(document_id, TOKEN, {"configurable": {CONFIG_KEY: loader}})
+        assert document["regNumber"] == "42"
+        assert peek_document(loader, document_id, TOKEN, profile="brief")["shortSummary"] == "Договор"
+        assert len(edms.requested) == 1
+
+    asyncio.run(scenario())
+
+
+def test_invalid_document_id_is_not_prefetched(monkeypatch):
+    async def scenario():
+        edms = install(monkeypatch)
+        loader = RequestLoader()
+        prefetch_document(loader, "not-a-uuid", TOKEN)
+        await asyncio.sleep(0)
+        assert edms.requested == []
+        assert peek_document(loader, "not-a-uuid", TOKEN) is None
+
+    asyncio.run(scenario())
+
+
+def test_create_loader_prefetches_only_for_new_document_questions(monkeypatch):
+    async def scenario():
+        edms = install(monkeypatch)
+        document_id = str(uuid4())
+        loaders = [
+            api._create_loader(document_id, TOKEN, None),
+            api._create_loader(document_id, None, None),
+            api._create_loader(None, TOKEN, None),
+            # Ответ на уточнение продолжает прерванный граф — документ не нужен
+            api._create_loader(document_id, TOKEN, str(uuid4())),
+        ]
+        await asyncio.sleep(0)
+        assert edms.requested == [(document_id, TOKEN)]
+
+        # Непонадобившаяся предзагрузка отменяется в конце запроса
+        loaders[0].close()
+        await asyncio.sleep(0)
+        assert loaders[0]._tasks[("document", document_id, TOKEN)].cancelled()
+
+    asyncio.run(scenario())
@@ -0,0 +1,57 @@
+# tests/test_document_projection.py
+import json
+from uuid import uuid4
+
+import pytest
+
+from src.edms_assistant.core.tools.document_tool import DOCUMENT_PROFILES, project_document
+from src.edms_assistant.infrastructure import resources_openapi as models
+from src.edms_assistant.infrastructure.api_clients.model_adapters import to_payload
+
+DOCUMENT_ID = str(uuid4())
+VERSION_ID = str(uuid4())
+ATTACHMENT_ID = str(uuid4())
+EMPLOYEE_ID = str(uuid4())
+
+DOCUMENT = {
+    "id": DOCUMENT_ID,
+    "documentVersionId": VERSION_ID,
+    "regNumber": "42-ОД",
+    "status": "DRAFT",
+    "shortSummary": "Договор поставки",
+    "author": {"lastName": "Иванова", "firstName": "Анна", "authorPost": "Юрист", "employeeId": EMPLOYEE_ID},
+    "attachmentDocument": [{"id": ATTACHMENT_ID, "name": "contract.pdf", "size": 1024}],
+}
+CONTENT = json.dumps(DOCUMENT).encode()
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_profile_keeps_only_its_fields_and_identity(trusted):
+    author = to_payload(CONTENT, models.DocumentDto, trusted=trusted, include=DOCUMENT_PROFILES["author"])
+    assert author == {
+        "id": DOCUMENT_ID,
+        "documentVersionId": VERSION_ID,
+        "author": {"lastName": "Иванова", "firstName": "Анна", "authorPost": "Юрист"},
+    }
+
+    attachments = to_payload(CONTENT, models.DocumentDto, trusted=trusted, include=DOCUMENT_PROFILES["attachments"])
+    assert attachments["attachmentDocument"] == [{"id": ATTACHMENT_ID, "name": "contract.pdf"}]
+    assert set(attachments) == {"id", "documentVersionId", "attachmentDocument"}
+
+
+def test_full_and_unknown_profiles_return_whole_document():
+    full = project_document(DOCUMENT_ID, CONTENT, "full")
+    assert full["shortSummary"] == "Договор поставки"
+    assert full["author"]["employeeId"] == EMPLOYEE_ID
+    assert project_document(DOCUMENT_ID, CONTENT, "no-such-profile") == full
+
+
+def test_fields_outside_profile_are_not_validated():
+    broken = json.dumps({**DOCUMENT, "status": "NOT_A_STATUS"}).encode()
+    assert project_document(DOCUMENT_ID, broken, "reg_number") == {
+        "id": DOCUMENT_ID,
+        "documentVersionId": VERSION_ID,
+        "regNumber": "42-ОД",
+    }
+    # Поле профиля по-прежнему валидируется
+    assert project_document(DOCUMENT_ID, broken, "status") is None
@@ -0,0 +1,100 @@
+# tests/test_hedging.py
+import asyncio
+
+import httpx
+
+from src.edms_assistant.infrastructure.api_clients.hedging import RequestHedger, route_of
+
+DOCUMENT_ID = "7d5f2b8e-3b0a-4a7e-9b0e-1c2d3e4f5a6b"
+URL = f"http://edms.test/api/document/{DOCUMENT_ID}"
+
+
+def make_hedger(budget_ratio: float = 1.0, warm: bool = True) -> RequestHedger:
+    hedger = RequestHedger(
+        enabled=True, percentile=95, min_delay=0.01, max_delay=0.05, budget_ratio=budget_ratio, min_samples=5
+    )
+    if warm:
+        for _ in range(5):
+            hedger._record(route_of(URL), 0.01)
+    return hedger
+
+
+class Backend:
+    """send(): первый запрос отвечает через first_delay, последующие — через next_delay."""
+
+    def __init__(self, first_delay: float, next_delay: float = 0.0, first_error: Exception = None):
+        self.delays = [first_delay, next_delay]
+        self.first_error = first_error
+        self.started = 0
+        self.cancelled = []
+
+    async def send(self) -> httpx.Response:
+        attempt = self.started
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delays[min(attempt, 1)])
+        except asyncio.CancelledError:
+            self.cancelled.append(attempt)
+            raise
+        if attempt == 0 and self.first_error:
+            raise self.first_error
+        return httpx.Response(200, json={"attempt": attempt})
+
+
+def test_route_replaces_ids():
+    assert route_of(f"{URL}/version?x=1") == "/api/document/*/version"
+
+
+def test_slow_primary_is_hedged_and_loser_cancelled():
+    async def scenario():
+        hedger, backend = make_hedger(), Backend(first_delay=1.0)
+        response = await hedger.run(URL, backend.send)
+        await asyncio.sleep(0)
+
+        assert response.json() == {"attempt": 1}
+        assert backend.started == 2
+        assert backend.cancelled == [0]
+        assert hedger.stats()["hedge_wins"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_fast_primary_is_not_hedged():
+    async def scenario():
+        hedger, backend = make_hedger(), Backend(first_delay=0.0)
+        assert (await hedger.run(URL, backend.send)).json() == {"attempt": 0}
+        assert backend.started == 1
+
+    asyncio.run(scenario())
+
+
+def test_no_hedge_until_enough_samples():
+    async def scenario():
+        hedger, backend = make_hedger(warm=False), Backend(first_delay=0.1)
+        assert (await hedger.run(URL, backend.send)).json() == {"attempt": 0}
+        assert backend.started == 1
+
+    asyncio.run(scenario())
+
+
+def test_budget_limits_hedges():
+    async def scenario():
+        hedger = make_hedger(budget_ratio=0.5)
+        first, second = Backend(first_delay=0.2), Backend(first_delay=0.2)
+        await hedger.run(URL, first.send)
+        await hedger.run(URL, second.send)
+
+        # Бюджет 0.5 + 0.5: хватает только на один хедж из двух запросов
+        assert first.started + second.started == 3
+        assert hedger.stats()["budget_exhausted"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_failed_primary_falls_back_to_hedge():
+    async def scenario():
+        hedger = make_hedger()
+        backend = Backend(first_delay=0.1, next_delay=0.2, first_error=httpx.ReadError("reset"))
+        assert (await hedger.run(URL, backend.send)).json() == {"attempt": 1}
+
+    asyncio.run(scenario())
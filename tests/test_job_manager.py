@@ -0,0 +1,69 @@
+# tests/test_job_manager.py
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from src.edms_assistant.infrastructure.jobs.job_manager import JobManager, JobQueueFull, JobStatus
+from src.edms_assistant.presentation import api
+
+
+def make_manager(tmp_path, workers: int = 1, max_pending: int = 8) -> JobManager:
+    return JobManager(state_dir=tmp_path, workers=workers, max_pending=max_pending, result_ttl=3600)
+
+
+async def result(text: str) -> str:
+    return text
+
+
+def test_job_runs_and_result_is_persisted(tmp_path):
+    async def scenario():
+        manager = make_manager(tmp_path)
+        await manager.startup()
+        try:
+            job = await manager.submit("summarize_file", "alice", {"file_name": "a.txt"}, lambda: result("ok"))
+            await asyncio.wait_for(manager._queue.join(), timeout=1.0)
+            assert job.status == JobStatus.SUCCEEDED
+            assert job.result == "ok"
+            assert manager._read(job.id).result == "ok"
+        finally:
+            await manager.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_submits_beyond_limit_are_rejected_cleanly(tmp_path):
+    async def scenario():
+        # Без воркеров очередь не разбирается: лимит проверяется как есть
+        manager = make_manager(tmp_path, workers=0, max_pending=1)
+        await manager.startup()
+        outcomes = await asyncio.gather(
+            *(manager.submit("summarize_file", "alice", {}, lambda: result("ok")) for _ in range(3)),
+            return_exceptions=True,
+        )
+        accepted = [job for job in outcomes if not isinstance(job, BaseException)]
+        rejected = [error for error in outcomes if isinstance(error, BaseException)]
+
+        assert len(accepted) == 1
+        assert rejected and all(isinstance(error, JobQueueFull) for error in rejected)
+        assert list(manager._jobs) == [accepted[0].id]
+        assert sorted(path.stem for path in tmp_path.glob("*.json")) == [accepted[0].id]
+        await manager.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_job_is_visible_only_to_its_owner(tmp_path, monkeypatch):
+    async def scenario():
+        manager = make_manager(tmp_path, workers=0)
+        await manager.startup()
+        monkeypatch.setattr(api, "job_manager", manager)
+        job = await manager.submit("summarize_file", "alice", {}, lambda: result("ok"))
+
+        assert (await api._get_owned_job(job.id, "alice")).id == job.id
+        with pytest.raises(HTTPException) as error:
+            await api._get_owned_job(job.id, "bob")
+        assert error.value.status_code == 404
+        await manager.shutdown()
+
+    asyncio.run(scenario())
@@ -0,0 +1,74 @@
+# tests/test_pagination.py
+import asyncio
+import random
+
+import httpx
+
+from src.edms_assistant.utils.api_utils import fetch_all_pages, iter_all_pages
+
+BASE_URL = "http://edms.test"
+
+
+def make_client(total: int, max_size: int = 1000, with_total_pages: bool = True, state: dict = None) -> httpx.AsyncClient:
+    """Spring Page поверх списка 0..total-1; сервер урезает size до max_size."""
+    state = state if state is not None else {}
+    state.setdefault("in_flight", 0)
+    state.setdefault("max_in_flight", 0)
+    state.setdefault("requested", [])
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        size = min(int(request.url.params["size"]), max_size)
+        state["requested"].append(page)
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        # Страницы приходят в случайном порядке
+        await asyncio.sleep(random.uniform(0, 0.01))
+        state["in_flight"] -= 1
+        content = list(range(page * size, min((page + 1) * size, total)))
+        body = {"content": content, "size": size, "numberOfElements": len(content), "totalElements": total}
+        if with_total_pages:
+            body["totalPages"] = -(-total // size)
+        return httpx.Response(200, json=body)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_pages_are_yielded_in_order_with_bounded_concurrency():
+    async def scenario():
+        state = {}
+        async with make_client(total=95, state=state) as client:
+            items = await fetch_all_pages(
+                client, BASE_URL, "api/employee", params={"size": 10}, max_concurrency=3
+            )
+        assert items == list(range(95))
+        assert sorted(state["requested"]) == list(range(10))
+        assert state["max_in_flight"] <= 3
+
+    asyncio.run(scenario())
+
+
+def test_server_capped_page_size_does_not_drop_trailing_pages():
+    async def scenario():
+        async with make_client(total=95, max_size=10, with_total_pages=False) as client:
+            items = await fetch_all_pages(client, BASE_URL, "api/employee", params={"size": 50})
+        assert items == list(range(95))
+
+    asyncio.run(scenario())
+
+
+def test_stopping_iteration_cancels_remaining_pages():
+    async def scenario():
+        state = {}
+        async with make_client(total=1000, state=state) as client:
+            pages = iter_all_pages(client, BASE_URL, "api/employee", params={"size": 10}, max_concurrency=2)
+            taken = []
+            async for item in pages:
+                taken.append(item)
+                if len(taken) == 15:
+                    break
+            await pages.aclose()
+        assert taken == list(range(15))
+        assert len(state["requested"]) < 100
+
+    asyncio.run(scenario())
@@ -0,0 +1,133 @@
+# tests/test_request_loader.py
+import asyncio
+
+import pytest
+
+from src.edms_assistant.core.loaders.request_loader import CONFIG_KEY, RequestLoader, load_once
+
+KEY = ("document", "7d5f2b8e-3b0a-4a7e-9b0e-1c2d3e4f5a6b", "token")
+
+
+class Factory:
+    """Фабрика загрузки: ждёт release и считает вызовы."""
+
+    def __init__(self, error: Exception = None):
+        self.calls = 0
+        self.cancelled = 0
+        self.release = asyncio.Event()
+        self.error = error
+
+    async def __call__(self) -> bytes:
+        self.calls += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error:
+            raise self.error
+        return b"document"
+
+
+def test_concurrent_loads_share_one_fetch():
+    async def scenario():
+        loader, factory = RequestLoader(), Factory()
+        waiters = [asyncio.create_task(loader.load(KEY, factory)) for _ in range(3)]
+        await asyncio.sleep(0)
+        factory.release.set()
+
+        assert await asyncio.gather(*waiters) == [b"document"] * 3
+        assert await loader.load(KEY, factory) == b"document"
+        assert factory.calls == 1
+        assert loader.stats() == {"entities": {"document": 1}, "hits": 3, "misses": 1, "prefetched": 0}
+
+    asyncio.run(scenario())
+
+
+def test_keys_are_scoped_by_token():
+    async def scenario():
+        loader, factory = RequestLoader(), Factory()
+        factory.release.set()
+        await loader.load(KEY, factory)
+        await loader.load(KEY[:2] + ("other-token",), factory)
+        assert factory.calls == 2
+
+    asyncio.run(scenario())
+
+
+def test_prefetch_is_reused_by_load_and_visible_to_peek():
+    async def scenario():
+        loader, factory = RequestLoader(), Factory()
+        loader.prefetch(KEY, factory)
+        loader.prefetch(KEY, factory)
+        await asyncio.sleep(0)
+        assert loader.peek(KEY) is None
+
+        factory.release.set()
+        assert await loader.load(KEY, factory) == b"document"
+        assert loader.peek(KEY) == b"document"
+        assert factory.calls == 1
+        assert loader.stats()["prefetched"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_error_is_shared_and_not_peeked():
+    async def scenario():
+        loader, factory = RequestLoader(), Factory(error=RuntimeError("EDMS down"))
+        factory.release.set()
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await loader.load(KEY, factory)
+        assert factory.calls == 1
+        assert loader.peek(KEY) is None
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_consumer_does_not_cancel_shared_load():
+    async def scenario():
+        loader, factory = RequestLoader(), Factory()
+        first = asyncio.create_task(loader.load(KEY, factory))
+        second = asyncio.create_task(loader.load(KEY, factory))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        factory.release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert await second == b"document"
+        assert factory.cancelled == 0
+
+    asyncio.run(scenario())
+
+
+def test_close_cancels_pending_loads():
+    async def scenario():
+        loader, factory = RequestLoader(), Factory()
+        loader.prefetch(KEY, factory)
+        await asyncio.sleep(0)
+
+        loader.close()
+        await asyncio.sleep(0)
+        assert factory.cancelled == 1
+        assert loader.peek(KEY) is None
+
+    asyncio.run(scenario())
+
+
+def test_load_once_without_loader_calls_factory_directly():
+    async def scenario():
+        factory = Factory()
+        factory.release.set()
+        assert await load_once(None, KEY, factory) == b"document"
+        assert await load_once({"configurable": {}}, KEY, factory) == b"document"
+        assert factory.calls == 2
+
+        loader = RequestLoader()
+        config = {"configurable": {CONFIG_KEY: loader}}
+        await load_once(config, KEY, factory)
+        await load_once(config, KEY, factory)
+        assert factory.calls == 3
+
+    asyncio.run(scenario())
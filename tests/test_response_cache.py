@@ -0,0 +1,163 @@
+# tests/test_response_cache.py
+import asyncio
+from uuid import uuid4
+
+import httpx
+
+from src.edms_assistant.infrastructure.api_clients.response_cache import ResponseCache
+from src.edms_assistant.infrastructure.api_clients.single_flight import SingleFlight
+
+BASE_URL = "http://edms.test"
+
+
+class FakeEdms:
+    """send() для ResponseCache.fetch: отвечает 304 на совпавший If-None-Match."""
+
+    def __init__(self, etag: str = '"v1"', body: bytes = b'{"v": 1}', headers: dict = None):
+        self.etag = etag
+        self.body = body
+        self.headers = headers or {}
+        self.requests = []
+
+    async def send(self, extra_headers):
+        self.requests.append(extra_headers)
+        if self.etag and extra_headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers={"etag": self.etag})
+        headers = {"content-type": "application/json", **self.headers}
+        if self.etag:
+            headers["etag"] = self.etag
+        return httpx.Response(200, headers=headers, content=self.body)
+
+
+def make_cache(**overrides) -> ResponseCache:
+    options = {"ttls": {"api/document/status": 0, "api/document/*": 30}, "max_entries": 100, "max_bytes": 1 << 20}
+    options.update(overrides)
+    return ResponseCache(**options)
+
+
+def expire(cache: ResponseCache) -> None:
+    for entry in cache._entries.values():
+        entry.stored_at -= entry.ttl + 1
+
+
+async def get(cache: ResponseCache, edms: FakeEdms, url: str, token: str = "token") -> httpx.Response:
+    key = SingleFlight.key(token, "GET", url)
+    return await cache.fetch(key, url, cache.ttl_for(url), edms.send)
+
+
+def test_ttl_rules_match_path_segments():
+    cache = make_cache()
+    assert cache.ttl_for(f"{BASE_URL}/api/document/{uuid4()}") == 30
+    assert cache.ttl_for(f"{BASE_URL}/api/document/status") is None
+    assert cache.ttl_for(f"{BASE_URL}/api/document/{uuid4()}/history") is None
+    assert cache.ttl_for(f"{BASE_URL}/api/employee/1") is None
+
+
+def test_fresh_entry_is_served_without_request():
+    async def scenario():
+        cache, edms = make_cache(), FakeEdms()
+        url = f"{BASE_URL}/api/document/{uuid4()}"
+        first = await get(cache, edms, url)
+        second = await get(cache, edms, url)
+
+        assert len(edms.requests) == 1
+        assert second.content == first.content == edms.body
+        assert second is not first
+
+    asyncio.run(scenario())
+
+
+def test_stale_entry_is_revalidated_with_etag_and_304_renews_it():
+    async def scenario():
+        cache, edms = make_cache(), FakeEdms()
+        url = f"{BASE_URL}/api/document/{uuid4()}"
+        await get(cache, edms, url)
+        expire(cache)
+
+        response = await get(cache, edms, url)
+        assert edms.requests[-1] == {"If-None-Match": '"v1"'}
+        assert response.status_code == 200
+        assert response.content == b'{"v": 1}'
+        assert cache.stats()["revalidated"] == 1
+
+        # Запись продлена: следующий вызов снова из кэша
+        await get(cache, edms, url)
+        assert len(edms.requests) == 2
+
+    asyncio.run(scenario())
+
+
+def test_changed_document_replaces_entry():
+    async def scenario():
+        cache, edms = make_cache(), FakeEdms()
+        url = f"{BASE_URL}/api/document/{uuid4()}"
+        await get(cache, edms, url)
+        expire(cache)
+        edms.etag, edms.body = '"v2"', b'{"v": 2}'
+
+        assert (await get(cache, edms, url)).content == b'{"v": 2}'
+        assert (await get(cache, edms, url)).content == b'{"v": 2}'
+        assert len(edms.requests) == 2
+
+    asyncio.run(scenario())
+
+
+def test_no_store_responses_are_not_cached():
+    async def scenario():
+        cache, edms = make_cache(), FakeEdms(headers={"cache-control": "no-store"})
+        url = f"{BASE_URL}/api/document/{uuid4()}"
+        await get(cache, edms, url)
+        await get(cache, edms, url)
+        assert len(edms.requests) == 2
+
+    asyncio.run(scenario())
+
+
+def test_invalidate_document_drops_entries_for_all_tokens():
+    async def scenario():
+        cache, edms = make_cache(), FakeEdms()
+        document_id, other_id = uuid4(), uuid4()
+        for token in ("alice", "bob"):
+            await get(cache, edms, f"{BASE_URL}/api/document/{document_id}", token)
+        await get(cache, edms, f"{BASE_URL}/api/document/{other_id}")
+
+        cache.invalidate_document(document_id)
+
+        assert cache.stats()["entries"] == 1
+        await get(cache, edms, f"{BASE_URL}/api/document/{document_id}", "alice")
+        assert len(edms.requests) == 4
+
+    asyncio.run(scenario())
+
+
+def test_response_in_flight_during_invalidation_is_not_stored():
+    async def scenario():
+        cache = make_cache()
+        document_id = uuid4()
+        url = f"{BASE_URL}/api/document/{document_id}"
+
+        async def send(extra_headers):
+            # Изменение документа, пока запрос ещё в пути
+            cache.invalidate_document(document_id)
+            return httpx.Response(200, content=b'{"v": "old"}')
+
+        await cache.fetch(SingleFlight.key("token", "GET", url), url, 30, send)
+        assert cache.stats()["entries"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_lru_eviction_by_entry_count():
+    async def scenario():
+        cache, edms = make_cache(max_entries=2), FakeEdms()
+        urls = [f"{BASE_URL}/api/document/{uuid4()}" for _ in range(3)]
+        await get(cache, edms, urls[0])
+        await get(cache, edms, urls[1])
+        await get(cache, edms, urls[0])
+        await get(cache, edms, urls[2])
+
+        assert cache.stats()["entries"] == 2
+        await get(cache, edms, urls[0])
+        assert len(edms.requests) == 3
+
+    asyncio.run(scenario())
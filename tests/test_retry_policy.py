@@ -0,0 +1,88 @@
+# tests/test_retry_policy.py
+import asyncio
+
+import httpx
+import pytest
+
+from src.edms_assistant.infrastructure.api_clients.retry_policy import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+)
+
+URL = "http://edms.test/api/document/1"
+
+
+def make_policy() -> RetryPolicy:
+    return RetryPolicy(max_attempts=1, base_delay=0.0, max_delay=0.0, failure_threshold=1, reset_timeout=0.0)
+
+
+def open_circuit(policy: RetryPolicy) -> CircuitBreaker:
+    breaker = policy.breaker(URL)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    return breaker
+
+
+def test_cancelled_probe_does_not_stick_half_open():
+    async def scenario():
+        policy = make_policy()
+        breaker = open_circuit(policy)
+        started = asyncio.Event()
+
+        async def hanging_send():
+            started.set()
+            await asyncio.sleep(3600)
+
+        probe = asyncio.create_task(policy.execute("GET", URL, hanging_send))
+        await started.wait()
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        # Следующий запрос становится новым пробным и закрывает цепь
+        response = await policy.execute("GET", URL, lambda: _ok())
+        assert response.status_code == 200
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    asyncio.run(scenario())
+
+
+def test_non_transport_error_releases_probe():
+    async def scenario():
+        policy = make_policy()
+        open_circuit(policy)
+
+        async def broken_send():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await policy.execute("GET", URL, broken_send)
+        response = await policy.execute("GET", URL, lambda: _ok())
+        assert response.status_code == 200
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_request_rejected_while_probe_in_flight():
+    async def scenario():
+        policy = make_policy()
+        open_circuit(policy)
+        release = asyncio.Event()
+
+        async def slow_send():
+            await release.wait()
+            return httpx.Response(200)
+
+        probe = asyncio.create_task(policy.execute("GET", URL, slow_send))
+        await asyncio.sleep(0)
+        with pytest.raises(CircuitOpenError):
+            await policy.execute("GET", URL, lambda: _ok())
+        release.set()
+        assert (await probe).status_code == 200
+
+    asyncio.run(scenario())
+
+
+async def _ok() -> httpx.Response:
+    return httpx.Response(200)
@@ -0,0 +1,89 @@
+# tests/test_single_flight.py
+import asyncio
+
+import httpx
+import pytest
+
+from src.edms_assistant.infrastructure.api_clients.single_flight import SingleFlight
+
+URL = "http://edms.test/api/document/1"
+
+
+class CountingFetch:
+    """fetch(), который ждёт release и считает вызовы."""
+
+    def __init__(self, error: Exception = None):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.error = error
+
+    async def __call__(self) -> httpx.Response:
+        self.calls += 1
+        await self.release.wait()
+        if self.error:
+            raise self.error
+        return httpx.Response(200, json={"call": self.calls})
+
+
+def test_concurrent_identical_requests_share_one_fetch():
+    async def scenario():
+        flights = SingleFlight()
+        fetch = CountingFetch()
+        key = flights.key("token", "GET", URL, {"a": 1})
+        waiters = [asyncio.create_task(flights.do(key, fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        fetch.release.set()
+
+        responses = await asyncio.gather(*waiters)
+        assert fetch.calls == 1
+        assert {response.json()["call"] for response in responses} == {1}
+        assert flights.stats()["coalesced"] == 4
+        assert flights.stats()["in_flight"] == 0
+
+        # Завершённый запрос не кэшируется: следующий вызов идёт в сеть
+        await flights.do(key, fetch)
+        assert fetch.calls == 2
+
+    asyncio.run(scenario())
+
+
+def test_error_is_propagated_to_every_waiter():
+    async def scenario():
+        flights = SingleFlight()
+        fetch = CountingFetch(error=httpx.ConnectError("down"))
+        key = flights.key("token", "GET", URL)
+        waiters = [asyncio.create_task(flights.do(key, fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        fetch.release.set()
+
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert fetch.calls == 1
+        assert all(isinstance(result, httpx.ConnectError) for result in results)
+        assert flights.stats()["in_flight"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_does_not_cancel_shared_fetch():
+    async def scenario():
+        flights = SingleFlight()
+        fetch = CountingFetch()
+        key = flights.key("token", "GET", URL)
+        first = asyncio.create_task(flights.do(key, fetch))
+        second = asyncio.create_task(flights.do(key, fetch))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        fetch.release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert (await second).status_code == 200
+        assert fetch.calls == 1
+
+    asyncio.run(scenario())
+
+
+def test_keys_are_scoped_by_token_and_params():
+    assert SingleFlight.key("alice", "get", URL) == SingleFlight.key("alice", "GET", URL)
+    assert SingleFlight.key("alice", "GET", URL) != SingleFlight.key("bob", "GET", URL)
+    assert SingleFlight.key("alice", "GET", URL, {"a": 1}) != SingleFlight.key("alice", "GET", URL, {"a": 2})
@@ -0,0 +1,62 @@
+# tests/test_upload_store.py
+import asyncio
+import hashlib
+
+from src.edms_assistant.infrastructure.storage.upload_store import UploadStore
+from src.edms_assistant.utils.file_utils import SavedUpload
+
+
+def stage(store: UploadStore, data: bytes) -> SavedUpload:
+    path = store.staging_path()
+    path.write_bytes(data)
+    return SavedUpload(path=path, size=len(data), sha256=hashlib.sha256(data).hexdigest())
+
+
+def test_concurrent_add_of_same_content_shares_one_entry(tmp_path):
+    async def scenario():
+        store = UploadStore(tmp_path, max_entries=1, max_bytes=10_000)
+        data = b"x" * 100
+        first, second = await asyncio.gather(
+            store.add(stage(store, data), "a.txt"),
+            store.add(stage(store, data), "b.txt"),
+        )
+        assert first is second
+        assert first.refcount == 2
+        assert store.stats()["bytes"] == 100
+        assert (store.stats()["hits"], store.stats()["misses"]) == (1, 1)
+
+        # После первого release() файл ещё занят вторым запросом и не вытесняется
+        store.release(first.sha256)
+        other = await store.add(stage(store, b"y" * 10), "c.txt")
+        store.release(other.sha256)
+        assert first.path.exists()
+        assert store.get(first.sha256) is first
+
+        store.release(first.sha256)
+        assert not list(tmp_path.glob("*.part"))
+        assert store._locks == {}
+
+    asyncio.run(scenario())
+
+
+def test_startup_removes_directories_of_exited_processes(tmp_path):
+    import os
+    import subprocess
+    import sys
+
+    exited = subprocess.Popen([sys.executable, "-c", "pass"])
+    exited.wait()
+    stale = tmp_path / str(exited.pid)
+    stale.mkdir()
+    (stale / "blob").write_bytes(b"x")
+    alive = tmp_path / str(os.getppid())
+    alive.mkdir()
+
+    store = UploadStore(tmp_path / str(os.getpid()), max_entries=10, max_bytes=10_000)
+    store.startup()
+    assert not stale.exists()
+    assert alive.exists()
+
+    store.root.mkdir()
+    store.shutdown()
+    assert not store.root.exists()